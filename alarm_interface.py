@@ -1,4 +1,6 @@
+import argparse
 import logging_config
+from application_layer.alarm_pi.alarm_config import AlarmConfig
 from application_layer.alarm_pi.alarm_service import AlarmService
 
 ############################## Setup Logger #############################
@@ -6,6 +8,11 @@ logging_config.setup_logging()
 #########################################################################
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Alarm controller")
+    parser.add_argument("--worker-id", default=AlarmConfig.WORKER_ID,
+                        help="ID of this alarm worker when several share the tags, see AlarmConfig.WORKERS")
+    args = parser.parse_args()
+    AlarmConfig.WORKER_ID = args.worker_id
+
     service = AlarmService()
     service.start()
-
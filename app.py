@@ -1,3 +1,7 @@
+import time
+## Start of the startup timeline, taken before the Qt and service imports
+STARTED = time.monotonic()
+
 from PyQt6 import QtGui
 from PyQt6.QtWidgets import QApplication
 
@@ -6,6 +10,7 @@ import logging_config
 import sys
 
 from presentation_layer.views.mainwindow_view import CMainwindowView
+from application_layer.startup_timeline import StartupTimeline
 
 ############################## Setup Logger #############################
 logging_config.setup_logging()
@@ -33,7 +38,7 @@ sys.excepthook = handle_exception
 class App(QApplication):
     def __init__(self, sys_argv):
         super(App, self).__init__(sys_argv)
-        self.stackwindowView = CMainwindowView()
+        self.stackwindowView = CMainwindowView(timeline=StartupTimeline("Startup", STARTED))
         screen = QtGui.QGuiApplication.primaryScreen()
         size = screen.size()
         logging.debug(f"Width: {size.width()}, Height: {size.height()}")
@@ -0,0 +1,70 @@
+import logging
+from data_access_layer.alarm_event_dao import AlarmEventDao
+from application_layer.states import AlarmState
+
+class AlarmEventDBService:
+    def __init__(self):
+        """
+        @brief Constructor for AlarmEventDBService.
+        """
+        self.alarm_event_dao = AlarmEventDao()
+        self.logger = logging.getLogger(__name__)
+
+    def create_table(self):
+        """
+        @brief Creates the alarm_events table if it does not exist.
+        """
+        self.alarm_event_dao.create_table()
+        self.logger.info("AlarmEventDBService: Ensured alarm_events table")
+
+    def add_events(self, events):
+        """
+        @brief Stores a batch of alarm events.
+        @param events A list of tuples (created_at, state, cause, tag_nr, device_id, gate_id, deactivated_by, latency_ms).
+        """
+        self.alarm_event_dao.add_events(events)
+        self.logger.info(f"AlarmEventDBService: Added {len(events)} alarm events")
+
+    def get_events(self, start, end):
+        """
+        @brief Retrieves the alarm events of a time range.
+        @param start The start of the range (inclusive datetime).
+        @param end The end of the range (exclusive datetime).
+        @return A list of alarm event records.
+        """
+        events = self.alarm_event_dao.get_events(start, end)
+        self.logger.info("AlarmEventDBService: Retrieved alarm events")
+        return events
+
+    def get_events_by_tag_number(self, tag_number, limit=100):
+        """
+        @brief Retrieves the most recent alarm events of a tag.
+        @param tag_number The tag number of the device.
+        @param limit The maximum number of events.
+        @return A list of alarm event records, newest first.
+        """
+        events = self.alarm_event_dao.get_events_by_tag_number(tag_number, limit)
+        self.logger.info(f"AlarmEventDBService: Retrieved alarm events for tag number {tag_number}")
+        return events
+
+    def count_alarms_by_gate(self, start, end):
+        """
+        @brief Counts the triggered alarms per gate in a time range.
+        @param start The start of the range (inclusive datetime).
+        @param end The end of the range (exclusive datetime).
+        @return A dictionary mapping the gate ID to the number of alarms.
+        """
+        counts = dict(self.alarm_event_dao.count_events_by_gate(AlarmState.TRIGGERED.value, start, end))
+        self.logger.info("AlarmEventDBService: Counted alarms per gate")
+        return counts
+
+    def count_alarms_by_device(self, start, end):
+        """
+        @brief Counts the triggered alarms per device in a time range.
+        @param start The start of the range (inclusive datetime).
+        @param end The end of the range (exclusive datetime).
+        @return A dictionary mapping the device ID to the number of alarms.
+        """
+        counts = dict(self.alarm_event_dao.count_events_by_device(AlarmState.TRIGGERED.value, start, end))
+        self.logger.info("AlarmEventDBService: Counted alarms per device")
+        return counts
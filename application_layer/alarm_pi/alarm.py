@@ -1,27 +1,31 @@
-import RPi.GPIO as GPIO
+import time
 import logging
+import threading
 
 from application_layer.alarm_pi.alarm_config import AlarmConfig
+from application_layer.alarm_pi.output_driver import create_output_driver
 
 class Alarm:
     """
     @brief A class to control an alarm system using a relay.
     """
 
-    def __init__(self):
+    def __init__(self, output_driver=None):
         """
         @brief Initializes the Alarm class.
-        @param relay_pin The GPIO pin connected to the relay. Default is 17.
+        @param output_driver The OutputDriver of the relay. Default is the driver selected by AlarmConfig.OUTPUT_DRIVER.
         """
         self.relay_pin = AlarmConfig.RELAY_PIN
+        self.output_driver = output_driver or create_output_driver(AlarmConfig.OUTPUT_DRIVER)
+        self._pattern_stop = threading.Event()
+        self._pattern_thread = None
         self.setup_gpio()
 
     def setup_gpio(self):
         """
-        @brief Sets up the GPIO mode and initializes the relay pin.
+        @brief Sets up the output and initializes the relay pin.
         """
-        GPIO.setmode(GPIO.BCM)
-        GPIO.setup(self.relay_pin, GPIO.OUT)
+        self.output_driver.setup(self.relay_pin)
         self.turn_off_relay()
 
     def turn_off_relay(self):
@@ -29,25 +33,82 @@ class Alarm:
         @brief Turns off the relay.
         """
         logging.info("Alarm::turn_off_relay")
-        GPIO.output(self.relay_pin, GPIO.LOW)
+        self.output_driver.write(self.relay_pin, False)
 
     def turn_on_relay(self):
         """
         @brief Turns on the relay.
         """
         logging.info("Alarm::turn_on_relay")
-        GPIO.output(self.relay_pin, GPIO.HIGH)
+        self.output_driver.write(self.relay_pin, True)
 
-    def start_alarm(self):
+    def start_alarm(self, pattern=None):
         """
         @brief Starts the alarm by turning on the relay.
+        @details The relay is switched on before this method returns, the rest of the pattern runs on a thread.
+        @param pattern "steady", "pulse", "blink" or "siren". Default is AlarmConfig.ALARM_PATTERN.
         """
-        logging.info("Alarm::start_alarm")
+        pattern = pattern or AlarmConfig.ALARM_PATTERN
+        logging.info(f"Alarm::start_alarm ({pattern})")
+        self._stop_pattern()
         self.turn_on_relay()
 
+        if pattern == "steady":
+            return
+        if pattern == "pulse":
+            self._start_pattern([(True, AlarmConfig.PULSE_DURATION)], None)
+        elif pattern == "blink":
+            self._start_pattern([(True, AlarmConfig.BLINK_ON_TIME), (False, AlarmConfig.BLINK_OFF_TIME)], 0)
+        elif pattern == "siren":
+            self._start_pattern([(True, AlarmConfig.BLINK_ON_TIME), (False, AlarmConfig.BLINK_OFF_TIME)],
+                                AlarmConfig.SIREN_DURATION)
+        else:
+            logging.error(f"Alarm::Unknown pattern {pattern}, keeping the relay on")
+
+    def _start_pattern(self, steps, duration):
+        """
+        @brief Runs a relay pattern on a thread.
+        @param steps A list of (state, seconds) steps. The first step is already applied.
+        @param duration None to run the steps once, 0 to repeat them until stopped,
+                        otherwise the time in seconds after which the steps stop repeating.
+        """
+        self._pattern_stop.clear()
+        self._pattern_thread = threading.Thread(target=self._run_pattern, args=(steps, duration),
+                                                name="AlarmPatternThread", daemon=True)
+        self._pattern_thread.start()
+
+    def _run_pattern(self, steps, duration):
+        """
+        @brief Applies the steps of a pattern until it is finished or stopped, then turns the relay off.
+        @param steps A list of (state, seconds) steps. The first step is already applied.
+        @param duration See _start_pattern().
+        """
+        deadline = time.monotonic() + duration if duration else None
+        first = True
+        while True:
+            for state, seconds in steps:
+                if not first:
+                    self.output_driver.write(self.relay_pin, state)
+                first = False
+                if self._pattern_stop.wait(seconds):
+                    return
+            if duration is None or (deadline is not None and time.monotonic() >= deadline):
+                break
+        self.output_driver.write(self.relay_pin, False)
+
+    def _stop_pattern(self):
+        """
+        @brief Stops a running pattern and waits for its thread.
+        """
+        if self._pattern_thread is not None:
+            self._pattern_stop.set()
+            self._pattern_thread.join()
+            self._pattern_thread = None
+
     def stop_alarm(self):
         """
         @brief Stops the alarm by turning off the relay.
         """
         logging.info("Alarm::stop_alarm")
-        self.turn_off_relay()
\ No newline at end of file
+        self._stop_pattern()
+        self.turn_off_relay()
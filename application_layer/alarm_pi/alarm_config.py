@@ -1,3 +1,5 @@
+from data_layer.config import ALARM_CONFIG
+
 class AlarmConfig:
     """
     @class AlarmConfig
@@ -8,4 +10,161 @@ class AlarmConfig:
     """
     @brief The GPIO pin connected to the relay. (GPIO17)
     @details This pin is used to control the relay for the alarm system.
-    """
\ No newline at end of file
+    """
+
+    HOLD_TIME = 60
+    """
+    @brief The time after which a triggered alarm turns itself off.
+    @details This specifies the duration in seconds. 0 keeps the relay on until the alarm is deactivated.
+    """
+
+    SUPPRESSION_WINDOW = 30
+    """
+    @brief The time during which a tag cannot trigger the alarm again.
+    @details This specifies the duration in seconds, counted from the moment the tag triggered the alarm.
+    """
+
+    CLEAR_TIME = 5
+    """
+    @brief The time without a read of the tags of an acknowledged incident after which the incident is over.
+    @details This specifies the duration in seconds.
+    """
+
+    REARM_TIME = 10
+    """
+    @brief The cooldown between the end of an incident and re-arming the alarm.
+    @details This specifies the duration in seconds.
+    """
+
+    LATENCY_REPORT_INTERVAL = 60
+    """
+    @brief The interval between two latency reports in the log.
+    @details This specifies the duration in seconds.
+    """
+
+    QUEUE_SIZE = 256
+    """
+    @brief The maximum number of distinct tags waiting for a decision.
+    @details Tags received while the queue is full are dropped and counted.
+    """
+
+    WORKER_COUNT = 2
+    """
+    @brief The number of workers taking decisions, each with its own database connection.
+    """
+
+    EVENT_BATCH_SIZE = 50
+    """
+    @brief The number of buffered alarm events that triggers a write to the alarm_events table.
+    """
+
+    EVENT_FLUSH_INTERVAL = 5
+    """
+    @brief The maximum time an alarm event stays buffered before it is written.
+    @details This specifies the duration in seconds. It is also the retry delay after a failed write.
+    """
+
+    EVENT_QUEUE_SIZE = 1000
+    """
+    @brief The maximum number of alarm events waiting to be written.
+    @details Events recorded while the queue is full are dropped and counted.
+    """
+
+    OUTPUT_DRIVER = "gpio"
+    """
+    @brief The driver of the relay output.
+    @details Supported values are:
+    - "gpio": RPi.GPIO on the Raspberry Pi
+    - "simulated": records the relay transitions in memory, for tests and benchmarks on any machine
+    """
+
+    ALARM_PATTERN = "steady"
+    """
+    @brief The pattern of the relay while the alarm is triggered.
+    @details Supported values are:
+    - "steady": on until the alarm is stopped
+    - "pulse": on for PULSE_DURATION seconds
+    - "blink": BLINK_ON_TIME on, BLINK_OFF_TIME off, until the alarm is stopped
+    - "siren": blinking for SIREN_DURATION seconds
+    """
+
+    PULSE_DURATION = 2
+    """
+    @brief The duration in seconds of the "pulse" pattern.
+    """
+
+    BLINK_ON_TIME = 0.5
+    """
+    @brief The on time in seconds of the "blink" and "siren" patterns.
+    """
+
+    BLINK_OFF_TIME = 0.5
+    """
+    @brief The off time in seconds of the "blink" and "siren" patterns.
+    """
+
+    SIREN_DURATION = 30
+    """
+    @brief The duration in seconds of the "siren" pattern.
+    """
+
+    RULES_RELOAD_INTERVAL = 5
+    """
+    @brief The interval in seconds in which the alarm rules file is checked for changes.
+    """
+
+    DEVICE_CACHE_TTL = 2
+    """
+    @brief The time in seconds a looked up device record answers further reads of its tag.
+    @details A tag in front of the antenna is read several times per second, only the first read
+             within this time queries the database. A device borrowed meanwhile is seen as not
+             borrowed until its record expires, so keep the time short. The cache is cleared when
+             the alarm rules are reloaded. 0 disables the cache.
+    """
+
+    WORKER_ID = ALARM_CONFIG['worker_id']
+    """
+    @brief The ID of this alarm process, also its MQTT client ID.
+    @details Set by WorkerId in data_layer/config.ini or --worker-id of alarm_interface.py. The worker
+             with the ID Services.MQTT_ALARM_CLIENT drives the relay and owns the alarm state, the other
+             workers forward their violations to it.
+    """
+
+    WORKERS = ALARM_CONFIG['workers']
+    """
+    @brief The IDs of all alarm workers sharing the tag stream, e.g. ["alarm_controller", "alarm_worker_2"].
+    @details Set by Workers in data_layer/config.ini. Every worker receives and decodes all tags and
+             decides only on its slice, assigned by consistent hashing of the EPC. Only the tags of the slice are queued, looked up and kept in
+             the device record cache, no worker holds the devices of the other slices. Staff tags are
+             handled by every worker. An empty list runs a single alarm controller deciding on all tags.
+    """
+
+    VIRTUAL_NODES = ALARM_CONFIG['virtual_nodes']
+    """
+    @brief The number of points per worker on the consistent hash ring, more points balance the slices better.
+    @details Set by VirtualNodes in data_layer/config.ini.
+    """
+
+    COMMAND_CACHE_SIZE = 32
+    """
+    @brief The number of answered commands remembered to answer a retried command without executing it again.
+    """
+
+    METRICS_PUBLISH_INTERVAL = 5
+    """
+    @brief The interval in seconds between two publications of the alarm metrics (queue, latency, transport).
+    @details 0 disables the publication.
+    """
+
+    DEVICE_SOURCE = "database"
+    """
+    @brief Where the alarm looks up the devices of the tags.
+    @details Supported values are:
+    - "database": the devices table
+    - "population": the population file written by the load generator, for benchmarks without a database
+    """
+
+    POPULATION_FILE = "data_layer/load_population.json"
+    """
+    @brief The population file used with DEVICE_SOURCE = "population".
+    """
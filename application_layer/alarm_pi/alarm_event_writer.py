@@ -0,0 +1,117 @@
+import time
+import queue
+import logging
+import datetime
+import threading
+
+from application_layer.alarm_event_db_service import AlarmEventDBService
+from application_layer.alarm_pi.alarm_config import AlarmConfig
+
+class AlarmEventWriter:
+    """
+    @brief Writes alarm events to the alarm_events table in batches.
+
+    record() only puts the event into a bounded queue. A background thread collects the
+    events and inserts them in one statement once AlarmConfig.EVENT_BATCH_SIZE events are
+    buffered or the oldest buffered event is AlarmConfig.EVENT_FLUSH_INTERVAL seconds old.
+    A failed insert is retried with the next flush.
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes the AlarmEventWriter class.
+        """
+        self.events = queue.Queue(maxsize=AlarmConfig.EVENT_QUEUE_SIZE)
+        self.alarm_event_db_service = None
+        self.dropped_count = 0
+        self.written_count = 0
+        self._thread = None
+
+    def record(self, state, cause=None, tag_nr=None, device_id=None, gate_id=None,
+               deactivated_by=None, latency_ms=None):
+        """
+        @brief Queues an alarm event. Never blocks.
+        @param state The AlarmState entered.
+        @param cause The cause of the state change.
+        @param tag_nr The tag number that triggered the alarm.
+        @param device_id The ID of the device that triggered the alarm.
+        @param gate_id The ID of the gate that read the tag.
+        @param deactivated_by Who deactivated the alarm.
+        @param latency_ms The time from receiving the tag to switching the relay.
+        """
+        event = (datetime.datetime.now(), state.value, cause, tag_nr, device_id, gate_id, deactivated_by, latency_ms)
+        try:
+            self.events.put_nowait(event)
+        except queue.Full:
+            self.dropped_count += 1
+            logging.warning(f"AlarmEventWriter::Queue full, dropped {state.value} event")
+
+    def _run(self):
+        """
+        @brief Collects queued events and flushes them by size or time until stopped.
+        """
+        batch = []
+        first_buffered = None
+        retry_at = 0.0
+        while True:
+            now = time.monotonic()
+            deadline = first_buffered + AlarmConfig.EVENT_FLUSH_INTERVAL if batch else now + AlarmConfig.EVENT_FLUSH_INTERVAL
+            try:
+                event = self.events.get(timeout=max(0.0, max(deadline, retry_at) - now))
+                if event is None:  # Sent by stop()
+                    break
+                batch.append(event)
+                if first_buffered is None:
+                    first_buffered = time.monotonic()
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            due = batch and (len(batch) >= AlarmConfig.EVENT_BATCH_SIZE
+                             or now - first_buffered >= AlarmConfig.EVENT_FLUSH_INTERVAL)
+            if due and now >= retry_at:
+                if self._flush(batch):
+                    batch = []
+                    first_buffered = None
+                else:
+                    retry_at = now + AlarmConfig.EVENT_FLUSH_INTERVAL
+
+        if batch and not self._flush(batch):
+            logging.error(f"AlarmEventWriter::{len(batch)} alarm events could not be written")
+
+    def _flush(self, batch):
+        """
+        @brief Inserts a batch of events, connecting to the database on first use.
+        @param batch The list of event tuples.
+        @return True if the batch was written, otherwise False.
+        """
+        try:
+            if self.alarm_event_db_service is None:
+                self.alarm_event_db_service = AlarmEventDBService()
+                self.alarm_event_db_service.create_table()
+            self.alarm_event_db_service.add_events(batch)
+        except Exception as e:
+            logging.error(f"AlarmEventWriter::Error writing {len(batch)} alarm events: {e}")
+            self.alarm_event_db_service = None  # Reconnect on the next flush
+            if len(batch) > AlarmConfig.EVENT_QUEUE_SIZE:
+                self.dropped_count += len(batch) - AlarmConfig.EVENT_QUEUE_SIZE
+                del batch[:len(batch) - AlarmConfig.EVENT_QUEUE_SIZE]
+            return False
+        self.written_count += len(batch)
+        return True
+
+    def start(self):
+        """
+        @brief Starts the background writer thread.
+        """
+        self._thread = threading.Thread(target=self._run, name="AlarmEventWriterThread", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        @brief Flushes the buffered events and stops the writer thread.
+        """
+        if self._thread is not None:
+            self.events.put(None)
+            self._thread.join()
+            self._thread = None
@@ -1,177 +1,556 @@
-from time import sleep
-import paho.mqtt.client as mqtt
+import asyncio
+import signal
+import time
 import logging
-import ast
 import threading
-import time 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-from application_layer.device_db_service import DeviceDBService
+from application_layer.alarm_rules import AlarmRules
 from application_layer.services import Services
+from application_layer.mqtt_config import MQTTConfig
+from application_layer.event_bus import create_transport
+from application_layer.messages import (AlarmStatus, AlarmViolation, AlarmCommandResponse, AlarmMetrics, Trace,
+                                        MessageError, decode)
+from application_layer.latency_tracer import LatencyTracer
 from application_layer.alarm_pi.alarm import Alarm
+from application_layer.alarm_pi.alarm_config import AlarmConfig
+from application_layer.alarm_pi.alarm_state_machine import AlarmStateMachine
+from application_layer.alarm_pi.alarm_event_writer import AlarmEventWriter
+from application_layer.alarm_pi.device_source import create_device_source
+from application_layer.alarm_pi.output_driver import create_output_driver
+from application_layer.alarm_pi.tag_partitioner import TagPartitioner
+from application_layer.epc_codec import to_canonical
+from application_layer.states import AlarmState
 
 class AlarmService:
     """
     @brief A class to handle the alarm service using MQTT.
+
+    The service runs on a single asyncio event loop. One MQTTTransport carries the
+    RFID tag and GUI subscriptions as well as the alarm status publications.
+
+    Received tags go through a bounded queue to AlarmConfig.WORKER_COUNT workers. A tag
+    that is already waiting in the queue is not queued a second time. The workers query
+    the database on their own threads, so a slow database never blocks the event loop.
+
+    Whether a device that is not borrowed raises the alarm is decided by the AlarmRules,
+    which are reloaded when their file changes. Staff tags are handled on receipt and
+    never reach the queue.
+
+    Several alarm workers (AlarmConfig.WORKERS) can share the tag stream. Each decides on
+    the tags its TagPartitioner assigns to it and keeps the queue and lookups for them.
+    Only the worker with the ID Services.MQTT_ALARM_CLIENT drives the relay, the other
+    workers forward their violations to it as AlarmViolation.
+
+    The device records looked up are cached for AlarmConfig.DEVICE_CACHE_TTL seconds, so the
+    repeated reads of a tag in front of the antenna query the database once. A worker only
+    looks up and caches the records of its own tags.
+
+    Every tag read carries a trace context. The latency of each stage (network, queue,
+    lookup, decision, tag_to_relay, status_publish) is aggregated by a LatencyTracer.
     """
 
     def __init__(self):
         """
         @brief Initializes the AlarmService class.
         """
-        self.device_db_service = DeviceDBService()
-        self.alarm = Alarm()
-        self.broker_address = Services.BROKER_ADDRESS
-        self.mqtt_port = Services.MQTT_PORT
+        self.db_local = threading.local()
+        self.db_executor = ThreadPoolExecutor(max_workers=AlarmConfig.WORKER_COUNT, thread_name_prefix="AlarmDB")
+        self.tag_queue = None
+        self.pending_tags = {}
+        self.queue_stats = {"enqueued": 0, "coalesced": 0, "dropped": 0, "processed": 0, "high_water": 0,
+                            "other_workers": 0}
+        self.decision_stats = {"errors": 0}
+        self.device_cache = OrderedDict()
+        self.device_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+        self.alarm_rules = AlarmRules()
+        self.worker_id = AlarmConfig.WORKER_ID
+        self.is_relay_owner = self.worker_id == Services.MQTT_ALARM_CLIENT
+        self.partitioner = TagPartitioner(AlarmConfig.WORKERS, self.worker_id, AlarmConfig.VIRTUAL_NODES)
+        # Workers without the relay never switch it
+        self.alarm = Alarm() if self.is_relay_owner else Alarm(create_output_driver("simulated"))
+        self.alarm_event_writer = AlarmEventWriter()
+        self.alarm_state_machine = AlarmStateMachine(self.alarm, self.on_alarm_state_changed)
         self.topic_rfid_tags = Services.TOPIC_RFID_TAGS
         self.topic_alarm_status = Services.TOPIC_ALARM_STATUS
         self.topic_gui_alarm = Services.TOPIC_GUI_ALARM
+        self.topic_gui_alarm_response = Services.TOPIC_GUI_ALARM_RESPONSE
+        self.command_responses = OrderedDict()
+        self.topic_alarm_metrics = Services.TOPIC_ALARM_METRICS
+        self.topic_alarm_violation = Services.TOPIC_ALARM_VIOLATION
+        self.alarm_status = None
+        self.transport = create_transport(MQTTConfig.TRANSPORT, self.worker_id, "AlarmService")
+        self.transport.subscribe(self.topic_rfid_tags, self.on_alarm_rfid_message)
+        if self.is_relay_owner:
+            self.transport.set_node_status(Services.TOPIC_ALARM_NODE_STATUS, Services.MQTT_ALARM_CLIENT)
+            self.transport.on_connected = self.republish_alarm_status
+            self.transport.subscribe(self.topic_gui_alarm, self.on_alarm_gui_sub_message, MQTTConfig.COMMAND_QOS)
+            if AlarmConfig.WORKERS:
+                self.transport.subscribe(self.topic_alarm_violation, self.on_alarm_violation_message, MQTTConfig.COMMAND_QOS)
+        self.loop = None
+        self.stop_event = None
+        self.stop_requested = False
+        self._stop_lock = threading.Lock()
+        self.tracer = LatencyTracer("AlarmService", report_interval=0)
 
-    def on_alarm_gui_sub_connect(self, client, userdata, flags, rc):
-        """
-        @brief Callback function for when the client receives a CONNACK response from the server.
-        @param client The client instance for this callback.
-        @param userdata The private user data as set in Client() or userdata_set().
-        @param flags Response flags sent by the broker.
-        @param rc The connection result.
-        """
-        if rc == 0:
-            logging.info("AlarmService::Connected successfully to broker")
-            client.subscribe(self.topic_gui_alarm)
-            logging.info(f"AlarmService::Subscribed to topic {self.topic_gui_alarm}")
-        else:
-            logging.error(f"AlarmService::Connection failed with code {rc}")
-    
     def on_alarm_gui_sub_message(self, client, userdata, msg):
         """
-        @brief Callback function for when a PUBLISH message is received from the server.
+        @brief Callback function for when a PUBLISH message is received on the GUI alarm topic.
+        @details A command with a request ID is answered once the relay is off. A retried command
+                 gets the cached response and is not executed again.
         @param client The client instance for this callback.
         @param userdata The private user data as set in Client() or userdata_set().
         @param msg An instance of MQTTMessage, which contains topic, payload, qos, retain.
         """
         try:
-            # Decode the received payload
-            payload_str = msg.payload.decode()
-            logging.info(f"AlarmService::Received message: '{payload_str}' on topic '{msg.topic}'")
+            # Decode and validate the received payload
+            command = decode(msg.topic, msg.payload)
+            logging.info(f"AlarmService::Received message: {command} on topic '{msg.topic}'")
+        except MessageError as e:
+            logging.error(f"AlarmService::Rejected message on topic '{msg.topic}': {e}")
+            return
 
-            # Safely evaluate the string as a Python dictionary
-            payload = ast.literal_eval(payload_str)
+        request_id = command.request_id
+        if request_id is not None and request_id in self.command_responses:
+            logging.info(f"AlarmService::Command {request_id} repeated, sending the response again")
+            self.transport.publish_message(self.topic_gui_alarm_response, self.command_responses[request_id],
+                                           qos=MQTTConfig.COMMAND_QOS)
+            return
 
-            # Extract the status of the alarm
-            alarm_status = payload['alarm_status']
-            logging.info(f"AlarmService::Alarm status: {alarm_status}")
-
-            # Deactivate the alarm if the status is 'DEACTIVATE'
-            if alarm_status == "DEACTIVATE":
-                logging.info("AlarmService::Deactivating the alarm...")
-                self.alarm.stop_alarm()
-            else:
-                logging.info("AlarmService::Alarm is still active")
+        # DEACTIVATE is the only command accepted by the schema
+        logging.info("AlarmService::Deactivating the alarm...")
+        error = None
+        try:
+            acknowledged = self.alarm_state_machine.deactivate(command.source or "gui")
         except Exception as e:
-            logging.error(f"AlarmService::Error handling message: {e}")
+            acknowledged = False
+            error = str(e)
+            logging.error(f"AlarmService::Error deactivating the alarm: {e}")
+        if request_id is None:  # Sent by a GUI that does not wait for a response
+            return
 
+        response = AlarmCommandResponse(request_id=request_id,
+                                        state=self.alarm_state_machine.state.value,
+                                        acknowledged=acknowledged,
+                                        error=error)
+        self.command_responses[request_id] = response
+        if len(self.command_responses) > AlarmConfig.COMMAND_CACHE_SIZE:
+            self.command_responses.popitem(last=False)
+        self.transport.publish_message(self.topic_gui_alarm_response, response, qos=MQTTConfig.COMMAND_QOS)
+        logging.info(f"AlarmService::Published response {response} to topic '{self.topic_gui_alarm_response}'")
 
-    def on_alarm_rfid_connect(self, client, userdata, flags, rc):
+    def on_alarm_rfid_message(self, client, userdata, msg):
         """
-        @brief Callback function for when the client receives a CONNACK response from the server.
+        @brief Callback function for when a PUBLISH message is received on the RFID tags topic.
+        @details The tag is only queued, the decision is taken by a worker.
         @param client The client instance for this callback.
         @param userdata The private user data as set in Client() or userdata_set().
-        @param flags Response flags sent by the broker.
-        @param rc The connection result.
+        @param msg An instance of MQTTMessage, which contains topic, payload, qos, retain.
         """
-        if rc == 0:
-            logging.info("AlarmService::Connected successfully to broker")
-            client.subscribe(self.topic_rfid_tags)
-            logging.info(f"AlarmService::Subscribed to topic {self.topic_rfid_tags}")
-        else:
-            logging.error(f"AlarmService::Connection failed with code {rc}")
+        received_at = time.monotonic()
+        received_wall = time.time()
+        try:
+            # Decode and validate the received payload
+            tag_read = decode(msg.topic, msg.payload)
 
-    def on_alarm_rfid_message(self, client, userdata, msg):
+            # Extract the tag number (EPC) in canonical form
+            tag_nr = to_canonical(tag_read.epc)
+        except ValueError as e:  # MessageError or an EPC that is not hexadecimal
+            logging.error(f"AlarmService::Rejected message on topic '{msg.topic}': {e}")
+            return
+        gate_id = tag_read.gate
+        logging.info(f"AlarmService::Tag number {tag_nr} at gate {gate_id}")
+
+        # Continue the trace started by the RFID reader
+        trace = self.start_trace(tag_read.trace, received_at, received_wall)
+
+        # A staff tag opens the override window of its gate, it is not a device
+        if self.alarm_rules.is_staff_tag(tag_nr):
+            self.alarm_rules.note_staff_read(gate_id, received_wall)
+            return
+
+        # The tags of the other workers are decided there
+        if not self.partitioner.owns(tag_nr):
+            self.queue_stats["other_workers"] += 1
+            return
+
+        self.enqueue_tag(tag_nr, trace, gate_id)
+
+    def on_alarm_violation_message(self, client, userdata, msg):
         """
-        @brief Callback function for when a PUBLISH message is received from the server.
+        @brief Callback function for when a violation is forwarded by another alarm worker.
+        @details Only subscribed by the worker driving the relay. The tag-to-relay stage of a forwarded
+                 violation starts when it is received here.
         @param client The client instance for this callback.
         @param userdata The private user data as set in Client() or userdata_set().
         @param msg An instance of MQTTMessage, which contains topic, payload, qos, retain.
         """
+        received_at = time.monotonic()
         try:
-            # Decode the received payload
-            payload_str = msg.payload.decode()
-            logging.info(f"AlarmService::Received message: '{payload_str}' on topic '{msg.topic}'")
-
-            # Safely evaluate the string as a Python dictionary
-            payload = ast.literal_eval(payload_str)
-
-            # Extract and decode the tag number (EPC)
-            tag_nr = payload['tag']['epc'].decode('utf-8')
-            logging.info(f"AlarmService::Tag number {tag_nr}")
-
-            # Get the is_borrowed status of the device
-            is_borrowed = self.device_db_service.get_is_borrowed_status_by_tag_number(tag_nr)
-
-            # Activate alarm if false
-            if is_borrowed == False:
-                logging.info("AlarmService::Device is not borrowed, triggering the alarm...")
-                self.alarm.start_alarm()
-                
-                # Create a payload for the alarm status message
-                alarm_payload = {
-                    "status": "ALARM",
-                    "message": f"Device with tag number {tag_nr} is not borrowed"
-                }
-                alarm_payload_str = str(alarm_payload)
-                # Publish the alarm status message
-                self.mqtt_alarm_gui_client.publish(self.topic_alarm_status, alarm_payload_str)
-                logging.info(f"AlarmService::Published alarm status: {alarm_payload_str} to topic '{self.topic_alarm_status}'")
+            violation = decode(msg.topic, msg.payload)
+        except MessageError as e:
+            logging.error(f"AlarmService::Rejected message on topic '{msg.topic}': {e}")
+            return
+        logging.info(f"AlarmService::Violation of tag {violation.tag} forwarded by {violation.worker}")
+        trace = {
+            "id": violation.trace.id if violation.trace is not None else None,
+            "read_wall": violation.trace.read_wall if violation.trace is not None else None,
+            "receive_wall": time.time(),
+            "received_at": received_at
+        }
+        self.alarm_state_machine.on_violation(violation.tag, device_id=violation.device_id,
+                                              gate_id=violation.gate_id, trace=trace)
+
+    def start_trace(self, read_trace, received_at, received_wall):
+        """
+        @brief Creates the trace context of a received tag and records the network stage.
+        @details The network stage compares wall-clock times of two hosts and is only as exact as their clock synchronisation.
+        @param read_trace The Trace published by the RFID reader, None if the publisher sent none.
+        @param received_at The monotonic time at which the message was received.
+        @param received_wall The wall-clock time at which the message was received.
+        @return A dictionary with the trace ID, the read and receive wall-clock times and the receive monotonic time.
+        """
+        trace = {
+            "id": read_trace.id if read_trace is not None else None,
+            "read_wall": read_trace.read_wall if read_trace is not None else None,
+            "receive_wall": received_wall,
+            "received_at": received_at
+        }
+        if trace["read_wall"] is not None:
+            self.tracer.record("network", received_wall - trace["read_wall"])
+        return trace
+
+    def enqueue_tag(self, tag_nr, trace, gate_id=None):
+        """
+        @brief Queues a tag for a decision, coalescing it with a queued read of the same tag.
+        @param tag_nr The tag number in canonical form.
+        @param trace The trace context of the read, see start_trace().
+        @param gate_id The ID of the gate that read the tag.
+        """
+        if tag_nr in self.pending_tags:
+            self.queue_stats["coalesced"] += 1
+            return
+        try:
+            self.tag_queue.put_nowait(tag_nr)
+        except asyncio.QueueFull:
+            self.queue_stats["dropped"] += 1
+            logging.warning(f"AlarmService::Queue full, dropped tag {tag_nr}")
+            return
+        self.pending_tags[tag_nr] = (trace, gate_id)
+        self.queue_stats["enqueued"] += 1
+        self.queue_stats["high_water"] = max(self.queue_stats["high_water"], self.tag_queue.qsize())
+
+    async def tag_worker(self):
+        """
+        @brief Takes decisions for queued tags until cancelled.
+        """
+        while True:
+            tag_nr = await self.tag_queue.get()
+            trace, gate_id = self.pending_tags.pop(tag_nr)
+            self.tracer.record("queue", time.monotonic() - trace["received_at"])
+            await self.handle_tag(tag_nr, trace, gate_id)
+            self.queue_stats["processed"] += 1
+            self.tag_queue.task_done()
+
+    async def handle_tag(self, tag_nr, trace, gate_id=None):
+        """
+        @brief Looks up the device of a tag, evaluates the alarm rules and reports violations to the state machine.
+        @param tag_nr The tag number in canonical form.
+        @param trace The trace context of the read, see start_trace().
+        @param gate_id The ID of the gate that read the tag.
+        """
+        try:
+            # Get the record of the device
+            lookup_start = time.monotonic()
+            record = await self.get_device_record(tag_nr)
+            self.tracer.record("lookup", time.monotonic() - lookup_start)
+
+            # Report the violation to the state machine if the rules raise the alarm
+            alarm, reason = self.alarm_rules.evaluate(record, gate_id, trace["receive_wall"])
+            self.decision_stats[reason] = self.decision_stats.get(reason, 0) + 1
+            if alarm:
+                logging.info("AlarmService::Device is not borrowed")
+                self.report_violation(tag_nr, record.device_id, gate_id, trace)
             else:
-                logging.info("AlarmService::Device is borrowed, the student can leave the room")
+                logging.info(f"AlarmService::No alarm for tag {tag_nr}: {reason}")
+            self.tracer.record("decision", time.monotonic() - trace["received_at"])
         except Exception as e:
-            logging.error(f"AlarmService::Error handling message: {e}")
+            self.decision_stats["errors"] += 1
+            logging.error(f"AlarmService::Error handling tag {tag_nr}: {e}")
 
-    def setup_mqtt_alarm_rfid_client(self):
+    def report_violation(self, tag_nr, device_id, gate_id, trace):
         """
-        @brief Sets up the MQTT client for publishing to topics.
+        @brief Reports a violation to the state machine, or forwards it to the worker driving the relay.
+        @param tag_nr The tag number in canonical form.
+        @param device_id The ID of the device.
+        @param gate_id The ID of the gate that read the tag.
+        @param trace The trace context of the read, see start_trace().
         """
-        self.mqtt_alarm_rfid_client = mqtt.Client(
-            client_id=Services.MQTT_ALARM_RFID_SUB,
-            userdata=None,
-            protocol=mqtt.MQTTv311,
-            transport="tcp"
-        )
-        self.mqtt_alarm_rfid_client.on_connect = self.on_alarm_rfid_connect
-        self.mqtt_alarm_rfid_client.on_message = self.on_alarm_rfid_message
-        self.mqtt_alarm_rfid_client.connect(self.broker_address, self.mqtt_port)
+        if self.is_relay_owner:
+            self.alarm_state_machine.on_violation(tag_nr, device_id=device_id, gate_id=gate_id, trace=trace)
+            return
+        violation = AlarmViolation(tag=tag_nr, worker=self.worker_id, device_id=device_id, gate_id=gate_id,
+                                   trace=Trace(id=trace["id"], read_wall=trace["read_wall"]) if trace["id"] else None)
+        self.transport.publish_message(self.topic_alarm_violation, violation, qos=MQTTConfig.COMMAND_QOS)
 
-    def setup_mqtt_alarm_gui_client(self):
+    async def get_device_record(self, tag_nr):
         """
-        @brief Sets up the MQTT client for publishing messages.
+        @brief Retrieves the device record of a tag from the cache or on a database thread.
+        @param tag_nr The tag number in canonical form.
+        @return A DeviceRecord, None if the tag is unknown.
         """
-        self.mqtt_alarm_gui_client = mqtt.Client(
-            client_id=Services.MQTT_ALARM_GUI_SUB,
-            userdata=None,
-            protocol=mqtt.MQTTv311,
-            transport="tcp"
-        )
+        now = time.monotonic()
+        # Entries are kept in the order of their expiry
+        while self.device_cache and next(iter(self.device_cache.values()))[0] <= now:
+            self.device_cache.popitem(last=False)
+        cached = self.device_cache.get(tag_nr)
+        if cached is not None:
+            self.device_cache_stats["hits"] += 1
+            return cached[1]
 
-        self.mqtt_alarm_gui_client.on_connect = self.on_alarm_gui_sub_connect
-        self.mqtt_alarm_gui_client.on_message = self.on_alarm_gui_sub_message
-        self.mqtt_alarm_gui_client.connect(self.broker_address, self.mqtt_port)
+        self.device_cache_stats["misses"] += 1
+        generation = self.device_cache_stats["invalidations"]
+        record = await self.loop.run_in_executor(self.db_executor, self._query_device_record, tag_nr)
+        # A record queried across a reload of the rules is not cached
+        if AlarmConfig.DEVICE_CACHE_TTL and generation == self.device_cache_stats["invalidations"]:
+            self.device_cache.pop(tag_nr, None)
+            self.device_cache[tag_nr] = (time.monotonic() + AlarmConfig.DEVICE_CACHE_TTL, record)
+        return record
 
-    def start(self):
+    def invalidate_device_cache(self):
         """
-        @brief Starts the alarm service by setting up the MQTT client and starting the loop.
+        @brief Drops all cached device records.
         """
-        self.setup_mqtt_alarm_rfid_client()
-        self.setup_mqtt_alarm_gui_client()
+        self.device_cache.clear()
+        self.device_cache_stats["invalidations"] += 1
 
-        threading.Thread(target=self.mqtt_alarm_rfid_client.loop_start, daemon=True).start()
-        threading.Thread(target=self.mqtt_alarm_gui_client.loop_start, daemon=True).start()
+    def get_device_cache_stats(self):
+        """
+        @brief Returns the metrics of the device record cache.
+        @return A dictionary with the number of cached records, hits, misses and invalidations.
+        """
+        return {"size": len(self.device_cache), **self.device_cache_stats}
 
-        logging.info("AlarmService::AlarmService started and running")
+    def _query_device_record(self, tag_nr):
+        """
+        @brief Queries the device record of a tag with the connection of the calling thread.
+        @details Every database thread opens its own connection on first use.
+        @param tag_nr The tag number in canonical form.
+        @return A DeviceRecord, None if the tag is unknown.
+        """
+        return self._device_source().get_device_record_by_tag_number(tag_nr)
+
+    def _device_source(self):
+        """
+        @brief Returns the device lookup of the calling database thread.
+        @details Every database thread opens its own connection on first use.
+        @return The device source of the thread.
+        """
+        device_source = getattr(self.db_local, "device_source", None)
+        if device_source is None:
+            device_source = self.db_local.device_source = create_device_source(AlarmConfig.DEVICE_SOURCE)
+        return device_source
 
+    async def check_returned_at_column(self):
+        """
+        @brief Checks once at startup that the returned_at column of the devices table exists.
+        @details The column is added by data_layer/migrations/001_devices_returned_at.sql. The
+                 device lookups need it, so a missing migration is logged as an error at once
+                 instead of with the first tag.
+        """
         try:
-            while True:
-                time.sleep(1)  # Sleep for a short duration to prevent high CPU usage
-        except KeyboardInterrupt:
-            logging.info("AlarmService::AlarmService stopping due to keyboard interrupt")
-            self.mqtt_alarm_rfid_client.loop_stop()
-            self.mqtt_alarm_gui_client.loop_stop()
-            logging.info("AlarmService::AlarmService stopped")
\ No newline at end of file
+            available = await self.loop.run_in_executor(
+                self.db_executor, lambda: self._device_source().check_returned_at_column())
+        except Exception as e:
+            logging.warning(f"AlarmService::Could not check the returned_at column: {e}")
+            return
+        if not available:
+            logging.error("AlarmService::The returned_at column of the devices table is missing or not a DATETIME, "
+                          "apply data_layer/migrations/001_devices_returned_at.sql")
+
+    def on_alarm_state_changed(self, state, details):
+        """
+        @brief Records a change of the alarm state in the audit log and publishes it.
+        @param state The new AlarmState.
+        @details Called right after the relay was switched, so a TRIGGERED change closes the tag-to-relay stage.
+        @param details The details of the state change (tag, cause, device_id, gate_id, trace, deactivated_by).
+        """
+        trace = details.pop('trace', None)
+        latency_ms = None
+        if trace is not None:
+            relay_latency = time.monotonic() - trace['received_at']
+            self.tracer.record("tag_to_relay", relay_latency)
+            latency_ms = round(relay_latency * 1000, 3)
+            if trace['id'] is not None:
+                details["trace"] = Trace(id=trace['id'], read_wall=trace['read_wall'], relay_wall=time.time())
+        self.alarm_event_writer.record(state,
+                                       cause=details.get('cause'),
+                                       tag_nr=details.get('tag'),
+                                       device_id=details.get('device_id'),
+                                       gate_id=details.get('gate_id'),
+                                       deactivated_by=details.get('deactivated_by'),
+                                       latency_ms=latency_ms)
+        self.publish_alarm_status(state, details)
+
+    def publish_alarm_status(self, state, details):
+        """
+        @brief Publishes a change of the alarm state to the GUI.
+        @details May be called from timer threads of the state machine, the publication is handed to the event loop.
+        @param state The new AlarmState.
+        @param details The details of the state change (tag, cause, deactivated_by, trace).
+        """
+        messages = {
+            AlarmState.IDLE: "The alarm is armed",
+            AlarmState.TRIGGERED: f"Device with tag number {details.get('tag')} is not borrowed",
+            AlarmState.ACKNOWLEDGED: "The alarm has been turned off",
+            AlarmState.COOLDOWN: "The alarm will be armed again shortly"
+        }
+        try:
+            alarm_status = AlarmStatus(status=state.value, message=messages[state], **details)
+        except MessageError as e:
+            logging.error(f"AlarmService::Invalid alarm status {state.value} not published: {e}")
+            return
+        if self.loop is None:
+            logging.warning(f"AlarmService::Not running, alarm status {state.value} not published")
+            return
+        self.loop.call_soon_threadsafe(self._publish_alarm_status, alarm_status, time.monotonic())
+
+    def _publish_alarm_status(self, alarm_status, created_at):
+        """
+        @brief Publishes an alarm status on the event loop and stamps the publication time.
+        @details The status is retained, so a GUI that connects later shows the current state at once.
+                 The time is stamped on a copy, the trace of the status is shared with the tag read
+                 delivered to other receivers.
+        @param alarm_status The AlarmStatus message.
+        @param created_at The monotonic time at which the state changed.
+        """
+        if alarm_status.trace is not None:
+            alarm_status = alarm_status.replace(trace=alarm_status.trace.replace(publish_wall=time.time()))
+        self.alarm_status = alarm_status
+        self.transport.publish_message(self.topic_alarm_status, alarm_status, qos=MQTTConfig.COMMAND_QOS, retain=True)
+        self.tracer.record("status_publish", time.monotonic() - created_at)
+        logging.info(f"AlarmService::Published alarm status: {alarm_status} to topic '{self.topic_alarm_status}'")
+
+    def republish_alarm_status(self):
+        """
+        @brief Publishes the current alarm state again after every connection to the broker.
+        @details Replaces a retained state left by a previous run or lost by a restarted broker.
+                 The trace is left out, the state change it measured was already published.
+        """
+        if self.alarm_status is None:
+            self.publish_alarm_status(self.alarm_state_machine.state, {})
+            return
+        alarm_status = self.alarm_status.replace(trace=None)
+        self.transport.publish_message(self.topic_alarm_status, alarm_status, qos=MQTTConfig.COMMAND_QOS, retain=True)
+
+    async def reload_rules(self):
+        """
+        @brief Reloads the alarm rules whenever their file changes.
+        @details The cached device records are dropped with every reload.
+        """
+        while True:
+            await asyncio.sleep(AlarmConfig.RULES_RELOAD_INTERVAL)
+            if self.alarm_rules.reload_if_changed():
+                self.invalidate_device_cache()
+
+    async def publish_metrics(self):
+        """
+        @brief Publishes the alarm metrics periodically, e.g. for the load generator.
+        """
+        while True:
+            await asyncio.sleep(AlarmConfig.METRICS_PUBLISH_INTERVAL)
+            metrics = AlarmMetrics(time=time.time(),
+                                   worker=self.worker_id,
+                                   queue=self.get_queue_stats(),
+                                   decisions=dict(self.decision_stats),
+                                   latency=self.get_latency_stats(),
+                                   transport=self.transport.get_stats(),
+                                   device_cache=self.get_device_cache_stats())
+            self.transport.publish_message(self.topic_alarm_metrics, metrics)
+
+    async def report_latency(self):
+        """
+        @brief Logs the stage latency percentiles periodically.
+        """
+        while True:
+            await asyncio.sleep(AlarmConfig.LATENCY_REPORT_INTERVAL)
+            logging.info(f"AlarmService::Stage latency (ms): {self.tracer.report()}")
+            logging.info(f"AlarmService::Queue: {self.get_queue_stats()}")
+            logging.info(f"AlarmService::Device cache: {self.get_device_cache_stats()}")
+            logging.info(f"AlarmService::Transport: {self.transport.get_stats()}")
+
+    def get_latency_stats(self):
+        """
+        @brief Returns the measured latencies.
+        @return A dictionary mapping each stage to its latency summary in milliseconds.
+        """
+        return self.tracer.report()
+
+    def get_queue_stats(self):
+        """
+        @brief Returns the backpressure metrics of the tag queue.
+        @return A dictionary with the queue depth, the counters and the queueing delay in milliseconds.
+        """
+        return {
+            "depth": self.tag_queue.qsize() if self.tag_queue is not None else 0,
+            **self.queue_stats,
+            "delay": self.tracer.get_recorder("queue").summary()
+        }
+
+    async def run(self, handle_signals=True):
+        """
+        @brief Runs the alarm service until SIGINT or SIGTERM is received or stop() is called.
+        @param handle_signals Whether to stop on SIGINT and SIGTERM, only possible on the main thread.
+                 A stop() called before run() ends it right after the startup.
+        """
+        with self._stop_lock:
+            self.loop = asyncio.get_running_loop()
+            self.stop_event = asyncio.Event()
+            if self.stop_requested:
+                self.stop_event.set()
+        if handle_signals:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                self.loop.add_signal_handler(sig, self.stop_event.set)
+
+        self.tag_queue = asyncio.Queue(maxsize=AlarmConfig.QUEUE_SIZE)
+        connection = self.loop.create_task(self.transport.run(self.stop_event))
+        tasks = [
+            self.loop.create_task(self.report_latency()),
+            self.loop.create_task(self.reload_rules())
+        ]
+        tasks += [self.loop.create_task(self.tag_worker()) for _ in range(AlarmConfig.WORKER_COUNT)]
+        if AlarmConfig.METRICS_PUBLISH_INTERVAL:
+            tasks.append(self.loop.create_task(self.publish_metrics()))
+        if AlarmConfig.DEVICE_SOURCE == "database":
+            tasks.append(self.loop.create_task(self.check_returned_at_column()))
+        self.alarm_event_writer.start()
+        logging.info("AlarmService::AlarmService started and running")
+
+        await self.stop_event.wait()
+        logging.info("AlarmService::AlarmService stopping")
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await connection
+        self.alarm_state_machine.stop()
+        self.alarm.stop_alarm()
+        self.alarm.output_driver.cleanup()
+        self.alarm_event_writer.stop()
+        self.db_executor.shutdown(wait=True)
+        logging.info("AlarmService::AlarmService stopped")
+
+    def stop(self):
+        """
+        @brief Stops the alarm service from any thread, also before run() was entered.
+        """
+        with self._stop_lock:
+            self.stop_requested = True
+            if self.loop is not None:
+                self.loop.call_soon_threadsafe(self.stop_event.set)
+
+    def start(self):
+        """
+        @brief Starts the alarm service and blocks until it is stopped.
+        """
+        asyncio.run(self.run())
@@ -0,0 +1,166 @@
+import time
+import logging
+import threading
+
+from application_layer.alarm_pi.alarm_config import AlarmConfig
+from application_layer.states import AlarmState
+
+class AlarmStateMachine:
+    """
+    @brief Decides when the relay is switched and when the alarm state is published.
+
+    States:
+    - IDLE: armed, the first violation triggers the alarm.
+    - TRIGGERED: relay on. Turned off by a deactivation or after AlarmConfig.HOLD_TIME.
+    - ACKNOWLEDGED: relay off, the tags of the incident do not trigger again. Ends when none of
+      them has been read for AlarmConfig.CLEAR_TIME seconds.
+    - COOLDOWN: relay off for AlarmConfig.REARM_TIME seconds, then IDLE.
+
+    A tag that triggered the alarm is suppressed for AlarmConfig.SUPPRESSION_WINDOW seconds.
+    A violation by any other tag triggers the alarm from every state but TRIGGERED.
+    The callback is called exactly once per state change.
+    """
+
+    def __init__(self, alarm, on_state_changed=None):
+        """
+        @brief Initializes the AlarmStateMachine class.
+        @param alarm The Alarm driving the relay.
+        @param on_state_changed Callback called with (state, details) after every state change.
+        """
+        self.alarm = alarm
+        self.on_state_changed = on_state_changed
+        self.state = AlarmState.IDLE
+        self.suppressed_until = {}
+        self.incident_tags = set()
+        self.last_incident_read = 0.0
+        self._timer = None
+        self._lock = threading.RLock()
+
+    def on_violation(self, tag_nr, **context):
+        """
+        @brief Handles the read of a tag that is not allowed to leave the room.
+        @param tag_nr The tag number in canonical form.
+        @param context Details of the read passed on with the TRIGGERED state change (device_id, gate_id, ...).
+        @return True if the violation triggered the alarm, otherwise False.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if tag_nr in self.incident_tags and self.state in (AlarmState.TRIGGERED, AlarmState.ACKNOWLEDGED):
+                self.last_incident_read = now
+                return False
+            if self.suppressed_until.get(tag_nr, 0) > now:
+                return False
+
+            self.suppressed_until[tag_nr] = now + AlarmConfig.SUPPRESSION_WINDOW
+            self._prune_suppressions(now)
+            self.last_incident_read = now
+
+            if self.state == AlarmState.TRIGGERED:
+                self.incident_tags.add(tag_nr)
+                logging.info(f"AlarmStateMachine::Tag {tag_nr} joined the running alarm")
+                return False
+
+            self.incident_tags = {tag_nr}
+            self.alarm.start_alarm()
+            self._transition(AlarmState.TRIGGERED, tag=tag_nr, cause="device_not_borrowed", **context)
+            if AlarmConfig.HOLD_TIME:
+                self._schedule(AlarmConfig.HOLD_TIME, self._on_hold_time_expired)
+            return True
+
+    def deactivate(self, source="gui"):
+        """
+        @brief Handles a deactivation command.
+        @details The relay is always turned off, the state only changes if the alarm is triggered.
+        @param source Who deactivated the alarm.
+        @return True if a triggered alarm was acknowledged, otherwise False.
+        """
+        with self._lock:
+            self.alarm.stop_alarm()
+            if self.state != AlarmState.TRIGGERED:
+                logging.info(f"AlarmStateMachine::Deactivation in state {self.state.value}, nothing to acknowledge")
+                return False
+            self._acknowledge(cause="deactivated", deactivated_by=source)
+            return True
+
+    def _on_hold_time_expired(self):
+        """
+        @brief Turns the relay off once the hold time of a triggered alarm is over.
+        """
+        with self._lock:
+            if self.state != AlarmState.TRIGGERED:
+                return
+            self.alarm.stop_alarm()
+            self._acknowledge(cause="hold_time_expired")
+
+    def _acknowledge(self, **details):
+        """
+        @brief Enters ACKNOWLEDGED and starts watching for the end of the incident.
+        @param details Details published with the state change.
+        """
+        self._transition(AlarmState.ACKNOWLEDGED, **details)
+        self._schedule(AlarmConfig.CLEAR_TIME, self._on_clear_check)
+
+    def _on_clear_check(self):
+        """
+        @brief Enters COOLDOWN once the tags of the incident are no longer read.
+        """
+        with self._lock:
+            if self.state != AlarmState.ACKNOWLEDGED:
+                return
+            remaining = self.last_incident_read + AlarmConfig.CLEAR_TIME - time.monotonic()
+            if remaining > 0:
+                self._schedule(remaining, self._on_clear_check)
+                return
+            self.incident_tags = set()
+            self._transition(AlarmState.COOLDOWN, cause="incident_cleared")
+            self._schedule(AlarmConfig.REARM_TIME, self._on_rearm)
+
+    def _on_rearm(self):
+        """
+        @brief Re-arms the alarm after the cooldown.
+        """
+        with self._lock:
+            if self.state == AlarmState.COOLDOWN:
+                self._transition(AlarmState.IDLE, cause="rearmed")
+
+    def _schedule(self, delay, callback):
+        """
+        @brief Replaces the pending timer of the state machine.
+        @param delay The delay in seconds.
+        @param callback The function to call after the delay.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, callback)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _transition(self, state, **details):
+        """
+        @brief Changes the state and notifies the callback.
+        @param state The new AlarmState.
+        @param details Details published with the state change.
+        """
+        if state == self.state:
+            return
+        logging.info(f"AlarmStateMachine::{self.state.value} -> {state.value} {details}")
+        self.state = state
+        if self.on_state_changed is not None:
+            self.on_state_changed(state, details)
+
+    def _prune_suppressions(self, now):
+        """
+        @brief Drops expired suppressions so the table does not grow with every tag ever seen.
+        @param now The current monotonic time.
+        """
+        if len(self.suppressed_until) > 1000:
+            self.suppressed_until = {tag: until for tag, until in self.suppressed_until.items() if until > now}
+
+    def stop(self):
+        """
+        @brief Cancels the pending timer.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
@@ -0,0 +1,67 @@
+import os
+import json
+import time
+import logging
+
+from application_layer.device_db_service import DeviceDBService, DeviceRecord
+from application_layer.alarm_pi.alarm_config import AlarmConfig
+
+class PopulationDirectory:
+    """
+    @brief Device lookup backed by the population file of the load generator.
+    @details Stands in for DeviceDBService in benchmarks on a machine without the database.
+             The file is read again when it changes, checked at most once per second.
+    """
+
+    def __init__(self, path):
+        """
+        @brief Initializes the PopulationDirectory class.
+        @param path The path of the population file.
+        """
+        self.path = path
+        self.records = {}
+        self.mtime = None
+        self.last_check = 0.0
+
+    def _reload_if_changed(self):
+        """
+        @brief Reads the population file if it changed since the last read.
+        """
+        now = time.monotonic()
+        if now - self.last_check < 1:
+            return
+        self.last_check = now
+        try:
+            mtime = os.stat(self.path).st_mtime
+            if mtime == self.mtime:
+                return
+            with open(self.path) as population_file:
+                devices = json.load(population_file)["devices"]
+        except (OSError, ValueError, KeyError) as e:
+            logging.error(f"PopulationDirectory::Error reading {self.path}: {e}")
+            return
+        self.records = {device["tag_nr"]: DeviceRecord(device["device_id"], device["tag_nr"], device["is_borrowed"], None)
+                        for device in devices}
+        self.mtime = mtime
+        logging.info(f"PopulationDirectory::Loaded {len(self.records)} devices from {self.path}")
+
+    def get_device_record_by_tag_number(self, tag_number):
+        """
+        @brief Retrieves the record of a device based on its tag number.
+        @param tag_number The tag number in canonical form.
+        @return A DeviceRecord, None if no device has this tag number.
+        """
+        self._reload_if_changed()
+        return self.records.get(tag_number)
+
+def create_device_source(name):
+    """
+    @brief Creates the device lookup selected in the configuration.
+    @param name "database" or "population".
+    @return An object with get_device_record_by_tag_number().
+    """
+    if name == "database":
+        return DeviceDBService()
+    if name == "population":
+        return PopulationDirectory(AlarmConfig.POPULATION_FILE)
+    raise ValueError(f"Unknown device source: {name}")
@@ -0,0 +1,122 @@
+import time
+import logging
+import threading
+from abc import ABC, abstractmethod
+
+class OutputDriver(ABC):
+    """
+    @brief Interface of the digital output driving the alarm relay.
+    """
+
+    @abstractmethod
+    def setup(self, pin):
+        """
+        @brief Prepares the pin as an output.
+        @param pin The pin connected to the relay.
+        """
+
+    @abstractmethod
+    def write(self, pin, state):
+        """
+        @brief Sets the level of the pin.
+        @param pin The pin connected to the relay.
+        @param state True for HIGH (relay on), False for LOW (relay off).
+        """
+
+    def cleanup(self):
+        """
+        @brief Releases the output.
+        """
+        pass
+
+class GPIOOutputDriver(OutputDriver):
+    """
+    @brief Output driver using RPi.GPIO on a Raspberry Pi.
+    @details RPi.GPIO is imported when the driver is created, so the module can be imported on any machine.
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes the GPIOOutputDriver class.
+        """
+        import RPi.GPIO as GPIO
+        self.GPIO = GPIO
+
+    def setup(self, pin):
+        """
+        @brief Sets the BCM pin numbering and prepares the pin as an output.
+        @param pin The BCM number of the pin connected to the relay.
+        """
+        self.GPIO.setmode(self.GPIO.BCM)
+        self.GPIO.setup(pin, self.GPIO.OUT)
+
+    def write(self, pin, state):
+        """
+        @brief Sets the level of the pin.
+        @param pin The BCM number of the pin connected to the relay.
+        @param state True for HIGH (relay on), False for LOW (relay off).
+        """
+        self.GPIO.output(pin, self.GPIO.HIGH if state else self.GPIO.LOW)
+
+    def cleanup(self):
+        """
+        @brief Resets the pins used by this program.
+        """
+        self.GPIO.cleanup()
+
+class SimulatedOutputDriver(OutputDriver):
+    """
+    @brief Pure Python output driver recording every relay transition.
+    @details Each transition is stored as (monotonic time, wall-clock time, pin, state), so the
+             tag-to-relay latency can be measured on any machine.
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes the SimulatedOutputDriver class.
+        """
+        self.states = {}
+        self.transitions = []
+        self.transition_event = threading.Event()
+        self._lock = threading.Lock()
+
+    def setup(self, pin):
+        """
+        @brief Registers the pin with a LOW level.
+        @param pin The pin connected to the relay.
+        """
+        self.states.setdefault(pin, False)
+
+    def write(self, pin, state):
+        """
+        @brief Sets the level of the pin and records the transition if the level changed.
+        @param pin The pin connected to the relay.
+        @param state True for HIGH (relay on), False for LOW (relay off).
+        """
+        with self._lock:
+            if self.states.get(pin) == state:
+                return
+            self.states[pin] = state
+            self.transitions.append((time.monotonic(), time.time(), pin, state))
+        self.transition_event.set()
+        logging.debug(f"SimulatedOutputDriver::Pin {pin} {'HIGH' if state else 'LOW'}")
+
+    def get_transitions(self):
+        """
+        @brief Returns the recorded transitions.
+        @return A list of (monotonic time, wall-clock time, pin, state) tuples, oldest first.
+        """
+        with self._lock:
+            return list(self.transitions)
+
+def create_output_driver(name):
+    """
+    @brief Creates the output driver selected in the configuration.
+    @param name "gpio" or "simulated".
+    @return The OutputDriver instance.
+    """
+    if name == "gpio":
+        return GPIOOutputDriver()
+    if name == "simulated":
+        return SimulatedOutputDriver()
+    raise ValueError(f"Unknown output driver: {name}")
@@ -0,0 +1,55 @@
+import bisect
+import hashlib
+
+class TagPartitioner:
+    """
+    @brief Assigns every tag to one alarm worker by consistent hashing of its EPC.
+
+    Each worker is placed on a hash ring at several points (virtual nodes). A tag belongs to
+    the first worker point following the hash of its EPC. Adding or removing a worker only
+    moves the tags of its neighbouring ring segments, the other workers keep their slices
+    and the state built up for them.
+    """
+
+    def __init__(self, workers, worker_id, virtual_nodes=256):
+        """
+        @brief Initializes the TagPartitioner class.
+        @param workers The IDs of all alarm workers, an empty list for a single alarm controller.
+        @param worker_id The ID of this worker.
+        @param virtual_nodes The number of ring points per worker.
+        @throws ValueError If worker_id is not one of the workers.
+        """
+        if workers and worker_id not in workers:
+            raise ValueError(f"Worker '{worker_id}' is not one of the alarm workers {workers}")
+        self.worker_id = worker_id
+        self.ring = sorted((self._hash(f"{worker}#{index}"), worker)
+                           for worker in set(workers) for index in range(virtual_nodes))
+        self.points = [point for point, _ in self.ring]
+
+    @staticmethod
+    def _hash(key):
+        """
+        @brief Hashes a key to a position on the ring, identical in every process.
+        @param key The string to hash.
+        @return A 64 bit integer.
+        """
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+    def owner_of(self, tag_nr):
+        """
+        @brief Returns the worker responsible for a tag.
+        @param tag_nr The tag number in canonical form.
+        @return The ID of the worker, this worker if there is only one.
+        """
+        if not self.ring:
+            return self.worker_id
+        index = bisect.bisect(self.points, self._hash(tag_nr)) % len(self.ring)
+        return self.ring[index][1]
+
+    def owns(self, tag_nr):
+        """
+        @brief Checks whether this worker is responsible for a tag.
+        @param tag_nr The tag number in canonical form.
+        @return True if this worker decides on the tag, otherwise False.
+        """
+        return self.owner_of(tag_nr) == self.worker_id
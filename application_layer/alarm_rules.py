@@ -0,0 +1,183 @@
+import os
+import time
+import logging
+import datetime
+import configparser
+
+from application_layer.epc_codec import to_canonical
+
+RULES_PATH = 'data_layer/alarm_rules.ini'
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+MINUTES_PER_DAY = 24 * 60
+
+def parse_schedule(schedule):
+    """
+    @brief Parses the armed schedule into a table with one entry per minute of the week.
+    @param schedule Entries separated by ';', each "<day>[-<day>] HH:MM-HH:MM", e.g. "mon-fri 07:00-18:00".
+                    A time range ending before it starts continues on the next day.
+    @return A bytearray of 7 * 1440 entries, 1 where the alarm is armed. None if the schedule is empty.
+    @throws ValueError If an entry cannot be parsed.
+    """
+    entries = [entry.strip() for entry in schedule.split(';') if entry.strip()]
+    if not entries:
+        return None
+
+    armed = bytearray(7 * MINUTES_PER_DAY)
+    for entry in entries:
+        try:
+            days, times = entry.lower().split()
+            first_day, _, last_day = days.partition('-')
+            first = WEEKDAYS.index(first_day)
+            last = WEEKDAYS.index(last_day or first_day)
+            start_time, end_time = times.split('-')
+            start = _parse_minute(start_time)
+            end = _parse_minute(end_time)
+        except ValueError:
+            raise ValueError(f"Invalid schedule entry: '{entry}'")
+
+        length = (end - start) % MINUTES_PER_DAY or MINUTES_PER_DAY
+        day = first
+        while True:
+            for minute in range(day * MINUTES_PER_DAY + start, day * MINUTES_PER_DAY + start + length):
+                armed[minute % len(armed)] = 1
+            if day == last:
+                break
+            day = (day + 1) % 7
+    return armed
+
+def _parse_minute(value):
+    """
+    @brief Converts "HH:MM" to the minute of the day.
+    @param value The time of day. "24:00" is the end of the day.
+    @return The minute of the day.
+    @throws ValueError If the time is invalid.
+    """
+    hours, minutes = (int(part) for part in value.split(':'))
+    if not (0 <= hours <= 24 and 0 <= minutes < 60) or hours * 60 + minutes > MINUTES_PER_DAY:
+        raise ValueError(f"Invalid time: '{value}'")
+    return (hours * 60 + minutes) % MINUTES_PER_DAY
+
+class AlarmRules:
+    """
+    @brief Declarative rule set deciding whether a tag read raises the alarm.
+
+    The rules are read from data_layer/alarm_rules.ini and compiled into a single predicate.
+    A device raises the alarm if it is not borrowed, unless
+    - it is listed in ExemptDevices,
+    - the alarm is not armed by the ArmedSchedule at the time of the read,
+    - it was returned less than GracePeriod seconds ago, according to the returned_at column,
+    - a staff tag was read at the same gate less than StaffOverrideWindow seconds ago.
+
+    Every check is a set lookup, a table lookup or a comparison, so the cost per tag does
+    not depend on the size of the rule set. reload_if_changed() compiles the file again
+    when it was modified. A file that cannot be compiled keeps the previous rules active.
+    """
+
+    def __init__(self, path=RULES_PATH):
+        """
+        @brief Initializes the AlarmRules class and loads the rules.
+        @param path The path of the rules file.
+        """
+        self.path = path
+        self.mtime = None
+        self.staff_tags = frozenset()
+        self.staff_seen = {}
+        self.predicate = self.compile({})
+        self.load()
+
+    def load(self):
+        """
+        @brief Reads and compiles the rules file.
+        @return True if the rules were replaced, otherwise False.
+        """
+        try:
+            self.mtime = os.stat(self.path).st_mtime
+            config = configparser.ConfigParser()
+            with open(self.path) as rules_file:
+                config.read_file(rules_file)
+            rules = dict(config['RULES']) if config.has_section('RULES') else {}
+            staff_tags = frozenset(to_canonical(tag.strip()) for tag in rules.get('stafftags', '').split(',') if tag.strip())
+            predicate = self.compile(rules)
+        except (OSError, configparser.Error, ValueError) as e:
+            logging.error(f"AlarmRules::Error loading rules from {self.path}, keeping the previous rules: {e}")
+            return False
+
+        self.staff_tags = staff_tags
+        self.predicate = predicate
+        logging.info(f"AlarmRules::Loaded rules from {self.path}: {rules}")
+        return True
+
+    def reload_if_changed(self):
+        """
+        @brief Loads the rules again if the file was modified since the last load.
+        @return True if the rules were replaced, otherwise False.
+        """
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError as e:
+            logging.error(f"AlarmRules::Rules file {self.path} not accessible: {e}")
+            return False
+        if mtime == self.mtime:
+            return False
+        return self.load()
+
+    def compile(self, rules):
+        """
+        @brief Compiles a rule set into a predicate.
+        @param rules A dictionary with the lower-case keys of the [RULES] section.
+        @return A function (record, gate_id, now) -> (alarm, reason).
+        @throws ValueError If a rule has an invalid value.
+        """
+        grace_period = float(rules.get('graceperiod') or 0)
+        staff_window = float(rules.get('staffoverridewindow') or 0)
+        armed = parse_schedule(rules.get('armedschedule', ''))
+        exempt_devices = frozenset(int(device_id) for device_id in rules.get('exemptdevices', '').split(',') if device_id.strip())
+        staff_seen = self.staff_seen
+
+        def predicate(record, gate_id, now):
+            if record is None or record.is_borrowed is None:
+                return False, "unknown_tag"
+            if record.is_borrowed:
+                return False, "borrowed"
+            if record.device_id in exempt_devices:
+                return False, "exempt_device"
+            if armed is not None:
+                local = time.localtime(now)
+                if not armed[local.tm_wday * MINUTES_PER_DAY + local.tm_hour * 60 + local.tm_min]:
+                    return False, "outside_schedule"
+            if grace_period and isinstance(record.returned_at, datetime.datetime) \
+                    and now - record.returned_at.timestamp() < grace_period:
+                return False, "grace_period"
+            if staff_window and now - staff_seen.get(gate_id, float('-inf')) < staff_window:
+                return False, "staff_override"
+            return True, "device_not_borrowed"
+
+        return predicate
+
+    def is_staff_tag(self, tag_nr):
+        """
+        @brief Checks whether a tag is a staff badge.
+        @param tag_nr The tag number in canonical form.
+        @return True if the tag is listed in StaffTags.
+        """
+        return tag_nr in self.staff_tags
+
+    def note_staff_read(self, gate_id, now=None):
+        """
+        @brief Starts the staff override window of a gate.
+        @param gate_id The ID of the gate that read the staff tag.
+        @param now The wall-clock time of the read. Default is now.
+        """
+        self.staff_seen[gate_id] = now if now is not None else time.time()
+        logging.info(f"AlarmRules::Staff tag read at gate {gate_id}")
+
+    def evaluate(self, record, gate_id=None, now=None):
+        """
+        @brief Decides whether a device read at a gate raises the alarm.
+        @param record The DeviceRecord of the tag, None if the tag is unknown.
+        @param gate_id The ID of the gate that read the tag.
+        @param now The wall-clock time of the read. Default is now.
+        @return A tuple (alarm, reason). reason is "device_not_borrowed" or the rule that prevented the alarm.
+        """
+        return self.predicate(record, gate_id, now if now is not None else time.time())
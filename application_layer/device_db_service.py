@@ -1,7 +1,16 @@
 import logging
+from collections import namedtuple
 from data_access_layer.device_dao import DeviceDao
+from application_layer.epc_codec import to_canonical, decode_epcs
 import datetime
 
+## The state of a device as seen by the alarm rules. returned_at is the time of the last return, None if unknown.
+DeviceRecord = namedtuple("DeviceRecord", ["device_id", "tag_nr", "is_borrowed", "returned_at"])
+## The types of the returned_at column that the grace period of the alarm rules can use.
+RETURNED_AT_TYPES = ("datetime", "timestamp")
+## A device as identified by its QR code, kept by the ValidationIndex of the GUI.
+DeviceQRRecord = namedtuple("DeviceQRRecord", ["device_id", "name", "qr_code", "is_borrowed"])
+
 class DeviceDBService:
     def __init__(self):
         """
@@ -44,13 +53,47 @@ class DeviceDBService:
     def get_is_borrowed_status_by_tag_number(self, tag_number):
         """
         @brief Retrieves the borrowed status of a device based on its tag number.
-        @param tag_number The tag number of the device.
+        @param tag_number The tag number of the device, in any form accepted by to_canonical().
         @return The borrowed status (True/False) of the device.
         """
+        tag_number = to_canonical(tag_number)
         is_borrowed = self.device_dao.get_is_borrowed_status_by_tag_number(tag_number)
         self.logger.info(f"DeviceDBService: Retrieved borrow status for tag number {tag_number}: {is_borrowed}")
         return is_borrowed
 
+    def get_device_record_by_tag_number(self, tag_number):
+        """
+        @brief Retrieves the record of a device based on its tag number.
+        @param tag_number The tag number of the device, in any form accepted by to_canonical().
+        @return A DeviceRecord, None if no device has this tag number.
+        """
+        tag_number = to_canonical(tag_number)
+        result = self.device_dao.get_device_record_by_tag_number(tag_number)
+        self.logger.info(f"DeviceDBService: Retrieved device record for tag number {tag_number}: {result}")
+        if result is None:
+            return None
+        device_id, is_borrowed, returned_at = result
+        return DeviceRecord(device_id, tag_number, is_borrowed, returned_at)
+
+    def check_returned_at_column(self):
+        """
+        @brief Checks that the migration data_layer/migrations/001_devices_returned_at.sql was applied.
+        @return True if the returned_at column stores the time of the returns, so the grace period of the alarm rules can apply.
+        """
+        column_type = self.device_dao.get_returned_at_type()
+        self.logger.info(f"DeviceDBService: Type of the returned_at column: {column_type}")
+        return column_type in RETURNED_AT_TYPES
+
+    def get_unborrowed_tag_numbers(self):
+        """
+        @brief Retrieves the tag numbers of all devices that are currently not borrowed.
+        @return A list of tag numbers in canonical form.
+        """
+        epc_records = decode_epcs(self.device_dao.get_unborrowed_tag_numbers())
+        tag_numbers = [epc_record.epc for epc_record in epc_records if epc_record is not None]
+        self.logger.info("DeviceDBService: Retrieved unborrowed tag numbers")
+        return tag_numbers
+
     def get_is_borrowed_status_by_device_id(self, device_id):
         """
         @brief Retrieves the borrowed status of a device based on its ID.
@@ -61,6 +104,57 @@ class DeviceDBService:
         self.logger.info(f"DeviceDBService: Retrieved borrow status for device ID {device_id}: {is_borrowed}")
         return is_borrowed
     
+    def get_devices_after_id(self, last_id=0):
+        """
+        @brief Retrieves the devices added after a given ID.
+        @param last_id The highest device ID already known, 0 for all devices.
+        @return A list of DeviceQRRecords ordered by ID.
+        """
+        devices = [self._qr_record(row) for row in self.device_dao.get_devices_after_id(last_id)]
+        self.logger.info(f"DeviceDBService: Retrieved {len(devices)} devices after ID {last_id}")
+        return devices
+
+    def get_borrow_states(self):
+        """
+        @brief Retrieves the borrow status of all devices.
+        @return A dictionary mapping each device ID to True if the device is borrowed.
+        """
+        states = {device_id: bool(is_borrowed) for device_id, is_borrowed in self.device_dao.get_borrow_states()}
+        self.logger.info("DeviceDBService: Retrieved the borrow states of all devices")
+        return states
+
+    def get_device_by_qr_code(self, qr_code):
+        """
+        @brief Retrieves the device of a QR code.
+        @param qr_code The QR code of the device.
+        @return The DeviceQRRecord, None if no device has this QR code.
+        """
+        device = self.device_dao.get_device_by_qr_code(qr_code)
+        self.logger.info(f"DeviceDBService: Retrieved device by QR code {qr_code}")
+        return self._qr_record(device)
+
+    def get_device_by_id(self, device_id):
+        """
+        @brief Retrieves a device and its borrow status by its ID.
+        @param device_id The ID of the device.
+        @return The DeviceQRRecord, None if the device does not exist.
+        """
+        device = self.device_dao.get_device_by_id(device_id)
+        self.logger.info(f"DeviceDBService: Retrieved device by ID {device_id}")
+        return self._qr_record(device)
+
+    @staticmethod
+    def _qr_record(row):
+        """
+        @brief Converts a (id, name, qr_code, is_borrowed) row.
+        @param row The row, None if no device was found.
+        @return The DeviceQRRecord, None for no row.
+        """
+        if row is None:
+            return None
+        device_id, name, qr_code, is_borrowed = row
+        return DeviceQRRecord(device_id, name, qr_code, bool(is_borrowed))
+
     def get_device_name_from_qr_code(self, qr_code):
         """
         @brief Retrieves the name of a device based on its QR code.
@@ -107,7 +201,8 @@ class DeviceDBService:
         @param is_borrowed The new borrowed status of the device (default is False).
         """
         date = datetime.datetime.now() if is_borrowed else None
-        self.device_dao.update_device(device_id, name, is_borrowed, borrower_id, qr_code, date)
+        returned_at = datetime.datetime.now() if not is_borrowed else None  # Starts the grace period of the alarm rules
+        self.device_dao.update_device(device_id, name, is_borrowed, borrower_id, qr_code, date, returned_at)
         self.logger.info(f"DeviceDBService: Updated device ID {device_id}")
 
     def delete_device(self, device_id):
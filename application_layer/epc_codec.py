@@ -0,0 +1,138 @@
+import logging
+import string
+from collections import namedtuple
+
+import numpy as np
+
+EPCRecord = namedtuple("EPCRecord", ["epc", "scheme", "filter", "company_prefix", "item_reference", "serial"])
+"""
+@brief A decoded EPC.
+@details epc is the canonical form (upper case hex string) used for devices.tag_nr. The GS1 fields
+         are only set for SGTIN-96 EPCs, otherwise they are None. scheme is None for EPCs that are
+         not GS1 encoded (e.g. the factory EPC of a blank tag).
+"""
+
+EPC_SCHEMES = {
+    0x2C: "gdti-96",
+    0x2D: "gsrn-96",
+    0x30: "sgtin-96",
+    0x31: "sscc-96",
+    0x32: "sgln-96",
+    0x33: "grai-96",
+    0x34: "giai-96",
+    0x35: "gid-96",
+}
+"""
+@brief The 96-bit EPC schemes of the GS1 Tag Data Standard, indexed by their header byte.
+"""
+
+SGTIN96_HEADER = 0x30
+
+SGTIN_COMPANY_PREFIX_BITS = np.array([40, 37, 34, 30, 27, 24, 20, 0], dtype=np.uint64)
+SGTIN_COMPANY_PREFIX_DIGITS = (12, 11, 10, 9, 8, 7, 6)
+"""
+@brief The SGTIN partition table: bits and digits of the company prefix for each partition value.
+@details The company prefix and the item reference always share 44 bits and 13 digits. Partition 7 is invalid.
+"""
+
+_HEX_DIGITS = frozenset(string.hexdigits.encode())
+
+def to_canonical(epc):
+    """
+    @brief Converts an EPC to its canonical form.
+    @details Accepts a hex string, the hex encoded bytes reported by the Mercury API (e.g. b'E200...')
+             or the raw binary EPC. Bytes that consist only of hex digits are treated as hex encoded.
+    @param epc The EPC as str, bytes, bytearray or memoryview.
+    @return The EPC as upper case hex string.
+    @throws ValueError If the EPC is empty or not valid hex.
+    """
+    if isinstance(epc, (bytes, bytearray, memoryview)):
+        epc = bytes(epc)
+        if len(epc) % 2 == 0 and _HEX_DIGITS.issuperset(epc):
+            epc = epc.decode('ascii')
+        else:
+            return epc.hex().upper()
+
+    epc = epc.strip()
+    if not epc or len(epc) % 2 or not _HEX_DIGITS.issuperset(epc.encode()):
+        raise ValueError(f"Invalid EPC: {epc!r}")
+    return epc.upper()
+
+def decode_epcs(epcs):
+    """
+    @brief Decodes a batch of EPCs into their canonical form and, for SGTIN-96, their GS1 fields.
+    @details The bit fields of all 96-bit EPCs are extracted at once on a numpy array
+             instead of one integer at a time.
+    @param epcs An iterable of EPCs in any form accepted by to_canonical().
+    @return A list of EPCRecord in the order of the input, None for EPCs that are not valid.
+    """
+    canonical = []
+    for epc in epcs:
+        try:
+            canonical.append(to_canonical(epc))
+        except ValueError as e:
+            logging.warning(f"EPCCodec::{e}")
+            canonical.append(None)
+
+    records = [None if epc is None else EPCRecord(epc, None, None, None, None, None) for epc in canonical]
+
+    rows = [index for index, epc in enumerate(canonical) if epc is not None and len(epc) == 24]
+    if not rows:
+        return records
+
+    words = np.frombuffer(bytes.fromhex("".join(canonical[index] for index in rows)), dtype=">u4")
+    words = words.reshape(-1, 3).astype(np.uint64)
+    high = (words[:, 0] << np.uint64(32)) | words[:, 1]
+    low = words[:, 2]
+
+    headers = high >> np.uint64(56)
+    filters = (high >> np.uint64(53)) & np.uint64(0x7)
+    partitions = (high >> np.uint64(50)) & np.uint64(0x7)
+    company_and_item = (high >> np.uint64(6)) & np.uint64((1 << 44) - 1)
+    serials = ((high & np.uint64(0x3F)) << np.uint64(32)) | low
+
+    item_bits = np.uint64(44) - SGTIN_COMPANY_PREFIX_BITS[partitions]
+    company_prefixes = company_and_item >> item_bits
+    item_references = company_and_item & ((np.uint64(1) << item_bits) - np.uint64(1))
+    is_sgtin = (headers == SGTIN96_HEADER) & (partitions < 7)
+
+    for position, index in enumerate(rows):
+        header = int(headers[position])
+        if not is_sgtin[position]:
+            records[index] = records[index]._replace(scheme=EPC_SCHEMES.get(header))
+            continue
+        digits = SGTIN_COMPANY_PREFIX_DIGITS[int(partitions[position])]
+        records[index] = EPCRecord(
+            canonical[index],
+            EPC_SCHEMES[header],
+            int(filters[position]),
+            str(int(company_prefixes[position])).zfill(digits),
+            str(int(item_references[position])).zfill(13 - digits),
+            str(int(serials[position]))
+        )
+    return records
+
+def encode_sgtin96(company_prefix, item_reference, serial, filter_value=1):
+    """
+    @brief Encodes an SGTIN-96 EPC, the inverse of decode_epcs().
+    @param company_prefix The GS1 company prefix as a string of 6 to 12 digits.
+    @param item_reference The item reference as a string of 13 digits minus the digits of the company prefix.
+    @param serial The serial number, at most 2^38 - 1.
+    @param filter_value The filter value (0 to 7).
+    @return The EPC in canonical form.
+    @throws ValueError If a field does not fit its size.
+    """
+    if len(company_prefix) not in SGTIN_COMPANY_PREFIX_DIGITS or len(company_prefix) + len(item_reference) != 13:
+        raise ValueError(f"Invalid SGTIN company prefix {company_prefix!r} or item reference {item_reference!r}")
+    serial = int(serial)
+    if not 0 <= serial < 1 << 38 or not 0 <= filter_value <= 7:
+        raise ValueError(f"Invalid SGTIN serial {serial} or filter {filter_value}")
+
+    partition = SGTIN_COMPANY_PREFIX_DIGITS.index(len(company_prefix))
+    item_bits = 44 - int(SGTIN_COMPANY_PREFIX_BITS[partition])
+    value = SGTIN96_HEADER
+    value = (value << 3) | filter_value
+    value = (value << 3) | partition
+    value = (value << 44) | (int(company_prefix) << item_bits) | int(item_reference)
+    value = (value << 38) | serial
+    return f"{value:024X}"
@@ -0,0 +1,331 @@
+import time
+import queue
+import asyncio
+import logging
+import threading
+import paho.mqtt.client as mqtt
+
+from application_layer.mqtt_config import MQTTConfig
+from application_layer.mqtt_transport import MQTTTransport
+from application_layer.latency_recorder import LatencyRecorder
+from application_layer.messages import NodeStatus
+from application_layer.states import NodeState
+
+class BusMessage:
+    """
+    @brief A message delivered by the EventBus, with the attributes of a paho MQTTMessage used by the handlers.
+    """
+
+    __slots__ = ("topic", "payload", "qos", "retain")
+
+    def __init__(self, topic, payload, qos=0, retain=False):
+        """
+        @brief Initializes the BusMessage class.
+        @param topic The topic.
+        @param payload The payload, a Message or bytes.
+        @param qos The QoS of the publication.
+        @param retain True if the message is a retained message delivered on subscription.
+        """
+        self.topic = topic
+        self.payload = payload
+        self.qos = qos
+        self.retain = retain
+
+class EventBus:
+    """
+    @brief In-process publish/subscribe bus with the topic semantics of MQTT.
+
+    Topic filters may contain the + and # wildcards and retained messages are delivered on
+    subscription. Typed messages are passed on as objects, neither serialised nor copied, so
+    receivers must not modify them. There is no Last Will: the services of the process stop
+    together, and a stopping transport publishes its offline status itself.
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes the EventBus class.
+        """
+        self.transports = set()
+        self.retained = {}
+        self._lock = threading.Lock()
+
+    def attach(self, transport):
+        """
+        @brief Connects a transport to the bus.
+        @param transport The BusTransport.
+        """
+        with self._lock:
+            self.transports.add(transport)
+
+    def detach(self, transport):
+        """
+        @brief Disconnects a transport from the bus.
+        @param transport The BusTransport.
+        """
+        with self._lock:
+            self.transports.discard(transport)
+
+    def retained_for(self, topic_filter):
+        """
+        @brief Returns the retained messages matching a topic filter.
+        @param topic_filter The topic filter of a new subscription.
+        @return A list of (topic, payload, qos) tuples.
+        """
+        with self._lock:
+            return [(topic, payload, qos) for topic, (payload, qos) in self.retained.items()
+                    if mqtt.topic_matches_sub(topic_filter, topic)]
+
+    def publish(self, topic, payload, qos=0, retain=False):
+        """
+        @brief Delivers a message to every transport subscribed to a matching topic filter.
+        @param topic The topic.
+        @param payload The payload, a Message or bytes. An empty retained payload deletes the retained message.
+        @param qos The QoS of the publication.
+        @param retain Whether the bus keeps the message for new subscribers.
+        @return The number of transports the message was delivered to.
+        """
+        with self._lock:
+            if retain:
+                if payload:
+                    self.retained[topic] = (payload, qos)
+                else:
+                    self.retained.pop(topic, None)
+            transports = list(self.transports)
+        delivered = 0
+        for transport in transports:
+            if transport.matches(topic):
+                transport.deliver(BusMessage(topic, payload, qos))
+                delivered += 1
+        return delivered
+
+DEFAULT_BUS = EventBus()
+"""
+@brief The bus shared by all BusTransports of the process.
+"""
+
+class BusTransport:
+    """
+    @brief A transport with the API of MQTTTransport, connected to an in-process EventBus.
+
+    Handlers are called like by MQTTTransport: on a dispatcher thread of the transport when
+    started with start(), or on the event loop when running with run(). A typed message
+    published with publish_message() reaches the handlers as object, decode() returns it
+    without parsing.
+    """
+
+    def __init__(self, client_id, name="BusTransport", bus=None):
+        """
+        @brief Initializes the BusTransport class.
+        @param client_id The client ID, only used in the log messages.
+        @param name The name used in the log messages.
+        @param bus The EventBus. Default is DEFAULT_BUS.
+        """
+        self.client_id = client_id
+        self.name = name
+        self.bus = bus or DEFAULT_BUS
+        self.broker_address = "in-process"
+        self.mqtt_port = None
+        self.qos = MQTTConfig.QOS
+        self.subscriptions = {}
+        self.connected = False
+        self.stats = {"connects": 0, "disconnects": 0, "published": 0, "dropped": 0, "received": 0,
+                      "handler_errors": 0}
+        self.publish_latency = LatencyRecorder()
+        self.loop = None
+        self.node_status = None
+        self.on_connected = None
+        self._inbox = queue.Queue(maxsize=MQTTConfig.PUBLISH_QUEUE_SIZE)
+        self._dispatcher = None
+
+    def subscribe(self, topic, handler, qos=None):
+        """
+        @brief Registers the handler of a topic and subscribes to it.
+        @param topic The topic, wildcards are allowed.
+        @param handler Function called with (client, userdata, msg) for every message on the topic.
+        @param qos The QoS of the subscription, kept for the API of MQTTTransport.
+        """
+        self.subscriptions[topic] = handler
+        if self.connected:
+            self._deliver_retained(topic)
+
+    def set_node_status(self, topic, node):
+        """
+        @brief Announces the liveness of the node on a topic, see MQTTTransport.set_node_status().
+        @param topic The node status topic.
+        @param node The name of the node.
+        """
+        self.node_status = (topic, node)
+
+    def matches(self, topic):
+        """
+        @brief Checks whether the transport subscribed to a topic.
+        @param topic The topic of a publication.
+        """
+        return any(mqtt.topic_matches_sub(topic_filter, topic) for topic_filter in self.subscriptions)
+
+    def deliver(self, msg):
+        """
+        @brief Hands a message to the thread or event loop of the transport.
+        @param msg The BusMessage.
+        """
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self._dispatch, msg)
+            return
+        try:
+            self._inbox.put_nowait(msg)
+        except queue.Full:
+            self.stats["dropped"] += 1
+            logging.warning(f"{self.name}::Inbox full, dropped message on topic '{msg.topic}'")
+
+    def _dispatch(self, msg):
+        """
+        @brief Calls the handlers of a message, an exception does not affect the transport.
+        @param msg The BusMessage.
+        """
+        for topic_filter, handler in list(self.subscriptions.items()):
+            if not mqtt.topic_matches_sub(topic_filter, msg.topic):
+                continue
+            self.stats["received"] += 1
+            try:
+                handler(None, None, msg)
+            except Exception as e:
+                self.stats["handler_errors"] += 1
+                logging.error(f"{self.name}::Error handling message on topic '{msg.topic}': {e}")
+
+    def _run_dispatcher(self):
+        """
+        @brief Dispatches the messages of the inbox until None is received.
+        """
+        while True:
+            msg = self._inbox.get()
+            if msg is None:  # Sent by stop()
+                break
+            self._dispatch(msg)
+
+    def _deliver_retained(self, topic_filter):
+        """
+        @brief Delivers the retained messages matching a new subscription.
+        """
+        for topic, payload, qos in self.bus.retained_for(topic_filter):
+            self.deliver(BusMessage(topic, payload, qos, retain=True))
+
+    def _connect(self):
+        """
+        @brief Attaches to the bus, delivers the retained messages and announces the node.
+        """
+        self.bus.attach(self)
+        self.connected = True
+        self.stats["connects"] += 1
+        logging.info(f"{self.name}::Connected to the in-process event bus")
+        for topic_filter in self.subscriptions:
+            self._deliver_retained(topic_filter)
+        self._publish_node_status(NodeState.ONLINE)
+        if self.on_connected is not None:
+            self.on_connected()
+
+    def _disconnect(self):
+        """
+        @brief Announces the node as offline and detaches from the bus.
+        """
+        if not self.connected:
+            return
+        self._publish_node_status(NodeState.OFFLINE)
+        self.connected = False
+        self.stats["disconnects"] += 1
+        self.bus.detach(self)
+
+    def _publish_node_status(self, state):
+        """
+        @brief Publishes the retained status of the node, if set_node_status() was called.
+        @param state The NodeState.
+        """
+        if self.node_status is not None:
+            topic, node = self.node_status
+            self.publish(topic, NodeStatus(node=node, status=state.value, time=time.time()), MQTTConfig.COMMAND_QOS, True)
+
+    def publish(self, topic, payload, qos=None, retain=False):
+        """
+        @brief Publishes a message on the bus.
+        @details May be called from any thread.
+        @param topic The topic.
+        @param payload The payload, a Message or bytes.
+        @param qos The QoS of the publication. Default is the QoS of the transport.
+        @param retain Whether the bus keeps the message for new subscribers.
+        @return False if the transport is not connected and the publication was dropped, otherwise True.
+        """
+        if not self.connected:
+            self.stats["dropped"] += 1
+            logging.warning(f"{self.name}::Dropped publication on topic '{topic}': not connected")
+            return False
+        started = time.monotonic()
+        self.bus.publish(topic, payload, self.qos if qos is None else qos, retain)
+        self.stats["published"] += 1
+        self.publish_latency.record(time.monotonic() - started)
+        return True
+
+    def publish_message(self, topic, message, codec=None, qos=None, retain=False):
+        """
+        @brief Publishes a typed message as object, without encoding it.
+        @param topic The topic.
+        @param message The Message.
+        @param codec Ignored, kept for the API of MQTTTransport.
+        @param qos The QoS of the publication. Default is the QoS of the transport.
+        @param retain Whether the bus keeps the message for new subscribers.
+        @return False if the publication was dropped, otherwise True.
+        """
+        return self.publish(topic, message, qos, retain)
+
+    def start(self):
+        """
+        @brief Connects to the bus and dispatches the received messages on a thread.
+        """
+        self._dispatcher = threading.Thread(target=self._run_dispatcher, name=f"{self.name}Dispatcher", daemon=True)
+        self._dispatcher.start()
+        self._connect()
+
+    async def run(self, stop_event):
+        """
+        @brief Connects to the bus and dispatches the received messages on the running event loop until stop_event is set.
+        @param stop_event The asyncio.Event ending the connection.
+        """
+        self.loop = asyncio.get_running_loop()
+        self._connect()
+        await stop_event.wait()
+        self._disconnect()
+
+    def stop(self):
+        """
+        @brief Disconnects from the bus and stops the dispatcher thread started by start().
+        """
+        self._disconnect()
+        if self._dispatcher is not None:
+            self._inbox.put(None)
+            self._dispatcher.join()
+            self._dispatcher = None
+
+    def get_stats(self):
+        """
+        @brief Returns the transport metrics.
+        @return A dictionary with the connection state, the counters, the pending publications
+                and the publish latency in milliseconds.
+        """
+        return {
+            "connected": self.connected,
+            **self.stats,
+            "pending": self._inbox.qsize(),
+            "publish_latency": self.publish_latency.summary()
+        }
+
+def create_transport(transport, client_id, name):
+    """
+    @brief Creates the transport selected in the configuration.
+    @param transport "mqtt" or "bus".
+    @param client_id The client ID.
+    @param name The name used in the log messages.
+    @return An MQTTTransport, or a BusTransport on DEFAULT_BUS.
+    """
+    if transport == "mqtt":
+        return MQTTTransport(client_id, name)
+    if transport == "bus":
+        return BusTransport(client_id, name)
+    raise ValueError(f"Unknown transport: {transport}")
@@ -0,0 +1,60 @@
+import math
+from collections import deque
+
+class LatencyRecorder:
+    """
+    @brief Keeps the most recent latency samples and computes percentiles over them.
+    """
+
+    def __init__(self, size=1000):
+        """
+        @brief Initializes the LatencyRecorder class.
+        @param size The number of most recent samples kept.
+        """
+        self.samples = deque(maxlen=size)
+        self.count = 0
+
+    def record(self, seconds):
+        """
+        @brief Adds a latency sample.
+        @param seconds The latency in seconds.
+        """
+        self.samples.append(seconds)
+        self.count += 1
+
+    def percentile(self, percent):
+        """
+        @brief Computes a percentile of the kept samples (nearest rank).
+        @param percent The percentile between 0 and 100.
+        @return The latency in seconds, or None if there is no sample.
+        """
+        if not self.samples:
+            return None
+        return self._nearest_rank(sorted(self.samples), percent)
+
+    @staticmethod
+    def _nearest_rank(ordered, percent):
+        """
+        @brief Picks a percentile from sorted samples.
+        @param ordered The samples in ascending order.
+        @param percent The percentile between 0 and 100.
+        @return The sample at the nearest rank.
+        """
+        rank = max(math.ceil(percent / 100 * len(ordered)) - 1, 0)
+        return ordered[min(rank, len(ordered) - 1)]
+
+    def summary(self):
+        """
+        @brief Summarises the kept samples.
+        @return A dictionary with the total count and p50, p90, p99 and max in milliseconds.
+        """
+        if not self.samples:
+            return {"count": self.count, "p50": None, "p90": None, "p99": None, "max": None}
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "p50": round(self._nearest_rank(ordered, 50) * 1000, 3),
+            "p90": round(self._nearest_rank(ordered, 90) * 1000, 3),
+            "p99": round(self._nearest_rank(ordered, 99) * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3)
+        }
@@ -0,0 +1,57 @@
+import time
+import logging
+
+from application_layer.latency_recorder import LatencyRecorder
+
+class LatencyTracer:
+    """
+    @brief Aggregates the latency of the stages a tag read goes through and reports their percentiles.
+
+    Stage latencies are recorded by name. Every report_interval seconds the next record()
+    logs the percentiles of all stages, so no timer thread is needed.
+    """
+
+    def __init__(self, name, report_interval=60, size=1000):
+        """
+        @brief Initializes the LatencyTracer class.
+        @param name The name used in the log messages.
+        @param report_interval The interval in seconds between two reports in the log, 0 disables them.
+        @param size The number of most recent samples kept per stage.
+        """
+        self.name = name
+        self.report_interval = report_interval
+        self.size = size
+        self.recorders = {}
+        self.last_report = time.monotonic()
+
+    def record(self, stage, seconds):
+        """
+        @brief Adds a latency sample to a stage.
+        @param stage The name of the stage.
+        @param seconds The latency in seconds. Negative values (clock skew between hosts) are ignored.
+        """
+        if seconds is None or seconds < 0:
+            return
+        self.get_recorder(stage).record(seconds)
+
+        if self.report_interval and time.monotonic() - self.last_report >= self.report_interval:
+            self.last_report = time.monotonic()
+            logging.info(f"{self.name}::Stage latency (ms): {self.report()}")
+
+    def get_recorder(self, stage):
+        """
+        @brief Returns the recorder of a stage.
+        @param stage The name of the stage.
+        @return The LatencyRecorder of the stage, created if needed.
+        """
+        recorder = self.recorders.get(stage)
+        if recorder is None:
+            recorder = self.recorders[stage] = LatencyRecorder(self.size)
+        return recorder
+
+    def report(self):
+        """
+        @brief Summarises all stages.
+        @return A dictionary mapping each stage to its count and p50, p90, p99 and max in milliseconds.
+        """
+        return {stage: recorder.summary() for stage, recorder in self.recorders.items()}
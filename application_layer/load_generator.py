@@ -0,0 +1,240 @@
+import sys
+import json
+import time
+import uuid
+import random
+import logging
+import platform
+import threading
+
+from application_layer.services import Services
+from application_layer.mqtt_config import MQTTConfig
+from application_layer.mqtt_transport import MQTTTransport
+from application_layer.messages import TagRead, Trace, MessageError, decode, encode
+from application_layer.epc_codec import encode_sgtin96
+from application_layer.alarm_pi.alarm_config import AlarmConfig
+from application_layer.states import AlarmState
+
+COMPANY_PREFIX = "0614141"
+
+def generate_population(size, borrowed_ratio, seed):
+    """
+    @brief Generates a reproducible population of tagged devices.
+    @param size The number of devices.
+    @param borrowed_ratio The share of borrowed devices (0 to 1).
+    @param seed The seed of the random generator.
+    @return A list of dictionaries with device_id, tag_nr and is_borrowed.
+    """
+    rng = random.Random(seed)
+    return [{
+        "device_id": index + 1,
+        "tag_nr": encode_sgtin96(COMPANY_PREFIX, f"{index % 1000000:06d}", index),
+        "is_borrowed": rng.random() < borrowed_ratio
+    } for index in range(size)]
+
+def save_population(path, population, seed, borrowed_ratio):
+    """
+    @brief Writes a population file for the "population" device source of the alarm.
+    @param path The path of the file.
+    @param population The list returned by generate_population().
+    @param seed The seed the population was generated with.
+    @param borrowed_ratio The borrowed ratio the population was generated with.
+    """
+    with open(path, "w") as population_file:
+        json.dump({"seed": seed, "borrowed_ratio": borrowed_ratio, "devices": population}, population_file)
+    logging.info(f"LoadGenerator::Wrote {len(population)} devices to {path}")
+
+class LoadGenerator:
+    """
+    @brief Impersonates RFID gates and measures how the alarm controller copes with the load.
+
+    Every gate publishes tag reads of randomly chosen devices of the population on its own
+    MQTT connection, paced to its share of the total rate. The alarm metrics published by
+    AlarmService before and after the run give the decision throughput, the queueing delay
+    and the drop rate. With the same seed, the same tags are sent in the same order.
+    """
+
+    def __init__(self, population, gates=1, rate=100, duration=10, seed=0, codec=None, qos=None,
+                 broker_address=None, mqtt_port=None):
+        """
+        @brief Initializes the LoadGenerator class.
+        @param population The list returned by generate_population().
+        @param gates The number of impersonated gates, each with its own connection.
+        @param rate The total number of tag reads per second.
+        @param duration The duration of the load in seconds.
+        @param seed The seed of the tag selection.
+        @param codec The codec of the tag reads. Default is MQTTConfig.TAG_CODEC.
+        @param qos The QoS of the tag reads. Default is MQTTConfig.QOS.
+        @param broker_address The address of the broker. Default is Services.BROKER_ADDRESS.
+        @param mqtt_port The port of the broker. Default is Services.MQTT_PORT.
+        """
+        self.population = population
+        self.gates = gates
+        self.rate = rate
+        self.duration = duration
+        self.seed = seed
+        self.codec = codec or MQTTConfig.TAG_CODEC
+        self.qos = MQTTConfig.QOS if qos is None else qos
+        self.broker_address = broker_address
+        self.mqtt_port = mqtt_port
+        self.sent = [0] * gates
+        self.publish_dropped = [0] * gates
+        self.alarms_triggered = 0
+        self.metrics = None
+        self._metrics_received = threading.Condition()
+
+    def on_alarm_metrics(self, client, userdata, msg):
+        """
+        @brief Keeps the latest alarm metrics.
+        """
+        try:
+            metrics = decode(msg.topic, msg.payload)
+        except MessageError as e:
+            logging.error(f"LoadGenerator::Rejected alarm metrics: {e}")
+            return
+        with self._metrics_received:
+            self.metrics = metrics
+            self._metrics_received.notify_all()
+
+    def on_alarm_status(self, client, userdata, msg):
+        """
+        @brief Counts the triggered alarms.
+        """
+        try:
+            if decode(msg.topic, msg.payload).status == AlarmState.TRIGGERED.value:
+                self.alarms_triggered += 1
+        except MessageError as e:
+            logging.error(f"LoadGenerator::Rejected alarm status: {e}")
+
+    def wait_for_metrics(self, newer_than, timeout):
+        """
+        @brief Waits for alarm metrics published after a point in time.
+        @param newer_than The wall-clock time the metrics must be newer than.
+        @param timeout The maximum time to wait in seconds.
+        @return The AlarmMetrics, None if none arrived in time.
+        """
+        with self._metrics_received:
+            self._metrics_received.wait_for(lambda: self.metrics is not None and self.metrics.time > newer_than, timeout)
+            return self.metrics if self.metrics is not None and self.metrics.time > newer_than else None
+
+    def run_gate(self, index, transport, stop_at):
+        """
+        @brief Publishes the tag reads of one gate until stop_at.
+        @param index The index of the gate.
+        @param transport The MQTTTransport of the gate.
+        @param stop_at The monotonic time at which the gate stops.
+        """
+        rng = random.Random(f"{self.seed}-{index}")
+        gate_id = f"load_gate_{index + 1}"
+        interval = self.gates / self.rate
+        next_read = time.monotonic()
+        while next_read < stop_at:
+            delay = next_read - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            device = self.population[rng.randrange(len(self.population))]
+            message = TagRead(gate=gate_id, epc=device["tag_nr"], rssi=-rng.randint(40, 80),
+                              trace=Trace(id=uuid.UUID(int=rng.getrandbits(128)).hex, read_wall=time.time(),
+                                          read_mono=time.monotonic()))
+            if transport.publish(Services.TOPIC_RFID_TAGS, encode(message, self.codec), self.qos):
+                self.sent[index] += 1
+            else:
+                self.publish_dropped[index] += 1
+            next_read += interval
+
+    def run(self):
+        """
+        @brief Runs the load and collects the measurements.
+        @return The report dictionary, see build_report().
+        """
+        monitor = MQTTTransport(f"load_monitor_{self.seed}", "LoadGenerator", self.broker_address, self.mqtt_port)
+        monitor.subscribe(Services.TOPIC_ALARM_METRICS, self.on_alarm_metrics)
+        monitor.subscribe(Services.TOPIC_ALARM_STATUS, self.on_alarm_status, MQTTConfig.COMMAND_QOS)
+        monitor.start()
+        transports = [MQTTTransport(f"load_gate_{index + 1}", f"LoadGate{index + 1}", self.broker_address, self.mqtt_port)
+                      for index in range(self.gates)]
+        for transport in transports:
+            transport.start()
+
+        try:
+            metrics_timeout = 2 * AlarmConfig.METRICS_PUBLISH_INTERVAL + 1
+            baseline = self.wait_for_metrics(0, metrics_timeout)
+            if baseline is None:
+                logging.warning("LoadGenerator::No alarm metrics received, only the load side is measured")
+            self.alarms_triggered = 0
+
+            logging.info(f"LoadGenerator::Sending {self.rate} tags/s from {self.gates} gates for {self.duration}s")
+            started_wall = time.time()
+            started = time.monotonic()
+            threads = [threading.Thread(target=self.run_gate, args=(index, transport, started + self.duration),
+                                        name=f"LoadGate{index + 1}", daemon=True)
+                       for index, transport in enumerate(transports)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.monotonic() - started
+
+            final = self.wait_for_metrics(time.time(), metrics_timeout) if baseline is not None else None
+            return self.build_report(baseline, final, started_wall, elapsed, transports)
+        finally:
+            for transport in transports + [monitor]:
+                transport.stop()
+
+    def build_report(self, baseline, final, started_wall, elapsed, transports):
+        """
+        @brief Builds the report of a run.
+        @param baseline The AlarmMetrics before the load, None if the alarm did not publish any.
+        @param final The AlarmMetrics after the load, None if the alarm did not publish any.
+        @param started_wall The wall-clock time at which the load started.
+        @param elapsed The duration of the load in seconds.
+        @param transports The MQTTTransports of the gates.
+        @return A dictionary with the parameters, the environment, the load side and the alarm side measurements.
+        """
+        sent = sum(self.sent)
+        report = {
+            "parameters": {
+                "gates": self.gates,
+                "rate": self.rate,
+                "duration": self.duration,
+                "population": len(self.population),
+                "borrowed": sum(device["is_borrowed"] for device in self.population),
+                "seed": self.seed,
+                "codec": self.codec,
+                "qos": self.qos
+            },
+            "environment": {
+                "started": started_wall,
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "broker": f"{transports[0].broker_address}:{transports[0].mqtt_port}"
+            },
+            "load": {
+                "sent": sent,
+                "publish_dropped": sum(self.publish_dropped),
+                "elapsed": round(elapsed, 3),
+                "achieved_rate": round(sent / elapsed, 2) if elapsed else 0.0,
+                "publish_latency": [transport.get_stats()["publish_latency"] for transport in transports]
+            },
+            "alarm": None
+        }
+        if baseline is None or final is None:
+            return report
+
+        queue = {key: final.queue[key] - baseline.queue.get(key, 0)
+                 for key in ("enqueued", "coalesced", "dropped", "processed")}
+        offered = queue["enqueued"] + queue["coalesced"] + queue["dropped"]
+        report["alarm"] = {
+            "received": offered,
+            **queue,
+            "decision_throughput": round(queue["processed"] / elapsed, 2) if elapsed else 0.0,
+            "drop_rate": round(queue["dropped"] / offered, 4) if offered else 0.0,
+            "loss": sent - offered,
+            "depth_at_end": final.queue["depth"],
+            "high_water": final.queue["high_water"],
+            "queue_delay": final.queue["delay"],
+            "decisions": {reason: count - baseline.decisions.get(reason, 0) for reason, count in final.decisions.items()},
+            "alarms_triggered": self.alarms_triggered,
+            "latency": final.latency
+        }
+        return report
@@ -0,0 +1,443 @@
+import struct
+import asyncio
+import logging
+import threading
+import paho.mqtt.client as mqtt
+
+# Packet types of MQTT 3.1.1
+CONNECT, CONNACK, PUBLISH, PUBACK, PUBREC, PUBREL, PUBCOMP = 1, 2, 3, 4, 5, 6, 7
+SUBSCRIBE, SUBACK, UNSUBSCRIBE, UNSUBACK, PINGREQ, PINGRESP, DISCONNECT = 8, 9, 10, 11, 12, 13, 14
+
+# CONNACK return codes
+CONNACK_ACCEPTED = 0
+CONNACK_UNACCEPTABLE_PROTOCOL = 1
+CONNACK_IDENTIFIER_REJECTED = 2
+
+MAX_WRITE_BUFFER = 1024 * 1024
+"""
+@brief The number of bytes buffered for a slow subscriber after which QoS 0 messages to it are dropped.
+"""
+
+class ProtocolError(Exception):
+    """
+    @brief Raised when a client violates the MQTT protocol. The connection is closed.
+    """
+
+def _encode_length(length):
+    """
+    @brief Encodes the remaining length of a packet.
+    @param length The number of bytes following the fixed header.
+    @return The variable-length encoding as bytes.
+    """
+    encoded = bytearray()
+    while True:
+        byte = length % 128
+        length //= 128
+        encoded.append(byte | 0x80 if length else byte)
+        if not length:
+            return bytes(encoded)
+
+def _packet(first_byte, body=b""):
+    """
+    @brief Builds a packet from its first byte and its body.
+    """
+    return bytes([first_byte]) + _encode_length(len(body)) + body
+
+def _encode_string(value):
+    """
+    @brief Encodes a UTF-8 string with its 16-bit length prefix.
+    """
+    data = value.encode()
+    return struct.pack("!H", len(data)) + data
+
+class _Reader:
+    """
+    @brief Reads the fields of a packet body.
+    """
+
+    def __init__(self, data):
+        """
+        @brief Initializes the _Reader class.
+        @param data The packet body.
+        """
+        self.data = data
+        self.offset = 0
+
+    def uint8(self):
+        """
+        @brief Reads one byte.
+        """
+        if self.offset + 1 > len(self.data):
+            raise ProtocolError("Truncated packet")
+        self.offset += 1
+        return self.data[self.offset - 1]
+
+    def uint16(self):
+        """
+        @brief Reads a big-endian 16-bit integer.
+        """
+        if self.offset + 2 > len(self.data):
+            raise ProtocolError("Truncated packet")
+        self.offset += 2
+        return struct.unpack_from("!H", self.data, self.offset - 2)[0]
+
+    def binary(self):
+        """
+        @brief Reads binary data with a 16-bit length prefix.
+        """
+        length = self.uint16()
+        if self.offset + length > len(self.data):
+            raise ProtocolError("Truncated packet")
+        self.offset += length
+        return bytes(self.data[self.offset - length:self.offset])
+
+    def string(self):
+        """
+        @brief Reads a UTF-8 string with a 16-bit length prefix.
+        """
+        try:
+            return self.binary().decode()
+        except UnicodeDecodeError:
+            raise ProtocolError("Invalid UTF-8 string")
+
+    def rest(self):
+        """
+        @brief Reads the remaining bytes of the body.
+        """
+        rest = bytes(self.data[self.offset:])
+        self.offset = len(self.data)
+        return rest
+
+    def at_end(self):
+        """
+        @brief Checks whether the whole body was read.
+        """
+        return self.offset >= len(self.data)
+
+class BrokerSession:
+    """
+    @brief The state of one connected client.
+    """
+
+    def __init__(self, client_id, writer, keepalive, will):
+        """
+        @brief Initializes the BrokerSession class.
+        @param client_id The client ID.
+        @param writer The asyncio StreamWriter of the connection.
+        @param keepalive The keepalive in seconds, 0 to disable it.
+        @param will The will message as (topic, payload, qos, retain), None if the client has none.
+        """
+        self.client_id = client_id
+        self.writer = writer
+        self.keepalive = keepalive
+        self.will = will
+        self.subscriptions = {}
+        self.next_packet_id = 0
+        self.closed = False
+
+    def packet_id(self):
+        """
+        @brief Returns the next packet ID for a QoS 1 delivery.
+        """
+        self.next_packet_id = self.next_packet_id % 65535 + 1
+        return self.next_packet_id
+
+    def send(self, data):
+        """
+        @brief Writes a packet to the client without waiting.
+        """
+        if not self.closed:
+            self.writer.write(data)
+
+class LocalBroker:
+    """
+    @brief Lightweight asyncio MQTT 3.1.1 broker for running all nodes on a single machine.
+
+    Supports QoS 0 and 1 (QoS 2 subscriptions are granted QoS 1), retained messages,
+    the + and # wildcards, keepalive, client ID takeover and will messages. Sessions are
+    not persisted, every connection starts a clean session. It is meant for development,
+    tests and benchmarks, not for the deployment in the lab.
+    """
+
+    def __init__(self, host="127.0.0.1", port=1883):
+        """
+        @brief Initializes the LocalBroker class.
+        @param host The address to listen on.
+        @param port The port to listen on, 0 for a free port.
+        """
+        self.host = host
+        self.port = port
+        self.sessions = {}
+        self.retained = {}
+        self.stats = {"connections": 0, "received": 0, "delivered": 0, "dropped": 0}
+        self.server = None
+        self.loop = None
+        self.clients = {}
+        self._thread = None
+
+    async def start(self):
+        """
+        @brief Starts listening for connections on the running event loop.
+        """
+        self.loop = asyncio.get_running_loop()
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        logging.info(f"LocalBroker::Listening on {self.host}:{self.port}")
+
+    async def stop(self):
+        """
+        @brief Closes the server and all client connections.
+        @details Closing a connection ends the read of its handler, the handlers are awaited so none
+                 is left pending on the event loop.
+        """
+        if self.server is not None:
+            self.server.close()
+            for writer in list(self.clients.values()):
+                writer.close()
+            await asyncio.gather(*self.clients, return_exceptions=True)
+            await self.server.wait_closed()
+            self.server = None
+        logging.info("LocalBroker::Stopped")
+
+    async def serve_forever(self):
+        """
+        @brief Starts the broker and serves until the task is cancelled.
+        """
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    def start_in_thread(self):
+        """
+        @brief Runs the broker on its own event loop in a daemon thread.
+        @details Returns once the broker accepts connections, self.port holds the port.
+        """
+        ready = threading.Event()
+
+        def run():
+            loop = asyncio.new_event_loop()
+            loop.run_until_complete(self.start())
+            ready.set()
+            loop.run_forever()
+            loop.close()
+
+        self._thread = threading.Thread(target=run, name="LocalBrokerThread", daemon=True)
+        self._thread.start()
+        ready.wait()
+
+    def stop_thread(self):
+        """
+        @brief Stops a broker started with start_in_thread().
+        """
+        if self._thread is not None:
+            asyncio.run_coroutine_threadsafe(self.stop(), self.loop).result()
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self._thread = None
+
+    async def read_packet(self, reader):
+        """
+        @brief Reads one packet.
+        @param reader The asyncio StreamReader of the connection.
+        @return A tuple (packet type, flags, body).
+        """
+        first_byte = (await reader.readexactly(1))[0]
+        length = 0
+        for shift in range(0, 28, 7):
+            byte = (await reader.readexactly(1))[0]
+            length += (byte & 0x7F) << shift
+            if not byte & 0x80:
+                break
+        else:
+            raise ProtocolError("Malformed remaining length")
+        body = await reader.readexactly(length) if length else b""
+        return first_byte >> 4, first_byte & 0x0F, body
+
+    async def handle_connection(self, reader, writer):
+        """
+        @brief Serves one client connection from CONNECT to its end.
+        @param reader The asyncio StreamReader of the connection.
+        @param writer The asyncio StreamWriter of the connection.
+        """
+        session = None
+        clean_disconnect = False
+        task = asyncio.current_task()
+        self.clients[task] = writer
+        try:
+            packet_type, _, body = await asyncio.wait_for(self.read_packet(reader), 10)
+            if packet_type != CONNECT:
+                raise ProtocolError("First packet is not CONNECT")
+            session = self.connect(body, writer)
+            if session is None:
+                return
+
+            while True:
+                timeout = session.keepalive * 1.5 if session.keepalive else None
+                packet_type, flags, body = await asyncio.wait_for(self.read_packet(reader), timeout)
+                if packet_type == DISCONNECT:
+                    clean_disconnect = True
+                    break
+                self.handle_packet(session, packet_type, flags, body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+            pass
+        except ProtocolError as e:
+            logging.warning(f"LocalBroker::Protocol error of client {session.client_id if session else '?'}: {e}")
+        finally:
+            del self.clients[task]
+            if session is not None:
+                self.disconnect(session, clean_disconnect)
+            writer.close()
+
+    def connect(self, body, writer):
+        """
+        @brief Handles a CONNECT packet and registers the session.
+        @param body The body of the packet.
+        @param writer The asyncio StreamWriter of the connection.
+        @return The BrokerSession, None if the connection was refused.
+        """
+        packet = _Reader(body)
+        protocol_name = packet.string()
+        protocol_level = packet.uint8()
+        connect_flags = packet.uint8()
+        keepalive = packet.uint16()
+        if (protocol_name, protocol_level) not in (("MQTT", 4), ("MQIsdp", 3)):
+            writer.write(_packet(CONNACK << 4, bytes([0, CONNACK_UNACCEPTABLE_PROTOCOL])))
+            return None
+
+        client_id = packet.string()
+        will = None
+        if connect_flags & 0x04:
+            will_topic = packet.string()
+            will_payload = packet.binary()
+            will = (will_topic, will_payload, min((connect_flags >> 3) & 0x03, 1), bool(connect_flags & 0x20))
+        if connect_flags & 0x80:
+            packet.string()  # User name, any user is accepted
+        if connect_flags & 0x40:
+            packet.binary()  # Password
+
+        if not client_id:
+            if not connect_flags & 0x02:
+                writer.write(_packet(CONNACK << 4, bytes([0, CONNACK_IDENTIFIER_REJECTED])))
+                return None
+            client_id = f"local-{id(writer):x}"
+
+        # A client connecting with the ID of a connected client takes over the session
+        previous = self.sessions.get(client_id)
+        if previous is not None:
+            logging.info(f"LocalBroker::Client {client_id} took over its previous connection")
+            previous.closed = True
+            previous.writer.close()
+
+        session = BrokerSession(client_id, writer, keepalive, will)
+        self.sessions[client_id] = session
+        self.stats["connections"] += 1
+        writer.write(_packet(CONNACK << 4, bytes([0, CONNACK_ACCEPTED])))
+        logging.info(f"LocalBroker::Client {client_id} connected")
+        return session
+
+    def disconnect(self, session, clean):
+        """
+        @brief Removes a session and publishes its will unless the client disconnected cleanly.
+        @param session The BrokerSession.
+        @param clean True if the client sent DISCONNECT.
+        """
+        session.closed = True
+        if self.sessions.get(session.client_id) is session:
+            del self.sessions[session.client_id]
+        if not clean and session.will is not None:
+            self.publish(*session.will)
+        logging.info(f"LocalBroker::Client {session.client_id} disconnected")
+
+    def handle_packet(self, session, packet_type, flags, body):
+        """
+        @brief Handles a packet of a connected client.
+        @param session The BrokerSession of the client.
+        @param packet_type The packet type.
+        @param flags The flags of the fixed header.
+        @param body The body of the packet.
+        """
+        packet = _Reader(body)
+        if packet_type == PUBLISH:
+            qos = (flags >> 1) & 0x03
+            retain = bool(flags & 0x01)
+            topic = packet.string()
+            packet_id = packet.uint16() if qos else None
+            payload = packet.rest()
+            self.stats["received"] += 1
+            if qos == 1:
+                session.send(_packet(PUBACK << 4, struct.pack("!H", packet_id)))
+            elif qos == 2:
+                session.send(_packet(PUBREC << 4, struct.pack("!H", packet_id)))
+            self.publish(topic, payload, qos, retain)
+        elif packet_type == PUBREL:
+            session.send(_packet(PUBCOMP << 4, struct.pack("!H", packet.uint16())))
+        elif packet_type == SUBSCRIBE:
+            packet_id = packet.uint16()
+            granted = []
+            new_filters = []
+            while not packet.at_end():
+                topic_filter = packet.string()
+                qos = min(packet.uint8() & 0x03, 1)
+                session.subscriptions[topic_filter] = qos
+                granted.append(qos)
+                new_filters.append((topic_filter, qos))
+            session.send(_packet(SUBACK << 4, struct.pack("!H", packet_id) + bytes(granted)))
+            for topic_filter, qos in new_filters:
+                self.send_retained(session, topic_filter, qos)
+        elif packet_type == UNSUBSCRIBE:
+            packet_id = packet.uint16()
+            while not packet.at_end():
+                session.subscriptions.pop(packet.string(), None)
+            session.send(_packet(UNSUBACK << 4, struct.pack("!H", packet_id)))
+        elif packet_type == PINGREQ:
+            session.send(_packet(PINGRESP << 4))
+        elif packet_type in (PUBACK, PUBREC, PUBCOMP):
+            pass  # Acknowledgements of deliveries, nothing is retransmitted
+        else:
+            raise ProtocolError(f"Unexpected packet type {packet_type}")
+
+    def publish(self, topic, payload, qos, retain):
+        """
+        @brief Stores a retained message and delivers a message to all matching subscriptions.
+        @param topic The topic.
+        @param payload The payload as bytes.
+        @param qos The QoS of the publication.
+        @param retain Whether the message is retained. An empty retained payload deletes the retained message.
+        """
+        if retain:
+            if payload:
+                self.retained[topic] = (payload, min(qos, 1))
+            else:
+                self.retained.pop(topic, None)
+
+        for session in list(self.sessions.values()):
+            granted = [sub_qos for topic_filter, sub_qos in session.subscriptions.items()
+                       if mqtt.topic_matches_sub(topic_filter, topic)]
+            if granted:
+                self.deliver(session, topic, payload, min(qos, max(granted)), False)
+
+    def send_retained(self, session, topic_filter, qos):
+        """
+        @brief Sends the retained messages matching a new subscription.
+        """
+        for topic, (payload, retained_qos) in list(self.retained.items()):
+            if mqtt.topic_matches_sub(topic_filter, topic):
+                self.deliver(session, topic, payload, min(qos, retained_qos), True)
+
+    def deliver(self, session, topic, payload, qos, retain):
+        """
+        @brief Sends a PUBLISH packet to a client.
+        @details QoS 0 messages are dropped while the client does not keep up with reading.
+        """
+        if qos == 0 and session.writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            self.stats["dropped"] += 1
+            return
+        first_byte = PUBLISH << 4 | qos << 1 | int(retain)
+        body = _encode_string(topic)
+        if qos:
+            body += struct.pack("!H", session.packet_id())
+        session.send(_packet(first_byte, body + payload))
+        self.stats["delivered"] += 1
@@ -0,0 +1,462 @@
+import json
+import struct
+import logging
+
+from application_layer.services import Services
+from application_layer.mqtt_config import MQTTConfig
+from application_layer.states import AlarmState, NodeState, ReaderHealth, ReaderMode
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the standard library encoder is used without it
+    orjson = None
+
+class MessageError(ValueError):
+    """
+    @brief Raised when a payload does not match the schema of its topic.
+    """
+
+class Field:
+    """
+    @brief Describes one field of a message.
+    """
+
+    def __init__(self, name, field_type, required=True, choices=None):
+        """
+        @brief Initializes the Field class.
+        @param name The name of the field.
+        @param field_type str, int, float, bool, list, dict or a Message class for nested messages.
+        @param required Whether the field must be present and not None.
+        @param choices The allowed values, None for any value of the type.
+        """
+        self.name = name
+        self.field_type = field_type
+        self.required = required
+        self.choices = frozenset(choices) if choices is not None else None
+
+    def validate(self, value):
+        """
+        @brief Checks a value against the field.
+        @param value The value, a nested message may be given as a dictionary.
+        @return The value, nested messages converted to their Message class.
+        @throws MessageError If the value does not match the field.
+        """
+        if value is None:
+            if self.required:
+                raise MessageError(f"Field '{self.name}' is required")
+            return None
+        if isinstance(self.field_type, type) and issubclass(self.field_type, Message):
+            if isinstance(value, dict):
+                return self.field_type.from_dict(value)
+            if not isinstance(value, self.field_type):
+                raise MessageError(f"Field '{self.name}' must be a {self.field_type.__name__}")
+            return value
+        # bool is a subclass of int but never a valid number, an int is a valid float
+        if isinstance(value, bool) and self.field_type is not bool:
+            raise MessageError(f"Field '{self.name}' must be of type {self.field_type.__name__}")
+        if self.field_type is float and isinstance(value, int):
+            value = float(value)
+        if not isinstance(value, self.field_type):
+            raise MessageError(f"Field '{self.name}' must be of type {self.field_type.__name__}")
+        if self.choices is not None and value not in self.choices:
+            raise MessageError(f"Field '{self.name}' has the invalid value {value!r}")
+        return value
+
+class Message:
+    """
+    @brief Base class of the typed messages exchanged between the nodes.
+
+    A subclass lists its fields in FIELDS. Construction validates every field and rejects
+    unknown ones, so an instance always matches its schema. Top-level messages have a
+    TOPIC, a TYPE_ID for the binary codec and a VERSION which is sent with every payload.
+    Messages published on several topics list them in TOPICS instead.
+    """
+
+    TOPIC = None
+    TOPICS = ()
+    TYPE_ID = None
+    VERSION = 1
+    FIELDS = ()
+
+    def __init__(self, **values):
+        """
+        @brief Initializes the message and validates its fields.
+        @param values The field values.
+        @throws MessageError If a field is missing, unknown or has an invalid value.
+        """
+        unknown = set(values) - {field.name for field in self.FIELDS}
+        if unknown:
+            raise MessageError(f"Unknown fields for {type(self).__name__}: {', '.join(sorted(unknown))}")
+        for field in self.FIELDS:
+            setattr(self, field.name, field.validate(values.get(field.name)))
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        @brief Creates a message from a decoded dictionary.
+        @param data The dictionary.
+        @return The message.
+        @throws MessageError If the dictionary does not match the schema.
+        """
+        if not isinstance(data, dict):
+            raise MessageError(f"{cls.__name__} must be an object")
+        return cls(**data)
+
+    def replace(self, **changes):
+        """
+        @brief Creates a copy of the message with some fields changed, the message itself is not modified.
+        @details Delivered messages may be shared by several receivers and must not be modified.
+        @param changes The new field values.
+        @return The new message, nested messages are copied as well.
+        @throws MessageError If a new value does not match the schema.
+        """
+        return type(self)(**{**self.to_dict(), **changes})
+
+    def to_dict(self):
+        """
+        @brief Converts the message to a dictionary, omitting fields that are None.
+        @return The dictionary, nested messages converted as well.
+        """
+        data = {}
+        for field in self.FIELDS:
+            value = getattr(self, field.name)
+            if value is not None:
+                data[field.name] = value.to_dict() if isinstance(value, Message) else value
+        return data
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()})"
+
+class Trace(Message):
+    """
+    @brief Latency trace of a tag read, passed on from the RFID reader to the GUI.
+    """
+
+    FIELDS = (
+        Field("id", str),
+        Field("read_wall", float, required=False),
+        Field("read_mono", float, required=False),
+        Field("relay_wall", float, required=False),
+        Field("publish_wall", float, required=False)
+    )
+
+class TagRead(Message):
+    """
+    @brief A tag read by a gate, published by the RFID controller.
+    """
+
+    TOPIC = Services.TOPIC_RFID_TAGS
+    TYPE_ID = 1
+    FIELDS = (
+        Field("gate", str),
+        Field("epc", str),
+        Field("rssi", int),
+        Field("trace", Trace, required=False)
+    )
+
+    # rssi, read_wall, read_mono, trace id, has trace, length of the EPC, length of the gate
+    BINARY_LAYOUT = struct.Struct("!hdd16sBBB")
+
+    def to_binary(self):
+        """
+        @brief Packs the message body for the binary codec.
+        @return The body as bytes.
+        @throws MessageError If the EPC or the trace ID is not hexadecimal or a field does not fit its binary size.
+        """
+        try:
+            epc = bytes.fromhex(self.epc)
+            gate = self.gate.encode()
+            trace = self.trace
+            if trace is not None:
+                body = self.BINARY_LAYOUT.pack(self.rssi, trace.read_wall or 0.0, trace.read_mono or 0.0,
+                                               bytes.fromhex(trace.id), 1, len(epc), len(gate))
+            else:
+                body = self.BINARY_LAYOUT.pack(self.rssi, 0.0, 0.0, bytes(16), 0, len(epc), len(gate))
+        except (ValueError, struct.error) as e:
+            raise MessageError(f"TagRead cannot be packed: {e}")
+        return body + epc + gate
+
+    @classmethod
+    def from_binary(cls, view):
+        """
+        @brief Unpacks a message body of the binary codec.
+        @param view A memoryview of the body.
+        @return The message.
+        @throws MessageError If the body is malformed.
+        """
+        try:
+            rssi, read_wall, read_mono, trace_id, has_trace, epc_length, gate_length = cls.BINARY_LAYOUT.unpack_from(view)
+            offset = cls.BINARY_LAYOUT.size
+            if len(view) != offset + epc_length + gate_length:
+                raise MessageError("Invalid length of the TagRead body")
+            epc = view[offset:offset + epc_length].hex().upper()
+            gate = str(view[offset + epc_length:], "utf-8")
+        except (struct.error, UnicodeDecodeError) as e:
+            raise MessageError(f"Malformed TagRead body: {e}")
+        trace = Trace(id=trace_id.hex(), read_wall=read_wall, read_mono=read_mono) if has_trace else None
+        return cls(gate=gate, epc=epc, rssi=rssi, trace=trace)
+
+class AlarmStatus(Message):
+    """
+    @brief A change of the alarm state, published by the alarm controller.
+    """
+
+    TOPIC = Services.TOPIC_ALARM_STATUS
+    TYPE_ID = 2
+    FIELDS = (
+        Field("status", str, choices=[state.value for state in AlarmState]),
+        Field("message", str),
+        Field("tag", str, required=False),
+        Field("cause", str, required=False),
+        Field("device_id", int, required=False),
+        Field("gate_id", str, required=False),
+        Field("deactivated_by", str, required=False),
+        Field("trace", Trace, required=False)
+    )
+
+class AlarmViolation(Message):
+    """
+    @brief A violation decided by an alarm worker, forwarded to the worker driving the relay.
+    """
+
+    TOPIC = Services.TOPIC_ALARM_VIOLATION
+    TYPE_ID = 9
+    FIELDS = (
+        Field("tag", str),
+        Field("worker", str),
+        Field("device_id", int, required=False),
+        Field("gate_id", str, required=False),
+        Field("trace", Trace, required=False)
+    )
+
+class AlarmCommand(Message):
+    """
+    @brief A command to the alarm controller, published by the GUI.
+    """
+
+    TOPIC = Services.TOPIC_GUI_ALARM
+    TYPE_ID = 3
+    FIELDS = (
+        Field("alarm_status", str, choices=["DEACTIVATE"]),
+        Field("source", str, required=False),
+        Field("request_id", str, required=False)
+    )
+
+class AlarmCommandResponse(Message):
+    """
+    @brief The result of an AlarmCommand, published by the alarm controller once the relay is off.
+    @details request_id correlates the response with the command and its retries.
+    """
+
+    TOPIC = Services.TOPIC_GUI_ALARM_RESPONSE
+    TYPE_ID = 8
+    FIELDS = (
+        Field("request_id", str),
+        Field("state", str, choices=[state.value for state in AlarmState]),
+        Field("acknowledged", bool),
+        Field("error", str, required=False)
+    )
+
+class ReaderHealthStatus(Message):
+    """
+    @brief The health of the RFID reader, published by the RFID controller.
+    """
+
+    TOPIC = Services.TOPIC_RFID_HEALTH
+    TYPE_ID = 4
+    FIELDS = (
+        Field("health", str, choices=[health.value for health in ReaderHealth]),
+        Field("error_rate", float),
+        Field("total_errors", int),
+        Field("consecutive_errors", int),
+        Field("reconnects", int),
+        Field("outages", int),
+        Field("current_outage", float),
+        Field("last_outage", float),
+        Field("dead_time", float),
+        Field("last_error", str, required=False)
+    )
+
+class ReaderMetrics(Message):
+    """
+    @brief A telemetry window of the RFID reader, published by the RFID controller.
+    """
+
+    TOPIC = Services.TOPIC_RFID_METRICS
+    TYPE_ID = 5
+    FIELDS = (
+        Field("time", float),
+        Field("duration", float),
+        Field("cycles", int),
+        Field("reads_per_second", float),
+        Field("unique_tags_per_second", float),
+        Field("empty_cycle_ratio", float),
+        Field("rssi_bins", list),
+        Field("rssi_histograms", dict),
+        Field("mode", str, choices=[mode.value for mode in ReaderMode]),
+        Field("health", str, choices=[health.value for health in ReaderHealth]),
+        Field("filter", dict, required=False),
+        Field("transport", dict, required=False),
+        Field("duty_cycle", dict, required=False)
+    )
+
+class AlarmMetrics(Message):
+    """
+    @brief The queue, decision and latency metrics of the alarm controller.
+    """
+
+    TOPIC = Services.TOPIC_ALARM_METRICS
+    TYPE_ID = 6
+    FIELDS = (
+        Field("time", float),
+        Field("worker", str, required=False),
+        Field("queue", dict),
+        Field("decisions", dict),
+        Field("latency", dict),
+        Field("transport", dict),
+        Field("device_cache", dict, required=False)
+    )
+
+class NodeStatus(Message):
+    """
+    @brief The liveness of a node, published as retained message and registered as its Last Will.
+    """
+
+    TOPICS = (Services.TOPIC_RFID_NODE_STATUS, Services.TOPIC_ALARM_NODE_STATUS)
+    TYPE_ID = 7
+    FIELDS = (
+        Field("node", str),
+        Field("status", str, choices=[state.value for state in NodeState]),
+        Field("time", float, required=False)
+    )
+
+class JSONCodec:
+    """
+    @brief Encodes messages as JSON objects with a "v" version field.
+    @details Uses orjson if it is installed, otherwise the json module of the standard library.
+    """
+
+    def encode(self, message):
+        """
+        @brief Encodes a message.
+        @param message The message.
+        @return The payload as bytes.
+        """
+        data = {"v": message.VERSION, **message.to_dict()}
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    def decode(self, message_type, view):
+        """
+        @brief Decodes a payload.
+        @param message_type The Message class expected on the topic.
+        @param view A memoryview of the payload.
+        @return The message.
+        @throws MessageError If the payload is not valid JSON or does not match the schema.
+        """
+        try:
+            data = orjson.loads(view) if orjson is not None else json.loads(str(view, "utf-8"))
+        except (ValueError, UnicodeDecodeError) as e:
+            raise MessageError(f"Invalid JSON payload: {e}")
+        if not isinstance(data, dict):
+            raise MessageError("The payload must be a JSON object")
+        version = data.pop("v", None)
+        if version != message_type.VERSION:
+            raise MessageError(f"Unsupported version {version!r} of {message_type.__name__}")
+        return message_type.from_dict(data)
+
+class BinaryCodec:
+    """
+    @brief Encodes messages as compact binary frames.
+
+    A frame is the magic byte, the TYPE_ID and the VERSION of the message followed by the
+    body packed by the message class. Messages without a binary layout are encoded as JSON.
+    """
+
+    MAGIC = 0xB5
+    HEADER = struct.Struct("!BBB")
+
+    def encode(self, message):
+        """
+        @brief Encodes a message.
+        @param message The message.
+        @return The payload as bytes.
+        """
+        if not hasattr(message, "to_binary"):
+            return CODECS["json"].encode(message)
+        return self.HEADER.pack(self.MAGIC, message.TYPE_ID, message.VERSION) + message.to_binary()
+
+    def decode(self, message_type, view):
+        """
+        @brief Decodes a payload without copying it.
+        @param message_type The Message class expected on the topic.
+        @param view A memoryview of the payload.
+        @return The message.
+        @throws MessageError If the frame does not match the schema.
+        """
+        try:
+            magic, type_id, version = self.HEADER.unpack_from(view)
+        except struct.error:
+            raise MessageError("Truncated binary payload")
+        if magic != self.MAGIC or type_id != message_type.TYPE_ID or not hasattr(message_type, "from_binary"):
+            raise MessageError(f"The payload is not a binary {message_type.__name__}")
+        if version != message_type.VERSION:
+            raise MessageError(f"Unsupported version {version} of {message_type.__name__}")
+        return message_type.from_binary(view[self.HEADER.size:])
+
+CODECS = {
+    "json": JSONCodec(),
+    "binary": BinaryCodec()
+}
+
+MESSAGE_TYPES = {topic: message_type
+                 for message_type in (TagRead, AlarmStatus, AlarmViolation, AlarmCommand, AlarmCommandResponse,
+                                      ReaderHealthStatus, ReaderMetrics, AlarmMetrics, NodeStatus)
+                 for topic in message_type.TOPICS or (message_type.TOPIC,)}
+
+def register_codec(name, codec):
+    """
+    @brief Registers an additional codec.
+    @param name The name used with encode().
+    @param codec An object with encode(message) and decode(message_type, view).
+    """
+    CODECS[name] = codec
+
+def encode(message, codec=None):
+    """
+    @brief Encodes a message for publication.
+    @param message The message.
+    @param codec The name of the codec. Default is MQTTConfig.CODEC.
+    @return The payload as bytes.
+    """
+    return CODECS[codec or MQTTConfig.CODEC].encode(message)
+
+def decode(topic, payload):
+    """
+    @brief Decodes and validates the payload of a received message.
+    @details The codec is recognised by the first byte: binary frames start with BinaryCodec.MAGIC,
+             JSON payloads with '{'. The payload is read through a memoryview and never copied as a whole.
+             A message passed on as object by the in-process event bus is returned as it is.
+    @param topic The topic the payload was received on.
+    @param payload The payload, e.g. msg.payload.
+    @return The message of the type registered for the topic.
+    @throws MessageError If the topic is unknown or the payload is malformed.
+    """
+    message_type = MESSAGE_TYPES.get(topic)
+    if message_type is None:
+        raise MessageError(f"No message type registered for topic '{topic}'")
+    if isinstance(payload, Message):
+        if not isinstance(payload, message_type):
+            raise MessageError(f"Expected {message_type.__name__}, received {type(payload).__name__}")
+        return payload
+    view = memoryview(payload)
+    if not view:
+        raise MessageError("Empty payload")
+    codec = CODECS["binary"] if view[0] == BinaryCodec.MAGIC else CODECS["json"]
+    message = codec.decode(message_type, view)
+    logging.debug(f"Messages::Decoded {message} from topic '{topic}'")
+    return message
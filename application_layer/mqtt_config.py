@@ -0,0 +1,84 @@
+class MQTTConfig:
+    """
+    @class MQTTConfig
+    @brief Configuration class for the MQTT transport shared by all nodes.
+    """
+
+    TRANSPORT = "mqtt"
+    """
+    @brief The transport between the services.
+    @details Supported values are:
+    - "mqtt": an MQTT broker, the services can run on different hosts
+    - "bus": the in-process event bus, all services run in one process (single_host_interface.py)
+    """
+
+    PROTOCOL = "3.1.1"
+    """
+    @brief The MQTT protocol version.
+    @details "3.1.1" or "5".
+    """
+
+    QOS = 0
+    """
+    @brief The default QoS of publications and subscriptions.
+    @details Tag reads are only useful while they are fresh, so they are not retransmitted by default.
+    """
+
+    COMMAND_QOS = 1
+    """
+    @brief The QoS of alarm state changes and deactivation commands, which must not be lost.
+    """
+
+    KEEPALIVE = 15
+    """
+    @brief The maximum period in seconds between two communications with the broker.
+    @details The broker publishes the Last Will of a node that stays silent for 1.5 times this period.
+    """
+
+    RECONNECT_MIN_DELAY = 1
+    """
+    @brief The delay before the first attempt to reconnect to the broker.
+    @details This specifies the duration in seconds. The delay doubles after every failed attempt.
+    """
+
+    RECONNECT_MAX_DELAY = 60
+    """
+    @brief The upper bound of the delay between two attempts to reconnect to the broker.
+    @details This specifies the duration in seconds.
+    """
+
+    PUBLISH_QUEUE_SIZE = 1000
+    """
+    @brief The maximum number of publications waiting to be sent or acknowledged.
+    @details Further publications are dropped until the queue drains.
+    """
+
+    MAX_INFLIGHT = 20
+    """
+    @brief The maximum number of QoS 1 and 2 publications sent but not yet acknowledged.
+    """
+
+    COMMAND_TIMEOUT = 2
+    """
+    @brief The time in seconds to wait for the response to a command before sending it again.
+    """
+
+    COMMAND_RETRIES = 2
+    """
+    @brief The number of times a command without response is sent again before it fails.
+    """
+
+    DISCONNECT_TIMEOUT = 1
+    """
+    @brief The maximum time in seconds to wait for pending publications before disconnecting.
+    """
+
+    CODEC = "json"
+    """
+    @brief The codec of the payloads, see application_layer/messages.py.
+    """
+
+    TAG_CODEC = "binary"
+    """
+    @brief The codec of the tag reads, the most frequent messages.
+    """
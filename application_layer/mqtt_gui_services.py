@@ -1,12 +1,22 @@
-import threading
 import logging
-import paho.mqtt.client as mqtt
+import time
+import uuid
+import threading
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from application_layer.services import Services
+from application_layer.mqtt_config import MQTTConfig
+from application_layer.event_bus import create_transport
+from application_layer.messages import AlarmCommand, MessageError, decode
+from application_layer.states import AlarmState
+from application_layer.latency_tracer import LatencyTracer
 
 class MQTTGuiServices(QObject):
-    send_alert = pyqtSignal()
+    send_alert = pyqtSignal(object)
+    alarm_state_changed = pyqtSignal(str)
+    node_status_changed = pyqtSignal(str, str)
+    deactivation_completed = pyqtSignal(bool, object, str)
+    connected = pyqtSignal()
 
     def __init__(self, parent=None):
         """
@@ -14,91 +24,160 @@ class MQTTGuiServices(QObject):
         @param parent The parent QObject, if any.
         """
         super().__init__(parent)
-        self.broker_address = Services.BROKER_ADDRESS
-        self.mqtt_port = Services.MQTT_PORT
+        self.transport = create_transport(MQTTConfig.TRANSPORT, Services.MQTT_GUI_CLIENT, "MQTTGuiServices")
+        self.transport.subscribe(Services.TOPIC_ALARM_STATUS, self.check_alarm_state, MQTTConfig.COMMAND_QOS)
+        self.transport.subscribe(Services.TOPIC_RFID_NODE_STATUS, self.check_node_status, MQTTConfig.COMMAND_QOS)
+        self.transport.subscribe(Services.TOPIC_ALARM_NODE_STATUS, self.check_node_status, MQTTConfig.COMMAND_QOS)
+        self.transport.subscribe(Services.TOPIC_GUI_ALARM_RESPONSE, self.check_command_response, MQTTConfig.COMMAND_QOS)
+        self.tracer = LatencyTracer("MQTTGuiServices")
+        self.pending_commands = {}
+        self._lock = threading.Lock()
 
-    def on_subscriber_connect(self, client, userdata, flags, rc):
+    def check_alarm_state(self, client, userdata, msg):
         """
-        @brief Callback for when the subscriber client connects to the broker.
+        @brief Callback for when a message is received from the broker.
+        @details Every state is passed on with alarm_state_changed. The trace of a triggered alarm is passed on
+                 with send_alert, the view reports the display time with record_display(). A retained status
+                 describes a state set before the GUI connected, its trace is not measured.
         @param client The client instance for this callback.
         @param userdata The private user data as set in Client() or userdata_set().
-        @param flags Response flags sent by the broker.
-        @param rc The connection result.
+        @param msg An instance of MQTTMessage, which contains topic, payload, qos, retain.
         """
-        if rc == 0:
-            self.mqtt_subscriber_client.subscribe(Services.TOPIC_ALARM_STATUS)
-            logging.info("MQTTGuiServices:: ts/gui/alarm_controller/show_state")
-            logging.info("MQTTGuiServices:: Connected successfully to broker")
-        else:
-            logging.error(f"MQTTGuiServices::Connection failed with code {rc}")
+        received_wall = time.time()
+        try:
+            alarm_status = decode(msg.topic, msg.payload)
+            logging.info(f"MQTTGuiServices::Received message: {alarm_status} on topic '{msg.topic}'")
+        except MessageError as e:
+            logging.error(f"MQTTGuiServices::Rejected message on topic '{msg.topic}': {e}")
+            return
 
-    def on_publisher_connect(self, client, userdata, flags, rc):
+        self.alarm_state_changed.emit(alarm_status.status)
+
+        # Only a triggered alarm is shown, the other states are changes back to normal
+        if alarm_status.status == AlarmState.TRIGGERED.value:
+            trace = None
+            if alarm_status.trace is not None and not msg.retain:
+                trace = alarm_status.trace.to_dict()
+                trace["receive_wall"] = received_wall
+                trace["receive_mono"] = time.monotonic()
+                if alarm_status.trace.publish_wall is not None:
+                    self.tracer.record("status_to_gui", received_wall - alarm_status.trace.publish_wall)
+            self.send_alert.emit(trace)
+
+    def check_node_status(self, client, userdata, msg):
         """
-        @brief Callback for when the publisher client connects to the broker.
+        @brief Callback for when the liveness of a node is received from the broker.
+        @details The retained status is received on every connection, the Last Will when a node dies.
         @param client The client instance for this callback.
         @param userdata The private user data as set in Client() or userdata_set().
-        @param flags Response flags sent by the broker.
-        @param rc The connection result.
+        @param msg An instance of MQTTMessage, which contains topic, payload, qos, retain.
         """
-        if rc == 0:
-            logging.info("MQTTGuiServices:: ts/alarm_controller/gui/deactivate_alarm")
-            logging.info("MQTTGuiServices::Connected successfully to broker")
+        try:
+            node_status = decode(msg.topic, msg.payload)
+        except MessageError as e:
+            logging.error(f"MQTTGuiServices::Rejected message on topic '{msg.topic}': {e}")
+            return
+        logging.info(f"MQTTGuiServices::Node {node_status.node} is {node_status.status}")
+        self.node_status_changed.emit(node_status.node, node_status.status)
+
+    def record_display(self, trace):
+        """
+        @brief Records the time at which a triggered alarm is shown to the user.
+        @param trace The trace passed with send_alert, None if the alarm controller sent none.
+        """
+        if trace is None:
+            return
+        display_wall = time.time()
+        self.tracer.record("gui_display", time.monotonic() - trace['receive_mono'])
+        if trace.get('read_wall') is not None:
+            self.tracer.record("read_to_display", display_wall - trace['read_wall'])
+        logging.info(f"MQTTGuiServices::Alarm {trace.get('id')} displayed")
+
+    def send_deactivation_command(self):
+        """
+        @brief Sends a deactivation command to the alarm and waits for its response in the background.
+        @details The command is sent again after MQTTConfig.COMMAND_TIMEOUT seconds without response,
+                 at most MQTTConfig.COMMAND_RETRIES times. The result is emitted with deactivation_completed
+                 as (success, round-trip time in milliseconds or None, message).
+        @return The request ID of the command.
+        """
+        request_id = uuid.uuid4().hex
+        with self._lock:
+            self.pending_commands[request_id] = {"sent_at": time.monotonic(), "attempts": 0, "timer": None}
+        self._send_command(request_id)
+        return request_id
+
+    def _send_command(self, request_id):
+        """
+        @brief Sends an attempt of a pending deactivation command and starts its timeout.
+        @param request_id The request ID of the command.
+        """
+        with self._lock:
+            pending = self.pending_commands.get(request_id)
+            if pending is None:  # Answered meanwhile
+                return
+            pending["attempts"] += 1
+            pending["timer"] = threading.Timer(MQTTConfig.COMMAND_TIMEOUT, self._on_command_timeout, args=(request_id,))
+            pending["timer"].daemon = True
+            pending["timer"].start()
+        command = AlarmCommand(alarm_status="DEACTIVATE", source="admin_gui", request_id=request_id)
+        self.transport.publish_message(Services.TOPIC_GUI_ALARM, command, qos=MQTTConfig.COMMAND_QOS)
+
+    def _on_command_timeout(self, request_id):
+        """
+        @brief Sends a command without response again, or fails it once the retries are used up.
+        @param request_id The request ID of the command.
+        """
+        with self._lock:
+            pending = self.pending_commands.get(request_id)
+            if pending is None:
+                return
+            retry = pending["attempts"] <= MQTTConfig.COMMAND_RETRIES
+            if not retry:
+                del self.pending_commands[request_id]
+        if retry:
+            logging.warning(f"MQTTGuiServices::No response to command {request_id}, sending it again")
+            self._send_command(request_id)
         else:
-            logging.error(f"MQTTGuiServices::Connection failed with code {rc}")
+            logging.error(f"MQTTGuiServices::Command {request_id} failed after {pending['attempts']} attempts")
+            self.deactivation_completed.emit(False, None, "The alarm controller did not respond.")
 
-    def check_alarm_state(self, client, userdata, msg):
+    def check_command_response(self, client, userdata, msg):
         """
-        @brief Callback for when a message is received from the broker.
+        @brief Callback for when the response to a command is received from the broker.
+        @details Completes the pending command and records its round-trip time, retries included.
         @param client The client instance for this callback.
         @param userdata The private user data as set in Client() or userdata_set().
         @param msg An instance of MQTTMessage, which contains topic, payload, qos, retain.
         """
-        logging.info(f"MQTTGuiServices::Received message: '{msg.payload.decode()}' on topic '{msg.topic}'")
-        self.send_alert.emit()
-        
-    def setup_mqtt_subscriber_client(self):
-        """
-        @brief Sets up the MQTT subscriber client.
-        """
-        self.mqtt_subscriber_client = mqtt.Client(
-            client_id=Services.MQTT_GUI_SUB_ALARM,
-            userdata=None,
-            protocol=mqtt.MQTTv311,
-            transport="tcp"
-        )
-        self.mqtt_subscriber_client.on_connect = self.on_subscriber_connect
-        self.mqtt_subscriber_client.on_message = self.check_alarm_state
-        self.mqtt_subscriber_client.connect(self.broker_address, self.mqtt_port)  
-
-    def setup_mqtt_publisher_client(self):
-        """
-        @brief Sets up the MQTT publisher client.
-        """
-        self.mqtt_publisher_client = mqtt.Client(
-            client_id=Services.MQTT_GUI_PUB_ALARM,
-            userdata=None,
-            protocol=mqtt.MQTTv311,
-            transport="tcp"
-        )
-        self.mqtt_publisher_client.on_connect = self.on_publisher_connect
-        self.mqtt_publisher_client.connect(self.broker_address, self.mqtt_port)
+        received_at = time.monotonic()
+        try:
+            response = decode(msg.topic, msg.payload)
+        except MessageError as e:
+            logging.error(f"MQTTGuiServices::Rejected message on topic '{msg.topic}': {e}")
+            return
+        with self._lock:
+            pending = self.pending_commands.pop(response.request_id, None)
+        if pending is None:  # Response to a retry of an answered command, or to another GUI
+            logging.debug(f"MQTTGuiServices::Ignored response to command {response.request_id}")
+            return
+        pending["timer"].cancel()
 
-    def send_deactivation_command(self):
-        """
-        @brief Sends a deactivation command to the alarm.
-        """
-        payload = {
-            "alarm_status": "DEACTIVATE"
-        }
-        self.mqtt_publisher_client.publish(Services.TOPIC_GUI_ALARM, str(payload))
+        rtt = received_at - pending["sent_at"]
+        self.tracer.record("deactivation_rtt", rtt)
+        rtt_ms = round(rtt * 1000, 3)
+        logging.info(f"MQTTGuiServices::Command {response.request_id} answered in {rtt_ms} ms: {response}")
+        if response.error is not None:
+            self.deactivation_completed.emit(False, rtt_ms, f"The alarm could not be deactivated: {response.error}")
+        elif response.acknowledged:
+            self.deactivation_completed.emit(True, rtt_ms, "The alarm has been deactivated.")
+        else:
+            self.deactivation_completed.emit(True, rtt_ms, f"The alarm was not triggered ({response.state}), the relay is off.")
 
     def setup_mqtt_gui_services(self):
         """
-        @brief Sets up the MQTT GUI services, including publisher and subscriber clients.
+        @brief Sets up the MQTT GUI services by connecting to the broker on the MQTT network thread.
+        @details The connected signal is emitted after every connection to the broker.
         """
-        self.setup_mqtt_publisher_client()
-        self.setup_mqtt_subscriber_client()
-
-        # Start the MQTT client loops in separate threads
-        threading.Thread(target=self.mqtt_publisher_client.loop_start, daemon=True).start()
-        threading.Thread(target=self.mqtt_subscriber_client.loop_start, daemon=True).start()
\ No newline at end of file
+        self.transport.on_connected = self.connected.emit
+        self.transport.start()
\ No newline at end of file
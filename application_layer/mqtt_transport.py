@@ -0,0 +1,447 @@
+import time
+import asyncio
+import logging
+import threading
+import paho.mqtt.client as mqtt
+
+from application_layer.services import Services
+from application_layer.mqtt_config import MQTTConfig
+from application_layer.latency_recorder import LatencyRecorder
+from application_layer.messages import NodeStatus, encode
+from application_layer.states import NodeState
+
+PROTOCOLS = {
+    "3.1.1": mqtt.MQTTv311,
+    "5": mqtt.MQTTv5
+}
+
+class AsyncioMQTTHelper:
+    """
+    @brief Drives a paho MQTT client from an asyncio event loop instead of a network thread.
+
+    The socket of the client is registered with the event loop: reads and writes are
+    performed when the socket is ready and keepalives are handled by a periodic task.
+    All client calls must therefore happen on the event loop thread, except the blocking
+    connect(), which runs on an executor thread. The socket callbacks it triggers are
+    passed to the event loop thread.
+    """
+
+    def __init__(self, loop, client):
+        """
+        @brief Initializes the AsyncioMQTTHelper class.
+        @param loop The asyncio event loop.
+        @param client The paho MQTT client to drive.
+        """
+        self.loop = loop
+        self.client = client
+        self.misc_task = None
+        self.connecting = None
+        self.disconnected = asyncio.Event()
+        self.client.on_socket_open = self.on_socket_open
+        self.client.on_socket_close = self.on_socket_close
+        self.client.on_socket_register_write = self.on_socket_register_write
+        self.client.on_socket_unregister_write = self.on_socket_unregister_write
+        self.loop_thread_id = threading.get_ident()
+
+    def _on_loop(self, function, *args):
+        """
+        @brief Calls a function on the event loop thread, at once if already on it.
+        @details Calls passed from another thread keep their order.
+        """
+        if threading.get_ident() == self.loop_thread_id:
+            function(*args)
+        else:
+            self.loop.call_soon_threadsafe(function, *args)
+
+    def on_socket_open(self, client, userdata, sock):
+        """
+        @brief Registers the socket of a new connection with the event loop.
+        """
+        self._on_loop(self._register_socket, client, sock)
+
+    def _register_socket(self, client, sock):
+        """
+        @brief Watches the socket for reads and starts the keepalive task, on the event loop thread.
+        """
+        self.disconnected.clear()
+        self.loop.add_reader(sock, client.loop_read)
+        self.misc_task = self.loop.create_task(self.misc_loop())
+
+    def on_socket_close(self, client, userdata, sock):
+        """
+        @brief Unregisters the socket of a closed connection.
+        """
+        self._on_loop(self._unregister_socket, sock)
+
+    def _unregister_socket(self, sock):
+        """
+        @brief Stops watching the socket and signals the disconnection, on the event loop thread.
+        """
+        self.loop.remove_reader(sock)
+        self.loop.remove_writer(sock)
+        if self.misc_task is not None:
+            self.misc_task.cancel()
+            self.misc_task = None
+        self.disconnected.set()
+
+    def on_socket_register_write(self, client, userdata, sock):
+        """
+        @brief Waits for the socket to become writable while outgoing data is pending.
+        """
+        self._on_loop(self.loop.add_writer, sock, client.loop_write)
+
+    def on_socket_unregister_write(self, client, userdata, sock):
+        """
+        @brief Stops waiting for the socket once all outgoing data is written.
+        """
+        self._on_loop(self.loop.remove_writer, sock)
+
+    async def connect(self, host, port, keepalive):
+        """
+        @brief Connects the client on an executor thread, so a slow DNS lookup or TCP connect does not block the event loop.
+        @details The connection attempt is completed even if the calling task is cancelled,
+                 see wait_connect().
+        @throws OSError If the connection failed.
+        """
+        self.disconnected.clear()
+        self.connecting = self.loop.run_in_executor(None, self.client.connect, host, port, keepalive)
+        await asyncio.shield(self.connecting)
+
+    async def wait_connect(self):
+        """
+        @brief Waits for a connection attempt still running on the executor thread.
+        """
+        if self.connecting is not None:
+            await asyncio.gather(self.connecting, return_exceptions=True)
+
+    async def misc_loop(self):
+        """
+        @brief Handles keepalives and retries of the client once per second.
+        """
+        while self.client.loop_misc() == mqtt.MQTT_ERR_SUCCESS:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                break
+
+class MQTTTransport:
+    """
+    @brief The MQTT connection of a node.
+
+    Every node uses one transport, and so one connection, for all its subscriptions and
+    publications. Handlers are registered per topic and subscribed again after every
+    reconnect. Lost connections are re-established with exponential backoff between
+    MQTTConfig.RECONNECT_MIN_DELAY and MQTTConfig.RECONNECT_MAX_DELAY.
+
+    Publications are counted until they are written (QoS 0) or acknowledged (QoS 1 and 2).
+    At most MQTTConfig.PUBLISH_QUEUE_SIZE publications can be pending, publish() drops
+    further ones and returns False, so a slow or missing broker cannot fill the memory of
+    a node. The time to send or acknowledge each publication is recorded.
+
+    The network traffic is handled either by a paho thread (start()) or by the asyncio
+    event loop of the node (run()).
+
+    A node registered with set_node_status() publishes a retained NodeStatus, online after
+    every connection and offline before a clean disconnect. The offline status is also its
+    Last Will, so the broker publishes it when the node dies without disconnecting.
+    The on_connected function, if set, is called after every connection, e.g. to publish
+    the retained state of the node again.
+    """
+
+    def __init__(self, client_id, name="MQTTTransport", broker_address=None, mqtt_port=None,
+                 protocol=None, qos=None):
+        """
+        @brief Initializes the MQTTTransport class.
+        @param client_id The MQTT client ID.
+        @param name The name used in the log messages.
+        @param broker_address The address of the broker. Default is Services.BROKER_ADDRESS.
+        @param mqtt_port The port of the broker. Default is Services.MQTT_PORT.
+        @param protocol "3.1.1" or "5". Default is MQTTConfig.PROTOCOL.
+        @param qos The default QoS. Default is MQTTConfig.QOS.
+        """
+        self.name = name
+        self.broker_address = broker_address or Services.BROKER_ADDRESS
+        self.mqtt_port = mqtt_port or Services.MQTT_PORT
+        self.protocol = PROTOCOLS[protocol or MQTTConfig.PROTOCOL]
+        self.qos = MQTTConfig.QOS if qos is None else qos
+        self.subscriptions = {}
+        self.connected = False
+        self.stats = {"connects": 0, "disconnects": 0, "published": 0, "dropped": 0, "received": 0,
+                      "handler_errors": 0}
+        self.publish_latency = LatencyRecorder()
+        self.loop = None
+        self.loop_thread_id = None
+        self.helper = None
+        self.node_status = None
+        self.on_connected = None
+        self._pending = {}
+        self._completed = set()
+        self._lock = threading.RLock()
+
+        self.client = mqtt.Client(
+            mqtt.CallbackAPIVersion.VERSION2,
+            client_id=client_id,
+            userdata=None,
+            protocol=self.protocol,
+            transport="tcp"
+        )
+        self.client.on_connect = self.on_connect
+        self.client.on_disconnect = self.on_disconnect
+        self.client.on_publish = self.on_publish
+        self.client.reconnect_delay_set(MQTTConfig.RECONNECT_MIN_DELAY, MQTTConfig.RECONNECT_MAX_DELAY)
+        self.client.max_inflight_messages_set(MQTTConfig.MAX_INFLIGHT)
+        self.client.max_queued_messages_set(MQTTConfig.PUBLISH_QUEUE_SIZE)
+
+    def subscribe(self, topic, handler, qos=None):
+        """
+        @brief Registers the handler of a topic and subscribes to it.
+        @param topic The topic, wildcards are allowed.
+        @param handler Function called with (client, userdata, msg) for every message on the topic.
+        @param qos The QoS of the subscription. Default is the QoS of the transport.
+        """
+        qos = self.qos if qos is None else qos
+        self.subscriptions[topic] = qos
+        self.client.message_callback_add(topic, lambda client, userdata, msg: self._dispatch(handler, client, userdata, msg))
+        if self.connected:
+            self.client.subscribe(topic, qos)
+
+    def _dispatch(self, handler, client, userdata, msg):
+        """
+        @brief Calls the handler of a message, an exception does not affect the connection.
+        """
+        self.stats["received"] += 1
+        try:
+            handler(client, userdata, msg)
+        except Exception as e:
+            self.stats["handler_errors"] += 1
+            logging.error(f"{self.name}::Error handling message on topic '{msg.topic}': {e}")
+
+    def on_connect(self, client, userdata, flags, reason_code, properties):
+        """
+        @brief Callback for when the client receives a CONNACK response from the broker.
+        @details Subscribes to all registered topics again, announces the node and calls on_connected.
+        @param client The client instance for this callback.
+        @param userdata The private user data as set in Client() or userdata_set().
+        @param flags Response flags sent by the broker.
+        @param reason_code The connection result.
+        @param properties The MQTT v5 properties of the CONNACK, None for MQTT 3.1.1.
+        """
+        if reason_code.is_failure:
+            logging.error(f"{self.name}::Connection failed: {reason_code}")
+            return
+        self.connected = True
+        self.stats["connects"] += 1
+        logging.info(f"{self.name}::Connected successfully to broker")
+        if self.subscriptions:
+            client.subscribe(list(self.subscriptions.items()))
+            logging.info(f"{self.name}::Subscribed to topics {', '.join(self.subscriptions)}")
+        self._publish_node_status(NodeState.ONLINE)
+        if self.on_connected is not None:
+            self.on_connected()
+
+    def set_node_status(self, topic, node):
+        """
+        @brief Announces the liveness of the node on a topic.
+        @details Registers the offline status as Last Will, so it must be called before connecting.
+                 The broker publishes the Last Will at the latest 1.5 times MQTTConfig.KEEPALIVE after
+                 the node went silent.
+        @param topic The node status topic.
+        @param node The name of the node.
+        """
+        self.node_status = (topic, node)
+        offline = NodeStatus(node=node, status=NodeState.OFFLINE.value)
+        self.client.will_set(topic, encode(offline), MQTTConfig.COMMAND_QOS, retain=True)
+
+    def _publish_node_status(self, state):
+        """
+        @brief Publishes the retained status of the node, if set_node_status() was called.
+        @param state The NodeState.
+        @return True if the status was published, otherwise False.
+        """
+        if self.node_status is None:
+            return False
+        topic, node = self.node_status
+        status = NodeStatus(node=node, status=state.value, time=time.time())
+        return self._publish(topic, encode(status), MQTTConfig.COMMAND_QOS, True)
+
+    def _announce_offline(self):
+        """
+        @brief Publishes the offline status before a clean disconnect, for which the broker sends no Last Will.
+        @return True if the status was published and is pending, otherwise False.
+        """
+        return self.connected and self._publish_node_status(NodeState.OFFLINE)
+
+    def _flushed(self):
+        """
+        @brief Checks whether all publications were sent or acknowledged.
+        """
+        with self._lock:
+            return not self._pending
+
+    def on_disconnect(self, client, userdata, flags, reason_code, properties):
+        """
+        @brief Callback for when the connection to the broker is closed.
+        @details Pending QoS 0 publications are lost with the connection and leave the publish queue.
+        @param client The client instance for this callback.
+        @param userdata The private user data as set in Client() or userdata_set().
+        @param flags Disconnect flags.
+        @param reason_code The reason of the disconnection.
+        @param properties The MQTT v5 properties of the DISCONNECT, None otherwise.
+        """
+        self.connected = False
+        self.stats["disconnects"] += 1
+        with self._lock:
+            self._pending = {mid: pending for mid, pending in self._pending.items() if pending[1] > 0}
+        logging.warning(f"{self.name}::Disconnected from broker: {reason_code}")
+
+    def on_publish(self, client, userdata, mid, reason_code, properties):
+        """
+        @brief Callback for when a publication was written (QoS 0) or acknowledged (QoS 1 and 2).
+        @param client The client instance for this callback.
+        @param userdata The private user data as set in Client() or userdata_set().
+        @param mid The message ID of the publication.
+        @param reason_code The reason code of the acknowledgement.
+        @param properties The MQTT v5 properties of the acknowledgement, None otherwise.
+        """
+        with self._lock:
+            pending = self._pending.pop(mid, None)
+            if pending is None:
+                # Written before publish() returned, publish() records the latency
+                self._completed.add(mid)
+                return
+        self.publish_latency.record(time.monotonic() - pending[0])
+
+    def publish(self, topic, payload, qos=None, retain=False):
+        """
+        @brief Publishes a message.
+        @details May be called from any thread. With an asyncio event loop the publication is handed to the loop.
+        @param topic The topic.
+        @param payload The payload, str or bytes.
+        @param qos The QoS of the publication. Default is the QoS of the transport.
+        @param retain Whether the broker keeps the message for new subscribers.
+        @return False if the publication was dropped, otherwise True.
+        """
+        qos = self.qos if qos is None else qos
+        if self.loop is not None and threading.get_ident() != self.loop_thread_id:
+            self.loop.call_soon_threadsafe(self._publish, topic, payload, qos, retain)
+            return True
+        return self._publish(topic, payload, qos, retain)
+
+    def publish_message(self, topic, message, codec=None, qos=None, retain=False):
+        """
+        @brief Encodes and publishes a typed message.
+        @param topic The topic.
+        @param message The Message.
+        @param codec The name of the codec. Default is MQTTConfig.CODEC.
+        @param qos The QoS of the publication. Default is the QoS of the transport.
+        @param retain Whether the broker keeps the message for new subscribers.
+        @return False if the publication was dropped, otherwise True.
+        """
+        return self.publish(topic, encode(message, codec), qos, retain)
+
+    def _publish(self, topic, payload, qos, retain):
+        """
+        @brief Publishes a message if the publish queue has room.
+        @return False if the publication was dropped, otherwise True.
+        """
+        started = time.monotonic()
+        with self._lock:
+            if len(self._pending) >= MQTTConfig.PUBLISH_QUEUE_SIZE:
+                return self._drop(topic, "publish queue full")
+            info = self.client.publish(topic, payload, qos, retain)
+            if info.rc == mqtt.MQTT_ERR_QUEUE_SIZE or (info.rc == mqtt.MQTT_ERR_NO_CONN and qos == 0):
+                self._completed.discard(info.mid)
+                return self._drop(topic, mqtt.error_string(info.rc))
+            self.stats["published"] += 1
+            if info.mid in self._completed:
+                self._completed.discard(info.mid)
+                completed = True
+            else:
+                self._pending[info.mid] = (started, qos)
+                completed = False
+        if completed:
+            self.publish_latency.record(time.monotonic() - started)
+        return True
+
+    def _drop(self, topic, reason):
+        """
+        @brief Counts and logs a dropped publication.
+        @return False.
+        """
+        self.stats["dropped"] += 1
+        logging.warning(f"{self.name}::Dropped publication on topic '{topic}': {reason}")
+        return False
+
+    def start(self):
+        """
+        @brief Connects to the broker and handles the network traffic on a paho thread.
+        @details The thread retries the first connection and reconnects with backoff.
+        """
+        self.client.connect_async(self.broker_address, self.mqtt_port, MQTTConfig.KEEPALIVE)
+        self.client.loop_start()
+
+    async def run(self, stop_event):
+        """
+        @brief Connects to the broker and handles the network traffic on the running event loop.
+        @details Reconnects with backoff after a connection loss and disconnects once stop_event is set.
+        @param stop_event The asyncio.Event ending the connection.
+        """
+        self.loop = asyncio.get_running_loop()
+        self.loop_thread_id = threading.get_ident()
+        self.helper = AsyncioMQTTHelper(self.loop, self.client)
+        connection = self.loop.create_task(self._maintain_connection())
+        await stop_event.wait()
+        connection.cancel()
+        await asyncio.gather(connection, return_exceptions=True)
+        await self.helper.wait_connect()
+        if self._announce_offline():
+            deadline = time.monotonic() + MQTTConfig.DISCONNECT_TIMEOUT
+            while not self._flushed() and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+        self.client.disconnect()
+
+    async def _maintain_connection(self):
+        """
+        @brief Connects to the broker and reconnects with exponential backoff after a connection loss.
+        """
+        delay = MQTTConfig.RECONNECT_MIN_DELAY
+        while True:
+            connects = self.stats["connects"]
+            try:
+                await self.helper.connect(self.broker_address, self.mqtt_port, MQTTConfig.KEEPALIVE)
+                await self.helper.disconnected.wait()
+            except OSError as e:
+                logging.error(f"{self.name}::Connecting to broker failed: {e}")
+
+            # Back off unless the broker accepted the connection
+            if self.stats["connects"] > connects:
+                delay = MQTTConfig.RECONNECT_MIN_DELAY
+            logging.info(f"{self.name}::Next connection attempt in {delay}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MQTTConfig.RECONNECT_MAX_DELAY)
+
+    def stop(self):
+        """
+        @brief Disconnects from the broker and stops the paho thread started by start().
+        """
+        if self._announce_offline():
+            deadline = time.monotonic() + MQTTConfig.DISCONNECT_TIMEOUT
+            while not self._flushed() and time.monotonic() < deadline:
+                time.sleep(0.01)
+        self.client.disconnect()
+        self.client.loop_stop()
+
+    def get_stats(self):
+        """
+        @brief Returns the transport metrics.
+        @return A dictionary with the connection state, the counters, the pending publications
+                and the publish latency in milliseconds.
+        """
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "connected": self.connected,
+            **self.stats,
+            "pending": pending,
+            "publish_latency": self.publish_latency.summary()
+        }
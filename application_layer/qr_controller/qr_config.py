@@ -0,0 +1,60 @@
+class QRConfig:
+    """
+    @class QRConfig
+    @brief Configuration class for the QR code scanner.
+    """
+
+    BACKEND = "keyboard"
+    """
+    @brief How the scanner is read.
+    @details Supported values are:
+    - "keyboard": key events of the main window, the window must have the focus
+    - "evdev": the input device of a USB HID scanner, read directly (Linux, requires the evdev package)
+    - "serial": a scanner in serial or USB CDC-ACM mode, read through QSerialPort
+    """
+
+    EVDEV_DEVICE = "/dev/input/by-id/usb-scanner-event-kbd"
+    """
+    @brief The input device of the HID scanner, preferably its stable /dev/input/by-id/ path.
+    """
+
+    EVDEV_GRAB = True
+    """
+    @brief Whether the HID scanner is grabbed, so its key strokes do not reach the focused window as well.
+    """
+
+    SERIAL_PORT = "/dev/ttyACM0"
+    """
+    @brief The serial port of the scanner.
+    """
+
+    SERIAL_BAUD_RATE = 9600
+    """
+    @brief The baud rate of the serial port, ignored by CDC-ACM devices.
+    """
+
+    ENCODING = "utf-8"
+    """
+    @brief The encoding of the codes sent over the serial port.
+    """
+
+    TERMINATORS = "\r\n"
+    """
+    @brief The characters ending a code, the suffix configured in the scanner.
+    """
+
+    FRAME_TIMEOUT = 0.2
+    """
+    @brief The time in seconds without input after which a pending code is complete, for scanners without suffix.
+    @details 0 disables the timeout. Not used by the keyboard backend.
+    """
+
+    MAX_CODE_LENGTH = 512
+    """
+    @brief The maximum number of characters of a code, longer input is discarded.
+    """
+
+    RECONNECT_INTERVAL = 2
+    """
+    @brief The time in seconds before a scanner that could not be opened or was unplugged is opened again.
+    """
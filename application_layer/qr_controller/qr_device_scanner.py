@@ -0,0 +1,290 @@
+import time
+import codecs
+import select
+import logging
+import threading
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from application_layer.qr_controller.qr_config import QRConfig
+from application_layer.qr_controller.qr_scanner import QRCodeFramer, QRCodeScanner
+
+class QRDeviceScanner(QThread):
+    """
+    @class QRDeviceScanner
+    @brief Base class of the scanners reading the device directly on their own thread.
+
+    The thread opens the device, frames the received characters into codes and emits
+    device_qr_code_scanned once per code, independent of the focus of the window. A device
+    that cannot be opened or is unplugged is opened again after QRConfig.RECONNECT_INTERVAL.
+    Subclasses implement open_device(), read_text() and close_device().
+    """
+
+    device_qr_code_scanned = pyqtSignal(str)
+    """ @brief Signal emitted with every complete code. """
+
+    reads_key_events = False
+    """ @brief The scanner does not use the key events of the main window. """
+
+    def __init__(self, name, parent=None):
+        """
+        @brief Constructor for QRDeviceScanner.
+        @param name The name used in the log messages and as thread name.
+        @param parent The parent QObject, if any.
+        """
+        super().__init__(parent)
+        self.name = name
+        self.framer = QRCodeFramer()
+        self.stats = {"codes": 0, "opens": 0, "errors": 0}
+        self._stop_event = threading.Event()
+        self.setObjectName(name)
+
+    def run(self):
+        """
+        @brief Opens the device and reads codes until stop() is called.
+        """
+        threading.current_thread().name = self.objectName()
+        while not self._stop_event.is_set():
+            try:
+                self.open_device()
+            except Exception as e:
+                self.stats["errors"] += 1
+                logging.warning(f"{self.name}::Could not open the scanner: {e}")
+                self._stop_event.wait(QRConfig.RECONNECT_INTERVAL)
+                continue
+
+            self.stats["opens"] += 1
+            logging.info(f"{self.name}::Scanner opened")
+            try:
+                self._read_codes()
+            except Exception as e:
+                self.stats["errors"] += 1
+                logging.error(f"{self.name}::Scanner lost: {e}")
+            finally:
+                self.framer.flush()
+                self.close_device()
+            if not self._stop_event.is_set():
+                self._stop_event.wait(QRConfig.RECONNECT_INTERVAL)
+
+    def _read_codes(self):
+        """
+        @brief Reads and frames the input of the open device until stop() is called.
+        @details Waits at most 0.2 s per read to notice stop(), and completes a pending code
+                 once no input arrived for QRConfig.FRAME_TIMEOUT.
+        """
+        last_input = time.monotonic()
+        while not self._stop_event.is_set():
+            text = self.read_text(0.2 if not self.framer.pending() or not QRConfig.FRAME_TIMEOUT
+                                  else min(0.2, QRConfig.FRAME_TIMEOUT))
+            if text:
+                last_input = time.monotonic()
+                for code in self.framer.feed(text):
+                    self._emit_code(code)
+            elif (QRConfig.FRAME_TIMEOUT and self.framer.pending()
+                  and time.monotonic() - last_input >= QRConfig.FRAME_TIMEOUT):
+                code = self.framer.flush()
+                if code is not None:
+                    self._emit_code(code)
+
+    def _emit_code(self, code):
+        """
+        @brief Hands a complete code to the GUI thread.
+        @param code The code.
+        """
+        self.stats["codes"] += 1
+        logging.info(f"{self.name}::Scanned QR code {code}")
+        self.device_qr_code_scanned.emit(code)
+
+    def stop(self):
+        """
+        @brief Stops reading and waits for the thread to end.
+        """
+        self._stop_event.set()
+        self.wait()
+
+    def open_device(self):
+        """
+        @brief Opens the device.
+        @throws Exception If the device cannot be opened.
+        """
+        raise NotImplementedError
+
+    def read_text(self, timeout):
+        """
+        @brief Reads the available input.
+        @param timeout The maximum time in seconds to wait for input.
+        @return The received characters, an empty string if nothing arrived.
+        @throws Exception If the device was lost.
+        """
+        raise NotImplementedError
+
+    def close_device(self):
+        """
+        @brief Closes the device, also after an error.
+        """
+        raise NotImplementedError
+
+class EvdevQRScanner(QRDeviceScanner):
+    """
+    @class EvdevQRScanner
+    @brief Reads a USB HID scanner through its Linux input device.
+
+    The key codes are translated with a US keyboard layout, the usual default of HID
+    scanners. The device is grabbed if QRConfig.EVDEV_GRAB is set, so the codes are not
+    typed into the focused window as well.
+    """
+
+    KEYMAP = {
+        **{f"KEY_{letter}": (letter.lower(), letter) for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"},
+        **{f"KEY_{digit}": (digit, shifted) for digit, shifted in zip("1234567890", "!@#$%^&*()")},
+        "KEY_MINUS": ("-", "_"), "KEY_EQUAL": ("=", "+"), "KEY_LEFTBRACE": ("[", "{"),
+        "KEY_RIGHTBRACE": ("]", "}"), "KEY_SEMICOLON": (";", ":"), "KEY_APOSTROPHE": ("'", "\""),
+        "KEY_GRAVE": ("`", "~"), "KEY_BACKSLASH": ("\\", "|"), "KEY_COMMA": (",", "<"),
+        "KEY_DOT": (".", ">"), "KEY_SLASH": ("/", "?"), "KEY_SPACE": (" ", " "), "KEY_TAB": ("\t", "\t"),
+        "KEY_ENTER": ("\n", "\n"), "KEY_KPENTER": ("\n", "\n")
+    }
+    """ @brief The characters of the key names without and with shift. """
+
+    SHIFT_KEYS = ("KEY_LEFTSHIFT", "KEY_RIGHTSHIFT")
+    """ @brief The names of the shift keys. """
+
+    def __init__(self, device_path=None, grab=None, parent=None):
+        """
+        @brief Constructor for EvdevQRScanner.
+        @param device_path The path of the input device. Default is QRConfig.EVDEV_DEVICE.
+        @param grab Whether the device is grabbed. Default is QRConfig.EVDEV_GRAB.
+        @param parent The parent QObject, if any.
+        """
+        super().__init__("EvdevQRScanner", parent)
+        self.device_path = device_path or QRConfig.EVDEV_DEVICE
+        self.grab = QRConfig.EVDEV_GRAB if grab is None else grab
+        self.device = None
+        self.keymap = None
+        self.shift_codes = ()
+        self.shift = False
+
+    def open_device(self):
+        """
+        @brief Opens and optionally grabs the input device.
+        @throws ImportError If the evdev package is not installed.
+        @throws OSError If the device cannot be opened.
+        """
+        import evdev
+        if self.keymap is None:
+            self.keymap = {evdev.ecodes.ecodes[name]: chars for name, chars in self.KEYMAP.items()}
+            self.shift_codes = tuple(evdev.ecodes.ecodes[name] for name in self.SHIFT_KEYS)
+        self.device = evdev.InputDevice(self.device_path)
+        if self.grab:
+            self.device.grab()
+        self.shift = False
+
+    def read_text(self, timeout):
+        """
+        @brief Translates the key presses received within the timeout.
+        @param timeout The maximum time in seconds to wait for input.
+        @return The typed characters.
+        @throws OSError If the device was unplugged.
+        """
+        readable, _, _ = select.select([self.device.fd], [], [], timeout)
+        if not readable:
+            return ""
+        chars = []
+        for event in self.device.read():
+            if event.type != 0x01:  # EV_KEY
+                continue
+            if event.code in self.shift_codes:
+                self.shift = event.value != 0  # 0 release, 1 press, 2 repeat
+            elif event.value == 1 and event.code in self.keymap:
+                chars.append(self.keymap[event.code][self.shift])
+        return "".join(chars)
+
+    def close_device(self):
+        """
+        @brief Releases and closes the input device.
+        """
+        if self.device is None:
+            return
+        try:
+            if self.grab:
+                self.device.ungrab()
+        except OSError:
+            pass  # Already gone when unplugged
+        self.device.close()
+        self.device = None
+
+class SerialQRScanner(QRDeviceScanner):
+    """
+    @class SerialQRScanner
+    @brief Reads a scanner in serial or USB CDC-ACM mode through QSerialPort.
+
+    The port is created and used on the scanner thread with the blocking API of QSerialPort,
+    so no event loop is involved.
+    """
+
+    def __init__(self, port_name=None, baud_rate=None, parent=None):
+        """
+        @brief Constructor for SerialQRScanner.
+        @param port_name The name or path of the serial port. Default is QRConfig.SERIAL_PORT.
+        @param baud_rate The baud rate. Default is QRConfig.SERIAL_BAUD_RATE.
+        @param parent The parent QObject, if any.
+        """
+        super().__init__("SerialQRScanner", parent)
+        self.port_name = port_name or QRConfig.SERIAL_PORT
+        self.baud_rate = baud_rate or QRConfig.SERIAL_BAUD_RATE
+        self.port = None
+        self.decoder = None
+
+    def open_device(self):
+        """
+        @brief Opens the serial port for reading.
+        @throws OSError If the port cannot be opened.
+        """
+        from PyQt6.QtCore import QIODeviceBase
+        from PyQt6.QtSerialPort import QSerialPort
+        self.port = QSerialPort()
+        self.port.setPortName(self.port_name)
+        self.port.setBaudRate(self.baud_rate)
+        if not self.port.open(QIODeviceBase.OpenModeFlag.ReadOnly):
+            error = self.port.errorString()
+            self.port = None
+            raise OSError(f"{self.port_name}: {error}")
+        self.decoder = codecs.getincrementaldecoder(QRConfig.ENCODING)(errors="replace")
+
+    def read_text(self, timeout):
+        """
+        @brief Reads the bytes received within the timeout.
+        @param timeout The maximum time in seconds to wait for input.
+        @return The decoded characters, a character split across reads is completed by the next read.
+        @throws OSError If the port was lost.
+        """
+        from PyQt6.QtSerialPort import QSerialPort
+        if not self.port.waitForReadyRead(int(timeout * 1000)):
+            if self.port.error() not in (QSerialPort.SerialPortError.NoError, QSerialPort.SerialPortError.TimeoutError):
+                raise OSError(f"{self.port_name}: {self.port.errorString()}")
+            self.port.clearError()
+            return ""
+        return self.decoder.decode(bytes(self.port.readAll()))
+
+    def close_device(self):
+        """
+        @brief Closes the serial port.
+        """
+        if self.port is not None:
+            self.port.close()
+            self.port = None
+
+def create_qr_scanner(backend, parent=None):
+    """
+    @brief Creates the QR code scanner selected in the configuration.
+    @param backend "keyboard", "evdev" or "serial", see QRConfig.BACKEND.
+    @param parent The parent QObject, if any.
+    @return A QRCodeScanner fed by the key events of the main window, or a QRDeviceScanner to be started.
+    @throws ValueError If the backend is unknown.
+    """
+    if backend == "keyboard":
+        return QRCodeScanner(parent)
+    if backend == "evdev":
+        return EvdevQRScanner(parent=parent)
+    if backend == "serial":
+        return SerialQRScanner(parent=parent)
+    raise ValueError(f"Unknown QR scanner backend: {backend}")
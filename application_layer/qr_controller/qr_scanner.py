@@ -1,30 +1,98 @@
 from PyQt6.QtCore import QObject, pyqtSignal
-import logging 
+import logging
+
+from application_layer.qr_controller.qr_config import QRConfig
+
+class QRCodeFramer:
+    """
+    @class QRCodeFramer
+    @brief Assembles the characters sent by a scanner into complete codes.
+    """
+
+    def __init__(self, terminators=None, max_length=None):
+        """
+        @brief Constructor for QRCodeFramer.
+        @param terminators The characters ending a code. Default is QRConfig.TERMINATORS.
+        @param max_length The maximum number of characters of a code, longer input is discarded. Default is QRConfig.MAX_CODE_LENGTH.
+        """
+        self.terminators = terminators or QRConfig.TERMINATORS
+        self.max_length = max_length or QRConfig.MAX_CODE_LENGTH
+        self.chars = []
+        self.overflow = False
+
+    def feed(self, text):
+        """
+        @brief Adds received characters.
+        @param text The characters, in any chunks.
+        @return The list of codes completed by a terminator, usually empty or one code.
+        """
+        codes = []
+        for char in text:
+            if char in self.terminators:
+                code = self.flush()
+                if code is not None:
+                    codes.append(code)
+            elif len(self.chars) < self.max_length:
+                self.chars.append(char)
+            else:
+                self.overflow = True
+        return codes
+
+    def flush(self):
+        """
+        @brief Completes the pending code, e.g. after the frame timeout.
+        @return The code, None if nothing is pending or the input was too long.
+        """
+        code = "".join(self.chars) if self.chars and not self.overflow else None
+        if self.overflow:
+            logging.warning(f"QRCodeFramer::Discarded input longer than {self.max_length} characters")
+        self.chars = []
+        self.overflow = False
+        return code
+
+    def pending(self):
+        """
+        @brief Checks whether a code is partially received.
+        @return True if characters are waiting for a terminator.
+        """
+        return bool(self.chars)
 
 class QRCodeScanner(QObject):
     """
     @class QRCodeScanner
     @brief A class to handle QR code scanning and signal emission.
+
+    Reads the scanner as keyboard: the main window passes its key events to scan_qr_code().
+    See qr_device_scanner.py for the backends reading the scanner directly.
     """
     device_qr_code_scanned = pyqtSignal(str)
 
+    reads_key_events = True
+    """ @brief The main window passes its key events to scan_qr_code(). """
+
     def __init__(self, parent=None):
         """
         @brief Constructor for QRCodeScanner.
         @param parent The parent QObject, if any.
         """
         super().__init__(parent)
-        self.qr_code = ""
+        self.framer = QRCodeFramer()
 
     def scan_qr_code(self, key):
         """
         @brief Processes the input key for QR code scanning.
         @param key The input key from the QR code scanner.
         """
-        logging.info("QRCodeScanner::Processing QR Code Scanner")
-        if key == '\r' or key == '\n':  # Enter key, assuming it's the end of the QR code
-            if self.qr_code:  # Emit signal only if there's something to process
-                self.device_qr_code_scanned.emit(self.qr_code)
-                self.qr_code = ""
-        else:
-            self.qr_code += key
\ No newline at end of file
+        for code in self.framer.feed(key):
+            logging.info(f"QRCodeScanner::Scanned QR code {code}")
+            self.device_qr_code_scanned.emit(code)
+
+    def start(self):
+        """
+        @brief Nothing to start, the key events are passed by the main window.
+        """
+
+    def stop(self):
+        """
+        @brief Nothing to stop, the key events are passed by the main window.
+        """
@@ -0,0 +1,106 @@
+import time
+import logging
+from collections import deque
+
+from application_layer.rfid_pi.rfid_config import RFIDConfig
+from application_layer.states import ReaderMode
+
+class DutyCycleController:
+    """
+    @brief Adapts the power and duty cycle of the RFID reader to the activity at the gate.
+
+    The reader starts in ACTIVE mode (full power, continuous reading). When no tag has been
+    seen for RFIDConfig.idle_threshold seconds it drops to PRESENCE mode (reduced power,
+    short reads separated by a pause). The first tag seen in PRESENCE mode switches it back
+    to ACTIVE mode.
+    """
+
+    def __init__(self, rfid_reader):
+        """
+        @brief Initializes the DutyCycleController class.
+        @param rfid_reader The RFIDReader whose settings are adapted.
+        """
+        self.rfid_reader = rfid_reader
+        self.mode = ReaderMode.ACTIVE
+        self.started_at = time.monotonic()
+        self.mode_since = self.started_at
+        self.last_tag_time = self.started_at
+        self.transitions = deque(maxlen=RFIDConfig.max_mode_transitions)
+        self.mode_stats = {
+            mode: {"cycles": 0, "tags": 0, "read_time": 0.0, "time": 0.0}
+            for mode in ReaderMode
+        }
+
+    def update(self, tag_count, read_duration):
+        """
+        @brief Accounts for a finished read cycle and switches the mode if needed.
+        @param tag_count The number of tags returned by the read.
+        @param read_duration The time in seconds spent in the read.
+        @return The pause in seconds before the next read should start.
+        """
+        now = time.monotonic()
+        stats = self.mode_stats[self.mode]
+        stats["cycles"] += 1
+        stats["tags"] += tag_count
+        stats["read_time"] += read_duration
+
+        if tag_count:
+            self.last_tag_time = now
+            if self.mode == ReaderMode.PRESENCE:
+                self._switch_mode(ReaderMode.ACTIVE, now)
+        elif self.mode == ReaderMode.ACTIVE and now - self.last_tag_time >= RFIDConfig.idle_threshold:
+            self._switch_mode(ReaderMode.PRESENCE, now)
+
+        if self.mode == ReaderMode.PRESENCE:
+            return RFIDConfig.presence_read_interval
+        return 0
+
+    def _switch_mode(self, mode, now):
+        """
+        @brief Applies the reader settings of a mode and records the transition.
+        @param mode The ReaderMode to switch to.
+        @param now The current monotonic time.
+        """
+        if mode == ReaderMode.ACTIVE:
+            self.rfid_reader.set_read_powers(RFIDConfig.reader_powers)
+            self.rfid_reader.set_timeout(RFIDConfig.timeout)
+        else:
+            self.rfid_reader.set_read_powers(RFIDConfig.presence_reader_powers)
+            self.rfid_reader.set_timeout(RFIDConfig.presence_timeout)
+
+        self.mode_stats[self.mode]["time"] += now - self.mode_since
+        self.transitions.append({
+            "time": time.time(),
+            "from": self.mode.value,
+            "to": mode.value,
+            "after": round(now - self.mode_since, 3)
+        })
+        logging.info(f"DutyCycleController::Switched from {self.mode.value} to {mode.value} "
+                     f"after {now - self.mode_since:.1f}s")
+        self.mode = mode
+        self.mode_since = now
+
+    def get_stats(self):
+        """
+        @brief Returns the mode transitions and read-rate statistics.
+        @return A dictionary with the current mode, the recent transitions and per-mode statistics
+                (cycles, tags, tags per second, duty cycle and share of the uptime).
+        """
+        now = time.monotonic()
+        uptime = max(now - self.started_at, 1e-9)
+        modes = {}
+        for mode, stats in self.mode_stats.items():
+            elapsed = stats["time"] + (now - self.mode_since if mode == self.mode else 0)
+            modes[mode.value] = {
+                "cycles": stats["cycles"],
+                "tags": stats["tags"],
+                "tags_per_second": round(stats["tags"] / elapsed, 2) if elapsed else 0.0,
+                "duty_cycle": round(stats["read_time"] / elapsed, 3) if elapsed else 0.0,
+                "time_share": round(elapsed / uptime, 3)
+            }
+        return {
+            "mode": self.mode.value,
+            "mode_since": round(now - self.mode_since, 3),
+            "transitions": list(self.transitions),
+            "modes": modes
+        }
@@ -0,0 +1,167 @@
+import time
+import logging
+import threading
+from collections import deque
+
+from application_layer.rfid_pi.rfid_config import RFIDConfig
+from application_layer.states import ReaderHealth
+
+class ReaderSupervisor:
+    """
+    @brief Keeps the RFID reader running across serial port and reader failures.
+
+    Every failed read closes the reader. It is re-opened with an exponential backoff
+    between RFIDConfig.reconnect_min_delay and RFIDConfig.reconnect_max_delay, which
+    applies region, power and read plan again. The supervisor tracks the error rate and
+    the dead time, i.e. how long the gate was blind.
+    """
+
+    def __init__(self, rfid_reader, on_health_changed=None, stop_event=None):
+        """
+        @brief Initializes the ReaderSupervisor class.
+        @param rfid_reader The RFIDReader to supervise.
+        @param on_health_changed Callback called with the health status dictionary when the health changes.
+        @param stop_event The threading.Event stopping the service, it ends the wait for the next open attempt.
+        """
+        self.rfid_reader = rfid_reader
+        self.on_health_changed = on_health_changed
+        self.stop_event = stop_event or threading.Event()
+        self.health = ReaderHealth.DOWN
+        self.reconnect_delay = RFIDConfig.reconnect_min_delay
+        self.next_open_attempt = 0.0
+        self.error_times = deque()
+        self.total_errors = 0
+        self.consecutive_errors = 0
+        self.reconnects = 0
+        self.outages = 0
+        self.outage_start = time.monotonic()  # The gate is blind until the reader is opened
+        self.dead_time = 0.0
+        self.last_outage = 0.0
+        self.last_error = None
+
+    def read_tags(self):
+        """
+        @brief Reads tags, re-opening the reader first if it is down.
+        @details Never raises. While the reader is down the call waits until the next open attempt
+                 or until the stop event is set.
+        @return A list of tags, empty if no tag was seen or the reader is down.
+        """
+        if not self.rfid_reader.is_open() and not self._try_open():
+            return []
+
+        try:
+            tags = self.rfid_reader.read_tags()
+        except Exception as e:
+            self._on_error(e)
+            return []
+
+        if self.outage_start is not None:
+            self._end_outage()
+        return tags
+
+    def _try_open(self):
+        """
+        @brief Opens the reader if the backoff delay has expired.
+        @return True if the reader is open, otherwise False. False without an attempt if the stop event was set while waiting.
+        """
+        wait = self.next_open_attempt - time.monotonic()
+        if wait > 0 and self.stop_event.wait(wait):
+            return False
+
+        try:
+            self.rfid_reader.open()
+        except Exception as e:
+            logging.error(f"ReaderSupervisor::Opening the reader failed, next attempt in {self.reconnect_delay}s: {e}")
+            self._record_error(e)
+            self.next_open_attempt = time.monotonic() + self.reconnect_delay
+            self.reconnect_delay = min(self.reconnect_delay * 2, RFIDConfig.reconnect_max_delay)
+            return False
+
+        self.reconnects += 1
+        return True
+
+    def _on_error(self, error):
+        """
+        @brief Closes the reader after a failed read and starts an outage.
+        @param error The exception raised by the reader.
+        """
+        logging.error(f"ReaderSupervisor::Error reading tags: {error}")
+        self._record_error(error)
+        self.rfid_reader.close()
+        self.next_open_attempt = time.monotonic() + self.reconnect_delay
+        self.reconnect_delay = min(self.reconnect_delay * 2, RFIDConfig.reconnect_max_delay)
+        if self.outage_start is None:
+            self.outage_start = time.monotonic()
+            self.outages += 1
+            self._set_health(ReaderHealth.DOWN)
+
+    def _record_error(self, error):
+        """
+        @brief Accounts for an error in the error counters.
+        @param error The exception raised by the reader.
+        """
+        self.total_errors += 1
+        self.consecutive_errors += 1
+        self.last_error = str(error)
+        self.error_times.append(time.monotonic())
+
+    def _end_outage(self):
+        """
+        @brief Ends the current outage after the first successful read.
+        """
+        self.last_outage = time.monotonic() - self.outage_start
+        self.dead_time += self.last_outage
+        self.outage_start = None
+        self.consecutive_errors = 0
+        self.reconnect_delay = RFIDConfig.reconnect_min_delay
+        logging.info(f"ReaderSupervisor::Reader is reading, gate was blind for {self.last_outage:.1f}s")
+        self._set_health(ReaderHealth.DEGRADED if self.error_rate() else ReaderHealth.OK)
+
+    def error_rate(self):
+        """
+        @brief Computes the error rate over the last RFIDConfig.error_rate_window seconds.
+        @return The number of errors per minute.
+        """
+        horizon = time.monotonic() - RFIDConfig.error_rate_window
+        while self.error_times and self.error_times[0] < horizon:
+            self.error_times.popleft()
+        return len(self.error_times) * 60 / RFIDConfig.error_rate_window
+
+    def check_health(self):
+        """
+        @brief Re-evaluates the health, e.g. to report OK once old errors left the window.
+        """
+        if self.health == ReaderHealth.DEGRADED and not self.error_rate():
+            self._set_health(ReaderHealth.OK)
+
+    def _set_health(self, health):
+        """
+        @brief Changes the health and notifies the callback.
+        @param health The new ReaderHealth.
+        """
+        if health == self.health:
+            return
+        logging.info(f"ReaderSupervisor::Health changed from {self.health.value} to {health.value}")
+        self.health = health
+        if self.on_health_changed is not None:
+            self.on_health_changed(self.get_status())
+
+    def get_status(self):
+        """
+        @brief Returns the health status and the dead-time metrics.
+        @return A dictionary with the health, error counters, error rate and dead times in seconds.
+        """
+        now = time.monotonic()
+        current_outage = now - self.outage_start if self.outage_start is not None else 0.0
+        return {
+            "health": self.health.value,
+            "error_rate": self.error_rate(),
+            "total_errors": self.total_errors,
+            "consecutive_errors": self.consecutive_errors,
+            "reconnects": self.reconnects,
+            "outages": self.outages,
+            "current_outage": round(current_outage, 3),
+            "last_outage": round(self.last_outage, 3),
+            "dead_time": round(self.dead_time + current_outage, 3),
+            "last_error": self.last_error
+        }
@@ -44,4 +44,102 @@ class RFIDConfig:
     """
     @brief The timeout for reading tags.
     @details This specifies the duration in milliseconds for which the RFID reader will attempt to read tags.
-    """
\ No newline at end of file
+    """
+
+    presence_reader_powers = [(1, 1500)]  # Antenna 1, Power 15 dBm
+    """
+    @brief The read powers used while the reader is in presence sense mode.
+    @details Same format as reader_powers. A lower power keeps the reader cool while the room is empty
+             but is still enough to notice somebody approaching the gate.
+    """
+
+    presence_timeout = 100
+    """
+    @brief The timeout for reading tags in presence sense mode.
+    @details This specifies the duration in milliseconds of a single read while in presence sense mode.
+    """
+
+    presence_read_interval = 0.5
+    """
+    @brief The pause between two reads in presence sense mode.
+    @details This specifies the duration in seconds for which the reader stays idle between two presence reads.
+    """
+
+    idle_threshold = 10
+    """
+    @brief The time without any tag after which the reader drops to presence sense mode.
+    @details This specifies the duration in seconds. Any tag seen in presence sense mode switches the reader
+             back to full-rate reading immediately.
+    """
+
+    max_mode_transitions = 100
+    """
+    @brief The number of mode transitions kept in memory for inspection.
+    """
+
+    filter_enabled = True
+    """
+    @brief Enables the edge-side tag filter.
+    @details When enabled only tags of devices that are in the inventory and not borrowed are published.
+    """
+
+    filter_refresh_interval = 5
+    """
+    @brief The interval between two synchronisations of the tag filter with the devices table.
+    @details This specifies the duration in seconds. It bounds the time a just returned device can leave unnoticed.
+    """
+
+    filter_max_age = 30
+    """
+    @brief The maximum age of the tag filter.
+    @details This specifies the duration in seconds. If the filter could not be synchronised for longer,
+             every tag is published again so that no alarm is lost while the database is unreachable.
+    """
+
+    reconnect_min_delay = 1
+    """
+    @brief The delay before the first attempt to re-open a failed reader.
+    @details This specifies the duration in seconds. The delay doubles after every failed attempt.
+    """
+
+    reconnect_max_delay = 60
+    """
+    @brief The upper bound of the delay between two attempts to re-open the reader.
+    @details This specifies the duration in seconds.
+    """
+
+    error_rate_window = 60
+    """
+    @brief The window over which the error rate of the reader is computed.
+    @details This specifies the duration in seconds. The reader is reported as degraded while errors are in the window.
+    """
+
+    health_publish_interval = 30
+    """
+    @brief The interval between two health status publications.
+    @details This specifies the duration in seconds. Health changes are published immediately.
+    """
+
+    telemetry_window = 10
+    """
+    @brief The length of a telemetry window.
+    @details This specifies the duration in seconds. A summary is published on the metrics topic after every window.
+    """
+
+    telemetry_ring_size = 360
+    """
+    @brief The number of telemetry window summaries kept in memory.
+    @details With the default window of 10 seconds the ring covers the last hour.
+    """
+
+    rssi_bins = [-80, -70, -60, -50, -40]
+    """
+    @brief The upper bounds in dBm of the RSSI histogram bins.
+    @details A histogram has one bin more than bounds, the last bin counts every read above the last bound.
+    """
+
+    gate_id = "gate_1"
+    """
+    @brief The ID of the gate this reader is installed at.
+    @details This ID is sent with every tag and stored with the alarm events.
+    """
@@ -9,6 +9,7 @@ class RFIDReader:
     def __init__(self, reader_uri, region, read_powers, antenna_list, protocol, timeout):
         """
         @brief Initializes the RFIDReader class.
+        @details The connection to the reader is opened by open().
         @param reader_uri The URI of the RFID reader.
         @param region The region setting for the RFID reader.
         @param read_powers The read powers for the RFID reader.
@@ -16,13 +17,42 @@ class RFIDReader:
         @param protocol The protocol to use for reading.
         @param timeout The timeout for reading tags.
         """
-        self.reader = mercury.Reader(reader_uri)
+        self.reader = None
+        self.reader_uri = reader_uri
         self.region = region
         self.read_powers = read_powers
         self.antenna_list = antenna_list
         self.protocol = protocol
         self.timeout = timeout
-        self.setup_reader()
+
+    def open(self):
+        """
+        @brief Opens the connection to the RFID reader and applies the configuration.
+        @details Any previous connection is released first. Raises if the reader cannot be opened
+                 or configured, the reader is closed again in both cases.
+        """
+        self.close()
+        self.reader = mercury.Reader(self.reader_uri)
+        try:
+            self.setup_reader()
+        except Exception:
+            self.close()  # A half-configured reader must not count as open
+            raise
+        logging.info(f"RFIDReader::Opened reader {self.reader_uri}")
+
+    def close(self):
+        """
+        @brief Releases the connection to the RFID reader.
+        @details The Mercury API closes the serial port when the reader object is destroyed.
+        """
+        self.reader = None
+
+    def is_open(self):
+        """
+        @brief Checks whether the connection to the RFID reader is open.
+        @return True if the reader is open, otherwise False.
+        """
+        return self.reader is not None
 
     def setup_reader(self):
         """
@@ -32,14 +62,27 @@ class RFIDReader:
         self.reader.set_read_powers(self.read_powers)
         self.reader.set_read_plan(self.antenna_list, self.protocol)
 
+    def set_read_powers(self, read_powers):
+        """
+        @brief Changes the read powers of the reader.
+        @details The powers are applied again whenever the reader is re-opened.
+        @param read_powers A list of (antenna, power) tuples, power in centi-dBm.
+        """
+        self.read_powers = read_powers
+        if self.reader is not None:
+            self.reader.set_read_powers(self.read_powers)
+
+    def set_timeout(self, timeout):
+        """
+        @brief Changes the duration of a single read.
+        @param timeout The timeout for reading tags in milliseconds.
+        """
+        self.timeout = timeout
+
     def read_tags(self):
         """
         @brief Reads RFID tags using the configured reader.
+        @details Errors of the reader are raised to the caller, an empty list always means that no tag was seen.
         @return A list of tags read by the RFID reader.
         """
-        try:
-            tags = self.reader.read(self.timeout)
-            return tags
-        except Exception as e:
-            logging.error(f"RFIDReader::Error reading tags: {e}")
-            return []
\ No newline at end of file
+        return self.reader.read(self.timeout)
@@ -1,10 +1,19 @@
-from time import sleep
-import paho.mqtt.client as mqtt
+from time import monotonic, time
+import uuid
 import logging
+import threading
 
 from application_layer.rfid_pi.rfid_config import RFIDConfig
 from application_layer.rfid_pi.rfid_reader import RFIDReader
+from application_layer.rfid_pi.duty_cycle_controller import DutyCycleController
+from application_layer.rfid_pi.tag_filter import TagFilter
+from application_layer.rfid_pi.reader_supervisor import ReaderSupervisor
+from application_layer.rfid_pi.rfid_telemetry import RFIDTelemetry
 from application_layer.services import Services
+from application_layer.event_bus import create_transport
+from application_layer.mqtt_config import MQTTConfig
+from application_layer.messages import TagRead, Trace, ReaderHealthStatus, ReaderMetrics
+from application_layer.epc_codec import decode_epcs
 
 class RFIDService:
     """
@@ -15,76 +24,144 @@ class RFIDService:
         """
         @brief Initializes the RFIDService class.
         """
-        self.broker_address = Services.BROKER_ADDRESS
-        self.mqtt_port = Services.MQTT_PORT
         self.topic_rfid_tags = Services.TOPIC_RFID_TAGS
-        self.mqtt_client = None
+        self.topic_rfid_health = Services.TOPIC_RFID_HEALTH
+        self.topic_rfid_metrics = Services.TOPIC_RFID_METRICS
+        self.transport = create_transport(MQTTConfig.TRANSPORT, Services.MQTT_RFID_PUB, "RFIDService")
+        self.transport.set_node_status(Services.TOPIC_RFID_NODE_STATUS, Services.MQTT_RFID_PUB)
         self.rfid_reader = RFIDReader(RFIDConfig.reader_uri,
                                       RFIDConfig.region,
                                       RFIDConfig.reader_powers,
                                       RFIDConfig.read_plan_antenna,
                                       RFIDConfig.read_plan_protocol,
                                       RFIDConfig.timeout)
+        self.stop_event = threading.Event()
+        self.reader_supervisor = ReaderSupervisor(self.rfid_reader, self.publish_health, self.stop_event)
+        self.duty_cycle = DutyCycleController(self.rfid_reader)
+        self.tag_filter = TagFilter() if RFIDConfig.filter_enabled else None
+        self.telemetry = RFIDTelemetry()
 
-    def on_connect(self, client, userdata, flags, rc):
-        """
-        @brief Callback function for when the client receives a CONNACK response from the server.
-        @param client The client instance for this callback.
-        @param userdata The private user data as set in Client() or userdata_set().
-        @param flags Response flags sent by the broker.
-        @param rc The connection result.
-        """
-        if rc == 0:
-            logging.info("RFIDService::Connected successfully to broker")
-        else:
-            logging.error(f"RFIDService::Connection failed with code {rc}")
-
-    def setup_mqtt_client(self):
-        """
-        @brief Sets up the MQTT client for connecting to the broker.
-        """
-        self.mqtt_client = mqtt.Client(
-            client_id=Services.MQTT_RFID_PUB,
-            userdata=None,
-            protocol=mqtt.MQTTv311,
-            transport="tcp"
-        )
-        self.mqtt_client.on_connect = self.on_connect
-        self.mqtt_client.connect(self.broker_address, self.mqtt_port)
-
-    def publish_tags(self, tags):
+    def publish_tags(self, tags, read_wall=None, read_mono=None):
         """
         @brief Publishes RFID tags to the MQTT broker.
+        @details Tags rejected by the tag filter (borrowed devices, tags not in the inventory) are not published.
+                 Every tag gets a trace with its own ID and the time of the read, so the following
+                 stages can measure their latency against it.
         @param tags A list of RFID tags to publish.
+        @param read_wall The wall-clock time at which the read finished. Default is now.
+        @param read_mono The monotonic time at which the read finished. Default is now.
+        """
+        read_wall = read_wall if read_wall is not None else time()
+        read_mono = read_mono if read_mono is not None else monotonic()
+        epc_records = decode_epcs([tag.epc for tag in tags])
+        for tag, epc_record in zip(tags, epc_records):
+            if epc_record is None:
+                continue
+            if self.tag_filter is not None and not self.tag_filter.is_candidate(epc_record.epc):
+                logging.debug(f"RFIDService::Filtered tag {epc_record.epc}")
+                continue
+            message = TagRead(gate=RFIDConfig.gate_id,
+                              epc=epc_record.epc,
+                              rssi=tag.rssi,
+                              trace=Trace(id=uuid.uuid4().hex, read_wall=read_wall, read_mono=read_mono))
+            self.transport.publish_message(self.topic_rfid_tags, message, MQTTConfig.TAG_CODEC)
+            logging.info(f"RFIDService::Published: {message} to {self.topic_rfid_tags}")
+
+    def publish_health(self, status):
+        """
+        @brief Publishes the health status of the reader to the MQTT broker.
+        @details The status is retained, so a GUI that connects later shows the current health at once.
+        @param status The health status dictionary of the ReaderSupervisor.
+        """
+        self.transport.publish_message(self.topic_rfid_health, ReaderHealthStatus(**status),
+                                       qos=MQTTConfig.COMMAND_QOS, retain=True)
+        logging.info(f"RFIDService::Published reader health: {status['health']}")
+
+    def publish_metrics(self):
+        """
+        @brief Closes the current telemetry window and publishes its summary with the duty cycle statistics to the MQTT broker.
         """
-        for tag in tags:
-            payload = {
-                "tag": {
-                    "epc": tag.epc,
-                    "rssi": tag.rssi
-                }
-            }
-            self.mqtt_client.publish(self.topic_rfid_tags, str(payload))
-            logging.info(f"RFIDService::Published: {payload} to {self.topic_rfid_tags}")
+        metrics = self.telemetry.close_window()
+        metrics["mode"] = self.duty_cycle.mode.value
+        metrics["health"] = self.reader_supervisor.health.value
+        if self.tag_filter is not None:
+            metrics["filter"] = self.tag_filter.get_stats()
+        metrics["transport"] = self.transport.get_stats()
+        metrics["duty_cycle"] = self.get_reader_stats()
+        self.transport.publish_message(self.topic_rfid_metrics, ReaderMetrics(**metrics))
+        logging.debug(f"RFIDService::Published reader metrics to {self.topic_rfid_metrics}")
 
     def read_rfid_tags(self):
         """
         @brief Reads RFID tags and publishes them to the MQTT broker.
+        @details Reader failures are handled by the ReaderSupervisor, any other error only ends the current cycle.
         """
-        try:
-            while True:
-                tags = self.rfid_reader.read_tags()
+        last_health_publish = monotonic()
+        while not self.stop_event.is_set():
+            try:
+                read_start = monotonic()
+                tags = self.reader_supervisor.read_tags()
+                read_end = monotonic()
+                read_wall = time()
+                read_duration = read_end - read_start
                 if not tags:
-                    logging.warning("RFIDService::No tags found")
+                    logging.debug("RFIDService::No tags found")
                 else:
-                    self.publish_tags(tags)
-        except Exception as e:
-            logging.error(f"RFIDService::Error: {e}")
+                    self.publish_tags(tags, read_wall, read_end)
+
+                if self.rfid_reader.is_open():
+                    self.telemetry.record_cycle(tags)
+                    pause = self.duty_cycle.update(len(tags), read_duration)
+                    if pause:
+                        self.stop_event.wait(pause)
+
+                if self.telemetry.window_elapsed():
+                    self.publish_metrics()
+
+                if monotonic() - last_health_publish >= RFIDConfig.health_publish_interval:
+                    last_health_publish = monotonic()
+                    self.reader_supervisor.check_health()
+                    self.publish_health(self.reader_supervisor.get_status())
+            except Exception as e:
+                logging.error(f"RFIDService::Error: {e}")
+                self.stop_event.wait(RFIDConfig.reconnect_min_delay)
+
+    def get_reader_stats(self):
+        """
+        @brief Returns the duty cycle statistics of the reader.
+        @return A dictionary with the current mode, the mode transitions and the read-rate per mode.
+        """
+        return self.duty_cycle.get_stats()
+
+    def get_reader_health(self):
+        """
+        @brief Returns the health status of the reader.
+        @return A dictionary with the health, error rate and dead-time metrics.
+        """
+        return self.reader_supervisor.get_status()
+
+    def get_telemetry(self):
+        """
+        @brief Returns the telemetry of the last windows.
+        @return A list of window summaries, oldest first.
+        """
+        return self.telemetry.get_history()
 
     def start(self):
         """
-        @brief Starts the RFID service by setting up the MQTT client and reading RFID tags.
+        @brief Starts the RFID service by connecting to the MQTT broker and reading RFID tags.
+        @details Blocks until stop() is called.
+        """
+        if self.tag_filter is not None:
+            self.tag_filter.start()
+        self.transport.start()  # Connects and reconnects on the MQTT network thread
+        self.read_rfid_tags()
+        if self.tag_filter is not None:
+            self.tag_filter.stop()
+        self.transport.stop()
+
+    def stop(self):
+        """
+        @brief Stops reading after the current cycle, may be called from any thread.
         """
-        self.setup_mqtt_client()
-        self.mqtt_client.loop_start()  # Start the MQTT client loop
-        self.read_rfid_tags()
\ No newline at end of file
+        self.stop_event.set()
\ No newline at end of file
@@ -0,0 +1,87 @@
+import time
+from bisect import bisect_left
+from collections import deque
+
+from application_layer.rfid_pi.rfid_config import RFIDConfig
+
+class RFIDTelemetry:
+    """
+    @brief Computes read-rate and RSSI telemetry of the RFID reader per time window.
+
+    The current window only holds counters, the set of seen EPCs and one RSSI histogram per
+    antenna, so recording a tag is a bisect and two increments. Finished windows are
+    summarised and kept in a ring of RFIDConfig.telemetry_ring_size entries.
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes the RFIDTelemetry class.
+        """
+        self.rssi_bins = RFIDConfig.rssi_bins
+        self.ring = deque(maxlen=RFIDConfig.telemetry_ring_size)
+        self._reset_window(time.monotonic())
+
+    def _reset_window(self, now):
+        """
+        @brief Starts a new, empty window.
+        @param now The current monotonic time.
+        """
+        self.window_start = now
+        self.cycles = 0
+        self.empty_cycles = 0
+        self.reads = 0
+        self.unique_epcs = set()
+        self.rssi_histograms = {}
+
+    def record_cycle(self, tags):
+        """
+        @brief Accounts for the result of one read cycle.
+        @param tags The list of tags returned by the reader.
+        """
+        self.cycles += 1
+        if not tags:
+            self.empty_cycles += 1
+            return
+
+        for tag in tags:
+            self.reads += tag.read_count
+            self.unique_epcs.add(tag.epc)
+            histogram = self.rssi_histograms.get(tag.antenna)
+            if histogram is None:
+                histogram = self.rssi_histograms[tag.antenna] = [0] * (len(self.rssi_bins) + 1)
+            histogram[bisect_left(self.rssi_bins, tag.rssi)] += tag.read_count
+
+    def window_elapsed(self):
+        """
+        @brief Checks whether the current window is complete.
+        @return True if the window is at least RFIDConfig.telemetry_window seconds old.
+        """
+        return time.monotonic() - self.window_start >= RFIDConfig.telemetry_window
+
+    def close_window(self):
+        """
+        @brief Summarises the current window, stores it in the ring and starts a new window.
+        @return A dictionary with reads/sec, unique tags/sec, the empty-cycle ratio and the RSSI histogram per antenna.
+        """
+        now = time.monotonic()
+        duration = max(now - self.window_start, 1e-9)
+        summary = {
+            "time": time.time(),
+            "duration": round(duration, 3),
+            "cycles": self.cycles,
+            "reads_per_second": round(self.reads / duration, 2),
+            "unique_tags_per_second": round(len(self.unique_epcs) / duration, 2),
+            "empty_cycle_ratio": round(self.empty_cycles / self.cycles, 3) if self.cycles else 1.0,
+            "rssi_bins": self.rssi_bins,
+            "rssi_histograms": {str(antenna): histogram for antenna, histogram in self.rssi_histograms.items()}
+        }
+        self.ring.append(summary)
+        self._reset_window(now)
+        return summary
+
+    def get_history(self):
+        """
+        @brief Returns the summaries of the windows kept in the ring.
+        @return A list of window summaries, oldest first.
+        """
+        return list(self.ring)
@@ -0,0 +1,104 @@
+import time
+import logging
+import threading
+
+from application_layer.device_db_service import DeviceDBService
+from application_layer.alarm_rules import AlarmRules
+from application_layer.rfid_pi.rfid_config import RFIDConfig
+
+class TagFilter:
+    """
+    @brief Edge-side filter deciding which tags are worth sending to the alarm controller.
+
+    Holds the set of tag numbers of devices that are in the inventory and not borrowed.
+    Only those tags can trigger the alarm, every other tag (borrowed devices, foreign tags)
+    is dropped on the RFID Pi. Staff tags of the alarm rules always pass, they open the
+    override window of the gate on the alarm controller. The set is refreshed from the devices table in a background
+    thread and replaced as a whole, so lookups never wait for the database.
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes the TagFilter class.
+        """
+        self.alarm_tags = frozenset()
+        self.last_sync = None
+        self.passed_count = 0
+        self.filtered_count = 0
+        self.device_db_service = None
+        self.alarm_rules = AlarmRules()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def refresh(self):
+        """
+        @brief Synchronises the filter with the devices table.
+        @return True if the synchronisation succeeded, otherwise False.
+        """
+        try:
+            if self.device_db_service is None:
+                self.device_db_service = DeviceDBService()
+            tag_numbers = self.device_db_service.get_unborrowed_tag_numbers()
+        except Exception as e:
+            logging.error(f"TagFilter::Error synchronising with the devices table: {e}")
+            self.device_db_service = None  # Reconnect on the next refresh
+            return False
+
+        self.alarm_rules.reload_if_changed()
+        self.alarm_tags = frozenset(tag_numbers) | self.alarm_rules.staff_tags
+        self.last_sync = time.monotonic()
+        logging.debug(f"TagFilter::Synchronised {len(self.alarm_tags)} alarm-worthy tags")
+        return True
+
+    def is_stale(self):
+        """
+        @brief Checks whether the filter is too old to be trusted.
+        @return True if the filter was never synchronised or is older than RFIDConfig.filter_max_age.
+        """
+        return self.last_sync is None or time.monotonic() - self.last_sync > RFIDConfig.filter_max_age
+
+    def is_candidate(self, tag_nr):
+        """
+        @brief Checks whether a tag is a candidate violation and has to be published.
+        @param tag_nr The tag number (EPC) in canonical form.
+        @return True if the tag belongs to a device that is not borrowed or to a staff member, or if the filter is stale.
+        """
+        if self.is_stale() or tag_nr in self.alarm_tags:
+            self.passed_count += 1
+            return True
+        self.filtered_count += 1
+        return False
+
+    def _run(self):
+        """
+        @brief Refreshes the filter periodically until the filter is stopped.
+        """
+        while not self._stop_event.is_set():
+            self.refresh()
+            self._stop_event.wait(RFIDConfig.filter_refresh_interval)
+
+    def start(self):
+        """
+        @brief Starts the background synchronisation of the filter.
+        """
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="TagFilterThread", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        @brief Stops the background synchronisation of the filter.
+        """
+        self._stop_event.set()
+
+    def get_stats(self):
+        """
+        @brief Returns the filter statistics.
+        @return A dictionary with the filter size, its age and the number of passed and filtered tags.
+        """
+        return {
+            "size": len(self.alarm_tags),
+            "age": round(time.monotonic() - self.last_sync, 3) if self.last_sync is not None else None,
+            "passed": self.passed_count,
+            "filtered": self.filtered_count
+        }
@@ -1,20 +1,28 @@
+from data_layer.config import MQTT_CONFIG
+
 class Services:
     """
     @class Services
     @brief Contains configuration constants for MQTT broker and topics.
+    @details The broker is configured in the [MQTT] section of data_layer/config.ini.
     """
-    BROKER_ADDRESS = "172.16.2.160"
-    MQTT_PORT = 1883
+    BROKER_ADDRESS = MQTT_CONFIG['address']
+    MQTT_PORT = MQTT_CONFIG['port']
     
     # MQTT Topics
     # ts/{SUBSCRIBER}/{PUBLISHER}/{SERVICE}
     TOPIC_RFID_TAGS = "ts/alarm_controller/rfid_controller/show_tags"
     TOPIC_ALARM_STATUS = "ts/gui/alarm_controller/show_state"
     TOPIC_GUI_ALARM = "ts/alarm_controller/gui/deactivate_alarm"
+    TOPIC_GUI_ALARM_RESPONSE = "ts/gui/alarm_controller/deactivate_response"
+    TOPIC_ALARM_VIOLATION = "ts/alarm_controller/alarm_worker/violation"
+    TOPIC_RFID_HEALTH = "ts/gui/rfid_controller/reader_health"
+    TOPIC_RFID_METRICS = "ts/gui/rfid_controller/reader_metrics"
+    TOPIC_ALARM_METRICS = "ts/gui/alarm_controller/alarm_metrics"
+    TOPIC_RFID_NODE_STATUS = "ts/gui/rfid_controller/node_status"
+    TOPIC_ALARM_NODE_STATUS = "ts/gui/alarm_controller/node_status"
     
     # MQTT Clients IDs
     MQTT_RFID_PUB = "rfid_publisher"
-    MQTT_GUI_SUB_ALARM = "gui_subcriber"
-    MQTT_GUI_PUB_ALARM = "gui_publisher"
-    MQTT_ALARM_RFID_SUB = "alarm_rfid_subscriber"
-    MQTT_ALARM_GUI_SUB = "alarm_gui_subscriber"
\ No newline at end of file
+    MQTT_GUI_CLIENT = "gui_controller"
+    MQTT_ALARM_CLIENT = "alarm_controller"
\ No newline at end of file
@@ -0,0 +1,67 @@
+import time
+import logging
+import threading
+
+class StartupTimeline:
+    """
+    @brief Records the milestones of the GUI startup relative to a common start time.
+
+    Every milestone is logged with its offset from the start when it is marked, from any
+    thread. Once all expected milestones are marked, the whole timeline is logged once, so
+    the time to the first interactive frame and to each ready subsystem can be compared
+    between runs.
+    """
+
+    def __init__(self, name="StartupTimeline", started=None):
+        """
+        @brief Initializes the StartupTimeline class.
+        @param name The name used in the log messages.
+        @param started The time.monotonic() value of the start. Default is now.
+        """
+        self.name = name
+        self.started = time.monotonic() if started is None else started
+        self.milestones = {}
+        self.outcomes = {}
+        self.expected = set()
+        self.reported = False
+        self._lock = threading.Lock()
+
+    def expect(self, *milestones):
+        """
+        @brief Declares milestones that must be marked before the timeline is reported.
+        @param milestones The names of the milestones.
+        """
+        with self._lock:
+            self.expected.update(milestones)
+
+    def mark(self, milestone, outcome=None):
+        """
+        @brief Records and logs a milestone, a milestone marked again keeps its first time and is not logged again.
+        @param milestone The name of the milestone.
+        @param outcome Optional outcome shown with the milestone, e.g. "failed".
+        @return The offset from the start in milliseconds.
+        """
+        offset_ms = (time.monotonic() - self.started) * 1000
+        with self._lock:
+            if milestone in self.milestones:
+                return self.milestones[milestone]
+            self.milestones[milestone] = offset_ms
+            if outcome is not None:
+                self.outcomes[milestone] = outcome
+            complete = not self.reported and self.expected <= self.milestones.keys()
+            if complete:
+                self.reported = True
+        logging.info(f"{self.name}::{milestone}{f' ({outcome})' if outcome else ''} after {offset_ms:.1f} ms")
+        if complete:
+            logging.info(f"{self.name}::Startup complete (ms): {self.report()}")
+        return offset_ms
+
+    def report(self):
+        """
+        @brief Returns the timeline.
+        @return A dictionary mapping each milestone, with its outcome if any, to its offset in milliseconds,
+                in the order they were marked.
+        """
+        with self._lock:
+            return {f"{milestone} ({self.outcomes[milestone]})" if milestone in self.outcomes else milestone: round(offset_ms, 1)
+                    for milestone, offset_ms in sorted(self.milestones.items(), key=lambda item: item[1])}
@@ -23,4 +23,58 @@ class AdminAction(Enum):
     @brief Enumeration for different admin actions.
     """
     #Can be incremented in the future
-    DEACTIVATE = "deactivate"
\ No newline at end of file
+    DEACTIVATE = "deactivate"
+
+class ReaderMode(Enum):
+    """
+    @enum ReaderMode
+    @brief Enumeration for the operating modes of the RFID reader.
+    """
+    ACTIVE = "active"        # Full power, continuous reading
+    PRESENCE = "presence"    # Low power, low duty cycle while the room is empty
+
+class ReaderHealth(Enum):
+    """
+    @enum ReaderHealth
+    @brief Enumeration for the health states of the RFID reader.
+    """
+    OK = "ok"                # Reading without recent errors
+    DEGRADED = "degraded"    # Reading, but errors occurred within the error rate window
+    DOWN = "down"            # Reader unavailable, the gate is blind
+
+class NodeState(Enum):
+    """
+    @enum NodeState
+    @brief Enumeration for the liveness of a node, published as retained message and Last Will.
+    """
+    ONLINE = "online"      # Connected to the broker
+    OFFLINE = "offline"    # Disconnected, or the broker lost the connection (Last Will)
+
+class AlarmState(Enum):
+    """
+    @enum AlarmState
+    @brief Enumeration for the states of the alarm.
+    """
+    IDLE = "IDLE"                    # Armed, relay off
+    TRIGGERED = "TRIGGERED"          # Relay on
+    ACKNOWLEDGED = "ACKNOWLEDGED"    # Relay off, the tags of the incident are still at the gate
+    COOLDOWN = "COOLDOWN"            # Relay off, waiting to re-arm
+
+class SubsystemState(Enum):
+    """
+    @enum SubsystemState
+    @brief Enumeration for the readiness of a GUI subsystem during the staged startup.
+    """
+    STARTING = "starting"    # Being brought up by its loader, or waiting for the broker
+    READY = "ready"          # Usable
+    FAILED = "failed"        # Could not be started, retried if the subsystem supports it
+
+class Severity(Enum):
+    """
+    @enum Severity
+    @brief Enumeration for the severity levels of the GUI notifications, in ascending order.
+    """
+    INFO = "info"          # Confirmation, dismissed automatically
+    WARNING = "warning"    # Rejected input, e.g. an unknown card
+    ERROR = "error"        # A failed action
+    ALARM = "alarm"        # The alarm was triggered, stays until dismissed or the alarm is reset
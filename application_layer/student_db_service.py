@@ -1,6 +1,10 @@
 import logging
+from collections import namedtuple
 from data_access_layer.student_dao import StudentDao
 
+## The identifying columns of a student, kept by the ValidationIndex of the GUI.
+StudentRecord = namedtuple("StudentRecord", ["student_id", "name", "mat_number", "nfc_uid"])
+
 class StudentDBService:
     def __init__(self):
         """
@@ -36,6 +40,36 @@ class StudentDBService:
         logging.info("StudentDBService::Retrieved all matriculation numbers")
         return mat_numbers
 
+    def get_students_after_id(self, last_id=0):
+        """
+        @brief Retrieves the students added after a given ID.
+        @param last_id The highest student ID already known, 0 for all students.
+        @return A list of StudentRecords ordered by ID.
+        """
+        students = [StudentRecord(*row) for row in self.student_dao.get_students_after_id(last_id)]
+        logging.info(f"StudentDBService::Retrieved {len(students)} students after ID {last_id}")
+        return students
+
+    def get_student_by_nfc_uid(self, nfc_uid):
+        """
+        @brief Retrieves the student of an NFC card.
+        @param nfc_uid The NFC UID of the student.
+        @return The StudentRecord, None if no student has this card.
+        """
+        student = self.student_dao.get_student_by_nfc_uid(nfc_uid)
+        logging.info(f"StudentDBService::Retrieved student by NFC UID {nfc_uid}")
+        return StudentRecord(*student) if student is not None else None
+
+    def get_student_by_id(self, student_id):
+        """
+        @brief Retrieves a student by their ID.
+        @param student_id The ID of the student.
+        @return The StudentRecord, None if the student does not exist.
+        """
+        student = self.student_dao.get_student_by_id(student_id)
+        logging.info(f"StudentDBService::Retrieved student by ID {student_id}")
+        return StudentRecord(*student) if student is not None else None
+
     def get_name_from_nfc_uid(self, nfc_uid):
         """
         @brief Retrieves the name of a student based on their NFC UID.
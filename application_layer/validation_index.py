@@ -0,0 +1,269 @@
+import time
+import logging
+import threading
+
+class ValidationIndex:
+    """
+    @brief Local index of the students and devices, used by the GUI to validate scans without a database query.
+
+    Students are indexed by NFC UID and devices by QR code. A scan that is not in the index
+    is rejected at once. The index is kept up to date in the background:
+    - refresh() adds the students and devices created since the last refresh and updates the
+      borrow states, which is cheap enough to run whenever the user starts an action;
+    - refresh(full=True) reloads everything and also picks up edited and deleted rows.
+    Lookups compare the keys case-insensitively and without surrounding whitespace, like the
+    default collation of the database. A scan missing from the index is looked up in the
+    database before it is rejected, so a card or QR code assigned since the last refresh is
+    accepted at once. Edits and deletions of indexed rows are caught when the action is
+    confirmed, see check_student() and check_device().
+    """
+
+    def __init__(self, student_db_service, device_db_service):
+        """
+        @brief Initializes the ValidationIndex class.
+        @param student_db_service The StudentDBService used by the index only, as refreshes run on their own thread.
+        @param device_db_service The DeviceDBService used by the index only.
+        """
+        self.student_db_service = student_db_service
+        self.device_db_service = device_db_service
+        self.students_by_uid = {}
+        self.students_by_id = {}
+        self.devices_by_qr = {}
+        self.devices_by_id = {}
+        self.matriculation_numbers = set()
+        self.device_names = set()
+        self.last_student_id = 0
+        self.last_device_id = 0
+        self.local_borrow_states = {}
+        self.stats = {"refreshes": 0, "full_refreshes": 0, "refresh_errors": 0, "hits": 0, "fallback_hits": 0, "rejects": 0}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    @staticmethod
+    def _key(value):
+        """
+        @brief Normalises a scanned UID or QR code for the lookup.
+        @param value The scanned value.
+        @return The key, None for an empty value.
+        """
+        if value is None:
+            return None
+        return str(value).strip().casefold() or None
+
+    def refresh(self, full=False):
+        """
+        @brief Loads the changes of the database into the index.
+        @details Blocks on the database, call it from a background thread or use request_refresh().
+        @param full True to reload all rows, False to only add new rows and update the borrow states.
+        @return A dictionary with the number of new students, new devices and changed borrow states.
+        """
+        with self._refresh_lock:
+            started = time.monotonic()
+            students = self.student_db_service.get_students_after_id(0 if full else self.last_student_id)
+            devices = self.device_db_service.get_devices_after_id(0 if full else self.last_device_id)
+            borrow_states = {} if full else self.device_db_service.get_borrow_states()
+
+            with self._lock:
+                if full:
+                    self.students_by_uid, self.students_by_id, self.matriculation_numbers = {}, {}, set()
+                    self.devices_by_qr, self.devices_by_id, self.device_names = {}, {}, set()
+                    self.last_student_id = self.last_device_id = 0
+                for student in students:
+                    self._add_student(student)
+                for device in devices:
+                    self._add_device(device)
+                changed = 0
+                for device_id, is_borrowed in borrow_states.items():
+                    device = self.devices_by_id.get(device_id)
+                    if device is not None and device.is_borrowed != is_borrowed:
+                        self._add_device(device._replace(is_borrowed=is_borrowed))
+                        changed += 1
+                # A borrow or return of the GUI after the queries started is newer than their result
+                for device_id, (changed_at, is_borrowed) in list(self.local_borrow_states.items()):
+                    device = self.devices_by_id.get(device_id)
+                    if changed_at < started:
+                        del self.local_borrow_states[device_id]
+                    elif device is not None:
+                        self._add_device(device._replace(is_borrowed=is_borrowed))
+                # The rows are ordered by ID
+                if students:
+                    self.last_student_id = max(self.last_student_id, students[-1].student_id)
+                if devices:
+                    self.last_device_id = max(self.last_device_id, devices[-1].device_id)
+                self.stats["full_refreshes" if full else "refreshes"] += 1
+
+        result = {"students": len(students), "devices": len(devices), "borrow_states": changed}
+        logging.info(f"ValidationIndex::{'Full refresh' if full else 'Refresh'} in "
+                     f"{(time.monotonic() - started) * 1000:.1f} ms: {result}")
+        return result
+
+    def request_refresh(self, full=False):
+        """
+        @brief Refreshes the index on a background thread, unless a refresh is already running.
+        @param full True to reload all rows, see refresh().
+        @return True if a refresh was started, otherwise False.
+        """
+        if self._refresh_lock.locked():
+            return False
+        threading.Thread(target=self._refresh_in_background, args=(full,), name="ValidationIndexRefresh", daemon=True).start()
+        return True
+
+    def _refresh_in_background(self, full):
+        """
+        @brief Runs refresh() and logs its errors, the index keeps its content if the database is unavailable.
+        @param full True to reload all rows.
+        """
+        try:
+            self.refresh(full)
+        except Exception as e:
+            self.stats["refresh_errors"] += 1
+            logging.error(f"ValidationIndex::Refresh failed: {e}")
+
+    def _add_student(self, student):
+        """
+        @brief Adds or replaces a student, the caller holds the lock.
+        @param student The StudentRecord.
+        """
+        previous = self.students_by_id.get(student.student_id)
+        if previous is not None and self._key(previous.nfc_uid) != self._key(student.nfc_uid):
+            self._drop_uid(previous.nfc_uid, student.student_id)  # The card was re-assigned
+        self.students_by_id[student.student_id] = student
+        key = self._key(student.nfc_uid)
+        if key is not None:
+            self.students_by_uid[key] = student
+        self.matriculation_numbers.add(student.mat_number)
+
+    def _add_device(self, device):
+        """
+        @brief Adds or replaces a device, the caller holds the lock.
+        @param device The DeviceQRRecord.
+        """
+        previous = self.devices_by_id.get(device.device_id)
+        if previous is not None and self._key(previous.qr_code) != self._key(device.qr_code):
+            self._drop_qr_code(previous.qr_code, device.device_id)  # The QR code was edited
+        key = self._key(device.qr_code)
+        if key is not None:
+            self.devices_by_qr[key] = device
+        self.devices_by_id[device.device_id] = device
+        self.device_names.add(device.name)
+
+    def _drop_uid(self, nfc_uid, student_id):
+        """
+        @brief Removes a card from the index if it still points to the student, the caller holds the lock.
+        @param nfc_uid The UID of the card.
+        @param student_id The ID of the student the card belonged to.
+        """
+        key = self._key(nfc_uid)
+        student = self.students_by_uid.get(key)
+        if student is not None and student.student_id == student_id:
+            del self.students_by_uid[key]
+
+    def _drop_qr_code(self, qr_code, device_id):
+        """
+        @brief Removes a QR code from the index if it still points to the device, the caller holds the lock.
+        @param qr_code The QR code.
+        @param device_id The ID of the device the QR code belonged to.
+        """
+        key = self._key(qr_code)
+        device = self.devices_by_qr.get(key)
+        if device is not None and device.device_id == device_id:
+            del self.devices_by_qr[key]
+
+    def student_for_uid(self, nfc_uid, student_db_service=None):
+        """
+        @brief Looks up the student of a scanned NFC card.
+        @param nfc_uid The UID of the card.
+        @param student_db_service The StudentDBService of the calling thread, used for a card missing from the index.
+        @return The StudentRecord, None if the card is unknown.
+        """
+        with self._lock:
+            student = self.students_by_uid.get(self._key(nfc_uid))
+        if student is None and student_db_service is not None and self._key(nfc_uid) is not None:
+            student = student_db_service.get_student_by_nfc_uid(nfc_uid)
+            if student is not None:
+                with self._lock:
+                    self._add_student(student)
+                self.stats["fallback_hits"] += 1
+                return student
+        self.stats["hits" if student is not None else "rejects"] += 1
+        return student
+
+    def device_for_qr_code(self, qr_code, device_db_service=None):
+        """
+        @brief Looks up the device of a scanned QR code.
+        @param qr_code The scanned QR code.
+        @param device_db_service The DeviceDBService of the calling thread, used for a QR code missing from the index.
+        @return The DeviceQRRecord with the last known borrow status, None if the QR code is unknown.
+        """
+        with self._lock:
+            device = self.devices_by_qr.get(self._key(qr_code))
+        if device is None and device_db_service is not None and self._key(qr_code) is not None:
+            device = device_db_service.get_device_by_qr_code(qr_code)
+            if device is not None:
+                with self._lock:
+                    self._add_device(device)
+                self.stats["fallback_hits"] += 1
+                return device
+        self.stats["hits" if device is not None else "rejects"] += 1
+        return device
+
+    def check_student(self, student_id, nfc_uid, student_db_service):
+        """
+        @brief Confirms in the database that a card still belongs to the student found in the index.
+        @details Called once per confirmed action, the index forgets a card that was re-assigned
+                 or whose student was deleted.
+        @param student_id The ID of the student found for the card.
+        @param nfc_uid The UID of the scanned card.
+        @param student_db_service The StudentDBService of the calling thread.
+        @return The current StudentRecord, None if the card no longer belongs to the student.
+        """
+        student = student_db_service.get_student_by_id(student_id)
+        if student is not None and self._key(student.nfc_uid) == self._key(nfc_uid):
+            with self._lock:
+                self._add_student(student)
+            return student
+        with self._lock:
+            self._drop_uid(nfc_uid, student_id)
+        logging.info(f"ValidationIndex::Card {nfc_uid} no longer belongs to student {student_id}")
+        return None
+
+    def check_device(self, device_id, device_db_service):
+        """
+        @brief Reads the current state of a device found in the index from the database.
+        @details Called once per confirmed action, the index is updated with the result and
+                 forgets a deleted device.
+        @param device_id The ID of the device.
+        @param device_db_service The DeviceDBService of the calling thread.
+        @return The current DeviceQRRecord, None if the device was deleted.
+        """
+        device = device_db_service.get_device_by_id(device_id)
+        with self._lock:
+            if device is not None:
+                self._add_device(device)
+            else:
+                previous = self.devices_by_id.pop(device_id, None)
+                if previous is not None:
+                    self._drop_qr_code(previous.qr_code, device_id)
+                logging.info(f"ValidationIndex::Device {device_id} was deleted")
+        return device
+
+    def set_borrowed(self, device_id, is_borrowed):
+        """
+        @brief Updates the borrow status of a device after the GUI borrowed or returned it.
+        @param device_id The ID of the device.
+        @param is_borrowed True if the device is borrowed now.
+        """
+        with self._lock:
+            self.local_borrow_states[device_id] = (time.monotonic(), is_borrowed)
+            device = self.devices_by_id.get(device_id)
+            if device is not None:
+                self._add_device(device._replace(is_borrowed=is_borrowed))
+
+    def get_stats(self):
+        """
+        @brief Returns the size and the counters of the index.
+        @return A dictionary with the number of indexed students, cards and devices and the counters.
+        """
+        with self._lock:
+            return {"students": len(self.matriculation_numbers), "cards": len(self.students_by_uid),
+                    "devices": len(self.devices_by_id), **self.stats}
@@ -0,0 +1,20 @@
+import asyncio
+import argparse
+import logging_config
+from application_layer.local_broker import LocalBroker
+
+############################## Setup Logger #############################
+logging_config.setup_logging()
+#########################################################################
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local MQTT broker for running all nodes on one machine")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=1883, help="port to listen on")
+    args = parser.parse_args()
+
+    broker = LocalBroker(args.host, args.port)
+    try:
+        asyncio.run(broker.serve_forever())
+    except KeyboardInterrupt:
+        pass
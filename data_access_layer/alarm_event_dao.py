@@ -0,0 +1,139 @@
+import mysql.connector
+import logging
+from data_layer.config import DATABASE_CONFIG
+
+class AlarmEventDao:
+    """
+    @class AlarmEventDao
+    @brief Data Access Object (DAO) class for interacting with the alarm_events table in the database.
+
+    This class provides methods to create the table, insert batches of events and run the report queries.
+    """
+
+    def __init__(self):
+        """
+        @brief Constructor for AlarmEventDao.
+
+        Initializes the database connection and cursor.
+        """
+        self.conn = mysql.connector.connect(**DATABASE_CONFIG)
+        self.cursor = self.conn.cursor()
+
+    def __del__(self):
+        """
+        @brief Destructor for AlarmEventDao.
+
+        Closes the database cursor and connection when the instance is destroyed.
+        """
+        self.cursor.close()
+        self.conn.close()
+
+    def create_table(self):
+        """
+        @brief Creates the alarm_events table and its indexes if they do not exist.
+        """
+        self.cursor.execute(
+            "CREATE TABLE IF NOT EXISTS alarm_events ("
+            " id INT AUTO_INCREMENT PRIMARY KEY,"
+            " created_at DATETIME(3) NOT NULL,"
+            " state VARCHAR(16) NOT NULL,"
+            " cause VARCHAR(32),"
+            " tag_nr VARCHAR(64),"
+            " device_id INT,"
+            " gate_id VARCHAR(64),"
+            " deactivated_by VARCHAR(64),"
+            " latency_ms DOUBLE,"
+            " INDEX idx_alarm_events_created_at (created_at),"
+            " INDEX idx_alarm_events_gate_created_at (gate_id, created_at),"
+            " INDEX idx_alarm_events_device_created_at (device_id, created_at),"
+            " INDEX idx_alarm_events_tag_nr (tag_nr)"
+            ")"
+        )
+        self.conn.commit()
+        logging.info("AlarmEventDao::Created alarm_events table")
+
+    def add_events(self, events):
+        """
+        @brief Inserts a batch of alarm events in one statement.
+
+        @param events A list of tuples (created_at, state, cause, tag_nr, device_id, gate_id, deactivated_by, latency_ms).
+        """
+        self.cursor.executemany(
+            "INSERT INTO alarm_events (created_at, state, cause, tag_nr, device_id, gate_id, deactivated_by, latency_ms) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
+            events
+        )
+        self.conn.commit()
+        logging.info(f"AlarmEventDao::Added {len(events)} alarm events")
+
+    def get_events(self, start, end):
+        """
+        @brief Retrieves the alarm events of a time range.
+
+        @param start The start of the range (inclusive).
+        @param end The end of the range (exclusive).
+        @return A list of tuples, each representing an alarm event record.
+        """
+        self.cursor.execute(
+            "SELECT * FROM alarm_events WHERE created_at >= %s AND created_at < %s ORDER BY created_at",
+            (start, end)
+        )
+        events = self.cursor.fetchall()
+        self.conn.commit()
+        logging.info(f"AlarmEventDao::Retrieved alarm events between {start} and {end}")
+        return events
+
+    def get_events_by_tag_number(self, tag_number, limit):
+        """
+        @brief Retrieves the most recent alarm events of a tag.
+
+        @param tag_number The tag number of the device.
+        @param limit The maximum number of events.
+        @return A list of tuples, each representing an alarm event record, newest first.
+        """
+        self.cursor.execute(
+            "SELECT * FROM alarm_events WHERE tag_nr = %s ORDER BY created_at DESC LIMIT %s",
+            (tag_number, limit)
+        )
+        events = self.cursor.fetchall()
+        self.conn.commit()
+        logging.info(f"AlarmEventDao::Retrieved alarm events for tag number: {tag_number}")
+        return events
+
+    def count_events_by_gate(self, state, start, end):
+        """
+        @brief Counts the alarm events of a state per gate in a time range.
+
+        @param state The state of the events to count, e.g. TRIGGERED.
+        @param start The start of the range (inclusive).
+        @param end The end of the range (exclusive).
+        @return A list of (gate_id, count) tuples.
+        """
+        self.cursor.execute(
+            "SELECT gate_id, COUNT(*) FROM alarm_events "
+            "WHERE state = %s AND created_at >= %s AND created_at < %s GROUP BY gate_id",
+            (state, start, end)
+        )
+        counts = self.cursor.fetchall()
+        self.conn.commit()
+        logging.info(f"AlarmEventDao::Counted {state} events per gate between {start} and {end}")
+        return counts
+
+    def count_events_by_device(self, state, start, end):
+        """
+        @brief Counts the alarm events of a state per device in a time range.
+
+        @param state The state of the events to count, e.g. TRIGGERED.
+        @param start The start of the range (inclusive).
+        @param end The end of the range (exclusive).
+        @return A list of (device_id, count) tuples.
+        """
+        self.cursor.execute(
+            "SELECT device_id, COUNT(*) FROM alarm_events "
+            "WHERE state = %s AND created_at >= %s AND created_at < %s GROUP BY device_id",
+            (state, start, end)
+        )
+        counts = self.cursor.fetchall()
+        self.conn.commit()
+        logging.info(f"AlarmEventDao::Counted {state} events per device between {start} and {end}")
+        return counts
@@ -56,6 +56,57 @@ class DeviceDao:
         logging.info("DeviceDao::Retrieved all devices")
         return devices
     
+    def get_devices_after_id(self, last_id=0):
+        """
+        @brief Retrieves the identifying columns and the borrow status of the devices added after a given ID.
+        
+        @param last_id The highest device ID already known, 0 for all devices.
+        @return A list of (id, name, qr_code, is_borrowed) tuples ordered by ID.
+        """
+        self.cursor.execute("SELECT id, name, qr_code, is_borrowed FROM devices WHERE id > %s ORDER BY id", (last_id,))
+        devices = self.cursor.fetchall()
+        self.conn.commit()  # End the read snapshot so the next call sees new devices
+        logging.info(f"DeviceDao::Retrieved {len(devices)} devices after ID {last_id}")
+        return devices
+
+    def get_borrow_states(self):
+        """
+        @brief Retrieves the borrow status of all devices.
+        
+        @return A list of (id, is_borrowed) tuples.
+        """
+        self.cursor.execute("SELECT id, is_borrowed FROM devices")
+        states = self.cursor.fetchall()
+        self.conn.commit()  # End the read snapshot so the next call sees new borrows and returns
+        logging.info("DeviceDao::Retrieved the borrow states of all devices")
+        return states
+    
+    def get_device_by_qr_code(self, qr_code):
+        """
+        @brief Retrieves the identifying columns and the borrow status of the device with the given QR code.
+        
+        @param qr_code The QR code of the device.
+        @return A tuple (id, name, qr_code, is_borrowed) if found, otherwise None.
+        """
+        self.cursor.execute("SELECT id, name, qr_code, is_borrowed FROM devices WHERE qr_code = %s", (qr_code,))
+        device = self.cursor.fetchone()
+        self.conn.commit()  # End the read snapshot so the next call sees new and edited devices
+        logging.info(f"DeviceDao::Retrieved device by QR code {qr_code}: {device is not None}")
+        return device
+
+    def get_device_by_id(self, device_id):
+        """
+        @brief Retrieves the identifying columns and the borrow status of a device by its ID.
+        
+        @param device_id The ID of the device.
+        @return A tuple (id, name, qr_code, is_borrowed) if found, otherwise None.
+        """
+        self.cursor.execute("SELECT id, name, qr_code, is_borrowed FROM devices WHERE id = %s", (device_id,))
+        device = self.cursor.fetchone()
+        self.conn.commit()  # End the read snapshot so the next call sees new borrows and deleted devices
+        logging.info(f"DeviceDao::Retrieved device by ID {device_id}: {device is not None}")
+        return device
+
     def get_device_name_from_qr_code(self, qr_code):
         """
         @brief Retrieves the device name associated with the given QR code.
@@ -84,6 +135,7 @@ class DeviceDao:
             (tag_number,)
         )
         result = self.cursor.fetchone()
+        self.conn.commit()  # End the read snapshot so the next call sees new borrows and returns
         if result is not None:
             logging.info(f"DeviceDao::Retrieved borrow status for tag number: {tag_number}")
             return result[0]  # Assuming is_borrowed is a boolean or integer (1 or 0)
@@ -91,6 +143,52 @@ class DeviceDao:
             logging.warning(f"DeviceDao::No item found with tag number: {tag_number}")
             return None
         
+    def get_unborrowed_tag_numbers(self):
+        """
+        @brief Retrieves the tag numbers of all devices that are currently not borrowed.
+        
+        @return A list of tag numbers.
+        """
+        self.cursor.execute("SELECT tag_nr FROM devices WHERE is_borrowed = 0 AND tag_nr IS NOT NULL")
+        tag_numbers = [tag_nr[0] for tag_nr in self.cursor.fetchall()]
+        self.conn.commit()  # End the read snapshot so the next call sees new borrows and returns
+        logging.info(f"DeviceDao::Retrieved {len(tag_numbers)} unborrowed tag numbers")
+        return tag_numbers
+
+    def get_returned_at_type(self):
+        """
+        @brief Retrieves the type of the returned_at column, added by data_layer/migrations/001_devices_returned_at.sql.
+        
+        @return The lower-case data type of the column, e.g. "datetime", None if the column does not exist.
+        """
+        self.cursor.execute(
+            "SELECT DATA_TYPE FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'devices' AND COLUMN_NAME = 'returned_at'"
+        )
+        result = self.cursor.fetchone()
+        self.conn.commit()
+        logging.info(f"DeviceDao::Type of the returned_at column: {result}")
+        return result[0].lower() if result is not None else None
+
+    def get_device_record_by_tag_number(self, tag_number):
+        """
+        @brief Retrieves the ID, the borrowed status and the time of the last return of a device based on its tag number.
+        
+        @param tag_number The tag number of the device.
+        @return A tuple (id, is_borrowed, returned_at) if found, otherwise None.
+        """
+        self.cursor.execute(
+            "SELECT id, is_borrowed, returned_at FROM devices WHERE tag_nr = %s", 
+            (tag_number,)
+        )
+        result = self.cursor.fetchone()
+        self.conn.commit()  # End the read snapshot so the next call sees new borrows and returns
+        if result is not None:
+            logging.info(f"DeviceDao::Retrieved device record for tag number: {tag_number}")
+        else:
+            logging.warning(f"DeviceDao::No item found with tag number: {tag_number}")
+        return result
+
     def get_is_borrowed_status_by_device_id(self, device_id):
         """
         @brief Retrieves the borrowed status of a device based on its ID.
@@ -119,7 +217,7 @@ class DeviceDao:
         logging.info(f"DeviceDao::Retrieved device by name: {name}")
         return device
 
-    def update_device(self, device_id, name=None, is_borrowed=None, borrower_id=None, qr_code=None, date=None):
+    def update_device(self, device_id, name=None, is_borrowed=None, borrower_id=None, qr_code=None, date=None, returned_at=None):
         """
         @brief Updates a device's information in the database.
         
@@ -129,6 +227,7 @@ class DeviceDao:
         @param borrower_id The new borrower ID of the device (optional).
         @param qr_code The new QR code of the device (optional).
         @param date The new date associated with the device record (optional).
+        @param returned_at The time of the return (optional).
         """
         query = "UPDATE devices SET "
         params = []
@@ -145,6 +244,9 @@ class DeviceDao:
         if date:
             query += "date = %s, "
             params.append(date)
+        if returned_at:
+            query += "returned_at = %s, "
+            params.append(returned_at)
         if borrower_id:
             query += "borrower_id = %s, "
             params.append(borrower_id)
@@ -65,6 +65,45 @@ class StudentDao:
         logging.info("StudentDao::Retrieved all matriculation numbers")
         return mat_numbers
 
+    def get_students_after_id(self, last_id=0):
+        """
+        @brief Retrieves the identifying columns of the students added after a given ID.
+        
+        @param last_id The highest student ID already known, 0 for all students.
+        @return A list of (id, name, mat_number, nfc_uid) tuples ordered by ID.
+        """
+        self.cursor.execute("SELECT id, name, mat_number, nfc_uid FROM students WHERE id > %s ORDER BY id", (last_id,))
+        students = self.cursor.fetchall()
+        self.conn.commit()  # End the read snapshot so the next call sees new students
+        logging.info(f"StudentDao::Retrieved {len(students)} students after ID {last_id}")
+        return students
+
+    def get_student_by_nfc_uid(self, nfc_uid):
+        """
+        @brief Retrieves the identifying columns of the student with the given NFC UID.
+        
+        @param nfc_uid The NFC UID of the student.
+        @return A tuple (id, name, mat_number, nfc_uid) if found, otherwise None.
+        """
+        self.cursor.execute("SELECT id, name, mat_number, nfc_uid FROM students WHERE nfc_uid = %s", (nfc_uid,))
+        student = self.cursor.fetchone()
+        self.conn.commit()  # End the read snapshot so the next call sees new and edited students
+        logging.info(f"StudentDao::Retrieved student by NFC UID {nfc_uid}: {student is not None}")
+        return student
+
+    def get_student_by_id(self, student_id):
+        """
+        @brief Retrieves the identifying columns of a student by their ID.
+        
+        @param student_id The ID of the student.
+        @return A tuple (id, name, mat_number, nfc_uid) if found, otherwise None.
+        """
+        self.cursor.execute("SELECT id, name, mat_number, nfc_uid FROM students WHERE id = %s", (student_id,))
+        student = self.cursor.fetchone()
+        self.conn.commit()  # End the read snapshot so the next call sees edited and deleted students
+        logging.info(f"StudentDao::Retrieved student by ID {student_id}: {student is not None}")
+        return student
+
     def get_student_by_matriculation_number(self, mat_number):
         """
         @brief Retrieves a student by their matriculation number.
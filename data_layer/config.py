@@ -12,5 +12,18 @@ DATABASE_CONFIG = {
     'database': config['DATABASE']['Database']
 }
 
+# Accessing the MQTT broker configuration, e.g. 127.0.0.1 for the local broker (broker_interface.py)
+MQTT_CONFIG = {
+    'address': config.get('MQTT', 'BrokerAddress', fallback='172.16.2.160'),
+    'port': config.getint('MQTT', 'Port', fallback=1883)
+}
+
+# Accessing the alarm worker configuration, Workers is a comma-separated list of worker IDs
+ALARM_CONFIG = {
+    'worker_id': config.get('ALARM', 'WorkerId', fallback='alarm_controller'),
+    'workers': [worker.strip() for worker in config.get('ALARM', 'Workers', fallback='').split(',') if worker.strip()],
+    'virtual_nodes': config.getint('ALARM', 'VirtualNodes', fallback=256)
+}
+
 # If you need to access other configuration like Admin Password Hash
 ADMIN_PASSWORD = config['DEFAULT']['AdminPassword']
@@ -0,0 +1,6 @@
+-- Adds the time of the last return of a device, used by the GracePeriod rule of the alarm
+-- controller (data_layer/alarm_rules.ini). The date column keeps the date of the borrow.
+-- Apply once before starting the services of this version:
+--   mysql -u <user> -p tracking_system < data_layer/migrations/001_devices_returned_at.sql
+
+ALTER TABLE devices ADD COLUMN returned_at DATETIME NULL AFTER date;
@@ -0,0 +1,35 @@
+import json
+import argparse
+import logging
+import logging_config
+from application_layer.alarm_pi.alarm_config import AlarmConfig
+from application_layer.load_generator import LoadGenerator, generate_population, save_population
+
+############################## Setup Logger #############################
+logging_config.setup_logging()
+#########################################################################
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sends simulated tag reads to the alarm controller and reports its throughput")
+    parser.add_argument("--gates", type=int, default=1, help="number of simulated gates")
+    parser.add_argument("--rate", type=float, default=100, help="total tag reads per second")
+    parser.add_argument("--duration", type=float, default=10, help="duration of the load in seconds")
+    parser.add_argument("--population", type=int, default=1000, help="number of tagged devices")
+    parser.add_argument("--borrowed", type=float, default=0.9, help="share of borrowed devices")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the population and of the tag selection")
+    parser.add_argument("--codec", choices=["json", "binary"], default=None, help="codec of the tag reads")
+    parser.add_argument("--qos", type=int, choices=[0, 1, 2], default=None, help="QoS of the tag reads")
+    parser.add_argument("--population-file", default=AlarmConfig.POPULATION_FILE,
+                        help="population file read by the alarm controller when DEVICE_SOURCE is \"population\"")
+    parser.add_argument("--report", default="load_report.json", help="path of the JSON report")
+    args = parser.parse_args()
+
+    population = generate_population(args.population, args.borrowed, args.seed)
+    save_population(args.population_file, population, args.seed, args.borrowed)
+
+    generator = LoadGenerator(population, args.gates, args.rate, args.duration, args.seed, args.codec, args.qos)
+    report = generator.run()
+    with open(args.report, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+    logging.info(f"LoadGenerator::Report written to {args.report}")
+    print(json.dumps(report, indent=2))
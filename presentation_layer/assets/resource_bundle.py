@@ -0,0 +1,25 @@
+import os
+import logging
+from PyQt6.QtCore import QResource
+
+RESOURCE_BUNDLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ressources.rcc")
+"""
+@brief The binary resource bundle built from ressources.qrc by ui_to_py.sh, providing the images under :/imgs.
+"""
+
+_registered_bundles = set()
+
+def register_resources(path=RESOURCE_BUNDLE):
+    """
+    @brief Registers a binary resource bundle, once per path.
+    @details Qt maps the file into memory instead of holding the images as Python bytes. An
+             image is only decoded when a widget showing it is laid out or painted.
+    @param path The path of the .rcc file.
+    @throws FileNotFoundError If the bundle does not exist or is not a valid resource file.
+    """
+    if path in _registered_bundles:
+        return
+    if not QResource.registerResource(path):
+        raise FileNotFoundError(f"Could not register the resource bundle {path}, build it with ui_to_py.sh")
+    _registered_bundles.add(path)
+    logging.info(f"ResourceBundle::Registered {path}")
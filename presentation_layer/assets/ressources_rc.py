@@ -1,13656 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x4f\xfb\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\xda\x00\x00\x00\xa9\x08\x06\x00\x00\x00\x8c\x25\xfc\x74\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x4f\x90\x49\x44\x41\x54\x78\x5e\xed\xbd\xf9\x93\
-\x1c\xc9\x75\xe7\xe9\x11\x91\x99\x55\x85\x1b\x68\xdc\x8d\x46\x77\
-\xb3\xc9\x6e\x1e\xdd\x14\x0f\x89\x12\xc5\x11\x25\xcd\xb1\x6b\x3b\
-\x66\x6b\xb6\x66\xf3\xc3\xfc\x3b\xfa\xb3\x66\xcd\xc6\x4c\x1a\x72\
-\xb5\x33\x1a\x51\x43\x91\xcb\xab\x9b\xdd\x8d\xbe\x70\xdf\x40\x15\
-\x2a\x2b\x33\x23\x62\xbf\x9f\x17\x11\x59\x91\x59\x79\x44\x56\x55\
-\x02\x55\xc0\xfb\x20\x1d\x79\x54\x44\x3c\x3f\x9e\xbf\xe7\xee\xe1\
-\xee\x11\x9d\xbc\xf2\x66\x1e\x1c\xc7\x71\x1c\xc7\x59\x0a\x71\xf9\
-\xee\x38\x8e\xe3\x38\xce\x12\x70\x47\xeb\x38\x8e\xe3\x38\x4b\xc4\
-\x1d\xad\xe3\x38\x8e\xe3\x2c\x11\x77\xb4\x8e\xe3\x38\x8e\xb3\x44\
-\xdc\xd1\x3a\x8e\xe3\x38\xce\x12\x71\x47\xeb\x38\x8e\xe3\x38\x4b\
-\xc4\x1d\xad\xe3\x38\x8e\xe3\x2c\x11\x77\xb4\x8e\xe3\x38\x8e\xb3\
-\x44\xdc\xd1\x3a\x8e\xe3\x38\xce\x12\x71\x47\xeb\x38\x8e\xe3\x38\
-\x4b\xc4\x1d\xad\xe3\x38\x8e\xe3\x2c\x11\x77\xb4\x8e\xe3\x38\x8e\
-\xb3\x44\xdc\xd1\x3a\x8e\xe3\x38\xce\x12\x71\x47\xeb\x38\x8e\xe3\
-\x38\x4b\xc4\x1d\xad\xe3\x38\x8e\xe3\x2c\x91\xe7\xf6\x3c\xda\xd6\
-\xb7\x42\xc8\xd3\x09\xa2\x66\x49\xdf\x8c\xec\x2d\xeb\x65\x21\x74\
-\xa3\x90\x77\xf5\xa5\x57\xfc\xe6\xcc\x27\x7e\x2d\x0a\xad\xb7\x94\
-\xc5\x89\x32\x39\x4e\x43\xf6\x40\x9f\x1f\x2b\x3f\x6f\x27\xe5\x11\
-\x8e\xf3\xe2\x69\x7d\x2d\x0a\xd1\xf9\x3c\xe4\x03\x85\xf5\x2c\xe4\
-\x0f\xa5\xa3\x0f\xd4\x07\xe8\x7b\x5d\x3f\xcc\xb4\x3f\x88\x43\xb6\
-\x95\x96\xdf\x6a\xc8\x0f\xa4\x9f\xbc\x5a\x7d\xbc\xe7\xe6\x68\x8f\
-\xfc\xa7\x4e\x18\xdc\xdd\x9a\xec\x6c\x61\xd2\xcf\xf6\x9b\xfe\x2b\
-\x5e\xc5\x7f\x0a\xd9\x57\x2a\xa4\x3c\x0f\xd9\x4d\xef\x90\x4f\x23\
-\x3e\x1b\x85\xce\xf7\x92\x90\xcb\xc1\xe6\x5d\x19\xaf\xbe\xf2\xab\
-\x2b\x67\xbb\xa5\xcf\x38\xda\xfb\xad\xf2\x48\xc7\x79\x71\xac\xfd\
-\x6f\xd2\xc3\x56\x26\xdd\x54\x40\x37\x65\x98\xf9\x9c\x3f\x56\xc3\
-\xfa\xcb\x4e\x79\x94\x73\x18\x39\xf2\x7f\xae\x84\x74\xa3\x37\xe2\
-\x6c\x69\x4c\xa5\x0f\xfa\x21\xff\xe3\x6a\xf9\xcb\xab\xc1\x73\xf3\
-\x54\x71\x2b\x0e\xad\x73\x2b\x21\x4a\xa6\xb4\x52\xf9\xb9\x1e\x8c\
-\xca\xc3\xea\xa7\xd2\xc9\xe2\x60\xa3\xcb\x69\x88\x2e\xa5\x21\xf9\
-\x5e\x2f\x44\x17\x26\xb4\x98\x9c\xd0\x7e\xbb\x15\xe2\x93\x71\x88\
-\x57\x93\x10\xb5\x8a\x0c\xc5\xd9\xe6\xfd\x2c\x84\xce\xc0\xbe\x3b\
-\xce\x8b\xa4\xf5\x96\xf4\xf3\xb8\x4c\x50\x47\x21\x29\x4c\x91\xe9\
-\x68\x4f\x61\x65\x10\xf2\x35\xaf\xdb\x87\x9d\xb6\x6c\x7e\xbc\x52\
-\x8c\xa0\x55\x4e\x36\x4b\x65\x83\x5e\x31\x9e\x6b\x97\xb0\xee\x6c\
-\xd3\xcd\x39\x95\x88\xb2\xc1\x41\xe0\x98\x89\x65\xe5\xa0\xe5\x6c\
-\xed\x53\xe9\x83\xa3\xf3\x69\x88\xdf\xee\xab\x44\xf9\xe6\x54\x44\
-\x64\x9b\xf2\x2c\x31\x47\x1b\x87\x2c\x53\xcf\xb6\xa7\x3c\x67\x44\
-\x61\xed\xd5\x53\x74\xe7\x00\x22\x1d\xc5\x16\x24\x9d\x24\x24\x6b\
-\xaa\xf0\xaa\xe7\x99\xf4\x33\xc7\x10\xbb\x8a\xbe\x34\xe0\x6c\xb1\
-\x41\xaf\xaa\x93\x85\xe7\xea\x68\x01\x67\x1b\xb5\x95\xe9\x8f\x94\
-\xe9\x5d\xf5\x4c\x55\xd1\x26\x86\x38\xb2\x63\x63\xb5\x76\x63\x55\
-\xc4\xf8\x98\x2a\xe3\x09\x39\x8d\x23\xaa\x90\x78\x5a\xfc\x6a\x86\
-\xb7\x55\x38\x9a\x85\xf8\x3d\xf5\x6e\xcf\x79\x0b\xb8\x62\xb0\x2e\
-\xc7\xaa\xfc\xc9\x36\xa5\xd8\x32\x5e\x49\xbb\x15\xa2\x35\x15\x77\
-\x5b\x99\xd7\x2b\x5a\x98\x8e\xf3\x22\xc9\xd6\xa9\xbf\x7a\xef\x65\
-\xd2\xd3\x81\xaa\xb5\x9c\xae\xea\x77\xb4\x22\x3d\xa5\x9a\xf7\x9f\
-\xbb\x79\x72\x96\x04\xb7\x0c\x5f\x55\x27\x0b\x2f\x54\x93\x07\x0f\
-\xfb\x21\xdd\x98\x33\x8c\x89\x53\x55\x2c\xa9\x84\x51\x12\x5b\xcb\
-\x97\x5e\x71\x72\xa6\x6d\xdf\x0d\x9c\x2e\xe1\x9c\x2a\xeb\x65\xf5\
-\x6e\x9d\x30\xf8\x9d\x8c\xd7\x13\x86\x8a\x53\xf5\x66\x8b\xf6\x88\
-\x35\x58\x30\x62\xb7\xfd\xde\x97\xf3\xe2\xc9\xee\xe6\xa1\xfb\xeb\
-\xbe\x0d\x17\x0f\x7b\xb0\xf4\x72\xd5\x10\x0f\x77\x56\xa4\xc4\x54\
-\x7e\xc7\x39\xfc\x24\xab\x27\x4e\xfd\x5d\xf9\x79\xa9\x74\xde\xdf\
-\x9e\x7c\x93\x3d\x4b\xc3\x40\x3d\x5a\xfb\xdc\x55\x6f\x74\xbd\x3d\
-\x9c\x11\x9b\x3f\xe1\x3d\x2a\xc2\x96\x2a\x5d\xaa\xca\xa6\xde\x6d\
-\x44\x4f\x0c\xbf\xca\x67\x5d\xca\x86\x9b\x4e\xc8\xd9\x96\xd7\xc8\
-\xa9\xa8\x78\x93\x15\xee\xf1\xe8\x98\xad\xd2\x09\xbf\xc2\x0c\x3e\
-\x51\xbe\xd0\x00\xd9\x54\x78\xca\xfd\x11\x65\xd1\xe7\xca\x3c\x9f\
-\xcd\xe9\x1c\x10\xb2\xfb\xaa\xaf\x1b\xea\xed\xa8\xde\x43\xfe\x24\
-\x0a\xd9\x27\xea\xce\x3e\x7b\x7e\xf5\x37\x3a\x95\x87\xf8\x94\x7a\
-\xd3\xaf\xeb\xcb\xf1\x34\xe4\x8f\xdc\x76\xec\x07\xed\xf7\x5a\x85\
-\xdd\x16\xe9\xd3\x81\x85\x8a\xe8\x61\xbb\xfc\xf4\x6a\xf0\xdc\x66\
-\x1d\x1f\xfb\xcf\xdb\xb3\xcc\xfa\xf7\xb6\x42\xf7\xda\x46\xf9\x4d\
-\xdc\x5c\x09\xd1\xe6\xec\xe1\xcc\x68\x4d\x95\xe1\xf5\x38\xb4\xdf\
-\x88\x43\x7c\x4c\x85\xc7\x4d\x48\xd0\x69\x83\x7b\xfd\xd0\xbf\xdb\
-\x55\x2d\xe5\x07\x55\x5c\xde\x3f\x5a\xe3\x8b\xe3\x38\xce\x44\xda\
-\xef\x44\x21\xbe\x24\x3b\xd2\x91\xcd\xc8\xd4\x10\xdd\x1c\xa8\xc1\
-\x3f\x78\xe5\x66\xc4\x2e\x0b\x66\x1d\xc7\x47\x0a\x3b\xbd\x75\x7d\
-\x33\xf4\x6e\xd0\xe2\x2f\x88\x3e\x3d\x52\x7e\x7a\x35\x38\x34\x4d\
-\xb7\x7c\x33\x0a\xe9\xc7\x79\xd8\xfa\x1f\x54\x06\x79\x52\xca\x8f\
-\x7b\xb9\x72\xb8\xed\x73\x1d\xbb\xb7\x33\x74\xb2\x84\x0b\x3d\xfd\
-\xe7\x38\x8e\xb3\x93\x95\x1f\x27\xa1\xf5\x6e\x1c\xa2\x23\x32\x16\
-\x65\x1b\x1f\x27\xfb\x2a\xdf\x47\x74\x96\xc7\xa1\x1b\x23\xc1\xe1\
-\x76\xff\x31\x0d\xe9\x97\xfa\x82\xb3\x2d\x43\xeb\xfc\xca\xb6\x93\
-\x25\x1c\xdf\x9f\x89\x51\xd1\x8a\xc2\xc9\x3c\x44\x27\x8a\x40\xeb\
-\xd7\x29\xf3\xe5\x94\xf2\x84\xbc\x39\xff\x7c\xf2\x66\x58\x16\x65\
-\x79\x1c\xc4\xb2\x18\xd1\x97\xe7\x90\x2f\x43\x79\x95\x2c\x7d\x5f\
-\x96\xbc\x11\x59\xcf\xa9\xcc\x77\x4b\x15\xd7\x49\xf9\xb1\xf2\xc3\
-\x56\x48\xce\xc9\xf4\xb5\xa2\x72\xed\x6e\x66\x73\x45\xd4\x4c\x2f\
-\x8f\xd8\x1f\xea\xba\xc0\x2d\xad\x65\x51\x2f\x97\x65\x96\x7f\x85\
-\xc9\xa3\xee\x1f\x70\x1d\x38\x48\x1c\x9a\xa1\xe3\x49\xac\xfd\xb4\
-\x1d\xe2\x73\xc5\xd0\x04\x4d\x86\xfe\xad\xad\xd0\xbb\xb9\x3d\x3c\
-\x11\xee\xb7\x43\xd8\xc5\xbd\x80\xe4\xb2\xc2\x5b\xba\x60\x47\xad\
-\x5b\x9b\xd9\xac\x17\xcb\x62\xf4\xd9\x32\xcb\xee\x07\xeb\xed\x2b\
-\x55\xd4\xfb\x92\x3f\x67\xb7\xaa\xd5\xff\x23\x09\xe9\x93\x9d\x93\
-\xb4\xb2\x9e\x1a\x0c\x1f\x49\xce\xe3\xe6\x69\x5f\xf9\xdb\x58\xe7\
-\xed\x9c\x40\x96\xad\xab\x35\xfe\x87\xb6\x8c\x46\x11\x97\xf8\xbc\
-\x7a\xfa\xef\xeb\xf7\x09\x3b\xb3\x0c\x3e\x94\x71\xb9\xb7\xf8\x86\
-\x15\xd1\x69\xe5\xcb\xa5\x28\xc4\x27\xf5\x05\xc3\x41\xde\x28\x2f\
-\x18\x76\xb3\xbc\xa9\xf2\xe5\xba\xe2\xc0\xfb\x3e\x6c\x28\x82\x4c\
-\x76\x0e\x0a\x1d\x7d\x6e\x23\x4c\x2f\x5a\x54\x94\x07\xaf\x9a\xcc\
-\xec\xde\xfc\xb2\xd8\x6f\x22\xa9\x75\xa2\xf8\xc5\xa7\x88\x8b\x0c\
-\x0f\x46\xc7\xa2\x59\xbc\x5b\xeb\xaf\x78\xd9\xf7\xec\xcb\x32\x6f\
-\x6e\xed\x2e\x6f\xac\x0c\x2e\x4b\xde\x09\x7d\x29\xf3\xa3\xb8\xbe\
-\xfe\xa3\xa8\x25\xaf\x92\x65\x73\x1e\x1e\x2b\x5f\x0e\xb0\xac\xd5\
-\xff\xa8\xba\xf1\x78\x67\xdd\x18\xdc\x97\xe3\xfb\x43\xf3\x49\x7b\
-\x95\x6e\x46\x8a\x6b\x44\xbd\x25\x9e\x95\x7e\x52\x06\xbc\x77\x15\
-\xdf\x7b\x49\x58\xf9\x93\x8e\x95\x5b\xff\x46\x37\x64\x83\xbc\x98\
-\x20\xa8\x62\xc9\x06\x72\xb8\x0f\x14\x97\x3f\xee\xbc\xed\xb4\xfa\
-\x6f\x15\xcf\xad\x9d\xf1\xec\x7f\xa5\xba\xf8\xf9\x76\x3c\xa3\x33\
-\xd2\xd7\x32\x1e\xe4\x59\x15\x87\xaa\x7e\xd8\x1c\x94\x47\xfa\x7a\
-\x6b\x71\x7b\x57\x61\x69\x55\x88\x2f\x28\xd2\xd4\xc3\x61\x5d\x40\
-\xd6\x58\x99\x70\xcf\x9b\x7a\xb1\xc7\x79\x19\xa6\xe7\xb2\x8b\xf1\
-\x45\x5d\xc7\x74\x9c\xf4\xe8\x5d\xb2\x73\xe9\x82\xe5\xed\x1d\xec\
-\xa1\xf2\xb2\x94\xe5\x43\xc7\xdb\xbc\xf0\xc9\x50\xc6\x7a\x2b\x44\
-\x83\xc5\x8d\x41\xf6\x2c\xb7\x8d\x19\xb8\x5f\xcb\x10\x32\x0c\xee\
-\xd7\x86\x8c\xd1\x38\x5d\xbb\x29\xed\xaf\xe3\x9c\x12\x33\x2e\xa1\
-\xa5\x93\xf3\xe2\x9a\x06\x5f\xb9\x1e\x95\xa6\xf8\x1a\x22\x96\x15\
-\x9d\x4d\x6d\xf8\x29\x5f\xd7\xb1\x59\xed\xf8\x1a\xd1\x8a\xae\xfb\
-\xa6\x9c\x60\x17\xed\x2f\x7f\x14\xe9\x03\x55\x52\xb6\x99\xec\x36\
-\xab\x74\xb1\x5a\xe1\x2b\xdf\xc6\x99\xa2\xdc\xc5\x85\x78\xe7\x3a\
-\xf9\xdd\x48\x95\x6a\x3b\xad\xd1\xd1\x28\xac\x7e\x47\xbd\x7c\x5a\
-\xec\xe5\xb1\x30\xb8\xd3\x0b\xf9\x46\x73\x99\x10\x9f\x89\x42\xe7\
-\x47\x49\x68\x5d\x55\x3e\x1f\xd3\xb5\x39\xb5\x96\x0e\xab\xd4\xbc\
-\xf3\x1f\x99\xa4\x7c\x89\x8e\xe9\xfd\xb4\xde\x39\x76\x63\xf1\xb2\
-\x4d\xae\xc8\x86\x7c\x4f\x32\xdf\x94\x4c\xda\x68\xb5\xe8\xea\x97\
-\xa2\x82\x97\x65\x61\x58\x59\xe8\x07\xc9\x0c\x8f\x25\x6f\x4a\x59\
-\xec\x27\x9d\xef\xc6\xa1\xf5\x4e\x2c\x27\x2b\x07\xab\xf8\xd5\xf3\
-\xc5\xe2\x88\x21\x1a\x7e\x17\xc4\x97\xbc\x51\x08\xa7\x64\x9d\x16\
-\x8c\xe7\xea\xdf\xd4\xca\x80\xa2\x26\xaf\xb9\xbe\x2e\x31\x94\x57\
-\x7c\x2d\x7e\x97\xa1\x8f\x8e\xea\xc3\x69\xc9\xa2\x6d\xd6\x6d\x5e\
-\x0e\xcf\x4b\xd6\xea\x0f\xe8\x1e\xe9\x12\xd2\xd3\x0a\x96\xfe\xa5\
-\x1b\xba\xde\xe3\xf9\x8d\x64\xb6\x19\x5d\xa9\xe9\x66\x60\xbb\xd1\
-\x32\x9e\x06\x9f\x09\xc2\xca\xe8\xb8\xca\x6a\x2d\x0e\xe9\x9d\xbe\
-\x39\xe0\x48\xd1\xcc\xef\xe9\xbf\x67\xaa\x3f\x6a\x18\x46\xdd\x56\
-\xc8\xf5\x79\x9c\xce\xfb\x9d\x10\xaf\xaa\x91\xdb\xa5\x85\x51\x30\
-\xb8\xaf\x6b\xc8\x06\x45\xa5\x8d\x69\x7f\x03\xfb\xa1\x6b\x1c\x2d\
-\x64\x91\x67\x11\x36\x84\x28\x91\x3c\xe2\x41\x83\x65\x4d\x69\x53\
-\xc8\xd7\x17\x2b\x7f\x58\xfd\xeb\x32\xad\x72\xb4\x56\x2e\x5c\xb7\
-\x9a\xaf\x82\x1c\x64\x54\x59\xd9\x96\x7c\xea\x05\xcb\x1e\xf9\x7d\
-\x17\xf5\x10\xda\xdf\x88\x43\xfb\x5b\xd2\x73\x35\xde\xc3\x50\x66\
-\xf9\x5e\xa6\x8f\x1d\x85\x4c\xaf\x4f\x28\x60\xd3\xe4\x6c\x7d\x32\
-\xd4\x36\x87\xda\xd1\xe6\xcf\x54\xd1\x8e\x4a\x01\x4e\x5b\xd5\xb7\
-\x96\x69\xca\xfa\x51\xf6\x46\x06\x36\xb1\x68\x58\xa0\xdc\xb3\x49\
-\xae\xe8\x3a\xe6\x60\xd1\x23\xb5\xce\xba\x03\xab\x28\xd6\x53\xc1\
-\x99\xeb\xfa\x28\x0e\x6b\x7c\xad\x15\xa9\xd6\xb0\x29\x59\xab\x52\
-\x30\x7d\x9e\xb4\xf6\x4f\x87\x77\xbe\xd6\x0a\xc9\x31\xe5\x81\xae\
-\x63\x43\x55\x6c\x43\xa6\x16\xb4\x9d\xdf\xb0\x31\xb0\xf2\x67\x2d\
-\xa5\x97\x78\xe8\x1a\x6c\x59\x27\xc5\xcd\xd8\x1b\x36\x55\x50\xef\
-\xbd\xbe\xee\x10\x47\x4b\x23\x24\x39\x2a\xc3\x51\x3a\x5b\x9c\x2c\
-\xf7\xa0\x22\x9c\x6c\x43\x47\xdb\x7e\x57\x95\xec\xdd\x24\xc4\x34\
-\xf2\x89\x6b\x05\x4b\x32\xf8\x4e\xde\x94\x33\xc2\x59\xff\x6c\x35\
-\x9d\x64\x61\x64\xf4\x35\x3a\xa2\x2f\x14\xc1\xd3\xe6\xe5\x8b\xcc\
-\xd6\xdb\x89\x1c\x6c\x21\x83\xbc\xcf\x55\x16\x55\xa5\xe6\xda\xf1\
-\x9a\x74\x86\x6c\x43\x74\x27\x29\x1a\x31\x76\xb0\xe4\xbe\x86\x61\
-\xd1\x1f\x96\x38\x73\x75\xf5\x3f\xa8\x2c\xcc\xd8\x49\x26\x91\x90\
-\x48\xdb\x93\x5b\x8d\x20\xbb\x21\x43\x54\x6c\x0d\xb8\x74\x46\x06\
-\x3a\xc4\x0a\x34\x0e\x28\x2b\x1d\x16\x29\x9e\xf9\x31\x9d\xd4\xd5\
-\xb9\x73\xd6\x8b\x46\xca\xfb\xd5\xbf\x56\x7a\x6b\x65\x60\xb2\x28\
-\x03\x5d\xc2\xf4\x91\x7c\xa0\x67\xc6\x3a\x75\x76\x5a\x1a\xca\x53\
-\x7e\x70\xd2\x31\xc9\x6d\x30\x1b\xdf\x64\xfd\x8d\x64\xd1\xb8\xd9\
-\x21\x4b\xd7\xaa\xcb\x62\x8e\x04\xef\xc8\x92\x1e\xb0\xf3\x4f\x25\
-\xcb\x1c\x4c\x83\xfc\xc7\x2e\xd8\xce\x41\x3a\xdc\xea\x05\x4e\x96\
-\xcd\x6c\xe4\x80\xe6\x39\xda\xf6\x7b\x49\xe8\x7c\xa0\xe3\x74\x18\
-\x6a\x87\x7c\x6c\x4b\x51\x2f\x89\xab\xf2\x7f\x55\xba\x4b\x39\x1c\
-\x51\xbe\xe8\x3b\xb6\x21\x7d\xda\x57\xbd\x51\xfd\x53\x7d\xcd\x3e\
-\x54\xc3\x55\x8d\xd4\xec\x81\x62\x8e\xb3\x9d\xe0\x64\x01\xa7\x91\
-\x1c\x95\x4e\x2a\xcd\x38\x5b\x9c\x2c\x23\x52\x2c\x41\xc2\xd1\xae\
-\xfe\x7b\xfd\x5d\x8e\xc8\x74\xd5\x22\x53\x9e\x28\x4c\x2e\xea\x09\
-\xc4\x8d\x72\x51\x83\x20\xea\xe8\xfc\x5a\xe3\x78\x16\xe3\x3a\x20\
-\x49\x66\x3f\x48\x8f\x7d\xb6\x7a\x58\xd8\x27\x86\xc4\x63\x96\x48\
-\xb1\x0b\x1c\xe5\x82\xbe\x51\x0f\xe9\x78\x3f\x99\x5f\x26\x75\x3a\
-\x3f\x68\xa9\x2e\x16\x79\x4c\xbd\xb6\xf4\xd1\x28\xd2\xcb\x02\x91\
-\xd1\x25\xad\xee\x9b\x1f\xd5\xf7\x93\xfa\x83\x1a\xf3\xed\xaf\xc9\
-\x26\xb9\xa3\x35\x16\xcb\xf5\x03\x48\xff\x73\x16\xba\x6f\x93\x1c\
-\xaf\x29\xae\xca\x3c\x3f\xb6\x5d\xb8\xd3\x58\xf9\x89\x2a\xfb\x59\
-\x5d\x05\x23\xa2\x90\x6d\x0c\xac\x67\x9c\x6d\x94\x4e\x9b\x8a\xa1\
-\xe3\xcc\x71\x24\xaa\xb4\x72\x5e\xed\xf3\x2b\xa1\x75\x4e\x9a\x2b\
-\x05\xa3\x5e\xd1\x92\x8e\xae\xaa\xf1\x60\x86\x77\x94\xec\x8e\x0c\
-\xc0\x5d\xd3\xca\xd0\x52\xfc\x5a\xa7\xdb\x45\x25\x05\x55\x80\xfc\
-\xf8\xfc\x38\x42\xc4\x6c\x6b\xde\x15\x07\x86\x84\x53\xe2\x57\x4e\
-\xde\x88\x7a\xd3\x8b\x92\x9d\x59\x2a\x27\xbb\x08\x56\xc9\x64\xcc\
-\x22\x46\x79\x10\x2d\x11\xd9\x13\x55\x18\x19\x43\xab\xe4\x04\x25\
-\x97\x2d\x1e\x6d\x8d\xae\x9c\x5f\xfb\xec\xaa\x1a\x14\xaa\x60\xe4\
-\xa5\x30\x03\xa3\xf4\x45\x97\x76\x0e\xbb\x4d\xc2\x64\x7e\xb3\x94\
-\xa9\x6b\xa4\xeb\x2a\x8b\x7b\x3d\x4b\x2b\x69\x1e\x36\x4e\xf4\x9f\
-\xad\xab\x3e\x22\x03\x47\x9e\x5e\x5a\x31\xb9\x56\xe6\xc8\x7c\x4d\
-\x71\x3c\x59\xe6\xf1\x3e\xb3\xf2\x6f\xa4\x2f\x6b\x4a\x9f\x9c\x1a\
-\x71\x1c\x3c\xe9\x4b\x5f\xb6\x42\x26\x07\x61\x79\x2c\x7d\x31\x28\
-\x12\xfd\x3d\x6a\xa9\x11\x77\x24\x09\xed\x0b\xd2\x99\x53\xea\xc1\
-\x61\xfc\x14\x35\x73\xd2\x67\xe6\x97\xfd\xea\x5f\xb7\xad\x81\x65\
-\xd7\xd2\xdb\xe0\xae\xf2\xe3\x61\xaf\x6c\x40\x29\x90\x68\xb2\x5b\
-\x81\x1d\x78\x70\x5c\xad\x13\x0a\x92\x87\x01\xb4\xfc\x50\x41\xc5\
-\x17\x7b\xea\x4d\xcd\xce\x13\x93\xc5\x70\x1f\xb2\x28\xef\xc7\x72\
-\x7c\x92\x45\xda\x70\xda\x23\xb2\xda\xac\xcb\x2e\x65\xa9\x3e\xb0\
-\x0b\x99\xd5\x05\xfe\x3b\x3b\x5f\x56\x9d\xd6\x71\x0c\x6f\x83\x1d\
-\xe3\x4a\xda\xd2\x91\xf6\x7b\xe4\xbf\x82\xe2\x92\xc9\x79\xa6\x0f\
-\xe5\xfc\xca\x32\x20\xcd\x2c\x0f\x24\xe0\x78\x8a\xe5\x80\xd2\x13\
-\xc5\xd3\x46\xbf\x14\xc5\x3c\xd2\x41\xe7\x17\x9b\x34\x49\xc3\x95\
-\x42\xa8\xea\x6f\xae\xc6\x3c\x4e\xd6\x1a\xa2\xba\x2c\xce\xc4\x1a\
-\xc1\x6c\xc6\x63\x79\x24\x1d\x95\x83\x6e\x9d\x6d\x97\x0d\x6d\x9d\
-\xa3\x22\xb7\x72\x63\x87\xb6\x06\xe5\x8f\x6d\x5a\xf9\x2b\x39\xd9\
-\xb2\x4e\xa0\x3f\x56\x27\xa8\x87\xe8\x40\x55\x27\x94\xef\x66\x9f\
-\xd0\x01\xc9\x6c\x5f\x50\x5d\x3c\xa1\x7c\x2d\x9d\x2d\xf3\x56\xe2\
-\x37\x9a\xa7\xb7\xf3\x43\xe5\xd7\x1b\xe8\x81\x64\xd2\xa8\x52\x60\
-\x98\xdf\xec\x8e\x39\x5b\x32\x51\x51\x92\x3c\xca\xbe\xf5\x5a\xa7\
-\x28\x47\x7e\xbf\xd4\xcc\xa6\xbd\x2a\x60\x0a\x0e\x35\x38\x31\xd3\
-\x5e\x90\x66\x27\x14\xb4\x29\x5d\xf9\xd3\x9c\xad\x19\x8b\x89\x11\
-\xd4\x08\x42\x08\xbd\x1b\x5d\xdb\x48\x83\xfb\x35\xd8\x8b\xb4\x2b\
-\x27\x79\x4f\x3d\xe5\x2f\xa5\xdc\x9f\xea\xfb\x2d\x9d\x84\x38\x05\
-\x36\xcf\x58\x79\xf3\x48\xb1\x7d\x1c\x07\x13\x30\x66\x13\xe8\x5d\
-\xdb\x56\x3c\x9c\x43\x9d\xa2\x57\x34\x1b\x86\x8d\xab\xfb\x1d\x90\
-\x3d\xdd\x36\x48\xd1\x13\xc9\x9f\xb7\xb8\x9f\x16\xe7\x02\x50\xb9\
-\x6d\x88\x0a\x0d\x51\xde\x50\x99\xfb\x5f\x75\x43\xaa\x1e\x43\x95\
-\x37\x04\x33\x1c\x54\x2c\x3e\xda\xb1\x12\x25\x83\x46\xbe\xd0\x93\
-\xb0\x4a\x27\x68\x4c\xe4\x27\x66\x57\xbe\x4a\xa6\xa1\x37\x46\x3d\
-\x6c\x07\x31\xb5\xcc\xcd\x70\xea\x52\xd9\x5d\x95\xc5\x57\xfa\xdb\
-\xa7\xb9\x95\x45\x4e\x76\xeb\xd8\x62\x7b\xcf\x4e\x69\x58\xf4\x9b\
-\x0e\x36\xc7\xd2\x20\x6f\x17\x21\x3e\x2b\x39\xe7\x95\x2e\x3a\x61\
-\x92\xdb\x2f\x0d\x9e\xc5\x11\x47\xb4\x2e\xc7\xfb\x49\x1c\x06\xbf\
-\x89\x42\xff\x5f\xf5\xf9\x9a\xa2\x52\x1a\x7b\x1c\x73\xeb\x4c\xdb\
-\x0c\x60\x9e\x15\xc7\x33\x8c\x38\x2b\x5f\x6c\x3f\x60\xca\x1d\x79\
-\xba\x46\xef\xfa\xa6\x7a\x62\x2a\x7b\xf2\x42\xc6\xda\x74\xf3\x43\
-\xc9\xfa\x95\xc2\x6f\xa5\xa3\xd7\x14\x87\xae\x8e\x55\x79\xc7\x72\
-\x84\x2b\x6f\x1e\x2d\xcb\x41\xa7\x90\x2f\xa7\x17\x90\xf5\xd5\xa6\
-\x0c\xab\x8e\x97\x2c\x7a\x69\x53\x65\xc9\x10\x23\xab\x7d\x79\xad\
-\xe8\x49\x21\x0b\xf5\x9c\x21\x6b\x22\x12\xdd\x04\x7a\x75\xc4\x15\
-\xeb\xc5\xa8\x46\xff\xee\x56\xe8\xd3\x30\x66\x3e\x02\xf9\x72\x43\
-\xf9\xff\xcb\x38\xf4\xff\x59\x69\xf8\xc7\x3c\xf4\x7e\x8e\x63\xe0\
-\x58\x1a\x66\x8a\xe7\x45\xe5\x7f\x79\x2d\xdb\x8e\xb4\x81\xb3\x9b\
-\x46\xeb\x9c\x9c\xac\xf2\x6c\x20\xe7\x33\xb8\x4b\x2f\xb7\x2c\x57\
-\xa5\xc5\x64\xe0\xa4\xf4\x8a\xf5\x4e\xbd\x68\x9f\xa7\xec\xc9\x50\
-\xfd\x8d\x70\x66\xbe\xe3\x5b\xf9\xd3\xb2\x61\xc7\x35\xa5\x67\xfd\
-\x1b\x6a\xd4\x21\x47\x51\xcf\x28\x17\xf6\x1c\xb8\xa7\x38\x7c\xae\
-\x7a\xf1\x89\x2e\xda\x57\x79\xe8\x58\xf2\xa7\x75\xa6\x13\x3a\x6f\
-\x28\xc3\x4c\x9e\xca\xeb\x88\xf2\xe8\xb5\xf9\xe9\xa5\x2e\x9a\x5d\
-\xd4\x85\x18\x9c\x40\x36\xfa\x30\x50\xc3\x97\x46\xc2\xb0\x31\x83\
-\x6d\xe0\x56\x96\xfe\xa1\x73\x89\x3a\x11\xb6\xe5\xa2\xec\xee\xe0\
-\x69\x73\xa7\xfe\xb2\x73\xa8\x87\x8e\x2b\xec\xda\x58\x3d\x41\x0f\
-\x74\x70\x6f\xcb\xf4\x0a\x22\x6e\xcc\x3f\x1b\x75\x6c\x15\x54\xd8\
-\xf6\x77\xd4\x7b\x92\x6d\x36\xa3\x79\x5b\x0a\xcc\x4e\x55\x76\xb2\
-\xfe\xbb\xd3\x0a\xf9\x97\x6a\xa5\x4b\x89\x6d\x03\x0d\x26\x31\xdc\
-\x95\xb3\xbd\x9e\xd9\xd0\x59\x7c\x5a\xe7\x62\x64\x8e\xa8\x52\xcb\
-\xe0\xda\x79\x38\x76\xc2\x86\xac\x55\x0d\x2a\x7a\xe7\xbd\x5a\x3c\
-\x24\x70\x38\x94\xc2\x79\x73\x86\x8f\x3b\xdf\x51\x65\x3b\x55\xa4\
-\x91\xd6\x34\x13\xbf\x86\xdc\xa4\x97\x54\xfc\xad\xa2\x1a\x3a\xae\
-\x20\x6d\x66\x00\x44\x93\xa1\x63\x7a\x36\x36\xec\xc3\x4b\x61\xeb\
-\x73\x19\x78\x5a\xce\x82\x34\x33\xd1\x29\x97\x41\x63\x72\x4f\xfa\
-\x89\xbe\x2b\x6f\x30\xba\x2d\x35\x08\x6c\x78\x5d\x27\xb5\x4e\xb5\
-\xad\xd1\x52\xb5\xb8\xad\x88\x9e\x4e\x4f\x67\x25\x93\xe3\x98\x0d\
-\xda\xbf\xa5\x0b\x22\x92\xf3\x54\x16\xd9\x67\xf5\xb2\x90\x4c\xca\
-\xe2\x33\x55\x70\xfd\x3d\xb9\xa0\xb2\xd0\x07\x7a\x0d\xf4\x82\x39\
-\xdf\xf2\x75\x45\xef\x33\x64\x2e\xca\x70\xf8\x5e\xff\x72\x86\x10\
-\xef\x94\xc6\x04\x23\x76\x5d\xfa\x72\x43\xb2\x18\x7e\x64\x52\x1a\
-\x4b\xbb\x1f\x16\x71\x4c\xd8\x42\xf4\xb4\x7e\xd3\x2b\x56\xc3\x2c\
-\xe5\xfe\x9e\x8c\x55\x91\x2f\xfa\x6f\x4a\xf9\x77\xbe\x27\x79\xc7\
-\x94\xa7\x4a\x5b\xd6\x57\xb9\xdf\xec\x16\x86\x5a\xa7\x66\x9f\x49\
-\x71\xef\x2a\x4f\x4c\x9e\x2e\xb5\xa1\x38\x55\xf2\xce\x29\x3f\x4e\
-\xe8\xbb\x8e\xb5\xb8\x72\x0e\xe5\xc0\x6d\x8e\x07\x3a\x6f\x02\xed\
-\x77\x25\xeb\x74\x21\x8b\x1d\xc5\x7a\xa5\x2c\x1b\x92\xfd\x7c\x8e\
-\xac\xe3\x35\x59\x24\x8a\x61\xcb\x19\xb2\x2a\xea\x76\x61\x64\x78\
-\x71\xc6\xd0\xf1\xea\x5f\xaa\x77\x48\x5d\xd0\x0b\x5b\xd2\x43\x4f\
-\x4a\xf2\x3f\xaa\x2e\x70\xef\x9b\x8d\x6e\x2a\xd4\x08\x1d\x7c\x9a\
-\x85\xd6\xdb\x4a\x1b\xc3\xc8\x0a\xe8\x8c\xc9\x52\x54\xad\x05\x37\
-\x47\x47\xa6\xdd\x6f\x5c\x55\x83\xd2\x9c\xcf\x13\x05\x3c\x8f\x1a\
-\x5a\xe9\x57\xaa\x17\x37\x54\x5e\x77\x94\x17\x8a\x5a\xa2\x72\x28\
-\x86\xd8\x65\x2b\x78\x17\x4c\x5e\x34\xe1\xbc\x18\x7e\x9e\x32\x22\
-\x65\x4e\x56\x8d\x3b\xd2\x4a\xb9\xf4\xbe\xd8\x34\x3d\x00\x36\xf3\
-\xb1\xa1\xef\xdb\x92\xc7\xd0\x77\x69\xa3\xd2\xcf\x75\x51\x1d\x1f\
-\x1f\x57\xb9\xac\x48\x26\xe9\x55\x23\xc3\x6c\x2e\xe9\xa5\x71\x31\
-\xa7\x5c\xac\x03\x82\x2e\xe8\x33\xf5\x7d\xeb\xb3\x0d\x73\xee\x43\
-\x1e\x4a\x87\xd5\xa0\xcc\x6f\x29\xbd\x5f\xa8\x01\xf6\x99\x64\x13\
-\x47\x35\x3a\x5a\x27\x25\x97\xdb\x39\xcf\xfa\xa1\x75\xba\x98\x28\
-\x36\x52\xb6\xc2\x87\x8e\x0f\x21\x4c\x8a\xaa\xb0\xfb\x97\xe5\x67\
-\x63\x46\x8f\x76\xe5\xcf\x8a\x61\x32\x33\x62\x32\x42\xa6\xfc\x54\
-\x3a\x19\x8c\xec\x1a\x0a\x2c\x67\x34\x61\xb6\x1e\x4b\x8c\xb6\xfe\
-\x97\x7a\x76\xf7\x75\xac\xce\x65\xd8\x74\xe5\x6a\x39\x8b\x4e\x3f\
-\x4d\x7a\xea\x08\xf7\x83\x06\x9f\x6d\x2b\xaa\x0d\x23\x55\x70\xff\
-\x64\x0e\x36\x11\xa1\xc4\x1c\x50\x09\x95\x74\xbf\xb7\xaa\x1b\xf6\
-\x6c\xca\xcb\x6e\x5d\x53\x25\x63\xd8\x16\x63\x2d\x67\x9d\x7e\xac\
-\x4a\x74\x53\xe1\x89\xf2\xba\x9c\xe5\x6c\x46\xf7\xe3\x3c\x74\xff\
-\xbb\xd2\x8e\x15\x43\xb3\xf4\x96\x9c\xe2\xde\x96\xd2\x4a\x31\xd0\
-\x9a\x9e\xd2\xc3\x34\x99\x47\x0b\x03\x88\x41\xea\xab\xf5\x6c\x65\
-\x41\x78\xa0\x0a\x7d\x67\x72\x59\x40\xff\xc3\x4c\x95\x5d\xc7\xf1\
-\x67\x05\x7a\x2c\x06\xa2\x30\x2a\xfb\x88\x0d\xdf\xab\xe5\x3e\x78\
-\x50\x0c\xa1\xc5\x27\x94\x0f\xf4\x66\x99\xd8\xf2\x78\xba\xb1\xde\
-\xfa\x17\x19\x39\x9d\x87\xd1\x22\x30\xcc\x56\x29\x2a\xc3\x8f\xd3\
-\xb0\x24\xe9\x3f\x1b\x2d\xe0\xfe\x63\x75\x0e\x4e\x6d\xc6\xed\x82\
-\xde\x47\xc5\xfc\x82\xec\x51\xd1\x03\x41\xdf\x62\x35\x7c\xcc\x89\
-\x4e\x19\xd2\x8d\xa5\xc2\x95\xac\xbc\x26\x0b\xe6\xc9\x62\x44\x61\
-\x28\x8b\xe1\x7c\xd2\x37\x43\xd6\x5e\xc0\xa9\x73\x6d\xee\x7d\xf6\
-\x6f\x49\x4f\x68\x40\x92\x1f\x32\xfe\xd3\x74\x04\xb6\x7e\xa1\xfa\
-\xad\x64\x90\x3e\xbb\xcd\x80\x3e\xa3\x5f\xbb\xd4\x11\x7a\xf1\xe9\
-\xd3\xf2\x7e\xed\xa6\x74\xf0\xd7\x6a\xe4\xfd\x41\xfa\x60\x13\x13\
-\x15\xa8\x13\xea\x61\xb2\x1c\x11\x9d\xae\x62\xd6\xb6\xb2\x47\x76\
-\xf1\x7d\xd6\x88\x56\x7c\xa1\x74\x76\x4a\xef\xd6\x67\xeb\xd6\x80\
-\xb4\x53\xb1\x51\x9f\x28\x0d\xd3\xea\xc4\x47\x79\xd8\xfa\xa5\x74\
-\xc0\x4e\x56\xfd\x3a\xa3\xc6\x49\x75\x5b\x0d\x71\x67\x66\xdf\xca\
-\x89\x4e\x90\x51\xc5\xb5\xd3\x67\x72\x92\x76\x9b\x4a\x4d\x28\xf2\
-\xfa\x3e\x0d\x6c\xe5\x75\x6f\xbb\xfe\x83\xed\x73\xf0\xf7\xb2\x8b\
-\x0f\x24\x4f\xbd\xf7\x68\xa5\xa8\x1b\x8e\xa9\xdd\xe1\x27\x67\x73\
-\xf2\x12\x9c\x5e\xc5\x64\x15\xdc\xc6\x2a\xac\x2a\x80\x19\xce\xbb\
-\xea\xcd\x9a\x33\xd1\xf5\x36\xa4\xdc\xcf\xb6\xaf\x33\x8d\xde\xef\
-\x55\x71\x75\x3a\x43\x26\xed\x33\xaa\x3c\x54\x5c\x69\x31\x15\x67\
-\xd2\x7d\xd7\xde\x67\xdb\xbf\x8d\xdc\x4b\x86\xd3\xd3\x15\x9f\x9e\
-\xb7\x39\xbe\x92\xfa\xb0\x71\x78\x30\xdd\xb8\xef\x96\xd6\x9b\x4a\
-\x3b\x86\x4c\x22\xad\x72\x55\x13\x9f\x08\x0f\x67\xe7\x4d\x76\x2f\
-\x0f\xbd\x3f\x90\x2f\xc5\xfd\x1c\x0c\x04\x46\x3e\x39\xa9\x78\x92\
-\xb7\xab\x93\x0d\x6f\x21\x53\x1f\x94\x97\xe9\xe3\x62\x18\x10\xd9\
-\x99\x0c\x49\x7e\x77\x7e\x1a\xcd\x91\x61\xcc\x74\x3e\xf7\xc1\xcd\
-\x1a\x55\x91\x9e\x91\xb7\x8b\x12\x29\x4e\x36\x73\x9b\xde\xa8\x40\
-\xdf\x12\x1c\x58\x83\x51\xb2\x7c\x93\xf8\x08\xe5\x89\x19\xcb\x32\
-\x7a\x4d\x6e\x1d\x00\x86\x6b\x08\x7a\x77\x6e\x7a\xba\xf2\x75\x19\
-\xdb\x6b\xca\xc7\x07\x2a\x3f\x7a\x3a\x0a\xf1\xa6\x9c\x6d\x5b\x3d\
-\xbe\x29\x30\xb9\xb0\x82\x1e\xc9\x90\x39\xb2\xb8\x7d\xd3\xfb\xa3\
-\xea\x4f\x4d\x56\xb4\xae\x7c\x91\x2c\xca\x63\xbf\x19\x36\x02\x65\
-\xbd\xec\xd6\x01\xd9\xa7\xe2\xc8\x36\x67\x9b\x33\xec\x44\x11\x1b\
-\xe9\xa4\x74\xa4\xae\x22\x4d\xe6\x72\x8c\xc3\x23\xfe\x06\x0f\x14\
-\x01\xf5\xf0\xb3\x8f\xa7\x3b\x3d\x1a\xd9\xfd\x0f\x75\xfd\x56\xa1\
-\x9f\xf4\x6a\xeb\xb2\xa3\x64\xb2\x33\xda\x1e\xca\x2f\x82\xdd\x73\
-\xb6\x8d\xcb\xf5\xe2\x59\xbd\x33\x1a\x15\xc0\x5e\xd2\x03\x6b\x80\
-\x4a\xae\xea\x46\xd1\xe0\x2d\x85\xae\x4c\x6f\x00\x99\x5c\x86\xaa\
-\x41\x72\xfb\xb7\xb7\x1b\xf6\x26\x7b\xce\xd2\xc0\xee\xff\x33\x08\
-\x99\x1a\x19\xcc\x63\xe1\x69\x4c\x8e\xa9\xea\x4b\x80\x29\xcf\x36\
-\x38\x08\x82\x19\x88\x29\xca\x38\xf5\x9e\x27\xd7\x6a\xb8\xa6\x17\
-\x45\xae\xd3\x3a\x2b\x23\xc6\x4f\x0a\x93\x8c\x67\x71\x3f\x79\x9b\
-\xce\x65\x66\x50\x94\x4c\x71\x40\xd0\x79\x7f\x7b\x98\xc5\x86\x45\
-\x6b\x43\x38\x4d\x1a\x04\x8b\x60\x4e\xdd\xb6\xb8\xe4\x8b\x7a\x44\
-\xeb\x6a\xa1\x9a\x3c\xc5\x5d\x79\x93\xcf\x19\x72\x02\x9c\x6d\xf6\
-\x44\xad\x7c\x86\x6f\x4b\xac\x97\x73\x9a\xa1\xe1\x9d\xf9\x02\x26\
-\xb3\xc4\x8c\x57\x49\xcc\x92\x84\x86\x3d\x76\x96\x5a\x54\x74\x2e\
-\x55\xf7\xa5\x14\x66\xe4\xed\xa2\x6c\xfd\x7a\x10\xfa\xbf\xcf\xc2\
-\xe0\x23\x45\xab\x0c\xf9\x57\x32\x3c\x4f\x64\xf8\xe6\x80\xf3\x2b\
-\x14\x53\xe9\x2a\x87\x10\xab\x28\x4e\xa3\xee\xfc\x98\x84\x67\x35\
-\x96\x80\xf1\x7d\x2d\x0b\xf1\xb7\xfb\x21\xbe\xa4\x7c\x1e\xdb\x34\
-\x80\xbc\xe8\xfd\xaf\x3c\xf4\x7f\x2d\x7b\x5c\x0b\xe9\xef\xd4\x50\
-\x9a\xa2\xdf\xf4\x5a\x2a\x62\x46\x5c\xea\xb2\xce\x4c\x97\x05\xd3\
-\x64\x05\x7a\xfa\xfb\x08\xfa\x59\xd5\xef\x22\x27\x0b\x2c\x46\x73\
-\xf4\x04\x87\x67\x94\x87\xd1\xeb\x9a\x97\xff\xb3\x60\x54\x83\xd9\
-\xd8\x39\x43\xf8\x73\x9c\x5e\x2a\x5b\x51\x3f\xa2\xde\xd0\xce\xa6\
-\xd4\x89\xd6\x5b\xdb\xe5\x64\xf5\xbe\x1c\x32\xa6\x1e\xce\x1a\x61\
-\xa8\xc3\x84\xce\x4a\xf0\xc8\xfc\x15\x46\xd1\xa6\x34\xf0\xda\xc8\
-\xe5\x1c\x05\x5b\xeb\x2f\x1b\x50\x9d\x17\xb1\xe6\xbf\x41\x7d\xb4\
-\x4e\x88\xa8\xf4\xfc\x55\xe7\xa5\xc8\x05\xeb\x99\x96\x3a\x33\x9c\
-\xcd\x3b\x87\x98\xf5\x81\xa5\xbe\x30\xbc\x51\x3f\x2f\xee\xa8\x05\
-\x78\x42\xca\xdc\x20\xe4\xeb\xdb\xce\xc4\x26\x9d\x94\x0a\x39\xcd\
-\xb8\x6f\xfd\x76\xbb\x67\xd0\x74\xf8\x78\x74\xd8\xb8\xb2\x16\x82\
-\xe5\x13\xfb\x3c\x6c\x4c\x5e\xda\x3d\x48\x2e\xab\x30\x78\x40\x33\
-\x5a\x09\xe2\x85\x31\x69\x20\x8f\x06\x45\xf7\x7f\x64\x32\xb6\x6a\
-\x0d\xd7\x02\xad\xfe\x68\xc2\xfd\x72\xd2\x67\xb3\x6a\x4b\x98\x5c\
-\x51\x11\xc5\xdc\x6b\x9c\x9c\xf7\xe3\x21\x7b\xb2\x9d\x87\x75\xa3\
-\x32\x6b\x68\x76\x51\xd2\x1b\x92\x73\x5b\x69\x19\x0b\xf5\x21\xb4\
-\x49\xb0\x9b\x4e\x75\x8f\x7c\x11\x98\x44\x67\xd9\x4f\x18\xe4\xa1\
-\xf3\xfa\x51\xeb\x9d\x30\x59\x89\xa1\xd3\x68\x45\x69\xbf\x9c\x86\
-\xd6\x07\x69\x48\xbe\x3b\x08\xf1\x65\x7d\x67\x79\xd3\x2e\x48\x55\
-\x6e\x43\x59\x8a\xeb\xca\xdb\xc7\xb6\x65\x25\x92\x25\x07\xbb\x5f\
-\xb2\xf6\x1b\xcb\xfd\x39\x23\x03\x38\x69\xa3\x4c\x24\x7a\x36\x74\
-\xd8\xf5\x7b\xba\x0b\x60\xb3\xcc\xe7\x38\xd9\x69\x10\xdb\x59\x31\
-\x8e\xb1\x6b\x25\x38\xda\x21\xb9\xea\x04\xc3\xfc\x13\xea\xc0\x78\
-\xe0\x21\xfa\xd5\x55\x98\x27\x60\x94\x82\xa7\x8d\x2e\x61\x03\xaa\
-\xc6\x4c\xf1\x64\x25\x0e\x2e\x42\xf6\x74\x72\x23\x6d\x1c\x3a\x21\
-\xb6\x9c\xac\x32\xb2\xaf\x38\x2f\x51\x73\x03\xed\xd1\xff\x35\x23\
-\x0d\x79\x3a\x39\x89\x36\x55\x9e\x77\x94\xa9\xd6\x43\x4c\xce\x76\
-\x42\xf2\x4e\x24\x63\x92\x37\x0a\x83\x0d\x66\x1a\x16\x0a\xcb\x44\
-\x8b\x51\xe9\x3b\xa1\x65\x5b\xd1\x64\xf8\x78\x7c\xd8\xb8\x9e\xbe\
-\xfc\xd1\x4e\xa7\xb5\x57\xea\x0e\xcf\xf2\xa6\x26\xcf\x7a\x97\x0d\
-\x29\x76\x0a\x9a\x10\x26\x38\xa4\x4a\x66\x55\xb9\xab\xfc\xa4\x57\
-\xb5\x48\x59\xa4\x59\x6f\xb8\x03\x17\xb1\xae\x62\xde\x74\x68\x76\
-\x2f\xc4\x17\x65\xe7\xbf\xa9\xb8\x7e\x53\xef\xdf\xcd\x43\xfb\x47\
-\x45\xe8\xfc\x55\x11\xf8\x1c\xda\xdc\xc3\x5c\x2c\x2e\x18\xac\xec\
-\xb6\xf4\xd3\xce\xcb\x4d\x67\x3a\x6f\x1d\x55\x6f\x8c\x7b\xa0\x1c\
-\x51\xe6\x27\x79\xa7\x9f\x62\x39\xc2\xf8\x6d\x1d\xf7\xc3\xa2\xf7\
-\xb9\x88\x23\x1c\x91\x25\xa3\xca\xd2\x9d\x11\x59\x95\xd1\xdc\x07\
-\x59\xbb\x65\xd8\x2b\x15\xe4\x88\xdd\x0b\x2e\xb1\xb5\xa2\x33\x48\
-\x2e\x6c\xd7\x4f\x74\x6c\xd8\x43\x24\x3d\x4b\x7e\xf6\xed\x70\x34\
-\xa3\x0a\x0d\xa9\x0e\x67\xdd\x2f\xb0\x84\x8e\xc9\x67\x93\xf4\x7f\
-\x52\x88\x2e\xa4\x61\xf0\xb0\x36\x42\x74\x72\xfe\x88\xd4\x08\xe5\
-\x4c\xee\x2a\xe3\xfc\x19\xc1\xbb\xe3\xd0\xe7\x9a\x39\xa2\xea\x7e\
-\x82\xb5\x52\x47\x2b\xbb\x4d\x16\x9a\x00\x6b\xdb\x2a\x72\x55\x3a\
-\xee\x9d\x24\xe7\x3a\x21\x56\xcb\x7d\x11\xb8\x57\xd7\x67\x5d\x23\
-\x06\x5e\xa2\x59\x5e\x62\x7a\x39\xa5\x17\xb5\xe8\xf0\x31\xc6\xa1\
-\x62\xc7\xb0\x71\xc3\xe1\xa3\xc3\x44\x95\x3e\xca\xc2\xee\x29\x2d\
-\xc8\x80\xd9\x8d\x94\x85\xca\x94\xf5\xca\xc3\xdc\x5e\x82\xb3\x6d\
-\xbf\x1f\x85\xce\x4f\xe2\xb0\xf2\xb7\x85\x83\x8d\x2f\xca\x39\x5d\
-\xd0\xfb\x29\x95\x8d\x7a\xb0\x84\x3a\xa4\x8d\xf5\x8f\x8b\xb2\xf5\
-\x3b\x95\xfb\x86\x74\x9b\x4e\x0d\x0e\x50\x96\x17\x87\xdb\x52\xa3\
-\x90\xf5\x92\xf4\x36\x47\x30\x05\x94\xfc\x4b\x72\x84\x57\xb3\x90\
-\x7c\x5f\x8e\x50\x06\xb7\x09\xdd\x7f\x56\xc3\x71\x86\xac\xfa\x1c\
-\x88\x21\xbb\x94\xb5\x5b\xba\xbf\xe9\x13\x35\x93\x1b\xf3\x30\x11\
-\x92\x4f\x38\x21\xb9\x33\x26\x5f\xb1\xf6\x96\x46\x04\xf3\x30\x6c\
-\xd8\x97\xf9\x19\x78\x31\x86\xd2\xf7\x79\x64\x68\x3f\x18\xda\x35\
-\x41\x83\x97\xcd\x37\xa2\x63\xf1\xc2\x36\x8a\x25\x79\xb6\x0c\x6d\
-\x73\x60\xbb\x5b\xd9\xad\x00\x31\xf5\x36\x4e\x4d\x6e\xa6\x1e\xf1\
-\x90\xc9\x87\x3b\x0d\x58\xac\xc4\x0e\x20\xd6\x4a\x95\x02\x54\x21\
-\xad\xdd\x17\x34\xa6\x55\x20\x2a\x58\x09\xf7\x12\xd9\xf3\x34\x7f\
-\xa6\x56\x39\x43\x65\xbb\x08\xc5\xac\xbc\xcc\x26\xe2\xd8\x5a\xce\
-\x19\x86\x7d\x91\xe1\xe3\xf6\x77\xb6\xff\x5e\x1f\x36\x6e\xb4\x76\
-\x76\x17\x54\x3d\xfd\x8a\xfa\x90\xfa\xb4\xd1\x81\xbd\xc2\x92\x80\
-\x0a\xdb\xd9\x27\x52\x99\x3e\x55\xe3\x67\x42\x3e\x37\x09\x94\x05\
-\x65\xca\x7d\xe1\xca\xd9\xe6\x6c\x7d\xb7\x4f\xb0\x55\x27\x5b\xe1\
-\xc5\x97\x14\xd5\x35\x5d\x5d\xd1\x67\x85\x0e\xbb\xfe\xd8\x0c\xe4\
-\xfa\xe4\xb1\xb1\xc0\x2c\x6c\x66\xb8\x2f\x02\xf7\xbc\xbb\x3f\xeb\
-\x85\xfe\x87\xca\x9b\x72\xc2\x1d\x60\x70\x2d\x8d\xa7\xda\xc5\xfd\
-\xef\x23\x2a\x1f\x19\x52\x9b\xa1\x5c\x41\xd6\x52\x31\xce\xcb\xc8\
-\xbe\xb5\xad\x77\xd3\xa0\xc7\xd8\xfd\x59\x3f\xf4\x3f\x9a\x2c\x0b\
-\xa7\x3b\x22\xab\xae\x82\x43\x59\x72\xba\xc8\xda\xc7\x21\xfb\x3a\
-\x36\x37\x82\x4b\x2b\x7e\x34\xc6\x3a\xaf\x57\xd3\xa5\xf5\xdb\x1b\
-\xd2\x9b\x0b\xa3\xf9\xcb\x76\x85\xab\xff\x4e\x4e\x6a\x45\x07\xe8\
-\xbc\x54\xbd\x43\xd6\x3e\xa3\x2b\x58\xc0\x65\x8c\x0c\xed\x95\xa8\
-\xe6\xec\x0c\x1c\xa4\xe2\x1e\xab\x70\xc7\xf5\xbd\x49\x40\x2f\xd3\
-\x47\xd2\x01\x95\x63\xb5\xd1\x4e\x98\x30\x09\xab\x5e\x17\xc7\xb1\
-\xd2\x3c\x80\x0d\x92\xc3\x40\xbd\x4a\x1e\x4a\x5a\x57\x47\x5b\xd8\
-\x29\x13\x69\xd0\x85\x52\x1f\x66\x0e\x75\x58\xe5\x8c\x42\x7c\x5c\
-\x8a\x47\x05\xac\x7a\x43\x7b\xc4\x9c\xad\x8c\xd2\x34\x66\x0d\x1f\
-\xd7\x67\x2b\xcf\x1a\x36\xce\xd6\x47\xd3\xbd\x7f\x14\x79\x52\x05\
-\xec\xa6\xd5\xb0\x6d\xd1\xcb\xa1\x2a\x0b\xf5\x9a\x68\xb0\xd0\x0a\
-\xaf\x0f\x79\xed\x96\xca\xd9\xee\xd7\x90\x17\xbb\x00\x15\x8f\x57\
-\x53\x74\x65\xac\x70\xaa\xe8\xcd\xe0\x71\xb9\x59\x01\xce\xd6\x7a\
-\x4d\x0a\x6c\xb4\xce\x86\x27\x8f\x55\x5e\x0a\x38\x28\x86\x63\x59\
-\x0a\xb3\x28\x2c\x29\x1b\x7c\x94\xd9\xf2\xa9\xde\xc7\x5c\xb7\xfc\
-\x03\xa8\x6c\x70\xf4\xb6\xfb\xd1\x5a\x62\x9b\x14\x30\x13\xda\x1a\
-\x71\xfa\xdd\x36\x8f\xe0\x7d\x2d\x6b\xb4\x33\x90\x2d\x45\xfb\x50\
-\xb2\xfe\x7e\x50\xc8\xda\x2a\xff\x00\xc8\xd2\x9b\xc9\x52\x0f\x2b\
-\x19\x97\x85\xed\x96\xd2\x98\xac\x8b\x7b\xaf\x4b\x93\xc0\xd1\x76\
-\xff\xa7\xd2\x21\x79\xc8\xa2\x0e\x15\x9b\x24\x48\x7f\xe4\xdc\xa3\
-\x4b\x83\x90\xfc\xd9\x20\xb4\x7f\x98\x87\xce\x8f\x43\xe8\xfc\xa9\
-\xca\x8b\x7b\xe4\x7d\xe9\xd4\xba\xca\x8a\x5d\xd2\x68\x44\xa0\x72\
-\x5b\x72\xc0\x07\x70\x64\xc8\x66\xa8\xd7\xea\x21\xeb\x60\xd9\x35\
-\x8b\x5d\xc1\x76\x73\xaf\xbf\x8e\x35\x9a\xce\xa8\x4e\xb4\x28\xc9\
-\x51\x6c\x42\x61\x4d\x2e\xf5\x1f\x69\x7b\x93\xe8\x1c\xea\x0d\x2b\
-\x6c\x27\x21\xf6\xc4\xed\x14\x0a\x43\xef\x6b\x7b\x8d\xa9\x94\x44\
-\x3d\xb0\x68\xca\x2c\xd9\xe8\x94\x1c\xe2\xf9\xc2\x59\x15\x43\x7a\
-\x85\x35\xb1\x0d\x2f\x3e\x92\xb1\xe7\xc9\x3c\xd7\xf5\xb7\x5d\x86\
-\xf0\x40\xd7\x9e\x32\xc1\x22\xdf\x40\xb6\xe2\x56\xdd\x0f\x95\x42\
-\x57\x8b\xb9\xeb\x9b\x17\xb4\xae\xa8\xf5\xf9\x7a\x11\x47\x86\x8d\
-\xd9\x01\xa7\x22\xe2\xc9\x44\x33\x36\x24\xdf\xed\x86\x15\x89\xe2\
-\x55\xe5\x0b\xf0\xc4\x8d\xa1\x94\x06\x1b\x5d\xec\x0a\x09\xa8\xe2\
-\xca\x30\xe8\xf0\x29\x1f\x72\x62\xec\xb2\x94\x7f\x19\x4f\xcc\xe3\
-\xa6\x21\xbf\x43\x2f\x40\xd7\xdb\xe5\x84\x97\x0a\x5b\xc4\x2f\x9d\
-\x33\xb3\xa3\x17\xb3\x31\xd9\xfa\xaf\xba\xc7\x9f\x4b\xa5\x6d\x72\
-\xd4\xa7\x8a\xf3\x4d\x95\x29\xf1\x2e\x37\x2e\x20\xb4\x5f\x6f\x0d\
-\xef\x47\x8f\xd7\x81\xc6\x0b\xf8\xa5\xde\xf9\x03\xc9\xfe\x9c\x87\
-\x49\x14\x0e\x97\xa1\xbe\x62\x73\x11\xbd\x63\x20\xd5\x00\xb0\xad\
-\xf8\xd4\x68\x89\xd8\x16\x51\xb2\xaa\x49\x2d\x39\x9b\x48\xa0\x06\
-\x4d\x66\xd6\xab\xf7\x32\x51\x16\x06\x1a\x59\xd6\x5b\x2a\xca\x6c\
-\x44\x96\x1a\x1b\x4d\x65\xed\x66\xc3\x0a\xe0\x7e\xbf\x39\xd9\xd7\
-\x0a\xbb\xc1\x26\x20\x36\x61\x8b\x9d\xa9\xf4\xbb\xce\xb6\x1e\x6c\
-\xb4\xaa\x90\xe3\x30\x94\x06\x35\x86\xf2\x4d\x26\x3e\x16\xfb\x03\
-\x47\xa4\xef\x0b\xc9\x68\xd0\x4b\xdb\xeb\x06\xf9\x9c\x5b\xdf\xb0\
-\x86\x27\x98\x0d\xe7\x86\x48\x7e\xf5\x60\x82\x3a\xf5\xbc\x41\x57\
-\x6c\xb4\x47\xe9\x60\x3b\xd7\xec\xe3\xd6\x44\x5d\x6f\x1a\x72\x9e\
-\xb2\x44\x5d\x9e\x50\x27\xea\x72\xcd\x1e\xd6\xf5\x94\x8d\x3d\x66\
-\xd8\x9d\x3a\xfe\x50\x81\x6d\x0a\x2d\x3d\xa4\xd8\xae\x29\xec\x4d\
-\x60\x93\x37\xe4\x14\xbe\x94\x81\xc6\xd0\x58\xd0\xef\xf7\x77\x2a\
-\xef\x24\x62\x86\x94\xea\xb4\x64\x24\xb6\x54\x09\xf7\x18\x66\xd1\
-\xbf\x43\x37\xa3\x60\xda\xf0\xb1\xad\x2d\x2d\x79\x1e\xc3\xc6\x50\
-\x5f\x22\x03\xf4\xc0\xf8\xc5\x7e\x5d\x60\x99\x8c\x0d\xab\x56\xcf\
-\x2d\xad\x87\xd7\xb6\xd3\x37\x8d\x91\xb5\xd0\xea\xa1\x4c\xca\xdb\
-\xdd\x84\xbd\x12\x5f\x94\x21\xc7\x89\xc9\x98\x63\xac\xd3\xfb\x3d\
-\xeb\x79\xdb\xfa\xe0\x5b\x49\xc8\xfe\xc0\xce\x50\x8a\xfb\xd8\x42\
-\xfe\x65\x51\x6d\x88\xb0\xf5\xf3\x2c\x6c\xfd\x22\x0b\xfd\x4f\x0b\
-\x67\x08\xb1\x54\x0a\x67\x42\xaf\x93\x2d\xf8\x18\x25\xb0\x86\x16\
-\x3d\xb9\x19\x6b\x28\xa7\x31\x55\x16\x0e\x57\x49\x1e\xca\xba\x22\
-\x59\x83\xbd\xc9\x6a\x4a\xff\x0f\x72\x02\xd7\xd2\x62\xd8\x1e\xb5\
-\xc2\xc1\xae\xa9\xb7\x76\x9c\x8d\x68\x14\x29\xbd\x68\x60\xd0\x00\
-\xa7\xa1\x6a\xa3\x0d\x8a\x93\x8d\x44\xdc\x51\x79\x7d\x2a\x63\xbf\
-\xcb\x19\xc3\xcf\x83\xfa\x46\x3c\xb6\xa2\xa1\x84\xf9\x1f\xe3\xba\
-\xbd\xdb\x30\x89\xd1\x0d\x80\x6a\x75\x51\x61\x3f\x6f\xc1\xbc\x4a\
-\x1c\x5a\x47\xdb\xf9\xbe\x5a\x4b\xb5\xfb\x18\x03\xf5\x2c\xec\x09\
-\x23\xa4\xa8\xfc\x79\xd6\x33\x6e\xd3\x72\x93\x7f\x2a\xa7\xed\xcf\
-\x2a\xaa\xab\x3d\x8f\x59\xaa\x6c\x09\x57\x31\x69\xf8\x98\x61\x63\
-\x7a\x97\x15\xcf\x67\xd8\x58\xd7\xde\x90\x1c\xe5\x49\x15\x12\xb6\
-\x71\xd3\xef\x45\x25\x6b\x9e\x2f\x2b\x3f\x6a\x85\xd6\x37\xf2\x91\
-\x10\x5f\x51\x19\xb5\x77\x1a\x5e\x9b\x91\x69\x1f\x4a\x99\x27\x6a\
-\xe9\xdb\xc7\x35\xb0\x7b\x61\x38\x8c\x8f\xa3\x55\x8f\xce\x1e\x22\
-\xc0\xae\x37\xbc\x98\x4d\x3d\x63\xe7\xaa\xe7\xc1\xd0\x11\xfe\x4c\
-\x8e\xf0\x1f\xe4\x54\x78\x2a\x90\xd4\x87\x1e\x85\x0d\x27\x9f\x92\
-\x53\x21\x7f\x51\xbb\x3d\xee\x96\xb5\x43\xd6\xa3\xe2\x77\x93\x25\
-\x07\xd7\xb9\xa0\xd6\xef\x3e\xc9\x9a\x06\xe5\xb1\xf2\xe7\xea\x49\
-\x5f\x56\x59\x6c\xa4\xa1\x7f\xb7\x5b\x3c\xc2\x4e\x2f\x2b\x05\x7a\
-\xdb\x85\xd6\x2a\x1e\xe8\x95\x5e\x4f\xe3\x90\x5e\x8f\x42\xfa\x1b\
-\x35\x88\xa6\xec\xfa\x76\x90\xb0\x19\xe0\x55\x9d\xa8\xd9\x88\x79\
-\xfb\xb7\xef\x95\xec\x76\xed\xfa\xc8\xaf\x11\xad\x2e\x50\x9e\x65\
-\x07\xc8\x39\xa4\x8e\x96\x87\x30\xb7\xae\xe8\x03\x1b\xb3\xeb\x0d\
-\x5d\x18\xf0\x10\x67\x19\x3e\xab\x5e\xf4\x68\x6f\xcf\x1e\x12\xb2\
-\xd9\xbf\x35\x25\x5a\x79\x5d\x35\x97\xc3\x09\x0b\x6c\x1b\xc7\x83\
-\xd8\xdb\x3f\xc9\x76\x84\xe8\x5b\xb3\xef\x85\xd9\x7d\xb0\xda\x96\
-\x8c\xf5\xd9\xc7\x3c\xab\xb2\x3e\xdb\x98\x0d\x1c\xe8\x41\x81\xed\
-\x8b\xba\xcf\x9b\x54\xd4\xa9\x66\x45\x97\xf5\x3b\xb4\xce\x30\x7d\
-\x56\x3f\x28\x58\xef\x72\xce\x83\x01\x80\x21\x7d\x7a\xa5\x66\xdc\
-\x4b\x58\x9e\x60\x8f\xf4\xab\xdf\xef\x2b\xa1\x17\x9d\xd5\x7a\xf8\
-\xed\xd7\x78\xc2\x8a\x3e\x10\xe6\x2c\xd9\xa8\xb3\xf2\x97\xc9\xc4\
-\xb2\x48\xfe\x64\x4b\x2d\xf3\xed\xb2\xde\x0d\x09\xbd\x59\xf2\xc0\
-\x02\xbd\x01\x5d\x0f\x03\x4e\x68\xfa\x38\xbe\x5d\x44\x21\x79\x63\
-\x72\x98\x05\xf7\x73\x37\xff\xab\x1a\x6b\xb6\xd6\x96\x4c\x54\x9c\
-\x55\x1e\x56\xa6\xfc\xdd\x7e\xd9\xc9\x24\x39\x84\x59\x13\xfb\x90\
-\xc5\x16\x83\xdc\xbe\x19\xca\x92\xc3\x1d\x91\xb5\xcf\x0d\x57\x7b\
-\x06\xed\x8f\x5b\xf6\x6e\xb7\x54\x6e\x76\x43\xfa\xa5\x1c\xee\xbf\
-\x26\xa1\xf7\xdf\x42\xe8\xfd\xf7\x3c\xf4\xff\x55\xf5\x86\x0d\x45\
-\xfe\x3f\xfd\xfe\x2f\x3a\xee\x97\x3c\x10\x81\x21\xfd\x83\xef\x60\
-\x2b\xea\x1b\x88\x30\xef\x63\x58\x27\xa0\xe1\x83\x10\xd8\xdf\x99\
-\x59\xf1\xe3\x75\xa2\xf5\x17\xba\xf6\x94\xa7\x5b\xa5\xb6\xdf\x3b\
-\x05\xa8\x06\x32\x72\x69\xb0\x55\xb2\x1b\x36\x9c\x78\xf2\x0f\x8f\
-\x5a\xe4\x51\xa3\xe6\x70\xa9\x27\xaf\x30\x87\xc6\xd1\x32\x73\xb0\
-\xfd\x1d\x55\xb0\x9f\xca\xe0\xd1\x60\xd6\x6f\x36\xf1\x42\xbd\xd8\
-\xde\x57\xcf\xb6\x67\x72\xa2\x0c\x6c\xc5\xd6\xc0\x19\xf5\xaf\xe9\
-\x9c\xb2\xfc\xb9\xc7\x34\xe4\x28\x43\x9c\xf3\x15\x99\x56\x35\x8f\
-\xbf\x8a\xc7\x26\x3e\x31\x61\x21\xdc\x9b\xaf\x58\x23\x5b\x32\xd6\
-\x86\x8f\xd9\x1f\xb6\x3e\x6c\x6c\x9b\x46\x54\x30\x6c\xbc\x64\x58\
-\x3e\x51\x41\x4b\xda\x86\x8f\xcc\xc3\x28\x9f\x58\x42\x31\x07\x86\
-\xf4\xa9\xa4\xe4\x0b\x13\x91\xd8\x0b\xb6\x9a\x95\x9d\x4f\x79\x20\
-\x78\xef\xb6\xae\x5b\x66\xd9\xc8\x50\x3a\x72\xa7\x3c\x11\x69\x1c\
-\x1e\xf2\x50\x77\xee\xc0\x7d\xb9\xc1\x23\x1c\x3c\x8a\xb1\x7b\xc6\
-\x67\x63\x56\xb3\xb1\x9b\x9a\x0f\x9e\xb1\x6b\x1b\x08\xf0\xe4\x1d\
-\x0c\x4f\x03\xac\xd7\xc6\x7d\xe1\xb7\x95\x97\x57\xb3\x61\xc8\x8f\
-\x6d\x35\x7a\xb4\x22\xb3\x95\x2b\x12\xee\x57\xea\xbd\x0a\xe3\xcc\
-\x94\xd5\xa0\xe1\x59\x97\x55\xaa\xca\x54\x59\x7b\x85\xd1\x92\xf8\
-\x44\x14\x78\x24\x5e\x7a\xaf\x57\x0c\x55\xf3\xf0\xf6\xd2\x81\xda\
-\xb0\x28\x0f\x00\x61\x23\x11\xb6\x84\x9c\x31\x4c\x7a\x90\xa9\x36\
-\x10\xa9\xe8\xb0\x87\xb7\x65\xaa\xfe\x7b\xad\x59\x9d\x68\xbd\xa1\
-\x5e\xff\xf1\x51\x9b\x91\x6d\x0e\x8a\xe7\x61\x6f\x57\xf3\x11\xaa\
-\xc9\x9a\xfc\x4f\xe8\x5c\xdc\xee\x04\x84\xa3\xd2\x85\x39\xfa\x90\
-\xbc\xa1\x86\xf6\x19\x5d\x07\x87\x9d\x28\xae\x84\xb2\x11\xf6\xaa\
-\x72\x20\x1c\x6d\xeb\x2d\x95\xc5\xbb\xf9\x48\x60\xb1\xb5\x2d\xfa\
-\xff\x73\x19\xa9\xbf\x60\xa8\x58\x91\xbd\x2c\x63\xc1\x3d\xd9\x4a\
-\x03\x14\x7a\xd7\xe5\x64\x55\xe1\xaa\xd6\x34\xe4\x37\x67\xf7\x66\
-\x2b\xfa\x72\x74\x76\x19\xb5\xb6\x58\x26\xd0\x46\xa1\x4a\x2b\x91\
-\x9f\x95\x16\xce\x79\x9e\xe9\xea\x4f\x25\x47\x46\xb3\x75\xa2\xad\
-\x56\x7c\x62\xad\x37\xd6\xe7\x15\x8f\x40\x9b\xef\x10\xeb\x6b\x6a\
-\x47\x86\x86\xd4\x03\x88\x4e\x6d\xff\xad\x3e\x6c\x1c\x35\x7c\x50\
-\xf4\x5e\x18\x2e\x9f\x20\x28\x6f\x56\x78\xcc\x16\x90\xc7\x47\x65\
-\x80\xdf\x54\x25\x9f\x32\x7c\x65\xcb\x28\x56\xc9\x40\x7d\x51\xde\
-\xf0\xd8\x41\xdb\x9f\x95\x73\x15\xa6\xcd\xfe\x45\xa6\x89\x94\x3c\
-\xc2\xca\xd5\xa3\xc5\x39\x7a\xb1\x3e\x32\x3a\x37\xbb\x2c\xec\x99\
-\xc2\xea\x7c\xc7\xab\x7a\x97\x83\x67\x74\x83\xb2\x60\x38\x31\x6e\
-\x32\xf1\x67\x0e\xc3\x5b\x0d\x25\x55\x79\x11\xbd\x79\xad\xfc\xf6\
-\x37\xd4\xa3\x78\x4f\x3d\x2a\xc5\x25\x27\x2a\x18\x9e\x06\x30\xea\
-\x61\x23\x03\x67\x3b\x76\x5f\x11\x68\x38\x64\x03\xa5\xe9\xf8\xe4\
-\xfc\xaf\x63\x3b\xa6\x95\xf4\x1f\x4a\x9f\xc9\x7a\xfd\x94\x4f\x98\
-\x00\x53\x97\x55\xdd\x23\x37\x59\x7d\xc9\x3a\x3d\x3b\x7d\x50\x3d\
-\x2b\x19\x98\xd9\x3b\x2c\x3b\xc2\x3e\xce\x27\xb0\x21\x7c\x9e\x66\
-\xc4\x7d\x72\xee\xbf\xb2\xe9\x84\x7a\xee\xf1\x25\xe9\xc8\x59\x7d\
-\x66\xe4\x62\x6c\xfd\xf2\x61\x85\x3a\x31\x50\x67\xc0\xea\x84\xea\
-\x92\x6d\x8b\x39\x6c\xc5\x28\xcd\x57\xa7\xd7\x43\xa0\xc7\x4f\x03\
-\x91\x5b\x63\xf6\x10\x0b\xc1\xd3\xc9\xb8\x07\x4b\xa3\x77\xda\x6c\
-\x6b\xec\x92\x39\xf8\x32\xd8\xd6\x9f\x50\xca\x8d\x90\x3b\x65\xa4\
-\x89\xa5\x6f\x9d\xef\x4a\x7f\x5a\xaa\x7f\xf7\x7b\x43\x5d\x7a\xd5\
-\x79\xe1\xb3\x8e\x59\xd3\x65\x4f\x6d\x91\x5d\xb5\xc0\xd6\x88\xbc\
-\xe3\xf3\xda\x2a\x54\x74\x8b\x77\x8c\x34\x4a\x46\xc9\x33\x8b\xd0\
-\x5a\x65\xec\xb4\xa3\x02\x1f\xea\x9a\x5a\xb9\x5f\xc8\xe9\x4d\xe9\
-\x35\x8d\xc3\x3e\xb2\xad\xb3\x92\x5d\xf6\x56\xb8\xbf\xc4\x43\xbc\
-\x99\x5c\x61\xf2\xd4\x8b\x46\x26\x43\xb9\x66\x2c\x18\x8a\x93\x81\
-\x6b\x5d\x92\x32\x7d\x2f\x91\x41\xd7\x49\x18\x14\x69\x25\xb3\x96\
-\x19\xc6\x8a\xd0\x50\xe2\x79\x4b\x8a\xdd\x60\x76\x1e\xee\x65\x38\
-\xcb\x57\xe7\x55\x33\xf3\xd8\x90\x9b\x59\x94\x0c\x1b\x0f\xf7\xfe\
-\x65\x88\x72\xc6\x13\x62\xea\xec\xe5\x31\x79\xe4\x0b\x8f\xfe\x8b\
-\x4f\x14\xdf\xab\xad\x25\x79\xa0\xb5\xa5\x0d\x63\x77\x51\x0e\xf7\
-\x94\x2a\xf1\x49\xe5\xdb\xf9\x28\xb4\xde\x55\xf6\xb0\x19\xb9\x0c\
-\xae\xa5\x9a\xb4\x28\x2f\x79\x4c\x9e\x65\x28\xaf\xdb\x2a\x9b\x29\
-\x4e\x0f\x99\x0c\x2d\xb7\x2e\x17\x7f\xb7\x8d\xd7\x7b\xe5\x0c\x51\
-\x9c\xcc\x31\x19\x9a\x73\x6a\x80\x70\x3f\xbd\x10\x50\x2b\x8b\x38\
-\x24\x27\xf5\x63\x59\x16\xe9\x13\x19\x13\xf2\x91\x51\x0e\xc5\x23\
-\xbf\xb7\xf7\xe5\x3d\x96\x9f\x6f\x15\x13\xc3\xf8\x8f\x85\xfc\xd9\
-\x33\xc9\x20\x2e\x8c\xae\xd3\x00\xdc\x92\x8c\x9a\x13\x6b\x7d\x4d\
-\xe5\xf8\x81\xe2\x76\x49\xe5\xa8\xf8\x64\x72\xfc\xb6\xac\x42\xe5\
-\xda\x74\xd6\x31\xeb\x55\x93\x33\x0a\x32\x76\x94\x1f\x4b\x9e\x38\
-\x3f\xac\x29\x3f\x58\x95\xc6\xbd\xd8\x09\x7a\xb6\xf2\x17\x49\x48\
-\x4e\x48\xb7\x79\x76\x99\x0e\x1f\x50\xfe\x32\xd8\x44\x38\xe6\x11\
-\x8e\x63\x8f\x71\x84\x4a\x16\x33\x78\x91\x45\x3e\xda\xef\x4a\xdb\
-\x22\xb2\xfa\x37\xb7\x65\xd9\x2c\xd5\x09\xb2\x2a\x16\x9d\x75\xcc\
-\x23\x2d\x99\xbd\x4b\x2c\x88\x23\x0f\x9f\x60\xb9\x4a\x74\x5c\xa2\
-\x5f\x53\x50\x63\x3c\x79\x5d\x0d\xe7\x37\xca\x70\xa5\x78\x8f\xcf\
-\x2b\x9c\x96\xfe\x48\x5f\xe9\x6d\x51\xe7\x59\x7a\xd5\x74\x26\xfa\
-\x8b\x98\x75\x0c\x4c\xe6\x6a\x97\xa3\x5b\xf6\xb8\x3b\xa5\x95\xa7\
-\xe9\x98\x2d\x54\xa3\x22\xbe\xa0\x34\xf1\xd9\xd4\x5b\xd7\x51\x3d\
-\xb1\xd1\x89\x1f\x25\xa1\xfd\x8e\x8e\xb7\xbd\x86\x95\xce\x81\x74\
-\xe7\x6e\xdf\x96\x08\x99\x8d\xa2\xfe\xcf\x58\x3f\x9c\x6d\xa8\x2e\
-\xb2\xe2\x41\x87\x32\x59\x94\xf8\x33\x2a\x65\x1d\x1a\xc9\x8b\xce\
-\x14\xf9\x8e\x0d\x60\xa9\x5b\x72\xb5\x68\x4c\xc6\x17\x8a\x3c\xea\
-\x5f\xdf\x92\x0d\x51\xc3\x8d\x3d\x05\xc4\x6e\xf2\xec\x65\xe2\x85\
-\x38\x5a\x7a\x68\x38\x0f\x73\xb2\xd3\xd6\x14\x5a\x79\x16\x85\x46\
-\x61\x9b\xb1\x55\x83\x95\xa1\x37\x7a\x29\xf6\xb8\x28\x5a\x7a\xfa\
-\x9b\x1d\xac\x77\x36\xf7\x8e\x66\x54\xea\x49\xd0\xba\x6b\xb3\x16\
-\x97\xf3\x75\xfd\xf6\xe9\x8e\xc9\x60\x39\x80\x39\xdb\x13\x72\x28\
-\x6a\x19\x26\xaf\x2b\x50\x71\x65\xd8\x63\x19\x23\xdb\xf5\x87\x78\
-\x29\x8e\x38\x59\x0c\x69\xa1\x84\x7a\xd1\xeb\x6c\x3a\xc4\xab\xe3\
-\x6d\x13\xef\x12\x5a\x81\x50\x39\x5a\x7a\xec\xec\x57\x0a\xf9\xdd\
-\xe6\x0e\x63\xaf\xcf\xa3\x4d\x6f\x64\x21\x29\x1b\x21\x9c\x67\xbb\
-\xd2\xc8\xc9\xd9\x2e\x5a\x55\x3a\x69\x0c\x49\x0e\xce\xd6\x96\x58\
-\x61\x88\x28\x27\x89\x61\x43\x80\x5c\x79\xc2\x46\x20\xd6\x70\x61\
-\xf9\x96\x1c\xde\xac\xc6\x07\x4b\x36\x90\xc9\x12\x12\x6e\x0b\xf0\
-\x28\x33\x54\x00\x99\x81\x7d\x7d\x95\x1c\x7a\xfa\xf1\x79\xfd\xed\
-\x8a\x82\x8c\x6a\x7c\x46\x65\x54\x2e\xef\x42\x0e\xe5\x60\x0d\x13\
-\x6c\x18\x06\x81\xdb\x08\xc8\xdd\x23\x2c\xc9\x4a\x78\xd6\x2e\x8d\
-\x32\xf2\x83\x5e\x33\x33\x59\xf5\xd9\xee\x85\xaa\x81\x11\x5f\x92\
-\x7e\xbc\x29\x3d\xb9\x24\x27\xfb\x0d\x0c\xba\x64\x63\xa0\x58\x02\
-\xb4\xae\x7c\x3b\x2e\xe3\x77\x0a\xc5\xd1\xf5\x94\xa4\x6a\x49\x19\
-\x4c\x33\x3c\x66\x68\xaf\x2a\xdf\x95\x36\xea\x8a\xf5\xe4\x18\x92\
-\x53\x34\x68\x90\xb2\x1b\x55\x72\x55\xf1\x51\x43\x83\x6d\x20\x93\
-\xb7\x25\xf2\x5b\x2a\x2b\x95\x0b\xf7\xd6\xc8\xc7\xad\x2f\x9f\x59\
-\x7d\x19\xe6\xfc\x0d\xc5\x61\x42\x39\x14\x46\x5d\xb2\x74\x0e\xbd\
-\x20\xea\x9c\x2d\x29\x29\x65\x45\x6a\x5c\x8d\xc8\x7a\x0b\x59\x3a\
-\x6e\x17\xb2\x2a\x16\x75\xb4\x81\xa4\xb3\x64\x87\xb4\x2b\x3f\xec\
-\xd6\x86\xf2\x9f\x0d\x19\xcc\x5e\x28\xce\x95\xd9\x30\xec\xb3\xca\
-\x48\xea\x6e\xbb\x75\x1d\xd1\x67\x02\x0d\xb7\xf3\x8a\xb0\x7a\xeb\
-\x51\x2c\x3b\x32\x67\x7b\xd1\x17\xe6\x68\x69\x80\xe2\xf4\xd4\x00\
-\xb5\x7a\xc8\x3a\xec\x35\xe9\x9e\x3a\x1a\x36\x42\x84\x8e\x5b\x9d\
-\xa0\x51\x51\xd4\x09\x82\x2d\x6d\x22\x23\x10\x21\xdd\xb1\x67\x6d\
-\x53\x2e\xd4\x5d\xf8\x62\x76\xb9\x50\x17\xd1\x05\x1a\x36\xd8\x59\
-\xe4\x72\xbd\x4a\x1f\x82\xf2\x3e\x96\x5c\x3a\x23\x3c\x20\xde\x1c\
-\xbc\xea\x61\x31\x9c\x2f\x7d\x57\x07\x88\x07\x7b\x54\xb3\xa5\x77\
-\x93\x67\x2f\x13\xcf\xdd\xd1\xda\x43\xa4\xe9\xf9\xad\xa9\xa0\x68\
-\x99\xcf\xc0\x14\x45\x4a\x62\x0e\x55\x46\xa0\xd8\x0c\x40\x9a\x53\
-\x2a\xcf\x50\x91\x36\x54\xc0\x3c\x9b\xb1\x61\x4f\xb6\x4e\xd5\x93\
-\x8a\x4f\x4a\xa9\x4a\x5d\xa7\x45\x8f\x36\x71\x79\x33\x32\x32\xf2\
-\xc0\xa2\x71\x53\x6c\x82\x14\x96\x67\x50\xd2\x63\x43\x81\xed\x38\
-\xe2\xa4\x1e\x5b\x7e\x4b\x17\x9a\xa1\xc4\x75\x30\xe0\x3c\xd4\x1d\
-\xe8\xc5\x71\x3f\x93\x0a\x85\xa3\xe5\xa2\xd6\x13\xd1\x77\x98\xb7\
-\x76\xb6\x4e\xdd\xd1\x62\xe8\x6d\x6f\x57\x7a\xa4\xa2\x89\xa3\x05\
-\x1a\x21\xe6\x6c\xab\x7c\x91\x11\xb3\x6d\x11\xcb\x28\x58\xe3\x87\
-\x77\x1c\x8d\xf2\x84\x78\x72\xbf\x8c\xde\x24\x15\x8e\x4d\x01\xca\
-\x23\x42\x7e\x4d\x5d\xa2\x06\x43\x88\x26\x13\x87\x56\x46\x8f\xfd\
-\xa3\x23\xb5\x8c\x91\x1d\x30\x4c\x38\x00\xfe\x21\xb3\x2a\x17\xfd\
-\x2d\x57\x19\x6c\xaf\x35\x44\xa2\x90\xbc\xfc\xcb\xe6\x79\x36\x0f\
-\x66\x64\x9b\xd3\xd3\x67\xd2\x3a\xbc\x97\x4c\x4f\x0e\x99\xc4\x4d\
-\x4a\x30\x7c\x62\x89\xd2\x6f\xc3\xaf\x34\xdc\xe4\x53\xdb\x47\x56\
-\x43\xcc\x73\x3e\x85\xc5\x95\x21\xd6\xa2\x68\xa7\x3b\x5a\xe9\x27\
-\x8d\xbe\x44\x8d\x3d\x93\x81\x0e\x92\x27\xe5\x79\x2c\x61\xb1\x1e\
-\x2e\xb7\xef\x68\xf8\x90\x2f\x04\xfd\x89\xe1\x73\xee\x61\x16\xeb\
-\x46\x41\xf9\xc1\x88\x0f\x3d\xef\x09\x58\x5d\x78\x2a\xa3\xae\x1e\
-\x38\xf5\x6a\x5c\x56\xb5\x66\x76\x28\x4b\xce\x83\xbc\x1f\xca\x52\
-\x23\xb1\x2e\x2b\xf0\x10\xfc\x39\xc3\xf6\x75\xbb\x30\x78\xda\x53\
-\x23\x57\x82\x91\x37\xcd\xd1\x8a\xf4\x66\x51\xdf\x58\x43\x4b\x3d\
-\xa4\x11\xc8\x08\x8c\x8d\xb8\x98\xf3\xd1\x41\x45\x24\x84\x2e\x56\
-\xea\xa9\x51\x7d\xd4\xa1\x26\x27\xd2\x87\x35\xc5\x79\x4d\xba\xcb\
-\x88\xd1\x14\x5d\x19\x77\xb4\x95\x9e\xc1\xa2\x8e\x36\xe5\x11\x90\
-\xca\x2f\x9e\x8c\x65\xcc\x70\xb4\x30\x5c\x33\xcc\x03\xe0\x05\x69\
-\xae\xec\x27\x8f\x6d\x2c\x1a\x17\x65\x50\xd9\xeb\x08\xcb\x03\x74\
-\x94\x78\x66\x8f\x8b\x06\xa1\x45\x98\x17\x6b\x87\xa7\xe8\x40\x9d\
-\xf4\x71\x3e\xb2\x21\x90\xe9\x43\xb9\x43\x15\xb2\x86\x72\x91\xa9\
-\x6c\xb4\x3a\x8f\x4e\x4b\xef\xb3\xaf\xd8\x93\xbb\xd8\x44\x04\x76\
-\x93\x67\x2f\x13\xcf\xd5\xd1\x5a\x65\x52\x65\xb4\xfb\x03\x56\x21\
-\x66\x87\xaa\x50\x0c\x3e\x5b\xf7\x95\xdf\x8b\xc2\xcb\x9f\xaa\xb7\
-\x70\x53\xc6\xe3\xba\x94\x74\x0f\xc6\x34\x7f\x22\x45\xb8\x91\xda\
-\x10\x1f\x56\xc5\x7a\x0f\x32\x96\x16\x50\x2e\x8c\x19\xca\xa4\xdf\
-\x91\x62\x0e\x45\x95\xda\xb6\xdb\xe3\x60\x7e\xe7\x0f\x0f\xd5\xd2\
-\xdc\xc5\xac\x46\x5d\xcd\x86\x8f\x31\xca\x36\x34\x2a\x29\x0c\x63\
-\xf3\xe8\x3e\x6b\x64\xd0\x12\xa5\x87\xcc\x30\x5c\x43\x2a\x47\x8b\
-\x93\x45\xc9\xad\x87\xa2\x34\xe0\x6c\x9b\x3a\x5a\x0c\xef\xe0\x13\
-\xa5\x51\x9f\x13\xf5\x1c\xed\x83\xe0\x5a\x16\x54\xd1\x78\xb7\x46\
-\x10\xf1\x64\x52\x0a\xf7\x93\xab\x3c\xa1\x9c\xd6\x71\xb2\xaa\x54\
-\x0d\xf3\xa4\x92\x49\xcf\x91\xdb\x08\xf4\x92\xcc\x98\x22\xaf\xa3\
-\x56\x75\x55\x16\x02\x07\xc0\xdf\x29\x0b\x0c\x3c\x71\x30\xb9\xfc\
-\x79\x5d\xf1\xfa\xbc\xb9\xdc\x26\x54\x8d\xb2\x16\x33\xc2\x49\xa3\
-\xec\x06\x2d\x76\x8b\x17\x06\x05\xc1\x88\xc3\x7e\x96\x46\xce\x8e\
-\x53\x5c\x32\xc5\x25\x3a\x5a\x6c\x06\xc2\xd2\x20\xeb\x81\xc9\x58\
-\x56\x8e\x65\x96\xe1\xb1\x89\x46\x7a\x59\x0f\x59\xd7\x8b\x2b\xe7\
-\xa2\x50\x38\x5a\xe5\x55\x59\x9c\xfa\x54\xc8\x56\x7e\x64\xcf\xc8\
-\x13\xc9\xa1\x1c\xf4\xe2\x71\x7e\xd1\x9c\xa7\xaf\x50\x17\xa6\xcb\
-\x42\xce\x98\x2c\x1d\x43\x43\x73\x92\xac\x26\xb7\x39\xea\x76\x41\
-\xa7\xe9\x87\xa2\xd1\x44\x8f\x7f\xd6\x86\x15\xe4\x89\xa2\x69\x43\
-\xdd\x96\x7f\x8a\x27\xf9\x6d\xf5\xb5\xb4\x1f\x66\x63\xca\x38\xdb\
-\xef\x04\x7a\x66\xea\xed\xe1\xa4\xaa\xf5\xbe\xb6\x73\x56\x5b\x8d\
-\xed\x8e\x3e\x4f\x19\x89\xaa\x1c\x2d\x3d\x43\xd2\xdc\xb4\xec\x2a\
-\x2a\x47\x8b\x93\xe5\x01\xf9\xa4\x15\xa7\x65\x3a\x32\xc7\xd1\x02\
-\xe9\xa5\xa1\x97\x5c\xd4\x99\x8a\x73\xa4\x56\x8f\xd5\x69\xd3\x3d\
-\xbd\x13\x6d\x65\x85\xe5\xbf\xe2\x64\xb7\x5d\xb0\x51\xa4\x0f\x1d\
-\x54\x54\xad\x5c\xa8\x8b\x0d\x47\xfd\xd0\xf7\xf4\x8e\xf4\xfd\x0a\
-\x79\x45\x6e\x17\xfa\x40\xfd\x63\xcf\x64\xea\x1b\x79\x6c\x8f\x0a\
-\xc4\x16\x4a\x26\x75\xc0\x96\x4e\x3d\x68\xd9\xd0\x33\x1b\xb4\xec\
-\x36\xcf\x5e\x26\x9e\x9b\xa3\x65\x43\xef\xca\xc9\x2e\x82\x55\x27\
-\xb4\x92\x72\xe6\xed\xb1\x2a\xd4\x3d\xe9\xcd\x35\xf5\x1c\xef\x48\
-\xb3\xe6\x3c\xec\xb9\x31\x52\xf6\x6a\x6d\x6b\xb1\x5e\x52\xb2\xf8\
-\x8a\x78\x94\x89\x8a\xab\xcf\x66\xcc\xf9\x99\xf7\x42\xaf\xcc\xe1\
-\x67\x1f\xc9\x60\x3c\x52\x5c\x76\xe3\xf0\x75\x4a\x7c\x59\xa7\x6e\
-\xa0\x84\x45\x8f\xc8\x86\x8b\xf9\x8c\x23\x53\x5d\xcc\xa4\xbc\x8b\
-\xdc\x67\xb4\x21\xdd\xb3\xea\x51\xd5\x86\x6b\xac\x62\xaa\x92\xb0\
-\x0e\xb2\x89\xa3\xad\xc8\xee\xab\x14\x58\x5f\xab\x4b\x71\x2f\xcc\
-\xca\x82\xca\x5b\x7e\x2c\xbe\x93\x17\x64\x06\x3f\xe8\x0d\xe7\xc2\
-\x0e\x5b\xf7\x25\x67\x17\x79\x92\xde\x2a\x2e\xca\x25\xed\xfe\x27\
-\x65\x51\x56\xec\x4a\x4e\xd5\xc8\x19\x3a\x58\xce\x90\x63\xcd\x7e\
-\xa7\xb2\xd8\xa5\xdc\x79\x58\xa3\x4c\x46\x2f\x39\x8d\xc1\x91\xd0\
-\x32\x5e\x60\xf1\x52\x11\x59\xef\xc1\x7e\x92\x71\xbc\xc5\x08\x87\
-\xe2\xa2\x78\xb1\x2e\x3a\xea\xd4\x46\x16\x48\x4b\x65\x7c\xe6\x3c\
-\xe7\x97\x32\xc0\xd8\x92\x22\xca\x60\xd8\xc0\xab\xf2\x03\x1d\x2d\
-\x65\xda\x3b\x41\x97\xe5\xf8\xec\xa6\x64\x7c\x2e\x43\xde\x70\x19\
-\x12\xb2\xd2\x2f\xe9\x75\xe9\xb2\xd6\xc0\x2a\xae\x39\x51\x16\x49\
-\xa9\xc9\xca\xd5\xb0\xca\xfe\xd8\x5c\xd6\xb8\x5d\xb0\x51\x2e\x9c\
-\xed\xa6\xd2\x3a\xe3\x1e\x22\x93\x6e\x92\xd7\x75\x2c\xc3\xbe\xca\
-\xff\xde\xad\x62\x28\xd6\xe2\x28\xc7\x5a\x64\x54\x71\x2c\xf0\xbb\
-\x7d\xb7\x5b\x10\x72\x52\x72\x14\xad\xe3\x6d\x73\xb6\xe6\xec\x84\
-\xed\x64\x45\x34\x26\xd4\x0d\x1c\x2d\xb7\x24\xaa\x78\x2e\x52\x76\
-\x80\xa3\x4d\xde\x52\xde\xc8\xc9\xd6\xd3\x6a\xce\xf6\xb1\xe2\x3d\
-\xc7\xd1\x82\xe9\x1e\xe5\x42\x3d\xb4\x2d\x40\xf9\x51\xef\x7a\xb3\
-\xf4\xe9\x53\x55\x17\xaa\x32\xab\xfe\x3e\xd4\x81\x05\x47\xfd\x98\
-\x24\x87\xbe\xb3\x31\x10\xfb\x16\x64\x64\x15\xd7\xd5\x55\x6d\xa4\
-\x43\x17\x37\x3b\x89\xec\xaa\xec\xcb\xc6\x5c\xeb\x82\x3a\x0b\xa9\
-\xf2\x4c\x4e\x18\x16\xcd\xb3\x97\x89\xe8\xe4\x95\x37\x2d\xdb\x96\
-\x0d\xf7\x0d\x16\x75\xb2\x86\x62\x67\x6b\x2f\xbb\xbc\xa3\x32\xcf\
-\x87\x68\x55\xca\x75\x99\x8a\xa0\x0a\xc1\x44\x10\x36\x8f\x97\x12\
-\xd3\xca\x33\x45\x53\x7c\x52\x36\x2a\x60\x58\xa7\xb7\xf7\x78\xcd\
-\xcb\x9f\xec\xbe\xfe\x6b\x30\xf4\x5a\x41\xa5\xe0\xfe\xf2\x24\x58\
-\xfa\xb0\x97\xbc\x4c\xbe\xa6\x73\x75\x69\x86\xdb\x6c\xa3\x76\xf2\
-\x85\x89\x25\xfa\x6d\x3f\xf3\xa4\xa2\x2a\x8b\x42\xa6\x02\xa3\xea\
-\x2b\x6a\x41\x2f\xa9\x2c\x9a\xc2\xfd\xa9\x58\x0e\x37\x39\x29\xd9\
-\x1d\x45\xee\x99\xca\x50\x06\x2e\x7b\xac\x70\xbb\x8c\x47\x2d\x3e\
-\xf6\xec\xd8\x53\xe5\x97\x1a\xdc\xc7\x0e\xf7\x17\x33\x80\xc9\xdb\
-\xba\xae\x64\x15\xf9\xa1\xcf\xca\x8f\xb0\x59\xc8\x27\x3f\x32\xca\
-\xa3\x2b\xc3\xb7\x0f\x79\xb2\xa3\xbc\x91\xa5\xcb\xb3\x86\x36\xb0\
-\x97\xf3\x1e\x64\x4d\xd3\xfb\x59\x79\xb2\xfa\x1f\xe8\x5d\xe2\x60\
-\x55\xee\xdd\x34\xa4\xf7\x31\x10\x92\xab\x86\x01\xb7\x90\x18\xe2\
-\x1e\x81\xd1\x11\xf2\x9e\xd9\xf0\x72\xc2\x9d\x6f\xaa\x5e\xd3\xd3\
-\x65\x58\x5c\xc6\x7f\xfd\x97\x54\x08\x0e\xd4\x7f\xdc\xab\xbd\x49\
-\xcb\x6e\x14\x26\x51\xa1\x87\xe3\x2c\x52\x76\xd3\xd2\xca\x24\x33\
-\xd3\xdd\x05\xe1\x11\x92\xb6\x41\x47\x55\x27\xb0\x51\xeb\xa4\x42\
-\xef\xe8\x80\x1a\x2b\x6c\xfd\x69\xec\x43\xbd\xa0\xfc\xcd\x26\x4a\
-\x56\x74\xb2\x94\x25\x7d\x63\x87\xb0\xf4\x0b\x1d\x30\x26\x63\x3f\
-\xf2\xec\x65\xe1\xb9\x39\x5a\xc7\x71\x9c\xbd\xc2\x92\x3a\x66\x0d\
-\x9b\x93\x65\x56\xfb\xed\xae\x7a\x4d\x38\x16\xf5\xa2\x58\xd6\xd7\
-\xe0\x56\x41\x7c\x2e\x0a\x6b\x7f\x8d\x43\x2e\x8e\xdd\xba\xd1\x1d\
-\xee\xe9\xcd\xd2\xa7\xe8\x73\x79\x2e\xc7\xd9\x47\x5e\xad\x66\x85\
-\xe3\x38\x87\x9a\xf8\xb8\x1c\x61\x8b\x20\x47\xfb\xa0\x98\x49\x6b\
-\x8f\x27\xbc\x5b\x0c\xcf\x37\x81\xf5\xa9\x95\x93\x05\x5b\xbe\xc2\
-\x57\xf3\xb4\xf6\x93\xe3\xec\x2b\xee\x68\x1d\xc7\x39\x14\x30\x44\
-\xca\xe4\x1a\xbb\xd7\x97\xc4\xf6\xf4\x24\x30\xdf\xb8\xe0\xfe\xbf\
-\x29\x0f\xb7\xd7\x29\x84\xe1\x3a\x75\x11\xef\x62\xe5\x82\xe3\xcc\
-\xc3\xb5\xca\x71\x9c\x43\x01\x13\x73\x2a\xe8\x81\xb2\x8b\x95\x7d\
-\x56\x67\xd6\x76\x85\x6a\xe8\x6c\xd9\x60\x83\x79\x17\xc3\xde\x2b\
-\xfe\xba\x9c\x40\x95\x0f\x8a\x89\x3c\x8e\xb3\x9f\xb8\xa3\x75\x1c\
-\xe7\xd0\xc0\x72\x13\xeb\x89\xa6\x79\x48\x4e\x76\xd4\xcb\x65\x62\
-\x13\x13\x74\xf2\x10\x7f\xab\x6f\x3b\x96\xe1\x74\xd9\x57\xda\xb6\
-\x62\x2c\x27\xee\xb0\xa9\x43\xeb\xdb\xc5\x5e\xe9\x76\x8f\xd7\x96\
-\xa2\xa5\x61\xeb\xb3\x0d\x9b\xa9\x6b\x43\xc9\x84\xe7\xb0\x97\xb8\
-\xf3\xea\xe1\x93\xa1\x1c\xc7\x39\x34\x30\x91\x69\xf5\xaf\xda\xc1\
-\x96\x54\xa9\x27\x9a\x76\x07\xb6\x41\x0a\xcf\x05\xb6\xd9\xc6\x0a\
-\xb6\xa9\x86\x0d\x2f\xe3\x3c\xf5\x1d\x07\xaa\x2e\xb0\xed\x2c\xc6\
-\x26\x27\x7c\x97\xb7\x4e\x1f\xf6\x43\xca\x5e\xc9\xdc\xe3\xcd\x74\
-\xc9\xcf\x5b\x0b\xef\x2c\xe7\x38\x4d\x70\x47\xeb\x38\xce\xa1\x22\
-\xb9\xa2\x9e\xe9\x0f\xd8\xfb\x59\xde\x91\xde\xad\x1c\x25\x0f\x17\
-\xc8\xb6\xe4\x30\xd5\x53\xad\x26\x3a\x15\xf7\x72\x71\xb2\xf6\xb5\
-\x70\xb0\xcc\x50\x56\x60\x59\x90\xc1\xf9\x72\xda\xd9\xef\x9a\xcd\
-\x58\x76\x9c\xdd\xe0\x8e\xd6\x71\x9c\x43\x07\x6b\x3a\x93\x2b\xb1\
-\x6d\x5c\x81\xa3\x65\x38\x19\x6c\x97\x27\x7a\xbb\x25\x23\xeb\x56\
-\xe5\x60\xed\x38\x02\x3e\x5a\x7f\xb3\x8d\x1c\x6a\x8f\xd8\x73\x9c\
-\x65\xe0\x8e\xd6\x71\x9c\x43\xcb\x70\x13\x05\x36\x96\xb1\x87\x5b\
-\xc8\x99\x96\x7f\x33\x87\x6b\x9d\x5e\xbd\xf3\x23\x6f\xec\x4d\xc1\
-\xe6\x1a\x4f\xf4\xce\x76\x93\xfb\xb0\x91\x83\xe3\xcc\xc3\x1d\xad\
-\xe3\x38\x2f\x1d\x4c\x8e\x0a\x6b\x72\xa2\x9b\xdb\xe6\xed\x30\x3e\
-\xfc\xdd\x79\x39\x88\xcb\x77\xc7\x71\x9c\x97\x06\x9c\x6a\xb5\xd5\
-\x68\x15\x1c\xe7\x45\xe1\x8e\xd6\x71\x1c\xc7\x71\x96\x88\x3b\x5a\
-\xc7\x71\x1c\xc7\x59\x22\xee\x68\x1d\xc7\x71\x1c\x67\x89\xb8\xa3\
-\x75\x1c\xc7\x71\x9c\x25\xe2\x8e\xd6\x71\x1c\xc7\x71\x96\x88\x3b\
-\x5a\xc7\x71\x1c\xc7\x59\x22\xee\x68\x1d\xc7\x71\x1c\x67\x89\xb8\
-\xa3\x75\x1c\xc7\x71\x9c\x25\xe2\x8e\xd6\x71\x1c\xc7\x71\x96\x88\
-\x3b\x5a\xc7\x71\x1c\xc7\x59\x22\xee\x68\x1d\xc7\x71\x1c\x67\x89\
-\xb8\xa3\x75\x1c\xc7\x71\x9c\x25\xe2\x8e\xd6\x71\x1c\xc7\x71\x96\
-\x88\x3b\x5a\xc7\x71\x1c\xc7\x59\x22\xee\x68\x1d\xc7\x71\x1c\x67\
-\x89\xb8\xa3\x75\x1c\xc7\x71\x9c\x25\xe2\x8e\xd6\x71\x1c\xc7\x71\
-\x96\x48\x74\xf2\xca\x9b\x79\xf9\xd9\x71\x1c\x67\x5f\x89\x56\xf4\
-\xdf\x6a\xcd\xc4\xe8\x63\xfe\x4c\xef\x83\xa8\xf8\x7e\x00\x88\x4e\
-\x4c\x37\x81\xf9\x93\xf9\xf1\xdc\xeb\xf9\xce\xcb\x8f\x3b\x5a\xc7\
-\x71\xf6\x8d\x68\x35\x84\xe4\x72\x08\xf1\x45\x39\x98\x8e\x4c\x4b\
-\x5a\x9a\x17\xbd\xe5\xfa\x97\x3e\x1b\x84\xfc\x8b\x38\xe4\xf7\x5a\
-\xc5\xef\x07\x80\x23\xff\x57\x3b\xf4\xef\x6e\x95\xdf\xb6\xe9\xdd\
-\xe8\x85\xe8\x9a\x12\x34\x87\xbd\x9e\xef\xbc\xfc\xf8\xd0\xb1\xe3\
-\x38\xfb\x42\xfb\xdd\x38\xac\xfc\x45\x12\x92\x77\x22\x73\xb8\x06\
-\x1d\xba\xd2\xd7\x9a\x93\x7d\x9a\x85\xbc\x72\xbe\x07\x84\x78\x25\
-\x09\xed\x73\x74\xbd\xb7\x19\xdc\xe9\x35\x8e\xe7\x5e\xcf\x77\x5e\
-\x7e\xdc\xd1\x3a\x8e\xb3\x67\xe2\xb3\x51\x68\x7d\x33\x09\xd1\x51\
-\x7d\x8e\xe5\x5d\x8b\x57\xc8\x7b\x59\x71\x00\x3e\x27\x0d\x21\x4b\
-\xcb\xef\x07\x8c\xba\xb3\xc4\x49\x2e\x1a\xcf\xbd\x9e\xef\xbc\xdc\
-\xb8\xa3\x75\x1c\x67\xcf\xac\xfc\xa8\x15\xa2\x44\x1f\x5a\x32\x29\
-\x7a\xa5\x1b\xfd\x30\x78\xdc\x57\x2f\x36\x0d\xf9\x40\xbd\xd8\x3c\
-\x0f\xc9\xf1\x56\x48\x8e\x1c\x9c\x21\xe3\x71\x70\x96\x21\x8a\x76\
-\xed\x24\xf7\x7a\xbe\xf3\xf2\xe2\x8e\xd6\x71\x9c\x3d\x11\x9f\x8b\
-\x43\x7c\x34\x96\xa3\x25\x44\xa1\x77\xa3\x1b\xd2\x07\x83\x61\x6f\
-\x36\x1b\xe4\x21\x7b\x1c\xd9\xc4\xa0\x24\xee\x84\xa8\x85\x47\x76\
-\x9c\x57\x07\x77\xb4\x8e\xe3\xec\x89\xf8\x98\x75\xe4\x42\x24\x6b\
-\x82\xa3\xcd\xfb\x79\xc8\xb3\x2c\x64\x5b\xa9\x1c\xac\x7a\xb7\xbf\
-\x4a\x42\xfa\xdb\x28\x0c\x7e\x1d\x85\xfe\xaf\x43\xc8\xef\xba\xd9\
-\x71\x5e\x2d\x5c\xe3\x1d\xc7\xd9\x13\xd1\x91\xf2\x83\xc8\xfb\x72\
-\xae\xb5\xfb\xb2\xf9\x1d\xf5\x5e\xfb\xdc\xad\x75\x9c\x57\x17\x77\
-\xb4\x8e\xe3\xec\x89\xd6\xb9\xb1\xa1\xe0\x1c\x0f\x5b\x7e\x76\x1c\
-\xc7\x1d\xad\xb3\x20\xa3\xab\x18\x9e\x0f\x2f\x42\xe6\xcb\xce\x7e\
-\xe6\x29\xe3\xc6\x25\xd9\x93\x41\xf9\xa9\x20\xea\xbb\x89\x71\x1c\
-\xdf\xb0\xa2\x21\x2c\xc2\x8f\x4e\xca\xa0\xb4\xb3\xed\x35\x82\xed\
-\xb2\xe5\xae\x16\x7c\xfe\x28\x0a\xf9\x96\x42\x57\xc6\xe6\x9e\x7e\
-\xeb\x35\x1f\x2e\x8b\xce\x44\x21\x3e\x3b\x79\xa6\x62\x7a\x5b\xbf\
-\x3f\x9e\x3f\x79\x64\xd6\x35\x06\x5f\x2a\xce\x9b\x8b\x4f\x40\x89\
-\x4e\x2b\xdd\x17\x23\xa5\x5b\x89\xd4\xa5\xa3\x0e\xf7\xde\x48\x73\
-\x1e\xb2\x4d\xa5\xaf\xab\xef\x4f\xe2\x85\xd3\x3b\x8b\x11\x99\x7c\
-\x6f\x3d\x67\x99\xc8\x62\xa3\x05\xb2\x52\x9f\x99\xc4\x13\xba\x2a\
-\xd7\x9e\xbe\xde\xd5\x6f\xfb\x20\xb3\x92\x37\xa2\x4b\x95\x4c\x92\
-\xfa\xd8\x92\x6b\x93\x87\xf6\x2a\x73\x19\xb2\xda\x1f\x28\xff\xb7\
-\xd2\xf2\x9b\x7a\xb4\x97\x93\xd0\xbe\xd0\xb1\xcf\xfd\x7b\x5b\xa1\
-\x7b\x6d\xc3\x96\xf6\x70\xbf\x36\x6e\xe9\xf7\x74\xd4\xd9\x4e\xd2\
-\xe9\xf1\x6b\x56\xe4\x8f\x55\x06\xb7\xe7\x3b\xeb\xe8\x48\x14\x12\
-\x99\xb2\x49\x6b\x57\xb3\xfb\x69\xc8\xef\x4f\x9f\xed\x7c\xec\x3f\
-\x6f\x6f\x2a\xb1\x75\x7d\x33\xf4\x6e\x6c\xda\xe7\x7c\xa0\xf8\x7f\
-\xb1\x66\x9f\x67\xb1\xe8\xf9\xd1\x4a\x1e\x92\xaf\x49\xa7\x26\xc4\
-\x35\xdf\x50\x7c\xaf\x37\x2f\xef\x48\x97\x4f\xde\xd2\x79\x13\xae\
-\x95\xde\xd6\x6f\x8f\xbd\xa1\x73\x10\x48\x56\x4f\x9c\xfa\xbb\xf2\
-\xb3\x33\x81\xf6\xd7\xa3\xd0\xfe\x4e\x1c\xe2\x4b\xea\xfe\x1f\x2d\
-\x2a\x09\xcb\x18\x6c\x29\x03\x60\x98\x41\x3d\x84\xe8\x88\x3e\x1f\
-\x4d\x0b\x87\xc7\xcf\x1b\xcd\x94\xbc\x75\x31\x0e\x2b\x1f\xb4\x75\
-\xca\xc0\xd6\x21\x56\x21\xed\xf6\x43\x60\xbb\xba\xee\x7c\x27\xd9\
-\xfe\x9a\x8c\xdd\xd7\x93\x90\xc7\xe9\xe8\x35\x36\x7a\xaa\xbc\x71\
-\x88\x7a\xcd\x2b\x5c\xfb\x9d\x22\xcd\xc9\xd5\x62\xa2\x4b\xb0\xf4\
-\x96\xe9\xd4\x1b\x86\xd9\xf2\x00\xdb\x7a\xbc\x48\x6f\x7c\x4c\x46\
-\xee\xa9\x0c\x44\xd6\xdc\x48\xd4\x99\x28\x33\x2e\x65\x8a\x5c\x59\
-\xba\x14\x99\xef\x4b\xe6\x1b\xba\x2e\xf9\x25\x5b\x6c\x32\x70\x13\
-\x55\x3a\x25\x2f\x3a\xaa\x0f\xc7\x24\x4f\x32\x23\x7e\xc7\x19\xed\
-\x42\xa6\xe9\x52\x29\xcf\x26\x10\xd5\x74\xc9\x64\x9a\xf3\xd3\x6f\
-\xf4\x36\x49\xe7\xb1\x22\x9d\xbb\x91\x99\x5c\xd1\x25\xbe\x97\x2c\
-\x20\xab\x4c\x9f\xd2\x9a\xaf\xcf\x96\x75\xe4\x6f\x75\x52\x4b\x17\
-\x58\xe1\x78\xfd\x40\xbe\xb5\xa4\x63\x2d\x39\xeb\x67\x69\x18\x3c\
-\xea\xab\xec\xe4\xf8\x8e\xb1\xae\x36\x09\xf1\x71\xfd\xbd\xd2\xc7\
-\x29\x3a\x3d\x7e\x4d\x42\x16\x0f\x42\x9a\xaa\x4e\x3c\x9a\xbf\x24\
-\x28\x6a\x47\x61\xf5\x2f\x95\x10\xf4\x7f\x4d\xe9\xaa\xae\x91\xf7\
-\x43\xd6\xd5\x35\xd7\xa7\x5f\xa3\xf3\xfe\xf6\xdf\xd2\xa7\x92\xa9\
-\x60\x28\x0f\xa2\xc7\xed\xe2\xf3\x0c\x16\x3e\x3f\x8d\xc2\x9a\xd2\
-\x4b\xfc\x42\x6b\xb4\xbe\x66\x03\xb5\xe8\x9e\x29\xef\x07\x0d\x6d\
-\xc7\x95\x58\xf5\x46\xf5\x3e\x1a\xab\xf7\x9b\xfd\x90\x3f\x54\x99\
-\xf8\x88\xc2\x81\xc0\x4b\x61\x06\xab\xff\xae\x15\x5a\xdf\x90\xb2\
-\x56\x93\x3d\xb0\x3d\x34\xba\x07\x58\x60\xbd\x08\x1d\xfd\xa7\x4a\
-\x1e\xaf\x61\xc1\xf4\x59\xb6\x82\x35\x83\xd1\xf9\x41\x88\xdf\x94\
-\x51\x51\x8f\xac\x09\xe3\xbb\xcb\x0c\xee\xcb\x40\xf4\x76\xb6\xf0\
-\x67\x91\x1c\x55\x7c\x4f\x63\x35\x0b\x16\x5d\x38\x4f\xeb\x78\xf5\
-\xdf\xea\x1a\xef\x96\x69\x26\xbd\x15\x66\x98\x15\x48\xa6\x8c\x68\
-\xa4\xb4\x92\xce\xca\x60\xe7\x47\x64\xa8\xbf\xd9\x0b\xd1\xb9\xc5\
-\xe2\x3c\x53\x26\xf2\x08\xd2\xd2\x4a\x26\xb2\xf6\x4d\xe6\x37\x74\
-\x4d\x7d\xb6\x6b\x63\xf7\xe9\x15\x94\xe9\xc4\x69\x10\x28\xdb\xa2\
-\xdc\xf5\x23\xb2\x2f\xc8\xa0\x7d\x4d\xe5\x2a\xd9\x8b\xb0\xf2\xe3\
-\x64\x67\x1a\x75\xb9\x4a\x97\x08\xe6\xd4\xa5\x4f\xd1\xea\xb6\x2e\
-\x99\xcc\xf3\x72\xb8\xef\xa9\xc1\x74\xb2\x59\x3a\x71\xb0\x9d\xef\
-\xca\xc9\xd1\xf0\xab\xc9\xca\x67\xc9\x42\x0e\x81\x3c\x6d\x20\x0b\
-\x5d\x45\x67\xe9\xb5\xe2\x64\xb3\xbe\x8e\xaf\x1a\x9d\xa0\x7c\xa3\
-\x71\xc4\xe4\xa8\xbc\xf4\x3b\xf3\x74\xba\xba\x26\xa4\x9b\x8b\xef\
-\x22\x15\x2b\x1e\x2d\x5d\x83\x38\x41\xba\xde\x97\xd3\x5b\x4c\x37\
-\x9e\x17\x5b\xbf\xed\x17\xeb\x8a\x4f\xb5\xb7\xe3\xfb\x40\xce\x91\
-\xfa\xba\xd6\x5c\xb7\x5a\x6f\xaa\x21\xd3\x51\x83\x4a\xd7\x81\x4c\
-\xf9\x36\xb8\x57\x5c\x67\x91\xc6\xb5\xb3\x5c\xbc\x24\xa6\xb0\xf6\
-\xbf\xab\x02\x1c\xc1\x22\x15\x76\x28\xdb\x50\x4b\xf5\xa1\x1c\x97\
-\x0c\x45\x56\x19\x14\x0c\xb4\x2a\x77\xbc\xd2\x32\x47\xdb\x3a\xdb\
-\x0e\xc9\x49\x59\x30\x6c\x16\x46\x06\xa3\x75\x49\x2d\xd4\x86\x54\
-\xce\x76\x37\x4e\xb6\xa2\x72\xb6\x8b\x3a\xd9\xf8\xb5\x28\xac\xfc\
-\x9b\xd6\xb6\x23\x90\x66\xb0\x0e\x32\x7d\x22\xa7\xa2\x77\xdb\x74\
-\x40\x21\x8a\x95\x5e\x19\xe7\xf8\x08\xe9\xed\xc8\x58\xa8\x27\x9e\
-\xeb\x04\x1c\x1f\xd9\x72\x56\x3d\x90\x4b\x3a\xa7\x01\x38\xb9\x99\
-\x32\xfb\x3b\x65\x26\xa5\xcc\xa0\xdf\x2c\x9f\x17\x94\x69\xe9\xfc\
-\x49\x29\xd3\x9c\x37\x65\x2b\x83\x2c\x23\x97\x6d\x62\xd8\x15\x28\
-\x5f\x5d\x9e\xf2\x48\xd6\x5a\xa1\xfd\x5a\x21\x13\x87\x6c\xce\x44\
-\xbd\xfb\x48\x8d\xa8\xc6\x8e\xef\x07\x32\xa8\xe7\xb8\x60\x29\xaf\
-\xab\x5e\xdf\x7d\x95\xcf\xba\x74\xa9\xdc\xcc\x01\x48\x67\xd4\x56\
-\x3a\x57\xe5\x30\x4e\xb7\xcd\x69\x04\x8c\x30\x79\x2b\x51\x31\x69\
-\x9c\xd3\x70\x43\x56\xeb\xea\xb6\xac\xbc\x97\x87\xc1\x03\x64\xc9\
-\x71\x21\xab\x72\x5c\xe3\xb2\xce\x4e\x90\xb5\x36\x27\x7d\xa8\x17\
-\x8e\x56\xa7\xb1\x1b\xd4\x30\x66\xfa\x3e\x7c\x57\x54\x02\x23\x13\
-\xfa\x1c\x49\xd6\x3c\xd0\x7f\x8b\xb7\x9c\xec\x6e\x36\x7e\xa8\x9c\
-\xed\x41\x76\xb2\x90\xdd\x2d\x72\x8b\x0d\x3c\xda\x17\x56\x95\x39\
-\x51\xd1\x58\x81\xd5\xe6\xf1\x8e\x8e\x15\x99\xcd\x75\xcc\x46\x3d\
-\x51\xc3\x86\x7c\x7b\xa6\xbc\x3e\x40\x0f\x6e\x78\xd5\x99\xaf\xf9\
-\xaf\x20\xad\xb7\x64\x84\x8e\xca\x80\xd0\xb8\x96\x21\xe9\x5d\xdf\
-\x94\x02\x0f\x54\x11\x54\xf9\x09\x8f\x54\x51\x6e\x29\xdc\x56\x2b\
-\x54\xef\xdc\xbf\x33\x63\xa3\x1e\x10\x46\xab\x7d\x49\x15\x07\x1b\
-\x21\xa3\x95\xad\xea\xc3\x99\x66\x4e\x00\x30\xee\xbb\x75\xb2\x15\
-\x0c\xa3\x2d\x6a\xa4\x3a\x7f\x4a\x63\x01\x6b\xa8\x2f\x4a\x0c\xc6\
-\x79\xf0\x50\xce\x87\xf4\xaa\x27\x84\x2f\xc8\xcd\x02\x96\x46\x53\
-\x69\x8d\x95\x37\xb4\xca\x3b\x57\x56\xad\xc1\x61\xbd\x33\xfe\x7e\
-\x5c\x5d\x98\x79\x46\x5a\xac\xfc\xb4\x2d\xe7\x59\x93\x29\xe7\x53\
-\xc9\x4c\x71\xb2\x63\x32\x43\x4d\x66\xfb\xd2\x4a\x48\x30\xdc\x88\
-\xa9\x64\x9e\x29\xbb\x4e\x33\x20\x9d\x55\x03\x0a\x67\xd4\xbb\xd9\
-\x0d\xe9\x46\xe5\xf0\x70\xb2\xba\xdc\x13\x39\x8d\x87\x0a\x5d\x1d\
-\x86\x0e\x48\x4c\x72\x42\xe9\xbc\x7a\x44\xef\x72\xf2\x12\x87\xcc\
-\xf8\xe2\x7c\xc7\x47\x63\x22\xb9\x20\x61\x76\x9d\x48\x3d\x35\xa5\
-\xcd\xf6\xc1\xc5\x91\x14\xf9\x9a\xdd\x56\x79\x49\x97\x06\xd7\x74\
-\x59\xee\x09\xeb\xb8\x58\x65\x68\x46\x18\x5d\xaa\x1a\x15\x38\xc9\
-\xf3\xb3\x1b\x6e\x95\x2c\x1a\x05\x0c\x99\x0e\x6e\x75\xcd\xc1\x66\
-\xca\x27\x93\x75\xb7\x90\x95\x0e\x65\xe9\xa5\x7c\xdd\x21\x8b\x06\
-\xc5\xe9\xe9\xf9\xd9\xbf\xbd\x55\x18\x74\xd2\x80\xaa\xd1\x3b\x96\
-\x4c\x43\xa7\x46\x9c\x4a\x3c\xda\xaa\x4b\xe6\x8c\x55\x37\xe8\xc1\
-\x91\x7f\x73\x48\xd5\x38\xd8\xcb\xee\x4a\x38\x5b\x49\x2e\xbe\x1c\
-\x50\x70\xb4\x83\xcf\xb6\xd3\x88\x4e\x0f\x51\x03\x3d\x3f\x31\x5f\
-\x97\xb1\x53\x56\x7f\x4a\x68\x54\x55\xe4\x0d\x86\xdb\x9d\xe7\x07\
-\x1a\xe9\x8c\xc1\x70\x4c\x31\x9c\x28\xa3\x44\x0f\x6b\x53\x86\x58\
-\xbd\x90\xd0\x97\x01\xf8\x5c\x8e\xf0\xc3\x24\x0c\xfe\x28\xc7\xf0\
-\xa1\xc2\xef\xd4\xf9\xfa\x59\x16\x7a\xbf\x56\xa5\x61\xc5\x3e\xaf\
-\x8e\x5a\xd5\xea\x05\xb1\x53\x8e\x59\xb7\x95\xbd\x39\xce\x65\xb3\
-\xfa\x57\x72\xb2\x54\x58\x45\x97\x34\xf7\x6e\x3c\xb3\xfb\x4c\x36\
-\xd4\xa8\x57\xc6\x04\xa4\x7b\x71\xc8\x3e\x66\xc3\x01\xa5\xf9\x93\
-\x3c\xf4\x3f\x55\xaf\x8e\x3c\xd2\x39\x89\x1a\x07\xe6\x6c\x65\x54\
-\x31\xd0\x24\x79\x9e\xd3\x1b\xca\xe4\x55\xc9\xb4\x5e\x57\x21\x33\
-\xdf\x52\x18\x93\x39\x30\x99\x65\x36\x4b\x66\xeb\xa2\x7a\x3f\x72\
-\x12\x43\x99\x73\x9c\xfb\x0a\x8d\x09\xc9\xe4\x7c\x73\xb2\xd7\x9e\
-\x85\x6c\x4b\x4e\xa8\x34\x50\xe9\xb5\x38\x0c\xfe\x49\x65\xfb\x1b\
-\xc9\xfc\x95\xca\xf5\x1f\xf3\xb0\xf5\x33\x95\xfd\xf5\x22\x8e\x9c\
-\xd3\xb9\xb8\xaa\x06\x49\x95\x4e\x9d\x77\x61\x8e\xe3\x7b\x5b\xc6\
-\x90\x5d\x93\xc8\x2b\xd9\xbe\x81\x1c\x94\x39\x75\xc9\x0d\x77\xe3\
-\x62\x33\x07\x74\xe9\x23\x39\xe1\xcf\x24\xf3\x17\x59\xd8\xfa\x7b\
-\xe5\x43\xf9\x30\x18\x7a\xf2\xed\x33\x1d\x93\x69\x89\x3c\x32\x3d\
-\x8d\x66\x78\x6d\x87\x26\xc5\x55\xb2\xfa\xb7\xb6\x65\xe5\x6a\x1c\
-\x4e\x96\xa5\x1e\x50\x99\x84\x11\x59\x38\xda\x29\xb2\xba\xbf\xd9\
-\x0a\xe9\x0d\xe5\x9b\x1c\x36\x0d\x4e\xee\xc5\xc6\x63\xbb\x3d\xe1\
-\x28\xf3\x67\xba\xc6\x7d\xe5\xd5\x9d\xc2\xb9\x13\xe2\x67\x44\x6c\
-\xf4\xd8\x57\x95\xfe\x67\xdb\x75\x24\x39\x36\xea\x18\x99\x04\x38\
-\x0f\xec\x54\x85\x8d\x5a\xc8\x56\x55\xf8\xb0\xf1\xc1\xc2\x4b\x63\
-\x02\xf1\x09\x5a\xe0\xfa\x20\x83\xc5\x70\x31\x86\x1f\x52\x39\x9c\
-\xf0\x70\xb2\x91\x48\xbf\x92\xf3\xf9\x63\x6a\xad\xe9\xec\x69\x6a\
-\xe7\xb7\xce\xb4\x55\x81\xd4\x82\x5f\xe0\x9e\xcb\xf3\xc6\x7a\x5c\
-\xe7\xa5\x06\xa4\x57\x91\xa6\x77\x97\xae\xcb\xc0\x12\x65\x9c\xc9\
-\x3d\x35\x2c\x7e\x2f\x03\xfd\x89\x8c\xa5\x7a\x43\x66\xb0\x65\xa4\
-\xd3\x8f\xf3\xd0\xfd\x7f\x75\x1c\xbd\x07\x7c\x50\x47\x8e\x8f\xc6\
-\x85\x1c\x8a\x21\xa7\x97\xd3\xcb\x9c\x42\x74\xbc\xcc\xe3\x49\x32\
-\x1f\xeb\x6d\xaa\x4c\x1d\x24\x99\x9c\xbb\xa8\xcc\x58\xe9\xac\x64\
-\xf6\xbe\x90\x93\xc5\x19\xe0\xbc\x14\xb2\xdf\xab\x9c\x1e\xec\x2c\
-\xdb\x7c\x33\x0a\x5b\xbf\x4c\x43\xef\xa3\xa2\x4c\x49\xab\x0d\xf5\
-\xd9\x1f\x15\x54\xb6\xb3\x7a\x1f\x2d\x26\x04\x71\x9e\xe2\x98\xab\
-\x37\x5b\x8d\x56\xe0\xa8\xb3\x3b\xca\xbb\x09\x9b\x39\x54\x32\x6d\
-\x64\xe2\x51\x71\xbf\x0d\x43\x9c\x28\xad\xe4\x51\x7e\x6c\xb2\xbc\
-\xd6\xf9\x52\x16\xff\x71\xfd\x3d\xc8\xb2\x7c\xd5\x75\x26\xc9\x1a\
-\xfc\x56\x8d\x1e\x39\xeb\x2a\x58\xcf\x78\x02\xc8\x1f\x7c\xaa\xe3\
-\x6b\xc7\x12\xc2\xba\x9b\x1d\xa8\x86\x8f\x2b\xda\x17\x55\x19\x2b\
-\x1a\x0c\x1f\x57\xc3\xc6\x30\x78\xb0\xfd\x98\xbe\xe8\x89\xf4\xd8\
-\x87\x8d\x0f\x14\xae\xf1\x13\xb0\x16\xbd\xf4\x14\x55\xad\x26\x67\
-\x80\xb5\x32\x59\xd2\x33\x85\xf4\x6e\xb6\x3d\xa4\x56\x62\x13\x1e\
-\x4e\xcb\x88\x37\x9c\x14\xf5\xbc\x49\x2e\x94\x69\x25\x60\x8b\xbf\
-\xda\x94\xf5\x2d\x8d\x33\xbd\xca\x29\x06\x1a\xb2\xfb\xea\xf1\xfd\
-\x4b\xdf\x9c\x08\x3d\x27\xb9\x4e\xbb\xc7\xc6\x7d\x62\x1c\xc2\xb4\
-\x56\xf9\x70\xc8\xab\x94\x39\xb8\xd3\x1d\xca\xb4\x70\x5d\xf9\xb5\
-\xa0\xcc\xb8\xa9\x4c\x9c\xb2\x8a\x34\xef\xca\x41\xea\x7c\xc8\x3e\
-\x9f\x2e\xaf\x62\xf0\x7b\x2e\x5e\x9c\xcf\x10\xa8\x4d\x3a\xb3\x6e\
-\xb4\x7a\xd9\xd5\x8c\xec\x69\xe8\x34\x73\x80\x63\x44\x33\xee\xf1\
-\x62\x84\xb3\xc7\x7d\xeb\x71\x57\x24\x4c\x7a\x39\xc7\x5e\xc1\x33\
-\xe2\x5a\xca\xca\xb7\x46\xe3\x14\x33\x31\x6a\x0a\x93\x64\xd1\x88\
-\x89\xd5\x50\xb4\xdb\x09\xce\xd2\x60\x52\x54\xc5\x22\xc3\xc7\x3b\
-\x86\x8d\x6b\xe5\x9d\xad\x4f\xee\x0c\x38\x2f\x0e\x99\x39\x67\x9c\
-\xf4\xce\xb6\x01\x8c\x19\xd2\x41\x9f\xc9\x29\x19\x38\x66\x9c\xc6\
-\x17\x65\x90\x58\x8b\x38\x46\x76\x47\x4e\xe0\x1f\xf2\xd0\xfb\xb9\
-\x7a\x4c\xb5\x90\xfe\x8b\x0c\xf9\x01\x6d\x61\x76\xbe\x43\xe5\x56\
-\xdc\x64\x9d\xed\x5e\x65\xbf\x34\xb6\x24\xef\xf6\xfc\x78\xe7\xcf\
-\x14\x52\x0c\x75\x39\x09\x43\x60\x30\xe2\x19\xf7\xe2\x8a\x21\xaf\
-\x42\xa6\xdd\x8f\x95\x5c\x43\x32\xa3\x47\xf3\x5b\xe3\xe4\x33\xa7\
-\xd7\x65\xda\xfd\x3f\x1a\x34\xc9\xb6\xb3\xa8\x63\x32\xb9\xac\x82\
-\x4d\x6a\xab\x26\x9e\x70\xa9\x86\xc3\x6c\x83\xcf\x75\xed\x32\x6a\
-\xdc\x1e\xb0\x3c\x52\x98\x65\x10\x87\x69\x13\x66\x48\x39\x1f\x71\
-\x0c\xef\x5e\x1c\x84\xe8\x82\xae\x39\x41\x97\x60\xf3\xff\xce\x76\
-\xea\xd2\x3f\xe9\x1a\xe4\xd1\x04\xa6\xcb\x52\xb8\xb0\x3b\x59\xf9\
-\xdd\xc9\xb2\x9c\xfd\xa1\xde\xab\xb5\x51\x0b\x46\xc0\x4a\x66\x0d\
-\x1f\x4f\x1b\x36\x66\xed\xae\x0f\x1b\x1f\x3c\xbc\x44\x26\x30\xb8\
-\x2b\x03\xae\x77\x3a\x2c\xc9\x5a\x12\xda\xaf\x31\x13\x52\x0a\x8c\
-\xa3\x5d\x51\x05\xb8\x94\x86\xe4\x83\x41\x48\xde\x4d\x43\x7c\x59\
-\x3d\x9a\x63\xd3\x2b\xc4\x41\x27\x3e\x2a\x6b\x8c\x41\x56\xe0\x1e\
-\x69\xd5\x4b\x23\x34\xa9\xb0\x18\x8a\xad\x7f\xed\x87\xc1\x35\x39\
-\xcc\x2f\x74\x8d\x32\x44\x0f\x65\xa4\x7b\x93\x8d\x74\xab\xec\x45\
-\x13\x98\x0d\x5b\x97\x99\x3f\x98\xee\xa0\x2b\x72\x75\xba\xbb\xbf\
-\xe8\xed\x90\x19\xee\x49\xe6\xe6\xe4\xf3\xb9\x1d\x50\x81\x61\x1a\
-\xc2\x5a\xe7\x86\x8d\x20\xd6\x88\x56\xd8\xcc\xe7\x12\x33\x88\x53\
-\x8c\x62\xaa\xfc\xb1\x94\xe9\x3f\x1a\x24\x9d\xab\x47\xcb\xfb\xb5\
-\x0a\xcc\xfc\x95\xb3\x4d\xde\x57\xf8\xee\xa0\xd0\xa5\xd7\x24\x63\
-\x8a\x33\x9c\xc7\x88\xac\xac\x2e\x8b\xfb\xb6\x0a\x97\xf6\x4f\x96\
-\xb3\x3f\xd8\x68\xc2\xdd\xed\xc6\x21\x43\xf6\x15\xb3\x1a\x70\xd3\
-\x86\x8d\x63\x9f\x6d\x7c\x20\x71\x47\x3b\x81\x94\x1e\x93\x74\x1f\
-\xc3\xc8\x3d\xbc\xd6\xf9\xd5\x62\xd9\x01\x33\x32\xc9\xb1\x52\x8f\
-\xa3\x13\xb9\x0c\x96\x9c\xee\x37\x15\x7e\x88\xf1\xca\x0a\xe3\x75\
-\x48\xe0\xfe\xac\xbd\x2b\x3d\x84\x6c\xbd\x1c\xc6\xc2\x50\x33\x94\
-\xda\xb0\xc2\xa6\x9f\xe6\x21\xfd\x5c\x3d\xa0\xb1\x10\x4d\xd8\xb0\
-\x63\x5c\x66\xbd\x37\xbb\x4c\x99\x0c\x81\x56\x32\x2b\x98\x34\x94\
-\x5c\x55\x43\xea\x27\x59\xa3\x10\x4e\x0d\x86\xce\x96\xde\x47\xad\
-\x7d\x10\xf2\xf6\xb6\xb1\xac\x43\xef\x3b\x63\x27\x24\x1b\x16\x2f\
-\xce\x6b\x5f\x58\xb3\xa1\x59\x74\xc9\xee\x2f\xf3\x92\x7d\x35\x5d\
-\x7a\x5b\xfa\xf6\x81\xde\x69\xc4\x5d\xd2\x09\x0b\x38\xc2\x11\x59\
-\x8a\xe6\x0e\x59\x96\x01\xfb\x23\xcb\xd9\x3f\x7a\xd7\xb6\x1d\x6a\
-\x7c\x6c\xbb\x71\x4a\x03\x6e\x92\xb3\x35\x7d\x9e\x32\x6c\xdc\xa4\
-\xa1\xea\x3c\x7f\x76\x5a\x25\xc7\x5a\x99\xdd\xff\xc9\x24\xa8\xc2\
-\x60\xf1\x4e\x0f\xa6\x73\x69\xd5\xee\x3f\x5a\x2f\xa1\x6e\xb1\x4b\
-\xa2\x8b\x32\x58\x6f\x66\x21\xf9\x7e\x39\xbc\x3c\xe3\x7e\xee\x41\
-\x80\x09\x49\xd3\x88\xf6\x61\xab\xc1\x26\xe4\x13\xb6\xdd\x5b\x36\
-\x18\xa6\x78\xad\x15\xe2\xd3\xed\x10\x33\x33\x7c\x01\x06\x0f\x7b\
-\xb6\xce\x37\xed\xa5\xb6\x8e\x78\x58\xc2\x33\xee\xd3\x6e\xfd\x6e\
-\x60\x3d\x4c\x1c\x20\x21\x39\x2a\xe7\x7e\x7e\xc5\x1c\x21\x33\x7d\
-\xc7\x61\x59\x32\x3b\x35\xd9\xc8\x09\x3d\x50\x39\xc2\xe8\xa8\xf4\
-\xa9\x01\xc8\xca\xd6\x4b\x59\x7a\x8d\xc8\x3a\xd2\x50\xd6\xe9\xe7\
-\x5f\x26\xaf\x32\xe9\xe7\x2a\xa8\x92\x6a\x82\x5f\x45\x34\x61\x22\
-\x25\x33\xd9\x2b\xc6\x87\x8d\xbd\x37\x7b\x30\x71\x47\x3b\x85\xf4\
-\x8b\x3c\x6c\xfd\x73\x39\xac\x89\xd1\x2a\x4d\xaa\x6d\x08\x71\xa6\
-\x63\x81\x05\xf8\x84\x9c\x5e\x89\x75\x6f\xb6\x61\x48\x30\xfe\x66\
-\x7f\xe1\x5d\x8b\x9e\x27\x36\x6c\x5c\xa3\xde\x32\x8e\xe6\x4c\x0e\
-\xda\x2d\xc9\xc5\xe9\x2a\xb7\x2c\xe7\x5e\x6f\x50\x98\x51\xa2\xac\
-\x14\x6c\xbd\x25\x7f\x5a\x30\x0c\xd6\xd9\x7d\x67\xcb\x96\x35\xb1\
-\x6e\x7a\xb4\xe4\x77\x62\x0d\xb7\x9f\xc9\x01\x6e\xe8\x4b\x29\x1b\
-\xd0\x25\xee\xa5\x72\x6b\x22\x3e\x52\xe8\x92\x4d\xd6\xaa\xeb\x12\
-\x1f\x8f\xc8\xf9\xbd\x33\x68\xa4\x4b\x36\x94\xff\x8b\x52\x56\x56\
-\xa6\x55\x98\x2c\x05\x93\x25\x99\x13\x65\xc1\x11\x39\xdd\x37\xd4\
-\x60\x7c\x63\xfa\xb0\xa5\xb3\xff\xd4\xd7\xd4\xb6\xce\x6c\xef\x10\
-\x97\x4f\x58\xb2\xd6\x7e\x9b\x79\x15\x05\xf5\x61\xe3\xf0\x60\xfb\
-\x77\xe7\x60\xe1\x8e\x76\x06\x2c\xd9\xe9\xfe\xd7\x7e\xe8\x7f\x94\
-\x85\xac\xd8\x27\x7c\x84\x84\xdd\x8a\x14\x5a\x27\x65\xc4\x4e\xa9\
-\x77\x44\x6f\x97\x49\x2e\xa2\xea\x09\x87\x73\x32\x90\x67\x0f\x70\
-\x0f\xa1\x1a\x4f\x55\x30\x9b\x3b\x66\x77\x97\x42\x4d\x26\x6b\x74\
-\x4d\xe6\xb2\xe5\x96\xf2\x98\x45\xce\x96\x80\xe9\xb3\x34\xa4\xec\
-\xc9\xab\xdf\x76\x1b\x80\x8d\x1e\x70\xb6\xe6\x84\x67\xc0\x6c\x69\
-\xd3\xa5\x0f\x4b\x5d\x1a\x3b\x9e\x78\xa1\x4b\x6c\x8c\x91\xb0\x96\
-\xb5\xd2\x25\xbd\x6c\x43\x08\x1a\x7b\xe8\x52\x83\x1d\xb0\x46\x64\
-\x75\xf5\xc3\xb8\xac\x96\xf2\x61\x92\x2c\x61\x3d\x6f\x29\x42\xce\
-\x7e\xd2\x57\x67\xaf\x11\x76\xf6\x8f\x69\x6b\x6a\xc7\x87\x8f\x67\
-\x0d\x1b\x47\xcf\x76\x8e\x58\x38\x07\x03\x77\xb4\x73\x60\x9d\xe1\
-\xe0\x63\xf5\x12\xfe\x5b\xa6\x1e\x6e\x16\xfa\x9f\x48\xf1\x31\x5e\
-\xe8\x37\x76\xb0\x34\xba\x0c\xf9\x58\x8f\x81\xe1\x65\x66\x7c\x62\
-\xac\x4a\x03\x99\x9f\x91\xc1\x9a\x31\x83\xf0\xc0\x81\xad\x5d\xd2\
-\xb0\x77\xb6\x31\x7a\xdd\x68\x45\x0e\xbe\xfc\xbc\x2c\xf2\xf5\xf2\
-\x43\x49\xa4\xde\x23\x70\xbf\xb5\xf7\x45\x3f\x0c\x3e\x52\xcf\x60\
-\x0f\x21\xff\xaa\x15\xe2\x29\x13\xbf\xc6\x19\xea\xd2\xcf\xd2\x51\
-\x5d\x92\x32\x99\x2e\xa9\x97\x69\xbb\x5f\xa1\x4b\x17\x2a\x5d\xd2\
-\xab\xd2\xa5\x86\x3b\x60\x81\xc9\xfa\x87\x39\xb2\x14\x76\xc8\xa2\
-\x5d\x28\x59\x19\x6b\x39\x1b\xca\x72\xf6\x06\x23\x11\x75\xea\x6b\
-\x6a\xa3\xda\x5a\x66\x5b\x8e\x57\x32\xb2\x49\x85\x4f\x82\x3a\xd0\
-\xb8\xa3\x5d\x80\xfc\xa1\x7a\x42\x32\x58\x5b\x3f\x93\xf1\xfa\x85\
-\x9c\xee\xa7\xfa\xad\xea\x31\x28\xc4\xb2\xb5\x32\x5f\xb6\xc6\xb2\
-\xc5\xa6\x06\x6c\x5d\xc8\xb6\x79\xd4\x85\x19\x1b\x29\xbc\x28\xc6\
-\x9d\x1e\x3d\x1c\x7e\x19\xfd\x75\x3e\xb6\xa5\x21\xa3\x5d\x93\xc2\
-\x1c\xaa\x75\xca\xbb\x91\x3b\x51\x1e\x61\x0e\x51\x6d\x6d\x34\x7b\
-\x2a\x17\x5b\x20\xee\x2d\xf0\x88\xc4\x45\xa0\x01\x37\xd4\xa5\x9f\
-\xcb\x11\x7e\x2a\x5d\x91\x7e\x55\xfa\x54\xed\x80\xd5\x3a\xd5\x29\
-\xb6\x46\x64\x62\x5e\xa5\x4b\x2b\x8b\xe9\xd2\x24\x59\xe9\x8d\xd2\
-\xf1\x96\x72\xf6\x4b\x96\xb3\x7b\x66\xad\xa9\xad\x18\x5d\xd6\xb3\
-\x3d\x6c\xec\x5b\x2e\x1e\x6c\x54\xbd\x9c\xdd\x30\x74\xba\x3f\x2f\
-\x7a\x0c\x83\x8f\x55\x19\xb8\xe7\x85\xbd\x6d\x45\xa1\xcd\xbd\x3b\
-\x86\xe1\xaa\xb0\xc0\x46\xe1\xcf\x8b\xfc\xa9\xe2\xc5\x78\x71\x19\
-\x58\x1b\x4a\xf4\xcd\x65\x2c\xb0\x9b\xd5\xea\x4f\x92\xd0\xfe\xd3\
-\x6c\x47\x08\xaf\x63\xc9\x47\xb1\x35\xb0\x53\x64\x4e\x9a\xf8\x31\
-\x8d\x95\xbf\x9c\x2c\x33\xba\x5a\xbb\x67\x55\x62\x5b\x01\xd6\xb0\
-\x35\xb0\x07\x88\xbc\x5b\x3a\x42\xb6\x44\x94\x33\xec\xff\x51\xf1\
-\xb5\x51\x5b\xe5\x8a\x7a\xb7\x2d\x35\x80\x98\xd0\x34\xcc\xb7\x3d\
-\xec\x34\x56\xc9\xea\xff\xb6\x70\xbc\xcb\x94\xb5\x5b\xca\x51\x79\
-\xa3\xf6\xf1\xa5\xa7\xde\xab\xad\x0f\x1f\x43\x35\x7c\x5c\x5f\xd6\
-\x33\x32\x6c\xec\x6b\x67\x0f\x34\x5e\x3a\x63\xd8\x73\x3b\x4f\x4c\
-\x0e\xd3\xb0\xe1\x65\x19\xac\xad\x5f\x15\x5b\xd9\x31\xf4\xc7\xb0\
-\x5c\x72\x86\x27\xdb\x94\xc7\x2c\x30\x14\xcb\x24\x1b\x8c\x8d\x55\
-\xa9\x86\x0e\xba\x75\x45\x2d\xdd\x7e\x73\x19\xc0\x7a\x54\x7b\x27\
-\xe8\x3f\xdb\x9c\xa3\x42\xc2\x67\xad\xe3\x1b\x81\xbd\x9d\xcb\xc7\
-\x74\x55\x0c\xee\xf6\x42\xf4\x64\xba\x99\x9c\x26\xb3\xe9\x50\x65\
-\x7c\x3a\x99\x28\xb3\xbe\xdf\x6b\x9d\xc1\x35\xe5\x63\xe9\x3c\xd8\
-\xdc\xc2\x8c\x39\x81\xde\x42\xc3\x61\x7d\x1e\xae\xdf\x7a\x5f\xe7\
-\x4f\x08\xd3\xae\x31\x49\x8f\x08\xb3\xb0\xad\x26\xff\x51\xba\xd4\
-\x91\x2e\xd9\x7a\x5b\xbd\x2b\x9f\x6c\xf8\xb8\x3c\x75\xd2\x24\x99\
-\x49\x72\x08\xb3\xd2\xb7\x5b\x59\xcb\xc4\x1a\x5f\x2a\x1b\x0b\x0d\
-\xcb\xa6\x75\x45\x07\xa3\xff\xcd\x0e\x9f\x0b\xaa\x11\x37\x94\x9d\
-\x8d\x35\xe4\x60\x91\xf3\x2b\x70\xb4\xf5\x49\x51\xe3\xc3\xc7\xf5\
-\xdd\xa0\xea\xc3\xc6\xbe\xe5\xe2\xc1\xc7\x1d\xed\x18\xd1\xc9\xd8\
-\x1e\xa3\xd6\xfa\x40\x06\xb4\x16\xa2\xd7\xe7\x4f\x0c\x61\xa6\x32\
-\x86\xaa\xc2\x1c\x66\xf9\x79\x16\xe3\x43\xb8\xf1\xf1\x72\x78\x88\
-\x93\x1b\x5c\x60\xf5\xdf\xcb\x71\xa8\x81\xd0\xbb\xd7\x55\xe5\x5b\
-\xcc\x28\x76\x7f\xd3\x1f\x1a\x27\x1b\xae\x42\x5e\xd9\x33\x8f\x8e\
-\xcf\xbf\x56\xf5\xd4\x9f\xb8\x9c\x14\xc4\x4e\x4f\x3c\x85\xc7\x76\
-\x6c\x9a\x12\xf7\x71\x99\xd1\x8a\xd4\xb0\x94\xd9\xe4\xa9\x3f\x9d\
-\x6f\x4d\x97\x69\x0b\xf6\x27\x50\x5f\xab\x38\x32\x2c\x07\x73\x1e\
-\x0c\x50\xb1\xf2\xbe\x7a\x7b\x6f\x2a\xbe\x27\x55\xce\x65\x60\x69\
-\x4c\xda\xdb\xd9\x8b\xae\x58\xfd\xe9\x4e\x5d\x8a\xbf\xae\xf4\x9f\
-\x9e\x3d\xa9\x89\x46\x10\xfa\x54\x41\xd6\xd4\xb3\x73\xd2\x03\xbd\
-\x27\xca\x7a\x6f\x10\xa2\x53\xb3\xf3\x74\x5c\x56\xbc\xc2\x0d\x90\
-\x17\xc7\xc8\x88\x83\x22\x32\xaf\xc1\xd7\x7e\x37\x0e\xc9\x9b\x71\
-\x48\xbb\x3c\x61\x6b\xf1\x46\x41\xdd\x51\xc6\xe8\xe2\x1e\xd8\xeb\
-\xf9\x23\x93\xa2\xc6\x86\x8f\xa7\x0d\x1b\xfb\x96\x8b\x07\x9f\xbd\
-\x69\xc5\x4b\x8a\x6d\xe7\x57\xdb\xf9\x87\x8d\x1c\x70\x60\xd1\x82\
-\x13\x43\x78\x26\x66\x65\x21\xa3\x79\x2d\xce\xb2\xb7\x45\xb0\xfb\
-\x96\x94\x0c\xce\xe7\x98\x0c\xfa\x94\x99\xa6\xd1\x69\x19\xd7\xbf\
-\x95\x33\x5f\x51\x05\x55\xc5\x63\xa8\xda\x36\x27\x58\x00\x1b\xae\
-\xc2\xce\x10\x74\xfe\xca\x1b\x47\xed\x77\xeb\x4e\x1c\x65\x7d\xe5\
-\x74\x87\x90\xa8\x17\x91\x9c\xd1\x07\xe2\xcd\x7d\xbd\x41\x1e\xd2\
-\x87\x6c\x4c\xaf\xef\x3a\x3f\xdb\x18\x73\x68\x25\x3b\x64\x5e\xe5\
-\xe1\xb0\xa2\x94\x69\xb3\x5d\xa7\x8c\x00\xf0\x3c\xd9\xe4\x0d\x7d\
-\x60\x38\x7e\x5c\xa6\xf2\x6b\x96\xcc\x61\x16\x9b\x4c\xa5\x93\xfc\
-\x25\x90\xce\x39\x4b\x67\xe2\xb3\x72\x3e\x47\xe5\xdc\x59\x7f\x2b\
-\x07\x0f\xf6\xfc\xcf\x72\x23\xfe\x69\x3d\x0a\x9b\x95\xcc\xfe\xc4\
-\xe5\xac\x5e\xf4\x28\x5b\x97\xbc\x06\xeb\x62\xed\x99\xb9\x25\x3c\
-\xa7\xb7\xd2\x25\x0b\x13\x88\xa2\x24\xb4\x6b\xb2\xc8\x13\xb6\xa9\
-\x6c\x72\x9f\xb5\x2e\x8b\x87\x62\xd4\x65\x4d\x72\xea\xfb\x4d\x7a\
-\x5b\x32\xcb\x02\x8a\x70\xb4\xa6\xff\x0a\x4a\x4b\x7c\x52\x69\x9f\
-\xa0\x0f\xa6\xff\x7f\x93\x84\xd6\xd7\x55\x36\x89\x1a\x5b\x77\x9a\
-\x35\x98\xc6\xb1\x5b\x28\x25\x55\x6f\xba\x4a\x7b\xfc\xfa\xec\x06\
-\x11\x64\xb7\xf7\x76\x7e\x9d\xf1\xe1\xe3\xfa\x9a\xda\xfa\xbd\x5a\
-\x1f\x36\x3e\x5c\x24\xab\x27\x4e\xfd\x5d\xf9\xd9\x11\xf9\x86\xea\
-\xf4\x77\x64\x4c\xa9\x30\x0a\x38\xcb\xec\x59\x61\xe4\x6c\x18\x0e\
-\x83\xda\x9d\xac\xd8\x9d\xef\x25\x21\x51\x8f\xb8\xaa\x64\x83\xdb\
-\xf4\xb2\x74\x8e\x6a\x5e\xb4\x29\x07\xb8\x31\xd9\x09\x22\xb3\xd8\
-\x73\xb8\x80\x2a\xc4\x73\x59\xcd\xd0\x20\x57\xce\x36\x3e\xab\x70\
-\x5c\x2d\xf7\x73\x2a\xb4\xd7\xd5\x18\x78\x27\xb2\xa1\xa4\x48\xed\
-\x01\xdb\x40\x41\x06\x1f\x87\x65\x5b\xed\x29\xf4\x6e\xd4\xd6\x23\
-\x49\xee\xb4\xca\xc8\x5e\xc5\xd6\x3b\x3c\x49\xa4\xf9\x9c\x98\x51\
-\x67\x58\xca\x96\xb0\x1c\x95\xdc\xd7\x4a\xe3\xb7\xaa\x77\xc9\x4b\
-\x4e\x47\x4a\xab\xe2\x72\x35\xb6\xe7\xa6\xe2\xac\x38\xbb\xf7\xf9\
-\x33\xd9\xc9\xd2\x00\xa8\x67\x19\x4d\xd9\xa5\xc6\xf6\x47\xd6\x71\
-\xad\xb3\x45\x9c\xaa\x1e\x4c\xb6\xa9\xc6\x0c\x32\xd7\x24\xf3\x82\
-\x64\xb1\x99\x44\x29\x33\x2e\x65\xb6\xde\xa9\xc9\xd4\x1b\x4f\xe1\
-\xb1\x7b\xe1\xa0\xb2\x89\xee\xd6\x0c\xd3\x18\xd9\x86\x7a\x05\x97\
-\x75\x4d\x1d\xce\xf2\x16\x1e\xbc\x8e\x93\xb4\x51\x08\x36\x6d\xe0\
-\x9d\xf5\xc3\xa9\x42\x8d\xf6\xd7\xe9\x35\x25\x21\x3e\xc6\xb9\xb9\
-\x6d\xee\xbf\x75\x7d\xb3\xd8\x84\x9f\xe2\x7d\xaa\xb2\x9b\x52\xb6\
-\xcc\x70\x4e\x5e\x63\xe9\x8e\xf2\x43\xff\x70\x06\x79\xa4\x34\xf1\
-\xe8\x57\x6e\x85\x3e\x2d\xd2\x3e\x8e\x35\x62\x2e\xe9\x3c\xf5\x2e\
-\xc9\xdc\xde\x4d\xc9\xb3\xc7\xf9\xe9\x0b\xba\xf4\x78\x67\x83\x22\
-\x6f\x29\x4f\x2f\xaa\x91\xc8\x70\xbc\x0e\xe5\x31\x79\x85\x2c\x49\
-\x66\x92\x58\x57\xe7\x66\xa3\x69\x83\x59\xb2\xf2\x74\x7a\x39\x56\
-\xb4\xdf\xd6\xb9\xe5\x9a\x6c\x66\x72\x0f\xa4\x8b\x15\xd1\x63\x9d\
-\x3b\x41\xe6\x38\x91\xda\x3d\x3c\x7d\xc8\xa4\x52\xbe\x92\x6d\xbb\
-\x70\x11\x25\xf2\xea\xa2\x74\x42\x3a\x10\x9f\x52\x7c\xcf\x49\xf7\
-\xbf\xa1\xe3\xd1\x7f\xb2\x41\x27\x0d\x94\xd6\xe4\x94\x1c\xd3\x89\
-\xa2\xfc\x07\x4f\xb7\x77\xf1\x32\xbd\x58\xdf\x99\x5f\x15\x91\x74\
-\xbc\x75\x2e\x36\xd9\xf4\x48\xfb\x6c\xd1\x89\x5c\xb6\xae\xa4\x71\
-\x75\x45\x8d\xbf\x53\xca\xa3\x8b\x4a\x0a\x65\xbe\x35\x5a\x66\xd1\
-\xa9\x09\xe7\xd3\x60\xe0\x59\xbc\x0d\xce\x1f\x47\x4d\x42\xcb\x0b\
-\x43\x49\x48\x1f\x17\xf9\xd9\x62\x0d\xb4\xea\x0a\xc3\xc6\xd5\x36\
-\xa2\x36\x6c\x8c\xfe\x39\x07\x1a\x77\xb4\x13\x30\x27\xa0\x8a\x63\
-\x4b\x20\x54\x59\x82\x2a\x47\xe1\x30\x55\x91\xd4\x8a\x8e\xce\xc9\
-\x28\xeb\x77\x9c\x93\x55\xfc\x4b\x32\x36\xdf\x96\x13\x38\x23\xc3\
-\xa4\x63\x38\xb6\x77\xbb\x1b\xd2\x67\x83\xc2\x78\x53\x03\x6f\xca\
-\xd2\xcd\x30\x38\x19\x06\xfc\xac\x2a\x8d\x8e\x8d\x79\x88\xb6\x2a\
-\x39\x7b\x0f\x73\xbe\x55\x78\x19\x9f\xe8\x84\x64\x1f\x57\xe0\x3e\
-\x0d\xdf\x75\x1e\xce\x1c\x07\x65\x4b\x34\xce\x62\x4d\x0b\x9a\x3a\
-\x5a\x48\x6f\x66\xa1\xfd\x66\x21\xc3\x7a\xc5\xea\x85\xc5\x4a\xbb\
-\x0d\xc3\x21\x5f\xb6\x12\x63\x12\xbf\x26\xa7\x71\x59\x3f\x5d\xd0\
-\x6f\xc4\x91\x9e\x13\x69\x93\x51\xee\xdd\xd8\x2a\x7a\xfd\xca\x00\
-\xf2\x2d\xbf\xdd\x9e\xd9\x13\xca\xee\xe5\xa3\x32\xd5\x8b\x37\x99\
-\xec\x14\xc5\x3d\x6e\xf2\xde\x64\xe2\x04\xf4\x53\x25\xb3\xcc\xcf\
-\x48\xf6\xaa\x7f\x43\x79\xac\xe3\x87\x32\x6f\xcc\x96\xc9\xe3\xf7\
-\x12\xa5\x81\xfb\x5c\x94\x51\xeb\xa4\x12\x36\x28\x1a\x15\xf6\xc0\
-\x88\xe3\x92\x77\x49\xe5\xf0\x86\x82\x8c\x62\x72\x55\x3f\xbf\xa7\
-\x32\x56\x83\x00\xe7\x6e\xa5\x27\x39\xe6\xdc\xd5\x93\xe6\x17\x7e\
-\xcb\xaf\xcb\xb8\x4f\x29\xdb\xbc\x4f\x3a\x8b\x5b\x08\xc5\x03\xc9\
-\xd5\xcb\xec\x4a\x1e\x3f\xd0\xa9\x7e\x3d\x55\x7c\x74\x7d\x0c\xf2\
-\xc9\x52\x97\xbe\xa5\x34\xd3\x88\xd1\x65\x59\x6a\x33\x78\xda\xb7\
-\xa1\x71\x6b\x84\x70\x85\x3b\xd3\xd3\x89\x2c\x7a\xfb\x13\x65\x5d\
-\x94\xc1\x1f\x97\xf5\x4d\xc9\x52\x39\x8c\xc8\x7a\xc0\xfa\x62\xbb\
-\x9c\xf4\x56\x3d\xe4\x39\x3d\xda\xfd\x70\xb4\xd0\x7a\xab\xd0\x7f\
-\x22\x8c\x4e\x64\x9b\xd2\x7f\xca\x56\x65\x63\x3a\xc1\x1a\xd2\x13\
-\x8a\xbb\xea\x40\x40\x27\xa5\x0b\xec\x95\x9d\x3e\x1a\x28\xee\x59\
-\xe8\xbc\xbe\x56\x34\xce\x04\x71\x68\xea\x68\xa1\x90\x2d\xe1\xca\
-\x2e\xe6\x1c\x50\xe7\x0d\x7a\xd4\x38\x4c\x35\xf8\x52\xc5\x27\xa8\
-\x91\x18\xba\x3a\x76\x8c\xf1\xf3\x79\x06\xb0\x69\x87\xe2\x48\x59\
-\x44\x6a\x3c\xce\x3a\x7f\x9c\x36\xd7\x13\x34\x7c\xfb\xb7\x8a\x49\
-\x85\x95\xa3\xed\x5d\x97\xfe\x95\xcf\x50\xce\xef\xcf\xd6\x79\xe7\
-\x60\xe0\x8e\x76\x02\x0c\xdf\xb4\x65\xe8\x78\xea\x09\xc6\xad\x78\
-\x04\x1b\x4b\x1e\xa8\xdc\x0a\xaa\xf8\x38\x58\x42\x74\x5a\x46\x0d\
-\xe7\xc7\xbd\x19\x1c\x80\x2a\x66\xff\xe6\x96\x3d\x2c\xde\x8c\x15\
-\xf5\xe1\xa6\xac\x02\xbd\x90\x19\x20\xb3\xf3\x6d\x2a\xab\x5e\x92\
-\x85\x73\xa5\xe7\x14\xaa\x2d\x02\x31\x34\x38\x3d\xde\x65\x7c\x68\
-\x19\x67\x1b\xea\x91\xf1\xa8\x37\x0c\xc9\xd6\x8a\x7a\x33\x85\x0c\
-\x9c\x4f\xfa\x10\xe3\x53\x54\xc6\x79\x8e\x16\xd2\x47\x72\x3c\x6f\
-\xe8\x98\xd2\xbe\xd0\x03\xa3\xd7\x67\x86\x4b\xd7\xa9\x0c\x98\x19\
-\x0d\x9c\x9d\xe2\x08\x6c\xa1\x38\x30\x43\x57\x1a\x35\x8c\xe4\x75\
-\x55\xfe\x06\xf7\x8d\x76\xc8\x94\x51\xe1\x11\x85\x26\x0b\xe7\x87\
-\x81\xd3\x3f\xb6\x49\x34\xa7\x6e\xf9\xa2\xeb\x2b\x6f\x07\xa4\x6f\
-\xb0\xb8\x4c\xee\xc7\x25\x72\x9c\xd6\x13\x12\x0c\x05\x83\x3a\x7e\
-\x45\x59\x91\x3e\x89\x32\xa7\x4e\x0f\x8f\x18\x20\x1b\xf1\xca\xef\
-\x54\x4e\xc8\x1e\xcf\xc7\xb1\xfa\x0d\xe7\x1e\x36\x8b\xbc\x99\x44\
-\x31\x62\xa0\x6b\x32\x62\x40\x2f\x47\x65\x6a\xd7\x93\xcd\x35\x5d\
-\xe2\xd2\xe8\x8f\x1c\x5f\x8c\x2e\x1d\xd3\x67\x64\xeb\x5c\xfe\xb7\
-\x9e\xd9\x13\xa5\xd3\xf2\x5b\xbf\x20\x8b\xa5\x1c\x13\x9c\x57\x35\
-\x52\x40\xfa\x90\x15\xaf\x94\x1b\x51\xd0\x28\x28\x65\x05\x64\x9d\
-\xd0\xdf\xd4\x60\xac\xcb\xe2\xda\x3c\x13\x38\x7b\xa2\x88\x31\x14\
-\x3e\x47\x56\x9d\xba\xa3\x4d\x9f\x32\x34\xae\x6b\x14\xea\xd1\xd8\
-\xd1\x0e\x47\x39\xe8\x19\x12\xf7\x58\x0d\xd7\x63\xcc\xdc\xd7\xb9\
-\xba\x96\x35\xbc\x4a\xdd\xe3\x33\xf7\xe5\x91\x63\x0d\x33\xe5\x4d\
-\x76\xad\x1d\x56\xbe\xb5\xdd\xd0\x1c\x3c\x52\x03\xb4\xa1\xa3\x45\
-\x36\xa3\x2b\xd1\x9a\xf4\x88\xbc\x92\xc8\x48\xba\x68\xad\x66\xf2\
-\x4d\x32\xd3\x47\x3c\xd9\x4a\x75\x1a\x27\x39\xe6\x28\x77\x9c\xaf\
-\x73\xd0\x65\x3b\x5f\x6f\x94\xc1\xac\xf3\xc7\x31\x9d\x39\xaa\xfa\
-\xa7\x5e\xb0\x7d\x27\xad\xd2\xf9\xca\xd1\x62\x5f\xa8\xdb\xf6\xa4\
-\x9e\x19\x23\x38\xce\xc1\xc1\x1d\xed\x14\x70\x02\xf4\x7e\xec\x11\
-\x63\xaa\xc8\x28\x38\xbd\x46\x8c\x80\x0d\x09\xe9\x4f\xb9\x6a\x24\
-\x0b\xfe\xcd\x10\x50\xdf\x19\x72\xa5\xf2\x33\x1c\x89\xf9\xd2\xb1\
-\xf9\x5d\x55\xf0\x86\x5b\xa3\x71\xef\x2e\xb9\xa4\x0b\x63\x1f\x14\
-\x74\x7a\xd1\x93\x22\x94\x06\x86\x1e\x12\xce\x95\x0a\x6d\xc6\x77\
-\x3d\xb6\xe7\xa9\x52\x31\x5b\xaf\x27\xe6\x64\x33\x39\x3e\x8c\x3b\
-\xf7\x71\xcc\xd9\x36\x70\xb4\x54\x6e\x1e\x03\x97\x5c\xd6\xb1\x44\
-\x57\xb6\xd2\x5a\xe3\xf4\xdc\x71\x0e\xb1\xae\x83\xd1\x26\x5d\xb2\
-\xc3\xcc\x4a\x35\x47\x2f\x23\x60\x43\xb7\x18\x15\x91\x5f\xd7\xc9\
-\x8f\x67\x1b\x92\x8a\x4a\x66\x7c\x52\xf9\xc9\x3d\x42\xe2\x4a\x9e\
-\x22\x13\x27\xaf\x28\x9b\x63\xad\xcb\x94\x21\x37\x99\x64\x4e\x29\
-\x33\xdc\x91\xbc\x86\x79\x8c\xcc\xf4\x46\x16\x5a\x97\x74\x0e\xb3\
-\x42\x69\x44\xa8\x91\x44\x2f\xde\x9c\x12\xf9\x4c\x0f\x8a\x97\x15\
-\xb2\x8e\x51\x07\x0d\xa3\x8d\x71\x27\xef\xad\x6c\xf5\x62\xa3\x8a\
-\x26\x69\x65\xc4\x80\x5e\x74\xc4\x13\x84\xd0\x25\xd2\xc7\xbe\xc3\
-\x14\x89\x64\x15\x8d\x18\x0c\x7c\x51\xc6\xe6\xc4\x55\xbe\x76\xdb\
-\x82\x1e\x29\xf9\x2b\xa2\x87\x49\xc8\x6f\x49\xa6\x0c\xec\x34\x18\
-\x29\x18\xca\x92\x1e\x16\xb2\x94\x36\xe9\x90\x95\x27\x8d\x16\x0e\
-\x9c\x24\x4b\xc6\x7c\x28\xab\xaf\x7c\xff\x42\x4e\x72\x86\xac\x8a\
-\xca\xd1\xa6\x72\x6e\x76\x2f\x59\xce\x9b\x1e\x9d\xd5\x8b\x05\x7a\
-\xb4\x44\xcc\x1a\x41\xca\x9a\x42\xcf\x95\x27\x34\x6a\xe5\xb4\xac\
-\x71\xa7\x57\xe1\x60\xca\x11\x26\x82\x7e\xcc\x3e\x95\x8c\x8d\x38\
-\x74\xde\x2f\x74\x80\x67\x42\x5b\x7d\xd1\xb9\x96\x7f\x73\x1c\x2d\
-\x30\x21\xd1\x1a\x28\x14\xa7\x5d\x57\x57\xa6\x6c\x70\xee\x0a\xa4\
-\x0b\xbd\x9b\xe6\x28\x47\xce\xa7\x6e\x8a\x91\xf3\x95\xaf\xd6\xcb\
-\x6d\xe0\x68\x8d\xb6\x1a\x1d\xaa\xcf\x80\x7e\x30\x54\x8c\xa3\xc5\
-\xbe\x54\xc3\xc6\x31\x0d\xcb\x29\xb7\x2c\x9c\x83\x85\x3b\xda\x29\
-\x98\x13\xf8\x14\x63\xa1\x0a\xc4\x90\xb0\xfd\xa8\x8a\x2f\xa5\xc7\
-\xb9\xf2\x6e\x76\x98\x4a\xc9\x8b\x8a\x64\x95\xdf\x0e\x0c\xf9\x53\
-\x55\xf2\x8f\x65\x00\x9e\x36\xaf\x08\x0c\x6d\xb2\x21\x7c\x72\x5e\
-\x5f\x74\x2d\x73\x60\xf6\x07\xc9\xc5\xa9\x60\xaf\x14\xa5\x22\x32\
-\xfa\x78\x0b\xc3\xab\xeb\xcb\x28\x72\xff\x2a\x3a\xab\xdf\xca\x61\
-\x34\x60\x43\x79\x73\xb6\x4f\x14\xd7\x26\x13\x26\xe4\x5c\xab\x34\
-\xdb\x32\x02\x45\xdf\x64\xe9\xa7\xca\x09\xe0\x77\xcc\x10\xf1\x4e\
-\x7c\xf4\x6e\xbf\x5b\x7a\x65\xcc\x26\x3c\x3d\x67\x26\x74\xa0\xbe\
-\x2c\x65\xaa\x47\xd0\x58\xa6\xfe\x0d\x65\x2e\x90\xc7\x46\x3d\x9d\
-\xc8\xc4\x06\x73\x6d\x5d\xd3\x96\x66\x59\x83\x42\x3f\x91\xff\x1c\
-\x46\x7e\xea\x65\x11\xd1\x9f\x86\x72\xa7\xcc\x70\x9e\x04\xce\xd6\
-\x9c\x2c\xf9\x5a\x3e\x80\x80\xb4\x15\xba\xa4\x20\x63\x6c\xa0\x47\
-\x92\x53\xe8\x53\x91\x5c\xc8\x6f\xab\x2c\x79\x36\x6c\x83\x3d\xa8\
-\x27\xc9\xb2\xb4\x95\xb2\xe8\xb5\x1b\xe3\xb2\xb8\xb4\x0e\x37\x59\
-\x34\x98\x1a\xee\x77\x8d\xa3\xcd\xfb\x7d\xdb\xd6\x12\xec\x41\x0d\
-\x95\xb3\x6d\xd0\x23\xae\xb0\x46\xd0\x75\x35\xf6\x2e\xc8\xb1\x2a\
-\xde\x55\xdd\xb2\xa0\x38\x5a\x66\xf0\x59\x58\xf9\x6f\xa8\x1c\xfe\
-\xa8\xeb\x97\x73\x26\x70\xb4\x38\xd9\x4a\xff\x6d\xc8\x17\x67\xfb\
-\x54\xf5\x67\x8e\xa3\xb5\xfa\xfe\x89\xce\x43\x27\x68\xf4\xd1\xb0\
-\x2c\x45\xf2\x1f\x0d\x57\x6b\xfc\xb2\x64\x6d\x82\xa3\x9c\x7b\xbe\
-\x1a\x8e\x7c\xa7\x8e\x37\x71\xb4\x1c\x57\xcd\xdb\xb0\x5e\xec\xad\
-\xae\x39\xda\xc1\xdd\xee\x70\xd8\x78\xde\xed\x28\xe7\xe0\x10\x9d\
-\xbc\xf2\x66\x59\x6a\xce\x34\xb8\xbf\x12\x5f\x56\xa5\x65\x52\x06\
-\x13\xa2\x80\x51\x2a\x2a\x3f\x75\x8b\x1a\xb4\xa9\xf7\x2d\x5a\xf5\
-\x6a\xf9\xde\x51\xa5\xdc\xc3\x06\xf9\xa3\xf2\xf4\x43\x47\x42\x54\
-\xc9\xb3\x47\x92\x21\x99\xd9\x1d\x19\x99\x27\xfa\xbd\x26\x23\x3e\
-\x2f\x43\x7a\x4e\x1f\xd4\xea\x1e\x67\x70\x43\xf1\x53\xcf\x77\x51\
-\x98\xd5\x19\xab\x91\x91\x9c\xd4\x17\xd2\xbb\xa2\xeb\xd0\x00\xc0\
-\xe1\xc8\xb0\xb0\x8f\xee\xa4\xb8\xec\x85\x17\x21\x33\x79\xa7\xb8\
-\x4e\x72\x41\xff\x49\x8c\xc9\xc4\xf9\x94\xe5\x8b\xf1\xcc\x1e\xcb\
-\x60\x3f\xd2\x6f\xf7\xf6\x56\xb6\x60\xf2\x74\x69\xee\x03\x73\xed\
-\xe1\x6e\x56\xa5\x63\xc9\xbb\x92\xd3\x55\x1a\x49\x2b\x65\xbe\x87\
-\xb4\x26\x97\x75\x9e\xf4\x68\xaa\x2c\x1a\x62\x9b\x92\x35\x45\xaf\
-\x9a\x90\x5c\x92\xdb\x3b\xbe\x53\xef\x32\xf5\x4a\xb3\x2f\x75\xad\
-\x06\xbd\xe2\x71\xc8\x23\xd3\x7f\xe9\x01\x65\x6f\x7b\xfe\x92\x2f\
-\x38\xe3\x87\x93\xcb\xa1\xfd\x81\xe2\x8f\x73\x1f\x23\x55\x2f\x3f\
-\x7f\xb0\x98\xfe\x9b\x1e\xda\x04\x41\xc9\xb6\xe5\xac\xca\x2c\x5d\
-\x7a\x70\x5d\xef\x0d\xea\xd2\x5e\xcf\x87\xd6\xb7\xe3\xb0\xf2\x1d\
-\x5a\x9e\x4a\xea\xcd\xae\x2d\xf7\x61\xc2\x21\x23\x67\x36\x6c\xfc\
-\x99\x32\xc8\x39\x14\xb8\xa3\xdd\x03\xac\x5d\x85\x45\xb7\xdf\x73\
-\x0e\x3e\x2f\xa2\x6c\x9f\xa7\x4c\xd7\xdd\x83\xcf\xda\x7f\xec\x14\
-\xa3\x12\xa2\xa7\x1e\x2d\xcb\x0c\xb9\x8f\x0e\xf9\x8d\x8e\x3f\x44\
-\xe0\x10\xb1\x58\x33\xcf\x19\x01\x23\xe5\x86\xea\xe5\xe4\x45\x94\
-\xed\xf3\x94\xf9\x22\xd2\xe7\x34\x87\x75\xdb\x31\x3d\xe1\xb2\x1b\
-\x54\x38\x59\x26\x4e\x14\x34\xba\x15\xe4\x1c\x18\xbc\xb4\x1c\xc7\
-\x71\x0e\x10\xd1\x99\x10\x3a\x3f\x68\x95\x4e\xb6\x1c\x79\x60\x7b\
-\x49\x6e\xa2\xd3\x36\xf2\x27\xf5\x1c\x3a\x7c\xe8\xd8\x71\x1c\xe7\
-\x05\xc1\xfe\xd9\xf1\xd9\xe2\xbe\xb2\x4d\x8e\x93\x93\x65\x16\x3e\
-\x13\xb9\x58\xda\xc7\x84\xcb\xad\xcf\x36\x6c\x99\x97\x39\x59\x59\
-\x6b\xd6\x6d\xfb\xb0\xf1\xe1\xc2\x7b\xb4\x8e\xe3\x38\x2f\x88\xe4\
-\x64\x14\x3a\xef\xb6\x43\x7c\x2e\xb7\xdd\xd0\x98\xb8\x66\x13\x2c\
-\x59\xde\x94\x66\xa1\x7f\xb7\x5b\xac\xc9\x67\xc6\x38\x1d\xda\x4d\
-\x39\x5f\x77\xb2\x87\x0e\x77\xb4\x8e\xe3\x38\x2f\x10\xd6\xe7\xf3\
-\x0c\x6b\x83\x1e\x6b\x2e\x27\xdb\xcf\xc2\xe0\xee\x96\xf5\x64\xab\
-\xf5\xdd\x78\xda\xfc\x96\x6f\x50\x71\x18\x71\x47\xeb\x38\x8e\xf3\
-\x82\xc1\xd9\x46\xb1\xcc\x31\x4b\xd9\x9e\x65\x21\xdd\x18\x04\x36\
-\x68\x61\x38\xd9\x76\x85\x63\x19\x2e\xbb\x90\xf9\xbd\xd9\x43\x89\
-\x3b\x5a\xc7\x71\x9c\x17\xcc\x70\xa3\x0d\x66\xcc\x54\xbe\x94\x77\
-\x2c\xb4\x9c\x6b\xf6\xa1\x7a\xb2\x3c\x40\xc0\x39\x94\xb8\xa3\x75\
-\x1c\xc7\x79\x81\xd4\x77\xb3\x02\xdb\x44\x64\x3d\x0e\xf9\x7d\xb6\
-\x57\x6d\x85\xec\xa3\x56\xe3\x5d\xba\x9c\x83\x89\xcf\x3a\x76\x1c\
-\xc7\x71\x9c\x25\xe2\x3d\x5a\xc7\x71\x1c\xc7\x59\x22\xee\x68\x1d\
-\xc7\x71\x1c\x67\x89\xb8\xa3\x75\x1c\xc7\x71\x9c\x25\xe2\x8e\xd6\
-\x71\x1c\xc7\x71\x96\x88\x3b\x5a\xc7\x71\x1c\xc7\x59\x22\xee\x68\
-\x1d\xc7\x71\x1c\x67\x89\xb8\xa3\x75\x1c\xc7\x71\x9c\x25\xe2\x8e\
-\xd6\x71\x1c\xc7\x71\x96\x88\x3b\x5a\xc7\x71\x1c\xc7\x59\x22\xee\
-\x68\x1d\xc7\x71\x1c\x67\x89\xb8\xa3\x75\x1c\xc7\x71\x9c\x25\xe2\
-\x8e\xd6\x71\x1c\xc7\x71\x96\x88\x3b\x5a\xc7\x71\x1c\xc7\x59\x22\
-\xee\x68\x1d\xc7\x71\x1c\x67\x89\xb8\xa3\x75\x1c\xc7\x71\x9c\x25\
-\xe2\x8e\xd6\x71\x1c\xc7\x71\x96\x88\x3b\x5a\xc7\x71\x1c\xc7\x59\
-\x22\xd1\xc9\x2b\x6f\xe6\xe5\xe7\x5d\xf3\xe7\xdf\xff\x93\xf2\x93\
-\xe3\x38\x8e\xe3\xec\x0f\xff\xf4\xcb\x5f\x95\x9f\x0e\x37\x7b\x76\
-\xb4\x38\xd9\x1f\xff\xe0\xfb\xe5\x37\xc7\x71\x1c\xc7\xd9\x1f\xfe\
-\xcb\x3f\xfc\x2c\xfc\xe1\x93\x4f\xcb\x6f\x87\x17\xef\xd1\x3a\x8e\
-\xe3\x38\x07\x12\xef\xd1\x3a\x8e\xe3\x38\x8e\x33\x17\x9f\x0c\xe5\
-\x38\x8e\xe3\x38\x4b\xc4\x1d\xad\xe3\x38\x8e\xe3\x2c\x11\x77\xb4\
-\x8e\xe3\x38\x8e\xb3\x44\xdc\xd1\x3a\x8e\xe3\x38\xce\x12\x71\x47\
-\xeb\x38\x8e\xe3\x38\x4b\xc4\x1d\xad\xe3\x38\x8e\xe3\x2c\x11\x77\
-\xb4\x8e\xe3\x38\x8e\xb3\x44\xdc\xd1\x3a\x8e\xe3\x38\xce\x12\x71\
-\x47\xeb\x38\x8e\xe3\x38\x4b\xc4\x1d\xad\xe3\x38\x8e\xe3\x2c\x11\
-\x77\xb4\x8e\xe3\x38\x8e\xb3\x44\xdc\xd1\x3a\x8e\xe3\x38\xce\x12\
-\x71\x47\xeb\x38\x8e\xe3\x38\x4b\xc4\x1d\xad\xe3\x38\x8e\xe3\x2c\
-\x11\x77\xb4\x8e\xe3\x38\x8e\xb3\x44\xdc\xd1\x3a\x8e\xe3\x38\xce\
-\x12\x71\x47\xeb\x38\x8e\xe3\x38\x4b\xc4\x1d\xad\xe3\x38\x8e\xe3\
-\x2c\x11\x77\xb4\x8e\xe3\x38\x8e\xb3\x44\xdc\xd1\x3a\x8e\xe3\x38\
-\xce\x12\x71\x47\xeb\x38\x8e\xe3\x38\x4b\xc4\x1d\xad\xe3\x38\x8e\
-\xe3\x2c\x8d\x10\xfe\x7f\xb7\x8b\x51\x13\xec\xbb\x5f\x32\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x07\x13\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x1f\x08\x03\x00\x00\x00\x26\xd9\x98\x64\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x02\
-\xd6\x50\x4c\x54\x45\x00\x00\x00\x00\xff\x00\xff\xff\x00\x80\xff\
-\x00\x55\xaa\x00\x80\xbf\x00\x66\x99\x00\x66\xcc\x00\x99\xcc\x00\
-\x80\xd5\x00\x6d\xb6\x00\x80\xbf\x00\x71\xc6\x00\x80\xb3\x00\x80\
-\xcc\x00\x74\xb9\x00\x6a\xaa\x00\x6a\xbf\x00\x76\xb1\x00\x76\xc4\
-\x00\x6d\xb6\x00\x77\xaa\x00\x80\xbf\x00\x78\xc3\x00\x71\xb8\x00\
-\x80\xb9\x00\x7a\xb1\x00\x80\xbf\x00\x70\xb8\x00\x7a\xb8\x00\x76\
-\xba\x00\x72\xb9\x00\x7b\xbd\x00\x78\xb7\x00\x74\xb9\x00\x71\xb8\
-\x00\x76\xb4\x00\x76\xbb\x00\x79\xb6\x00\x7a\xb9\x00\x77\xb5\x00\
-\x77\xbb\x00\x74\xb7\x00\x7a\xb7\x00\x7a\xbc\x00\x72\xb8\x00\x77\
-\xb8\x00\x75\xb5\x00\x7a\xb5\x00\x72\xb6\x00\x78\xb6\x00\x78\xbb\
-\x00\x75\xb8\x00\x78\xb9\x00\x76\xb5\x00\x73\xb7\x00\x76\xb8\x00\
-\x79\xb8\x00\x78\xb7\x00\x76\xb8\x00\x74\xb6\x00\x74\xb9\x00\x78\
-\xb9\x00\x77\xb9\x00\x75\xb9\x00\x76\xba\x00\x74\xb8\x00\x76\xb6\
-\x00\x76\xb9\x00\x74\xb7\x00\x76\xb7\x00\x77\xb8\x00\x75\xb9\x00\
-\x74\xb8\x00\x74\xbb\x00\x77\xbb\x00\x76\xb9\x00\x76\xbc\x00\x74\
-\xb7\x00\x76\xb8\x00\x75\xb8\x00\x76\xb7\x00\x76\xb9\x00\x75\xb7\
-\x00\x75\xba\x00\x78\xba\x00\x74\xb8\x00\x76\xb8\x00\x76\xbb\x00\
-\x75\xb6\x00\x75\xb9\x00\x75\xbb\x00\x76\xb9\x00\x76\xbc\x00\x75\
-\xb8\x00\x75\xba\x00\x78\xba\x00\x74\xba\x00\x76\xb5\x00\x76\xb8\
-\x00\x76\xbb\x00\x76\xb9\x00\x75\xb9\x00\x75\xbb\x00\x75\xb9\x00\
-\x76\xb8\x00\x75\xb6\x00\x75\xb8\x00\x76\xb6\x00\x76\xb9\x00\x76\
-\xba\x00\x75\xb8\x00\x76\xb9\x00\x77\xb8\x00\x76\xb8\x00\x75\xb7\
-\x00\x75\xb9\x00\x77\xb9\x00\x76\xba\x00\x77\xb9\x00\x76\xb8\x00\
-\x76\xba\x00\x75\xb9\x00\x77\xb7\x00\x76\xb9\x00\x75\xb8\x00\x77\
-\xba\x00\x76\xb9\x00\x75\xb9\x00\x76\xb8\x00\x76\xba\x00\x75\xb8\
-\x00\x76\xb9\x00\x76\xb8\x00\x77\xb8\x00\x76\xb8\x00\x78\xbd\x00\
-\x76\xb9\x00\x77\xb9\x00\x74\xb9\x00\x77\xb9\x00\x77\xb8\x00\x77\
-\xb9\x00\x77\xba\x00\x76\xbb\x00\x76\xb8\x00\x77\xb9\x00\x76\xb9\
-\x00\x77\xba\x00\x76\xb9\x00\x78\xbd\x00\x76\xb9\x00\x78\xbd\x00\
-\x76\xb8\x00\x77\xb9\x00\x77\xba\x00\x75\xbb\x00\x75\xb9\x00\x76\
-\xb9\x00\x77\xba\x00\x76\xb8\x00\x76\xb9\x00\x77\xb9\x00\x76\xb9\
-\x00\x76\xba\x00\x78\xbd\x00\x76\xb8\x00\x75\xba\x00\x76\xb9\x00\
-\x75\xb9\x00\x75\xb9\x00\x76\xb9\x00\x74\xba\x00\x76\xb9\x00\x76\
-\xb9\x00\x76\xba\x00\x75\xb9\x00\x77\xbb\x00\x75\xb8\x00\x77\xbc\
-\x00\x75\xb9\x00\x76\xb8\x00\x76\xb8\x00\x76\xba\x00\x76\xba\x00\
-\x76\xba\x00\x76\xb9\x00\x75\xb9\x00\x74\xba\x00\x76\xb9\x00\x76\
-\xba\x00\x77\xb9\x00\x77\xba\x00\x78\xbb\x00\x75\xb9\x00\x76\xb9\
-\x00\x76\xb8\x00\x77\xb8\x00\x77\xb9\x00\x78\xbc\x00\x77\xb9\x00\
-\x75\xb9\x00\x76\xb8\x00\x75\xb9\x00\x77\xb9\x00\x77\xbb\x00\x75\
-\xb9\x00\x76\xb8\x00\x76\xb9\x00\x76\xbb\x00\x76\xb9\x00\x75\xb9\
-\x00\x75\xba\x00\x76\xb9\x00\x76\xb8\x00\x76\xb9\x00\x77\xb8\x00\
-\x75\xb9\x00\x75\xba\x00\x77\xba\x00\x76\xb9\x00\x76\xba\x00\x77\
-\xba\x00\x77\xbb\x00\x77\xbc\x00\x78\xbb\x00\x78\xbc\x00\x78\xbd\
-\x00\x79\xbd\x00\x79\xbe\x00\x79\xbf\x00\x7a\xbe\x00\x7a\xbf\x00\
-\x7a\xc0\x00\x7b\xc0\x00\x7b\xc1\x00\x7b\xc2\x00\x7c\xc2\x00\x7c\
-\xc3\x00\x7d\xc4\x00\x7d\xc5\x00\x7e\xc5\x00\x15\x6d\x68\x36\x00\
-\x00\x00\xdc\x74\x52\x4e\x53\x00\x01\x01\x02\x03\x04\x05\x05\x05\
-\x06\x07\x08\x09\x0a\x0a\x0b\x0c\x0c\x0d\x0d\x0e\x0f\x10\x11\x12\
-\x16\x17\x18\x19\x19\x1a\x1d\x1f\x20\x21\x24\x29\x29\x2a\x2c\x2d\
-\x2d\x2e\x2e\x2e\x2f\x2f\x30\x30\x31\x31\x31\x32\x33\x34\x35\x36\
-\x3d\x40\x41\x42\x42\x42\x49\x4c\x4e\x4f\x50\x50\x51\x52\x56\x57\
-\x5a\x5a\x5a\x5b\x5b\x5c\x5d\x5e\x5f\x5f\x60\x60\x60\x61\x61\x61\
-\x62\x62\x62\x63\x63\x64\x64\x64\x67\x68\x6c\x6c\x6e\x71\x71\x74\
-\x77\x7a\x7a\x7b\x7b\x7d\x7e\x80\x81\x82\x87\x87\x87\x88\x8b\x8c\
-\x8d\x8e\x8e\x8f\x90\x90\x91\x92\x93\x93\x94\x95\x9b\x9d\x9e\x9f\
-\xa0\xa5\xa7\xaa\xac\xac\xad\xaf\xb1\xb2\xb3\xb4\xb5\xb6\xb7\xb9\
-\xba\xc1\xc5\xca\xcb\xcb\xcc\xcd\xcd\xcd\xcf\xcf\xd1\xd4\xd5\xd6\
-\xd7\xd8\xd8\xd9\xdb\xdc\xdd\xde\xde\xe2\xe3\xe5\xe7\xea\xeb\xed\
-\xef\xf0\xf2\xf3\xf3\xf3\xf3\xf3\xf3\xf4\xf4\xf5\xf5\xf5\xf5\xf7\
-\xf8\xf8\xf9\xf9\xf9\xfa\xfa\xfa\xfa\xfb\xfc\xfc\xfc\xfd\xfd\xfd\
-\xfe\xfe\xfe\xed\x2a\xc8\x5f\x00\x00\x00\x09\x70\x48\x59\x73\x00\
-\x00\x0f\xe6\x00\x00\x0f\xe6\x01\xdf\x48\x8d\x85\x00\x00\x02\xde\
-\x49\x44\x41\x54\x48\x4b\xed\x94\x67\x53\x13\x51\x14\x40\x9f\x8a\
-\xbd\x27\x2a\xd8\x7b\xef\x62\xef\xd8\x45\x05\x4d\x54\x10\x7b\xc1\
-\xde\x7b\x41\xb0\x17\xec\xbd\xf7\x86\x62\xef\x8a\x62\xc5\xde\x1b\
-\xa2\x9b\x5d\x92\xdd\x8d\x09\x16\xf4\x1f\xb8\xf7\xdd\xb7\x49\x58\
-\x70\x32\xc9\xe8\x8c\x1f\x38\xdf\xce\xbd\x6f\xf6\x64\x66\xf3\x96\
-\xc4\xdd\x03\xde\xac\xcf\x4e\x32\xa2\xdd\xad\x07\xca\xf6\xfe\x8b\
-\xe1\xcc\xbd\xe4\x9d\x09\xb0\x6e\xcb\xc1\x3c\x2d\x1d\x12\x05\x58\
-\xcb\xa3\x98\x7b\xc9\x5b\x0e\x90\xff\x18\xe1\x61\x2d\x8d\x64\xee\
-\x25\x99\x11\x8f\x10\x6d\xc0\xaf\xad\x19\xff\xbb\xd4\xc8\x08\xe6\
-\x5e\xb2\x7a\x2d\xb0\x6e\xd9\xa0\x3e\x21\xa1\x40\xfb\x8a\x3e\x6c\
-\x03\xb0\x88\x39\x3a\x08\x76\xfd\x83\xfd\x70\x5c\x21\x34\x34\x44\
-\x39\x3e\xb8\x26\x6a\xee\x4e\x03\x60\x3d\x30\x20\x17\x7a\xd3\x21\
-\xa0\xfd\x7a\x95\x46\x25\x24\x6b\x16\x80\xf4\xe0\xcd\x3c\x25\xf1\
-\xca\xaa\x26\x6c\xa5\xc0\x22\x1c\x47\x77\x96\xbb\x75\x70\xdc\xe5\
-\x33\x3d\x6d\x1b\x8f\xea\x17\x2b\x81\x7e\x39\xa8\x47\x8f\x48\x01\
-\x35\x3f\x6b\x8d\xea\x20\xd0\x44\x2f\x84\xc9\xc4\x0b\xf6\xab\xc3\
-\xd8\xd0\x25\x42\x77\xc9\x37\x6a\xe3\xb8\xf3\x27\x7a\xda\x3a\x0e\
-\xd5\xf7\x84\x08\x2a\x1f\x60\x91\xb9\x76\x50\xe1\x69\x2b\x54\x07\
-\xdd\x39\xf6\x34\x05\xf1\xb5\x81\x4d\x9d\x11\x8a\x10\xa7\x46\x92\
-\xe8\x58\x1e\x8b\xea\x7b\xdc\x02\x2a\xed\x57\x23\x36\x50\xfe\x71\
-\x4b\x54\x07\xae\x11\x4e\xba\x50\x99\x8d\xff\x61\x84\xb3\xcd\x62\
-\xe3\xbf\x1b\x09\x64\x2f\xde\x04\x6b\x4e\xda\xa7\xc3\xb1\xe6\xc5\
-\xc7\x7b\x19\xf1\xa1\x90\xe0\x34\x11\xf3\xa5\x72\xb8\xd5\x44\x6e\
-\xb3\x7f\x97\xa7\x91\x0d\x1b\x81\xcd\x2b\xc3\x0c\x46\xa3\xd1\xd0\
-\x73\xa7\x04\x7b\xe1\x3a\x7b\x29\x2c\x62\x8e\xee\xaa\x6c\x8d\x7d\
-\x83\xd8\x3d\xf1\x34\x62\xa1\x37\x3e\x55\xbd\xf1\x4b\xed\xb0\x17\
-\xae\x55\x42\x65\x11\xed\x8d\xf7\x34\xa2\xf9\x76\x2d\xcf\x38\xa2\
-\xf9\x76\x65\x46\xfe\x83\x48\x38\xaa\x8a\x1a\x19\x83\x5a\x34\x06\
-\x23\x7b\x0b\xa0\xcf\xf9\x6e\x51\x90\x9e\xb7\x40\x75\x17\xe9\x88\
-\x11\xcb\xec\xaa\x8d\x00\xff\x7c\x38\x66\x11\x71\x61\x35\x98\x36\
-\x68\x7e\x96\x46\x2c\x31\xcd\xfc\xc1\xeb\x45\x9d\x89\x55\x38\x79\
-\x2c\xa4\x16\x68\xe3\x1a\x6e\x22\x01\x1f\xe8\xd3\xb8\x57\x09\xc0\
-\xa3\xcb\xd5\x71\xdc\xf6\xbd\xeb\x38\x21\x21\x89\x1a\x97\x88\xf6\
-\x71\x4a\x4e\x9d\x4e\xaf\x2f\x58\x6a\xcf\x4b\xd0\x27\x47\xdd\x44\
-\x1a\xde\x14\xe8\xde\x24\x00\x62\x7c\xdd\xb4\x63\x9e\x8e\x05\x2c\
-\x2a\xa0\x7f\x9d\x84\xa7\x0a\x1d\xb6\x82\x8a\xa7\xdd\x44\x0a\xef\
-\x96\xe9\x1e\x71\x7c\x20\xf3\xef\x72\x1d\x6b\xb1\xb1\x88\xee\x90\
-\x08\x2a\x9c\x72\x13\x21\xe1\xb2\xe3\x67\xba\x44\x48\x98\xf3\xd7\
-\xa7\xc7\xe3\x88\x7e\x93\x1d\xbf\x99\x80\x33\x92\x77\x4d\x8a\x73\
-\xac\xc5\xe3\x08\x29\xb9\xc3\x2a\xaa\xcf\x73\x46\x48\xf1\x2d\x36\
-\xc7\x58\x4b\xfa\x48\xb2\x0c\xfc\xd8\xce\x22\x2b\x7e\x82\xda\xef\
-\x54\x41\x55\x28\x36\xf9\x22\x4f\xcf\x28\xe3\x87\xf5\xd9\x90\x90\
-\x22\x13\xce\x0b\x6c\xac\x25\x75\x2a\x1e\xd1\x1f\xf9\x06\x6a\x3f\
-\x47\xe6\x45\x00\x8b\x86\x66\xc3\x45\xb7\x25\xa0\x91\x33\x4a\xa0\
-\x52\xca\xf7\x9e\x3e\x9f\x9e\x8a\x9c\x59\x86\x8d\x80\xb2\x86\x69\
-\x38\xd6\xb2\xb8\x0d\x1e\xc8\x33\x7a\x01\x68\xd4\xc4\xdf\xba\xaa\
-\xa8\xca\x7f\x3e\x40\x0c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
-\x60\x82\
-\x00\x00\x47\xca\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x03\x00\x00\x00\x00\xd5\x08\x06\x00\x00\x00\xe0\x9a\x97\x8f\
-\x00\x00\x47\x91\x49\x44\x41\x54\x78\xda\xed\x9d\x79\x9c\x1c\x55\
-\xb5\xc7\xbf\x9d\xc9\x64\xb2\x02\x09\x90\x10\x30\x44\x08\x9b\x2c\
-\x2a\x20\x88\x22\x71\xb7\x13\x44\x01\x31\x2e\xc0\xc3\xe5\x29\xb8\
-\x01\x6a\x92\xf2\x89\x08\xee\x3e\x3b\x20\x02\x22\xcb\x7b\xe2\x13\
-\x04\xc1\x88\x80\x2c\x49\x21\xa8\x04\x50\x64\x5f\x25\x90\xb0\x24\
-\x21\x64\x21\x0b\x59\xc8\x64\x26\xb3\xbc\x3f\xce\xa9\xcc\xed\x9a\
-\xea\x9e\x9e\x99\x9e\x64\x66\xf2\xfb\x7e\x3e\xfd\x49\xa6\xba\xba\
-\xea\xde\x73\xef\xad\x3a\xe7\xde\x73\xce\x05\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
-\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
-\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
-\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x88\x5e\x41\x4e\
-\x22\xe8\x1c\x51\xcc\x08\x60\x54\x95\x2e\xd7\x00\x2c\x2f\xe4\x69\
-\xe9\xc7\xf2\x1a\x00\x8c\x06\xea\xaa\x74\xc9\xf5\x85\x3c\x2b\xd5\
-\x13\x85\x10\x42\x08\x21\xba\xc6\x40\x89\xa0\xd3\x7c\x04\xf8\x69\
-\x95\xae\xf5\x00\x70\x0a\x50\xdf\x8f\xe5\x55\x07\x5c\x0c\x1c\x5e\
-\xa5\xeb\x5d\x0b\x7c\x5b\xdd\x50\x08\x21\x84\x10\x42\x06\xc0\x96\
-\x62\x38\xb0\x7b\x95\xae\xb5\x00\x18\xd0\xcf\xe5\x35\x00\x18\x53\
-\x45\x99\x8d\x52\x17\x14\x42\x08\x21\x84\xe8\x9e\x72\x26\x84\x10\
-\x42\x08\x21\x84\x90\x01\x20\x84\x10\x42\x08\x21\x84\x90\x01\x20\
-\x84\x10\x42\x08\x21\x84\x90\x01\x20\x84\x10\x42\x08\x21\x84\x90\
-\x01\x20\x84\x10\x42\x08\x21\x84\x90\x01\x20\x84\x10\x42\x08\x21\
-\x84\x90\x01\x20\x84\x10\x42\x08\x21\x84\x90\x01\x20\x84\x10\x42\
-\x08\x21\x84\x90\x01\x20\x84\x10\x42\x08\x21\x84\x90\x01\x20\x84\
-\x10\x42\x08\x21\x84\x90\x01\x20\x84\x10\x42\x08\x21\x84\x90\x01\
-\x20\x84\x10\x42\x08\x21\x84\x0c\x00\x21\x84\x10\x42\x08\x21\x84\
-\x0c\x00\x21\x84\x10\x42\x08\x21\x84\x0c\x00\x21\x84\x10\x42\x08\
-\x21\x44\x1f\x61\xa0\x44\x20\x84\x10\x62\x6b\x11\xc5\x0c\x06\x46\
-\x03\x39\x3f\xd4\x0a\x2c\x2f\xe4\xd9\xd8\x87\xea\x30\x02\x18\x15\
-\x1c\xda\x6a\x75\xe8\x8d\xf2\x8c\x62\x72\xc0\xf6\xc0\x6e\xc0\x8e\
-\x7e\x78\x1d\xb0\x00\x58\x53\xc8\xd3\x1c\x9c\x5b\xeb\xb2\xdc\x14\
-\x7e\xe7\xd7\x18\xea\xd7\x59\x03\x6c\x28\xe4\x69\xd5\x08\xaa\xa8\
-\x3f\x36\x01\xcb\x0a\x79\x9a\xb6\x62\x79\xde\x04\x0c\x06\x96\x02\
-\x2f\x84\x65\x89\x62\x06\x02\x63\x52\x3a\xe9\xaa\x42\x9e\x75\x6a\
-\x4d\x19\x00\xfd\x95\x1a\x60\x48\x14\x57\xf5\x9a\xcd\x40\x43\x3f\
-\x7e\x30\xd6\x46\x31\xc3\xaa\x74\xad\xa6\x42\x9e\x86\x2a\x3d\xe0\
-\x6a\x81\x41\x55\x2a\x57\x8b\xb7\x61\x4b\x15\xca\x35\x00\xa8\xa3\
-\x7a\xab\x7d\x8d\x85\x3c\x9b\xaa\x24\xb3\xba\x2a\x3e\x83\xaa\xd6\
-\x96\xbd\xf8\xa5\x9e\xd5\x96\x99\xf5\x76\x65\xa9\xce\x9f\x31\xbd\
-\xfd\xd9\xf0\x66\xe0\x2a\x60\x88\xff\x5d\x0f\x9c\x02\x3c\xd0\x87\
-\x9a\xe7\x23\xc0\x4f\x83\xbf\xb7\x66\x1d\x7a\x95\x3c\x5d\xb9\x7b\
-\x3b\x70\x36\x70\x08\x30\xdc\xbf\xda\x08\xbc\x00\xfc\x3c\x8a\xf9\
-\x43\x21\x4f\xb3\x3f\xdb\xbf\x04\x7c\x1e\xd8\x00\x5c\x1a\xc5\x5c\
-\xe3\xc6\xc0\x41\xc0\xb9\xc0\x81\xc0\xe3\xc0\x8f\xa2\x98\x27\xaa\
-\xdd\x9f\xbb\xf9\x2c\x6f\xf5\x31\xd6\xdc\xcb\xfa\xe3\x62\x60\x8a\
-\xff\xbb\xa5\xdb\x7f\x18\xf0\xdf\xc0\x89\x2e\xd7\x65\xc0\xd7\xa3\
-\x98\x5b\x82\xb6\x1b\x03\xcc\x74\x03\x31\xe1\xdb\xc0\xb5\x52\x13\
-\x65\x00\xf4\x26\xe6\x02\x57\x54\xe9\x5a\xbb\x01\x37\xfb\x8b\xb9\
-\x5a\x2c\x07\xfe\x1a\xc5\xac\x00\xe6\x01\xf3\xfb\x99\x15\x3d\x19\
-\x98\x55\xa5\x6b\xdd\x02\xcc\xa8\x62\xb9\xa6\x55\xe9\x5a\xcb\x80\
-\xd3\x7d\xa6\xa4\xbb\x8c\x06\x2e\xf6\x07\x6c\x35\x38\x0f\xf8\x73\
-\x77\x2f\x32\x68\x28\x00\x67\xf8\x8b\xaa\xb7\xb5\x65\x6f\x25\xab\
-\x2d\x4b\xd5\xbb\xce\xdb\xea\xcd\xc1\xb1\x27\xbc\x8f\xf6\xb6\x99\
-\xf5\xc1\xc0\x38\x6c\x76\x17\x57\xfc\x06\xf7\xb1\xb6\x19\x0e\xec\
-\x1e\xfc\xbd\x35\xeb\xd0\x6b\xe4\x39\xc0\xcc\xcf\x77\x02\xbf\x05\
-\xde\x98\xfa\x7a\x28\xb0\x03\x36\xa3\xdf\x9a\xb3\xf5\x8a\xe3\x81\
-\x1f\x04\x65\x2f\x00\xcf\x03\xf3\x81\xff\x01\x0e\xf3\xe3\x7b\xf9\
-\x6f\x3f\x06\x55\x7f\xbf\x75\xe7\x59\xde\xe0\xbf\x7d\xbc\x97\xf5\
-\xc7\xad\xa2\xef\x79\x9b\x1e\x0e\x9c\xe4\xed\x0c\xb0\x07\x70\x26\
-\xf0\x77\x60\x6d\x50\xb6\xdd\x52\x65\x1e\x2e\x75\x53\x06\x40\xaf\
-\xa2\x90\x67\x0e\x30\xa7\x4a\x96\xf1\xa9\xc0\xe5\x3d\x50\xcc\x13\
-\xb0\x25\xbf\xb5\xc0\x3f\xa3\x98\xbb\xb0\xd9\x9f\x87\xfa\xc1\x2c\
-\xe9\x2e\xfe\xa9\x06\xcf\x54\xb9\x5c\x47\x55\xe9\x5a\x0b\x5d\x81\
-\xab\x06\x75\xfe\x00\xde\xbd\x4a\xd7\xfb\x5d\x35\x2e\x52\x33\x70\
-\xf3\x4b\xfc\xa8\x5e\xd8\x96\xbd\x95\xac\xb6\x2c\x55\xef\x1a\x57\
-\xfe\x8f\xca\x38\x2e\xc4\x16\x61\xda\xed\x0c\x07\xfe\x2b\x43\xf9\
-\x4f\x78\x15\xb8\xb7\x90\xa7\xa5\xce\xd6\x75\x0f\x0b\x94\x7f\x30\
-\x37\x96\x63\x80\xeb\xfc\x79\xb1\x59\xb7\x04\xf6\x06\x46\xf6\x80\
-\x01\xd0\x9d\x67\xf9\x86\x40\xd1\x95\x82\x69\x66\xe7\xdb\x33\x94\
-\xf9\x7d\xdc\x48\x7d\x5a\x52\xda\x7a\x28\x08\xb8\x7f\x1b\x77\xa3\
-\x80\x0f\x03\x3f\xc7\x56\x1a\x2e\x8d\x62\x0e\x8b\x62\x29\x01\x42\
-\x08\x21\x7a\x9c\x09\xc0\xc1\xa9\x63\xaf\x01\xf7\x01\x8b\x80\x3b\
-\x81\x97\x00\x36\xd9\xba\xd4\xbf\xa1\xc8\x4f\x7d\x3d\x70\x37\x16\
-\x2b\x90\x56\x16\x17\xd0\x36\x83\x2c\x7a\x21\x9b\xea\x01\x98\x8d\
-\x79\x26\x84\xdc\x87\xb9\x7f\x09\x19\x00\x62\x0b\xb0\x23\xf0\x39\
-\xe0\x06\xe0\x87\x51\xcc\x58\xf7\x13\x16\x42\x08\x21\x7a\x82\xc3\
-\x28\x76\x59\x6b\x06\x7e\x81\xb9\xd9\x1c\x03\x7c\xaf\x90\x67\x3d\
-\x40\x8b\x39\xc2\xce\xc4\x5c\x7d\x56\xb9\x82\x3f\x03\xf8\xdb\x79\
-\x47\xb3\x02\xf3\xff\xbf\x17\x58\x0d\x3c\x88\xf9\x88\xaf\x91\x88\
-\x7b\x3d\x4f\x03\xe7\x60\x6e\x5c\x6b\x80\x3b\x80\x1f\x17\xf2\xd4\
-\x4b\x34\x5b\x17\xb9\x00\x6d\x7b\x8c\x03\x22\xcc\x95\xe0\x2b\x51\
-\xcc\xfc\x6a\x04\x9b\x0a\x21\xfa\x3e\x19\x81\xc6\x9d\x0e\xae\xce\
-\xb8\x46\x97\x82\xda\x33\x02\x99\x3b\x15\x80\x9e\x0a\x32\xef\x54\
-\x19\x32\xee\xdd\xd5\x3a\x84\xb2\xe8\x2d\x01\xa2\x95\xd6\xb9\x1a\
-\x41\xe3\x03\xa0\x68\xa2\x69\x19\x70\xbd\xc7\xa5\x3d\x91\x3e\xb9\
-\x90\x67\x55\x14\xf3\x2d\x37\x02\xea\xb1\x18\xb6\x26\x80\x19\x93\
-\xf8\xeb\xf4\xd9\x3c\x01\x8c\xc7\xe2\xa3\x96\x74\xa6\x6c\xa9\xfe\
-\x50\xae\x2f\x2d\x05\xee\x49\x1d\x1b\x8c\xb9\xd4\x85\xae\x99\x6b\
-\x81\xa7\x28\x8e\xe1\x6b\xc8\x32\x4a\x52\xf7\xee\xb4\x5c\x33\xc6\
-\x54\x97\xda\xc6\x57\xff\xeb\xbc\x4d\xba\x9c\x6c\x22\x15\x28\x5d\
-\xf6\x19\x51\xc8\xb3\x29\x8a\xf9\x3f\xe0\x6f\x98\x57\xc2\x8b\x85\
-\x3c\x2b\xf4\xb4\x95\x01\x20\xb6\x0e\x35\xc0\x7b\xb1\x08\xfb\xb3\
-\xa2\x98\xbb\x7a\xeb\x4b\x49\x08\xb1\x45\x94\xbf\x5a\xcc\xa7\xfa\
-\x14\x6c\xd6\xb6\xd6\xbf\x7a\x2d\x8a\x99\x03\xfc\x01\x58\x5c\xee\
-\x39\xe1\xd9\x5e\xf6\xc0\x32\xb8\x1c\x1e\x5c\x63\x13\xf0\x40\x14\
-\xf3\x5b\x7f\xf9\x77\x64\x50\xe4\xb0\x59\xe3\x6f\x02\x1f\xa2\x2d\
-\x9b\xcd\xcb\x51\xcc\x6f\x80\x39\xa5\xae\xe1\x8a\xd2\x6e\xc0\x7f\
-\x62\x19\x67\x76\x08\xca\xf0\x74\x14\x73\x05\x30\xb7\x54\x3a\x44\
-\x57\x90\x76\x03\x3e\x09\x7c\x20\xb8\xf7\x26\xe0\xc1\x28\xe6\x5a\
-\x60\x5e\x05\xb3\x97\x39\x57\x54\x27\x07\xb2\x68\x05\x5e\x8c\x62\
-\xfe\x17\xb8\x3f\x5d\x06\x57\x12\xcf\xa0\xd8\xd7\xfd\x9e\x42\xbe\
-\x2d\xee\xa6\x76\x30\x7c\xe3\x66\x4e\xa6\xd8\x47\x7d\x3e\x70\x51\
-\x57\xe3\xbb\xca\xd4\xb9\x1e\xb8\x3f\x8a\xf9\x75\x47\x6d\x9f\x71\
-\xcd\xbd\xbd\x2e\x6f\x49\x7d\xb5\x1d\x70\x4e\x14\x6f\xf6\xdb\xbf\
-\xa6\x90\x67\x4e\x89\x7a\xad\xc2\x02\xd9\x57\x02\x0c\x34\xd5\x7b\
-\x52\x78\x4e\x14\xdb\x39\x85\xbc\x9d\x93\x21\xc3\x46\x37\x26\xf6\
-\x05\xfe\x23\xe8\x0f\xe5\x92\x19\xcc\x02\xee\x4a\x1d\x1b\x87\xcd\
-\x5c\x8f\x0b\x8e\x3d\x05\x1c\xeb\x72\x4a\x68\x75\x23\x20\x91\xeb\
-\x38\xe0\xe3\xc0\xc4\xe0\xde\xf5\xde\x97\x7e\x0b\xbc\x54\xce\xa8\
-\x2d\x33\x2e\xeb\x81\x3b\xa3\x98\xeb\x2b\x6c\x9b\x1c\x16\x87\x71\
-\xba\x5f\x27\x17\x8c\x89\xcb\x7d\x4c\x14\x5d\x23\xa3\x4d\x1a\x81\
-\x4b\x81\x9d\x81\xd3\x80\x37\x04\xcf\x88\xbf\x01\x57\x03\x2b\xd3\
-\x46\x49\x14\xb3\x23\x16\x18\x3d\x2a\x38\x56\xd4\xaf\x3b\xd9\xa7\
-\x06\x95\x1a\x1f\x42\x06\x80\xa8\x7c\x66\xe6\x50\xe0\x97\xc0\x27\
-\x80\xc7\x24\x12\x21\xb6\x49\xe5\x7f\xac\x2b\x06\x27\xbb\x22\x98\
-\x76\x0d\x9d\xec\x4a\xfd\x39\x51\xcc\x4d\x59\xca\xb3\x2b\x2a\xff\
-\x81\xb9\x65\xec\x41\xfb\x60\xe3\x77\xfb\xf5\x2f\x8c\x62\x2e\xec\
-\x60\x26\xbf\x0e\xb8\x10\x73\x5b\x4c\xa7\x63\xfc\x10\x96\x36\xf2\
-\xa2\xc4\x75\x24\xa5\xfc\x1f\xe5\xca\xdd\x5b\x33\xde\x6f\xef\x01\
-\x8e\x06\x7e\x12\xc5\x5c\x9d\x2e\x83\xd7\xe1\xe3\xc0\x77\x5d\xe9\
-\xca\xfa\xfd\x67\x81\x8b\xa2\x98\x0b\x3a\x30\x02\x92\x2c\x4c\x3b\
-\xa6\x64\x31\xd1\xaf\xf3\x83\x8c\x32\x0c\xc4\xb2\x62\xa5\x03\x50\
-\x37\x2b\x38\x03\x4d\x1a\x47\x01\xa7\x86\x4a\x10\xf0\xab\x44\xf1\
-\xec\x82\xe1\x57\xae\xce\xef\xc3\x92\x4a\x7c\xaf\x54\xdb\x97\x60\
-\xac\xf7\x99\xa1\xa9\xe3\xc3\x81\x4f\x07\x7f\x3f\x0c\xcc\x29\x51\
-\xaf\x85\xc0\x65\x9b\x0d\x80\x0a\xce\xc9\x90\x61\x03\x16\x34\xff\
-\x6e\x8a\x83\x73\x4b\x2a\x8d\xde\x26\xe9\xbe\x51\xef\xca\x7d\x48\
-\x33\x50\x5f\xc8\xf3\x7a\x09\xb9\x7e\x0c\x4b\x7d\xba\x5f\x86\x5c\
-\xdf\x8f\x65\xc6\xb9\x24\x8a\xb9\x24\xab\x2f\x45\x31\x43\x80\xaf\
-\xba\xd2\x9b\x35\x2e\xdf\x87\xb9\xf5\xfe\x30\x8a\xf9\x63\x07\x63\
-\x6a\x34\x96\x1a\x76\xb7\x54\x7f\x7c\x8f\x97\xe5\xc7\x51\xcc\x8d\
-\x61\x39\x32\xe4\xdd\x00\x0c\xf3\x31\xb8\x5b\xea\xfa\x79\x37\xce\
-\xce\xf2\x36\x4d\xb7\xf9\x89\xb4\x4f\x44\xd1\x59\xc5\xbd\x54\x9f\
-\x92\x01\xd0\x0d\x25\x50\x6c\xdb\xec\x05\xcc\x88\x62\xf6\x91\x28\
-\x84\xd8\xe6\x94\xff\x51\xc0\xf9\xc0\xb7\xb0\xd9\xca\x01\x25\x26\
-\x8a\xde\x84\xa5\x20\xfd\xb8\x2b\x37\xe1\x35\x6a\x5c\x31\x3e\xcf\
-\x9f\x27\x59\x49\x06\x6a\xb0\x19\xc3\xb3\x80\x93\x5c\x59\x2f\xf7\
-\x5e\x1a\x4b\x76\x2e\xf6\x1d\xfd\x1a\x27\x84\xc9\x0c\x3c\xdd\xe0\
-\x01\x3e\xa1\xf1\x36\xb2\x27\xb7\x06\x60\x41\xa9\x3f\x71\xc5\x27\
-\x5d\x87\xe3\xdc\xf0\x78\x53\x99\xdf\x8f\xf1\xfb\x7f\xc1\x57\x3c\
-\xca\xd5\x61\x74\x09\x59\x8c\xc7\xf2\xa2\xbf\x67\x2b\xb7\x7d\xa2\
-\xfc\x97\xab\xf3\x40\x97\xeb\xc5\xae\xf8\xf5\x35\xea\xdc\x20\xd8\
-\x7e\x0b\xca\x75\x80\x1b\x7a\x17\x60\x7b\x16\x0c\x2c\x31\x1e\xde\
-\x08\x7c\x0f\xf8\x54\x7a\x3c\xf8\x66\x6e\x5f\xf3\xef\x3b\x1a\x97\
-\x17\x02\x1f\xec\x60\x4c\xd5\xb9\x02\x5e\x93\xd1\x4f\xf7\x77\x23\
-\xea\x83\x15\xc8\xf2\xb3\x19\xca\x3f\x3e\x56\x3f\x04\x14\xfc\x99\
-\x22\x64\x00\x88\x3e\x40\xce\x67\x00\x7e\x1a\xc5\x8c\x94\x38\x84\
-\xd8\x66\x94\xff\x1a\xcc\xed\xe3\x84\x8c\x77\x41\x03\xb4\xf3\x0d\
-\xde\x05\xcb\xcb\xbe\x6f\xea\xf8\xde\xc0\x74\x68\xf7\xfc\x68\x84\
-\x76\x33\xc6\x23\x31\xd7\x9e\xee\xa4\xa5\x1d\x06\x4c\xc5\x5c\x11\
-\x00\x98\x3e\x9b\x5a\xcc\xcd\xe0\x80\x0a\xca\x30\x06\xf8\xcf\x94\
-\x21\xb3\x1b\xf0\xfd\xf0\x9a\x65\x7e\x9f\xdc\x7f\xaf\x6e\xd4\x61\
-\x67\x20\x8a\xe2\xad\x9a\x32\x72\x3c\xf0\xe3\x8c\x3a\x37\x64\xd4\
-\x79\x17\xe0\xbb\x51\xcc\xae\x7d\xf4\x1d\xb7\x25\x19\x05\xfc\xc8\
-\x8d\xd8\x74\x5f\x6a\xcc\xe8\x4b\x67\x66\x8c\x87\x43\xb0\xf4\xa9\
-\xe1\xa6\x97\xad\xd8\x1e\x1e\x4d\x19\x7d\x69\x3a\xdd\xcb\x9b\x3f\
-\x02\x38\xc5\x5d\xa8\xba\x23\xcb\x77\x52\xbd\xbd\x5d\xd2\xec\x9a\
-\x9a\x14\x68\xc2\xdc\xdf\x44\x17\x91\x0b\x90\x48\x06\xf5\x31\xc0\
-\x87\xa3\x98\x6b\xb4\xbd\xba\x10\x7d\x86\x89\xee\xc3\x9b\x26\xf1\
-\x1d\x2e\xc7\x4e\xd8\xae\xab\xe1\x4b\xb5\x1e\xf3\xf3\xbd\xd3\x5f\
-\xb8\xa7\x62\x3e\xec\xa1\xa2\x7c\x72\x14\x73\x56\x21\x4f\x4b\xad\
-\xe5\xf9\x3e\x31\xa5\x0c\x37\x63\x69\x87\xaf\x76\xa5\xe4\x2b\xc0\
-\x11\x81\xf2\x70\x00\xe6\x5a\xf0\x52\x99\xb2\xd5\x63\x19\x61\xee\
-\x0f\xca\x31\x3a\xa5\xbc\xee\x49\xdb\x66\x79\xbb\x7a\x39\x43\x05\
-\xe5\x79\xe0\x3b\x98\xdf\xf9\x77\xfc\x37\x09\xfb\xfa\xf1\x95\x5e\
-\x87\x4f\xa4\xe4\xd5\xea\xf7\xbf\xc6\xcf\x3b\x09\x73\x73\xc8\x05\
-\x72\x78\x33\xb6\x31\x64\x29\x56\x62\x6e\x17\x73\xfd\x7e\xa7\xa5\
-\x14\xba\xfd\x5d\x49\xdc\xe2\x99\x6c\x3c\xe0\xf7\x78\x8a\x7d\xda\
-\x9b\x81\xeb\xbd\xcc\x3b\x67\xd4\xf9\x6d\xc0\x91\x2e\x97\x8e\x98\
-\x87\xb9\x95\xbd\xcf\xaf\x93\x50\xe4\xd7\x4f\xfb\x60\xdb\x9e\x62\
-\x39\x10\xd3\xe6\xaf\x3f\xb7\x27\x6e\x52\x53\xbb\xb9\x2f\x1d\x9c\
-\xea\x4b\xb7\x01\xbf\xf6\xbf\xa7\xf8\x39\x89\xfe\x75\x90\xb7\xc5\
-\x05\xde\x36\x75\x98\xab\xcb\xa8\x94\xf1\x70\x11\x96\x52\x73\x3c\
-\xf0\x0d\x6c\x75\x81\xe0\x1a\x13\x80\x47\xcb\x14\xef\x75\x6c\xdf\
-\xa1\x67\xb1\x95\x83\xcf\x51\xbc\x32\x72\x98\x8f\xa9\x8e\xf6\x54\
-\x79\xd6\x9f\x11\x2d\x98\x4b\x5d\xd8\x47\x06\x63\xab\x73\xd7\x55\
-\x73\xcf\x21\x5f\x6d\x9b\x98\xd2\x59\x37\x62\xe9\x44\x85\x0c\x00\
-\xd1\x4d\x06\x61\xfe\x86\x73\x30\xbf\x4a\x21\x44\xef\x67\x3f\xff\
-\x74\x85\x5d\x69\x0b\xe4\x4b\xb8\x14\x38\xb7\x90\x67\x7d\x2e\x07\
-\xd3\x67\xf3\xb4\x2b\x7c\xc9\x79\x03\x5c\x51\xa8\x03\xea\xbf\x71\
-\x33\xb5\x7e\xff\x50\xf1\x7e\x1a\x38\xa3\x90\x67\xb1\x5f\xe3\x39\
-\x6c\xc7\xe2\xd1\xc1\x35\x3a\x5a\x01\xb8\x1a\x98\x5a\xc8\xb3\xde\
-\x5f\xfe\x4b\xb1\xf4\x91\xc9\x3b\x6b\x38\x16\x9b\xf0\x8f\xc0\x20\
-\x48\x5f\xf3\x8e\x40\x59\x7d\x87\x2b\x3c\x09\xa3\xfc\x1a\x2b\xbd\
-\x0e\x87\xa7\xde\x87\x73\x81\xef\x14\xf2\x36\xc3\x18\xc5\x3c\x89\
-\xcd\xca\x8e\x0e\xde\x9d\x6f\x88\x62\x06\x94\xc8\xa2\xd2\x84\xcd\
-\x02\x5f\xe2\x59\x50\x86\xb8\xc2\x14\xee\x30\x3b\xc6\xef\x3b\x77\
-\x2b\xf4\x9b\x3a\x2c\xe0\x37\xac\xf3\xa3\x40\x54\xc8\xb3\xd8\xeb\
-\xfc\xb8\x1b\x6b\xe3\x82\x3a\x4f\x8e\x62\xfe\xdc\x91\x72\x57\xc8\
-\xb3\x04\xb8\xd2\xdb\x2e\x34\x00\xd6\x03\xd7\x16\xf2\x2c\xd8\x82\
-\x75\x7d\x05\xf8\x32\x70\x7b\x27\x62\x18\xba\xc4\xd4\x5b\x19\xe0\
-\x86\x52\x5d\xaa\x2f\x7d\x23\xe8\x4b\x0f\xb8\xf1\x78\x60\x30\x1e\
-\x0e\x08\xfa\xd2\x0e\xde\x5f\x43\x1e\x06\x0a\x85\x3c\xaf\x0e\xa8\
-\x81\x69\xb7\xb3\x11\xf8\x4d\x60\xbc\x0f\xc1\x66\xf1\x4b\xd1\x8a\
-\xb9\xc7\x7d\xbf\x90\xa7\xde\x8d\x8c\x1d\xb1\xb8\x9c\x5c\x30\x21\
-\xb0\x73\x07\x06\xc0\xab\x6e\xd8\xdd\x55\xc8\xd3\x12\xc5\xdc\x0e\
-\xdc\x94\x32\x46\x76\xf0\xbe\x52\x15\x03\xc0\x5d\x9b\xde\x8f\xad\
-\x54\x86\xbc\x0c\x5b\xb4\x1f\xf5\x3b\xe4\x02\x24\x42\x0e\x07\x3e\
-\xda\x81\x2f\xa1\x10\xa2\x7f\x30\x02\x9b\xb1\x4b\x68\x00\xee\x48\
-\x82\x6b\x5b\x6d\x1d\xf0\x21\x2c\x7d\x5f\xc8\x2e\xd8\xac\x78\x32\
-\x71\x90\xde\x99\xfb\x09\x57\xd8\x93\x6b\x3c\x97\xf1\xa2\x2e\x67\
-\x00\x34\x02\xb7\x25\xe5\x70\xa5\xed\x49\x8a\xdd\x27\x06\x50\xbc\
-\x22\xb0\xce\x95\xcb\x90\x77\x61\x33\xd6\x43\x81\xff\xc3\x66\xe0\
-\x93\xcf\xb7\xb1\xd9\xe8\x52\x75\x78\x18\x78\x31\xf8\x7b\x41\x46\
-\x1d\x3e\x48\xe9\x1d\xbb\x1b\x81\x47\x92\xc0\x4c\x0f\xae\xbc\x39\
-\xb8\x27\x98\x3f\xf6\xe0\xad\xd4\xf6\x83\x69\xef\xb2\xf5\x0c\xb0\
-\x26\x8a\x19\x16\xc5\x0c\xf3\xfa\xde\x9b\x3a\x67\x2f\xfa\xde\xc4\
-\xe1\x7d\xc0\xac\x9e\x56\xfe\x03\xc3\x6a\x7c\xea\xd8\x5c\xe0\xd5\
-\x40\xae\x1b\x53\x7d\x0b\x37\x1a\x46\x07\x6d\x93\x76\xe7\xf9\x23\
-\xbe\x6a\xe2\xfb\x25\x3c\x83\x6d\xa8\x56\x29\xcb\x81\xeb\x92\x20\
-\xdf\x19\x93\x68\x00\x7e\xdf\x05\x25\xfd\x25\xe0\xc1\xc0\xe8\x7d\
-\x11\xdb\x93\xa1\x27\xd8\xd1\x63\x13\xbf\x00\x5c\x92\x1a\xef\xad\
-\xd8\xea\xe0\x72\x3d\xc6\xbb\x8e\x56\x00\x44\xda\x20\xfc\x02\x70\
-\x23\xd8\x2c\x90\x10\xa2\xff\xe1\x41\xb3\xc3\x28\x9e\x04\x6a\xa6\
-\x38\xa5\x21\xbf\x38\x9e\xa6\xaf\xdf\xc8\xab\xa9\x9f\x0f\xef\x40\
-\x71\xdd\x90\x4a\x29\xb8\x11\x78\xc0\xff\x4d\x28\xe7\xbb\xdb\xd4\
-\x49\xe5\x06\xcc\x2d\xe1\x09\x6c\x56\x3b\xe1\x40\x6c\x76\x72\x36\
-\x70\x1d\xe6\x02\xb2\xa8\xc2\xbc\xe7\x95\xd4\xe1\x79\xe8\x94\xbb\
-\xe4\x22\x37\x52\x7a\x43\x90\xe4\x76\x29\x85\x2a\x31\x68\x6e\x4f\
-\x1d\xdb\xbb\x1f\x74\xf7\xd5\x9d\xd9\x3f\xa2\x0a\xef\xd0\xda\xd4\
-\xb1\x77\x60\x2b\x60\x9b\x87\x1f\xed\x03\x69\x47\x06\xc6\x64\xd6\
-\xf8\x5a\x9f\xea\xb7\xcf\x62\x9b\x7a\x1e\x18\x18\xef\xe5\x5c\xc9\
-\x1a\xb0\x0d\xd4\x08\x0c\xf3\xd7\xa1\xd3\x7b\x00\x6c\x24\xc8\x90\
-\x74\xf1\x14\x5a\x4e\x9f\xd9\x63\xb2\x9d\x86\xad\x36\x64\x65\x03\
-\x5b\x06\x5c\xbe\x05\xdb\x55\x06\x80\xd8\x26\xd8\xcb\x3f\x32\x00\
-\x84\xe8\xfd\xcc\xc5\xdc\xf6\xd2\xd4\x62\x2e\x32\xbb\x64\xfd\x68\
-\xd0\xb0\xcd\x0a\x5f\xd9\xa0\xbf\xc6\x0d\x1d\x2a\xeb\x95\xd0\xe0\
-\x2f\xf3\x9a\x94\x92\x5f\x4d\xea\x81\x3f\xb9\xb2\x35\x2c\x50\xb4\
-\x46\x61\x31\x0a\x1f\xc7\x56\x22\x2e\xf1\x74\x96\x4b\xab\x50\x87\
-\x66\xa8\x9e\x9f\xf3\x96\xb6\x01\x69\x1f\xd0\xb9\x4b\xa9\xfe\x22\
-\xba\x45\x67\xe5\xba\x23\x1d\x07\xf4\xd6\x63\xc1\xf4\x49\x7f\x6c\
-\xed\xc3\x7d\xb1\x14\xa5\x0c\xe5\xd5\x58\x32\x82\x87\xd5\xb5\x64\
-\x00\x88\xea\x32\x14\x78\x47\x14\x73\xaf\x36\x07\x13\xa2\xd7\x33\
-\xa7\x90\xe7\xb4\xf4\x41\x77\x35\x98\x55\x4a\xf1\x18\x60\xf3\xfe\
-\xc3\xa8\x2c\x43\x4a\xb7\x9e\x03\x9e\x54\x60\x63\x4f\x0a\xa1\x90\
-\xa7\xd5\x37\x56\xda\x05\xcb\xd0\x33\x2c\x6d\xf3\x60\xb3\xa5\x17\
-\x03\x93\xa2\x98\xcf\x17\xf2\x45\xee\x38\x5b\xbd\x0e\x42\xa8\x3f\
-\x76\xc8\x46\x2c\x35\xea\xa5\x9a\xfd\xef\x3e\xf2\xf5\x16\x69\x72\
-\x58\xb0\xcd\xf6\x12\x85\x10\xfd\x93\x46\x73\xf4\xf9\x17\xed\xd3\
-\x12\x16\xe1\x59\x4d\x76\xee\x23\x4a\xd1\x06\x2c\xbf\xfe\x17\xb1\
-\xd9\xc1\x0d\x19\xa7\x0d\xc4\x36\x2c\x3a\x4d\xb1\x4e\xed\x58\x8f\
-\x25\x80\x28\xf7\x59\x46\xe7\xdd\x46\x24\xd7\x8e\xe5\xba\x98\xb6\
-\x55\xb1\x26\xc9\xb8\x24\x2d\x74\xb0\x7b\xb2\xa8\x1c\xad\x00\x88\
-\x2c\x46\x63\x01\x82\xab\x24\x0a\x21\xfa\x1f\xcd\xf6\xfa\x9c\xef\
-\xca\xc6\xa0\xc0\xf8\x2f\x5a\x11\x18\x34\x04\x68\x1f\xb0\xdb\x91\
-\x82\x52\x9b\xce\x8e\xe3\xca\xf6\x0e\xc0\x9a\x1e\x5e\x59\x6c\x02\
-\xee\xc2\x82\x57\xf7\xc5\xd2\x50\x7e\x0c\xf3\x65\x4f\x14\xfe\x3a\
-\x37\x02\x2e\xa6\x7d\xe0\x70\xc9\x3a\x78\x46\xa3\xed\xb0\xf8\x80\
-\xa6\x3e\xde\x05\x36\x66\xd4\xfd\x16\x2c\x38\x3a\xcd\x00\xcc\xc5\
-\x24\x71\x33\x69\xd0\x08\xea\x14\xb3\xb1\x3c\xfd\xe9\x78\x91\x1a\
-\x1f\x47\xad\xde\x6f\x97\xf9\xf1\x65\x58\x0c\x4c\xe8\x06\x34\x30\
-\x8a\xc9\x85\x29\xba\x7d\x1f\x8f\x11\xc0\xda\x0a\xe3\x5a\xfa\x1a\
-\xd7\x60\x99\x7e\xce\xa4\x2d\x26\x62\x28\xf0\xed\x28\xe6\xc9\x42\
-\xbe\x5d\x20\xb5\xe8\x24\x9a\x01\x11\x59\x0c\x07\xed\xe6\x27\x44\
-\x3f\xa7\x25\xa5\x94\xd4\x01\xfb\x86\x33\xe3\xa7\xcf\x64\x17\x2c\
-\x65\x61\x48\xa2\xa0\x40\x46\xe0\x30\x96\x16\x74\xfb\x40\x51\xc9\
-\xf9\xb1\x6b\x48\xed\xe0\x5b\x4d\xa2\x98\xa1\x98\xfb\xcf\x75\xae\
-\x18\xdd\x05\x9c\x0d\x7c\x14\xdb\xd7\x20\xe4\x0d\xb4\x65\xc1\xc9\
-\xaa\xc3\x81\x04\x2b\x1f\x51\x4c\x6e\xfa\x6c\x26\x00\xbf\xc5\x76\
-\x6e\xdd\x52\x93\x67\xe3\xa3\xb8\x2d\xbd\xe3\xe9\x33\x19\x93\xd1\
-\x1e\x1d\x51\x43\xfb\x80\xdf\x75\xc0\x8a\xd4\xb1\x1d\xb1\x80\xd9\
-\x05\xc9\x07\x9b\x04\xfa\x18\xb0\x0f\xf0\x4a\x21\xcf\xd2\x9e\x50\
-\x36\x3d\x28\xb5\x25\xa3\xdc\x75\x41\xdd\x6b\xe9\xde\x66\x57\x5b\
-\x82\x46\x68\x17\x5f\xb2\x9b\x1b\xbe\xa1\x5c\x97\xba\x71\x7a\x38\
-\xb0\xb8\x90\x67\x71\x60\x54\x66\x6d\x18\x96\x27\x70\x6b\xf3\x31\
-\xf5\x16\x1f\x53\x13\x7b\x6a\x4c\x6d\x65\xe6\x60\x7b\x46\xa4\x63\
-\x9c\x0e\x07\xa6\xa4\x77\x24\x17\x9d\x47\x2b\x00\x22\x8b\xc1\x94\
-\xcf\x29\x2c\x84\xe8\xfb\x2c\x75\x05\x2f\x51\x2c\x06\x00\x67\x00\
-\xcf\x7a\x0e\xf8\xed\xb0\xac\x60\x6f\xcb\xf8\x5d\xa2\xa0\x34\x00\
-\xff\x06\x3e\x14\x7c\x7f\x30\x70\x66\x14\x73\x25\x96\x69\x64\x5f\
-\xe0\x27\xd8\xe6\x5f\xfb\x01\xeb\xa2\x98\xbf\x54\x73\x16\x3d\x8a\
-\xd9\x05\x38\x17\xcb\x6b\x3e\x14\xf8\x15\x70\x16\x96\x2d\x65\x15\
-\xb0\xb6\xcc\xcf\x1b\xb0\xb4\x8a\x1f\xa4\x6d\x05\xe4\x60\xe0\xf4\
-\x28\xe6\x52\xaf\xc3\x04\xe0\xa7\x58\x3e\xf2\xb7\x03\x8d\x51\xcc\
-\x8d\x55\x76\x45\xc8\x32\x44\x8e\xc4\x36\x5e\xfb\x93\x2b\xc3\x1f\
-\x01\xde\x5a\x81\x61\xd7\x92\x32\xec\x3e\x17\xc5\x3c\x8b\xcd\x34\
-\xbf\x82\xcd\xfe\x3f\xe3\x6d\x92\xd4\x79\x22\xf0\x95\x28\xe6\x5a\
-\x37\xf0\x46\x03\x9f\xc1\x82\x9f\xd7\x00\xdf\x88\x62\xfe\xd8\x13\
-\xee\x17\x25\x82\xcd\xc7\x78\x3f\xfa\x99\xb7\xd1\x87\x5d\x11\xee\
-\xb5\xfc\xe2\x78\x36\x7d\xfd\x46\x5e\x72\xc3\x3a\x97\x31\x1e\x56\
-\x61\xf9\xf6\x3f\x8e\xad\xb6\x34\x00\x2d\x1e\x98\x9e\x8c\x87\xd5\
-\xc0\x0b\xd8\xa6\x5c\x09\xef\x01\x3e\xe1\x79\xf7\x37\xb9\x81\xfa\
-\x53\x6c\x83\xbd\x09\xd8\xce\xd6\xf7\xf7\xc3\xb8\xbd\x95\x5e\xcf\
-\x83\x03\x83\x3c\x79\x4e\x3d\x10\xc5\xdc\xad\x8d\x4b\x65\x00\x6c\
-\x31\xa2\x98\x37\xf9\x43\xb3\x1a\xbc\x05\xdb\xc8\xa6\x1a\x83\x76\
-\x7b\x7f\x28\xf4\xf7\x55\x9d\xa5\xd8\x2e\x93\xd5\x40\xdb\x88\x8b\
-\x6d\x99\xc5\xd8\x66\x59\x9f\xa7\x78\x97\xde\x99\x58\x0e\xf8\x91\
-\xd8\x26\x50\xe1\x7b\x62\x3d\x70\x65\xb2\x11\x94\x07\xdf\xfe\x85\
-\xe2\x5d\x45\x07\x63\x3b\xef\x9e\xe8\xca\xf3\x78\xcc\xfd\x27\x07\
-\xbc\x11\xdb\x11\xf5\x24\xda\xef\x2f\xd0\x25\x6a\xcd\x4d\xe9\x4b\
-\x98\xef\x7f\x4d\xa0\xcc\xde\x4a\x5b\xee\xfe\xf4\x66\x69\x2f\xbb\
-\xa2\xc5\x8c\x49\xb4\x4e\x9f\xcd\x1f\xbc\x4c\x3b\x05\xef\xc6\xe9\
-\x58\x3c\xd4\x3a\xaf\xc3\xce\x5e\x87\xb1\xd8\xa6\x4a\x2b\xb1\x55\
-\x86\x6a\xd1\x80\xed\xbb\xf0\x81\xe0\x39\x3e\x1c\xf8\x39\xb6\x91\
-\xd5\x50\x6c\x36\xb9\xa3\xbd\x03\xe6\xf9\xb3\x2d\x34\x14\x26\xb9\
-\x21\xb7\x01\x38\x79\xc6\x24\xee\x9b\x3e\x9b\xeb\xbd\x8d\x46\x04\
-\xed\x76\xae\x1b\x7d\xaf\xfa\xbd\xc6\xba\x2c\x06\x03\x17\x02\xaf\
-\x47\x31\xb7\x56\x7b\x15\xc0\x73\xdb\xbf\xe4\x86\xe5\xa0\xa0\x0d\
-\xbe\xe0\x4a\xff\x06\xcc\x8d\x6b\x70\x6f\x1e\x50\x6e\xc8\x5c\x0d\
-\x7c\x92\x36\xd7\xb9\x70\x3c\x2c\xc7\x02\xd5\xc7\x07\xe3\xea\x22\
-\x6f\xfb\x24\x55\xe8\x06\xbf\xc6\xc4\x40\x16\xdb\xf9\x79\x53\x5d\
-\x46\x7b\x04\xe3\x6d\x5f\xe0\x32\xe0\x58\x37\x1c\xfa\x0d\xfe\x7c\
-\xb9\x0f\xdb\xc7\x63\x1a\xc5\x3b\x71\xff\x08\x38\x8e\xf6\x2b\x59\
-\x42\x06\x40\x8f\x71\x14\xb6\x9d\x76\x35\xf8\x87\x0f\xda\xfa\x2a\
-\x5c\xeb\x9d\xd8\x46\x33\x43\xfa\xb9\xfc\x67\x61\xb9\x81\xab\x41\
-\x93\xba\xb3\xd8\x56\xf1\x1d\x41\x2f\x71\x05\x2b\xdc\x11\x78\x67\
-\xb2\x03\x7f\x9b\xb1\xdc\xe3\xe9\xcd\xa1\xfe\xe6\xe3\xf2\x93\xc1\
-\x0b\x7a\x20\xa5\x73\xc8\xaf\x23\x3b\x40\xb7\x6b\x83\xd8\x72\xa1\
-\x3c\x86\xcd\xf2\x27\x6e\x3d\x39\xff\xff\xc8\x8c\x9f\x6c\xf4\xf2\
-\x6e\x80\xcd\xee\x27\x8f\xba\xe1\x73\x6a\x60\x44\x0c\xa2\xf4\x2e\
-\xcb\xeb\xab\xf4\xdc\x4e\x2b\x3b\xd7\x00\x9f\x76\x05\x8f\x40\x81\
-\x3c\xa8\x13\x97\x5a\xe5\x86\xc4\x5b\x82\xf6\x48\x36\x4e\xdb\x00\
-\xd4\x04\x75\xfe\x13\xb6\x6a\x52\x13\xdc\x6b\x82\x7f\xd2\x0c\xc5\
-\x56\x13\x7a\x6a\xc6\xf5\x5e\x2f\xf7\x3b\x83\x63\x83\x4a\x94\xa5\
-\x37\x33\x17\xf8\x1d\x10\x05\x3a\x56\x32\x1e\xb2\xc6\xc4\xe0\x40\
-\x99\xc7\x77\xd8\x8d\x81\xbf\x53\xbc\xb2\x36\x0c\xd8\xbf\xc4\x3d\
-\x57\x54\x73\x4c\xf5\xb2\xe7\xd4\x26\x1f\x17\x27\x50\xbc\x2a\x72\
-\x28\xe6\x0a\x74\x85\x32\x16\xca\x00\xe8\x8b\x34\x03\xf5\x85\x3c\
-\xaf\x77\xf7\x42\x51\x4c\x43\x0f\x3e\x98\x7b\x13\x9b\xaa\x21\x2f\
-\x21\x04\x60\x3b\xec\x9e\x89\xe5\xd5\x2e\xa7\x68\x35\x02\x57\x01\
-\xdf\x29\xe4\x8b\x37\xe9\x72\x43\xe2\x3b\xae\xac\x7d\xb4\xcc\x7b\
-\xa5\x15\x78\xca\x0d\xf8\x07\xaa\x55\x01\x57\x66\x6f\xc3\x66\xec\
-\xbf\x93\x52\x9e\xb3\x8c\xfe\x99\xc0\xaf\xc2\x59\x6c\xaf\xc3\x0f\
-\xb0\xd9\xf0\x4f\xd0\x7e\xe3\xa1\x90\x47\x30\xf7\x8d\xfb\x7b\xa0\
-\x3d\x9e\xc3\x5c\x1e\xce\x27\xdb\x0d\xb3\x15\xcb\x1a\xb3\x5b\x29\
-\x39\xbb\xc2\x74\xbe\x1b\x2f\x47\x52\x22\xd5\x6b\x21\xcf\x6b\x51\
-\xcc\x7f\xb9\xf2\xdf\x51\x9d\x5f\x04\x66\x00\xb7\xf6\x94\xcb\xc5\
-\x79\x47\xb3\x6c\xda\xed\xfc\x14\xdb\xf5\xb5\xd4\x4e\xd1\xaf\xd2\
-\x7e\x07\xeb\xde\xa8\xb0\x5e\x88\xc5\x4d\x1c\xd7\x81\x9e\xb5\x12\
-\x38\x07\xb8\x3e\x75\x8d\x65\x51\xcc\x99\xc0\xa5\xd8\x4a\xc0\x80\
-\x32\x3a\xc4\x1c\xe0\xeb\xb4\x05\x11\xf7\xd7\xe7\xd4\x25\xc0\xcf\
-\x02\x79\x0e\x76\x23\xeb\x21\x7a\x6e\x37\xe2\x7e\x8d\x82\x80\x85\
-\x10\xa2\x6f\xd0\x84\xb9\xed\x84\xe9\x03\x4b\x65\xea\x6a\x71\x85\
-\xa0\x6c\x0a\x47\xf7\x3b\xbe\xc9\x15\xc0\x5f\x01\x4b\xb0\x99\xc4\
-\xe4\xb3\x06\x9b\x99\x3d\x0d\x88\x0a\x79\x96\x97\x50\x7a\x5e\xf0\
-\x73\xce\x04\x1e\xc7\x66\xc8\x93\x6b\xbc\x8e\xb9\x26\xcc\xc0\xdc\
-\x20\xe6\xa4\x94\xc8\x8d\xd8\x2e\xb9\x49\x39\x17\xd1\x3e\xc7\x79\
-\xfa\x9c\xa2\xba\xbb\x5f\xfa\x6f\xbc\x1e\x97\x60\xae\x3f\x61\x3d\
-\xd6\x7b\xb9\xce\x04\xbe\x59\xc8\xb7\x8f\x09\xf0\xcd\xc1\xce\xf0\
-\x7a\xdc\xeb\x75\x4f\xd7\xe1\x7c\x6c\x86\xfe\x2f\x29\x37\x98\x74\
-\xaa\xc7\xac\x3a\x64\xb5\xdf\xfa\x8c\xf6\xf8\x1d\xe6\x96\x95\x2e\
-\xc3\x12\xe0\x7f\x80\xff\xc2\x76\x21\x2e\x97\x9a\xf3\x59\xcc\x7f\
-\x7f\x86\xff\x7f\xb9\xcb\xab\xa8\x5c\x1d\xd4\x79\x83\xcb\xf1\x12\
-\x97\xeb\xe5\x85\x7c\xa7\x57\x3d\xd2\x72\x09\xd3\x5d\x16\x77\x58\
-\x9b\xc3\x9d\xe5\x7d\xe4\x8e\x54\x59\xd6\x00\x7f\x00\x3e\x85\xb9\
-\x5d\x95\xba\x5e\x56\xbf\x5f\xd5\x43\x63\xaf\x64\x4a\x54\x1f\x27\
-\x5f\x06\xbe\x86\xad\xf4\xaf\x4f\xc9\xf5\x55\xef\xaf\x9f\x04\xfe\
-\xa7\x44\x5c\x45\xd2\x86\xdf\xc5\x5c\xba\xd2\x63\xea\x01\xef\x0b\
-\x27\x01\x4f\xa6\xc6\x54\x25\x72\x2f\x3b\xee\x5a\xac\x66\xab\xca\
-\xd5\xb9\x92\x73\x2a\x7c\x6e\x95\x1d\x1b\x3e\xd6\xae\xc2\xbc\x1c\
-\xc2\x73\x06\x00\xc7\xf7\xd3\x20\xe8\x1e\x47\x2b\x00\x42\x08\xd1\
-\x37\x58\x06\x4c\xa1\xbd\x4f\x7e\x16\x0d\xd8\x4c\x7b\x5d\xea\x58\
-\x43\x86\xb2\xd2\x02\x3c\x12\xc5\xfc\xdb\x95\xbd\x9d\x52\x4a\xc2\
-\x0b\x85\x7c\xc7\x7e\xb6\x85\x3c\x2b\xa2\x98\xcb\xfc\x25\x1d\xfa\
-\x38\xb7\xb8\xf2\xba\xa0\x44\xe0\xef\x13\x98\xab\x43\x32\x53\xdd\
-\xea\x0a\x6b\xb9\x73\xc8\x50\x9e\x5b\x80\x87\xa2\x98\xc7\x30\x1f\
-\xfd\xd1\x29\x05\x63\x01\xb0\xa4\x9c\xff\x7a\x21\xcf\xea\x5c\x8e\
-\xff\x9b\x3e\x9b\x5b\x31\x77\x83\xc1\x15\xd6\xe1\x16\xe0\xbe\xe0\
-\xef\xac\x3a\x64\xb5\xdf\xaa\x8c\x32\xd4\xe7\x72\xfc\x71\xfa\x6c\
-\xfe\x9e\x2a\xc3\x0a\xda\x7c\xbc\xff\x11\xc8\xa2\x5d\xbb\xba\x32\
-\xf8\x82\xaf\xcc\x5c\x84\xc5\x60\x0c\xc2\x66\x9c\x97\x57\x58\x67\
-\xfc\xdc\xf9\xdd\x08\xd8\x4e\xcb\x25\x4c\x77\x99\x25\xff\xe6\x5c\
-\x8e\xfb\xa6\xcf\xe6\xa4\x54\x59\x36\x62\xae\x35\xeb\xb1\xa0\xf3\
-\xba\x12\xd7\xcb\xea\xf7\xeb\x7b\x68\xec\x95\x4d\x89\x5a\xc8\xb3\
-\x22\x97\xe3\xf2\xe9\xb3\xb9\x09\x5b\x5d\x0b\x7f\xbb\x16\x98\x5b\
-\xc8\x97\xde\xcc\xcb\xdb\x70\x61\x14\x53\xc0\xb2\xfd\xec\x96\x1a\
-\x53\x2f\x14\xf2\xbc\xd2\x0d\xb9\x97\x1d\x77\x8d\xb6\xce\x7e\x1e\
-\x16\x5f\x90\x59\xe7\x4a\xce\xa9\xf0\xb9\xd5\xe1\xd8\x98\x31\x89\
-\x15\xd3\x67\x73\x1a\xed\x33\x41\x6d\x2b\xde\x0f\x55\x27\x27\x11\
-\x74\x8e\x28\xe6\x54\xaa\x17\x03\x70\x0f\x30\xb9\x4a\x2e\x40\x13\
-\x7d\xf6\x64\x68\x15\xca\xb5\xc1\xcb\x35\xa7\x0a\xe5\x4a\x76\x24\
-\xad\x56\xe0\xf4\x15\x59\x3b\x9f\xf6\xb3\x7e\xb1\x10\x98\xe8\xe9\
-\xe2\xba\x5b\xae\xf1\xd8\x12\xf1\xee\x55\x2a\xdb\x69\x85\x3c\x57\
-\x74\xf7\x22\x43\xb6\x83\xd3\x67\x72\x39\xe6\x73\xdd\x6f\xfb\x85\
-\x10\x42\x08\xd1\x1b\x91\x0b\x90\x10\x42\x08\x21\x84\x10\x32\x00\
-\x84\x10\x42\x08\x21\x84\x10\x32\x00\x84\x10\x42\x08\x21\x84\x10\
-\x32\x00\x84\x10\x42\x08\x21\x84\x10\x32\x00\x84\x10\x42\x08\x21\
-\x84\x10\x32\x00\x84\x10\x42\x08\x21\x84\x10\x32\x00\x84\x10\x42\
-\x08\x21\x84\x10\x32\x00\x84\x10\x42\x08\x21\x84\x10\xd5\x43\x3b\
-\x01\x0b\x21\x84\xd8\xa6\x89\x62\x6a\xb0\xdd\x63\x9b\x0b\xf9\xd2\
-\xbb\xbb\x8a\x2d\xda\x26\x39\x6f\x93\x1a\x6c\xe7\xdb\x86\x72\xbb\
-\x38\x8b\x8a\x64\x9a\xc8\xb3\xa1\x90\xa7\x59\x12\x91\x01\x20\x84\
-\x10\x42\x54\x95\xda\xc1\xf0\x8d\x9b\x39\x99\xe2\x5d\xc0\x57\x01\
-\xe7\x15\xf2\xac\xec\x45\x4a\xd1\x9e\xc0\xd7\x81\xb7\x00\xaf\x46\
-\x31\x57\x01\xb7\x6d\x2b\x0a\x92\xef\x22\x7f\x52\x6f\x69\xa3\x28\
-\x66\x00\x70\x04\x30\x05\xd8\x1f\x18\x02\x6c\x02\x5e\x8c\x62\xee\
-\x05\x6e\x2c\xe4\x59\xa3\x11\xb6\x59\xa1\x3f\x03\xd8\x2b\x38\x7c\
-\x4f\x21\xcf\xef\x52\xe7\x0d\x06\x4e\x70\x99\x8e\x04\x1e\x8d\x62\
-\xfe\xbb\x90\x67\xa9\xa4\x28\x03\x40\x08\x21\x84\xa8\xde\xcb\x65\
-\x10\xb8\xf2\x7f\x6a\x70\x78\x21\x70\x19\x94\x57\x2e\x6b\x6a\x61\
-\xea\xad\x4c\x04\xf6\x0b\x0e\x37\x01\xb3\x0a\x79\x96\x54\x5a\x86\
-\x12\xd7\x59\x0f\xdc\x52\xc8\xb3\xce\x15\xa8\x1f\x00\x27\x02\x39\
-\xff\xfe\xed\xc0\xab\xc0\x3f\xbb\xa1\x98\x25\x2b\x0a\xc9\x35\x5b\
-\xe9\xbd\xb3\xae\xfb\x75\xa5\x8d\x7a\x48\xa1\xcd\x01\x9f\x04\x7e\
-\x0a\x8c\xcf\x38\xe5\x04\x60\x2e\x70\x7f\x14\x53\x0b\x0c\x0a\xbe\
-\xeb\xb2\x8c\xa3\x98\x11\xc0\x47\x80\xe1\x65\x4e\x7b\x19\x78\x0c\
-\x78\xb5\x90\x67\x53\x2f\xd2\xe1\x3e\x92\x32\xb2\x81\x62\x03\x00\
-\x38\x08\xb8\x10\xd8\xd1\xff\x3e\x12\x18\x14\xc5\x4c\x2d\xe4\xa9\
-\xd7\xd3\x4a\x06\x80\x10\x42\x08\xb1\xd5\x19\x34\x04\xb0\x59\xe9\
-\x50\x31\xdd\x00\x4c\x86\xca\x0d\x80\x12\xd7\x59\x08\xdc\x07\xac\
-\x73\x85\xe8\xf0\x40\x51\x07\x78\x83\x2b\x4c\xff\xec\x46\x15\x0e\
-\x04\xce\x73\x23\x00\xa0\x01\x98\x06\x3c\xae\xd6\x2d\xcb\x01\xc0\
-\xb9\x25\x94\x7f\xbc\x4d\xe6\xfa\xff\x27\xbb\x4c\xa9\x82\x8c\x47\
-\xb9\xd1\xb1\x7b\x99\x73\xd6\x7b\xdf\xbb\x23\x8a\xf9\x39\xb0\xa0\
-\x0f\xad\x12\x1d\xe4\x75\xdc\x6c\x1b\x03\x79\xaf\xf3\x22\x75\x3b\
-\x19\x00\x42\x08\x21\xc4\xb6\xc4\x46\xe0\xb5\xd4\xb1\x66\xa0\xb1\
-\x9b\xd7\xdd\x1e\x78\x27\x30\x34\x30\x5e\xb6\x97\xb8\x4b\x33\xa0\
-\x06\x80\xf7\x01\xfb\xa4\xbe\x6a\xf2\x36\xa9\xc5\x56\x6e\x92\xf6\
-\xda\x85\xe2\x99\xef\x9e\x96\xf1\x70\x60\x6f\x60\x4f\xe0\x03\xc0\
-\xd9\x51\xcc\x8d\x7d\xc4\x08\x68\xc0\xe2\x28\x6a\x52\xc7\x14\x07\
-\x20\x03\x40\x88\x3e\xc3\x58\xf7\x59\xad\x06\x4b\x0a\x79\xe6\xf5\
-\xc2\x3a\xd6\x01\x87\x47\x71\xc9\x59\xb0\xce\x30\x86\xb6\x59\xc8\
-\x6a\xb0\x77\x15\xe5\x3f\x02\x9b\x8d\xad\xca\xb5\xaa\x58\xae\x35\
-\xc0\x53\x0a\x92\xdb\x26\x78\x0d\x98\xe9\x4a\xe7\xf6\xae\x10\xdd\
-\x06\xc4\x12\xcd\x96\x65\xda\xed\x0c\xc6\x5c\x53\xc2\xd5\x98\xf5\
-\xc0\x2f\xb0\x59\xfd\xf7\x03\x7f\xeb\x05\x45\xad\x01\xf6\x05\xbe\
-\xef\xe5\x9a\xd7\x07\xc4\x7b\x37\x70\x17\xf0\x41\x97\xef\x7a\xe0\
-\xe7\xc0\x72\xf5\x3c\x19\x00\x42\xf4\x15\x26\xfb\x8b\xa0\x1a\x5c\
-\x09\x9c\xde\x0b\xeb\x38\x1a\xb8\x0a\xaa\x92\xf1\x62\x40\x95\x0d\
-\x80\x33\x80\xaf\x54\xe9\x5a\x37\x40\xd5\x94\xf6\x1f\x02\xb3\xaa\
-\x74\xad\x7f\x00\xc7\x62\x33\x8a\xa2\x1f\x53\xc8\xd3\x12\xc5\x5c\
-\x04\x3c\xeb\xcf\x95\x67\x81\x1b\x41\xc1\x91\x5b\xe9\xb9\x77\x58\
-\xea\xd8\x53\xc0\x8c\x42\x9e\xb5\x51\xcc\x9f\x30\x3f\xff\x2d\xc5\
-\x52\x57\xee\x07\x00\x63\x31\xb7\xa4\x70\x06\x7d\x3f\xe0\x9b\x51\
-\xcc\xd7\x7b\x7b\xe6\xa8\x42\x9e\x97\xa3\x98\xd3\x80\x4f\x01\xbb\
-\xf9\x33\xee\xc6\x42\x9e\x26\x75\x3b\x19\x00\x42\xf4\x14\xad\x55\
-\x7e\x68\x0f\xac\x62\xbf\x1d\x54\xe5\x97\x45\x63\x95\xae\x99\x03\
-\x06\xf7\xd2\xf6\x1c\x54\x45\xb9\xd5\x17\xf2\x2c\xe8\xee\x45\x86\
-\x6c\x07\xa7\xcf\xa4\x9e\x36\x77\x8b\xee\x12\x06\x6f\xf6\x1a\xa2\
-\x98\xed\x31\xdf\xf2\x44\x09\x69\xc6\x56\x2a\xd6\x54\x7a\xce\x80\
-\x1a\x98\x76\x3b\x7b\xbb\x42\xb3\xf9\x7b\xcc\x15\xe6\x6d\x58\xd6\
-\x95\x1c\x50\x0f\xfc\xdb\x7f\xdb\xd0\x41\xb9\x72\x98\xdf\xfc\x3b\
-\x80\x1d\xfc\xf0\x6b\xc0\x93\x29\x85\xa9\x27\x64\x32\x01\x73\x1b\
-\xc9\x05\xe3\x70\x56\x12\xa4\x79\xfa\x4c\x72\xb4\xdf\xef\xa6\x01\
-\xcb\x2a\x93\xb8\x9d\xec\xee\xe5\xbd\xc1\xbf\xdf\xd3\x8d\xbf\x35\
-\x7e\x8f\x1a\x97\x69\xe2\x5e\xb2\xc6\x65\x36\x12\x78\x0f\x6d\xbe\
-\xd5\xf7\xf8\x75\xf6\x06\xde\x9c\xaa\x7b\x0d\xf0\xe6\xa8\x6d\x5d\
-\xa1\x5d\xdb\xf9\xbd\x6a\xfd\xb7\x49\xf6\x9b\xa4\x4e\x8b\xfc\xfc\
-\x4d\x1d\xc8\x63\x98\xff\x7e\xaf\xe0\xf7\xf5\xc0\xc3\xc0\xdc\x4e\
-\xa4\xd1\xac\x8d\x62\x0e\xf7\x7a\x0f\xc4\xdc\x70\x9e\x03\x1e\xee\
-\x28\x68\xb4\x44\x19\x96\xfa\xef\x9f\x4b\x97\x21\x90\xef\x3e\x19\
-\x63\x78\x28\xf0\xf6\x28\xde\xec\xae\xf2\x54\x14\x33\xd4\x65\xbc\
-\x77\xea\xdc\xb4\x8c\x37\x02\x4f\x14\xf2\x6c\xec\x62\xf7\x9a\xe5\
-\x13\x44\x39\x6c\x25\xf5\xb3\x58\x8c\xc1\xe0\x60\x72\x65\xa2\xf7\
-\xf9\x65\x19\x72\x18\xe0\xe3\xe2\xad\x98\xbb\x52\x32\x2e\xe6\x95\
-\x6b\xcb\x28\x66\x6c\x50\xb7\x64\x7c\xb6\xf8\xf8\xdc\xcb\xcb\x33\
-\xb7\x90\x67\x4e\x27\xc6\xc9\x60\x37\xb0\xfe\x11\x1c\x1e\x49\x10\
-\x4f\x93\xba\x2f\xfe\xdd\x0b\x6e\xe8\x1c\xe2\x6d\x99\xf4\x83\xc7\
-\x0b\x79\xd6\x49\xbd\x91\x01\x20\x44\x39\x1a\xa8\x9e\x9b\x47\x6f\
-\x66\x95\x2b\x15\x83\xd4\xe4\xa2\x87\x38\x10\xb8\x39\xa5\xd8\x1d\
-\x8b\x05\xb4\x56\x74\xce\x20\x53\xaf\xce\x00\x3e\x1f\x28\x49\xdf\
-\x02\x0e\xc6\xb2\xaf\x24\x59\x42\x5a\x80\x15\xc0\xb5\x9e\x2e\x70\
-\x59\x09\xc5\x62\x38\xf0\x19\xbf\xde\x9b\x83\x77\x4a\x13\x96\x35\
-\xa5\x4b\x86\x54\x93\x79\xe0\xcf\xf7\xeb\x0c\x0c\xde\x57\x3b\xa4\
-\x14\xac\x8f\x00\x17\x04\x3f\xfd\x37\xf0\xaf\x40\x21\xab\xa3\x7d\
-\x60\xe7\x72\x60\x6d\x09\x79\x64\xc9\xb5\x0e\x0b\xe8\x7d\xa7\xff\
-\xbd\x18\x0b\x9e\x3c\xc5\x8f\x25\x63\xfe\x34\x2f\xef\xc5\xae\x8c\
-\xd6\xa5\x8c\xca\xf3\x68\xf3\xb9\x2e\xba\x47\x60\x44\x7d\xd5\x15\
-\xcd\x9d\x03\xc3\xa5\xd1\x9f\x2f\x97\x46\x31\xbf\x2e\xe4\x59\x9c\
-\xd1\x0e\x89\x5b\xca\x99\xde\x8e\x23\x82\xdf\xb7\x00\x2f\x02\xb7\
-\x44\x31\x17\x17\xf2\xbc\xd0\x81\xf8\xb7\xf3\xfa\x4d\xf4\x72\xe4\
-\x7c\x12\x67\x8d\xf7\x87\x02\xb0\xb0\x90\x2f\x9e\xd8\xf1\x32\x1c\
-\xe4\xfd\x69\x72\xaa\x0c\x8d\x6e\xc4\xfc\x3a\x8a\xb9\xbc\x90\x67\
-\x55\x86\x6c\xde\x45\xfb\xd5\xca\xa4\x3f\xb7\x06\x32\xdb\xd7\x65\
-\x3c\x30\xc3\x70\x0f\x65\xbc\x08\xf8\x50\x37\xde\x3f\x9b\x0a\x79\
-\x5e\xf7\xff\xaf\x8f\x62\x66\xb8\x22\x7c\x74\x70\xce\x2e\xc0\xae\
-\x69\x03\x20\x8a\xd9\xc9\x8d\x87\xe3\xbd\xbc\x83\x82\x71\xb1\x02\
-\xb8\x31\x59\x79\x4a\xcb\xd1\x65\x77\x71\x60\x00\x7c\x07\x0b\x54\
-\x3f\xd6\x65\x0a\x70\x05\x54\x6e\x00\xd0\xb6\xaa\x3c\x2e\x38\x76\
-\x3a\xb6\x0a\x9e\x75\x5f\x30\x77\xab\x07\x81\xcf\xf9\xef\x06\x78\
-\x3b\xac\x05\xee\x8c\x62\x7e\x0a\x3c\x92\x51\x7e\xd1\x47\xd0\x4e\
-\xc0\xa2\x47\xb9\xe8\xe3\x34\x63\x29\xf5\xfa\xfb\x43\x62\xb3\x52\
-\x21\x44\x0f\x51\xe3\x8a\xfd\x50\xff\x0c\xa1\xfd\x0c\x7b\xd9\x73\
-\x72\xa6\x8e\x0f\x0a\xbe\x1f\xe9\x4a\xd3\x97\x03\xe5\x3f\x79\x37\
-\x8c\x76\x25\xe1\xfc\x28\x66\xbb\x0c\xa5\x73\x14\xf0\x33\xff\xfd\
-\x21\x29\x85\x6c\x20\xf0\x46\xe8\x5a\x1c\xcb\x26\x9b\xb3\xfd\x17\
-\xc5\xc1\xb8\x83\x68\x9b\x49\xc5\x8d\x81\x8f\xa7\x7e\x3a\xd6\x15\
-\xe9\x84\x5a\x60\x58\xc6\xa4\x44\x73\x09\x79\x64\xc9\x35\xd9\x90\
-\x2a\xf9\x7e\x82\x1b\x1d\xef\xc9\x30\xf8\x07\xfa\x39\x59\x6e\x77\
-\x75\x65\xee\xb1\x2b\xf0\x6b\x6c\x86\x79\x4c\xea\xdd\x9c\xd4\xfb\
-\x1c\xe0\x57\x2e\xf7\xb0\x1d\x72\x98\xeb\xcc\x0d\xc0\x17\xb1\x95\
-\x8a\x01\xa9\xb6\x9c\xe0\xc6\xc1\x2f\x7d\xdf\x83\x72\x24\x72\x1d\
-\x1d\x18\x70\x39\x3f\x7e\x9a\x2b\x9f\x3b\x66\x94\xe1\x58\xe0\x0f\
-\x6e\x80\x6c\x9f\x51\x87\x09\x58\x86\x9f\x2b\xa3\xb8\x48\x11\x4d\
-\xe4\x3b\x38\xc3\x60\x1c\x10\xf4\xe7\x44\x66\x89\x8c\x07\x55\x20\
-\xe3\xaa\xad\xe4\x9d\x7f\x0c\x6b\x81\x7b\x53\x87\x07\x05\xc6\x76\
-\x22\x8b\xb1\xc0\x2f\x81\xb3\xdc\x20\x1a\x94\xea\x1f\xbb\x00\x5f\
-\xc2\x52\x75\x1e\xe1\xb2\xcb\xea\x43\x43\x5d\xe1\x3f\x07\xf8\x74\
-\xa0\xfc\x77\x85\x5c\xea\xb9\x30\x34\xc3\x80\x1a\x98\xfa\x7e\x92\
-\xdf\x7b\x7c\xd0\x96\x39\x6f\xdb\x13\x80\x4b\x28\x9f\x35\x49\xc8\
-\x00\x10\xdb\x32\x0d\xeb\x01\xb8\x05\x0b\x3a\xea\xcf\x2c\x01\x1e\
-\x51\x8b\x8b\x3e\x46\xf2\x42\xcf\x95\x31\x3a\x92\x0d\x84\x42\x25\
-\x67\x00\xf0\x09\x2c\xbd\x66\x4f\xb9\xab\xad\xcc\x78\x6e\x84\x06\
-\xc5\x4e\xd0\x4e\x99\xdd\x1e\x38\x28\x50\xaa\xf6\xa2\xbd\xab\xc8\
-\x02\x37\x02\xba\xf3\xde\xac\x5a\xb6\x19\x9f\x39\x9f\x8a\xb9\x32\
-\xd5\x74\x60\x00\xe6\x81\xe3\x52\xc7\xc7\x00\x05\x6c\xa6\x39\xd7\
-\x41\x5b\x4f\x02\xce\x8c\xe2\x2e\xaf\xfe\xd7\xb8\xe1\xf3\x79\xef\
-\x03\x09\x6f\x00\xbe\xeb\xb2\x2e\x57\x86\x3a\x6c\xd5\xe6\x3f\x53\
-\xbf\xef\xf5\x4c\xbd\x95\x21\xd8\x8a\x44\xba\x8f\xbe\x12\xb4\xe5\
-\x40\x6c\x05\xe4\xe3\x94\xf7\xb0\xc8\x01\x87\x02\x3f\xc1\x56\x59\
-\xca\xb1\x13\x3d\xec\x4a\x57\xa6\xad\xcb\xb5\xd1\xdb\xb0\x18\x88\
-\x5a\x3d\x46\x65\x00\x08\xd1\x8e\x56\x9b\xf7\x7f\x8e\x7e\x1e\x54\
-\x77\xde\xd1\xac\x03\xee\x00\x2d\x87\x8a\x3e\xc9\x46\x6c\x93\xa3\
-\xfb\x5c\x41\x0e\xfd\xb4\x07\x03\xc7\xfb\x66\x49\x09\xe3\x30\x77\
-\x95\x50\xc9\x69\xc2\xfc\x95\x7f\xe3\x63\xa1\xbb\xbb\xb5\xae\xce\
-\xb8\xc6\xb8\x40\x79\x7d\x23\xb6\x82\x91\x7e\xa7\x1d\x47\x9b\x2f\
-\xf9\xe8\x94\xb2\xde\x04\x3c\xd3\x09\x5f\xf8\x72\x34\x61\xee\x40\
-\x0b\xfd\xb3\xde\x3f\x0b\x31\x97\x90\xf0\x59\xd0\xea\xc7\x92\x73\
-\x17\xb9\xcc\x13\xe5\x39\x9f\x52\xf2\x96\x01\x7f\xc2\x5c\x30\x9a\
-\x53\x0a\xf4\xbb\xdd\x68\x48\x66\xde\x27\x61\x2b\x00\xa1\xe2\xfd\
-\x22\x70\x2d\xf0\x57\x8a\x57\x26\x93\x99\xfa\xbd\x2a\xa8\xdb\xb3\
-\x58\x5c\xc3\x0b\xa9\xfe\x30\xc8\xaf\x11\x6e\x9a\xb5\xbf\x2b\xaa\
-\xad\x41\x7d\xe7\x05\x65\x58\x9f\x6a\xa3\x8f\xd1\xb6\x52\xd3\xe2\
-\xf5\x7d\x85\xf6\x69\x29\x1b\x5c\x56\xa1\xcc\x12\x19\xaf\x4a\xbf\
-\x6e\x52\x32\x5e\xec\xf5\xe8\x2a\xb5\x51\xcc\xb0\x28\x66\x78\x14\
-\xb3\x3b\xf0\x1f\x6e\xbc\x84\x3c\x82\xad\x70\x27\xec\xeb\xb2\xa9\
-\x49\xf5\xe3\x59\xc0\x1f\x31\xb7\xb8\xb0\x5f\xbc\x0b\x73\x13\xea\
-\x88\x66\x9f\x64\x5a\x58\xa2\xee\x3d\x45\xd8\x0f\x9e\x4d\xc9\xb3\
-\xc6\x27\x01\x0e\xd4\xe3\xb3\x6f\xa2\x18\x00\xb1\x25\x58\xe1\x0f\
-\x8f\xbd\xfb\x6b\x05\x5b\x9a\x37\xbf\x0c\xd6\xa2\x7c\xdf\xa2\x6f\
-\xd1\x0c\x5c\x8a\xcd\x46\x6e\xc4\x5c\x35\x7e\x0f\xbc\x29\x38\xe7\
-\x30\x6c\xb9\xff\x69\xff\x7b\x4f\x3f\x2f\x54\xbe\x92\xa0\xc9\x45\
-\xae\x80\x9f\x0c\x9c\x4f\xd7\x83\xb3\x57\x63\x81\xc4\xe1\x73\xe3\
-\x70\x60\x4c\x14\xb3\xd4\xcb\x94\xb5\xfa\xf0\x56\x6c\x56\xf5\x75\
-\x2f\x73\xe8\x8e\xb3\x16\xb8\xb3\x0a\x32\x6b\x04\xfe\x17\xdb\x5d\
-\x35\x59\x4d\x48\x94\xb2\xfb\xbc\x9c\x57\x05\xe5\x6b\x70\xd9\x3c\
-\x10\xc8\x2b\x49\xc1\x38\xde\x8d\x99\x50\xe9\x9d\x8a\xa5\x27\x1d\
-\x03\x5c\x8f\x05\x58\x13\x18\x3e\x75\x58\xa0\x72\x1d\xe6\x1e\x32\
-\x38\xa5\xfc\x9f\x82\x6d\x9a\x35\x04\x73\x0b\x2a\x04\xef\xfb\xb1\
-\x58\xc0\xed\xdc\x52\x8f\x33\xcc\x3d\xe5\x5c\x6c\x86\x7b\x9c\x1b\
-\x75\x47\x04\xe7\xec\x86\xb9\x04\x25\xc6\xc5\x5f\x5d\x19\xfc\x1e\
-\xb6\x92\xf1\x0c\xf0\x05\x2c\xf8\x78\x88\xf7\xad\xaf\xd2\x36\xe9\
-\xb8\xaf\xb7\xd3\xc2\x40\x36\x7b\x7a\x9d\x77\x0d\xee\xf3\x84\xd7\
-\xa5\x3e\x90\xd9\x33\x2e\xe3\x13\xfd\xba\x94\x90\x71\x13\x64\xc7\
-\xae\x54\xc8\x64\xef\xd3\x03\x30\xb7\x9d\xdd\x52\x72\x5e\x89\xa5\
-\xd2\xdc\x00\xb6\xeb\xb4\x1b\x08\xe3\x53\x65\xfa\x2e\xe6\x6b\xdf\
-\x84\xcd\x9a\x5f\x47\x9b\xeb\xcc\x40\xe0\xbd\x51\xcc\x95\x65\x02\
-\xbc\x5b\x31\xd7\xaa\x1f\x79\x9f\x86\x2d\xb7\xa2\x7e\x27\xe6\xf6\
-\xb5\x12\x73\xfb\xfa\x25\x70\x4c\x60\x6c\x8e\xf2\xfe\xf1\xa8\x1e\
-\xa3\x32\x00\x84\x68\xc7\xf9\xc7\xd0\x30\xf5\x56\xae\x03\xde\x4b\
-\x7b\x7f\xdc\xfe\xc4\xe3\x58\x96\x85\xc9\x6a\x75\xd1\x87\x58\x00\
-\x5c\x52\xc8\xb3\x02\x20\x8a\x79\x12\xb8\x3f\x65\x00\x0c\xa7\xd8\
-\xef\x7b\x8f\x94\x32\xb4\xde\x95\xfd\x24\x38\x74\x7d\x14\x73\x0d\
-\x36\x1b\x9f\xef\x62\xb9\x36\x62\xee\x83\xc7\x05\x8a\xe3\xce\xd8\
-\xac\xfe\x7a\xe0\xc3\x25\x7e\xb7\x33\xf0\xd6\x9a\x5a\x5e\xf2\x73\
-\x49\x29\x6d\xcb\xaa\x20\xb3\xbf\x03\xdf\x09\x36\xa5\x0a\x59\xe7\
-\x7b\x78\xb4\xa4\x94\xea\x65\x15\x66\xbd\xca\x61\xb3\xe9\x39\x6c\
-\xc6\xf8\x51\xe0\x2d\x29\xe3\x23\x61\x58\x46\x1d\xff\x0a\xfc\xc3\
-\x57\x39\xd6\x47\x31\x77\x00\xff\x15\x9c\x97\x8e\xa5\xc8\x9a\xb0\
-\xf9\x79\x21\x6f\xc1\xb3\x51\xcc\xb3\xc0\xed\x29\x03\x20\x17\x28\
-\x81\x14\xf2\x6c\x8a\x62\xee\xc7\x66\xc9\x3f\xeb\x86\xdb\x83\x41\
-\x5f\xb8\xd1\x0d\x82\x21\xe9\x32\x78\x39\x97\x46\x31\x75\xb4\x9f\
-\xb1\xdf\x08\x2c\x0a\x82\x71\x93\x63\xeb\xa2\x98\x95\x19\x86\xcb\
-\xb2\x6a\x64\x16\x73\x76\x29\x23\xa7\x8d\x58\xec\x4b\x52\xc7\x64\
-\xd7\xe9\x3d\x28\x5e\x89\x99\x0b\xcc\x4c\x32\x27\x45\x31\x0f\xb9\
-\x81\x12\xfa\xce\xef\xea\xf2\xd8\x54\xa6\x3d\x0a\x85\x3c\xff\xde\
-\x0a\xcf\x86\xdb\x93\x7e\x90\xcb\xf1\xfa\xf4\xd9\x5c\x8a\xed\x25\
-\x30\xb8\xc2\xbe\x24\x7a\x31\x72\x01\x12\x3d\x4e\xb3\x3d\xd6\x66\
-\x51\x9c\xad\xa4\xdf\xe1\x6e\x40\xbf\x01\xa5\x47\x13\x7d\x8a\x25\
-\xa1\x52\x7c\xf1\x14\x5a\xca\x28\x23\x09\x03\x53\x8a\xce\x6b\xc0\
-\x82\x30\x23\xc8\xc5\x53\x58\xe7\xc6\x45\x97\xf0\x6b\xbd\x00\x45\
-\x69\x1c\x87\x63\x33\x8e\x63\x28\x9e\x69\x0d\x95\xed\xa1\xc0\x71\
-\x53\x6f\x65\x28\x36\xcb\x1c\xf2\x0a\xdd\x77\x4d\x02\x78\xa9\x84\
-\xf2\xdf\x15\xd6\x51\x3c\xa3\x3b\x08\x9b\x49\xbf\x1c\x8b\xbd\xb8\
-\x06\xcb\x3c\x33\xd9\x3f\xd3\x68\x5b\x75\x18\x0e\xc5\x41\xc1\xb4\
-\x77\x71\x5a\x87\xad\xa6\x6c\x08\x3e\x4d\x1d\x18\x5e\x6b\x53\xed\
-\xb0\xac\x92\xf6\x2a\xe4\x59\xee\x8a\xf1\x5f\x81\xa1\xee\x42\x33\
-\xc4\xdb\xa7\xbf\xb9\x47\xd6\x12\x4c\xa2\x96\x48\x39\x9b\x03\xde\
-\x12\xc5\x4c\xf4\x8d\x0a\xdf\x41\xe7\xf7\x65\xa9\xf7\xf6\xdb\x1a\
-\x6c\x8e\x95\x71\x77\xde\xd7\xa9\xce\xfe\x34\xa2\x17\xa0\x15\x00\
-\xb1\xa5\x58\x0d\xcc\xc0\x96\xed\x47\xf6\xc7\x0a\xba\x1b\xd0\x2c\
-\x6c\xd7\xc5\x63\xd4\xe4\xa2\xaf\x74\xdd\x2a\x28\x67\xd5\xde\xef\
-\x23\x61\xa9\x1b\x17\x43\x03\xe5\x78\xbc\x2b\x26\xe1\x73\xe4\x41\
-\x2c\xa8\x32\x79\xa7\xed\x85\xb9\xca\x1c\x9a\xba\xde\x5f\x52\x06\
-\x45\x6f\xe0\xdf\xfe\xcc\x08\x03\xad\x77\xc0\xd2\xab\x7e\x1a\x5b\
-\x59\xbc\x01\xb8\x1a\x58\x5a\x41\xfc\x42\x7a\x02\x62\x39\xe6\x46\
-\x13\xae\xd8\x54\x7d\xf7\x5a\x8f\x4b\x78\x93\xdf\x6b\x3f\xda\x52\
-\xb6\x6e\xa2\x7a\x7b\xa4\x6c\x49\x9a\x68\x5b\x6d\x49\x36\x54\x4c\
-\x8c\xde\xc1\xd8\xaa\xca\xf3\x51\xcc\xf5\xbe\x6b\x78\x56\xca\xd9\
-\x30\x8d\x69\x68\xe0\x09\x21\x03\x40\x6c\x1b\x14\xf2\xb4\x46\x31\
-\xf7\x62\x3e\x9e\x5f\xa4\x17\x6e\xb4\x54\x0d\x66\x4c\x62\xfd\xf4\
-\xd9\x9c\xe7\x86\xce\x18\xb5\xbc\x10\xdd\x62\x19\xb6\x8a\x10\xfa\
-\x85\xef\x87\xf9\xb0\x27\x0a\x6d\x23\x70\x17\xe6\x57\x9e\x28\x9d\
-\xe3\x28\xde\xbc\x0b\x37\x1a\x1e\x72\x65\xad\xd7\x70\xde\xd1\x34\
-\x4c\xbb\x9d\xcb\xfc\x99\xf1\xc6\xd4\xd7\x83\xfc\xf8\x21\x58\x36\
-\xa6\xb3\xa3\x98\xbb\x3a\x53\x07\xdf\x08\xeb\x81\x9e\xac\x83\x2b\
-\xff\x1f\xc0\x62\x22\xf6\xe9\x27\xcf\xf7\x59\xd8\x6a\x06\xd8\x6c\
-\xff\x64\x2c\x5d\x6e\x62\x8c\x0e\xc5\x32\xfe\xdc\x83\xc5\xbd\x24\
-\x29\x78\x43\x06\x64\x1c\x13\xa2\x57\x20\x17\x20\xb1\x25\x8d\x80\
-\x8d\xc0\x45\x98\x7f\x68\xbf\xc4\x97\x49\xff\x81\x2d\xe1\xaf\x57\
-\xab\x0b\xd1\x2d\xd6\x03\xb7\xa5\x8e\x1d\x01\x1c\x15\x28\x99\xaf\
-\x61\xc1\x8a\x4f\x07\xe7\xec\x86\xad\xc2\x85\x01\xc8\x6b\x30\x9f\
-\xfa\x5e\x85\xaf\x1c\xde\x8d\xf9\xce\xdf\x46\xb6\x0b\x61\x8d\x1b\
-\x02\x17\x61\xb9\xe5\x7b\x0d\xbe\x97\xc2\x41\xae\xfc\x77\x94\x8a\
-\xb4\x2f\xb1\xa4\x90\x67\x8e\x7f\xee\xc2\x82\xa2\x2f\x4d\x9d\xb3\
-\x27\xe6\xf7\x0f\xd9\xab\x60\x2d\x98\x0b\xcf\x86\x32\x9f\x06\x94\
-\x3d\x4e\xc8\x00\x10\xdb\x00\xcf\x00\x5f\xc1\x32\x55\xf4\x57\x43\
-\x67\x13\xe6\xb7\x7b\x03\xdd\x4b\x43\x27\xc4\xb6\x3e\x69\xd0\x0c\
-\x3c\x44\x71\xde\xfe\x7d\x28\xde\xd1\xf4\x09\xcc\x05\xe8\xa9\x94\
-\xc2\x7c\x0c\xc5\xfe\xd6\x2b\xfc\xd3\x5b\xeb\x39\x07\xcb\x6c\x73\
-\x22\xb6\x52\xfa\x4a\x86\x62\xb8\x0f\xf0\x95\x24\x0d\x68\x09\xea\
-\xb6\x64\xd9\xa7\xcf\x66\x00\xb6\xaa\xbb\x4f\x70\x78\xa3\xb7\xdb\
-\x3d\xfe\x79\xbe\xaf\x2b\xb9\x1e\x88\x7c\x1f\xc5\xf1\x31\x43\xb1\
-\xa0\x58\xc8\xde\xf5\xfe\x29\x2c\x2d\xe8\xe4\x32\x9f\x69\x74\x6f\
-\x5f\x0a\x21\x64\x00\x88\x3e\xf1\x10\x6d\xc1\xd2\xd3\xfd\x08\xda\
-\x6f\x69\xdf\x8f\xea\xb9\x0e\x88\xb0\x74\x7a\x32\x02\x44\x4f\x90\
-\xe5\x72\x90\xb5\x3b\x70\x4f\xd0\x94\x52\xe8\x46\x90\x72\x79\x3b\
-\x7d\x26\xc3\xa8\x8e\x1b\xdc\x72\x28\xca\x02\x93\x0e\x7c\x7d\xc8\
-\xbf\xbf\x27\xa5\x48\x8d\xa4\x78\x36\xfa\x19\xaa\x13\x00\x5c\x75\
-\x7c\x6f\x83\xf7\x63\xf9\xf1\xff\x82\x65\xd3\x99\x0c\xfc\x02\x8a\
-\x82\x8d\x73\xd8\x2c\x7b\x5d\xa0\x68\xa7\x57\x1a\xdf\x9a\x36\x10\
-\xa2\x98\x9d\xa2\x98\x53\xa2\xb8\x5d\xc6\xa0\x6a\x50\x87\xb9\x65\
-\x85\xb2\x8e\xb1\xec\x4f\x89\x92\x7b\x32\xd5\xc9\xbe\xb4\xb5\xdb\
-\xe8\x60\x28\xda\xf8\xaa\x05\x0f\x98\xbe\x78\x0a\xcd\x78\x4a\xd0\
-\x80\x06\x2c\x53\x50\xb2\x92\x30\x07\xdb\x4d\x78\x39\xb6\x1a\x75\
-\x6f\x21\xcf\xe3\xbd\xcd\x2d\x4d\xc8\x00\x10\xa2\x27\x8d\x80\xab\
-\xb0\x99\xae\xa7\xfa\x71\x3d\x97\x63\xf9\xbc\x2f\xcd\x78\x31\x08\
-\xd1\x59\xd2\xc1\xba\x75\xc0\x07\x3c\xcb\x0a\x51\xcc\x30\x6c\xb6\
-\x71\x4b\xcc\x00\xa7\x77\xd3\xdd\x01\xf8\x74\x14\xb3\x9d\x97\x25\
-\x87\xa5\xe9\x7c\x7f\x15\xee\xb5\xd0\x95\xf7\x2c\xd6\x03\xf7\x78\
-\xa6\x9a\x39\x98\x2f\x76\x29\xee\x62\xeb\xcd\xb4\x0e\x4c\x8c\x96\
-\x28\x66\x84\xa7\x09\x4d\x14\xcb\x5a\xe0\xf3\xd8\xaa\xe1\xcf\xb1\
-\xc0\xdf\x96\x42\x9e\x27\x30\xb7\x93\x74\x8e\xf5\x30\x05\x67\x96\
-\x5b\xd3\x07\x81\xc3\x92\x9d\x76\xa3\x98\xe1\xc0\x19\x58\x56\xa1\
-\x1f\x47\x71\xbb\xac\x41\xd5\xd0\x23\xd2\xbb\xc1\xbe\x0a\xac\x2e\
-\xe4\x79\xdd\x67\xce\x17\x51\xbc\x21\x59\x35\xa8\xa7\x38\x23\x4d\
-\x0d\x30\x22\x8a\xc9\x79\xf6\xa1\x9d\xbb\x79\xfd\x64\x23\xb0\x61\
-\x51\xcc\x18\x37\xca\x4e\x4b\x9d\xf3\x3a\xe6\xbe\x45\x93\x85\x0b\
-\xa7\x57\x98\xf6\x03\x8e\x0b\xda\x22\x87\xa5\x74\xfd\x0d\xb6\x42\
-\x3c\x31\xd8\xb5\xba\x5a\xec\xe3\x06\x5f\xae\xaf\xed\xb6\x2c\xb6\
-\xfc\x43\x49\x88\xad\xa1\x1c\x37\x45\x31\xf7\x60\x7e\xaf\x3f\xc3\
-\xb6\x97\xaf\xe9\x87\xf5\x5c\x15\xc5\x7c\xdb\x5f\xd2\x91\x2b\x01\
-\x39\xf5\x00\xd1\x05\x96\xbb\x12\x15\xee\xa5\xf1\x65\x60\x97\x28\
-\xe6\x31\xe0\xed\x94\xce\x8d\x5f\x6d\x16\x63\x33\xba\xe3\x03\xa5\
-\xf4\x4b\xd8\x4e\xbd\x77\x61\x79\xec\x4f\xa1\x78\xb7\xd8\x2e\x71\
-\xc1\xb1\xac\xfc\xc6\xcd\xdc\x0d\x1c\x59\xc2\x38\x78\x38\x90\xcf\
-\x5c\xb2\x77\xb9\xdd\x08\x3c\x1f\xa6\x29\xed\x61\xd6\xf9\x3d\xc3\
-\xec\x45\x67\x45\x31\x07\x63\xb3\xc8\xaf\x47\x31\x9f\x75\x05\x76\
-\xaa\x3f\x1b\x92\xac\x46\x3f\xc7\x76\xfb\x7d\xc4\xeb\x72\x70\xea\
-\xda\x9b\x02\xc5\xb7\x01\x8b\x7f\x78\x5f\xf0\x3e\x1f\x87\x6d\x52\
-\xf6\xc7\x28\x66\x9d\xcb\x6d\x32\x16\x34\xfd\x59\x60\x54\x14\xf3\
-\xad\x42\x9e\xf9\x55\xaa\x6b\x23\xed\x77\x7a\x7f\x0f\x30\x35\x8a\
-\x37\x2b\xfd\x6f\xa5\x7d\x86\x9c\x6a\x18\xa1\xa1\x8c\xeb\x80\x1f\
-\x60\x9b\xb0\x1d\x04\x2c\x8e\x62\xbe\x59\x66\x83\xad\x8e\x48\x36\
-\x02\x03\x5b\xe1\xda\x8f\xf6\x1b\xcf\x25\x3b\xf3\xb2\xc9\x72\x4b\
-\xdd\x8a\xed\x77\x30\x3a\xf8\xdd\x0f\x80\xfd\xa3\x98\xf9\x58\xbc\
-\xc0\xf1\xb4\x05\x4a\x5f\x0e\x9c\x1a\xc5\xcc\xe9\x62\xdf\xcc\x4a\
-\xd9\xfb\x2e\x6c\x82\x6d\x01\x70\x31\x6c\x95\xfd\x03\x84\x0c\x00\
-\x21\xca\x2a\xc7\xad\xb9\x1c\x0f\x4f\x9f\xcd\x67\x31\x7f\xdd\xcf\
-\x60\x3b\x25\x0e\xec\x67\xf5\x7c\x3d\x8a\xb9\x08\x9b\x29\x3a\x13\
-\xdb\x2d\x72\xb8\x7a\x80\xe8\x24\xcb\xb0\x59\xee\x4f\x06\xc7\x86\
-\x61\xee\x15\x27\x6f\xe1\xb2\xcc\x07\x7e\x8d\x05\xbb\x27\xb3\x8c\
-\x83\xb1\x4c\x35\x27\x54\xf3\x46\xae\x58\x25\x3e\xe4\x69\xe3\xf9\
-\x79\xdc\x45\xe6\x82\x63\x69\xf8\xc6\xcd\xcc\x01\x26\x65\x3c\x43\
-\x56\x03\x2f\x6d\x41\xf9\x2c\xc6\x66\xbd\xc3\xd9\xf6\xc3\xfc\x93\
-\x94\x7b\x0c\xb6\x07\xc3\x1b\x28\x4e\x69\x3a\xd2\x15\xf5\xcf\x66\
-\x5c\xb7\x19\x73\x21\x69\x48\x9e\xa1\x51\xcc\xf5\xc0\x7f\x62\xae\
-\x41\x09\x07\xf8\x27\xeb\x9d\xff\x1e\x6c\xf3\xa6\xaa\x18\x00\xe7\
-\x1f\xc3\xa6\xa9\xb7\x72\x3f\xe6\xbe\x94\x4c\xe2\xec\x85\xa5\x7d\
-\xee\x49\x5e\x72\x25\x37\xdc\xb0\xee\x10\xff\x80\xad\x1a\xed\x8c\
-\xc5\x52\x74\x85\x72\x1b\x81\x81\xad\x40\xfc\x1c\x5b\xed\x48\x78\
-\xc4\x0d\xb2\x4f\x07\x7d\x75\x1c\x30\xbd\xc4\x35\xf6\x01\x4e\xc2\
-\x62\x0b\xba\xe2\x2a\xda\xe0\x0a\xfe\x7b\x83\xfb\x0d\x74\xe3\x65\
-\x03\xb6\xa3\xb7\x10\x99\x68\x79\x48\x6c\x55\x5a\x5b\xa1\x90\xe7\
-\xe5\x19\x93\xb8\xcc\x15\x87\x73\xfd\x81\xb6\x96\x7e\xb4\xe1\x48\
-\x21\xcf\xc6\x42\x9e\x7f\x61\xb3\xa4\xc7\x03\x37\xba\x82\xd0\xa8\
-\x5e\x20\x2a\xec\x43\x6b\x80\x5f\x52\xde\x97\xba\xc9\x15\x93\x9e\
-\x2e\x4b\x13\x36\xcb\x3c\x6b\x0b\x55\xff\x79\xda\xbb\xd1\x35\x02\
-\x37\x15\xf2\xa6\x0c\xbb\xa1\x70\x37\xc5\xf1\x02\x09\x8f\xb9\xb2\
-\xbd\xa5\x58\x81\xcd\xbe\x96\x6a\x8b\xb1\xc0\x21\x3e\x3b\x7d\x11\
-\x16\x17\xd5\xd1\xf3\xae\x05\xdb\x81\xf8\xb2\xd4\x5e\x00\x8b\x81\
-\x02\xb0\xaa\x82\x72\xad\x71\xa5\xf5\xa1\x6a\x55\xd4\x37\x7a\xfc\
-\xbd\x97\x6d\x4b\x3e\xb3\x17\x03\x97\x51\xda\xad\x6b\x4f\x57\x8c\
-\x7b\x82\x7a\x2c\xbf\xff\xcd\xa1\xff\xfe\x8c\x49\x34\x00\x3f\x74\
-\x43\xbd\x92\xf6\xfc\x27\x70\xb1\x8f\xa7\x4e\x33\x63\x12\x2d\x6e\
-\x88\xcf\x47\x88\x4e\xa2\x15\x80\xce\xd3\x44\xf5\xfc\xb9\xab\x99\
-\xfe\xab\xb9\x8a\x2f\xfe\x7a\xbf\xde\x96\x36\x04\x5e\x89\x62\x66\
-\x00\x57\xfa\xc3\xfb\xa3\x98\x5b\xc3\x6e\x58\x70\xe3\x0e\x55\x36\
-\x5a\xb7\xb8\xf2\x5d\xc8\xb3\xd6\x5d\x24\xfe\xe9\x4a\xc0\x51\x6e\
-\x10\x8c\xc3\x66\x0b\x6b\x81\xed\xd8\x36\xdc\x84\x1a\xab\xd5\x77\
-\xfc\x5a\xbd\x71\x5c\x56\x9b\x7f\x01\x5f\x07\xbe\x8b\xcd\x1e\x26\
-\xcf\xf0\x56\xcc\x1f\xfe\x16\x1f\x23\x1f\xcd\x1a\xcb\x25\x64\x55\
-\x54\xdf\x12\xe7\xb4\x7b\x26\xcc\x98\xc4\x92\xe9\xb3\xf9\xbe\xff\
-\xf6\x48\x1f\x9f\xb9\x40\xb9\x59\xed\xe5\xdd\x9f\x36\x97\x88\xfa\
-\x2e\xca\xf6\x25\x6c\xb6\xf7\x8d\xc1\xb1\xd5\xd8\x8c\x6b\xc8\x42\
-\x6c\xf7\xe0\x7d\x53\xc7\x1f\xf4\xc0\xfc\x4a\xfa\x4e\xba\xae\xad\
-\x2e\xa3\x0d\x95\xf6\xdd\x42\x9e\x96\x28\xe6\x8f\xd8\xec\xf4\xa7\
-\xb0\xd9\xfe\x81\x81\x6c\xea\x31\x97\x12\xb0\x4d\xb9\x4e\x01\xce\
-\xc6\x62\x26\xc6\x52\xec\x0e\xd9\xea\x13\x22\xb7\x03\xdf\x27\xe5\
-\x6e\x53\xc8\xd3\x1c\xc5\x5c\x83\xb9\x82\x9c\xe9\xf7\x1c\x9a\x2a\
-\xd2\x7a\x97\xdf\x0c\xe0\x0f\x9e\x92\xb9\xd4\x3b\x2d\xab\x8d\x3a\
-\x3a\x67\x29\xf0\x35\x2c\x6f\xfe\x91\x7e\xff\x41\x81\xac\x96\x60\
-\x6e\x90\x6f\x09\x9e\xe1\x69\xa5\xb7\x95\xb6\x94\x99\x1d\x8e\x45\
-\xaf\xf7\x6f\x30\x77\xb3\x2f\xb8\x8c\x07\x04\x32\x5e\x4b\xe5\x41\
-\xe8\x59\xf7\xce\x62\xbd\xf7\xb1\x4b\xdc\x00\x78\x2d\xa3\x3f\x3d\
-\x8b\xc5\x0a\xfc\x00\x98\xe8\x65\xc8\xa5\x14\xff\x95\xde\x9e\x3f\
-\x72\xe3\x96\x4e\xb6\x47\x78\xbf\x27\x5d\xf6\xdf\xf3\x7e\x3f\xdc\
-\x65\xbf\x29\xe8\xc7\x59\xf5\x6b\xaa\x40\xb7\x69\xaa\x40\xcf\x50\
-\x92\x0b\x19\x00\xdb\x0c\xb3\xb0\xe5\xb5\x6a\xb0\x86\xea\x05\xa5\
-\x25\xe9\xc6\xaa\xe1\x47\xdf\xcc\x56\x0a\xce\xf5\x19\xb1\xa5\xc0\
-\xd2\x28\xe6\x7e\xcc\xad\x60\x07\x37\x00\xc6\x54\xb9\xcf\x2e\xd9\
-\x4a\x75\x6c\xc5\x66\x29\xe7\x03\xf3\xa3\x98\x6b\xfd\xa1\x3d\x1c\
-\xf3\x63\x1d\xcd\xb6\xb1\x3a\x57\x15\xf9\x37\xda\x2b\xeb\x22\x2c\
-\x75\x62\x6f\x1b\x97\x55\x1f\x1f\x51\xcc\x1f\x30\x97\x81\x4f\x62\
-\xfe\xce\x3b\x62\xab\x66\x7f\xc2\x02\x46\x77\xa6\x2d\x5f\x79\xd1\
-\x58\x2e\x21\xab\xa2\xfa\x96\x38\xa7\xdd\x33\xc1\x8d\xf6\x07\xa3\
-\x98\x4f\x62\xae\x2d\x1f\x77\x65\xbf\x09\x9b\x61\xbe\x11\xf3\xc9\
-\x9f\x40\xdb\x86\x5c\x1b\x31\x5f\xfd\xce\xb2\x18\x73\xab\xd8\x21\
-\x38\xb6\xd1\xaf\x1f\xf2\x2a\xf0\x39\x8a\x37\x00\x4b\x94\xec\x4a\
-\xfb\x4e\xba\xae\x0d\x58\xaa\xc6\xed\x3b\xd3\x77\x0b\x79\xd6\x78\
-\xfc\xcf\xff\x62\x6e\x7f\x49\x6c\xc2\x72\x57\x1e\xe7\x06\xcf\x83\
-\xf9\x51\xcc\x97\xb1\x98\x8a\x13\x31\x5f\xf1\xdd\xbd\x6d\xe6\xbb\
-\x61\xf7\x80\x07\xd4\x66\xdd\xab\xc1\x8d\x80\xd9\xae\x80\xe7\x7d\
-\x12\x05\x37\x88\x6e\xf3\x36\x79\x35\x23\xe3\x4c\xfa\x9d\x96\xd5\
-\x46\x65\xcf\x71\x57\xa4\x67\xbd\xec\xfb\x61\x9b\xb0\xbd\xdd\xbf\
-\xbe\x1f\xcb\xd0\xb4\xd6\x8d\xd6\x01\x25\xda\x24\x6b\xc7\xe2\xb2\
-\x63\xb1\x90\x67\x5d\x14\xf3\x43\xef\xfb\x27\x04\x86\xe6\x72\xe0\
-\x26\x2a\xf7\x7f\xcf\xba\x77\x16\x2b\xb1\x15\xb8\x95\xa5\x7c\xf6\
-\xfd\xf8\xb3\x1e\xe3\x71\x80\xcb\x64\x2f\xef\x3f\x0b\xdd\x98\xbd\
-\x09\xf8\x77\x21\x9f\x39\x69\x57\x49\x7b\xa4\x0d\xa1\x3b\xbd\x7d\
-\xc7\x63\x31\x23\x6f\xf7\x49\xa6\xa7\xca\xd4\x6f\x5e\x05\xba\xcd\
-\xbc\x0a\xf4\x8c\x79\x88\x3e\x89\x82\x11\x85\x10\xa2\x8f\xe2\x19\
-\x64\x06\x02\x0d\x29\xb7\x90\xad\x51\x96\x01\x6e\xc0\xb6\x7a\x79\
-\xb4\xb9\x51\xd7\x65\x59\xe3\xb2\x6c\x4e\x5c\x9c\x3a\xf9\xfb\x1c\
-\x6d\xd9\xa0\xd4\x16\x5b\xbf\x3d\xeb\x5c\x69\x6e\x50\xca\x4f\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
-\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
-\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
-\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\xba\x41\x4e\x22\x10\x42\x08\x51\x8a\x28\x66\x34\xf0\
-\x05\x60\x3c\x30\x0f\xf8\xbf\x42\x9e\x15\x7d\xbc\x4e\x63\x81\x53\
-\x81\x5d\xfb\x6a\x9d\x72\x39\x98\x3e\x9b\x5d\x80\x8f\x00\x87\x00\
-\x03\x80\x46\xe0\x31\x60\x76\x21\xcf\xe2\x3e\xdc\x3e\xb5\xc0\x64\
-\x60\x17\x3f\xb4\x14\x98\x55\xc8\xb3\xc9\xeb\xbd\x87\xb7\xdf\x28\
-\xe0\x19\xe0\xda\x42\x9e\xe5\x5b\xb2\x1c\x9d\xb8\xc6\x60\x60\x34\
-\xb0\xba\x90\x67\x5d\x95\xca\x35\x04\xf8\x34\xf0\x76\x60\x1d\x70\
-\x79\x21\xcf\x3c\x3d\xad\x44\x67\x18\x28\x11\x08\x21\x44\x9f\x50\
-\x8a\x76\x04\xa6\xb9\xd2\x03\x70\x4f\x21\xcf\xef\xc2\x73\x6a\x07\
-\xc3\x37\x6e\xe6\x64\xe0\x28\x3f\xb4\x0a\x38\xaf\x90\x67\x65\x57\
-\xee\x59\x53\x0b\xc0\x29\xc0\x0f\x80\x1a\xa0\x09\x18\x12\xc5\xfc\
-\xa4\x90\xa7\xb9\x2f\xca\xd1\xeb\x74\x32\x70\x8e\x2b\xcd\x4d\x40\
-\x7d\x14\x73\x59\x21\x4f\x73\x14\xb3\x3d\x70\xa0\xd7\x17\x60\x5e\
-\x21\xcf\x92\xde\x56\x8f\xe9\xb3\xd9\x0e\xb8\x18\x38\x2e\xf5\x2e\
-\x5f\xe1\x46\xcd\xe2\x0e\xfa\xd3\x70\xe0\xeb\xc0\xb8\xe0\xf0\x3f\
-\x80\xab\x0b\x79\x5a\xb6\x72\xf5\x06\x79\x5f\x4f\xfa\xf1\x3d\xc0\
-\x5d\xc0\xa6\xe9\xb3\xa9\x05\xbe\x0b\x7c\xc6\xdb\xaf\xd9\xdb\xf0\
-\x97\x5b\xb2\x1c\x1d\xc8\x36\xe7\x46\xc3\x09\xfe\xdb\xc3\x80\xb9\
-\x51\xcc\xc3\xc0\x6c\xe0\x81\xce\x18\x11\x19\xe4\x81\x8b\x80\x61\
-\xfe\xf7\x0e\x51\xcc\x57\x0b\x79\x1a\xf4\xa4\x14\x32\x00\x84\x10\
-\xa2\x7f\x31\x1c\x38\x11\xd8\x3d\x38\x56\x64\x00\x0c\x1c\x04\xae\
-\x70\x9c\xea\x87\x16\x02\x97\x41\xd7\x0c\x80\xda\xc1\x00\x4c\x08\
-\x94\xe1\x81\xc0\xa1\xfe\x77\x9f\x34\x00\xbc\x4e\x7b\xba\xf2\x98\
-\xd4\xe9\x2d\x41\x9d\x0e\x04\x6e\x06\x86\xf8\xf7\xa7\x03\x57\xf6\
-\x42\x23\xe6\x24\xe0\x98\x8c\xf7\xf8\xbf\x80\x07\x2b\xb8\xcc\x78\
-\xe0\x6b\xc0\x98\xe0\xd8\xbb\x81\xfb\x80\xf9\xbd\x5c\x6f\x19\x1f\
-\xb4\x5f\x0d\xb0\x77\x2f\x32\xd4\x73\xde\x2e\xdf\x02\x8e\x08\xc6\
-\xce\x1e\xd8\x6a\xc2\x69\xc0\x2f\xa2\x98\x19\xdd\x30\x02\x76\x0e\
-\x94\x7f\x80\x7d\x5c\x2e\x32\x00\x44\xc5\x0c\x90\x08\x84\x10\x42\
-\x64\xd1\xb8\x01\x5c\x21\x4c\x5c\x17\x5e\xc5\x66\x88\x1b\xfb\x78\
-\x9d\xfe\x09\xbc\xee\x87\x96\x02\xbf\x0b\xea\x54\xe3\xca\xff\x50\
-\xff\xf4\xba\x89\xb2\xa9\xb7\x52\x0b\xbc\x17\x18\xec\x87\x1a\x80\
-\xff\x03\xae\xc5\xdc\x7f\xea\x2b\x50\x52\x3f\x0c\xec\x98\xfa\x6a\
-\x02\x70\xb8\x7f\xdf\x5b\x69\x00\xae\x09\xfa\xe4\x4a\xe0\xce\x5e\
-\x54\xbe\xdd\xb1\x15\xb3\x23\x03\xe5\x3f\xad\xbc\x9f\x0e\xbc\xad\
-\x1b\x72\x7e\x18\x5b\xe5\x69\xf5\x7e\x7c\x2b\xf4\xdd\x31\x29\xb6\
-\x9e\x25\x2d\x84\x10\x62\x1b\x24\x8a\x19\x00\xd4\xe1\xfe\xe3\xe9\
-\x19\xc9\x16\x9b\xe3\xbf\x01\x58\x86\xcd\x60\x3e\x0f\xcc\xa9\xe2\
-\xfd\x73\x7e\xff\x1a\xa0\xa9\x52\x17\x86\x72\xe5\x4e\x5d\xb3\x19\
-\x68\x28\xe4\x69\x4d\xd5\xe9\x4f\x6e\xcc\x8c\x03\xe6\x62\xae\x2f\
-\xbd\xa1\x3d\x2a\x95\xc7\x20\xda\xfc\xd2\x01\x9e\xc2\x5c\x55\x5e\
-\xaf\xf0\xbd\x3e\x14\xf8\x50\xc6\xb9\x03\x81\x4f\x60\x2b\x20\xaf\
-\x57\x50\xde\x5a\x2f\x4b\x8b\xcb\xb9\xa5\xc2\x7a\xd6\xf9\xbd\x3a\
-\xf5\x3b\x80\x42\x9e\x96\x28\xe6\x0f\xc0\x12\x6f\xbf\x79\x6e\xd0\
-\x65\xdd\xa7\xc6\xe5\x99\xcb\xea\xdf\x15\x94\xad\x53\x0a\xfa\xa0\
-\xa1\x80\xad\xbe\x1d\xe4\x87\x5a\x81\x97\x30\xd7\xa1\xb7\x01\xfb\
-\x7a\xdb\x8e\x01\x22\x6c\x45\xaf\xbe\x4c\x1f\x68\x75\xf9\xa4\x57\
-\xdb\x1e\x03\xa6\x60\xab\x71\x4b\x30\x77\xc0\x4d\x1d\xf4\xa7\x76\
-\x63\xa1\x9a\xe3\x32\x90\x1b\x95\xc8\x3a\x35\x86\x3b\xbc\x47\x57\
-\xeb\x22\x64\x00\x08\x21\xc4\xb6\xae\xec\x87\x01\x8d\x4d\xae\xf4\
-\x1e\x04\x7c\x1e\x73\x27\xf8\x57\x14\x73\x3b\x70\x7f\x6a\x06\x79\
-\x07\xda\xfc\xc4\xc7\x03\x3b\x01\x4b\xa2\x98\x37\xd1\xe6\x1b\xdd\
-\x84\x05\x47\x2e\x09\xee\x17\x7e\xbf\x1e\xb8\x25\x09\x82\x8c\x62\
-\x06\x02\x7b\x61\x2e\x12\xc7\x60\x41\x92\xf3\xa3\x98\x59\xc0\xbd\
-\xc0\xb2\x44\x29\x8c\x62\x46\x60\x81\xae\xc3\xfd\x3e\xff\x72\xc5\
-\xe7\xd3\x5e\xee\xf3\x80\x3f\xbb\x42\x31\x16\x78\x1f\x70\xac\x5f\
-\x73\x39\x70\x4b\x14\x73\x37\xb0\x28\x50\xa4\x46\xf8\xb9\x78\x39\
-\xe6\x45\x31\x2b\x5c\x3e\x47\xa5\xde\x8d\x13\xa3\x78\xf3\xff\xe7\
-\xba\xb2\x59\x32\x30\xb4\x2b\x81\xa3\xfe\x9b\x09\x25\xe4\x71\x3f\
-\xb0\x38\x90\xc7\x58\xcc\xef\x7f\x6c\x70\x89\xed\x5d\x99\x6c\x70\
-\x65\xf3\x99\x0e\xba\xc3\x58\xcc\x6d\x84\xa0\x7d\x86\xfb\xff\x0f\
-\xf1\xef\x37\xbb\x01\xd5\xd4\xc2\xd4\x5b\x99\x08\xec\xe7\x87\x16\
-\x60\x33\xce\x47\x63\x81\xa8\xaf\x03\x37\x46\x31\x77\x02\x0b\x12\
-\x39\x67\xfc\xee\x09\x2c\x86\xe5\xe3\x2e\xf7\xe4\x77\xb1\xb7\x4f\
-\xa5\x86\x40\xd8\x7e\x7b\x78\xbb\x2c\x49\x29\xa3\xfb\x7a\xf9\xf2\
-\xae\x34\xfe\x2b\x8a\xf9\x8b\xcb\x73\x5d\xa8\x3c\xba\x72\xb9\x23\
-\x70\x78\xaa\x6c\x7f\x76\xd9\x56\xc4\xd7\x6f\xa4\x16\x73\x47\x4a\
-\x66\xfe\x17\x01\x9f\x02\x1e\xf7\x72\xce\xc4\x5c\xcc\x72\xc0\x01\
-\xc0\xc8\xc4\x00\xf0\xfe\x3b\x06\x8b\x17\x38\xc5\xfb\x40\x33\x10\
-\x47\x31\xb7\x01\x73\x83\x3e\x34\xc6\xc7\xc0\x40\x1f\x9b\xe3\xc2\
-\x36\xf7\x6b\xed\x09\xbc\x2b\xe8\x4f\xcb\x81\x1b\xa2\x98\x7b\xc3\
-\xfe\x94\xd1\x46\x8f\x01\x6f\xf0\xfe\x94\xf4\xc3\x3f\x02\xf7\x15\
-\xf2\xac\xc9\x50\xca\x47\x7a\x99\x3f\xe9\x72\x03\xb8\x3f\x8a\xb9\
-\x09\x78\x34\xbd\x1a\xe5\x7d\xfd\x00\xe0\x3d\xde\x36\xc3\xfc\x1e\
-\xd7\x63\xae\x6b\xab\x53\x6d\x53\x03\xbc\x11\x5b\xf1\x9a\x14\xd4\
-\xe5\xe6\x28\xe6\xaf\xc0\x92\x5e\x10\xb3\x22\x03\x40\x08\x21\x44\
-\xaf\x25\x0c\x68\x6c\x04\x9e\x04\xf6\xa7\xcd\xd7\xfd\x28\xe0\x8b\
-\xc0\x85\x51\xcc\x7f\x07\x2f\xee\xbd\xb1\x60\xd3\xa1\xc0\x06\x57\
-\x6e\x97\xf8\xf9\x97\xfb\x39\xe1\x71\x82\xeb\x25\xdf\x2f\xc4\x5d\
-\x89\x5c\x39\xf9\xa8\x2b\xee\xa1\x2f\xf7\x51\xc0\x7f\x00\x0f\x61\
-\x2e\x12\x0f\xf9\xf1\x51\xc0\x4f\x31\xd7\x8a\x46\x57\xf6\xf6\xf3\
-\xfa\x00\xfc\x2e\x67\xf3\xb4\x07\xf9\xfd\x0e\x4d\xbd\xdb\x8e\x03\
-\x9e\xc5\x32\x19\xfd\xb3\x4c\x9d\xd6\x52\x1c\xf0\x99\x70\x92\x7f\
-\x00\xae\xc0\xdc\x2f\xca\x05\x86\x76\x2a\x70\xd4\x33\xba\x7c\x15\
-\x38\x03\xd8\x2d\x43\x1e\x4f\x00\x5f\x8b\x62\xfe\xe5\x8a\xce\xde\
-\x2e\xbb\xa1\xc1\x65\xf6\xc2\x82\x42\xc1\x7c\xcc\x4b\x1a\x00\x1e\
-\x3f\x70\x14\x6d\xbe\xff\xeb\x81\xdb\xb0\x19\xe5\x44\x09\x7d\x53\
-\x68\x00\x0c\x1a\xb2\x59\x0e\x49\x6c\xc9\x6a\x3f\x37\x54\x8e\x3f\
-\x08\xfc\x1b\xf8\xb2\xb7\x75\xd6\xef\x5e\x71\x85\x71\x48\xea\x77\
-\x8f\x78\xdf\x7b\xbc\xc2\xbe\x5c\xaa\x4f\x26\x0a\xe6\x17\x80\xb3\
-\xbd\x2e\xb9\x40\x9e\x5f\x02\x62\xef\x5f\x4b\xc0\xb2\x29\xb9\xb2\
-\x7c\x91\x1b\x8f\x83\x53\x65\xcb\x75\x72\x8c\x85\x2b\x33\xcb\x81\
-\xe7\x0a\x79\x1a\xa2\x98\xe7\x5c\xc1\x3d\xd0\xbf\xab\x03\x6a\x83\
-\x32\x1c\xe1\x65\x38\x20\x55\x86\x77\x7b\xff\x38\x2b\x8a\xb9\xce\
-\x8d\x80\xb0\xfe\x45\x6d\xee\xe3\xeb\xfd\xc0\xf9\x7e\xad\xd0\xd5\
-\xfb\xd8\x74\x7f\xca\x68\xa3\x97\x7d\xcc\x0d\x0d\xe4\xf6\x29\xe0\
-\xba\x28\xe6\x9b\x85\x3c\xaf\x05\xd7\xdb\x03\x0b\xbe\x9e\x48\x71\
-\x4c\xc2\x51\xde\x06\x17\x44\x31\x17\x14\xf2\xac\xf7\xb2\x0d\x76\
-\xd9\x9f\xe9\x7d\x3d\x3c\xff\x13\xc0\x1d\x5e\xd7\x25\x41\x5d\xde\
-\x0b\x5c\xe8\x63\x3e\x5d\x97\x87\xbd\xee\x8f\xeb\xf1\xde\x79\x14\
-\x03\x20\x84\x10\xdb\xa6\x31\x70\x68\x4a\x11\xc3\x15\xba\x33\x5d\
-\x19\xe9\x29\x0e\x77\x05\x76\x8f\x8c\x77\xd0\x40\xbf\xf7\x77\xa2\
-\x98\xed\x4a\x94\xfb\xcd\x81\xf2\x0f\xc0\xf4\xd9\xec\x08\xfc\xc4\
-\xaf\x9d\x9e\xd8\xaa\x71\x43\xe7\x4c\xcf\xf0\xd3\x7b\x5e\xc0\x36\
-\x4f\x7c\x02\xf0\x3d\x6c\x16\x37\x4b\x1e\x87\x60\x81\xdc\x7b\x56\
-\xe3\x9e\x53\x6f\xa5\x0e\xf8\x58\x20\xc3\xe7\x80\x4b\x5c\xf1\x4b\
-\x64\xfc\x31\x9f\x45\x2f\xc5\x48\xda\xcf\x8c\xd7\xb8\x11\xf6\xfd\
-\x28\xde\x9c\xa9\x2a\xcd\xae\x19\x7d\xae\x06\x73\x8f\xf9\xbe\x67\
-\x26\xea\x32\x3e\x23\x7d\x1c\x70\xae\x2b\xe2\x69\xe5\x7d\xb8\x7f\
-\x3f\xdd\x0d\x05\xa6\xcf\xa6\x0e\xf8\x11\x36\xbb\x3c\x38\xa3\x6c\
-\x9d\xd1\x93\x9a\xa0\x48\x41\xde\x17\x38\x31\x8a\xa9\xfb\xc5\xf1\
-\xb4\xb8\x92\x7e\x8f\x7f\x1e\xc0\x83\x76\xa7\xcf\x66\x94\x97\xf9\
-\xd0\x8c\x32\xe4\xb0\x19\xf9\x1f\xfb\xf5\x3a\x62\x1f\x57\xfe\x0f\
-\x2a\xd3\x9f\x7e\x99\x52\xc0\x43\xde\x90\x32\x2e\xf1\x36\x3b\x09\
-\xf8\xb4\xcf\xc8\xe3\xe3\xf3\x6c\x97\xdb\xb0\x12\x7d\xe4\x5b\xc0\
-\x7b\x83\x58\x87\x23\x81\x6f\x97\xb8\xf7\x30\x9f\x18\xf8\x81\xaf\
-\xfa\xe1\xe7\xfd\xcc\xc7\x6f\x56\x5d\x0e\x07\xbe\x99\xb4\xa5\x90\
-\x01\x20\x84\x10\xa2\x63\x9a\xb1\x19\xf1\xff\xc5\xfc\xfa\x5b\x02\
-\x23\xe0\x3f\x3a\x50\x00\xc1\x5c\x5b\x1a\x03\x25\x65\xb3\xb2\xe5\
-\xb3\xcc\x3b\x67\x28\x68\x83\x31\xf7\x86\x3d\xfc\xd0\x46\xe0\x37\
-\x98\x3f\xf4\xfd\xc1\xa9\x1f\x04\xde\x51\xe6\xde\xcf\x62\x01\xaf\
-\x77\x78\x39\xde\x81\xcd\xde\x26\x65\x78\x04\x38\x0b\xf3\x8d\x4f\
-\x78\xaf\x2b\x37\xe5\x94\xb7\x5b\xfc\xd3\x14\x1c\xbf\x07\x9b\xf9\
-\xbf\xc2\xff\x9f\xf5\x1e\xcd\xa5\x94\xcc\x30\xb8\xf6\xb5\xd4\xf5\
-\x36\x33\xed\x76\x86\x60\x33\x9f\x89\x02\xb5\x01\x0b\x70\x3d\x2b\
-\x25\x8f\x03\xbd\x4d\x6a\xb1\xd9\xd1\xab\xbc\xde\x61\x5b\xfc\xc6\
-\xcb\x38\xb7\x83\x76\x7b\xab\x2b\x9a\x78\x9b\xff\xdd\x95\xd1\xd0\
-\x8f\xfe\xdd\x65\x14\xc4\x84\x45\xc0\x0c\x2c\x9d\x6a\x98\x35\xe8\
-\x5d\xd8\x8c\x71\x29\xe6\xfb\x6f\xce\x81\xcd\xb9\xeb\x73\xde\x7e\
-\x47\x75\xb3\x4f\x6f\x8f\xa5\x36\x4d\xfa\xde\x6a\x6c\x56\x3d\xbc\
-\x57\x8d\x97\xef\x90\x40\x1e\xef\x0e\xf4\xa1\xf0\x37\x9d\xca\x86\
-\x74\xc1\xb1\x34\x60\x2e\x34\x89\x0b\xcb\x08\x57\xdc\x2f\xff\xfa\
-\x8d\x1c\xed\x63\x6d\xb2\x7f\x4e\x01\x96\xbb\x11\x78\x9c\x97\x21\
-\x19\x97\x77\x78\x3d\x6e\x08\xc6\xe5\x6e\xae\x80\x97\x5c\x91\xf0\
-\x71\x77\x3c\x6d\x31\x08\xc9\xb5\xce\x02\x66\x05\xd7\x7a\x33\xf0\
-\xae\x32\xd7\x7a\xcc\xcb\x3a\x9b\xb6\x6c\x5f\x83\xb0\x15\xa9\xd0\
-\x55\x6c\x4a\x6a\xcc\x7d\xcb\xfb\xe1\xc6\x40\xa9\x3f\x0d\x18\xee\
-\x4a\xfd\x69\x6e\x18\x80\xb9\x58\x5d\xe9\xbf\x79\x2c\x68\x9b\x29\
-\x5e\x3e\xb0\x95\xa8\xfd\x83\x72\xdd\xe9\x86\xfe\x2b\x41\xbf\x39\
-\xdc\x0d\x4b\x21\x03\x40\x08\x21\x44\x05\xbc\xe0\x4a\xc8\xa9\xc0\
-\xe7\x52\x8a\xe3\x5e\x74\xec\x22\xba\x8a\x36\xb7\x96\x3a\x60\x8f\
-\x44\xa1\x98\x7a\x2b\x39\xcc\x6f\x37\x54\xae\x5b\x30\xff\xdd\x49\
-\xc1\xf1\x87\x81\xe9\x85\x3c\x33\xdc\x08\x58\x13\x28\x0e\x07\xb8\
-\x0b\x40\x9a\x97\xb1\x1c\xf0\xa7\x60\x6e\x00\xb3\x5c\x01\x48\x66\
-\x4e\x1b\x31\xf7\x88\xff\x76\x25\x66\x83\x7f\x6a\xb0\x78\x86\x4c\
-\x0a\x79\x1a\xbc\x1c\xe7\x51\x9c\x51\xe5\x77\x85\x3c\xa7\xf9\xe7\
-\x77\x5e\x8f\xd0\x9d\x67\x4c\xa0\xd4\x80\xb9\x67\x84\x6e\x20\x8b\
-\xcb\x04\x38\xee\x87\xf9\xd0\x27\xdc\x0c\x7c\xb9\x90\xe7\xa7\xc0\
-\x7f\x02\x4f\x07\xef\xea\x8f\x02\xdb\xf9\x86\x4f\xd3\x02\x85\x16\
-\xff\xff\xe9\x5e\xc6\x92\x41\xda\xc1\x0c\xf9\xd8\xc0\xe0\xb8\xf9\
-\xbc\xa3\x69\xc0\x62\x42\x5a\x03\x65\xf3\xdd\x1d\x18\x8f\x17\x03\
-\xff\x85\xcd\x9e\x7f\x0d\x36\x6f\xc4\x55\x87\xa5\x55\xcd\x62\x3d\
-\x96\xc3\xff\x47\xfe\x39\x33\x68\xf3\x11\x6e\x3c\x74\x87\x1d\x29\
-\x4e\x93\x7b\xb5\xcb\x2a\x7d\xaf\xb1\x41\x19\x0f\x09\xe4\xd1\x0c\
-\xfc\x22\xf8\x4d\x58\xaf\x0e\xd9\x64\x6a\xef\x35\x41\xbb\xe1\x7d\
-\xee\x33\xc0\xf5\x98\x8b\xda\xc1\x58\x00\x6b\x7d\x21\x4f\xcb\xb4\
-\xdb\xc9\x79\x1f\x48\x0c\xee\x25\xc0\x99\x85\x3c\x17\x02\xd3\xb1\
-\x15\x9a\xa4\x0f\xbc\x2d\x38\xaf\x1d\x53\x6f\x65\x47\x2c\xbb\x53\
-\x38\xc6\x93\xfe\xf4\x95\x60\x8c\x0f\xc4\x56\x9e\xb2\xae\xf5\x2a\
-\xe6\xc6\x75\x2a\xe6\x96\xf5\x48\xf0\xdd\xae\xb4\xad\xfc\xec\x1b\
-\x18\x03\x1b\xdc\xc8\x98\xe1\x86\xcb\xdf\x53\xc6\xeb\x48\x6f\x97\
-\x77\xa7\xda\xe6\x6b\xfe\x9b\x73\x03\xa3\x61\xfb\x40\xe9\x1f\x97\
-\x31\xae\xcf\x71\xc3\x24\x19\xd7\x3b\x77\x60\xd8\x0b\x19\x00\x42\
-\x08\x21\x02\x96\x62\x01\x74\xad\x58\x50\xe7\x23\x9d\xfc\xfd\x12\
-\x2c\x3b\x50\xf2\x2e\x39\x8e\x36\xd7\x81\x11\xb4\x05\x04\x26\x8a\
-\xc8\x6a\x7f\x99\x87\x2e\x0e\x7f\x07\x46\x44\x31\xe3\x5d\xf9\x0a\
-\x33\xcf\x7c\xb0\x84\x82\xf2\x37\xe0\xe1\x42\x9e\xe6\x42\x9e\x8d\
-\xee\x13\xfd\x4a\xa0\x40\xd4\x02\xdf\x74\xa5\xeb\x5e\x2c\x80\x78\
-\xb2\x1b\x0b\x4f\x55\x41\x6e\x0d\x29\x05\x6f\x1c\xe6\x03\x9d\x28\
-\xd8\x47\xd0\xb6\x59\x5b\x2b\xb6\x5a\x51\x8a\x11\x81\x12\xd5\x82\
-\x05\x0b\x27\xe9\x2d\xe7\x62\x33\xf3\x09\xa3\x82\x73\xbb\xca\x08\
-\x8a\xdd\xbb\x96\x01\x2f\x79\x66\xa4\x47\xb0\x38\x08\xe8\xd8\x0d\
-\x68\x19\x16\xd4\xdd\xe2\xfd\xe7\x1f\x58\x86\xa8\x84\xb1\x25\x7e\
-\x3b\x1f\xf8\x4b\x21\x4f\xab\xff\xee\xf1\x94\x82\xbd\x53\x37\xeb\
-\x37\x26\x65\xe4\x2d\x75\xa5\x75\x77\x57\xfe\xc3\xfe\x35\xde\xb3\
-\xf6\xec\x95\xaa\xd7\x1f\x0a\x79\x36\x95\xa8\x57\x25\xcc\x73\xc5\
-\xf6\x11\x8a\xf7\xca\x18\x8e\xcd\x6e\x5f\x87\xb9\xad\xd4\x05\x06\
-\x53\x68\x2c\x2f\xa2\x6d\x13\xb7\x97\xdd\x48\x4e\x94\xdd\x01\x1d\
-\xe8\x6d\xc3\x29\xde\xd8\xed\x35\x60\x90\x8f\xaf\x01\x29\xa3\x71\
-\x34\xd9\x69\x4a\x5f\xc2\x02\x8e\x5b\x2f\x9e\xc2\xcb\xc0\xa3\xc1\
-\x77\x39\x20\xe7\x72\xdb\x27\x35\x19\x30\xbf\x90\xa7\xf5\xfc\x63\
-\x58\xeb\xe3\x3a\x29\xf3\xc6\xc0\x38\x0b\xfb\xef\x42\x2f\xc3\xee\
-\x5e\xce\xd7\x52\xf7\x49\x64\x11\x8e\xeb\x69\x3e\x9e\xaf\x74\x43\
-\xa7\x9a\xe3\x5a\x06\x80\x10\x42\x88\x6d\x8b\x8b\xa7\xd0\xec\x2f\
-\xeb\xce\xb0\xc0\x95\xf1\x84\x70\x26\xf5\x50\xda\xdc\x4c\x5a\xb1\
-\x6c\x2a\x1b\xfc\x85\x1f\xfa\xf6\x7f\x19\xb8\x1b\x73\x41\x9a\x49\
-\xf1\xa6\x54\xc3\x4a\xbc\xa3\xea\x0b\xf9\x76\x2e\x35\xf7\xd3\x16\
-\x34\x9c\xc3\x5c\x20\x2e\xc5\x36\x4a\xfb\x98\x2b\x28\x0f\xa4\xb3\
-\x98\x74\x05\x0f\xc4\xbd\x2f\x50\x4c\xea\x02\x65\x39\x49\xaf\x19\
-\x1a\x49\x7f\xed\x84\x61\xb1\x30\x68\x93\xf4\x4a\x43\x35\x08\xdb\
-\x25\x51\x56\x13\x05\x71\x4d\x4a\x41\x7c\x73\x4a\x39\x0e\x69\xa2\
-\x38\x7d\x65\x0b\xc5\x6e\x4e\x3b\x90\xbd\x82\xb4\x2e\x90\x1b\x6e\
-\x70\x2c\xaf\x62\xfd\x06\xa6\xfa\xcc\x34\xef\x5b\x59\xfd\x6b\xa7\
-\x9a\x81\x9b\x95\xe6\x4a\xeb\x55\x69\xff\xb8\xc7\xfb\x5d\xe4\xca\
-\x69\x58\xe7\xdd\xb0\x95\x93\x0f\xb8\xc1\x98\xec\x3b\x11\x96\xa1\
-\x05\xe0\xbc\xa3\xd9\x04\x7c\x9f\x36\xb7\xa1\x69\x74\x6e\xb3\xaf\
-\x37\x63\x2e\x40\x73\x7c\xac\xbe\xbf\x82\xdf\x6c\xec\xa8\xdf\x65\
-\xc8\x6d\xb3\x9c\x9a\xed\x97\x57\x91\x72\x75\xca\xb8\x4c\xd8\x36\
-\xbf\x27\xc3\x65\xd0\xfb\xe3\xcb\xc1\xb8\x3e\x0a\x5b\x61\xf9\x25\
-\x96\xdd\xe8\x15\x2c\x6b\xd9\x1a\x44\x97\x06\x8b\x10\x42\x08\xd1\
-\x29\x66\x4c\xa2\x69\xfa\x6c\xfe\x8e\xcd\xb4\x0f\x74\xe5\xea\xa8\
-\x28\xe6\x25\xcc\xdf\x3e\x09\xe4\x7b\x0d\x2c\xe3\x88\xbb\xf4\x84\
-\x7e\xc7\xa3\xa0\x64\xc0\x68\x67\x58\x09\x5c\xe0\x06\xc8\x9e\x7e\
-\x8f\xc1\x98\x8b\xcd\x3e\x98\xfb\xcc\xb7\xa2\x98\x3f\x64\xe4\x54\
-\xef\x0a\x31\x36\x3b\x3f\xd1\xff\x7e\x9b\x2b\xcb\xdb\x51\xec\xfe\
-\xf2\x78\x4a\xa9\x2e\x47\x2b\xf4\x5c\x5e\x73\xf7\x0f\x3f\x22\x68\
-\x17\x30\x97\x9b\xbb\x42\xa5\x38\xf8\xff\x38\x6c\xb6\xf5\xe9\x1e\
-\xec\x46\xad\xd0\xa3\x29\x1c\xab\xd5\xbf\xba\x62\x24\x2e\x88\x62\
-\x2e\xc4\x66\xfc\x3f\x84\xf9\xba\x27\xa9\x36\x47\x02\xdf\xa0\x38\
-\xf6\xa6\x1d\x2d\xcd\xe0\x2e\x5f\x45\x7d\x28\x48\x4b\xdb\x11\x75\
-\x14\xaf\x08\x6c\xa9\xfa\x2f\xa1\x38\x23\x58\x56\x99\x2b\x69\x9b\
-\x45\x58\x06\xb0\x9f\x04\xc6\xdb\x50\x2c\x6e\xe3\x20\xcc\x9d\xf0\
-\x8c\x4e\x18\xd9\x42\x06\x80\x10\x42\xf4\x79\x46\x45\x31\x83\x0b\
-\xf9\xb6\xd9\xc5\xd3\x67\x32\x78\x4b\x29\x3c\xad\xa6\xaa\xde\x8d\
-\xa5\x15\x3c\x04\x73\x1b\x99\xe2\x8a\xf1\x49\xc1\xa9\x0f\xd2\xe6\
-\xc7\x9c\x9e\x5d\x9c\x9f\x56\x14\x02\x9e\x80\xca\x94\xf5\x42\x9e\
-\xd6\x28\xe6\x66\xbf\xcf\x97\xb0\x99\xc2\x03\x68\xcb\xe2\x32\x0e\
-\xf3\x51\xbe\x9b\xb6\x00\xc2\xee\xb0\x06\x5b\xd5\x38\xc2\xeb\x3d\
-\xce\x95\xbc\xb1\xd8\x2a\x07\x98\xbb\xc9\x35\x1d\xed\xca\x1b\xea\
-\xe8\xb4\xcf\x90\x53\x35\x7c\xf7\xe0\x83\x53\x87\x87\x53\xda\xad\
-\x28\x07\x1c\x12\xc5\xd4\x5e\x3c\xa5\xea\x2b\x11\x09\xb5\xb4\xcf\
-\x7a\x53\x4d\xca\xf5\xaf\x1e\x71\x1b\x71\x23\xf7\x10\x37\x6e\x1e\
-\x2d\xe4\x79\x25\x8a\xf9\xad\xf7\xcd\xab\xb0\xfd\x1e\x70\x83\x71\
-\xa4\x1b\xaf\x3d\xc5\x5a\xaf\x67\x73\x77\xc6\xd7\x56\x68\x9b\xa5\
-\x3e\xae\x9b\xa2\x98\xab\x31\x37\xac\x2f\x06\x86\x76\x8d\x7f\x0e\
-\x00\xa6\x45\x31\x0f\x06\xae\x73\x42\x06\x80\x10\x42\xf4\x2b\xd6\
-\x63\xae\x2c\x49\x90\xe3\x44\x6c\x89\x3f\xf4\x13\x3f\x90\xb6\x59\
-\x69\xfc\xfc\xf5\x3d\x58\xa6\x97\xb1\x4c\x25\x07\xbb\xc2\x78\x20\
-\x16\xe8\x97\x64\xe5\x68\xc4\x5c\x71\x92\x25\xfa\xe5\xae\x94\x24\
-\x81\x84\xb3\xb1\xa0\xd0\x44\xc1\x1c\xe5\xd7\xba\xcf\x15\xe8\xce\
-\xb8\x3b\x0c\xc3\x66\xb4\x0b\xd8\xac\xe1\xb1\x98\x8b\x51\x92\x77\
-\xfd\x8d\xfe\xe9\xb6\x01\xe0\x06\xc7\xef\xb1\x4d\xd4\xf6\xa7\x2d\
-\x8b\x4d\x18\x0c\x3c\x17\x5b\x29\xa8\x94\x3a\x60\xcf\x28\x26\x57\
-\xc8\xd3\x7a\xfa\x4c\x6a\x53\xd7\x6b\xa0\x7b\x2e\x41\xbb\xd2\x96\
-\x1d\xa6\x52\xde\xe8\x72\x7d\x2d\xc3\x70\x18\x8f\xb9\x81\x25\xb2\
-\xdf\x2e\xa5\xc0\x35\x66\x5c\x6f\x27\x6f\xfb\xc4\x17\x7f\x34\x1d\
-\x67\x1b\xea\x0c\x89\x8b\x51\x12\x8b\x72\xad\xf7\x87\x84\x9d\xbd\
-\x0c\xcf\x00\x8d\x8d\x66\x9a\x2d\xec\x44\xbd\x3a\x52\xfe\x07\x62\
-\xab\x4d\x3f\x71\x99\x4d\xc1\x36\x38\x6b\x8d\x62\x1e\x76\x65\x7c\
-\x42\x60\x60\xe5\x5c\x4e\x61\x46\xa7\x11\x6e\x08\xbe\xee\xd7\x1c\
-\x85\x65\xdf\xb9\xbe\x90\x2f\x3a\x2f\xd3\x2e\x4f\x29\xf5\xf3\xb0\
-\x8d\xcd\xc2\xd8\x8e\x43\xb0\xac\x3b\x9d\x1d\x5f\x9b\xc9\x90\xdb\
-\xe0\x50\x4e\x9e\xad\x6a\x0a\x16\xab\x93\xc4\xc0\xb4\x50\xbc\xc2\
-\x75\x25\x6d\x7b\x57\x24\xfd\x73\x2c\x16\xf3\xd0\xe8\xd7\xc9\x79\
-\x7b\x4d\xc0\x66\xfa\xb7\xf3\xfa\x7c\x99\xb6\xb4\xb8\xef\x70\x43\
-\xe0\x7e\xbd\x22\x64\x00\x08\x21\x44\x7f\x64\x2d\xf0\x17\x6c\xf9\
-\x3b\x51\x9e\xce\x8f\x62\xce\xc5\x66\xc8\x26\x60\x39\xb6\x47\x07\
-\xbf\x79\xb4\x27\x0d\x00\x57\x6c\xfe\xe4\x8a\xf0\x04\x6c\x99\xfe\
-\x64\xda\x66\x75\x1f\xc1\x7c\xef\x5b\x03\x05\x6d\x21\x6d\x6e\x09\
-\xc7\xb9\x92\xf6\xa4\x2b\x86\x67\x63\x69\x31\xcf\x06\xae\xf0\xeb\
-\x77\xa4\x74\xe5\xfc\xde\x3f\xc6\x02\x03\xdf\x89\xe5\xd5\xbf\x1a\
-\xcb\x54\x72\x60\xa0\x70\x55\x12\xf7\xd6\x42\xb1\x5b\xc6\xfe\xae\
-\x84\xbd\x01\x58\x18\x6c\x84\xb4\x0c\x73\xef\x38\xc7\xdf\xa5\xef\
-\x09\x7e\xd3\x84\xa5\x43\x5c\xdd\xc1\xbd\x16\x60\x41\x97\x49\xd6\
-\x93\xcf\x00\x0f\x44\x31\xf3\xdc\x98\x39\x32\x38\xf7\x95\xc0\x90\
-\xea\x0a\xe3\x29\xce\x90\x73\x0d\x64\x66\x0c\x3a\x99\xb6\x74\x9c\
-\x49\xcc\x46\xda\x00\x18\x05\x9c\x16\xc5\xcc\x75\x65\x6d\x2a\x6d\
-\xee\x2d\x60\x3b\x39\x6f\x1a\xd2\x5e\x75\xde\x13\x0b\x80\x4d\x94\
-\xf2\x2f\xa6\xfa\xeb\xc2\x12\x65\xdf\x01\x98\x10\xc5\xac\xa4\x2d\
-\xf0\x3c\x8b\x15\x5e\xd6\x64\x15\x2c\x8f\x65\xdf\x59\xe8\xca\xe5\
-\x8f\x31\x97\xb0\xaf\x00\xf7\xbb\xbf\xfa\x22\x57\x9a\x6b\x52\xf5\
-\xaa\xc7\xfc\xd7\xf7\xab\x44\xb8\xee\x62\x75\x02\x96\xa9\x66\x67\
-\xbf\xe6\xff\x46\x31\x97\xfa\x38\x3c\x02\x4b\x59\x59\x64\x9c\x5f\
-\x78\x02\x9b\xce\xbc\xa1\xa8\x4e\x7b\x03\xc7\x47\x31\xd7\xb9\x21\
-\x10\xb9\xc2\x7b\x68\x14\x33\xad\x90\x2f\x1b\x33\xb1\x1c\x5b\x71\
-\x4b\xd2\xec\xee\x85\xad\x4c\xfd\xc9\xaf\xf5\x59\x6c\x23\xae\x5f\
-\x02\x17\x16\xf2\xb4\x0e\xd9\xae\xf3\x1d\xc9\xe5\xb6\xc4\x15\xfa\
-\x44\x49\x3f\xc9\xdb\xb5\x05\xdb\xa5\xfb\x47\xc0\x93\x51\xcc\x97\
-\xb0\x40\xf8\x65\x3e\x1e\x92\x94\xb7\x27\xf8\x04\xc0\x3c\xef\x9b\
-\x91\xcb\xe7\xcb\xc0\x1c\x1f\xd7\xfb\x79\x59\xdf\x8e\xa5\x04\xbd\
-\x00\xcb\xec\xf5\xae\xc0\x00\x18\x28\x5d\x56\x06\x80\x10\x42\xf4\
-\x5b\x0a\x79\x36\x45\x31\x37\x61\xe9\x21\x13\x05\xe7\x5d\x58\x70\
-\xe3\x7a\x6c\xf6\x32\x74\xff\x59\x0d\x5c\x5d\x26\x05\x65\xb5\x78\
-\x1e\x9b\x7d\x9b\x80\xcd\x30\x26\xf9\xfb\x5b\x81\xdf\x17\xf2\x6d\
-\x33\xee\xe7\x1f\xc3\xca\xa9\xb7\x72\x93\x2b\x43\x35\xd8\xec\xef\
-\x75\xae\x84\x6d\xe7\x8a\x70\x0d\xf0\x43\xe0\x45\xe0\xf6\x4a\x74\
-\x2f\xcc\x9f\x3a\xc9\x49\x7e\xa2\x2b\x12\xab\x28\xce\x21\xbe\x86\
-\xca\x02\x4e\xe7\x61\xee\x1a\x49\x9e\xf8\x2f\xb8\x22\x3e\xc6\x0d\
-\xac\x6b\xbc\x3d\x9a\x7d\x15\xe0\x8b\x6e\xd0\x84\xae\x34\x4b\x80\
-\xb8\x82\x78\x83\x97\x5d\x09\x4a\xca\x79\xb8\x2b\x6b\xaf\xb8\x82\
-\x33\x3a\x30\x28\x66\x52\x1c\x4c\xda\x5d\xe6\x14\xf2\x5c\x11\x1e\
-\x18\xb2\x1d\x9c\x3e\x93\x43\x03\x03\xa0\x68\x7f\x87\x14\x27\x60\
-\x33\xaf\xf5\xd8\xca\x42\x5d\x60\xe4\xdd\x59\xe2\x37\x75\x58\x86\
-\x9c\x0f\xf8\xdf\xfb\x05\x7a\xc8\x32\xda\x7c\xb9\xd3\xb3\xe2\xfb\
-\x63\xe9\x5e\x17\x78\x3b\x97\x53\x80\xef\x73\x05\x38\xc9\x11\xff\
-\x67\xbf\xd6\x58\x57\x34\x6b\x80\xdf\x7a\xbb\xfd\x1d\x8b\x81\x78\
-\x9a\xb6\xdc\xf3\x49\xbd\x36\xf8\x7d\xeb\x2a\x11\x66\x6b\xcb\xe6\
-\x76\x1a\x18\xf4\xcb\x0f\xb9\x41\xba\x8a\xe2\x2c\x4e\x4d\xd8\xee\
-\xcb\x6b\x1b\x6d\x2d\xe4\x8f\x6e\xf8\x8e\x76\x05\x79\x06\x96\x9a\
-\x77\xa8\xcb\xa8\x0e\xdb\xbb\x60\x55\x14\x33\xbd\x54\x19\xce\x3b\
-\x9a\x8d\xd3\x6e\x67\x96\x1b\xd6\x83\xdc\xa8\xbe\x10\xcb\xbf\x1f\
-\x5e\xeb\x6c\x60\x75\x14\xf3\x6b\x4f\x00\xd0\x15\x1e\xf4\xfe\x9b\
-\x6c\x60\x77\x26\x16\x64\xdc\xea\xf7\x19\x81\xad\x46\x16\xdc\xf0\
-\x58\xe4\x6d\xf1\x15\xff\xfd\x21\xc0\x4d\x7e\x8d\x37\xf8\x75\x72\
-\xd8\x5e\x16\x9f\xf1\x49\x81\xef\x63\xf1\x44\x39\x37\x5c\x3e\xec\
-\xe3\x38\x5c\xc9\x7a\x8e\xca\xe3\x6c\x44\x80\xb2\x00\x09\x21\x44\
-\xdf\xe1\x11\x2c\x4f\x79\xe8\x57\x3e\x0a\x9b\xd9\x0d\x95\xff\x7a\
-\x6c\xb6\xec\x9f\x3d\x5d\xa0\x19\x93\xd8\x04\xfc\x4f\x86\x72\xfd\
-\xb4\x2b\x39\x9b\x09\x32\x84\xdc\x1a\x28\x98\xbb\xbb\x82\x7d\x10\
-\x6d\x69\x09\x17\xd3\x96\xfd\xa3\x2c\xe7\x1d\x4d\x93\x2b\xd1\x4b\
-\x03\xc5\x6b\x5f\x37\x44\x12\x57\xa3\x06\x6c\x46\x7e\x51\x05\x97\
-\x5c\x81\xe5\xe3\x4f\x14\xa3\x61\x98\xef\xf1\x38\xe0\x7d\xc9\x4e\
-\xa8\xce\x22\x37\x60\x42\xd7\x86\xd6\xc0\xa8\xe9\xc8\xa8\x6b\xc6\
-\x72\xc3\xff\x93\xb6\xd9\xd4\xdd\xdd\x40\x4a\x94\xff\x16\x57\xa8\
-\x6f\xa8\x52\x00\x73\xb5\x48\xf2\xfd\x1f\x41\xdb\xac\x6e\xa3\x1b\
-\x48\x77\x54\xf0\xbb\xb7\x04\xca\x75\x13\x36\x53\xff\x90\x1b\x8a\
-\x9b\xdc\x10\x5a\x15\xb4\xe9\xae\x6e\x30\x0e\x2c\xd3\x17\x1b\x80\
-\x9f\xd3\x96\xef\x3e\x59\x1d\x3a\xd2\x0d\xaa\x1a\x97\xe7\x12\xda\
-\x56\x1b\x96\xba\x92\xbc\x2a\x55\xbe\xb0\xff\x74\x88\xa7\x52\xfd\
-\x33\xe6\xfe\x13\xae\xba\x0d\xf7\x36\x1d\x1e\xf4\x8f\x47\x81\x4b\
-\x0a\x79\x36\x79\x2c\xcd\xfd\xc0\x8d\xb4\x65\x1c\xda\xde\xef\x1f\
-\xca\xe8\x05\x57\x98\x9b\x3b\x28\xc3\xcd\x58\x56\x9d\x72\xd7\x6a\
-\x70\x83\xab\x3b\x41\xe7\xcf\xb8\xdc\x92\xec\x61\x83\x7d\x9c\x1c\
-\x46\x5b\xa0\xf9\x0a\x37\x5c\xd7\x79\xac\xd2\xe5\xb4\xc5\x5e\x24\
-\x7d\xfd\x9d\xfe\x6f\xce\xdb\xa6\x1e\x73\x4f\xaa\xf7\xfa\xae\x0e\
-\xda\xe5\x4d\xa9\xfe\x96\x6c\x9c\xb7\x42\xaf\x06\x19\x00\x42\x08\
-\xd1\x6f\xf1\x97\xe8\x2f\xb0\x3c\xf7\x8f\x62\xb3\x61\x0d\xc1\x4b\
-\x7d\x8d\x1f\xff\x26\xf0\x8b\x30\x40\xd8\x5f\xae\xcb\x5c\xf1\x59\
-\xe8\xff\x6f\x01\x68\xb1\xd9\xcb\x55\x59\xdf\x61\xb3\xce\x8b\xfc\
-\x78\x98\x97\xdb\xb4\x19\x53\x21\x1e\xc2\x02\x6c\x17\x06\x9f\x99\
-\xd8\x2c\x7e\x5a\x49\x5b\x8e\xb9\x62\xdc\xe2\x46\x43\x83\x2b\x22\
-\x1b\xfd\xbe\xb3\xb0\xd9\xd9\xa7\x02\xe5\x70\x71\x70\xdd\x55\x19\
-\x4a\xcf\x2c\x6c\x86\xf0\x6e\x2c\xa8\x32\xbc\xe6\x22\x6c\x16\xf2\
-\x67\x41\x40\x6e\xc9\x3a\xb9\x92\x7d\x85\x1b\x2a\xcb\x69\xcb\x67\
-\xbe\xc6\xdf\x99\xb5\xc1\xb9\x0d\xae\xa8\x86\xae\x39\xab\x80\x99\
-\x9d\x58\x79\x99\x87\x6d\xba\x74\x43\x20\x8f\x16\xbf\xe7\x8b\x5e\
-\x8e\xaf\x51\xec\xfa\x52\xb2\x2d\xcb\x10\xd6\x79\x21\x19\xae\x61\
-\x19\xfd\x60\x31\xd9\x69\x30\x93\x94\xa5\x1b\xfc\xbe\x0d\xd8\xaa\
-\xc5\x55\xc0\xd9\x65\x02\x9f\xd7\x62\x2b\x46\x1b\x83\x32\xbd\xe0\
-\x7d\xfa\xc7\xbe\xa7\x43\x62\x28\xde\x88\xb9\x85\x3c\xeb\x65\xda\
-\xe0\x6d\xdb\x54\xaa\xfd\xbc\x2f\x3e\xe9\xfd\x67\x96\x9f\xdf\xe8\
-\x7d\xa1\xde\xcf\xbd\x1a\x73\x59\x7b\x31\x68\xef\x6b\xfc\x5e\x2f\
-\xf8\xb5\x12\xf9\x2f\xc0\xe2\x38\x5e\xac\x44\xce\x5e\xfe\x5f\x62\
-\x71\x2d\x4f\x78\xbf\x68\x0c\x14\xdb\x57\xb0\xd4\xb4\x5f\x0d\xdb\
-\xd3\xfb\xca\x39\x2e\x87\x17\xfc\xdc\x56\xff\xed\x4a\x6c\x95\xe2\
-\x8b\xc0\x3d\x9e\x61\xa8\x64\x5b\x16\xf2\xac\xf6\xba\xfc\xca\xcb\
-\x5d\xef\xf7\xdf\xe8\x72\xfc\xa7\xd7\x7f\x76\x21\x4f\x4b\xb9\xb1\
-\x5f\xae\x3f\x78\x2a\xde\xcb\xbc\xae\x4f\x7a\x19\x92\x74\xa0\x6b\
-\xfc\x3e\x5f\x05\xae\x4b\xda\xd5\xc7\x74\xd8\x36\xe1\x38\x7d\xc5\
-\xdb\x66\x0a\xf0\x94\xb7\xcb\x0d\xd8\xc6\x62\x0f\x7a\x39\xc2\xb6\
-\x7c\xc1\x9f\x23\x97\xf7\x32\xc3\xb8\xcf\x90\x93\x08\x84\x10\xa2\
-\x6f\xe1\xb3\xd0\x23\xb1\x59\xcd\xdd\xb1\xa5\xf6\x39\xfe\x92\x7e\
-\x01\x58\x9d\x7e\x29\x7a\x76\x92\xd1\x14\xcf\x02\x2e\x2f\xe4\x69\
-\xc9\xe5\x60\xfa\xec\xa2\x8d\x7a\x36\x7f\x17\xc5\x0c\xf6\xdf\xe5\
-\xfc\xe5\xbb\x3c\x65\x58\x24\x7e\xf8\x3b\x06\x33\x73\x00\xab\xca\
-\x65\xe6\x88\x62\x86\x60\xfe\xd8\x7b\x63\x3e\xbe\x7f\xf5\xf2\x2f\
-\x28\xe4\xdb\x14\x1a\x0f\xac\x1c\x43\xdb\xcc\xef\xfa\x42\xbe\x7d\
-\xe6\x14\x2f\xc3\x70\xcc\xef\x79\x42\x70\xcd\xe7\x81\x17\x03\x25\
-\x84\x0a\xeb\x94\x94\x6f\xfb\x40\x59\x9d\xef\xb2\x6d\x0d\x64\x3a\
-\x19\x9b\xf1\x4f\x64\xf7\x1b\xe0\x2b\xe9\xeb\x55\xd0\xa6\xa1\x3c\
-\x0e\xc4\xdc\x53\x16\x62\x41\xa4\x9b\x2a\x6d\xcb\x32\xd7\x0f\xeb\
-\x9c\xd9\x3e\x19\xfd\xa0\x09\x58\x76\xf1\x14\x9a\x4e\x9f\xc9\xe5\
-\x6e\xa8\xe0\xca\xe7\x89\xb4\xc5\x3e\x3c\x85\xad\xf8\xbc\x14\x2a\
-\xff\xee\x52\x14\xfe\xee\x1f\x98\x0b\xdb\x01\x58\xb0\xf8\xdd\xd8\
-\xaa\xd6\xa2\x8c\xbd\x1d\x92\xb6\x1f\xed\xed\x3f\xc2\x0d\xa4\xf9\
-\x7e\xdf\x8e\xda\x6f\xb8\xcb\xf2\x60\x97\x67\xec\x7d\x61\x71\x96\
-\x81\xe2\xf7\x1a\x87\xb9\xa6\x1c\xe4\xf2\x7f\xd9\x15\xe2\x91\x7e\
-\xaf\x0e\xe5\x1c\xb4\xcf\xce\x98\xcb\xd1\x81\x98\x4b\xd2\x5f\xb1\
-\xd5\x86\x17\x4a\x19\x87\x41\x19\xf6\xc1\xe2\x17\x9e\x72\x83\x7e\
-\xbe\xf7\xfb\xd6\x4a\xdb\xd2\x03\x71\xc7\xb9\x0c\xde\xe5\xb2\x5f\
-\xea\x46\xcd\x6b\x49\x1d\xca\x8d\xfd\x52\xfd\x21\x6c\x2b\xaf\xeb\
-\x18\xbf\xcf\x07\xdd\xc8\xbb\x3b\x3d\x56\x4a\xb4\x4d\x38\x4e\x5f\
-\x4a\xf7\x9f\xe0\xfa\x3b\xb8\x2c\xc3\xb6\x7c\xae\x54\xbf\x11\x32\
-\x00\x84\x10\x42\x88\x9e\x30\xc0\xc6\xba\x02\x33\x0a\x8b\x57\x48\
-\x02\x8d\x5f\x07\xa6\x14\xf2\xcc\xea\x4f\xf5\xcd\x50\xe4\x17\x02\
-\x13\x0b\xf9\xcd\xd9\x72\x2a\xfd\xdd\x3d\xc0\xe4\x42\xbe\x68\x47\
-\x5e\x21\xc4\x56\x40\x41\xc0\x42\x08\x21\x44\xe7\x98\x8c\x65\x7b\
-\xa9\xa1\x38\x48\xf4\x36\x2c\x08\x55\x08\x21\x64\x00\x08\x21\x84\
-\x10\xfd\xec\xdd\x39\x34\x75\xec\x79\x60\x46\x21\xbf\x39\xe7\xba\
-\x10\x42\xc8\x00\x10\x42\x08\x21\xfa\x09\x4d\xb4\x65\x3f\xd9\x84\
-\xf9\x69\x9f\x8b\xf9\xb3\xf7\x3b\x3c\xb8\xb6\x31\xa8\x73\x12\xa4\
-\xda\xd9\xdf\x35\xd0\xbd\xcc\x33\x42\x08\x19\x00\x42\x08\x21\xc4\
-\x56\x61\x16\xe6\x06\x04\x16\x1c\xfc\x12\xf0\x6a\x56\xc0\x63\x7f\
-\xa0\xd1\xd4\xf7\x8b\xb0\xcc\x4e\x49\x9d\x97\x77\xe1\x77\x61\xd6\
-\x2a\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
-\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
-\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
-\x88\x5e\xcf\xff\x03\xcc\xdd\xa4\x00\xd0\x8b\x55\xe0\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x33\xa4\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\xd4\x00\x00\x00\xaf\x08\x06\x00\x00\x00\x44\xb5\x2f\xda\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x33\x39\x49\x44\x41\x54\x78\x5e\xed\x9d\xe9\x77\
-\xd5\x46\xb6\xf6\xef\xe7\x4e\x48\x02\x61\x30\x83\x67\xe3\x11\xf0\
-\x04\x1e\x20\x0c\x21\x0c\x21\xc6\x84\x00\x09\x19\xde\x84\xee\x34\
-\x49\xaf\x0c\x6b\x75\xe0\xae\xd5\x4d\x3e\xf4\xdb\x7f\xfa\xb9\xfb\
-\x29\xa9\xe4\x52\x69\xef\x3a\x92\x8e\x0c\x36\x7e\x3e\xfc\xd6\x51\
-\x1d\x55\xed\x1a\xb5\x77\x4d\x2a\xfd\xcf\xfb\x67\x46\x7b\x84\x10\
-\x42\x08\x19\x0c\x1a\x54\x42\x08\x21\xa4\x03\x68\x50\x09\x21\x84\
-\x90\x0e\xa0\x41\x25\x84\x10\x42\x3a\x80\x06\x95\x10\x42\x08\xe9\
-\x00\x1a\x54\x42\x08\x21\xa4\x03\x68\x50\x09\x21\x84\x90\x0e\xa0\
-\x41\x25\x84\x10\x42\x3a\x80\x06\x95\x10\x42\x08\xe9\x80\x8a\x41\
-\xfd\xe6\x9b\x6f\x6a\x73\xed\x93\x5b\xa5\xb0\xc3\xb3\xf3\xee\x7f\
-\xfc\x86\xff\xc3\xdf\xdd\xcf\xb6\x4a\xff\x1d\x1d\x9b\xac\xc8\x4b\
-\x11\x86\x05\x5b\xdb\x0f\x7a\x9b\xd7\x6e\x94\xfe\x1b\x5f\x38\xef\
-\xfc\x0e\x4d\x4e\x97\xfe\xbf\x79\xe7\x6e\x45\x9e\xc5\xe2\xfa\x46\
-\x29\x2c\xdc\xf8\x3f\xfc\x0f\x3c\x7c\xf4\xa8\xb7\x7a\xf9\x4a\xe9\
-\xbf\xe9\xc5\xe5\x8a\x3c\x0b\xa4\x3f\x0c\x0b\xf0\xff\xfc\xca\xc5\
-\xd2\x7f\x88\xe3\xc9\x97\x5f\x96\xfe\x03\xf8\x2f\x96\x69\xd1\xa4\
-\x3e\x90\x87\xf0\x7f\xc4\x1f\xcb\xb3\x68\x52\x1f\x20\xfc\x0f\x7e\
-\x62\x79\x29\xc2\xb0\x20\x55\x1f\xc8\x5b\xf8\x3f\xf2\x1e\xcb\xb3\
-\x68\x52\x1f\x71\xfc\x08\xab\xc9\xd4\x68\x52\x1f\xc8\x6b\xf8\x1f\
-\x88\xe5\xa5\x68\x52\x1f\xa8\xc3\xf0\x7f\xd4\x71\x2c\xcf\xa2\x49\
-\x7d\x58\xba\xa4\x0e\x4d\xeb\x23\xfc\x0f\xe0\x59\x8c\x65\x5a\x34\
-\xa9\x0f\x4b\x97\xd4\xa1\x49\x7d\x58\xba\xa4\x2e\x4d\xea\x43\xd3\
-\x25\xb1\x3c\x0b\xab\x3e\x0e\x07\xff\x81\x94\x6e\xaf\x03\xea\x23\
-\x96\xf9\xf4\x6b\xbb\x3e\x0e\x8f\x8c\x97\xfe\x7f\x20\xe1\x63\x99\
-\x16\x71\x7d\xa8\x06\x35\xfe\x8f\x10\x42\x08\x21\x69\x68\x50\x09\
-\x21\x84\x90\x0e\xa0\x41\x25\x84\x10\x42\x5a\x12\x4e\x4f\xd3\xa0\
-\x12\x42\x08\x21\x2d\xb9\xb7\xfd\xa0\x58\xb3\xa5\x41\x25\x84\x10\
-\x42\x3a\x80\x06\x95\x10\x42\x08\xe9\x00\x1a\x54\x42\x08\x21\xa4\
-\x03\x68\x50\x09\x21\x84\x90\x0e\xa0\x41\x25\x84\x10\x42\x5a\xf2\
-\xf4\xe9\xd3\xe2\x70\x88\x8a\x41\x8d\x4f\x7e\x20\x84\x10\x42\x88\
-\x4e\x78\x9a\x5a\xc5\xa0\x12\x42\x08\x21\xa4\x39\x34\xa8\x84\x10\
-\x42\x48\x07\xd0\xa0\x12\x42\x08\x21\x1d\x50\x31\xa8\xf1\x29\xff\
-\x84\x10\x42\x08\xd1\x09\xbf\xa2\x53\x31\xa8\xda\xa7\x80\x08\x21\
-\x84\x10\x52\x25\xb9\xcb\x97\x10\x42\x08\x21\xf5\xa0\x41\x25\x84\
-\x10\x42\x3a\x80\x06\x95\x10\x42\x08\xe9\x00\x1a\x54\x42\x08\x21\
-\xa4\x03\x92\x06\x95\x47\x0f\x12\x42\x08\x21\xf5\x48\x1a\xd4\xf0\
-\x18\x25\x42\x08\x21\x84\xd8\x70\xca\x97\x10\x42\x08\xe9\x00\x1a\
-\x54\x42\x08\x21\xa4\x03\x68\x50\x09\x21\x84\x90\x0e\x48\x1a\xd4\
-\xf0\x18\x25\x42\x08\x21\x84\xd8\x5c\xfb\xe4\x56\x71\x5d\x31\xa8\
-\xdc\xe5\x4b\x08\x21\x84\x34\x87\x06\x95\x10\x42\x08\xe9\x00\x1a\
-\x54\x42\x08\x21\xa4\x03\x68\x50\x09\x21\x84\x90\x96\x0c\xcf\xce\
-\x17\xd7\x34\xa8\x84\x10\x42\x48\x4b\x92\xbb\x7c\x69\x50\x09\x21\
-\x84\x90\x7a\x70\x84\x4a\x08\x21\x84\x74\x0c\x0d\x2a\x21\x84\x10\
-\xd2\x01\x34\xa8\x84\x10\x42\x48\x07\xd0\xa0\x12\x42\x08\x21\x2d\
-\x49\x9e\x94\x14\xde\x24\x84\x10\x42\x88\xcd\xed\xcf\xb6\x7a\x87\
-\xf3\xeb\x8a\x41\x25\x84\x10\x42\x48\x73\x68\x50\x09\x21\x84\x90\
-\x0e\xa0\x41\x25\x84\x10\x42\x3a\xa0\x62\x50\xc3\x97\x54\x09\x21\
-\x84\x10\x62\x73\x74\x6c\xb2\xb8\xae\x18\x54\xee\xf2\x25\x84\x10\
-\x42\xea\x91\x3c\x7a\x90\x23\x54\x42\x08\x21\xa4\x1e\x49\x83\x4a\
-\x08\x21\x84\x90\x7a\xd0\xa0\x12\x42\x08\x21\x1d\x40\x83\x4a\x08\
-\x21\x84\x74\x40\xd2\xa0\xf2\xa4\x24\x42\x08\x21\xa4\x1e\x49\x83\
-\x7a\xf7\xb3\xad\x92\x9b\x10\x42\x08\x21\x3a\x7b\x7b\xca\xf7\xf4\
-\x88\x8e\xe6\xf7\x00\x71\x7c\xe2\x6c\x6f\xe1\xe2\x5a\x6f\x64\x7a\
-\xb6\x77\x7a\x6a\xba\xf7\x1e\xcb\xa5\x31\x28\x43\x94\x1d\xca\x10\
-\x65\xf9\x5a\xca\xd0\xc7\x11\xa2\xf9\xdb\xeb\xbc\x2d\xf9\xe8\x02\
-\xad\x2c\x80\xe6\x77\x37\xd9\x0b\x69\xe8\x88\xfd\xac\xdf\xf6\xa4\
-\x41\x1d\x9e\x5d\xe8\xdd\xb8\x71\xc3\xf1\xdf\xff\xfe\xd7\x81\xeb\
-\xab\xd7\xae\xf5\xde\x3b\x75\x26\x2b\x60\x25\xdc\x41\x60\xea\xc2\
-\x72\xef\xc5\xcb\xff\x2d\x95\xcf\x8f\x3f\xfd\xdc\x7b\xef\xe4\xc1\
-\x2e\x97\x26\xa0\x0c\x2f\x5f\xf9\xa8\xd4\xbe\x56\xd7\xd6\x77\xad\
-\x0c\xef\x6c\x3f\x28\xd5\x97\x6f\xcf\x38\x44\x7b\x3f\xd5\xd9\xcc\
-\x85\xc5\x52\xfa\x7d\x7e\x8e\x8d\x4d\x1e\xb8\xb6\x37\x32\x33\x57\
-\xa9\x4f\xef\xbe\x71\xe7\x53\xd1\x53\xc3\xaf\xc5\x08\xa0\x6d\xc5\
-\xf1\x83\x93\x93\x67\xf7\x65\x9d\xe0\xd9\xfc\xe7\x1f\x2f\x4a\xf9\
-\x81\x7e\xfb\x40\xf2\xb2\x1f\xf2\xb3\x27\x0d\xea\xb1\xb1\x89\x52\
-\xe3\xf0\x85\xfb\xea\xd5\xab\xde\xbb\x27\x4e\x66\x8d\x55\x09\x77\
-\x10\xf8\xee\xd9\x5f\x4b\x8d\xcd\x97\xcf\x98\xf4\xe6\x60\x10\xf6\
-\x73\xcf\xf4\x75\xb1\x74\xf1\x52\xa5\xfc\xc0\xc6\xb5\x1b\xbb\x52\
-\x86\x33\xe7\x17\xd5\xf8\x3e\x1c\x16\x83\x2a\x1d\xc4\xfd\x52\x67\
-\x77\xee\xeb\xca\xfb\xfd\x93\xa7\xf7\x55\x3e\xba\x00\x6d\x28\xae\
-\x4f\xef\x5e\xdb\xd8\xe8\x1d\x1a\x42\x99\xec\xbe\x9e\x42\x9d\xc4\
-\xf1\xe3\xfa\xf8\xc8\xd8\xbe\xd4\x07\xdf\x7c\xff\x4c\xcd\xcf\x7e\
-\xd1\x6f\x49\x83\x1a\x1e\xa3\xf4\x3a\x39\x36\x3a\x51\x2a\x4c\x5f\
-\xb8\x30\xa8\xef\x1c\x3b\xd1\x3b\x74\x80\x0d\x47\x3c\xb2\xf2\xe5\
-\x73\xff\xe1\x17\xf2\x10\x9f\x92\x5e\xdc\xc1\xed\x6c\xd4\x05\x65\
-\xa8\xb5\xaf\xbe\x65\x88\x36\xa7\xa1\xf9\x0d\x98\x39\x7f\x41\x8d\
-\xef\x88\xc4\x73\x48\x8c\x51\x1d\x19\x9d\x12\xa7\xdf\xa3\xf9\x0d\
-\xb8\x73\x7f\xbb\x94\x7e\x9f\x9f\xf7\xa4\x93\xfb\x46\xf2\xf1\x86\
-\x38\x22\xc6\xea\xd5\x9f\x7f\x56\xea\x33\x74\x9f\xc2\x08\xf1\x35\
-\xe8\x29\xb4\x2d\x2d\xfe\xf1\xb9\xf9\xcc\xa8\xef\xb3\x3a\xd9\xef\
-\xfa\x2d\x69\x50\xdf\xd4\xd1\x83\xc3\x33\xf3\xa5\xc2\xf4\x85\x7b\
-\xf5\xea\xd5\x83\x6d\x50\x25\xcf\xe7\x97\x57\x2a\x8d\x0d\xd7\x8b\
-\x97\xd6\x65\xf4\x2e\x0d\xee\x00\x8f\xde\x6b\x21\x65\xf8\xe4\x9b\
-\x6f\x2b\xe5\x07\x4e\x8f\x4f\x9a\x65\x88\x30\xb1\x7f\x5c\xd7\x99\
-\xb6\x85\x21\xd2\xe2\x7b\x13\x86\xe8\xfc\xca\x6a\x29\xfd\x3e\x3d\
-\x75\xa6\x6d\x2d\xe5\xfd\xc6\x3a\x06\x6f\x88\x95\xcb\x59\x87\x2c\
-\x2c\xbf\xd8\x7d\xed\x93\xdb\xaf\xc5\xa0\xa1\x4e\xfe\xa3\xc4\x3f\
-\x39\x7f\x6e\xff\x19\x54\x49\x2b\xda\xe7\x7f\xfe\xf3\x9f\x4a\x7e\
-\x96\xd7\x37\xf7\x9d\x7e\xdb\x53\x06\x35\x2c\x4c\x5f\xb8\x07\xcd\
-\xa0\xa2\x27\x7c\x7c\x7c\xaa\x77\x7c\x62\x2a\xfb\x4f\xf2\x0c\xc5\
-\xf7\xcb\x6f\xbf\x17\xe5\x83\x51\xfb\xd6\xe7\x0f\xb3\x72\xd9\x87\
-\x3d\xd2\x37\x01\xca\x70\x6d\x63\xb3\x68\x5f\x28\xc3\xd9\x73\xe7\
-\x93\x65\x88\x07\x3d\x6e\x8f\xa0\xce\xb4\xed\x5e\x1a\xd9\x59\x9d\
-\x89\x3a\xd3\xb6\x7b\x6e\xa4\xfd\x86\xb0\x96\x5d\x42\x37\x74\xd5\
-\xeb\x58\x9e\xb2\x3a\x6b\x27\x44\x77\xec\x47\x7d\x80\x67\xf3\x1f\
-\xbf\xfc\x5a\xe4\xc7\xeb\xb7\x77\xf7\xa1\x7e\xdb\x33\x06\x15\x53\
-\xbe\x61\xe3\x08\x0b\xf7\x6d\x37\xa8\xd8\xe1\x36\x3e\xb7\xd0\x5b\
-\xdf\xdc\x2c\xa6\x95\xa0\xc8\xdc\x83\x29\x79\x46\x83\x42\xfe\x3f\
-\x3c\x33\xe2\xfc\x41\x99\xa1\x4c\x8a\xde\xdb\x5b\x5a\x2e\x5d\xe2\
-\xcb\x10\x3b\x08\x51\x86\x30\x6c\xc9\x32\x14\xb7\x35\xb2\xab\x63\
-\x4c\xf6\xcc\xc8\x4e\xe2\xb1\x46\xda\x75\x8c\xfb\x5e\x1a\x69\xbf\
-\x29\x70\xbe\xb9\x56\x7e\x9a\xfb\x94\x74\x84\x77\x5b\x57\x59\x9d\
-\xb5\x63\xa2\x1f\xf6\xa3\x41\x7d\x9b\xf4\xdb\x9e\x32\xa8\x71\xe3\
-\xc4\xf5\xdb\x6e\x50\x31\x12\xbd\xb8\xbe\x5e\x79\x38\xa6\x17\x82\
-\xe9\x1b\x01\xbf\x18\x4d\x40\x89\xe1\x7f\xfc\xd2\x98\x36\xa3\x51\
-\x19\xca\x7f\xd6\xc8\xce\x19\x13\x09\x9f\x2a\xfb\x3d\x33\xb2\x93\
-\x78\xac\x91\xb6\x4b\x4b\x9f\x7c\xec\xa5\x91\xf6\x9b\x62\x6a\xe1\
-\x7c\x25\xff\x6b\xeb\x1b\xbd\x3f\x5e\xbc\x28\x95\x27\xae\x1f\x7f\
-\xf5\x54\xca\x54\x0c\xc1\x2e\x96\x8b\xd5\x59\x1b\x17\xc3\x5f\xe8\
-\x0c\x25\xdc\x5e\xe6\x6d\xd1\x6f\x07\x7a\x0d\x15\xc6\x6c\x48\xc0\
-\xbb\x4f\x9b\x37\x6e\x3a\xd0\x28\x4b\xef\x41\x0d\x18\x27\xa6\x70\
-\x11\x07\xd6\x60\x00\x64\xc3\xed\x1a\x90\x60\x29\xbb\x5b\xf7\x3e\
-\x2b\x7a\x68\x6e\x1a\x58\xc2\x1c\x1b\x9f\xea\x1d\x1e\x1e\x75\x6b\
-\x78\xc7\xc6\xed\xf5\xaf\x23\x23\xe3\xce\x3f\xa6\x8e\x8f\x0c\x8f\
-\x39\x70\x1d\xe7\x25\xce\x3f\xde\x03\x83\xfc\x22\xef\x81\xdf\x26\
-\x64\xf1\x9f\xed\x1b\x7f\x0c\xc2\x20\xaf\xde\xbf\x0f\xdf\x2f\x9c\
-\x96\x5f\x17\x26\x08\xe7\xd2\x23\x7e\x0e\xcb\x3d\xe4\x11\xd3\x4c\
-\x5a\x19\x42\x16\xd2\x80\x7b\x4f\xbe\xfe\xa6\xd2\x1e\x71\x7d\x58\
-\x1e\xf6\xa3\xe2\x0f\x7e\xb4\xb8\x40\xdd\x91\x5d\xd8\x3e\x50\x07\
-\x68\x1f\x48\xe3\xa0\x75\xb0\x93\xdf\x51\x73\x0d\xfe\xa4\xa4\xff\
-\x03\x69\x5f\xf0\x53\xd4\x4f\x14\x67\xdd\x91\x36\xe2\x9a\xba\xb0\
-\xe4\xda\x12\x9e\x21\xb4\x25\xb4\xd7\xc1\xdb\x52\xb9\x7c\xfc\xf3\
-\x59\xd4\xdd\x00\xb2\xeb\x82\xd7\xab\xe2\xfc\x6f\x7d\xfe\xb0\x77\
-\xed\xe6\xad\xc2\xed\xef\xbb\x69\xdf\xe3\xed\xa7\x7d\x91\x5f\xe4\
-\x6f\xf3\xe3\x4c\x1f\x65\xed\x21\x78\x26\x05\xd4\x49\x93\x35\xd4\
-\xdd\xd6\x07\x48\x33\xfc\xa2\x8e\xda\xbc\x47\xea\xd3\xb7\x5f\xf4\
-\x5b\xcc\xbd\xed\x07\x2e\xcd\xb8\x3e\x90\x6b\xa8\x0b\x17\xd7\x7b\
-\xdb\x8f\x9f\xb8\x77\x5c\xe3\xf8\x42\xf7\xfc\xe2\x92\x53\x9c\x6d\
-\x2a\x00\x95\x87\x91\x27\xe2\xb0\xe4\x2f\xad\x5e\x34\xe3\x0f\x0d\
-\xaa\xf5\xde\xd9\x89\xb1\x09\x49\x5b\xf5\xc1\xb5\xfc\x63\x07\x22\
-\xf2\x02\xc5\x97\xca\xff\x77\xcf\x9e\xf5\xce\x4c\xcf\x99\x0d\xba\
-\x1f\x2b\x57\xae\xaa\xf1\x4f\xce\x2f\x24\x7b\x9d\xda\x48\x1d\x5c\
-\xbf\x73\x37\x19\xee\xff\x3d\xfb\x6b\x25\x3e\xac\x79\x85\x61\xac\
-\xf7\x42\xc3\x32\xc4\x83\x1a\xdf\xaf\xe3\x8e\xe3\x72\xf1\xa5\x46\
-\x76\xa2\xf4\x50\x07\xf3\x4b\xcb\x66\xfb\x40\x1d\x64\x6d\xcf\xce\
-\xb7\x05\x8c\x69\x2c\xaf\x8e\x1b\xaf\x85\xc4\xf9\x48\x8e\xb4\x25\
-\x1f\x50\x58\x68\x4b\x58\xaa\x88\xe5\xe1\x7a\xe9\xe2\xc5\xbc\x2d\
-\x35\xcb\x47\x9d\xe7\x07\x86\x6e\xe6\x5c\xb6\x34\xd2\xb6\xad\xf6\
-\x03\xf9\xfb\xff\x4a\xfc\x78\x3f\x17\x75\x19\xa6\xc7\xdf\x5f\xbf\
-\x7a\xad\xd4\xd9\xa8\xc3\xd4\x85\xe5\xbe\xed\xe1\x04\x8c\x8c\xe4\
-\xd5\xea\xac\x59\x6b\xa8\x96\x3e\xf0\xef\x79\xc2\x18\xd5\xd6\x07\
-\x81\x6c\x18\xce\x70\x99\x2a\x96\x7f\x4e\x3a\x72\x75\xea\xc6\x4a\
-\xdf\x49\x29\xfb\x3a\xfa\xcd\x6f\x68\xf2\xf9\x89\xf5\x9b\xbf\x7f\
-\xf3\xe6\x4d\xe7\x46\x7e\x46\x06\xd0\x6f\x31\x9b\xd7\x6e\x14\xd7\
-\x07\x6a\x0d\x15\x0a\x33\xf5\xf0\x5b\xee\xed\x2f\x1e\x4b\xc3\xa8\
-\x77\x00\x00\x7a\x45\x75\x36\x30\xc4\xee\x95\x4b\x97\xe4\x81\x18\
-\xed\x8d\xcd\xce\x39\x65\xf5\xee\xf1\xa1\xfc\xe1\xc0\x03\x64\xbf\
-\x77\xa6\x95\x8b\xe5\x1f\x3d\x67\x18\xa7\x3a\xf9\x47\x47\xe6\x38\
-\x8c\x4d\xa4\x60\xeb\x80\x07\x54\x93\xbf\xb4\xba\x2a\x79\xca\xd7\
-\x45\xa2\x30\xe8\xe5\xc6\xfe\xbd\xfb\x97\xdf\x7e\x33\xc3\x21\x6d\
-\x5a\x7e\xce\x4c\x4e\x15\xe5\x07\x3f\xd6\x7b\xa1\x13\xe8\xd5\xe7\
-\x65\x88\x9e\x6e\x7c\xbf\x8e\xfb\xbb\x1f\x7e\xa8\xa4\x2f\x35\xb2\
-\xbb\x7e\xfb\xae\xa9\xbc\x62\xf7\xfc\xca\xc5\xc6\x75\x60\x95\x7f\
-\x3f\xb7\x56\x3f\xa9\x91\xf6\xe4\xdc\x82\xa9\x4c\x63\x37\xd6\x16\
-\xeb\xe4\xa3\xcd\xf3\xf3\xea\xd5\x9f\xb5\xe5\x37\x45\x7b\x0f\x17\
-\x53\xbd\xef\x1c\x3d\x2e\x1d\xde\x93\xbd\x17\x2f\x5f\x56\xee\xef\
-\x4c\xfb\xee\x94\x63\x0a\x74\x40\xeb\xb6\x87\x8d\xeb\x37\x7a\xb7\
-\xb7\xee\xab\xf7\xad\x35\xd4\x94\x3e\xd8\xb8\xfe\x71\x63\x7d\x80\
-\xf6\x65\xcd\xac\xc5\x6e\x6c\xa6\x7c\x5f\xca\x21\xa5\x3b\xbb\xd0\
-\x6f\x30\x96\x9a\x7e\x8b\x8d\xa9\x77\x5f\xbf\x7e\xbd\xb5\x7e\x4b\
-\x71\x60\xd6\x50\x61\x4c\xf1\xa0\xc6\xf2\xeb\xba\xb1\x43\x14\x69\
-\x48\x35\x0c\x28\x83\x5f\x7f\xdf\xd9\x8d\x9b\x92\x17\xbb\x61\x50\
-\xdd\x43\x2a\x8d\xc2\x3d\x14\x88\x2b\xaf\xec\xa6\x6b\x26\x96\x7f\
-\x8c\x7a\x43\x77\x7c\x3f\x76\xa3\xec\x4d\x43\x96\x42\xd2\xa3\x4d\
-\x33\x42\x1e\x3a\x0a\xda\xbb\x7a\x98\x96\x89\xfd\x87\x6e\xb7\x23\
-\x55\x09\x87\x91\x4c\xec\x1f\x0f\xff\xe1\x53\x58\x8b\xc9\x95\x5a\
-\x5e\x86\xa1\x3c\xef\x3f\x2c\x43\x4c\x39\xc5\xf7\xeb\xb8\x17\x45\
-\xb9\xc4\xbb\x3b\xad\xf8\x50\x07\x71\xf8\x94\xbb\x4d\x1d\xa0\x63\
-\x50\x57\x7e\xe8\xfe\xf6\xfb\x1f\x2a\xf9\xb0\x46\xda\x67\xe7\x17\
-\x2a\xe1\x53\x6e\xd4\x49\xbf\x7c\x0c\xf2\xfc\x80\xe5\x8d\xcb\x99\
-\xfc\xa8\x8d\xb4\x46\xe4\xc4\x27\x94\x81\x70\x77\xb8\x66\xdc\x90\
-\xd7\x62\x07\xb5\x26\x37\xa0\x89\x31\xf5\xee\xd5\x4b\x59\x9b\x8f\
-\xef\xef\xb6\x3e\xf8\x43\x3a\x0f\x58\x4f\xbe\x7c\xe5\x4a\x2d\xff\
-\xde\x7d\x41\x9e\x0f\xb7\x26\x6a\xd4\xcb\xa0\xfa\xcd\x1b\x4b\x9f\
-\x9f\xd8\x78\x5a\x6e\x3c\x5b\xef\x63\xa0\xd4\xe0\xd9\xea\xc7\x81\
-\x59\x43\xc5\xc8\x54\x93\xdf\xc4\xfd\xdd\x0f\xcf\x92\x0d\x03\x71\
-\x68\xe1\xcf\x2d\x2e\xf6\xc6\x66\x64\xe4\x29\x95\x37\x34\x3a\x2e\
-\xee\x25\x55\xbe\x9b\x2a\xf2\x4a\xc7\xc7\x21\xbf\x75\x8c\x41\x98\
-\x0e\xcb\x3f\x1a\x50\xe8\x8e\xef\x6b\xee\xd1\xb3\x33\x2e\xcf\x8d\
-\xca\x5e\xfc\x6e\xdc\xb8\xa9\xca\x1b\x1a\x1b\x57\xe5\x59\x1b\x80\
-\xbc\x3b\x2b\x9b\x6a\x38\x6d\xe4\xb9\xb8\xb2\x52\x28\x3c\x57\x36\
-\x82\x35\xd2\x0a\x7b\xf5\x30\xa8\xf1\xfd\x3a\x6e\xcd\xa0\x5a\xf1\
-\xa1\x3d\xc7\xe1\xfb\xb9\x27\x66\xe7\x1a\xd5\x41\xdb\x91\xb6\x66\
-\x50\x2d\x65\x87\xb6\x14\x87\xef\xe7\xbe\x76\xeb\x76\x32\x1f\xd6\
-\xc8\x14\x65\xf6\xb7\xbf\x3f\x77\xeb\x96\x78\x76\x36\x2f\x5f\x51\
-\xe5\x23\x4d\x1f\x8a\x9c\xae\x14\x24\x8c\x9d\x96\x9e\xd3\xe3\x13\
-\xae\xe3\x8b\x0e\x1e\xd6\xce\xe2\xfb\xc0\xb7\x57\x4b\x57\x00\x74\
-\x20\xfa\x19\xd3\x26\xed\xc5\x5a\x43\x45\x1d\x7a\x63\x12\xfa\x6f\
-\xa3\x0f\xda\xba\xdd\xba\x6a\xa8\xd7\x6a\xa4\xaf\x49\x7e\xe0\x0e\
-\xf3\x13\x1b\x4f\xcb\x3d\x2e\x7a\xb9\xb1\x7e\x4b\x70\x20\xd6\x50\
-\xb1\x66\xea\xe5\xc5\xf2\x0b\x63\x27\x23\x19\x8c\x10\xa1\x60\x71\
-\x42\x87\xe5\xff\x8c\x71\x1a\x0a\xce\x22\xd6\x1e\x8e\xb3\x73\xf3\
-\xf9\xc8\x73\xa8\x77\xe8\xc4\x29\xd7\x40\xb0\x36\x8a\x69\xc2\x58\
-\x3e\xf2\x1a\x2b\x34\x50\xc7\x18\xd4\xf1\xef\xdd\xbf\xfc\xfa\x5b\
-\xef\xd6\xa7\xf7\x7a\x43\x23\x63\x62\xe0\xc7\xdc\x27\xfb\xac\x87\
-\x2b\x33\x16\xcd\x47\xa9\xd8\xf4\xa3\xc9\xc3\xc8\x26\x1b\x39\x06\
-\x69\x96\x6b\x6d\x24\x10\xba\x31\x8d\xa6\xa5\x43\xdb\x30\x82\xcd\
-\x22\xf1\x48\xd8\x1a\x69\x85\x65\x08\x43\x34\x2c\x1d\x88\xa5\xf5\
-\xcd\xde\xa2\xc8\x5d\xbd\xa4\x1f\x57\xb8\x76\xe5\xa3\xde\xa2\x8c\
-\x12\x70\x28\xc4\xe9\x89\x49\xb7\xd5\x3f\x1e\x7d\x59\xf1\x79\x37\
-\xea\x00\x6d\x03\x75\x30\x2b\x46\x02\x75\x60\x29\xcf\xcc\xd0\xd5\
-\xaf\x03\x4c\xc9\x2d\x6f\x5e\x71\x6d\x15\xe9\xfb\xf1\xf9\xf3\x4a\
-\xfc\x60\x64\x72\xca\x19\x07\x1c\x10\x82\xfc\x1e\x1b\x1e\xad\xe4\
-\xc3\xea\x9c\x79\x37\x76\xbb\xa2\x2d\xcd\x5e\x58\x72\x6d\x69\x62\
-\x66\xd6\x34\xb6\xa9\xb6\x84\x0d\x2d\x9a\xfc\x95\x8b\x97\x7a\x27\
-\xc7\x26\xdc\x33\xf4\xce\xb1\x21\x57\xaf\x00\x06\x4b\xf3\x8f\x38\
-\xb4\x67\xa2\x0d\x58\xd3\x8c\xe5\x3b\x7d\x24\x69\xf1\xe5\x04\xfe\
-\xa9\x4c\xfb\xa2\xcc\xfb\xd5\x99\xb5\x0c\x81\xeb\xab\x37\x3f\xe9\
-\x1d\x92\x7c\xba\x7c\x0b\xa8\x1f\x74\x24\x2c\xff\xc0\x5c\x43\xad\
-\xa9\x0f\x8e\x8a\x0e\x44\x9b\x46\x5b\x4c\xf9\xf7\xee\x8b\x6b\x6b\
-\xbd\x91\xa9\xb3\xbd\x31\xe9\xd8\x23\x7d\xe8\xec\x58\xfe\x5d\x67\
-\xca\xa8\x17\x2b\x7d\x75\xf3\x13\x1b\xcb\x7e\xfa\x2d\xf4\xdf\x56\
-\xbf\x85\x8c\xcb\xa8\xdd\x5f\x1f\x88\x35\x54\xab\xe7\xeb\xa6\x6e\
-\xbc\xb1\x93\x07\x04\x95\x97\x71\xca\xbd\xb6\x12\xfb\x07\x6e\x3d\
-\x4f\xa9\x00\x6d\x6b\x3d\x1e\x3e\x8c\x4a\xdd\x34\xae\xa4\x1f\xd3\
-\x8f\x68\x1c\x08\xfb\x81\x5c\x6b\xf2\x9d\x72\x8e\xf2\x5a\xc7\x18\
-\x84\x69\x49\x29\xf3\x2d\xe9\xe5\x23\x4d\x28\x53\x18\x6f\xe4\x05\
-\x0d\x0a\xeb\x15\x9a\x7f\x94\xbf\x33\x4e\x98\xbe\x6a\x50\xfe\x48\
-\x93\x66\xec\x9c\xbc\xa8\xd3\x80\x4d\x04\xfe\x7e\xec\xdf\xbb\x5d\
-\x67\xc3\xa7\x23\x0f\x87\x75\x57\xcd\x3f\x76\xaf\xc6\x0f\x89\x35\
-\xd2\x2a\x8d\xf2\x05\x84\x41\x8f\x15\xe5\x72\x4e\x14\xaa\x26\x1f\
-\xd3\xc9\x4e\xb9\x8b\x1f\xdf\x49\x8a\xcb\xc7\x8a\x0f\xd7\x5b\x52\
-\x07\xef\x41\x59\x46\x75\x00\xc3\xa1\xf9\x6f\x53\x07\x61\x3e\x1e\
-\x3f\xfd\xba\x24\xcf\xcb\x3f\x74\xfc\x44\xdf\x7c\xa4\x94\x31\x9e\
-\x1f\xad\x2d\xcd\x2d\xad\xa8\xfe\x4b\x75\x18\xe5\x03\x6d\x25\xf6\
-\xbf\x79\xf9\x72\xfe\xfc\xe4\xcf\x27\x9e\x21\x71\xa3\xa3\x84\xb4\
-\xe2\xac\xd7\xd0\xbf\x0f\xdf\xc5\x11\x80\x68\x5b\xda\x71\x95\xa8\
-\xbb\x92\x3e\x12\xb6\x1f\x3d\x2e\xc5\xef\xfd\xa3\x93\x6e\xa6\x43\
-\xfe\xb3\x8e\xc3\x84\x31\xcd\xf4\x12\x96\x7f\xb2\x7a\x01\xef\x8b\
-\xac\x7f\x88\xfe\x89\xfd\x7b\x77\x97\xfa\x00\x9d\x31\xcd\x3f\xae\
-\xd1\x1e\xc7\xa6\x67\x0a\xdd\xe9\xda\x8f\xa4\x13\xbf\x5f\x48\x5b\
-\x8b\xfd\x83\x05\x19\xb8\xe0\x7e\xf8\x4c\xf6\x4b\x5f\x93\xfc\x78\
-\x63\x6a\xe5\xc7\xeb\xb7\xd8\xf8\x22\x2f\xef\x49\xda\x9b\x3c\x5b\
-\x31\x7b\xf3\x70\xfc\x5d\x5a\x43\xb5\xa6\x55\x76\x1e\x56\x29\x74\
-\x91\xed\x15\x2a\x80\xe1\xc3\x7f\x58\x33\x88\xd3\x03\xb4\x07\x05\
-\xbd\xcd\x50\x3e\x40\x4f\xe9\x9d\xa3\xc1\xd4\x63\x90\x2e\x34\x2c\
-\x6c\xa6\x88\xe5\xa3\xa7\x17\xfb\xaf\x65\x0c\x02\xd9\x96\xff\x2d\
-\x69\x6c\x7f\xf1\x0f\xaa\x28\x5b\xa4\xc1\x19\x79\xa7\x7c\xcf\xa8\
-\x1b\x2c\x40\xab\xf2\x17\xbf\x1b\x37\x3e\x56\xe5\xc5\xe5\x17\x77\
-\x46\xa0\x78\x17\x94\xaf\x9c\x64\x2f\xcd\xef\x4c\xcf\x60\x54\x13\
-\xde\xc7\xb5\x55\xe6\xd6\x48\x4b\x2b\x43\x5c\xa3\x4c\xf0\xda\x4c\
-\xec\x1f\x64\x3b\x75\x33\xe5\xe0\x3b\x49\x71\xd9\x58\xf1\x6d\xd5\
-\xa8\x83\x38\x3e\x5c\xb7\xa9\x03\x9f\x0f\xac\x67\xc7\xf2\x00\xea\
-\xa1\x5f\x3e\x2c\x65\x07\x63\x9a\xca\x07\xd6\xd9\xe2\xf8\x70\xad\
-\xe5\x63\x68\x42\x57\xde\x18\x65\x38\xff\xa8\x1f\x91\xeb\xc2\xe4\
-\x20\xad\x90\x83\x67\x28\x94\x0f\x26\x30\x8d\xa7\x3c\x17\x4d\xb0\
-\xd6\xf4\x31\x33\x81\x3c\xbb\xf4\xe4\x7e\xad\x69\xdf\xd4\x51\x84\
-\xd8\x3d\xac\xbd\xfa\x82\x0d\x4f\x1f\x38\xe3\x94\x4d\x29\xfb\x3a\
-\xc1\x2f\xe2\xc4\xce\xef\xd0\x7f\x18\xbe\x6b\x7d\xf0\xaf\x7f\xfd\
-\xbb\xe4\xdf\x87\x1f\x9e\x9c\x72\xcf\x98\x33\xa4\x48\xa3\x0b\x97\
-\xa7\x6f\x54\x4f\x9f\xb6\x2c\xd2\x2f\x7d\x75\xf3\x13\x1a\xd3\x77\
-\x13\xf9\xf9\xe7\x1f\x7f\x94\xfc\x7b\xe3\x7a\x08\xcf\xb3\xdc\x0f\
-\xdb\x64\x13\x86\x26\xa7\x8b\xeb\x3d\x63\x50\x77\x6b\x0d\x15\x0f\
-\x46\x28\xcf\xcb\x47\xe1\x17\x0f\xab\x22\x17\xff\xdd\x31\x76\xd3\
-\x69\x0f\xec\xf6\xa3\xea\x1a\xad\x53\xee\x46\xda\x11\x56\xdb\x5d\
-\x87\x29\x3a\xa7\xe4\x02\xff\x4d\x8c\x41\xca\x3f\xa6\xb6\x5d\x6f\
-\x1f\x0f\x81\x92\x1e\xeb\xbd\xcb\xf8\xdd\xc9\xba\x58\xd3\xbe\xa3\
-\x67\xa7\x77\xd2\x2d\xc4\x5f\xf1\x58\x14\x03\x00\xc5\xe5\xdd\x3e\
-\x3c\xa6\x6e\x8a\xb2\x41\x7a\x95\x13\x80\x30\x8d\xea\x46\x41\x51\
-\x99\x5b\x23\x2d\xab\x17\xec\xe4\xa7\xca\xc3\x68\x37\x1e\x2b\x3e\
-\x4c\xab\xa5\xea\x00\xaf\x99\xc4\xf1\x01\x67\xfc\x5a\xd4\x01\xfc\
-\x5b\xef\xa1\x66\x06\x35\x9d\x0f\x4b\xd9\xf5\x6b\x4b\x78\x35\x21\
-\x8e\x0f\x68\x6d\x29\x65\xbc\xb0\xb9\xe7\xb0\xf8\xc5\x7b\x89\x98\
-\xca\xc6\xb4\x3c\xc0\x7a\x37\xda\xd7\xea\x5a\x75\x83\x4e\x4a\x79\
-\xd7\x45\xdb\xc0\x88\xce\xfd\x07\xae\xee\xd1\x06\x77\x64\xe3\x5a\
-\x9b\xf6\x75\xa3\x9f\x5c\xb1\x87\xb2\x01\xde\x33\x8d\xfd\x83\x79\
-\xbf\xe1\x09\xe1\xe2\x7a\x11\x37\x64\xcd\x1b\x9f\xd4\x6b\xba\x86\
-\x3a\x31\xb7\x90\xac\xc3\x7f\xfc\xba\x73\x1c\xa0\x8f\x0f\xfa\xd8\
-\x19\x61\x57\xbe\x91\x5e\x93\x6b\xab\x73\xf1\xed\xf7\xdf\xcb\x48\
-\x30\x0f\xe3\xfd\xe7\x58\xe9\x6b\xba\x86\xda\x2f\x3f\x8f\x9e\xee\
-\x3c\xcf\x3e\x3c\x8c\x6b\x5b\xfd\xa6\xb1\xa7\x0c\xaa\xcf\x2c\x32\
-\xea\x0b\x6b\x50\x83\x3a\xb5\x70\xae\x24\xcf\xcb\x5f\xfb\xc8\x9e\
-\x7e\x72\xc8\x7f\xc3\xd3\x33\x95\xf4\x80\xf0\x1d\x51\xef\x5f\x5b\
-\x03\x4a\xa5\xdd\x9a\xe6\xc4\xa1\x01\xb1\x41\x6d\x6a\x0c\x92\xfe\
-\x8d\x69\x17\xa4\x2f\x39\x92\x69\xd1\xe0\x90\x2e\x6d\xa4\x52\x5a\
-\x0f\x15\x3f\x58\x3f\x0d\xef\x63\x64\x82\x38\xbd\xdb\x87\x2f\x29\
-\x4a\x27\xbb\xfa\x95\x0a\x94\x9f\xa6\x4c\xad\x91\x56\xca\xa0\x26\
-\x4f\x18\xea\x53\x1e\xc9\xf8\x12\x75\x60\x7d\x22\x6c\x10\x83\x9a\
-\x3c\xf1\xa9\x8f\x4c\xab\x73\xe6\x3a\x73\x89\x7c\x58\xcb\x2c\x5a\
-\x9c\x37\xee\x7e\x5a\x91\x3f\x88\x1b\xcb\x32\xc5\xb3\x1d\xa6\xab\
-\x26\x98\xd5\xd2\x3a\xbb\x95\xcd\x6e\xb9\x7f\x5c\xa7\xa6\x7d\xb5\
-\xe7\x1f\x79\xd6\xfc\x17\x1b\x9e\xac\xb4\x8b\x1c\xeb\xf9\x6e\xba\
-\x86\xea\xfc\x27\xea\x50\x9b\x86\x77\x3a\xcd\x98\x75\x03\xf8\x4f\
-\x33\x8e\x29\x83\x3a\x68\x7e\x7c\x7c\xfd\xf2\xe3\xf5\x5b\x68\x4c\
-\xe1\x6e\xfd\x6c\x29\xec\xa9\x29\xdf\xb0\x30\x7d\x61\x0d\x3a\xe5\
-\xab\x8d\x1c\x41\xea\x2b\x23\x1e\x4c\x5f\xc4\xe9\xc1\xb5\xb6\x1b\
-\x12\x27\x70\x84\xf2\xbd\xff\xc7\x4f\xf3\x77\xd2\xe0\x37\x4f\x3f\
-\x1e\x58\xed\xfb\x9c\x98\x86\xc6\xba\x44\xdc\x88\x92\xca\xd9\x68\
-\x70\x4d\xfc\x3b\xe4\xbf\x41\xce\xae\x55\x11\xff\xda\xc3\x82\x3a\
-\x75\x0a\x4f\xea\x14\x1d\x8b\xf8\xbe\x5b\x03\x95\xfb\xb1\x31\xc6\
-\xc3\xec\xc3\x61\xca\xcc\xfb\xf7\xf7\xb1\x41\x46\x2b\x3f\x60\x8d\
-\xb4\xac\x51\xfe\xa0\xe5\xd1\x38\x3e\x20\xff\x59\xaf\x76\xb5\xee\
-\x45\x8b\xff\xdd\x38\xcb\xb7\x5f\x5b\xd2\xda\x37\xd0\xca\x0e\xcf\
-\x68\x2c\x7f\x10\xf7\x1f\x2f\x5e\x8a\xce\xa8\xce\x52\xd4\xe5\xc6\
-\xdd\x7b\xaa\x7c\x18\x54\x6c\xae\xc1\x7b\xc4\x53\x32\x7a\x42\x67\
-\xdd\x19\xc6\x3b\x9f\xca\xa8\x51\xdf\x90\xb3\xf3\x09\xb2\x72\x3a\
-\xe6\x17\xab\x1b\x9e\x40\x9d\x2f\x48\xbd\x2e\x7d\x00\x83\x1a\x4f\
-\x4b\xe3\xd9\xcd\xa6\x48\x8d\x76\x23\xff\xc1\x60\xc5\xf1\x2d\x5f\
-\xbc\x68\x76\x72\xba\xc8\x0f\x8c\x63\x1d\xfd\x16\x1b\x53\xb8\x8f\
-\x62\x33\x5e\x9b\x67\x4b\xa1\x62\x50\xb7\xb6\x1f\x94\xdc\xaf\x8b\
-\xdd\x5a\x43\xb5\x7a\x8e\xd8\xfd\xe5\x7a\x33\x09\x99\x67\x8c\x69\
-\x68\x3c\x58\xf1\x3a\x0a\xe4\x20\x2e\xcd\x3f\x36\xb7\x60\xfd\x6f\
-\xf2\xfc\xa2\x1b\xc9\xe2\x74\x91\xf0\xbe\xf7\xaf\xed\x4e\x05\x4d\
-\x95\x73\x5b\x65\x3e\xc8\x48\xc6\xc2\x9a\xf6\xc5\xfa\x35\xd2\x12\
-\x3f\x1c\xd9\x1a\xa8\x18\x45\xa9\x1b\x1c\xa8\xe1\xfd\xfb\xfb\x4b\
-\x6b\xd9\x87\x9c\xb5\x99\x87\x6c\xcd\x2d\x9b\xf2\x89\xd3\x9a\x1c\
-\x69\x69\x65\x32\x60\x79\x34\x8e\x0f\xc8\x7f\x4d\x46\x76\xb5\x10\
-\xff\xbb\x36\xd2\x4e\xe4\xa3\xc9\x48\x1b\x27\x92\xc5\xf2\x07\x71\
-\x63\x37\xec\x20\x06\x55\x1b\x99\xb5\x75\xbb\x69\x5f\x94\x53\x64\
-\x20\x91\x67\xcd\x3f\xfe\xef\xa7\x97\x5e\x97\x3e\xf8\xeb\xf3\x9f\
-\x4b\xfe\x71\xbd\x63\x50\x8d\xb2\x95\xff\x42\xff\x3e\x7c\xa6\x33\
-\x75\x83\x3a\x68\x7e\xbc\x71\xec\x97\x9f\x47\x4f\xb3\xe7\x39\x34\
-\xa6\x70\x7f\x20\xed\xb1\xad\x7e\x03\x37\xef\xdc\x2d\xae\x2b\x06\
-\x35\x3c\x46\xe9\x75\xb2\x5b\x6b\xa8\xd6\xc3\x8a\x57\x15\xb4\x9e\
-\x63\x88\x35\x2d\x8b\xed\xe1\x59\xe3\x08\x1e\x12\x91\x83\xc6\x12\
-\x7e\x22\x2c\x8c\xaf\x9f\xfb\xf1\x57\x5f\xe5\xa3\xab\x6a\xef\xb4\
-\xa9\x72\x6e\xea\xdf\x21\xff\x0d\x32\x92\xb1\xc0\xfa\x92\x36\xed\
-\xeb\xd6\x43\x45\x71\xc4\xca\xab\x78\x69\x5e\xe2\x9b\x3c\x97\x3d\
-\x38\xe1\x7d\x57\xf6\x12\x4e\x1b\xc9\xe1\xd5\x0d\x6b\xed\x0c\x86\
-\x21\xf6\x0f\x4c\xc3\x30\x60\x79\x34\x8e\x0f\xc8\x7f\x4d\x46\x76\
-\xb5\x10\xff\x7b\x7d\xa4\x6d\x19\x97\xad\xcf\x3f\x77\xed\x01\x6c\
-\x7d\xfe\xd0\x51\xc7\x8d\x57\xb3\x92\xd3\xa6\x09\xac\x0d\x52\x83\
-\xb8\xcf\x48\x67\x3a\xce\xb3\xd5\xf9\x3e\x35\x3e\x21\xe5\xda\xdf\
-\xa0\x36\x39\xcb\xd7\xf9\xcf\x8d\x47\x1d\xff\x0e\xf9\x0f\x06\x35\
-\xf4\x0f\xfa\xea\x63\xf9\x2f\xf4\xef\xc3\xbf\x8e\x35\xd4\x7e\xf9\
-\x81\x41\x0d\xfd\x23\x3c\x8c\xeb\x20\xfa\x0d\xec\xc9\x5d\xbe\xbb\
-\xb5\x86\x8a\xc2\x0f\xe5\x79\xf9\x5e\xa1\xa7\x1a\x2e\x5e\x46\x8e\
-\xd3\x03\xb6\xe4\xc1\x8d\x47\xa8\x00\xb2\x50\x31\x78\x4d\x21\x8e\
-\xcf\x72\x23\x7f\x90\x07\xe5\xa6\x2e\xf4\x0b\x4d\x95\x73\x5b\x65\
-\x3e\xc8\x48\xc6\x44\xc2\x68\xca\x03\xd3\xe6\xd8\x70\x12\xc7\x17\
-\xae\x21\xa1\x7c\xaf\x5e\x2d\x9f\x6d\xea\xa7\x7d\xe3\xdd\xb0\xc5\
-\xc8\xd6\x50\x46\x8d\x47\x5a\x03\x96\x47\xe3\xf8\x80\xfc\xb7\xaf\
-\xd6\x50\x13\xf9\x68\x32\xd2\xb6\xda\x2b\x36\x70\xa1\x4e\x51\xdf\
-\x68\x13\xb5\x41\x1c\x48\x9b\xd2\xb1\xea\x87\xb6\x5b\x7f\x50\xb7\
-\x76\x14\xa1\xd5\x3e\xf0\x1e\x6f\x3f\x83\x6a\x95\x57\xab\x35\xd4\
-\x44\x1d\x9a\x6b\xa8\x7d\x0c\xaa\x66\x1c\x5f\xdb\x1a\x6a\x22\x3f\
-\xfe\x79\x0e\x8d\x29\xdc\x03\xe9\x37\x61\xcf\xbe\x36\x13\x16\xa6\
-\x2f\xac\x41\xa7\x7c\xb5\x57\x2b\x40\x36\xd2\xa9\x1a\xc5\x10\x4b\
-\x99\xb8\x0d\x4d\x4a\x58\xbc\xbb\x86\xca\xd6\xb6\xf2\xc7\x6e\x34\
-\x4c\xa4\x01\xbb\x25\x91\x3f\x27\x4f\xf2\xa8\x35\x06\xc8\xd4\xe4\
-\xa5\x0c\x6a\x13\xff\x0e\xf9\x6f\x90\x91\x4c\x0a\x4c\x75\xc7\xe9\
-\x41\xfe\xb1\xa3\x39\x8c\x0f\xff\xb9\xa9\x60\x74\x74\xa4\x6c\x91\
-\x4e\xed\xd5\x15\xbc\x5a\x14\xcb\xc3\xc8\x24\xd5\x4e\x50\x97\xa1\
-\x7f\x1f\xde\x34\x0c\x03\x96\x47\xe3\xf8\x80\xfc\x77\x10\xd7\x50\
-\xad\x43\x1d\x60\x5c\x60\x20\xe1\xdf\x77\xb0\xaa\xc8\xff\x52\xe7\
-\xa8\x77\x8f\x7b\x8e\xe4\x5e\x9b\xb2\xc2\xd1\x87\x61\x7a\xe3\xf4\
-\xb7\x71\x67\xd3\xbe\x68\xd3\x3b\x6d\xd3\x7a\xfb\xc0\x3a\xc0\xa4\
-\x40\xc2\x5b\xcb\x58\x5d\xeb\x83\xf4\x1a\x6a\xda\xa0\xc6\xf1\xbd\
-\xcd\x6b\xa8\xfb\xf4\x3d\x54\xa3\xa0\xfa\x80\xed\xf6\x71\xe1\xe3\
-\xda\x8f\x74\xac\x75\x16\x18\x47\xeb\xe1\x72\x3b\x71\xdd\xe8\x76\
-\xa7\xd1\xe3\xac\xe0\xd0\x3f\xe4\x63\xdb\x3f\x0c\x04\x0e\x02\xc0\
-\x91\x83\xb3\x8b\xcb\x4e\xa1\x42\x91\x21\x4f\xd9\x4b\xf5\x41\x6f\
-\xda\xc8\x5f\x53\xe5\xdc\x56\x99\x0f\x32\x92\x49\x81\xbc\x69\xd3\
-\xbe\xd8\x3c\x12\xba\xd1\x8b\x2d\xd5\xb5\x80\x23\x0c\xfd\x7d\x1f\
-\x5e\x3b\x31\xc6\x8d\x6c\x25\x9d\x96\x22\xb2\x3a\x47\x29\x83\x6a\
-\x4d\xcb\xf9\x07\x37\x55\x1e\x8d\xe3\x03\xf2\xdf\x6e\xac\xa1\x5a\
-\xcb\x1e\x3e\x2d\x29\x99\x6d\x95\x71\x93\x91\xb6\xb5\xa1\x2f\x3b\
-\x6d\x28\x1f\xd5\x18\xf1\x68\x27\x6c\xad\x6d\x6e\x9a\x9d\xd3\x14\
-\xda\x06\x39\x80\xcd\x82\xfd\xa6\x99\xbd\x1b\x6d\x3a\x0e\x8f\xeb\
-\xd2\xab\x62\x12\x17\xf2\xec\x95\x7b\xe8\x5f\x33\xbe\x71\x1a\xad\
-\xe3\x0a\xbb\xd6\x07\x5c\x43\xad\x47\xd2\xa0\x86\xc7\x28\xbd\x4e\
-\x52\x6b\xa8\x68\x8c\xf8\xca\x82\xff\x1e\x22\xc0\xb5\xe5\x76\x05\
-\x9a\x17\x0e\xae\xad\xf7\xf0\x30\x35\xeb\x2a\x20\x36\x66\x72\xad\
-\x7d\x65\x02\x58\x5b\xe7\xb1\x33\x30\xf4\x8f\x07\xeb\x2f\x1f\x66\
-\xd3\x55\x30\xbe\xf0\x8f\xa9\x9c\xec\x3a\x77\xc3\x70\x48\x03\x73\
-\x86\x39\x8c\x3f\xa2\xa9\x72\x6e\xab\xcc\x77\x63\x0d\xd5\x21\xe1\
-\x2c\xe3\x14\xba\xb1\xa9\x28\xee\xe4\x58\xef\xb5\x85\x6e\x37\xb2\
-\x85\xa2\x4e\x4c\x95\xb5\x19\x69\x59\xc6\xa4\x98\x96\x4b\x74\x82\
-\xda\xc4\x07\x59\x9d\xaf\xa1\x0a\x56\x7b\x28\xde\xeb\xed\xb0\x33\
-\xe7\x90\xff\x9a\x8c\xb4\x21\xc3\x3a\x44\xc3\x7d\x35\x08\xcf\x89\
-\x12\x8f\xb9\xc7\x61\x69\x39\xeb\xf0\x1a\x9d\x2b\x0b\xeb\xab\x27\
-\x30\x96\x78\xf7\xd2\x75\x80\xe3\xe9\xe5\x08\x9c\x7d\x1d\x87\x07\
-\xf1\xf1\x91\xc8\x0f\xde\x5d\xf5\xf7\x43\xff\xee\xec\x66\xa5\x6c\
-\x91\x5f\xed\x55\x31\xef\xe6\x1a\xea\x1e\x5c\x43\xdd\x6b\x67\xf9\
-\xb6\x71\x9f\x96\x46\x5d\x3c\x4c\x52\x48\xf8\x96\x9f\xe5\x1f\x5f\
-\x6e\xc0\x27\xb2\xce\xcc\xcc\x49\xaf\x31\xfb\xb8\xaf\x35\x52\xc3\
-\x35\xce\x87\x2c\x7a\x5a\x41\x05\x58\x07\xe3\xe3\x9b\xa7\x50\x16\
-\x30\x28\xf8\x76\x23\xb8\xb3\xb5\xed\x14\x2e\xce\xc0\x74\xc7\xa4\
-\x49\x5a\x5d\x23\x30\x2a\xb4\xa9\x72\x6e\xab\xcc\x07\x59\x33\xec\
-\xc7\x72\x3e\xaa\xd4\xe4\x7b\xb7\xf6\x0e\x29\xd2\x6a\x9d\xe0\xe4\
-\xdd\x3b\x23\x5b\xe3\x21\x17\x2c\xe3\x98\x2a\x13\x6b\x5a\x0e\xd7\
-\xe8\x8c\xcd\x88\xa2\xc5\xc3\x8d\x8e\x9c\x56\x07\xa1\xff\x3a\xf1\
-\x21\xed\x9d\xaf\xa1\x0a\xd6\xb2\x07\xae\x61\x7c\x70\x80\x09\xd2\
-\x5b\x74\x46\x83\xb0\xc8\x5f\xe8\xdf\x87\xaf\x63\x50\xb5\xf8\x54\
-\xe5\x25\xd7\xda\xb2\x80\x77\x5f\xbf\x7d\xc7\xd5\xad\xef\x78\xe2\
-\x80\x07\x7c\x65\xc8\x32\x2e\xd9\xab\x27\xf6\x6c\x85\x8a\xc8\xb5\
-\xe4\xb9\xcd\x6e\xe8\x18\x23\xbf\xe8\x00\xe3\x79\x55\x39\xe3\xbe\
-\xc9\xa9\x19\x07\x80\xa9\xc5\xa2\xb3\x28\xa0\x6c\xb5\xf8\x70\x7d\
-\xff\x8b\x47\xee\x5b\xbd\x18\xc9\xc2\x90\xc2\xd8\xf7\x3b\x48\x9f\
-\x6b\xa8\x7b\x70\x0d\x35\x3c\x46\xe9\x75\x62\xad\xa1\xb6\x71\xc3\
-\x48\x85\x15\x8e\x07\xd1\x7a\x4f\xac\x89\x1b\x3d\xd5\x9d\x97\x9a\
-\xcb\x0f\xeb\x89\xfc\x4b\x25\xa9\xf0\x29\x37\x1a\x2f\x0c\x2c\x1e\
-\xcc\xb8\x62\x9b\x2a\xe7\xa6\xfe\x1d\xf2\xdf\x6e\xad\xa1\x02\xe4\
-\x2b\xde\x60\x14\xa6\xcf\x7c\x87\x54\xae\xad\x35\x23\xef\xd6\x8e\
-\x83\x8b\xb1\x94\x57\xca\x30\x40\x99\x69\xf1\xc5\xee\xec\x2b\x44\
-\xe5\x29\xc6\x36\xf1\x21\xaf\x9d\xaf\xa1\x0a\xd6\xb2\x47\xec\x46\
-\xe7\x2f\xce\x87\xa5\xec\xea\x74\x0c\x62\xf9\xc0\x6a\x4b\xa8\x3b\
-\xc4\x1f\xfb\x0f\xdd\x58\x36\xf8\xe5\xf7\xdf\x93\xdf\xef\xc4\xe6\
-\x34\x17\x87\x9b\xad\xa8\x6f\x50\x47\xa4\x43\x6d\xc9\x2b\xed\xbe\
-\x4f\x95\xbf\xdc\x43\x9c\x3f\xfe\x54\x1d\xd9\xe1\xba\x34\xf2\x14\
-\x30\xfb\xa2\x9d\xb0\xd4\xd6\xdd\xb5\x3e\xe0\x1a\x6a\x3d\xf6\xd5\
-\x1a\x6a\x1b\xb7\x7f\xc7\xb1\x28\x20\xf9\x45\x45\x3e\x69\xb0\xfb\
-\x36\x76\xc3\x98\xe2\x41\x2d\x7a\xbe\x51\xe1\xa3\x12\x97\x37\x2f\
-\xd7\x96\x67\xb9\xf1\x41\x5e\x1c\xb5\x56\x34\x0a\xf9\x6d\xaa\x9c\
-\xdb\x2a\xf3\xdd\x5a\x43\x05\x88\xd3\x9a\xd6\xc3\xb5\xeb\xac\x18\
-\x3d\xdf\xe1\xc4\x48\xd1\xad\x39\x61\xf4\x10\xad\x69\xc7\xa0\x4c\
-\xb4\xf0\xa9\x32\xc1\x7f\xfd\x8c\x39\xd0\xbe\x58\xd1\x26\x3e\xe4\
-\xbb\xf3\x35\x54\x01\x71\x59\xaf\xa6\x84\x6e\xed\xab\x36\x6d\x95\
-\x71\xe3\x91\xb6\xb8\x31\x7a\xfb\xf1\xf9\x4f\x6a\x7c\x75\xdc\x68\
-\x0b\x7e\x34\x69\xed\x8d\xb0\xb0\xd2\x5b\x9c\x27\x5c\x57\x9e\xf8\
-\x19\x13\xc3\xa9\xa5\xcf\x9d\xe0\x14\xe8\x0f\x57\x2f\x2b\xd9\x51\
-\x93\x9a\x7f\xcd\x8d\x3c\x5a\x5f\x75\xe9\x5a\x1f\x70\x0d\xb5\x1e\
-\x7b\xd2\xa0\x5a\x6b\xa8\x6d\xdc\x87\x63\x83\x2a\xa0\x90\xd1\x08\
-\x26\xe7\xb2\xa9\xe5\x54\xf8\xd0\x8d\x29\x8e\x71\xff\x65\x05\x3c\
-\x0c\x89\x86\x84\xc6\xd2\x54\xbe\xe6\xc6\x34\x34\x2a\xd8\x35\x0c\
-\xa1\xa9\x72\x6e\xab\xcc\x77\x6d\x0d\x15\x48\x58\x7c\x52\x4c\x93\
-\x0f\x52\xa3\x4c\x8c\x14\xb5\x0f\x09\x80\x62\x4d\xbb\x4f\xfa\xda\
-\x8e\xb4\x90\x9e\x39\xe3\xec\x54\xef\xd6\xce\x8e\x6d\x1b\xdf\x6e\
-\xac\xa1\xfa\x7c\x60\x1a\x31\x4e\x4f\xe8\xd6\x4e\x00\x6b\xab\x8c\
-\xdb\x8c\xb4\x21\x0b\xf7\xfa\x95\xb7\xe6\xc6\xf7\x52\xb3\x1d\xf3\
-\xf9\xd4\xac\x96\x2e\x03\x6c\x40\xc4\xa8\x57\x93\x7f\x52\xee\xc5\
-\x65\xd2\x0f\x8c\x3c\xbd\xb2\x8e\xe5\x95\xa6\x7d\xc5\x1f\xe4\x9e\
-\x9c\x98\x34\xfd\x87\x6e\x8c\x96\x3f\x94\x91\xf2\xe8\xd4\xb4\xea\
-\x9f\x6b\xa8\x7b\x70\x0d\xf5\x4d\x81\x75\x11\xac\x11\xa0\xc2\xd0\
-\x0b\x02\xb8\x6e\xe3\x8e\xbf\x4a\xe2\x41\x41\xa3\x31\xe3\x01\xc1\
-\x11\x62\x6b\x1b\x1b\x45\xe5\x85\x95\x03\x59\x68\xbc\x38\x68\x1d\
-\xeb\x7a\x68\x40\xde\x98\xaa\x95\x25\x58\xc7\x09\x62\x2a\xf3\x6f\
-\xcf\x9f\x3b\x56\x2e\x5d\x72\xe0\xda\xda\x0d\xe8\xdd\xa7\x26\xa7\
-\x8b\xf8\x70\xbc\x19\x0c\x4a\x9c\xdf\xec\xfb\x95\xd5\x06\xd4\xd4\
-\xbf\x07\xc7\xa1\x61\x5a\xd6\xfb\xf7\xe1\x3f\x84\x11\xb0\x1e\xa0\
-\x06\xc0\x30\x6a\xf2\x71\x9d\x9a\xa6\x43\x7a\x31\x52\x0c\xfd\xfb\
-\xf0\xee\x08\xc9\x3e\xd3\xbd\x00\x65\x82\xb8\xe3\xf0\xfd\xca\x04\
-\xff\xa3\x1e\x26\xe4\x61\x9d\x9e\x5f\x70\xdf\x48\x45\xdd\x01\x9f\
-\x1e\xcd\x10\xb5\x8d\x0f\xd3\x52\xa8\x3b\xef\xdf\x87\x1f\xb4\x0e\
-\x7c\x3e\xf0\x19\xab\xdb\xf7\x3e\x73\x3b\x68\xb1\x5b\x1a\xf8\xf4\
-\x69\x1d\x03\x9c\x48\xa5\xa5\x27\xfb\x06\xac\x9d\x0f\x74\xce\xb4\
-\xfc\xbf\x2f\x75\x9c\xca\x07\xe4\xe1\x3e\xca\x7b\x4e\x14\x27\xc2\
-\x68\xcf\x07\xc0\x3d\x3c\x4f\xd8\x5c\xe5\x66\x8f\x30\x53\x81\x34\
-\x35\x30\x7e\x00\xeb\xb1\x30\xa8\x90\x17\xa6\x17\xfa\xc1\x19\x8f\
-\x44\x3e\x35\xe0\x17\x53\xd3\xb1\x3c\x5c\xfb\x8f\xc5\x17\xf2\xe4\
-\x17\xe9\x9d\x58\x38\xef\xd6\xb3\x35\x7d\x80\x2f\xd0\xe0\x14\xb5\
-\xec\x93\x7f\x43\xbd\xb9\x65\xb4\x91\x72\x7d\x80\x13\xa3\xe3\x6a\
-\x5a\x2d\x7d\x60\xf9\xf7\x40\x9f\x85\xfe\x71\x8d\xf6\x92\x9c\x01\
-\x90\xff\xfe\xf5\xef\x7f\x17\xfe\x7d\x78\x3c\x23\xef\x9d\x2c\xcf\
-\x7e\x78\x9a\xa6\xaf\x6d\x7e\x76\x4b\xbf\x25\x0d\x6a\x78\x8c\xd2\
-\x6b\x45\x32\x83\x4a\xc2\x03\x8d\x46\x83\x86\xdc\x8e\xec\xfb\x7c\
-\xae\x27\xa4\x15\x10\xe2\x91\x4a\x45\xc1\x23\x2e\x34\x8e\x71\x7c\
-\xe8\x59\x2a\x03\xc7\x11\xa2\xe7\x8d\x87\x13\xb2\x70\x0f\x7e\x5c\
-\x25\xa1\x21\x24\x0a\x5c\x33\xa6\x6e\x9a\x58\xd2\x51\xc8\x8a\xc0\
-\x3d\xeb\xe3\xcf\xe1\x7a\x4b\x91\x5e\x31\x1c\x3b\x65\x93\xa5\x4d\
-\x6b\xd8\x08\xd3\xc4\x7f\x11\xae\x88\x67\xa7\xfc\x71\xdd\x66\xc7\
-\xa4\x0a\xd2\xa5\xd6\x71\xcd\xb4\x49\x3a\xc2\xb4\xb9\x70\x92\x47\
-\x5f\x4e\x5a\x38\x4f\xdb\x32\x01\xa5\x3a\x10\xff\x59\x1a\x02\x19\
-\x45\x1a\x76\xca\x68\x2f\xd6\xc1\x7e\xc9\x47\x96\xce\x6c\x96\x09\
-\xf1\x40\xe1\xe1\xf9\xc4\x7b\xcb\x78\x07\x19\xa7\x9c\x61\xa4\x8f\
-\x91\x45\x26\x17\xe9\x16\xb9\x92\x1e\x84\xd5\x64\x26\x41\x7c\x12\
-\x76\xa7\x4c\x76\xd2\x9b\xd4\x25\x16\x2e\xfd\x58\x1e\x52\xda\xab\
-\xc4\x81\x67\xa0\x94\xce\xdc\xbf\x2f\xaf\x59\x31\xac\x99\x3e\x1a\
-\x77\xfa\x28\x4c\x8b\x33\xc6\x12\xbe\x49\x9d\x0c\x56\x87\xe5\x3c\
-\xe0\x3a\x59\x87\x2e\x2f\x28\xcb\x53\x41\x5c\x79\x38\x49\x83\x16\
-\xae\x69\xfa\x06\xcb\x4f\x56\xc6\xa5\x74\xa5\xf2\x53\x83\x45\x19\
-\x34\xf9\xeb\x8a\x41\x7d\x53\xbb\x7c\x01\x0a\x0a\x19\x73\x0d\xa6\
-\x25\x08\xeb\x64\x18\x85\xea\x29\xc7\x85\x57\x5a\x22\xf2\x86\x5b\
-\x47\x96\x76\xa2\x12\x7a\x3e\x98\x7a\x2e\x1a\x92\x93\x95\x93\xa7\
-\x13\x71\x9c\x9e\xca\xb6\xd9\xc7\xe1\x71\x7c\x5a\x51\xd1\x3e\xad\
-\x12\xb6\x56\x3e\x9b\xfa\xf7\xf8\x70\x79\x98\x30\x9c\xd5\x48\x9b\
-\x52\x2e\xf7\x2e\xd2\x26\x28\xa3\xda\x0a\x3e\x7c\xd3\x32\xf1\x20\
-\x7c\x20\xa3\x94\x0e\xb8\xe5\xff\x52\x19\xb5\x8d\xcf\x87\xcb\xc3\
-\x84\xe1\x4a\xf2\xdb\x02\xf9\x41\xda\xf6\x6c\x3e\x10\xbe\x24\xc3\
-\x3f\x9b\xfe\xb5\x33\xff\xea\x99\x4f\xcb\x60\xe5\x53\x8e\xab\x45\
-\x7a\x63\x4c\x79\x82\x26\x0f\xfe\x5d\x98\x30\xaf\x39\xb1\x2e\x72\
-\x7e\xe5\x3a\xa8\xbf\xd2\x7d\x4d\x36\xee\xbd\xa6\x3a\xcc\xf2\xd1\
-\x20\x9c\xf7\x5f\x37\x7d\x4d\xfd\x7b\x7c\xb8\x3c\x4c\x18\x2e\x95\
-\x9f\x26\xec\x29\x83\x5a\x80\xcc\x0d\x82\x26\xd3\x22\x0f\xe3\x1a\
-\x41\x40\x13\x59\x18\xe1\x86\xc6\x10\x60\x4a\xc1\xed\x0e\x0c\x8c\
-\x62\x0c\xe2\xc1\x8e\xe4\xd8\x98\x02\xf3\xab\x13\xa1\x8c\xf0\x7f\
-\x8b\xa6\xfe\x41\x18\xa6\x49\xb8\x26\xb4\x8d\xa3\x6d\xb8\x90\x41\
-\xc3\x83\x50\x46\x3f\x39\x75\xfd\x85\x84\x61\x9a\x84\x6b\x4a\x93\
-\x78\xea\xfa\x0b\x09\xc3\x34\x09\x17\x92\x87\x1d\xe4\x19\xad\x4d\
-\x28\xb7\x0b\xd9\x6d\xe4\x89\xbf\xda\xf9\xec\x77\x3f\xa6\xa9\x7f\
-\x10\x86\xd9\xed\x70\xbb\xed\x1f\x84\x61\x9a\x84\xab\xc1\xde\x34\
-\xa8\xfb\x0c\xeb\x3d\x3f\xac\xb7\x61\xba\xca\x32\xa8\x18\xd9\xe2\
-\xdd\xb7\xd8\x98\xc2\x18\xe3\x13\x66\x6e\x1a\x0b\x7e\x95\x38\x09\
-\x21\x84\xec\x2d\x68\x50\x3b\x00\x46\x0f\xef\xc8\x85\xc6\x34\x34\
-\xae\x78\x4f\x11\xa7\x35\xe1\xd5\x05\x6c\xae\xc1\x86\x0d\xeb\x13\
-\x6e\xb8\xde\xd9\xaa\xdf\x7e\xe7\x19\x21\x84\x90\xdd\x67\xcf\xae\
-\xa1\xee\x5b\xc4\xe8\xe1\x54\x13\xcd\x38\x36\x75\x6f\x7d\xfe\x30\
-\x7f\x45\x67\xb0\x85\x72\x42\x08\x21\xbb\x4f\x72\x97\x2f\x0d\x6a\
-\x3b\x60\xfc\x52\x5b\xdf\xfb\xb9\xf1\x1e\x1d\xde\xc5\x74\x3b\xcf\
-\xb0\x5b\xed\x54\xc3\x9d\x85\x84\x10\x42\xde\x28\x34\xa8\x5d\x21\
-\xc6\x0f\x46\x15\xbb\xf2\xf0\x0e\x1d\xde\x73\xc5\x7b\x7d\xfe\x3d\
-\xbf\xd0\x78\xc2\x8d\xf7\x5c\x71\x28\x01\xde\x75\xc5\xc9\x2a\x6e\
-\x54\xea\x76\x04\x07\x9b\x98\xb4\x78\x08\x21\x84\xec\x49\x68\x50\
-\xbb\x04\x46\x15\x60\x4b\xb6\x18\x56\x8c\x34\xb3\x77\x9e\x76\xde\
-\x7b\x8a\xc1\x7d\xf8\x83\x7f\xb7\x85\x7b\xc0\xed\xff\x84\x10\x42\
-\xde\x0c\x34\xa8\xbb\x81\x37\xac\x32\xd2\x0c\xdf\x15\x73\xef\x97\
-\x15\xe4\xef\x41\xe1\x3e\xfc\xc1\x88\xd2\x90\x12\x42\xc8\xbe\x85\
-\x06\xf5\x75\xe0\x8d\xa5\x86\xe6\x9f\x10\x42\xc8\xbe\xe0\xc1\x17\
-\x8f\xdc\xb1\xaa\xb8\xae\x18\xd4\x70\x0b\x30\x21\x84\x10\x42\x6c\
-\x56\x2f\x5f\x29\xae\x2b\x06\x95\x10\x42\x08\x21\xcd\xa1\x41\x25\
-\x84\x10\x42\x3a\x80\x06\x95\x10\x42\x08\xe9\x00\xae\xa1\x12\x42\
-\x08\x21\x2d\x99\x5e\x5c\x2e\xae\x2b\x06\x95\xbb\x7c\x09\x21\x84\
-\x90\x7a\x24\x8f\x1e\x24\x84\x10\x42\x48\x3d\x68\x50\x09\x21\x84\
-\x90\x0e\xa0\x41\x25\x84\x10\x42\x3a\x80\x06\x95\x10\x42\x08\xe9\
-\x80\xa4\x41\x7d\xf8\xe8\x51\xc9\x4d\x08\x21\x84\x10\x9d\xa4\x41\
-\x0d\x8f\x51\x22\x84\x10\x42\x88\x0d\xa7\x7c\xc9\xee\xa1\x7d\x00\
-\xa0\x2e\x9a\x3c\x42\xf6\x12\x6c\xb7\x24\x82\x06\x95\xec\x0a\xaf\
-\xfe\xfc\xb3\xf4\x21\x75\x5c\xf7\x73\xbf\x78\xf9\xb2\xb7\x74\xf1\
-\x52\x6f\x6a\xfe\x1c\x3f\x63\x47\xf6\x2c\x23\x33\x73\x6a\xfb\xdd\
-\xb8\xf1\xb1\x6b\xb7\x5a\x18\x72\x30\xa0\x41\x25\xdd\x23\x46\x10\
-\x06\x35\x54\x36\xb1\xf2\xa9\xe3\x9e\x5f\x5c\xca\xbe\x11\x4b\xa3\
-\x4a\xf6\x10\x2b\x97\x3f\x52\xdb\xeb\xe8\xf4\x8c\xfb\xbe\x31\xdb\
-\xeb\xc1\x25\x69\x50\xc3\x63\x94\x08\xa9\x8d\x28\x94\xab\xd7\xae\
-\x25\x8d\x65\x5d\xf7\x2f\xbf\xfd\xde\x9b\x3c\x77\x81\x3d\x7f\xb2\
-\x67\x80\x41\xd5\xda\xeb\xe8\xd4\x74\xef\xd0\x89\x53\x62\x50\xd9\
-\x56\x0f\x2a\xf7\xb6\x1f\xf4\x0e\xe7\xd7\x15\x83\xca\xa3\x07\x49\
-\x2b\x72\x83\x1a\x1b\xc7\xb6\xee\xab\x57\xaf\xf6\x3e\x10\x25\x45\
-\xa3\x4a\xf6\x02\x23\xd3\xb3\x6a\x7b\x5d\xfb\xe8\x6a\xef\x5d\x18\
-\x54\xb6\x53\x22\xd0\xa0\x92\x6e\xc8\xa7\x7c\x35\xe3\xb8\x79\xf9\
-\xb2\xe3\x8f\x17\x2f\x1c\xde\x1d\x2b\xa7\xd8\xfd\xf8\xe9\xd7\xbd\
-\x43\x43\x9c\x4e\x23\x6f\x1e\x18\x54\xad\xbd\xd2\xa0\x92\x10\x1a\
-\x54\xd2\x0d\xb9\x41\x0d\x95\x8d\x57\x3e\x1f\x0c\x9d\xea\xbd\x73\
-\xf4\x78\xef\x9d\x63\x27\x4a\x1c\x91\x11\xe8\xc4\x8c\xde\xf3\xf7\
-\xee\x23\x67\x46\xdc\x9a\x2a\xe4\xab\xf1\x12\xf2\x1a\xb0\xd6\x50\
-\x47\xa6\xce\xd2\xa0\x92\x02\x1a\x54\xd2\x0d\xf9\x94\xaf\x66\x1c\
-\x4f\x8e\x4f\xf6\xde\x3d\x7e\xd2\x8d\x36\x0f\x9d\x3c\x13\x20\x6e\
-\xf9\x6f\x6e\x79\x45\x55\x56\xb8\x9e\x98\x9d\xe3\x28\x95\xbc\x71\
-\xac\x35\x54\x1a\x54\x12\x42\x83\x4a\xba\x21\x37\xa8\xa1\xb2\xf1\
-\xca\x07\x06\xf5\x90\x8c\x52\xdd\xc6\x0d\x18\xc6\x00\x18\xca\xf7\
-\xc4\xb8\xae\xae\xad\x55\x94\x15\xf8\xf6\xfb\x1f\x44\x61\x9d\xec\
-\xab\xb0\x8e\x8c\x8c\xf5\x86\x26\xa6\x9c\xe2\xdb\xbc\x71\xb3\x37\
-\x3e\x3b\xef\xa6\xe9\x16\x2e\xae\xb9\x78\x9d\x41\x06\x4a\xd8\x7e\
-\x1c\x17\xb9\x90\x0d\x79\x90\x0d\x4e\x4f\x4d\xf7\x4e\x8c\x4f\xed\
-\xc8\x1d\x40\xf6\xd4\x85\x25\x27\x1b\x69\x86\x6c\xa4\xb9\x9f\xec\
-\x23\x23\xe3\x0e\x84\x3f\x2e\x7e\x8f\x0c\x8f\x39\xfa\xa5\xe5\xf8\
-\xc4\x59\x17\xc6\xfb\x47\x58\xd0\x2f\x5c\x16\xdf\x8e\xff\x52\x7c\
-\x8a\xff\x02\xb9\x1f\xe7\xcf\x97\x5f\x9b\x7a\xc9\xd2\x7f\x56\x4f\
-\x7f\xe0\x0f\x69\x45\x1c\x68\x0f\xfd\xe2\xd0\xea\x37\x2e\x7f\xdc\
-\xd3\xda\x27\xa7\x7c\x49\x72\x97\x2f\x0d\x2a\x69\x85\x28\x1d\x6b\
-\x0d\xf5\xf0\xa9\x6c\x24\x6a\x29\x35\x28\xae\x99\x73\x17\x2a\xca\
-\x0a\xd7\x3f\x3e\x7f\xee\x46\xb7\x9a\xc2\x82\x62\xbd\xb3\xfd\xa0\
-\xb7\xbe\xb9\xd9\x77\x43\xd4\xea\xda\x7a\xef\xc6\x9d\x4f\x9d\x1c\
-\xa7\x28\x23\x59\x31\x30\x20\x9b\x1f\x7f\xd2\xfb\xf5\xf7\xdf\xfb\
-\xee\x5e\x3e\x2f\x23\xec\xa3\xe2\xbf\xae\x71\x80\xec\xf1\xb9\x05\
-\x27\xbb\xdf\xab\x46\x4f\xbe\xfe\x46\x95\x0d\x19\x9a\xff\xef\x9e\
-\xfd\x35\x2b\x2b\x23\x1d\xdb\x8f\x9f\x94\xfc\xfb\xf0\x78\x17\x38\
-\x15\x6e\xe6\xc2\x62\x25\xbe\x5f\x24\xfd\xd6\x2b\x4e\x30\x68\x88\
-\xeb\xc5\xcb\xff\x55\xe3\xf3\xee\xef\x9e\x3d\xeb\x8d\x89\xa1\x4d\
-\xc5\x1d\xb2\x72\xe5\xaa\x2a\xef\xc4\xd8\xa4\x93\x81\xce\x48\xdc\
-\x1e\xac\xcd\x6d\x30\xa4\x48\xa3\x55\xbf\xc8\xdf\xf2\xe6\x15\x17\
-\x76\x78\x7a\xa6\x72\x1f\xd7\x34\xa8\x64\x7e\xe5\x62\x71\x4d\x83\
-\x4a\xba\x41\x94\xa1\x65\x1c\xfa\x19\x54\xfc\x0f\x63\x17\x2b\x2b\
-\xa7\xb0\x36\x36\xc4\xa0\x0e\x89\xc2\x2a\xaf\xa3\x4e\x5d\x58\x76\
-\x06\x49\x8b\x2f\xe5\x5e\xdb\xd8\x14\xe5\x3b\x91\x54\x80\x43\x62\
-\xa8\x21\xbb\x8e\xbc\xd0\x7d\x7b\xeb\x7e\x25\x9d\x31\x90\x0d\x85\
-\x5f\x47\x5e\xe8\xae\xc8\x96\x5f\xcd\x58\x61\x77\x74\x4a\xc1\x5f\
-\xbe\x92\x4d\x5d\xc6\xf2\x5f\xbd\x7a\x95\x0c\xf7\xe3\x4f\x3f\x97\
-\xfc\xe3\xfa\xfe\xc3\x2f\xb2\x99\x87\x28\xcc\xd4\xc2\x79\xb3\x73\
-\x65\xb9\xf1\xaa\xd4\xb1\x51\xa9\x17\xcc\x62\x04\xb2\x62\xac\x91\
-\xe2\xc4\xfc\xb9\xde\xf5\x3b\x77\x55\xe3\xf8\x3e\xde\x13\x3d\x59\
-\x6d\x3f\xfd\x8c\xbd\x77\x4f\x9f\x3b\xdf\x5b\xde\xc8\x36\xd1\xc5\
-\xf7\x39\xe5\x4b\x42\x68\x50\x49\x37\x88\xb2\xb2\x7a\xfa\x27\x27\
-\x30\xe5\x9b\x36\xa8\x77\xee\x6f\x57\x94\x15\xae\x57\x2e\x5d\xaa\
-\x18\xd4\xe1\xd9\x85\xbe\x23\xbb\x94\xfb\x8f\x97\x2f\x5d\x7a\x34\
-\x25\x88\x91\x15\x14\x6d\x13\x79\xa1\x7b\x4c\x14\x7e\xac\xbc\x43\
-\xd9\x30\x68\xa9\xf0\x29\x77\x49\xb6\x80\x43\x30\x34\xff\xa7\x64\
-\xe4\x85\xf5\xe9\x38\x0d\x30\xe6\x9a\x7f\xef\x1e\x92\x8e\x86\x16\
-\x0e\x23\x39\xd5\xff\xe8\x58\xc5\x98\xcc\x9c\xaf\x8e\x64\xeb\xba\
-\x37\xaf\x5c\xe9\x7d\x38\x3c\x9a\x34\x4e\x30\xa8\x5a\xf8\xf5\x8f\
-\xae\xb9\xce\x84\x26\x1f\x9b\xdf\xc2\x7c\xb5\x69\x3f\xdf\xfd\xf0\
-\x83\x7a\x9f\x06\x95\x84\xd0\xa0\x92\x6e\x10\x65\x15\x4e\xb3\x85\
-\xca\xa7\x9f\x41\x85\xc2\xc6\xa8\x2d\x56\x56\x60\xeb\xf3\x87\x3b\
-\x06\x35\xf7\x6f\x4d\x5b\x42\xa1\xc2\xff\xb5\x4f\x6e\xb9\xdd\xc3\
-\xe7\xc4\xe0\xc4\xf2\xbc\xdb\x6d\x76\x52\x0c\xdf\x9d\xfb\x0f\x54\
-\xff\x78\xcd\x67\x56\x46\x2a\x90\x7d\xeb\xde\x67\xbd\xc5\x95\xd5\
-\xd2\x7d\xef\x1f\x23\x3d\xb7\x3e\xa8\x28\x58\xcb\xd8\xe0\x55\x22\
-\xc8\x46\x9a\x21\x1b\xeb\xc6\xe1\x7d\xef\x1f\xf9\x2b\x64\x4b\xba\
-\xf1\x32\xb9\x26\x0f\x69\xcc\xd6\xac\xcb\x79\xc3\xc8\x51\xf3\xef\
-\xdd\x67\xe7\x17\xd4\x70\xda\x86\x1c\xa4\x05\x3b\xb7\x43\xff\xfd\
-\xe4\xd7\x71\x17\x9d\x1d\x63\xa4\x6a\xed\xb6\xb5\x8c\x29\xae\x63\
-\x83\xfa\xf7\x9f\x7f\xae\x84\x0f\xdd\xa8\xc3\xd4\xfd\xd0\xcd\x29\
-\x5f\x12\x42\x83\x4a\xba\x41\x94\x95\x35\xcd\x77\x58\x94\x59\xa6\
-\x24\xcb\x8a\x1a\xc0\x98\x9e\x37\x8c\x13\xae\x17\x2f\xad\x89\xc2\
-\x0a\xd6\x50\x45\x86\x36\x6d\xb9\xb6\xbe\xe1\xe2\x81\x92\x87\x01\
-\x46\x18\xac\xbd\x62\xad\x32\x94\xe7\xfd\xaf\x62\xe4\xab\x28\x42\
-\x6d\x1a\x10\xc6\xf4\x10\x5e\xf5\x39\x7a\xa2\x24\x7b\x6e\x49\xdf\
-\x9d\x9c\x19\xeb\x6a\x07\x42\x1b\xf9\xc2\x98\x6a\xb2\x4f\xca\x68\
-\xd1\xcb\x0b\xfd\x5f\xbb\x75\xdb\xc9\x46\x59\x22\xed\x38\x0b\x39\
-\xbc\x0f\x60\xec\xb5\x8d\x5c\x58\x5f\x8d\xe5\x85\xee\x6c\xda\xb7\
-\x1a\x4e\xab\x1f\x74\x00\xf0\xea\x93\xef\x94\x60\xf4\x6d\xd5\xff\
-\xca\xc5\x4b\xbd\xa3\x62\xd4\x8e\x48\xa7\x08\xf5\xf3\x9e\xc4\x81\
-\xce\x43\x28\x2f\xf4\x3f\xbd\x70\x4e\xed\xec\x00\x6b\xb7\x6d\xe8\
-\x46\x5b\x40\x67\x6a\x2b\xef\x5c\xb9\x0e\x59\x2e\x2f\x15\xfe\xf1\
-\x57\x5f\xf5\xc6\x66\xe6\x5c\x1a\x51\x1f\xb3\x8b\xcb\x6e\x0d\xdf\
-\xf2\xef\xe2\xa2\x41\x3d\xf0\x84\x5f\x68\xab\x18\xd4\xad\xed\x07\
-\x25\x37\x21\xb5\x10\x65\x65\x4d\xa3\xe1\x78\xb6\xb9\xe5\xd5\xde\
-\xfc\xea\x25\x37\xc2\xf2\xbb\x2f\x6f\xdc\xfd\xd4\x1c\x99\xe2\x1a\
-\x0a\x1e\xca\x37\x3c\xda\x0d\xbb\x31\x35\xff\x30\xbc\x4e\xc1\x63\
-\xc4\x24\xca\x13\x0a\x0e\xc0\xf8\x2c\xad\x5e\xac\xf8\x77\xc6\xc3\
-\x8f\x7c\xbd\xe2\x96\x5f\x6d\xda\x1a\x06\xc1\x19\x6a\xa4\x25\x92\
-\x7d\xf9\xca\x95\x8a\xff\x9d\x91\x5e\xa0\x64\x8d\xf2\x49\xc9\xd6\
-\x8c\x65\x28\x1b\x46\x55\x9b\xf6\xc5\x68\x2d\x34\x22\x3e\xfe\xb8\
-\xb3\xa0\x8d\xc4\x30\x9a\x8b\xc3\x69\xd3\xd4\xae\xa3\xe3\x37\x8b\
-\x89\x1f\x6b\x64\xbf\xb8\xbc\xd2\x7b\x4f\xd2\xf2\xce\x31\x74\x16\
-\x4e\xb9\x8e\x15\xf2\x86\x3c\xe0\x75\xa9\xd8\x3f\xae\x5d\xfa\x15\
-\xc3\x0e\xac\x35\x54\x5c\xff\xed\xef\xcf\x9d\xe1\x76\x06\x51\xda\
-\x82\xef\xa0\x14\xd3\xfb\x92\x4e\x6c\xbe\xd2\xc2\x6f\x89\xf1\xfd\
-\xcb\x87\x59\x67\x0c\x69\x73\xe9\x14\x90\xe6\x73\x4b\xcb\x6a\x7c\
-\x80\x53\xbe\xe4\xd1\xe3\x27\xbd\xc3\xd2\xa1\xc4\x75\xc5\xa0\x12\
-\xd2\x0a\x51\x56\xd6\x1a\x6a\x5b\xf7\xc4\xf4\x4c\x3e\x0a\xda\x19\
-\xed\xc1\xa0\x62\xf7\xe5\x2f\xbf\xfd\xe6\x36\x2c\x61\x34\x82\x6b\
-\xb7\x6e\xe8\x15\x5b\xee\x17\xc0\xe8\x6c\x3f\x7a\xac\xca\x7f\x1f\
-\x8a\xb3\x62\x3c\xae\x14\xf7\x43\xff\x6e\x03\x4e\x2e\xdf\x8d\xb4\
-\x05\xfc\x62\x83\xd3\xd2\xfa\x66\x6f\x71\x6d\xbd\x77\x7a\x62\xd2\
-\x81\x51\x71\x36\x22\x0f\x94\x6c\x2e\x3b\x8c\xdf\xcb\x4f\xc9\x3e\
-\x33\x79\xd6\xc9\xf6\xf2\x8f\x0d\x8f\xee\xc8\x86\x9f\xf1\x49\x35\
-\xbd\x18\x5d\x85\xe5\x86\x57\x57\xc2\xfb\x60\xe1\xc2\x62\xc9\x8d\
-\xeb\xd1\xb3\xd3\xb9\xfc\x2c\x1c\xca\x3b\xbc\x0f\x60\x88\xdd\x34\
-\xaa\xef\x34\x88\x5f\x6b\x83\x0f\x0c\x9c\x33\x52\x92\x96\xa2\x6e\
-\x04\xc8\x87\xe1\x3e\xbf\xac\x1b\xab\xf5\xab\xd7\x4b\xe9\xf7\x58\
-\x6b\xa8\x30\xa6\xde\x70\xa3\x2c\xb3\xce\x49\xde\x41\xc9\xe3\xc4\
-\x28\x5a\x5b\x96\x40\x7e\x30\x23\x90\xa5\x53\xc2\xe4\x79\x72\x69\
-\x94\xf0\x28\x0f\x4c\x45\x87\xf1\xf9\xf0\x34\xa8\x24\x84\x06\x95\
-\x74\x83\x28\x1f\x6b\x0d\xb5\x8d\xdb\x4d\x29\xba\x91\x5b\xa4\xac\
-\xa0\xe4\x44\xe9\x61\xe4\x01\x05\xe8\x46\x3e\xf2\xeb\x46\x34\x4e\
-\x19\x66\xca\xd3\x03\xb7\xb5\xe1\xc9\x8d\x7e\x43\xa5\x2d\xbf\x78\
-\x4d\x45\x4b\x8f\x77\x7f\xf7\xc3\x33\x27\xef\xd4\x64\xb6\x96\xe9\
-\x14\xae\xc8\x80\xd2\xcd\x46\x36\x50\xe6\x81\xf1\x08\xd2\x8d\xd7\
-\x6b\x62\x79\xa1\x1b\x23\x69\xc8\x9e\x5f\x5d\xab\x2d\x1b\xd7\xe9\
-\x91\x6c\xe6\x0f\xeb\xb7\xe1\x7d\x8c\x02\x31\xd5\xec\xdd\x3e\x7c\
-\xf6\xde\xef\x4e\x99\xdf\xb8\x7b\xaf\x74\x1f\xd7\xdf\x7e\xff\x7d\
-\xa9\xa3\x33\x3c\x3b\x5f\xba\xef\xfd\xa3\xb3\x83\x3a\x74\xe9\xc8\
-\xe5\x85\x20\x6d\x78\x2d\x25\x96\x0f\xe6\xce\x5f\xc8\xd3\x5f\x0e\
-\x67\xad\xa1\x8e\x48\xc7\x23\x9b\xa1\x50\xca\x3e\x47\xeb\x1c\xe0\
-\x1a\xc6\x38\x4b\x27\x3a\x12\x5a\x3a\x87\xdd\x54\x70\x18\x9f\x0f\
-\xcf\x29\x5f\x12\x42\x83\x4a\xba\x41\x14\x98\xb5\x86\xd6\xc4\x8d\
-\xd1\x02\x8c\x29\x8c\x9d\x37\x92\xb1\x72\x2c\x46\x0e\x72\xef\xe8\
-\xe8\x84\x1b\xc9\x0d\x9f\x9d\x71\xc6\x08\xa3\x51\xbc\x73\x8a\xa9\
-\x64\x18\x1a\x70\xf5\xaa\x3e\x72\x8e\x37\xab\x80\xc9\xdc\xf0\x68\
-\xfe\x35\xb7\x7b\x8f\x52\x94\xad\x33\xe6\x92\x26\x07\xe4\x45\x69\
-\xf6\xb2\xfb\xc9\x0b\xdd\x90\xbd\x71\xfd\xe3\xb4\x6c\xb9\x36\xa7\
-\x7d\x51\x7e\x12\x06\x7e\x30\xd5\x19\xde\x3f\xb7\xb8\xe8\x8c\x48\
-\x3c\xf2\x2a\xa6\xc2\xf3\x72\xc7\xba\x6b\x78\x1f\x9c\x1e\xc7\x68\
-\x0e\xb2\x33\x3f\x98\xc2\x0f\xef\x7b\xff\x5b\x9f\x3f\xcc\x46\x8c\
-\x4a\x1d\x7a\x8e\xc9\x08\x3b\x96\x8f\x6b\x6b\x1d\xd8\x5a\x03\xcd\
-\x46\x8a\x3b\xf9\x0d\xc3\x84\x61\xc3\xf4\xf9\xf0\x68\x6f\x61\x9e\
-\x2b\x61\xe5\x3f\xbe\x87\x4a\xea\x40\x83\x4a\xba\x41\x94\x8e\xb5\
-\x86\x5a\xc7\x0d\x45\xfe\xb7\xe7\xf9\x1a\x18\xd6\xbf\x72\x63\xea\
-\x47\x58\x31\x98\xc2\xdc\x7e\x64\xbf\x94\x5f\xc7\xad\x19\x54\x8c\
-\x46\x26\xe7\x16\x6a\x85\x8f\xdd\x78\x0f\xd2\x4d\x33\x1a\x69\xf6\
-\xb2\xeb\xca\x0b\xdd\x29\xd9\x96\xb2\x3f\x25\xa3\x36\x18\xb3\xc3\
-\xc3\xd5\x0d\x43\xd9\x9a\xf3\x50\x6f\x4e\x99\xf6\xc5\xe6\x21\x37\
-\x12\x96\xb8\xe2\x0d\x60\x30\xd4\x98\x5a\x2d\x8c\x88\xf8\xc1\x09\
-\x48\x61\x78\xef\xff\xd6\xa7\xf7\x72\xc3\x6b\x1b\x1b\xc4\xa1\xcd\
-\x6c\xfc\xf1\xe2\x65\x66\xe4\x72\xa3\xed\xfd\x0f\x72\x62\x11\x4e\
-\x40\xf2\xfe\xc3\xf0\xd8\x20\xd5\x2f\x9d\xe6\xc8\x98\x53\xbe\x24\
-\xa0\x62\x50\xb9\xcb\x97\xb4\x22\x57\x8c\xb1\xb2\x02\x8f\xbe\xfc\
-\xaa\xf7\xf8\xab\xa7\x6e\xe7\x25\xc0\x35\xc0\xc8\xe0\xec\xdc\x7c\
-\x6f\x56\x8c\x23\x8c\x5b\xb6\x91\xa4\xbc\x89\x44\x8b\x0b\xd3\x90\
-\x83\x18\x6f\xef\xae\x4c\xf9\x02\xb9\x86\x12\x9f\x58\x38\xef\xde\
-\x8b\x6c\x22\x0f\xd7\x38\x42\x31\x5b\x87\x53\xd2\x1e\xc8\xb6\xd6\
-\xe4\x52\x6e\x4b\x36\x46\x79\xaf\x5e\x55\xcb\xc3\xaf\x87\x2e\x2b\
-\xc6\xc0\x9d\xaf\x2c\xf9\x1f\x16\x3f\xde\xbf\xbf\xef\x5f\xbb\xc1\
-\xfa\x6c\x28\x0f\xd7\x8b\x2b\x2b\xd9\xd4\x6a\x50\x6e\x30\x54\x61\
-\x78\xef\xdf\x19\x2a\x65\x94\x59\x42\x64\x68\x33\x1b\x30\xa8\x30\
-\xf8\xf1\xa8\xd1\x5a\x43\xad\x63\x50\x61\xf8\xc3\xf4\xf9\xf0\x6e\
-\x27\x70\x9f\x74\xa6\x47\xc6\x34\xa8\x07\x99\xe4\xa6\xa4\xf0\x18\
-\x25\x42\x6a\x23\x4a\xcf\x5a\x43\xc5\x86\x8f\xe2\xb5\x10\x47\xf6\
-\x6a\x48\x01\x0c\x5b\xb0\x3e\xe8\x0c\x46\xa0\x44\x43\xb4\x35\x3d\
-\xef\xc6\xe8\x09\xeb\x7b\x18\x19\x41\xd1\xe1\xe0\x81\x59\x31\xe0\
-\xd6\x7b\x9d\xaa\x41\x05\xe2\x86\xe1\x43\x9a\x96\xd6\x37\x9c\xf1\
-\x87\xec\x38\xbc\xe5\xbe\xfd\xd9\x96\x33\x7c\x6a\x1e\x02\xd9\x67\
-\x26\xa7\x9c\x6c\x8c\xce\x53\xf2\x42\xb7\x26\x1b\xe5\x85\xf5\xd9\
-\xd8\xbf\x9f\x36\xc5\x34\xb8\x0f\x8f\x7b\xbf\xfc\xfa\x9b\xab\x0f\
-\x18\xdb\x63\x52\x37\xa1\x7c\x5c\xfb\xf3\x93\x27\xe7\xab\x23\xf5\
-\xe2\x35\x94\x60\xe4\x68\x19\x9b\x26\x06\x35\x0e\xef\xd6\x5f\x15\
-\x83\x3a\xc8\x48\xd1\x32\xc6\x75\x0c\xea\x20\x23\x63\xf2\x76\x93\
-\x3c\xcb\x97\x90\x56\xe4\x8a\x31\x56\x56\x00\xef\x87\x3a\xa3\x89\
-\xd1\x95\x28\x62\x67\x34\x63\xa0\x34\x03\xc5\xa9\x81\x77\x56\xb5\
-\xdd\xa4\x30\x76\xe3\xd3\x33\x6e\xaa\x32\x1b\xe5\x66\x9b\x94\xa0\
-\xe8\x80\x36\xad\x09\xb4\x29\xdf\x02\xf9\x0f\xe9\x42\x9a\x61\xfc\
-\x60\xf8\x67\x97\x96\x9d\xf2\xb5\x0e\x75\xf0\xee\xd2\xfa\x65\x2c\
-\xd7\x90\x3d\x34\x36\xee\x64\x5b\xc6\xdf\xbb\xdd\x1a\x67\x2c\x5b\
-\xe4\x61\x0d\x39\xf6\x0f\xbf\x30\x4a\xf1\xee\x62\xcc\x0a\x38\xa3\
-\xe8\xea\x63\x38\x3b\xe7\x38\xb8\x8f\x6b\xec\x80\xc6\x06\xac\x50\
-\x1e\xae\xb3\x91\x6d\xd9\x80\x58\xc6\x66\x0b\x87\x72\xf4\x31\x54\
-\xd6\x86\x26\x9c\x90\x65\x19\x54\xcd\x7f\x1d\x83\x6a\x19\x63\x6c\
-\xe0\xea\x97\xce\x41\x46\xc6\xe4\xed\x86\x06\x95\x74\x8f\x28\x3d\
-\x6b\x1a\xb6\x74\xb0\x43\xa0\x1c\x9b\x82\x83\xcf\x35\xf9\xc5\x8e\
-\x60\x31\x4c\xd9\x74\x71\xd9\x68\x63\xd3\x4e\xe8\xdf\x87\xef\x67\
-\x50\x01\xd2\x9c\xc9\xc9\xd6\x15\x21\xdf\x19\x6b\x31\x48\xd7\x3e\
-\xb9\xad\xa6\x07\xb8\x57\x67\x22\x63\xd0\x54\x76\x9c\x5e\xef\x76\
-\xaf\xce\x44\xb2\x31\xed\xab\xf9\xc7\xab\x36\x71\xf8\xa1\x11\x1c\
-\x19\x98\x19\x10\xa4\x61\xe6\x7c\xf5\xc3\x04\x30\xee\xf1\xc8\x39\
-\x1c\xd9\xba\xba\xcc\xe3\xc6\x1a\x6d\x1c\x1e\xd7\xce\xf8\x4b\x9d\
-\xb8\xd1\x6c\xee\x37\x26\x69\x8c\xfd\x48\xb8\x86\xff\x3a\x86\xcd\
-\xde\x00\xb5\x92\xa7\xd3\x0e\x6b\x4d\x6b\x73\xca\x97\xd0\xa0\x92\
-\xee\x11\x05\x6b\xad\xa1\xf6\x3d\xcb\xb7\x26\xe3\x32\xb2\xd2\xe4\
-\x67\x87\x0c\xf8\x77\x08\x33\x63\x55\x84\x93\x6b\xeb\x55\x98\x78\
-\xca\x77\x68\xf2\xac\x3b\x15\xe8\xc9\x37\xdf\x3a\x70\x0d\xbc\xe1\
-\x81\xbf\xc2\x08\x4a\x5c\xc8\x13\x46\xbf\x71\x7a\x70\xed\xde\x03\
-\x0d\xf2\x3c\x25\x6e\x2f\x2f\x94\xdf\x4f\x76\x98\x5e\x2f\x3f\x96\
-\x0d\x10\x16\xaf\xdd\xc4\xfe\x37\x2f\x97\xdf\xab\xc5\xe8\x79\xe7\
-\x15\x91\x2c\xde\x63\x63\x55\x63\x8c\x35\xcc\xd0\x0d\xc2\x91\x6d\
-\x1c\xb7\xf6\xea\x0e\xae\xb3\x4e\x8b\xd1\xb1\x10\xe2\xdd\xc7\x3e\
-\xfc\xe2\xa5\xf5\xc2\xe8\x87\xfe\x07\x19\x29\x22\x9d\xd6\xb2\x84\
-\xdf\xc0\xa5\xa5\x13\x33\x23\xd6\x87\x18\x68\x50\x49\xd2\xa0\x86\
-\xc7\x28\x11\x52\x9b\x84\xb2\xea\xcc\xa0\x1a\xbb\x49\x4b\x6b\x60\
-\x51\x1c\xa9\x35\xd7\x8a\x41\x9d\x38\x5b\xba\xef\xfd\x9f\x9e\x9a\
-\x11\xd9\x91\xb2\x95\x6b\xec\xda\xc5\xee\xdb\xd8\x3f\xf0\x5f\xd8\
-\x71\x46\x2b\x97\x1d\xde\xf7\xfe\x53\xb2\xb5\x35\x4c\x5c\xfb\xf2\
-\xf4\xb2\x7d\x98\xb1\xd9\x39\xd5\x7f\xe8\xde\x79\x87\x74\x27\x4e\
-\x94\x9b\x75\xe8\x44\xe8\xf6\x53\xf7\x15\xe3\x21\x72\x30\xca\xd5\
-\xc2\xe3\xe8\x3e\xed\xc0\x0d\x80\x51\x7c\xec\x1f\xd7\x18\xd9\xba\
-\xba\x19\x92\x70\x51\x98\x41\xd6\x50\x21\xcb\xea\x5c\xad\x4a\xa7\
-\x4c\x4b\x27\x8c\xa9\xf6\xea\x90\x77\x73\xca\x97\x24\x0d\xea\x93\
-\x2f\xbf\x2c\xb9\x09\xa9\x85\x28\x21\x73\x0d\xb5\xdf\xe7\xdb\x6a\
-\x62\x29\x53\x8c\xc2\xfc\x27\xba\x9c\x02\x16\xf0\xf1\x69\x8c\x02\
-\x35\xff\xde\x1d\x4f\xf9\xe2\x43\xd5\x9a\x7f\x28\xdb\xe2\x2b\x28\
-\xb9\x7c\x70\x4c\xfc\xe3\xb3\x66\xb1\xff\x6c\x14\x98\x4d\x8d\x7a\
-\xd9\x48\x8f\xbf\x1f\xfa\xff\xf1\xf9\x4f\xaa\x6c\x4c\xa3\x6a\x9f\
-\x4c\x73\xeb\xa2\x91\x6c\x8f\x36\xd2\x8c\xdd\x3b\x47\x06\x8a\x41\
-\xf5\x61\x45\x8e\x35\x2d\xee\xdd\xd9\x21\x0d\xd5\xe9\x5e\x0f\x0e\
-\xea\xc7\x28\x55\x0b\x8f\x13\xad\xf0\xae\xee\x19\x01\xd3\xae\x78\
-\x6f\x75\x5e\x46\xd9\x56\x7b\x99\x90\x51\x28\xd6\x4f\xb5\x11\xe3\
-\x20\x6b\xa8\x2e\x9f\xab\xd9\xd1\x83\x71\x78\x80\xba\xc0\xa6\x4c\
-\xe4\x05\x87\x40\x60\x9a\xd7\x3a\x01\xca\xbb\x69\x50\x09\xa7\x7c\
-\x49\xf7\x88\xb2\x32\xd7\x50\x3b\x32\xa8\x30\x60\xd6\x21\x0d\xb8\
-\xc6\x26\x1a\xec\x76\xc5\xa1\x0e\x96\xb2\x0e\xdd\x95\x35\x54\xf9\
-\xd5\x76\xcb\x7a\x37\xe4\xe3\x43\xe8\x18\x8d\xc1\x58\x5b\xd3\x9c\
-\x98\x1a\xad\x18\x04\xf9\xc5\xe8\x48\xf3\x0f\xdc\x09\x4c\x5b\xdb\
-\x4e\x36\xa6\x82\x2d\xe3\xa4\xca\xce\x81\xa1\xeb\x37\xd2\xcc\x46\
-\x99\x91\x01\x90\x70\xcb\xf9\xd4\x70\xec\xdf\xbb\xb3\x77\x4a\xab\
-\xd3\xbd\x1e\xc4\x0d\x63\x64\x85\xaf\xeb\xc6\x66\x24\x37\x3a\x35\
-\x8c\xd4\x20\x6b\xa8\x00\xf7\xf1\x4d\xdc\x38\x7c\x5b\x37\xa7\x7c\
-\x09\x0d\x2a\xe9\x1e\x51\xa8\xbb\xbd\x86\x8a\xf0\xd6\x34\xa8\xe5\
-\xc6\x68\x11\x07\x46\x68\xf7\x2b\xaf\xcd\xc8\x2f\x46\x27\xf8\xd8\
-\xb5\xe6\xbf\x8e\x1b\x23\x39\x18\x6a\xcd\x68\x41\xf6\x20\xca\x1c\
-\xb2\x91\x66\x53\x81\x4b\x1c\x53\xf3\xe7\x92\xe1\xad\x51\xa6\xb5\
-\x61\xc7\xbb\xf1\xae\xb0\x3a\xdd\x1b\x80\x7b\x93\x62\xf0\xb5\xf0\
-\x75\xdc\x2e\x7f\x62\xb4\xdd\x08\xda\x30\xdc\x03\xef\xb6\x15\x99\
-\x67\x72\x19\x71\xfc\x96\x1b\xb3\x02\x78\xbd\x49\xbb\x4f\x83\x4a\
-\x68\x50\x49\xf7\x88\xa2\xb2\xd7\x50\xa7\xba\x31\xa8\x02\x14\xd7\
-\xfd\x2f\x1e\xa9\xca\x2d\x76\xc3\x98\x62\x8a\x73\x5d\x94\xad\x76\
-\xbf\x62\x50\x21\x5f\xae\x8f\x8e\x8e\xbb\x69\xca\xd8\x7f\x3f\x37\
-\x46\x57\x78\x75\xc7\xed\x36\x36\x46\x90\x90\x8d\xc3\xfc\xeb\xc8\
-\x0b\xdd\x6e\xe4\x96\x1b\x1b\x4d\xb6\x27\x35\xed\x6b\x6d\x2a\x02\
-\x7e\x74\x1b\xfa\xf7\xe1\xb3\xdd\xbd\xc1\x46\xa6\x20\x5c\x09\xb9\
-\x87\xa9\x64\x7c\x59\xa8\xc9\xa1\x18\x30\x58\xee\xb8\x49\x97\xbf\
-\x60\x73\x99\x12\x87\x35\xed\x3f\xda\xc0\xb0\xc1\xcf\xf1\xd1\x09\
-\xd7\x3e\x7c\xf8\x58\x9e\x77\x23\x6d\x68\x43\xc7\xce\x8c\xa8\xf7\
-\xd1\xb6\x68\x50\x0f\x36\x34\xa8\xa4\x7b\x44\x01\x62\x9a\x12\x0a\
-\x08\x8a\x0a\xe0\x1a\xf8\xa3\xec\x2c\x23\xd0\x08\x28\x6d\x51\xb8\
-\x67\x44\x81\x62\xcd\x4b\x53\x86\x18\xe9\x60\x1d\x2e\x7b\x2f\x75\
-\xc8\xbd\x3b\x19\xa6\xc7\xa7\xef\x43\x51\x92\xaa\xe1\x13\xe5\x08\
-\xe3\x81\xaf\xc8\x58\x23\x13\xef\x86\x3c\xbc\x76\x91\x7d\x36\x2c\
-\x3b\x32\x31\x65\x10\xbc\x6c\x7c\x45\x06\xb2\x63\x79\xa1\x1b\xb2\
-\xb1\x89\xa8\xae\x6c\x80\x7b\x6b\x9b\x9b\x6a\x7e\xb1\x3b\x38\x35\
-\xba\xc5\x59\xc8\xa1\x7f\x1f\xde\x9f\x75\x9b\x32\xe4\x05\x72\x1f\
-\x46\x15\x53\xb6\xf8\x76\x6b\xea\x7b\xa2\x30\xd4\x98\x4a\x3e\x7a\
-\x66\xe7\xb8\xc9\x7e\xf9\xc3\xab\x53\x98\xf6\x8f\xf3\x97\x9d\x0a\
-\x25\x79\x93\xb2\xd2\xc2\x95\x70\x69\x1c\xee\x1d\x15\x25\x88\x2f\
-\xfd\x68\xe9\x83\x4c\xa4\x0d\x6d\x07\x69\x7b\x5f\xd2\xf5\xaf\x57\
-\x7f\x56\xca\x67\x5d\xd2\x52\x3b\x5e\xf2\x56\xc2\x4d\x49\x64\x57\
-\x80\x92\x82\xc2\x86\xf2\x85\x12\xca\xc0\x21\x0b\x50\xe2\x35\x94\
-\x71\x4d\xa0\x70\x9d\xd2\x76\x87\x22\x0c\xf5\x86\x64\xd4\x07\x63\
-\x81\x5d\xc0\xee\x23\xe3\x50\xce\x18\xed\x48\xbc\x30\xe4\x30\xc0\
-\x30\x62\x18\xdd\x21\x3d\xe1\x7d\xd5\xb8\xf8\x38\x10\x2e\xcf\x0f\
-\x3e\x0f\x87\x38\xfc\x27\xda\x70\x02\x13\xe2\xc3\xc8\xcd\xc9\x83\
-\x31\xc0\x08\x4e\xd2\x95\x32\x08\x20\x96\x0d\xc3\x0f\xd9\xfe\x13\
-\x6d\x38\xe1\xa9\xad\x6c\x6f\x2c\xf4\x7a\xa8\x67\xec\xcb\xe1\xb2\
-\xb2\xca\xe2\xaf\x69\x34\xf2\x34\x20\x2e\x9f\x0e\x5f\x7e\xc8\x1b\
-\x46\x7b\x98\x16\xf7\xb2\x77\xf2\x97\xbf\x42\xa4\xc9\xcc\xc1\xfd\
-\x4c\xee\x4e\x5d\xd6\xc9\x5b\x85\x22\x8d\xd9\xce\x65\xbc\x36\x83\
-\xf2\x47\x5b\xda\x49\x9f\x97\x9b\x95\xbd\xf7\x3b\x50\xbc\xe4\xad\
-\x03\x87\x93\xf8\xeb\x8a\x41\xe5\x59\xbe\xa4\x35\xb9\x92\x72\xc6\
-\x22\x07\xd7\x75\x14\x65\x63\x10\x97\x28\xbd\x2c\xae\x6c\xd3\x53\
-\x41\x6e\x44\x8b\x78\xbd\x5f\x18\xa4\x28\x5d\xb8\xa7\xca\x07\x08\
-\x07\x19\x4e\x99\x0a\x45\x1c\xf9\xa7\xd4\x8a\xf8\xca\x71\xa9\xb2\
-\x62\x5e\x87\x6c\xc8\xcd\x29\x95\x87\x16\x06\xc4\x69\x8a\xc2\xd6\
-\x8e\xdf\x53\x4a\x87\xcf\x5f\x80\x52\x4f\xaa\x9c\x08\xf8\xad\xd6\
-\xa5\xd0\x34\x7d\x42\x26\x2b\x33\xfe\xd5\xf4\x95\xd3\xe6\xfd\x76\
-\x11\x2f\x79\x3b\xa1\x41\x25\xdd\x93\x2b\xa0\x02\xcd\x4f\x57\xe4\
-\x71\x38\x65\x97\x93\x8c\xb7\xdf\x7d\x8b\x3c\x4c\x18\x4f\xdf\xb8\
-\xea\x92\xcb\xe8\x5c\x76\x28\xa3\xa9\x9c\x41\xc2\xc6\xe4\x32\x76\
-\x35\x7f\xda\xfd\x26\x88\x8c\xda\x69\xeb\x77\x9f\x1c\x58\x68\x50\
-\x09\x21\x84\x90\x0e\xa0\x41\x25\x84\x10\x42\x5a\x82\x93\xda\xfc\
-\x35\x0d\x2a\x21\x84\x10\xd2\x12\x7c\x52\x11\xef\x98\xe3\x9a\x06\
-\x95\x10\x42\x08\xe9\x00\x1a\x54\x42\x08\x21\xa4\x03\x68\x50\x09\
-\x21\x84\x90\x0e\xa0\x41\x25\x84\x10\x42\x5a\x72\x74\x6c\xb2\xb8\
-\xa6\x41\x25\x84\x10\x42\x5a\x92\x3c\x7a\x30\x3c\x46\x89\x10\x42\
-\x08\x21\x36\xd3\x8b\xcb\xc5\x75\xc5\xa0\x12\x42\x08\x21\xa4\x39\
-\x34\xa8\x84\x10\x42\x48\x07\xd0\xa0\x12\x42\x08\x21\x1d\x50\x31\
-\xa8\xe1\x31\x4a\x84\x10\x42\x08\xb1\x59\xbd\x7c\xa5\xb8\xae\x18\
-\xd4\xbb\x9f\x6d\x95\xdc\x84\x10\x42\x08\xd1\x49\xee\xf2\x25\x84\
-\x10\x42\x48\x3d\x68\x50\x09\x21\x84\x90\x0e\xa0\x41\x25\x84\x10\
-\x42\x3a\x20\x69\x50\xc3\x63\x94\x08\x21\x84\x10\x62\x93\x34\xa8\
-\x3c\x7a\x90\x10\x42\x08\xa9\x47\xd2\xa0\x86\xc7\x28\x11\x42\x08\
-\x21\xc4\x86\x6b\xa8\x84\x10\x42\x48\x07\xd0\xa0\x12\x42\x08\x21\
-\x1d\x40\x83\x4a\x08\x21\x84\x74\x40\xd2\xa0\x86\xc7\x28\x11\x42\
-\x08\x21\xc4\x66\xf3\xda\x8d\xe2\xba\x62\x50\xb9\xcb\x97\x10\x42\
-\x08\x69\x0e\x0d\x2a\x21\x84\x10\xd2\x01\x34\xa8\x84\x10\x42\x48\
-\x07\xd0\xa0\x12\x42\x08\x21\x2d\x19\x5f\x38\x5f\x5c\xd3\xa0\x12\
-\x42\x08\x21\x2d\x49\xee\xf2\xa5\x41\x25\x84\x10\x42\xea\x31\x34\
-\x39\x5d\x5c\xab\x06\x35\x24\xdc\x12\x0c\x30\xbc\xc5\xff\xa1\x10\
-\x70\xf3\xce\x5d\x47\xf8\x1f\xfc\xc4\xf2\x52\x84\x61\xc1\xc3\x47\
-\x8f\x2a\xaf\xf1\xe0\x68\x44\xf8\x8d\x0f\xf1\xc7\x87\xd1\x63\x79\
-\x16\xf3\x2b\x17\x4b\x61\x11\xc7\x93\x2f\xbf\x2c\xfd\x07\xf0\x5f\
-\x1c\x3f\xc2\x6a\x32\x35\xe2\x8f\xb5\x23\xcd\xf8\x3f\x3e\xde\x11\
-\x71\x20\xaf\xe1\x7f\x20\x96\x97\xa2\x49\x7d\x84\x53\x14\x00\x75\
-\x1c\xcb\xb3\x68\x52\x1f\xd7\x3e\xb9\x55\xfa\x6f\x78\x76\xbe\x22\
-\xcf\xa2\x69\x7d\x84\xff\x81\xad\xed\x07\x15\x99\x16\x4d\xea\x63\
-\x71\x7d\xa3\xf4\x1f\xdc\xb1\x3c\x8b\x26\xf5\x81\xf4\x87\xff\x81\
-\x58\x5e\x8a\x26\xf5\x81\xdf\xf0\x7f\xf8\x8b\xe5\x59\x34\xa9\x0f\
-\x4b\x97\xd4\xa1\x69\x7d\x84\xff\x01\x84\x0f\xe5\xa5\x68\x52\x1f\
-\x9a\x2e\x89\xe5\x59\x34\xa9\x0f\x4b\x97\xd4\x25\x0c\x0b\x52\xf5\
-\xa1\xe9\x92\x58\x9e\x85\x55\x1f\x87\x83\xff\x40\x4a\xb7\xd7\x41\
-\xab\x8f\xa7\x5f\xdb\xba\x3d\x8e\xff\x91\xfc\xa7\xc9\xd5\x18\xad\
-\x51\x1f\x9e\x8a\x41\x25\x84\x10\x42\x48\x53\x46\x7b\xff\x07\xb1\
-\xa8\x05\x06\x4d\x3b\x34\xe0\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\xa3\x70\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x4c\x00\x00\x01\x23\x08\x06\x00\x00\x00\x59\xcc\x38\xd0\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\xa3\x05\x49\x44\x41\x54\x78\x5e\xed\x9d\x07\x78\
-\x1d\xc5\xd9\x85\xdd\x7b\x97\x6c\xd9\xea\xbd\xbb\xf7\x22\xcb\xaa\
-\xb7\xa9\xb8\x62\x7a\xef\x3d\x14\x77\x5b\x56\x77\xa3\xb8\xdb\x6a\
-\x6e\xb4\x40\x42\x20\x24\x94\x00\x09\x09\x60\x4a\x48\x08\x84\x50\
-\x8c\x7b\x51\xb1\x64\x15\x77\x20\xf0\xfd\xe7\xcc\xee\x4a\x57\xb2\
-\x4c\x4c\x42\xf2\x43\x32\xe7\x79\xce\x73\xab\xf6\xee\xdd\xab\x7d\
-\xf7\x7c\x33\xb3\xb3\x6d\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xfe\x0b\x24\xd2\
-\xd6\x55\x92\x1f\x6b\x2f\xca\x1b\xd7\xd2\xe9\x2d\x3c\x6d\x4b\x73\
-\x4f\xdd\x96\x3d\x3e\xa3\x24\x6b\x54\xda\xe6\x2c\x4f\x73\x69\x5a\
-\x5a\x5a\x5a\x3f\x6e\xcd\x7c\xe0\x81\xae\x19\x25\x85\xc3\xd3\xb6\
-\x15\x8c\x4f\xdf\xb2\x6c\x5c\x3a\x60\x47\x20\xda\x4a\x0a\xc6\xbb\
-\x4a\x72\x2f\x73\x96\xe6\x3e\xee\x28\xcd\xdd\xd9\xe8\xa2\x9c\x66\
-\x76\xb6\x70\x7a\x69\xde\xce\xf4\xe2\xdc\x9d\xe9\x45\x39\x6f\xbb\
-\x8a\xb3\x5f\x4a\x2b\xc9\x5d\x94\x59\x92\x9d\xe4\x2a\xce\x1b\xd3\
-\x12\xb2\x7c\xce\xb6\xa5\x30\xd0\x5c\x15\x2d\x2d\x2d\xad\x1f\x8e\
-\x32\xb7\x3c\xd4\xc7\x55\x5c\x38\xd2\x56\x92\x3d\xde\xb9\x29\x7b\
-\xac\xab\x28\x3f\xce\x5e\x92\x77\xab\xb3\x34\xff\xd9\xf4\xb2\xc2\
-\xb7\x61\x37\x30\xe6\xee\x4c\x2b\xce\xfd\x6b\x46\x69\xa1\x64\x6e\
-\x5d\xd6\xcc\xe9\x65\xcb\x24\x63\x0b\xef\xe3\xb5\x6d\x85\x32\x75\
-\x9b\xf1\xfc\xd4\x2d\x85\x32\x4d\xdd\xc2\x65\x05\xb8\x5f\x28\x19\
-\x25\x39\x15\xe9\x45\xd9\xef\xa4\x95\xe4\xbc\xe9\x02\x48\x2d\x67\
-\x14\xe7\xbe\x85\xdb\xd7\x1c\x25\xf9\xab\x01\xde\xb4\x54\xc0\xd3\
-\x59\x9a\x3d\xd6\x51\x54\x10\x6e\xae\xae\x96\x96\x96\xd6\x7f\x4e\
-\xe9\xc5\xf9\x5e\xf6\xcd\x05\xa3\x9d\x9b\x56\x8e\x75\x96\x2c\x4f\
-\x70\x96\xe4\xcd\x75\x95\xe4\xbd\x60\x2f\xcb\x7d\xdb\x0e\x28\xda\
-\x8b\x72\xdf\x76\x94\x14\xee\xce\xd8\xf1\xa0\x64\x6c\x7f\x40\xd2\
-\x09\x43\x40\x2f\xad\x2c\x5f\x5c\xa5\x79\x70\xae\x20\x65\xaa\x5b\
-\x67\x71\x4e\xa3\x1d\x45\xd9\xca\x2e\xdc\x47\x8a\x94\x34\x65\xde\
-\xc7\xeb\x78\xbf\x32\xee\x03\x92\xca\x2e\xd3\xe9\x65\x79\x0a\xaa\
-\x53\xb7\x2c\x97\xa9\x5b\xe9\x15\x92\x56\x94\x7f\xd2\x55\x9c\xf5\
-\x1e\x01\xed\xd8\x92\xfb\x07\x7c\x56\xb1\x6b\x6b\xde\x34\xc2\x93\
-\x69\x37\x63\x47\x7e\xb4\xf9\x75\xb4\xb4\xb4\xb4\xbe\x5f\x01\x36\
-\x3e\x4c\x91\xf6\x4d\x05\xa9\xae\xb2\x65\xd9\x8e\xb2\x65\x2f\x3b\
-\x4a\x97\xbf\x85\x24\xf7\x8e\xb3\x38\xff\x70\xda\x36\x40\x6a\xdb\
-\x72\x71\x6c\x2d\x10\xfb\x96\x7c\xb1\x03\x62\xf6\xd2\x7c\x71\x94\
-\x16\x08\x92\x26\xc0\x46\x9b\xa0\x74\xb3\x3b\x30\x2d\x1b\xc0\x04\
-\x14\x4d\x2b\x60\x16\xe5\x02\xa6\xf8\x1b\x3e\x87\xbf\x4b\x6f\xcd\
-\xc5\x79\x78\xbf\xf1\x1e\xa4\x4c\x00\xb9\x40\xd2\xb7\x23\xb5\xee\
-\x58\x2e\x69\x5b\x0a\xbf\xc0\x73\x7f\x76\x94\x21\x89\x96\xe6\xbd\
-\xe9\xda\x92\xb7\x23\xad\x2c\x77\xb6\x1d\xf0\x74\x94\x15\x0e\xce\
-\xca\xca\x6a\x67\x7e\x55\x2d\x2d\x2d\xad\xef\x2e\xdb\x96\x87\x02\
-\x33\xb6\x2d\x1f\x95\x56\xba\xcc\x91\x56\xb6\x7c\xb9\xb3\x6c\xd9\
-\x2b\x00\xe4\x7b\xe9\x45\x85\xd5\xd3\xb6\xac\x42\xb9\xbc\x42\xa5\
-\xc7\x34\x94\xc9\x48\x98\x80\x1d\x01\x68\xd8\x01\xa3\x2c\x07\x30\
-\xf3\x4d\x60\xe2\x75\x24\x4a\x07\xc0\xe6\xe0\xf3\xb0\x9d\xef\xdb\
-\x0c\xb8\x6d\x06\xdc\xe8\x22\x02\x33\x1b\x70\x34\xbd\x99\xb7\x58\
-\x0e\x61\xc9\xd7\x37\xe1\xbd\x9b\x90\x3a\xf1\x3e\x05\x52\xbc\x27\
-\x8d\xc6\xdf\x58\x89\xd4\x55\xbc\x54\xdd\xb7\xe0\x4b\xb8\x12\xcc\
-\x0e\xa6\x5a\x40\x3c\x03\xa5\x7e\x26\x20\x9a\x56\x9a\xff\x0d\xc0\
-\xf9\x81\x01\xd0\xfc\x27\x9c\x5b\xf3\x2f\x77\x96\xe5\x4e\x70\x95\
-\x16\x0e\x1d\xb9\x79\x73\x47\x73\x13\x68\x69\x69\x69\x9d\x5f\xae\
-\xb2\x9c\x30\x00\x70\x74\x7a\xe9\xf2\x34\xd7\xd6\xe5\xab\x1d\x65\
-\xf9\xbf\x73\x94\xe6\xbd\x87\xc7\x75\xd3\xb6\xa1\xbc\xde\xb2\x02\
-\xc9\x6d\x19\x20\x54\x08\x5b\xc9\x11\x50\x44\xba\x6b\x69\x0b\x98\
-\x84\xa3\x13\xa5\xb3\x5d\x99\xc9\xb3\x40\x90\xea\x60\xa6\x4f\xc2\
-\x0b\xe5\x7a\x49\x81\xa4\x6e\xc8\x92\xa4\x75\x0b\x24\x11\x9e\xb2\
-\x66\xbe\xba\x4d\x5c\xbb\x50\x6c\x9b\x08\x3d\x94\xf5\xf8\xcc\x34\
-\x2c\x37\x1d\xcb\x48\x6b\xfc\x4c\xc2\x31\x4b\xd9\x80\x65\x73\x60\
-\xb6\x4c\xb4\x69\x80\x26\xc1\x49\xa7\x6d\xcd\x07\x40\x97\x4b\xe6\
-\xb6\x95\x78\x6f\xee\x47\x8e\xb2\xbc\xb7\x01\xd1\x9f\x23\x1d\x5f\
-\x6b\x2f\xcd\x9d\xe4\xdc\x92\x37\x8c\x9d\x57\xe6\xa6\xd1\xd2\xd2\
-\xd2\x32\xe4\x7a\x34\x27\x0c\x80\xcc\x70\x6e\x59\xb6\x19\xe5\xf6\
-\xef\x91\x10\xff\x34\xb5\x74\xc5\xc9\x69\xdb\x1f\x50\xa5\xb6\x73\
-\x0b\x20\x57\x6a\xc1\x90\xb0\x02\xec\xd4\x2d\xa0\x88\x04\xa8\x52\
-\xa5\x59\x36\xf3\x39\x05\x51\x02\x71\x2b\x20\xb7\x0d\xb0\xc3\x2d\
-\x52\xe6\xdf\x53\x8a\x97\xfe\x05\x89\x91\xed\x9c\xaa\x03\x88\x76\
-\x16\xe5\xed\x9c\xb2\x76\xde\xfb\x77\x3f\x59\xfc\x55\xee\xcb\x4f\
-\x4a\xee\x2b\x4f\x4a\xce\x8b\x4f\xc8\xf2\x57\x9e\x96\x07\x5f\x7b\
-\x4e\x52\xee\xbb\x55\xc2\x67\xb8\x0e\x44\x4e\x77\xbd\x3d\x39\xfb\
-\xce\x37\x9d\x65\x79\x46\x6f\x7a\x71\xf6\x9b\x8e\xa2\x25\xef\xa4\
-\x6d\x5a\x5a\x9e\x89\xcf\x63\x5b\x66\xda\x16\x98\x40\x2c\x05\x30\
-\x4b\x00\xce\x52\xa4\x4e\xdc\x57\xb0\x24\x68\x2d\x58\xe2\xbb\xd0\
-\x48\x98\x66\xfa\x44\x4a\xc6\x7a\x66\x6c\x5f\x81\xe4\x9b\xf7\xa9\
-\xbd\x34\xe7\x1d\xfb\x96\xfc\x67\xec\x65\x05\xb7\x3a\x4b\x0b\xc6\
-\xa6\x6d\xce\xea\x66\x6e\x2a\x2d\x2d\xad\xff\x45\xb1\xe3\xc3\xb5\
-\x75\xd9\x18\x94\xda\xd3\x01\xcb\x12\xd7\xd6\x82\x3f\xa6\x95\xae\
-\xf8\x42\x75\xd4\x6c\x5b\x01\x48\x16\x02\x3a\x06\xfc\x14\x00\x61\
-\x07\x81\x69\x42\x51\x01\x12\xa5\x32\x6f\x5d\x78\x8c\xd2\x1d\x40\
-\x5a\x8e\xc7\xf9\x27\x51\x6e\xbf\x07\xc0\xbe\x69\xf5\x8e\x23\xb1\
-\xbd\x81\xb4\xb9\xc5\x5e\x9a\x3f\x93\x00\x72\x1f\x7b\x99\xb2\x6e\
-\xf1\xd8\xb1\x0f\xdc\x77\xf9\x47\x07\xf6\xef\x3c\x54\x5f\xfb\xd5\
-\xa1\xba\x63\x72\xa8\xa6\x5a\x8e\xd4\x1e\x93\xf2\x13\xf5\x72\x65\
-\xce\xa2\x0a\xff\x8c\x94\x65\xd1\x97\x4f\x4b\x0c\x9b\x39\x75\xcc\
-\xc4\xac\x3b\xc6\xb1\xed\x31\xb5\x38\x6b\x0c\x3e\x3b\x11\xa5\xf9\
-\x02\x24\xcc\x17\x1d\x45\x59\x6f\xc3\x80\xe9\x52\x02\xf5\x6d\x94\
-\xe8\x7b\x32\xb7\x2f\x07\x08\xf1\x3d\xd8\xe1\xa4\x40\xde\x3c\x71\
-\xaa\x8e\x24\xb3\x13\x8a\xe0\x24\x40\xed\x48\x9e\x4e\xc2\x73\xeb\
-\x4a\x24\xe2\xfc\xbd\x48\xc8\xbf\xc6\x3a\xdf\x69\x2b\xce\x9d\x02\
-\xe0\x8e\xc8\xdc\x92\xd5\xc7\xdc\x84\x5a\x5a\x5a\xff\xd5\x32\x07\
-\x8d\xa3\xec\x9e\xed\xda\xb2\x6c\x87\xbd\x6c\xd9\x1b\x69\xc5\xf9\
-\xef\x67\xec\x58\xf9\x95\x13\xe9\x8a\xa5\xb2\x93\x66\xd9\xcc\x52\
-\xda\x02\xa3\x05\x49\xf3\x31\xd3\x65\x5a\x19\x7b\xbf\x57\xa0\x4c\
-\x2e\xa8\x45\x62\xfc\x23\x9e\x67\x62\x7c\x0d\xef\x59\x93\x5a\x54\
-\xa0\x86\xf4\x58\x50\x54\x29\x6d\x4b\x7e\xa4\xb9\x16\xe7\xe8\xbe\
-\x67\xb7\x0e\xd9\x75\xf8\xd0\x0b\xfb\xab\x2a\xbf\xdc\x5b\x59\x2e\
-\x7b\xcb\xcb\xe5\x60\x55\xa5\x1c\x02\x34\xaf\xcc\x5e\xb0\x3f\xf2\
-\xc6\xd9\x37\x5e\xfb\xc6\x33\x3d\xcd\xb7\x37\x13\xc0\xd9\xcf\x51\
-\x92\x35\x8a\xc3\x9a\xd4\x67\x6d\xca\x1e\x0b\x10\x4e\x46\xc2\x44\
-\x3a\xcc\x7d\xd6\x5e\x92\xf3\x36\xc0\xfe\x16\x12\xee\x27\x19\x38\
-\x10\xa8\xb4\xcb\xa4\x69\x41\xd3\x1d\x98\xb0\x9d\xd0\x44\xfa\xb4\
-\xd1\x00\x6d\xfa\x0e\x6c\x97\x92\xfc\x7d\xd8\x1e\xef\xe2\xa0\xf1\
-\xbc\x1a\x15\x50\x94\x1f\xe7\x7a\xb4\xb0\xaf\xb9\x0a\x5a\x5a\x5a\
-\xff\x4d\x9a\xf5\xe4\xac\xf6\xec\xd0\x70\x6d\x29\xb8\x0c\x50\x7c\
-\x1c\xa5\xf7\x07\x99\x65\x2b\xbf\xc9\xdc\xbe\x4a\x90\x32\x55\x49\
-\x9a\x06\x48\xb2\x67\x59\x95\xd2\x00\x85\xea\xac\x61\xd9\x5d\x64\
-\x82\x12\xcf\xa7\x03\xaa\x80\x5f\xa5\x7d\x73\xce\x3b\x28\xdb\xdf\
-\xb2\x17\xe7\xbc\xea\x28\xca\x2b\x74\x15\xe5\xd9\x08\x48\x0e\x1a\
-\xcf\xfc\x27\x06\x8d\xef\xa9\xac\x1c\xb2\xf7\x68\xe5\x0b\xfb\xaa\
-\xab\xbe\xdc\x7d\xb4\x42\x76\x13\x9a\xd5\x95\xf2\x71\xe5\x61\xf9\
-\xf0\xd0\xfe\xfd\x1f\x95\x1f\xb8\xf1\x93\xea\xea\x56\x81\x79\x3e\
-\xcd\xfc\xe9\x03\x5d\xed\x25\x85\xc3\x09\x51\x47\x71\xfe\xc4\xb4\
-\xad\x05\xd7\xb8\xca\x72\x7f\xc6\xe1\x4f\x6c\xb3\x4c\xdf\x5a\x80\
-\x14\xc9\xf6\xd4\x26\x58\x36\x02\xd3\x7a\x0e\x07\x0d\xd5\x14\x81\
-\x6d\x91\xb6\x85\xe3\x44\x91\x58\x8b\x0b\xca\x01\xcd\x97\x39\x78\
-\x3e\xad\x34\x3f\x3e\xed\xd1\x55\xfa\xac\x23\x2d\xad\xff\x06\x8d\
-\xdc\x7c\x63\x47\x9e\x71\xe3\x2a\x5b\x76\x15\xc0\xf8\x24\x92\xe5\
-\x47\xd3\xca\x56\x21\x35\x3d\x20\xce\xad\xd8\xf9\x91\x12\xd3\x90\
-\x28\xd3\x4b\x0d\x2b\x68\x2a\x60\xb2\xcd\x12\xc0\xe4\x60\x71\x94\
-\xe8\xae\x92\x82\x43\xb6\xcd\x39\x7f\x04\x24\x5f\x04\x3c\x17\xa7\
-\x95\xe4\x27\x31\xc9\xd9\xcb\x0a\x46\x67\x94\x2c\xf7\x36\x3f\xee\
-\x9f\xd6\x9e\xca\x43\x43\xf6\x54\x1e\x79\x61\x5f\x4d\xd5\x97\x7b\
-\x00\xcc\xcf\xab\xca\x65\x0f\x80\xf9\x69\xe5\x11\xf9\xf0\x00\x80\
-\x79\xe8\xbb\x03\xb3\xa5\xe2\x7f\x97\xd5\xc1\x55\x9a\x33\x54\xf5\
-\x86\xe3\xc0\xe1\x2c\xcb\x7b\x9c\xbd\xe4\xce\xa2\x9c\x0f\x5c\x65\
-\xcb\xbf\x76\xa0\x0c\x77\xe0\x40\xa1\x86\x44\x29\x68\x12\x96\x1c\
-\x1a\x65\x35\x49\x98\x8f\xf1\x1e\x26\xd5\xb4\xd2\xc2\x2a\x1c\x20\
-\x7e\x8b\x6d\x93\x8d\x64\x9d\xc8\xf1\xa9\xe6\x47\x69\x69\x69\xfd\
-\x98\x64\x5f\xbd\xba\xb3\x63\xdb\xf2\x51\xce\xed\x2b\xaf\x73\x6d\
-\x5d\xfe\xf3\xf4\x6d\x2b\x3e\x99\xba\x03\xa0\x44\x42\x74\xb1\xe4\
-\x46\x59\xaa\x3a\x64\x60\x0e\x2a\xe7\x59\x36\x2c\xb1\x09\x4a\x17\
-\x1e\x67\x3e\xa2\x20\xc9\xf6\xbb\x77\x01\x89\x5f\x03\x16\xf7\x13\
-\x0a\x6c\xc3\xfb\x77\x9c\xc7\xfd\xec\x87\x6f\x0d\xd9\x5d\x59\xf9\
-\xc2\xfe\xea\xea\x2f\x91\x34\x65\x77\x55\x85\xec\xad\xa9\x92\xcf\
-\x00\xce\x4f\x0e\x1f\xd8\xff\x89\x4a\x98\x9f\xfc\x4b\xc0\x6c\x26\
-\x91\xb6\x8e\x4d\x39\x83\xd9\x16\xea\xdc\x9a\x7f\x11\xbe\xe3\x76\
-\x40\xf2\x0d\x5b\x71\xce\xfb\x69\x5b\x57\x7c\xe9\xda\x0e\x78\x6e\
-\x31\x00\x69\x37\xd3\xb6\x6a\xc3\x55\xb7\x46\x39\xcf\x4e\xa4\xcc\
-\x6d\xcb\xb9\xed\x6a\x50\xee\xbf\xe6\xdc\x92\x5f\x80\x24\x9b\xf2\
-\x7d\x1c\x40\xb4\xb4\xb4\xfe\x43\xc2\x0e\xdb\xd3\xb5\x6d\xe5\x55\
-\xce\x6d\x2b\x9e\x4d\xdb\xb6\x62\x57\xe6\xf6\x07\x91\x28\x57\xa9\
-\x92\xb2\x35\x13\x90\xe9\xb8\x25\x50\xa7\x22\x79\x02\x00\x7b\x5c\
-\xa5\xf9\xbf\x02\x00\xee\xb0\x6f\x43\xc9\x09\x48\xce\xda\xbc\xac\
-\xb7\xb9\xf8\x7f\x8b\x9e\xfd\xf4\x4f\x43\x9e\xf9\xf8\xbd\x17\x76\
-\x1f\xad\xfc\x72\xdf\xd1\xaa\x26\x60\xa2\x34\xff\xe0\xc0\xbe\xfd\
-\xaf\xed\xfe\xe8\xc6\xe5\x6f\xbc\xf1\xfd\x01\xb3\x85\xec\xa5\xf9\
-\xd1\xa9\x5b\xf3\xc6\xd8\xb7\x16\x4e\x03\x1c\x8b\x6d\x25\xf9\xef\
-\xa6\x15\x17\x9c\x55\x9d\x5f\x3c\xb8\xa8\x94\xc9\xd2\xbc\xa9\x74\
-\x6f\x6c\x03\x45\x12\x4d\xe7\xe0\xf8\xb2\xc2\x3a\x5b\x71\xde\xeb\
-\xd8\x9e\xcb\x5c\x1b\x73\x86\x9a\x8b\xd6\xd2\xd2\xfa\x21\x2a\xed\
-\x97\x9b\xbb\x21\x51\x8e\x45\xe9\x7d\xbb\x6b\xcb\xca\x9d\xd3\xb6\
-\x3f\x2c\x19\xdb\x1f\x12\x27\xc7\x4e\xb6\x80\xa4\xe1\x15\x92\xbe\
-\x6d\xa5\x4c\x7b\xe4\x21\x96\xe3\x9f\xc0\xef\xe0\x7d\xcf\xb8\xb6\
-\x16\xde\xa2\x3a\x69\xfe\x83\x43\x69\xc6\x3e\x7c\xe7\x90\x9f\xfd\
-\xf5\xdd\x17\x0e\xd6\xd4\x7c\x79\xb8\xf6\x98\x1c\xac\xa9\x16\xde\
-\x56\xd4\xd5\xcb\x9c\x67\xb6\xec\x9f\xb4\x76\xde\x8d\x3c\x10\x98\
-\x6f\xff\xb7\x2a\xbd\xb8\x20\xd4\x56\x52\x90\x81\xe4\xb9\x11\x29\
-\xf3\x35\x67\x71\xee\x9f\x32\xcb\x96\x9d\xe0\x20\x7d\x55\x92\xb7\
-\x00\xa6\x1a\x8c\x8f\xc7\x6c\xf7\xe5\xf6\x4c\x2f\x5e\x76\xd4\x55\
-\x9c\xbb\xde\x55\x96\x67\x73\x96\xe4\x06\x98\x8b\xd5\xd2\xd2\xfa\
-\xa1\x28\x69\x5b\x81\x87\x6d\x4b\xc1\xcd\xce\x2d\x85\xcf\x3b\xb7\
-\x2d\xdf\x9b\xfe\xd8\x83\x02\x78\x8a\x4b\xf5\x0a\x23\xfd\xd0\x80\
-\x24\x3b\x78\x78\xcb\xd2\x7c\xda\xa3\x0f\xe3\x7e\xc1\xc7\x28\xd9\
-\x7f\x96\xb1\x75\xd9\x35\x69\xa5\xcb\xd4\x60\xed\xf8\x2d\x59\x5d\
-\xcc\xc5\x7e\x6f\x8a\xcf\x32\xda\x0f\xad\x5e\x73\x77\x3b\x37\x2d\
-\x1e\x1b\xbf\x7e\xd1\xe5\x4f\x7d\xb0\x73\xe7\x73\x9f\xbe\xff\xd5\
-\xb3\x1f\xbf\x27\xcf\xfc\xed\x5d\x79\xf6\x93\xf7\x04\x8f\xe5\xc6\
-\x27\xd6\x57\x24\xad\x9b\xbf\xcc\x51\x94\x95\xa8\x7a\xde\x39\xf3\
-\xd1\x96\x65\xca\x9c\xfd\xc8\x68\x47\xcd\xfa\xde\xcb\x60\x82\xd3\
-\xb1\x2d\x6f\x14\xb6\x89\x0b\x30\x7c\x08\x09\xf3\x0d\xa4\xef\xe3\
-\xe9\xdb\x96\x99\xed\x9b\x46\x0f\xbb\x05\x50\x65\xc0\x33\x0d\x50\
-\x4d\x2b\xc9\x3f\xe9\x28\xce\xd9\xe9\x2c\xc9\x59\x8b\x12\xde\xe5\
-\x2a\x2d\x0c\x36\x17\xab\xa5\xa5\xf5\xff\x25\xfb\x8e\xac\x5e\xce\
-\xed\xcb\x26\xd8\xb7\x2e\xbb\xcf\xb9\x65\xf9\x9f\x33\x90\x16\xed\
-\x3c\xa7\x1b\x3b\xb5\x93\x63\x10\xb7\x03\x92\xb8\xef\x62\x5b\x1b\
-\xa0\x99\xb1\x6d\x95\x4c\x7f\x64\x35\x40\x59\xf8\x57\xc0\xf4\xa7\
-\x69\x5b\x56\x5e\x61\x2f\x59\x35\x9c\x40\x33\x17\xf9\x2f\x29\xfe\
-\xc9\xac\x1e\x69\x3b\xf2\x46\xa4\x95\x64\x8f\xe7\x24\x17\xb4\xa3\
-\x38\x7b\x22\xc0\x71\x35\xd2\xd6\x53\x80\xc8\x5b\x6a\xf8\x91\x39\
-\x73\x91\x31\x9d\x5b\xd6\x4e\x57\xf1\xd2\xf7\x5d\xc5\xd9\x5f\x39\
-\x4b\x96\x8a\xa3\x08\xde\xbc\x54\x9c\xa6\x55\x8a\x2b\xca\x3e\xc0\
-\xb1\x95\xb0\x31\xb6\xb3\x8c\xce\xdf\xe9\x2a\xcb\x7f\x3b\x6d\x4b\
-\xde\xab\xae\xb2\x82\x42\x26\x3a\x17\xca\x6a\x7e\x26\x6f\xbf\x4f\
-\x48\x65\x96\xe5\xfa\xa5\x95\x14\xa4\xba\x4a\xf3\x57\x00\xa0\x7f\
-\xc0\x81\xa7\x2e\x0d\x07\x24\xc7\x96\x02\x35\x04\xc9\x1d\x9a\x3c\
-\xa3\xc9\xa1\x26\x05\x29\x90\x8c\xd2\x82\xd3\x8e\x62\x4e\x46\x92\
-\xb3\x81\x67\x0f\x99\x8b\xd3\xd2\xd2\xfa\x4f\x8a\x63\x00\x01\x8b\
-\x38\xc7\x96\x65\x73\x00\x8e\x97\x1c\x5b\x0b\x0e\xa5\xed\x30\x76\
-\x60\x07\x4b\x47\x13\x98\x1c\x80\x8d\xf7\x48\x1a\x40\x39\xed\xd1\
-\xd5\x5f\x23\x51\xfe\x25\x63\xfb\xca\x47\xd3\x77\xac\xba\x24\x7d\
-\xeb\x8a\x21\xff\xea\xa4\x13\xa9\xc5\x0f\xf4\x73\x94\x2c\x1f\x05\
-\x30\x8c\xe5\x10\x9b\x8c\xb2\xc2\xbb\x32\xb6\x2c\x7b\x2e\xbd\x2c\
-\xef\x6d\x78\x27\x12\xd8\x4e\xc7\xe6\x6c\x4e\xb9\xf6\x89\x9a\xaa\
-\x0d\xe6\x70\x1e\x9e\x96\xa8\xce\x41\x37\x4b\x5c\x9e\x3a\xc9\xd3\
-\x1c\xed\x65\x39\xaa\x87\xda\x1a\x1b\xa9\x26\xde\x28\xe1\xf3\xd9\
-\x62\xdb\x92\x8d\xef\x96\x87\x94\xcc\xbf\x67\x4a\x36\xcc\xc9\x35\
-\xb0\xcc\x5a\xd7\x96\xbc\x77\x39\xb1\x46\x5a\x59\xee\x5b\xce\xb2\
-\xdc\xd7\x00\xd0\x75\x69\x65\x79\xe9\x84\x27\xd7\x2f\xa3\x24\x27\
-\xc2\x5c\xed\x7f\x5a\x4c\xb2\xae\xd2\xdc\x64\xe7\xb6\x82\xfc\x54\
-\x76\xf4\x94\x2e\xaf\x49\xdf\xbe\x4a\xf5\x9c\xbb\x43\x93\x43\x95\
-\x78\xf6\x93\xfa\x5e\xec\x34\xda\x9c\x7b\xd2\x56\x96\xb7\xc3\x56\
-\x94\x97\x69\xfb\x1e\xd6\x43\x4b\x4b\xeb\x02\xe5\x2c\x59\x19\x90\
-\xba\x75\xf9\x5c\xdb\xb6\xc2\x57\x90\x74\xca\x33\x1f\x59\x25\x36\
-\x40\x24\x15\x30\xb1\x73\x5c\xe1\xb6\x42\x05\x4c\x07\xcb\x71\xec\
-\xcc\x19\x3b\x1e\xfc\x2a\xbd\x78\xc5\x9f\x33\xb7\xad\xdc\x96\xbe\
-\x75\xe5\x45\xae\xed\x2b\x63\xb1\x98\xb6\xc6\xd2\xbe\xbb\x38\x7c\
-\x06\x20\x1b\xc9\xa1\x45\xf8\xfc\xf9\xce\xd2\x82\x17\x1d\x25\x79\
-\x6f\xa3\x64\x7d\x1b\x60\xda\x37\xe3\x51\xc2\x79\x85\x64\x6e\x2f\
-\x44\x92\x65\xaf\xb2\x09\x0e\x95\x1e\xb3\xc4\x51\x8c\xe4\xc8\xd3\
-\x16\x09\x14\x65\xc2\xd2\xb4\x3b\x74\x1a\xcd\xbf\x3d\xf7\xbc\xf0\
-\x46\xe3\x75\x40\x52\x0d\x48\xcf\xc0\xf7\xce\x00\x44\xa7\xe2\x60\
-\x31\x75\xcb\xb2\xd3\x58\xcf\x3f\x01\x9e\x3b\x9d\x65\x79\xaf\x3b\
-\xb7\xe4\x97\x3a\x8b\xf3\xa7\x4f\x45\x59\x9f\x51\xfa\xaf\x4d\xef\
-\xc6\x6d\xe0\xdc\x9a\x9f\xe0\xd8\x52\xb8\xd4\x56\x5a\xf0\xaa\xbd\
-\xb4\xa0\xca\x89\xed\x8e\x14\xa9\xd6\x99\xe0\x77\x94\xe2\x3b\x62\
-\xfd\x54\xe2\x54\xed\x9b\x2b\xbe\xb4\x15\xe7\xbe\x87\x72\xbe\xcc\
-\xb6\x39\x37\xd9\x5c\x94\x96\x96\xd6\xbf\x4b\xe9\xdb\x57\x06\xd9\
-\xb7\xe5\x2f\x71\x96\xe6\xef\x66\xa2\xb4\xef\x58\x81\x12\xbc\x50\
-\x6c\xdb\x00\xcc\xed\xf9\xb8\x8f\xa4\xc3\x53\x01\x01\x8c\x8c\x47\
-\x1f\x44\x49\xb8\xf2\x8c\x73\xcb\xca\x27\x9c\xdb\x56\x4e\x47\xda\
-\x8c\x32\x17\xf3\x9d\xa5\xa6\x77\xdb\x5a\x38\x32\x6d\x2b\xca\xd2\
-\xad\xcb\xb2\x5d\x5b\x0a\x7e\xe3\x2a\xce\xff\x63\x7a\x49\x61\xf9\
-\xf4\x6d\x0f\xc8\xb4\x6d\x2b\x25\x03\xa9\x0f\x29\xcf\x70\x99\x71\
-\xde\x76\x3a\xca\x55\x9e\xb3\x4d\xb0\x11\x88\xd6\x9c\x97\xcd\x20\
-\xe9\x66\xbe\xef\x5c\x60\x12\xb8\xad\x80\xd2\xdd\x78\x0f\x3f\x8f\
-\x73\x6e\xaa\xdb\xc6\xc7\x78\x8d\x89\x74\x1b\xdb\x71\x57\x7c\x05\
-\x58\xbf\x8f\xf7\xbe\xe1\x2a\xc9\xde\x91\x56\xbc\x74\x36\xdb\x50\
-\x1d\x65\x39\xff\xf4\xf4\x6e\xf1\x9b\xb3\x3c\xed\x48\xd6\x28\xcb\
-\x17\xda\x8b\xb3\x5f\xb6\x95\xe5\x1c\x71\x6c\x47\x99\x4e\x48\x02\
-\xe4\x4d\xdf\x01\x07\x33\x6c\x17\xe7\x0e\x1c\x40\x8a\xf3\xbe\x74\
-\x94\x65\x3f\x65\x2f\xc9\x4d\x35\x17\xa3\xa5\xa5\xf5\x7d\xcb\xfe\
-\xf8\x8a\x10\xc7\xf6\x65\xd9\x69\x3b\x96\xef\x4b\x7f\x0c\xa9\x12\
-\x90\x44\xca\x14\x1b\x92\x9c\x1d\x3b\xa9\x03\x8f\x15\x2c\x01\x51\
-\x94\xdc\x1c\x12\xf3\xae\x73\xeb\xf2\x22\xd7\x96\x95\x53\xcc\x45\
-\x7c\x27\xf1\x32\x0f\x19\x25\x79\xc6\xf4\x6e\x5b\x57\x2e\x77\x6e\
-\x5d\xf1\x8a\xab\x24\xff\xbd\x8c\xb2\x65\xd5\x19\x3b\x56\xa9\x0e\
-\x25\xd5\x81\x54\x92\x2f\x19\x70\x3a\x3b\x3b\x00\x29\x94\xc5\x06\
-\xb0\x70\xcb\x79\x2a\xd5\x44\x17\x84\x1a\xa1\x68\x02\xd3\xe1\x06\
-\x49\xb6\xf7\xd1\x16\xf8\x98\x32\x55\xd2\x04\xec\x9a\xce\xc2\xc1\
-\x7b\x71\xcb\xd7\xf9\x3e\x76\xae\x30\xcd\xf1\x39\x2e\xdb\x02\xa4\
-\x3a\xe5\x91\x90\x54\xb0\xc4\x32\xf9\x77\x4c\x7b\x5b\xcc\xf7\x72\
-\x9d\xd4\x30\xaa\xc2\x6f\x6c\x45\xb9\x1f\xb0\x0d\xd5\x59\x94\xf3\
-\x84\xbd\x38\xe7\x72\x94\xcd\x13\xd8\x31\xc5\xc1\xfe\xe6\x26\xb8\
-\x60\xb9\x36\x14\xf6\x65\x1b\x25\x3c\xcf\x55\x9a\xff\x61\x3a\x00\
-\x9d\x8a\xcf\xb6\xbb\x9b\xcd\x0d\x5b\x96\xe2\x37\xc3\x3a\x6e\x2f\
-\xf8\xca\x56\xb6\xf4\xe9\x94\xd2\x6c\x87\xb9\x08\x2d\x2d\xad\xef\
-\x4b\x3c\x5f\x1a\xe9\xf1\x8e\xb4\x47\x96\xed\x4e\x7f\x7c\x25\xc0\
-\xc8\x24\x69\x00\x92\x09\xd3\x8e\xfb\x04\xa5\xeb\x91\x95\xa7\x6d\
-\x5b\xf3\xdf\x76\x6e\x5b\xbe\x01\x65\x7a\x46\xfa\xf6\x07\x42\xcd\
-\x45\x5c\xb0\xd2\x8b\x72\x83\x32\xcb\x0a\x9c\xae\xad\x2b\x56\xa7\
-\x95\x2d\xff\x1d\x4a\xef\xf7\xa6\x95\xad\xa8\x9b\x86\xc4\x9a\xc6\
-\x8e\xa4\x2d\x6c\x7b\x34\x00\xd4\x98\xec\x08\x45\xeb\xd6\x84\xa3\
-\x02\x19\x4a\x6e\x2c\x4f\x25\xcd\x74\xa4\xbf\x8c\xb2\x42\xc9\x2c\
-\x43\xc9\x5c\x86\x04\xcc\xc1\xf2\xc5\xf8\x1e\x9b\x01\xbf\x8d\x80\
-\xc9\x86\xa5\x62\x5f\x97\xd5\x68\xdb\x7a\xdc\xe2\x39\x07\xe7\xc1\
-\x2c\xca\x03\x94\xf9\xb7\xcb\xd5\xc4\x20\x2e\x7e\x57\x1e\x18\x50\
-\x82\xb3\x73\x45\xc1\x1a\x46\xf9\x0d\x38\x1a\x90\x74\xe1\xd6\x48\
-\x99\x86\x2d\xd8\x2a\x48\x9b\x56\xa7\x3c\x22\x81\xda\x37\x65\x7d\
-\x64\x67\xa7\xd2\x96\xbc\x9f\xe3\x7b\x5d\xe7\xc0\x81\x82\x83\xff\
-\xcd\x4d\x72\xc1\x4a\x44\xa9\xee\x28\xcb\xbb\xdd\x5e\xb2\xf4\x45\
-\x5b\x49\xce\x01\x76\xb8\xd9\x4a\xb2\x24\xb5\x04\xdf\x0d\x25\x3a\
-\x92\x25\xd6\x23\x1b\xe0\xcc\x96\x8c\xed\x85\x7f\x77\x6c\xcb\xde\
-\xe1\xda\x9e\xff\x2f\x35\x91\x68\x69\x69\xb5\x90\x73\xcb\x8a\x81\
-\x29\x8f\x14\x16\xda\x1f\x59\x76\xcc\xf5\xf8\x72\x94\xdc\x00\x24\
-\x92\xa5\x61\x40\x03\x89\x33\xe3\x91\x95\xb5\x80\xe8\x66\xd7\xb6\
-\xe5\x4e\x96\xee\xe6\x9f\x5e\xb0\x38\x8c\x26\xb3\xac\x30\xdd\xb9\
-\xa5\x70\x83\xab\xac\xe0\xad\x69\x5b\x56\x9c\x9a\xc6\xcb\x4c\xa0\
-\xdc\x4e\xe3\x39\xd4\x80\x1d\x3b\x69\xac\x69\xd2\x68\x55\x72\x13\
-\x90\xa6\x59\x3a\xf3\x31\xa7\x5a\xcb\x00\x20\x33\xf1\xfe\x8c\xa2\
-\x7c\x49\x7d\x78\xb1\x24\xe6\xde\x2b\xe3\xee\xbb\x49\x86\x5e\x7b\
-\xa9\x44\xcd\x9a\x2a\x81\xce\x54\xf1\x4e\x8a\x97\x81\x71\x13\xc4\
-\x73\xcc\x68\xe9\x3b\x7c\x98\xf4\x1b\x66\x58\xdd\x1f\x31\x5c\x3c\
-\x47\x8f\x92\x01\xe3\xc7\x89\xf7\xa4\x89\xe2\x97\x10\x8f\xbf\xb1\
-\x49\xd8\xac\x4c\x89\xb9\xe6\x12\x19\x75\xd7\x0d\x12\xb7\xe8\x6e\
-\x49\x2e\x9c\x2f\xce\x75\xd9\x46\x72\xdc\x51\x28\x69\x3b\x50\xfa\
-\x6e\x33\xc0\x69\x41\xb2\xc9\x4c\xb5\x66\xca\x55\xc6\xfb\x36\x9b\
-\x89\x77\x0b\x52\x32\xcf\x7e\x2a\xce\xdd\x85\xf7\x3d\xe3\x2c\xce\
-\xbd\xc9\xb9\x29\x77\x32\xcf\x47\x4f\xd9\xbe\xb2\xbb\xb9\x99\xfe\
-\xa1\xe2\x9f\x5c\xd7\x43\x4d\x04\x52\x9a\x7d\x37\xd2\xf1\xbb\xa8\
-\x08\x90\x2e\x09\x4c\xc0\x9f\x89\x17\xeb\x41\x70\x3a\xb6\xe7\x7e\
-\xed\xd8\x9e\xf7\xba\x7d\x47\xde\x38\x9e\x79\x64\xfe\xb9\x96\x96\
-\xd6\xbf\x2a\x02\xd3\xf1\x58\x61\xa1\xed\xd1\x65\xc7\xec\x00\xa6\
-\x63\x07\x92\x19\xfd\x28\x52\x1a\x92\x9f\xb3\x6c\x79\x8d\x73\x5b\
-\xc1\x3a\xec\x9c\x23\xcc\x3f\xb9\x60\x65\x94\x2c\x8f\xc8\xdc\xb2\
-\x7c\x6a\x1a\xca\x77\x67\x71\xfe\xbb\x99\x5b\x96\x9d\x9d\xba\x9d\
-\x90\x04\x8c\x51\x6a\x73\x42\x0e\x9e\x6f\xce\x89\x7e\xd5\x54\x6f\
-\xc5\x00\x25\x93\xa3\x55\x46\x03\x8c\xec\xfd\x9e\xce\x61\x4b\x78\
-\xdd\xfe\xf0\x22\x89\x5f\x7c\xbb\x0c\xbf\xfe\x62\x09\x49\x4b\x91\
-\x81\xe3\xc7\x48\x9f\x98\x18\xe9\x11\x1c\x2a\xdd\x03\x42\xa4\x9b\
-\x6f\xb0\xf4\xf4\x0d\x95\x1e\x7e\xa1\xd2\xd3\x2f\x4c\x7a\xfa\x87\
-\x2b\xf7\xa6\x03\x22\xa4\x17\x6e\x9b\xd9\x0f\xcf\x29\xe3\x7d\x78\
-\x7f\x0f\xb8\x3b\x9e\xef\x8e\xf7\x76\x0f\x8a\x90\x1e\xe1\x51\x0a\
-\xb2\x3e\xf1\x93\x24\x74\x86\x4b\x46\xdd\x71\xb5\x24\xe5\xdd\x27\
-\xae\xb5\x4b\x91\x64\x0b\x55\xdb\x2a\x4f\x01\x65\xfa\xcd\xc0\xfa\
-\x72\x66\x76\x27\x3b\x9e\xac\x89\x86\xd5\x4c\xef\x86\x99\x8c\x33\
-\xf0\xbe\x4c\x40\x0e\xdf\xed\x73\x94\xfe\xef\x02\x70\xcf\x39\x4a\
-\xf2\xef\x62\xc9\xfe\x5d\x06\xcf\xc7\x6f\xc9\xea\x63\x2f\xce\xba\
-\xd1\x5e\x92\xfd\x0e\xb7\x11\x7b\xf8\x99\xca\x0d\x67\x8b\x4d\x03\
-\x53\x4b\xeb\xdf\x23\x96\xe4\xa9\x3b\x0a\xef\x70\x3e\xf1\xc0\x6e\
-\xd7\x53\x0f\x89\xfd\x11\x00\xe0\x89\x15\xe2\x7c\x74\x79\xbd\x73\
-\x6b\xe1\x1b\x8e\xad\xcb\x56\x38\x1f\x59\x31\xcc\x7c\xfb\x05\xc9\
-\x5e\xba\x32\x3a\xb3\xa4\x70\x06\x4a\xe3\x2d\x69\xc5\xcb\xdf\x9b\
-\xb1\x6d\xd5\x97\x99\x9c\x90\x83\x50\x84\xd5\x44\x1c\xe6\x6d\xe3\
-\x7d\x4e\xeb\x56\x82\x12\x98\x65\xf5\x96\x15\x48\x90\x2b\xc4\xf1\
-\xe0\x12\x89\xbb\xf7\x66\x89\x9e\x3d\x4d\x06\x4d\x8e\x03\x1c\x07\
-\x03\x66\x80\xe3\xa0\x60\xe9\x31\x10\x70\xf4\x09\x06\xf8\x42\x0d\
-\x07\x18\x50\x34\x1c\x29\xbd\x03\x2f\xc0\x01\x51\x70\x34\xee\xe3\
-\xd6\x7a\x2e\x28\x5a\x7a\x05\xc5\xc0\x51\xd2\x33\x10\xe0\xf4\x0f\
-\x93\xae\xbe\x21\xd2\xd5\x07\x20\xf5\xc7\x73\xa1\x31\xd2\x6f\xc8\
-\x48\x09\xb4\xa5\xca\x88\x1b\xaf\x04\x40\xe7\x48\xe6\xa6\x3c\x99\
-\x5a\x0a\xa8\xab\x19\xde\x01\x2f\xa6\x4d\x05\x7d\xc3\xbc\xec\x05\
-\x9b\x0f\x98\x90\xd9\x6e\xca\x36\x52\x0e\x5f\xe2\xac\xec\x00\xe6\
-\x01\x3b\x2f\xf4\x56\x92\x7b\x1f\xdb\x2a\x2f\x74\x4e\x4c\x8e\x93\
-\x4d\x2d\x5e\x7a\x8d\xa3\x24\xe7\x97\x00\xe7\xae\x8c\x47\xb0\xbd\
-\xb6\x60\x7b\xc2\x53\x77\x2c\xd7\x25\xb9\x96\xd6\xbf\x4b\xa9\xdb\
-\x0b\x42\x91\x30\x17\xdb\x1f\xc9\x7f\xd9\xf6\x48\xfe\xbb\xa9\x3b\
-\x96\xbd\xea\xd8\x56\xb8\x2c\x7d\xfb\xb2\x14\xf6\x62\x9b\x6f\xfb\
-\x76\xa9\xf9\x30\x57\xc6\x66\x16\x17\xcc\xce\x28\x59\xb6\x83\x73\
-\x61\x4e\xdd\xba\xe2\xef\x84\x1f\x4b\x5a\x35\xf3\xb8\x09\x4c\x5a\
-\x4d\x3a\x81\xe7\x38\x3f\x26\x27\xe7\x98\xba\x75\xa5\x4c\x2d\x5a\
-\x26\xc9\x05\xf3\x65\xc8\x0d\x57\xa0\xa4\x9e\x22\x3d\x23\x63\xa4\
-\x8b\x4f\x90\x74\xf1\x0e\x92\xee\x80\x56\x8f\x00\xa4\x40\x40\x8c\
-\x40\xec\xe3\x0f\xb8\xf9\x23\x1d\x06\x22\x29\xe2\xf9\xde\x7c\x1e\
-\xc0\xeb\xc5\x24\x49\x68\x5a\x00\xb4\xdc\xca\x73\xbd\x00\x4c\xc3\
-\xc6\xdf\x19\xcb\xc0\xe3\x40\x42\x33\x4a\x7d\x56\x0f\x2e\x4f\xbd\
-\x3f\x46\xb9\x27\x5e\x67\x0a\xed\xe1\x1b\x26\xdd\x00\xea\xee\x61\
-\x91\xe2\x85\xd2\x3e\xe2\xa2\xa9\x12\x37\xef\x0e\xc9\x58\x9b\x2b\
-\xd3\xd8\x61\xa5\xda\x63\x8d\x66\x05\xd5\x94\xc0\xc4\x6c\x02\xd3\
-\xdd\x3c\x9f\x3c\x03\xa9\x1b\x09\xfc\x08\x20\xfb\x1b\x94\xf0\xf3\
-\x91\x3c\x27\x4f\xdd\x56\xe0\x61\x6e\xd9\xf3\xca\xfe\xfc\xea\xce\
-\x69\x9b\xb3\x47\xa7\x95\xe5\x5c\x8f\x65\xfd\xdc\x5e\x92\xf5\xb6\
-\xa3\x64\xe9\x9b\xae\xad\xf9\xdb\x53\x1e\xc9\xd3\x9d\x3e\x5a\x5a\
-\xff\x2e\xa5\x6c\x5f\x39\xc0\xbe\xa3\x60\xb4\xed\xd1\x15\xe3\x79\
-\x9b\x78\x81\xa0\xb4\xe6\xc3\xcc\x28\xca\xbd\x2c\xbd\xa8\xe0\xf1\
-\xb4\xa2\xbc\x0f\xa6\x6d\x59\xf5\x4d\x06\x12\x57\x7a\x29\x3b\x4e\
-\x0c\x5b\x69\x52\x99\x65\x38\x20\x9a\xb1\x63\xa5\x64\x00\xa8\xb6\
-\x95\x8b\x64\xf8\x0d\x97\xc9\xa0\x49\xe3\xa5\x67\x48\x04\x12\x5d\
-\x10\x12\x1d\xcb\x6b\x96\xca\x2c\x9d\x71\x8b\x04\xa9\x00\x06\x1b\
-\x50\x34\x9f\xc3\x7d\x26\x41\x0b\x94\xee\x6e\x0d\x92\x17\x62\x02\
-\xb4\x07\xdc\x13\xd0\x54\x69\x53\x81\x32\x5a\xc1\xb2\x07\x00\x4b\
-\xf7\xc4\x73\xbd\x98\x46\xf1\x7e\x96\xfd\xdd\x7c\x43\xa5\x6b\x60\
-\xa8\x78\xa0\x84\x0f\x9f\xe6\x92\x49\x0b\x6f\x97\xf4\x8d\x48\x9e\
-\xbc\xa0\x1b\xe0\xc9\xb3\x76\x38\x1b\x91\x6a\x72\x80\xad\xf6\x59\
-\xb6\x3b\xaa\x5e\x76\x36\x3f\x6c\x5b\x89\xe7\x0a\x2a\xf1\x3e\x9e\
-\x61\x34\xdf\x55\x9a\x75\x41\x67\x14\xcd\xca\xca\xea\xe4\x2c\xca\
-\x1b\x66\xdb\x94\x3d\x5e\x9d\xde\xf9\x2f\x8e\x05\xd5\xd2\xd2\xfa\
-\x9e\xd5\x38\x1f\xe6\xa6\xdc\xab\x90\x18\x9f\x44\xa2\xfc\x68\x46\
-\x19\x00\x58\x5c\x88\x34\x05\x18\x96\xa0\xe4\x6c\x01\x4c\xb6\x59\
-\xb2\x0c\x9d\xc1\x0e\x9f\x4d\x05\x32\xfe\xfe\x9b\xc5\xdf\x96\x24\
-\x3d\x23\xa2\xa4\xb3\x4f\x80\x01\x49\xb6\x2d\x02\x74\x3d\xdd\xc1\
-\x87\x24\xc9\xc7\xad\x02\x93\x8f\x83\x9a\x92\xa5\xf5\xf7\xea\xef\
-\xcc\x5b\x77\xbb\x3f\xa7\xe0\xe8\x06\xca\x3e\xea\x16\xaf\xc1\x3d\
-\x09\x4c\xa6\x4d\x00\xb3\x11\x8e\x04\xa8\x4a\x9f\x80\xa7\x7a\x4c\
-\x63\x19\x70\x8f\x60\x18\x7f\xc7\x12\xbe\x8b\x4f\x88\x74\xf6\x0f\
-\x16\x8f\x91\xa3\x24\xe6\xb2\x8b\x24\x31\xfb\x5e\xc9\xd8\x9c\x2f\
-\x99\x5b\x70\x10\x41\xba\x56\x43\xa2\x4c\x60\xaa\xa4\x89\xb2\xdd\
-\xea\x5d\x67\xcf\xfc\xd4\x2d\x00\xe7\xe6\xfc\xbd\xce\xa2\xec\x02\
-\xe7\xa6\xec\x04\x3d\x1f\xa6\x96\xd6\x8f\x58\x9c\x71\xdc\x59\x94\
-\x7b\x89\x73\x73\xfe\xd3\xae\xa2\x82\x4f\x98\x12\xd3\x8b\x0b\x60\
-\xc0\x80\x06\x18\x0d\x03\x9c\x48\x93\x53\x01\xcc\x69\xdb\x56\xc8\
-\xac\xad\x0f\x88\x7d\xd5\x12\x89\xbd\x66\x36\x60\x32\x52\xba\xf9\
-\x05\x4b\x77\x05\xc9\x50\x05\x3f\x77\xb0\xb9\xdb\x1d\x72\x04\x27\
-\x13\x65\x4f\x94\xe2\x86\xf1\x7c\x90\xf9\x3e\x80\xd5\xb2\xd5\xb1\
-\x63\x3c\xb6\x6e\xad\xfb\x86\x7b\x35\x3e\x17\x21\x7d\x58\xe6\xb7\
-\xb0\x2a\xcf\x1b\xc1\x48\x1b\x8f\xd5\xf3\x6e\xa5\xbc\x82\x39\x5e\
-\xeb\x8e\xc7\x3d\xfc\x99\x4e\x59\xb6\x03\x9e\x48\xc6\x84\x67\x97\
-\xa0\x30\xf1\x8e\x9f\x20\xe3\xee\xbe\x5e\xd2\xd6\xe7\x0a\x4f\xe5\
-\x54\x67\x2a\xb1\x24\x47\xf2\x54\xb3\x12\xa9\x31\xa4\xc6\x19\x3c\
-\xbc\x94\x30\x87\x58\x39\x8b\x73\x6b\x9c\x1b\xb3\x5e\x03\x34\x0b\
-\x1c\x6b\x17\xa7\xfc\x3b\x26\x02\xd1\xd2\xd2\xfa\x37\x29\x3e\x2b\
-\xab\x8b\x3d\x7b\xf1\x68\xd7\x86\xbc\x1b\xd3\x36\xe7\xff\x7e\x7a\
-\xe9\x2a\x49\x2f\x2a\x14\x40\xd3\xe8\xb4\x81\x51\x52\xaa\x34\x99\
-\xce\x0e\x1c\x00\x93\x67\xea\x5c\xb4\xf5\x61\x49\xcd\x9b\x27\xe1\
-\xd3\xd3\xa5\x67\x78\x8c\x74\x1a\x14\x28\xdd\x00\x12\x02\xab\x0f\
-\x40\xd9\x27\x20\x4c\x81\xe7\x42\xcc\x04\x69\x25\x4d\x65\xfc\x3d\
-\x53\x1d\xdd\x83\x10\xc4\x63\x95\x16\x83\xa3\xa4\x5f\x68\xac\x78\
-\x86\x0f\x91\x01\x11\x43\x65\x40\xe4\x30\xf1\x8a\xa2\x87\x4b\xff\
-\x88\x61\xd2\x1f\xcf\x7b\x86\x0d\x96\xbe\x21\x31\xd2\x1b\xb0\xb3\
-\xd2\xa6\x02\x32\x96\xa3\xd2\x2b\xd6\xcf\x28\xbf\x9b\x83\x93\x6d\
-\xa8\x3d\xf1\x9a\x05\x65\xb5\x4e\x0a\x92\x91\xe7\x31\x4a\x76\x1c\
-\x1c\xba\xfa\x05\x4a\xff\x51\x23\x65\xf8\xf5\x97\x8b\xf3\xa1\xc5\
-\xea\x40\xc2\x6d\x65\x5c\xf0\x0d\x09\xd3\x1c\x92\x64\xdf\xbc\x54\
-\x99\x13\x85\xa8\xe1\x55\x45\xb9\x75\x8e\x0d\x4b\x5e\x77\x6c\xc8\
-\x5a\x96\xfa\xc0\x5c\x3d\x1f\xa6\x96\xd6\x0f\x5d\xc9\x9b\xe7\xf6\
-\xb6\xaf\xce\xba\xd6\xb9\x2e\xfb\x39\xfb\x9a\xec\xcf\xd9\x3e\xe9\
-\xda\x88\xd2\x72\x13\x20\x69\x02\x93\x29\x93\xd7\x15\x67\x59\x99\
-\xc9\xd9\x8b\x50\xa2\x27\x2d\xb9\x57\x82\xec\x36\x55\xb2\x76\xf1\
-\x76\x6f\x97\x34\xd3\x1e\x01\xd7\x02\x8a\xad\x5a\x25\xb6\x50\xe9\
-\xc6\x1e\x6b\xc2\x11\x65\x70\x9f\xb0\x58\x19\x10\x33\x5c\x7c\x86\
-\x8d\x15\xff\x51\x13\x24\x78\xc2\x14\x09\x9b\x94\x28\x91\x53\x52\
-\x24\x3a\xc1\x26\x31\x49\x0e\xd8\x2e\xb1\x49\xbc\x6f\x93\xd8\x64\
-\xbb\xba\x75\xbf\x1f\x9d\x98\xaa\xde\x1f\x39\x39\x45\xc2\x26\x26\
-\x4a\xe0\xd8\x38\xf1\x1d\x35\x5e\x06\x0d\x1d\x23\x9e\x00\x6c\xef\
-\x50\x94\xe4\x00\x2a\x3f\xcf\x00\xb4\x01\x69\x05\x55\x37\xb3\xcd\
-\x53\xa5\x4a\xe5\x16\xc0\x24\x7c\x79\x50\xc0\x7a\x73\xd8\x53\x17\
-\xa4\xea\xbe\x83\x87\xc8\x90\x2b\x2e\x12\xc7\x8a\x45\x92\x59\xb2\
-\x0c\xc9\x32\x5f\x6c\x16\x2c\x39\x59\x88\x39\xa6\xd3\xb9\x69\x29\
-\xbc\x44\x9c\x45\xb8\x5d\xb7\xe4\xa8\xed\xa1\xf9\xeb\x6d\xcb\xe6\
-\xd8\x12\x6e\xbd\x55\xcf\x87\xa9\xa5\xf5\x43\x53\xf4\xad\xb7\xf6\
-\x18\x71\xfd\x55\xe3\xc6\xff\xe4\xe6\x3b\x6d\x85\x8b\xde\x99\x5a\
-\xb4\x5c\x5c\x28\x2b\x9d\x1b\x50\x36\x6e\x44\xfa\xd9\x94\x2b\xe9\
-\x9b\x01\x4a\xb6\x5d\x22\x6d\x4e\x05\x24\x67\x94\xad\x92\xc9\x8b\
-\xee\x16\xff\xa4\x29\xd2\x1d\xe5\xa8\x02\x25\x3b\x6e\x4c\xb8\xf4\
-\xf2\x03\x3c\x08\x4d\xc0\x45\x25\xba\x46\x28\x32\xd5\x99\x46\xb9\
-\xad\xe0\x84\xf7\x75\xf7\xc5\xfb\x91\xfe\x3c\x23\x87\x8a\x37\x40\
-\x16\x32\x3e\x1e\x90\x4b\x95\x98\x64\x87\x0c\x4e\x76\xca\xd0\x54\
-\xa7\x0c\x4e\xc5\x7d\xd3\xb1\x29\x34\x40\xd9\x68\x40\x32\x99\xef\
-\x4f\x95\xe8\x24\xc0\x34\x31\x59\xa2\x93\x53\x24\x0a\x8f\xa3\xf0\
-\x5a\x34\xdf\xa3\xfe\xce\x09\x90\x62\x59\x29\x2e\x19\x92\x9a\xa6\
-\x1e\x47\x01\xa8\xe1\x71\x89\x12\x34\x7e\xb2\xf8\x0e\x1f\x23\xfd\
-\xa3\x86\x4a\xaf\xe0\x68\x63\xcc\xa6\x69\xae\xaf\x31\x7e\x93\xb7\
-\x06\x30\x0d\x80\x36\x77\x0f\x1c\x24\x8c\xd7\x00\x60\xdc\xef\xea\
-\x13\x24\x7d\x62\x87\xc8\xe0\xcb\x67\x4b\xea\x83\x8b\xd4\xb9\xf2\
-\xf6\xe2\x2c\xb1\x6d\xca\x32\x12\x26\x61\xb9\x21\x0b\xdb\x7b\x89\
-\x38\xd6\x2e\x22\x30\xc5\xf9\xf0\xa2\x93\x89\xf9\xf7\xee\x4c\x5e\
-\x71\xdf\xea\x71\xb7\xdf\x34\xc6\xfc\x99\xb4\xb4\xb4\xfe\xbf\x35\
-\xe4\xf2\x69\x03\xc6\xcf\xbd\xed\xb6\xc4\x65\x0b\x5e\x48\x5a\xb1\
-\x68\xbf\x6d\x2d\x92\xcf\x9a\x2c\xec\xbc\x39\xd8\x91\x09\x4b\x03\
-\x98\x28\xcf\x25\xa3\x64\x39\x40\xf9\xa0\xd8\xf2\x16\x48\xb0\x23\
-\x55\xba\x05\xb2\xf3\x23\x18\x80\x00\x54\x00\x92\xa6\xb4\xc8\x44\
-\x19\x86\x32\x1c\x09\x13\xee\x09\x10\xf6\x60\x29\x4c\x13\x3a\x00\
-\x50\x57\x82\x08\xef\xeb\x1b\x1e\x2b\xde\xc3\x0c\x40\x46\x21\x01\
-\x0e\x4d\x06\xc8\x52\xd2\x00\x45\xd8\xc6\x5b\x97\x82\x9b\x82\xa4\
-\x0d\x69\x32\x15\xa9\x31\x19\xe9\xb1\x05\x2c\x63\x53\x52\x1b\x1d\
-\x03\x50\xc6\x24\x03\x98\x29\x00\x26\x4d\x88\x12\xa8\xf8\x5b\x05\
-\x5a\x00\xb3\xc9\x06\x78\x63\x90\x46\x79\xab\x3e\x07\xf7\xa3\x00\
-\xeb\x10\xa4\x59\x9f\xe1\x63\xb1\x8e\x83\x91\x3e\x23\x50\x72\x73\
-\xf0\x3c\xe0\x89\xef\xd4\x12\x94\xad\x59\x95\xfa\x26\x38\x3b\x21\
-\x35\xf7\x1e\x3e\x4c\x06\x5f\x7f\xb1\x38\x1e\x5a\x88\x03\x0f\xca\
-\xf3\x8d\xd8\xce\xb0\x73\xfd\x62\xb1\x03\x96\xca\xab\x17\x8a\xed\
-\xa1\x05\x62\x7b\x78\x91\xa4\x2c\xbf\xbf\x7e\xd2\xdd\xb7\x95\x8e\
-\xbe\xed\xe6\xb4\xe1\xb7\xde\xfa\x9d\x4f\x53\xd5\xd2\xd2\xfa\x9e\
-\x34\xf4\xaa\xab\xfa\x0c\xbd\xe9\xaa\x89\xc3\x6f\xbc\x72\xee\x84\
-\x7b\x6e\xfe\x20\x75\xd9\x62\x49\x5e\xb1\x58\x6c\x0f\x2e\x31\x81\
-\xb9\x14\xa9\x27\x47\x95\xe4\xbc\x54\x6e\x46\xd9\x0a\x71\x3d\x94\
-\x23\x31\x17\xcf\x90\x6e\xa1\x51\xd2\x75\x50\x10\x12\x25\xd2\x21\
-\xd2\x96\x4a\x8b\x80\x5f\x63\xba\x54\xc0\x64\xca\xe4\x63\xc0\x05\
-\xf7\xbb\xf1\x3d\x00\x2b\xc7\x54\x7a\x00\x40\xbe\x23\xc6\x4a\x58\
-\x5c\x02\x4a\x69\x40\x4a\x41\x8b\x76\x02\x5c\x30\x6f\x99\x04\x01\
-\x4b\x5a\x41\x13\x09\x93\xc0\x8c\x25\x30\x15\x20\x0d\xc0\xc5\x98\
-\x36\xa0\x69\xb8\x31\x69\x02\x9e\xca\x00\xac\x05\x4c\x05\x46\x96\
-\xf0\xee\xd0\xc4\x67\x33\xc9\x12\xc4\x5c\x36\x97\x17\xcd\x72\xde\
-\x5a\xa7\x44\xbb\x84\x4f\x4e\x12\xbf\x51\x13\xa4\x7f\xf4\x70\x94\
-\xef\x91\x06\xf0\xf1\xfd\xf8\xfd\xf9\x1d\x79\xab\x92\x27\x60\xaa\
-\x3a\x85\x4c\x60\x2a\x73\xa8\x12\xdc\x15\xef\xef\xe4\x1b\x24\x03\
-\xc6\x8e\x94\xb1\xb7\x5f\x25\x4e\x6e\x63\x80\xd3\xbe\x7e\x91\xd8\
-\xd6\x01\x94\x6b\x16\x8a\xfd\xe1\x85\x92\xf2\xc0\x02\x49\x5a\x39\
-\x4f\x92\x96\xcf\xe5\x29\xa1\x67\x26\xfc\xe4\xa6\x77\x27\xce\xbd\
-\x63\x73\xd8\xf4\x8b\x26\x9b\x3f\x9f\x96\x96\xd6\x7f\x4a\x21\x99\
-\x99\x7e\xc3\x6e\xb8\xea\xde\xd1\x77\x5c\xfb\xf2\xd8\x3b\xaf\x3f\
-\x12\xbf\xe4\x3e\x99\x92\x33\x47\x12\x97\x2f\x90\xe4\x07\x50\x1a\
-\x02\x98\xce\x75\xd8\x99\x37\x64\x23\x09\x15\x48\xfa\x86\x7c\x19\
-\x7d\xeb\x75\xd2\x67\xf0\x50\xe9\xe2\xe5\x2f\xdd\x7d\x98\xb4\x8c\
-\xf2\x54\x75\xc2\x98\xa0\x64\x09\x6b\x00\xd3\x48\x9a\x7c\xdc\x71\
-\x60\x80\x74\x62\x59\x0a\x48\xfa\x8d\x1a\x27\x11\x93\x13\x64\x70\
-\x52\x2a\x52\xa4\x05\x3c\x02\xce\x32\xa0\x65\xc2\xd2\x1d\x98\x96\
-\x63\xac\x84\x69\x5a\x41\x93\x69\xd3\xfc\x7b\xeb\xd6\xba\xdf\xf2\
-\xf1\x60\xf3\xfd\x31\xf8\x7c\x03\xb4\x4d\x9f\x15\x83\x14\x4b\x40\
-\x1a\xf0\xc5\x6b\xd6\xdf\x02\xae\x6c\x27\xb5\xe0\xca\xb4\xcb\xa6\
-\x82\x80\xd1\x13\x55\xf3\x01\xdb\x3c\x79\x96\x90\x2a\xdd\x1b\xb7\
-\x09\x9b\x1e\x22\xe1\x28\x65\xa6\xcc\xc6\xe4\x89\x32\xbe\x33\xde\
-\xdf\x31\x20\x48\x7c\x93\xa6\x48\xc2\xa2\xbb\x91\xde\x73\xc5\xb6\
-\x01\x07\x2b\xa6\xcb\x07\x17\x4a\xea\x2a\xfc\x0e\xcb\xe7\x49\x42\
-\xfe\xfd\x32\x39\xfb\x27\x12\xb7\xe0\x4e\x99\x74\xcf\x6d\x67\xc6\
-\xdc\x7e\xfd\xa3\x21\xd3\xa7\x27\x98\x3f\xa3\x96\x96\xd6\xbf\x5b\
-\xd1\x69\xb3\xfc\x07\x5f\x75\xd9\xc2\x11\x37\x5f\xb5\x6b\xcc\x9d\
-\xd7\xcb\xb8\x7b\x6f\x92\x89\xd8\x21\xe3\xb3\xef\x13\x94\xe5\x48\
-\x37\x04\x26\xd3\x65\xae\x64\x6c\xca\x97\xc9\x59\x77\x8b\xd7\xe4\
-\x38\xe9\x3c\x28\x58\xba\x79\x87\x18\x50\xf4\x35\xe0\x40\x58\x5a\
-\xa9\xd2\xdd\xec\x1d\xef\x38\xc0\x5f\xfa\x05\x47\xca\x8c\xeb\x6e\
-\x96\x1b\xe6\x2d\x96\x09\xd3\x66\x49\xc4\x94\x24\x23\xed\x59\x30\
-\x3a\xc7\x4d\xc0\xb4\xe0\x44\x1b\x29\x33\x4d\x01\x73\x30\x3c\xc4\
-\x86\xd7\x79\x4b\xb8\x25\x02\x7e\x09\x28\xc1\xe1\xa8\x29\xc9\x12\
-\x99\x80\x52\x9c\xc6\xfd\x28\x7e\x1e\xee\xc7\x24\xa6\x20\x55\x02\
-\xd2\x48\x8d\x43\x00\xc5\x21\x2c\xbb\x95\x4d\x10\xe3\xf3\xa2\xe1\
-\x28\xac\x43\x14\xde\xd7\x6c\xfd\x4c\x60\x5a\x56\x25\x3c\xd3\x2e\
-\xcc\x14\x1a\x1e\x9f\x24\xde\xc3\xc7\x48\xef\x90\x68\xe9\xc2\x0e\
-\x2b\xd5\x93\x8f\xa4\xe9\x07\x38\xaa\x04\x1e\x89\x52\x9e\xe9\x93\
-\x30\xe5\x2d\xc1\x69\xa4\xd1\xae\x38\xf0\xf4\x8e\x1a\x2c\x83\x2f\
-\x9f\x25\xce\x07\x16\x8b\x0b\x07\xa9\x54\x00\x33\x79\xc5\x3c\x49\
-\x2c\x98\x23\x71\x39\xf7\xc8\xa4\x45\x77\xca\xc4\x39\xb7\xcb\x84\
-\x7b\x6e\x95\xd1\xb7\xdd\x70\x36\xec\xa2\x99\x4f\x84\x67\xce\x48\
-\x32\x7f\x4e\x2d\x2d\xad\x7f\x97\xc2\xd3\xd3\x83\xc2\xa7\x4f\x5f\
-\x12\x7b\xf9\xa5\xbb\x87\xdf\x7c\x8d\x0c\xbf\xed\x1a\x19\x79\xcf\
-\x8d\x32\x6e\xfe\xed\x12\x97\x75\x8f\x24\x14\xce\x97\x94\x87\xb2\
-\xb0\xe3\xe6\x89\x6d\xd5\x12\x89\xbc\x6c\xba\x74\x0d\x0d\x93\x2e\
-\x3c\xaf\x9b\x90\x54\x65\x28\x80\x40\x68\xb6\x80\xa4\x05\xca\x0e\
-\x9e\xbe\xe2\x1d\x33\x42\xae\xbe\x67\x8e\xfc\xe2\xf7\xaf\xcb\x81\
-\x86\xe3\xb2\xb7\xae\x41\xee\x2e\x5c\x06\xb8\x24\x28\xa0\x35\x87\
-\x64\x93\x0d\x98\x32\xf9\xb1\x2d\xd1\xa9\xc0\x38\xd4\x06\xa8\x01\
-\x62\x91\x93\xd9\xbb\x3d\x11\x29\x75\xac\x0c\x1c\x3c\x1c\xe9\x2e\
-\x56\xfa\x85\xf1\xcc\x1c\xc2\x1b\xa0\x0a\x0c\x95\x2e\xfe\xc1\xe7\
-\x98\xcf\xb3\x53\xaa\x47\x70\xb8\xf4\x0e\x8b\x12\xcf\xe8\x21\x32\
-\x68\xe8\x48\xf1\x1f\x3d\x5e\x82\x27\x4c\x46\x5a\x4c\x52\xa9\xd3\
-\x2a\xef\xd9\x39\xa4\xd6\xc1\x0d\x92\xca\xe6\x3a\x36\x96\xfd\x30\
-\xdb\x46\x07\x23\xe9\x0e\x25\xc0\x93\x6c\x12\x38\x66\xa2\xf4\x8b\
-\xe0\xb9\xf0\xe1\x28\xbf\xd9\xe6\x49\x48\x72\xfd\x9a\xdc\x78\x90\
-\xc1\xeb\x74\x37\x40\xb3\x8b\x6f\xb0\x78\x4d\x98\x20\x63\xef\xb9\
-\x59\x1c\x0f\x2d\x91\xe4\x95\xf3\x25\x9e\xe9\x12\xbf\x09\x4f\xc5\
-\x1c\xf7\x93\x9b\x64\xf4\x1d\x37\xc8\x08\xfc\x66\xb1\xd7\x5c\xfe\
-\x65\xd8\xcc\x19\x4f\x85\xa6\x4d\xd5\x13\x08\x6b\x69\xfd\x3b\x14\
-\x9b\x98\xee\x15\x91\x98\x9a\x10\x91\x99\x59\x10\x7d\xc9\xec\xbd\
-\x83\xaf\xb9\x5c\x86\x5c\x7f\xb9\x0c\xbb\xf5\x2a\x19\xf1\x93\xeb\
-\x65\xec\xbc\xdb\x64\xd2\x92\x9f\x48\x52\xc1\x7c\x71\x3e\xb8\x54\
-\x26\xdd\x7b\x8b\xf4\x1f\x33\x4a\x3a\x0d\xf2\x47\x9a\x0c\xc1\x8e\
-\x6d\x40\xb2\x25\x30\x55\x2f\x38\xcc\xe4\xd9\xb1\xbf\x9f\x04\x8d\
-\x18\x2b\x3f\xc9\xce\x91\xdf\xfe\xf9\x7d\xd9\x57\x5f\x27\xfb\x1a\
-\xea\x64\x77\xf5\x51\x39\x72\xf2\xa4\xfc\xe1\xa3\x8f\x64\xd6\x6d\
-\xb7\x49\xf0\xf8\x89\xcd\x20\xd9\x04\x22\xb3\x14\x56\x70\x4c\x00\
-\x7c\x26\x00\x8c\x23\xa4\x5f\x78\x8c\x1a\xdf\xd8\x79\x50\x00\xca\
-\x7b\x3f\xe9\x38\x08\xc6\x6d\x67\x1a\xeb\xd7\xd9\xdb\x5f\xad\x27\
-\xdd\xb1\x15\x77\xf2\xc1\xdf\xe1\x3d\xea\xbe\x77\x80\x61\x2c\xa3\
-\x13\xff\x1e\xf7\xbb\x02\x56\xbd\x00\xd3\xfe\x48\x7a\x7e\x23\xc7\
-\x4a\x78\xdc\x14\x23\x91\x22\x49\xaa\xb6\x55\xc2\x53\xd9\x5a\xcf\
-\xf3\xd9\xe8\x30\x62\x7b\x67\xd0\xb8\x78\xf1\x88\x1a\x26\x5d\xb1\
-\x8d\x54\xea\xe4\x64\x22\xa6\xd9\x8e\x6b\x00\x13\x30\xf5\x65\xdb\
-\x2e\xcf\x57\x67\xe7\x19\xde\x87\xef\x1a\x3c\x35\x5d\xe2\x97\xdc\
-\x23\x49\xf9\xf3\x24\x7e\xe1\x4f\x64\xe2\x7d\xb7\xcb\xe8\xbb\x6e\
-\x94\x91\xb7\x5e\x27\x43\xaf\xbf\x4a\xa2\xaf\xbc\x4c\x22\x2e\xbe\
-\xe8\xab\xf0\xe9\x33\x9e\x0e\x77\xa6\x5f\x14\xe9\x72\xe9\xc9\x37\
-\xb4\xb4\xbe\x2f\x85\x25\x27\x47\x85\x39\xd3\x72\x22\xa7\x4e\xfd\
-\x7d\xf4\xcc\x99\x35\x31\x97\xcc\x96\xc1\x57\x5c\x22\x43\xaf\xbd\
-\x5c\x86\xdf\x72\xb5\x8c\xfc\xc9\x0d\x32\x7a\x2e\x80\x99\x75\xaf\
-\x24\x2d\xbd\x4f\xa2\x2e\x9a\x2a\xdd\x83\x39\x16\x32\x08\x65\xa3\
-\x31\x8d\x1a\x01\xd9\x1a\x30\x7b\x60\x27\xef\x34\xc0\x4f\x82\x87\
-\x8f\x97\xb9\x05\xab\xe4\x8d\xbf\x7d\x02\x50\xd6\xca\x9e\xda\x6a\
-\xd9\x55\x5d\x2e\x9f\xd7\x54\xca\x9e\xea\x2a\xd9\x7b\xb4\x4a\xaa\
-\xcf\x9e\x91\xd2\x67\x9f\x91\x71\xd3\xa7\x4a\x70\xdc\x64\x05\x21\
-\xb6\x29\xd2\x91\x28\x6b\x83\x90\xce\xbc\x62\x86\x49\x4f\x40\xa5\
-\x2b\xe0\xd8\xc9\x0b\x50\x83\x2d\x30\x12\x88\x04\x5c\xa3\xf1\xb8\
-\x0b\x6e\x2d\x37\x7b\xcd\xcd\xee\xaf\x75\xf1\x09\x6c\x7c\x7f\x37\
-\xdc\xef\x0e\x77\xe3\xe3\x81\x58\x16\xac\x00\x0c\xc0\xf6\xc0\x3a\
-\x0c\x40\x12\x0d\x18\x3d\x4e\x22\xe2\x13\x55\xea\x6c\x4c\x9f\xa6\
-\x0d\xc0\x03\xa8\xe6\x7d\xa3\xfd\xd3\x61\x26\x64\x36\x27\x38\x25\
-\x74\xc2\x14\x24\xda\xa1\x00\x67\x88\x02\x33\xc7\x98\x36\x4e\x49\
-\xa7\x80\x89\xed\x49\x73\x5b\xb2\x54\xf7\x65\x2a\x0d\x93\xfe\xa3\
-\x47\xcb\xe8\x1b\xae\x92\xf8\x45\xf7\xca\x98\x7b\x6f\x95\x51\xb7\
-\x5e\x2f\x43\xae\xbb\x52\x06\x5f\x75\x99\x44\x5d\x7a\xb1\x84\x5f\
-\x34\x53\x00\xcc\x6f\x42\xa7\x4d\xff\x20\xdc\x95\xf1\x58\x84\x2b\
-\x23\xa3\xcd\xac\x59\xed\xcd\x9f\x5c\x4b\x4b\xeb\x9f\x51\x48\x82\
-\x2d\x26\x34\xc9\xb6\x32\xc6\x95\x51\x1e\x3b\x63\xa6\x44\xcd\x98\
-\x21\xd1\xb3\x67\xc9\x90\xcb\x2e\x91\x61\x57\x5f\x2a\xc3\x6e\xba\
-\x52\x46\xdc\x7d\x83\x4c\x98\x7b\xa7\x8c\xbc\xe9\x5a\xa4\xca\x31\
-\x46\xaa\x44\x69\xed\x3e\xa6\xb2\xa5\x09\xcc\x8e\x03\x50\x7a\xc7\
-\x0e\x93\x3b\xb3\x72\xe5\xf5\x8f\x3e\x93\xbd\xb5\xf5\xf2\x39\xd2\
-\xe4\x2e\xc0\x71\x57\x75\x85\x02\xe6\xee\x6a\x03\x98\xf4\x21\x80\
-\xf4\xf3\x63\xd5\x32\x7f\xf5\xc3\x28\xcb\x93\x24\x74\x62\xbc\x4a\
-\x74\x7d\xc3\xa3\x15\xa4\x54\xe2\x83\x09\xae\xae\x84\x97\xe5\x16\
-\x60\xfc\x47\x76\x07\xa5\x7a\xec\xfe\xf7\x00\xa4\x7a\x1d\xcf\x75\
-\xf5\x26\x2c\x03\xd5\x6d\xe3\xeb\xca\x4c\x9e\xbe\x2a\x85\x32\xcd\
-\x76\xf5\x0f\x92\xbe\x11\x31\x6a\x5d\x55\x87\x15\x52\xe6\x60\x05\
-\x4a\xa6\x4f\x94\xe2\xee\xf7\x61\x95\x44\x15\x38\x09\x50\xc2\xd4\
-\x86\x54\x3d\x59\x3c\x22\x87\x2a\x18\x76\x57\xdb\xd6\x3c\xe0\x00\
-\x96\x6c\x0f\xee\xa9\xda\x3d\x8d\x6d\xcb\xc4\xde\x83\x6d\xc5\x48\
-\xbd\x81\xf6\x14\x19\x73\xfb\x8d\x32\x1a\x1e\x7c\xed\x95\x12\x7d\
-\xf9\x25\x00\xe6\x6c\x89\xb8\x68\x96\x44\xe0\xf7\x0c\x4f\x9f\x2a\
-\xd1\x69\x53\x25\xc2\x99\xf1\x7c\x98\x2b\x63\x5a\x7c\x7c\xfc\xf7\
-\x72\xb9\x63\x2d\xad\xff\x39\x85\x27\xda\x87\x84\x24\xd9\x1e\x8a\
-\xb4\xbb\x2a\xa3\xd3\x32\x25\x32\x03\x9e\x3e\x5d\xa2\x91\x4e\x86\
-\x60\xa7\x1b\x7a\xd5\xa5\x32\xfc\xe6\xab\x65\xcc\x1d\x37\x48\xc4\
-\xf4\x0c\xe9\x1e\x16\xa1\x80\xc5\xf3\xbe\xb9\x23\x1b\x43\x82\xdc\
-\x20\xe9\x6f\x0c\x3e\xef\x3c\x30\x50\x7a\x07\x86\xc9\x95\x77\xdd\
-\x23\xaf\xfe\xe9\xcf\xb2\xaf\xae\x4e\xf6\x1c\x3b\x06\x50\x56\x2a\
-\x58\x7e\x5e\x55\x25\xbb\xab\x2a\x65\x37\x1e\x5b\xb0\xdc\x87\xc4\
-\x59\x71\xea\x04\x00\x5a\x2d\x39\xeb\xd6\x4b\xc0\xf0\x31\xd2\x01\
-\xc0\x65\x82\xec\xe8\x45\x38\x35\x87\x22\x13\x26\x6f\x55\xe2\x33\
-\xc1\xe9\xfe\xfa\x77\x37\xa0\x88\x65\x36\x2e\xcb\x5c\xbe\x4a\x96\
-\xe7\x00\x99\x8f\x01\x6e\xcb\x3e\x04\x28\xd2\x2e\xde\xd7\xdd\x2f\
-\x58\xfa\x47\x0c\x91\xe0\x31\x71\x12\x9b\x60\x97\x21\x49\x69\x00\
-\xa8\xab\x11\x96\x06\x40\x91\x30\x53\x8d\x14\xaa\x3a\x91\x00\x4c\
-\x35\x3c\x29\xc9\x21\x41\x63\xe3\xa4\x4f\x48\x34\xd2\x6d\x30\x0c\
-\x48\xa2\x24\xe7\xb6\x6e\x2c\xd3\x09\x4c\x8e\x30\xe0\xf6\xc6\xf3\
-\x5d\x91\x48\xfb\x0d\x1f\x29\xb1\x17\x5f\x24\xc3\x6f\xb8\x46\xa2\
-\x2e\xbb\x58\x22\x71\x3f\x82\x09\x73\xda\x0c\x89\x74\x65\x12\x96\
-\x12\x8d\xdb\x70\x87\xeb\xa5\xd0\x14\xd7\xcc\xe8\x59\xb3\x3a\x99\
-\xff\x02\x5a\x5a\x5a\x17\xa2\xb0\x94\x94\x61\xa1\xc9\xb6\x35\x61\
-\x29\xf6\xea\x08\xbb\x53\x22\x9d\x69\x00\x66\x06\xc0\x98\x29\x51\
-\xb3\xa6\xc9\xe0\x4b\x2e\x92\x11\xd7\x5e\xa1\xa0\x39\x28\x6e\x92\
-\x74\xf6\x33\xe6\xa3\x64\x02\xe2\x4e\xca\xb2\xdb\xda\x81\x55\xef\
-\x2e\xca\xc5\xce\xde\x6c\x67\x0b\x97\x29\x33\x2e\x91\x27\x5e\x7e\
-\x59\x76\xd7\xd6\xc8\xee\x63\x47\xe5\xb3\xa3\x48\x93\xf0\xe7\xa6\
-\x77\xc3\x7b\x00\xcb\xbd\x48\x97\xfb\xeb\x8e\xc9\x91\x93\x27\xe4\
-\xfd\xfd\x7b\xa5\x70\xe3\x46\x19\x9e\x98\x04\x60\xf9\x4a\x87\xfe\
-\x3e\xf8\xbc\x26\x48\x11\x90\x8d\x90\x74\x7b\xbe\xd1\x83\x08\x3c\
-\xae\x63\x2b\xaf\x99\x66\x1b\xa7\x02\xac\x9b\xd5\x72\x01\xf8\x6e\
-\x03\xf1\xdd\x70\xeb\xfe\x39\xca\xbc\xef\xfe\xb8\x15\x77\x45\x2a\
-\x6d\x34\x1e\xf3\x73\x08\xcf\x1e\x38\x68\x0c\x1a\x3a\x4a\x35\x27\
-\x18\xc3\x95\xd8\xce\x69\x94\xe3\x2a\x61\xb2\xd7\x3d\x95\xb7\xc6\
-\x7d\x9a\x3d\xf2\xd1\x89\x0e\xf1\x1d\x39\x41\x7a\x06\xc7\x48\x17\
-\x42\xd1\x97\xdb\xdb\x28\xd5\x79\x76\x94\x71\x70\x62\x67\x11\x6e\
-\x55\xe7\x11\xd2\x66\x68\x94\x84\x00\xbc\x43\xaf\x40\x49\x7e\x31\
-\xd2\xe5\xcc\x19\x12\x9e\x39\x4d\x01\xd3\x82\x66\xa4\x13\xd0\x4c\
-\x4e\x7b\x39\x3c\xd5\x31\x3b\xd4\x6e\xff\xce\xd7\x13\xd2\xd2\xfa\
-\x9f\x93\x7f\x5c\x4a\x50\x78\x62\x8a\x23\x2c\x21\x69\x23\x80\x59\
-\x13\x6e\x73\x4a\x44\x2a\x80\x69\x77\x49\x44\x3a\x3c\x0d\x69\x64\
-\xd6\x74\x19\x7a\xf9\xc5\x12\x31\x35\x43\xfa\x0e\x1e\xaa\x4a\xcf\
-\x2e\xbe\x80\x01\x76\x5a\x02\xd3\xb0\xb1\xd3\x72\xe7\xe5\xfd\xf6\
-\x03\x02\x55\x1b\xe3\xca\xb2\xed\xf2\x71\x65\x95\xec\x05\x08\x59\
-\x6e\x5b\xfe\x9c\xa5\x37\x13\xa5\xe9\x03\x75\x35\x52\x75\xf6\xa4\
-\xfc\x79\xf7\xe7\xb2\x70\xe5\x2a\x09\x1f\x3b\x41\xda\x79\x0e\x94\
-\xf6\xfd\x07\x01\x38\x4c\x6e\x6e\x40\x82\xbb\xb9\x81\xac\x65\x49\
-\x6d\xa4\x43\xc0\xd2\x02\x26\x60\xd5\x71\x80\x8f\xb4\xf5\x18\x20\
-\x6d\x7a\xf7\x97\xb6\x7d\x06\x4a\x07\x0f\x5f\xa4\xc5\x40\xe9\x0e\
-\xf7\x00\x5c\xbb\xc3\x5d\x07\x62\x39\x9e\x80\x73\xbf\x41\xd2\x96\
-\xef\x83\x3b\xf4\x1b\x28\x9d\x01\xeb\xce\x6c\x1b\xc5\xe7\x59\x9f\
-\xc3\x75\xa0\x9b\x3e\xf3\x5c\x13\x98\xee\x8f\x09\x64\x36\x23\xa8\
-\xc9\x36\xa2\x62\x25\x78\xec\x44\xd5\x61\xa5\x86\x41\x99\x80\x8c\
-\xc2\xb6\xb7\x86\x49\x19\xe0\x64\x99\xce\xd7\xd3\x25\x22\xde\x26\
-\x03\x87\x8c\x95\xae\x6a\x5c\x26\xa0\x69\x96\xe5\x8d\x36\x87\x6d\
-\xa9\x89\x47\xf0\x9b\xf0\xd6\x77\xec\x24\x19\x3a\x73\xa6\x44\x4d\
-\x9f\x21\x61\xa8\x1a\x22\x00\x49\x82\x32\xd2\x81\x83\xa1\x3d\x5d\
-\xa2\x70\x3f\xca\xee\xfa\x6d\x78\xb2\xe3\xfa\xc8\x54\xd7\x48\x9d\
-\x36\xb5\xb4\xce\xa3\x90\xc9\xb6\xf1\xc1\x09\xb6\xb5\x21\x09\xa9\
-\x6f\x85\x26\xa5\x9e\x0a\x47\xea\x41\xda\x50\xc0\x8c\x70\xb8\xb0\
-\x83\xb9\x50\x92\x67\xca\xe0\x8b\x66\x88\x7f\x42\x82\x74\x0b\x46\
-\x62\x24\x60\x58\x1e\xfa\xc2\xd8\x29\x99\x26\x0d\x60\x1a\x83\xce\
-\x3b\x03\x52\x9c\xe1\xe7\xca\x9f\xcc\x95\x9d\x9f\x7d\x22\xfb\x1b\
-\x00\xca\x1a\x94\xdc\x4c\x91\x66\xb9\x6d\xf8\xa8\xf2\xfe\xda\x63\
-\x28\xbd\x4f\xca\x1f\x3f\xfb\x54\xee\xcf\xcb\x91\xc0\x61\x43\xa5\
-\xbd\x87\x97\x6a\xef\xe4\x99\x41\xdd\x38\xb3\xba\x4f\x0b\x10\xc1\
-\xff\x08\x98\x9d\xbd\x02\xa5\x9d\x87\xb7\xb4\xe9\x3b\x00\xef\xf3\
-\x97\xe0\xe1\xa3\x25\x75\xd6\x6c\xb9\x65\xee\x7c\x29\xdc\xb0\x49\
-\xb6\x3e\xfd\x0b\xf9\xc5\x6f\x7f\x2b\x2f\xbe\xf9\x86\xfc\x66\xe7\
-\xeb\xf2\xd2\x9b\xaf\xcb\xaf\x5f\xff\xbd\xfc\xec\xa5\x17\xa5\xe4\
-\xa7\x3f\x95\xfc\x35\x6b\xe4\xe6\xfb\xef\x17\xdb\x8c\x8b\x24\x72\
-\xd4\x38\xe9\x8d\x03\x44\xbb\x3e\x03\xa4\x5d\x5f\x2f\xe9\x04\x80\
-\x76\xc3\x32\xd5\x3a\x34\xfb\x5c\xc3\x2a\xad\x7e\x4b\x93\x40\x57\
-\x96\xf0\x5e\x00\x36\xde\xc7\x61\x4b\xec\xdd\x8f\x49\xb4\x19\x69\
-\xd2\x0d\x98\x86\x5d\x48\xa1\x48\xfb\x49\xf8\x2d\x70\x1b\x9d\x9c\
-\x2e\x41\x13\x93\xa4\x4f\xd4\x50\xe9\x02\x60\x72\xc2\x91\x6e\x04\
-\x24\x61\x09\x5b\x29\xdf\x48\x9d\xfc\x5d\x42\xa5\x7f\xcc\x70\x89\
-\x71\xa4\x4b\x74\x06\x12\x26\x93\xa5\x09\xcb\x70\xd3\x11\xb6\x74\
-\x09\x4b\x4d\xfb\x2c\x3c\xd5\xf9\x6c\x58\xaa\xeb\xca\x88\x8c\x8c\
-\x0b\xbe\x8e\x90\x96\xd6\xff\x84\xc2\xa7\x38\x26\x86\x26\x24\x6d\
-\x89\x48\xb6\x9d\x08\x4f\xb2\x49\x58\x62\xaa\x84\xe1\x96\xd0\x8c\
-\x40\xca\x8c\x04\x30\xa3\xd2\xb1\x73\xb9\xd2\x64\xd0\xc8\x71\xea\
-\xcc\x94\xce\x28\xc1\xd5\x75\x6c\x60\xe3\x1c\x69\x40\x32\x90\xa7\
-\xf6\x85\x23\x71\x86\x4a\x47\x94\xb1\xc3\x92\xec\xb2\xfd\x57\xbf\
-\x92\xfd\xc7\xeb\x64\x4f\x5d\xb5\x91\x24\x01\xc8\xbd\x35\x47\x51\
-\x72\x03\x94\xb8\x35\x40\x59\x2b\x55\x67\xce\xc8\x9f\x3f\xdf\x2d\
-\xf7\xe6\xe4\x8a\x1f\x92\x6b\xbb\xbe\x9e\xd2\xb1\xff\x40\x40\xa5\
-\x65\x07\x8b\xd5\x46\xd8\x3a\x80\x2c\x13\x54\xed\x01\xb3\xb6\x48\
-\x85\x7d\x82\x22\x64\x52\xda\x54\x99\x57\xb0\x1c\x60\x7c\x4d\x3e\
-\x3c\x70\x40\x0e\xd5\xd7\x4b\xc5\xe9\x13\x52\x79\xe6\x38\x20\x5d\
-\x2f\xe5\x27\xea\xa4\xfc\x78\x6d\x93\x4f\xe2\x31\x9f\x3f\x59\x2f\
-\x95\x27\x1b\xe0\xe3\x72\x08\xcf\x7f\x72\xe4\xa0\xbc\xf2\xce\xdb\
-\xf2\x40\x51\xb1\x4c\xbb\xf2\x6a\xf1\x8f\x1d\x82\x84\xda\x5f\xad\
-\x6f\x17\x2f\x03\x9e\x84\x72\x6b\xeb\xf4\x8f\xcc\x52\xbd\x03\xe0\
-\xd9\x1d\x07\x23\x8e\xf3\xe4\x10\x23\x95\x38\x01\x47\xe5\x24\x40\
-\x32\x11\xc0\x6c\x34\x7e\x17\xc0\x33\x4a\x95\xe9\x13\xa5\x7b\x60\
-\x14\x0e\x28\x3c\x70\x71\xc0\x7b\x53\xb3\x88\xbb\xbb\xe3\xb7\xe9\
-\x15\x1c\x25\xa1\x93\x93\x64\x30\xdb\xa6\x2d\x60\xda\xd2\x1a\x6f\
-\xc3\x53\xd3\x24\x0a\xcf\x87\xa7\xb8\x76\x86\xa7\x38\xaf\x43\x89\
-\xde\xcb\xfc\x57\xd1\xd2\xfa\xdf\x56\x58\x42\xca\xe4\xd0\x29\x49\
-\xdb\xc3\x90\x2a\x09\x49\x05\x4b\xce\xbe\x63\x02\x93\x65\x79\x34\
-\x12\x49\x38\x9e\xf3\x88\x1e\x86\x1d\xdb\xb8\x34\x44\x73\x58\x22\
-\xc1\x98\xf3\x4e\x72\xd6\x21\x8f\xd0\x58\xb9\x61\xce\x12\xf9\xf3\
-\xbe\x03\x72\x10\xb0\xe4\xf0\xa0\xdd\x66\x9a\x54\xb0\x34\xbd\xbf\
-\x16\xa5\xf7\x99\x53\xf2\xb7\x43\x87\x64\xc9\x03\x0f\x4a\x10\x92\
-\x5f\xdb\x7e\x03\xa4\x03\x4a\x66\x03\x8c\x06\x78\x8c\xb6\x44\xdc\
-\x57\x20\x32\x3b\x53\x5a\xc0\xc6\x32\x41\xd9\xce\x03\xa5\x33\xca\
-\xdd\x11\x00\xf6\xa2\x55\x0f\xca\xab\xef\xbd\x87\xcf\xab\x01\xf4\
-\x4e\x48\x79\x43\xbd\x1c\x3c\x56\x2d\xfb\xf1\xf9\x07\x8e\x55\xfd\
-\x43\xef\xc7\xba\xef\xc7\x7a\xef\x47\x32\x3e\x70\xac\x52\x0e\xd4\
-\x56\xc9\x61\x24\xe5\x8a\x53\x0d\x72\xe4\x44\xbd\xbc\xbf\x67\x97\
-\x6c\x7e\x6c\x87\x4c\xbd\xe2\x72\xe9\x1f\x1c\xae\x4a\xf7\xce\x48\
-\xc4\xdd\x01\xf7\xee\x58\x1f\xf7\x36\xcc\xd6\xd6\xb7\xa5\x99\x8e\
-\x09\xce\x4e\xf8\xce\x04\x5b\xe0\xe8\x49\xaa\x83\x68\x30\xc0\x18\
-\x43\x60\x26\xa1\x74\x76\x77\x62\xba\x7a\x3e\x26\xd9\x25\xa1\x93\
-\x92\xa5\x4f\xe4\x30\x69\x8f\xe4\xcf\x49\x89\x55\x49\xce\x72\x1c\
-\x90\x6c\x1c\xca\xc5\x0a\x00\xaf\x75\xf5\x0f\x15\x1f\x94\xe8\x31\
-\x6e\x29\x33\x92\x09\x13\xb0\xa4\xc3\x91\x70\xa3\x1c\xb8\x9f\xe2\
-\x7c\x07\x49\xf3\xc6\x80\xcc\xcc\x0b\xba\xf0\x9a\x96\xd6\x7f\xad\
-\x42\x26\xa7\x26\x84\x4d\x49\x7a\x34\x22\x39\xf5\x4c\x63\xb2\x6c\
-\x01\xcc\x48\xec\x34\x81\x71\x09\xd2\x2b\x8c\x17\x1b\xe3\x04\xb7\
-\xa1\xd2\xd9\x2f\xc4\xb8\x0f\x60\x12\x96\x34\xc1\xc9\x33\x7a\x06\
-\x4f\x4e\x91\xd2\x67\x9e\x91\xbd\x0d\x1c\x06\x74\x54\x0d\x11\xda\
-\x0d\xd0\xec\x05\x70\x08\xc9\x7d\x84\x15\x5c\x81\xc4\x76\x00\xc0\
-\x7c\xa8\xa4\x54\xa2\xc6\x8e\x97\x76\xfd\x3c\x4d\x50\x5a\xe0\xe0\
-\x10\x1e\x73\x18\x0f\xc0\x49\x10\x36\x41\x94\x6e\x01\x1a\x82\xd2\
-\x73\x10\xd6\xc1\x4f\xe2\x33\x67\x48\xd1\x93\x4f\xcb\x27\x15\x80\
-\x1b\x3e\xe7\x60\x7d\x0d\x3e\xbb\x52\xf6\xd5\x54\x18\x00\x34\xdd\
-\x1a\x20\x5b\xf3\x7e\x78\x9f\x65\x00\x93\xde\x5b\xcb\xef\x84\xe5\
-\xe0\x3b\x1e\x46\xf2\xe4\x67\xfc\xee\xbd\x3f\xca\xdd\x8b\xb3\x24\
-\x00\x09\xb9\x4d\xef\x7e\xd2\x19\x69\x51\x25\xe3\xef\x00\x4c\x77\
-\x77\xe4\x28\x00\x80\xb3\x2f\x07\xa4\x8f\x8f\x07\x18\x79\x3a\x25\
-\xd2\x9f\x32\x00\xa7\x52\x26\x2a\x00\x24\x4c\xa6\xcc\xf0\xf8\x54\
-\x19\xe9\x98\x2a\x29\xb3\x2e\x95\x41\x38\xb8\xb5\x1f\xe0\xd7\x08\
-\xcd\x66\x49\x13\x8f\xd9\x51\xc4\xdf\x72\xc0\xb0\xb1\x12\x6d\x07\
-\x34\x61\x0b\x96\xee\xd0\xe4\xc1\x32\x32\x35\xed\x3d\xdc\xbf\x25\
-\x3a\x35\xb5\x9f\xf9\xaf\xa3\xa5\xf5\xbf\xa5\xf0\x64\x7b\x52\x58\
-\xb2\xed\x89\xc8\xc4\xd4\xb3\x4c\x8f\x4d\xa0\x4c\x15\x94\xe6\x12\
-\x05\x58\xb2\x0d\xcd\x0f\x29\xa4\x27\x27\xf6\x45\x2a\xb1\x3a\x75\
-\xd8\x33\x4b\xab\xf3\x9e\x91\x2c\x3b\x73\x72\x0c\xbc\xe7\xf2\x3b\
-\xee\x93\x9d\x9f\x7e\x2e\x07\x51\xc2\x7e\x06\x50\xaa\x12\x1c\x40\
-\xd9\x0b\xef\x63\xa2\x04\x28\x0f\x1d\xaf\x97\xa3\x67\x4f\xcb\x73\
-\xbf\x7b\x4d\x26\x3b\xd3\xa4\xa3\xe7\x00\xb3\xf4\xf6\x75\x83\x05\
-\x41\x19\xd4\x04\x4c\x1f\x00\xd3\x87\xa9\xf2\x5c\x50\xd2\xec\x35\
-\xef\xd0\xdf\x5b\x86\x63\xfd\xd7\xee\x78\x4c\x3e\xab\xaa\x46\xb2\
-\xe5\x30\xa4\xa3\xaa\x53\x89\x3d\xee\x7b\xb1\x3e\xee\xb0\xfc\x4e\
-\xc0\x34\x21\xa9\x40\x59\x67\x1a\xf7\x77\x03\xc0\xf4\x1e\xd3\x07\
-\x1b\x6a\x50\xc6\x37\xc8\xdb\x9f\x7c\x24\xb7\x2d\x5c\x20\xfd\x82\
-\x42\x90\x38\x3d\x00\x4d\x7f\x35\xd0\xfd\x42\x3a\x87\x5a\x9a\xdf\
-\xbf\x03\x3b\xba\xfc\x83\x85\xd3\xd8\x45\x21\x6d\xc6\xa6\x30\x69\
-\xba\x14\x28\xc3\xf1\x38\x02\xb7\x21\x71\x49\x32\x24\xd9\x21\x79\
-\xeb\x36\xc8\xa1\xfa\x63\xf2\xc4\xaf\x7f\x2d\xc3\xa6\xd8\xa5\xad\
-\x87\xef\x39\xc0\x54\xa9\xd3\x7c\x8e\x1d\x46\x7d\x63\x46\x4a\x24\
-\x12\x6a\x14\x96\x0b\x38\x36\x83\x66\x24\xcf\x95\x07\x34\x23\x92\
-\x5d\xef\x87\xa5\x3a\xef\x40\x79\xde\xdf\xfc\x17\xd2\xd2\xfa\xdf\
-\x50\x68\x8a\x3d\x35\x3c\xc1\xf1\x14\xa0\xf9\x65\x28\x00\xd9\x32\
-\x59\x46\x02\x96\x51\x28\x67\x7d\x87\x8f\x33\xc6\xf4\x79\x73\xe8\
-\x4a\x84\x3a\x55\x4f\x75\x2c\x10\x9c\xbc\x8f\x5b\x5e\x4a\x22\x74\
-\xec\x44\x59\x56\x5c\x26\xbb\x8e\x1d\x93\x3d\x75\x35\x2a\x55\x7e\
-\xce\x44\x09\x40\x72\x0c\x25\x53\xe5\x81\x63\x35\x72\xf4\xf4\x69\
-\xf9\xdb\xc1\x43\x72\xf3\x9c\xb9\x48\x39\x41\x48\x95\x00\x25\x07\
-\x9b\x9f\x53\x66\x5f\x18\x30\xd9\xcb\xdc\x16\xe5\xb7\xff\xd0\x51\
-\xb2\xf0\x81\x87\xe5\x2f\xfb\x0f\xca\xa1\x13\xc7\x91\x68\xab\xd5\
-\xe7\xb3\x19\x80\x6d\xa5\xfb\x00\xcc\x7d\xdf\x33\x30\xf7\xd4\xf1\
-\x60\x60\x78\x6f\x0b\x1f\x42\xc9\x7e\xe4\x44\x9d\xbc\xf4\xd6\x1b\
-\x92\x76\xe9\x65\xd2\xbe\x2f\xcb\x74\x6f\xd5\x31\x44\xbb\x7f\x87\
-\x0b\x35\x47\x07\xb0\x99\xa1\x77\x48\xa4\x04\xe1\x20\x16\x9d\x64\
-\xa4\xca\x88\x04\x87\x84\x4e\xc6\x41\x6e\x4a\x8a\xdc\x93\x97\x27\
-\x9f\x57\x60\x1b\xd4\xe1\xc0\x04\x68\xbe\xfb\xc9\xa7\x72\xc5\xed\
-\x77\x4b\x27\x2f\x6c\x37\x5e\xa3\x9d\x9d\x71\x1c\xbb\xe9\x06\x4c\
-\x9e\x1d\xd4\xd5\x3f\x42\xfa\x46\x0c\xc3\x32\xf0\xbb\xdb\x9a\xca\
-\x72\x77\xb3\x4d\x33\x22\xc5\xf5\x01\x92\xe6\xdd\x41\x89\xe9\xfa\
-\x82\x6b\x5a\xff\x1b\xe2\xb0\xa1\xf0\x04\xdb\xd3\x91\xc9\xce\xaf\
-\x98\x24\x23\x92\x91\x50\xb0\xf3\x45\x00\x90\xea\xb1\x0d\xa5\x78\
-\xaa\x4d\xbc\x86\x8c\x92\xee\x3e\x00\xa3\x37\x76\x2c\x1f\xee\x68\
-\x3c\xed\xce\x30\xc7\x55\x76\x01\x44\x3b\x23\x75\x4e\x99\x7d\xa9\
-\x3c\xfb\xd6\x9b\x72\xf0\xd4\x49\xd9\x05\x48\x7d\x0e\x30\x59\x6d\
-\x95\x84\xe5\x7e\x00\xf4\xf0\xf1\x06\x29\x3f\x79\x52\x4a\x9f\xfa\
-\x99\x84\x8e\x1c\x2d\x6d\xfa\x78\xaa\x36\x49\xf7\xde\xed\xef\xea\
-\xf6\x28\xbf\x09\x53\xfb\x15\xd7\xc9\x33\x6f\xbe\x23\x07\x4e\x9c\
-\x92\x3d\x1c\xdb\x89\x75\x68\xd6\x56\x0a\xe0\x59\xf7\xf7\xb3\x83\
-\xc9\xf2\xb7\x00\x53\x95\xe0\x16\x24\x01\xdf\xc6\x65\xb5\x6a\x2c\
-\xdf\x0d\x96\xfb\x60\x6b\xd9\xec\x48\xda\x57\x53\x23\x2b\x36\x17\
-\xc9\x80\xb0\x70\x69\xd7\xb7\x1f\xbe\xb3\x9f\x72\xd7\x6f\xed\xb8\
-\xe2\x81\xc1\x38\x88\x58\x90\xb5\x92\xa9\xea\x71\xf7\x0d\x92\x81\
-\xf8\x7d\xa2\xa6\x00\x9a\x53\x9c\x12\x1e\x97\x2c\xb7\x2e\x5e\x2a\
-\x1f\xee\xdf\x23\x87\xeb\xab\x65\x77\xe5\x11\xd9\x53\x55\x0e\x68\
-\x72\xdd\xcb\xe5\xe1\xd2\x12\xf1\x8e\x1c\x26\x9d\x3c\x03\xd4\xef\
-\x68\x41\xd3\x3d\x75\xf2\x12\xc0\xbd\x42\xa2\x25\x38\x3e\x09\xff\
-\x03\xe7\x02\xd3\x80\x66\x26\xa0\x99\xf6\x51\x58\xb2\xeb\xde\x48\
-\x9b\x6d\x90\xf9\x2f\xa5\xa5\xf5\x5f\xa9\xb6\x61\x49\x36\x17\x00\
-\xf9\x0c\x60\xf9\x75\x04\xca\x37\x05\x49\x05\x4b\x0b\x98\x76\x95\
-\x30\x3d\x07\x8f\x90\xae\x2c\xc1\x79\x8a\x9d\x3a\x9b\x84\x3b\x19\
-\xa7\x1b\x33\xa6\x1a\xe3\xb8\xca\x7e\xa1\x83\xe5\xd6\x25\xd9\xf2\
-\xfe\xa1\xfd\x72\xf0\x44\x03\x40\xc9\x5e\xef\x26\x38\x11\x96\x07\
-\x1b\xd8\xfb\xcd\xf1\x94\xbb\xe5\x8a\xdb\x6e\x97\x8e\x1e\x03\xa4\
-\x03\x12\xa1\x05\xcb\x7f\x06\x98\x6c\xab\x6c\xc3\x54\x39\x6a\xbc\
-\x64\x6d\x2c\x92\x0f\x2a\xf0\x59\x0d\x27\x0c\x48\x9a\xb0\x56\xf7\
-\x1b\x21\xd6\x3a\x30\x5b\x42\xd2\xdd\xdf\x07\x30\x15\x34\x91\x6c\
-\x0f\x62\x3b\x1c\xc1\xf6\x79\xe9\xcd\x37\x65\x74\x52\x92\xb4\xe9\
-\xd9\x57\xba\x21\x29\x1a\xe0\x6c\xfd\x3b\xb6\x06\x4c\x77\x1b\xdb\
-\xcc\x5f\xfa\x22\x6d\x06\x62\x3b\xdc\x34\x6f\x91\xbc\xfb\xe9\xa7\
-\x2a\x55\x7e\x5e\x71\x48\x01\x73\xef\x51\xb8\xfa\x08\xd6\xe7\x08\
-\x12\x6f\x8d\x3c\xff\xc6\x1b\x32\x16\xbf\x33\x87\x42\xb1\x13\x88\
-\xa7\x53\xba\x03\x93\x66\xbb\x66\xaf\x90\x28\x40\x33\x19\x80\x74\
-\x49\x78\x32\x60\x9c\xe2\x6a\x04\x26\xef\x47\x32\x81\x26\x3b\x3f\
-\xc1\x6b\x73\xc3\x12\x5d\x17\x74\x5d\x7a\x2d\xad\x1f\x97\x66\xcd\
-\x6a\x1f\x92\x6c\xcb\x40\x09\xfe\x5c\x64\x8a\xf3\x1b\xb5\x23\x34\
-\x82\xd2\x30\x20\x2a\x91\x89\x76\xf1\x8c\x1e\x66\xc2\x92\x97\xb7\
-\x0d\x95\x1e\x1c\xa6\xa2\x12\x09\x92\xa5\x4f\xb8\xb4\xf5\xf4\x93\
-\xa0\xf1\xf1\xf2\xc0\x23\x8f\xcb\xbe\xfa\x7a\x39\x50\x87\x32\x9c\
-\x6d\x84\x80\x87\xea\xd0\xa9\x25\x2c\xd9\x11\x52\xaf\x4e\x67\xdc\
-\xfe\xcc\x2f\x24\x78\xf8\x30\x80\xa2\xb7\x2a\x4b\x59\x82\x37\x07\
-\xa6\xd5\xa1\xd3\x12\x1a\xe7\xba\xa3\x97\x8f\xb4\xe9\xe7\x2d\xa3\
-\x32\x67\xc9\xd6\x57\x7f\x2b\x9f\x23\xb9\xee\x66\x33\x80\x09\x4b\
-\x96\xdd\xec\x88\xd9\x03\x2b\x50\x5a\x36\xe1\xc6\x9e\x71\xcb\x07\
-\x8e\x19\x66\xa7\x8d\x65\xf7\xe7\xf8\x1d\x94\xff\x21\x30\x61\xf7\
-\xcf\x82\xf7\x01\xa2\xfb\x4c\x60\xee\x67\x47\x13\x20\xca\xb4\xf9\
-\xc1\xde\xdd\x32\xfd\xea\xab\xa5\x6d\x9f\x7e\xd8\x06\x1c\x82\xd4\
-\x7a\xca\xe4\xd8\x4c\xcb\xc6\x18\x4f\x77\xfb\x49\x77\x3c\x4f\x77\
-\xc2\xf6\xec\xe1\x13\x20\xd7\xdf\x73\x9f\x7c\xb8\x6f\x1f\xc0\x58\
-\x2b\x9f\x57\x1e\x96\xdd\x55\x48\x98\x47\xb1\x2d\xf0\xf9\x7b\x4c\
-\x68\x1e\x3e\x7e\x4c\xfe\xf4\xf9\x1e\x99\x7d\xc3\x4d\xd2\xb1\xbf\
-\x37\x7e\xd3\x10\x03\x94\x01\xb0\x4a\x9b\x80\x25\xa7\x8f\xc3\xfd\
-\xee\xc1\x11\xaa\xa3\x2f\xdc\x06\x68\x12\x9c\x16\x34\x71\xcb\xff\
-\x1d\x55\xb6\x27\x3b\xff\x1a\x91\xe2\xbc\x5a\x0f\x39\xd2\xfa\xaf\
-\x12\x27\x54\x88\x4c\x71\x4d\xc3\x3f\xf8\xf3\x51\x29\x80\x63\x63\
-\x09\x4e\x3b\x95\xf1\xba\x7a\xec\x11\x01\x58\x02\x94\x06\x2c\x43\
-\x0c\x23\x8d\xf0\x4c\x11\xa6\xcd\x0e\xfd\x03\x64\xe2\xf4\xd9\xf2\
-\xd4\x1b\xbf\x47\x09\x7e\x02\xb0\x42\x09\x8c\xb4\x46\x68\x58\xe5\
-\x37\x7b\x8b\x39\xbe\xf1\xb3\x8a\x23\x72\xc7\x82\x85\xd2\xa9\xbf\
-\x97\xb4\xf7\xf0\x94\x2e\x83\x7c\x01\x09\xc2\xb2\x05\x30\x71\xff\
-\x42\xce\xf5\x66\x0f\x7a\x1b\x0f\x2f\x49\xbd\xea\x3a\xf9\xf5\x5f\
-\x3e\x92\x7d\xa7\x4e\xcb\x2e\xc0\x69\xb7\x95\x2a\x55\xd2\x63\x2a\
-\x34\x60\x49\xd0\x7d\x9b\x0f\x98\x66\x47\x94\xf1\x5c\x8d\xf9\x5c\
-\x0d\x9e\xab\x69\xf6\xde\x73\x00\xf9\x0f\xcd\x75\x69\x4a\x9a\x46\
-\x89\xce\x83\x48\x9d\x3a\x47\xfe\x86\x7b\xee\x91\xf6\x7d\xfb\xe2\
-\xbb\x7b\x63\x7b\x9f\xdb\x36\xcb\x04\x69\x6d\x1f\xab\x84\x77\xb7\
-\x05\x4c\x9a\x63\x3f\xbb\x00\x9c\xce\xd9\x97\xc8\xab\xef\xbe\x23\
-\x95\xa7\x4e\x02\x96\xd8\x1e\x55\x38\x80\xe0\xb3\x78\x10\xd9\x57\
-\x5d\xae\xd6\xe1\x20\x12\x28\xbf\x6f\xd6\x03\x0f\x49\x6f\x4e\x17\
-\x87\xdf\xb4\xb7\xba\x1c\x30\x13\x26\x53\xa7\x91\x3c\xd5\x70\xb1\
-\xa0\x48\x09\xe0\xd5\x35\x39\x2e\x33\x85\x49\xd3\x4c\x9b\x4c\x99\
-\x29\x78\x2e\xd9\x75\x2c\x34\xc5\xb5\x06\xc0\x0c\x31\xff\xd5\xb4\
-\xb4\x7e\xdc\x8a\x8e\x9e\xd5\x29\x22\xd1\x35\x33\x2a\xd9\xf5\x52\
-\x94\xfa\x47\x27\x1c\x99\x26\x79\xa6\x08\x9d\x86\x1d\x22\x43\xc2\
-\xf0\x5a\xdf\xe8\xe1\xd8\x59\x43\x01\x46\xec\x48\x6c\xbb\x64\x2f\
-\x38\x80\xd9\x13\xf7\xbb\x02\x94\x1c\xb7\x77\xc9\x9c\x39\xf2\x87\
-\xcf\x77\xc9\x81\x13\xc7\x55\x0f\x38\xcf\x05\xdf\x4b\x50\xd6\x02\
-\x36\x6c\xab\x3c\x51\x2f\x95\x67\xce\xc8\x2b\x7f\x7c\x4f\x26\x3a\
-\x5c\xd2\xa6\x7b\x6f\x75\x16\x8b\x01\x05\x80\x52\x25\x24\x77\x18\
-\x18\x70\x70\x87\x45\x6b\xe6\xa9\x8c\x6d\x3c\x07\xca\xb4\xdb\xef\
-\x90\xdf\x7d\xfa\x89\xec\x3f\x79\x42\x3e\xaf\xa9\x56\x9d\x3a\x2a\
-\xcd\x99\xd0\x56\xbd\xf1\x6e\xa5\xf4\xb7\xf9\x20\xd6\xf9\x48\x43\
-\x1d\x52\xf0\x71\xac\xf3\x29\xa9\x3c\x7d\x5a\xaa\xb0\xdc\xca\x13\
-\x27\xa5\x82\x3e\x65\x3c\x47\x1f\xc1\xf7\x3d\x00\xd8\xf0\xa0\x70\
-\x2e\x1c\x5b\x73\x6b\xc0\x64\xb9\x8f\xcf\xad\xaf\x55\xa9\xfc\x8e\
-\x85\xf3\x01\x4d\x26\x4d\x6e\x9f\x7f\x1e\x98\x74\x57\x40\xb3\x43\
-\x5f\x4f\x89\x1d\x3f\x41\x4a\x9f\x7c\x4a\x8e\x1c\xc7\xfa\x62\xfb\
-\xec\x43\xca\x34\x80\x49\x1b\xeb\xc1\x31\xa8\xec\x90\xda\x86\xe4\
-\xef\xc7\xdf\xdc\x2b\x58\x5d\x0e\xc3\x80\xa6\x51\xa6\xab\xf1\xb4\
-\x3c\x50\x06\x46\x49\xc0\xc4\x04\x89\x70\x4b\x9a\x61\xb8\x55\x06\
-\x48\x43\x92\x9d\xbb\x43\x53\x1c\x8b\x23\x6c\x99\x81\xe6\xbf\x9c\
-\x96\xd6\x8f\x53\x9c\x40\x21\x2a\xc9\x31\x1b\x50\x7c\x39\x26\x25\
-\xdd\x0d\x92\x4d\xe6\x98\xbe\xe8\x44\x97\x78\x44\x8d\x90\xce\x48\
-\x1b\x5d\x60\x76\xf2\x70\x26\x1c\x0e\x1b\xea\x01\x60\x76\xf2\xf0\
-\x43\x99\x3e\x5c\xee\x5b\xb7\x4e\xfe\x82\x1d\xef\xc0\x09\x94\x7d\
-\xd8\xf1\x0c\x38\x21\x8d\xa9\x54\x79\x0c\x60\x39\x25\x07\x1b\xea\
-\x65\xcd\xd6\x6d\xe2\x15\x1a\xa9\xda\xea\xd4\x40\x73\xa4\x47\x05\
-\x05\x98\xe5\xb8\x35\xe3\x0f\x93\xa5\x32\xdf\xe3\x06\x8b\x96\xe6\
-\x6c\x44\x6d\x3c\xbd\x64\xea\xdd\x77\xca\x2b\x9f\x7f\x26\x07\x00\
-\xb5\x3d\x0a\x96\xd5\x48\x96\x4d\x00\x6b\x0d\x8a\x2d\xbd\x1f\xc0\
-\x2b\x3f\xd9\x20\x47\xb1\xae\xfb\x8e\x1e\x95\x37\xff\xf2\x81\x3c\
-\xf6\xcb\x5f\x4a\xee\x83\x0f\xca\x8d\xf7\xdc\x2b\xb3\x90\x5e\x33\
-\x2e\xba\x54\x32\x67\x5f\x26\x33\xaf\xbe\x4e\x6e\xb8\xfb\x5e\x59\
-\xba\xea\x01\xd9\xf1\x8b\x5f\xc8\x1b\x78\xef\x5e\x80\x99\x83\xdf\
-\x0f\x71\x72\x63\x7c\x26\x07\xb4\x37\xc2\xba\x85\x9b\x3a\x97\xaa\
-\x5a\x40\xf3\x68\x23\xac\x6f\xc6\x01\xa8\x7d\x3f\x0f\x6c\x07\xa3\
-\x3c\x37\x0c\x60\xba\x7d\xff\x26\x70\xb6\x66\x77\x90\xfa\x62\x59\
-\x9e\xd2\x3f\x38\x54\xe6\x66\xe7\xca\x9e\xca\x4a\x39\x8c\xcf\xd8\
-\x8b\x74\xa9\x9a\x2a\x78\x9e\xbe\x5a\x5f\xa3\x8d\x96\x67\x31\xbd\
-\xb4\xf3\x0d\x89\x1e\x1f\x87\xdf\xc3\x17\x90\x6c\x6a\xd3\x54\x63\
-\x6b\x99\x34\x59\x61\x04\x33\x69\x4e\x51\xd0\xb4\xda\x32\x55\x7b\
-\x26\x01\x0a\x68\x86\x26\xbb\xf6\xe2\x80\x9b\xad\x93\xa6\xd6\x8f\
-\x56\x2c\xc3\xc3\x53\x1c\x13\x91\x2c\x9f\x8b\x4d\x4d\x07\x18\x79\
-\x0a\x5d\x9a\x32\x41\x19\x01\xf3\xf4\xb7\x68\x24\x06\xcf\xa8\xe1\
-\x06\x20\x39\x63\x37\xdb\x2b\x69\x73\xda\xb0\x36\x7d\x07\x89\xdf\
-\xc4\xc9\xf2\xe0\xb3\xcf\xc8\xae\xe3\x0d\xb2\x8f\x93\x66\xd4\x60\
-\xe7\x43\xd9\xbb\xbf\xfe\x28\x52\x57\xb5\x1a\x42\x53\xf3\xc5\x19\
-\x75\xba\xe1\xd5\x77\xdd\xa5\x00\xd0\x1e\x69\xd0\x82\xe5\xbf\x02\
-\x4c\x0e\xa3\x61\x8f\x7a\xfa\xad\xb7\xca\xcb\xbb\x3e\x91\x3d\x28\
-\x37\x3f\x47\xb9\xbc\x07\x40\xda\x6d\x5a\x81\xbb\x15\x38\xba\x9b\
-\x89\xae\xf2\xf4\x49\x80\xac\x5a\x9e\x7d\xf5\x77\x72\xc7\xfc\xc5\
-\x32\x3a\x21\x55\xfa\x05\x86\x21\xe5\x79\x49\x9b\xde\x1e\xf8\x1c\
-\x0f\x69\xdb\xb7\xbf\x1a\x02\xd4\xbe\x5f\x7f\xdc\xf7\x54\x63\x28\
-\xe9\xf6\xfd\xbc\xc4\x03\x40\x19\x9f\xec\x90\x39\x4b\xf3\xe4\xc5\
-\xdf\xbf\x21\x07\xaa\x6b\xa4\xe2\xf8\x09\x80\x93\xe0\x46\xa2\x34\
-\x41\xa9\x0c\x50\xee\x43\x59\x7c\x3e\x60\x5a\xd0\x3c\x08\xf0\x5e\
-\x7c\xd3\x8d\xd2\xd1\xa3\xbf\xda\x3e\x17\x0a\x4c\x63\xdb\xb9\xc3\
-\xd2\xb2\xaf\x74\xea\x3f\x10\x89\xd3\x5b\xa6\x5e\x76\xb9\xbc\xf3\
-\xd7\xbf\xc8\xd1\x53\x0d\xaa\xc7\x9c\x25\xba\x05\x4c\xb6\xaf\x72\
-\x10\x7f\xe5\xc9\x7a\x79\xe7\xd3\xbf\x4a\x7c\x46\x86\x9a\x85\x9e\
-\xcd\x2f\x4d\xc0\x34\xac\x66\x43\xe2\x50\xa6\xb8\x44\xd5\x7b\xee\
-\xde\x09\x44\x73\xc0\x3b\xe0\x79\x00\xe5\x79\x5e\xb0\xcb\x15\x66\
-\xfe\x0b\x6a\x69\xfd\x78\x34\x32\x2d\xad\x5b\x64\x92\xf3\xd6\xa8\
-\x24\xd7\x6e\x55\x76\x9b\x89\x12\x00\x35\x80\xc9\xf2\x1c\xff\xec\
-\x1e\xb1\xa3\xb0\x73\x9a\x25\x38\x6f\x39\xb7\x22\xdb\x2b\xe1\x36\
-\xfd\x7c\x24\x3a\x23\x53\x4a\xdf\x7c\x4d\x76\xa3\x6c\x25\x2c\x39\
-\x58\x9b\x63\x10\xf7\xd7\x01\x42\x80\xe5\x61\xa4\xcd\xea\x2f\x4f\
-\xcb\xab\x7f\x7c\x57\xe2\xd3\x33\x50\x82\xf7\x92\x4e\x03\xbd\xb1\
-\xa3\x37\x81\x91\x56\x63\x2d\x95\x9b\x20\xda\xe8\xf3\x01\x13\x60\
-\x68\xd3\xcb\x43\x6c\xd7\x5c\x2b\x2f\x7c\xfc\x57\xd9\x0d\xe0\x7d\
-\x06\xc8\x10\x92\x7b\x68\x40\xa7\x71\x50\x7c\x2b\x90\xa4\xd9\x01\
-\x45\x28\xec\xa9\xac\x92\x75\xdb\xb6\xcb\x78\x9b\x43\xba\xb0\xbc\
-\xe7\xcc\x43\xfd\xbd\x91\x5e\x79\xe9\x09\xf6\xbc\x1b\xe3\x3d\x8d\
-\x79\x35\x0d\xab\xb1\x9f\x78\x4e\x99\xef\x19\x18\x20\xed\x39\x81\
-\x47\xaf\xfe\xd2\x03\x60\x4a\x00\x64\x8a\x9f\x78\x02\xcb\x06\x78\
-\x4e\xe0\x60\xc2\xa4\x49\x9f\x03\x4c\xdc\x67\xb3\x01\xa1\x09\x60\
-\xba\x9b\xe5\xf9\xae\x8a\x23\x32\xc9\xe1\x04\x34\xbd\x4c\x68\x1a\
-\xc0\xb4\xdc\x12\x96\xea\x75\x6c\xb7\xe6\xc0\x74\xef\x14\xc2\xb6\
-\x43\x89\xde\x11\x69\x73\xf8\xc4\x89\xf2\xf3\x17\x7e\x2d\x47\xcf\
-\x9c\xc4\x36\x03\x34\x55\xda\x34\xe1\x6d\xfa\xf0\xf1\x6a\xf9\xb8\
-\xfc\x90\x64\x20\x5d\x73\xbc\x26\x67\xc8\xb7\xce\xde\x62\x69\x4e\
-\xb3\x83\xa8\x77\xe8\x60\x40\x33\xa9\x19\x2c\x1b\xa1\xa9\x4e\xad\
-\x4c\xdb\xcb\x31\x9a\x91\x49\x53\x3d\xcc\x7f\x43\x2d\xad\x1f\xbe\
-\x46\x8e\x1c\xd9\x31\x2a\xc5\x39\x39\x26\xd9\xf5\x42\x6c\x6a\x06\
-\x00\x89\x7f\xe8\x14\x73\x9a\x36\xf6\x84\x13\x9c\x48\x9d\x83\x62\
-\xc7\x20\xdd\xb1\x04\x37\x80\xc9\x44\xa9\x3a\x77\x7c\x82\x51\x02\
-\x7b\xcb\xc4\xeb\xae\x95\xa7\x3f\xf9\x8b\x1c\x38\x7b\x42\xc1\x71\
-\x1f\x40\xb9\xaf\x0e\xe9\x08\x3e\x88\xc7\x95\xa7\x8f\x4b\xd5\xd9\
-\xd3\xb2\xfd\x99\x67\x24\x78\xf8\x70\x80\xa4\x0f\xe0\xe2\x0b\xb8\
-\xf0\x8c\x9d\xe6\xc0\x6c\x02\x67\x53\xb2\x6c\x7c\xbe\x15\x60\x76\
-\xf5\x21\x2c\x3d\x25\x3c\x3e\x51\x9e\x78\xf3\x0d\xd9\xc3\x4e\x24\
-\xc0\x92\x33\xae\x5b\xa0\xfc\x76\x60\xb2\x3d\xb5\x01\xeb\x5a\x2d\
-\xa5\x8f\x3f\x26\x23\x26\xc6\x4b\x3b\x24\xd5\x76\x80\x12\x4f\x9d\
-\xe4\x67\x28\x10\x9a\xeb\xa0\xc0\x6d\x7e\xb6\x05\x49\xeb\x71\xe3\
-\x7c\x97\xbc\xc5\xfb\xb8\xee\x04\x52\xbb\x3e\xfd\xa4\x8b\x67\x7f\
-\x49\x70\xb8\xe4\x91\x9f\xfd\x42\x0e\xd7\xd5\xc9\x11\xa4\x70\xd5\
-\xf9\x64\x02\x93\x6e\x84\x28\x87\x1c\x59\xed\xab\x8d\xed\xac\x47\
-\xa5\xe2\x44\x9d\xbc\xf5\xe1\x07\x12\x32\x6c\xa4\x74\xc2\x76\xe7\
-\xf2\x5b\x02\xd2\xdd\xd6\xf6\x73\xf7\xb9\xef\xe3\xf3\x84\xa6\x97\
-\x78\x87\x46\xca\xca\xf5\xeb\x54\x09\xbe\xaf\x96\x3d\xe7\xe5\x00\
-\x79\x53\xe2\x25\xc8\x0f\x1d\x37\xda\x67\xaf\xbb\xf7\x5e\xc0\x91\
-\xb3\x42\x19\x49\xd3\x72\x6f\x3f\x40\x13\xff\x27\x7d\xc2\x86\x48\
-\x70\x7c\xca\xb9\xa7\x51\x72\xd2\x8e\x54\x47\x2d\xaa\x9a\x95\xfe\
-\x7a\x7c\xa6\xd6\x8f\x49\x16\x30\xa3\x6c\xae\x17\x86\xd8\x32\x01\
-\x47\x00\x33\x15\xa9\x92\x73\x5b\xda\x5c\x12\x63\x03\x2c\x87\x8f\
-\x6f\x2a\xbf\x4d\x73\xbc\x65\x57\xef\x10\x69\x03\x18\xb8\xe6\xdc\
-\x2d\x2f\x1d\xdc\xa5\x60\xc9\xf6\x49\x02\xf3\x60\x83\x61\x42\x88\
-\x13\x66\x1c\x3e\x7e\x5c\x0a\xd7\x6d\x90\x3e\x7e\x81\xaa\x6c\xed\
-\x8a\x44\x66\x8d\x1d\x3c\x07\x98\x48\x2e\x16\x98\xac\x9d\x5c\x3d\
-\x76\x07\x93\x9b\x99\xfe\xda\x63\x79\xb9\x5b\xb7\xcb\xc7\x75\x48\
-\x88\x0d\xf5\xaa\x47\x7e\xcf\x3f\x04\x26\x81\xce\xd3\x13\x8f\xcb\
-\x1f\xde\x7f\x5f\x32\x2f\xbb\x42\xda\x23\x4d\xb6\xef\x3b\xd0\x48\
-\x89\x6e\x9f\xe1\x7e\xdf\x4a\x73\xd6\xf3\xee\xaf\x19\x97\xbe\x70\
-\x5f\x77\xf6\xf2\x33\x09\xb2\x99\x01\xe0\x44\xe9\xde\x1d\xcf\x5d\
-\x74\xf5\x0d\xf2\x87\xf7\xfe\x8c\x34\x77\x06\x30\xaa\x69\x6c\xc3\
-\x24\x30\x39\xec\x6a\x0f\xdb\x11\x5b\x42\x93\xeb\x0e\x60\x1d\xe3\
-\xf5\x8a\x9e\xf8\xa9\xf4\xe5\x44\xcc\xd8\xfe\xe7\x02\xb0\xc9\xd6\
-\xf6\x73\x77\x37\x65\xf3\x75\xf5\x3e\x42\xd4\x48\x9f\x9d\x3d\x07\
-\x49\x4f\x2f\x5f\xb9\x63\xee\x1c\x39\x88\x83\xde\x91\x06\xc0\x11\
-\xeb\x62\x4c\x26\xc2\x51\x01\x46\xda\xe5\x20\x77\x9e\xdf\xbf\xb0\
-\x70\xa5\xf4\x43\xaa\xe4\xd9\x56\xac\x36\xac\x99\xf3\x39\xac\xac\
-\xab\x77\x98\x78\x44\x0e\x97\xf0\x04\x9b\x3a\xff\xbc\x11\x98\x1c\
-\xe8\x6e\x4b\xab\x8d\x76\xa4\x6b\x60\x6a\xfd\xf8\xe4\x3b\x73\x66\
-\xd7\x88\x54\xc7\xa5\x28\xc1\x7f\x1b\x85\xa3\xbf\x35\x11\xed\x10\
-\xc0\xd2\x7f\x54\x9c\x9a\xa9\xdb\x02\x25\xd3\x44\x2f\x9f\x10\xec\
-\x78\x41\xd2\xd6\x27\x48\x66\xac\xc8\x97\xdf\x1e\x3b\x28\x87\xce\
-\x36\x20\x35\xd5\x18\xa7\xd9\x35\xf0\x6c\x9d\x63\x48\x22\x35\x52\
-\xf3\xf7\xd3\xaa\x2d\xec\x9e\xac\x6c\x24\xa2\x81\xd2\xae\xdf\x00\
-\xc0\xb2\xf9\xc4\x12\x0a\x40\xd8\x89\x39\x14\xa8\x3d\x00\xd0\x09\
-\x25\x6e\x7b\x40\xb0\xd3\x00\xa3\xe4\xa4\xcf\x3b\x53\x39\x76\xf6\
-\x36\x7d\x06\xc8\xcc\xf9\xf3\x65\xe7\xe1\xc3\x72\xf0\xe4\x29\x80\
-\x91\xb0\x6c\x1d\x98\x0a\x9a\x48\x47\x7b\x50\x7e\x1f\xc0\xfa\xed\
-\x47\x02\xde\xb4\x7d\x87\xf8\x44\x0e\x96\x36\x3d\x3c\x01\x10\x63\
-\xdd\x2c\x10\xb6\xf4\x39\x9f\x0f\x33\xf5\x36\xc2\xde\xb4\x31\x7e\
-\xd4\x68\x8b\x6d\x3e\x3c\x0a\xaf\xe1\x7b\xb6\xeb\xe9\x21\x91\xc3\
-\x47\x4b\xc9\xa3\x8f\x4b\xf5\xa9\x53\x72\xf0\xd8\x31\xd9\x7f\x94\
-\x40\x34\x13\x26\x93\x27\x80\xe9\x6e\xab\x7d\xf3\x20\xbe\x43\xf5\
-\xe9\x53\x72\xc9\x8d\x37\x01\x98\xc6\x58\x55\x6b\x3b\xb5\x34\x67\
-\x80\xe7\x77\xe2\x24\xc6\x9d\xb0\x4d\x79\xf9\x0b\x5e\xd3\x88\x23\
-\x09\xdc\xb7\x2f\x61\xd9\x58\xe2\xf7\x47\xea\xc7\xef\x34\xfd\x8a\
-\xcb\xe4\x93\x83\xfb\x55\xaa\x35\x12\x26\xdb\x53\x09\x4d\xc3\x87\
-\xea\x8e\x49\xf5\x99\xd3\xb2\xb2\xa8\x48\x3c\x23\xa3\xa4\x23\xa1\
-\xa9\x60\x69\x34\xd5\xd0\x3c\xa8\xb2\x13\x30\x22\xd1\xa6\xce\x31\
-\x8f\xc4\x41\x38\xda\x99\x21\x51\xba\x24\xd7\xfa\x31\x4b\xf5\x92\
-\xdb\x9c\x17\x01\x96\x4f\x45\xa7\x38\xde\x82\x77\x0e\x1c\x36\xe6\
-\xc3\x2e\x3e\xa1\xdf\x70\xf8\x50\x63\xb2\xe4\xed\x80\x20\xe9\x10\
-\x18\x2a\x57\x6d\x5e\x23\x6f\x9c\x44\xf2\xf8\xe2\x84\x1c\x46\x9a\
-\x3c\x0c\xf8\x1c\xa9\x67\x8f\x6e\xad\xea\x71\xad\xff\xe6\x2b\xf9\
-\xdb\xa1\xfd\x72\xc5\xad\xb7\xab\xf6\x45\x9e\x9e\xd8\x1a\x70\x58\
-\xf6\x72\x47\xf6\x4b\x89\x97\xf8\xf9\x77\x48\x72\xf6\x7d\x32\xea\
-\xc6\x2b\xa5\x67\x28\x92\x0b\xd2\x26\x53\x90\x95\xe8\x5a\x9a\xb0\
-\x0c\x42\x09\xfd\xe4\x1f\xff\x28\x7b\x01\x91\xbd\xb5\xc7\x00\x17\
-\xc0\x12\x25\x39\xc1\xc8\x44\xd9\x1a\x30\x0f\x9d\xa8\x97\xcf\x2a\
-\x0e\xc9\xa2\x82\x3c\xe9\xc4\x29\xe2\x3c\xbc\xd5\xa5\x25\xf8\x59\
-\x46\x7b\x24\xdd\x1c\x96\xff\x3c\x30\xe9\xa6\x84\xd7\x1d\xdf\x97\
-\xee\xd0\xb7\xbf\x78\x06\x86\xc8\xfc\xbc\x02\x6c\x3b\x1e\x70\xea\
-\x8c\xb6\x4d\x0b\x9a\xe7\x00\xd3\x6a\x4f\xac\x52\xed\xa0\x3b\x3f\
-\xfc\x50\x42\x86\x8f\x52\x03\xcb\x5b\x1b\x82\x65\x99\x93\x16\xf7\
-\x08\x08\x92\x21\x33\xd2\x24\x3d\xef\x7e\x71\x2d\x9b\x2b\xc3\xae\
-\x9e\x25\x7d\xc2\x23\xa4\xb3\xc7\x20\xbc\xc7\x48\x97\x6a\x3d\xb1\
-\x1c\x35\x74\x6b\x80\x9f\x74\xec\x3b\x40\x26\xa4\xd8\xf0\x39\x7f\
-\x96\xaa\x53\x0d\x80\x24\xa1\xd9\x04\x4c\x03\x9a\x38\x28\x7e\x79\
-\x5a\x36\xfd\xf4\xa7\xe2\x3d\x78\x04\x12\x76\xa0\xea\x0c\x72\x87\
-\x26\x1f\xf7\x0d\x1f\x72\x24\x78\x52\xd2\x3b\x11\xa9\xce\xb7\xc2\
-\x52\x9d\xaf\x84\xd9\x5c\x4b\x23\x1d\x8e\x70\xf3\xdf\x4f\x4b\xeb\
-\xc7\x27\xd5\x5b\x6e\x4f\x1f\x12\x99\x6c\x1f\xe7\x3d\x7c\xc2\x78\
-\xaf\xe1\x63\x2f\xee\xee\x1b\xf6\x2c\x52\xe5\xd7\x06\x30\x43\xa5\
-\x73\x7f\xec\x80\xa1\x91\x72\xcb\x4f\xb7\xca\x1f\xcf\x02\x8c\x67\
-\x4e\xaa\x89\x72\x0f\x1d\x07\x30\x09\x4d\xdc\x96\x23\xb9\x1d\x07\
-\x2c\xdf\xf9\xdb\xc7\x92\x7e\xc9\x15\xd2\x06\x69\xaa\x23\x76\x5a\
-\x96\xa9\x0a\x28\x4c\x59\x16\x70\x78\x1f\xe5\xaa\x77\xdc\x38\x99\
-\xba\x31\x5f\xa6\x6e\x5d\x2e\xe9\x65\x85\x32\x6d\xeb\x4a\x89\x9b\
-\x73\xab\x74\xf6\x45\xe2\x43\xf9\xe8\x0e\x28\x5a\x01\x0c\x7f\xcb\
-\x59\xd1\xef\x5e\xbb\x56\x3e\xac\xa9\x96\xfd\x80\x88\x01\x4a\x76\
-\x38\xd1\x4c\x99\xe7\x02\xf3\xf0\xc9\x7a\xf9\xe4\xf0\x21\xb9\x67\
-\xd1\x12\x69\xd7\xab\x9f\x5a\xb7\x6e\x48\x61\x8d\xe9\xd2\xbd\x03\
-\xa7\x99\x91\xd4\x00\x13\x5a\x5d\xca\x02\xcf\xa9\xf7\x63\x3d\xbe\
-\x1d\x98\x46\xba\xb4\x6c\x01\x8a\xd0\xec\xe4\xe9\x85\xc4\xee\x2f\
-\xb7\xcd\x5d\x80\x83\x4d\x03\x00\x54\xdb\x3a\x30\x4d\x58\x2a\x60\
-\x22\xb1\x1f\x84\x6b\xbf\x38\x23\xf3\x0a\x0a\xd5\xd8\x4a\xa6\xc7\
-\xd6\x60\xd9\x15\x07\x9c\x4e\x48\xa1\x43\x2f\x99\x2a\xb3\x8a\xf3\
-\x65\xc6\x36\x78\x4b\xae\x5c\xbc\x65\x99\xc4\xdd\x71\x8d\x74\xf5\
-\xc3\xfa\xf6\x1f\x64\xae\xa7\xb5\xae\xe6\xfa\xe2\x6f\x3b\xf4\xf1\
-\x92\xd0\x61\x43\xe5\xf9\xd7\x5f\x93\xa3\xa7\x4f\x00\x92\xcd\x53\
-\xa6\xf1\x18\xeb\xf2\xd5\x17\xf2\xc8\xaf\x7e\x2d\xc1\x23\xc7\xaa\
-\x66\x09\x76\xfc\x10\x96\xea\xf2\xbe\x3e\x21\x1f\xf7\x0b\x1b\xbc\
-\xd0\x67\xcc\xe4\x04\x9f\x11\x93\xc6\x06\x8d\x4f\x1a\x1d\xed\x74\
-\x0e\x34\xff\xed\xb4\xb4\xfe\x7b\xd4\x2d\x20\xdc\xd1\xc5\x3b\xe4\
-\xe9\xee\x7e\x61\x5f\x75\x02\xb8\x3a\x45\x44\xcb\x5d\xcf\x3e\x2e\
-\x7f\xfa\xa2\x5e\x8e\x9c\x3e\x2e\x47\x00\x4b\xce\xef\x78\xe8\x04\
-\x4a\xf0\x13\x48\x97\x27\x8f\xc9\x71\xf9\x42\x5e\x7d\xf7\x2d\x89\
-\x73\x65\x28\x58\xb2\x37\x95\xbd\xc6\x16\x4c\x8c\xeb\x7f\x13\x94\
-\xfe\x6a\xdc\x64\xf7\x90\x50\x99\x78\xff\x2d\x32\x73\xdb\x03\x92\
-\x5e\x92\x2b\x19\xc5\x39\x92\x56\xb4\x54\xd2\xd7\x2d\x15\x8f\x21\
-\xc3\xa4\xf3\x00\x03\xb0\xee\xf0\xea\xe4\x13\x24\x6d\xfa\x79\x89\
-\x6f\x5c\x9c\x3c\xf5\xfe\x9f\xe4\xf3\x53\x27\x65\x37\xaf\x28\xd9\
-\x08\xcb\x63\x80\xa3\x7b\x49\xce\x99\x82\x2a\x00\xcb\x5a\xf9\xb4\
-\xe2\xa0\xcc\xc9\xc9\x51\xed\x95\x9d\x50\x9a\x1a\xe0\xc3\xba\xb5\
-\xf8\x0c\x77\xb7\x67\x6f\x79\x5f\x76\x02\x01\x42\x00\x2b\xaf\xed\
-\xc3\x75\x57\x7f\x8b\xef\xd1\x04\x44\x77\x50\xb6\x6e\x0b\x98\x96\
-\x3b\x7a\x0c\x94\x3e\xbe\x01\x72\xdf\xd2\x1c\x35\xf0\x9d\x9d\x50\
-\x04\xa6\x3a\x23\x09\x56\x33\x28\x99\x9d\x42\x56\x5b\xe7\x7e\xdc\
-\x3f\x82\xef\xfb\xe1\xbe\xfd\x32\x74\x72\x02\x80\x49\xe8\x9d\x9b\
-\x32\x3b\x21\x39\xf7\x8d\x8e\x91\xf8\xb9\xb7\xc9\x45\xdb\x96\xcb\
-\xd4\xe2\x6c\x99\x8a\x6d\x3b\xa3\x34\x5f\xd2\x57\xcd\x93\x10\xa4\
-\xfa\x76\x7d\x38\x4c\xa9\xb5\xf5\xc7\x7d\x7c\xc7\x0e\xf8\xde\x3e\
-\xe1\x51\xf2\xc4\xaf\x9e\x43\xd2\x24\x34\xdd\x81\xd9\x74\xf6\x53\
-\xdd\xdf\xbf\x54\x97\xe9\x08\x1f\x3b\x51\x3a\xe0\x37\x57\xd7\x06\
-\xf2\x0d\xfb\xa8\xa7\x6f\xd8\xbd\xdd\xfc\x23\x75\x5b\xa5\xd6\xff\
-\x86\x7a\x8d\x18\x91\xda\x7d\xf8\xa8\xa7\x3a\x45\x46\x7e\x39\xe7\
-\xb9\x9f\xca\x5f\x00\xcb\x43\x48\x1b\x3c\x75\x4f\xc1\x52\x01\x13\
-\xb0\x3c\x75\x4c\x4e\xc8\xdf\xe5\xd9\xdf\xbd\x2a\xc3\xe3\x13\x00\
-\xcb\x7e\x2a\x69\x31\x21\x1a\xc0\x44\x42\x73\x03\x27\x27\xbc\x65\
-\xbb\xe5\x80\x31\x23\x24\x73\x7d\x9e\x64\x96\x14\x02\x94\x39\x92\
-\x5e\x94\x8d\xdb\x2c\x49\x5b\x97\xa5\x2e\x9c\xd6\x19\xe5\xe1\x39\
-\xc0\xf4\x06\x30\x3d\xbc\xe4\xe6\x87\x1f\x92\x3f\x55\x55\xcb\xee\
-\xe3\xc7\x65\x77\x2d\xd2\xd9\x79\x81\x09\xd8\xd4\x63\x07\xaf\xaf\
-\x91\x87\x8a\x4b\x54\xba\x6b\xcf\x89\x3d\x1a\x93\x22\x9b\x05\xdc\
-\xa1\x69\x4c\x17\xc7\xf1\x86\xfc\x9c\xe0\x51\x63\xe5\x8e\xac\x5c\
-\x79\xf4\xc5\xdf\xc8\x2f\x5e\xfb\x83\xcc\x5f\xbe\x42\xfc\x62\x86\
-\x49\x07\xce\x82\x84\xef\xf1\xaf\x00\x93\xee\x80\xa4\xd9\x2f\x28\
-\x4c\x56\x61\xdd\xaa\xbf\x38\xdb\x08\xcb\xf3\x01\xd3\x1a\x96\x54\
-\xf7\xe5\x97\x92\xfd\xc0\x83\xd2\xdb\x0f\xeb\xaa\xca\xeb\xe6\xc0\
-\xec\xec\xe9\x2d\xbd\xc3\x22\x65\xd2\xbd\x37\xc9\x2c\x00\x33\x73\
-\xf3\x52\xc3\x00\xe7\xb4\xcd\x39\x32\xe6\xfa\x4b\xa4\x03\x60\xdb\
-\xa5\xd9\x77\xb0\x6c\xac\x2f\x7f\xbf\xf6\x1e\x3e\xd2\x37\x20\x58\
-\x4a\x7e\xfa\x84\x54\xb6\x80\xa6\xd5\x89\xc6\x21\x51\xf5\x5f\x9e\
-\x91\x67\x5f\x7d\x55\x62\x26\x4c\xc1\x72\xfd\x3e\x40\xc2\xbc\xbb\
-\x7b\x50\x90\x9e\xde\x4d\xeb\x7f\x4b\x1d\xc2\xa2\xef\x58\xf8\xd2\
-\xb3\x1f\x7f\x74\xa6\xfe\xeb\xc3\xd8\x61\x0e\x1e\xaf\x57\xb0\x3c\
-\x72\xfc\x18\xcc\x9e\xe6\x63\x52\x8f\x64\xb9\xe3\xd9\x5f\x48\xe4\
-\x98\x71\xd2\xa6\xb7\xa7\x51\x4a\x63\xc7\xb3\x00\x69\xc0\x92\x36\
-\x1e\xab\x6b\x85\xfb\xf8\x49\xd4\x45\x69\x28\x15\x57\x49\xfa\xe6\
-\x3c\xc0\xd2\x00\x66\x46\x49\x9e\x24\x2e\xfd\x89\x74\xf6\x67\xc7\
-\x05\xd3\x28\xc0\xc6\xce\x0b\x40\x4c\xa5\x4b\x4f\x1f\xf1\x1e\x3f\
-\x51\x7e\xfe\xe7\xf7\x65\x77\xc3\x09\xf9\xfc\x58\xad\x02\x66\x53\
-\x67\x8f\x01\xcb\xc6\xf2\x16\xae\x44\x22\x7e\xea\xa5\x17\x24\x1c\
-\xf0\x63\xf2\xed\x06\x30\xaa\xb6\x51\x55\x8a\x1b\x29\xd6\x72\xa7\
-\x41\x41\xd2\x16\x90\xe0\x44\xc7\x77\xe6\xe4\xcb\x1b\x9f\x7e\xa6\
-\xe6\xef\x54\xa7\x58\xe2\x33\x8e\x20\xd1\x3e\xfb\xfb\xd7\x24\x14\
-\x25\x68\x47\x42\x13\xdf\x45\x5d\x9c\xcc\x0b\x89\x55\x99\xb0\x21\
-\x84\x5a\x02\xf4\x7c\x70\x35\x92\x66\xf0\x90\xe1\xf2\xc2\xeb\x6f\
-\xaa\x81\xf3\x06\x30\xd9\x63\x8e\x92\xdc\xb4\x05\x4e\x35\xa0\x1c\
-\xae\x38\xd1\x20\xef\xef\xda\x25\xb1\x13\xe2\x14\xbc\xb9\xbd\xdd\
-\x81\xc9\xcf\xe9\x80\xf5\x19\x76\xf9\x4c\x99\x55\x94\x2f\x99\xdc\
-\xbe\x9b\xb3\x25\x1d\xc0\x9c\x5e\x56\x20\x09\x0b\x6e\x97\xde\x11\
-\x11\x0a\xb6\x4d\xeb\xe5\xbe\x7e\x38\x58\x79\xf1\x77\xc4\x76\xc7\
-\xf2\x7b\x0c\xf4\x91\x07\x36\x6f\x96\x72\x1c\x2c\x0f\xd5\xd6\x28\
-\x48\x32\x61\xd2\x6a\x80\x7d\x4d\x95\x34\xfc\xfd\x0b\x79\xfa\x37\
-\x2f\xd5\xc5\xa5\x4f\x2d\x6b\xd3\xa6\xb3\x3e\xa3\x47\xeb\x7f\x4b\
-\x05\x6f\xbc\x94\x9a\xfb\xfb\x17\x9e\xfa\xe4\xf4\xa9\x2f\x0f\x9f\
-\x3c\x29\x07\x4f\x10\x96\x46\xba\x3c\x0c\x58\x56\xa2\xcc\x6d\x90\
-\x2f\x65\xe3\x8e\xed\xe2\x1f\x3d\x58\xc1\x88\x97\x9d\x65\xf9\xda\
-\x04\xcb\x73\xcd\xce\x8a\x1e\x21\x21\x32\x79\xce\xcd\x32\x6d\xeb\
-\x0a\x49\xdb\x94\xab\x80\xc9\x94\x99\x09\x60\x46\x5d\x9a\xa9\x2e\
-\x95\xab\x76\x7c\x05\x4c\xe3\xf2\xb7\x9d\x39\xf6\x13\x65\xe4\xd5\
-\x8b\xb3\xe4\xfd\xf2\x23\xb2\xcf\x1a\x46\xa4\x52\x65\x53\xbb\x25\
-\x3b\x7c\xac\xd2\x96\x33\x21\xbd\xf3\xc9\xdf\x64\xda\x55\x57\x4b\
-\x9b\x6e\xbd\xd4\xba\x19\x3d\xef\xe6\x72\xdd\x60\xc9\x36\x49\x5e\
-\xbe\x62\x58\x92\x53\x1e\xfb\xcd\x6f\xe5\x73\x80\xf8\x53\xa4\xb9\
-\x4f\xab\x8e\xc8\x67\x55\xe5\xb8\xad\x40\x59\x5f\x2e\xd5\x5f\x9d\
-\x91\x2c\x95\xee\x82\xd5\xd5\x2a\x3b\x03\x4c\x96\x9b\x80\x79\x2e\
-\x18\x9b\x03\xc9\x78\x9e\x29\xb3\x2b\x9b\x07\xfa\xfb\x48\x72\xe6\
-\x74\xd9\x5b\x05\x20\xb2\x0d\xb6\x06\xc0\x34\x67\x68\xa7\xdd\x81\
-\xa9\xae\x1d\x04\x73\x98\xd1\xcd\xf7\xcd\x95\xee\x3e\x81\x6a\x88\
-\x95\x3b\x30\xe9\xb6\x28\xa9\x03\xa7\x4c\x92\xb4\xe5\x73\x15\x24\
-\x15\x30\x91\x2e\xa7\x97\x16\x8a\x63\xc5\x02\x09\x4c\x88\x93\xf6\
-\x38\xc0\xf1\x37\x6b\x6e\x6b\x3d\x9b\xcc\x4b\x09\x77\xea\xe7\xa5\
-\x4e\x01\x65\x2f\xf9\x41\x6c\xef\xa6\xb4\xc9\xa1\x47\x6c\x67\xad\
-\x90\x86\xaf\xbf\x94\x5f\xfe\xee\xb7\x1f\x2c\xdb\xb0\xe1\xee\x87\
-\x8b\x8b\x75\xc2\xd4\xfa\xdf\x50\xde\xeb\x2f\x39\xf6\xd6\x37\x3c\
-\xbd\xf7\xcb\x2f\xbe\x3a\x70\x82\x1d\x3c\x0d\x28\xbf\x09\x4b\x03\
-\x98\xe5\xa7\xea\xe4\xb8\x7c\x25\xab\x4b\x4a\xc4\x27\x22\x46\x9d\
-\x15\xa3\xae\xc3\xcd\x9d\xeb\xdb\xcc\xce\x08\x96\xe3\xa3\x86\x4b\
-\xda\x43\x8b\x25\xbd\x24\x1f\xa0\xcc\x55\xb0\x74\x6d\x5a\x2a\xae\
-\xd5\x8b\xc4\x63\xf4\x50\xd5\xde\xa9\x86\x1d\x11\x6e\x00\x1b\x87\
-\x33\x75\x60\x0f\x2e\xcb\xc3\x17\x5e\x90\x5d\xb5\x3c\x43\xc7\x48\
-\x94\x46\x29\x6e\xf6\x8e\xc3\xd6\x58\x4b\x5e\x0a\xe2\x30\xd6\xb9\
-\x70\xfd\x7a\xe9\x06\x38\x75\x40\x9a\x52\x1d\x35\xb0\x01\x49\xab\
-\x2c\x47\xb2\x04\xc4\x78\x99\xde\xd9\xb7\xdc\x29\xef\xed\x3f\x68\
-\xc0\xf2\x68\x85\x7c\x86\xe4\xb4\x0b\x09\x8f\xb3\xc3\xef\x3a\x5a\
-\x2e\xbb\x00\xcf\x8a\xd3\x0d\xf2\xe4\xf3\x2f\x88\x77\x64\xac\x1a\
-\x2e\xf5\xaf\x00\x93\xee\x8e\xe7\xba\xf4\xf7\x95\x5e\x38\x20\xac\
-\xd8\xb0\x59\x8e\x9e\x3d\x0b\xe8\x37\x1f\x5e\xa4\x92\xa5\x09\x4d\
-\xa3\x13\xa8\x42\x6a\xce\x9c\x92\x67\x5e\x79\x55\xfc\x90\x4e\xd9\
-\xae\xcb\x91\x05\xd6\x38\x4b\xba\x23\xca\xf2\x3e\x91\x91\x12\x77\
-\xef\xf5\xaa\x2c\x4f\xdf\x94\x2d\x69\x1b\x59\x96\xe7\x49\xe6\xfa\
-\x1c\x19\x76\xe9\x0c\x69\xcf\x76\x4c\xf5\xfe\x40\xe5\x56\x81\x69\
-\x26\x4d\xa6\xe9\x76\xbd\xfb\xc9\x9c\xdc\x5c\xe1\xa9\x9e\xbc\xd6\
-\x92\x4a\x99\xb5\x58\x27\xd3\x07\xb1\xde\xc7\xce\x9e\xe2\x55\x34\
-\x3f\x7a\xe5\x9d\x77\xee\x5d\x90\x97\xa7\xdb\x30\xb5\xfe\x7b\x25\
-\x22\x6d\x77\x9f\x3c\xe6\x3a\x78\xb2\xe1\x99\xcf\xbe\xfc\xe2\x6b\
-\x5e\x77\x87\x67\xc3\x10\x3c\xaa\x14\x3f\x71\x4c\xc1\xf2\x04\xde\
-\xb8\x7a\xcb\x56\x19\x14\x1e\x6d\x5c\x01\x91\x20\xbc\x00\x60\x72\
-\x0c\x20\x4f\x2d\x0c\xb4\x27\xcb\xcc\xd2\x15\x2a\xf5\xb0\xa3\x27\
-\x43\xb5\xb1\xe5\x48\xe2\xfc\x3b\xa4\xa3\x37\xde\x83\xf7\x5a\xc9\
-\x52\x01\x13\x26\x14\x62\x93\x53\xe4\xf5\x4f\x3e\x52\xd7\x2e\x67\
-\xfb\x24\x93\xa4\xd5\x96\xa6\x06\x78\x37\x0e\xf6\xae\x94\xea\xb3\
-\x27\xe5\x37\xef\xec\x94\x49\xce\x34\xa4\xcb\x3e\x58\x8e\xd9\x96\
-\x4a\x08\xab\x52\xdc\x00\x27\x61\xc9\xab\x5c\x5e\x73\xff\x02\x94\
-\xdf\x75\xf2\x39\x12\xd4\xae\xda\xa3\x80\x66\x35\x5c\xa3\x2e\x63\
-\xa1\x80\x09\x7f\x76\xf4\x88\x54\x7f\x7d\x46\x0a\x37\x6c\x90\xbe\
-\x81\x21\x4d\x09\x13\xdf\x4b\xb5\xb9\xb6\xda\x26\xf8\xed\x26\xdc\
-\x78\xdb\x05\xcb\x18\x36\x39\x41\x3e\x3a\x78\x48\x0d\xac\x67\xb2\
-\xb4\x80\xd9\xac\x6d\x93\x00\x85\x8f\x60\x3d\x99\x34\x13\x91\x4c\
-\xd5\x58\x4b\xfc\xbd\x05\x4b\x9a\xed\xc8\x3c\x05\x75\xf0\x25\x19\
-\x32\x6d\x73\xae\x64\x30\xc5\x03\x9a\xe9\xb8\x3f\xad\xb8\x50\xe2\
-\xee\xb9\x51\x3a\xfb\x62\x5b\xe3\x00\x66\x9d\x32\x49\x98\x5b\xbf\
-\x95\xfb\x09\x04\x06\xe4\xf1\x1a\xbe\x63\x9b\x1e\x1e\x72\xf7\x92\
-\x45\xc2\xeb\x20\x1d\xa8\x67\xfb\x31\x0f\x56\xc6\xb6\xe7\xe0\x76\
-\x5e\x31\xb3\x1a\xd0\x3c\x5c\x7f\xec\x13\x3c\x9e\x7b\xf0\x54\x8d\
-\x9e\x40\x58\xeb\xbf\x4f\x4f\xca\x93\xed\xf7\x9e\xaa\xcd\xf8\xfc\
-\x44\xdd\x73\x1f\x7f\xfd\xc5\x37\x7b\x4e\xd6\xa9\x32\x9c\xc9\x92\
-\x53\x7d\xd1\x15\x78\xee\xb8\x7c\x2d\x0f\x97\x6d\x95\x81\xe1\x31\
-\xea\x7a\xde\xee\x40\xfc\x47\x56\x43\x79\x90\x12\x87\x5e\x33\x5b\
-\x66\x6d\x5f\xa9\xda\x2d\x55\xdb\x65\x31\x4a\xc5\xcd\x79\x32\xf8\
-\xe2\x69\xd2\x0e\x3b\x30\xaf\x01\xc4\x0e\x18\x77\x68\xb2\x33\x69\
-\xf6\x9d\x77\xc9\x5f\x8f\x00\x28\x0d\x6c\xb7\x6c\x6a\xa7\x54\xc0\
-\x74\xdb\x69\x0f\xd5\x1d\x55\xeb\x9a\xbb\x66\x0d\x40\xc0\xce\x15\
-\xa4\x3f\xb5\x1c\xab\xdd\x92\x90\x34\x7a\xeb\x79\x3b\xfb\xd6\x3b\
-\x01\xca\x06\xd9\x83\x04\xbd\x07\x7f\xcb\x53\x3c\x39\xb8\x7d\x2f\
-\xbc\x87\xcb\x04\xa0\x0f\x73\x8a\x37\x94\xc1\xaf\xbc\xf7\x47\x19\
-\x3a\x79\x8a\x82\x14\x27\xe7\xfd\x57\x81\x49\x13\x70\x5c\x46\x77\
-\xdc\x16\xae\xdb\x24\x55\xa7\xcf\xa8\xb2\xfc\xdb\x80\xc9\xa4\x59\
-\xff\xf7\x2f\xe4\xde\xec\x1c\xe9\xe5\x17\xac\x12\xb4\x3b\x30\xd9\
-\x9c\xd1\x0e\x07\x99\x80\xc4\x49\x28\xc1\xe7\xc9\x54\xa6\x79\x24\
-\xcc\xb4\x4d\x39\x32\xb5\x74\xb9\xa4\xe4\xdc\x27\x9e\x43\x86\xa8\
-\x49\x50\xac\xb3\x7e\x98\x78\xad\xdf\xaa\x39\x30\x9b\x92\x32\xd7\
-\x93\xf3\x01\xdc\xb1\x00\x07\x98\xa3\x95\xaa\x5d\xbb\xf1\xa0\xc5\
-\xdf\x00\xdb\xff\x20\x6e\x2b\xb1\xbd\x0e\xd6\xd6\x7c\xb6\xaf\xe6\
-\xe8\x82\x3d\xb5\x47\xfc\xcd\x7f\x33\x2d\xad\x1f\xbf\x7e\x27\xd2\
-\xe1\xe3\xaf\x8e\x4f\xfb\xd3\xdf\x4f\x3d\xff\x97\xbf\x9f\x92\x03\
-\xfc\x67\x3f\x09\x58\xaa\x84\x09\x58\x9e\x42\x19\x7e\xba\x4e\x4e\
-\xca\x37\xb2\x06\xc9\x72\x40\x68\x14\x76\x46\x76\x36\x34\x6f\xaf\
-\x64\xca\xfc\xb6\xa4\xd9\x01\x65\x62\xaf\xb0\x08\x89\x9f\x7b\xab\
-\xcc\xd8\xba\x5c\xd2\x54\xc2\x24\x30\x91\x80\xd6\x2e\x95\x81\xe3\
-\x46\xe3\x3d\x4c\xa1\x41\x48\x82\x6e\xc0\x44\x49\xce\xf3\xc6\xf3\
-\x8a\x8b\x54\xe2\xe3\x74\x71\x7b\x14\x2c\x99\x32\x09\x11\xcb\x46\
-\xb9\x5a\x7d\xa6\x41\xde\xfb\xec\x23\xc9\xb8\xfc\x0a\xa4\xcb\xde\
-\xa2\x2e\x63\xcb\x92\x53\x99\x30\xc1\xfa\x98\xeb\x3a\xde\x95\x29\
-\x7f\xda\xbf\x4f\xf6\xe1\x7b\xee\xad\x47\x99\xd9\x70\x14\x40\xe6\
-\xb9\xf0\xd8\xf1\x71\x5b\x7e\xf6\x84\xbc\xf9\xc9\xdf\xe4\xc1\x92\
-\x52\xb9\xea\xae\xbb\xc5\x3b\x3a\x06\xd0\x00\x80\x01\xc8\xc6\x72\
-\x5c\x01\x93\x9d\x3f\xff\x3c\x30\x79\xcb\x65\x8c\x4b\x71\xca\xe7\
-\x95\x84\x3f\xbe\x1f\xbf\x13\xbe\x5f\x4b\x60\x2a\x68\xb2\x2c\xff\
-\xf2\xb4\x3c\xf2\xcb\x67\xc5\x2f\x66\xa8\xb4\xeb\x3b\xa0\x71\x79\
-\x06\xec\x02\xa5\x03\x7e\x23\x8f\xc1\xb1\x12\x37\xf7\x66\x99\xb6\
-\x65\x99\xb8\x14\x30\xb3\x25\xb3\xb4\x40\x9c\x0f\x2e\x92\xd0\xd4\
-\x44\xe9\xd0\x67\x40\x33\x60\xf2\x6f\x9b\xc3\x92\x36\x12\xa6\x65\
-\x35\x39\x49\xf7\xde\x72\xfb\xfc\xc5\xb2\xab\xc2\x98\x39\xdf\x98\
-\x81\x1e\xbf\x8d\x79\xd0\xe2\x09\x0d\x87\xd5\xec\xee\x15\xbb\x77\
-\x1f\xad\x5c\xbc\xaf\xae\x42\xcf\x87\xa9\xf5\xe3\xd7\x47\xf2\x51\
-\xa7\x3f\x9f\x3d\x3e\xf3\x4f\x7f\x3f\xf1\xd2\xeb\x80\xc3\xa1\x33\
-\x80\xe5\x89\x5a\xc0\x12\x65\x78\xa3\x6b\x15\x2c\x37\x3f\xf6\x28\
-\x60\x19\xa9\x3a\x14\x08\x40\x0b\x90\xee\x6e\x09\x49\x77\x33\xe9\
-\x79\x0e\x19\x2a\xe9\xcb\x17\xc8\x34\xec\xb4\xdc\x79\x5d\xdc\x81\
-\x51\x2e\x3a\x96\xcf\x95\xee\xa1\xe1\x48\x6d\xd8\x61\xdd\x61\x09\
-\x77\xea\xef\xaf\xe6\x62\xfc\xf9\xef\x5e\xc3\x0e\x69\xcc\x74\xde\
-\xda\x69\x84\xf4\xfe\x63\x15\x52\xfb\xe5\x49\x79\xf4\xd9\xa7\x25\
-\x8c\x17\x53\xeb\xed\xd9\x08\x24\xf7\x04\xd6\x91\x3d\xee\xb1\x23\
-\x64\xdb\x73\xcf\xcb\x91\x33\xa7\x65\x77\x5d\xb5\xec\xe7\x39\xf1\
-\x3c\x17\xbe\x9e\x13\xe8\x22\x55\x62\x3b\xe4\xac\x5d\x23\xde\x51\
-\x43\xa4\x2d\x80\xdd\xa6\x57\xbf\xc6\xb1\x8f\x84\x63\x23\x30\x4d\
-\x37\x6f\xc3\xbc\x70\x5b\xeb\xd4\x15\xcb\xec\xe7\x1f\x22\x8f\xff\
-\xea\x79\x35\x27\xa7\x95\xa0\x5b\x07\x66\xa5\x6a\x1e\x79\xe7\x93\
-\x8f\x64\x58\x5c\x82\xb4\x57\xc0\x34\x80\xc7\x6d\xad\x6e\x71\x80\
-\xea\xe6\xef\x2f\x23\xae\xbf\x58\xa6\x95\x01\x98\x6c\xc7\xc4\x41\
-\x2a\xa3\x34\x4f\x32\x36\x66\xcb\xf0\x2b\x66\x01\xaa\x5e\xf8\xec\
-\x26\x60\xb6\xb6\x7e\x2d\xdd\x0d\xe6\x01\xa3\x4d\xf7\x7e\x72\xdb\
-\xbc\x45\xf2\x69\xf9\x11\x35\x77\x27\x41\x49\x60\x5a\x1d\x41\x3c\
-\xfb\x6b\x7f\x75\x8d\x7c\x7c\xf0\xe0\xde\xcf\xab\xab\xb2\x77\x55\
-\x1d\xd0\xbd\xe7\x5a\x3f\x5e\xfd\x4e\x7e\xd7\xe1\xe3\x2f\x1b\xc6\
-\x7d\xf8\x45\xc3\x33\x2f\xd7\xe2\x9f\xfb\x8b\x33\xb2\x5f\x25\xcb\
-\x5a\x05\x4d\x03\x96\xf5\xd2\x80\x32\xbc\xec\x67\x3f\x13\xaf\xb0\
-\x18\x63\x92\x0a\x13\x8c\xad\x01\xd3\xb2\x3b\x28\x95\xf1\x5c\x47\
-\xec\x64\xde\x93\x26\xc8\xd4\x75\x39\xaa\x4d\x8d\x1d\x11\xec\xb9\
-\xcd\xd8\x94\x2b\xf1\xf7\xdf\x2e\x1d\x90\x58\xbb\x78\x35\xf5\x8c\
-\x5b\x6e\xdf\xcf\x47\x22\xc7\xc7\xc9\xce\x4f\x3e\x36\xda\xcd\x54\
-\x9a\x6c\x1d\x98\x9c\x3c\xa2\x0a\x20\xc9\x5a\xb5\x1c\x00\x42\x79\
-\xaf\xce\xe8\x69\x0e\x4c\x55\xfe\x22\x75\xce\xbc\xe1\x16\x94\xdd\
-\xf5\xaa\xbc\xdf\xc7\xc9\x43\x90\x30\x0f\x02\x9c\x87\xf1\x19\x47\
-\x50\x9e\x5f\x7f\xf7\x4f\xd4\xc4\x19\x9c\xb2\x8d\x25\x37\xff\xae\
-\x31\x65\x01\x8e\xdf\x17\x30\x9b\x19\xcb\xb8\xe1\xde\xb9\xaa\x87\
-\x5f\x01\xf2\x3c\xc0\x54\xdf\xb5\x01\x07\x0f\x24\xd1\xd4\xe9\xb3\
-\xcc\x61\x4e\x3e\x6a\x19\xdc\xde\x2a\x29\x62\x59\xbc\xfc\x47\xe4\
-\x34\x07\x00\x99\x2b\x69\xc5\x79\x46\xaa\x47\xa2\x9f\x5a\x94\x2b\
-\x13\xee\xb8\x16\xbf\x15\xd3\x32\xd7\xdb\x72\x2b\xeb\xd4\xc2\x6a\
-\xd9\xde\x46\x75\xd1\xa6\x67\x1f\xb9\x6b\xe1\x22\xd9\x55\x7e\x48\
-\xca\xf1\x3f\xd3\x04\x4c\xc3\x15\xc7\x6b\xe5\xb3\xc3\x07\xe5\x4f\
-\x9f\x7e\xbc\x1b\xe9\xff\xf6\x5f\xbd\xfe\x7a\x5f\xf3\xdf\x4f\x4b\
-\xeb\xc7\xa5\x9d\x07\x0f\x76\xfd\xec\xef\xc7\x6f\xfc\xec\xab\x93\
-\x9f\x1d\xf8\xea\x0b\x39\x70\x02\x09\xf3\xe4\x71\x05\x49\xc2\xf2\
-\x08\xdc\x20\x22\x8f\xfd\xfa\x05\x03\x96\x04\x07\x76\x12\xcb\xad\
-\x81\xb2\xa5\x1b\xdf\x8b\x9d\x92\x1d\x3e\x41\x8e\x64\x99\x51\x5c\
-\x28\x99\x84\xe5\xa6\x2c\xc9\xc0\x0e\x3c\x75\x73\xae\x8c\xb9\xee\
-\x0a\x2c\x9f\x3b\x6c\x73\x58\xd2\x6d\x7a\x7b\x49\xea\x45\x97\xc8\
-\xdf\x0e\x1e\x40\x99\xc7\x69\xc6\x9a\xda\xf1\x5a\xba\x1c\x3b\xe8\
-\xae\xf2\x83\x72\xcd\xed\x77\x22\x01\xf1\x9a\x38\x1c\x24\x6e\x00\
-\xd3\xb0\x9f\x74\xf0\xf0\x92\x41\xd1\x43\x64\xd3\x53\x4f\x4b\x39\
-\xd2\x25\x27\xe5\xb0\x4a\xf1\xc3\x80\x66\xf9\x89\xe3\x72\x7f\x6e\
-\xbe\xb4\xed\xdd\x17\xeb\x0e\xa0\x98\x90\x34\xcc\x75\x24\x1c\x9b\
-\xc3\xf2\xdb\x80\x69\xa5\x3e\x9a\xf7\x5b\xbe\xee\xee\xce\x58\xc6\
-\xe8\x64\x87\x7c\x5a\x59\x2e\xbb\x01\x1c\x77\x58\xb6\x04\x26\x4b\
-\xe0\xa3\x48\xd3\xd7\xfc\xe4\x4e\xe9\xe6\xed\x2f\xed\x91\x28\x9b\
-\x3e\xc7\x58\x57\xf6\x84\x07\x4c\x89\x13\xe7\x03\x0b\x25\xb3\xac\
-\x40\x5c\xc5\x39\xe2\x2a\xc1\x41\xaa\x34\x5f\x26\xce\xbd\x55\xba\
-\xf8\x06\xaa\x24\x7a\x21\xc0\x74\xff\x1e\x46\xef\xba\x71\xf0\x69\
-\xdb\xb3\x9f\xcc\xcd\xc9\x45\x79\x5e\x8e\xf2\xbc\x01\xbf\x8d\x59\
-\x9e\xab\xdf\xa8\x42\x8e\x9e\x6e\x90\x4f\x0e\x1d\x68\xd8\xf9\x97\
-\x0f\xca\x2a\x4e\x9c\x88\x31\xff\xfd\xb4\xb4\x7e\x3c\x3a\x08\x58\
-\xee\xae\xaf\xbf\x74\xcf\xa9\xfa\xdf\x7e\x2a\xa7\xd5\x35\x78\xe8\
-\x83\xf0\x61\xb6\x5d\x02\x96\xf5\xdf\x7c\x29\xcf\xfc\xf6\x55\xf1\
-\x41\x49\xda\xbe\xdf\xa0\x66\x00\xa4\x9b\xc1\x11\x3b\x9b\xb2\xfb\
-\x73\xb0\xf5\xde\x8e\x9c\x0d\xc7\x27\x50\xa2\x67\x66\xc8\xac\xd2\
-\xe5\x92\xb9\x01\xb0\xdc\x98\xa5\xc0\x99\xb9\x21\x5b\x22\x67\x64\
-\x22\xcd\x9d\x07\x98\x3d\x3c\xe5\xfa\xfb\xef\x95\xdd\x80\xc8\x21\
-\x00\xed\x7c\xc0\xe4\x94\x64\xdc\x39\xdf\xfe\xe8\x2f\x62\x9f\x39\
-\x5b\xf5\x8e\x77\x47\x12\x6a\x0e\x4c\x5e\xa6\x61\x80\x44\x4f\x88\
-\x93\xd7\x3e\xfc\x48\x1d\x20\x58\x82\x1f\xa8\xe7\xf4\x65\x47\xa5\
-\xa2\xa1\x5e\x5e\xff\xcb\x87\xd2\x2f\x30\x14\xeb\xec\x05\x48\x30\
-\xb5\x59\x20\xa4\xf9\xd8\x1b\x70\x34\x3b\x7c\x5a\x01\x26\xcb\x75\
-\xf7\xf6\xcc\x0b\x05\x26\xd7\x93\x23\x04\x7c\x62\x86\xcb\x1f\x3e\
-\xfc\x00\xe9\xb7\xfa\x5b\x81\xc9\x73\xcd\x6b\xbf\x3e\x23\x4b\x1e\
-\x5c\x21\xfd\x42\x22\xa4\x9d\x47\x53\x27\x9c\x05\x4c\x4e\xa6\xe1\
-\x3d\x6e\xb4\x24\xe7\xdf\x27\x53\xb7\x2d\x17\x27\x80\x49\xa7\x95\
-\xe5\x4b\x7c\xd6\x5d\xd2\x2b\x3c\x42\x3a\xa9\x01\xec\xd6\xf7\x3b\
-\xff\x3a\xb6\x06\x4c\xb5\xce\x48\xf1\xbc\xf4\xc5\x92\x55\x2b\xd5\
-\x05\xdc\xca\x4f\xd4\xab\xde\xf2\xfd\x66\xe7\x19\x4b\xf5\xa3\x67\
-\x8e\x4b\xc5\x89\xfa\x43\xfb\x6b\x8e\x16\xee\xab\x3e\x12\x69\xfe\
-\x1b\x6a\x69\xfd\xf0\x75\x44\xa4\xdb\xde\x86\x86\x2b\xf6\x9c\xac\
-\xff\xfd\xe7\xdf\x9c\x91\xbd\xfc\x07\x57\xc0\x6c\x68\x04\xe6\x31\
-\x3c\xcf\x59\xd2\x03\x63\x87\xa8\x44\xd6\x89\xc0\x33\x77\x1a\xcb\
-\x46\x99\x8d\x9d\x12\x3b\x0c\x2f\x6f\xdb\x09\x30\xe9\xc4\x32\x10\
-\xcf\x9f\x0b\x4c\x40\xc6\x2f\x50\x62\x2f\x9f\x21\xb3\xca\x96\x4b\
-\xba\x02\xe6\x52\x99\xba\x29\x47\x32\xd7\x67\x4b\xa0\x2d\x45\xda\
-\xf5\xe3\x8e\x18\x7c\x2e\x30\x7b\xf5\x97\x9c\x35\x0f\x0b\x27\xb5\
-\xe5\x54\x72\x4c\x2f\xec\x8d\x6d\x0d\x98\xc7\xbe\x38\x29\xbf\xfe\
-\xfd\x6f\x65\x74\x62\x32\x40\xdb\xd7\x04\x26\x77\x78\x0b\x08\x4c\
-\x98\x03\x25\x7c\xec\x04\x79\xe5\xcf\xef\x4b\x05\x12\xa6\x9a\xf0\
-\x18\x3b\x37\x81\x59\x85\x84\xb4\xa8\x70\x95\x6a\xaf\xec\x0c\x28\
-\xaa\x34\x09\xf0\x34\x99\x8f\x2d\x58\xb2\x2c\x77\x2f\xcd\xf1\x3a\
-\xbf\xb3\x2a\xdf\x09\x4d\x6c\x27\xcb\xf8\x5c\x03\x62\x4d\x00\x6a\
-\x69\xc2\x87\x1d\x69\xbd\xfc\xc3\xe5\xa7\x2f\xbd\x24\x07\x91\x96\
-\x79\x11\xb7\xf3\x01\x93\x43\x8f\x8e\xfd\xfd\x8c\x6c\x7c\x74\xbb\
-\xf8\x44\x0e\x91\x36\x6c\x2e\xc1\x72\x68\xeb\xf3\x3a\xf4\x1b\x28\
-\xfd\x86\x0e\x91\x49\x0b\x6f\x93\xa9\xdb\x57\x34\x01\x73\x4b\xbe\
-\x24\xe4\xdf\x2b\xfd\x86\x0c\x56\x3d\xec\xfc\xfc\xc6\xdf\x15\x6e\
-\x5c\x27\x3e\x87\xef\xc4\x36\x4b\xb6\xb1\x5a\xf3\x96\x36\xce\x70\
-\x84\xed\xcb\x03\x61\xdb\xfe\x6c\xaa\x19\xa8\xc6\xbd\xf2\x8a\x9a\
-\xbc\x64\x30\xa1\x79\xa0\x96\x63\x36\x0d\x57\x9d\x22\x34\xeb\x8e\
-\x1c\xa8\xad\x5c\xb9\xff\x78\x4d\xb4\xf9\xef\xa8\xa5\xf5\xc3\x55\
-\x95\x48\x8f\xdd\x0d\x75\x57\xef\x3b\x51\xfb\xc6\xa1\xbf\x7f\x09\
-\x40\xd6\xc9\x7e\xec\x98\x0a\x98\x00\xe5\x41\x24\xae\xa3\x5f\x9e\
-\x95\xbf\xec\xdf\x2b\x31\xe3\x27\xa0\x4c\x1e\xa0\xc6\xea\x11\x00\
-\xd6\x4e\xa4\x76\x2e\xec\x3c\x1c\x1c\xdd\x15\x25\x1d\xa7\x0c\xeb\
-\x16\x18\x2c\xed\x07\x0c\x52\x60\xb4\x7a\xa0\x1b\x81\x89\x9d\xab\
-\x63\xff\x41\xd2\x3d\x30\x48\x46\x5c\x77\xb1\xcc\xdc\xba\x4c\x0d\
-\x71\x61\xc7\x03\x81\x39\x75\x6d\xb6\x04\xc4\x4d\xc6\x8e\x8b\xe5\
-\xb6\x00\x66\x67\xf6\x90\xf7\x19\x28\xeb\x1f\xd9\xa1\xe6\x84\x3c\
-\xc0\xa1\x2b\xdf\x02\xcc\xda\x2f\x4f\xc9\x23\xcf\xfc\x5c\xc2\x47\
-\x8c\x56\x43\x91\x9a\x3a\x33\x2c\xfb\x2b\x40\xf4\x0d\x0a\x97\xec\
-\xd5\x6b\x55\xfb\x2c\x07\x5c\x13\xc4\x55\x38\x70\xbc\xfb\xd7\xbf\
-\x4a\x40\xcc\x50\x95\xa8\x0d\x60\x32\x4d\x5a\x40\x74\x33\x0e\x14\
-\x16\x18\x9b\xa0\xe9\xf6\x9c\x9b\x8d\xb4\x69\x7d\xfe\xf9\xa1\xa9\
-\x92\xb0\x57\xa0\x9a\x72\x6e\xcd\xb6\x47\x84\xd3\xd1\x71\x54\xc0\
-\xb7\x01\xb3\xe6\xab\xd3\xf2\xc8\x73\xcf\x4a\xc0\x90\x91\x6a\xda\
-\x3b\x0b\x98\x96\xf9\x3d\xfa\x44\xc5\xc8\xf8\xfb\x6f\x94\x69\x3b\
-\x2c\x60\x66\x4b\xfa\xd6\x3c\x49\x5e\x76\xbf\x0c\x18\x39\x5c\x4d\
-\xb4\x61\x81\xd2\x32\x1f\x77\x1f\x80\x2a\x02\xbf\x71\x17\x1f\x7f\
-\xe9\x19\x14\x8a\xdf\x11\xbf\x39\xb6\x5d\x17\x3c\xcf\xa9\xf9\xac\
-\xb1\xac\xea\x3c\x7c\x42\x13\xc9\x9d\xb3\x30\xad\x29\x2d\x95\xc3\
-\x75\xc7\xa4\xbc\xe1\x98\xfa\xbd\x38\xaa\x81\x03\xdd\x0f\x01\x9a\
-\x15\x27\x6b\x39\xec\xab\xf2\x60\x75\xd5\x83\x07\x8f\x55\x0e\x36\
-\xff\x2d\xb5\xb4\x7e\x78\xda\xf5\xcd\xae\xce\x07\x4e\xd4\xa4\x7c\
-\x5e\x7f\xec\xd5\xcf\x90\x26\x0f\x9d\x6a\x50\xb0\x54\xc0\x3c\x59\
-\x0f\x78\xd6\x4b\xf9\x99\x13\xea\x0c\x9a\xf8\x8c\xa9\xaa\xc3\xc3\
-\x82\x25\x6d\xed\xd8\x04\x00\x87\x08\x85\x24\x27\x89\x23\x7b\x9e\
-\xcc\x2c\x5a\x25\x99\x6b\xf3\x64\xc4\x55\x17\x4b\xcf\xd0\x30\x35\
-\xa0\xdb\x00\xa6\xb9\x03\x02\x98\x1d\x90\x40\x7a\x04\x05\xc9\x98\
-\x9b\x2f\x03\x30\x97\x4b\xda\xa6\xa5\x92\xb9\x31\x17\xc0\xcc\x93\
-\xcc\x35\x4b\xc5\x7b\xfc\x78\x00\xb8\x35\x60\x06\x4a\x3b\x4f\x1f\
-\x75\xc9\x57\x0e\x5d\x31\xce\x63\x36\xa6\x17\x3b\x07\x98\x70\xed\
-\x97\xa7\xa5\xf4\xf1\x47\x25\x08\xc9\x98\xb3\xbc\x13\x98\x4c\x86\
-\x16\xe8\x54\x5a\xc2\x7a\xf1\x1c\xec\xd0\x51\x63\xe5\x17\xbf\x7d\
-\x45\xea\xfe\x7e\x56\xaa\x4e\x1f\x97\xb7\xfe\xfa\xbe\x4c\xb1\xbb\
-\xa4\x5d\x2f\x9e\xe6\xc9\xef\x6a\x40\xee\x3f\x09\x4c\x76\x7a\x71\
-\x54\xc0\xd2\x07\xd7\x08\x87\x75\xfd\x43\x60\x7e\x79\x52\x7e\xfe\
-\xd2\x8b\x12\x3c\x6c\x4c\xab\xc0\xe4\x9c\x9f\xbd\xc2\xa3\x64\xec\
-\xdd\xd7\x36\x03\x66\xc6\xd6\x7c\xb1\xad\x9a\x87\xed\x3e\x56\xda\
-\xe3\x80\xc4\x73\xc7\xdd\xcf\xf9\x37\x2a\x08\x1f\x09\x76\x26\x8b\
-\x63\xf9\x42\xc9\x58\x93\x2b\xa9\xf9\x73\x25\x22\xcd\xa6\xc0\x69\
-\x5c\x66\xc4\x0d\x98\x30\x27\x89\x6e\xdb\xdb\x53\xbc\x43\xc2\xa5\
-\xf4\xb1\xc7\x54\x69\xae\xae\x73\x0e\x50\x1e\x04\x34\x39\x3e\xf3\
-\x48\x03\xe7\xd3\xac\x92\xbf\x1d\xfc\xbc\xe2\x60\x7d\xe5\xe2\x7d\
-\x55\xfb\xf4\x94\x6f\x5a\x3f\x4c\x1d\xa8\xaf\xef\xbb\xb7\xe1\xd8\
-\xfd\xfb\x8f\xd7\x1d\x38\x02\xb0\x34\xc2\x12\x56\xe7\x8a\x9f\x3a\
-\x21\xe5\xa7\x4f\xca\xec\x1b\x6f\x54\xd7\xb7\x61\x19\xee\xbe\xe3\
-\x5b\x3b\x36\xc7\xee\x85\xa4\x26\x21\x19\xe6\xcb\x25\x8f\xac\x95\
-\x19\x5b\x56\xc9\x8c\xad\xab\xe4\xe2\xed\xab\x65\xf4\x0d\x57\x48\
-\x37\xff\x20\x05\xd4\xc6\x1d\x97\xc0\x1c\x00\x60\x06\x07\xcb\x98\
-\x5b\xaf\x00\x30\x57\xaa\x1e\xf2\x4c\x33\x61\x66\xae\x5e\x22\x03\
-\xc7\x8d\x45\x7a\xc1\x4e\xd7\xb2\x24\x07\x40\xf8\xd9\x4f\xbc\xf0\
-\x3c\x92\x20\x76\x3c\xec\x74\x56\x0f\x6c\x4b\x60\xd2\xc7\x90\x30\
-\x37\xef\xd8\x26\xfe\x91\x31\xc6\x65\x31\xd4\x65\x22\x9a\x4a\x65\
-\x03\x5e\x06\xf4\x79\x30\xf0\x0a\x8b\x92\xa9\x97\x5f\x2d\xd3\xaf\
-\xb8\x56\x8d\x67\x6c\xdb\xab\xaf\xea\x5d\x6f\x2a\xe1\xcf\x03\x4c\
-\x77\xbb\xc3\xb3\x15\x5b\x9f\xa9\x3e\xd7\xda\x26\xad\xd8\xe8\x79\
-\x0e\x44\x1a\xf7\x97\xfb\xf2\x96\xa9\x03\xda\xb7\x02\x13\xae\xfe\
-\xe2\x84\xfc\xe2\xe5\xdf\x48\xe8\x88\xb1\xd2\x06\x09\x4f\x95\xc8\
-\x6e\x66\x73\x49\xcf\xb0\x70\x19\x75\xfb\x55\x8d\xc0\x74\xa8\x92\
-\xbc\x40\x52\x1e\x5c\x28\xde\x71\x13\xa5\x23\xca\x76\xd5\x6c\x61\
-\x95\xd9\xb8\x65\xf3\x4a\x48\x4a\x82\xcc\xde\xb2\x42\x66\x6e\x5f\
-\x25\xd3\x71\x3b\x1d\xb7\x97\x3d\xb2\x46\xa2\x67\xa4\x9b\xed\xd5\
-\xf8\xde\xaa\x2c\x37\xd6\x9d\x26\x34\x79\xf9\xe4\xb0\x11\xa3\xe4\
-\xf1\xe7\x7f\x25\x55\x67\x4f\x28\x60\xf2\x7a\x40\xaa\x3d\xb3\x96\
-\x1d\x73\x48\x9f\xc7\x8f\x9d\xda\x5b\x5d\xfe\xf4\xa1\x9a\xca\x71\
-\xe6\xbf\xa7\x96\xd6\x0f\x47\xfb\xea\xea\xfa\x1c\x38\x7e\xec\x46\
-\x94\xe2\xef\x1c\xfe\xfa\x4c\x23\x28\x2d\x33\xcd\x54\x9d\x3d\x23\
-\x73\x0b\x0a\x90\x2c\x8d\x39\x23\x8d\x1d\x1e\x3b\xb3\xb2\x09\x1a\
-\x0f\x1f\xe9\x1e\x10\x22\x09\x0b\xef\x96\x59\x5b\x1f\x94\x19\x65\
-\x2b\x64\x46\xe9\x72\x78\x99\x5c\xbc\xe3\x21\xc9\x5c\xb9\x44\x02\
-\x27\xc7\x01\x56\x6e\x69\x07\x3b\x20\x27\xd4\xe8\x11\x14\x22\x63\
-\x6f\xb9\x52\x66\x6e\x5b\x25\x19\x9b\x01\x4a\xc0\x92\xd3\x8d\x11\
-\x98\x5e\xe3\xc6\x00\xb2\xe7\x0e\x29\xb2\x80\xf9\xe4\x8b\x2f\x36\
-\xa6\x94\x03\xc7\x2a\x94\xcf\x0f\xcc\xed\xe2\x1f\x15\xab\xd2\x8e\
-\x01\x4c\x23\x55\xba\x03\xcc\x82\x18\x3b\x2c\xda\xa1\x24\x6d\x87\
-\x83\x80\x31\xe1\x31\xdf\xef\x0e\x4c\xbe\xd7\x4a\x90\xe7\xf1\xf7\
-\x08\x4c\x9e\xe5\xc4\xe1\x57\x77\xe7\xe4\xcb\xc1\x53\xff\xa0\x24\
-\x87\x6b\x00\xcc\x67\x5e\x79\xd9\x04\x26\x4a\x6b\x13\x5c\x96\x15\
-\x30\x43\xc3\x65\xf4\x1d\x00\xe6\x23\x2b\xcf\x05\xe6\x64\x00\x13\
-\xdf\x9f\x49\xdc\x30\xa0\x8d\xdf\x8b\x4d\x2c\x8e\xbc\x39\x80\xe4\
-\x0a\x35\x66\x76\x1a\x7e\x5f\x7a\x06\xa0\x39\xed\xa1\x6c\xe9\x1d\
-\x19\xa9\xda\xaf\xf9\x5e\x03\x98\xf8\x0e\xf8\x3c\x9a\x6d\x9a\x6d\
-\x7a\xf4\x91\xf1\x76\xa7\xbc\xf8\xd6\x9b\x72\x94\xc3\xd5\x14\x30\
-\xdd\xa0\x89\xd2\xbc\xf2\xe4\xf1\x9a\xfd\x47\x2b\xd7\xe3\xb9\x11\
-\xe6\xbf\xa9\x96\xd6\xff\xbf\xd8\x23\x7e\xb8\xa1\x36\x6d\x6f\x7d\
-\xfd\xeb\x07\x4e\x9f\x96\x83\x0d\x75\xea\xf4\x42\x0b\x96\x6c\xc7\
-\x2c\x3f\x75\x52\x36\x3d\xf6\xb8\x74\xb1\xda\x21\x1b\x77\x78\xec\
-\x08\x6e\xc0\xe4\x38\xcc\x01\x63\xc6\x88\x1d\x65\xda\x4c\x26\xcb\
-\x12\x03\x96\x33\x4a\x0b\xe5\x22\xa4\x90\x8b\x36\x16\x48\x74\xa6\
-\x53\xda\x21\xb5\xa8\xb3\x61\x4c\x18\x70\xd0\x7a\x8f\xa0\x50\x94\
-\xe4\x06\x30\x33\x37\xa3\x1c\xe7\x79\xcd\x45\x79\x32\x75\x4d\x96\
-\x0c\x1a\x3f\x4e\xda\x7b\x62\x67\x6b\x05\x98\x4c\xba\x3f\x7d\xe1\
-\x25\x35\x4b\x0e\x81\x79\xf0\x3c\xc0\xdc\xa7\xda\x30\x4f\x4b\xd9\
-\x4f\x9f\x90\xa0\xc1\xc3\xd4\x25\x32\x5a\x03\xa6\x65\x77\x88\x29\
-\xe3\x3d\x4d\xa5\xb3\xf1\x77\xff\x2f\xc0\x44\x79\x3c\xa7\x70\xa5\
-\xec\xc7\xef\xf2\x6d\xc0\xdc\x8b\x6d\xc0\x4e\xae\x9f\xe3\x60\x12\
-\x32\x1c\x25\x79\xdf\x73\x13\x26\xb7\x7b\xef\xf0\x48\x19\x77\xf7\
-\x75\x32\xdd\x04\x26\x9d\x0e\x60\xa6\x3e\x60\x26\xcc\x73\x80\xe9\
-\x27\xfd\x87\x0d\x93\x59\x9b\x97\x49\xe6\xd6\x42\x99\x5a\x96\x0f\
-\x58\x16\xca\x74\xfc\xce\x33\x71\x80\x9c\x8d\x03\xa5\xcf\x84\xb1\
-\x58\x67\x7c\x3f\x1e\x7c\x5a\x94\xe6\xc6\x79\xfb\x80\x26\xb6\xff\
-\xb4\x6b\xaf\x97\xb7\x3f\xf9\x58\x2a\x4f\x23\x69\x12\x96\xca\xa8\
-\x0e\x6a\xcb\xa5\xe2\xc4\x31\xa9\x3a\x59\x5f\x83\xdf\x33\xbf\xa6\
-\xe6\xa0\x3e\xe7\x5c\xeb\x87\xa1\x8a\x6f\x2a\xba\x03\x90\x57\xed\
-\x6f\x68\xd8\x73\xf8\xec\x59\x24\xb5\x3a\xe5\xfd\xf5\x00\x66\xc3\
-\x31\x39\x82\x72\xfc\xaf\xfb\xf7\x4a\xf0\xd0\xe1\x6a\x0a\x35\xb6\
-\x3d\x76\xc2\x4e\x4b\x5b\xb0\xa4\x09\x91\x0e\xd8\x29\xbd\x46\x8d\
-\x10\xe7\xb2\x05\xd8\x79\x00\xcc\xa2\x42\x99\x59\x52\x00\xe7\xcb\
-\x45\x5b\x01\xcf\x75\xd9\x12\xe1\x4c\x01\x58\x8d\x19\x74\x2c\x18\
-\x70\xc7\xed\x1e\x18\x26\x23\x6f\xb8\xdc\x00\xe6\x26\x80\x12\x9e\
-\xb6\x39\x4f\xa6\xaf\xcf\x96\x80\xc9\x93\xa5\x1d\x4a\xf2\x96\xc0\
-\x64\x27\x48\x3b\x40\x7a\xdb\x2f\x9e\x51\xc0\x64\xc7\x01\xe7\x5f\
-\xe4\x35\x6e\x5a\x02\x73\x3f\x80\x59\xff\xd5\x69\x79\xfc\x97\xcf\
-\x4a\xc4\x28\x00\xa4\x47\x5f\x05\x01\x03\x7c\x26\xb0\x5a\x01\xe7\
-\xb9\x36\x01\xd8\x2a\x1c\x5b\xbe\xf7\x02\x0c\xa8\xb8\x83\xb1\xa5\
-\xdd\x2f\xf6\xa6\xce\xa3\xc7\xf7\xce\xdf\x58\xa4\xda\x95\x0d\x60\
-\x56\x98\x06\x24\xd9\x86\xcb\x09\x85\xf1\x3c\xaf\x1f\x5e\x87\x03\
-\xc4\x63\xcf\x3c\x23\x81\x83\x47\xa8\x4e\x17\x6b\x39\x96\xd9\xc1\
-\xd5\x27\x3a\x56\x26\xde\x7f\xb3\x4c\x47\x49\xce\x74\x69\x74\xfa\
-\xe4\x4b\xf2\xca\x79\xe2\x35\x7e\x8c\x02\x26\x0f\x2c\xc6\x39\xf6\
-\xf8\xcd\xb1\xbd\x3c\x63\x07\xcb\xac\x4d\x80\xe4\xd6\x02\x99\x5a\
-\x8a\xdf\x49\xa5\xcc\x7c\x35\x3d\xdc\x45\x25\x2b\xd4\xff\x00\xcb\
-\x72\x96\xef\xd6\x67\x59\xc0\x54\x66\x7b\x26\xe7\xea\xc4\x72\x39\
-\x1d\x5e\xf9\xf1\x7a\x39\xc2\x33\xa9\x58\x21\xf0\xa0\x87\x94\x79\
-\xa4\xfe\x28\xdb\x33\x4f\x1d\x38\x76\x64\x47\x55\x7d\x95\x3e\x0b\
-\x48\xeb\x87\x21\x26\xcc\xfd\x48\x98\x07\x1b\x1a\x5e\xaf\xfa\xfb\
-\xd7\xb2\x9f\x57\x2b\xe4\x99\x3d\x75\xf8\x07\x46\x99\x6b\xcc\x71\
-\x59\x2f\xab\x8a\x4a\xa4\x13\xc0\xd6\xd1\x93\x3b\x3a\xfe\xe9\x95\
-\xb1\x53\x9b\x3b\xbe\x6a\xcf\xc3\x4e\xd0\xdd\x37\x40\x92\xee\xbd\
-\x5d\x66\x95\x02\x98\x2c\xc7\x8b\xf2\xe1\x1c\xb9\x14\x3b\x64\xf2\
-\xe2\x3b\x90\x4e\x86\x18\xc0\xb4\x80\x30\x90\xa7\x22\x22\xb1\xf9\
-\x87\xca\x90\x6b\x2e\x96\x59\x28\xeb\x9a\x80\x89\xf4\xb2\x21\x57\
-\x42\x52\x93\x51\x52\x62\x87\x6d\x09\x4c\x24\x95\xb6\x28\x97\xd7\
-\x6c\xdd\x81\x54\xc9\x0e\x83\xf3\x03\x93\x09\xf3\xd8\xd9\x93\xf2\
-\xe2\x1f\x7e\x2f\x63\x92\x53\xd5\xf9\xce\x2d\x81\x69\xb9\x19\xd0\
-\xce\xe7\xff\x27\x60\x76\xf3\x09\x91\xcd\x4f\xfe\xcc\x1c\x56\x84\
-\xd2\x1b\xdf\x6b\x6f\x0d\x67\x2f\x42\xc2\x6c\x06\xcc\x0a\x69\xf8\
-\xea\xac\x6c\xde\xc1\x2b\x60\x0e\x01\x30\xcf\x2d\xc9\xdb\x03\x98\
-\x9e\x23\x47\x48\xfc\xd2\xbb\x25\xf3\x51\x0b\x98\x4c\x98\xf9\x92\
-\x50\x70\xaf\x78\x8e\x18\x6a\x8c\xc3\x6c\xb6\x0e\x58\x2f\xdf\x40\
-\x99\x7c\xdf\xcd\x32\xeb\x31\x94\xe0\x00\xe5\xb4\x12\x24\x4d\xf8\
-\xe2\xc7\x1f\x96\xe4\x85\x77\xa2\x64\x0f\xc2\x01\xd5\xa7\xe9\xb3\
-\xf0\x5b\xa9\xeb\x1f\xe1\x3e\xad\x66\xad\xc7\xc1\xd5\x76\xe9\x95\
-\xf2\xca\x1f\xdf\x53\x33\xb6\x1f\xae\x37\x7e\x3f\x5a\x9d\x05\x74\
-\xa2\x56\xaa\x4e\xd4\xd6\xec\xad\x3e\x8c\x84\xa9\x67\x35\xd2\xfa\
-\x01\xe9\x70\x43\x83\xc7\xbe\xda\xda\xf9\xfb\xeb\xea\x0e\x55\xf0\
-\x1a\x32\x3c\x27\x1b\xb0\xdc\x5f\x5f\x23\xbc\x84\x03\x4f\x39\xe4\
-\xf3\xd9\x0f\xad\x41\x8a\x1c\x04\x70\x12\x96\x6c\x3f\xc4\xce\x63\
-\xee\xf8\xc6\x38\x42\x0e\x2d\x19\x28\xfd\x87\x0f\x93\xc4\x79\x77\
-\xc8\xec\xe2\x15\x72\x71\xe9\x0a\xb9\xac\x0c\xe5\x5e\xce\x7d\xe2\
-\x37\x79\xbc\xb4\x1f\xc0\xf1\x80\x7c\x7f\x13\x14\x54\xfb\x20\x76\
-\xc2\x18\x5e\x98\x6b\xfb\x03\x46\xef\x38\xa1\x49\x60\x6e\xca\x97\
-\xa8\x69\x2e\x24\x49\x5e\x09\xb1\x39\x30\xe9\x36\x3d\x3d\x65\xe1\
-\x8a\x55\x00\x05\xaf\x52\x89\x75\x3d\x4f\xa7\x0f\x01\x72\xf4\x54\
-\x83\xfc\xf1\xe3\xbf\x49\xda\xc5\x97\xa9\x49\x83\xad\x92\xfc\x82\
-\x81\xa9\xca\x6f\xd3\x2a\x69\xb6\x74\x2b\x7f\xe3\x66\x6b\x38\x55\
-\x4b\xbb\x03\xd2\x72\xd3\x84\xc6\x4d\xee\x88\x03\x44\xbf\xd0\xc1\
-\xf2\xdc\x1b\x3b\x71\x40\xab\x31\xca\x70\x7c\xb7\xc6\x32\x1c\xc0\
-\xe4\x65\x79\x39\xac\x8a\xcf\x37\x7c\xfd\x85\xe4\x3d\xb4\x5a\x3c\
-\x83\xa3\x8c\x44\xe7\xb6\x2c\x9a\x97\xe4\xf0\x8b\x9b\x20\xb6\x55\
-\x73\x25\x7d\x47\xa1\xd8\x91\x2e\x55\x2f\x79\x59\xae\x24\x2c\xbd\
-\x4b\x7a\x47\x47\xa9\xe1\x61\xd6\xfb\x1b\x81\x07\x18\xf6\x8b\x8e\
-\x16\x7b\xee\x7d\x72\xc9\xd6\x55\x72\xe9\xd6\x07\x64\x36\x7e\xe3\
-\x94\xac\x9f\x48\xdf\x21\x31\x80\x2a\x7e\x4f\xa6\x4b\x00\xde\x30\
-\x7f\x2b\x13\x98\xf8\xbe\x6d\x51\x15\xd8\xaf\xbe\x56\x5e\xfe\xe0\
-\x2f\x6a\xf6\xa5\xc3\xb5\xc7\x54\x75\x60\x00\xf3\xa8\x2a\xc7\x2b\
-\x8e\xd7\x9e\xde\x7b\xf4\xc8\x2f\xf7\x1f\xab\x9a\x68\xfe\x9b\x6a\
-\x69\xfd\x30\xf4\xbb\x7d\xfb\xba\xec\x3b\x76\xcc\xf1\x59\x55\xe5\
-\x6b\x9f\x54\x54\xaa\x49\x81\x39\x97\x21\xa1\xb9\x0f\xc0\xe4\xe4\
-\xbb\x9c\xd8\x82\x97\x49\x98\x93\x53\x20\x1d\xfa\x0c\x02\x18\xb1\
-\xa3\xf7\x6f\x82\x81\x05\xc0\x4e\x48\x6d\xed\x07\x00\x6e\x01\x41\
-\xe2\x3d\x61\x9c\x84\x38\x53\x01\xca\x49\xd2\x2b\x38\x14\xef\xc3\
-\xce\x87\xd7\x99\x52\x78\xd6\x8a\x82\x03\x1e\x77\xe4\x99\x31\x80\
-\x57\x48\x7a\x2a\x4a\xf9\x95\x0a\x98\x19\x34\xd2\x29\x53\xe6\x98\
-\x6b\x2f\x51\x83\xac\xcf\x07\xcc\x2b\x6e\xbb\x4b\x3e\xe7\xa9\x77\
-\x28\xeb\x08\x8b\xd6\xc6\x61\xd2\x47\x1a\x00\x99\xaa\x0a\xb9\xf9\
-\x9e\xfb\x54\x6f\x2d\xd7\xa7\x35\x60\xb2\x5d\xd1\x1d\x74\x8d\xfe\
-\x17\xd3\x64\x6b\xb0\xa4\xdd\x41\x69\xd9\x1d\x6c\x0a\x56\x80\x67\
-\x07\xaf\x40\x89\x98\x90\x24\xef\xef\xdd\xab\x86\x4f\xa9\xcb\x54\
-\xb8\xb7\x5b\x02\x96\xca\x6a\x1b\x54\xca\xb1\xaf\x4e\xcb\x2d\x73\
-\xe7\xab\x2b\x36\xb6\xe3\x41\xc9\x7d\x99\x58\x1e\x13\x66\xb0\x23\
-\x59\xd2\x36\x2c\x55\x63\x2f\x1d\xc5\x4b\xc5\x59\xc2\x09\x38\x72\
-\x25\x6e\xde\xad\xd2\x35\x28\x44\x3a\x71\xdd\x55\x3a\x6c\x4a\x88\
-\xec\x31\xef\x82\x6d\xd7\x3d\x20\x50\x02\xe3\x27\x49\x04\x7e\x63\
-\xef\x89\x63\xa4\x93\x1f\x0e\x1a\xac\x34\xd4\xf2\x9b\x77\xd2\x75\
-\xf5\x0e\x52\x53\xe6\xb5\xf1\x18\x20\x69\xd7\xdf\x28\xbf\xfb\xdb\
-\x5f\xa5\xea\xcc\x49\x39\x52\x87\x0a\x06\xd5\xcc\x61\x56\x07\x75\
-\x55\x72\xe4\x04\x0e\x7a\xf8\x7f\x7b\xff\xf3\x5d\x55\x28\xc9\xb3\
-\xf7\x1f\x3d\xaa\x27\x1a\xd6\xfa\xe1\x69\xd7\x37\x35\xbd\xf6\xd4\
-\x1c\xbd\x6e\x4f\x75\xf5\xce\xfd\xc7\xea\x90\x2a\xeb\x01\xca\xa6\
-\x19\xcb\x39\x0b\x10\xff\x91\x59\x3e\xdd\xb3\x38\x5b\x3a\xf6\x1a\
-\x28\x9d\x90\xfa\x3a\x9b\xc3\x8b\x2c\x60\x76\x34\x61\x48\x10\xf0\
-\x94\xc7\x76\x28\xb7\x39\x2d\x1b\x07\x34\x73\xd6\x6e\xbe\x4f\x01\
-\x13\x56\x70\x30\x81\xd9\x61\xc0\x20\xf1\xc6\xce\x37\x9d\x9d\x09\
-\xc5\xbc\x6c\x42\x9e\xf2\x54\xdc\x9f\x7c\xef\xcd\xd2\x9e\x3b\xbc\
-\xdb\x0e\x68\x99\x03\xd7\x27\x39\x33\xe5\xa3\x7d\xfb\xd5\x8e\xa7\
-\x80\x81\xe4\xc5\x71\x97\x2d\x81\xc9\xe4\x59\x7d\xe6\x94\xac\xdc\
-\xb4\x59\xfa\x05\x04\x03\xc2\xbc\x3a\xe2\xb9\xc0\xa4\x5b\xc2\x4e\
-\xf9\xff\x1d\x98\x41\x32\xe3\xa6\xbb\xd4\x6f\xc3\x36\x59\xa6\x66\
-\x05\x4a\x9e\x0e\x5a\xcb\x64\xc9\x99\x9a\x0c\x60\xf2\x94\x4e\x4e\
-\xc0\x91\x7e\xd9\x55\xea\x8a\x8d\xed\xf1\x3d\x09\xbb\xc6\x65\xaa\
-\xcf\xf6\x91\xa8\xd9\x99\xea\x3c\xf2\xb4\xb2\x1c\x71\x29\x60\x72\
-\x22\x8e\x1c\x19\x7b\xe7\x75\xd2\x01\xbf\x4d\x67\xce\xaa\x6e\x6e\
-\x6b\x0b\x98\xc6\xc5\xe1\xf8\x1a\x7f\x5b\x6f\x80\x97\xbf\x9f\x8f\
-\x74\xe2\x73\xd6\xf2\x5b\x00\x93\xe0\x65\x19\x3e\xf5\xce\x3b\xe4\
-\x0f\xbb\x3f\x95\xaa\xb3\x80\x25\x2f\xc3\x8c\x83\x1c\x27\x34\x61\
-\xba\x3c\x8c\xf5\xe5\x4c\x58\xbb\x8f\x56\x1e\x3d\x58\x5f\xb5\x7a\
-\x5f\xd5\xe1\x61\xe6\xbf\xa7\x96\xd6\x0f\x4f\x55\x55\x55\x3d\x76\
-\xd7\x54\x5d\xbd\xb7\xa6\xe6\x8d\xf2\xe3\x27\xe4\x40\x5d\x1d\x76\
-\x42\xa6\x36\x24\x4d\xec\x8c\x9c\x38\xe1\x00\xa0\x54\x71\xe2\xb8\
-\xfc\x64\xc1\x52\xe9\x0c\x60\x72\x52\x0c\xd5\x9e\x69\x0d\x6c\xe6\
-\x4e\xd6\x62\xe7\xbf\x10\xf3\xda\x33\xfd\x47\x8e\x90\x8c\xd5\xd9\
-\xd8\x81\x97\x37\x02\x33\x03\x09\xd3\x91\x3b\x47\xba\xf9\x21\xed\
-\xa0\x24\x35\xae\xde\xd8\xb4\x23\xb6\x07\x94\x03\x87\x8c\x94\xd7\
-\xdf\x7f\x5f\x0e\x12\xf0\xea\xea\x89\xad\x27\x4c\xd5\x8e\xf9\xc5\
-\x69\xf9\xf5\x6b\xaf\xc9\xc8\xf8\x44\x35\xd9\x6d\x57\xac\xef\xf9\
-\xa0\x49\xff\xa3\x8e\xa0\x66\xe0\xfb\x47\xaf\x63\x79\x2d\xcd\x03\
-\x48\xe3\x67\x99\xcf\xa9\xe7\x2d\xf0\x98\x66\x27\x5b\x77\xff\x48\
-\x79\x60\xfb\x63\x48\x61\xc7\x1b\xbf\x93\xd5\x04\x41\xab\xb3\x9c\
-\x4c\x97\x9f\xaa\x97\xbf\xec\xfb\x5c\xc6\xa4\x38\xa4\x9d\x07\x4f\
-\x4d\x35\x96\xc9\xcb\x7b\xf0\x62\x6f\x9d\x71\x00\xea\x8e\x2a\x60\
-\xc4\x4d\x97\xc9\xb4\xed\x2b\xc4\x05\x50\xba\x50\x8e\xbb\xb6\x70\
-\xf6\xf5\xa5\x32\xf4\xea\xd9\xd2\x96\x57\x8f\x34\x3f\x9f\x76\x5f\
-\x6f\x77\xb7\x6c\x3a\xb0\x7e\x1b\x9e\xfb\x4f\x77\xc4\x36\xe4\x95\
-\x36\x2f\xba\xeb\x6e\x79\x73\xef\x2e\x29\x07\x2c\x0f\x71\xe2\x65\
-\x54\x2f\x34\xe7\x00\xe0\xc4\x29\x15\xa7\x8f\xb3\xdd\xbc\xf2\x60\
-\x6d\x85\x3e\xd3\x47\xeb\xc7\x21\x75\x2e\x79\x6d\xed\x15\xfb\xeb\
-\xeb\x7f\x5f\x79\xea\xac\xec\x57\xd0\xb4\x80\x69\xf8\x10\x12\x41\
-\xf5\x29\x94\xe7\x59\x79\xd2\x0d\xb0\xec\xd8\x8f\x03\x95\xb9\xf3\
-\x00\x0a\x28\xad\x95\x79\xbf\x95\x9d\xeb\x7c\x66\x52\xe9\x13\x19\
-\x23\x29\x4b\xef\x53\x03\xa1\x2d\x60\x66\x02\x98\x19\xab\x96\x48\
-\xbf\xe8\xc1\xbc\x4c\x2b\x92\xa9\x01\x4d\x6b\xa7\xe4\x10\x15\x0e\
-\x51\x7a\xfc\xb9\x5f\x01\x88\xd5\x6a\xf2\x60\xb6\xed\xa9\x0b\x82\
-\xb9\xc1\xd2\x72\x79\x43\x9d\x7c\x76\xf8\xb0\xdc\x70\xf7\x3d\xd2\
-\xa6\x47\x2f\x40\xca\x1a\x57\xd9\x1c\x94\x96\x7f\x08\xc0\x64\xba\
-\x24\x30\x23\x26\x26\xca\xce\x3d\xbb\x51\xba\x22\x4d\x56\x97\xe3\
-\xfb\x94\xb7\x0a\x4c\xa6\x4e\x9e\x16\xf9\xd4\x6f\x9e\x17\xff\x21\
-\xc3\xa5\xad\xc7\xc0\xc6\x65\x59\x13\x63\x70\xca\xb7\x3e\xb1\xb1\
-\x32\x61\xee\xad\x32\xed\x91\x07\xcc\x21\x45\x4b\x91\x34\x73\xc5\
-\xf6\xf0\x02\x09\x4d\xb3\xa9\x31\xa8\x7c\xbf\x65\xf7\xf5\x76\xf7\
-\xf9\x80\x49\x77\xc4\x81\xb4\x0d\x4a\xff\x4b\xef\xbf\x5f\xde\x3d\
-\xb0\x1b\x65\xf8\x71\x23\x49\xba\xf9\xf0\xf1\x63\x72\x94\xe5\x79\
-\x43\xfd\x91\x03\xb5\x47\x57\xee\x3f\x7e\x5c\x9f\x4b\xae\xf5\xe3\
-\x11\x7b\xce\x91\x2c\x2f\x45\xe9\xf7\xdb\xca\xd3\xa7\x55\xfb\xa5\
-\x3b\x30\xd9\x7e\x76\x18\xcf\xd5\x9c\x39\x23\x4b\x96\x3d\x24\x3d\
-\x00\xad\xf6\xfd\xbc\x91\x62\x00\x85\x7f\x12\x98\x9c\xb4\xb7\x67\
-\x40\xa8\x8c\xbd\xe5\x6a\x99\xb1\xfd\x01\x49\x73\x4b\x98\x53\xd7\
-\xe7\x49\x50\x4a\xa2\x9a\xc9\xbd\x33\x4b\xbd\x96\x97\xa8\xe8\xd1\
-\x4f\xe6\xe4\x17\xc8\xae\x0a\x94\xa9\x58\x2f\x02\xb3\xf1\x2a\x8a\
-\xad\x40\xb3\xf6\xec\x29\xd9\xfa\xe4\x93\xe2\x1b\x1d\xab\x26\x11\
-\x76\x07\x64\x4b\x2b\x88\x01\x9a\xaa\x2d\xaf\x15\xf3\xf9\x96\xaf\
-\xa9\xe7\xdc\x40\xf9\x6d\xc0\xa4\xf9\x19\xee\xb0\x34\x06\x7c\x13\
-\x3c\x2c\x6b\x03\xf1\xb7\x58\x17\xef\x10\xb9\x25\xb7\x50\x0e\x9f\
-\x3e\x89\xef\x60\xc1\x92\x6e\x4a\x99\x8d\x09\x13\xcf\xd5\x7f\xf3\
-\x95\x2c\x5a\xb1\x5c\xfa\x60\x9b\x72\x6a\xb7\x26\x98\x19\xb3\xcb\
-\xb3\xfd\x72\x50\xfc\x04\x49\x5a\x31\x47\x32\xb7\x2f\x37\xd2\x65\
-\x71\x96\x3a\x2d\x32\x79\xc5\x5c\x75\x76\x15\x67\x65\x6f\xfc\x3b\
-\xd8\x7d\x9d\x2d\x37\x83\xa5\xb9\xbe\x2a\x59\xe2\x77\xe9\x44\x58\
-\xf6\xf3\x92\x99\x77\xdf\x2d\x6f\xed\xdf\x2d\x15\x67\x01\xcb\xe3\
-\x38\xe0\xf2\x14\x48\x24\x4a\x23\x59\xd6\xc8\x51\xa4\xfe\xf2\xd3\
-\x0d\x87\x0e\x9f\xa8\x29\x3c\x72\xbc\x5a\xcf\x56\xa4\xf5\xe3\xd3\
-\xae\x6f\xbe\xe9\xbc\xf7\xd8\xb1\xd9\x48\x98\x2f\x57\xb1\xe7\xdc\
-\x2d\x65\x5a\x97\x51\x65\xef\xe6\xb1\x2f\xcf\x4a\xf6\x03\xab\xa5\
-\xb7\x4f\x08\x80\xc6\xd9\xd6\x8d\x29\xcf\xd8\x6b\xde\xda\x0e\x76\
-\x3e\x73\x4e\x4c\x96\x8b\x91\xd3\x5c\x32\x73\x2b\x80\x59\x64\x00\
-\xd3\x4a\x99\xa3\xae\xbf\x1c\xa5\x25\x97\xcf\x1d\xd3\x1d\x98\xbc\
-\xc4\xee\x00\x89\x4b\xcf\x94\x3f\xef\xde\xad\x86\x42\x59\xd7\xeb\
-\xb6\x86\xd8\xb8\xc3\x92\x6d\x9b\x95\x27\xea\xe4\xaf\x7b\x77\xcb\
-\x95\xb7\xde\x2e\x6d\xba\xf6\x02\xe4\xb0\xe3\x13\x4a\x58\x8f\x56\
-\x81\x09\x2b\xe0\xb5\x00\x23\xcd\x74\xab\x06\xe1\xbb\xf9\xbb\x02\
-\xf3\x1c\x37\x02\x13\x09\x1a\x00\xea\x80\xf5\x0b\x1a\x1b\x27\xbf\
-\xf9\xdb\x47\x00\x4c\x3d\xbe\x87\x31\x38\xdf\x70\xf3\x84\xa9\xae\
-\xd0\x88\x04\x7a\xe4\x78\x83\xa4\x5d\x76\x05\x96\x87\xcf\x86\xdd\
-\xa1\xc6\x65\xb6\xef\xef\x2d\x61\x33\x1c\xc6\x2c\xeb\x5b\xf2\x24\
-\x0d\xe9\xd2\x55\xb2\x54\x32\xcb\xf2\x24\x6e\xc1\x6d\xd2\x43\xcd\
-\x70\xef\x83\x34\x8f\xf5\xc1\xdf\x29\xb7\xb2\xae\x8d\xcb\xf5\x6e\
-\x6a\xb3\x54\x65\xb8\x4a\x96\x5e\x72\xe5\xfc\xb9\xf2\xc7\x83\x7b\
-\x08\x44\x39\x74\x9c\x89\x12\xa0\x6c\xa8\x85\xeb\x90\x28\xeb\xa4\
-\xe6\xec\x19\xa9\x38\xd9\x70\xe0\xd0\x89\xea\xbc\x43\x0d\x0d\x61\
-\xe6\xbf\x9f\x96\xd6\x8f\x4f\x1f\x7d\xf4\x51\xa7\x3d\x35\x35\x33\
-\x91\x36\x5f\xaa\x3a\x63\x24\x4d\x0b\x96\x96\x0f\x01\x50\xb5\x5f\
-\x9e\x91\x95\x9b\xca\xc4\x23\x38\x4a\x5d\x0e\xa1\x9b\x17\x81\x79\
-\xee\xce\xf5\xad\x06\x50\x78\x3a\xdd\xc0\x09\xe3\x64\xda\xa6\x65\
-\x92\x61\x76\xfc\x64\x10\x98\x9b\xf2\xc5\x96\x7d\x9f\x74\xf1\xe3\
-\x90\x16\xbe\xbf\x69\xe7\x24\x30\x59\xae\xf6\x0d\x0c\x97\x5f\xbe\
-\xf6\x9a\x4a\x98\xfb\x38\x0e\xf1\x3c\xc0\x54\x06\x50\x6b\x4e\x9d\
-\x94\xc7\x7e\xf9\x9c\x04\x0d\x19\x81\x84\xca\x89\x38\x50\x76\x62\
-\x3d\xce\x07\x4c\xba\xb5\xd7\xe9\x96\x65\xfb\xf7\x09\xcc\x8e\x03\
-\xb0\x5e\xbe\x61\x72\xfb\xf2\x55\x72\xe8\x4c\x83\x1c\xa8\x06\x24\
-\xf1\x1d\xce\x07\x4c\xba\x1a\xe5\xed\x2b\xef\xbc\x2b\x61\xa3\xc6\
-\xa9\xd3\x4e\x9b\xa0\x66\x80\x8d\x13\x78\x74\xf3\x0f\x96\x91\xb7\
-\x5c\x2e\xd3\x76\x2c\x57\x1d\x3e\x04\x66\x5a\x69\x8e\xa4\x17\xe7\
-\xca\x88\x9b\x2e\x97\x0e\xfc\x0d\xd9\x31\x77\x01\xc0\x34\x3a\x7a\
-\xcc\x64\x09\x77\xc0\xf3\x6d\x50\xf2\x5f\xbd\x70\x91\xfc\xe9\xf0\
-\x7e\xa9\xc0\x7a\xab\xcb\x7a\xa8\x31\xbd\x34\x60\x79\xbc\x5e\x8e\
-\x7d\x71\x96\xa7\x40\xee\x3d\x72\xa2\x2e\xbb\xaa\xbe\x5e\x0f\x4e\
-\xd7\xfa\xf1\x8b\x17\x41\xdb\x57\x53\x33\x6d\x7f\x4d\xcd\xf3\x95\
-\x80\x0c\x27\xb9\x38\x50\xc3\xb2\xdc\xf0\x01\x94\xe7\x4c\x34\xb5\
-\x7f\x3f\x23\x25\x3f\x7d\x0a\x00\x1a\x0e\x68\xf6\x57\xbd\xb0\xdf\
-\x15\x9a\x1c\x8f\xd9\x3b\x32\x5a\x52\x01\xc7\xa9\x65\x2b\x24\x6d\
-\x63\xae\xa4\x6f\xe4\x65\x2a\xf2\xd5\x8c\x47\x03\x27\x8e\x97\xb6\
-\x28\x2f\x3b\x32\x25\x99\x65\x39\x27\xe4\xe8\xce\x94\x89\xb2\x7c\
-\x41\xe1\x0a\x35\xbc\xe8\x10\x92\xef\xb7\x02\x13\xe6\x35\x65\xf6\
-\x54\x56\xc8\xbc\x9c\x7c\x69\xd7\xcb\x53\xf5\xf6\xbb\x43\xb0\xb5\
-\xf5\x6b\xed\x75\x7e\xc7\xc6\xe7\xbe\x2f\x60\xb2\x03\x0d\xdf\x8f\
-\x25\x6d\x47\x80\x7c\xdc\xac\x2b\xe4\xed\x23\x87\x50\xc2\x72\xdb\
-\x37\xef\xe8\x69\xcd\x75\x5f\x9f\x95\xb9\xb9\xf9\xd2\x8b\x97\xfb\
-\x45\x4a\x6c\x0e\x4c\xe3\x0c\x1f\xaf\x11\x23\x25\x21\xeb\x6e\x99\
-\xbe\x63\x99\xa4\x97\x64\x03\x94\xd9\xea\x34\x47\xc7\xea\xc5\x12\
-\x92\x61\x93\xf6\x48\xed\x4c\xfc\x16\x10\x0d\x28\x36\x77\x23\x48\
-\xd5\x63\x63\xea\x39\xa6\x75\x96\xe1\x37\x2d\x5e\x22\x1f\x55\x1c\
-\x51\x9d\x4f\xc6\x84\x1a\xb5\xcd\x7c\xec\xab\x33\x78\xad\x61\x77\
-\xf9\xf1\xfa\xc5\x15\x75\x67\xf4\x45\xd0\xb4\xfe\x7b\xc4\xcb\xec\
-\x1e\xa8\xad\xce\x38\x58\x53\xfd\xdc\xd1\x93\xc7\xbf\x21\x34\x2d\
-\x60\x1a\x13\x27\x18\xa7\xb4\x35\x7c\x73\x5a\x7e\xfe\x9b\x17\x24\
-\x76\x5c\x9c\xb4\xeb\xe3\xa5\xca\xec\xef\x02\x4d\x02\xb3\xab\x5f\
-\x90\xea\xa1\x9d\xbe\x75\x95\x02\x66\xda\x06\xa4\x9f\x0d\xb9\x92\
-\xb9\xa1\x50\x46\x5e\x7f\xa5\xb4\x41\x62\x62\x6f\xb9\x95\x30\x09\
-\xcc\x1e\x70\xfb\xde\x03\x64\xf8\xe4\x64\xd9\xf9\xe1\xdf\xe4\x70\
-\x5d\xed\x3f\x04\xa6\x1a\xc8\x7e\xfa\xb8\xec\xfc\xe0\x7d\x71\xcc\
-\x98\x25\x6d\x3a\xf7\xc4\x0e\xdf\x94\x32\x5b\x5b\x3f\xeb\x35\xf7\
-\xd7\x2d\x60\xba\x8f\xdd\x74\x07\xa6\xfb\xdf\x5f\xb0\x01\x49\x5e\
-\x1d\x93\xa5\xb8\xff\xb8\x49\x52\x82\xe4\x7c\xe0\xd4\x09\x75\x06\
-\x53\x6b\x80\x74\x37\x9b\x1b\x3e\x41\xaa\x1b\x99\x90\x6c\x0c\xf5\
-\xb1\xd2\xaa\x65\x3c\xe6\x25\x90\x43\x33\x1c\xe2\xda\x60\x4c\xe5\
-\x46\x60\xa6\xc1\x99\xdb\x0a\x64\x4a\xce\x4f\xd4\xa4\xc2\x1d\xfb\
-\x0d\x6a\x06\xcc\x66\xcb\x30\xed\x0e\x4c\x8e\xd3\xec\x80\xef\xcd\
-\xf1\x9e\xf7\x14\x2c\x93\x4f\xab\xca\xd5\x65\x4c\x08\xc7\x0a\x1c\
-\x9c\xdc\x61\x59\xff\x77\x24\xcb\xd3\x27\x3e\x43\xca\x5c\x70\xa4\
-\xb6\x56\x5f\x66\x57\xeb\xbf\x4f\x22\xd2\xf6\xde\xec\x6c\xd7\xc1\
-\x9a\xa3\xcf\x54\x9c\x6c\xf8\x9a\x6d\x85\xaa\x03\x08\xc0\xe4\xac\
-\xe4\x87\xd4\x39\xc0\x48\x37\x5f\x9e\x92\x57\xdf\x7a\x5b\xc6\x26\
-\xdb\x55\xdb\x62\x07\x9e\x01\xc3\xc4\xd4\x1a\x18\x5a\x98\x80\xe1\
-\xe0\xe6\x41\x13\x51\x96\x6f\x2c\x04\x30\xf3\x14\x30\x5d\x84\x26\
-\xee\xbb\x96\x2f\x92\x9e\x61\x11\xd2\x05\x25\xa5\x05\x4c\x76\x00\
-\x75\xf3\x0e\x06\xb4\x82\x14\xa4\xd7\x6e\xd9\x21\xfb\xaa\xaa\x04\
-\x70\x97\xfd\x47\xcf\x0f\x4c\x9a\x69\xad\x0a\x3b\xf5\x33\x2f\xbf\
-\x20\x91\xa3\x46\xab\xeb\xfc\xa8\xf2\xba\x95\x75\xa3\x09\x47\xcb\
-\x2d\x9f\x53\xa7\x38\x7e\x5f\xc0\xc4\xf6\xe2\x88\x80\x3e\x91\xc3\
-\x24\x6b\xfb\x76\xd9\xfd\xc5\x49\xd9\x6b\xce\xf3\x69\x99\x97\x76\
-\x50\xb3\x96\x37\x3e\xc7\xef\x8a\x83\x16\xd2\xe5\x43\x25\x45\xd2\
-\x2f\x20\x54\x01\x93\xe7\x6d\x13\x6e\x56\xef\x38\x67\x60\xea\xce\
-\xa9\xf4\xee\xba\x5a\xa6\x6e\x47\x39\x5e\x82\x32\xbc\x04\x49\xbe\
-\x34\xcf\x28\xc7\x6f\xbe\x42\xda\xab\xb1\xa6\x7e\xea\x6f\x2c\x30\
-\xba\x83\x52\xb5\x57\xc2\xee\x83\xd9\xdb\xe2\x6f\x3a\xf9\x06\xc9\
-\x92\x35\xeb\x65\x17\xd6\x83\x57\xd5\x2c\x3f\x5e\x03\x58\x1e\x53\
-\x6e\x84\xe5\xd7\x5f\xc8\xd1\x2f\x4e\x7e\xf2\xfc\x9b\xaf\xcd\x75\
-\x5d\x79\xa5\x3e\xe5\x51\xeb\xbf\x5b\x80\xa6\xe3\xae\x85\x8b\x9e\
-\x3e\xd8\x50\xfb\x15\x27\x80\x65\x3b\x26\x67\x09\x3a\xcc\x9e\x73\
-\x96\xe7\x9c\xf4\xe1\x8b\xd3\xf2\xd6\x47\x1f\x4a\xd2\x8c\x99\xd2\
-\xd6\xc3\xcb\xd8\x71\xb1\xf3\xb5\x0e\x87\xe6\xee\x88\xf7\xf6\x0a\
-\x0d\x93\x84\xb9\xb7\x4b\x66\xf1\x32\x05\x4b\x17\xca\x72\x7a\xda\
-\xc6\x02\x89\x4c\x77\x49\x47\x0f\xb7\x41\xec\x2c\xcd\x7d\x00\x4c\
-\xdf\x10\x75\xb9\x8a\xc4\xf4\x19\xf2\xc7\xbf\x7d\x2a\x47\xea\xeb\
-\x90\x32\xbf\x1d\x98\x4c\x99\x84\x0d\xc7\x02\x6e\x79\xea\x09\xf1\
-\x0a\x0d\x97\x36\x3d\x3d\xb0\x1e\x84\x7c\xeb\xeb\xf7\x6d\xb6\x20\
-\xe9\xee\xd6\xde\xf7\x8f\xac\xce\xad\xf7\x0d\x93\x99\x73\x17\xc8\
-\x07\xc7\xeb\x64\x2f\xc0\xc3\x53\x1e\xdd\x61\xa9\x3a\x78\x70\xa0\
-\x52\x33\x34\x29\x57\xab\x66\x06\x1e\xb4\x26\xa7\xb9\xd4\x38\x4b\
-\x75\x59\x62\x37\xd0\x71\xfc\x65\x07\x1c\x54\x02\x13\x27\x48\xea\
-\x03\xf7\x4b\xe6\xf6\x65\x00\x26\x60\x09\x4f\xdb\x5a\x28\xce\x95\
-\x0b\xf0\x5a\xbc\x1a\x60\x7e\x2e\x24\x9b\x6c\x80\xd2\x1c\x0f\x8b\
-\xc7\xed\x3c\xbd\xa5\x6f\x68\x94\xac\x7e\xec\x31\xd9\x8b\x03\x29\
-\x61\x59\x81\xa4\x5b\x89\x52\xbc\xf2\x44\x8d\xe9\x63\x72\x16\x47\
-\xdd\x47\x9f\x7b\xe6\xa3\x5b\xe7\xde\x7f\xef\x82\xbc\x3c\x7d\x06\
-\x8f\xd6\xff\x86\xee\xcb\xce\xbb\xfb\xce\x85\x8b\x3f\xc3\x4e\xfc\
-\xb5\xb1\x93\x36\x01\xf3\x10\xcb\x46\x0e\x10\x3f\x73\x42\x3e\xdc\
-\xb7\x5b\x66\x5d\x7f\x03\x20\xe8\xad\x7a\x65\x39\x04\xa5\x35\x40\
-\xb8\x5b\x4d\x3c\xeb\xed\x27\x41\x8e\x14\xc9\x28\x5a\x26\xf6\x8d\
-\x4b\xc5\x89\xd2\x91\xc0\xcc\x44\xca\x4c\x5a\xf4\x13\x75\xfd\x1f\
-\x6b\x26\x9c\xae\xd8\x79\xbb\x32\x61\xc2\xdd\x00\xd0\x8e\x7d\x06\
-\xca\xca\x0d\x45\xb2\xa7\xb2\x52\xb5\x65\xb2\x83\xa7\x35\x58\xba\
-\x9b\x6d\x83\xec\xbc\xda\xfc\xe8\xe3\xe2\x11\x18\x0a\x68\xf6\xc1\
-\xba\x10\x76\x96\x5b\x5f\xd7\xef\xdb\x3c\x6d\xb4\x03\x40\xd7\x11\
-\x49\xcd\x71\xcb\x6d\xf2\xf6\xa1\x83\xb2\x9f\x67\x5c\x61\xbb\x1a\
-\xa3\x13\xcc\x34\x69\xc2\xb2\x39\x30\x91\xee\xff\x7e\x46\xd6\x6f\
-\xdf\x26\xfd\x82\x42\x8c\xf3\xf3\xdd\x20\xa7\xcc\xf6\x4c\x1f\x5f\
-\x19\x79\xd3\x25\x32\x6d\x0b\x4a\xf1\x52\x9e\xd5\x03\x97\xe4\xcb\
-\xf4\x2d\xcb\x65\xd2\x3d\x37\xa8\x4b\x85\x30\xe5\xbb\x03\x53\x0d\
-\x76\x37\xd3\x26\x6d\xa4\x4a\x03\x9a\xed\x3c\x07\x89\x4f\xec\x70\
-\xd9\xf1\xeb\xe7\xd5\x45\xe3\xd8\xb9\xc3\x89\x33\x2a\x01\xfa\x46\
-\x60\x9e\xac\x91\x33\xc0\x65\xc9\x93\x3b\x2a\x6f\x5b\x30\x2f\x1f\
-\xb0\xd4\xc9\x52\xeb\x7f\x43\x9e\x83\x87\x39\xba\xf8\x84\x3c\x8d\
-\x72\xfb\xab\x1b\xef\xbd\x5f\xf6\x54\x94\xab\xeb\x4b\x5b\xc0\x34\
-\x8c\xd4\x06\x10\x55\x63\x07\x62\xc7\xca\x3d\x8b\x97\x4a\x3f\xbf\
-\x60\x95\x6e\xba\xb9\x95\x71\x6a\x07\x6c\x05\xa2\x6c\xfb\xec\x15\
-\x19\x25\x49\x79\xf7\x49\x7a\x51\x7e\x23\x30\xd9\xe6\xc6\x94\x19\
-\x98\x38\x05\xa5\xaf\xb7\xd1\xb3\x8d\xe5\xa9\x12\x11\xb0\x64\xe7\
-\x4f\xbb\xde\x5e\x12\xc3\x21\x38\x3b\xdf\x52\x53\xd3\xf1\xec\x24\
-\xeb\x1c\x6b\xf6\x9e\x2b\x48\x12\xa2\x6c\xdf\x54\xe6\x73\x15\xc6\
-\x19\x27\x75\xb5\xb2\xe5\x67\x3f\x97\x41\x91\x91\x48\xab\x7d\x91\
-\x8a\x01\x8e\x41\x48\xc7\x26\x34\xdd\xdb\x30\x2d\xbb\x97\xe7\xff\
-\x92\x71\x00\x60\x8f\x76\xd7\x80\x70\x99\x79\xef\x02\x79\xeb\x48\
-\x85\x1c\x3a\xc1\xcb\xd2\x22\x09\x03\x86\x74\x23\x30\xe1\x26\x50\
-\x1a\x26\xa4\x76\x55\x1c\x90\x91\x09\xd8\x36\x2c\xa9\xcd\xe5\x5a\
-\xeb\xc9\xf6\xd9\x0e\xbd\xfb\x8b\x5f\xdc\x78\x49\x5d\x31\x47\xa6\
-\x31\x5d\x16\x9b\xd7\x21\xdf\xba\x5c\x9c\xab\x97\x48\x48\x5a\x92\
-\xb4\xe9\xd7\x1f\x50\x6d\x82\x63\xeb\x36\x86\x29\xb5\xed\xe7\x2d\
-\xe1\xe3\xe3\xe4\xd9\x37\x5e\x97\x23\x27\xeb\xe5\x88\x2a\xc1\xab\
-\x0d\x50\x9a\xae\xc2\x7a\x9d\x94\x2f\xa5\xf4\xa9\xc7\x24\x7c\xf4\
-\xf8\xca\xee\xfe\xa1\xf9\x61\x89\x2e\x0d\x4c\xad\xff\x2e\x8d\x1c\
-\x39\xb2\x63\x58\xaa\x6b\x68\x64\xb2\x7d\x5c\x64\xbc\x7d\x5c\xdf\
-\xd8\xe1\xe3\x3d\x63\x86\x5f\x8c\xf2\xf7\x59\xf8\xeb\x4e\x80\x14\
-\x07\x7d\x5f\x7c\xdd\x75\xf2\xb7\xbd\xbb\xa5\x8a\x43\x45\x6a\x51\
-\x8e\xb9\x81\xf3\x10\x60\x74\xb4\xbe\x56\x6a\x8e\x37\xc8\x9a\x8d\
-\xc5\x12\x10\x31\x44\x95\xcd\xff\x18\x98\x28\x67\x7d\x02\x25\xea\
-\xe2\x69\x32\x1d\x65\xb9\x73\xbd\x91\x32\xe9\xf4\x4d\x05\x92\x30\
-\xff\x4e\xe9\xec\xef\x07\x08\xf8\x01\x98\x00\x02\x96\xc3\x36\x4c\
-\x02\xb3\xfb\x20\x94\xe6\xdd\xfb\xc9\xf5\x77\xdf\x2b\x1f\xee\xdf\
-\xab\x86\xb0\xa8\x73\xcb\xdd\x3b\x80\xce\x01\xa6\xf1\xdc\x41\xac\
-\xff\x91\x86\x7a\x79\xee\xb5\xdf\xc9\x88\xc9\x53\xa4\x4d\xd7\x9e\
-\xd2\x89\x13\x26\x63\x9d\x08\x46\x77\x50\x5a\xfe\x3e\x80\xc9\xd2\
-\xbd\x4d\xbf\x81\xe2\x89\xa4\x76\xd7\x43\x6b\xe4\x2f\x47\x71\x00\
-\x6a\x38\xa1\x4a\xef\xbd\x75\x06\x30\x39\xbe\xb2\x35\x60\x1e\xc2\
-\x76\x66\x39\x5e\xf7\xd5\x59\x1c\x98\x16\xe3\xfb\xfb\xaa\x66\x0d\
-\x02\x98\xcb\xb6\xd6\x53\x5d\x5f\xdc\x37\x40\xc6\xdd\x71\x8d\x4c\
-\x2f\x2b\x54\xe9\x32\xbd\x08\xa9\xbd\x28\x57\x66\x00\x98\x93\xee\
-\xbf\x49\x7a\x85\x85\x21\xe1\x0e\x92\xce\xff\x00\x98\x1c\xd7\xc9\
-\x49\xa0\x27\x38\xa7\xca\x6b\x1f\x7c\x80\x03\x53\x9d\x94\xd7\x1f\
-\x55\xae\x68\x40\xa2\x04\x28\x79\x4b\x58\x1e\xff\xe6\xac\x3c\x5c\
-\x5a\x2c\x83\x22\xa2\xd5\x99\x43\xf8\xbd\xff\x0a\xcf\xf3\x88\x18\
-\x3a\x25\x68\x5c\xe2\x98\x80\xd1\x93\xc7\x07\x4d\x4e\x1a\x1d\xed\
-\x74\xea\xeb\xf7\x68\xfd\x38\x35\x6e\xdc\xcc\xae\xd1\xc9\xce\x4b\
-\xa2\x53\x1c\x3f\x87\xdf\x82\x77\x46\x4d\x49\xd9\xe9\x11\x3d\xec\
-\xc3\x8e\x3e\x41\xdf\x74\xf6\x09\x52\x73\x22\x32\x89\x30\x89\x39\
-\x2e\x9a\x2d\x7f\xfe\xf8\x53\x39\xca\x89\x60\xb1\xf3\xb2\x2c\x6f\
-\x84\x26\x12\x52\x39\xd2\x5b\xcd\xe9\x53\xf2\xf8\x2f\x7f\x25\x43\
-\x27\x01\x44\x3d\x3d\x00\x09\xee\x7c\x1c\x98\xcd\x1d\xfb\xdc\xb2\
-\x97\x9d\x2f\xfd\x86\x0e\x16\xdb\xaa\x05\xe2\xd8\xb4\x54\x1c\x0a\
-\x9a\x74\x8e\x64\x6c\x2e\x90\x20\x67\x02\x52\xe6\x40\xc0\x00\x69\
-\x87\x49\x73\x60\xa0\x2a\xc9\x09\x4d\x76\xbc\x74\x03\x38\x1e\x2c\
-\x2b\x43\xb2\xc4\xfa\xa8\xd2\xfc\x1f\x00\xd3\x34\x61\x54\x0e\xc8\
-\x7e\xf8\xf9\xe7\x72\xf3\xdd\xf7\x4b\x57\x80\x86\x90\x37\x66\x46\
-\xb7\xfc\xaf\x01\xb3\x71\xa6\x26\x98\xd7\x0b\xe7\x80\xfc\xd1\x69\
-\x19\x52\xf6\xe2\xf3\xb2\xa7\xa1\x56\xf6\x02\x8e\x9c\x31\xbd\xb1\
-\xad\xb2\x05\x2c\x5b\x02\xb3\xe6\xec\x69\x79\xe6\x95\x57\x64\x40\
-\x68\x94\x9a\x81\xde\xbd\x93\x8d\xeb\xd8\x0d\xdb\x92\x07\xb7\x10\
-\x67\x8a\xa4\x21\x49\x4e\x65\x7b\x65\x31\x27\xdb\x00\x30\x71\x3f\
-\x6d\x5d\xb6\x84\x4f\x73\x4a\x5b\x4f\x2f\x1c\xc8\xf0\x77\xad\x40\
-\xd2\x32\xe1\xce\x33\x87\xa6\x5e\x7b\x83\xfc\x19\x07\xa4\x23\x80\
-\xa2\x02\xa5\x1b\x30\x2b\x90\x34\xab\x4f\xd5\xc9\xb1\x2f\x4e\xc8\
-\xd2\x87\x56\x89\x47\x70\xb8\x3a\x4b\xcb\xda\x56\xed\x06\xf8\x1d\
-\xf2\x8c\x1a\xf2\x4e\xe4\x94\x94\x37\x63\x6d\xe9\x6f\xc7\xd8\xd2\
-\x5f\x89\x48\x71\x2c\x8d\x74\x38\xc2\xcd\x7f\x41\x2d\xad\x1f\x87\
-\x98\x2c\xa3\x52\x9c\x93\x63\x52\x5c\x2f\x0c\xb3\xa7\x4b\x4c\x8a\
-\x13\x76\x48\x74\x8a\x0d\x76\x48\xff\xc1\x23\x04\xd0\x04\x2c\xe9\
-\x40\xe9\xe4\xcb\x33\x6d\x06\xc9\xa4\x94\x34\x79\xfd\x8f\x7f\x54\
-\x49\x93\x3b\xf1\x01\x40\x89\xb7\x96\x39\x7d\x57\xed\x17\xa7\xe4\
-\x9d\xbf\x7e\x20\x17\x5d\x75\x1d\xca\xc3\x81\x6a\x96\x1b\x35\xeb\
-\x4d\x2b\xc0\x64\xc7\x4b\x27\x7f\x7f\x19\x79\xf3\xe5\x6a\x10\xbb\
-\x73\x3d\x12\x26\xcc\xb2\x3c\x7d\x53\xae\x38\x0a\xee\x97\x5e\xe1\
-\xa1\x28\x3f\xf1\x3e\x33\x4d\x71\x87\xe6\x69\x7f\xdd\x00\x62\x05\
-\x88\x91\xe3\xe4\xe7\x2f\xbf\x2a\xe5\x28\x6d\x0f\xa0\x24\x6f\x82\
-\xa4\xbb\x9b\x03\x53\x41\x13\xae\xa8\x67\x49\xc9\x1e\xf4\x57\x24\
-\x69\xda\x2c\xe9\xe8\x31\x40\x1d\x1c\x78\x49\xe0\xa6\xcb\x54\xfc\
-\x93\xc0\x04\x74\xda\xf6\x1d\xa0\x66\x41\x0f\x1f\x3f\x49\x16\xaf\
-\x59\x2d\x7f\xda\xbf\x47\x75\x96\x1c\xc4\x67\xf3\x6c\x24\x9e\x0f\
-\xae\x7a\xc2\x5b\x31\x2f\xfd\x6b\x1d\x90\x2a\x01\xd8\xcf\x0e\x1d\
-\x92\x91\x53\x92\x90\xcc\x39\x4d\x1e\xb7\x01\x0f\x20\x4d\x40\xef\
-\xd8\xcf\x4b\x7a\x84\x86\xa8\x33\x78\xa6\x6e\x5b\x2e\x2e\xb6\x5d\
-\x72\x56\x22\x78\xc6\xf6\x15\x6a\x2a\xb7\x5e\xd1\xd1\x0a\x84\xcd\
-\xd2\xbf\x9b\xf9\x1c\x27\xfe\xed\x1f\x11\x2b\xf7\x2d\x5b\x21\x9f\
-\xf1\xa0\xa8\x4e\x73\xc4\x7a\xd4\xb3\xc3\x89\x57\x7d\x04\x34\xe1\
-\xa3\xa7\x79\x79\x89\x3a\xb9\x6b\xc1\x42\xe9\xe9\x1d\xac\xa6\x02\
-\x54\x53\xf3\x99\xbd\xff\x03\xa2\x87\x4b\x74\x92\x53\x62\xed\x19\
-\x12\x6d\x73\x49\x8c\x23\x5d\xa2\xec\xce\xbd\x91\x76\xd7\xdd\x91\
-\x49\x53\x3d\xcc\x7f\x45\x2d\xad\x1f\xbe\x42\xed\xf6\xce\xd1\xc9\
-\xb6\x0c\x40\xf2\xa3\x21\x36\x02\x13\xff\xd0\x00\x65\x4c\xaa\x5d\
-\xa2\x52\xe0\x44\x9b\xf4\x8b\x1c\x22\x5d\x00\x4a\xf6\x4c\x77\xf5\
-\x0d\x95\x6e\xfe\xe1\xea\xf2\x15\x31\xe3\xc7\xc9\x2f\x7f\xf7\x1b\
-\x75\xcd\xe9\x96\xd0\x64\xbb\xe6\xa1\xda\x0a\xa9\x39\x53\x2f\xfb\
-\x2a\xcb\x65\x29\x76\x3a\x0f\x7f\x80\xad\x97\x47\xab\x65\x39\x77\
-\xfc\x8e\x48\x3b\x03\xc6\x8d\x96\xcc\x35\xb9\xe2\xdc\x98\x23\x69\
-\x04\x26\x9c\x86\xb4\x39\xb3\x38\x5f\xc2\x32\x52\x91\xd6\x50\x82\
-\x9a\xc0\x35\x80\x69\x9a\x4d\x06\x3d\xfa\x49\xca\xcc\x8b\xe4\xf5\
-\xbf\xbc\x8f\x1d\x18\x25\xee\x05\x02\x93\xe6\xcc\xed\x87\x8e\x55\
-\x4b\x25\xaf\xc9\x5e\x5b\x2b\x4f\x22\xfd\x4d\xbf\xea\x6a\xf1\x08\
-\x08\x96\x76\xbd\xfa\x49\xfb\xde\xfd\xd5\x0c\xf4\x46\xf2\x6c\x4a\
-\x9c\xad\x99\x69\x99\xe7\xca\x73\xd6\x73\x6e\xa7\x1e\x38\xd8\x8c\
-\x07\x24\xf2\x36\x6e\x96\xb7\x76\xed\x52\xd7\x4d\x3a\x88\x74\xc6\
-\xb6\x54\x7e\x76\x6b\xc0\x54\x33\xc9\x5b\xf7\x61\xc2\x92\x4d\x20\
-\xd5\xa7\x4e\xc8\x15\x37\xdf\x02\x28\xf1\xf2\xc5\xbe\xe6\x36\x70\
-\xfb\x7c\x7c\x76\xbb\xde\x1e\x12\xe2\x48\x52\xed\x94\xd3\xb6\xad\
-\x50\xed\x96\x4c\x97\x19\x5b\x0b\x24\x1d\xdb\x32\x62\x9a\xc3\x98\
-\x99\x88\x50\x53\x66\xbb\x70\x73\x60\xb2\x0c\xef\x19\x14\x26\xb7\
-\x66\xe5\xc8\x91\x33\x67\xe5\x10\x0e\x28\x87\x6a\xd9\x61\x86\xed\
-\xc4\x73\xc2\x01\xcd\xc3\x84\xe5\xd9\x06\xd9\x5b\x5d\x21\x57\xde\
-\x7a\x8b\x3a\xe3\x8b\x03\xd9\xbb\x21\xf5\x73\xb9\x1d\x50\x55\xf4\
-\x89\x18\x2a\xc1\xf1\x29\x12\x99\x9a\x86\xff\x27\x97\x44\xc2\x11\
-\xb6\x34\x89\xb4\x39\x6a\xa3\x6d\x8e\x95\xfe\x36\x9b\xee\x3d\xd7\
-\xfa\xf1\xc8\x3d\x61\x0e\x45\xc2\x8c\x56\x09\xd3\x48\x99\x51\x4c\
-\x9a\xc9\x70\x42\xaa\xf4\x09\x8b\x01\x94\x82\xa5\xbb\x4f\x88\x74\
-\x03\x34\xbb\xfa\x05\x23\x31\x0e\x10\xff\x98\x61\x52\xf2\xf8\x53\
-\xaa\x0c\x2e\x47\x79\xc6\xc4\xc4\x9d\x9d\x3e\x8c\x1d\xec\x30\x4a\
-\xcd\x4a\x00\xb5\x0a\xe5\xfb\x4f\x7f\xf9\x4b\x19\x36\x21\x4e\x5d\
-\x2e\x42\x95\xa9\xdc\x51\x01\x3b\x65\xec\xa4\xea\x14\x41\xbf\x40\
-\x35\x37\x63\x7a\xc9\x32\xc0\x72\x29\x9c\xa5\x3c\xbd\xb4\x40\x06\
-\x5f\x32\x4d\xb5\xd7\x75\x04\xb4\x08\xcc\x26\x50\x10\x1a\x58\x16\
-\x6e\xdb\xf4\xec\x2f\x57\xde\x76\x17\x27\xa4\x95\x0a\x76\x02\x59\
-\x03\xda\xdd\xac\x4e\xa5\x04\x80\x8c\x6b\x9a\x5b\x6e\x02\x14\xe7\
-\x01\x65\x4a\x65\x27\xd2\xce\x8f\xfe\x2a\xab\x36\x17\x4b\xda\x25\
-\x57\x48\xf0\x90\x11\x48\x50\x01\xd2\x9e\x20\x04\xf8\x59\xba\xb7\
-\xed\x83\x12\x1b\x6e\xdb\xcb\xcb\x70\x9f\x01\x00\x86\x9f\x04\xe0\
-\xbd\xa9\xb3\x2f\x95\x85\x0f\x3c\x28\xcf\xbe\xfe\xba\x7c\xc2\x5e\
-\xfc\xe3\xc7\x51\x56\xd7\x1a\x90\xc4\x76\xd9\x67\x02\x53\xd9\xfd\
-\xf3\x5b\xf8\x20\x60\xca\x71\xaf\xc7\xce\x9e\x91\x82\x87\xd7\x48\
-\x37\x24\x4b\x5e\x8c\x4d\xcd\x7a\xcf\x6d\x66\x6d\x43\x6c\x8b\xee\
-\x84\x35\xd6\x6b\xf0\xac\x4c\xc0\x11\x25\xf8\x96\x02\x95\x2c\x39\
-\x9d\xdb\x8c\x47\x56\xca\xc4\xf9\xb7\x48\xcf\x98\x28\xd5\xdb\xdd\
-\x34\xa9\x89\x1b\x30\xd5\xef\xe2\x2f\x1e\x91\xb1\x12\x15\x9f\x2c\
-\xa3\x9c\x99\x52\xf4\xf3\xa7\x91\x22\x4f\x02\xd8\xac\x1c\x00\x4c\
-\xd3\x47\xcf\x9e\x90\xf7\x76\xef\x92\xe4\x99\x33\x71\x80\x18\x68\
-\x8c\xe5\x54\x43\x8f\x90\x32\x01\xcb\x1e\xc1\xd1\x12\x3c\x29\x49\
-\xc2\x53\xd3\x25\x14\x15\x49\x04\x1c\x4e\x60\x02\x9e\x91\x29\x00\
-\x66\x8a\x63\x65\xa4\x06\xa6\xd6\x8f\x4d\xaa\x0d\x33\xc9\x71\x69\
-\x54\xb2\xe3\xb7\x31\xf6\x34\x13\x98\x4e\x05\xcf\xa8\x24\x00\x33\
-\xc9\x2e\x61\xf1\x49\xd2\x3b\x24\x5a\xba\x9a\x63\x20\xbb\xe3\x96\
-\x33\x7b\x77\xf4\xf0\x95\xbe\x7e\x61\x92\xf3\xc0\x6a\xd9\x5d\x51\
-\x8e\xb2\xb6\xd6\x38\xff\xd9\x4c\x9b\x46\xbb\x26\xe1\x79\x54\x6a\
-\xb0\xd3\xfd\xf1\xaf\x7f\x95\x8b\xae\xb9\x4e\xda\xa1\x44\xe5\x24\
-\xc1\x4c\x96\x06\x30\x0d\x78\x12\x84\xbc\x12\xe5\xd4\x8d\xf9\x6a\
-\x06\xf6\xf4\x4d\x48\x46\x45\xb9\x92\xb1\x76\x89\x78\x8e\x1e\x01\
-\x60\x22\xc5\x00\x0a\x0a\x98\x8d\x06\x30\xbd\x8c\x73\x9b\x79\xde\
-\x34\x2f\x93\x7b\xcb\xfd\x73\xe5\x93\x03\x07\x78\xee\xb2\x31\x93\
-\x11\x4b\x74\xd5\x73\x6e\xf6\xa0\x73\x10\xbe\x1a\xba\x63\xb9\x25\
-\xa8\xf0\xfe\x5a\x80\x01\xb0\xe7\x55\x0e\x09\xd0\x8f\x51\x0a\xbf\
-\xfc\xf6\xdb\x52\xfc\xd3\x9f\x4a\xfe\x9a\x35\x72\xcf\xd2\x02\xb9\
-\x79\xce\x62\xb9\xe1\xbe\x05\x72\xdb\xbc\xc5\xb2\xb0\x70\x95\xac\
-\xdd\xb6\x5d\x9e\xfb\xc3\x6b\xf2\xe7\xbd\x9f\xab\x19\xec\xd9\x41\
-\xc2\x89\x7d\x79\x2d\x6e\x42\x9a\xbd\xe0\x8d\x90\x74\xf3\xb9\x9f\
-\xef\x66\x24\xf5\xa3\x67\x8e\x4b\xd1\xe3\x4f\x48\x1f\x1f\x7c\x57\
-\x1c\x34\x8c\xb6\x55\xa3\xa9\xc0\xb8\x3c\x84\xb1\xed\xd8\x7e\xc9\
-\x6b\xc5\xfb\xc4\x8f\x97\x94\x55\xf3\x1b\xe7\xbe\xcc\x44\x69\x9e\
-\xb6\x76\xa9\x84\x3a\x93\x8d\x49\x4d\x78\xb0\x01\x20\x79\xa0\x51\
-\xe5\x33\x0f\x58\x5c\x26\x96\x3f\x08\xb0\x8f\x4e\x4c\x95\xd8\x64\
-\xa7\x44\x4c\x49\x91\xe1\x76\x97\x3c\xf5\xca\xab\x58\x87\x53\x6a\
-\x96\xf4\xc3\x48\xc7\xbc\x42\xe5\x33\xaf\xbe\x22\xd1\xe3\x27\xe1\
-\x00\x32\x10\xdb\xdf\x4f\xba\xf9\x60\x59\x6c\xb6\xc1\x32\x7b\x04\
-\x45\x49\xe0\xc4\x04\xc0\xd2\x25\xa1\xc9\x69\x12\x96\x92\x0e\x58\
-\xd2\x00\x27\x4a\x73\xa4\xcc\xbd\xe1\xc9\xba\x24\xd7\xfa\x91\x8a\
-\xa5\x79\x4c\x92\x63\x76\x64\xb2\xe3\xe5\x58\xfc\x93\x37\x02\x13\
-\x09\x33\x22\xd9\x86\x44\x60\x97\xd0\xb8\x44\xe9\x09\x68\x76\x41\
-\xca\x64\xd2\xa4\x7b\xc0\x9c\x5d\xbd\x93\x87\x37\xca\xb2\x3b\xe5\
-\xbd\x4f\x3e\x91\xa3\x28\x87\x0f\x01\x4a\xee\x9d\x41\x96\x6b\x00\
-\x9e\x83\x55\x95\xb2\x6c\xdd\x3a\xe9\x1f\xca\xe1\x3c\x1e\xd8\xc1\
-\x38\x6c\x85\x29\x27\x50\xed\xf4\x1d\x07\xf9\x4a\xe4\x74\xa7\x4c\
-\x7d\x68\xa9\x4c\x5d\x9d\x2d\xb6\xbc\x7b\x25\x28\x69\x22\x4a\x71\
-\x24\x2b\xb3\x1c\x77\x07\xa6\x31\x19\x06\x6e\x07\x70\x8c\x66\xa0\
-\xf0\xd2\xc0\x9d\x3c\x06\xca\x5d\x0b\x16\xcb\xae\x23\x80\x38\xcb\
-\x73\xac\x0f\xc1\x48\x48\x5a\xb3\x30\x7d\x3b\x30\xcf\x35\xaf\x21\
-\x54\x0e\x00\x56\x9c\x6e\x90\x4a\x00\xac\xea\xcc\x09\x75\x5b\x89\
-\xc7\x7c\xae\xfc\x64\xbd\xea\xa5\xe7\x9c\x8f\x04\xcb\x7e\x4e\x96\
-\x51\x5d\x2e\x07\x6a\xca\x01\x4c\x73\xb8\x10\x96\xf3\x5d\x80\xc9\
-\xf1\x96\x55\xa7\xeb\x65\xeb\xcf\x9f\x94\x3e\x7e\xd8\xce\xec\xfd\
-\x6e\xfc\xee\x3c\x78\x18\xc3\xa0\x98\x0c\x69\x96\xd2\x9c\x59\xbd\
-\xbd\xd7\x20\x09\x9f\xee\x12\xe7\x43\x4b\x64\xe6\x16\x40\xf3\xc1\
-\xc5\x12\x8e\x52\xbc\x8b\x2f\xde\x8b\x74\x6a\x9d\x09\xd4\x4d\x01\
-\x13\xb0\x04\xf0\xba\xfb\x87\x48\xc0\xe8\x09\x12\x8b\xca\x22\x32\
-\xd9\x6e\x54\x17\xfc\xfd\x01\xcd\xf8\x99\x97\xc8\xdb\x9f\x7d\x26\
-\xe5\x58\x97\xf2\x53\x75\xf2\x60\x71\x91\xf4\x0f\x0e\x51\xd3\xc6\
-\x11\xd6\x1c\x3e\x46\x60\xf2\x00\xd8\x2b\x38\x46\x82\x26\x26\x22\
-\x55\xba\x24\x04\xb0\x24\x30\x09\xcb\x30\x24\xcd\x70\x5b\x26\xe0\
-\xe9\x3a\x10\x9e\xe4\xca\x0b\x4e\x76\xe9\xd9\x8a\xb4\x7e\xbc\x22\
-\x34\x01\xcb\x6b\xb1\x93\x7c\x42\x60\xa2\x54\x67\xe9\xa4\x80\x69\
-\x41\x33\x68\xd2\x14\xe9\x15\x14\xa1\x26\x5e\xe8\xee\xcd\xf2\x1c\
-\x26\x34\xb1\xb3\xf0\x8c\x91\x91\x78\xdf\x4f\x7f\xfd\x02\x4a\x70\
-\x40\x84\x67\x06\x99\xe5\xb9\x61\x94\xeb\x80\x08\x7b\x57\x8f\x9e\
-\x3c\x26\x2f\xbe\xfe\x3b\x99\x9c\x9e\xa1\x3a\x57\xd4\x65\x5a\xbd\
-\xb1\xd3\xb3\xd7\x16\xc0\xec\xe0\xe5\x8d\x94\x12\x2c\x7d\xc2\x23\
-\x55\xef\x3c\x67\x68\x57\xa0\x54\x70\x04\x34\xdd\x4e\x47\xa4\x79\
-\x51\x32\xb6\x2f\x2a\x08\x20\x2d\xa9\xb3\x83\x90\x7e\x6f\x41\xfa\
-\xfb\xe4\xd0\x11\x55\x52\xaa\x94\x69\xc2\xf2\x5c\x60\x7e\x9b\x09\
-\x2f\x42\x0d\x25\x34\xd2\x9e\x05\x3f\x0e\x24\xe7\xad\xba\x6c\x84\
-\x9b\xdd\x2f\x97\xc1\xa4\xcd\x4e\x25\xe3\x6f\x98\x30\x2f\x14\x98\
-\x48\xe8\x80\x6e\xf9\x89\x1a\x29\xfa\xe9\x63\xd2\xcb\x2f\x44\x3a\
-\xa0\x8c\xb6\x0e\x16\x2d\x0f\x1a\x96\x15\x34\x91\x1e\xb9\x4d\x3a\
-\x0c\xf4\x91\xde\x31\xd1\xe2\x35\x76\xa4\xf4\x8a\x8c\xc0\x6b\xbe\
-\xaa\x9d\x51\x8d\x67\x05\x28\xbb\x31\x65\xf2\x31\xfe\xc6\x33\x2c\
-\x56\xc2\x27\x25\xaa\x8e\x3e\xeb\xf7\xe6\xc1\x92\x46\xf5\x21\x11\
-\x93\x93\xe5\xaa\x7b\xe7\xca\x5f\x0e\x1f\x96\xeb\xe7\xdc\x87\xa4\
-\xcf\x4b\x30\x03\xde\xea\x37\x63\x85\x10\x84\xf5\x09\x04\x2c\xa3\
-\xf1\x3f\x92\x08\x38\x3a\x25\x14\x0e\x4b\x76\xc1\x66\x29\x6e\x4b\
-\xc7\x72\x5d\x7b\xc3\x92\x5c\xd9\xa1\x09\x76\x3d\x5b\x91\xd6\x8f\
-\x5c\xb3\x66\xb5\x8f\x48\x76\x8c\x42\x19\xfe\xf3\xc1\x66\xba\x74\
-\x07\x66\x04\x52\x07\x1b\xee\x83\xc7\x4f\x96\x1e\x01\xd8\x01\x51\
-\xca\x19\x1d\x41\xb0\x1f\x4a\x75\xbf\x20\x69\x83\x64\xe7\x11\x1a\
-\x25\x8b\x97\x3f\x20\xbb\xcb\xcb\x01\xc6\xfa\x46\x68\x58\xd0\x21\
-\x34\x0f\xd5\xe2\x35\xc0\x60\xd7\x91\x83\x72\x7f\x6e\x81\x74\xc7\
-\x4e\xdc\xa6\xdf\x00\xe3\x3a\x31\x6a\x00\x39\x67\x75\xf7\x31\x4b\
-\xf0\xa6\x54\xd9\x3a\x30\x8d\xa4\xa5\x86\x1c\xe1\xf5\x2e\x5e\x46\
-\x89\xde\x01\xd0\xec\x80\xf5\xb9\xe4\xa6\x5b\xe4\x4f\x9f\xef\x92\
-\x9a\x2f\xce\x02\x92\x4d\xf3\x7c\xba\x03\xf3\xdb\x01\xda\x04\x32\
-\x96\xe9\x2a\x29\x7e\x67\x60\xf2\xbd\x17\x06\x4c\x2e\x53\x75\xb2\
-\xd4\xd7\xc9\xb2\x0d\xeb\x00\xb4\x41\x6a\x86\x7a\x77\x50\x5a\x6e\
-\x15\x98\x30\x5f\xe3\x01\x84\xdb\x4f\xfd\xad\xa7\x8f\x2a\xd7\xbb\
-\x71\x38\x16\x0e\x76\x4c\x95\x4c\xa3\xdd\xf1\xbb\xf9\x0f\x1b\x2d\
-\x83\x51\x82\x47\xbb\xfd\xce\x11\x80\x24\x7f\x7f\x54\x1d\xaa\x34\
-\x1f\x8c\xdf\x3d\x8a\x9d\x37\x93\x12\x8c\x33\x83\x58\x15\xf8\xe0\
-\x33\x95\x51\x86\xe3\xf3\xba\x07\x47\x8a\xff\xc4\x78\x09\x61\x35\
-\x82\xbf\xb1\x60\xa9\x80\x99\x9a\x21\x28\xc1\x77\x23\x59\x2e\x8e\
-\xb0\xd9\xf4\x6c\x45\x5a\xff\x1d\x8a\x8f\x8f\xef\x80\x24\x39\x2d\
-\x3a\xd9\xfe\x7c\x0c\x81\x89\x9d\x27\x5c\xed\x40\xc6\x4e\x44\x47\
-\xa3\x64\x0f\x9a\x30\x45\xba\x05\x45\x4a\x67\xa6\x4c\x24\xcc\x6e\
-\xbe\xc1\xa6\x43\xd4\x64\xb2\xbc\x20\xda\x8c\x2b\xae\x96\x37\xff\
-\xf4\x9e\xd4\x9c\x39\xa9\xc6\x10\x1a\x69\xd3\x48\x99\x87\xe0\xc3\
-\x35\x15\x52\x59\x5f\x2d\x15\x0d\x75\xf2\xc4\xaf\x9e\x93\x88\xf1\
-\xe3\x91\x52\xfb\x63\x67\x27\x34\x9b\xca\xcc\x66\x76\x03\x66\x73\
-\x1b\x09\x93\xf7\xf9\x1e\xd5\xae\x09\x73\x52\xdc\xf6\x7d\x3d\x24\
-\x3e\x2d\x5d\x7e\xfd\xfb\x3f\x28\x68\xf2\x32\xc2\x16\x20\x2d\xb7\
-\x7c\x4c\x50\x36\x3d\x36\xda\x33\xdd\x61\x69\xb4\x47\xf2\x02\x64\
-\x6c\x13\x05\x34\xdd\xac\x3a\x95\x60\xd5\x23\xef\xd6\x7e\xda\x68\
-\xeb\xf9\xc6\xd7\xdd\x80\x09\x08\xb3\xb3\xe9\x13\x24\xb9\xeb\xee\
-\xfe\x89\xb4\xef\xe3\x21\x9d\xd9\xa3\xcd\x04\xee\x56\x7a\xd3\x0a\
-\x8a\x70\x6b\xd0\xb4\x80\xaa\xde\xab\x0e\x22\x84\xa5\x01\xcc\xae\
-\x38\xa0\x70\xec\x66\xdf\x88\x18\x09\x05\xe0\x06\x33\x4d\x26\xa1\
-\x82\x68\x66\x94\xe4\xf8\xad\x09\xcc\x21\x80\x65\x28\x7e\xef\x5e\
-\x00\x62\x7b\x6e\x67\x94\xdf\x84\x24\xab\x01\xb6\x79\xb2\xe3\xa9\
-\x17\xfe\x17\x82\x26\x24\xa0\x04\xb7\x49\x08\xfe\x86\xc0\x54\xd0\
-\xc4\xdf\x86\x23\x59\x86\xa7\xa4\x7d\x06\x80\x2e\x08\x4e\x4e\xd3\
-\xb3\x15\x69\xfd\x97\x49\x25\x4d\x5b\x06\x40\xf9\x1c\xca\xf3\x6f\
-\xc2\x01\x4e\x03\x96\x4e\xd3\x48\x1f\xa9\x69\x12\x30\x31\x41\xba\
-\x06\x47\x21\x15\x1a\xd0\x6c\x6c\xd7\xe4\xd0\x23\x9f\x60\xd5\xb1\
-\x33\x64\xfc\x44\xd9\xf2\xe4\x13\x52\xc9\xa9\xbf\x1a\x8e\x35\x01\
-\x93\xa7\x27\x9a\x2e\xaf\xab\x94\x63\xa7\x6b\xe5\xc3\xdd\xbb\x24\
-\x2e\x63\x06\x4a\x74\x96\x7b\x26\xf8\x14\xfc\xdc\x60\x80\xc7\xe7\
-\xc2\xb2\xb9\x9b\x86\xfe\xf0\xd6\xe8\x1c\x69\x07\xf0\xf8\x45\xc7\
-\x4a\xce\x43\x0f\xc9\xee\xa3\x47\xa5\xf2\xf4\x29\x00\xd0\x4c\x9b\
-\xec\x90\x51\x9d\x32\x4d\x26\x30\xdd\x1f\x1b\x09\xd1\x02\x26\x61\
-\x69\x5e\xb1\xf1\x3c\x66\xe7\x52\xcb\xde\xf9\xd6\xdd\x04\x4c\x5e\
-\xeb\xa6\xfc\xd4\x71\xf9\xf5\xeb\xaf\xcb\x78\x9b\x03\xdb\xa1\x0f\
-\xbe\x3f\xdb\x2c\xad\x71\xa0\xc6\x58\x50\xcb\xee\x50\x74\x7f\xfe\
-\x7c\x36\x2e\xbd\xe1\xaf\x7e\x1f\xbf\xe1\xe3\x00\x44\x80\x12\x69\
-\x30\x32\x29\xd5\x84\x64\x93\x09\x50\x26\x4b\xda\x77\xc4\x78\xe9\
-\x82\x03\xa1\x31\xf1\x89\x05\x4b\x40\x97\xa5\x3f\x0e\x6c\xbd\x03\
-\x23\x24\x74\x7c\x82\x84\x27\x22\x59\x02\xb4\xa1\xf8\x1f\x21\x2c\
-\x43\x50\x9d\x84\xd9\x00\xdb\x14\x57\x75\x48\xb2\xeb\x41\x9d\x2c\
-\xb5\xfe\x9b\xd5\x36\x2c\xc9\xe6\x8a\x48\xb0\x3f\x83\x74\xf9\x75\
-\x78\x0b\x60\xd2\xe1\x28\xdb\xfd\x01\xcd\xee\xc1\xd1\xd8\x81\x90\
-\x2e\x5b\x40\x93\x66\xa7\x80\x47\x70\xa8\xdc\xb3\x74\x89\x7c\x56\
-\x7e\x50\xcd\x49\xd9\x12\x98\x15\x48\x55\x15\x80\xd0\x23\xcf\x3d\
-\x27\x43\x90\x50\x7c\x87\x8e\x32\x3b\x6f\x7c\x54\x39\xee\xbe\xd3\
-\x5f\x08\x30\x2d\x5b\xc0\x35\xae\x9d\xcd\x33\x56\xbc\x50\xa2\xf7\
-\x97\xc9\x48\x9b\x4f\x3c\xff\xbc\x94\x9f\x6c\x50\x80\xda\x5f\x57\
-\x73\x8e\xad\xe9\xec\xbe\xcd\xad\x81\xd2\xf2\x05\x03\x13\x49\x94\
-\x93\x81\x54\x9e\x69\x90\xbf\xec\xfd\x4c\xee\x5b\x9a\x2d\xbd\x51\
-\x26\xf3\x60\xc3\x36\x46\x0e\x51\xa2\xbb\x0c\xc2\x77\x80\xdd\xb7\
-\xc5\x77\x01\x26\x13\x38\xdf\xdb\x3f\x62\x28\xca\xea\x24\xa4\x4a\
-\xa7\x1a\xfd\xd0\x12\x94\x96\x55\x5b\x26\x4a\x70\x8f\xe8\xa1\xc6\
-\x94\x71\x3e\x6c\x7e\x09\x56\xb0\xb4\x4c\x60\xf6\x0c\x8c\x94\x10\
-\x94\xe9\x0a\x96\x09\x36\x09\xe3\x88\x0a\x96\xe2\x48\x96\x61\xa8\
-\x44\x22\x1d\x28\xc5\x53\xd2\xfe\x12\x94\xe2\xbc\x3c\x62\x42\x46\
-\x4f\xf3\x7f\x4b\x4b\xeb\xbf\x53\xe1\x89\x29\x8e\xf0\x04\xdb\xd3\
-\x51\x29\x8e\xaf\x8c\xb2\x1c\x25\x3a\x60\xc9\x9d\x83\x8e\xc0\x8e\
-\xc7\x46\xfe\x5e\xa1\x31\xaa\x4d\x53\x9d\xdf\x0d\x60\xaa\x19\x85\
-\x78\x0b\x73\xa2\x59\x9e\x31\x93\x3a\xf3\x22\x79\xe5\x9d\xb7\xd5\
-\x19\x40\xe5\x80\x66\x79\x4d\x39\x40\x59\x03\x60\xd6\xcb\xcf\x5e\
-\xfc\x8d\xc4\x24\x24\x49\xf0\xa4\x78\x89\xc6\x72\xb9\x53\x7b\x46\
-\xf0\xca\x91\x80\x26\x76\x76\x6b\xc7\xff\xce\xc0\xc4\xdf\xa8\x89\
-\x82\xb1\x73\x73\x76\x20\x5e\x83\xa8\x4d\x5f\x4f\xe9\xe1\xe3\x2f\
-\xd3\xaf\xbe\x46\x7e\xf5\xfa\xef\x51\x02\x37\x48\xc5\xa9\x13\xc2\
-\xe9\xeb\x08\x4b\x0e\x07\x52\xb7\xdf\x11\x92\xee\x76\x07\xa6\x35\
-\x94\xa9\xd9\xeb\x28\xe5\x79\xf9\x86\x0a\x00\xfb\x4f\xbb\x3e\x93\
-\x25\xab\x56\x4a\xd0\xd0\x61\x6a\xe6\x24\x9e\xcf\xce\x64\x4c\x50\
-\xaa\x9e\x70\xac\x73\x27\xb6\xe9\xb2\x6d\x97\xf0\x6b\xe1\xf3\x95\
-\xe5\x34\x0f\x38\x4c\xeb\xbd\x83\xc3\x25\x68\xcc\x44\x80\x92\x27\
-\x25\xb8\x1a\x3b\x74\x5a\x9a\xcd\x30\x31\xc9\x76\x09\x1c\x3b\x41\
-\xba\x07\x85\xa1\x7a\xc0\x72\x50\x76\x5b\x13\x74\x28\x58\x22\x69\
-\x72\x28\x52\x6f\x1c\x28\x03\x59\x86\x03\xb0\x21\x09\x76\x18\xff\
-\x17\x89\x28\xc3\xf1\xff\x11\x86\x83\x69\x34\x87\x0f\xa5\xb8\x3e\
-\x02\x40\xef\xd5\xe3\x2d\xb5\xfe\x67\x14\x9a\x62\x4f\x0d\x4f\x70\
-\x3c\x15\x99\x6c\xff\x92\x6d\x5b\x04\x66\x18\x12\x85\x65\x3e\x0e\
-\x8a\x4b\x94\xbe\x91\x43\x15\x20\xd5\x04\xbf\x6a\x6c\x1f\x4b\x38\
-\x82\x93\x67\x7e\x70\xb6\x9b\x41\x12\x32\x72\xbc\xac\xdb\xbe\x43\
-\xaa\x91\x34\x6b\x58\xa6\xd7\xd7\xc9\xb3\xbf\x7f\x43\x46\xa0\x74\
-\x0b\x1c\x3f\x41\xc2\x13\x92\xd5\x30\x96\xa8\x84\x54\x89\xc6\x6d\
-\xe0\xa8\xf1\xd2\x23\x20\x54\xcd\x68\xa4\x3a\x7f\xe8\x56\xe0\xd8\
-\x9a\x8d\x84\xc9\x0e\x20\xec\xec\x2a\xa9\xb2\x1d\xd0\x84\x0e\x96\
-\xc7\x4b\x6b\xf4\xf5\x0f\x94\xa9\x97\x5f\x29\x8f\x21\xdd\xf2\x3c\
-\xf4\xea\x2f\xce\xca\xe1\x53\x27\xe5\x40\x03\x67\x3e\x3a\x17\x9a\
-\x2d\xc1\x77\x3e\x37\x07\xa6\xf1\xb7\x9c\x7c\xf9\x60\x7d\x2d\x92\
-\xed\x09\x75\x51\xb0\x57\xfe\xf8\xae\xdc\xb1\x68\x81\x04\x0e\x19\
-\x22\x6d\x7a\xf7\x41\xfa\xf5\x54\xeb\x47\x5b\xeb\xda\xc5\x8b\xd7\
-\x18\xff\x6e\xc0\xb4\x40\xc9\x83\x0d\xdb\x94\x7d\x87\x8e\xc1\xc1\
-\x28\x55\x62\x53\x01\xb1\x54\xb6\x41\x1b\x43\xc6\xdc\x1d\xc3\xf2\
-\x1b\xa9\x30\x12\xa9\xd2\x2b\x76\x98\x9a\x90\x43\x4d\xca\xe1\xcb\
-\x34\x49\x50\x5a\xe6\x78\xd9\x40\xf1\x08\x1f\x2c\x21\x93\x93\x54\
-\x09\x1e\x0c\x58\x12\x94\x06\x2c\x9d\x12\xce\xf4\x6a\x23\x2c\xd3\
-\x3e\x08\x4d\x76\xdd\x1d\x94\x98\xee\x65\xfe\x2b\x69\x69\xfd\x6f\
-\x28\x3c\xd9\x9e\x14\x96\x60\x7f\x02\xe5\xda\x59\x03\x98\x16\x34\
-\x8d\xa4\x89\xf2\x5d\x42\x00\x38\x8f\x98\x11\xd8\xa9\x42\xb0\xd3\
-\x22\x85\x30\x89\x98\xe7\xa0\xf3\x96\xcf\xb7\xeb\xef\x2b\xbd\x00\
-\xc0\x9b\xef\x9f\x2b\x9f\x1e\x3a\x28\x2f\xbf\xfb\x47\x19\x95\x31\
-\x4b\x7c\xc7\xc5\x49\xd8\x94\x24\x65\x02\xd3\x70\xb2\x44\x25\x02\
-\x9e\xb8\xf5\x1f\x3e\x56\x7a\xfa\x87\xa9\xce\x24\xba\x09\x8c\xbc\
-\xef\xfe\xb8\xc9\x04\x26\x7b\xcc\x39\x46\x53\xa5\x54\x8e\x3f\x34\
-\x3b\x4e\x1a\xe1\x82\xe7\x3a\xa0\xfc\xed\x8a\x04\x3c\x0c\xe9\xf6\
-\xbe\x9c\x1c\xf9\xd5\x1f\xfe\x20\x9f\x57\x55\xa9\x01\xeb\x34\xc7\
-\x56\xb2\x44\x67\xaf\xf8\xde\x63\xcd\x3b\x78\x9a\x99\x3d\xdc\xaa\
-\x23\x88\xf7\x8d\x33\x88\x78\xa5\xcd\x8a\xe3\xf5\x72\x14\x10\x3e\
-\x8c\x83\xc3\x5b\x1f\x7d\x24\x0f\x14\x17\x4b\xca\x8c\x99\x28\xbd\
-\x39\x49\x46\x1f\xe9\xe8\xe9\x85\x75\xf1\xc1\x7a\x71\x9c\x29\x6f\
-\x4d\xb0\x73\x8c\x25\x8d\xe7\xac\x91\x03\x56\x72\x74\x77\x33\x58\
-\x02\x94\x6a\x64\x01\xe0\xd6\x3f\x66\x98\x44\x00\x6a\xec\xe1\x8e\
-\x26\x0c\x01\xc6\x48\x05\x4d\x37\x50\xc2\x83\x91\x38\x59\xa2\x07\
-\x8e\x99\x24\x3d\xfc\x43\x55\xa9\xad\xc0\x68\xba\x3b\xdc\x83\x1d\
-\x3d\xf8\x3d\x39\x2f\x66\xff\x98\xe1\x12\x16\x9f\x2c\x41\x89\xa9\
-\x12\x82\xdf\x3f\x04\xff\x0b\xa1\x49\xec\x11\xa7\x9d\x12\x65\x0c\
-\x1f\x7a\x1f\xf0\xbc\x23\x74\x92\xbd\xbf\xf9\x2f\xa4\xa5\xf5\xbf\
-\xa5\x90\xc4\xd4\x84\xb0\x29\xf6\x47\x23\x92\x1c\x67\xc2\x91\x24\
-\x2c\x60\xf2\x36\x94\xe0\x44\xda\x20\x3c\xbd\x86\x8c\x56\xc9\x46\
-\x8d\xf5\x53\xa0\x34\xda\xbc\x0c\x68\xf2\x92\xac\xd8\xb1\xbd\xfd\
-\x24\x7a\x42\x9c\x24\xcc\xba\x44\x02\x50\xd6\xa9\x12\x1f\x3b\x21\
-\x77\xc4\x70\x13\x98\xd6\x2d\x4f\xcd\x54\xc3\x5b\xa6\xd8\x00\xce\
-\x71\xaa\xad\xb4\x83\x27\x12\xd7\x00\x13\x28\x1c\xe6\xd2\x0a\x30\
-\x5b\xba\xa9\x33\xa8\xa5\xf1\x3c\x20\xd3\xb1\xdf\x40\x69\xdb\xa7\
-\x9f\xf4\xf2\xf6\x91\xe8\x31\x63\xe5\xe2\xeb\x6f\x90\x55\x1b\x36\
-\xca\xaf\x5f\xfb\x9d\xfc\x79\xf7\x67\xb2\xbb\xba\x52\x0e\x9f\xa8\
-\x07\x44\x4f\xa2\x94\xa6\x4f\x98\x3e\xa9\x9e\x33\x9e\x3f\x81\x04\
-\x79\x1c\x80\x3d\x26\x9f\x1c\x39\x24\x3b\xff\xfa\x01\xd2\xeb\x2f\
-\x65\x6e\x6e\xae\x24\x65\x4e\x95\x81\x21\xe1\xea\xdc\xf4\xb6\x7d\
-\x3c\x51\x2a\x0f\x04\xf0\xbc\xb1\xfe\x83\x9a\xe0\xd8\x8a\x99\x32\
-\xd9\x7e\x49\x60\xb6\xb6\xfe\x84\x26\x13\x25\x41\xc9\xb6\xdf\xfe\
-\xd1\x83\x25\x74\x72\x82\xc4\x70\xa2\x0b\x38\x0a\x80\x8c\x62\x7b\
-\x62\xa3\xf9\xd8\x00\x27\x7b\xc0\x23\xe2\x92\xc5\x33\x1a\xa9\x12\
-\x7f\x4b\x58\x36\x96\xde\xa6\xbb\xe3\x77\xec\xce\xde\x75\xfc\xa6\
-\x83\x86\x8f\xc1\x41\x2d\x55\x82\xf0\x9b\x04\xc2\x04\x26\x3b\x79\
-\x8c\xe1\x43\x5c\x6e\x1a\x12\xa6\xe3\xbd\xf0\x24\xd7\x2d\xd1\xa9\
-\xa9\xfd\xcc\x7f\x1d\x2d\xad\xff\x4d\x85\x25\xa4\x4c\x0e\x4d\xb4\
-\x6f\x47\xda\x3c\xd5\x12\x98\xaa\x1d\x0b\xf7\x23\x90\x36\xfd\x50\
-\x7a\xf7\x08\x08\xc7\x0e\xd8\xb4\xe3\x29\x60\x9a\x3d\xad\x9c\x0d\
-\xa7\x9d\x97\xb7\xb4\x07\x04\x3c\x90\x84\x42\xe3\x12\x54\x19\xee\
-\x0e\x4a\xeb\x96\xcf\x47\x12\x9a\xf8\x8c\xc1\x00\x27\xc7\x03\xfa\
-\x8f\x1c\x27\xbd\x02\xc3\x14\x08\xd5\x14\x67\x2d\xe0\xd8\x9a\xcf\
-\x0f\x4c\x77\x1b\xe9\x8e\x6d\xae\x6d\xfb\xf4\x97\x36\x00\x1b\xd3\
-\x9f\x4f\x64\xb4\x8c\x88\x4f\x10\xe7\xec\x4b\xe5\xba\xbb\xef\x95\
-\x9f\x2c\xc9\x96\x85\xcb\x1f\x90\xa5\x0f\xae\x91\xa5\x0f\xad\x91\
-\xc5\x2b\x1f\x94\xfb\xb3\xf3\xe5\xc6\x7b\xee\x97\x19\x57\x5d\x2b\
-\xf1\x4e\xa4\xac\x91\x63\xc5\x33\x30\x54\x3a\x21\x41\xb6\xe9\xdd\
-\x57\xda\x71\xc8\xd4\x00\x6f\x95\x74\x8d\x73\xc1\x01\x44\x35\x61\
-\x31\xd6\xbf\x05\x24\xdd\x4d\x60\x1a\x3d\xe4\xe7\x02\x93\xed\x93\
-\x3c\xb7\xbe\xab\x6f\x90\x78\x61\x3b\x86\x4f\x8c\x37\xe6\x01\x40\
-\xe9\xcd\x31\xb4\x04\x25\x21\xd6\xdc\x48\x96\x00\x29\x87\x0d\xf9\
-\x8e\x18\x27\x5d\xfd\x42\xd5\x50\x30\xa3\x22\xe0\xef\xe4\x06\x4c\
-\xef\x60\xac\x1f\x12\x26\xd2\xbd\xdf\xd8\x89\xea\x77\x0e\x8b\x07\
-\x28\x4d\x68\x2a\x60\xb2\xda\x60\x27\x4f\x92\x73\x77\x48\x92\xe3\
-\x57\x21\xc9\x8e\xeb\xfd\x27\xb9\xfa\x9a\xff\x32\x5a\x5a\xff\xdb\
-\x0a\x9f\xe2\x98\x18\x9a\x90\xba\x25\x3c\xc1\x76\x82\x3b\x50\x30\
-\x4a\xb3\xe0\x84\x14\xb5\x13\x59\x0e\xc7\xce\x14\x30\x76\x92\xf4\
-\x0e\x65\x0f\x3a\x77\x3c\xc2\x32\x58\xd9\x9a\x2a\x8e\x73\x6c\x5a\
-\xd3\x88\x75\x41\x99\xee\x83\xb2\x3b\x92\xa0\xc4\xf2\x08\x4b\x65\
-\x2c\x37\x82\x8f\x61\xab\x07\x37\x0a\x49\x36\x36\x19\xc6\x67\x04\
-\x8f\x99\x28\xfd\x42\xa2\x14\x38\x78\x59\x0c\x55\x8e\xb6\x02\x4b\
-\xcb\x17\x06\x4d\xbe\xa7\xa9\xfc\xe5\x73\xbc\x66\x4e\x07\x24\x50\
-\xf6\x5e\x33\x1d\xb6\xe9\xe3\x01\x08\x02\xa8\x6e\x6e\xdb\xdb\x53\
-\x0d\x5f\xa2\xdb\xf7\x1b\x60\x4c\x48\xc1\x14\x8c\xe5\xa9\xf3\xb4\
-\x1b\xa1\xc7\x66\x01\x23\x31\x2a\xf3\x7e\x0b\x48\xba\xbb\x25\x30\
-\xb9\x4e\x6c\xd3\xe5\x77\xed\xe6\x1f\x22\xde\x43\x47\x4a\x44\x7c\
-\x92\xea\xac\x51\x43\x85\x70\x4b\x58\x1a\x27\x1d\xe0\x00\xc6\x0e\
-\x1d\x05\x4e\x40\x92\xa9\x13\xb7\xc1\x13\x13\xa4\x57\x44\x8c\x74\
-\x40\xa2\xb4\xae\x34\x69\x40\x12\xdf\x17\xc0\xe4\xa9\x8e\xdd\x61\
-\xb6\x41\xf7\x8a\x18\x6c\x9c\xbd\xa3\x0e\x8a\x46\x13\x0c\x1d\x4c\
-\x58\xe2\xb7\x50\x67\xf5\x24\x39\x5e\x0f\x4d\x4c\xbb\x39\x28\xd1\
-\x35\xc6\x77\xdc\xcc\xae\xe6\xbf\x8a\x96\x96\x16\x15\x32\xd9\x36\
-\x3e\x38\xc1\xb6\x36\x24\x21\xf5\xad\x90\xc4\x94\x53\xc1\x49\x00\
-\x26\xe0\x16\x0a\x58\x86\xa2\x74\xe6\x6d\x18\x80\x16\x34\x29\x41\
-\x3c\xa3\x86\x19\x1d\x40\x4c\x9b\x2a\x61\x5a\x36\xda\xc8\x08\x4d\
-\xce\xe8\xde\x09\xaf\xf5\x09\x8d\x11\x7f\x80\x96\x89\x92\x8e\x70\
-\x03\x66\x78\x32\x80\x49\x2b\x68\xda\x24\x1a\x3b\xec\x60\x82\x13\
-\xf7\xc3\x26\xc4\x8b\x57\xec\x70\xa4\x25\xf6\xca\xfb\x2a\x73\x26\
-\xf7\xf3\x01\x93\xb7\xdf\x5a\xa2\x13\x62\xb8\xdf\xb2\x8d\xb0\x19\
-\xec\xf0\xd8\xdd\xd6\xdf\x35\xb7\xfb\x67\x18\xcf\x35\x83\x25\x6c\
-\x0c\x48\x67\xdb\xe5\xf9\x8c\xf7\xa8\xcf\xf3\xc1\x81\x81\xf7\x03\
-\xa4\x5f\x58\xb4\x04\x8e\x99\x80\xd4\x9d\x2a\xb1\x29\x3c\xef\x1b\
-\x90\x34\xad\x7a\xbc\xd9\x5e\xa9\xa0\x69\x3c\x17\x6d\x76\xea\x44\
-\xe0\x77\x19\x30\x64\x24\x0e\x56\xc1\xd2\x81\x03\xfb\x59\x86\x63\
-\xfb\x1b\xa7\x37\x12\x9c\x58\x4f\xc2\x53\x1d\xe0\x82\x64\x40\xec\
-\x08\x1c\xb4\xcc\x2a\xc2\x0d\x96\xac\x24\x42\xb9\xdd\x01\x4b\xa4\
-\xcc\xdf\x03\xa4\x57\x8c\x4c\x4b\xeb\x66\xfe\x7b\x68\x69\x69\xb5\
-\x94\x7f\x5c\x4a\x50\xf0\xe4\x14\x47\xc8\x94\x94\x8d\xa1\x53\x52\
-\x6a\xdc\x77\xaa\x10\x40\x93\x00\x45\x09\x2f\xe1\xf1\xc9\xe2\x3b\
-\x7c\x9c\x74\xf7\x0b\x13\x75\x8d\x71\xd5\x73\x6e\x94\x7f\x4d\xd0\
-\xa4\xcd\x2b\x13\xe2\xf5\xbe\xe1\x83\xd5\x29\x98\x31\x58\x26\xe7\
-\xe4\x24\x30\x79\xda\x9e\x05\xcc\x96\x66\xaa\x52\x1d\x19\xf8\xdc\
-\x80\x11\xe3\xa5\x2f\x52\x27\xc1\xc2\x79\x29\x69\xab\x73\xc8\xe8\
-\x08\x02\xe0\xdc\xe0\x79\xae\x0d\xf0\xb9\x27\xcc\x26\xf0\x7d\xbf\
-\xc0\xe4\x50\xa7\xa6\xe5\x37\xb7\x02\x25\xcc\x53\x44\xd9\x43\xde\
-\x3d\x30\x44\x06\xe1\xa0\x10\x81\x83\xd0\x60\xc0\x30\x16\x65\xb7\
-\x9a\xb3\x54\x41\xd2\x04\xa5\xb2\xd9\xc1\x63\xa6\x4c\x35\x99\x4a\
-\x82\x5d\x95\xdf\xdd\x50\x5a\xb7\xc7\x77\x67\x09\x6e\x6c\x73\x13\
-\x98\xd8\x56\xfc\x0e\x9c\xf9\x88\xcd\x28\xdd\x03\x23\xc4\x7f\xf4\
-\x44\xd5\xbc\x62\x75\xec\x59\x56\x4d\x31\x48\x96\x11\x4c\x96\x09\
-\xb6\xdf\x86\x26\xa5\x5e\xea\x3b\x6e\x9c\x4e\x95\x5a\x5a\x17\xa2\
-\x80\x78\xe7\xb0\xe0\x29\xc9\x6b\x50\xa6\x57\xa3\x34\x43\xe2\x40\
-\xa9\x8c\x72\x9a\x13\xc7\xaa\xa4\x19\x0f\xa8\xc1\x21\xe3\x12\xa4\
-\x5f\xc4\x50\x95\x24\x99\x38\xad\x12\x9d\xe0\x54\x29\x93\x3b\x2b\
-\x6e\x8d\xfb\x78\x0e\xe0\xe4\xe4\xc5\xc1\x48\x8f\x1c\x64\x4d\xbb\
-\x9f\xc2\xa7\xce\x7b\xe6\x8e\x0b\xab\xe7\xb0\x23\xf3\x3d\x6a\xac\
-\x21\x76\xf2\xb0\x09\x09\xe2\x3d\x64\xb4\x3a\xa5\x8f\x20\xe0\xd5\
-\x2c\xd9\x51\xd4\xf2\xec\xa1\xe6\x6e\x09\x3c\xc3\x2c\x8d\xcf\x7d\
-\xde\xfa\x1b\x02\xce\x7a\xce\xfd\xfe\xb9\xb6\xd2\x62\xd3\x73\x04\
-\xa3\x01\x5c\x0b\xce\x2a\xfd\x32\x11\xe3\x7e\xaf\x80\x30\x19\x10\
-\x35\x44\x42\xc6\xc7\x49\x4c\x92\x31\xe5\x1a\xd3\x22\xc1\x68\x95\
-\xdc\x91\x8d\xa0\x74\x33\x5e\x8b\x21\x50\xb1\x8d\xfc\xc6\x8c\x93\
-\x9e\xc1\xe1\xd2\x01\xcb\x65\x19\x6f\x9c\x7f\x6f\x2c\x9f\xa0\x34\
-\xd2\xa5\x61\xfe\x16\x7d\x22\x62\x25\x38\x2e\x41\x6d\x57\xa3\x9d\
-\xba\xb9\x23\x12\xb1\x6c\x7b\x1a\x60\x69\x7f\x39\x3c\x29\x75\x36\
-\x27\x6d\x31\xff\x15\xb4\xb4\xb4\x2e\x44\xe1\x89\xf6\x21\x21\x09\
-\x49\x0f\x85\x4d\xb1\x55\x86\x62\xa7\x0a\x06\x28\xad\xf6\xcc\xd0\
-\x78\xc3\xaa\xb4\xc3\xed\xa0\xe1\x63\xa5\x8b\x7f\xa8\x74\x50\x3b\
-\xab\x99\x34\x4d\x50\x36\x99\x25\x7a\xa0\x7a\x4f\x27\x80\xd3\x23\
-\x82\xd0\x88\x97\x58\x2c\x3b\xc6\x0d\x9c\x06\x30\x01\x0f\xec\xc4\
-\x91\x89\x00\x89\xb2\x01\x50\x2b\x79\x45\x26\x22\xe5\x4e\x8c\x97\
-\x80\xe1\x63\xa4\x7f\x78\xac\xf4\x44\xd9\x4e\x30\xb1\xb3\xa8\x53\
-\x7f\xc2\x09\xa0\x68\x84\x68\x13\xcc\x5a\xb6\x25\xba\xbf\x66\xb8\
-\x35\x60\xb6\x7c\xdc\xdc\xad\x02\x93\x00\x63\x33\x42\x7f\x7c\x06\
-\xbe\x73\xef\x90\x08\x80\x7e\x84\x84\x8d\x8b\x93\x68\x24\xf4\x21\
-\x80\xdf\x60\x24\x49\x02\xb3\x79\x92\x3c\xd7\x9c\x8e\x8d\x13\xa7\
-\x70\x3e\xcb\x80\xd1\xe3\xa5\x77\x68\x24\xb6\x63\x80\x82\x65\x07\
-\x94\xf3\x2c\xe9\x5b\x03\x26\xef\x77\xf7\x0b\x45\x25\x30\x16\xdb\
-\x8e\xed\x9e\xd6\x28\x88\x26\x87\x73\x1b\xf3\x4c\xaf\x29\x8e\x8f\
-\x42\x93\xec\x4f\x22\x59\xce\x88\x9e\x35\xab\x93\xf9\x2f\xa0\xa5\
-\xa5\xf5\x5d\x84\x44\x19\x1b\x9c\x90\x9a\x1f\x92\x90\xfa\x07\xa4\
-\xcc\x5a\xd5\xce\x65\x96\x71\xec\x2c\x50\x3d\xaa\xb8\x65\x79\xcd\
-\xc9\x3b\x58\x76\xab\x24\xd9\x58\x1a\x1a\xe0\x34\xda\xd2\x9a\x52\
-\x0f\xcd\xd9\x70\x08\xd7\x7e\xa1\xb1\x6a\xbc\x20\xcf\x06\x8a\x56\
-\xe7\x41\xbb\x19\x3b\xb4\x01\x50\x03\xa6\x84\x2a\xcb\x79\xa3\x1d\
-\x34\x05\x49\x0c\xc0\xe1\x79\xd3\xf1\x89\x12\x3c\x36\x4e\x7c\x87\
-\x8e\x16\x4f\xac\x43\x4f\xff\x70\x05\x0e\x05\x13\x55\xb6\xfb\x28\
-\x77\xf6\xe2\x90\x1f\x03\x96\xaa\xed\xd0\x84\x9b\x51\xca\xfb\x19\
-\xb3\xff\x28\xf3\x7e\x93\xdd\x61\xa8\x80\xe8\x66\x63\xf8\x8f\x8f\
-\x70\xce\x4e\xd5\x11\x84\xef\xc6\x71\xa9\x5e\xd1\x43\xd5\x20\xfd\
-\x70\x24\xbb\x98\xc4\x64\x24\x49\xa6\x49\x9b\xc4\xd0\x58\x67\x3a\
-\x9a\x63\x52\xcf\x03\x4c\x8e\xa7\x8c\x85\xf9\xfd\xfc\x46\x8e\x55\
-\x89\xb2\x23\xca\x7d\xce\x48\xa4\xa0\xc8\x12\x1c\xdb\xb0\xa5\x3b\
-\xe1\x35\x6e\xf7\x7e\x61\xb1\x12\x36\x1e\x9f\x4d\x20\x12\x96\x58\
-\x26\xc7\xdb\x36\x19\xdb\x37\xd9\xfe\x4d\x78\x82\xf3\x39\x54\x11\
-\x97\x86\x25\xb8\x86\xb6\xc9\xca\x6a\x67\xfe\xf4\x5a\x5a\x5a\xff\
-\x8c\xfc\xe3\x6c\x83\x82\xe3\x52\x12\x83\x12\x92\x97\x03\x9a\x07\
-\x42\xb1\xe3\x19\x83\x9b\x2d\x23\x6d\xb2\x5d\x93\xe0\x44\xc9\xee\
-\x3d\x7c\x9c\x74\x09\x40\xb9\xc8\x1d\x1a\xf0\xb4\x80\x69\xcc\xb3\
-\x88\x9d\xdd\x0d\x9e\x2a\x75\xe2\x3d\x4c\x9c\xbd\xc3\x62\xc4\x7b\
-\xc4\x38\x75\x66\x0a\x13\xa7\x75\x5e\xb4\x31\x3d\x59\x53\xd9\x1e\
-\x89\xcf\xa3\x09\xe9\xb0\x24\x7c\x2e\x4c\x78\x12\xa4\xfc\xbb\x58\
-\xc0\x20\x0a\x29\x38\x7c\xe2\x14\x09\x18\x39\x4e\x06\xc6\x0e\x07\
-\x94\x23\xa5\x97\x3f\x4f\xef\xc4\xe7\xb2\xbd\x93\x83\xe5\x55\x29\
-\x8b\xd4\xc9\x21\x4c\xb0\x2a\x99\x01\xbf\x73\x4d\xe0\xe2\x3d\x04\
-\x2f\xdb\x49\xe1\xae\x03\x8c\x24\xca\x09\x76\x59\x62\xb3\xc3\x66\
-\xd0\xe0\xe1\x12\x84\x04\x18\x31\x69\x8a\x4a\x91\xb1\x00\x5d\x2c\
-\x2f\x3c\x87\x5b\x35\x58\x1f\x26\x20\x5b\xda\x1d\x98\x84\x9b\x35\
-\x41\x06\x87\x5a\x31\x1d\x76\x0f\x0a\x95\xf6\x83\x00\x64\x0e\x57\
-\x32\x7b\xbf\x95\x09\x46\xd5\x3e\x49\x50\xf2\xe0\xe0\x2f\xed\xb1\
-\xbe\x4c\xfa\x83\x86\x8d\xc1\xdf\xe3\x73\x13\x70\xc0\x49\x30\x12\
-\x7b\x33\xe3\x40\x14\x9d\xe4\xf8\x3a\x2c\xc1\xfe\x0c\x2a\x08\x17\
-\x7e\xe6\xb6\xc6\xaf\xad\xa5\xa5\xf5\xbd\x88\x13\xc4\x22\x55\x66\
-\x23\x65\xee\x23\x34\x39\x04\xc5\x1d\x98\xa1\x09\xbc\x35\x3a\x10\
-\x78\xdd\x17\xcf\x98\xe1\xaa\x04\x37\x92\xa4\x31\x1b\xb8\x01\xcd\
-\xe6\xc0\xec\xac\x86\x25\x05\xe3\xd6\x68\x07\xed\x0e\xd8\x0e\x8a\
-\x1d\xa9\xa6\x1f\x23\x04\x8d\xde\xe2\xf3\x00\x53\xdd\x12\x98\xc9\
-\x30\x9f\x37\x53\xa8\x32\x4a\x5e\xfc\x9d\x4a\x75\x84\x16\x4f\xd1\
-\x9c\x9c\x24\x21\x58\x6e\xc0\x98\x89\xe2\x33\x62\x8c\x78\x0d\x1d\
-\x21\x03\x90\x04\x3d\x22\x62\x91\x8e\x63\xa4\x0f\xc1\x1a\x1c\xd1\
-\xe8\xde\x21\x91\xd2\x17\x30\xec\x17\x11\x23\x9e\xd1\x43\xa4\x3f\
-\xe0\x3b\x68\xd8\x28\xf1\x1b\x3d\x4e\x82\xc6\xc7\x49\xd8\xe4\x04\
-\x89\xc4\x72\x09\x3e\x2b\x35\xaa\xc4\x6b\xad\x13\x61\x9e\x6c\x38\
-\x12\xf7\xa3\xe0\x46\x50\xe2\xbe\x7a\x0e\xdf\x8f\x9d\x5b\x2c\xbb\
-\x63\x01\xb7\xd0\x71\xf1\xd2\x3f\x6a\x98\x1a\x54\xde\x11\x60\xe6\
-\x5c\x95\x9c\x53\x94\x73\x55\xba\xc3\xd2\x00\x26\x41\xc9\x84\x8b\
-\xe4\x39\x08\x69\x3d\x72\x88\x9a\x38\x83\xdf\x3d\x02\xdb\x82\x13\
-\x68\x10\x8e\x2d\x81\x19\x93\xec\xfa\x8a\xf3\x09\x70\x5e\x01\xf3\
-\xe7\xd5\xd2\xd2\xfa\xbe\xe5\x3f\x29\x29\x18\xd0\x9c\x0f\x48\xbe\
-\x0a\x40\x56\x5a\xbd\xad\xcd\x12\xa7\x82\x26\xc0\x86\x94\x17\x84\
-\x32\x99\x17\x5b\xe3\x99\x40\xc6\xe9\x79\xec\x84\x30\x3a\x22\x94\
-\x55\x27\x91\xd1\xe6\x69\xd8\x1a\xd7\x09\xfb\x86\xaa\xd4\xe9\x83\
-\xb2\x96\x67\x0b\x29\x08\x02\x2e\x2c\xcf\xd5\x90\x24\xd8\x1a\x9e\
-\x64\x80\x13\xa0\x52\xc0\x32\xcb\x76\xf3\xf5\x46\xe3\x35\xda\x02\
-\xaf\x91\xec\x4c\xf3\xb1\xf9\x77\x16\x90\x69\x3e\x8e\xe2\xad\x82\
-\x1d\x9f\xe3\xeb\x30\x0e\x0e\x1c\x97\xaa\xec\x36\xb6\xb4\xc9\x06\
-\x30\x09\x44\x77\xbb\xc3\x32\x0a\x25\x7a\x34\x8d\xfb\x61\x48\xa5\
-\xbc\xee\x4e\xb7\xc0\x50\x24\x49\x94\xd5\x2c\xbb\x4d\x30\xb2\xcc\
-\xb6\x00\x69\x01\x53\xa5\x4a\xaf\x00\xc0\xd4\x5f\x3a\xc0\x3d\xd9\
-\x03\x3e\x6a\x82\x71\xbe\x3e\x20\x19\x39\x05\xdb\x09\xf0\x0d\xa7\
-\xdd\x61\x99\xec\xfc\x0a\xa9\xf2\x4f\xe1\x89\x8e\xad\x9c\x4f\xc0\
-\xfc\x59\xb5\xb4\xb4\xfe\x5d\x8a\x4c\x4a\xf2\x08\x8c\x4b\x99\x1c\
-\x9c\x90\xb2\x38\x34\x31\xf5\x63\x4e\xcc\x60\x80\x92\xb3\xdb\x20\
-\x21\x61\x67\x55\x49\x73\x0a\xdb\x1a\x61\x00\xc5\x7f\xf4\x04\xe9\
-\x15\x12\x81\xa4\x84\x1d\x1d\x3b\xfc\x79\x81\xa9\x7a\xd8\x09\x4b\
-\x24\x4e\x9f\x20\xe9\x88\xd7\x3a\xe1\xb6\x1b\xca\x4c\xa6\x27\x42\
-\x21\x22\x2e\x09\x60\x30\x00\x47\xf0\x5d\x30\x30\xcf\x63\xc2\xce\
-\x82\xde\x79\xcd\xd7\xbf\xcd\x78\x4f\xf3\xe5\xb6\x0e\x4c\xab\xdd\
-\x32\x7a\x4a\xb2\x84\x8e\x9f\x2c\x03\x63\x87\xa9\x4b\xdf\x12\x80\
-\x6a\xd6\x73\xc0\x91\x33\xa7\x37\x26\x48\x1e\x68\x2c\x60\x9a\xb0\
-\x34\x40\x8a\xf7\xf3\x79\xbf\x50\xf1\x8a\x1d\x2d\xe1\x71\x04\xb1\
-\x03\xa0\xc4\x77\x87\xcf\x01\x26\x7e\xa3\xc8\x24\xc7\x69\x24\xce\
-\xc7\x50\x01\x4c\x0b\x4f\x4d\x8b\x34\x7f\x4e\x2d\x2d\xad\xff\x84\
-\x3c\x47\x8c\x18\xe4\x3f\x3e\xee\xbe\x90\x29\xc9\x7f\xe3\x84\xc4\
-\x1c\xc7\xc7\xde\x74\xab\x07\x96\xf7\x8d\xc7\x84\x17\x8c\x94\xe8\
-\xa3\x3a\x2f\x00\x4e\x73\xcc\xa0\x01\x4c\x13\x9a\x0a\x9c\xd6\x00\
-\x78\x73\x98\x92\x95\x38\x51\x6e\x72\xbc\x67\x67\xdc\xf6\xf0\x0f\
-\x47\x09\x3d\x58\x7c\x51\x52\x87\x4c\x9c\xac\x4a\x62\x23\x19\x1a\
-\x00\xb5\xca\xf7\xe6\x00\x3b\xd7\x17\x0c\xc3\xd6\x8c\xcf\x6c\x69\
-\xd5\x09\xe5\x66\x02\x93\x29\x52\x19\xa0\x0c\x47\xf9\x1e\x30\x66\
-\x82\x0c\x88\x19\x2a\x3d\x78\x0a\x28\xc0\xc7\x24\xa9\x80\x48\x30\
-\xb2\x6d\xd5\x04\xa4\xbb\x9b\x0f\xcd\x62\xa2\x04\x58\xb1\x7d\x38\
-\x11\x47\xc8\xc4\x29\x46\x1b\xa5\xd5\x56\x09\x47\x9a\xb6\x1e\xb3\
-\x6d\x14\xdb\xe4\x54\x58\xdc\x94\xed\xbe\xa3\xe3\x26\x9b\x3f\x9f\
-\x96\x96\xd6\x7f\x5a\xbe\x43\xc7\xf9\x78\x0f\x1d\x5f\xe0\x37\x6a\
-\x52\x15\xcb\x53\x35\x55\x1c\x60\x84\xb2\xaf\x11\x9c\x86\x91\x04\
-\x55\x0a\x63\xc7\x10\xc0\x39\x62\x1c\x12\x67\xb4\xda\xf1\x09\x46\
-\x35\xf0\x9d\x60\x44\xca\x34\x4c\x80\x5a\x30\x35\x80\xa9\xae\x37\
-\x84\xfb\x84\xa6\xba\xc6\x0d\xd2\x6a\x37\x5f\xce\xe1\x18\x21\x5e\
-\x31\xc3\x55\xfa\x0c\x9d\x68\x9c\xbf\x6e\x75\x1a\xa9\x72\x1a\x9f\
-\xc9\xe7\xd4\x79\xed\x6e\x6e\x06\xc0\x78\xb7\xfb\x17\x62\x02\x32\
-\x81\xb3\x30\x19\x36\xa0\x6d\x96\xda\x4c\xb9\xb8\x4f\x40\x72\x0e\
-\x4a\x96\xda\x6c\x07\xed\xe2\x17\x24\x1d\x06\xf1\x42\x66\x86\x09\
-\xc0\x66\x25\x36\xdd\x12\x96\x30\x4b\xf4\x8e\xf8\xae\xed\x07\xfa\
-\x48\x07\xdc\xf6\x09\x8f\x95\xc0\x71\x71\xe6\xf7\xc0\xf6\x54\x49\
-\xbe\x09\x90\x96\x39\x86\x95\x6d\x99\xa1\x71\x09\x5f\x78\x8f\x1c\
-\xf7\x6a\x7b\xbf\xa0\x14\xf3\x67\xd3\xd2\xd2\xfa\xff\x50\x57\xdf\
-\x30\x9f\xae\xbe\xc1\x05\x9d\x7d\x83\xaa\x7a\x86\x44\x01\x10\xc6\
-\x8e\xcc\x52\xd0\x00\xa5\x35\x6d\x1c\xdb\x35\xf1\xbc\x69\x95\x38\
-\x01\x1e\x9e\x79\xd2\x1b\x00\xe8\x84\x12\x9c\x1d\x44\x0a\x96\xbe\
-\x4d\xc0\xe4\x3c\x9c\x6a\x2e\x4e\x37\x77\x19\x04\x33\x9d\x9a\x6d\
-\xa1\x0a\x3a\x04\x0c\xe7\xc8\x04\x7c\x7b\x04\x46\xa8\x31\x9e\xbe\
-\xc3\xc6\x4a\xc8\x58\x24\x50\x96\xf0\x00\x22\x67\x48\x32\x4a\x75\
-\x02\xc6\x0d\x9c\x84\x25\xcc\x76\xd2\xb0\xc6\x5b\x63\x86\x25\xda\
-\xfd\xbd\xca\xf8\x7b\xa3\x7d\x13\x90\x44\x69\x1d\x11\x9f\x08\x28\
-\x4d\x91\xa0\x71\x93\xc4\x77\xf8\x68\x35\x28\xbd\x4f\x70\xa4\x9a\
-\x3c\x83\x65\xb6\x3a\x17\xde\x8b\xc3\x81\xb0\x8e\x6e\x69\x51\x81\
-\x12\xcf\x59\xd0\x6c\x66\xb3\x1c\xe7\x39\xf9\xed\xe1\x8e\x78\xae\
-\x4f\x44\x34\x40\x39\x51\x9d\x9b\xaf\xd6\x5b\xad\x1f\x81\xd9\x1c\
-\x94\xec\xe8\xe1\xf8\xd5\xf0\xf8\x54\x19\x38\x74\x0c\x4f\x99\xfc\
-\xa2\xe3\xa0\x80\x57\x3b\x07\x45\x6a\x60\x6a\x69\xfd\xbf\xa9\x7f\
-\x74\x0f\xc0\xeb\x12\x94\xca\x7f\xea\x88\xd4\xc7\xce\x07\xb6\x37\
-\x7a\x0e\x1e\x21\xa1\xd8\x99\x23\xd9\x76\x66\x82\x53\x4d\xe8\xa0\
-\x00\x6a\xec\xd0\x6a\xc7\x66\x5b\x1b\xdb\xdd\xf0\x38\x60\xdc\x64\
-\xe9\x0d\xd0\xf0\x3a\x33\x3c\x6b\x88\x3d\xe7\x06\x1c\xcd\xa4\x49\
-\x80\x02\x8e\xe7\x9a\xef\x63\x4a\x35\x20\xa3\x40\x63\xa6\x35\xd5\
-\xc6\xc7\x49\x27\xfc\x42\xa4\x47\x50\x38\xc0\x1c\x2d\x9e\xd1\x43\
-\xc5\x0b\x89\xcf\x67\xd4\x38\xf1\x1b\x3d\x1e\x00\x9a\xa4\xce\xb8\
-\x09\x46\x69\xcf\xde\x65\xf6\xcc\x07\x63\x5d\x82\xf9\xdc\xf8\x49\
-\x12\x04\x13\x52\x01\x63\xe1\x31\x13\xc5\x77\xf4\x38\xf1\x1e\x39\
-\x46\x06\x62\x19\x1e\x91\xb1\xd2\x33\x14\x60\xe4\xec\x45\x48\x8f\
-\x2a\x09\x02\x8e\xd6\x99\x37\x1c\x93\xa9\xca\x69\x58\x01\x9d\xf7\
-\xb9\x4e\x2d\xdb\x23\x5b\x31\x9b\x2c\x3a\xf0\xbd\x38\x90\x78\x46\
-\x0d\x05\x8c\x27\x63\x9b\x19\x1d\x51\x8d\x29\xd7\xb2\x2a\xff\xcd\
-\x83\x91\x6a\x8a\xb0\x61\x7b\xc6\x49\x0f\x1c\xc0\xda\x61\x19\xea\
-\xfc\xf2\x41\x81\x27\x3a\x0f\x0c\x58\xdd\xd9\x2b\x3c\xc8\xfc\xf5\
-\xb4\xb4\xb4\xfe\x93\xea\xdd\x3b\xa0\x4f\xa7\x01\x7e\x77\x21\x39\
-\x1d\xee\x34\xd0\xb8\x86\x35\x77\x74\x05\xaa\xc0\x30\xf1\x1e\x31\
-\xc1\x68\x4f\x03\x38\xdd\xdb\x36\x2d\x60\x36\x26\x22\x96\x95\x80\
-\x01\x13\x68\x30\xa0\xc5\x89\x24\xba\x06\x86\x03\x9a\x4d\x65\x38\
-\xa1\xc8\x31\x8f\xb4\x82\x4a\x23\x74\xf8\x1e\xf3\x39\xd3\x6a\xac\
-\xa5\x9b\x09\x2a\x82\x4b\xd9\x84\x18\xad\x7a\xa3\xf1\x7a\x27\x2c\
-\xb3\x93\xb7\x8f\xe4\x6f\x58\x2f\x4f\xbe\xf0\xa2\x6c\x7d\xfa\x69\
-\xd9\xf8\xe8\x23\xb2\x7e\xc7\x76\x29\xfa\xe9\xe3\x32\x31\x23\x13\
-\x09\x8f\x49\x0f\x30\xc4\xdf\xa8\x92\x9a\x43\x7d\x68\x73\x39\x2c\
-\xb5\xd5\xf2\x08\x46\x37\xab\xe7\x60\xde\x3f\xdf\xa9\x8b\xee\xeb\
-\xa9\x12\x29\xde\xd3\x33\x28\x52\x06\x0d\x1d\x2d\xa1\xd8\x1e\x6a\
-\xd2\x92\x29\x48\xb6\x2d\x41\x69\x3a\x32\x81\x07\x27\x76\x82\xd9\
-\x01\xfd\x44\xe9\x17\x33\x4c\x3a\xe0\x00\xd3\x9e\xbf\x05\x3e\xab\
-\x23\xc7\xb9\x0e\x0c\x38\xdb\x71\x60\xc0\xb3\x1d\xbd\xfc\x62\xcc\
-\x9f\x4f\x4b\x4b\xeb\x3f\xa9\xde\x01\x00\xe6\x20\x03\x98\x1c\xa0\
-\xae\x06\xa9\x9b\xb7\x1d\xe0\xf6\x28\x9b\x7b\x87\xc5\x4a\xe0\xf8\
-\x29\x46\xf2\x01\x38\x09\x4b\x65\x05\x4a\x0b\xa2\x28\xd7\xb1\xd3\
-\x87\x9a\x29\x89\x09\x29\x34\x2e\x51\x9d\x6e\xd9\x2b\x2c\x5a\x0d\
-\x6a\x57\x13\x4b\x70\xf9\x1c\xb7\xa9\x3e\x83\xe0\x31\xac\xee\xb7\
-\x02\xa0\xd6\xac\x4a\x61\x0b\xba\xa6\x15\x40\xbd\x06\xc9\x2f\x5e\
-\x79\x51\xaa\x8e\x1f\x93\x9a\x53\xf5\x72\xf4\x64\x9d\xba\xad\xff\
-\xea\xa4\x5c\x72\xf3\x2d\x0a\xb4\x84\x99\x5a\x06\x3f\x93\xe0\xc3\
-\x3a\xa9\xbf\x87\x2d\x58\x5a\x56\x80\x04\xac\xd4\x59\x37\xe6\x3a\
-\x5a\x76\xff\x6c\x95\x88\xcd\xbf\xe1\x05\xc9\x3c\x23\x07\x4b\xd0\
-\x98\x49\x6a\xe0\xbd\x6a\x3e\x00\x10\x2d\xb7\x06\x4b\x3e\xcf\x19\
-\x9e\x38\xd8\x9f\x83\xdc\xbb\x05\x84\x03\x94\x00\xaf\x91\x2a\xcd\
-\x75\xe0\xf2\xfd\xce\xe2\x73\x9e\xed\xee\xa7\x81\xa9\xa5\xf5\x1f\
-\xd3\xf8\x9b\x2f\x1f\x30\xea\x96\xcb\x46\xc7\xfd\xe4\xba\x31\x41\
-\xb6\xf8\xe4\x2e\xbe\x81\x0f\x76\x1e\xe4\x57\x65\x0c\x46\x07\x10\
-\x2c\x80\x20\xe1\x74\xc0\x6d\x7b\xec\xac\x1d\x90\x02\xfb\x46\x0c\
-\x96\xe0\x09\x09\x80\x80\x53\x95\xe1\x84\x26\x61\xa9\x66\x74\x07\
-\x4c\x99\x2e\x69\x63\x00\x7c\x8a\xba\x4f\xc8\x12\xa0\x81\x13\xe2\
-\xa5\x3f\xca\x7c\xce\xb6\xc3\xb4\xa4\x4a\x7f\x42\x09\xa9\xaf\xb3\
-\x0f\xed\x06\x21\x00\xe2\x42\x4a\xde\x46\xab\xf7\x63\x59\x48\x7f\
-\x3f\x7f\xe1\x05\x39\x5c\x5b\x25\x87\xeb\xe0\xda\x4a\x29\xaf\xaf\
-\x92\xea\x13\xb5\x72\xd1\xf5\x37\x00\x96\x3e\xca\xfc\x1b\x02\xae\
-\x35\x60\xba\x5b\x81\xf1\x3c\xeb\xa2\xda\x30\xf1\x3c\x41\xc6\x76\
-\x4e\x76\x5a\xf9\x0d\x1b\x23\xe1\x13\x13\xd5\x04\x23\xea\x82\x71\
-\x66\xa2\x3c\x2f\x28\xdd\xca\x73\xdf\x51\xe3\xa5\x67\x70\x94\xb1\
-\x6d\x70\x40\x61\x62\x6e\x6a\x27\xe5\xba\x60\x1b\x0d\xf2\xfb\xb2\
-\xab\x7f\xc0\x1f\xfa\x8c\x18\x7c\x69\x5c\xd6\xed\x63\x26\x2e\xb8\
-\x79\xdc\xa4\xf9\x37\x45\x9b\x3f\xab\x96\x96\xd6\xf7\xad\xd4\x75\
-\x59\xa1\x29\x1b\x96\x2c\x4e\xdd\x94\xfd\x72\x5c\xce\x5d\x6f\x8d\
-\xb9\xf5\x8a\x77\x02\x6d\x53\x0e\xb7\xeb\x3f\x00\xc0\xf1\x36\x61\
-\xc0\x71\x93\x06\x30\x8d\x9d\x96\x3b\x2f\x9e\x63\x2a\xf4\x0d\x13\
-\xcf\xa8\x11\x12\x0a\x30\xa8\xde\xf4\x64\x24\xc9\x24\x40\x12\xb6\
-\x80\xd9\xd2\x8d\xf0\xa4\xa7\x24\x4b\x10\xe0\xc9\x92\xbd\x7b\x30\
-\x4a\x76\x80\x41\x9d\x5b\xad\x80\xd0\x04\x4d\xb6\x6d\xba\xdf\xfe\
-\x43\x13\x70\x03\xfc\x01\xcc\x17\x15\x30\x8f\xb8\x03\x13\x49\x73\
-\xf6\x8d\x37\x02\xd0\x04\x26\xbf\x23\xde\x8b\xbf\xf9\x36\x60\xaa\
-\x12\x1c\x56\x09\xd8\xfc\x0c\x3e\xb6\x9a\x03\xd8\x5b\xde\x37\x22\
-\x46\x7c\x46\x70\xfc\xe4\x14\x40\x92\xa7\x51\x12\x94\x46\x4f\x7e\
-\xd4\x14\xbb\x31\xce\xd4\x7c\xdc\x72\x38\x14\x87\x4f\x19\xa0\x9c\
-\x20\xec\x68\x63\x1b\x65\x47\x0e\xb9\xe2\x76\x56\xdb\xdb\x82\xa5\
-\xb9\x7e\x4c\xc7\x03\xbc\xa5\x57\x44\xf8\x17\xf1\x59\xb7\xff\x79\
-\xd2\xc2\x5b\x77\x3a\x4a\xf3\xde\xb4\x97\xe5\x6c\xc7\xad\x3e\xd3\
-\x47\x4b\xeb\xfb\x56\x6a\x71\x56\xbf\xa4\xf5\x0b\xef\x48\x5d\xb7\
-\x78\xb7\x63\x73\x8e\xd8\x36\x65\x8b\xa3\x28\x4f\x92\x97\xcf\x91\
-\xf0\x69\x76\xe9\xe2\x8b\x9d\xb6\x3f\x80\x00\x50\x12\x96\x2d\x81\
-\xc9\xb6\x48\x0e\x07\x52\x3b\x37\x13\x27\x07\xa1\x4f\x9c\xac\xa0\
-\x19\x9e\xcc\x94\x69\x80\xf3\xdb\xe0\xd9\x68\x26\x52\x80\x34\x64\
-\x52\x3c\xa0\x31\x46\xfa\x45\xc6\x4a\x77\xff\x30\x05\x65\x5e\xfe\
-\x97\x56\xed\x85\x6e\xc0\x52\xc6\xe7\xb7\x9a\xfa\xf0\xbe\x66\xc0\
-\xa4\x8f\x55\xaa\x6b\xab\x1f\x3b\x59\x2f\x97\xdc\x74\x93\x01\x1d\
-\x94\xe4\xfc\x4e\x46\xa9\xdb\x1c\xc6\x16\xa4\x94\xb9\x3c\x7e\xb6\
-\x17\xde\x8b\x34\xcc\x8e\x29\x9e\x89\xd3\x3f\x7a\x98\x04\xa8\xa1\
-\x4f\x53\x54\x4f\xb7\x3a\x9b\x08\xdf\xd7\x02\x63\x6b\xe6\x7b\x14\
-\x24\xf1\x9d\x39\xad\x1b\x41\xe9\x33\x62\xbc\xea\xd0\x61\x9a\x64\
-\x3b\xa5\x9a\xfd\x89\xeb\xd3\xca\x3a\x71\xbd\xdb\x23\x19\x0f\x18\
-\x37\x5a\xa6\xe4\xdc\x2d\x69\x5b\xf2\xc4\x5e\x96\x0b\xe7\x4b\xda\
-\xe6\xbc\xbf\xdb\x8a\x96\xec\x48\x29\xc9\x8a\xc5\x4f\xac\xcf\x25\
-\xd7\xd2\xfa\xbe\x14\xbf\xee\xbe\x81\x29\xeb\x17\x14\x26\x6f\x5c\
-\x74\x2c\x65\xf3\x12\x01\x3c\x95\x93\x37\x2c\x16\xdb\xda\x45\x32\
-\xe6\xce\x6b\xa4\xcf\xe0\xa1\xd2\x9e\x97\x7d\xc0\x8e\xdc\x1a\x30\
-\x69\xee\xd8\xaa\x74\x04\x50\x3a\xfa\x06\x4a\xaf\xf0\x18\xf1\x1d\
-\xcd\x4b\xf1\xa2\xcc\x34\x4b\x73\xf7\xb2\xfc\xdb\x4c\x90\x18\x63\
-\x1e\x8d\xb6\xbe\x20\x9e\x39\x33\x74\x34\xd2\x1b\x00\x1a\x18\xaa\
-\x86\x27\xf1\xcc\x22\x2b\x81\x76\x1d\x88\x75\xc0\xfa\xb8\x43\x45\
-\xd9\x0d\x98\x84\x65\xb9\x1b\x30\x6b\x00\xcc\x8b\x09\x4c\x76\xc6\
-\x70\x78\x10\xfe\xde\xe8\xc5\x27\xa0\xf8\xb7\x06\x98\x54\xba\x04\
-\x9c\x78\x9f\x97\x98\xe0\x2c\xf3\x83\x62\x46\x8a\xdf\xf0\x71\x12\
-\x82\xf5\x62\x1b\x23\xd7\x93\xa7\x2d\xaa\xf5\x05\x0c\xd5\xb8\x55\
-\x37\x38\x9e\xcf\x6c\xa3\x0c\x9f\x94\x24\x83\x78\x21\x3a\xff\x70\
-\x80\x1b\x9f\xc7\x2b\x67\x32\x55\xaa\x8e\x36\xe3\xd6\x1d\x98\x4c\
-\xb2\xfc\x2d\x3a\x06\x04\x4b\xf0\xac\x34\xb1\xaf\x5d\x22\xf6\x92\
-\x6c\x1c\xe8\x70\xbb\x29\x4b\xec\x9b\xe1\xb2\xbc\xaf\x01\xcc\xd7\
-\xed\x45\x59\xe3\xda\x88\x68\x60\x6a\x69\x7d\x5f\x6a\x04\xe6\x86\
-\x45\xc7\x52\xb1\xb3\x25\xaf\x5f\x0c\x2f\x92\xe4\xb5\x0b\x25\x71\
-\xed\x02\x49\xd9\xb8\x44\x12\x0a\xee\x97\xc0\x34\x9b\xb4\x07\xa8\
-\xda\x21\xe5\x59\xb0\x34\x6c\xdd\xe7\xad\x99\x7e\x60\xf6\xe2\xb2\
-\x83\xa8\x7b\x50\x84\x78\x0f\x1f\x2b\x21\x13\x13\x50\x7e\xa7\xa8\
-\x12\xbc\x35\x48\x7e\x9b\xd9\xe6\xa9\x26\xdf\x50\xe7\x87\xe3\xb9\
-\x29\x49\xe2\x37\x6e\x22\xd2\xec\x60\x40\x04\x60\x01\x14\x5b\x6d\
-\x53\x04\x5c\x98\x04\x7f\xfe\xe2\x8b\x0a\x96\xcd\x80\x79\xaa\x5e\
-\x66\xdf\x70\x13\x52\x9a\xaf\xb4\x37\x81\x69\x7d\x8f\xc6\xbf\x85\
-\xbb\x05\x84\xca\x00\xce\x56\xc4\x01\xe5\xf1\x9c\x8c\xc3\x80\xa3\
-\x3a\xaf\x1b\xd0\xe3\x74\x74\xd6\xe9\x93\x2a\x59\x9a\x6e\x15\x90\
-\x70\x0c\x13\x25\x0f\x02\x63\x26\x89\x67\xc4\x10\x7c\x56\xb0\x74\
-\x60\x82\xe7\x77\xf0\xc2\x3a\x28\x48\x12\x9a\xa6\x15\xb8\x03\x8d\
-\x11\x02\x03\x39\x0f\xa7\xb7\xf4\x1d\x31\x5c\x26\xcc\xb9\x55\x1c\
-\x65\x85\x92\x54\xb2\x54\x52\x36\x2f\x96\x54\xc0\xd2\x86\xdf\xcf\
-\x86\x83\x9e\xad\x78\xc9\xd7\x29\x9b\x34\x30\xb5\xb4\xbe\x77\xa5\
-\x3e\x90\xd5\x2f\x75\xd3\xc2\x3b\x52\x8a\x96\xee\x4e\x2d\xce\x95\
-\xe4\x75\x80\xe5\x3a\x03\x96\x96\x93\xd6\x2f\x91\x94\x35\x59\x32\
-\xf6\xae\xeb\xc5\x73\xc4\x28\x95\x70\x3a\x99\x83\xc9\xd9\xae\xd9\
-\xd4\x19\x61\x41\xc7\x30\x67\xd9\x61\xa9\xce\xde\x5d\x96\xf4\xaa\
-\x5c\x1f\x33\x51\xc2\x27\x27\xa9\x52\x94\x33\x90\xab\x36\x4c\xb8\
-\x35\x50\xb6\x66\x35\x1d\x5c\x8a\x43\xa2\x78\x25\x45\x5e\x76\x61\
-\x52\x82\xf4\x0a\x8a\x54\x25\xea\x39\xc0\x44\x0a\xe5\x50\x9e\xa7\
-\x5e\x6a\x05\x98\x48\x98\xb3\x6e\x04\x30\xf1\x77\xed\x00\x4d\xab\
-\x7d\x92\x66\xaa\x64\x52\x66\x7b\x24\xe7\xbc\x8c\xe5\x14\x6d\x84\
-\xb6\x05\x6e\x13\x80\x56\x59\x6d\xb9\xd5\x54\x89\xe7\xad\x0e\x9f\
-\xf0\x49\x53\xc4\x67\xd8\x28\x35\x5b\x92\x4a\x8a\xf8\x5c\x4e\x16\
-\x6c\xf5\xbe\x37\xda\x5c\x07\x65\x26\x69\x6f\x36\x47\x0c\x92\x6e\
-\x81\x81\x12\x3e\xc3\x29\xa9\x0f\x2f\x56\xa5\x77\x4a\x51\x16\x60\
-\x49\xe3\xf7\xc1\x6d\x2a\x1e\xa7\xe2\xbe\xb3\x54\x97\xe4\x5a\x5a\
-\xff\x36\x25\x6c\x5a\x18\x92\xb2\x61\x51\x76\xf2\x86\xa5\xfb\x92\
-\x37\xe7\x34\x82\x32\x01\x9e\xb2\xce\x70\x02\x12\xa7\x6d\x0d\xd2\
-\xcb\xf2\x05\x12\x73\xe9\x74\xe9\x16\x1e\x8c\x1d\x7e\x20\xca\x74\
-\x3f\x94\xe9\x46\xaa\x3c\x07\x98\x96\x91\x34\xd5\x80\x6d\xa4\x28\
-\xba\x9b\x5f\xa8\x9a\xe6\x2c\x60\x6c\x9c\x6a\xbb\x53\xf0\x84\x5b\
-\x03\xa4\xbb\xc3\x51\xa6\x5b\xc0\xa4\xc3\x15\x38\x9d\x0a\x54\x3d\
-\x38\xbe\x13\x80\x39\x17\x98\x01\xf2\xd4\x6f\xce\x07\xcc\x9b\xf1\
-\x1d\xfc\x55\x6a\x66\x22\xb6\xc0\xc5\xb1\x98\x9c\xfd\x9c\x80\xe3\
-\x85\xdb\x58\x6a\x1b\xc0\xe4\x99\x36\x0e\x33\x65\xe2\x31\x3e\x57\
-\xf5\x6c\x63\xdd\xdc\x81\x49\x38\xc6\x98\x8e\x9c\x9c\x2c\x01\xa3\
-\xc6\x89\x87\xba\x22\x27\x67\x53\x37\xe1\xcc\xf5\x73\x87\x64\xa3\
-\x8d\x66\x06\x63\x9c\x25\x0e\x36\x5e\x3e\x80\xb7\xb7\x0c\x8a\x1b\
-\x27\x93\x16\xdd\x2e\xce\x92\x02\xb1\x15\xe1\xc0\x86\x44\x99\x52\
-\xb4\x14\x90\x44\xc2\xb4\x6e\x8b\xb3\x00\xcb\x9c\xaf\x52\x37\x2d\
-\x7a\x3a\xa5\x74\xb1\xee\xf4\xd1\xd2\xfa\x77\x29\x65\xcd\xc2\xa0\
-\xc4\xb5\x8b\x97\x24\xad\x5b\xb2\x3b\x75\x73\xb6\x24\xae\x5f\xd8\
-\x08\xcc\x78\x78\xf2\x9a\xf9\x12\xbf\x7a\x9e\x24\xae\x9e\x2f\xa9\
-\xeb\x16\x4b\x52\xd6\x5d\x12\xe2\x4a\x92\x8e\x7e\x7e\xd2\x86\x10\
-\x50\xb0\xc4\x4e\x8e\xb4\x69\x24\x4e\x03\x96\x46\xd2\xc4\x73\x30\
-\xe1\xc5\xf6\x40\x5e\x25\xb2\x1d\xcc\x74\xd7\x35\x30\x4c\x3c\x63\
-\x87\xab\x33\x58\x08\x1f\x0e\xd2\xe6\x95\x13\x55\x07\x90\xd9\x59\
-\xa4\x3a\x8c\x08\x55\x05\x4b\xbc\x6e\x02\x33\x82\xc0\x84\x79\x85\
-\xc5\x01\x58\x06\x97\xdd\x08\x23\x1a\xf7\x09\xea\xa7\x50\x92\x1f\
-\x06\x28\xd9\x43\x7e\xe8\x58\x85\xea\x2d\xe7\x78\xcc\x8b\xdc\x80\
-\xa9\xfe\x0e\xc0\x22\x34\x09\xb5\x01\xb1\xc3\x54\x0f\xb7\x4a\x87\
-\x04\x66\xa3\x59\x8e\x1b\x29\x53\x9d\xca\x48\xe0\xf3\x5c\x73\x00\
-\x53\x5d\x15\x92\x60\x9d\x9c\x28\x81\x23\xc7\xab\x89\x44\x58\xd2\
-\xb3\x53\xa9\x13\x52\xb9\x71\xa1\x34\x7c\x0e\x3e\x4b\x41\x9d\xe5\
-\xb6\xf9\x99\xc6\xe7\x73\x9d\x8d\x6d\xa5\x3a\xb9\x3c\x51\x7e\x0f\
-\x19\x22\x23\x6f\xb9\x42\x9c\xeb\x73\xc4\x51\x92\x0f\x50\x2e\x95\
-\xe4\xcd\x34\x13\xe5\x52\x94\xe0\xb8\x8f\x5b\x47\x49\xb6\xa4\x97\
-\xe5\x7e\x69\x2b\x5e\xfa\x94\xbd\x24\x4b\x4f\xef\xa6\xa5\xf5\xef\
-\x56\xc2\xba\x85\x01\x48\x96\x73\x13\xd6\xce\x7b\x25\x69\xfd\xa2\
-\xf2\xe4\x4d\xd9\x32\x19\xe5\xf9\xe4\x75\xf3\x01\xcc\x79\x32\x05\
-\xb0\x54\x06\x3c\x53\x56\x2f\x94\xb4\xd5\x4b\x24\xee\xfe\x9b\x64\
-\xe0\xe4\x09\x2a\x69\x5a\xe9\xa9\x65\xda\x64\x67\x90\x61\xa6\x26\
-\x00\x89\xd0\x34\xcd\x99\xc4\xdb\xc1\x2c\xdd\xbb\xfa\x87\x8a\x47\
-\xe4\x50\xf1\x1d\x39\x41\x42\x78\x61\x2f\x82\x89\x33\xf2\x10\x8e\
-\x80\xa8\x05\x4a\x77\xab\x0b\x88\x25\x3b\xa5\x7f\xcc\x50\xb5\x3c\
-\x2e\xbf\x39\x30\x03\x15\x30\x0f\x01\x98\x87\x00\xcc\x83\x00\x26\
-\xc7\x63\x56\x9d\xaa\x93\x59\x37\x18\xc0\xe4\x95\x19\xf9\x5e\x2b\
-\xe5\x11\x70\xfd\xa3\x87\x02\x8c\x46\xc7\x4c\x4b\x5b\x25\x36\xa1\
-\xc9\xfb\x51\xf1\x49\x12\x3c\x76\xa2\x9a\xd2\xad\x97\x39\x2c\x8a\
-\x49\x91\xdb\xc3\xb8\xc6\x39\xdb\x27\xad\x4b\x60\x34\x7d\x8e\x3b\
-\x30\xad\x12\x9c\xdb\xa3\x8d\xe7\x20\xe9\x1e\x1e\xa1\x92\x7c\xca\
-\x03\x8b\x90\x1a\x0b\x55\xaa\xe4\x08\x86\x54\x00\xd3\x28\xc3\x69\
-\x00\xb3\x08\x20\x2d\xcd\xfb\x32\x75\x63\xd6\x7b\xf6\xa2\xac\x32\
-\x5b\x69\x56\xb2\xf9\x73\x6a\x69\x69\xfd\xbb\x35\x69\xc3\xbc\xbe\
-\xc9\xeb\x16\x4e\x9a\xb2\x6e\xfe\x82\x29\x6b\x17\x7f\xc4\x12\x3d\
-\x6e\xfd\x22\x99\xcc\x12\x7d\xcd\x42\x24\x4c\x24\xcf\x35\xbc\x4f\
-\x70\xce\x93\xe4\xf5\x0b\x24\x75\xf5\x22\x19\x73\xfb\xb5\x32\x60\
-\xec\x28\xc0\x67\x90\xd1\xc6\x89\x9d\x9f\x6d\x9c\x1c\x72\xd4\x12\
-\x98\xee\x56\xc9\xca\x04\x07\x67\x17\x57\xc9\x0a\x10\xeb\x08\xe0\
-\xf6\x08\x8a\x50\xd7\xda\x0e\x18\x3b\x49\x25\xb9\x98\x54\xa7\xc4\
-\xda\xd2\x24\x86\xed\x97\x70\x2c\x3c\x04\x25\x79\x28\x4a\xe7\x2e\
-\xfe\xc1\x80\xb6\xb1\xcc\x96\xc0\xfc\xd9\x4b\x46\xc2\xfc\x87\xc0\
-\x84\xd9\xb3\xce\x5e\x73\x26\xc3\xc0\x31\x13\x65\x08\x60\x3c\x38\
-\x09\x29\x16\xe0\x8e\x05\xb4\x39\xef\x65\x24\x00\x19\x3a\x21\x5e\
-\x7c\x86\x8f\x51\xb3\x15\xb1\xf7\x5c\x7d\x16\xfe\x4e\x9d\x6f\x0e\
-\x30\x36\x42\x11\x6e\xba\x00\x9b\xf1\x58\x41\x12\x60\x54\xaf\xe3\
-\xbb\x73\xdc\x27\x1f\xb7\x05\x28\xbb\x86\x85\x49\xe4\x45\xe9\x92\
-\xb4\x6c\x8e\x38\x8a\xf3\x24\x15\xdb\x9f\x90\x24\x2c\x6d\xb8\x6f\
-\x43\xfa\x67\xb2\x4c\x2d\xca\x06\x28\x0b\x98\x3a\x4f\xda\x8a\x96\
-\xee\xb0\x15\x2d\xce\x4c\x28\x59\x14\x61\xfe\x8c\x5a\x5a\x5a\xff\
-\x49\xb1\xf7\x7c\xf2\xba\x05\x77\x4e\x5e\xb3\xf0\x45\x80\xf2\x00\
-\xd3\x66\xfc\xda\x45\x0a\x9a\x84\xa5\x01\x4c\xe3\x96\xa5\xbb\x6d\
-\x7d\x96\xd8\x1f\x5e\x22\xa3\x6e\xbf\x5a\x3c\xc6\x8d\x96\xb6\xaa\
-\xa3\x82\x1d\x1a\x16\x2c\x5b\xda\x84\x27\xdb\x40\x07\x01\x34\xbc\
-\x78\x99\x09\x1b\x55\xb6\xc3\xec\xbd\x6e\x3f\xc0\x07\xa5\x3b\x92\
-\x9a\x6f\xa0\xf4\x0c\x89\x94\x01\x83\x47\x4a\xc0\x98\x49\x12\x86\
-\xb2\x97\x33\x09\xf9\x8e\xe0\x90\x9c\x60\xd5\x39\xd2\x08\x4a\x37\
-\x60\xb2\xcc\xfd\x19\x13\x66\x4d\x85\x1c\x84\x0f\x54\x97\xab\xb4\
-\xc9\x53\x25\x67\x03\x98\xec\xbc\xe2\xe5\x22\x9a\xb5\x7d\x62\xdd\
-\xf8\xf9\x9d\xfd\x82\xc5\x33\x7a\x38\x3e\x63\xac\x78\x0f\x1b\x09\
-\x78\x0f\x95\xde\xa1\x11\x78\x9e\xc3\xa7\xd8\xa4\x60\xac\x9b\x7a\
-\xaf\x02\x21\xfe\x96\xb7\x1c\xee\x64\x82\xb1\x35\x5b\xb0\x54\xf7\
-\xf1\x1d\x3b\x78\x0c\x92\x2e\x01\x41\x12\x92\xe9\x90\x29\x05\x00\
-\xa5\xd9\x4e\x99\xba\x11\x70\xa4\x15\x2c\x8d\xf2\x9b\x26\x48\x9d\
-\x25\xf9\xa7\x53\x37\x2e\x7d\x1b\x20\xdd\x60\xdf\x9c\x35\xc9\xfc\
-\xd9\xb4\xb4\xb4\xfe\xbf\x34\xa1\xe4\xfe\x9e\x71\xeb\x17\x4e\x98\
-\xbc\x76\xd1\x5d\x71\x6b\x16\xfe\x3a\x61\xed\xa2\xbd\x49\xd8\x81\
-\x93\x00\xce\x44\x73\xd8\x91\x61\xde\x5f\x84\xe7\x17\x23\x09\x21\
-\x05\xb1\x47\xfd\xee\xeb\xc5\x27\x7e\xa2\x74\xf2\x0f\x94\x76\x9e\
-\x3c\x9b\x86\x60\x3c\x0f\x30\xbd\x59\xca\x1b\x57\x7b\x24\x4c\x08\
-\xa0\xd6\xdc\x1e\xaf\xb3\xbd\x51\x4d\x3e\xc1\x52\x1f\x90\xec\x00\
-\x60\xa9\x34\xcb\xb3\x7f\x1a\x7b\xeb\x5b\x00\xf3\xa5\x17\x00\xcc\
-\x2a\x00\xb3\x0a\xc0\xac\x68\x01\x4c\xac\x0b\x80\xc9\xe1\x47\xea\
-\xc2\x68\x58\x2f\xeb\xef\xb9\x8e\x9c\x59\x88\x3d\xed\x9d\xf8\x39\
-\x00\x64\x67\xb8\x13\x60\x49\x77\xb6\x6c\xc2\xaf\x75\x60\xf2\x39\
-\x96\xe8\x96\xf1\x1c\xbf\xa3\xa7\xb7\xb4\xf3\xf2\x96\x5e\x43\x62\
-\x24\xea\xb2\xe9\x92\x58\x30\x57\x1c\x9b\x0b\x90\x1c\xf3\x24\x05\
-\x80\xb4\xdc\x0c\x98\x28\xbf\x5d\x65\x85\x92\x56\x94\x5f\x0b\x50\
-\x16\xd9\x8b\x73\x9c\x49\x1b\xb2\x82\xcd\x9f\x4b\x4b\x4b\xeb\x87\
-\xa0\xb4\xcd\x59\xdd\xa6\x3c\x34\x6f\x6c\xe2\x9a\x05\xb7\x27\xae\
-\x59\xb8\xd3\xb1\x39\x57\x12\x37\x2c\x91\x84\x75\x80\xa4\xf2\x62\
-\x49\x40\xd9\x9e\x88\x5b\x3a\x69\xdd\x12\xb1\x6f\xcc\x11\xc7\x86\
-\x5c\x89\x5f\x72\x97\x84\xa6\xdb\x55\x9b\x5c\xfb\xfe\xde\xd2\x51\
-\xc1\x93\xa5\xb3\xd1\x2b\xcd\xc1\xe7\x6a\x00\x3a\x80\x68\x41\x46\
-\x3d\x6f\xda\x00\x2b\x4c\x48\x9a\xb7\xc6\xc4\x17\xbc\xe5\xeb\x5c\
-\x46\x8b\x84\x68\x59\x01\x33\x50\x7e\xfe\x9b\x97\x50\x92\x1f\x6d\
-\x15\x98\x1d\x07\x00\x8a\x1c\x07\x49\x60\x72\x1d\xf8\x37\xa6\x55\
-\x73\x01\x3e\x4f\x95\xcd\xb8\xdf\x68\xa6\x59\xb5\xbe\xcd\xd7\xbb\
-\x25\x30\x59\x7e\xb3\xd3\x49\x0d\x40\x07\x98\x3b\xf5\x07\xe0\x3d\
-\x91\xa6\x91\x50\x3d\x27\x8d\x97\xe1\xb7\x5d\x23\x29\x48\xe5\xf6\
-\x62\x80\x12\xdb\x94\x1d\x3a\x49\x28\xb9\x93\x69\x40\x92\x4e\xd9\
-\x68\x94\xe3\xae\xb2\x02\x71\x96\x15\x1c\xb7\x15\xe7\xbc\x99\xba\
-\x29\xf7\x41\x47\x49\xde\x28\xf3\xe7\xd1\xd2\xd2\xfa\x21\x6a\xc2\
-\xf2\xfb\x7b\x26\xad\x5d\x78\x55\xd2\xfa\x85\xcf\x26\xac\x59\xb0\
-\xcb\x86\x34\x94\xb4\x1e\x3b\x39\x00\x99\x08\x27\x10\x98\xeb\x09\
-\xcc\xc5\x92\x82\xc7\xc9\x1b\xb2\x54\xe2\x74\x02\x9e\x49\xcb\xe7\
-\xc9\xf0\x1b\x2e\x95\x81\x13\x46\x4b\x17\x7f\x40\xca\xd3\x4b\x3a\
-\xf6\x1f\x04\x90\xb8\x27\xb4\xe6\x56\x53\xca\x35\x4b\xa5\x86\x9b\
-\xbf\x4e\xe3\xb1\x05\x4c\xc2\xd4\x04\xa6\x01\xe2\x00\x13\x98\xd5\
-\x26\x30\xd9\x53\x5e\xe5\x06\x4c\x40\x0c\xc0\x6c\x84\xdd\x85\x58\
-\x81\xf4\x5b\x1e\x9b\xcf\x29\xe0\x9b\x69\xb2\x3d\xbe\x67\xcf\xc8\
-\x68\x55\x76\x8f\x5f\x74\x87\xa4\xae\x67\x7b\x24\x20\x89\x04\x99\
-\x0c\x28\x26\x6f\xcc\x92\xa4\x4d\x59\x92\x88\x24\x69\x01\x33\x85\
-\xdb\xae\xa4\x50\x9c\x45\x79\x75\xa9\x9b\xb2\xfe\xe0\x28\xce\x59\
-\x89\x6d\x6e\xcb\x2c\xcb\xf5\x33\x7f\x12\x2d\x2d\xad\x1f\xb2\xec\
-\xab\xef\xe8\x9c\xbc\x29\x6b\x54\xe2\xfa\x25\xd7\x01\x94\x3f\x4f\
-\x58\xb7\xf0\x93\xd4\x4d\x79\x00\x26\x76\x76\x82\xd3\x1d\x98\x1c\
-\xf0\xbe\x3e\x0b\x5e\x0c\x20\x2c\x01\x20\x96\x00\x14\x8b\x64\x72\
-\xf6\x1d\x12\x75\x69\xba\x0c\x18\x39\x54\xba\xfa\x06\x48\x7b\xcf\
-\x41\xca\x6c\xcf\x73\x87\xce\x85\x00\xd3\x3a\x25\x93\x89\xb3\x59\
-\xba\x54\xc0\xc4\x7b\xf0\xda\xcf\x14\x30\x6b\x9a\x01\xb3\x92\xb3\
-\x15\x9d\x0f\x98\x04\xa0\x65\xeb\x39\x37\xbb\xb7\x41\x36\x9a\x70\
-\x36\x93\x25\x4b\xee\x8e\x3c\x95\x94\x07\x84\x80\x20\xf1\x99\x12\
-\x27\xa3\xee\x40\x9a\x7c\x60\x01\x0e\x20\xb9\x0a\x84\x49\x48\xe8\
-\xdc\x3e\x3c\xa8\x10\x96\x06\x30\x97\x2a\x60\x26\x6e\xce\x91\x14\
-\x94\xde\xa9\x45\xb9\x35\xa9\x1b\xb3\x5e\xc3\x6d\x01\x4a\xf3\x94\
-\x8c\x92\xe5\xde\xe6\xcf\xa0\xa5\xa5\xf5\x63\xd2\xc8\xcd\x37\x76\
-\x4c\xda\x90\x33\x5c\x25\xce\x75\x59\x4f\x26\xae\x5d\xf2\x91\x1d\
-\xa9\x28\x69\x83\x51\xa6\x5b\xc0\x34\xa0\x00\x60\x6e\xe0\xf9\xe9\
-\x0b\xd4\x6d\xca\xc6\xc5\x80\x27\xd2\xe7\x9a\x45\x32\x25\xeb\x2e\
-\x19\x72\xe5\x4c\x19\x80\xe4\xd9\x29\x30\x40\xda\x21\x79\xb6\xf7\
-\x18\x04\x90\x19\x13\xee\x1a\x65\x31\xe1\x68\x95\xe7\x1c\xa7\x68\
-\x3e\xcf\x34\x69\xb6\x0d\x72\x28\x93\x65\x05\x4b\x65\xbc\xcf\x37\
-\x50\x9e\x7a\xf9\x37\x72\xb0\xba\x5a\xf6\xd7\x54\xca\x3e\x94\xe4\
-\x07\x50\x92\x97\x9f\x44\xc2\xbc\xf1\x66\x75\x4a\x62\x33\x60\x7e\
-\x0b\x28\x5b\x9a\x25\xb7\x2a\xbb\x99\x22\xd9\x39\xd5\x9f\x49\xd2\
-\x47\xf5\x74\xb3\xfd\x76\xe8\x0d\x97\x49\x02\xdb\x26\x91\xc4\xed\
-\x45\xb9\x92\x84\x24\x99\x80\x6d\x91\x84\xef\x9f\xbc\x09\xdb\x05\
-\x90\x4c\x01\x30\xe9\xe4\x0d\x48\xea\x78\x3d\x95\x63\x2d\x37\xe7\
-\x54\x21\x75\xfe\x36\xa5\x28\x27\x3b\x61\x43\x6e\x62\x62\x71\xbe\
-\x97\xb9\xd9\xb5\xb4\xb4\x7e\xcc\x9a\xf5\xe4\xac\xf6\x09\x1b\x17\
-\x0d\x4d\x5a\xbd\xf0\xb2\x84\x35\x0b\x1f\x4f\x58\xbb\xe0\x83\x94\
-\xf5\x4b\xbf\x49\x59\x87\xd2\x12\xa9\xb3\x09\x98\x8b\x14\x2c\x93\
-\x39\xb9\x87\xba\x0f\xa8\xc2\xa9\x84\x27\x87\xcd\x00\xb0\x53\xf2\
-\xee\x91\xe1\xb7\x5c\x2e\x01\xf6\x44\xe9\x1d\x1b\x23\x1d\x7d\xfd\
-\xa4\x6d\x7f\x2f\x40\x74\xa0\x1a\xd3\x48\x80\x1a\x29\xd3\x6a\xbb\
-\x04\xe4\xac\xf3\xaf\xdd\x60\x69\x59\x9d\x56\xe8\x1b\x24\x4f\xb6\
-\x02\xcc\x23\x27\x6b\xe4\xa2\x9b\x6e\x51\x6d\x97\x8d\xc0\xbc\x50\
-\x58\x5a\x65\xb6\x07\xd6\x6b\x80\xb7\x74\x0d\x08\x11\x8f\x91\x23\
-\x24\x64\x56\xba\x8c\xba\xf7\x46\x49\x5a\x31\x1f\x65\x74\xbe\xd8\
-\x8b\xf3\x54\x6a\x4c\x42\xba\x26\x14\x93\x98\x22\xb9\x2d\x00\x4b\
-\x35\x8e\x12\xaf\xb1\x8d\x32\x05\x65\xb9\xab\x74\x99\xd8\x37\xe5\
-\x94\x27\x6f\x5a\xfa\x72\xc2\xa6\xec\x45\xc9\xeb\xb3\xe3\xd3\x36\
-\x67\x79\x9a\x9b\x59\x4b\x4b\xeb\xbf\x4a\xd2\xa6\x2d\xa0\x10\x9b\
-\xb4\x66\xe1\xec\xa4\x75\x0b\x77\xa0\x34\x7f\xdf\xb6\x31\xe7\xef\
-\xec\xe1\x55\xa9\xd3\x02\x24\x4a\xf2\x14\xa6\x4c\x3e\xe6\xfd\x75\
-\x26\x44\x69\xc0\x93\x13\x80\xd8\x59\xc6\xa3\x7c\x9d\xb4\xf8\x76\
-\x19\x7a\xfd\x6c\x09\x70\x26\x4b\xdf\x91\xc3\xa5\x6b\x50\x88\x02\
-\x27\xcb\xf7\x76\x2c\xe3\x39\xde\x53\xf5\x70\x03\x96\x84\x27\x60\
-\xa7\x3a\x68\x00\x4b\xda\x02\xe6\x53\xaf\xfc\x46\x0e\x55\x1f\x55\
-\xe5\x78\x23\x30\x4f\x1c\x93\x8b\x6e\xbc\x15\x7f\x6f\x74\xfa\x28\
-\x10\x2a\x58\x72\x70\x39\xac\x96\xc5\x65\x73\x6c\x25\xcb\x6b\x00\
-\x12\x9f\xd9\x61\x20\x12\x64\x68\xa8\x78\x8e\x1b\x2d\xa1\x33\x1c\
-\x32\xfa\xce\xab\x25\xb1\xe0\x5e\xb1\x23\x21\xda\x8a\x73\x24\xb9\
-\x38\x5b\x0d\x28\xe7\x24\x26\x29\x38\x58\xb0\xf4\xa6\x53\x98\x26\
-\x01\x48\x75\x4a\x23\xcc\xb3\x75\x6c\xc5\xb9\x92\x56\xb6\x8c\x9d\
-\x3a\x87\x52\x37\x2e\x7d\x29\x65\x63\xee\x9c\xc4\x0d\xd9\x71\xae\
-\x0d\x85\x7d\xcd\xad\xaa\xa5\xa5\xf5\xdf\xae\xc4\x8d\x59\xd1\x49\
-\x6b\xb3\x67\x24\xad\x5d\xba\x25\x69\xfd\xe2\xd7\x13\xd7\x65\xfd\
-\x39\x65\x73\xce\xd9\x54\x40\x83\xc0\x4c\x05\x1c\x09\x4b\x4e\xf2\
-\x91\xb4\x16\x65\xfa\x5a\xdc\xf2\xbe\xf9\x98\x43\x95\x38\x74\x89\
-\xc0\xb1\x01\x44\xf6\xf5\x80\xcb\xc3\x59\x92\x98\x37\x47\xc6\xdd\
-\x77\x93\x0c\xb9\xfa\x22\x09\x4b\xb7\xcb\xa0\x89\xe3\xa5\xcf\xe0\
-\x21\xd2\x3d\x38\x42\x3a\x03\x8c\x1c\x02\xd4\xa1\x3f\xa7\x3f\x33\
-\xdc\xd6\x13\xa0\x43\x82\x7c\xe6\xd5\xdf\x49\x55\xdd\x31\xa9\xa8\
-\xab\x91\xf2\xda\x6a\xa9\xac\x3f\x26\xd5\x67\x4e\xc8\xec\xeb\x6e\
-\x96\x0e\x7d\xbd\xa5\x6d\x1f\x02\xd8\x47\xda\x01\xc0\x84\x70\x3b\
-\x00\xb2\x9d\xb7\xaf\x74\x0e\x0c\x92\x5e\x51\x11\xe2\x39\x66\x98\
-\xf8\x3b\x13\x25\xea\xda\x8b\x64\xf4\xbc\x9b\x25\x61\xf9\x1c\x71\
-\x6c\xc8\x16\x27\x12\xa4\xbd\x98\x13\x5e\x30\x35\xa2\xd4\xc6\x77\
-\xa2\x99\x9e\xd5\xf7\x44\x6a\xe6\xc4\x25\x1c\x51\xc0\x84\x99\xba\
-\x29\x47\x52\x8b\x72\xc4\x5e\x52\x20\x69\xc5\x00\xe5\x86\xec\xfd\
-\xa9\x1b\x73\x9e\x4f\xd9\x98\xf3\x13\xa4\xcc\x89\xf6\x1d\x59\xbd\
-\xcc\x4d\xa8\xa5\xa5\xf5\xbf\x26\xa4\xc5\x48\xc0\x73\x4c\xe2\x9a\
-\x45\x53\x93\xd7\x2f\xda\x94\xbc\x61\xc1\xdb\xf6\x0d\x59\xa7\xd9\
-\xd6\xc9\x04\xa6\xe0\xb8\x7a\xbe\xe1\x35\xd6\x98\xce\x26\x23\xad\
-\x2a\x27\xf3\x96\x49\x94\xa9\x94\x29\x14\x25\xae\x83\x20\x5d\x03\
-\x10\x3d\x88\xd7\xf2\xe7\xc8\xe4\x45\x77\xca\xb8\x3b\xaf\x93\x91\
-\xd7\x5f\x26\x83\x2f\x9f\x21\xe1\x17\x65\x48\xd0\x74\x3b\xec\x94\
-\xc5\x3f\x2d\x92\xa2\xd7\x7e\x29\x9b\xe0\x8d\xf4\xef\x9f\x93\xa2\
-\x37\x5f\x10\xfb\x3d\x37\x8b\x5f\xca\x64\xf1\xb5\x4f\x91\xc0\x69\
-\x36\x09\xbb\x24\x5d\x06\x5f\x3b\x4b\x46\xde\x7e\xa5\x8c\x9d\x77\
-\xa3\x4c\xca\xbd\x4b\x12\x1e\x98\xa3\xe0\xce\x71\x90\xf6\xe2\xa5\
-\x80\x1e\x92\xa3\x4a\xcb\x5c\x1f\x9a\xed\xb2\x58\x57\x13\xf8\x6a\
-\x6a\x3c\x02\x13\xb0\x6c\x04\x26\x0e\x14\x1c\x51\xe0\x2a\x59\xce\
-\x71\x95\x9f\xa5\x6c\xc8\x7e\x27\x75\x73\xce\x2f\x53\x37\xe5\xde\
-\x91\xb4\x76\xf1\xf8\xf8\x75\x59\x3d\xcc\x4d\xa6\xa5\xa5\xa5\xd5\
-\xa6\x0d\x07\x58\xdb\x36\x2d\x76\xa5\x6e\x5c\xb4\x2e\x75\xc3\xa2\
-\xdf\x01\x92\xef\x25\x6d\x5c\xd2\x90\xc4\x5e\x61\xc0\x93\x03\xdf\
-\x39\x00\x9e\xb3\x22\x25\xac\x05\x40\x95\x2d\x70\xce\x47\x0a\x9d\
-\x87\xf2\x9d\x13\x7f\xcc\x97\x14\xbc\x96\x0a\x27\xe3\x7e\x22\x9e\
-\xe7\x7b\x09\x2d\x26\x57\x95\x5e\x01\x32\xdb\x46\x40\xcb\x74\xc2\
-\xea\xfb\x65\xf2\x83\xf7\xc9\xe4\x87\x0c\xc7\x3f\x7c\xbf\x72\x22\
-\x97\xc5\x89\x92\x37\xb1\x07\x9f\xcd\x01\x86\x93\x37\x02\x7e\x1b\
-\x01\x42\xdc\x26\x6e\xc0\x67\xac\x9f\x8f\xb2\xda\x00\x63\x0a\x4f\
-\x05\x35\x9d\x62\x3e\x67\x98\x89\xd8\x18\x1d\x40\x50\xda\x90\x28\
-\x79\x2a\xa3\x93\x63\x2c\xd7\x2d\xf9\x5b\xea\x86\x9c\xb7\x91\x30\
-\x9f\x46\xe9\x7d\x03\xcb\x6e\x76\x98\x71\x7c\xab\xb9\x79\xb4\xb4\
-\xb4\xb4\xce\x55\xd2\x86\x79\xc1\xc9\x9b\x16\x8c\x4a\x58\x37\xcf\
-\x89\x84\xb9\x0a\x40\x7c\x35\xe1\xa1\xf9\xef\x25\xae\x59\x5c\xc3\
-\xb1\x87\xec\x20\x49\x00\x8c\x12\xd6\xce\x55\x4e\x5c\x37\x0f\x49\
-\xd4\x30\xa1\x99\x0a\x78\xa6\xae\x01\x3c\xe1\x24\xbc\x96\xc8\xf7\
-\xc0\xd6\xeb\x49\xe6\xdf\xb9\xff\x8d\xf1\x3c\xde\xcb\xf7\x73\x79\
-\x04\x20\xdc\xb8\x7c\xf3\x71\xa3\xf9\x9c\x72\xd3\x73\x0a\x9a\x70\
-\x32\x00\xaa\x60\x69\xbd\x86\xc7\x34\x93\x25\xcf\xca\x71\x6c\xca\
-\x03\x2c\x73\xbe\x49\x5c\xbf\xe0\x43\xc0\xf3\xad\xd4\x0d\x59\x4f\
-\xa2\xec\xbe\x92\x25\x77\xca\xba\xac\x61\xb3\x9e\xcc\xea\x64\x6e\
-\x0a\x2d\x2d\x2d\xad\x0b\x57\xdc\xfa\x5c\xbf\x84\x0d\x8b\x47\x26\
-\xac\x5f\x98\x9a\xb0\x6e\x71\x5e\xc2\x9a\x85\xaf\x4c\x59\xb3\xe8\
-\xad\x29\xab\xe7\xbd\x03\xf0\x95\xdb\x54\x07\x09\x87\x26\xb1\x34\
-\x07\xc0\x38\xd9\x87\xe9\x14\x33\x75\x26\xad\x9d\x83\xdb\x39\x06\
-\x20\xcd\xf7\xb8\x43\x56\x81\x72\x8d\x01\x50\x77\x38\x36\xc2\x13\
-\xe0\x63\x52\xb5\x9e\xa7\xf9\x58\x3d\xc7\xf7\xac\xe7\x7b\x8c\xf7\
-\x36\xbe\x1f\xc0\x54\x65\x37\x2f\x0b\xc1\x4e\xaa\x8d\x4b\xbe\x4a\
-\x5e\xbb\xf8\xfd\x94\xf5\x0b\x77\x02\x92\x6f\xda\xd6\x2f\x79\xd4\
-\xbe\x21\xeb\x62\x24\xea\xf1\xf6\xf5\x59\x43\x38\x92\xc0\xfc\xca\
-\x5a\x5a\x5a\x5a\xff\xba\xe2\xd7\x65\x0d\x9c\xfc\xf0\xbc\xd1\x53\
-\x1e\x5a\x3c\x36\x61\xcd\xdc\x44\x80\x70\x7e\xc2\xba\xfb\x5f\x8c\
-\x5f\x3b\xe7\xed\x29\x6b\xe6\xec\x4c\x7a\x78\xce\xdb\xb6\xd5\x0b\
-\xf6\x3a\x90\x42\xed\x1b\x38\x00\x9e\xe5\x2f\x4a\x70\x80\x90\x69\
-\x53\x01\x74\x35\x80\xf6\xd0\x5c\x75\xcb\xc7\xd6\x73\xc9\xe6\x73\
-\xc9\x7c\x0e\x25\x7e\x32\xcb\x7d\x05\x57\xbc\xce\xc7\xeb\x38\xab\
-\xbc\x01\xc9\x26\xe3\x6f\x90\x40\x09\x65\x96\xe1\x2c\xf1\xed\xec\
-\xd9\xde\xb0\xe4\x24\x5e\x7f\x0f\x65\xf8\x9b\x48\x99\x6f\x25\xad\
-\x5f\xf4\x7a\xf2\xfa\xc5\xa5\x48\x98\xd3\x53\xd6\x65\x8f\x4d\xde\
-\x90\x35\xce\x56\x94\xa3\xaf\x11\xae\xa5\xa5\xf5\x9f\xd3\xb8\xe2\
-\xac\x7e\xf1\x6b\xef\x1f\x95\xf4\xd0\x7d\xe3\x53\x1e\xba\x77\x6c\
-\xc2\xba\xb9\x93\x91\x2c\x6f\x4f\x7e\x78\xfe\x2f\x53\x57\xcf\x7f\
-\x3b\x65\xf5\xfc\x9d\x74\xd2\xc3\xf7\xbf\x95\xf8\xf0\xbc\x8f\x1d\
-\x00\xa8\x1d\x65\xb1\x1d\xc9\xcf\xb2\x6a\xcf\x64\xfb\x26\x9c\x42\
-\x28\x32\x35\xe2\x3e\x6f\x51\x32\xab\xd7\x6d\x6e\xed\x9e\x56\xdb\
-\xa7\x9d\x1d\x3b\x6b\xe7\x55\x27\xae\xb9\xff\x5d\x80\xf3\xcd\xc4\
-\x75\x73\x77\x26\x12\x8e\xeb\x16\xbc\x86\xd2\x7c\x35\xd2\x6a\x5a\
-\xe2\xc6\x05\x63\x00\xcd\x71\x29\xeb\x16\x8f\x45\x09\xae\xa7\x55\
-\xd3\xd2\xd2\xfa\x61\x89\x9d\x24\x89\x0f\x2e\x18\x91\xf4\xd0\xbc\
-\xf1\xc9\xab\x17\x8c\xa3\x53\x57\x2f\x9c\x90\xf2\xf0\xbc\xab\x52\
-\x1e\x9e\xff\x24\x6e\xdf\xb2\x40\xea\xee\xe4\xd5\x73\x1a\x9d\x80\
-\xc7\xee\x4e\x5c\xb3\x60\x27\x12\x66\x93\xd7\xce\x7f\x1b\x7e\x19\
-\x65\x78\x76\xe2\xda\x39\x29\x89\x1b\xe7\x00\x8c\x73\xc6\x11\x8e\
-\xa9\x80\xa4\x6d\xe3\xdc\x40\x73\x75\xb4\xb4\xb4\xb4\x7e\x7c\x62\
-\x1b\xa1\xfd\xe1\xf9\x43\x2c\x88\x9e\x6b\x00\x4f\xb9\xc5\xf3\x80\
-\x60\x4b\x23\x3d\x8e\x4f\x5a\x3f\x6f\x74\xe2\xc3\xf3\xf5\xe9\x88\
-\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\
-\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\
-\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\
-\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\
-\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\
-\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\
-\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\
-\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\
-\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\
-\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\
-\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\
-\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\
-\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\x5a\
-\x5a\x5a\x5a\x5a\xff\xbf\x6a\xd3\xe6\xff\x00\xce\xa6\x82\x7f\xb5\
-\x1d\x36\x1d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x01\x00\xf8\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x06\x94\x00\x00\x01\x35\x08\x06\x00\x00\x00\xe9\xbe\x03\x68\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x32\xc0\x00\x00\x32\xc0\x01\x28\x64\
-\x5a\xdb\x00\x00\xff\xa5\x49\x44\x41\x54\x78\x5e\xec\xbd\x09\xb8\
-\x65\x47\x75\x9e\x4d\x62\xc7\xfe\xe3\xd8\xbf\xc9\x60\xe2\xd8\x89\
-\x87\xd8\x71\xe2\x98\x90\x38\xc6\x63\xf0\x00\x26\x60\x03\x36\xd8\
-\x20\x81\x93\x18\xdb\x09\xc1\x26\x38\x71\x6c\x47\x42\x03\x42\x6a\
-\xf5\xa4\xee\x56\xab\xe7\xb9\x5b\xdd\x42\x03\x6a\x8d\xa0\x11\x09\
-\x89\x6e\x49\x96\x5a\x52\x6b\xee\x41\x42\x03\x12\x92\x90\x11\x93\
-\xb0\xc1\x60\x81\xe1\xfe\xeb\x3d\xff\xfa\x3a\xa5\xad\x7d\xee\xd9\
-\xfb\x9c\xb3\xcf\xbd\x57\xf7\xfb\x9e\x67\x3d\x2d\xdd\x53\xbb\x76\
-\xd5\xaa\x55\xab\xd6\x50\x55\xfb\x45\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\
-\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\xc6\xbc\
-\xc0\xc9\x27\x9f\xfc\x2d\xf9\x9f\x86\x61\x18\x86\x61\x18\x86\x61\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\xc6\x7c\xc1\xca\x95\x2b\
-\xff\xee\xc6\x8d\x1b\x8f\x3a\xe3\x8c\x33\x36\xac\x58\xb1\xe2\xd2\
-\xd3\x4e\x3b\xed\xfa\xa0\x5b\x17\x2f\x5e\x7c\x70\xe1\xc2\x85\x8f\
-\x2e\x58\xb0\xe0\xe9\x93\x4f\x3e\xf9\x2f\x4f\x3a\xe9\xa4\xaf\x05\
-\x4d\xbd\xef\x7d\xef\x7b\x36\xfe\xf6\x85\x45\x8b\x16\xfd\xf9\xd2\
-\xa5\x4b\x1f\x0e\xba\x2f\x9e\xbb\x25\xea\xb9\x76\xd5\xaa\x55\x17\
-\xad\x5d\xbb\x76\xe5\xd6\xad\x5b\xdf\x30\x35\x35\xf5\xb7\xf2\x15\
-\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\x31\xff\xb0\x6e\xdd\xba\
-\xb7\x95\xb4\x61\xc3\x86\xb7\x9a\x86\xa3\x64\xa9\x61\x18\x73\x0c\
-\x5d\xe8\xc1\xac\x7a\x5e\xc2\xfc\x34\x0c\x63\xd2\xd8\xb4\x69\xd3\
-\xbf\x5e\xb3\x66\xcd\x9f\x2c\x5f\xbe\xfc\xe2\x05\x0b\x16\x3c\x7c\
-\xdc\x71\xc7\x4d\x1d\x7f\xfc\xf1\x53\x27\x9c\x70\xc2\xd4\x7b\xdf\
-\xfb\xde\xa9\x4c\x1a\x4d\x9d\x7c\xf2\xc9\x53\xa7\x9c\x72\x4a\x8f\
-\xa2\xdc\xd4\xa9\xa7\x9e\x3a\xb5\x70\xe1\xc2\xa9\x45\x8b\x16\x3d\
-\x87\xf8\x5b\x49\x94\xa3\x7c\x3c\xf7\x37\xa7\x9d\x76\xda\x03\xf1\
-\xae\xf3\xd7\xaf\x5f\xff\xbf\xb6\x6d\xdb\xf6\xa3\xd9\x04\xc3\x30\
-\x0c\xc3\x30\x0c\xc3\x30\x0c\xc3\x78\xe1\xe3\x98\x63\x8e\x99\x3a\
-\xf6\xd8\x63\xa7\x70\xbc\xeb\x9c\xee\xd2\xf1\x36\xd5\x93\xf8\x94\
-\x2c\x35\x0c\x63\x8e\xe1\xd4\x53\x4f\xbd\x5f\x7a\x90\x00\xe4\x89\
-\x27\x9e\x38\xb4\x1e\xb4\x3e\xf8\xbf\xfc\x7c\xcf\x7b\xde\xd3\xe3\
-\x27\xeb\x0a\xbc\x1c\x96\x9f\xcb\x96\x2d\x3b\x94\x55\x1b\x86\x61\
-\x1c\xc1\x86\x0d\x1b\x5e\xb6\x62\xc5\x8a\xb3\x43\x5f\x7f\xae\x4c\
-\x1e\xa1\x6b\xd0\x1f\x24\x81\x48\x0e\x2d\x5d\xba\x74\xea\xb4\xd3\
-\x4e\x9b\x5a\xbe\x7c\xf9\xd4\xe9\xa7\x9f\x3e\x75\xc6\x19\x67\x4c\
-\xad\x5a\xb5\x6a\x6a\xcd\x9a\x35\x53\x6b\xd7\xae\x7d\x0e\xad\x5b\
-\xb7\xae\x47\xd5\xbf\xaf\x5e\xbd\xba\xf7\x0c\xcf\x52\x07\x75\x51\
-\x27\x75\x87\x8e\xfa\x74\x3c\xf3\xfe\xed\xdb\xb7\xbf\x3c\x9b\x66\
-\x18\x86\x61\x18\x86\x61\x18\x86\x61\x18\x2f\x4c\x28\x88\x4a\x00\
-\x15\x07\x9c\xdd\x97\x38\xdf\x4b\x96\x2c\x39\xe2\x80\x9b\x06\xd3\
-\x9a\x35\x6b\x0e\x24\x4b\x0d\xc3\x98\x63\xa8\xea\x41\x02\x91\xec\
-\x48\x1f\x56\x0f\x6e\xde\xbc\x79\x6b\x56\x3d\x2f\xa1\x64\x12\xc1\
-\x5d\xf1\x53\xeb\x4a\x1d\xbf\x06\xd1\x86\x0d\x1b\xb6\x65\xd5\x86\
-\x61\x18\x2f\x5a\xbb\x76\xed\xdb\x43\x9f\xfc\x19\x7a\x46\xba\x9b\
-\x4d\x00\x24\xa0\x49\x22\x2d\x5e\xbc\xb8\xa7\x3b\x56\xac\x58\xd1\
-\x4b\x00\x91\x10\x0a\x3d\x82\x6e\x9e\xda\xba\x75\xeb\xd4\xf6\xed\
-\xdb\xa7\x76\xec\xd8\x31\xb5\x73\xe7\xce\xa9\x5d\xbb\x76\x4d\x9d\
-\x75\xd6\x59\x53\xef\x7f\xff\xfb\x7b\x74\xf6\xd9\x67\xf7\x48\xff\
-\xcf\x6f\x94\x39\xf3\xcc\x33\x7b\xcf\xf0\x2c\x75\x6c\xda\xb4\x69\
-\x6a\xfd\xfa\xf5\xbd\xba\x79\x07\xef\xe2\x9d\xab\x57\xaf\xbe\x6d\
-\xdb\xb6\x6d\xef\xca\xa6\x1a\x86\x61\x18\x86\x61\x18\x86\x61\x18\
-\xc6\x0b\x07\x5c\x23\x84\x23\xce\x6e\x4e\x12\x49\x04\x4e\xd9\x75\
-\xc9\x8e\x4d\x76\x67\x6e\xdc\xb8\xb1\xe7\x30\xe3\x80\x9b\xfa\x13\
-\x3c\x3a\xfb\xec\xb3\x37\x26\x5b\x0d\xc3\x98\x43\xe0\x4a\x36\x05\
-\x24\x49\x7c\x90\xf4\x60\xe7\x39\xbb\xd1\x87\xd1\x83\xf3\x5d\x1f\
-\xd4\xf1\x93\x40\xeb\xb0\xeb\x8a\xf5\xab\x61\x18\xc2\x19\x67\x9c\
-\x71\x5a\xe8\x95\xc7\xd0\x31\x24\xac\x49\x22\x69\x03\x00\x36\x2c\
-\xba\x86\x53\x44\xe8\x1a\x74\x07\xc9\x1f\x92\x46\x24\x88\x3e\xf0\
-\x81\x0f\x4c\xed\xde\xbd\x7b\xea\xa2\x8b\x2e\x9a\xba\xe4\x92\x4b\
-\xa6\x3e\xf8\xc1\x0f\x4e\x7d\xe8\x43\x1f\x9a\xba\xec\xb2\xcb\xa6\
-\x2e\xbf\xfc\xf2\xa9\x2b\xae\xb8\xe2\x79\xc4\xdf\x21\xca\x50\x96\
-\x67\x78\x96\x3a\xce\x3f\xff\xfc\xa9\xf3\xce\x3b\xaf\x57\x37\xef\
-\xe0\x5d\xe8\x2c\x92\x4c\xac\x1f\x41\x4f\xc7\xff\x6f\xf6\x95\x78\
-\x86\x31\xfb\x71\xc1\x05\x17\x7c\x53\xe8\x90\x6b\xf3\x7f\x0d\xc3\
-\x30\x0c\xc3\x30\x0c\xc3\xe8\x87\x95\x2b\x57\xee\x54\xd0\x8f\x5d\
-\x95\x38\xe1\x38\xc3\xec\xc2\x94\xf3\x8d\xc3\x8c\x03\x6e\xea\x4f\
-\xf0\xe8\x92\x4b\x2e\x59\x9b\x6c\x35\x0c\x63\x0e\x61\xc5\x8a\x15\
-\x3d\x3d\xc8\x49\x1a\x92\x1f\xec\x34\x67\x27\x3b\x3b\xd1\xd9\x9d\
-\xde\x56\x0f\x52\xfe\xb2\xcb\x2e\xfb\xb5\xac\x7e\xde\x01\x7e\xea\
-\x64\x12\x01\x5e\xf8\x49\x12\x69\x18\x7e\x52\x6e\xbe\xf3\xd3\x30\
-\x8c\x17\xbd\x68\xfd\xfa\xf5\x6f\x09\x9d\xf2\x44\x79\x8d\x26\xa7\
-\x91\x38\xf9\x88\xfd\x1a\xf6\x6c\xef\xa4\x10\x36\x6c\xa9\x6b\x48\
-\xfc\x90\x08\x22\x39\x74\xcd\x35\xd7\x4c\x7d\xe4\x23\x1f\x99\xfa\
-\xe8\x47\x3f\x3a\xb5\x77\xef\xde\xa9\x1b\x6f\xbc\x71\xea\xa6\x9b\
-\x6e\x9a\xba\xf9\xe6\x9b\x7b\x74\xcb\x2d\xb7\xf4\x68\xdf\xbe\x7d\
-\x47\xfe\x5b\xbf\x41\x7f\xf6\x67\x7f\xd6\x7b\x86\x67\xa9\x83\xba\
-\x3e\xfc\xe1\x0f\xf7\xea\xe6\x1d\x17\x5f\x7c\x71\x4f\x67\x9d\x73\
-\xce\x39\x3d\x3b\x7a\xcb\x96\x2d\xbd\xc4\x56\xd8\xd6\xcf\x46\x9b\
-\x4e\xc9\xae\x18\x86\x31\xcb\x80\xdd\xc2\xc9\xea\xb0\x59\x6e\xcc\
-\x3f\x19\x86\x61\x18\x86\x61\x18\x86\xd1\x0f\x67\x9c\x71\xc6\x99\
-\x0a\xa2\x92\x4c\xc2\xf9\xc5\x11\xc6\x29\x66\x37\xe6\xd5\x57\x5f\
-\x7d\xc4\x01\x37\xf5\x27\x78\x74\xfd\xf5\xd7\xbf\x2e\xd9\x6a\x18\
-\xc6\x1c\x02\x89\x75\x76\xb9\x73\x4d\x12\x41\x49\x76\xb5\x73\xc5\
-\x91\x02\x91\x6d\xf5\x20\x01\xc6\xac\x7a\x5e\x02\x7e\xb2\xae\x70\
-\x62\x80\x64\x12\x01\x5e\x82\xbb\xc3\xf0\xf3\xda\x6b\xaf\x9d\xf7\
-\xfc\x34\x8c\xf9\x8e\xd0\x29\x5b\xaa\x89\x24\xae\xb4\x5b\xb6\x6c\
-\x59\xef\x24\x10\x09\x6b\x4e\x07\xa1\x67\x48\xe8\x5c\x7a\xe9\xa5\
-\xbd\x53\x45\xe8\x99\xeb\xae\xbb\x6e\xea\x86\x1b\x6e\xe8\x25\x84\
-\x48\x14\xdd\x7e\xfb\xed\x53\x77\xde\x79\xe7\xd4\x5d\x77\xdd\x35\
-\x75\xf7\xdd\x77\x4f\xdd\x73\xcf\x3d\x53\xf7\xde\x7b\xef\xd4\x7d\
-\xf7\xdd\x37\x75\xe0\xc0\x81\xe7\x11\x7f\x17\x51\x96\x67\x78\xf6\
-\x8e\x3b\xee\xe8\xd5\x45\x9d\xd4\xcd\x3b\xc2\x0e\xec\xbd\x93\x04\
-\x13\x6d\x20\x29\x8e\x4d\x4d\x82\x8b\x75\x65\xdb\xb6\x6d\x37\xc4\
-\xda\xe2\xd3\x4a\x86\x31\x4b\x10\xf3\xf2\xe8\xe3\x8e\x3b\xee\x59\
-\x9d\x78\xdc\xb0\x61\xc3\xff\xc9\x9f\x0c\xc3\x30\x0c\xc3\x30\x0c\
-\xc3\xe8\x07\x9d\x4e\xe2\x7a\x27\x9c\x5d\x1c\x5f\x02\x7e\x04\xf2\
-\xd8\xb5\x79\xeb\xad\xb7\xf6\x1c\x66\x1c\x67\x53\x7f\xba\xed\xb6\
-\xdb\x1c\xf0\x34\x8c\x39\x8a\x45\x8b\x16\x1d\x26\x40\xc9\x69\x1a\
-\xae\x2a\x22\x99\xc4\x95\x46\xe8\x41\x76\xa3\x2b\x08\xb9\x7f\xff\
-\xfe\xda\xf9\x5f\x12\x65\x42\x6f\xde\x92\x55\xcf\x4b\x2c\x5e\xbc\
-\xf8\xb0\x4e\xbd\x72\xd2\x8b\x20\x2f\xc1\x55\xf8\x49\xd0\x55\xfc\
-\xac\xe3\x5f\x95\xcc\x4f\xc3\x98\xbf\xd8\xbc\x79\xf3\xcb\x17\x2e\
-\x5c\x78\x6f\xf9\x3d\x36\x12\xff\xe8\x96\xf2\x24\x29\xd7\xce\xb1\
-\x11\x8a\x24\x12\x49\x68\x4e\x10\x91\xe4\x41\xcf\x90\xfc\x21\x11\
-\x44\x72\xe8\xf0\xe1\xc3\x53\x0f\x3c\xf0\xc0\xd4\xc7\x3e\xf6\xb1\
-\xa9\x07\x1f\x7c\x70\xea\xa1\x87\x1e\x9a\x7a\xf8\xe1\x87\xa7\x1e\
-\x79\xe4\x91\x23\xf4\xf1\x8f\x7f\xfc\x39\x54\xfe\x46\x59\x9e\xe1\
-\x59\xea\xa0\xae\x43\x87\x0e\xf5\xea\xe6\x1d\xbc\x8b\x77\xf2\x6e\
-\xda\x80\xce\xbb\xf2\xca\x2b\x7b\xeb\x09\xa7\xa5\xf8\x0e\xd3\x96\
-\x2d\x5b\xbe\x1c\xff\x9e\x90\x5d\x34\x0c\x63\x86\x10\xba\xe5\x60\
-\x99\xa8\x46\xbf\x84\xbd\xf2\x92\xfc\xd9\x30\x0c\xc3\x30\x0c\xc3\
-\x30\x8c\x7e\x60\x57\x3e\xbb\xc8\x39\x9d\x84\x53\xce\x0e\x72\x1c\
-\x60\xae\xf9\xc0\x31\x3e\x78\xf0\xe0\x11\x07\xdc\xf4\x7c\xba\xff\
-\xfe\xfb\x7b\x74\xe0\xc0\x81\x9b\x92\xa5\x86\x61\xcc\x31\x10\x4c\
-\x20\x48\xc9\xb7\x37\xf8\xd0\x3a\xbb\xca\x39\x45\x43\x50\x90\x9d\
-\xec\xec\x4c\x47\x0f\x32\xd7\xeb\xf4\x80\x88\xdf\x29\x17\xfa\x60\
-\x49\x56\x3d\x2f\xc1\x46\x05\xd6\x15\xbe\xc7\xc7\xa9\x81\x0b\x2e\
-\xb8\xa0\x77\xca\x48\xfc\x24\xf8\x4a\x10\x76\x3a\x7e\x4a\xb7\x9a\
-\x9f\x86\x31\x3f\xb1\x7a\xf5\xea\x05\xc7\x1d\x77\xdc\x57\x39\x39\
-\x40\xb0\x97\x24\x35\xa7\xe9\xd1\x2b\x5c\x23\x87\x6e\x39\xf7\xdc\
-\x73\x7b\xc9\x9a\xab\xae\xba\xaa\x77\x12\x49\x1b\xa1\xb0\x5f\xa5\
-\xb7\x95\x3c\x22\x19\x44\x82\xe8\xd1\x47\x1f\x9d\xfa\xc4\x27\x3e\
-\x31\xf5\xf8\xe3\x8f\xf7\xe8\x89\x27\x9e\x68\x45\x3c\xc3\xf3\x10\
-\x75\x51\x27\x75\xf3\x0e\x74\x17\xba\x8d\x13\x4f\xb4\x81\xcd\x46\
-\x5c\x93\xc7\xf5\x78\xac\x29\x7c\x7f\x89\xc4\x12\xdf\x5b\xda\xb5\
-\x6b\xd7\x75\xd1\xfe\xbf\x9f\xdd\x35\x0c\x63\x42\x08\x5b\x6f\x47\
-\xbf\xab\x33\xb3\x88\x61\x18\x86\x61\x18\x86\x61\x18\xfd\xa0\x6b\
-\x89\x70\xd0\x71\xce\xf9\x66\x12\xd7\xdc\xe1\x90\x73\xa5\x07\xc1\
-\x3c\x76\x64\xe2\x30\x3f\xf6\xd8\x63\xa6\x3e\x04\x7f\x1e\x7a\xe8\
-\xa1\x85\xc9\x56\xc3\x30\xe6\x10\x36\x6c\xd8\xf0\x56\x12\x20\x5c\
-\x9f\xc4\xd5\x49\xec\x20\xe7\x94\xe6\x9e\x3d\x7b\x7a\xc9\x0f\x82\
-\x83\xec\x48\x57\x20\xb2\x4e\x07\x94\x44\xb9\x07\x1e\x78\x60\x51\
-\x56\x3f\xef\x00\x3f\xd9\xa8\xc0\xba\xb2\x66\xcd\x9a\xde\x69\x2f\
-\xf8\xc9\x6e\x7d\xd6\x15\x02\xbc\x0a\xec\xd6\xf1\xaf\x4a\xf3\x9d\
-\x9f\x86\x31\x1f\xb1\x6a\xd5\xaa\xff\x7d\xcc\x31\xc7\x4c\x29\x99\
-\xb4\x60\xc1\x82\x5e\xb0\x17\x1d\xcd\xd5\xcc\xba\x42\x93\xd3\x3f\
-\x24\x6b\x48\x56\x73\xa2\x91\x44\x8e\x92\x48\xe8\x99\x32\x79\xa4\
-\x84\xd0\x93\x4f\x3e\x39\xf5\xc9\x4f\x7e\xf2\x08\x3d\xf5\xd4\x53\
-\xcf\xa3\x3f\xff\xf3\x3f\x3f\x42\xd5\xdf\xca\x67\xa9\xab\x4c\x34\
-\x49\x67\xf1\x6e\xda\x40\x5b\x48\x6c\xb1\x96\x70\x32\x13\x3d\x48\
-\x72\x9d\xc4\x12\xa7\xaa\x42\x3f\xde\x1d\x76\xf7\xb7\x65\xb7\x0d\
-\xc3\xe8\x10\xe1\xeb\x1e\x15\xf6\xde\x17\x48\x26\xe9\xbb\x99\x6c\
-\x7e\xd1\x89\xc7\x4d\x9b\x36\x3d\x95\x45\x0d\xc3\x30\x0c\xc3\x30\
-\x0c\xc3\xe8\x07\x12\x4a\xec\xca\xc2\x90\xe6\xba\x3b\x76\x4d\xe2\
-\xe8\xb2\xbb\x93\x93\x49\x38\xc4\x72\xc2\x71\x9a\x4d\xf5\x04\x7f\
-\x1e\x7d\xf4\xd1\x53\x93\xad\x86\x61\xcc\x21\xa0\x07\x49\x80\xa0\
-\x07\x49\xac\xb3\xe3\x9d\xdd\xee\x04\x28\x39\x49\xc3\xae\x73\x02\
-\x92\x4d\xf5\x20\xe5\x42\x77\xbe\x2a\xab\x9f\x77\xd0\x77\xf9\xe0\
-\x27\xd7\x07\x6a\x5d\xe1\xd4\xab\x92\x73\x6d\xd6\x15\xca\x66\xd5\
-\x86\x61\xcc\x03\x84\x3d\xfa\x1b\xc7\x1e\x7b\xec\xd7\x49\x26\xe9\
-\xdb\x76\x7c\x2b\x69\xed\xda\xb5\xbd\x53\x49\xe8\x14\x5d\xcd\xcc\
-\xe9\x1f\xae\xc5\x24\x69\xc3\x26\x28\x25\xff\x4b\x9d\x5d\x4d\x1a\
-\x95\xc9\x22\xd1\xa7\x3e\xf5\xa9\xc6\x54\xf7\xbc\x12\x4d\xbc\x8f\
-\xf7\x42\xb4\x81\xb6\xd0\x26\x4e\x2e\xb1\x9e\x70\x6a\x09\x5d\x48\
-\x12\x8c\x64\xd8\x85\x17\x5e\x48\x62\xe9\xb6\xb0\xc5\xbf\x39\xbb\
-\x6f\x18\x46\x07\x58\xb8\x70\xe1\x7e\x5d\x9d\x89\x5e\x21\x49\xcd\
-\xc6\x97\xb0\x01\x7b\xb6\xca\xb6\x6d\xdb\x98\x8f\x67\x65\x71\xc3\
-\x30\x0c\xc3\x30\x0c\xc3\x30\xfa\x81\xef\x5c\x60\x50\x73\xcd\x13\
-\x86\x34\xbb\x3d\xb9\x32\x84\x5d\x9e\x38\xbf\xec\xec\xc4\x39\xee\
-\xe7\x80\x9b\xfe\x6f\x10\xe1\xb1\xc7\x1e\x9b\xb7\x01\x64\xc3\x98\
-\xcb\x50\x02\x44\xdf\x91\xe3\x83\xee\x04\x2a\xb9\xaa\x88\x00\x25\
-\x01\x41\x82\x83\x0a\x4a\xd6\xe9\x01\x11\xbf\xa3\x33\xb3\xea\x79\
-\x09\xf8\xc9\x46\x05\xae\xa5\xe2\x24\x01\x01\x53\xd6\x15\x82\xbe\
-\xec\xd8\xd7\xba\x02\x3f\xeb\x78\x28\x82\x97\x10\xbc\xcf\xaa\x0d\
-\xc3\x78\x81\x63\xe3\xc6\x8d\x3f\x7e\xe2\x89\x27\x3e\xc3\x55\x54\
-\xba\x92\x19\x1b\x95\x80\x2f\xd7\xc4\x71\x7d\x26\x09\x7f\x4e\xfa\
-\xb0\xf9\x89\xef\x16\x29\x91\x84\x6e\x51\xb2\x7a\x3a\x7d\x5d\x97\
-\x24\x1a\x95\xca\xfa\xa5\xbb\x68\x03\x6d\xd1\xc9\x25\x9d\x5a\x22\
-\xb1\xc4\x89\x25\x92\x61\xac\x35\x24\xc7\xa2\x5f\x7f\x96\x2c\x30\
-\x0c\x63\x8c\x08\xfd\xb1\xed\xd8\x63\x8f\xed\x9d\x76\xe4\x54\x92\
-\xae\xb7\xc3\xe6\x23\x49\xcd\x35\xc7\xdc\xd0\x91\x57\x1d\xff\x7a\
-\x3e\x66\x18\x86\x61\x18\x86\x61\x18\x46\x3f\x60\x58\x63\x54\xeb\
-\xfb\x49\x5c\xc1\xa1\x6b\x89\xd8\x95\x8f\x13\x2c\x87\xbc\xce\x81\
-\x36\xfd\xff\x41\x04\x82\x06\xc9\x52\xc3\x30\xe6\x18\x96\x2c\x59\
-\x72\x98\x6f\x73\xb0\x4b\x95\xc4\x3a\x1f\x76\xd7\x75\x77\x3a\x9d\
-\xa4\xe4\x47\x9d\x0e\x28\x89\x32\x4f\x3e\xf9\xe4\xde\xac\x7a\x5e\
-\x82\x75\x85\x8d\x0a\xac\x2b\x9c\x26\xb8\xf4\xd2\x4b\xa7\x6e\xb8\
-\xe1\x86\xde\xce\x7c\x82\xbe\x4d\xf9\xc9\xef\x99\x50\x9a\xd7\xfc\
-\x34\x8c\xf9\x82\xb0\x41\xbf\x23\x74\xc7\xa3\xe5\xc9\x24\x92\x49\
-\x1b\x36\x6c\xe8\x5d\x9d\x89\x6e\xe6\xb4\x23\x89\x18\xf4\x33\x27\
-\xe9\xd1\xd1\x24\xfd\xeb\x12\x49\x75\x7a\x65\x92\x44\x1b\xa4\xc7\
-\x74\x72\x49\x89\x25\x92\x60\x24\xc3\x48\x8a\x71\x5a\xe9\x8a\x2b\
-\xae\x60\x53\x97\x75\x9d\x61\x8c\x09\x1b\x37\x6e\x7c\xf3\xfb\xde\
-\xf7\xbe\xa7\xd0\x27\x9c\x4a\x62\xe3\x10\x3a\x45\xd7\xdb\xc5\xef\
-\xbd\x24\x35\x9b\x88\x48\xea\xa2\x5b\xc2\xf6\xf3\x49\x41\xc3\x30\
-\x0c\xc3\x30\x0c\xc3\x98\x0e\x7c\xe7\x82\x7b\xe9\x39\xee\xcf\x0e\
-\x2d\x9c\xf5\xcb\x2f\xbf\xbc\xe7\xa8\x73\x75\x08\x0e\x2f\xce\xaf\
-\x13\x4a\xd3\x53\x06\x0a\x1c\x04\x30\x8c\x39\x0a\xf4\x20\x41\x06\
-\xbe\xcd\x71\xe6\x99\x67\xf6\x02\x0b\xfa\x8e\x9c\xae\xfd\x6c\x9a\
-\x50\xca\x04\xc8\x82\xac\x7a\x5e\x02\x7e\x72\xaa\x80\x75\x85\xef\
-\x51\xf1\x5d\x3e\xd6\x15\x82\xa7\x7c\x93\xaf\xe9\x46\x05\x05\x62\
-\xe7\x3b\x3f\x0d\x63\xbe\x60\xd1\xa2\x45\x77\xe8\x9b\x49\xe8\x10\
-\x4e\x10\x90\x4c\xe2\x7b\x49\x97\x5c\x72\x49\xef\x34\x0f\x57\x91\
-\xea\x1b\x9f\xe8\x67\x5d\x6d\x57\x26\x92\x66\x93\xcd\xaa\xf6\xd0\
-\x36\xda\x48\x62\x09\x1d\x48\x12\x4c\xa7\x95\x38\xbd\xc9\x9a\x73\
-\xf5\xd5\x57\xb3\xb1\xeb\xaa\x64\x87\x61\x18\x43\x22\x7c\xdb\xeb\
-\xb9\xde\x4e\x27\x1d\xd9\x34\x84\xbf\xcb\xc9\x69\x4e\x3b\xb2\xd9\
-\x85\x6f\x98\xb1\xe1\x85\x44\x12\x9b\x5e\xd0\x2d\xf9\xb8\x61\x18\
-\x86\x61\x18\x86\x61\x18\xfd\x50\x7e\x37\x04\xe3\x9a\xef\x86\xe0\
-\xcc\xf2\xd1\x60\x76\x7d\xea\x9a\xa7\x26\x81\xbf\xf9\x4c\x0e\x78\
-\x1a\xc6\xdc\x05\x89\x75\xf4\x20\x27\x35\xf9\x7e\x12\x81\x4b\x76\
-\x8a\xf3\x8d\x0b\x12\xeb\x6d\xf5\xe0\x7c\xd7\x07\xac\x2b\xec\x02\
-\x26\x70\xc3\xba\x72\xce\x39\xe7\xf4\xbe\x13\xc2\xba\x42\xe0\x94\
-\x2b\xa9\xe0\x67\x13\x5e\x2a\x08\x6b\xfd\x6a\x18\x2f\x7c\xac\x5e\
-\xbd\xfa\x04\x02\xc0\x24\x93\x08\xfe\xf2\xcd\x24\x74\x32\x49\x69\
-\x25\x93\xd0\xcb\x24\xa6\x49\xc4\xe8\x54\x12\x09\x9a\xb9\x62\xa7\
-\xd2\x46\x88\xc4\x12\x7a\x50\xa7\x95\x0e\x1f\x3e\xdc\x4b\x92\x91\
-\x78\xbf\xe6\x9a\x6b\x58\x83\x7e\x3b\xd9\x62\x18\x46\x0b\xac\x5a\
-\xb5\x6a\x45\xe8\x91\xaf\x29\x31\xad\xeb\xed\xd0\x27\x6b\xd6\xac\
-\xe9\x5d\xc3\x8b\x9d\xc7\x55\xbc\xd8\x7a\x9c\x0e\x24\x91\xc4\x09\
-\xea\xd0\x2d\xb7\x65\x35\x86\x61\x18\x86\x61\x18\x86\x61\xf4\x43\
-\xf9\xdd\x90\xcd\x9b\x37\x1f\xf9\x6e\xc8\xed\xb7\xdf\xde\xdb\xf9\
-\x89\xa3\x8b\xa3\x3e\x17\x9c\xf4\x99\xa4\x0c\x0c\x38\xe0\x69\x18\
-\x73\x10\x4a\x80\x2c\x5d\xba\xb4\x77\xfd\x09\x3b\x56\xd9\xad\xca\
-\xf7\x93\x0e\x1d\x3a\xd4\x3a\x01\x82\x3e\xc8\xaa\xe7\x25\xe0\x27\
-\x01\x1c\x36\x2a\xf0\x3d\x2a\x3e\x9e\x4f\x80\x94\x75\x05\x7e\xb2\
-\xae\x98\x9f\x86\x61\x94\xb8\xe0\x82\x0b\xbe\xe5\xbd\xef\x7d\xef\
-\xe7\x38\x4d\x40\x32\x09\x7d\xcc\x09\x47\xae\xa3\xe2\x9a\x3b\x25\
-\x93\xee\xbd\xf7\xde\x23\xc9\x24\xf4\xc8\x38\x92\x49\x3c\x3b\x0c\
-\xd5\xd5\xd5\x84\x78\x96\x36\x2b\xa9\xc4\x09\x2b\x92\x4a\x7c\xb7\
-\x94\xa4\x12\xc1\xed\x58\x83\x1e\x4c\xd6\x18\x86\xd1\x00\xeb\xd6\
-\xad\xfb\xf5\x05\x0b\x16\x3c\x58\x77\xbd\x1d\xd7\xef\x56\xaf\xb7\
-\x43\xa7\x70\x2a\x90\xd3\x81\xe8\x15\xfc\xde\xa0\xf7\x66\x75\x86\
-\x61\x18\x86\x61\x18\x86\x61\xf4\x83\xbe\x1b\xc2\xf1\x7f\xbe\x1b\
-\x72\xd1\x45\x17\xf5\x76\x6a\x71\x2f\x3d\x0e\x3b\x4e\xae\x12\x4a\
-\xa3\x38\xcf\x2f\x64\x82\x2f\xf0\x28\x59\x6a\x18\xc6\x1c\x03\x89\
-\x75\xed\x86\xe7\xc3\xcc\x7c\xf0\x9d\x40\xc3\x1d\x77\xdc\xd1\x0b\
-\x30\x94\x7a\xb0\x4e\x07\x94\x44\x99\xf9\x9e\x00\x59\xbc\x78\xf1\
-\x61\xbe\x9f\xc4\x46\x05\xd6\x15\x76\x01\x5f\x77\xdd\x75\xbd\xdd\
-\xbf\x04\x4c\x75\xa2\xa0\x8e\x7f\x55\xb2\x7e\x35\x8c\xf9\x81\xd0\
-\xbf\x1f\xd0\xd5\x54\xa1\x43\x8e\x7c\x7f\x0d\x7d\x4c\x82\xbf\x3c\
-\x99\xa4\x24\x3f\xba\x76\x98\x64\x12\xe5\x4b\xa2\x0e\x25\x78\x44\
-\xe8\x1d\x51\xf9\x77\x95\xd5\x7b\x45\x75\xef\x99\x8e\xca\x77\x53\
-\x2f\x7a\x91\x7e\xa1\x23\xe9\x27\x27\x95\x62\x1d\x3a\x2d\xd9\x63\
-\x18\xc6\x34\x08\x7b\xe3\x52\x5d\x6f\xa7\x53\x49\xe8\x11\xbe\xbf\
-\x46\x62\x1a\x5d\xc2\x69\x69\x4e\x3a\xea\x7a\x3b\x36\x0d\x31\xd7\
-\xb0\xf3\xf4\x1d\xb6\xf8\xf7\x67\xb2\x4a\xc3\x30\x0c\xc3\x30\x0c\
-\xc3\x30\xfa\x01\xa3\x9b\xdd\x5b\x38\xee\x3b\x76\xec\xe8\xdd\x23\
-\xbd\x77\xef\xde\xde\x0e\xc9\x32\xa1\x54\x75\x9c\xbb\xa2\x3a\xa7\
-\x7b\x18\xaa\xab\xbb\x2b\x82\x37\x04\x36\x92\xa5\x86\x61\xcc\x31\
-\xb0\x93\x15\x3d\x48\x62\x9d\xa0\x03\x01\x07\x12\xeb\xd2\x83\x04\
-\xfa\x08\xf8\x31\xdf\xeb\xf4\x4d\x49\x94\x09\x9d\x39\xaf\xbf\xa7\
-\x06\x3f\xf9\xf6\x09\x1f\xbc\xe6\x7b\x54\x5a\x57\x14\x0c\x56\x20\
-\xb8\x8e\x7f\x55\x4a\xfd\xea\xd3\x9f\x86\xf1\x02\xc6\x86\x0d\x1b\
-\x5e\xa9\xab\xee\x48\x46\xa3\x8b\x39\x35\xcf\xe9\x46\xae\xcb\xd4\
-\xf7\xec\x48\xb6\xe8\x64\x92\x92\x3b\x4d\xf4\x32\x24\x9b\x2d\x9e\
-\x7b\x24\xfe\xbd\x36\xf4\xf4\x96\xd0\xed\xc7\x06\xfd\xe7\xc7\x1e\
-\x7b\xec\x0d\x51\xef\x2f\x44\xbd\x2f\x8b\xbf\xff\xc8\x23\x8f\x3c\
-\xf2\x53\xf1\xef\xab\xe3\xef\x6f\x09\x3b\xf8\x9d\xf1\xdb\xa6\x28\
-\x77\x4b\xfc\xff\x97\x59\x0f\x78\x3f\x84\x7d\x4c\x3b\xca\xb6\x34\
-\x6d\x8f\x88\xf2\x3c\x4b\x5d\xd4\xc9\x37\xe6\xe8\x27\x1b\xbb\x6e\
-\xb8\xe1\x86\x6f\x5c\x75\xd5\x55\xff\x3a\xd9\x64\x18\x46\x05\x6b\
-\xd6\xac\x39\xfe\xc4\x13\x4f\xfc\x4b\x4e\x25\xc5\xbf\xbd\x53\x49\
-\xd3\x5d\x6f\x77\xfd\xf5\xd7\x1f\xb9\xde\x8e\x13\xd3\xd8\x24\xe8\
-\x14\x4e\x4e\x33\xb7\xb3\x5a\xc3\x30\x0c\xc3\x30\x0c\xc3\x30\xfa\
-\xa1\xfc\x6e\x08\x46\x37\x77\xd4\x73\x05\xc0\x8d\x37\xde\x78\x24\
-\x90\xaa\xab\x89\xe4\x30\x8f\x9b\x70\xa2\x4b\x27\xbc\xad\x23\x5e\
-\x47\xaa\x47\x75\xd7\xbd\x77\x9c\x44\x10\x20\xf8\x74\x43\xb2\xd5\
-\x30\x8c\x39\x06\x82\x10\xda\x11\x5f\xea\x41\xbe\x9f\xf4\xd0\x43\
-\x0f\xf5\x74\xa0\xf4\x54\x9d\xce\x11\x49\xef\x44\xf9\x79\x9d\x00\
-\x21\x28\x0c\x3f\x59\x57\x08\xe4\x5c\x76\xd9\x65\xbd\x80\x30\xdf\
-\x4f\x62\x17\xb0\xd6\x14\xe9\xea\xe9\x88\x72\x8f\x3e\xfa\xe8\xa9\
-\x59\xb5\x61\x18\x2f\x40\x2c\x59\xb2\x64\x7f\x79\xd5\x1d\xdf\x4d\
-\x3a\xeb\xac\xb3\x7a\xba\x98\x64\x34\xa7\x45\x47\x4c\x26\x3d\x1b\
-\xcf\xec\x0c\x7a\x4d\xbe\x72\x68\x84\x0e\xfb\xc5\x87\x1f\x7e\x78\
-\x5b\xb4\xe5\x4b\x0a\x42\xd3\x26\x25\x97\xda\xb4\xab\x24\x9e\xc9\
-\xf5\xa3\x77\x52\x89\x6f\x2a\x91\x54\x8a\xb5\xe8\x83\xf9\x6a\xc3\
-\x30\x0a\x2c\x58\xb0\xe0\xae\x63\x8e\x39\x66\x4a\xdf\x4a\x42\x7f\
-\xf0\xed\xc6\x95\x2b\x57\xf6\xbe\xdf\xc8\x46\x49\x92\xd2\xba\xde\
-\x8e\x53\x7f\xe8\x12\x6c\x11\x25\x92\xd8\x38\xc9\x9c\x4b\x7a\x36\
-\xab\x36\x0c\xc3\x30\x0c\xc3\x30\x0c\x63\x3a\x6c\xda\xb4\xe9\xe8\
-\x30\xb8\xdf\x72\xce\x39\xe7\xfc\xe6\x85\x17\x5e\xf8\xc6\x6b\xaf\
-\xbd\xf6\xf5\xe1\xbc\xfe\xca\xfe\xfd\xfb\x5f\x73\xe8\xd0\xa1\x57\
-\x87\x03\xff\xcb\xe1\x38\xbf\x6a\x9c\x14\x0e\xf8\xab\xc2\x59\xbe\
-\x01\x23\xbe\xea\x88\xe3\x50\x0f\xe3\x88\x8b\xe2\xd9\x5f\x82\xa2\
-\xce\x57\x42\xbc\xab\xa4\xba\xf6\x8c\x83\xe0\x53\xb2\xd4\x30\x8c\
-\x39\x04\xbe\xf7\x43\x20\x42\xdf\xeb\xe0\x4a\x94\xab\xae\xba\xaa\
-\xb7\x83\x95\xdd\xab\xec\x16\x47\x47\x11\xe8\xab\xd3\x39\x25\x29\
-\x20\x38\x9f\x13\x20\xf0\x93\x8d\x0a\x25\x3f\xd9\x15\x4c\x20\x47\
-\x09\x25\xe9\x7d\x74\xfe\x74\xa4\x1d\xfb\xe8\xd8\xac\xde\x30\x8c\
-\x17\x18\xd6\xad\x5b\xf7\x3d\x0a\x08\x93\x88\xe6\x64\x23\x27\x45\
-\x39\x51\x10\x36\x69\xef\x5a\x2a\x74\x47\xe8\x81\x9e\xee\x40\x2f\
-\x34\x4d\xda\xa4\x4e\x3e\xf3\xe9\xa7\x9f\xfe\xee\x7c\xdd\xd8\x10\
-\xeb\xc4\xb7\x1e\x3e\x7c\xf8\x4f\x08\x4c\xb3\xf1\x80\x24\x90\x82\
-\xd3\xe8\xaf\xa6\x6d\x2c\x89\xf2\xd2\x7b\xd4\x79\xf0\xe0\xc1\xa9\
-\x7d\xfb\xf6\x71\x65\xa8\x4f\x29\x19\x46\x81\xb0\x2f\x7e\xea\xd8\
-\x63\x8f\xed\x25\x93\xb0\x39\x38\x65\xce\xa9\x24\xec\x0e\xae\x2e\
-\xc6\xf6\xe0\xdb\x6b\x57\x5f\x7d\x75\x2f\x29\x7d\xeb\xad\xb7\xf6\
-\x36\x4b\x92\xa8\xd5\x7c\x65\x9e\xc9\xff\xe4\xdf\xa0\x8b\xb3\x7a\
-\xc3\x30\x0c\xc3\x30\x0c\xc3\x30\x66\x23\x1e\x7c\xf0\xc1\x1b\x31\
-\xe8\x09\xd6\x3e\x96\x3b\x3c\x65\xd4\xe3\x50\xb7\x75\xc2\x21\x9e\
-\xc9\xea\x0d\xc3\x30\x1a\x81\xef\x27\x71\x45\x0a\x81\x88\x0d\x1b\
-\x36\xf4\x3e\xd6\xcc\x4e\x56\x82\x0f\xdc\xab\xcf\x0e\x56\x74\x53\
-\x13\x9d\x44\x19\x74\x58\x56\x3d\x2f\xc1\xc9\xd7\xb5\x6b\xd7\xee\
-\xd8\xbc\x79\xf3\xd6\x5d\xbb\x76\x6d\xba\xe8\xa2\x8b\xd6\x7e\xf8\
-\xc3\x1f\x3e\xe3\xe6\x9b\x6f\x5e\x7e\xe0\xc0\x81\x25\x0f\x3c\xf0\
-\xc0\x22\x12\x6e\xd0\x13\x4f\x3c\xb1\x60\x3a\x52\xb9\xac\xda\x30\
-\x8c\x17\x20\x56\xaf\x5e\x7d\x9c\x3e\xa0\x8f\x1e\xe6\x64\xc1\xb9\
-\xe7\x9e\xdb\xbb\xea\x8e\x44\x34\x1f\xcb\x57\x22\x1a\x5d\xdc\x26\
-\x99\x14\xff\xbe\x2f\x5f\xd3\x19\xee\xba\xeb\xae\x9f\x3c\x78\xf0\
-\xe0\xed\x24\x96\x48\x7a\x61\xd3\x86\xfe\x1a\x29\xa9\xc4\xb3\x24\
-\xa7\xb0\x93\xb9\x2a\xf4\x96\x5b\x6e\x59\x94\xaf\x33\x0c\x23\x10\
-\x76\xc6\xb1\x4a\x44\x2b\x99\xc4\xc9\x46\x9d\x4a\xe2\x64\x34\xdf\
-\x6e\xe4\xdb\x6b\x24\x92\xd8\x20\x54\x4d\x24\x69\x7e\x6a\xce\x85\
-\x8e\xf9\x1f\x59\xbd\x61\x18\x86\x61\x18\x86\x61\x18\xb3\x11\xdc\
-\x5d\x8d\x81\xcf\xee\x4b\xae\x31\x21\xb1\xa4\x9d\x9d\x23\x38\xe0\
-\xfe\xce\x86\x61\x18\xad\xb0\x78\xf1\xe2\xc3\x7c\xbc\x99\x6f\x76\
-\x70\xd7\x3e\xbb\xe2\xb9\x63\x9f\x6b\x51\x74\xed\x27\x81\x86\x26\
-\x3a\x89\x32\x04\x29\xb2\x6a\xc3\x30\x0c\x63\x00\x96\x2c\x59\x72\
-\x83\x4e\x18\xac\x5e\xbd\xba\x77\x3a\x89\x93\x05\xe8\xe1\xdb\x6f\
-\xbf\xfd\x48\x62\xbf\x8d\x7d\x98\xba\xf8\x0d\xf9\x8a\x89\x20\xda\
-\xfa\x41\x7d\xe0\x9f\xc0\x75\x99\x58\xa2\x3d\x4d\xda\x0d\x51\x8e\
-\x7e\xf2\x2c\xc1\x6f\x4e\x54\xec\xdf\xbf\xff\x70\xbe\xc6\x30\x8c\
-\xc0\xf2\xe5\xcb\x2f\xe6\xba\x62\xae\xb9\x53\x32\x69\xe7\xce\x9d\
-\x3d\x1b\x8e\x53\xe6\x9c\x4a\xe2\x74\x23\x73\x12\x3f\x93\x64\xaf\
-\xfc\xcc\x6a\x32\x89\x79\xc7\x3c\x8d\x39\xeb\x93\x80\x86\x61\x18\
-\x86\x61\x18\x86\x31\x5b\x11\x46\xfe\xaf\x62\xe8\xb3\xf3\x94\x60\
-\x81\x8c\x7d\x02\x06\xec\x40\x6d\x1a\xbc\x2d\x89\xf2\x4e\x28\x19\
-\x86\xd1\x16\x04\x24\xf8\x08\x3c\xdf\x4f\x22\x90\x79\xe9\xa5\x97\
-\xf2\x21\xf4\x5e\xc2\x9b\xa0\x20\x3a\xa9\x49\x10\x93\xdf\x33\x08\
-\x68\x3d\x64\x18\x86\xd1\x10\xa1\x83\xff\x8a\xa4\x3e\xd7\x64\x72\
-\x4a\x94\xab\xaa\x38\x9d\xc4\xb5\xa3\x9c\x4e\xd2\x55\x77\x6d\x92\
-\x49\x41\xff\x2d\xab\x9f\x28\xf6\xed\xdb\xf7\x11\x36\x4c\xb1\x59\
-\x8a\x53\x55\xc3\x9c\x56\xca\xf6\xf7\x9e\xe1\x59\xd6\x21\xea\xbb\
-\xf5\xd6\x5b\x7f\x3e\x5f\x63\x18\xf3\x1e\x0b\x17\x2e\x7c\x90\x53\
-\x8d\xfa\x5e\x23\x27\x93\x48\x26\x5d\x73\xcd\x35\x3d\xdd\xc1\x3c\
-\xd4\xf5\x76\x4d\xe6\xa1\x37\x03\x19\x86\x61\x18\x86\x61\x18\xc6\
-\x2c\xc7\x65\x97\x5d\xb6\x9a\x0f\xa4\xb2\x83\x6c\xcf\x9e\x3d\xbd\
-\xab\xa5\x74\xa5\x09\x46\xbf\x76\x8e\x55\x8d\xfd\xe9\x28\x03\xb9\
-\xaf\xcc\x57\x18\x86\x61\x34\x02\x3b\xe3\x17\x2d\x5a\xd4\xbb\x77\
-\x7f\xd7\xae\x5d\xbd\x6b\x52\x14\xc8\x1c\xe6\xfb\x49\x51\xde\x09\
-\x25\xc3\x30\x8c\x06\x58\xbf\x7e\xfd\x6f\x71\xdd\x1d\xa7\x93\x56\
-\xac\x58\x71\xe4\xdb\x49\x5c\x3b\xca\x29\x51\x02\xc2\xba\xa2\xaa\
-\xa9\x5d\x18\xba\xf8\x82\xac\x7e\xe2\x08\x9b\xf6\x9b\x83\x3e\x26\
-\xbb\x96\x53\xae\x6a\x7f\xdb\xa4\x12\x65\xb1\x87\x79\x9e\x7a\xf6\
-\xef\xdf\xbf\x31\x5f\x63\x18\xf3\x1e\xc7\x1d\x77\xdc\x37\xd8\x0c\
-\xb4\x7c\xf9\xf2\xa9\x4d\x9b\x36\xf5\xae\xb9\x23\x11\x7d\xd3\x4d\
-\x37\x1d\x49\x26\x95\xa7\x92\x98\x7f\xcc\xab\x7e\xf3\x2f\xca\x3c\
-\x9e\x55\x1b\x86\x61\x18\x86\x61\x18\x86\x31\x1b\x71\xde\x79\xe7\
-\x6d\x20\x70\x8b\xf1\x7f\xf9\xe5\x97\xf7\x92\x4a\x04\x0e\xb8\x26\
-\xa4\x4d\x00\x57\x84\x73\x80\xa3\x90\xd5\x1b\x86\x61\x34\xc2\xca\
-\x95\x2b\x77\xb2\xc3\x75\xc9\x92\x25\xbd\x9d\xf1\x7c\xb7\x83\x44\
-\x37\xc1\x40\x3e\x02\xaf\x6b\x96\x9a\x06\x00\xd1\x43\x8f\x3d\xf6\
-\xd8\xab\xb2\x7a\xc3\x30\x0c\x63\x1a\x9c\x7e\xfa\xe9\x67\xf1\x0d\
-\x14\x74\x30\xd7\xdd\x9d\x75\xd6\x59\xbd\xa4\xfe\x8d\x37\xde\x78\
-\x64\xa3\x51\x19\x0c\xae\xd3\xbd\x25\xa5\x1e\x7e\x6d\x56\x3f\x23\
-\xb8\xfa\xea\xab\x7f\x9b\x6f\xb7\xec\xdb\xb7\xef\x48\x52\x49\x27\
-\x24\x9a\x26\x94\x20\xca\x51\x9e\xd3\x59\xd8\xc6\xf7\xdd\x77\xdf\
-\x53\xf9\x0a\xc3\x98\xd7\xd8\xbe\x7d\xfb\xcb\x39\x5d\xce\xe9\x24\
-\x4e\x97\x9f\x79\xe6\x99\x53\x1f\xfc\xe0\x07\xa7\x3e\xfa\xd1\x8f\
-\x4e\xdd\x79\xe7\x9d\xcf\xb9\x26\x73\x50\x22\x09\xe2\xb7\x4f\x7c\
-\xe2\x13\x67\x66\xf5\x86\x61\x18\x86\x61\x18\x86\x61\xcc\x46\x6c\
-\xde\xbc\xf9\xde\x8d\x1b\x37\xf6\xee\xba\xe6\x9e\x7c\x7d\x00\x9f\
-\x0f\xa6\x0e\x9b\x50\x7a\xf2\xc9\x27\xf7\x66\xf5\x86\x61\x18\x8d\
-\x70\xc6\x19\x67\x9c\xc9\xfd\xfb\xa7\x9d\x76\xda\x54\xe8\xa5\x5e\
-\x92\xfb\xda\x6b\xaf\x65\x27\x78\x6f\x77\xab\x82\x80\xd3\x05\x22\
-\x44\x94\x71\x62\xdb\x30\x0c\xa3\x39\x96\x2d\x5b\x76\x35\x49\x7d\
-\xbe\x81\xb2\x7e\xfd\xfa\x9e\x0e\xfe\xf0\x87\x3f\xdc\xfb\x90\x7e\
-\xd5\x26\x1c\xa4\x87\x53\x07\x7f\x31\xab\x9e\x51\x5c\x7e\xf9\xe5\
-\x57\x63\xdb\xd2\x8f\x32\xa9\xd4\xe6\x04\x3e\xfd\x81\xe8\x3f\xcf\
-\xb2\x26\xdd\x7d\xf7\xdd\x3f\x95\xaf\x30\x8c\x79\x8b\xb5\x6b\xd7\
-\x1e\xcb\xe9\x72\x6c\x37\xbe\x9d\xa4\x6b\x32\xb9\x4a\x9d\xf9\xc6\
-\x35\x77\x9c\x4c\xc2\x26\x1b\x34\xdf\x34\xcf\xa2\xfc\xdb\xb3\x7a\
-\xc3\x30\x0c\xc3\x30\x0c\xc3\x30\x66\x23\xd8\x89\xba\x72\xe5\xca\
-\x23\x57\x14\x70\x22\x80\x2b\xa6\xb8\x23\x9e\xeb\x09\xda\x24\x94\
-\x0a\x87\xdb\xd7\x4c\x19\x86\xd1\x0a\x8b\x17\x2f\x3e\x5c\xbd\x6a\
-\x89\x0f\xc1\xf3\xfd\x24\xbe\xeb\x46\x40\x82\x00\x20\x3a\xa6\x4e\
-\xff\x94\x44\x19\x27\xb6\x0d\xc3\x30\x9a\xe3\xb4\xd3\x4e\xbb\x83\
-\xef\x27\x9d\x7e\xfa\xe9\x53\x5b\xb6\x6c\x39\xa2\x83\x49\xea\xeb\
-\xba\xb8\x36\x3a\x38\x6c\xc7\x7d\x59\xf5\x8c\xe2\x83\x1f\xfc\xe0\
-\xab\x2f\xb9\xe4\x92\xde\x86\xa9\xdb\x6e\xbb\xad\x77\xe2\x55\xdf\
-\x82\xd2\x89\x89\xba\x3e\xd4\x11\xe5\x79\x0e\x7e\xdc\x77\xdf\x7d\
-\xef\xcc\x57\x18\xc6\xbc\x45\xf8\x90\x97\x92\x88\xd6\x75\x77\xe7\
-\x9f\x7f\xfe\x91\xb9\x46\xe2\x55\xa7\x93\x9a\x26\xa2\x29\x17\x7a\
-\xe6\x9f\x65\xf5\x86\x61\x18\x86\x61\x18\x86\x61\xcc\x36\x84\xe1\
-\x7f\x34\x01\x5c\x9c\x00\x4e\x29\x91\x50\xba\xfa\xea\xab\x9f\xb3\
-\x1b\xb5\xed\x0e\x4e\xca\x3a\xa1\x64\x18\x46\x5b\x70\x65\x0a\xdf\
-\x4f\x3a\xe3\x8c\x33\x7a\x57\xa6\x5c\x7a\xe9\xa5\x53\x7b\xf7\xee\
-\x3d\xb2\xa3\x9c\x80\x44\xd3\xe0\x9f\xf5\x90\x61\x18\x46\x3b\x2c\
-\x5e\xbc\xf8\xe3\xd8\x84\x5c\x5b\x45\x52\x1f\x1d\x7c\xc3\x0d\x37\
-\xf4\x92\xfa\xe5\x29\x83\xa6\x3a\x38\xec\xc7\x8b\xb3\xea\x19\xc7\
-\x79\xe7\x9d\xf7\x30\xdf\x0b\x2d\xaf\x75\x6e\x13\xe8\x16\xe5\xda\
-\xd2\x4b\x48\x85\x9d\xbc\x3e\xab\x37\x8c\x79\x8b\xb0\xdb\x1e\xe5\
-\x74\x39\x9b\x13\xb7\x6d\xdb\x36\x75\xd1\x45\x17\x1d\xb9\xee\x0e\
-\xdb\xad\xed\x66\x20\x74\x4c\x56\x6d\x18\x86\x61\x18\x86\x61\x18\
-\xc6\x6c\x04\x57\x4c\xb1\x1b\x95\xeb\x4d\x94\x50\xe2\x7a\x13\xae\
-\xbc\xd3\xae\xb2\xb6\x09\x25\x1c\x01\x7f\xb7\xc4\x30\xba\x03\x1f\
-\x1a\xcf\xff\x7c\xc1\x60\xc3\x86\x0d\x6f\xd5\xb7\x3b\xd6\xac\x59\
-\x33\xf5\xfe\xf7\xbf\xbf\xf7\x4d\x37\xae\x4c\x61\x37\x39\xc1\x4c\
-\x25\x94\xea\x74\x4f\x49\xe8\x21\x27\x94\x0c\xc3\x30\xda\x61\xc1\
-\x82\x05\xcf\x90\xd4\x5f\xbb\x76\x6d\xef\xfb\x49\xe8\x60\x4e\xac\
-\x93\xd4\x6f\x7b\xdd\x5d\xea\xe0\xed\x59\xf5\x8c\xe3\x9c\x73\xce\
-\x59\x7d\xde\x79\xe7\x1d\xb9\x8a\xeb\x9e\x7b\xee\xe9\x7d\x13\xaa\
-\x4d\x92\x0c\x92\x9d\xcb\x69\xad\x07\x1e\x78\xc0\xa7\x60\x8d\x79\
-\x0f\x6c\x37\x12\xd1\x7c\x77\x8d\xeb\xd3\xf9\x7e\x12\xdf\x5d\x53\
-\x22\x5a\x7a\xa3\x6e\x3e\x55\x89\x72\xe1\x77\xde\x93\x55\xbf\x60\
-\xf1\x42\xb4\xe3\xe7\x0a\x2e\xb8\xe0\x82\x6f\xc9\xff\x9c\x53\xb0\
-\xcc\x18\x86\x61\x18\x86\x31\xab\xa0\x6f\x96\x70\xc5\x14\xdf\x2c\
-\x09\x23\xab\x77\x4d\xc1\xed\xb7\xdf\xde\xbb\x62\x0a\x87\x19\xc7\
-\xb9\xa9\x23\x20\x47\x3b\xab\x37\x1a\x60\xdd\xba\x75\x6f\x23\x98\
-\xbe\x68\xd1\xa2\xc3\x10\xd7\x7e\x9d\x70\xc2\x09\x53\x9c\xd6\x58\
-\xba\x74\xe9\xa1\xd3\x4e\x3b\xed\x50\x38\x69\x3b\x20\x4e\x94\xe5\
-\x63\x33\x0a\xda\x0b\xad\x5c\xb9\x72\xa7\xda\x0c\x2d\x59\xb2\xa4\
-\x47\x38\x97\xdc\xa7\x5e\x12\xfd\x28\x69\xd5\xaa\x55\x67\x42\xb3\
-\xa5\x4f\xb3\x05\xdb\xb7\x6f\xff\x8e\xf5\xeb\xd7\xbf\x25\x78\xb3\
-\x7a\xd9\xb2\x65\x37\x04\x3f\xef\x0e\x1e\x3f\xb4\x70\xe1\xc2\x4f\
-\x12\xec\x3b\xf9\xe4\x93\xff\x1a\xfe\xbe\xef\x7d\xef\x7b\x36\x1c\
-\xf8\xcf\x05\xdf\x1f\x0d\x39\xb9\x37\xe6\xf0\x5e\xae\x1d\x09\x79\
-\x5a\xbe\x75\xeb\xd6\x37\xcc\x35\xc7\x03\x59\xe2\xca\x94\x90\x8d\
-\xde\x1d\xfc\x04\xfe\x74\x5a\x92\xe4\x76\x9b\xd3\x92\xd2\x43\x4e\
-\x6c\x1b\xc3\x22\xd6\xc3\x5f\x88\x39\xb8\xe2\xf4\xd3\x4f\x3f\x7b\
-\xf9\xf2\xe5\x1f\x8e\x39\x76\x47\xcc\xc3\x87\x63\xbd\xfc\x6c\xe8\
-\xb3\xaf\xc6\x1c\xfc\x46\xfc\xf7\x5f\xc6\xbc\x7c\x32\x7e\x3b\x18\
-\x65\x6e\x5a\xbb\x76\xed\x8a\x2d\x5b\xb6\xbc\x3a\xab\x78\xc1\x02\
-\x1d\x15\xfa\xff\xed\x31\x67\x77\x45\xdf\x6f\x0b\x1e\x7c\x2c\x74\
-\xd1\x9f\xc7\xfc\xfd\x12\xba\x29\xe8\x6b\xa1\xab\xfe\x22\xfe\xfe\
-\x54\xe8\xaf\x07\x82\x8f\x17\x86\x4e\x3b\xe6\xcc\x33\xcf\xfc\xc9\
-\xac\xc2\x98\xa5\x08\xd9\xfe\x06\x49\x7d\xbe\x9f\xc4\x77\x50\xb8\
-\x02\x99\x0d\x46\x24\xf5\xb1\x07\x9b\x06\x86\x95\x50\x0a\x9d\x7d\
-\x41\x56\x3d\xe3\x38\xf7\xdc\x73\x5f\xc1\xa9\x2b\x4e\x4f\x60\xe7\
-\xea\xdb\x7c\xe5\x29\xa5\xba\xbe\x54\x49\xeb\x0b\x89\xa8\x07\x1f\
-\x7c\xf0\x73\x59\xbd\x31\x4f\x20\xdb\x17\xc2\x87\x9a\xce\xfe\xc5\
-\xa6\x49\xbb\xe6\x39\xf6\xef\x6c\xb3\xe9\x47\x01\x7a\x9d\x3e\xa2\
-\x37\xb0\xdd\xce\x3e\xfb\xec\xa9\x2b\xae\xb8\xa2\x97\x88\xbe\xef\
-\xbe\xfb\x5a\x7f\x8b\x37\xf5\xc6\xea\xac\x7e\xce\x21\xe4\xe3\x65\
-\xac\x8f\x21\x1b\xa7\x85\xfd\x70\x71\xac\x91\x77\xc6\x5a\xf8\x68\
-\xac\x89\x9f\x0a\x9b\xe1\x99\xe0\xd5\x97\x43\x46\xbe\x8e\x7c\x84\
-\x3d\xff\xe5\x58\x3b\x3f\x1d\xf2\xf3\x48\xd8\xfb\x77\x45\xf9\x3d\
-\xf1\xdc\x25\xc1\xc7\xf7\x05\x5f\xff\x45\x56\x69\x0c\x81\xe0\xe1\
-\x3f\x0c\x9b\xec\x0f\x63\x9e\xad\x0c\xbe\x5e\x14\xe3\xb0\x2f\x78\
-\xfd\x68\xf0\xfd\x8b\xf8\xd7\xf1\x2f\x3e\x14\x1b\x28\x3e\x19\xbf\
-\x3d\x10\xf3\xf9\x8a\x78\x66\x59\xd8\x7e\x6f\x8d\x71\x99\x91\x84\
-\xd3\x59\x67\x9d\xf5\x0f\x37\x6e\xdc\xf8\xe6\xb0\x99\x42\x1c\x96\
-\x5d\x1d\xed\x7b\x04\xb9\x89\xf6\xfc\x25\x76\x15\xba\x25\xe4\xe7\
-\xd9\xf8\xdb\x17\x42\xa6\xfe\x3c\xe6\xdc\xc3\x51\x76\x77\x3c\xf3\
-\x4e\x9e\xcd\x6a\x0c\xc3\x30\x0c\xc3\x30\x26\x03\x12\x17\x61\xb0\
-\xf4\xae\x29\xc0\xd1\xe6\x8e\x79\x5d\x53\xa0\x9d\x9b\x18\xf7\x38\
-\xd0\x75\x86\x7f\x95\x28\x17\x8e\xc0\x9c\xd8\xb1\x19\x86\xe3\xdb\
-\x4a\xc2\x49\x1c\x85\xb2\xda\xc6\xe0\x9d\xc1\xfb\xfb\xdf\xf3\x9e\
-\xf7\x4c\x1d\x7f\xfc\xf1\xbd\x04\x12\x4e\x19\x27\xc6\x48\xf2\x31\
-\x2e\x61\x30\xf6\xae\x00\x13\xf1\xff\xfc\x3d\x9e\xdd\x3e\x49\x47\
-\x54\x6d\x8d\x36\x1c\x3e\xee\xb8\xe3\x8e\xb4\x37\x8d\xdb\x23\xed\
-\x0e\x23\xf7\x79\xed\x0e\x47\xa9\x47\x38\x9b\x90\xfe\xbf\xec\x0f\
-\xcf\xad\x58\xb1\xe2\x60\x18\xff\x3d\x27\x3b\x5f\x3b\x2f\xb0\x63\
-\xc7\x8e\xef\x8a\x3e\x2f\x38\xed\xb4\xd3\xae\x89\x71\x7f\x1c\xfe\
-\x2a\xa1\xa8\x80\x44\x9d\x4c\x88\x8f\x55\x12\x5f\x83\xa7\xdf\x08\
-\x87\xe4\xa1\xa8\xfb\xd2\x90\xcf\xe3\xd7\xaf\x5f\xff\xed\xf9\xca\
-\x59\x09\x9d\x96\xd4\x1d\xfc\xbb\x77\xef\x3e\x72\x07\x7f\x99\xdc\
-\x6e\xa2\x8b\x14\xf0\xcb\xaa\xc7\x0a\xe9\x0b\xa8\xaa\x03\xc6\x4d\
-\xf9\xca\xa1\xd0\xb4\x9d\xe8\x91\xe9\xa8\x2c\x9b\x55\x8f\x1d\x21\
-\x9b\x3f\x16\xf5\xbf\x3e\x9c\xe2\x37\x44\x7b\x7f\x3d\xfe\xff\x8d\
-\xa2\xf8\xdb\xaf\xb7\xa5\xac\xb6\x35\xe2\x7d\xaf\x0b\x3d\x74\x76\
-\xcc\xb5\x27\x4a\x3d\x77\x52\xce\x43\xe6\x60\x55\xc7\x95\xf3\x4e\
-\x73\x2f\xfe\xff\x4b\xa7\x9f\x7e\xfa\x6d\x04\x26\xb2\xea\x39\x8f\
-\x18\x9f\x9f\x0b\xde\x9c\x1b\xfd\x7b\xb0\x5c\xb3\xb4\x06\xd4\xe9\
-\xff\x3a\xde\x84\x9e\x7b\x2a\xf8\xbc\x7d\xcb\x96\x2d\xaf\xc8\xaa\
-\x87\x06\xe3\x55\x27\x37\x55\x79\x68\x4a\x59\xed\xbc\x45\xcc\xf7\
-\x1f\x60\x2c\x63\x8c\x8e\x7c\x53\x93\x13\xeb\x6c\x30\xe2\x0a\xe4\
-\xc7\x1e\x7b\xac\x97\xd4\x6f\xa3\x83\x1f\x7f\xfc\xf1\x6b\xb2\xfa\
-\x59\x81\x90\x8f\x5e\xa2\xec\xf2\x3c\xfd\xca\xc9\x2b\x6c\xdd\xf2\
-\x5b\x4a\x83\x08\x9b\x38\xfb\xd6\xbb\xf6\x2e\xab\x6e\x85\x52\x3f\
-\x43\xd2\xb1\xa3\x50\x56\x3d\x6b\x30\xee\xfe\x89\xb2\xfa\x89\x40\
-\x6d\x0f\xfd\xd5\xdb\xf0\x85\xde\xeb\x67\x9f\xf5\xd3\x7f\xb2\x7d\
-\xab\xf6\xaf\x74\x22\xcf\x94\x36\x70\xbe\x7a\xc6\x11\x73\xe5\xc7\
-\xa2\x3d\xbf\x2a\x8a\xff\xff\x95\x3a\x0a\xdb\x6d\x27\x7d\x08\x7b\
-\xb3\xb7\x31\x51\x7a\x83\x44\x34\x7a\xa3\xcd\x77\xd7\x20\xe6\xd7\
-\x13\x4f\x3c\xf1\x9e\x87\x1e\x7a\xe8\xe7\x0e\x1e\x3c\xf8\x8a\x5b\
-\x6e\xb9\xe5\x17\xf7\xee\xdd\xfb\xca\x2b\xae\xb8\xe2\xd5\xe7\x9d\
-\x77\xde\xaf\x9c\x79\xe6\x99\xaf\x63\xd3\x14\x14\xef\xfb\x35\x51\
-\x36\x7b\xe2\x88\x36\xfd\xe3\xe0\xcf\x9f\x46\xff\x3f\x12\x32\xf1\
-\x05\xc9\x08\x6b\x63\x55\x46\x4a\xf9\x28\x65\xa4\x9f\x5c\x60\xc3\
-\x07\x8f\xb7\x6f\xdb\xb6\x6d\xc6\xfa\xd7\x16\xd1\xde\x23\xeb\xf2\
-\x9a\x35\x6b\xde\x18\xbc\x79\xd3\xb0\x14\xfe\xd1\xbf\xce\x6a\x1b\
-\x21\xde\xfd\xed\xf1\xdc\xb1\x31\xd7\xf6\xc9\x4e\xd1\x58\x0c\xb2\
-\x53\xc4\xff\xfc\xfb\xb3\x2b\x57\xae\xbc\x26\xd6\xc1\xb7\x67\xd5\
-\x9d\x21\x64\xf7\x87\x56\xad\x5a\xb5\x38\xde\x7b\x77\x69\x5b\x95\
-\xb2\x53\x6d\x73\xbf\x76\x87\xff\x74\x20\xda\xfc\x47\x59\xb5\x61\
-\x18\x86\x61\x18\x46\xb7\xc0\xc8\xc2\x10\x59\x9d\xd7\x14\x70\xbf\
-\x7c\x79\x4d\x01\x0e\x73\x9b\x84\x52\x3a\x02\x73\xe2\x9a\xa9\x30\
-\xbc\x76\x1d\x73\xcc\x31\x53\xfd\x0c\xb8\x36\x14\x46\xff\xa1\xac\
-\x76\x20\xc2\x69\xc4\xf9\xba\x9f\x80\x25\xef\xe4\x7d\x38\x1a\x8c\
-\xc3\xd2\xa5\x4b\x7b\x4e\xd9\xe9\xa7\x9f\xde\xfb\x8e\x0c\xe3\xc2\
-\xf5\x5f\x61\x20\xf7\x88\xff\x0f\xc3\xb3\xf7\x3b\xe5\xc2\x68\xdf\
-\x96\xd5\x8e\x1d\x38\xd2\x6a\x67\x95\x3f\x18\xb7\x18\xaf\x18\xb2\
-\x04\x9f\x68\x4b\xf4\xab\x97\x98\xa4\x7d\xd5\x76\xd7\x11\xbf\xab\
-\x3f\x3c\x47\x9f\x48\x26\x50\x1f\x8e\x37\x4e\x54\xe0\xa8\x6c\xce\
-\x0b\x0e\xc1\xdf\x3f\x0a\xfe\xdd\x1c\xfc\xfd\x86\xf8\x2b\xd9\xc3\
-\x71\x90\x3c\xc0\x0f\xf8\xd2\x4f\x26\xaa\xc4\x6f\xf0\x94\xb2\x25\
-\x4f\x83\xbe\x12\xf2\x72\x5e\x38\xe3\xff\x3e\x9b\x30\xab\x10\x63\
-\x7e\x18\xb9\x42\x16\xb6\x6e\xdd\x3a\x75\xf1\xc5\x17\x3f\x27\xb9\
-\x4d\x30\xb3\x4d\x42\xa9\x8b\xc4\xf6\x74\x3a\x63\x18\xbd\xd1\x8f\
-\xa8\x2b\xc6\x79\xa4\xc0\x52\xf0\xf2\xfe\x63\x8f\x3d\x76\x4a\x09\
-\xca\x6a\x70\x03\x42\xef\x0c\x22\x95\x6d\xa3\xe3\xda\x22\xe6\xc1\
-\x4d\x55\xbe\x2a\x00\xd0\x96\xaf\x94\xcf\x6a\x1b\x81\xa0\x47\x8c\
-\xeb\x85\xf1\xdc\xd3\xbc\x1b\x5e\x95\x7a\xae\xd4\xcb\x55\x1d\x57\
-\x37\xf7\xa4\xd3\x34\xf7\xe2\xef\xb7\xef\xd8\xb1\x63\x4e\xee\x42\
-\x9f\x9a\x9a\xfa\x5b\xd1\xa7\x13\x43\xd7\x1f\x28\xe5\x08\xde\x20\
-\x1b\xac\x01\xe8\x6a\xf4\x4b\xc9\x9b\x7e\xfa\x09\xde\x48\x2f\xc1\
-\xcf\x28\x7b\x6f\xe8\xf8\x37\xe5\xeb\x5a\x23\xe4\xe4\x19\x64\x7c\
-\x1c\xf3\x31\xda\xbf\x2f\xab\x9d\xb7\x88\xb9\xf0\x12\x78\xc1\x78\
-\x12\x18\xe6\xc3\xfa\xd7\x5e\x7b\x6d\xef\x7b\x43\x9c\xe4\x19\xe6\
-\x3b\x28\x3c\xf3\xc0\x03\x0f\xfc\x60\xbe\x62\xc6\x11\xeb\xee\x63\
-\x3a\xa5\x74\xfd\xf5\xd7\x1f\xe9\x1b\xa7\x94\xb0\x77\xe9\x1f\x44\
-\xdb\xf5\xdf\x55\xe2\xb4\x05\x44\xa0\x9c\xb5\xe9\xbe\xfb\xee\x7b\
-\x59\x56\xdf\x18\xe8\xe7\x71\xaf\x25\x59\xf5\xac\x01\xfd\xab\xae\
-\x41\xa3\xf4\x0f\xe2\xd9\xac\xbe\x33\xc8\xf6\xd5\xd8\x54\xf5\x5e\
-\x3f\xfb\xac\x9f\xfd\x1b\xf5\x1d\xa1\x52\x1f\x6a\xbd\x40\x27\xf2\
-\x2c\x3a\x14\xbd\x48\xbd\xf1\xff\x07\xb1\x81\xd9\xd4\x91\xcd\x9a\
-\x38\xb0\x4f\x35\x86\xfd\xd6\x65\xf9\x02\xb4\x9b\xfe\x84\x7d\xd9\
-\xdb\x98\xc8\xdc\xc2\x76\x63\x33\x50\x1b\xdb\x0d\xa2\x2c\xf3\x0b\
-\x1f\x94\x93\x91\x9c\x74\xe2\x9a\xca\x0f\x7c\xe0\x03\xbd\x44\x37\
-\xfc\x82\x47\x8c\x83\x6c\x94\xf8\xff\x8f\x67\xb3\x27\x86\x18\xbb\
-\x93\x42\x0e\x0e\x55\xe5\x9b\xf6\xd0\x36\xfc\xa3\xd2\x76\x68\x63\
-\xc3\x53\x06\x59\x2a\xe5\x22\xe4\xec\x0b\x21\x13\x5b\x48\x9a\x64\
-\x13\x66\x1d\xb6\x6c\xd9\xf2\x9d\x92\x19\xcd\x1f\xf8\x52\xb5\x3d\
-\x9b\x52\xcc\x99\xa5\x59\xf5\xb4\x08\xbe\xfd\x71\xd8\x22\x37\xc5\
-\x58\xfc\x8d\x64\xb5\x3a\x16\x9a\xab\xf0\x74\xba\x71\xd0\x9c\x94\
-\x0d\x17\x65\x0e\xc4\x9a\xf1\xfa\x7c\xd5\xd8\x10\xe3\xf8\xbb\xd1\
-\xae\x3b\x4b\x3e\xd1\xe6\xaa\x6d\xa5\x36\xd7\xe9\x16\x91\x64\x46\
-\xf2\x12\xed\xff\x64\x8c\xc5\xf2\x7c\x95\x61\x18\x86\x61\x18\xc6\
-\xf8\xc1\xae\x3b\x8c\x3c\x8c\x16\x1c\x1d\xbe\x59\x82\xd1\x5e\xbd\
-\xa6\x00\x27\xa0\xa9\x23\x30\x97\x12\x4a\x72\x18\x15\x40\xc4\x88\
-\x2b\x9d\x44\x08\x23\x7e\x10\x51\x6e\xf3\xe6\xcd\x5b\xb3\xda\xbe\
-\x08\x1e\x1f\x71\x52\xf5\x4e\x9c\x31\xf8\x8f\xc1\x88\xb1\x88\x61\
-\x88\xc3\xc4\x47\x6d\x77\xec\xd8\x31\xb5\x6b\xd7\xae\xde\x77\x0c\
-\x18\x1b\x88\xff\xc7\x61\xe3\x77\xca\x65\xd5\x63\x45\x18\xa3\x3b\
-\xcb\x20\x80\x1c\x01\xda\x2a\xa3\x3c\x0d\xd6\x5e\x7b\xc3\x28\xee\
-\xb5\x85\x24\x00\x81\x1a\xda\x57\xb6\x9b\xeb\x2f\xd8\x11\x0c\xf1\
-\xdf\x10\x7f\xe7\x77\x92\x98\x94\xe7\x39\x9e\x27\x88\x15\x72\xd9\
-\xab\x17\x7e\xf0\x1e\xde\xd7\x65\xe2\x6c\x92\xd8\xb8\x71\xe3\xab\
-\xa2\x3f\x57\x07\x5f\xbf\x5c\xf2\x57\x4e\x0f\xb2\x80\x4c\xe1\xc8\
-\xe0\x1c\x30\x2f\xe3\x99\xa9\x70\x0c\x7a\x3c\x42\x26\xe0\x59\xc9\
-\xdb\x92\x24\x23\x94\xa1\x2c\xcf\xf0\x2c\x75\xc0\x53\xea\xa4\xee\
-\x18\xb3\xbd\xb3\x2d\xc8\x8d\x33\x85\x13\x45\x1b\x69\x3b\xc9\xed\
-\x9b\x6e\xba\xa9\x97\xdc\x66\x17\x78\xd3\xe4\x36\xbf\x77\xa1\x87\
-\x62\x8e\xee\xd2\xbc\x90\xb3\x5a\x26\x1c\x90\x53\xa8\xaa\x1f\x86\
-\xa1\xe8\xff\x5b\xf2\xb5\x43\xa3\xda\xd6\x32\xc0\xd1\xb6\x9d\x94\
-\x6f\xa2\xe3\x86\x45\x8c\xfd\xe7\x35\x1f\xea\x1c\xea\xa6\xed\xa5\
-\x5c\x8c\x53\xa3\x2b\xa8\x62\x0e\x1c\x1d\xfc\xb8\xad\x0c\x96\xe9\
-\xdd\x8c\x29\x75\x95\xf3\x70\x90\x8e\x93\x4e\x93\x8e\xd6\xdc\x43\
-\x3f\x52\x47\xfc\xf7\x85\xf9\xea\x39\x81\xd0\xef\xeb\x82\x2f\xcf\
-\xd3\x53\x8c\x0b\x32\xc4\x9a\xa5\x35\xa0\xd4\x51\xe8\x1e\x78\x00\
-\x3f\x4a\xde\x40\xfc\x9d\xb9\xad\xf5\x0b\xbe\xc2\x9b\x90\xad\x0f\
-\xc5\xef\x3f\x9c\xaf\x6e\x84\xab\xae\xba\xea\x5b\x07\xcd\xc7\x3a\
-\x19\xa9\x23\xca\xc6\xd8\x36\x0a\x5c\xbd\xd0\x11\xf2\xcf\xc9\xd6\
-\x9e\xac\xeb\x0a\x64\x02\xc3\xf7\xdf\x7f\xff\xd0\x09\xa5\x8f\x7d\
-\xec\x63\xb3\xc6\x26\x0c\x5b\xe2\xca\x90\xbf\x3b\x77\xef\xde\xbd\
-\xe7\x9a\x6b\xae\xf9\xe0\xbe\x7d\xfb\x76\xdd\x7b\xef\xbd\x6b\x1e\
-\x78\xe0\x81\x85\xb1\xce\x1c\x1b\xed\x7d\xd7\x63\x8f\x3d\xf6\xdb\
-\xb1\xde\xbc\x29\xfa\xfa\xea\x47\x1f\x7d\xf4\x67\xe3\xbf\x5f\x1a\
-\xff\xfe\x40\x94\xf9\x47\x0f\x3e\xf8\xe0\xb7\x66\x55\x23\x01\x7b\
-\x10\xf9\xd5\xdc\x92\xde\x69\xab\xf3\x20\x95\xcf\xaa\x67\x05\x64\
-\x47\x2a\x50\x5a\xda\x38\x6d\xfb\x27\xe2\x99\x2e\xd7\x21\xd9\xe8\
-\xd2\x79\xd5\x00\x2f\x7a\x85\x76\x10\xb4\x25\x80\x2b\xfb\x0c\xbb\
-\x15\x9d\xd6\x6f\x6d\x90\xfd\x5b\xda\xc1\xfc\x26\x1b\x58\xb6\x1a\
-\x73\x0e\xbd\xc8\x9a\x41\xfd\xe8\x57\xf4\x2c\x7d\x8e\xdf\x27\xbe\
-\xb9\x2a\xf4\xea\x33\xf2\x57\xea\xf4\x2b\x84\x8d\x0e\x3f\xe0\x05\
-\x3c\x20\xe9\x83\x1f\x89\xed\x56\x77\xfa\xaf\x4e\x57\x54\x49\x09\
-\x25\xec\xbe\x83\x07\x0f\xf6\xae\x3d\xe6\xc4\x13\xfa\x08\x5e\xc1\
-\x1f\xf9\x07\x92\x8b\x18\x87\x73\xb2\xd9\x9d\x22\xc6\xe1\xe5\x31\
-\x26\x1f\x08\x9e\x7c\xb1\x6e\x6d\x94\x0d\x0f\x4f\x64\x3b\xb4\xb5\
-\xe1\x21\x64\x88\x72\xa5\x5c\x50\x17\x75\x86\x5c\x7c\x31\xea\x5b\
-\x3b\x1b\xaf\xb5\x0e\x7b\xe0\xed\x24\x94\xe0\x8d\xe6\x8f\x6c\x4f\
-\xc9\x8c\xe6\xf3\x20\xa2\x6c\xf0\xeb\x17\xb3\xea\x5a\xc4\xfb\x7e\
-\x37\xe4\xf2\x11\xc9\x69\xf9\xce\x72\x2c\x98\x4f\xc8\x0d\x73\xb5\
-\x3a\x0e\x25\xff\x65\xc3\x69\x4e\x52\x5e\xf3\x31\x78\x3e\x16\x19\
-\x8b\x71\xfc\x93\xd0\x29\x47\x4e\x7a\x57\xf5\x23\x6d\x96\x6d\x85\
-\x3f\xac\x36\x4b\xb7\x48\x46\xaa\xed\x2e\xe5\x45\x3e\x5f\xc8\xcd\
-\x4d\x51\xf6\x25\xf9\x6a\xc3\x30\x0c\xc3\x30\x8c\xf1\x21\x0c\x96\
-\x33\x31\xbc\xd2\x18\xef\x39\x02\xe1\x60\xf7\xae\x98\xd2\x35\x05\
-\x4a\x28\xd5\x19\xfd\x75\x84\x23\x90\xd5\xcf\x7a\x94\x8e\x12\x4e\
-\x12\x46\x9c\x92\x3a\x18\x71\x18\xf0\x18\x72\x83\x08\xde\x85\x91\
-\xb7\x29\xab\xad\x05\xce\x75\x69\x3c\xe2\xa0\x62\x60\xe3\x10\x61\
-\xa8\xf2\x2e\x0c\x41\x8c\x44\xc6\xe1\xc2\x0b\x2f\x9c\xba\xf4\xd2\
-\x4b\x7b\x41\xf5\xcb\x2e\xbb\xec\x08\xf1\xff\xfc\x9d\xdf\x2f\xba\
-\xe8\xa2\xb5\x59\xfd\x58\x10\x46\xee\xdb\x82\x0f\xbd\x2b\x3d\xca\
-\x00\x9d\x1c\x01\x82\xab\xb4\x15\xde\xe0\x1c\x61\x70\x63\xc4\x9e\
-\x7b\xee\xb9\xbd\x36\xe3\xec\x71\xaa\x84\x8f\xf1\xaa\xdd\x97\x5f\
-\x7e\x79\xef\x2e\x75\x1c\x4c\x88\xff\x86\xf8\x7b\xd9\x1f\x9e\xa3\
-\x4f\xec\x88\xa6\x3e\xf8\x40\xfd\x18\xc6\xbc\x8f\xf7\xc6\x7f\x6f\
-\xc9\xa6\xce\x39\x84\xa3\xfd\x13\xc1\xc3\x6b\x4a\x19\x28\x1d\xad\
-\xd2\x81\x40\x16\x70\xcc\x71\x0e\x70\x14\xf8\x96\x10\xd7\xbf\xb1\
-\xa3\xba\x94\x09\xf1\xb6\x24\xfe\xc6\xef\x8c\x01\xbb\x44\x79\x86\
-\x67\xa9\x03\x9e\xe2\x90\x94\x3c\x8d\x71\xbc\x38\x9b\x38\xa3\x88\
-\xf6\xbc\x15\x7e\xc0\x0b\x78\x80\x5c\xd1\x1f\x25\xb7\xf5\x8d\x8b\
-\xa6\x81\xcc\x71\x27\x94\xca\xe0\x18\xc1\x03\xe6\x05\x8e\x1f\xf3\
-\x57\x41\x03\xe9\x8c\xa6\x7a\xa3\x24\x3d\x07\xc5\x58\xfd\x46\xbe\
-\x76\x68\x30\x97\xe5\xd0\xa3\x6b\xaa\x6d\x45\x67\x35\x6d\x27\xe5\
-\x9a\xe8\xb8\x61\x11\x7a\xe3\x9b\xca\xa4\x80\x74\xb1\xe6\x03\xce\
-\x7c\x93\xf6\x8a\x7f\x21\xe3\x1f\xcd\xaa\x6b\x11\xe3\xf4\x9a\x78\
-\xc7\x5d\x75\xce\x3c\x81\x32\xf1\x89\xf1\x64\xae\x30\x67\x98\x87\
-\xd3\xe9\x38\x51\xa9\xd3\x98\x7b\xe8\x33\x02\x88\xcc\x65\xea\x0a\
-\xba\x2b\xea\xfa\x97\xd9\x94\x59\x89\xe0\xf9\xff\x88\x71\xe8\x5d\
-\xf9\xa7\xf5\x51\xeb\x55\x39\x2e\xf0\x1c\x1d\x8d\x5e\x91\x8e\x2a\
-\x79\x23\x9e\x48\x2f\x41\xe2\x0d\xba\x1e\x7e\xc2\x57\xf8\xcb\x7a\
-\x12\x72\xf9\x95\xe0\xd3\x31\xd9\x8c\x81\x40\x67\x30\x86\x55\x19\
-\x67\x0d\x2f\xe7\x63\x55\x4e\xaa\x24\xf9\x8e\x75\xe7\x67\xb3\xea\
-\x79\x8d\x85\x0b\x17\x7e\x89\x20\x36\x6b\x10\xe3\x74\xdd\x75\xd7\
-\x4d\xdd\x75\xd7\x5d\xbd\x93\x06\x6d\x02\xc3\x94\xa1\x2c\xcf\x7c\
-\xec\x63\x1f\xa3\x0e\x7f\x3f\xab\x00\xf2\xcb\x1c\x93\x1d\x80\x8d\
-\x55\x06\x3e\x9b\xea\x68\xe9\x3d\xca\x8f\x63\xed\x18\x17\xb4\x5e\
-\x56\xfb\xd7\x46\xa7\x8b\xd4\xc7\xd0\x17\x1b\xb3\xfa\xb1\x82\xf5\
-\x32\xda\x78\x24\x91\xa4\x04\x9f\x92\x48\xa5\x5e\xa1\x3d\xd8\xea\
-\x04\x76\xb5\x2e\xa0\xfb\x98\x2b\xd8\x5c\xd3\xd9\xbf\xa5\x1d\x2c\
-\x7d\x48\x79\xad\x17\xac\x2f\xd4\xc7\x9a\x41\xfd\xbc\x07\xdd\x08\
-\xbf\x58\x93\x26\x69\x03\x47\x5b\xbe\x05\xfd\x5a\xae\xcb\xe8\x05\
-\xf1\x41\x63\x48\xfb\xd0\x15\xd8\x6c\xb4\x9d\x7e\x73\xb2\x9c\x6b\
-\x32\xf5\xed\x4b\x6c\xb7\x26\x9b\x81\x44\x69\xbf\xf5\x9e\xa5\x0e\
-\xea\xe2\xc4\x13\x75\xf3\x8e\x92\x37\x92\xfd\xd0\xdf\xff\x39\x9b\
-\xde\x09\xe2\x1d\x2f\x0d\x59\xb8\x4e\x76\x43\xe9\x23\x55\x93\x00\
-\xb4\x89\xf6\xc9\x86\x97\x8c\xf4\xb3\xe1\xab\x72\x21\x3b\x02\xd9\
-\x60\x4d\x95\x5c\x68\xbd\xc4\x96\x80\xff\x31\x0e\xcf\x04\xef\x57\
-\x64\x13\x67\x05\x62\xae\xec\x64\x1e\xc9\x4e\x66\xfe\xc8\x77\x44\
-\x6e\x9a\xcc\x7b\xcd\x77\xca\x66\xb5\xcf\x43\xf0\xe0\xdf\x05\xcf\
-\xf7\x94\x73\x16\x3b\x0e\x39\x2d\x75\x8d\xc6\x02\x99\xc1\xb7\xc4\
-\x26\x63\x1c\x98\xab\xe5\x38\x88\xc4\xfb\xd2\x86\xe3\x39\xd9\x70\
-\x51\xd7\x47\xb2\x09\xad\x11\x3c\x78\x47\xf0\xe4\xa1\x61\xdb\x5c\
-\xa7\x5b\x44\xfc\xad\x94\x17\x6c\x32\xcd\x93\x68\xf7\x93\xa1\x53\
-\xde\x90\xcd\x30\x0c\xc3\x30\x0c\xc3\x18\x0f\x48\x28\xe1\x34\xe1\
-\x2c\x61\x28\x61\x84\x10\x3c\xe0\x0a\x90\xb6\xbb\x51\x21\xca\x51\
-\x3e\xab\x9f\xf5\x90\xb3\x8b\x31\x87\xc1\x4b\x00\x0a\xe3\x4b\x49\
-\x1d\x8c\x38\x9c\x80\x41\x44\xd9\xac\xb2\x16\xf0\x19\xe3\x51\x0e\
-\x08\xce\x35\xce\x07\x0e\x22\xc6\x33\x46\x1f\x75\x60\xe0\x62\x24\
-\x92\xd4\x63\x1c\xf6\xee\xdd\xdb\xdb\xe5\x47\x50\x5d\xc4\xff\xf3\
-\x77\x7e\xcf\xea\x47\x46\xd5\x99\x2e\x9d\x24\x64\x03\x47\x00\xc3\
-\x1e\xa7\x91\xb6\x62\xa8\x22\x2b\x18\xdc\x18\xb1\x57\x5f\x7d\x75\
-\xef\x5a\x1c\xda\xb4\x67\xcf\x9e\xa9\x1b\x6e\xb8\xe1\x39\xed\x66\
-\x77\x61\x49\xfa\x3b\xdf\x2f\xa0\x1c\xe5\x79\x0e\x87\x91\xdd\xd0\
-\xec\x44\xc4\x40\xc6\x38\xc6\x49\x97\x61\xcc\xfb\x71\xa2\x42\x56\
-\xe7\x4c\x62\x29\xda\xfa\x23\xe1\x84\x5f\x5a\xee\xd4\x85\xbf\x0a\
-\x54\x20\x77\xa5\x03\x21\xd9\xc3\x79\xc0\x71\x80\x0f\xf0\x03\xbe\
-\xe0\xa4\x8b\xb7\xf0\x4e\x7c\xac\x12\xbf\x71\x6d\x25\x72\x52\xe5\
-\x29\x75\x2a\x98\x0b\x4f\x99\xf7\xe1\x94\x3f\x12\x4e\xea\x8c\xde\
-\xcf\x1e\x8e\xd4\x4e\xf8\x82\x53\x85\xac\x31\xe6\xc8\x15\xc9\x6d\
-\x76\xa8\x72\x65\x4a\x9b\x84\x12\x81\xcc\x78\xe6\x55\x59\xfd\x48\
-\xc0\x41\x26\x88\xa0\xb9\xa1\xc0\x0a\xe3\x46\x40\x03\x07\x9f\x00\
-\x10\x6d\x6e\xaa\x33\xea\x28\x1c\xc1\x3b\x62\x3e\x8d\x65\x1c\xe0\
-\x27\xfa\x06\x67\x15\x9e\x12\x04\x42\xc6\xca\xe4\x48\xd3\xb6\x52\
-\x6e\x90\x8e\x1b\x05\x31\xa7\xdf\x22\xde\x92\xb4\xc0\xa9\x2e\x75\
-\x31\x7c\x6d\xd2\x5e\x7e\x87\x42\x8f\x2e\xce\xaa\x9f\x83\xa8\xef\
-\x3b\xa2\xee\xdd\xcc\x43\xe9\x63\xf8\xc3\x5c\x94\x33\x4f\xc0\x83\
-\x39\x41\xf0\x80\xf7\x32\x57\xd0\x43\xcc\x1d\xe9\xe5\x3a\x1d\x57\
-\x92\x74\x9a\xe6\xde\x55\x57\x5d\xd5\x9b\x77\xe8\x4c\xe4\x24\xc6\
-\xe0\x73\xd1\xce\x9f\xc9\x66\xcd\x1a\xc4\x5a\xf4\xb3\xa1\xf3\x8f\
-\x7c\x77\x40\x41\x55\xc6\x04\x79\xd7\x3a\xc0\xb8\x20\x43\xf0\x9a\
-\x35\x80\x35\x4b\x3a\x0a\xde\xa0\x7b\xfa\xe9\x27\x78\x23\xbd\xc4\
-\x9a\x21\x3d\xcf\xf8\x51\x27\x75\x07\x7f\x2e\x09\x5e\x7d\x53\x36\
-\xab\x2f\x62\x5d\xdd\xca\x38\xd2\x46\x74\xa9\x64\x9c\x24\x57\x5b\
-\x19\xef\x52\xbe\xe7\x1a\x82\x97\x7f\xae\x84\x12\xeb\x10\x63\xc5\
-\x29\x51\x92\x42\xc3\x26\x94\x38\xa5\x70\xe0\xc0\x81\xdb\xee\xb9\
-\xe7\x9e\xbf\x97\xaf\x31\x02\xe8\x20\x25\x5b\x58\x4f\xa4\x7b\x08\
-\x22\x0e\xa3\xa3\x63\x2e\xcd\x8a\xef\x80\xb1\x66\xca\xbe\x46\xbf\
-\x62\x47\xa2\x5b\x95\x78\x50\x90\xb4\x69\xff\x20\xca\x66\xf5\x63\
-\x03\xb6\x2f\xb6\x59\x35\x91\x54\x26\xcf\x69\x77\xb9\xce\xd3\x16\
-\x6c\x75\x6c\x5f\x92\x00\xac\x0b\xe8\x3e\xe6\x49\x13\xfb\xb7\x6a\
-\x03\xa3\x2f\x79\x06\xfb\x8e\xf5\x85\xfa\x58\x33\xa8\x1f\xfd\xca\
-\xfb\xca\x80\x76\xae\x51\x9d\xdb\xc0\xb1\x2e\x1f\xad\x31\xac\xae\
-\xcb\xe8\x57\xad\xcb\xb4\x8f\x75\x92\x35\x8e\x76\xc3\x03\xbe\x9d\
-\xa4\xd3\x49\x6d\xfd\x48\x88\x84\x12\xcf\xb0\xa9\x11\xbd\x83\xfe\
-\x81\x6f\xf0\x18\x9e\xb3\x66\xa0\x9b\x58\x53\x79\x3f\xed\x88\x77\
-\xff\xbf\xd9\xf4\xb1\x23\xfa\xbe\x2d\xe4\xe4\xeb\xc8\x49\xe9\xc7\
-\xb1\xee\x20\xdb\x75\x36\x3c\x81\x7d\x78\x52\xca\x48\x3f\x1b\x7e\
-\x3a\xd9\x80\x9f\x92\x0b\xf5\x1d\x7e\x23\x13\xc8\x24\x3e\x64\xc8\
-\xe7\x5d\x21\x9b\xdf\x9f\xcd\x9d\x51\x84\x7d\x7c\x1f\x3c\xc2\x87\
-\x44\xaf\x61\x37\x30\x7f\x90\x5f\xe6\x4f\x53\xbd\x96\x3a\xad\xf6\
-\xb4\x79\xcc\x81\xad\x31\x57\xbf\xc1\x7c\x55\x52\x46\x76\x1c\x76\
-\x00\x7e\xa2\x74\x4d\x39\x16\xf8\x14\xd3\x8d\x83\xf8\x2e\x1b\x8e\
-\x72\x55\x1b\x0e\xd9\x8f\x7a\xef\xc8\xa6\x34\x42\xcc\x9b\xd7\xc4\
-\x1c\xba\xad\xb4\xad\x94\x48\x42\xcf\xd0\xe6\xd2\xe6\xa5\xef\xb4\
-\x59\xfe\x75\xb5\xcd\x6a\x6b\x29\x33\xa5\xbc\x50\x1e\x9b\x8c\xe7\
-\x99\x27\xcc\xd5\xe0\xff\x5f\x05\x2f\x7e\x3e\x9b\x64\x18\x86\x61\
-\x18\x86\x31\x3a\xe4\xcc\xe2\x34\x11\x84\xc1\x79\x21\xd8\x53\x06\
-\x0f\xda\x26\x94\x9e\x78\xe2\x89\xb1\x7f\xb7\xa4\x0b\x84\x83\xd0\
-\x0b\xb8\xd2\x7f\x82\x27\x18\x73\x04\xd8\x31\x18\xe5\x18\xc9\x09\
-\x18\x44\x18\x6e\x59\xed\xf3\x10\xce\xc6\x41\x9c\x0f\x08\x47\x95\
-\x24\x0d\x49\x04\x0c\x5e\x78\x8e\xb1\x8b\x83\x80\xd1\x88\xc1\x88\
-\x51\x48\x10\x9d\xa4\x1e\xe3\x80\x53\xc6\x09\x0d\xd1\x3d\xf7\xdc\
-\xd3\xfb\xfb\xed\xb7\xdf\x7e\x5a\xbe\x62\x24\x28\x58\x8e\x91\xab\
-\x9d\xde\x38\x8f\x38\x49\x38\x02\x38\x2b\x38\x2d\x38\x2f\x72\x1a\
-\x65\xe0\x62\xb8\x62\xdc\x62\xd0\x96\x6d\xa6\x8d\x6a\x37\xf7\x9f\
-\x93\x10\xe0\xc4\x1b\xc4\x7f\x43\xfc\x9d\xdf\x29\xc7\x33\x10\xd7\
-\xea\xec\xdf\xbf\x7f\x6a\xdf\xbe\x7d\x3d\x03\x19\x59\xe4\x3d\x55\
-\x63\x1e\xa3\x3b\xc6\xaa\x93\xd3\x12\xe3\x44\x3a\xa1\xdf\xa8\x3a\
-\xa1\x0a\x5e\x2b\x80\x84\xdc\xc9\xe9\xc1\x01\x40\x9e\x70\x20\x71\
-\x1e\xe0\x03\xce\x39\x7c\x61\x97\xb8\xf8\x5b\xf2\x56\xfc\x14\x4f\
-\x4b\x39\x81\xa7\xec\xee\xa4\x0e\xea\xa2\x4e\x78\xca\x18\xc2\x53\
-\x1c\x37\x1c\x98\x4c\x16\xae\xcc\xa6\x4f\x1c\x4a\x6e\xe3\x5c\xe1\
-\x7c\xd2\x2e\xda\x59\x4d\x6e\xd7\xe9\x9d\x2a\x29\x90\x99\x55\x8f\
-\x04\xcd\x0f\xc6\x0f\x07\xb0\x0c\xac\x30\x2f\x18\x37\x82\x4b\x04\
-\xc6\xe1\x29\x41\x72\xda\xdd\x86\xf2\x99\xdb\xf2\x95\x63\x01\xfa\
-\x0d\x79\xc3\x61\x45\xbf\x33\x8f\x99\x3b\x38\x97\x92\xb1\xa6\x6d\
-\xa5\xdc\x74\x3a\x6e\x54\x44\x5b\x37\xa1\x7b\x14\x78\x24\x69\x41\
-\x20\xa0\xaa\x8b\x07\xb5\x97\xdf\x29\x17\x7a\xf4\xa7\xb3\xea\x23\
-\x08\x9d\xf1\x07\x21\x5b\x9f\x67\x0c\xe1\x0b\xff\x6a\x2e\xc2\x1f\
-\x05\x20\x98\x0b\xc8\x1e\x3a\x99\xf7\x52\x2f\x7a\x48\xf3\x10\x79\
-\xd4\x3c\x2c\x75\x5c\x39\xff\xa4\xd3\x34\xf7\xca\x79\x47\xf2\x05\
-\x3d\x1a\x0e\xfe\xfd\xd1\xbf\x81\x49\x93\x49\x21\x74\xd1\x09\xb1\
-\x06\x7c\x15\x5d\xa5\xa4\xb7\x82\x1d\x6c\x7c\x50\x32\x92\xc0\x04\
-\x7a\x8a\x7e\xc0\x6f\xd6\x00\xd6\x2c\x74\xb6\x74\x94\xf4\x7f\xc9\
-\x17\x91\x78\x03\x1f\x59\x33\xa4\xe7\xa9\x0b\xb9\x84\x37\xc8\xe9\
-\xce\x9d\x3b\x1f\x89\xb1\x98\xf6\x0a\xbc\x58\x4b\xef\x25\x30\xa3\
-\x39\x89\x8c\x13\xb0\xa2\x0e\xda\xd7\x74\x3e\xa6\xdc\x3c\x91\xd5\
-\xce\x7b\x04\x2f\xef\x18\x57\x42\x49\x27\x0d\x74\x75\x55\x8c\xf7\
-\x9e\x71\x5d\x19\xf7\x42\x40\xe8\x9f\x43\xd8\x84\x04\x14\xb1\x05\
-\xb0\xb3\x34\xbf\xda\xac\x27\x94\x43\x47\x07\x9d\x91\x55\xcf\x28\
-\x58\x33\xd1\x23\xa5\x7d\x4d\x40\x99\x40\x29\x3a\x5d\x41\xf6\x36\
-\xfd\x0b\x9b\x68\xac\xf6\x09\x6b\x7b\xb9\xd1\xa7\x4c\x24\xa1\xf3\
-\xca\xe4\xb9\xd6\x04\xd6\x79\xda\x82\xad\xae\xc0\x2e\x7a\x0c\xdd\
-\x87\xbe\x67\x9e\x34\xb5\x7f\xa1\xd2\x56\x43\x77\x4a\x2f\x62\x53\
-\x53\xbf\x82\xc3\xf0\x4b\xc9\x25\xd6\xa8\x49\xd8\xc0\xa1\x07\xb6\
-\xf4\x5b\x97\xd1\xd5\xa5\x8f\x84\xbd\x8a\x1e\x67\x2d\x80\x17\xf4\
-\x0b\x7d\xa1\x5b\x2e\xda\x9c\x4e\x82\x28\x8f\x9e\xc1\xee\x43\x77\
-\x70\x4a\x09\x1e\xb1\x06\x8b\x2f\xbc\x53\xb2\x11\x73\xe5\xd9\x6c\
-\xf6\x58\x11\xeb\xe2\xff\x8a\x35\xe6\xd3\xd5\xcd\x76\xe5\x66\x30\
-\xec\xd5\xd2\x86\x67\xee\x32\x17\xd1\x9b\x04\xf8\x25\x23\xfd\x6c\
-\x87\xaa\x7c\x48\x36\x28\x23\xd9\xe0\x59\xd9\xf0\xf2\x8b\x24\x13\
-\xbc\x97\xf7\x87\x4c\x3c\x15\xfa\xe3\xb5\xd9\xf4\x19\x43\xd8\xca\
-\x5f\x85\x4f\xf0\x08\x1f\x92\x75\x04\xbb\x41\x1b\x26\x9b\xe8\x35\
-\x7e\x4f\xfd\x70\x75\x56\xdb\x43\xe8\x8f\xd7\x86\x2e\xf9\x24\x73\
-\x14\xb9\x84\xb0\x53\x4a\x3b\x4e\x73\x56\xfe\xaa\xc6\x42\xbe\x2a\
-\x36\x59\x53\x1b\x8e\x72\x94\xe7\xb9\xd2\x86\x63\x0e\x44\x5b\xce\
-\xce\x66\x4d\x8b\xd0\xed\x2b\x94\xb4\xae\xda\x56\x65\x22\x09\xdd\
-\x2f\xfb\x9c\xbe\x57\xdb\x2c\xfd\x42\xdb\x68\xa7\x74\x89\x48\xba\
-\x84\x36\xcb\x8f\x46\xfe\x98\x27\xc8\x0a\xb2\x19\xe3\xf0\x68\xfc\
-\xfb\x4f\xb2\x69\x86\x61\x18\x86\x61\x18\xa3\x41\xc1\x18\x8c\x3e\
-\x1c\x05\x0c\x19\x1c\x02\x0c\x13\x3e\x86\x8a\x23\x80\x51\x5f\x67\
-\xf0\x57\x09\x67\x01\x8a\x67\xe6\xc4\xf7\x93\x08\x60\xcb\xe8\xc5\
-\x29\x20\x58\x86\x31\x87\xb1\x8b\xb3\x82\xe1\xae\x40\xfe\x74\x84\
-\xa1\x17\xce\xc2\xb2\xac\xf6\x39\x08\x43\xf1\x3e\x82\x05\x38\xd5\
-\x32\x7a\x71\x54\x71\x40\x30\x78\x31\xf0\x70\xca\x78\x1f\x46\x23\
-\x06\x23\x06\x21\x8e\x05\xd7\xcb\xe0\x90\x31\x0e\x38\x54\x22\x76\
-\xfc\xf1\xf7\x28\xf3\xea\x7c\xcd\xd0\x88\x76\x1d\xf9\x9e\x13\xbc\
-\xc0\x38\xc7\xc8\x55\x22\x09\x27\x85\x00\x80\x12\x5e\x72\x90\x14\
-\x3c\x94\x71\x8b\x31\x8b\xc3\xa7\x36\xd3\x46\xb5\x9b\x2b\x2b\x20\
-\xae\x2c\x83\xf4\xff\xfc\x46\x19\x48\x7d\x82\x48\x1e\xd0\x7f\x64\
-\x90\xfa\x79\x0f\xbc\xe1\xbd\x18\xf3\x38\xf4\x8c\x13\xfc\x3b\xe7\
-\x9c\x73\x36\x64\x57\x66\x15\xc2\xf1\xfe\xf1\xe0\xe5\x3d\x75\x4e\
-\x28\x81\x4f\xed\xd4\x25\x30\xa0\xa0\x39\x4e\x8f\x82\x14\x0a\x5c\
-\xd3\x7f\xf8\x00\x3f\xe0\x8b\x78\x24\xbe\x95\xfc\x15\x4f\xc5\xd7\
-\x41\x3c\x65\x0c\xe5\x20\x29\x90\x4b\x7b\x82\xce\xcf\x6e\x4c\x14\
-\xf0\x89\x79\x82\x93\x8e\x73\xc5\xdc\x80\x1f\xb4\x97\x3e\xb4\xd5\
-\x45\x4f\x3e\xf9\xe4\xc8\x89\xed\x6a\x32\x89\xf1\xc3\x01\x54\x72\
-\x06\x07\x99\x79\x41\x3b\xd1\x17\xf0\x14\x7d\x00\x49\x3f\x4c\x47\
-\x45\xd9\x9b\xf3\x95\x63\x03\xfc\x54\x82\x0e\x87\x95\xb1\x25\xf8\
-\xc0\x78\x33\xee\xb4\x55\x81\xb0\x41\x44\xb9\x90\xc9\x5b\xb2\xea\
-\xb1\x23\xd6\xa0\x3b\x99\x23\xe8\x47\x74\x31\x7a\x87\xf1\x67\x4e\
-\xd0\x56\x05\x64\x06\xf1\x95\xdf\x99\x3b\x59\xed\x11\x84\x13\xbd\
-\x13\x9d\x46\xfd\xac\x77\xd2\xc5\x4a\xec\x23\x6f\x24\x22\xd0\x2b\
-\x04\x0b\xe0\x91\x92\x48\xd4\x5b\xce\xc3\x3a\x1d\x57\xa5\x72\xfe\
-\xa1\x17\x35\xef\xe8\x03\xeb\x2b\xf5\x33\xe7\x63\xce\x5d\x96\x4d\
-\x9c\x51\x04\x2f\x3e\xa4\x75\x00\x9b\x40\x89\x36\x64\x9d\x20\xa2\
-\x12\xa7\xc8\x8f\xd6\x01\x6d\x7c\x20\x78\xa1\x35\x40\x3a\xaa\xca\
-\x9b\xaa\x6e\xa2\x0c\x7c\xac\xf2\x06\xdd\x07\x6f\x14\xb0\x89\x31\
-\x79\x38\xde\xfb\x43\xd9\xcc\xe7\x81\xe0\x0c\xf3\x52\x01\x6b\xe6\
-\x24\x7c\x25\x18\xa5\x40\x0c\xf5\x56\xe5\xa4\x4a\xc8\x4d\xcc\x87\
-\x73\xb3\xda\x79\x8f\x98\x2b\x97\x28\xa1\xc4\xba\x40\x40\x8a\x71\
-\x6e\x7b\xe5\x1d\x54\x9e\x34\xe0\x79\xf8\x1d\xfa\xf2\xd1\x58\xc7\
-\x67\xd5\xf7\xfb\x66\x0a\x31\xcf\x0e\x31\xd7\xb0\x09\xb0\xc1\x99\
-\x63\x04\x13\xb1\x77\x9a\xca\x2f\x44\x39\x74\x7a\xcc\xcb\x7d\x59\
-\xf5\x8c\x81\x75\x13\x5d\xc2\xdc\xa4\x6f\xd2\xe9\xb2\xaf\xa5\x5b\
-\x69\xf3\x20\x9d\x2e\xa2\x6c\x56\x3f\x16\xf4\xb3\x7d\xeb\x92\xe7\
-\xd8\x9c\x5a\x37\x69\x37\x6d\x96\xad\x4e\x60\x17\x3d\x56\xda\x67\
-\xa5\xfe\x93\x6d\x56\xb5\x7f\xeb\x74\x62\xa9\x17\xd1\xa7\x0a\x0e\
-\xf3\x3e\xde\xab\x44\x02\xfa\x91\x79\xd9\xb5\x0d\x1c\x6b\xe5\x3d\
-\xe5\xba\x4c\x42\x50\x63\x58\xae\xcb\x8c\x8f\xec\x55\xd6\x02\xd6\
-\x49\xfa\x42\x7f\x65\xb7\xb5\x49\x26\x41\x94\x57\x32\x5a\x49\x25\
-\x78\x03\xbf\x79\x0f\x7c\xe1\x9d\xbc\x3b\xf5\xf7\xf5\xd9\xec\xb1\
-\x21\x74\xe0\x07\x90\x11\x12\x8e\xac\x8b\xe5\x86\xc0\xe9\x6c\x78\
-\xd6\x46\xec\x90\x52\x46\xa6\xb3\x1d\xea\xe4\x43\x72\x51\xae\x97\
-\x55\x1b\x1e\xfe\xe3\x3b\xa2\x2f\x78\x3f\xbe\x5a\x8c\xd1\xdf\x84\
-\xdc\xbe\x3b\xbb\x30\x71\x6c\xdd\xba\xf5\x07\xb1\x97\xe1\x15\x7c\
-\xc2\xd7\x65\x1e\xe1\x63\x20\xbb\xf0\x66\x90\xed\xc9\x78\x42\xa9\
-\x1f\xfe\x28\xab\x7e\x51\xc8\xdd\xef\x23\xf3\xcc\x4f\xec\x39\xd6\
-\x28\x12\x9d\x65\x22\x49\x76\x9c\xe6\x2c\x7a\xb4\x1c\x8b\xe9\xec\
-\x94\x92\xf8\x7b\x69\xc3\x49\xee\x68\x93\xec\x14\x78\x1e\xbe\x71\
-\x5f\x5e\x1f\x75\xd4\x51\xdf\x14\x3a\xe5\xda\x52\xcf\x54\x6d\x2b\
-\x36\x95\xc2\x1f\x7c\x09\x92\x3e\xac\xb5\xf2\x01\x07\xb5\x59\xb2\
-\x52\x95\x19\xca\x51\x5e\x3a\x04\x9e\x22\x2b\xd4\x8d\xee\x88\x77\
-\xcd\xf8\x1a\x61\x18\x86\x61\x18\xc6\x0b\x00\x2b\x73\x07\x3b\x41\
-\x52\x8c\x63\x76\xc7\x90\xdc\xc0\x89\xc5\x70\xc5\x40\x21\x10\x80\
-\x51\x5f\x67\xf0\x57\x49\x0e\xc0\xa3\x8f\x3e\x7a\x6a\xbe\x62\x56\
-\x23\x9c\xa5\xc3\x18\xbd\x18\xa5\x04\x88\x31\xea\x30\xe8\x30\x40\
-\x31\xc0\xca\x00\xa2\x1c\x81\x2a\xf1\x77\x0c\xb7\x30\x36\x97\x64\
-\xb5\x47\x10\x8e\xc6\xdd\x38\x61\xd4\x8f\x01\xa9\xdd\x6c\x18\xbd\
-\x04\xe7\x30\x46\x31\x4a\x31\xf4\x70\x8e\x30\x58\xa9\x13\x83\x90\
-\xe0\x0b\x57\x7c\x11\xbc\xc1\xa1\x2a\x89\xbf\x8d\xca\xe3\x18\xef\
-\x23\x57\xdc\x95\x27\x2f\x14\x60\x2d\x4f\x4e\xe1\x24\xe1\xc8\x22\
-\x17\x38\x70\x18\xa8\xe2\x0b\xc6\x2d\x46\xac\xda\x8b\xe3\x57\xd7\
-\x66\xe4\xa8\xa4\xea\xef\x10\xcf\xf1\x3c\xf5\x50\x1f\xf2\x47\xfd\
-\xbc\x47\x86\x31\x4e\x86\x02\xb2\x38\x28\xec\xd6\x0c\x27\x6a\x7d\
-\x76\x6b\x56\x20\x1c\x9d\xe3\xc3\x79\xf8\x8a\x76\xbd\x8a\xb7\xc8\
-\x01\xe3\xcf\x2e\x64\x39\xa1\xf4\x81\xe0\xa7\x02\xfc\x38\x10\x38\
-\xe4\x38\x30\xe2\x2f\x7c\x68\xca\xdf\xea\xdf\xab\x3c\x65\xac\x4a\
-\x9e\xca\x41\x52\xb2\x0e\x99\x64\xdc\x63\x2e\x9c\x95\xdd\x99\x18\
-\xe0\x15\x81\x7e\x1c\x2d\x82\x4f\xb4\x85\x76\xc1\x0f\xda\x4c\x7f\
-\x9a\x26\x94\x32\x10\x31\x52\x62\xbb\x2e\x99\x44\xb0\x49\xbb\xc8\
-\xcb\xf9\xcb\xbc\x90\xbe\x40\x1f\xc0\xdf\xaa\xae\x28\x89\xdf\xa1\
-\x74\xfa\x6a\xaf\x67\x1b\x15\xda\x59\x8c\xb3\x8d\xce\x21\x00\x85\
-\xac\x31\x8f\xd1\x37\xa5\x93\xda\x8f\xd4\xce\x74\xa8\x9f\xa7\xe3\
-\xc6\x85\x68\xeb\x97\x49\xb8\x12\x1c\x40\x17\x13\x18\x21\x68\x85\
-\x63\xcd\x9c\x80\xb7\xb4\x55\xbc\xed\x47\xc9\xcf\xaf\x67\xb5\x2f\
-\x8a\xb1\xf9\xc9\x98\x63\x77\x2b\x08\x81\x6c\xa1\xe3\xa4\x8b\x09\
-\x76\x68\x2e\xe2\x68\xcb\x99\x47\xcf\x30\x37\xd0\xc9\xd4\x59\x9d\
-\x87\x75\x73\xb0\x8e\x34\xf7\xa4\xcb\xe0\x23\x7a\x8c\x39\x87\x4e\
-\x65\xbd\x09\x39\x3a\x21\x9b\x3b\x71\x04\x0f\x5e\x15\x6b\xe0\x91\
-\x8f\x59\x2b\xb0\x2a\x5d\x45\xc0\x0c\x59\x27\xd8\x81\x6d\x40\xb0\
-\x0c\xf9\xd1\x98\xd0\x1f\xe4\x04\xbd\x42\x30\x4c\x3a\xaa\x8e\x17\
-\x25\x49\x2f\x49\x27\x51\x87\x78\x03\xef\x99\xf7\x04\xc9\x08\xae\
-\x87\x2c\x3c\x54\x97\x54\x0a\x39\xf9\x27\x6a\x2f\xf3\x12\x19\x27\
-\x90\xa4\x39\x59\x8e\x5f\x9d\xac\x94\x44\x99\xe8\xcf\xef\x65\xd5\
-\xf3\x1e\x61\x03\xac\x20\xb8\x8e\xae\x63\x6e\xc0\x53\xc6\x1c\x5e\
-\x31\x6e\xac\x35\x4d\x03\xc4\x94\x43\x6f\xf3\x1c\xb6\x0d\x63\xcc\
-\xf8\x20\x4f\x31\xbe\xbb\x82\x5e\x9c\xaf\x9d\x97\x88\x79\xb6\x83\
-\xf9\x46\x70\x91\xb5\x17\xbe\x20\xff\xe5\x1c\x83\xef\xa5\x5e\xae\
-\x92\x64\x18\x9d\x1e\xcf\x8d\x7d\x73\x42\x1b\x44\x5f\x76\x61\x57\
-\x12\x80\xd7\x7a\xce\xdc\x44\x8e\xb0\x25\xb1\xdf\xda\xf6\x0d\x1a\
-\xd7\x3a\x89\xed\xcb\x69\x81\x72\x6d\x2f\x6f\x0d\xa0\xad\x0a\xf0\
-\x32\x16\x24\xcf\x91\xd7\xea\x9a\x40\xdb\x90\xe7\x36\xf6\x59\x95\
-\xca\x32\x55\x5b\x0d\x7d\x2a\xdd\xc8\xfb\x78\x2f\xef\xa7\x1d\x0a\
-\x68\xcb\x06\x3e\xe7\x9c\x73\xee\xca\xee\x8d\x15\xb1\x26\xfc\x0d\
-\xeb\x32\xbc\xa9\xae\xcb\xd8\x10\x5a\x97\xcb\x31\x84\x27\xb4\x9d\
-\xbe\xd0\x2f\xe6\x3e\xf6\x58\xdb\x84\x12\x24\xdd\x41\x3d\xd4\x27\
-\x9e\xb0\x96\xea\x7d\xbc\x1b\x39\x0a\x3a\x2e\x9b\x3d\x32\x62\xdd\
-\xfb\x89\x58\x57\x0e\x96\x1b\xc2\x94\x70\xd4\x66\x3b\x92\xbf\xf0\
-\x1e\x3b\x50\x36\xbc\x92\x00\xe5\xda\x58\xca\x48\x53\xf9\xa8\xfe\
-\x5e\xae\x97\xb2\x25\xe8\x37\x32\xc1\x38\xe0\x3b\x60\x4f\x30\xbf\
-\x58\x33\x59\xb3\x83\x4e\xcf\xee\x4c\x14\xa1\xcf\xfe\x10\x7e\x31\
-\xf7\xb1\x21\xb0\xe5\x69\x13\xf3\x88\x76\xa2\xff\x65\x7b\x6a\x6e\
-\xd7\x11\xbf\xc3\xc3\x28\xfb\xdd\xd4\x1b\x73\x70\x31\xfd\xc3\x8e\
-\x25\xd9\xcb\x18\x10\xb7\x40\x6f\x96\x89\x3d\xec\x38\xe6\x06\x7a\
-\x86\xb9\xc2\xfb\xb0\xcb\x19\x8b\xaa\x9d\x52\x37\x16\x55\xa2\x4c\
-\xd5\x86\x63\x1e\x32\xd6\x24\xf3\xc2\x86\x7b\xb8\xd7\xf1\x0a\x62\
-\xed\xfc\xa7\xe1\x63\x3f\x82\x1f\x28\x19\x82\x27\xd8\xb8\xb2\xad\
-\x48\x7e\x91\xb0\xc6\x0e\x94\x9e\x29\x7d\xec\x26\x6d\xae\x93\x19\
-\xb5\x99\xe7\x90\x3f\xf8\x89\x1f\x05\x3f\x90\x53\xf8\x18\x7c\xfa\
-\xaf\xd9\x54\xc3\x30\x0c\xc3\x30\x8c\xe1\xc0\x09\x1d\x9c\x29\x8c\
-\x64\x82\x6d\x38\x0b\x18\xc6\x04\xbb\x30\xe6\x30\x46\xe4\x0c\xd4\
-\x19\xfb\x55\x92\xf1\x9f\xd5\xcf\x7a\x10\x70\x65\xb7\x90\x02\xae\
-\x04\xa3\x08\x28\x62\x74\x61\xa8\x57\x83\x88\x75\x24\x03\x3f\x0c\
-\xb6\x5f\xce\x6a\x7b\x08\x27\x63\x3f\xbb\xf9\xd8\x35\x4d\xb0\x0b\
-\x27\x04\x1e\xf3\x37\x8c\x5e\x0c\x48\x8c\x51\x78\x8d\xf1\x88\xc1\
-\x87\xe1\x47\x7d\x32\x18\x31\x12\xe1\xa7\xc6\x00\xe2\xbf\xf9\x7b\
-\x94\x1b\x3a\xa1\x24\x87\x5a\x4e\xbf\xee\xb9\x9e\xee\xe4\x54\xe9\
-\x3c\x96\x7c\x29\x0d\x5c\x19\xb6\xd5\x36\x0f\x22\x95\x57\xdf\x20\
-\x19\xc6\x72\xa2\xe4\x58\x63\x64\xc3\x2f\x25\x41\x08\x3a\xe2\xf8\
-\x7f\x70\x96\x7c\x37\x60\xe9\xd2\xa5\x57\x55\x83\xb3\xe2\x2d\x0e\
-\x10\xce\x15\x4e\xa8\x76\xeb\xd1\x07\xfa\xa2\x40\x05\x72\x50\xe5\
-\xaf\x78\xd1\x96\xbf\x75\x3c\x65\xac\xea\x78\xca\xfb\x15\xe4\x26\
-\x60\xc0\xf8\xc7\x7c\xd8\x9a\xdd\xea\x1c\x31\x4f\xde\x8a\x2c\x92\
-\xb4\xc1\xd9\xc2\xd1\x62\x87\x21\x0e\x16\xce\x27\x6d\xa5\x0f\xf4\
-\xab\x4e\xf7\x54\x89\x7e\x8f\x32\x47\x48\x26\x29\xd9\x4a\xd2\x99\
-\x31\x64\x0e\xa3\x27\x08\xfa\xe1\xb4\x12\x5c\xc7\xa9\xc4\x51\x63\
-\x5e\x94\x81\x03\xa8\x4e\x5f\x40\xfa\x1d\x8a\x67\x16\xe6\x2b\xc7\
-\x0a\x36\x0b\xc0\x4f\x02\x65\xf0\x13\x67\x9b\xc0\x07\xce\x24\x63\
-\x8d\x53\x5c\x3a\xaa\xd3\x11\xed\x4c\x1d\xb7\x28\xab\x1f\x2b\xa2\
-\x6d\x2f\x51\x32\x91\x79\xa2\xab\x57\xe1\x2f\x89\x7d\x39\xd6\xb4\
-\xb5\x1f\x5f\xc5\x4f\xda\x19\x3c\xbd\x95\x7a\xef\xbc\xf3\xce\xb7\
-\xc5\xfc\xfa\x3a\xba\x96\xb5\x8d\x7a\xd1\xc1\x90\xae\xa8\xe1\xef\
-\x4a\x0c\x96\x89\xa4\xd2\x99\xa7\xde\xea\x3c\x6c\x32\x07\x35\xf7\
-\xf4\x1c\x75\xd0\x3e\xea\x65\xae\x13\x38\xe0\x9d\xe1\xdc\x7f\xb2\
-\xc7\x88\x09\x63\xe3\xc6\x8d\xaf\x0e\x3d\xf5\x25\xe4\x1c\xfe\x2b\
-\x69\xca\x7a\x08\x8f\xe0\x0f\x6b\x15\xf3\xb0\x0c\x76\x94\xeb\x80\
-\xe4\x67\xba\x35\xab\x4a\xfa\xbd\xd4\x49\xd4\x21\xde\x48\x1f\x11\
-\x7c\x42\x06\x98\x6b\xa1\x8f\x9e\x17\x24\xdf\xb6\x6d\xdb\x3b\xd0\
-\xaf\xb4\x99\x40\x30\x32\x8e\x5e\x55\xb0\x53\x73\x52\x72\x53\x27\
-\x3b\xa5\xdc\x84\x9e\xf9\xbe\xac\x7a\xde\x23\xf4\xdc\x6b\xd0\x79\
-\x0a\x22\x33\x3f\x18\x7b\x78\x8a\x1c\x33\x76\x6d\x12\x4a\x8c\x3b\
-\x63\x0d\xaf\xd1\x3d\x04\x5d\x59\x6b\x18\xaf\xd0\xa7\x9f\x3f\xf7\
-\xdc\x73\x4f\xcc\x57\xcf\x3b\xc4\x5c\x3b\x9a\x20\x23\x73\x4e\x36\
-\x38\x36\x17\xf3\x8c\xf9\x80\x6c\xd6\xc9\x6e\x95\x90\x73\xe4\x3d\
-\xe6\xcf\x4d\x59\xf5\x8c\x80\xb5\x53\xeb\xa6\x12\x65\x04\xb8\xd1\
-\x23\x9a\x9b\xc8\x80\xf4\xc7\xa0\xbe\xf1\x3b\xe5\xb2\xfa\x91\x40\
-\xdb\xca\x2b\xee\xa6\xb3\x7d\xd1\x3d\xd2\x79\xda\xe4\x53\xae\x09\
-\xb4\x4d\x7a\x4f\xba\xaf\x89\xfe\xab\xa3\x52\x27\x4a\x2f\x4a\x37\
-\x32\xdf\xe8\x7f\xd5\x5e\x63\xad\x92\x0d\xcc\xc6\xaf\xb0\xd7\xd6\
-\x66\x37\xc7\x82\xf0\x13\xbe\x07\x1e\x29\x61\x4f\x10\xbf\x5c\x97\
-\xc5\x8f\x72\x0c\x69\xab\xd6\x4a\xf1\x82\xfe\x0d\x93\x4c\x12\xc9\
-\xaf\x14\x5f\xc4\x13\xc9\x07\xef\x67\x8e\x84\x7d\xf2\x1f\xb2\xe9\
-\x23\x21\xd6\x92\xdf\x0d\xf9\xf8\x8a\xd6\x45\xe4\x18\x3b\x8a\x9b\
-\x05\xf0\xe7\x74\x5a\xb7\x9a\x48\x62\x4c\xb0\x55\xe5\xcb\xd1\xae\
-\x3a\x19\xd1\x58\x57\x65\xa0\x1f\xa9\x7c\x29\x17\xf4\x1f\x9e\xf3\
-\x1e\xde\xa7\xc4\x12\x7a\x83\xf1\xc1\xe6\x61\xed\xbe\xf0\xc2\x0b\
-\xff\x7b\x76\x6b\x62\x88\x39\x7f\x21\xb6\x04\xf3\x8a\xb9\xaf\x8d\
-\x9a\xcc\x25\x78\x44\x7b\x65\x7b\xd2\x07\xc9\x4e\x49\xfc\x4d\xe3\
-\x4a\x9d\xc1\xd7\x1b\xe0\x31\x76\x08\x7c\xa7\x4e\xd6\x7b\xfc\x69\
-\xe6\xac\x12\x7b\xa5\x1d\x57\x26\x65\xa8\xa7\xdf\x58\xd4\xf1\x5c\
-\x54\xc7\x77\xea\xa2\x4e\x78\xce\x3c\xc8\x04\xcd\x73\x92\x33\x24\
-\x93\x96\x2d\x5b\xf6\x10\xf2\x83\x1f\x28\x1f\x42\xb6\x95\xae\x8d\
-\x44\x27\x12\x73\x80\x37\xd4\x25\x5f\x42\x3e\x60\xd9\x66\xda\xd1\
-\xa4\xcd\x50\xd9\x6e\x9e\x87\x9f\xd4\x09\x3f\x90\x13\xde\x17\x6d\
-\xbe\x2f\x9b\x6b\x18\x86\x61\x18\x86\x31\x1c\x38\xa1\xa3\xdd\x67\
-\xec\x44\x25\xa1\x82\xc1\x86\x03\x85\xc1\x84\x31\x83\x61\xd2\x26\
-\x70\x80\x11\x93\xd5\xcf\x6a\x28\x80\xcd\xc9\x11\x02\xae\x18\x78\
-\x18\xa4\x18\xa3\x18\xa2\xf4\x5f\x8e\x11\x3c\xe8\x47\x32\xda\xb2\
-\xda\x1e\xc2\xc9\x5b\x81\x83\x87\xc1\x0b\x5f\x31\x20\xf9\x97\xff\
-\x87\xc7\xec\x0e\xe2\x3d\xf0\x19\x03\x0f\x43\x0f\x5e\xeb\x5d\x18\
-\x84\xfd\x78\x9e\xce\xd5\x48\x27\x2f\x4a\x87\x5a\xc7\xef\xe1\x81\
-\x76\x66\xca\x30\xc7\xe8\xc4\xf8\xc4\x49\x92\x51\x5e\x75\x16\xcb\
-\xf6\x96\x54\xd7\xf6\xa6\xa4\x3a\x64\x18\x43\xa5\x61\x8c\x13\x85\
-\x33\x8b\x73\x82\x03\x85\x41\x1e\x86\xf9\xed\xd9\xbd\x19\xc1\x96\
-\x2d\x5b\xbe\x2d\x1c\xef\xbb\xcb\x64\x52\xb9\x1b\x4d\xbc\x45\x2e\
-\x74\x9d\x8d\x92\x89\x0a\xae\x74\xc1\xdf\xea\x73\x55\x67\x43\x8e\
-\x69\xd5\xd9\x60\xfc\x91\x83\x8b\x2f\xbe\x78\x5d\x76\xb1\x53\x90\
-\xdc\x86\x67\x24\xb7\xb5\x53\x1b\x3e\xe1\x44\xe2\x60\xe1\x5c\x8a\
-\x17\x75\xfd\x2c\x89\x7e\x8e\xa2\x87\x94\x4c\x52\x30\xa1\x9c\x1f\
-\x04\xfc\x70\x02\x09\x86\xe2\x00\xe2\x54\x22\x8f\xf0\x10\x7e\x42\
-\x1a\xb7\x7e\x44\xdb\x92\xff\x9d\x5d\x0d\xaa\xd3\xa7\x25\x3f\xd1\
-\x3b\x04\xe9\x19\x67\x1c\xfa\xaa\x9c\xf5\x23\xc9\x4a\x56\x3d\x76\
-\xac\x5b\xb7\xee\x1d\xb4\x95\xc4\x00\x3b\x4e\x09\x10\x28\x00\x81\
-\x83\x0d\x7f\xd1\x8f\x4d\xda\x4a\x3b\xa3\xec\xc9\xa1\xaf\xde\x4b\
-\x40\x96\xfe\x12\xf4\x21\xe9\x4c\x50\x93\x24\x09\x7a\x98\xb9\x48\
-\x70\x0c\x9e\x10\x10\x50\x00\x42\xce\x3c\xe3\x29\x47\x9e\x7a\xab\
-\x73\xb0\x4e\xee\xfa\x51\x39\xef\xa8\x8f\x39\x07\xff\x79\x17\x3a\
-\x8c\x7e\x86\x0e\x3b\x39\xd9\x31\x11\x84\x2c\xbf\x3c\xe4\xfb\x73\
-\x92\x73\x05\x56\x49\x9a\xb2\x56\xc1\x2b\x74\x15\xbc\x63\xa7\x2f\
-\xb2\x0e\x3f\x15\x0c\xd2\x7a\x55\xc7\x9f\x3a\x1e\x54\x49\x65\xab\
-\xbc\x81\xe7\xcc\xf5\x32\x60\x83\xae\x24\xc0\x1b\xfa\xe8\x39\xdf\
-\x0b\x89\x35\xfc\x12\xda\x4c\xd0\x9a\x36\x33\x37\xd1\x19\xe8\x55\
-\xd6\x2c\xf4\x29\xf5\x0d\x92\x9b\xae\xe5\x7b\xae\x22\x74\xc8\xe3\
-\xa5\xee\x60\x8e\xa0\x3b\x34\x17\xdb\x8e\x35\xcf\x30\x1e\xcc\x67\
-\xea\x61\x9c\x14\x20\x64\x03\xc1\xce\x9d\x3b\xef\x89\xb9\xff\x8e\
-\x7c\xfd\xbc\x41\x99\x50\x22\x30\xca\xda\x0b\x6f\xb0\x0b\x9a\xca\
-\x30\x54\xf2\x37\xab\x9e\x38\xb4\x76\xa2\xcf\xb1\xad\xd1\x27\x04\
-\xe0\xd1\xbf\x04\xba\xb1\x79\xe9\x17\x73\xbc\x4d\xbf\x62\x7e\x8e\
-\xbc\x56\xd6\x6d\xa4\x62\x7d\xd4\xda\xae\x24\x81\x6c\x5f\xda\x8a\
-\x0e\x92\xce\xab\xae\x09\x50\x75\x5d\x10\xd5\xcd\x83\xa6\xa4\x3a\
-\xa8\x5b\xba\x31\x79\xd0\x5b\x3b\xe0\x1d\x6b\x94\x6c\xe0\x32\xf1\
-\x1e\x7c\x1e\x5b\x52\x69\xfd\xfa\xf5\xbf\xaf\x4d\x29\x75\xeb\xb2\
-\xd6\x01\xda\x56\x1d\xc7\xb6\xeb\xc1\x20\xaa\xe3\x89\x48\xbc\xc9\
-\x66\x8f\x84\x90\xd7\x77\x49\x46\xca\x75\x51\x09\x47\x6c\x07\x12\
-\x8e\x6c\xba\xc2\x06\x54\x22\x89\xb1\x60\xcd\x62\x6c\xaa\x36\xbc\
-\xda\xac\x3e\x0c\xcb\x93\x92\x07\x65\xbf\x79\x1f\x7a\x42\x6b\x26\
-\x72\xcb\x9a\x9d\x9b\xed\xbe\x18\x76\xce\xbf\xc9\xee\x4d\x04\xe1\
-\xf7\x3c\x0c\xdf\x58\x97\x39\x85\xc3\x89\x22\xe6\x14\x6b\xb9\xe6\
-\x7e\xc9\x9f\x7e\xc4\xef\x31\xdf\x9e\x51\xdf\xf0\x4d\xf0\x9b\x59\
-\x8b\xd0\x27\xf8\xd2\xd4\xcd\x9c\xe5\x6f\x8c\x47\xe9\x53\xc9\x2e\
-\x2f\xe7\x6c\x75\x2c\xea\xf8\x5c\xa5\x2a\xdf\xc5\x73\xe4\x9f\xf7\
-\xc0\xef\xb0\x51\x8e\x5c\x21\x17\xf2\xf1\x4f\x42\xa7\x7c\x0c\x7b\
-\x16\x3e\xa0\x07\x4b\xdb\x8a\xb5\x0e\xdb\x93\xf1\xa1\x3f\x4a\x24\
-\x95\xb6\x55\xb5\xcd\x6d\xda\x2b\x2a\xdb\x9d\xbc\xec\xf1\x9e\xf7\
-\xc0\x23\xe6\x71\xac\xbf\x13\x4f\x38\x1a\x86\x61\x18\x86\xf1\x02\
-\x02\xbb\x08\xd9\x7d\xc6\x95\x14\xec\xde\x26\x80\x84\x51\x86\x81\
-\x8c\xc3\x82\xd1\x24\x63\xa6\xce\x60\xa9\x12\x65\xc3\x08\x9a\x13\
-\xdf\x4f\x2a\xaf\xfb\x63\x77\x33\x01\x46\x82\x56\x24\x28\x08\x46\
-\x61\xd8\xc9\xe8\x2d\x0d\xba\x2a\xc9\xc0\xcc\x6a\x5f\x14\xc6\xe5\
-\x69\x0a\x92\x28\x80\x09\xf1\xdf\x32\x22\x31\xe4\xe4\x84\xc8\x80\
-\xac\x1a\x8f\x75\xfc\xd5\x3b\x47\xe1\xb1\xae\xb9\xa3\xef\x24\x93\
-\x30\xfa\x71\x16\x71\xfa\xeb\x4e\x4e\x11\xf4\x54\x40\x17\x83\x54\
-\x4e\x00\xed\x2c\xf9\x52\xd7\xde\x51\x48\xf5\x42\xbc\x87\x77\xf2\
-\x6e\xf8\x24\x07\x0a\xc3\x18\x43\x9c\xb6\xe6\xd5\x03\xab\xb2\x9b\
-\x13\xc5\xce\x9d\x3b\xbf\x5b\x7c\x2d\x93\x10\xcc\x2b\x76\x78\xe3\
-\x84\xe2\xf8\xe8\xc4\x17\x01\x00\xc6\x7f\xba\x44\x5d\x57\xfc\x2d\
-\x79\x0a\x89\xa7\x8c\x2f\xed\x60\xbc\xe1\x29\x8e\xb2\x82\x14\x41\
-\x9d\x9f\xfe\x22\xa1\x04\xdf\x94\xdc\x86\x5f\x24\x0a\x71\xb6\xe0\
-\x11\xed\x83\x2f\x4d\x78\x41\x19\xfa\x95\x55\xb7\x02\xe3\x58\x97\
-\x6c\x45\x3f\x12\xec\x63\x0c\x09\x70\xe3\x44\x12\x14\xd5\xdc\x28\
-\xe7\x6f\x39\x6e\x55\xe2\x37\xca\x8d\x32\x87\x9b\xa0\xba\x59\xa0\
-\xca\x4f\x1c\x6d\x78\x34\x5d\x5b\xa1\xa2\xbd\x9d\x05\x29\x63\x9e\
-\xbc\x5f\xc9\x2f\x82\xaa\x4a\x26\x32\xaf\x99\x23\x0a\x40\x34\xe1\
-\x2d\x7d\x0a\x3d\x75\x18\xbd\xca\xb3\x04\xc1\xb5\x63\x17\xfd\x4b\
-\x10\x82\x75\x8e\xff\x47\x4f\xa3\x8b\xcb\xa4\x79\x35\x20\x54\x7d\
-\x67\x9d\xbc\x35\x21\x3d\x0f\x2f\xa9\x97\x77\xf0\x2e\x25\x95\x6e\
-\xba\xe9\xa6\xcf\x24\x3b\x3a\xc7\xb6\x6d\xdb\x7e\x38\xf8\xfd\x14\
-\x72\x4e\xc0\x50\xeb\x80\xe4\x9c\xc4\x0c\xf3\x1e\xbe\xb1\x1e\xd2\
-\x3e\x64\x1d\x9b\x80\x36\xf7\x0b\x76\x0c\xcb\x1f\x3d\xab\xf1\xa3\
-\x6e\xe6\x94\x12\x0f\x9c\x66\x51\x80\x2c\xda\x75\x24\x00\xb2\x66\
-\xcd\x9a\x67\x08\xf4\xd1\x6e\x76\x2a\x13\xe8\x63\x4c\x19\x4f\xd6\
-\x06\xcd\xcb\x6a\x1b\x4b\xe2\x37\xfa\x11\x7d\xba\x23\xab\x35\x12\
-\x31\x17\xb7\x94\x81\x64\xd6\x2d\x02\x96\xe5\x7c\xac\x1b\xcf\x3a\
-\x12\xaf\x19\x5f\x8d\x2d\x09\x4a\xe6\x38\x72\xc6\x49\x25\xe4\x0e\
-\xf9\x0b\xf9\x3c\x14\x6b\xe6\x8c\x7d\x03\x64\x26\x80\xee\xe3\xf4\
-\x03\xba\x8f\x24\x2e\xeb\x6f\x19\x7c\xad\x9b\x6b\x25\x49\x8e\x29\
-\xcb\x3a\x1e\xf3\x66\xe4\xef\x6b\x0e\x83\x45\x8b\x16\x1d\xc6\xaf\
-\x40\xa7\x90\x24\xc3\xfe\xa1\x4f\x04\xe0\xd1\xb5\x8c\x39\x7a\x44\
-\xb6\x24\xed\x1e\xd4\xaf\xe8\xd3\x58\xd6\x4a\x6d\xa4\x42\xe7\xe1\
-\xf7\xa0\xf3\xb0\xfd\x75\x6b\x00\x6b\x7b\x19\x94\x96\xed\x5b\x06\
-\xa5\x69\xf3\xb8\xf4\xde\x74\x54\xd6\x0d\x89\x4f\xd2\x8f\xb2\x81\
-\x59\xb3\xe0\x29\xeb\x1c\x1b\x23\xe8\x43\xcc\xa5\x5f\xcb\x2e\x8f\
-\x84\xf0\x91\x2e\xd0\x49\x93\xea\xba\x8c\x5e\x86\x2f\xb4\x45\x6d\
-\xab\xb6\xb9\xae\x5f\xa3\x50\xb5\x7e\x88\xf7\x32\x1e\xc1\x97\xc7\
-\xb2\xd9\x43\x23\xd6\x93\xff\x2d\x19\xc1\x1e\x91\x8c\xa0\x03\xd1\
-\x4b\xf4\x5f\x37\x0b\x20\xcb\xac\x4b\xa5\x0d\xaf\xf5\xa6\x9f\x8c\
-\x40\x75\xfd\x6a\x43\x65\x5d\x45\xdf\x7b\xf2\xc9\x78\x20\xaf\xe8\
-\x0d\xd6\x6c\xda\x48\x5b\xa3\xcd\xfb\xb3\x8b\x13\x01\x1b\xea\xd8\
-\x4c\xc7\x89\x2e\xfc\x4a\xec\x2d\xfc\x1e\xda\x04\xaf\x90\x5d\xda\
-\x5c\xc7\x9f\x92\xd4\x37\xf8\x8a\xce\x90\x5f\xc2\x1c\x25\x81\x04\
-\x21\x8f\xac\x1f\x75\xe3\x51\xb5\xe3\xaa\xf5\xd7\xf1\xb7\x1f\x95\
-\xcf\xd1\x2e\xcd\x41\xd9\x99\xd8\xd5\x31\xff\x7e\x90\xfe\x87\x9c\
-\xfc\x19\xba\x1c\xdb\x04\xf9\xc1\x0f\x44\xcf\x54\x6d\x2b\xf9\x81\
-\x8c\xd7\xa4\x6c\x2b\xea\x87\x37\xd8\x47\xb9\x79\x70\x77\x6f\xd0\
-\x0c\xc3\x30\x0c\xc3\x30\xda\x82\x13\x3a\x04\x4d\xcb\x13\x3a\x18\
-\x3a\x04\x6e\xb4\xfb\x0c\xe3\x43\x46\x4d\x9d\xb1\x52\x25\xca\x86\
-\x31\x34\x67\x12\x4a\x04\xb0\x71\xe4\x71\x7a\x09\x16\xe3\xc8\xe3\
-\x98\xe1\x48\x96\x01\xd7\xba\xbe\x8a\xca\x3e\x87\x61\xb9\x18\xc3\
-\x92\xa0\x16\x8e\x07\x75\xe2\x84\x94\xc7\xf1\x31\x7c\x65\x58\x2b\
-\x58\x50\x1a\xbc\x75\xef\x10\xc9\x30\xec\x75\x60\x08\x94\x49\x0f\
-\x1c\x7e\xfa\x2e\x87\x9a\x80\x33\x06\x3a\x3b\xa6\x30\xcc\xfb\x05\
-\xcb\x9b\xca\x42\x17\xa4\xfe\x27\xcf\x8f\x38\x1a\x32\xe8\x71\x5a\
-\x62\x0c\x5f\x9f\xdd\x9d\x08\xb6\x6c\xd9\xf2\xaf\x42\x8e\x1e\x85\
-\xaf\x04\x52\x08\xe2\x93\xa4\xc4\x99\x28\x77\xfa\xd7\x39\xa1\xfd\
-\x1c\x88\xba\xbe\x77\x45\xe2\xa9\x9c\x24\x05\xfb\x68\x23\x49\x93\
-\x0c\x52\xdc\x93\xdd\xed\x0c\x0a\x42\x95\xc9\x6d\xde\xcd\x5c\x41\
-\x17\xe1\xbc\x35\xe1\x8f\xfa\x13\x7d\x69\xad\x87\xca\xf9\x51\x9e\
-\x4c\xa2\x3d\x0a\x38\x31\x3f\x70\xc4\x70\x02\x71\xcc\x18\xbf\x36\
-\x63\x47\x99\x28\xdf\xb9\x8e\x9c\x6e\xb3\x00\xe3\x3b\x09\x7e\x36\
-\x05\xc9\x2f\xf8\x4d\x00\x52\x3b\x5a\x49\x7e\x31\x57\x70\x7c\x15\
-\x80\x68\xc2\xdf\x6c\x6b\x6f\x6e\x31\x46\xd4\xc1\x98\x51\x1f\xc1\
-\x07\x74\x1c\xfa\x59\xa7\x6e\x08\x90\x6b\x2e\x2a\x00\xc1\x78\xf2\
-\xae\x26\xef\x1b\x86\xa8\x57\xf3\x8d\xf7\xb2\xde\xd0\xce\x5b\x6e\
-\xb9\xe5\x57\x92\x25\x9d\x21\xd6\xf9\x7f\x18\xbc\x7e\xa4\xba\x0e\
-\x68\x53\x01\xbc\x27\xf8\xcb\xdc\x63\xfe\xc3\x9f\x32\xd8\xd1\x74\
-\xad\x1a\x96\xa8\x97\xfa\xab\xc1\x0f\xe4\x16\xfd\x19\x63\xf8\xb9\
-\x98\x8b\xdf\x44\x5f\x08\x72\x42\xac\xdf\x6c\x08\x61\xcd\x25\xd9\
-\x8b\xfd\x42\x9b\xcb\xb1\xac\x7b\x17\xa4\xf7\x45\xd9\x19\xf9\xde\
-\xc4\x6c\x46\xc8\xc3\xbf\x67\x57\x35\xf6\x01\xf6\x0b\x73\x86\x40\
-\xfb\x30\xb6\x21\x54\xf0\xba\x37\xd7\x18\x23\xe4\x4b\xc1\x70\xe4\
-\x8e\x84\x2f\x09\x2c\x4e\x03\xc4\xb8\x3e\xb8\x7d\xfb\xf6\x63\xb2\
-\x39\x2f\x68\x04\x9f\x0f\x30\x07\xb1\x17\xe0\x03\x89\x5c\x25\x94\
-\x9a\xea\x3e\xca\x20\xef\xd8\xae\x31\x67\x9e\x73\x05\xf3\x24\xc0\
-\xe9\x24\x05\xe3\xb1\x81\x58\x3b\xd9\x4c\x85\xec\x60\x9b\xa1\xe3\
-\xd0\xb5\x4d\x6d\x6b\x88\x3e\x85\xbc\x8c\xbc\xf6\x68\x6d\x2f\x13\
-\xe8\xd8\xbe\xb4\x8f\x44\x34\x6b\x03\xf2\xcd\xda\x5e\xb5\x7d\x69\
-\x2b\x7c\x6d\x2b\xef\x5d\x90\xe6\x90\xd6\x0f\xe6\x11\xf3\x11\x59\
-\xa1\xed\xf4\x21\x6c\xe0\xdb\xb2\xdb\x23\x21\xf8\xf4\x09\xec\xd9\
-\x7e\xeb\xb2\xd6\x83\xba\x76\x4e\x92\xe0\x47\xb4\xe5\xfd\xd9\xec\
-\xa1\x10\xf3\xef\x3d\xc7\x1c\x73\xcc\xc0\x84\x23\x7a\x0a\x7d\x45\
-\x12\xaf\x9a\xb8\x98\x29\x19\x91\x4c\x68\xcd\x44\x67\xd0\x36\x25\
-\x60\x18\xb3\x2b\xae\xb8\xe2\xcc\xec\x6a\xa7\x08\x9d\xfd\xef\xb1\
-\x3d\x39\xd5\xc6\xda\xc1\x66\x3a\xc5\x15\xd0\xf5\xc8\x2a\xbc\x6a\
-\xc2\x27\x7e\x87\xa7\xb2\x03\xb4\xb9\x84\x44\x0c\xeb\x3c\x76\x1d\
-\x36\x01\x76\x8a\x4e\x4f\xf7\x1b\x8f\x71\x8e\x49\x95\xdf\xf2\x97\
-\x42\x2e\x96\x86\x6d\x79\x11\xfa\x04\xbd\xc2\x9c\x21\xb1\xc4\xbf\
-\xfc\x7f\x3f\xdb\x0a\x7d\xa8\xb9\xd4\xa5\x0c\x89\x9f\xf0\xa6\xb0\
-\x3b\x9f\xce\xa1\x33\x0c\xc3\x30\x0c\xc3\x68\x07\x9d\xd0\x21\x68\
-\x8a\xd1\x23\x47\x16\x63\x0d\xe3\x08\x83\x03\xc3\xa3\x8d\x31\x86\
-\xb1\x12\x4e\xd8\xab\xf2\x15\xb3\x1a\xe5\x0e\x7e\x0c\x3e\xed\x6e\
-\x96\xd3\x8b\x33\x49\x7f\x06\xf5\x1d\xe3\x2f\xf8\xd4\x73\x78\x71\
-\xea\x08\x52\xb2\xfb\x08\xe7\x83\x20\x2e\xa4\x7b\x92\xb5\xdb\x1b\
-\xc3\x57\x01\xba\x36\x06\x64\x1a\x84\x43\x39\xd7\x38\xfb\x5c\xc7\
-\x86\xb3\x44\xbf\xeb\x1c\x6a\x8c\x73\x05\xcb\x87\x4d\x26\x51\xa6\
-\x24\x9e\xab\xa3\xb2\x4c\x5d\x3d\xfd\x48\xcf\xd0\x26\xda\xa6\x04\
-\x08\xc6\x79\x9e\x54\xea\x7d\x3f\x65\x12\xd8\xb4\x69\xd3\x4f\x9d\
-\x7c\xf2\xc9\x4f\x29\x50\x01\x5f\x09\xce\xd6\xed\xf4\xd7\x6e\x34\
-\xed\x7a\x2d\x83\x15\x25\x3f\xea\xfa\x5c\x92\xca\x35\xa1\xba\xe7\
-\xeb\x88\xb2\xb4\xa1\xe4\x69\x99\xa8\xc3\x01\xba\xf6\xda\x6b\x3b\
-\xbd\x92\x0b\xfe\xb1\xab\x51\x41\x28\x82\xc3\xc8\x23\x4e\xb1\x12\
-\x37\xe2\x53\x5d\x1f\x44\xea\x8b\xe6\x64\x53\x10\x70\x22\x98\x50\
-\x17\x64\x27\x98\xa0\x64\xab\xe6\x87\x82\xaa\xe5\xf8\xd5\xb5\xa7\
-\x24\xca\x44\xbb\x5e\x99\xaf\xec\x14\xf0\x53\xdf\x4f\xaa\x6e\x16\
-\x10\x3f\x69\x4f\x53\x7e\x86\xd3\x3b\xf4\xf7\xa8\x06\x21\x78\xfe\
-\x0d\x02\x38\xdc\x2f\x0f\xbf\x39\x49\xa4\xe4\x17\xba\x58\x7a\xb2\
-\xae\x7d\x55\xca\xb1\xef\x39\xe9\x3c\xab\xdd\xdb\xc8\x12\xfd\xe7\
-\x5f\xf4\x04\x75\x13\xa0\x90\x43\xcf\x33\x90\x74\x5d\x1d\x89\x5f\
-\x4d\xf8\x36\x88\xa8\x8f\x77\xd1\x37\x64\x29\x03\xeb\xcb\x92\x25\
-\x9d\x21\x64\xe2\xfa\xe9\x02\xab\xc8\x39\x7c\x62\x1d\x44\xce\xe1\
-\xcf\xb0\xba\x0a\x2a\xf9\x05\x95\xfc\x14\xf5\x2b\xa3\x80\x0d\xf2\
-\x8a\xde\x64\xcc\x68\x5b\xac\xd3\x97\x86\x3e\xfa\x17\x5c\x1d\x43\
-\xc0\x0a\xf9\xd6\x1a\x56\x3d\x61\xac\xfa\xeb\xda\x06\xf1\x1b\xe3\
-\x10\x7d\x9c\xe8\x46\x84\xb9\x82\xcd\x9b\x37\x5f\x23\xfb\xa8\x4c\
-\x0a\x20\x13\xf0\x6d\x3a\xde\x56\x49\xe3\xcb\x73\x9a\xa3\x5a\x67\
-\xa8\x97\xb9\x99\x3b\xea\x7b\x9b\x70\x18\x57\x12\x4b\x1b\x37\x6e\
-\xfc\xf3\x58\x4f\x57\x6c\xdf\xbe\xfd\x3b\xb2\x59\x2f\x38\xac\x5a\
-\xb5\xea\x80\x02\xb0\xd8\x8b\xa3\x04\x60\x19\x9b\x99\x48\x28\x61\
-\x5f\x6a\xfd\xe4\x74\x02\x1b\x6a\x18\x47\xe6\xa5\x4e\xb7\x69\xdd\
-\x6c\xd1\x9f\x91\x93\x49\xd8\xbe\xe8\x3c\x6d\x5a\x41\xe7\xe1\xf3\
-\x48\xe7\xb1\x91\x0c\xd9\x43\xbf\x68\x6d\x6f\x1a\x94\xd6\xdf\x29\
-\x03\x51\xbe\x09\xa9\xbc\x9e\x17\x55\xeb\xaf\x23\xbd\x8f\x7a\x68\
-\x63\x35\xa9\x44\xb0\x3d\x74\xe4\xeb\xb2\xfb\x43\x43\x9b\x52\xfa\
-\xad\xcb\xe2\x4f\x5d\x1b\x27\x49\xc9\x87\xdf\xcf\x66\xb7\x46\xd8\
-\x48\xaf\x3a\xf6\xd8\x63\xbf\xa6\x64\x28\x76\x28\x7e\x21\xd7\x7d\
-\x96\x6b\x8b\x36\xdb\xa1\xaf\xd0\x5b\xf2\xe1\xaa\x72\x52\xd7\xc6\
-\x92\xca\xf1\x96\x1c\x54\xa9\x2c\x03\xd5\xd5\x53\x92\xea\xd2\x9a\
-\xa9\xa4\x12\xf6\x0f\x73\x0f\xff\x33\xd6\xf6\xff\x9c\x5d\xee\x0c\
-\x61\x4b\x9c\x80\x6d\x41\x5c\x01\xfb\x99\x8d\x1e\xd8\x14\xac\xcb\
-\xd8\x5b\x8a\x2b\xa8\x8f\x75\x7d\x11\xf1\xbb\x64\x5c\xf6\x1c\x3a\
-\x04\xf9\x23\x21\x83\xac\xb3\xc1\x41\x76\x5c\x39\x1e\xf0\x41\x63\
-\x52\x47\xe2\xab\xa8\xee\xfd\xd3\x11\xcf\x50\x4f\xd9\xb6\x68\xcf\
-\x17\xd1\xdb\xf4\x97\x8d\x11\x6c\x26\x65\x73\x04\x7e\xa0\x6e\x27\
-\x91\x6d\xa5\x36\x97\xb6\x55\x97\xed\x85\xd4\x66\xc9\x88\xfc\xe6\
-\x90\x8f\x57\xe4\xf0\x19\x86\x61\x18\x86\x61\x34\x07\x57\x4c\x71\
-\x9d\x81\x4e\xe8\x60\xf4\xe0\xcc\x13\x7c\xc3\x31\x91\xa1\xd3\xd4\
-\x78\xa1\x1c\x86\x4a\x56\x3f\xeb\xc1\xb1\x7c\xed\xe0\xc7\x59\x2a\
-\x77\xf0\x63\xe8\xe1\xa4\xc9\x90\xab\xeb\xaf\x88\x32\xc1\xa7\x57\
-\x86\x71\xb6\x10\x23\x91\x00\x3c\xf5\xc0\x4b\x92\x4a\x18\x91\x04\
-\x62\x30\xea\x09\xe6\x62\x78\x2a\x80\x89\x01\xd9\xc6\x38\xe4\x5d\
-\xd9\xfc\xd6\xc0\xd9\xc7\x61\x2a\x4f\x5e\xe8\x9a\x20\xda\x8a\xc1\
-\xaf\xf6\xc9\xe8\x67\x3c\x9b\xf0\x40\x44\x39\x88\x67\x82\xf6\x88\
-\xa8\xa7\x24\xfa\x5d\x1a\xcf\x7a\xae\xae\xce\x7e\xa4\xf7\x50\x9f\
-\x8c\x63\x9c\xa7\x5b\x6f\xbd\xf5\x96\xec\x72\xe7\x08\x5e\x3e\xac\
-\x40\x05\xc9\xa4\xea\x89\x16\x12\xb4\xba\x1e\x4d\x4e\x68\x39\xf6\
-\xea\x7b\x5d\xff\xea\x48\x7c\x12\x89\x7f\x55\xaa\x96\xab\xab\xab\
-\x8e\x54\x27\x6d\x83\xa7\x04\x72\xd1\x05\x38\x40\xd1\x8f\xaf\xdc\
-\x90\x57\x3a\x8c\x1b\x4a\x6e\x93\x00\x21\xb8\x4d\xa0\x98\xb9\xa3\
-\x20\x94\x78\xd6\xa4\x3f\xea\x43\xe8\xaf\xc6\x89\x6d\x92\x49\x0a\
-\x86\x95\x49\x41\xf4\x82\x4e\xee\x29\xe0\xa4\x64\x70\xdb\x31\xcc\
-\xb6\xff\x52\xbe\xb2\x53\xe8\x7b\x54\x4d\x36\x0b\xd4\xb5\xb5\x24\
-\xca\xd0\xcf\x36\xfc\x6c\x03\x4e\xf8\x11\x80\xd0\x49\x59\x02\xaa\
-\x04\x94\x71\xbc\x99\xcf\xcc\x6b\xda\x0a\x9f\xeb\xda\x57\x25\xca\
-\xa1\x13\x14\x64\x23\x11\x81\x5e\x63\xec\x20\x05\x20\xea\xf4\x5c\
-\xd2\xd3\x41\x77\x45\x9f\xaf\x88\xbe\xdf\x15\xbf\x3d\x4b\xff\x4b\
-\x52\xd9\x26\xfc\x9b\x8e\x78\x5e\x6d\xa5\x3d\xd1\xb6\x9b\x93\x2d\
-\x9d\x60\xf5\xea\xd5\xc7\x21\xe7\xe8\x2b\xad\x03\x04\x7d\xca\x75\
-\x00\x39\x87\x47\xc8\x39\xf3\x0e\x3d\xa0\x3e\xd3\xde\x36\x7d\x8e\
-\xb2\x5f\x08\xba\x3f\x68\x6f\xd4\x71\x45\xf4\xf5\x50\xd0\x5f\xd1\
-\x67\xa8\xca\x53\xd5\x2f\xe2\x6f\xfc\xc6\x18\x31\x56\xf0\x88\x31\
-\xa4\x8d\xd7\x5f\x7f\xfd\x66\xd6\x6c\xda\x8d\xae\xd5\x55\xad\xac\
-\xbf\x8c\xb9\xc6\x96\x3a\xea\xda\x26\xe2\x3d\xbc\x23\xe6\xc5\x3f\
-\x48\x36\x19\x05\x42\x07\xbe\x8e\xc0\x2a\xf6\x21\x81\x77\x76\xbc\
-\x57\xf9\x0b\x0f\xeb\x78\xdb\x8f\x34\xb6\xc8\x80\xd6\x19\xc6\x96\
-\x79\x8a\xfd\xc9\x9a\xc9\xbb\x38\xd9\x42\x50\x0e\xf9\xe4\x24\x5a\
-\xe8\x87\x2f\x87\xad\x7a\x56\xe0\x47\xb3\x79\x2f\x18\x84\x9e\xde\
-\x46\xe0\x5e\xa7\xc1\xe0\x01\xfc\x28\xf5\xdf\x20\x3e\x8b\xaf\xe8\
-\x13\xec\xd1\xac\x7a\x22\xd0\xe9\x24\x7c\x0a\x7d\x0b\x0f\x5d\xae\
-\xbe\x30\x6f\x19\x63\xda\xc6\xb8\x37\x91\x19\xca\x64\xf5\x23\x81\
-\x6b\xcc\xd0\x79\x5a\x13\x4b\xdb\x17\x39\x63\x5d\x44\xe7\xd1\xbe\
-\x36\xf6\x59\xf2\x7b\x4f\x94\x5d\x10\xcf\xbc\x52\xc4\x5a\x09\x45\
-\x5d\xa7\x8a\xe2\xef\x7b\x93\x7a\xf5\x97\xfa\x8f\xf7\xe8\x5d\x4d\
-\xf8\x22\xca\xf7\x3f\x47\x47\x32\x37\xd3\x5e\x3b\xf2\x4d\x97\x61\
-\x10\xf2\xf8\xb2\x72\x53\xca\xa8\xeb\x72\x57\x04\x0f\xe8\x7f\xe8\
-\x91\x97\x66\xd3\x5b\x21\xe4\xf5\x9b\x83\x1e\xc3\x8e\xc7\xfe\xc3\
-\x27\xe4\x44\x16\x76\x13\x7d\x26\x11\x20\xff\x48\xf6\x9f\x36\xe4\
-\x30\x86\x6d\xc6\x2d\xcb\x7d\x35\xda\xfb\x48\xfc\xcb\x9a\x78\x55\
-\xfc\x7b\x7b\xfc\xfb\x28\x75\x89\xe8\x0f\xd4\x56\x2e\x54\x8e\x67\
-\x18\x9b\xd4\x03\x3d\x1b\x9a\x4d\x34\xb1\x66\xde\x98\xdd\xee\x0c\
-\xcb\x97\x2f\xbf\x8a\x79\x46\xd2\x16\x9d\x4d\x42\x59\x71\x05\xd9\
-\x14\xf4\xb1\x69\x7f\xca\xbe\x68\x9d\xa0\x1e\xe4\x9c\xff\xa6\x7f\
-\xc8\x3d\xe3\x41\x39\xf1\x2d\xfe\xfd\x78\xfc\x7b\x6d\xd0\xad\xf1\
-\xdf\xcf\x88\xa7\x25\x51\x0e\x12\xdf\xea\xda\x30\x1d\x95\xed\xa3\
-\x5f\x4a\xe8\x92\x78\xc4\xef\x67\x63\x00\xfa\x0f\xdb\x9b\xcd\xaa\
-\xc8\x90\x6c\x2b\xb5\x59\xe3\x4d\x3d\xf1\xef\xa7\xe2\xdf\x7d\xf1\
-\xef\xd5\x41\x0f\xf3\xf7\x92\x46\x6d\xaf\x88\x67\xa9\x8f\x18\x0f\
-\x3c\x8c\x36\xfd\x41\x0e\x9f\x61\x18\x86\x61\x18\x46\x73\x84\xa3\
-\x70\xe4\x84\x0e\x1f\xa4\x65\x47\x0d\x27\x29\x70\x46\x4a\xc7\xaf\
-\xce\x20\xa9\x92\x0c\x9c\x30\xac\xf6\x66\xf5\xb3\x1a\xe1\x2c\xf4\
-\xae\xfb\xab\xdb\xc1\x8f\xb3\xd4\x66\x17\x25\x86\x59\xf4\x7b\x81\
-\x82\xef\x18\x94\x04\xbc\x38\xd5\x41\x80\x0b\x67\x5a\x3b\xe2\x65\
-\x48\x96\x86\x6f\x5d\x9d\x75\x94\x46\xe0\xd0\xa7\x93\x48\xa0\x61\
-\xe8\xe3\xec\xb3\x13\x96\xa4\x07\xc1\x72\x0c\x5f\x05\xcb\x19\xf7\
-\xd2\xd0\x1d\xd4\x7f\x8d\x7b\x94\xdb\x13\xff\xfe\x52\xf4\x6b\xda\
-\xd3\x17\xc1\xd7\x57\x11\xe8\xe0\x1d\x18\xe0\x18\xb4\x72\x04\x9a\
-\xbc\xaf\x4a\xf9\xee\xde\xb3\x32\x8e\xe9\x47\xf0\xfc\x57\xf2\x95\
-\x9d\x61\xd9\xb2\x65\x57\x94\x49\x08\x1c\x28\x05\x67\x95\x84\xe8\
-\xb7\x1b\x4d\x63\x3f\xa8\xaf\xfc\x0e\x45\xff\xfe\x2a\xfe\xbd\x20\
-\xfe\xfd\x83\x78\xfe\x37\xe3\xf9\x9f\x8f\xff\xfe\xf1\xa8\xef\xf5\
-\x41\xff\x3d\x68\x43\xf0\xf3\x4e\xe6\xac\xf8\x29\x9e\x36\x7d\x97\
-\x88\x72\x94\xe7\x79\x39\xa4\x24\x21\x70\x08\x43\x3f\x74\x72\x6d\
-\x46\x35\xb9\x4d\x10\x91\x40\x0f\xc1\x61\xe6\x94\x74\x51\x93\x3e\
-\x50\x86\x3e\x67\xd5\x03\x41\x32\x89\x40\x18\xc1\x93\xea\x35\x27\
-\xe8\x44\xed\x2a\x44\xae\x70\x62\xcb\x60\x02\xef\x6a\xd2\xa6\xe0\
-\xe7\x9e\x7c\xdd\x44\x20\x7e\xd2\x17\x6d\x16\x80\x9f\xc3\x6c\x16\
-\x68\xcb\xcf\xb6\x08\x5e\xff\xb1\xf4\x12\x7c\x2f\xbf\x65\xc7\xbc\
-\x81\xdf\xf0\x1a\x99\xac\x6b\x5f\x95\xd4\x5e\xfa\x87\x8e\x41\x97\
-\xa3\x17\x18\xbb\x7e\x41\x88\xa8\x9f\x44\xc7\xfb\xe2\xff\x7f\x32\
-\x9b\xf5\x1c\x84\xde\xfe\x57\xc1\xb3\xff\x16\xf4\xe7\xf0\x0e\x79\
-\xe4\x39\xa8\xed\xfc\xaa\x92\xe6\x1a\xfd\xa4\xbf\x81\xbf\x9d\xaf\
-\x1d\x2b\xb6\x6e\xdd\xfa\x83\x27\x9e\x78\xe2\x17\x09\xac\x22\x1b\
-\x0a\xac\x2a\x69\x5a\xae\x03\xac\x53\xb4\x27\x79\x73\xa4\x7f\x83\
-\xfa\xa8\x32\x51\x7e\x67\xf0\xe5\x8d\xf9\xea\xe7\x21\xc6\xe5\xc7\
-\xa3\x7e\xd6\x81\x03\x75\xeb\x80\x78\x2a\xe2\x6f\xfc\x4e\x9b\x8a\
-\x35\xf6\x6b\xba\xc6\x10\x79\xc1\x76\x51\xc0\x46\xba\x96\x7a\x9a\
-\xb4\x39\xea\xff\x6a\x36\xcd\xa8\x41\xd8\x0a\x17\xb1\xd3\x1a\x1b\
-\x89\x60\x19\x36\x12\x3c\x66\x4c\x9a\xf0\xb8\x4a\x92\x13\x9e\xd5\
-\xd8\x32\x1f\x99\x9b\xac\x35\x8c\x2f\x41\x7e\x36\xe6\xb0\x8e\x92\
-\x38\x44\x87\x71\xa2\x84\x13\x4b\xc8\x6d\xc8\xf3\x55\xd1\xae\x5f\
-\xcd\x26\xce\x79\x84\x0d\x7e\x94\x6c\x71\x3e\x38\x8f\xed\x28\x9b\
-\xac\x29\x9f\xf9\x9d\xf9\x42\xf9\xd0\x71\x9d\x07\x8f\x4b\x28\x20\
-\xcf\xe9\x0e\x12\x63\xf4\x03\xbd\x42\x30\x59\xdf\xdc\x41\x17\x4b\
-\x67\xd6\xb5\xbf\x4a\x51\x6e\x2c\xa7\x93\x94\xe8\x92\xbd\x5f\xb5\
-\x7d\xcb\x20\x6f\x55\xe7\x55\xdb\x94\x3c\xee\xd9\xbb\xf9\x8a\xd6\
-\xc0\x06\x46\x97\xf1\xbe\x7e\xba\x8f\xf7\xd4\xbd\xbf\x4a\xd9\x9e\
-\x23\xf3\x08\x1e\xcb\x5e\x8b\xf9\x33\xf4\xfc\x08\x1f\x21\x96\xe5\
-\xff\x7f\x5d\xc6\xae\x65\x53\x0a\x49\x7b\xf8\xa5\x93\x66\x1a\xcb\
-\xb2\xbd\x4d\xdb\x3d\x88\xaa\xf5\x41\xbc\xa7\x8e\x68\x47\x36\xbb\
-\x35\x62\x1d\x7c\xce\x89\x5d\x92\x49\x24\xd0\xfb\x25\x93\x64\x37\
-\x94\x32\x02\x0d\xe8\xc3\x0d\x51\xf6\xc4\xa0\x9f\xc8\xd7\x3e\x0f\
-\x51\xe7\x3f\x88\xba\xdf\x1e\xeb\xe1\xf9\x5a\x13\xfb\xd9\x19\xfd\
-\xde\x07\xe9\x77\xca\xf3\x1c\xf5\xa0\x43\x48\x4e\x33\x76\xe1\x97\
-\x76\x7a\x83\x48\xf0\xf0\x93\xcc\x35\x4e\x28\xd6\x9d\x6c\xa5\x4f\
-\xb4\x6d\xba\x3e\x88\x28\x43\x9f\xe1\x35\x7d\xe1\x59\xf8\xcf\xdc\
-\x41\xfe\x2a\xf3\xe7\xd9\xf8\x77\x4d\xfc\xfb\xfa\xb0\xa1\xbe\x39\
-\x9b\x73\x04\x61\xfb\x7d\x4f\xf0\xf5\xc4\xa0\xaf\xc3\x5f\xea\xca\
-\xe7\x5a\xcf\xb9\x92\x28\xaf\xb9\x27\x5f\x89\x0d\x84\xc9\xeb\x9e\
-\x5d\x82\xff\x80\x0e\x94\x9e\xa1\xfd\x7a\x77\x3c\xbb\x35\xe8\xc7\
-\xa3\x0d\xdf\x96\x4d\x3d\x82\xe0\xdb\x37\x47\x5b\xdf\x14\x7d\xbc\
-\x54\x32\x51\x3c\x37\x52\x9b\xe9\x33\x75\xd1\x96\x98\xcf\xa7\xe4\
-\x2b\x0d\xc3\x30\x0c\xc3\x30\x9a\x43\xbb\xb1\x74\x42\x07\xe3\x19\
-\x03\x08\xc3\x99\x60\x81\x0c\xad\x3a\x83\xa4\x4a\x18\x28\x18\x37\
-\xf1\xcc\xc8\x0e\xe0\x24\x50\x5e\xf7\x47\x10\xb3\xdc\xc1\x8f\xe3\
-\x8b\xa1\x4a\xff\x65\xb0\xd5\xf5\x59\x14\x65\xf6\x50\x16\xc3\x8c\
-\x80\x25\x46\x23\xc6\x23\x75\x41\xba\xdf\x19\x63\x1a\xa3\x50\x7c\
-\x6d\x63\x04\x8a\xbf\xd9\xfc\x56\xc0\xa1\x66\x87\xa6\x1c\x26\x9c\
-\x7d\xae\x22\x21\x40\xa3\x93\x17\xb4\x99\xf6\x61\xb0\x36\xed\x37\
-\x44\xdf\xa3\xdc\x50\x8e\x75\x18\xd6\x8b\x90\x33\xf8\x56\x1a\xca\
-\xc3\xf2\x86\x67\x19\x37\xc6\x20\x78\x7e\x5a\xbe\xa6\x13\xac\x5e\
-\xbd\x7a\x11\xc9\x24\x92\x74\xe5\x89\x2f\xe6\x11\x49\x08\x82\xf7\
-\x65\xa0\x42\x0e\x44\xe9\x04\xd4\xf5\xa5\x4a\x51\x6e\x7f\x94\xff\
-\xcd\x7c\xed\x40\x84\x43\xf3\xb3\xe1\x68\x5d\x54\x71\xb4\x86\x79\
-\x6f\xaf\x3c\xcf\xe1\x78\xe1\xbc\xe5\xd5\x08\x9f\xcf\x57\x8d\x15\
-\x5c\x3f\x89\x6c\x96\xc9\x6d\x76\xf4\x11\x58\x84\x7f\xe2\x5d\x5d\
-\x5b\xab\x44\xdb\xa3\x6c\xa3\xc4\x36\x1f\x10\x57\x30\x41\x49\x41\
-\xf4\x41\xf5\x1a\xc8\x32\x98\xd0\x56\x46\x83\x8f\x13\x4d\x26\x81\
-\xea\x66\x01\x82\x67\xf0\x13\xa7\xbe\xe4\x67\x93\x3e\xa4\x2c\x74\
-\xd6\x87\xd0\x4f\x97\x2a\x99\xa8\x1d\xad\x4a\x7e\xd1\x56\x74\xa6\
-\xe4\xb7\xae\x7d\x55\x2a\x65\x97\xb1\x42\x7e\x99\x0b\xd4\x53\x75\
-\xca\x83\x98\x5f\xbf\x9d\x4d\x19\x88\x83\x07\x0f\x7e\x7b\xe8\xc9\
-\x0d\x4a\x48\x49\x5f\xaa\x7d\x4d\x65\xa2\x24\x9e\x41\x9e\x68\x27\
-\xfa\x30\x64\xed\x7b\xf3\x75\x63\x45\xcc\xb1\x9b\x74\xa5\x0f\xa7\
-\xc1\xf8\xc6\x1b\xb2\x01\xbf\xb5\x0e\xe8\x84\xaa\xfa\xd5\xb6\x4f\
-\xd1\x8f\x0d\x41\xdf\x97\xaf\x6c\x84\x78\xdf\x9f\x46\xbf\xbf\x5a\
-\xb7\x0e\xe8\xfd\xfc\xcb\xff\xf3\x77\xca\x21\x17\xcc\x49\x4e\xcb\
-\xd0\x6e\x36\x6d\xf0\xdf\xe8\x0b\x12\x4e\x6d\xd6\x6f\x7e\x8f\x77\
-\x7e\x24\x9b\x63\xf4\xc1\xfb\xdf\xff\xfe\x83\xe8\x44\xe9\x11\xd6\
-\xd9\x61\xe5\x44\xc4\x33\x10\x63\xcb\x1c\x62\xec\x19\x3b\x64\x10\
-\x3b\x4c\x63\x8c\x5d\x8a\x2e\x66\xb7\x77\x35\xb1\xb4\x61\xc3\x86\
-\x3b\x43\x8e\xe7\xfc\x0e\xeb\xe8\xc3\x51\xe8\x40\x82\xb0\xe8\xeb\
-\xf2\x5b\x35\xe8\x06\x78\xd4\x44\x96\x19\x0b\xc6\x24\x74\xdd\x0d\
-\x59\x75\xe7\x28\x37\x2c\xc9\xa6\x26\x01\xc9\x0e\x7d\x12\x90\xd8\
-\x41\xe8\xb6\xa6\xfd\x80\x28\x93\xd5\x8f\x04\x9d\x20\xd7\x35\x66\
-\xb2\x7d\xb1\xf7\xb5\xb6\x37\xd5\x79\xfc\x3d\x68\x6c\xc1\xd7\x18\
-\xdb\xbe\x36\xb0\xda\xd1\xaf\x2d\x25\x51\x86\xf2\x3c\x47\x1d\xac\
-\x4f\x69\xaf\x0d\x7d\x5a\x3f\x6c\xa1\x8f\x6a\x3c\x49\xb0\xb0\xc9\
-\x87\x75\x42\x3e\x92\x12\x4a\xcc\x5b\xb5\x57\xd4\xb4\xdd\xfd\x48\
-\xcf\xab\x5f\xea\x5b\x1d\xa5\xde\xb8\x3b\x9b\xdd\x0a\xe1\xfb\xae\
-\x95\x1d\xaf\x93\xe9\xc8\x2e\x1b\x0c\x49\xea\x32\x07\xd1\x3f\xc3\
-\xf8\x6f\xfc\x1e\xe5\xae\x7c\xfa\xe9\xa7\x7f\x2e\x5f\xd7\x18\x21\
-\x0f\x2f\x0b\xfe\x5e\xaa\xa4\x09\xf3\xa6\xad\x5c\x88\x77\x3c\x47\
-\xbb\x69\x3f\xb2\x7e\xcb\x2d\xb7\x5c\x94\xaf\xe9\x04\xda\x60\x87\
-\x7d\x81\x3f\xc4\x66\x00\x9d\x50\x44\x2e\x91\xcf\x26\xfc\x83\xd4\
-\x4f\x8d\xbf\x6c\xba\x92\xe2\x6f\x9f\x8a\x7f\x8f\xff\xfc\xe7\x3f\
-\xff\x9d\xd9\x84\x69\x11\x7c\xf8\xe7\x41\xbb\x65\xc3\xd5\xf1\xb6\
-\xae\x2d\xfd\x48\xed\xa3\x6d\xcc\x61\xea\xd5\xda\x05\xa1\xc3\xd1\
-\x7f\xfc\x8d\xb9\x9e\x32\xf4\xe5\x78\xdf\x82\xf8\xef\xef\xce\x66\
-\x0d\x44\x3c\xfb\x66\x9e\x47\x26\xa8\x03\x3e\x6a\xee\x89\x4f\x75\
-\xed\xab\x23\xb5\x99\x7e\xd3\xe6\x68\xdb\xe6\x7c\x8d\x61\x18\x86\
-\x61\x18\x46\x33\x70\x42\x87\x20\x6a\xbf\x6b\x86\xe4\x2c\x60\x74\
-\xd4\x19\x24\x55\x92\x81\x12\x86\x4e\x67\xdf\xd9\x18\x27\xea\x76\
-\xf0\xeb\x58\x7e\x19\x28\x69\x62\xa8\x61\xd0\x51\x56\x46\x7b\x69\
-\x4c\x42\x38\x76\xfc\xbd\x2e\xa9\x50\x12\x7f\x83\xa8\x0f\xa2\x9c\
-\x88\xfa\x83\x86\x4a\xd6\xe9\x04\x06\x46\xbe\x9c\x43\xae\x14\x63\
-\xbc\x31\xf4\x15\x1c\x52\x10\x4e\x06\x6a\x5d\x5f\x21\xb5\x37\xca\
-\x8d\x9c\x3c\xdc\xbf\x7f\xff\x6b\x08\x62\xc2\x33\x78\x24\x03\xbf\
-\xad\xa1\x9c\xed\xe9\x3d\x8b\xd1\x1d\x75\xfe\x59\xbe\x62\xec\x88\
-\xb9\xf3\x7a\x5d\xa1\x52\xb7\xd3\x5f\xc1\x59\xc6\x9e\x60\x50\xdd\
-\xb8\xd7\xf5\x41\x94\x7d\x7e\x32\xca\xbe\x33\x5f\xd9\x1a\x31\x87\
-\x7f\x5f\x3c\x65\x2e\x4b\x9e\x9b\xb6\x01\xa2\x0c\x65\x79\x8e\xe7\
-\xa9\x8b\x3e\x85\x43\xfa\x3b\xf9\x9a\xb1\xa1\xdc\xd9\xcc\xc9\x20\
-\x9c\x50\x82\x88\x4a\x74\x4a\x2e\xeb\xda\x59\xa5\x6c\xf3\xb4\xb2\
-\xb9\x69\xd3\xa6\xa3\x49\x62\xf1\x5e\xf4\x20\xef\x66\x67\x2a\xd7\
-\x9c\xe8\xce\x7c\x25\x05\xab\xe3\xd8\x54\x2e\x93\x7f\x13\x4f\x26\
-\x81\xe9\x36\x0b\x74\xc1\xcf\x51\x10\xed\x7c\x54\xc9\xc4\x51\xbe\
-\x65\x57\x92\x64\xb7\xd0\x9d\x55\xfa\x4c\xfc\xf6\x3f\xb2\x09\xad\
-\x71\xd7\x5d\x77\x9d\xcc\x3a\x89\xde\x24\x80\x90\x41\x82\x5e\x3b\
-\x79\x6f\x5d\x9b\xfa\x91\xda\xca\xf3\xc8\xd8\xc1\x83\x07\xff\x5d\
-\xbe\x66\x6c\x08\xfd\x74\xac\x12\xa7\xc8\x05\xbc\x26\x20\x4f\x90\
-\x90\x5d\xe7\xfa\x36\x98\xe4\x5c\x7d\xa1\x6d\x83\xf8\x9e\xed\x7f\
-\xe0\x33\x9f\xf9\x4c\xdf\xdd\xd7\x83\x10\xf3\xfc\x47\x82\x6e\x24\
-\x19\xc4\x98\xd3\x86\x6a\xa0\x47\xe3\xc9\xdf\xf9\x1d\xde\xb3\x76\
-\x20\xd3\x6c\xda\x28\x83\x36\xd2\x77\x3c\x33\xa8\xfd\x94\x89\x3a\
-\x4f\xcc\xa6\x18\x7d\x10\x6b\xdb\x4f\x9f\x7b\xee\xb9\xcf\xea\x94\
-\x02\xfc\x46\xf6\xb5\x5e\x0f\xe2\x73\x3f\x92\x8c\x69\x7c\x19\x37\
-\xe6\x13\xeb\x16\xf2\x88\xfd\x84\x6c\x72\x4a\x80\x13\x4b\x4a\x2c\
-\x71\xcd\x21\x49\x0b\x92\xa2\x04\x81\x43\x77\x7f\x7c\xc7\x8e\x1d\
-\x73\x7a\x1c\xb1\x25\x74\x42\x97\x7e\xea\x44\x29\xfc\x68\xca\x63\
-\xca\x88\x87\x59\x6d\xe7\x20\x28\xaf\x75\x94\x40\x32\x27\x80\xd8\
-\x14\x42\x40\x5e\x7d\x90\x7d\xd9\x64\x4e\xf2\x7b\xcc\xfb\x91\xd7\
-\x9c\x32\xd1\xa5\x64\x01\x32\x83\xed\x8b\x2c\x21\x57\x4d\x6d\xdf\
-\x71\xb5\xa9\x0e\xa1\xc7\x96\xc8\x5e\x43\xb7\x49\x7f\x49\xf7\x0d\
-\xe2\x17\x44\x19\xca\x6a\xec\xa9\x8b\x35\x34\x5f\xd1\x1a\x31\xbf\
-\xbe\xa9\x4a\x9c\x9e\xad\x52\xb4\xf7\xab\xb4\x17\xdb\x88\x77\x23\
-\xa7\x6d\xda\x5d\xa5\x78\xee\x1b\x75\xef\x19\x44\xd9\xec\xc6\x08\
-\x59\xf8\x31\xbe\x9b\x54\xb5\xe3\xcb\xab\x10\x75\xe2\x15\x5e\xb6\
-\x59\xe3\xe3\xf7\x4f\x45\xb9\x37\xe5\xab\x86\x46\xac\x6d\x7f\x88\
-\xfe\x43\x0f\xa2\x6b\xc5\x67\x78\xdc\x84\xbf\x29\xb3\xbd\x76\x23\
-\xe3\xcc\x43\x64\x22\xd6\xfb\x1f\xcb\x57\x8c\x15\xa1\xbb\x7e\x59\
-\x7a\x40\x71\x05\x92\xca\xac\x17\xd8\x4b\xb2\x2d\x06\xf1\xaf\x24\
-\xfa\x20\xd9\xa6\x2f\x10\xfd\x4f\x3a\x37\xfe\xfe\x5d\xf9\xfa\xc6\
-\xd8\xb3\x67\xcf\x8b\x63\xee\x7f\x4a\xbc\xad\xda\x1b\x7a\x67\x5d\
-\x7b\xea\xa8\xe4\x33\x72\xc2\x58\x51\x2f\xba\x45\x36\x0d\x7f\x63\
-\x0c\x62\xfc\x6e\x8c\x71\xfc\xd7\xd9\x94\x56\x88\xb1\x3b\xb1\xf4\
-\x97\x79\x97\x7c\x92\x26\xf2\x50\x12\x65\xe1\x21\xcf\x47\x5d\x97\
-\xe6\x2b\x0c\xc3\x30\x0c\xc3\x30\x9a\xa1\x3c\xa1\x43\x10\x55\xd7\
-\x0c\x69\xf7\x19\x06\x96\x8c\xd6\x3a\x63\xa4\x4a\x32\xa8\xc2\x50\
-\xea\xf4\x38\xfd\xb8\x80\x13\x41\x82\x85\x63\xf9\x04\x24\xfa\x5d\
-\xf7\x37\xc8\x40\x2b\x0d\x49\x8c\x7d\x82\x20\x3c\x8f\x11\x09\xc9\
-\x11\x90\x33\x22\x9e\xf2\x1c\x14\xff\xfd\x9c\xfb\xd7\xb3\x79\x2f\
-\x82\x8f\x50\x3c\x77\x6a\xfc\x7b\x03\xed\xc9\x9f\x5a\x01\x87\x5a\
-\x57\x91\x70\xdd\x87\x76\x8d\x69\xf7\x1d\x57\x8a\x69\xbc\x69\x1f\
-\x7d\x99\xae\xcf\x6a\x37\x6d\xce\x57\x8c\x8c\xdb\x6e\xbb\xed\xb5\
-\x04\x1d\x30\x94\xe1\x17\x3c\x94\x73\xda\xc6\x48\xa6\x2c\xcf\xc0\
-\xeb\xe0\xfd\x4d\x59\xfd\xd8\x11\xf3\xe6\x49\x78\xca\xfc\x51\x00\
-\xa5\xdc\xe9\x4f\x52\x16\x27\x94\xbe\x68\xdc\xe1\x6b\x93\xbe\x24\
-\x7f\x2f\x0a\x7a\x49\xbe\x6e\x68\x84\x03\xf7\x8b\xe1\x90\x7e\x5d\
-\x41\x56\x05\x4d\x4a\x19\xac\x6b\x43\x49\x94\x91\x7c\xcb\x21\xbd\
-\xe3\x8e\x3b\xae\xce\x57\x8c\x05\x65\x72\x5b\x1f\x25\xd7\xf5\x93\
-\x38\x7c\xcc\x1f\xf1\xb0\xae\x8d\x55\x4a\x39\xe8\x2b\x9f\x3b\x76\
-\xec\x78\x0b\x01\x04\x74\x00\x63\x88\x1e\x20\x99\x54\xee\x4c\x9d\
-\x2e\x98\xd0\x84\x6f\x50\x94\x9b\x91\x6b\x24\x4a\x7e\xca\xa9\x2f\
-\xaf\xf3\x1c\x37\x3f\x47\x85\x76\x8f\xd7\x7d\xcb\x8e\xb6\xa2\x0b\
-\x9a\xca\x6b\x49\x94\x87\x78\xb6\xa4\x90\xff\xad\x4d\x77\xb3\x4e\
-\x87\x90\x8f\x7d\xac\x17\x5c\x71\x32\xac\x8c\x88\x28\xcf\xb3\xd4\
-\x71\xff\xfd\xf7\xbf\x36\x5f\x31\x36\x84\x8c\x7f\xa2\x3c\x4d\xa9\
-\xc0\x2a\x81\xf9\x32\xb0\xaa\x3e\x34\xe5\x77\xf2\xf7\x9a\xe8\xf3\
-\x3f\xca\x57\x0d\x8d\x18\xe7\xbf\x1b\xeb\xd1\x4d\xac\x03\xb4\xa5\
-\x4c\x84\xc3\xd3\x62\xfc\x7a\x32\x81\x3e\x42\xaf\xc1\x7b\xca\xf3\
-\x6f\xdb\xe4\x39\xbf\x51\x77\xac\xaf\xfe\x28\x75\x03\xc4\x1a\xf7\
-\xbf\x94\xf0\x55\xa2\xa0\x0c\x12\x36\x91\x99\xe9\x28\xe5\xa9\x37\
-\x76\xd4\x89\xdd\xc3\x38\x33\xb6\xac\x63\xe8\x04\x4e\x7f\xb3\x11\
-\x86\x0d\x40\xe8\x35\x36\x71\x28\xb1\x84\x2d\xbb\x6e\xdd\xba\xa7\
-\x37\x6f\xde\x7c\x3a\x01\xf0\x6c\xf6\x9c\x41\xe8\xc0\x03\xf4\x81\
-\x13\xf3\xb2\xc7\xd1\x2f\x5a\xbb\x9b\xf0\x97\x32\x94\x65\x1e\x64\
-\xb5\x9d\x42\x36\xa6\x74\x0b\x1b\x96\xf0\x27\x94\x78\x64\x3e\x4b\
-\x8f\x37\xd5\x8d\xc8\x40\x56\x3f\x12\xf0\x73\x58\x0b\xd9\xb0\xc0\
-\xfa\x22\x5b\xbf\xad\xfc\xf2\xf7\xa0\x4e\xd7\x73\x4e\xd5\x63\x6f\
-\xd0\xa6\xaa\xcf\x90\xef\xaf\x6d\x5b\x49\x94\xa1\x1f\x3c\x87\xcc\
-\x20\x3b\xd8\xd7\xf9\x8a\xb1\x23\xd6\xc0\xbf\x8b\x9d\x8b\x1e\x86\
-\x8f\xb4\x99\x71\xa6\xcd\x1a\xeb\x26\xed\x16\x65\xfb\x27\x72\x55\
-\x63\xf8\x43\x7b\x64\xc7\x97\x27\x76\x43\x6f\x1c\x39\x99\x8e\xec\
-\xa2\x7b\xca\x75\x68\x50\x7f\xa2\xfd\xd7\x46\xb9\x56\xa7\x74\xa7\
-\x43\x8c\xdf\xd1\x61\x67\x3c\x2b\x3b\x43\xba\xa0\xc9\xfa\x06\xf1\
-\x3b\xed\xe6\x19\xd6\x47\xf4\x68\xd4\xd9\xc9\x89\x94\x98\x63\xcb\
-\xe0\x27\xbe\xa6\xf4\x00\x3e\x11\x3a\x9b\xf7\x4a\xa6\xdb\xc8\x04\
-\x44\xf9\x92\xa2\x3f\x7c\x9b\xf1\xf7\xf2\xb5\x43\x21\x64\xf7\x77\
-\xd0\xaf\xac\x29\xd8\x0f\xcc\x39\x25\x95\x9a\xf0\xb5\x24\xca\xf2\
-\x8c\xf8\xcc\x1c\x40\x66\xe8\x2f\xc4\x7f\xf3\xb7\xf8\x6d\x65\xbe\
-\x7e\x68\x84\x5c\xde\x88\xdf\x8e\x2d\x5f\xca\x83\x64\xb3\x69\xbb\
-\x29\x57\xc8\xc5\x05\x59\xbd\x61\x18\x86\x61\x18\x46\x33\xe0\x68\
-\xe1\x00\xea\x9b\x25\xe5\x35\x43\x0a\x2c\xc9\x60\xad\x33\x46\xaa\
-\x24\xe3\x24\xab\x9f\xf5\xc0\xc9\x64\xa7\x36\x4e\x04\x3b\xd2\xf4\
-\xe1\x60\x1c\x3a\x9c\x23\x39\xbf\x75\x7d\x2d\x49\x86\xa4\x02\x20\
-\x18\x8e\x38\x56\x18\xa7\x90\x9c\x2c\x7e\x93\x93\x95\xd4\x59\x80\
-\xb6\x04\xce\xbe\x76\xe0\x11\x34\xe7\x4a\x29\x76\xbf\xea\xba\x0f\
-\x39\x4c\x4a\xa0\x0d\x32\xa4\x73\x9c\xc7\xde\xf6\x70\xf0\x6f\xa5\
-\x3d\x0a\xd0\xc2\x3b\x78\xd9\xd4\x69\x82\x24\x83\xf4\x25\x9c\xdc\
-\x4e\x9c\xd2\x33\xce\x38\x63\x83\x12\x74\x04\xc1\x75\x85\x0a\x3c\
-\xd5\xf5\x2e\xf4\x01\x27\x5b\x81\x0a\xda\xd4\xa4\x0f\xfc\x1e\x74\
-\x4c\xbe\x6a\x2c\x08\x47\xee\x77\xb8\xb2\x03\xa7\x89\x40\x85\x02\
-\xae\x92\xc5\x26\x7c\xa5\xed\xe2\x2b\x73\x03\x99\x89\xb1\xfa\xfe\
-\x7c\xc5\xc8\x28\x93\xdb\xdc\xd5\x8f\x13\x8a\x7c\x92\xd0\x51\xc0\
-\x47\x72\x50\xd7\xbe\x2a\xd1\xd6\xe8\x63\x6d\x62\xfb\x9c\x73\xce\
-\xf9\x4d\x82\x07\x24\x91\x98\x13\xfc\x37\xa7\x14\x71\x7e\x95\x4c\
-\x22\x50\x89\x2c\x2a\x29\x58\x75\xd8\xea\xde\x59\x52\x8e\xe3\x8c\
-\xdd\x49\x5e\xf2\x93\xc4\x81\xf8\x59\x6e\x16\xa0\x3f\xe3\xe0\xe7\
-\xa8\x88\xb9\xf3\x33\x4a\x76\x57\x93\x5f\xc8\x99\xda\x9a\x3c\xad\
-\x6d\xdf\x20\xd2\xb3\x29\xc7\x63\x3b\x41\xbb\x67\xcf\x9e\x9f\xe1\
-\xdb\x00\xcc\xaf\xaa\xac\x34\x99\xef\x55\x42\xc6\x53\x77\x35\xbe\
-\x82\xaf\x09\x82\xaf\xef\xd5\x55\x77\xf0\x59\xdf\xcf\x23\x31\x80\
-\xac\xd3\x7e\xe4\x02\x9d\xab\x60\x60\x13\x7e\x27\x4f\xaf\xc8\xd7\
-\x8c\x05\x77\xdc\x71\xc7\xb7\xc5\xd8\xdf\xcc\x89\x23\x9d\xec\xd5\
-\xfa\x89\x1c\xe6\x18\xf6\xda\xa8\xa0\x0d\x3c\xd7\x3a\xab\x80\x90\
-\xf4\x45\x93\x3e\x50\x5f\xe0\x5b\xb2\x09\xc6\x00\x5c\x74\xd1\x45\
-\x67\x32\x47\x75\xe2\x11\xb9\xd7\x18\x0d\x23\xf7\x55\x4a\xb9\x3a\
-\x32\xce\xd4\xcb\x38\xb3\x76\x21\x0f\xd8\x07\xbc\x17\xb9\x2d\x13\
-\x4b\x24\x0a\x48\xc4\x90\x94\xc6\xce\x89\xb5\xe4\x99\x90\xf3\x95\
-\x73\x29\xb1\x14\xf6\xc4\x41\xf4\x20\x6b\x11\xa7\x68\x64\xa3\xd1\
-\x77\xf1\xb7\x8e\x67\x25\xc1\x3f\xf8\xc6\x5c\x88\x79\xfd\xea\xac\
-\xba\x33\xc8\x1e\x62\x2d\x25\x69\x83\x6e\x61\x1d\x25\x69\xc3\x3c\
-\xc6\x9f\x28\xf5\x62\x5d\x9b\xab\x14\x63\x3f\x16\x1b\x93\xb6\xb1\
-\xce\xf3\x1d\x20\x12\x75\xba\x86\x4f\xeb\xbb\x82\xc8\xd2\x79\x75\
-\x6d\x81\xf8\x2d\xda\x3f\xed\xf7\x41\xc7\x81\xb0\x1f\x97\x13\x7c\
-\xa7\x6d\xf0\x0d\xbd\xa6\xf6\xf5\x9b\x5b\xfc\x4d\xa4\x79\x03\xaf\
-\x99\x93\xd8\x4f\x61\x8f\xde\x9c\xd5\x8f\x1d\xe1\x2f\xfe\x3a\xc1\
-\x6d\xe6\xa3\xf4\x35\x6d\xd6\x3a\xd2\xaf\xcd\xfd\x28\xcb\x2e\xc9\
-\xea\x3b\x43\xcc\xb1\xdf\xaf\xda\xf1\xe5\x89\x5d\xec\x8f\xaa\x6e\
-\x83\xaf\x83\xfa\x12\xfd\x5d\x97\xaf\x18\x2b\x42\x2e\xde\xae\xe4\
-\x87\xec\xf8\x41\x72\x51\x12\x65\x28\x8b\x1e\x65\x8c\x42\x26\x3e\
-\x95\x55\x8f\x15\xcb\x96\x2d\xbb\x41\x89\x65\xf8\x49\x5c\x01\xfd\
-\x2c\x3d\xc0\xfb\x07\xcd\xb5\x7e\xc4\x33\x50\xf4\xe5\xe9\xcf\x7e\
-\xf6\xb3\x3f\x9a\xaf\x1c\x09\xd7\x5e\x7b\xed\x97\xf0\xd9\x68\x5f\
-\x9d\xdf\x59\xd7\x8e\x7e\x94\x6d\x7b\xce\xba\x55\xa1\xdf\xcf\xd7\
-\x8e\x84\xe0\xe7\x0a\x74\x2b\xfe\xd1\x30\x32\x5a\x12\xed\xe5\xb9\
-\x90\xa7\x1d\x59\xbd\x61\x18\x86\x61\x18\x46\x33\x84\xf3\xf7\x9c\
-\x6f\x96\x8c\x7a\xcd\x10\x86\x49\xd0\x8c\x5c\xef\xd4\x16\xec\xe0\
-\xd7\xae\x34\x02\xd8\xa5\x93\x89\x53\xd4\x36\xe0\x2a\x43\x52\x46\
-\x24\xce\x14\xc6\x3e\xc4\x7f\xcb\xd0\x4b\x9a\x48\x22\x49\xe0\x2a\
-\x12\xfa\x8a\xd3\x44\x20\x51\xd7\x5f\x11\x08\xc5\x88\x2e\x83\xa0\
-\xb4\x8f\x7e\x4c\x37\xe6\x5d\x8d\xf1\x65\x97\x5d\xf6\x6b\x04\xbd\
-\x09\x10\xd1\x2e\x39\x4d\x6a\x17\x6d\x1a\x24\x8b\x1a\x07\x9e\xc1\
-\x31\xc8\xaa\xc7\x86\x4d\x9b\x36\x7d\x6f\x38\xa1\x7f\x4d\x82\x0e\
-\xa7\x89\x44\x04\x41\x0a\x5d\x1f\xa8\x9d\xfe\xb4\x7d\x98\x24\x44\
-\x94\xfd\xef\xf9\xaa\xb1\xe2\xba\xeb\xae\x3b\x17\x07\x99\xb9\x4d\
-\xdb\x14\x38\xa6\x7d\x83\xc6\x1b\x2a\xf9\x4a\xbf\x70\x0c\xa3\xae\
-\xa1\xaf\xe3\xab\xa2\xbc\x7e\x92\x40\x20\xd7\x4f\x2a\xb9\x2d\x67\
-\x49\xb2\x59\xd7\xbe\x92\x68\x2b\xf3\x30\xab\x7e\x0e\xa2\xde\x37\
-\x11\xf0\x62\xde\x33\x1f\x14\x48\x28\x4f\x26\xe1\xfc\xe2\xb8\x2b\
-\xd1\xda\xc6\x51\xe3\x77\x28\xca\x4e\x74\x8e\x57\x21\x7e\x96\x9b\
-\x05\xe8\x97\x36\x0b\x30\x86\x4d\x1d\xe6\xe9\xf8\x39\x0e\x84\x4e\
-\x3a\x45\xc9\x2f\xe6\x92\x76\xb4\x0e\xb3\x33\x7f\x3a\xca\x7e\xbc\
-\x3b\x5f\x3b\x36\x7c\xe8\x43\x1f\x7a\x06\xde\xe2\xdc\x13\x04\xd4\
-\xda\xd9\x94\xbf\x25\x21\x63\xcc\xcb\x98\x9f\x47\x67\xf5\x63\x41\
-\xf0\xf7\x29\x9d\xc8\x65\x53\x81\x02\x67\xda\x54\xa0\xc0\x6a\x9b\
-\x76\xc3\xcf\x28\x77\x6b\xb4\xf7\xef\xe6\x6b\xc6\x86\x58\x03\x7e\
-\x24\x74\xe9\xe7\x09\xac\x6a\x17\x2e\x6d\xd3\x3c\xa4\x7d\x10\xff\
-\x4d\x7b\xf9\xbb\x88\xff\x57\x99\x26\x32\x93\x72\xf1\x74\xbe\xda\
-\x68\x88\xd0\x95\x17\x32\x4f\x91\x7b\x74\x25\x1b\x0d\xda\x04\x38\
-\x9b\x52\xca\xd9\x91\x71\xe6\x1d\xe8\x04\xde\xc7\x5a\x86\xec\x12\
-\xd0\x46\x8e\xb1\x5f\x39\xd5\x83\x1e\x47\xbe\xd9\x28\x84\xfe\x0b\
-\xfd\xfe\xf9\xb9\x92\x58\x0a\x5b\xfc\x28\x25\x65\x86\xfd\xf6\x08\
-\xbf\x4b\x97\x74\x9d\x50\x62\xc3\x52\x79\xa5\x9c\x4e\x25\x30\x0e\
-\x8c\x89\x4e\xc4\x36\x6d\x3b\x14\x65\xc6\xb2\x19\x03\x3b\x9f\xb6\
-\xe1\xe7\xa0\xf7\xf4\x6d\x2a\xf4\x35\x32\x83\xfc\x68\x7d\x1f\x24\
-\xb3\xfc\x9e\xd5\x76\x0e\x6d\xae\x52\xb0\x58\xfe\x08\x73\x80\x36\
-\xd6\x11\xed\x4b\xda\x13\xe5\xf6\x46\xf9\x05\x61\x3f\xbf\xaa\xeb\
-\xf1\x8f\xb6\xae\x63\xde\x21\xa7\x4a\x84\x55\x7d\x0a\xda\x57\xc7\
-\xd3\x3a\xa2\x0f\xf1\xdc\xeb\xb3\xfa\xce\x10\xf6\xfb\x13\xda\x68\
-\x57\x77\x15\x22\xb6\x72\x99\x08\x55\x3f\xa6\xeb\x4b\xfc\x76\x71\
-\x56\xdf\x09\x82\xcf\x9b\x4a\x3b\x1e\xff\x88\x79\xd5\x44\xe7\xf2\
-\x5b\xf2\xb6\xd7\x27\x6c\xab\xd0\xdb\xff\x26\xab\x1e\x1b\x42\x0f\
-\x3c\xa3\xf9\x46\x5c\x01\x5d\xcc\xcd\x1f\xc8\x32\xeb\x78\x1b\x3d\
-\x50\x47\x3c\x17\x34\xd4\x37\x7b\xeb\x70\xd1\x45\x17\xdd\x43\x02\
-\x91\xcd\x11\xfd\xfc\xce\xba\x76\xf4\xa3\x6c\x9f\xe6\x62\x8f\xa8\
-\x27\xea\x1b\xdb\x46\xa6\x58\x17\x7e\x0f\x1f\xbe\xb4\x3b\x59\x0f\
-\x87\xb1\x3b\x29\xcb\x33\x21\x13\x4b\xb3\x7a\xc3\x30\x0c\xc3\x30\
-\x8c\x66\xd0\x35\x43\xe5\x09\x1d\xed\x38\x95\x03\x88\xb1\xd1\xd4\
-\xa0\xa2\x6c\x18\x4d\x33\x1a\x48\x6d\x0a\x76\xf0\xe3\x48\xe8\x7a\
-\x0e\x82\x0f\x3a\x96\x8f\x41\x89\xc1\xdd\xc6\x30\x93\x01\x89\xe1\
-\xc8\x73\x18\xa3\x22\xfe\x3f\xeb\xda\x13\xff\xdf\xf9\x0e\xc7\x12\
-\xeb\xd6\xad\x7b\x5b\x8c\xf1\xe1\x70\x98\x0e\x95\x3b\x34\x75\x02\
-\x40\x46\x3e\xfd\x65\xbc\xd5\x5e\xfa\x21\xa2\x5f\x25\x45\x99\xce\
-\xc6\x98\xc0\x37\xc6\xbd\x82\x28\xda\xd1\x46\xbb\x78\xf7\x20\x59\
-\xd4\x38\x50\x3e\x9c\xf0\xb1\x7f\x90\x3a\xf8\x78\x49\xb9\xd3\x9f\
-\x9d\xc4\xba\x3e\x10\xa7\x1a\xf9\xa9\xdb\xe9\x5f\xd7\xd6\x92\x28\
-\x13\xbc\xee\x24\x99\x04\xae\xb8\xe2\x8a\x1f\x2d\x9d\x26\xda\xa8\
-\x9d\xaf\x1a\xe3\xba\x76\x95\x94\x6d\xec\x3d\x83\xf3\x72\xd7\x5d\
-\x77\xad\xcf\xea\x47\x06\xc9\x6d\x82\xdd\x24\x77\x08\xfa\xe8\x4a\
-\x9a\x61\x92\xdb\x94\x09\xbe\xef\xcd\xaa\x8f\x80\x84\x25\x27\xc9\
-\xd0\x77\xcc\x7b\x82\x08\xbc\xaf\x7a\x32\x49\x01\x52\xde\x3b\x17\
-\x93\x49\xa0\xca\xcf\x61\x37\x0b\xa8\x4f\xc1\x83\xe7\xf1\x73\x5c\
-\x58\xb1\x62\xc5\x47\x94\x4c\x2c\x77\xb4\x12\xf0\x1b\x75\x47\xab\
-\x28\x9e\xfd\x5a\xf4\xe1\x2d\xf9\xca\xb1\xe2\xbc\xf3\xce\xbb\x53\
-\xce\x3d\x27\x26\xb4\xcb\x55\x72\x53\xd7\x9e\x7e\x24\xdd\xf5\xf0\
-\xc3\x0f\xff\x6a\x56\x3f\x32\xce\x38\xe3\x8c\x85\xd2\x59\xac\x01\
-\x3a\xfd\x40\xb0\x9a\x4d\x05\x0a\x9c\x35\x0d\xac\x42\xfc\x1e\xe5\
-\xa2\xf8\x13\xff\x34\x5f\x33\x76\x5c\x7b\xed\xb5\xbf\xcd\x95\xac\
-\xd3\x25\x77\x69\x2b\xc4\xff\x8b\xd4\xfe\x41\x7d\x80\x54\x47\xd4\
-\xb9\x3b\x5f\x6b\xb4\x40\xd8\x11\x0b\x25\xf7\x6c\xc4\x51\x50\xab\
-\x94\xa3\x26\xe3\x30\x88\x34\x4e\x8c\x2f\xba\x80\xfa\x59\x87\x58\
-\xc3\x90\x8b\xba\xc4\x12\xc9\x52\x64\x1c\xdb\x6e\xd7\xae\x5d\xbd\
-\x53\xc4\x61\xff\xcc\xfa\xc4\xd2\xa6\x4d\x9b\x8e\x0e\xfb\xf4\xc8\
-\x3a\x38\xcc\x35\xcc\x10\xbc\x82\x4f\x0f\x3c\xf0\xc0\xa2\xac\x7a\
-\xec\x20\x99\x54\xb7\x61\x49\x41\x64\x6d\x58\x6a\xab\x5b\xb2\xfa\
-\x91\x81\x9d\x5f\x5e\xf5\x8c\x1c\xc8\xcf\x41\x5e\xe0\x69\x93\x00\
-\x77\xca\xdf\xc4\x36\xcb\x85\xad\xf6\x06\xfc\x11\x4e\x4e\xb0\x41\
-\x09\x7b\x8d\x20\x37\xe3\x0f\x1f\x91\x01\x6c\x1c\x28\xfe\xbf\x77\
-\x5d\x76\xcc\xbb\x19\xb9\x6a\x3c\x64\xf4\x3e\xd6\x3f\xec\x4b\xd6\
-\x13\x6d\x02\x60\x0d\x94\xbc\x32\xee\x75\x7c\xad\x52\xf2\x19\x79\
-\x79\x71\x56\xdf\x09\x62\x4d\xdc\xca\xe9\x24\xe4\x96\xcd\x45\xe5\
-\x89\x5d\xd6\x1c\xfa\xc0\x3a\xae\x84\x8d\xd6\x95\xba\x36\x43\xd9\
-\xee\x7d\xf1\x4c\xe7\xa7\x5c\x43\xaf\x3d\x51\xb5\xe3\x9b\xc8\x30\
-\xc4\xef\x8c\x07\xe3\xc2\xbc\x8c\x39\xf0\x3f\xb3\xda\xb1\x00\xbd\
-\x4a\x5c\x01\x9e\x06\x8f\x8f\xcc\x37\xfc\x39\x6d\x3a\x68\xaa\x07\
-\xea\x28\xdb\xff\xd6\x7c\xdd\x58\x70\xee\xb9\xe7\x86\xc9\xb9\xbb\
-\x97\x00\x67\xbe\x49\x2f\xb4\xd1\xb5\x55\xe2\x19\x11\x7d\x0d\xda\
-\x9e\xaf\x1b\x0b\x62\x4d\xfb\x4d\x4e\xf2\xb3\xbe\xc9\xef\x64\x0d\
-\x54\xe2\xb9\x0d\x7f\x29\x9b\x32\xf1\x07\x59\xbd\x61\x18\x86\x61\
-\x18\xc6\x60\xb0\x73\xaf\xbc\x66\xa8\x3c\xa1\x83\x33\x30\xac\x61\
-\x82\x73\x93\xaf\x98\xd5\x60\x07\x3f\x01\x57\x82\x98\x04\x1a\xb4\
-\x6b\x71\x98\x00\x36\x24\xe3\x11\x82\x0f\x10\xcf\x17\x34\xab\xf8\
-\x12\x46\xe8\xeb\xc2\x08\x7d\xed\xdd\x77\xdf\xbd\x94\x80\x43\x38\
-\x7f\x0b\xc3\x89\xeb\x7d\xab\x29\xc6\x10\x27\x15\xea\xc9\x40\x95\
-\xb2\x8a\x4e\xc0\x8e\x36\x8c\x7b\xed\x7c\x96\x2c\xe2\x30\x35\x95\
-\x45\xca\x61\x20\x47\x7f\xc6\x9a\x50\x8a\x39\xf3\x8b\xe5\x15\x19\
-\x0a\xfa\x70\x9a\x46\x27\x2a\x70\x9a\x70\xa4\x91\x1f\xda\x40\x5b\
-\xea\xda\x58\x12\x7d\x0a\xf9\x38\x3e\x5f\xd3\x19\xc2\x59\xbe\x9c\
-\x39\x8e\x73\x87\x9c\x97\xbb\x48\x9b\xb4\x13\xa2\x1c\xe5\x73\x87\
-\xe3\xd8\x92\x0c\x38\xa1\xba\x7e\x12\xc7\xbe\x9a\xdc\xc6\xb9\x6b\
-\x32\xfe\x9a\x83\xd1\xc6\xe7\xcc\x37\xe4\x9d\xc0\x22\x09\x0b\x82\
-\x07\xec\x9e\xe4\x5d\x24\x58\x71\xcc\x94\x4c\x62\x0c\xe5\x50\x56\
-\x83\xd7\x75\xef\x13\xe9\xbd\x41\x63\xdb\x39\x39\x0a\xc4\xcf\x72\
-\xa7\xfb\xb0\xfc\xcc\x31\xef\x4c\x7f\x85\x1e\xfe\x34\xba\x98\xf9\
-\xa4\x93\xb2\x04\xa6\x08\xa4\x95\x01\xbf\xba\xf6\x35\xa1\x68\xff\
-\x93\x4f\x3f\xfd\xf4\x7f\xc8\xd7\x8d\x1d\xbb\x76\xed\x3a\x9f\xf5\
-\x13\x99\x2d\x77\x36\xa3\x03\x90\x9f\x41\x3c\x2e\x49\xf3\x2b\x9e\
-\x7f\x79\x56\x3f\x32\x4e\x3a\xe9\xa4\xa7\x25\x0f\xf0\x98\xf5\x4e\
-\xdf\x88\xd0\x29\xb0\xea\x8e\xdc\x86\x72\xd1\x49\x82\xae\xc4\xe5\
-\x97\x5f\xfe\x7e\xcd\xcb\xea\x49\x25\xc9\xaf\x48\xff\x5f\xd7\xde\
-\x7e\xa4\xe7\x42\x57\x3b\x98\x32\x24\xae\xbe\xfa\xea\xdf\xfa\xe8\
-\x47\x3f\xfa\x0c\xc9\x1c\x25\x53\xd1\x2f\xd5\x31\xaa\xe3\x7f\x5b\
-\x52\x5d\xd4\x8b\xac\xf2\x0e\xf4\x03\xba\x9a\xf7\x32\xef\x90\x13\
-\xe6\x20\x32\xc3\x7c\x44\xce\x99\x9b\xd8\x15\x24\x52\x33\xb1\xf4\
-\xb9\x98\xb7\x9d\xaf\xb9\xc3\xa2\x3c\xa9\x8b\xfc\x13\x30\x54\xd2\
-\xb7\x69\x90\x53\xfc\x79\xf0\xc1\x07\x3b\xfb\x1e\x0d\x09\x1b\x92\
-\xd5\xe8\x6f\x36\x68\xd0\x66\xd6\xd9\xf2\x74\x52\x9b\xdd\xfe\xfc\
-\x1e\xe5\xc6\xb6\xd6\x60\xe7\x93\x34\x28\xaf\x7e\x95\x6d\xa9\x24\
-\x4d\x29\xa7\x75\x6d\x82\xf8\x0d\xbe\x67\xb5\x13\x41\xac\x83\x77\
-\x28\xc8\x1d\xf2\x7c\xf3\xe1\xc3\x87\x6f\x0a\x9b\xed\x97\x43\xff\
-\xcd\xaa\x6f\xd4\x86\x4d\xf5\x37\x24\x0e\x90\x55\x6d\x06\xd3\xda\
-\x2d\x79\x85\xbf\x75\x7c\xad\x52\x8e\xff\xa7\xb3\xea\x4e\x10\xfe\
-\xee\x4f\x91\x04\xd5\xc9\x35\x6d\x64\x41\x6e\x75\x62\x57\xc9\x8f\
-\x32\xa9\xd0\x4f\x3e\xf4\x5b\xf4\xf1\x5f\xe7\x2b\x3a\x45\xd8\xaa\
-\x1b\xb0\xe3\xb1\xe7\xea\xec\xf8\x7e\xed\x84\xf8\x4d\x7a\x01\x7d\
-\x19\x32\x75\x7e\x56\x3b\x16\x6c\xdc\xb8\xf1\xcd\xf8\x47\xda\xb8\
-\xc2\xcd\x0d\xc8\x04\x3c\x2d\xed\x8c\x41\xed\xac\xa3\x6c\xfb\xb1\
-\xf9\xaa\xb1\x21\x6c\xce\x0b\xb1\x91\x15\x03\xe0\x14\x3f\x6d\x95\
-\xfd\x3f\x4c\x5b\x4b\x8a\x67\xaf\xca\x57\x8d\x0d\x31\xdf\xde\xc2\
-\x46\x38\xae\x77\x65\x73\x68\x99\xb0\x6b\x9a\x5c\x14\x25\x5f\x19\
-\x9b\xd7\x65\xf5\x86\x61\x18\x86\x61\x18\x83\x51\x3a\x5a\xba\xa2\
-\x02\x47\x4b\xdf\x52\x90\x81\x8a\xb1\xd1\xd4\x30\xc1\x28\x99\x6d\
-\xce\x4e\x3f\xe0\x4c\x28\xc0\x46\x10\x53\x57\xc0\x11\x70\x95\x23\
-\xd1\xc6\x28\x83\xc4\x2b\x11\x86\x28\x14\xf5\xcc\x89\x24\xdb\x74\
-\x08\x63\xf3\x55\xa2\xfc\x53\x27\xe0\xfa\x41\x9c\x53\x02\xe0\x0a\
-\xce\xb6\x4d\xf0\x51\x06\x27\x30\x1c\x82\xb1\x26\x94\x96\x2c\x59\
-\x72\x33\x72\x53\x5e\x91\xa1\xab\xee\x14\xac\xc7\xb9\xab\x06\x3c\
-\xeb\xda\x28\x4a\x39\xf9\x48\xbe\xa2\x53\x5c\x70\xc1\x05\xef\x20\
-\xa8\x86\xd3\xcc\xe9\x34\xed\xfa\xc7\x01\x69\x1a\xa4\x12\x6f\xe9\
-\x63\xf4\xf5\xb3\x59\xf5\x48\x20\xb9\xcd\xf7\xcc\xd8\xd5\xa8\xd3\
-\x13\x4a\x6e\xd3\xc6\x36\x09\xc5\xe4\x27\xfc\x3f\x32\xe7\x48\x9c\
-\x12\x98\x21\x60\x40\x02\x90\x24\x12\xef\x21\xb0\x38\xae\x93\x49\
-\xf9\xce\x89\x9e\x3e\xec\x07\xf1\x53\x9b\x05\xe8\xa3\x4e\x24\xd2\
-\x3f\x39\xf5\xb4\xbb\x69\xdf\x82\x1f\x63\xbb\xae\xa3\x0a\x02\x10\
-\x4a\x26\x32\xf7\xb5\xa3\x95\xc4\x9e\x76\xb4\x32\x0e\x75\xed\x1b\
-\x44\xb4\x3f\xe4\xf5\x0d\xf9\xaa\x4e\x10\x32\xb5\x09\x59\x22\xa0\
-\xa6\x24\x0d\xa7\x35\x86\x59\x43\x53\x8e\x08\x1e\x7f\x47\x56\x3f\
-\x12\x62\xfc\xff\x87\xae\xa3\x52\x50\x95\x04\x2a\x3a\x0b\x1e\xa3\
-\xb3\x4a\xfd\xda\x74\x8e\x45\xd9\x4d\xf9\x8a\x4e\x11\x73\xf3\xa7\
-\x58\x9b\xb5\x6b\x1c\xbe\x22\xbf\x5a\x9f\x69\xaf\xda\xd4\x94\xc7\
-\x25\x65\x5f\x90\xef\x1f\xcf\x57\x1a\x43\xe0\xda\x6b\xaf\xfd\x37\
-\xb1\x5e\xdf\x49\x30\x4e\xdf\x51\x91\x0e\x65\xbd\x68\x22\x57\x6d\
-\x89\xfa\xa8\x97\xf1\xe3\x3d\x65\x62\x89\x75\x98\x76\x10\xd8\x9e\
-\x2e\xb1\x14\x74\xe7\xce\x9d\x3b\x3b\xbf\x5e\xab\x2d\xfa\x25\x40\
-\x9a\x06\x8e\x21\xca\x50\x36\xf8\xd1\x49\x42\x89\xd3\x49\x24\x93\
-\xb4\xd6\xa0\xbf\xb9\xe9\x80\xf9\xaa\x53\x55\x65\x12\x6c\x50\x9b\
-\x35\x9e\x59\xfd\x58\x80\x9f\x83\xbd\xc6\x06\x12\xae\x3e\x24\x91\
-\x8e\x2e\x29\xaf\xd2\x55\xdb\xea\xda\x24\xa2\x6d\x94\xeb\xda\xfe\
-\xad\x82\x53\xd5\xf9\x9f\xb3\x12\xe1\x3b\x7d\x0f\x27\x51\x48\x24\
-\xca\x6e\xd7\xc9\x34\xe9\x80\x26\xfc\x15\xc1\xe7\x90\xd9\x4b\xb3\
-\xfa\x4e\xb0\x7c\xf9\xf2\xdd\xe5\x9a\x28\x1b\x09\xdd\xa0\x8d\x2c\
-\x92\x5b\xcd\xb5\xba\xb6\x8a\x68\x73\xd0\xca\xac\xbe\x73\x5c\x7c\
-\xf1\xc5\x3f\x89\xad\x51\x3d\x51\xc3\x1a\xde\x84\xd7\xfc\x4e\x39\
-\x74\x49\xf4\xf3\xf1\xac\x76\x2c\x58\xb3\x66\xcd\x06\xf8\x8a\x7f\
-\x84\x9d\x8d\xcd\xcd\xd5\xd5\xc4\x15\xe0\x29\xef\x6c\x23\x0f\xa2\
-\xd4\x0d\x1f\xcd\xd7\x8c\x15\xa1\x67\x3f\x42\x0c\x04\x5f\xae\xf4\
-\x3b\xb0\x33\x9a\xfa\x1d\xfd\x28\xdb\x3d\x96\x6f\x3d\x95\x08\x5d\
-\xb6\x94\x79\xa7\x53\x75\x9c\x52\x42\x6e\xd1\x69\x65\x12\xb4\xae\
-\x4d\x55\xa2\x1c\xe5\x0f\x1f\x3e\xfc\x23\x59\xbd\x61\x18\x86\x61\
-\x18\xc6\x60\x94\x8e\xd6\x38\xae\x19\x92\x51\x92\xd5\xcf\x7a\x10\
-\xc4\x24\x80\xad\x20\x26\x01\x36\x8c\xf3\x32\xe0\x3a\xaa\x21\x09\
-\x7d\xf2\x05\x90\x4c\x9a\x24\xb8\xa2\x0b\xc7\x1f\x87\x69\x58\x47\
-\x24\xf9\x8e\x43\x38\xb6\x20\x78\x38\xce\x2f\xe7\x74\x12\xc1\x13\
-\x5d\x13\x59\x5e\x91\xa1\x6f\xd3\xe8\x64\x1f\xef\x1f\x24\x3b\xfc\
-\x9e\x32\xf6\xd2\x7c\x4d\xa7\x98\x9a\x9a\xfa\x5b\xd1\xe6\xaf\x70\
-\x8d\xce\x30\x3b\xf1\xd4\x5e\xfa\x86\xa3\x45\xb0\x3f\xab\x1e\x09\
-\xec\x72\x96\x73\x8f\x13\xca\xae\x3b\x92\x5e\xba\x3e\x4c\xed\xe3\
-\xfd\xd3\xb5\x0f\xe2\x77\xda\x17\xfa\xab\x17\xf8\x89\xf9\xbc\x84\
-\x79\x8d\xa3\x88\x73\xcb\x98\x91\x40\x86\x78\x8f\xae\x2a\x23\xe8\
-\x38\xec\xc9\xa4\xe0\xc9\xc4\xaf\xb2\x9c\x0e\xe5\x66\x81\x92\x9f\
-\xf4\x11\x7e\x96\x89\x8e\xba\x3e\x95\x94\xfd\x3b\xc2\xcf\x71\x23\
-\x9c\xf9\xd7\xd1\x56\x25\x13\x4b\xa7\x5e\xc9\x03\xc9\x66\x5d\xfb\
-\xa6\x23\xda\x1e\xb4\x21\x5f\xd5\x19\xa2\x0f\x17\x2b\x28\xa5\x44\
-\x0d\xb2\x44\x60\xbb\x6d\x40\x82\xb2\x9f\xf8\xc4\x27\x9e\xcc\xaa\
-\x47\x46\xf0\xf5\x16\xd6\x3a\x76\x62\xb3\x79\x82\x84\x2a\x41\x55\
-\x64\x9e\x04\x4d\xdb\x20\x75\xca\xc3\xc7\x63\xee\x7f\x6b\xbe\xa2\
-\x73\x84\x6d\xb2\x47\xc1\x3e\x02\x95\x5a\x0f\x9a\xce\xd1\xe9\x88\
-\x67\xa9\x23\x5f\x65\x8c\x88\x1b\x6e\xb8\x61\x03\x72\xa5\xc4\x3c\
-\xe3\xc4\x1c\xd0\xda\x3d\xca\x58\xd5\x11\xf5\xa5\x4c\xf6\xc6\x11\
-\x99\x80\xb0\x5f\x59\x8b\x69\x03\x3a\x8f\xc4\x29\xed\x62\x6e\x62\
-\x57\x94\x89\x25\xec\xdf\x58\x17\xce\x8d\x35\x61\x2c\x49\xdc\x71\
-\x60\xd5\xaa\x55\x07\x38\x49\x4b\xf2\xb7\x9f\x3e\x1c\xc4\x4b\xca\
-\xc0\x77\xf8\x90\xd5\x8e\x15\xa1\x53\xee\xe7\xe4\x23\xdf\x92\xc4\
-\x8f\xd0\xe9\x24\x12\x60\xb4\x97\xd3\x49\xd2\x81\x4d\xd7\xd2\x28\
-\x37\x56\x7b\x79\xc9\x92\x25\xbd\xab\x5f\x09\xbe\xb2\xe6\xb3\x79\
-\x84\xcd\x3f\x04\x5f\x69\x5b\x93\x8d\x63\x92\x2f\xf8\x8e\x3c\x87\
-\xce\xec\xf4\x9b\x44\x73\x09\x31\x77\xfe\x87\x92\x89\xba\xa2\x11\
-\x7b\x18\x3f\xb2\x4c\x28\x0d\x1a\x7b\x48\x7c\x8e\xb9\xfb\x7f\xb2\
-\xfa\x4e\x10\x32\xfb\x45\xec\x78\xd6\x44\xe4\x82\x76\xeb\x74\x8a\
-\x36\x54\x2a\x99\xd0\x44\x6e\xa3\xcd\x5f\x08\xfc\xfd\xac\x7e\x22\
-\x08\xbd\xf0\x31\xd6\x71\xf9\x48\xa5\x6e\x68\x22\xcf\x94\x41\xf6\
-\x99\x03\x31\x4f\xff\x55\x56\x3b\x32\xc2\xe6\xdc\x4f\x5c\x01\x3f\
-\x0e\xbd\x0a\x5f\x49\x76\x48\x1e\xd0\xcb\x4d\x78\x5a\x25\xca\x47\
-\x7b\x7f\x22\x5f\x33\x56\x2c\x5f\xbe\xfc\xe3\xba\xf2\x10\x7f\x40\
-\xfa\x41\x1b\x4b\x9b\xe8\xda\x3a\xe2\x99\x78\xf6\xbd\xf9\x9a\xb1\
-\x22\xe6\xdb\x15\xd8\xf7\xf8\xca\xe8\x5c\x36\x4b\xe0\xcf\x21\xbb\
-\x6d\xe6\x1c\x44\xff\xa2\xfc\xe7\xb3\x6a\xc3\x30\x0c\xc3\x30\x8c\
-\x66\xc0\x11\x2c\x1d\xad\xea\x35\x43\x18\x52\x6d\x1c\x01\x28\x8c\
-\xd9\xce\xbe\xb3\x31\x4e\x10\xc0\xc6\xa1\xc0\x20\xe3\x44\x0c\x41\
-\x4c\x5d\xd1\x51\x0d\xb8\x36\x35\xca\xaa\xc4\x73\x61\x38\x3b\x99\
-\xd4\x02\x9b\x36\x6d\x3a\x9a\x31\x51\x60\xb9\x7a\x55\x02\xf2\x88\
-\xf1\x5b\xc7\xef\x92\x92\xf7\x18\xd6\x63\x4b\x28\xad\x58\xb1\xe2\
-\x2c\x76\x35\x12\x3c\xd1\xd5\x2e\xec\x1e\x56\x1b\x09\x20\xd3\xc6\
-\x26\x01\x0a\x51\xb6\x73\xa2\xd7\xee\x84\x93\xf7\xa8\x4e\x28\x90\
-\x68\xd1\x89\x3c\x1c\x3d\xf8\x4b\xdb\xe1\x71\x95\xf8\x3b\x44\x19\
-\xe6\x46\xf0\xf6\x93\xa1\x27\xf6\x85\x03\xf3\x2f\xb2\xea\xa1\xa1\
-\xe4\x36\x7c\xc5\x09\xd5\x35\x3f\x38\xa1\xdc\x0b\x4e\xdb\x34\x1f\
-\xeb\xf8\x58\x92\xc6\x9e\x7a\x1f\x78\xe0\x81\x45\xf4\x8f\x20\x22\
-\xe3\x84\x03\xce\xd5\x64\xc8\x16\x4e\x18\x41\x45\xde\x53\x9e\x4c\
-\xd2\xbb\xa8\x63\xd0\xfb\xf8\x3d\x78\x33\xb1\xef\x2a\x34\x85\xf8\
-\xc9\x55\x2e\x4a\xce\xd2\x4f\x1c\x4e\xf1\xb3\x8d\x6e\x17\x3f\xbb\
-\xc0\xaa\x55\xab\xce\x50\xf2\x8b\x5d\xa2\x0a\x48\x12\x24\xa1\xad\
-\xe8\xe2\xa6\xf3\xbe\x24\xda\x1d\xf4\x58\xb4\xfd\xdb\xf2\x55\x9d\
-\x21\xd6\x93\xbb\xcb\x80\x25\x3b\xb4\x87\x0d\x48\x50\xf6\xf1\xc7\
-\x1f\x1f\xcb\x4e\xdc\xad\x5b\xb7\xfe\xa0\xbe\x13\xc1\x15\x34\xac\
-\x75\xd5\xb9\x3f\xcc\x5a\x1f\x65\xff\x34\x5f\x31\x11\x84\xfc\xbe\
-\x1d\xb9\x60\x0e\x73\xca\x4e\x89\x5f\x25\x2a\x72\xac\x6b\xdb\x3b\
-\x88\x78\x2e\x78\x7e\x7f\xbe\xca\x18\x03\x42\xb6\x7e\x62\xdf\xbe\
-\x7d\x57\x20\x5f\x24\xff\xb4\x2e\x4a\xaf\x6a\x3e\x0c\x3b\x66\xfd\
-\x28\xc7\xb2\x47\xc8\x05\xef\x43\xd7\x29\xb1\x44\xb0\x8d\x36\xa1\
-\x5b\x08\x1a\xea\xc4\x12\xfa\x91\x4d\x45\xdb\xb6\x6d\x7b\x22\xd6\
-\xf4\x5f\xc9\x6e\xcc\x28\x42\xa7\x1c\xe4\xba\x52\x7d\xdb\x94\x35\
-\x8c\x35\xaa\x4d\x92\x9a\x32\xf0\x1b\x1d\x9a\xd5\x8e\x0d\x9c\x4e\
-\x92\x6e\xd1\x49\xd8\xea\xc9\x72\x9d\x00\x62\x1c\x06\xb5\x57\x63\
-\x97\xd5\x8f\x0d\xa1\xf7\x0e\x91\x38\x20\x60\xcc\xb7\x9d\xe0\xa5\
-\x74\x88\x92\x06\x4d\xdb\x46\x3f\xe0\x25\xc1\x7b\x4e\x3d\xe7\x2b\
-\xe6\x35\x62\xdd\xbb\x44\x89\x99\x51\x13\x08\x94\xa1\x6c\xc8\xcc\
-\xcf\x66\xf5\x63\xc7\xea\xd5\xab\x8f\xe3\x54\x1d\x76\xfc\x74\xdf\
-\x94\x95\x8d\xd4\x44\x36\xa2\xcd\x63\xbf\x86\x6d\x10\x76\xec\xd8\
-\x71\xb1\x4e\x55\x29\x01\x52\xb6\x7b\x10\xbf\xf9\x5d\xf2\x1c\x7a\
-\x65\x6c\xdf\x6e\x0d\xbf\xfa\xaf\x89\x2b\xa0\xbb\xb0\x87\xca\x04\
-\x8d\x12\xb8\x83\x78\x5a\x25\xca\xc6\x33\x9d\x24\x66\x40\xb4\xf7\
-\xab\x6c\xb6\xe1\xc4\xaa\xbe\x59\xa7\x13\x76\x6d\xe4\xb7\xa4\x6c\
-\xf3\x9d\xf9\x8a\xb1\x23\x74\xee\xa3\xe8\xdd\x41\x1b\xf0\xea\xda\
-\x56\x25\xc6\x63\x5c\x36\xa7\x61\x18\x86\x61\x18\xf3\x08\x24\x54\
-\xb8\x66\x08\x47\x4b\xd7\x0c\xe9\x84\x0e\x86\x1f\x06\x09\x86\x54\
-\x9d\x01\x52\xa5\x34\x9e\x78\x66\x4e\x24\x50\x08\xb8\xe2\x08\x13\
-\xc0\x56\x10\x93\x9d\x5e\xec\x60\x1d\xe6\x74\x56\x95\x78\x2e\x78\
-\xe7\x64\x52\x4b\x84\x13\x72\xa6\x76\x3b\x6a\xb7\x3f\x32\x89\x03\
-\x2f\x99\x44\xce\xea\x78\x5e\x52\xf2\x7f\xac\x09\xa5\x98\x2f\x9f\
-\x63\xce\xe8\x54\x5b\xf9\xe1\x69\x5d\xed\x82\xdc\xa8\x8d\x4d\x64\
-\x27\xca\x3d\x75\xc1\x84\x3f\x0e\xbe\x69\xd3\xa6\x9b\x71\x9c\xb4\
-\x23\x13\x99\x27\x70\xaf\xe0\x4a\xb4\xff\x8b\x41\x87\x42\xfe\xaf\
-\x0c\x1e\x6e\x88\xbf\x1d\x1b\x4e\xe0\xd1\xf1\xb7\x9f\x0e\x7e\x7e\
-\x77\x56\x33\x56\xc4\x98\xf7\x76\x11\xb3\xab\x11\x27\x54\x4e\x9d\
-\x9c\x64\xda\xc5\x7c\xac\xe3\x61\x95\xe0\x7d\x94\xdd\xcb\xd8\xf3\
-\x2c\x01\x02\x64\x88\x24\x05\xc1\x2e\x92\x4a\x8c\x1b\xb2\x45\xe0\
-\x63\xd4\x93\x49\xd9\x85\x59\x05\x6d\x16\xc0\x49\x2e\xf9\xa9\xeb\
-\x23\x71\xea\x9b\xea\x76\xf1\x33\xab\x1e\x3b\x42\x07\xdf\x4c\x70\
-\x47\xdf\x31\xd0\xe9\x19\x02\x52\x04\x24\x47\x71\xe8\x83\x8e\xca\
-\xd7\x74\x8a\x45\x8b\x16\x7d\x56\x27\x7d\x35\xaf\x86\x0d\x48\xc0\
-\xef\x90\xc1\x75\x59\xf5\x48\x88\x75\x6e\x0d\x49\x70\x02\x7e\xcc\
-\x2d\xe6\xbd\x76\x35\x33\xef\x09\xb0\x97\x27\x2a\xeb\xda\x53\xa5\
-\x68\xdf\xe7\x0e\x4e\xe0\xc3\xe3\x25\x2e\xbe\xf8\xe2\x97\x20\xc7\
-\xa5\xce\xd2\x4e\x5c\xda\x0e\xcf\xda\xca\x87\x88\x67\x43\xbf\x6c\
-\xce\x57\x19\x63\x44\xe8\xd6\x37\x87\xce\xb9\x9d\x20\x17\xc9\x55\
-\x82\x97\xb9\xc6\xf4\xe4\x6d\x94\x71\xeb\x47\x39\xef\x7b\x75\xf3\
-\x0e\xd6\x0d\xde\xc7\x3c\xac\x9e\x58\x2a\x13\x4b\xac\x0d\xd8\x81\
-\xec\x52\x3f\xef\xbc\xf3\x26\x9a\x30\xad\x43\xc8\xfb\x51\xe8\x6f\
-\xed\x9a\xd7\x75\xcc\xa5\xfe\x1e\xc4\x3b\x7e\xa7\x1c\xf3\x24\x74\
-\xe9\x2f\x67\xd5\x63\x01\xdf\xa0\xd1\x77\xd9\xd0\x2d\x9c\xf2\xe0\
-\xc4\x17\xbc\x2c\x4f\x4c\x30\xde\x2d\xda\x3a\x76\x9b\x39\x6c\xb5\
-\x1d\xb4\x51\x09\x2f\x12\x07\x3a\x3d\x25\xdd\x37\x48\x0e\xf9\x8d\
-\x32\x94\x85\x97\xe8\x1e\x74\xd0\x75\xd7\x5d\x37\xb1\x6b\xce\x66\
-\x2b\xc2\x1e\xfe\xb8\x36\x26\x22\x03\xda\x98\x88\xad\xa1\x0d\x15\
-\x4d\xc6\x1f\x4a\x19\x98\x0a\xfc\xed\xac\x7e\xec\x88\xb5\xfa\x3e\
-\xe4\x56\xdf\x40\x95\x7d\x24\x9b\x83\xb1\x45\x4f\x49\x47\x0d\x6a\
-\x77\x94\xf9\xc6\x17\xbe\xf0\x85\x7f\x90\xd5\x4f\x0c\xe1\x7f\x1c\
-\xaf\xcd\x57\x3a\xa5\x54\xb6\xbd\x89\x4c\x4b\x2f\xc6\x73\xc7\x64\
-\xb5\x23\x21\x74\xd5\x77\x29\xae\xc0\x7c\x23\x19\x8e\x9d\xad\x0d\
-\x77\x4d\xe7\x5b\x95\x82\xc7\x8f\xe4\x2b\xc6\x8e\x18\xff\x97\x13\
-\x0b\xc0\x7e\x2b\xaf\xc4\x1c\xc7\x89\xaa\xa0\x4e\xae\x52\x8d\x71\
-\xff\x36\x25\xf2\x95\x50\x62\x43\xec\x28\x09\xa5\x28\x3f\xef\x75\
-\x99\x61\x18\x86\x61\x18\x2d\x10\x86\x74\xef\x8a\x29\x0c\x12\x9d\
-\xd0\x61\xf7\x2f\x3b\xf5\x71\x04\x4b\xc3\xaf\xce\x00\xa9\x12\x86\
-\x0b\x65\xc3\x90\xe9\xec\x3b\x1b\xe3\x44\x38\x41\x87\x75\x2c\x5f\
-\xc1\x75\x82\xcb\x0a\x02\xb6\x71\x82\xaa\xc4\x33\xf1\xac\x93\x49\
-\x43\x80\x84\x92\x12\x36\xa3\x26\x94\x08\x24\x85\x33\x30\x96\x6b\
-\xba\x62\x8e\xfc\x41\xf9\xed\x24\x25\x21\x75\xaa\xad\x6c\x5f\x53\
-\xb9\xc9\x39\xf3\xc7\xf9\x8a\x89\x21\xda\x7e\x4e\x38\x51\x1f\x09\
-\xc7\x69\x6b\x38\xd1\xc7\xc4\x9c\xff\x8d\x70\xf6\x5e\x1a\xf4\xf7\
-\xb2\xc8\xc4\xc1\x95\x5c\x38\xf8\xd5\x1d\xd9\x38\xa1\x04\x25\xc4\
-\xd7\x3a\x3e\x56\x09\xf9\xc8\xb1\xef\xcd\x65\x82\x70\x8c\x11\x4e\
-\x22\xe3\xc5\xf5\x41\x04\xbd\x08\x7a\xe0\x80\x0d\x7b\x32\x29\xe8\
-\x94\x6c\xfe\xac\x43\xf9\x4d\x22\xf8\x49\xb0\x74\x14\x7e\x46\xf9\
-\xce\xf4\xd9\x49\x27\x9d\xf4\x45\x12\x1e\x0a\xee\x94\x27\x7c\xa4\
-\x8b\x69\x43\x93\x39\x55\x52\xf4\x6f\x67\xbe\xa2\x53\x84\x73\xff\
-\x7d\xd2\x0b\x9c\x5a\x2c\xaf\x8e\xa5\xfd\x38\xf7\x4d\x75\x02\x44\
-\xd9\xe8\xf3\xbb\xb2\xfa\x91\xb0\x60\xc1\x82\xc7\x08\xf0\xb0\xce\
-\x2b\xa0\xaa\x1d\xcd\x75\x3b\xb1\xeb\xda\x53\xa5\x90\x85\x19\x59\
-\xe3\x37\x6f\xde\xfc\xb0\x76\x92\xb3\x26\x20\xcb\xda\xf1\xdc\x86\
-\xbf\x55\xa2\xdf\x8f\x3f\xfe\xf8\x7f\xca\xd7\x18\x1d\x20\xe6\xc2\
-\x1f\xc4\x78\x3d\xa2\xd3\x4a\xcc\x89\xae\x13\x4b\x10\x75\x52\x37\
-\xd4\x2f\xb1\x84\x9e\xc1\xee\x65\x3d\x60\x7d\x20\x20\x9e\xa7\x58\
-\x3b\xbf\x2a\x73\x3a\x90\x50\x22\xc9\x2e\xfb\x94\xf5\x0b\xfb\xb4\
-\x4d\x92\x9d\xdf\x29\x47\xf9\x71\x26\x94\x38\x9d\x54\x7e\x83\x06\
-\x1f\x02\x9e\x61\xaf\xf5\xd3\x2d\xd3\xb5\x35\xdb\xd9\xc9\x1a\xc3\
-\xa9\x77\x6c\x0b\xf4\x9f\xae\x0f\x64\x13\x09\x36\x5b\x19\x7c\xaf\
-\x6b\x97\x48\x72\x24\xbb\x02\x39\x26\x61\x82\xcf\x40\xb2\xef\xfc\
-\xf3\xcf\x5f\xbf\x63\xc7\x8e\x79\x99\x94\x0e\x5b\xe3\x1b\xac\xdf\
-\xd8\x1a\x24\x3f\x65\x6b\x20\x03\xe8\x67\xe6\xf9\xa0\xf1\x17\x51\
-\x26\x78\x7c\x38\xab\x1e\x3b\xa2\x7d\xaf\xe0\x74\x52\x29\xb7\xf8\
-\xbe\xc8\x84\x36\x53\x62\x1f\xd1\xe6\xa6\x72\x1b\xe5\xb6\x67\xf5\
-\x13\x45\xd8\x75\xff\x41\x32\xad\x35\xb1\x3c\xc1\x38\x48\x3f\x64\
-\xdb\x7b\x65\x43\x37\x2c\xce\x6a\x47\x42\xf8\x16\xff\x15\xde\xe2\
-\xc3\xf1\xfd\x37\x74\x02\x71\x05\xcd\x37\x25\x3a\x06\xcd\xb7\x92\
-\x68\x67\x94\xef\xec\x74\x52\xb4\xf3\x5d\xb4\x79\x9c\x09\xa5\x6c\
-\x73\x67\xa7\x9e\x43\xa7\xfd\x86\xe2\x37\x24\x94\xb8\x29\x83\x13\
-\x4a\xe5\x46\x1b\xc6\xb6\x49\x9b\x29\x43\xff\xc2\x8e\x7a\x7b\x56\
-\x6f\x18\x86\x61\x18\x86\x31\x18\x24\x94\x08\x82\x61\x54\x13\x04\
-\x23\x38\x4e\x90\x55\xa7\x15\x70\xb4\x64\x50\xd7\x19\x21\x55\x4a\
-\x03\xaa\xb3\x6b\x91\xc6\x0d\x02\xae\xec\xaa\x23\x80\xad\x1d\xa0\
-\x72\x84\xe5\x50\x60\x64\xd5\xf5\x75\x10\xc1\x8b\x7c\x8d\xd1\x12\
-\x0a\x7e\xea\xdb\x01\xba\x86\x62\xd8\x84\xd2\xc3\x63\xfa\x80\xf2\
-\xd2\xa5\x4b\x7b\xdf\x21\x51\xd2\xa3\x0c\x7c\x2b\x09\xa9\xc0\x71\
-\xd3\xf6\x45\xd9\x8f\x67\xf5\xf3\x1a\xe1\x10\xbd\x55\xce\x11\x0e\
-\xb2\x1c\x7c\x25\xea\x08\x40\xb6\x71\x42\x29\xc7\xd8\xe3\x08\x32\
-\x2e\xec\x44\x46\xaf\xe1\x70\x73\x15\x0f\x81\x43\xea\xc6\x61\xe4\
-\x37\xca\xb4\xd9\x91\x9a\x63\x37\x6b\x13\xc6\x25\x3f\xcb\x80\xc9\
-\xb0\xfc\x84\x27\x51\xbe\x93\xfe\xb2\xd3\x52\xbb\x85\x95\xfc\x2a\
-\x93\x89\x6d\x03\x52\xa2\x28\xff\x97\x21\x03\xff\x30\x5f\xd3\x29\
-\x82\xc7\xef\x18\x57\x42\x29\x65\x8b\x3e\xff\x42\x56\x3f\x34\x62\
-\x2e\xfd\xaa\x92\xe0\x04\xa6\xb5\xce\x73\x52\x8f\x00\x0f\xc1\x74\
-\x02\xeb\x4d\xf9\xcb\xef\x59\xe6\x1f\xe7\x2b\x26\x8a\x6d\xdb\xb6\
-\xed\x46\xef\x96\xbb\xc9\x09\xae\x2b\x78\xd2\x54\x9e\x4b\x12\xbf\
-\xe3\x79\x7f\x8c\x7a\x02\x88\x31\x7b\xcf\xbd\xf7\xde\xfb\x18\xe3\
-\x86\x1e\x42\x47\xa3\x8b\x34\x7e\x85\x8c\x8d\x8d\x54\x27\xf5\xe7\
-\x58\xf7\xde\xc9\xbb\x69\x03\x6d\x41\x2f\x92\x20\xd0\xc6\x03\x12\
-\x23\xec\xfc\x0f\x5a\x9a\x4d\x9f\x11\xc8\x3e\xa7\x2d\xd8\xe7\xba\
-\xb2\xb4\x69\xc0\x50\xfd\x26\xe9\x1a\xba\x74\x61\x56\x3b\x32\x38\
-\x9d\xa4\x93\x08\xb2\x87\x34\x2f\xe5\x43\xb4\x39\x8d\xc0\xef\x31\
-\x36\x9d\x26\x94\x58\x0b\xb1\x29\xcb\x00\xb7\xd6\xfd\x41\xed\x83\
-\xb2\x8d\x3d\x7d\x89\x8f\x80\xed\x80\xbc\xa0\x4f\x09\x42\xc3\x03\
-\xde\xb1\x75\xeb\xd6\x2d\xb1\x06\x6f\xcb\xd7\xbf\xa0\x71\xd6\x59\
-\x67\xfd\x28\x72\xa0\x84\x1d\x9b\xc0\xb0\xd9\xe1\x0b\xc9\x8d\xb6\
-\x27\x52\x28\x17\xe5\x3b\xe3\xdd\xe9\xa7\x9f\xbe\x5b\xbe\x9f\x4e\
-\x54\x29\x59\x8b\xdc\x92\x28\x6c\x7a\xc2\x07\xa2\x4c\xcc\xc3\xce\
-\xae\xe7\x9b\x0e\x21\x6f\xdf\xa3\x4d\x38\x24\xc1\x49\x6e\x96\x9b\
-\x70\x90\xd5\x41\xed\xa7\x0c\x7d\x8d\x67\x36\x66\xb5\x23\x21\xf8\
-\x7b\x76\x5d\x5c\x81\xb5\x1a\x9d\x80\xce\x6d\xa2\xb7\x4a\xa2\xec\
-\xa7\x3f\xfd\xe9\x7f\x92\xaf\x18\x3b\xc2\xee\xdc\x42\x9b\xd9\x5c\
-\xca\x89\x2f\x9d\xe6\x1f\xe5\xca\x3b\xca\xc6\x33\xc7\xe5\x2b\xc6\
-\x8e\x68\xf3\x69\xe2\x73\xf9\x0d\xa5\x61\xf8\x9c\x6d\x45\x0e\x5e\
-\x96\xd5\x1b\x86\x61\x18\x86\x61\x0c\x06\x27\x74\x30\xaa\xd9\x95\
-\x83\x51\x8d\x11\x35\xcc\x0e\x48\x91\x8c\x92\xac\x7e\x56\x83\x80\
-\x6b\xd5\x09\x22\x80\x40\xe2\x02\x27\xa8\x6d\xc0\xb5\x4a\xc1\x87\
-\x59\x1b\x6c\x9e\xad\x60\x4c\x96\x2c\x59\xd2\x3b\x35\x46\x60\x96\
-\xdd\x6d\x3a\xc6\x8f\x73\x4a\xf0\xb3\xe9\xb8\x20\x8b\xe9\x98\x8e\
-\x45\x1e\xc3\x31\xfa\xde\x72\x57\x63\xb4\xf5\xc8\x89\x3e\x39\xce\
-\xb4\xad\x4d\xe0\x9b\x32\x61\xf0\x8f\x65\x57\xe0\x5c\x87\x4e\x4b\
-\xc2\x5b\x9d\xfc\xc2\x39\xe2\xf4\xd0\xb0\xc9\x6d\xca\x67\x10\xad\
-\xb7\x63\x8f\x44\x31\xc1\x38\x82\x06\xfc\xcb\xff\x23\x53\x04\x86\
-\xd0\x75\x92\xab\x26\x63\x17\xe5\x66\xe5\x35\x77\x42\xb9\x59\x40\
-\xfc\x24\xe8\x35\xec\x66\x81\x2e\xf5\xfa\xba\x75\xeb\xfe\x13\xba\
-\x98\x6f\x19\xa0\x8b\xb5\xa3\x95\x79\x45\xc0\xaf\x6d\x40\x0a\xa2\
-\x5c\xb4\xf9\xf4\x7c\x45\xe7\xe0\xfa\x54\x5d\xd9\x87\x73\x5f\x9e\
-\x26\x68\x1b\x90\x90\xec\x86\x2e\x19\xf9\x0a\x9d\x90\x83\xd5\x3a\
-\xa9\xa6\x8d\x13\x04\x9e\x74\xf5\xa1\xd6\x79\xf8\xcb\x7b\x07\xb5\
-\x2f\xf9\x7a\x71\x56\x3f\x71\x6c\xdd\xba\x75\x19\xba\x97\x75\x41\
-\x32\xd2\x66\x5d\xa8\x23\xf1\x3b\x5f\x61\x4c\x08\xa1\x7f\xdf\x1d\
-\xf3\xfb\x10\xf3\x83\x39\x2e\x39\x64\x2c\x98\x2b\x9a\xef\x83\x64\
-\xb2\x2d\xa9\x4e\xea\xe7\x5d\xbc\x93\x77\x2b\xb1\xc4\x5a\xce\xfa\
-\xc0\xe6\x22\x76\x7c\x63\x17\x07\xfd\x61\x36\x7b\xe2\x88\x79\x7b\
-\xa0\xb4\x85\x94\x08\x2e\x83\xde\x75\xfd\x14\xa9\xaf\xd8\x26\xb1\
-\x16\xde\x98\xd5\x8e\x04\x4e\x27\xe9\x1b\x34\x5a\x63\x68\x9f\x36\
-\x2d\x68\x53\x56\xd3\xa0\x36\xbf\x47\xb9\x4e\x6d\x66\xd9\xfa\xa3\
-\x26\x94\xe0\x25\xe5\x79\x0e\x79\x41\x8f\xb2\xf9\x81\x3a\xd9\x48\
-\xc0\x09\x50\x02\xe9\xbc\x8b\x00\xf5\x9a\x35\x6b\x0e\xbc\x90\x93\
-\x4b\xab\x57\xaf\x3e\xa1\x3c\x29\x81\x1c\xd4\x7d\xcb\x45\xf3\xb9\
-\x8e\xaf\x22\xf1\x37\xe6\xe5\xef\x64\xf5\x63\x47\xac\x87\x5f\x2c\
-\x37\xdb\x20\x0f\xf2\xfd\x90\x5b\xec\xc5\x96\x72\x7b\x5f\x56\x3d\
-\x71\xec\xd9\xb3\xe7\x9b\x95\x50\x18\x36\xe1\x4c\x3f\x19\x9f\xe8\
-\xf7\x79\x59\xed\x48\x08\xbe\xde\x4f\x5c\x01\x5b\xa8\x4c\xd6\x91\
-\xe8\x62\xbe\xa0\x87\x9a\xf0\x56\x44\xb9\xa0\xb3\xb3\xfa\x4e\x10\
-\xfe\xe6\x3e\x74\x99\x12\x8c\x6c\x14\x64\xe3\x19\x6d\x96\x1e\x6b\
-\x22\xbf\x25\x51\x3e\xfe\xed\x6c\xe3\x4d\xb4\xf9\x6a\xf8\x8c\xaf\
-\xac\x6b\x8c\x49\xe6\xcb\xae\xa3\xcd\x4d\xc6\x1f\xa2\x4c\x94\xfd\
-\xeb\xac\xda\x30\x0c\xc3\x30\x0c\xa3\x19\xd8\xb9\x4c\xa0\x09\x23\
-\x4a\xd7\x14\x60\x44\xb5\x75\x06\x45\xe9\x08\x74\xf6\x9d\x8d\x71\
-\x42\x01\x6c\x7d\x90\xb5\x74\xd6\xab\x41\xcc\xba\xbe\xf6\x23\x78\
-\x15\xcf\xcc\xea\x60\xf3\x6c\x40\xf0\xfc\xad\x50\x38\xf9\x87\x49\
-\x6c\x22\x8b\x04\x3e\x09\x82\x73\x55\x02\xc1\xcf\xd2\x48\x2e\x77\
-\x0e\x62\x24\x0f\x1a\x97\x1c\x07\xc6\x70\x2c\xf2\xb8\x76\xed\xda\
-\x3f\xe5\x14\x85\xbe\x43\x82\xd3\xa1\xb6\x69\x47\x98\x1c\x67\xde\
-\x3d\x68\xce\xa8\x4c\xf4\xe5\xdf\xe5\x2b\xe6\x35\x14\x90\x27\xb9\
-\xcd\x0e\x41\x39\xa1\xf0\x96\x80\x23\xbc\x45\x17\x35\x9d\x8f\xf0\
-\x56\x8e\x32\x32\x43\x1d\x24\x95\x08\x16\xb2\xab\x98\x39\x8e\xd3\
-\x45\xf0\x40\xe3\x26\x5d\xd7\x64\xec\x66\xfb\x1c\x87\x9f\xda\x2c\
-\xa0\xeb\x92\x90\xd5\x51\x12\x1c\x59\xf5\xd8\xb1\x7a\xf5\xea\xad\
-\xe8\x62\x1c\xe3\xba\x64\x62\x39\xaf\xea\xda\x57\x47\xc8\xc9\xa7\
-\x3f\xfd\xe9\x89\x9d\x38\x59\xb2\x64\xc9\x5d\xf0\x5b\xba\xa1\x4c\
-\xda\xb4\x09\x48\xf0\x3b\x14\xfd\x1d\xcb\xc9\xc5\xd3\x4e\x3b\xed\
-\x56\xad\x73\x04\xcf\x74\x5d\x9c\x92\xe0\xc8\x7f\x9b\x00\x4f\xf6\
-\x61\x22\xdf\xa4\xaa\xc3\xa6\x4d\x9b\x8e\xe7\x14\x5b\x79\x6d\xdf\
-\x30\x57\x38\x96\x44\xbf\x43\xbe\xf7\xe5\x2b\x8c\x09\x23\xec\xcd\
-\xdf\x0d\x9d\x7c\x2b\xfa\x18\xbb\x8b\xf9\x8e\x4c\x6a\x3c\x9b\xcc\
-\x9b\xb6\x44\x7d\x10\x75\xf3\x0e\xde\xc5\x3b\x79\x37\xb2\xc4\x5a\
-\x41\x30\x91\x79\x82\xde\xc4\x36\x0e\x79\x7b\x63\x36\x79\xa2\x08\
-\x5b\xf5\xa0\x12\x21\x9a\xbb\xac\x61\x6d\x37\xd7\xd0\xbf\xe0\xef\
-\x0d\x59\xed\x48\x38\xee\xb8\xe3\x7a\xf6\x9a\x6c\x35\x7d\x4b\x52\
-\x49\xf4\x52\x6f\x0f\x6a\x1f\x44\x1b\xb3\xea\xce\x10\xba\xb9\xc7\
-\x47\x36\x8f\x91\xf8\xe2\x8a\x43\xf8\xd8\xd6\xd6\xa7\xad\xc8\x0c\
-\x3a\x9d\x31\x40\x56\xd0\xf3\x9c\x7e\x66\xdd\xd2\x77\xb8\x78\x0f\
-\x6b\x01\xfe\x05\x3a\xab\x4c\x2e\x6d\xdf\xbe\x7d\xc6\x74\xe8\xb8\
-\x41\x60\x5b\x89\x45\x6c\x37\x12\x1b\x7c\xcf\x67\x94\x93\x12\xc1\
-\xdb\x1f\xcb\xea\xc7\x8a\xcd\x9b\x37\xff\x32\xbe\x86\x02\xf1\x6a\
-\xaf\x12\x31\xd5\x04\x58\x5d\x1b\x4b\xca\xf6\x4e\xe4\x5a\xdd\x7e\
-\x88\x7e\x7c\x85\x84\xb3\x36\xb8\xb5\x4d\x38\xf3\x3b\xe3\x13\xb2\
-\x7c\x75\x56\x39\x12\x14\x57\x08\xbd\xd5\xd3\x0b\xdc\xfc\x41\x5c\
-\x81\x75\x1a\xdb\x93\x36\x31\xc6\x4d\xe4\x01\xca\xf6\x8d\xf5\xdb\
-\x6f\x55\x84\x3c\x7c\xb6\xbc\xb2\x11\xdb\x82\xf9\x4c\x2c\x84\x39\
-\x8e\xee\xa4\x1d\x4d\xdb\x4c\xb9\x68\xf3\xb9\x59\x7d\x27\x88\xf6\
-\x3e\x22\x7f\x94\x13\x6a\xba\x2d\x83\x36\xc3\xe7\xb6\x76\x5d\x8c\
-\xcb\xed\x59\xb5\x61\x18\x86\x61\x18\x46\x33\xc8\x21\xe4\x6a\x31\
-\x5d\x53\xc0\x2e\x2d\x39\xab\x6d\x8d\xa8\x34\x4a\xe6\xc4\xc9\x9c\
-\x72\x07\xbf\x76\x77\xe1\x04\x55\x77\x77\xd1\xa7\xba\xbe\xf6\x23\
-\x78\x15\x46\xdc\xbc\x3e\x9d\xa4\x64\x11\x04\x9f\x21\x92\x46\x4a\
-\x1c\x91\x98\x41\xf6\x38\x95\x40\xb0\x13\xc2\x21\xc5\x09\x61\x3c\
-\x70\x44\xd8\xe1\x49\x00\x05\xc3\x1e\x67\x04\x87\xbd\x0c\x84\x0f\
-\x1a\x17\xc6\x61\x9c\xf2\xb8\x7c\xf9\xf2\x0f\xd3\xde\x72\xbe\x94\
-\xd7\x72\xc9\x80\x6f\xe3\x38\x07\xed\xcf\xea\xe7\x3d\x94\xac\x23\
-\xb9\x8d\x73\x24\x27\x74\xd8\xe4\x76\x31\xfe\xbd\x67\x09\x1a\x51\
-\x0f\xe3\x04\x11\x48\xc7\xe1\x66\xcc\x28\x43\xd9\x36\x75\xd3\x96\
-\x90\xc5\xb1\x5c\xa5\xd8\x05\xca\xcd\x02\xe2\x27\xd7\xfc\x95\xfc\
-\x6c\xd2\x67\x7e\x87\x82\x47\x9d\x6d\x14\x58\xba\x74\xe9\xbd\xcc\
-\x7f\x1c\x63\x25\xbf\xf4\x2d\x3b\x82\xcc\x6d\x02\x52\xa2\x18\x9f\
-\xcb\xb2\xfa\x89\x20\xd6\x92\x2f\x20\xbf\x3a\x05\x54\x6e\xce\x50\
-\xd2\xa6\x29\xbf\x29\x17\xfd\xbd\x24\xab\x1e\x09\xec\xc6\x26\x78\
-\xc6\x6e\x61\x82\x67\xec\xa0\x2f\xd7\xb9\xa6\x09\x7a\x51\x94\xfb\
-\x4c\x56\x3d\x23\x88\x3e\xfc\xbe\x92\x76\x92\x93\xea\xce\xe7\xba\
-\x76\xf7\xa3\x82\xdf\x4b\xf2\x15\xc6\x0c\x21\xc6\xf1\x3f\x86\x4c\
-\x5e\x80\x7e\xc6\xfe\xec\x97\x58\x6a\xa3\x07\x9a\x90\xea\x4c\x39\
-\xe8\xbd\x93\xf5\x02\x99\x22\xe9\x4a\x80\x16\x39\x8b\xf5\xfe\xf3\
-\x97\x5d\x76\xd9\xf7\x65\x73\x27\x86\xf5\xeb\xd7\x6f\x27\xd0\x59\
-\x5e\x05\x2a\xbd\xa2\xb5\xab\xae\x5f\x25\xd1\x3f\xca\x06\x4f\x47\
-\x4e\x28\x71\x3a\x89\xf5\x05\xbb\x0d\xbd\x42\xc2\x44\xdf\xef\x50\
-\xb2\x4b\x6d\x6b\xb2\x66\xf3\x7b\x94\xeb\xdc\x66\x26\x89\x83\xed\
-\x46\x32\x9a\x13\x29\xb4\x15\xdb\xad\xad\xaf\x23\x59\xa1\x7f\xac\
-\xa3\xf4\x95\xcd\x4e\x8c\x89\xbe\xc3\x05\x2f\x18\x2b\xf4\x2d\x81\
-\x7e\x02\xeb\xe8\x5f\x02\xff\x8c\x25\x1b\x3d\xb0\x75\x5f\x08\xc9\
-\xa5\x58\x5f\x1e\x63\xed\xa3\x4f\xd8\x1a\xba\x7a\x0d\x7e\x94\x7a\
-\xb9\x29\x6f\x83\xaf\xdf\xc8\xaa\xc7\x8e\x18\xff\x65\xf8\x1e\x9c\
-\x56\xc3\x36\x52\xc2\x43\xb6\x91\xec\xf8\x36\xed\x0d\x19\xf8\x83\
-\xac\x7e\x46\xb0\x6c\xd9\xb2\xcf\x29\x51\x2a\xb9\x6e\x93\x70\xe6\
-\x77\xfa\x1b\x3a\x6f\xe4\x4d\x15\x31\xfe\xff\x52\x71\x05\xe4\xbc\
-\x8c\x2b\xb0\x89\xab\x8d\xce\x82\xe0\x6f\xb4\xed\x81\xac\xbe\x13\
-\x04\xef\x7e\xb0\xbc\xad\xa4\xd4\x0f\xe8\xff\x32\xe1\xdc\x44\x26\
-\xa0\x6c\xf7\x6f\xe4\x2b\x3a\x41\xf0\xf9\xab\x92\x63\x6d\xb0\x61\
-\x6d\x18\x46\xff\xa6\x3e\x9b\x17\x57\x74\x1a\x86\x61\x18\x86\x31\
-\x26\x10\xe4\xc7\x88\xc2\xa9\xd1\x75\x1a\x38\x41\x38\x44\xe5\xee\
-\x26\x8c\x8d\xa6\x46\x14\xc6\xcb\x6c\x0e\xb2\x96\x20\xb9\x41\xa0\
-\x0d\x27\x88\xe0\x14\xd7\x9a\xe0\x04\xe9\xb8\xf8\x30\x41\x4c\xca\
-\x06\x0f\x5e\xd0\xc9\xa4\x32\x59\xc4\x29\x08\xae\xa8\x13\xe1\x48\
-\x40\xc8\x55\x99\x2c\x22\x71\x47\xc0\x18\x7e\xe3\x78\x62\x04\xe3\
-\x70\xb0\x6b\x1e\xf9\x23\x28\x41\x90\x90\x60\x2c\xb2\x48\x50\x19\
-\x27\x9c\x1d\x57\xec\x0e\xe6\xa4\x82\x76\x92\x36\x75\xfc\x73\x2c\
-\x08\xa0\x8c\xe5\xe3\xf1\xd1\x8f\xcf\xd1\x8f\xf2\x14\x85\xbe\x43\
-\xc2\x0e\x55\x39\x6f\xbc\xb3\xae\x3d\x55\xca\xf6\xbd\x27\xab\x9f\
-\xf7\x90\x13\x5a\x06\x7c\x74\xfd\x64\x9b\x71\x17\x51\x4e\x32\xc0\
-\xb8\x10\xf8\x21\x40\x89\x5e\xe3\x5f\xfe\x9f\xbf\x33\xc7\x29\xa3\
-\xf2\x75\x75\x55\x89\x72\x3c\x37\x8e\xe0\x5c\x57\xa8\xe3\xa7\x3e\
-\xd8\xdc\x26\x80\xc6\xef\xe9\x6c\x76\xa6\xd7\xa2\xad\x7f\x53\x26\
-\x63\xca\x64\x62\x19\xe0\xa9\x6b\x5f\x95\x34\x8e\xd1\xde\x77\x66\
-\xf5\x9d\x63\xcb\x96\x2d\xff\x4a\xfc\x56\x60\x47\x41\x94\x32\x20\
-\xa1\xb6\xd5\xb5\x5b\x24\x7e\x87\x7c\x9e\x92\xd5\x0f\x8d\xd0\x53\
-\xaf\xd2\xb7\xa9\x08\x3a\x88\xb7\xec\x62\x25\x09\x03\x6f\x95\xa0\
-\x1f\xd4\x2e\x88\x32\x21\xf7\xeb\xb2\xfa\x19\xc1\xf6\xed\xdb\xdf\
-\x8c\x0e\xd6\x26\x90\xf2\x84\x28\x73\x7a\x98\x35\x3b\xf9\x3d\x23\
-\xa7\x4f\x8c\xe7\x23\xec\xcf\x1f\x3e\x70\xe0\xc0\xca\x18\xd3\xcf\
-\x91\xfc\x46\x67\x57\xf5\x75\x9b\xb5\xa0\x09\x51\x97\x64\x81\x77\
-\xa0\x73\x78\x2f\x73\x04\xdb\x83\x13\xd2\xcc\x9b\x2b\xaf\xbc\x72\
-\x4b\x36\x73\x62\x20\xe1\xa0\x8d\x01\x04\xeb\x09\x7e\x6b\xfe\x36\
-\xd5\x8d\xf4\x0d\xfe\x31\xdf\xb3\xda\xa1\x51\x7e\x3b\x49\x3b\xfa\
-\xb1\xd5\x68\x97\x36\x01\xb0\xc6\xc2\x47\xf8\x59\xd7\x9e\x92\x28\
-\x93\x55\x77\x0e\xd6\x18\xf8\x88\x1e\x2c\xbf\x97\x8a\x7c\x35\xd5\
-\x83\x10\xe5\x28\x0f\x4f\x79\x16\x1d\x4f\xbf\x91\x15\x78\x80\x1f\
-\x45\xfd\xe8\x27\x6e\x3e\x60\x83\x01\x27\xda\xf1\xb3\x48\x0c\xe2\
-\x73\x60\x47\xb2\x3e\xb3\x81\x0a\x9d\x36\x57\x93\x4b\xc7\x1f\x7f\
-\xfc\x37\xb4\xc6\x28\xe9\x49\xdf\x59\xfb\xe0\x2d\x3c\x6a\xb3\xc6\
-\x44\xf9\x9b\xb2\xea\xb1\x23\xfc\x8d\x1b\xf1\x49\xf0\x3b\x38\xb1\
-\x5b\x5e\x5b\x8d\xdf\x5b\x26\x61\x9a\xb4\x97\x72\x31\x0f\xbf\x37\
-\xab\x9f\x11\x84\xdd\xf1\x75\x25\x42\xe0\xbd\xec\x8e\x32\xa9\x50\
-\xd7\x76\x91\x64\x39\xf4\xdd\xfd\x59\xe5\xd0\x88\x76\xfc\xb1\xe2\
-\x0a\xf0\xb7\x8c\x2b\xb0\x46\x97\xc9\x99\xba\xb6\x54\x89\xb6\x75\
-\x6d\x73\x44\x3b\xdf\x81\x4c\x84\x0f\xdb\x4b\x8e\x23\x13\xcc\xd9\
-\xea\x95\x8d\x4d\xe4\x01\x4a\x7e\x7e\x79\x6a\x6a\xea\x6f\xe7\x2b\
-\xc6\x8e\xb0\x39\x5f\x8d\xcd\x59\x77\x4d\x74\x5b\x39\xe6\x77\xca\
-\x85\x1e\x9b\xd1\xc4\xa8\x61\x18\x86\x61\x18\x73\x0c\x24\x03\x30\
-\xa2\x08\xe6\x73\x1a\x44\xc1\x19\x5d\x2d\x36\xe4\xae\xf0\x39\xf3\
-\x1d\x02\x76\x58\xca\x09\x62\x97\x5a\xf5\xba\x3f\x39\xea\x6d\x8c\
-\x48\x28\xab\x7f\x41\x80\xa4\xd1\xa9\xa7\x9e\x7a\x7f\xf0\xe9\x30\
-\xc4\x9d\xf9\x3a\x61\x34\x5d\xc2\x88\x40\x03\xbc\xc5\x40\x57\xd2\
-\x08\x87\x99\xe4\x1d\x89\x23\x78\x4e\x20\x02\x43\x98\x04\x12\x8e\
-\x35\xbb\x37\x71\xf4\x39\x95\x44\xb2\x06\xc7\x88\x9d\xf4\x18\xc8\
-\xda\xe9\x88\x4c\xca\xb0\x1f\x34\x2e\xfc\xce\xf8\xc5\x33\x23\x27\
-\x38\xc3\xe1\xf8\x25\x9d\xa0\xc1\xf9\x57\x60\x47\x57\x5a\x11\xd8\
-\x69\x13\x40\x81\x28\x17\x7d\xf1\x07\x50\x03\x24\xb7\x91\x23\x64\
-\x05\x79\x90\x43\xa7\xab\x3b\xda\x3a\x74\x22\xca\xc3\x67\xe4\x80\
-\xb1\xa1\x0e\x88\xff\xe6\x6f\x50\x13\x87\xab\x4a\x39\x76\xb3\x36\
-\xa1\xa4\xcd\x02\x55\x7e\x56\x37\x0b\x34\xe9\xbb\x78\x38\x8e\x79\
-\x54\x87\x5d\xbb\x76\x7d\x2f\x6d\x45\x5f\x28\x19\x53\x26\x13\x87\
-\xd9\xd1\x4a\xd9\x58\xc3\xbe\x27\x5f\xd1\x39\x42\x3f\xbc\xb3\x4e\
-\x7e\xc5\xef\x36\xf2\x4b\x19\xe4\x72\x1c\x09\x0e\x76\x63\x4b\x0e\
-\xe0\x2d\xba\x95\xab\x9e\xe0\xad\x76\x30\xb7\x49\x2c\x42\xe3\x68\
-\xd7\x28\x08\x5b\xe5\xbf\xd3\x1f\x02\x3f\x04\xab\xf4\x5d\x30\x92\
-\xfa\x6d\xd6\x07\x11\xe5\xe8\x7f\xf0\x61\x46\x83\x82\xc6\xf3\x71\
-\xc1\x05\x17\x7c\x53\xc8\xe9\x9f\xc4\xd8\x3e\x50\x97\x58\x92\xdc\
-\x36\x1d\xeb\xa6\x44\x7d\xcc\x41\xde\x83\x4c\xa1\x83\x98\xc7\x9c\
-\xea\x8b\x35\xff\xeb\x21\x73\xff\x2c\x9b\x38\x11\x84\xcc\x1f\x8d\
-\xed\x84\x8d\x44\x52\xa2\xfa\x6d\xb6\xa6\x76\x3a\xe5\xe0\x5f\xf0\
-\xf3\xd5\x59\x75\x6b\x44\x3b\x9e\xf3\xed\x24\x7c\x07\x4e\x27\x49\
-\xdf\x0d\xb9\xf1\x67\x62\x9b\xb0\xb6\x6e\xdd\xba\x85\x0d\x4b\xda\
-\x40\x56\x5e\xa9\xdb\x94\x8f\x22\xca\xd2\x47\x9e\x93\xac\xa0\x53\
-\xa9\x0f\x79\xc1\x6e\xa5\xfe\x32\xb9\x44\xd0\xb7\x9a\x5c\xa2\x3d\
-\xac\x1b\x3a\xb9\x14\x7a\x7b\xce\x7c\x73\x29\x6c\xf7\x9f\x21\xb0\
-\x8d\xad\x4f\x72\x8c\xc0\xb6\xbe\xa3\x05\x0f\xca\xc0\x76\x1d\x0f\
-\xab\x94\xfc\x5c\x92\xd5\x8f\x1d\xe1\xab\x7c\x1e\x7f\x05\x3e\xb3\
-\x29\x41\xd7\x56\xb3\x86\xb4\x4d\x84\x32\xfe\x51\xf6\x6b\x21\xeb\
-\xef\x8e\x31\xff\x9f\x61\xaf\xfc\x51\x8c\xf5\x1f\x5f\x73\xcd\x35\
-\xc7\xec\xde\xbd\xfb\x84\xb0\x03\xde\x1b\x63\x7b\x72\xcc\x91\x53\
-\x62\xfd\x5d\x00\x05\x8f\x4e\x19\x17\x85\xcc\x9c\x1c\x72\xf2\x3e\
-\x78\x2f\xdb\x09\xbf\x89\x8d\x43\x9c\xbc\x43\x6f\x35\xf1\x63\x25\
-\xc7\xd1\xf7\x03\xc9\xa6\xa1\x11\x7c\xbd\x54\x71\x05\xfc\xba\x32\
-\xae\x30\x0c\x7f\x29\x17\xf2\xf3\xe6\xac\xbe\x13\x84\xbd\xbc\x03\
-\x99\x40\x9f\x21\x13\xf8\x9f\xc3\x5e\xd9\x08\x51\x2e\x78\xbe\x3b\
-\xab\xef\x04\x31\xfe\x0b\xe1\x33\x6d\x46\x77\xe8\x9a\x68\x7c\x26\
-\x5d\x0d\xdf\x74\xde\x89\xcf\xa1\xb7\x7f\x32\xab\x37\x0c\xc3\x30\
-\x0c\xc3\x18\x0c\x4e\x94\xe0\x14\x12\x20\xd7\x09\x9d\x32\x40\x8e\
-\xe3\xd9\xd6\x88\xa2\x7c\x56\x3f\xab\x41\xa2\x84\x04\x81\x0c\x71\
-\xdd\x4d\xaf\x40\x5b\x19\xc4\x6c\x69\x44\xce\xe9\xd3\x49\xeb\xd6\
-\xad\x7b\x9b\x12\x48\x04\x0d\xe0\x11\xce\xa2\x92\x46\x24\x8c\x48\
-\x16\x95\xa7\x8b\x94\x28\x42\x8e\xd8\xfd\x19\x86\x6e\x8f\xa7\xec\
-\x4e\xc3\xd0\xc5\xa9\xc0\x48\xc7\x69\x26\x11\xc3\x6e\x56\x9c\x68\
-\x78\x4e\xe0\x15\x43\x98\x6b\x41\x90\x3f\x1c\x6d\xc6\x01\xc3\x98\
-\xe4\x1e\x8e\x38\x4e\x39\x06\xb2\x1c\xd3\x41\xce\x91\x68\x9c\xf2\
-\x18\x7d\x5a\x4d\x60\x56\xf2\x52\x9e\xf8\x90\xe3\xc6\x7c\x69\xda\
-\x36\x28\xca\x3e\x9d\xd5\xcf\x7b\x28\xb9\x8d\x2c\x11\xa0\x92\x43\
-\xa7\x6b\xb9\xca\x40\x71\x1d\x2f\xa7\x23\x9e\x61\x1e\x43\x8c\x8f\
-\x48\x73\x7b\x98\x3a\x79\x96\xf6\xe0\xb4\x8d\x12\x9c\xeb\x0a\xfd\
-\xf8\x89\x53\x0f\x3f\xcb\x04\xc7\xa0\xfe\x8b\x7f\x59\xf5\xd8\x11\
-\x7a\xe2\x0f\x68\xab\x92\x31\x04\xd9\x14\x9c\x1c\xe6\x5b\x76\xb4\
-\x37\xc6\x77\xa2\x89\xbe\xd3\x4f\x3f\x7d\xbb\xf8\x5d\x06\x24\x86\
-\x91\xdf\x6c\x3f\xb2\xf5\xfd\x59\xfd\xd0\x08\xfd\xdc\xdb\x8d\x4d\
-\xbb\xd0\xc3\xb4\x4b\x41\x07\x12\x30\x0a\x3a\xf0\xce\x41\x6d\xe3\
-\xf7\x9c\x33\x7f\x2f\xab\x9f\x11\x84\xbc\xf4\x02\x68\xac\x2f\x04\
-\x2f\xfb\x25\x9e\x07\xf5\x47\x44\xb9\x58\x27\xfe\x2a\xab\x37\x66\
-\x29\x62\x9d\x7d\x7b\x8c\xf1\xcd\xd8\xa6\xd8\x02\xcc\x29\x82\xa5\
-\x8c\x77\x55\x9f\x37\x1d\xfb\x7e\xa4\x3a\xa8\x97\xfa\x79\x17\x6b\
-\x3c\xb6\x21\x3a\x34\xec\xe4\x8d\xd9\xac\x89\xa1\x9c\xc3\xd2\xe5\
-\xd8\x45\x0a\xd0\x36\xe9\x33\xe5\xe0\xd9\xb0\x6b\x16\xc9\x24\xbe\
-\x9d\x84\x2d\x84\x0d\x88\xbd\xa7\x6f\x27\xe9\xea\x49\x6d\x46\x6b\
-\xaa\xef\xba\x5c\x5b\xfa\x21\xec\xd0\x7b\xe0\x23\xc9\x68\xd6\x19\
-\x74\x61\x99\xf8\x68\x2a\x3f\x92\x13\x9e\x91\xac\xc0\x5f\xc6\x44\
-\x89\x25\xf4\x3f\x72\x83\x1d\xcb\x7a\x40\xa2\x45\xc9\x25\x5d\x8b\
-\xc7\xd5\x9d\xb4\x87\x84\x00\x36\x32\xe3\x8c\x9d\x89\x4d\x1d\xeb\
-\xc9\xd6\xd9\x9c\x5c\x0a\xdb\x78\x31\xf2\x80\x2f\x80\x4e\x26\xb9\
-\xa8\x93\xfb\x0a\x6c\x23\x77\xf0\xa8\x8e\x87\x55\xa2\x5c\xf0\xef\
-\x37\xb3\xfa\xb1\x22\xf8\xfa\x13\xf8\x33\x6c\x0c\xd3\xc9\x3a\x9d\
-\x86\x46\x76\xdb\x9e\x54\xa3\x0c\x65\x79\x06\xfd\xc0\x18\xe3\x43\
-\xe2\xc3\xb0\x36\x61\x0b\xb0\x81\x0e\xde\xe0\x37\xf1\x5e\x7c\xa8\
-\x71\x90\x36\xee\x51\x77\xca\x49\x8f\xf7\x4a\xe6\x55\x4f\x28\x4d\
-\xd7\x1f\xc9\x70\xd8\x5a\x23\x5f\x79\x17\xed\x7a\x42\x71\x05\x25\
-\x6e\x15\x57\x80\xbf\xe8\x86\xb6\xfc\x0d\x79\xf8\xee\xac\xbe\x13\
-\x84\x3d\x71\x27\x3c\x25\x09\xa6\xab\x74\x49\xda\x23\x13\x24\xc1\
-\xda\xc4\x42\xc4\xcb\xd0\x03\xff\x39\xab\xef\x04\xa1\x8b\xaf\xc6\
-\xb6\xc3\xf7\xc6\xc6\xd7\x46\x03\x74\x0c\x7a\x07\x1d\xd4\x92\xcf\
-\xcf\x66\xd5\x86\x61\x18\x86\x61\x18\xcd\x20\xc3\x5a\x4e\x21\xc1\
-\xfc\xf2\x0a\x88\x26\x3b\x9b\x44\x94\x81\xc2\x78\x9d\x13\x09\x95\
-\x30\x76\x9f\x73\xdd\x9f\xee\x7f\xc7\xb9\x24\x30\xa5\x20\xa6\xfa\
-\x55\xd7\xe7\x2a\xa5\x53\x39\xe7\x12\x4a\xe1\x04\xf6\x92\x48\x5c\
-\x63\x42\xb0\x80\x13\x48\x4a\x22\xe1\x18\x20\x23\x04\x0f\xe0\x15\
-\x06\x37\x8e\x82\x4e\x17\xe1\x40\x2a\x61\x84\x21\x8e\x33\x8c\x2c\
-\x91\x70\x51\xc2\x08\xde\xe2\x2c\x63\xf0\xe2\x5c\x10\x7c\xc0\x89\
-\xc6\xe9\x22\x18\x88\xf3\x89\x73\x8d\xd3\x81\xfc\xe1\x0c\x11\x2c\
-\xc1\x98\x27\xa0\x8c\x71\x8c\x53\x2a\xa3\xbe\xa9\x63\xca\xb8\x45\
-\xf9\xb1\x7c\xf7\x65\xe9\xd2\xa5\xbd\x0f\xdb\xc3\x03\xfa\x5b\x3a\
-\xcd\xc8\x8b\x02\xb3\xb4\xad\x89\xbc\xe4\x5c\x19\xcb\x37\x52\x5e\
-\x08\x08\xf9\xea\x25\xb7\x71\x8e\xe4\xd0\x95\xd7\x4f\xb6\x71\xe8\
-\xea\x88\xe7\xea\xa8\xae\x6c\x13\x62\x9c\x19\x6f\xc6\xfd\xd0\xa1\
-\x43\x9d\x5d\xcf\x32\x2c\xc4\xcf\xea\xb7\x66\xb4\xab\xbd\xad\x83\
-\xcc\x3a\x90\x55\x8f\x1d\xa1\x4f\xce\x2f\x77\x87\x8e\xfa\x2d\xbb\
-\x1c\x9b\xe3\xb2\xfa\x89\x20\xf4\xc3\xed\xe3\x92\xdf\xe4\xf7\x9f\
-\x67\xd5\x23\x61\xe1\xc2\x85\x9f\x50\x70\x67\x1c\x72\x10\xbc\xfd\
-\x68\x56\x3d\x63\x88\xb5\x67\x23\xeb\x91\x36\x82\x28\x80\xc6\x5a\
-\x81\xac\xb4\x5d\xb7\x29\x17\x3c\xb8\x32\xab\x37\x66\x39\xee\xb9\
-\xe7\x9e\x5f\x09\xbd\xf0\x21\xe4\x17\x3b\x4d\xc9\x0b\xe9\x08\xa8\
-\xcd\xf8\x4f\x47\xd4\x41\x7d\xd4\xcd\x5c\xc1\x2e\x26\x39\x10\x76\
-\xe2\xdf\x84\xad\x32\xd1\x53\x4a\x6b\xd6\xac\x39\x80\xbd\xa5\x2b\
-\xa4\xaa\x49\x61\xf5\xbb\xae\x1f\x22\xfa\x31\x6a\x42\x09\xfb\x10\
-\x7d\x8d\x2d\xc8\x29\x41\x6c\x3b\xda\xa3\x13\x29\x4d\x83\xd8\x10\
-\xbf\xcf\x84\xcd\x1c\x76\xe9\x6f\xea\x24\xec\xb0\xdf\xc0\x2c\x89\
-\xf2\x22\xc6\x81\xbe\xc3\x03\xea\x43\x3e\x91\x53\xf8\xc2\x5a\xc0\
-\x98\xf1\x3e\xd6\x06\xc6\x90\xf7\x13\x08\x2e\x93\x4b\xd8\x97\xd8\
-\xd0\xe8\x6c\x78\x8c\xbd\xbd\x75\xeb\xd6\x2d\xb3\x31\xb1\x14\x72\
-\xf0\x61\x6c\x63\xe4\x81\xc0\x36\x9b\xc3\xb0\xe7\x47\x08\x6c\x33\
-\x06\x9d\xcc\xad\xf0\x75\xdf\xab\x64\x28\x73\x49\x1b\x09\x95\x80\
-\x29\x37\xaf\x34\x6d\x6f\xa9\x1b\x94\x50\xe2\x14\x1a\xf3\x02\x7f\
-\x88\x75\x0a\x1f\x1b\x5b\x0c\xfb\x00\x3e\x8d\x83\xa8\x8b\x3a\x91\
-\x0d\x7c\x58\xfc\x2e\x7c\x2c\xf9\x25\xe8\xa9\xa6\x9b\xf0\xf8\x8d\
-\x3e\xc7\x58\x5d\x9b\xac\x1a\x1a\xd5\x84\x1d\x71\x05\x36\xde\xc1\
-\x1b\xda\xc3\x9c\x68\xc9\xdf\x43\x59\x75\x67\x08\x99\xf8\x0b\x92\
-\x73\xd8\x49\x4a\x32\x72\x7d\x67\xa9\x17\xda\xca\xf0\xd3\x4f\x3f\
-\xfd\xed\x59\x7d\x27\xa8\xda\x76\xdc\x98\x41\x62\x54\x89\x3b\x64\
-\xb2\x4d\x9b\x83\xcf\x23\x27\x13\x0d\xc3\x30\x0c\xc3\x98\x47\xe0\
-\x84\x0e\x86\xb5\xae\x19\xaa\x1a\xd6\xe5\x6e\xbd\x3a\x03\xa4\x4a\
-\x18\x24\x50\x18\xa4\x63\xf9\x5e\x4d\xd7\x28\xaf\xfb\x23\x88\x29\
-\x27\x68\x98\x5d\x9f\x22\x78\x95\xd5\xcf\x09\x90\x48\xe2\x24\x92\
-\x92\x48\xc8\x03\x3c\xc1\x19\x60\x07\x38\x01\x5e\x39\x2c\x38\x5f\
-\x38\x8b\x18\xae\x18\xdc\x38\xe3\x4a\x16\x11\x00\xc6\x91\xc1\xa0\
-\xc5\x10\x57\xb2\x08\xa7\x4a\x09\x23\x02\xc4\xf0\x97\x60\x26\x86\
-\x3a\x89\x23\x1c\x2f\xe4\x0d\xe7\x07\xe7\x93\x20\x27\x4e\x07\xf2\
-\x47\x60\x02\xe7\x1b\x27\x9c\x80\x09\x06\x7d\x1b\x47\x0f\xa2\x6c\
-\x3c\x33\x96\x60\x45\xf0\xe4\x29\x76\xb0\x29\x40\xaf\xdd\x60\xb4\
-\x19\x79\xc1\x78\xa7\x7d\x9a\x07\x75\xed\x11\xa9\x4c\x3c\xf3\x27\
-\x59\xfd\xbc\x87\xae\x13\xd4\xf5\x93\xe5\xf7\x0d\x4a\x87\xae\x8e\
-\x9f\x33\x41\x8c\x1f\xfa\x01\x3d\x71\xf8\xf0\xe1\x59\x97\x50\xaa\
-\x6e\x16\xd0\x2e\xdc\xea\x66\x81\xba\xbe\x55\x69\x9c\xf3\xa8\x0e\
-\xe1\x18\x3f\xc2\xdc\x52\x32\x46\x57\x11\xe1\x18\x33\xf6\x6d\x76\
-\xb4\x42\x94\x8d\xf6\xfe\x74\x56\x3f\x11\x44\xfb\x9f\xa9\xca\xaf\
-\xf8\xdd\x56\x7e\xe1\x77\xc8\xd6\x15\x59\xf5\x48\x08\x39\xf8\x2a\
-\xed\x42\x87\xd3\xae\x7e\x9b\x46\xea\xda\x51\xa5\x6c\xd7\x7b\xb3\
-\xea\x19\x43\xf0\xf8\x82\x71\x26\x94\x52\xbe\x8f\xcf\xea\x8d\x39\
-\x82\x7b\xee\xb9\xe7\x15\x61\x2b\x5c\xcc\xfa\x8b\x2c\x6b\xd3\x09\
-\xe3\x8f\x6e\x66\x5c\x25\x07\x4d\x65\xa1\x8e\x78\x36\x65\xa4\x27\
-\x5f\xcc\x67\xe6\x4f\xc8\xdc\x44\x93\xd6\xa1\xcb\x0f\xd4\xc9\x7c\
-\x9b\x93\x35\xa9\x1b\xb1\xad\x16\x65\xb5\x8d\x41\x32\x09\x5b\x11\
-\x1b\x51\xf3\x4f\xba\x4e\xdf\x4e\x82\x37\xb2\x9d\x69\x4f\x5d\x1b\
-\x44\xb4\x35\xda\x33\x63\x1b\xb0\xc2\x7e\xdd\x80\x1d\xa7\xe4\xc7\
-\x30\x1b\x83\xaa\xc4\x33\x92\x17\x08\x3e\x50\x1f\x84\x6c\xc2\x1b\
-\x9d\x5c\x42\x6e\x19\x3f\x64\x49\xd7\xe2\x55\x93\x4b\xac\x85\x24\
-\x26\x48\x2e\xe9\x5a\xbc\xb0\xbf\x37\xef\xdc\xb9\xb3\xd3\x2b\xc0\
-\xda\x20\x7c\x88\xc7\xaa\x81\x6d\xe4\xa1\x0c\x6c\x37\xe5\x27\x65\
-\x82\x57\x9f\xce\xaa\xc7\x8e\x65\xcb\x96\x5d\xad\xcd\x2b\x3a\xed\
-\x87\x7f\x82\xdf\xc7\xf8\x97\xeb\x47\x5d\xfb\xaa\x44\x39\xe6\x14\
-\xeb\x28\xe3\xca\x78\x52\x17\x63\xc8\xf8\xe1\x57\xe2\x2b\x31\x4f\
-\x48\x2e\x41\xf0\x68\x1c\xa4\xfa\xb8\xed\x81\xd3\x50\xc8\x0a\x3e\
-\x17\xeb\x3b\xbc\xd7\xe9\x30\xc9\x73\x5d\xfb\x45\x92\xd9\x28\x7f\
-\x71\xb2\x6a\x28\x04\x4f\x7f\xa6\x8c\x2b\xd0\x77\xc5\x15\x48\x70\
-\xb5\x99\x5f\x6a\x53\xc8\xcf\x86\xac\xbe\x13\x44\x9b\x7f\x1c\x7b\
-\x19\x9d\x86\x9d\xa4\x44\x33\x49\x30\xc6\x53\x09\xf2\x96\x32\x7c\
-\x79\x56\xdf\x09\xb6\x6c\xd9\xf2\x9d\xb2\xf1\xb9\x11\x04\xf9\x42\
-\xde\xf0\xa9\xd1\x27\x6d\x12\x77\x05\x9f\xd7\x67\xf5\x86\x61\x18\
-\x86\x61\x18\x83\x11\xc6\xff\x91\x6f\x96\xb0\x03\x4e\xd7\x0c\xd5\
-\x9d\xb8\xa8\x33\x42\xaa\x24\xa3\xe4\xb1\x8e\xbe\xb3\x31\x6e\x2c\
-\xa9\x5c\xf7\x57\x3a\x41\xc3\x04\x31\xa1\x99\x74\x8e\xdb\x60\xf9\
-\xf2\xe5\xbb\x8e\x39\xe6\x98\x29\x4e\x24\x71\xad\x1d\x86\x69\x99\
-\x48\x22\xc9\xa6\x5d\x6f\xdc\xd9\x4f\x02\x09\x87\x05\xe7\x8b\xdd\
-\x93\x04\x10\x30\xb8\x71\x5e\x74\xba\x08\x07\x4a\x89\x22\x0c\x71\
-\x25\x8a\x70\xae\x94\x2c\xe2\xc4\x11\xc6\x2e\xbb\xbe\x48\x1a\x61\
-\xac\xb3\x5b\x13\xc7\x07\x9e\xe3\x7c\x62\x08\x23\x7b\xf0\xbf\x0c\
-\x0e\x31\x16\x32\x8e\x9b\x8c\x09\x65\x78\x26\x1c\xc4\x91\x13\x9c\
-\xd1\xaf\x6f\x86\x47\xec\x60\x2b\x03\xf4\x65\xc2\x83\x76\x36\x95\
-\x17\xca\xd0\x97\x30\xf8\x7f\x2a\x5f\x31\xef\xa1\x5d\xa3\x0a\x98\
-\xe9\x1b\x3a\x38\xa1\xa5\x43\x57\xc7\xcf\x99\x20\xc9\x17\x72\x4a\
-\xe2\x73\xff\xfe\xfd\xaf\xc9\xae\xcc\x38\xd8\x2c\x50\x06\xfd\x4a\
-\x7e\x32\xef\xda\xf2\x93\x72\x51\xbe\x33\xdd\x46\x32\x9b\xb9\x45\
-\x32\x46\x3b\x5a\xab\xc9\x2f\xcd\xfd\xba\xf6\x55\x29\xc6\xe5\xb3\
-\x59\xf5\x44\xb0\x7d\xfb\xf6\x97\xf6\x93\xdf\x61\xf9\x1d\x7d\x18\
-\x99\xdf\x9b\x36\x6d\xfa\xb7\xfd\x36\x8d\x94\xbb\x97\xdb\xb4\x2b\
-\x74\xf1\xcf\x66\xf5\x33\x86\x15\x2b\x56\x7c\xb4\xe4\xf5\x38\x12\
-\x4a\xc1\xef\xff\x98\xd5\x1b\x73\x0c\xa1\x7b\x7f\x2a\xec\x88\x73\
-\xd1\xc3\xc8\x34\x32\x80\xce\x50\x52\x03\x6a\x23\x0f\x75\xc4\xb3\
-\xd4\x83\x6c\x51\x3f\x27\x27\xc3\x9e\xb9\x3e\x9b\x30\x11\x70\x3a\
-\x05\xfb\x83\x00\x32\xc1\x43\x92\x0f\xd2\x2f\x4d\x75\x24\x6b\x16\
-\x7d\x88\x67\x6e\xcc\x6a\x1b\x83\x84\x12\x1b\x3f\x74\x35\x14\x1b\
-\xb1\x74\x3a\x49\x27\x22\x38\xe1\x41\x5b\x78\xcf\xa0\xb6\xf0\x7b\
-\x56\x3d\x63\x08\x7b\x76\x1d\x3a\x51\x81\x58\xd6\x1b\xd6\x74\x64\
-\x67\x14\x79\x29\x89\x7a\xa0\xd4\x33\xbd\xba\x19\x83\x6a\x82\x49\
-\x57\xe3\xe1\x83\xdc\x7a\xeb\xad\x3d\x3b\x9a\x8d\x15\x4a\x2e\x91\
-\x9c\xc0\x0e\x27\x89\x80\xcf\xc6\x89\xa5\xec\xc6\x8c\x42\x81\x6d\
-\x6d\x5a\x90\x6c\xb6\x0d\x6c\x43\x94\x09\xfe\x74\x76\x72\x3f\xfc\
-\x9b\xbb\x24\xbf\x24\xe8\x94\x50\x54\x02\x86\x31\x69\x33\xf6\x1a\
-\x57\xc6\x13\xbf\x25\xf5\x42\x6f\x3d\xa2\x5e\x7c\x6a\xec\x19\x6e\
-\x65\xc0\xc7\x24\xe9\x83\x0f\x35\x0e\xa2\x2e\x48\xfe\x98\xae\x09\
-\xc7\xe7\x42\x8e\x94\xcc\x6b\xd2\x1f\xf5\x23\xe4\x71\x57\xb2\x6a\
-\x28\xac\x59\xb3\xe6\x94\x6a\x5c\x01\xf9\xad\x26\xec\x9a\xc8\x83\
-\xda\x14\x7d\x38\x2a\xab\xef\x04\x61\x47\xfc\x29\x76\x12\x49\x46\
-\x6c\x0a\xc5\x42\x18\x43\xc6\x13\x9d\x06\x0f\x69\x4b\x5d\x3b\xab\
-\x44\xbb\xa3\x8f\xef\xc9\xea\x3b\xc1\xc6\x8d\x1b\x8f\x92\x8d\xaf\
-\x93\x76\xd8\x41\x24\xa5\x19\xfb\xb6\x89\xbb\xd4\x4b\xbf\x9b\xd5\
-\x1b\x86\x61\x18\x86\x61\x0c\x06\x09\x25\x12\x2a\xfa\xe6\x03\xce\
-\x8a\xae\x19\xc2\xb0\xc6\xf0\x1b\xc6\xb0\xce\xea\x67\x3d\xaa\x4e\
-\x10\x46\xbf\x9c\x20\x05\x31\x31\xb2\xea\xfa\x5a\x47\x69\x44\xce\
-\xfa\x84\x52\xf4\xb9\x77\xb5\x1d\x41\x5c\x0c\x52\x9c\xab\x32\x89\
-\x84\x13\x40\x82\x8d\x1d\x91\x9c\x3e\xc2\x71\x81\x37\x18\xab\x38\
-\x2c\x4a\x1c\x55\x93\x46\xec\xb0\xc4\x29\x83\x7f\x65\xc2\x08\x27\
-\x82\xa4\x11\x86\x39\x01\x1f\x1c\x67\x25\x8f\x08\x84\x28\x81\x84\
-\xbc\x29\x89\x04\xef\x31\x86\x91\x3f\xc6\x00\xb9\x92\x61\xdc\x46\
-\x1e\x79\x36\xea\x1c\x39\xc1\x19\x8e\xe7\xcf\xc3\x2b\xf8\x84\xc3\
-\x81\x53\x5f\x06\x66\x15\x30\x6e\x2a\x2f\xd9\xb6\x2f\x64\xf5\xf3\
-\x1e\x4a\x6e\xe3\xd0\xe9\xfa\x49\x25\xb7\x91\x9d\xb6\x0e\xdd\x24\
-\x88\x31\xa4\x3d\xc8\x2a\xb2\x1c\xf2\xfe\x67\xd9\x9d\x19\x47\x75\
-\xb3\x40\xc9\x4f\xe6\x63\x79\xad\x4b\x5d\xdf\xaa\x34\xae\x79\x54\
-\x87\x68\xdf\xcb\xd0\xc5\xcc\x2d\x76\x5a\xb2\x3b\x14\x5d\xa3\x64\
-\x62\x99\xf4\x68\x3a\xf7\x63\x4c\x46\xda\x65\xdb\x16\xe1\xd0\xff\
-\x91\xf8\x8d\xfc\x96\xdf\x80\x12\xbf\xdb\xc8\x2f\xfc\x0e\x3d\xf8\
-\xeb\x59\xfd\xd0\x88\xb6\xfc\xd7\xaa\x1c\x10\xdc\x21\x58\xc9\xbc\
-\x6a\xb3\x69\x04\xde\x47\x1f\x3e\x93\x55\xcf\x28\xa2\x3f\xf7\x22\
-\x2f\x04\x52\xd0\xc5\x6c\x6c\x80\xd7\xc3\x26\x94\xe0\x77\xc8\xda\
-\xdf\xcf\xea\x8d\x39\x8a\x3b\xee\xb8\xe3\x15\x61\x7b\x5c\x89\xad\
-\x81\x4e\x46\xbe\xb1\x27\xb4\x36\x4b\x87\x34\x95\x8b\x2a\xe5\x1c\
-\x38\xa2\xf3\xd1\x4f\x31\x97\xfe\xdf\x7c\x7d\xe7\xd8\xbe\x7d\xfb\
-\x51\x9c\x90\x26\xa1\x40\x80\x1a\x3b\x0c\x7b\x0b\x7b\x8a\x7e\xd2\
-\xc7\x41\x7d\x83\x07\xf4\xa1\x6d\x42\x89\x64\x12\x9b\x8f\xa4\x4f\
-\xd0\xd5\xd8\x88\xd8\x86\xb4\x83\x20\x3a\x7e\x03\x36\x5c\x13\x7d\
-\xcd\x6f\xd1\xde\x59\x61\x2f\x7f\xe8\x43\x1f\x5a\x83\xef\x23\x1d\
-\xc2\xd8\xc2\x4f\xe9\xec\x61\xe5\xa5\x24\xea\x80\xa8\x0f\x62\xac\
-\xe0\x13\xc4\xbb\xd0\x5b\xac\x13\xbc\x1b\x3e\xd2\x0e\xc6\x56\x27\
-\x97\xd8\xbc\x44\x82\x82\xb5\x91\xc4\x04\xba\x9c\xcd\x17\x21\x0b\
-\xf7\x70\x7d\x5f\x76\x65\xe2\x08\x1d\xfc\x5a\x6d\xa6\x28\x03\xdb\
-\xb2\x8d\xdb\x06\xb6\x29\x17\xfc\x38\x21\xab\x1f\x3b\xa2\x9d\x0f\
-\x4e\x77\xb5\x99\x74\x45\x5d\xfb\xea\x48\x6d\xd6\x38\xe2\x0b\xa0\
-\x7f\x18\x3b\xd6\x59\xec\x18\x92\x3c\xbc\x83\x2b\xbd\x49\x10\xe2\
-\x43\x8d\x83\xa8\x4b\x37\x3e\xe0\xbb\x22\x27\x6c\xdc\x83\xef\xf4\
-\x45\xbc\x6f\xa2\x17\xd4\x8f\x90\xc3\xb5\xc9\xaa\xa1\x10\x36\xfc\
-\xf5\x8a\x2b\xb0\x19\x51\x37\x7f\x0c\x93\xb0\xa3\x0c\x6d\x0f\xfa\
-\x47\x59\x7d\x27\x08\x9d\xba\x1b\xbd\x86\x0f\xcc\xa9\x35\x6e\xdc\
-\xa0\xcd\xf8\xb5\xf8\xac\xf0\x51\xba\xa0\xae\x9d\x55\xa2\x5c\xb4\
-\xf9\x15\x59\x7d\x27\x08\x5f\x7d\x0d\x27\xed\xd0\xc5\xfa\x46\x2a\
-\x9b\x3b\x89\xdf\x60\xdb\x95\x76\x50\x5d\x1b\x4b\x12\x9f\x63\x5d\
-\xfb\x37\x59\xbd\x61\x18\x86\x61\x18\xc6\x60\x84\x61\x7d\x98\x84\
-\x0a\xd7\x0c\xe1\xa0\xe2\xa4\x60\x9c\xe2\x18\xb6\x71\x50\x45\x94\
-\x0b\x43\x6a\x4f\x56\x3f\xab\xb1\x21\x77\xf0\xf7\xdb\xb9\xdd\x36\
-\xe0\x4a\xdf\xa1\xac\x7e\x56\x22\x9c\xbd\xde\x77\x92\x8e\x3d\xf6\
-\xd8\x23\xc9\x24\x1c\x2b\x82\xf8\xec\x7a\xc5\x90\x46\x0e\xb8\xc6\
-\x8e\x5d\x7b\xec\x32\xc4\x40\x45\x26\xe4\xac\x60\xac\xe2\x18\xe0\
-\x7c\xe1\xf0\x56\x13\x45\x38\xc3\x38\x54\xf0\x0f\x23\x1c\xa3\x16\
-\x2a\x13\x45\x10\xbc\x15\x61\xa8\x43\xe9\x38\xf4\x78\x0e\x89\xa7\
-\x75\xfc\x6e\x42\x3c\x4b\xbd\xd9\xfd\x91\x10\xbc\xfb\xdf\xf0\x0b\
-\x5e\x11\x98\xd5\xae\x5c\x1c\xc6\x61\x77\xb0\x45\x5f\xfd\xcd\x8e\
-\x04\xd7\x4f\xe2\x84\x6a\xd7\x73\x99\xdc\x46\xb6\x90\xa1\x36\xfc\
-\x9d\x04\x31\x86\xb4\x07\x19\x66\xfc\x63\x2e\xcc\x9a\x6b\xef\x9a\
-\x6e\x16\x68\xca\xcf\x71\xcd\xa3\x3a\xc4\xdc\x7a\x8f\x76\x87\x2a\
-\x19\x83\xde\x51\x32\xb1\x4d\x40\x0a\xa2\x4c\xe8\x98\x3f\xcc\xea\
-\x27\x82\xe0\xf7\x79\x38\xf7\xf0\x1b\xe7\x9e\x80\x04\xc9\xf7\x61\
-\xf8\x2d\xbd\x15\x7d\xf8\xde\xac\x7e\x68\x84\x5e\x3f\xa3\x2e\xb8\
-\xa3\x6b\x3a\xd5\xae\x41\x7c\xe5\x77\x28\xc6\xa1\xd3\x6b\x5c\x9a\
-\x62\xc9\x92\x25\x8f\x91\x50\x42\x5e\x58\xaf\xca\x64\xa9\x02\xda\
-\x6a\x73\x5d\x7f\x4a\xa2\x4c\xe8\xe2\x27\xb2\x6a\xe3\x05\x80\xb0\
-\x4f\x7e\x2d\xec\x93\x03\x3a\xb1\x24\x99\xd0\x1c\x6c\x22\x17\xfd\
-\x88\xe7\xa9\x87\xb9\x83\xcd\x73\xf7\xdd\x77\xff\x97\x7c\x6d\xe7\
-\x20\xa1\xc4\x1a\xc9\x5c\x66\xa3\x8f\xe6\x32\xfd\xa4\x8f\x4d\xec\
-\x75\xb5\x9f\x35\x2b\xab\x6d\x04\x36\x21\x91\xf8\x67\x03\x12\x49\
-\x2d\xd6\x15\xe9\x39\xe9\xea\xa6\x1b\x6b\x34\x37\xb3\xea\x59\x81\
-\x2b\xaf\xbc\x72\x15\x01\x7f\xf8\x49\x5f\x74\xb2\xa6\x89\x7e\x1c\
-\x86\xc4\x03\xc6\x03\x82\x67\xf0\x0e\xc2\x56\x66\xdd\x83\x9f\xc8\
-\x18\xed\xc1\xe6\x26\xb9\x84\x8f\x82\x4d\x8e\xce\x23\xa9\xc8\x7a\
-\x89\xdd\x7e\xde\x79\xe7\xfd\x46\x76\x65\xa2\x58\xbd\x7a\xf5\x69\
-\x4a\x32\xe2\x43\x90\xe8\x2a\xaf\x90\x6b\x9a\x60\x84\xf8\x1d\x3e\
-\x04\xcf\x87\xfa\xbe\x57\x13\x84\x0f\xf4\x14\xc9\x2f\x36\xcf\x4d\
-\x77\xb5\x59\x5d\xfb\xea\x48\x63\xa8\xf1\xa3\xbf\xcc\x2d\x8d\x1b\
-\xfe\x24\x63\x47\x82\xa9\x24\xfc\xec\x51\xa9\xac\x8f\x77\xc0\x6f\
-\xd6\x75\xfc\x30\xf4\x93\xe4\xb7\x29\xef\x29\x17\xed\x5f\x9c\xac\
-\x1a\x0a\x61\x6f\x7c\x8e\xb8\x82\x12\xdf\xc4\x15\x98\x57\xb4\x11\
-\x9e\xd0\xa6\x26\x7a\x0a\xa2\x4c\xb4\xbf\xf3\xef\x27\x11\x0b\xc1\
-\x4e\x22\xc9\xc8\xa9\x35\x4e\x7d\x49\x17\xd0\xe6\xa6\xba\x15\xa2\
-\x4c\x94\x7d\x76\x6a\x6a\xea\x6f\x65\xf5\x9d\x20\xe6\xdb\x4d\xb2\
-\xed\x46\x3d\x69\x97\x7c\xfe\xcb\xac\xda\x30\x0c\xc3\x30\x0c\xa3\
-\x19\xb8\xba\x82\x84\x8a\xae\xf0\x22\x81\xc0\x2e\x38\x0c\x53\x0c\
-\x52\x0c\xbf\x26\x86\xa8\x88\xb2\x61\x50\xcf\x89\x2b\xdf\xea\x76\
-\xf0\xd7\xed\xdc\x6e\xda\xf7\x34\x22\x67\x6d\xdf\xd9\x5d\x4a\x22\
-\x49\xd7\xdb\x11\x14\xa0\xef\x4a\x24\x31\xfe\x24\x49\x70\x50\xd9\
-\xed\x8d\x61\x8a\x2c\x90\x44\xc2\x89\xc5\x19\xc0\x31\x82\x37\x4a\
-\x1e\x55\x13\x47\x18\xdd\x90\x12\x47\xf0\xaf\x24\x8c\x5b\x8c\xf2\
-\x92\x90\x99\x2a\xc1\x4b\x51\x1d\xaf\x9b\x90\x9e\x8f\xf7\xee\x4d\
-\x16\x8c\x84\xe0\xd3\x76\x8c\x77\x25\x3c\x64\xbc\xc3\x9b\x61\x12\
-\x1e\x94\x8b\xb6\xf9\x9b\x1d\x09\x25\xb7\xf5\x7d\x2a\x25\xb7\x71\
-\x8e\xda\x3a\x74\x93\x24\xda\xc3\xb8\xd3\x3e\xe4\x20\xe4\x61\x56\
-\x5c\x7b\x37\x6e\x7e\x46\x1f\xc7\x32\x8f\xea\x10\x73\xea\x4a\x74\
-\x31\x73\x4b\xc9\x18\xe6\x56\x35\x19\xd3\xa4\xad\x94\x81\x42\xff\
-\xbc\x34\xab\x9f\x08\x96\x2c\x59\x72\x40\x81\x56\x05\x24\xd8\x41\
-\x3c\x0c\xbf\x29\x13\xba\xe1\x13\x59\xf5\x48\x80\xb7\xb4\x8b\x4d\
-\x23\xa5\x1c\x10\x8c\xa2\x5d\x4d\x37\x8d\x88\xaf\xd1\xae\x33\xb3\
-\xea\x19\xc3\x96\x2d\x5b\xbe\xed\xa4\x93\x4e\xfa\x86\x92\xfb\x4a\
-\x40\x6a\xed\x86\xd7\xac\x37\x6a\x73\x5d\x7f\x4a\xa2\x4c\xc8\xd7\
-\xd9\x59\xbd\xf1\x02\x42\xe8\xe3\x8d\x9c\x94\x46\x8f\x90\x20\x40\
-\x97\x20\x1b\x5a\xab\x9b\xc8\x47\x95\x78\x86\x39\xc3\xdc\xa1\xce\
-\xb0\x8b\xce\xcd\xd7\x4d\x04\xc8\xbd\x76\xa4\x2b\x69\xcd\xa6\x96\
-\xa6\x7a\x92\x7e\x53\x0e\xbb\x2d\xab\x1c\x08\x9d\x4e\xd2\xb7\x67\
-\x38\x89\x42\x30\x5e\x3e\x83\xf4\x49\x53\x3b\x28\x79\x38\xeb\xec\
-\xe5\x6b\xaf\xbd\xf6\xf5\x37\xde\x78\xe3\x0a\x78\x4a\x70\x1e\x3f\
-\x48\xfa\x84\x31\x97\xcc\x0c\x23\x37\xfd\x48\xf5\x41\xd4\xcf\x7b\
-\xe0\x21\xef\x44\xc6\xe0\x29\x72\x06\x7f\x19\x67\xe4\xb9\x4c\x2c\
-\x61\xaf\xb3\xde\x70\x52\x33\xd6\xce\x37\x65\x57\x26\x86\x65\xcb\
-\x96\x5d\x33\xdd\xa6\x85\xb6\x81\x6d\xfa\x1f\x7e\xc5\x77\x66\xf5\
-\x63\x47\xac\x87\x5f\xc0\xf7\x61\x23\x21\x9b\x11\xe0\x1f\xbc\x64\
-\xed\xc0\x9f\x69\x22\xbf\x55\x2a\xc7\x8e\x71\xc3\xff\xd1\xb8\x21\
-\x43\x8c\xdd\x24\x08\x9f\x8c\x79\x2d\x99\x55\x5f\xda\xf0\x3e\xc6\
-\xeb\x5d\xc9\xaa\xa1\x50\xc6\x15\xca\xab\x39\xf1\x1f\xe1\x85\xe6\
-\x52\x5d\x1b\xaa\x44\xdb\x83\x97\xef\xcf\xaa\x3b\xc3\x09\x27\x9c\
-\xf0\x75\xec\x65\x92\x8c\xba\x72\x59\xb7\x95\xc0\x53\x64\xb8\x0d\
-\x1f\x83\xef\x9d\x6f\xac\x8d\x39\xf7\x59\xd9\xf8\xb4\xb9\x7a\x62\
-\x15\x19\x84\xcf\x4d\xda\x4c\xdf\x62\x5c\x3a\xb3\xf1\x0d\xc3\x30\
-\x0c\xc3\x78\x01\x82\x13\x3a\xba\x66\x48\x27\x74\x74\x4d\x01\x3b\
-\xb5\x30\xac\x31\xfc\x9a\x1a\x51\x50\x1a\x25\x73\x26\xa1\x84\x13\
-\x84\x73\x5c\x3a\x41\x38\x6a\x38\x41\x18\xe4\x4d\x9d\x20\x88\xbe\
-\x87\xf1\x36\x2b\xfb\xce\xc9\x24\x92\x49\x7c\x4c\x99\x31\x57\xbf\
-\xb9\xb2\x84\xe0\x27\x4e\x15\xc6\x28\x09\x35\x0c\x52\x5d\x9b\x40\
-\x62\x11\x27\xab\xea\xa8\x60\x5c\x23\x1b\x10\x3c\x82\x30\x5c\x45\
-\xf0\xa2\x24\x78\x58\x52\x95\x77\xd5\xdf\x4b\xaa\x96\x6d\x4a\x3c\
-\xcb\xbb\xc7\x25\x8f\x2b\x56\xac\xf8\x08\xc6\x3b\x3b\xd8\xca\x5d\
-\x77\x0a\xa4\xc0\x97\xa6\xc6\x3b\x44\xdb\x82\x8f\x3f\x9f\xd5\xcf\
-\x7b\x54\x93\xdb\x38\x74\xfa\x86\x0e\xb2\x87\x73\x24\x59\xaa\xe3\
-\xe7\x4c\x11\xed\x61\xdc\x69\x1f\xce\x72\xcc\x99\x59\x71\xed\x5d\
-\xf9\x4d\xa2\x7e\x9b\x05\x9a\xca\x2b\x65\xba\xd4\xeb\x0b\x16\x2c\
-\xf8\x14\x3a\x49\xc9\x2f\xed\x0e\x55\x32\x66\x88\x80\xd4\xa7\xb2\
-\xea\x89\x21\xf4\xea\x57\xf5\x7d\xb5\xea\x37\xa0\xda\xca\x6f\xf2\
-\xfb\xd2\xac\x7a\x24\x84\x9e\xbf\xb1\xbc\xde\x47\xed\x6a\xbb\x69\
-\x84\xdf\xa1\x18\x87\x65\x59\xf5\x8c\x61\xfd\xfa\xf5\xbf\xaf\xd3\
-\xa2\x75\x81\x75\x05\xd3\xd4\xe6\xba\xfe\x88\xf8\x3d\x75\xf1\x1f\
-\x65\xf5\xc6\x0b\x0c\xfb\xf6\xed\x5b\x8e\x2e\x91\x2d\xa3\xa4\x92\
-\x6c\x95\x3a\xb9\x98\x8e\x24\x33\xd4\x41\x5d\x07\x0f\x1e\xbc\x35\
-\x5f\x35\x11\x84\x8e\x39\x50\x5e\xab\xa9\x93\x79\xda\x04\x35\xa8\
-\x4f\xfc\x4e\xdf\x69\xfb\x03\x0f\x3c\xf0\xcb\x59\xed\xb4\xd0\xe9\
-\x24\xe9\x12\xf4\xb4\x4e\xbd\xea\x24\x4a\xf9\xfe\xe9\xe6\x9d\xf8\
-\x97\x55\xcf\x4a\x90\x54\x0a\x1b\xf8\x66\x7c\x21\xf4\x24\xbc\x42\
-\x57\xca\xd6\x1d\xd4\xc7\x51\x88\x7a\xc5\x23\x8d\x15\x7c\xe5\xfd\
-\x4a\x52\xb0\x79\x85\xb6\x21\xd7\xf8\x6c\x6c\x5e\xe0\xa4\x0d\xba\
-\x70\xd2\x49\xa5\x90\x89\x4f\x60\x1b\x97\x37\x5d\x8c\x72\x22\x25\
-\xca\x76\x7a\x22\x25\xd6\x8e\xaf\xb1\x76\x30\x87\xb4\x76\xb0\x19\
-\x01\x9e\x22\xc3\x8c\x31\x7c\xaf\x6b\xdf\x74\x54\x8e\x1b\xfd\xa5\
-\x1e\xc6\x4d\x63\x37\x09\xe2\x5d\xbc\x77\x18\x39\x55\xbb\x43\xbe\
-\x86\xbe\xda\x38\x78\xfa\x3a\x4e\x9b\x2b\xae\x40\x92\x53\x71\x05\
-\xf4\x2f\xb2\x2b\x1d\x51\xd7\x86\x92\xc4\xcb\x28\xdf\xe9\xda\xbc\
-\x71\xe3\xc6\x57\xd1\x66\xdd\x56\x42\xa2\x5c\xb7\x95\x90\xbc\x6d\
-\xaa\xd7\x20\xb5\x39\xf8\x3f\xd2\x29\xaf\x41\x08\xbf\xfd\x07\xf1\
-\x99\xaa\x27\xed\x94\xb8\xc3\xe6\xa4\xcd\x4d\xe6\x5d\xc1\xe7\x95\
-\x59\xbd\x61\x18\x86\x61\x18\xc6\x60\x70\xc5\x94\x82\x32\x18\xd6\
-\xba\xa6\xa0\x7a\xcd\xd0\x20\x63\xa4\x24\x8c\x97\xc7\x3a\xfa\xce\
-\xc6\xb8\xc1\x6e\xcb\xaa\x13\x34\xcc\xce\x6d\x11\x06\x59\x56\x3d\
-\xeb\xa0\x93\x49\x18\xcd\x04\x04\x38\x09\xc0\x0e\x53\x02\x8c\x9c\
-\x06\xc0\x78\xc6\x21\xc5\x80\x26\x91\x84\x41\x4a\x60\x0e\x3e\x90\
-\x58\xc4\x89\xad\x26\x91\xe4\xac\xc8\xc8\x6e\x4b\x7a\x16\xca\xba\
-\xf6\x44\xbd\x7b\x4b\x67\x48\xef\xd0\x33\x75\x7c\xef\x47\x94\xe7\
-\xf9\x71\xc9\x63\xf0\x6c\x9f\x02\xc6\x4a\x78\x10\xa0\x1f\x66\x07\
-\x1b\x44\xdb\xc2\x01\xfc\xe1\xac\x7e\x5e\x83\xe4\x76\xe9\x84\xea\
-\xfa\x49\xee\x9e\xc7\xa1\x53\x72\x7b\x18\x39\x68\x42\xc8\x9e\xea\
-\xae\x52\x5d\xf9\x2a\x31\xee\xb4\x8f\x76\x1e\x38\x70\x60\xc6\xaf\
-\xbd\xab\x6e\x16\x18\xe5\x9b\x44\xe2\x43\x94\xef\x2c\xa1\x44\x5b\
-\xb5\x3b\x54\x73\x4b\xbb\x43\xcb\xe4\x57\x5d\xfb\xaa\x44\x9f\x42\
-\x7f\x8c\x25\x19\xd3\x14\x5b\xb6\x6c\x79\x05\x7d\xc0\xb9\x2f\x03\
-\x12\xc3\xc8\x2f\xbf\xd3\x87\xd0\x5b\x27\x65\xf5\x23\x61\xd9\xb2\
-\x65\xb7\x29\xe8\xc0\xf7\x4e\x74\xbd\xcf\x30\x72\x40\xb9\x18\x8b\
-\x63\xb2\xea\x19\x43\xe8\xe2\x0f\x71\x52\x82\x75\x6c\x1c\x3b\xe2\
-\x93\xdf\xff\x21\xab\x37\x5a\xe2\x82\x0b\x2e\xf8\xa6\x9d\x3b\x77\
-\x7e\xf7\xc6\x8d\x1b\x27\x7a\x2a\xb0\x0d\x62\xad\xde\x4a\xd0\x98\
-\x44\x2a\x81\x63\xe6\x24\x7a\x45\x72\xd2\x44\x56\x4a\xa2\x3c\xcf\
-\x52\x47\xd4\xf7\x40\xbe\x66\x22\x58\xb9\x72\xe5\x41\xad\x93\xcc\
-\x67\xec\xb6\xea\x7c\xae\x6b\xb3\x88\xb6\xa7\x6d\xd4\x28\xa1\xc4\
-\xe9\x24\x36\x28\xe8\x74\x12\xfe\x02\x9b\x90\x14\xc0\x54\xe2\xa0\
-\xe9\xbc\xcb\xf7\xcf\x89\x8d\x67\xb7\xdd\x76\xdb\xb2\xe8\xdf\x52\
-\xec\xe1\x32\xb1\x04\x9f\xe1\xa1\x74\xa7\xa8\xae\xbf\xc3\x52\x59\
-\x2f\xef\xe1\x7d\xbc\x97\xf7\xd3\x0e\xec\x4e\xf4\x1d\x32\x4d\x52\
-\x8f\x8d\x02\x24\x18\x2f\xbd\xf4\xd2\x3b\xb2\xf9\x13\x41\xdd\x89\
-\x14\x6c\x63\x64\x12\x9e\x89\x57\x75\x7d\xac\x12\xfd\x8c\xf2\xbb\
-\xb2\xea\xb1\x23\x74\xd5\xb7\xe3\xf7\x72\x9a\x8a\x9b\x19\x74\x1a\
-\x1a\xfe\x29\xd9\x4c\x5b\x87\x1d\xcb\xea\x98\x69\xdc\x26\x49\x7a\
-\xaf\xda\x51\xd7\xce\x3a\x52\x5b\x43\xde\x5f\x9c\xec\x6a\x8d\xb0\
-\x33\x56\x96\x71\x05\x12\x76\x8a\x2b\x20\xab\x6d\x12\x76\xb4\x9d\
-\xf6\x84\x5e\xe9\xf4\x5b\x44\x6b\xd6\xac\x39\x85\x36\xeb\xb6\x12\
-\x12\xf5\xba\xad\x84\x44\x39\x32\x81\x0c\x37\xe1\xa5\xda\x1c\xcf\
-\xbc\x2e\xab\xef\x04\xe1\xbf\xbf\x13\x9f\xa9\x3c\x69\xc7\xdc\x1f\
-\x25\x71\x17\x7a\xe5\xb7\xb2\x7a\xc3\x30\x0c\xc3\x30\x8c\xc1\x50\
-\x42\x89\xa0\x8c\xbe\xb1\xa1\x13\x3a\x38\xdc\x38\x9b\x4d\x83\x32\
-\x22\xca\x67\xf5\xb3\x1e\xda\xdd\xc3\x0e\xfe\xd2\x09\x22\x00\x28\
-\x27\x48\x46\x79\x5d\x5f\xab\x84\x11\x99\x55\xcf\x2a\x9c\x7a\xea\
-\xa9\xf7\x73\x32\x09\xe3\x53\x09\x34\x0c\x7d\x82\x8b\x9c\x04\xc0\
-\x70\x26\xc0\xc8\xb8\xb3\xe3\x91\xb1\xc7\x18\x2d\x1d\x67\xc6\x75\
-\x18\x47\x45\xe5\x20\x3d\x1b\xb4\x07\x8a\x7a\x17\x04\xbd\x12\xca\
-\xa6\xf6\xc0\x3b\xf5\x5e\xbd\x5b\xcf\x36\x79\xa7\x88\xb2\xe3\x1c\
-\x93\x30\xdc\x0f\x22\x2f\xfa\x10\x75\x35\x60\x4c\x9b\x9b\xb6\x91\
-\x32\xf4\xeb\xe9\xa7\x9f\xfe\xf6\xac\x7e\x5e\xa3\x4c\x6e\xe3\xd0\
-\x95\xc9\xed\x72\xe7\x73\x9b\xf1\x6f\x42\xd4\x87\x2c\xd2\x06\xc9\
-\x58\x49\xfc\xde\x66\x3c\x99\x33\x38\xcd\x31\x97\x66\xf4\xda\xbb\
-\xea\x66\x01\x39\xc8\x9c\x3c\x6c\xb3\x93\x1c\x4a\x1e\x8d\x2d\x31\
-\x5b\x45\x8c\xf7\x2f\xd2\x56\x25\x63\xaa\xdf\xb2\x6b\xe3\x18\x43\
-\x94\x8b\xb9\x38\xd1\xa4\xc7\xea\xd5\xab\x4f\x2a\xe5\x57\xfc\x1e\
-\x46\x7e\xc5\xef\xe8\xc3\xaf\x64\xf5\x23\x21\xf4\xd6\xbd\x65\xa2\
-\x56\xd7\xfb\xb4\x3d\x85\xac\x76\x85\x8c\xff\x6e\x56\x3d\x63\xe0\
-\x44\x9b\xae\x17\x64\x33\x08\xeb\x58\xb9\x19\x04\x5d\x8c\xee\xaf\
-\xeb\x47\x95\xe8\x17\x65\x03\x7f\x27\xab\x9f\x37\x58\xb7\x6e\xdd\
-\x2f\x6d\xda\xb4\xe9\x37\x42\x36\xfe\x5b\xd0\x9f\x86\x1c\x2f\x5c\
-\xb5\x6a\xd5\xda\x95\x2b\x57\xee\x0a\xde\x5e\x12\xf2\xfc\x91\x90\
-\x9f\x7d\x21\x3f\xf7\x2d\x5a\xb4\xe8\xe1\xe0\xf9\x53\x41\xcf\x84\
-\x2d\xf1\xd7\xd8\x4f\x24\x51\x4b\x3a\xe5\x94\x53\xbe\x90\x55\xcf\
-\x3a\xf0\x3d\x8b\x90\x91\x47\x90\x7d\x12\x20\xe8\x69\x05\x0a\x19\
-\xff\x26\x73\xb3\x24\xc9\x0d\xcf\x87\xcc\x4d\xf4\x44\x64\xc8\xfc\
-\x51\x75\x1b\x5b\xca\xe4\xfb\x74\xfd\xd1\x5c\x26\x01\x14\xf6\xde\
-\xa2\xac\xb6\x2f\x74\xb2\x5d\x1b\x6a\x34\xe7\x14\x88\x27\xd9\x52\
-\xea\x92\xba\x77\x8a\x78\x77\xd0\x29\x59\xf5\x9c\x01\x6b\x7a\xe8\
-\xcc\x25\xb2\x8f\xf1\x8f\xe8\x6f\x69\x1b\x67\xdf\x6a\xfb\x3d\x0e\
-\x52\xfd\xbc\x8b\xf7\xf2\x7e\x64\x98\xc4\x12\x41\x64\xf4\x1f\xf2\
-\xcd\x89\x9b\xcb\x2e\xbb\x6c\x75\x36\xbd\x53\x84\x7d\xf1\xc6\x32\
-\xb0\x5d\x9e\x48\x61\xed\x6b\x1b\xd8\x86\x97\xd1\xb7\x77\x67\xf5\
-\x63\xc7\xb6\x6d\xdb\x7e\x98\xc4\x28\x7e\x50\xf5\xea\x6a\xd6\x0e\
-\xc6\x75\x18\x7d\xd0\x8f\x34\x66\x93\xa4\xba\x76\x34\xa1\x94\xab\
-\x67\x92\x55\x43\x21\xe4\xe0\xb6\x2a\x7f\xd9\xac\x28\xfe\x22\xaf\
-\x4d\xf9\x4b\x19\xca\x86\x5e\xfb\xd6\xac\xbe\x13\x2c\x5f\xbe\xfc\
-\x4a\x4e\xc8\xeb\xca\x46\x25\x19\xd9\xa0\x82\x6e\x6b\xbb\x41\x85\
-\x36\x87\x3e\xec\xec\xca\x46\x20\x1b\x9f\x36\x63\x73\x92\xb8\xe3\
-\xb4\x28\x49\xb0\x11\x12\x77\x3f\x94\xd5\x1b\x86\x61\x18\x86\x61\
-\x0c\x06\x01\x01\x8c\xa8\xf2\x0a\x2f\xae\x3b\x1b\xf6\x84\x0e\x14\
-\x8e\xc3\x9c\xb8\x83\x37\x0c\xb0\xde\x0e\xfe\xd2\x09\x2a\x03\x6d\
-\xa5\x13\xd4\xd4\x88\x8c\xf2\xb3\x6e\xc7\x25\x3b\x4b\x15\x0c\x20\
-\x99\x44\xf2\x10\xe3\x93\x84\x08\xe3\x8d\xe3\x49\x52\x84\x60\x04\
-\x0e\x29\x8e\x29\x06\x3f\x41\x09\xfa\xcf\xf8\xc3\x03\xf1\xa1\x1f\
-\x2f\xf4\x1b\xa4\xf2\x41\xbd\x13\x47\x51\xcf\xf3\x92\x46\xfd\x40\
-\x70\x03\xd9\x23\x30\xa2\xa4\x16\x72\xa8\xb6\x4c\xd7\x86\x2a\x51\
-\x8e\xf7\x67\xd5\x23\x63\xf1\xe2\xc5\x8f\x96\xd7\x38\x94\xf2\x52\
-\x06\x8c\x07\xb5\x4f\x65\xa2\xfc\x17\xb3\xea\x79\x0f\x9c\x23\x9d\
-\x38\xd0\x87\xbe\x71\xe8\xf4\x0d\x9d\x61\x92\xdb\x83\x88\xba\x90\
-\xd1\x6c\xc2\x8b\x62\x3c\x90\xd5\xde\x38\x8a\x24\xff\x4d\xc6\x94\
-\xb2\xcc\x1b\xe4\x77\xa6\xaf\xbd\x93\xb3\xd9\x8f\x9f\x0a\xa4\xd2\
-\xee\x26\x7d\x83\x07\x59\xf5\xd8\x11\x6d\x5d\xc2\xd8\xa3\x8b\xf5\
-\x41\x6f\xed\x0e\xd5\x49\xd9\xa6\x8e\x31\xc4\x38\x44\xf9\x9f\xcb\
-\xea\x27\x82\x58\x43\x3f\x24\xe7\x7e\x54\xf9\x95\x2c\xdd\x77\xdf\
-\x7d\x7f\x3f\xab\x1f\x09\xa1\xb3\x1e\xd0\x3a\xc7\x2e\x56\x25\x16\
-\xdb\x9e\x42\x56\xbb\x42\x76\x3a\xdd\x79\x3b\x08\x21\x23\x3f\xc3\
-\x7a\x56\xee\x88\x57\x50\x9d\x9d\xfa\xcc\x3f\xcd\xdd\xba\x7e\x54\
-\x29\xfb\x75\x5f\x56\x3f\xaf\x70\xcc\x31\xc7\x7c\x2d\x68\x8a\xeb\
-\xcc\x38\xc1\x8c\x4d\x88\x1c\x43\xd8\x86\x24\xed\xb0\x1b\x20\x92\
-\x09\x10\x7c\x87\x48\x00\xb3\x1e\x96\x14\x72\xf6\xd7\x59\xf5\xac\
-\x44\xc8\xfe\x6f\x61\xf3\x28\xa9\x84\xac\x68\x0e\x20\x2f\x4d\xe6\
-\x41\x49\xe8\x24\xe6\x75\xd8\x2a\xcf\xe6\x2b\x26\x82\x4d\x9b\x36\
-\x1d\x2d\xbb\x7d\x98\xeb\x41\xf9\x8d\xb6\xb3\x5e\x85\xcd\x77\x63\
-\x56\x5b\x0b\xd6\x92\xf2\x74\x12\xf6\x23\x7a\x44\x27\x5e\x95\xc8\
-\x52\x20\x7e\x90\x9e\xce\xf9\x36\x27\x4e\x27\xf5\x03\x89\x25\xf4\
-\x3a\xfd\x46\x7e\x64\xa3\x4a\x8e\xe0\x01\xfd\x14\xd5\xf1\x61\x14\
-\xd2\xf8\x41\xbc\x93\xf7\x63\x2f\xd3\x26\xc6\x03\xf9\x26\xb8\x1c\
-\x36\xea\x1b\xb2\xc9\x9d\x61\xcd\x9a\x35\xcb\xd0\x17\x92\x8d\x71\
-\x9c\x48\x89\x3e\xfd\x74\x56\x3f\x76\xc4\xfa\xfc\xef\x95\xf0\x20\
-\x79\x70\xe1\x85\x17\xf6\x36\x23\x90\x3c\x90\x1c\x6b\xfc\xea\xda\
-\x38\x1d\x69\xbc\xe7\x22\xd1\xe7\xe4\xfd\x6d\xc9\xaa\xa1\x10\xb2\
-\xf0\x65\xd6\x8d\xd0\x1b\x3d\xfd\xc4\x55\xea\x9c\x9c\x23\xae\xd0\
-\xf6\x26\x07\xca\x84\xec\xdc\x99\x55\x77\x86\x58\xdf\x1e\x67\x8d\
-\xab\x6e\x50\xd1\x1a\xd1\x76\x83\x4a\xb4\xf9\x70\x56\xdd\x19\x62\
-\xbd\xbd\x0b\x39\xa6\xcd\xa5\x1c\x0f\x9b\xb8\x8b\x71\xff\x6c\x56\
-\x6d\x18\x86\x61\x18\x86\xd1\x0c\x4a\x32\x70\x15\x8e\x4e\xe8\x70\
-\x52\x85\xa0\x0c\x86\x5f\x93\x9d\x8e\x25\xa5\x51\x32\x27\x1c\x45\
-\x05\x5c\xeb\x76\xf7\xb0\x23\x49\x41\x86\x26\x4e\x10\x44\xb9\xd9\
-\xd8\x77\x02\x45\x4a\x1c\xd2\x57\x82\x8a\x4a\x26\xd1\x5f\x02\x8b\
-\x32\x9a\x75\xca\x86\x7e\x33\xee\x32\xfa\xa7\x1b\x7f\xfd\x0e\x45\
-\x79\x4e\x1d\x35\x4e\x1e\xd5\x21\xda\xb2\x94\xf6\x20\x83\xec\x6e\
-\x54\xbb\xe4\xb0\x37\x75\x44\xa0\x71\x8f\xc9\xc2\x85\x0b\x3f\x5d\
-\x9e\xf8\x18\xf6\x04\x4d\xf2\x0a\x5e\x3f\x92\x55\xcf\x7b\x84\x73\
-\x74\xb8\x7a\xe2\xa0\x0c\x92\x21\x97\x83\x82\x64\x6d\x88\x7a\x82\
-\x9e\xb3\x4b\xfa\xb1\xc7\x1e\x7b\x15\xe3\x88\xbc\xe1\x8c\x11\x58\
-\x60\x4c\x9b\x04\x43\x34\xa6\x94\xe7\xf9\x43\x87\x0e\xcd\xe8\xb5\
-\x77\xf0\x53\x9b\x05\xc6\xf1\x4d\xa2\xe8\x5b\x67\x1f\x18\x5e\xba\
-\x74\xe9\x4d\xe5\xee\x50\xed\x18\x26\xc0\xa3\x93\xb2\x6d\xd6\xa1\
-\x28\xfb\x95\xac\x7a\x62\x58\xb4\x68\xd1\xc7\xeb\xe4\x77\x98\x13\
-\x33\xc8\x51\x94\x7d\x28\xab\x1e\x19\xd1\xb6\x47\xa5\xb7\xca\x93\
-\x7f\xac\x73\xc8\x79\x53\x39\xc8\x76\xf1\xcc\x2f\x65\xd5\x33\x82\
-\x55\xab\x56\x9d\xce\xda\x4d\x02\x43\xc9\x7d\x9d\x68\x23\xb9\x8f\
-\xed\xa2\xb5\xa2\xae\x1f\x55\xa2\x5c\xf0\x60\x73\x56\x3f\xaf\x70\
-\xfc\xf1\xc7\x7f\x91\x0d\x27\x4a\x24\x21\xc3\x24\x8a\x90\x17\xe6\
-\x23\x41\x57\x64\x1a\x3d\x42\x80\x90\x04\x1e\xf6\x22\xc4\x49\x5d\
-\xf8\x5f\xa5\xac\x7a\xd6\x22\x6c\x9f\xcf\x29\xa9\xc4\xe9\xe2\x52\
-\x1f\x22\x0b\x4d\xf5\x0c\x94\xb2\xd3\x5b\xff\xc3\x0e\x98\xe8\x69\
-\xe3\x51\x36\x5f\xf0\x1b\x94\xeb\xd5\x0d\x59\x65\x2d\x62\xcc\xcf\
-\xe4\x04\x0a\x49\x44\x05\x89\xd1\x6f\x3a\x75\x20\x3d\x22\xfb\x67\
-\xd0\x7b\x43\x87\xcc\xe9\x64\x52\x89\x58\xe7\x5f\x1d\xe3\xbe\x98\
-\x44\x04\xeb\x3e\xbc\x2f\x6d\x68\xa8\xad\x4c\xb5\x21\xea\xa5\x7e\
-\xde\xc3\x7b\x91\x43\xd6\x4c\xec\x67\x6c\xfb\x90\x8b\x91\x92\x03\
-\x4d\x10\x7a\xe2\x23\x4a\xd0\x20\x8f\x5a\xbf\x91\x47\xe6\x56\xdb\
-\xc0\x76\x94\xfd\x3a\xa7\x09\xb3\xfa\xb1\x63\xc7\x8e\x1d\xdf\x85\
-\xbd\x81\x5e\xe3\xfb\xb1\xa5\x6d\x34\x6c\x42\x89\xb2\x22\x9e\x2d\
-\x49\x72\x30\xdb\x09\x9d\x81\xdc\x46\xff\xb7\x24\xab\x5a\x63\xf7\
-\xee\xdd\x7f\x57\x9b\x3d\x58\x1f\x14\x57\x20\xf1\x8c\x4c\x32\x47\
-\x90\xd3\x26\xfc\x15\x2f\x43\x37\x6f\xcb\xea\x3b\x41\xd8\x9c\xdf\
-\xc6\xfa\x47\x9b\xb5\x41\xa5\xee\xb6\x12\x78\x54\xd7\xce\x2a\xd1\
-\xee\xe0\xe5\xd9\x59\x7d\x67\x08\x3e\x7f\x95\xf5\x9a\x36\xa3\x93\
-\x2f\xbd\xf4\xd2\x5e\x9b\xdb\x26\xee\xc4\xe7\xe8\xe3\x35\x59\xb5\
-\x61\x18\x86\x61\x18\xc6\x60\x70\x42\x87\x00\x02\xc1\x03\xbe\xa5\
-\xa3\x6b\x0a\x70\x42\x08\xca\x60\xf8\x61\x44\x35\x31\x48\x20\xca\
-\x40\xe1\x3c\x9c\x9a\xaf\x98\xd5\x50\x42\xa9\xdf\xee\x9e\x26\x4e\
-\xb9\x48\x06\x59\x56\x3d\x6b\xc0\xe9\x24\x76\x1d\x2b\xf8\x86\x81\
-\xcf\x37\x93\xe8\x2b\xc9\x24\x05\x54\x70\x40\x71\xfa\x14\xf4\x6c\
-\x6a\x84\x66\xbf\x7b\x49\xa4\x7c\xe5\xc8\xb8\xf1\xc6\x1b\xf7\x71\
-\x27\x3f\x6d\x63\x2c\x14\xf0\x51\xc0\xa2\xa9\x3c\x42\x94\x8d\x67\
-\xc6\x16\xbc\x08\xe3\xfd\x8b\x04\xda\x38\x45\x41\x02\x92\xa0\x94\
-\xae\x7b\x29\x03\x2a\x75\x6d\x29\x29\xf9\x86\xc1\x7f\x4b\x56\x3d\
-\xef\x81\x13\xaa\xeb\x74\xca\x13\x07\x24\x17\x4b\x87\xae\xe9\xd8\
-\x4f\x47\xd4\x11\x75\x3d\x4f\x2e\x62\x1e\xfc\x32\x63\xc9\xc9\x0d\
-\xe6\x04\xef\x55\xa2\xb0\x89\x2e\xe0\x77\xca\x21\x0b\x3c\x1f\xf2\
-\x3b\x63\xd7\xde\x95\x9b\x05\xa6\xfb\x26\x51\x13\x7e\x8e\x7b\x1e\
-\x55\x71\xd2\x49\x27\xfd\x05\x63\xaf\x64\x0c\x3b\x5a\x09\xf0\x28\
-\xd1\x8d\x63\xdc\x66\xec\x63\x0c\x3e\x9a\x55\x4f\x04\x7b\xf6\xec\
-\xf9\xe6\x3a\xf9\x85\xdf\x04\x51\xda\x06\x24\x92\xdf\xbb\xb3\xfa\
-\x91\xb1\x68\xd1\xa2\x4f\x96\xbb\xc7\xcb\x8d\x13\xc8\x6a\xd3\x75\
-\x8e\x76\xd1\x87\x78\x66\xa2\x1f\x7c\xaf\x22\xd6\xb2\x3b\x75\x5a\
-\x42\xba\x98\x24\x99\xfa\x84\xed\x42\x9f\x68\x6f\x5d\x3f\xaa\x44\
-\xb9\x98\x0f\xef\xc8\xea\xe7\x15\x82\x8f\x9f\x26\x98\x06\x3f\xb1\
-\x05\x49\x52\xa0\x33\x48\x3e\x6e\xda\xb4\xa9\x17\x70\x65\x4e\x42\
-\xd8\x0e\xe8\x12\xe4\x9b\x4d\x29\x7c\x27\x8c\x2b\x14\xb1\x1d\x45\
-\xfc\x3f\xdf\x28\xc9\xea\x67\x25\xce\x3f\xff\xfc\x0b\xd8\x50\x43\
-\xd0\x9b\xf5\x5b\xf6\x6e\x1b\x9d\x28\x2a\xe6\x04\xc9\x9c\xef\xc8\
-\x57\x4c\x04\x9a\xd3\xc3\x7c\xfb\x94\xdf\x20\xca\x45\xdb\xfb\x26\
-\x94\xd6\xae\x5d\xbb\x83\x64\x12\x01\x78\xde\xa7\xcd\x34\x3a\x9d\
-\xa4\x80\x2b\xbc\x1b\xa4\x47\xf4\xce\xac\xfa\x05\x07\x12\x4b\xfd\
-\x92\x4b\xd2\x47\x90\xf8\x50\xc7\xa3\x61\x48\xf5\x21\x87\xbc\x8b\
-\xf1\x67\xdd\x64\xfd\xc4\x8e\x0e\xbf\xa6\xd3\x13\xa5\x9c\xee\x20\
-\xb0\x5d\x9e\x48\xe1\xa6\x0b\x25\x68\x9a\x06\xb6\x21\xca\x04\xaf\
-\xf6\x65\xd5\x9d\x21\xda\xfc\x35\x6d\xb6\xd1\xcd\x1c\xc3\xb4\x17\
-\x8a\xb2\xb7\x3c\xfd\xf4\xd3\x6f\x89\xf2\x47\x41\xd1\xfe\x23\x14\
-\x75\x1d\x3d\x69\x8a\xf1\x7f\x0e\xc5\xdf\x68\x47\x8f\xe2\xff\x8f\
-\x50\xc8\xe7\x5b\x4a\x0a\x99\x7d\xcb\x43\x0f\x3d\x74\xd4\xc3\x0f\
-\x3f\x3c\xf4\x77\xf0\x62\x3d\x7e\x9b\xfc\x4d\x74\x05\x6b\x02\x37\
-\x39\xa0\x9b\xd0\xb3\xe8\xc9\x41\xba\x49\x44\x19\xc6\x21\xda\xfd\
-\xfb\x59\x7d\x27\xe0\xca\xd7\xba\x2b\x1b\xd1\x6f\x6c\x16\xe4\xe4\
-\x9f\xe6\x6f\x5d\x3b\xab\x94\x6d\xfe\xe3\xac\xbe\x13\x84\xdc\xfe\
-\x84\x92\xfc\xb4\x99\xf5\x58\xdf\xd2\x1b\x36\x71\x17\x7d\x5c\x92\
-\xd5\x1b\x86\x61\x18\x86\x61\x0c\x46\x18\xd3\x3b\x15\x94\x21\x70\
-\x50\x17\x20\x6f\x63\x44\xc9\x28\x09\xc3\xb4\x93\xef\x6c\x8c\x1b\
-\x3a\xb5\x53\xdd\xdd\xa3\x80\x6b\x18\x84\x8d\x83\x0b\xd9\xf7\xce\
-\x76\xf0\x0f\x0b\x4e\x27\x29\xd0\xa9\xdd\x78\xec\x66\xe5\xca\x23\
-\x0c\x4f\x05\x6c\xc3\xb9\xe8\x19\xf9\xea\xef\x74\x7d\xd6\xef\x51\
-\xb6\x93\x00\x33\x81\x58\x76\x9b\x13\x20\x61\x3c\xd8\xe5\x88\x23\
-\x82\x51\xdf\x76\x4c\x28\x3b\x4e\x79\x0c\x79\xf9\x6b\x76\x6d\x6b\
-\xbe\xb4\xdd\x15\x2c\xa2\x4c\xce\x95\x0f\x66\xd5\xf3\x1a\x65\x72\
-\x5b\x0e\xdd\x28\xdf\xd0\x99\x8e\x06\xc9\xee\x1d\x77\xdc\x71\x33\
-\x63\xca\xdc\x40\xee\x94\x5c\xd6\xfb\xa7\x1b\x5f\xc9\x1c\x8e\x1c\
-\x3a\x24\x1c\xbb\x19\xb9\xf6\x4e\xfc\x94\xb3\x39\x8e\x6f\x12\x45\
-\xf9\xce\x12\x4a\xe8\x62\xc6\x1e\x5d\x8c\x63\xcc\xee\x50\x92\x31\
-\x04\x2b\x75\x52\x76\x10\xef\x45\x39\x06\xcb\xb3\xea\x89\x60\xe3\
-\xc6\x8d\x6f\xe8\x27\xbf\xd2\x5d\x6d\xf9\x1d\x7d\x3e\x36\xab\x1f\
-\x19\xa1\xff\x3f\x85\xde\x52\xf2\x45\x81\x74\xf4\x96\xd6\xf9\x26\
-\xbc\xa5\x5d\xc8\x77\x3c\x33\x63\xdf\x50\x0a\x59\x7e\xc9\x09\x27\
-\x9c\xf0\x75\x9d\x06\xd3\x0e\x73\x4e\x4b\x70\xa2\x4d\x9b\x0f\x68\
-\x67\x13\x7e\x6b\xce\xc6\x33\xff\x2e\x5f\x31\xaf\x70\xea\xa9\xa7\
-\x7e\x42\xb2\x4b\x80\x95\x04\x05\x89\x23\xae\x34\xc3\x56\x60\xf3\
-\x09\x01\x57\xec\x23\xd6\x66\xe6\x26\x84\x7c\x13\x74\x23\x58\x08\
-\xf1\x31\x70\xfe\xe5\xef\x61\x5f\xfc\x58\x56\x3f\x2b\x11\xf3\x73\
-\x1d\x3a\x51\xbb\xd0\x75\x6a\x53\x6b\x78\x53\x5d\x03\x15\xf2\xf3\
-\xa5\xac\x7e\x62\x08\x7d\x79\x40\xfa\x9d\xb1\x90\x7e\x27\x98\x88\
-\xbe\xa1\x6d\xfd\xfa\xa1\xdf\x28\xc7\x7c\xc9\x2a\x9f\x87\x75\xeb\
-\xd6\x6d\xc7\x4f\x60\x2d\x21\x61\xa0\xd3\xae\xa5\xed\x83\xfd\xd8\
-\xc4\x57\x48\x5e\x75\xb6\x8e\xcc\x26\x90\x58\x7a\xe0\x81\x07\x6e\
-\x44\xf7\xc3\x5f\x6c\x57\x78\x0d\x9f\xa4\x9b\xa6\x1b\x9f\x61\x48\
-\xfa\x99\xf7\x30\x26\x6c\x6a\xc1\x8e\x09\x5d\xff\xda\x6c\xd6\xd8\
-\xb1\x7e\xfd\xfa\x6f\xc7\xc7\x40\x3e\xca\x13\x29\xdc\x74\xc1\xbb\
-\xe9\x7f\xdb\xc0\x76\xf0\x6a\x5d\x56\xdf\x19\xa2\xbd\xcf\x28\xa1\
-\x34\xea\x95\x6c\x51\xf6\xf2\xac\x76\xde\x23\x74\x44\x4f\x5f\x54\
-\xe3\x0a\xe8\x0a\x92\xdd\xb2\xa5\x9b\xf2\x16\x79\x8e\xf1\xf8\x89\
-\xac\xbe\x13\x84\x1e\x3d\x83\x35\x50\x09\x73\x6d\x50\xd1\x95\x8d\
-\xe8\xd3\x26\xfa\x0d\x52\x9b\x63\xfe\xfd\x42\x56\xdf\x09\x42\xef\
-\x1f\x43\x9b\x49\xdc\xb1\x66\xb3\x5e\xb3\x06\x57\x13\x77\x4d\xe4\
-\x58\x6d\x8e\xf2\xbf\x99\xd5\x1b\x86\x61\x18\x86\x61\x0c\xc6\xe2\
-\xc5\x8b\x7b\x57\x4c\xb1\x23\x95\xa0\x0c\x81\x03\x82\x32\x38\xd7\
-\x38\x22\x6d\x82\xf7\x90\x8c\x92\xac\x7e\xd6\x83\xdd\x3d\x24\x5a\
-\x70\xc8\xcb\xdd\x3d\x04\x31\xcb\x00\x60\x93\xfe\x53\x2e\xca\xcf\
-\x2a\x47\xb9\x3c\x9d\x84\xa1\xac\x53\x68\xf4\x53\x89\x33\x25\x42\
-\x5a\x1a\x9e\x9d\xf5\x33\x64\xf0\x8d\xec\x7a\xc6\xa0\xc7\xc9\xd3\
-\xb5\x34\xda\xe5\x4f\x5b\x9b\xca\x24\x65\x70\x02\xb2\xea\xb1\x20\
-\x9c\xd0\xcf\x11\x98\x2d\xaf\x99\xe1\x14\x95\xe6\x0b\xef\x6b\xda\
-\x36\xf8\x1d\x46\xff\xd0\x57\x4b\xbc\x90\x40\x72\x5b\x72\x8a\x73\
-\xc4\xf8\x93\xf4\xd4\x8e\x6b\x05\xc8\xe0\x59\x1d\x3f\x9b\x12\x7c\
-\x0f\x9a\xf6\xba\xae\xbd\x7b\xf7\xde\xca\x49\x45\x76\x27\xd6\x25\
-\x33\xa7\x6b\x83\xc6\x95\xb6\xd2\xe6\x78\x76\x46\xae\xbd\x13\x3f\
-\xd9\x71\x09\x3f\xeb\xbe\x49\xd4\x86\x9f\xf4\x3b\xe6\x5e\x27\x1b\
-\x05\x42\xff\xbe\x89\x80\x54\xb9\x3b\x94\xc0\xb4\x92\x31\xe5\xd8\
-\x0f\x9a\x5b\xe2\x7f\x8c\xd5\x5b\xb3\xfa\x89\x60\xf5\xea\xd5\xcb\
-\xeb\xe4\x57\xfc\x6e\x2b\xbf\xe3\xe6\x77\xac\xf5\x8f\x2a\xa1\x54\
-\x5e\x8f\x85\xde\x42\xa7\x36\xd5\x5b\xb4\x9f\xb2\x31\x1f\xfe\x77\
-\x56\x3d\x71\xac\x5a\xb5\x6a\xb5\x02\x98\x3a\x7d\xa7\xc4\x00\x6b\
-\xda\x30\x01\xc1\x71\xaf\x13\x73\x09\x4b\xf2\xaa\x51\xec\x40\x64\
-\x97\x80\x30\x57\x56\x61\x27\x10\x54\x43\x56\xd0\x87\xec\xe0\x27\
-\xe8\x0a\x9f\x49\xf6\xa2\x1f\x99\xa3\x22\x4e\xb6\xf3\x2f\x81\xe4\
-\x28\x77\x74\x56\x3f\x2b\x11\xf6\xde\xf1\x9c\x4a\x67\x2e\x60\x63\
-\xd4\xad\x33\x4d\x64\x07\x92\xce\x89\xb5\x7c\xe2\xd7\xd7\x86\x9e\
-\x3f\x48\x12\xbe\x9c\x03\xd8\x4a\x4d\x93\xf0\xfc\x46\x7f\xd1\x01\
-\x59\xe5\x73\x10\xb2\xf0\x66\xe6\x19\x76\xb2\x82\xad\xda\x9c\xa0\
-\x84\x41\x9b\xf9\x46\x99\xac\x7a\x5e\x21\x4f\x2d\x35\x4a\x2e\x0d\
-\xe2\xe1\x74\xa4\xe7\xa9\x93\xfa\x91\x67\x36\x07\xb2\x49\x26\x9b\
-\x32\x76\xc4\x9a\xf2\xeb\x0a\x6c\xe3\x63\x20\x1f\xac\xdf\xe8\x03\
-\x92\x9b\xb2\x35\x9a\xf4\x8d\xdf\xe1\x45\xf0\xe7\x77\xb2\xfa\xce\
-\x10\xed\xfd\xc4\x18\x13\x4a\x1f\xce\x6a\xe7\x3d\x82\xaf\x87\x58\
-\x4f\xb8\xfe\x10\xde\xb2\x96\x94\x71\x05\xf4\x12\x72\x5f\xc7\xcb\
-\x2a\xc1\xdb\x28\xdb\xf9\x37\xf9\x42\xb7\xed\x25\x09\x36\xae\x2b\
-\x1b\xe9\x5f\xcc\xb9\xbf\x93\xd5\x77\x82\xd3\x4f\x3f\xfd\x42\x25\
-\xee\xe4\x8f\x72\xf2\x5c\x57\x90\x4a\xc7\x34\x6d\x33\xfd\x0b\x7d\
-\xf1\x8f\xb3\x7a\xc3\x30\x0c\xc3\x30\x8c\xc1\xe0\x23\xbb\x38\x8a\
-\x18\xd5\xec\x48\x65\x07\x2a\x41\x03\x9c\x44\x8c\x28\x0c\xbf\xa6\
-\x46\x14\x84\x01\x1e\x86\xd4\xde\xac\x7e\x56\x43\x01\x57\x9c\x20\
-\x9c\xe4\xea\xee\x9e\xb6\x01\x57\xca\x45\xf9\x59\x95\x50\xa2\x8f\
-\x3a\x9d\x54\xde\x7b\x8f\xa1\xac\x53\x68\x4a\x9c\x35\x19\x67\x7e\
-\x0f\xea\xf4\xdb\x19\x21\x87\x9b\x09\x6a\xd1\x56\x82\xe0\x04\x2e\
-\x08\x92\xe0\xe8\xb5\x49\x28\x65\x5b\xe9\xdb\x58\xe5\x31\xe4\xe5\
-\x71\x02\x6f\x04\xa3\x76\xef\xde\xdd\xe3\xa5\xbe\xf3\x82\x01\x8f\
-\x23\x31\xa8\x6d\x10\x65\x90\x99\x70\x54\x26\x7a\x3d\xe4\xea\xd5\
-\xab\xff\x78\xe9\xd2\xa5\x1f\x0e\xd9\x38\x23\xf8\xfc\x5f\x36\x6d\
-\xda\xf4\x03\xf9\xd3\x8c\x82\xeb\x27\xf5\x0d\x9d\xaa\x43\x57\x9e\
-\xa2\x68\x3a\x1f\xeb\x28\xe5\x61\xe0\xd5\x8c\xe1\x94\xbd\x9e\x9d\
-\xf8\x3a\x21\xa7\xf1\x6d\xaa\x13\x78\x0f\x6d\x45\x56\x69\xfb\x4c\
-\x5c\x7b\xc7\xdc\x17\x3f\x4b\x59\xc5\xd9\x54\x12\xb9\xa9\xac\x42\
-\x94\xcd\xaa\xc7\x8e\x55\xab\x56\xad\x47\x17\xd3\x56\x25\x63\x08\
-\xf2\x96\xdf\xb2\x6b\x3b\xaf\x62\xed\xfa\xe1\xac\x7e\x22\x88\xb6\
-\x5f\x0f\xbf\xa5\x1b\x24\xbf\x4a\x36\xb7\x91\x5f\xc9\x4f\x60\x6c\
-\x01\x89\xd3\x4e\x3b\xed\x10\x6d\x63\xc7\xf0\x38\x12\x4a\x8f\x3c\
-\xf2\xc8\xb2\xac\x7a\xe2\x58\xb0\x60\xc1\x93\x4a\xde\x95\x6b\xb7\
-\x12\x90\x6d\x03\x98\x50\x94\x9f\xf6\x1b\x32\x2f\x64\xac\x58\xb1\
-\xe2\x26\x92\x06\x24\x26\x58\x77\xd1\x15\xf0\x93\x00\x2b\x41\x61\
-\x64\x98\x60\x20\x76\x21\x44\xc2\x82\x4d\x37\x10\x01\x63\x78\xce\
-\xb5\x40\x10\xff\xcf\xef\x51\xfe\xbd\x59\xfd\xac\xc4\xd6\xad\x5b\
-\x97\x90\xbc\x66\xf3\x4a\x99\x88\xc1\xc6\x68\x6b\xf7\x52\x8e\x79\
-\x11\xeb\xff\xc4\xaf\xaf\x8d\xf1\x3a\x0a\xfb\x9d\x71\x2b\xaf\x09\
-\xa5\x1f\x4d\x83\xe2\xcc\x67\xca\x1e\x3a\x74\xe8\xd5\x59\xed\x11\
-\x04\x9f\xb6\x90\xe8\x87\x74\x3a\x49\x6b\x09\x36\x24\x49\x38\x74\
-\x5b\x93\xf9\xc6\x6f\xc1\xd7\x79\x71\x3a\x69\x3a\x28\xb9\x44\xb2\
-\x07\xdd\x8b\xbc\xc1\x3f\xc6\x01\xb9\xd3\x98\x0d\x1a\xb7\xe9\x88\
-\x3a\xa8\x8b\xba\x49\x90\x30\x2f\xf3\xf5\x63\x47\xd8\x94\x4b\xa4\
-\x8f\xd9\xb0\xa0\xeb\x17\x25\x1f\xf4\xb1\x8d\x3e\xce\x76\x0f\x7d\
-\xe5\x5a\x53\x84\xde\xbb\x97\xb9\x83\x4c\x57\xaf\xbc\xa3\xcd\x4d\
-\xe6\x0e\x44\x99\x28\xdb\xf9\x77\xaa\xe6\x0a\x4e\x38\xe1\x84\x6f\
-\xc8\xe7\x24\xd1\x5d\x8d\x2b\x20\x0b\x8c\x71\x1d\x2f\xab\x94\xf2\
-\xd0\x59\x32\x54\x08\xf9\xfd\x0b\x92\x60\xf2\x93\x75\x65\xe3\xb0\
-\x09\xc6\x98\xcb\xf7\x64\xd5\x9d\xe1\xd4\x53\x4f\xed\x7d\xb3\x93\
-\x24\x18\x6d\xc6\xb7\x67\xe3\x07\x6d\x2e\x13\x77\x2d\xda\xfc\xc9\
-\xac\xda\x30\x0c\xc3\x30\x0c\xa3\x19\x48\x36\x90\x50\x61\x97\x2f\
-\x8e\xb5\x76\x1d\xe2\x7c\x60\x44\x61\xf8\x35\x35\xa2\x20\xca\xc6\
-\x33\x73\xc2\x61\x54\xc0\x55\xbb\x7b\x08\x62\x96\xbb\x7b\xda\x04\
-\xd9\x28\x83\x81\x9c\x55\xcf\x1a\xe8\x74\x12\xc1\x00\x02\x6f\xba\
-\x86\x89\x9d\xc5\x18\xf7\x32\x94\x69\xfb\xa0\x7e\x66\x1f\x3b\x1f\
-\xdb\x35\x6b\xd6\x1c\xe0\x1a\x23\x02\xcb\x0a\xf6\x68\xe7\x60\xdb\
-\x84\x52\x17\xf2\xb8\x7c\xf9\xf2\x83\x65\xd0\x58\xd7\x2c\x0d\x93\
-\x50\xa2\x1f\x8f\x3e\xfa\xe8\x9a\xac\x7a\x22\x08\x99\x7f\xe4\xd8\
-\x63\x8f\x9d\xe2\x23\xec\x24\x94\xd1\x01\xc8\x48\x38\x80\x4f\x47\
-\xbf\x6e\x0d\xfe\xef\x0a\xde\xff\x51\x38\x28\x3f\x9e\x8f\x4c\x04\
-\xb4\x85\xef\xfd\x54\xbf\xa1\xc3\xb8\xeb\x2a\xa2\x26\xe3\xde\x8f\
-\x42\x16\x5a\x7d\xe7\x8b\xb9\x42\x90\x81\xc0\x08\x81\x6a\x74\x22\
-\xf2\x27\x67\x78\xba\x76\x68\x6c\x71\xe8\x78\xe6\xde\x7b\xef\x9d\
-\xf8\xb5\x77\xcc\xfd\x92\x9f\xf4\x65\x94\x6f\x12\x45\xbf\x3b\xdb\
-\x28\x10\xfa\xe9\x6e\xed\x0e\x2d\xe7\x95\x92\x31\x43\xe8\xe2\x4f\
-\x67\xd5\x13\x43\xcc\xab\xcf\xc1\xef\x6a\x70\x57\xf2\xdb\x86\xdf\
-\x94\x09\x7e\x1f\xce\xaa\xc7\x82\x98\xdb\xfb\xab\x09\xa5\x61\xf8\
-\x8b\x4e\xa5\xec\xc3\x0f\x3f\xfc\x91\xac\x7a\xa2\x58\xb7\x6e\xdd\
-\xef\x71\x3d\xa2\x02\x29\x9c\xac\x56\x80\x9b\x04\x99\xd6\x6e\xe6\
-\x69\x53\x5e\xe7\x3a\xb1\x32\x5f\x31\xef\x10\x3a\xff\x5c\xec\x40\
-\x12\x2c\xba\x06\x8e\x60\x1a\xfc\x24\x69\x44\x02\x1a\x19\x46\x97\
-\x61\x33\x40\x6c\x44\x81\x08\x8a\x93\xc0\x83\x48\x2c\xf0\x37\xca\
-\x1d\x38\x70\xa0\xf3\x0f\x92\x8f\x82\x90\xa3\xb3\x4a\xdd\x58\x06\
-\xe2\xda\xac\xe3\x90\x64\x28\xe4\x6e\xe2\xd7\xd7\x46\xfb\x8f\x62\
-\x5e\xeb\x86\x01\xe6\x01\xf6\x48\x9b\x35\x93\xbe\xb2\x56\xd5\x25\
-\x94\xf0\x0d\x98\x67\xf0\x4a\xa7\x4f\xca\xd3\x80\xbc\xa7\x49\xe0\
-\x92\xdf\xa0\xac\xd6\x08\xc0\xef\x90\xb7\x45\xcc\x97\xba\xe4\x12\
-\x32\x25\xbe\xd5\xf1\x74\x10\xf1\x1c\xf5\x50\x2f\x72\x1d\xfa\xbe\
-\x93\x8d\x2d\x21\x7f\x57\x69\x33\x45\xa9\x8f\x49\xce\xa0\x3b\x86\
-\x08\x6c\x7f\x25\xab\xee\x14\x67\x9c\x71\xc6\x5e\xe4\x9a\x36\x13\
-\x8c\x67\xbd\x6e\x9b\x50\xe2\x77\xca\xc5\x3c\x7b\x30\xab\x9d\xd7\
-\x08\xfb\xe2\x7b\xf1\x29\xb8\x3e\x95\xeb\x0f\xf1\xe1\x38\xe9\x5a\
-\x17\x57\xa8\xe3\x67\x95\x28\x17\xe5\xd7\x66\xf5\x9d\x20\xfc\x9d\
-\x7f\xa6\x8d\x97\xd5\x2b\x1b\xd9\x64\xc0\xdc\x44\x86\x19\xeb\xa6\
-\xf2\x10\x6d\xde\x91\xd5\x77\x06\xec\x20\x36\x82\x90\x04\xa3\xcd\
-\x6c\x82\xc3\x57\x66\xcd\x46\x2f\xc3\x67\xf4\x7f\x5d\x3b\xab\x94\
-\x6d\xbe\x2c\xab\x36\x0c\xc3\x30\x0c\xc3\x18\x0c\x12\x2a\x5c\xf9\
-\x46\x42\x05\x47\x91\x8f\xec\x72\x45\x0f\x3b\x52\xd9\x55\x56\xee\
-\xc6\x1f\x64\x44\x89\x30\x5e\xe2\x99\x39\x91\x50\xe2\xba\x3f\x02\
-\x80\x38\x41\x04\x15\xf4\x0d\x86\x32\xa8\xd0\x26\x00\x88\xc3\x94\
-\x55\xcf\x0a\x84\x91\xfc\x56\x82\xf4\xfd\x02\x6f\xe5\xce\xd2\x41\
-\x63\xcc\x6f\xc1\x8b\x89\x8c\x2b\xed\x95\x4c\xea\x5b\x2a\x0a\x5e\
-\x28\x01\xd6\x44\x26\xf9\x9d\x72\xd1\xc7\xb1\x9e\x00\x0a\x07\xf4\
-\x16\x64\x66\x5c\x09\xa5\x70\x5c\xcf\xcd\xaa\x3b\xc7\xfa\xf5\xeb\
-\xdf\x48\x32\x89\x64\x83\x3e\xb2\x8d\x43\x42\xc2\x11\x9e\x8b\x08\
-\x2e\xea\x9a\x9b\x98\x27\x7f\x15\xfd\xbd\x7f\xf5\xea\xd5\x1f\x0c\
-\x99\x7a\xdf\xc6\x8d\x1b\x9f\x17\x74\x1a\x07\xe4\x1c\x11\xc0\x92\
-\x43\xc7\xb5\x4a\x6d\xae\xef\xa9\xa3\x94\x83\xd6\xdf\x36\x0b\x9d\
-\x70\x0f\x49\x25\x76\x57\x2a\x31\xd0\xf4\x64\x4f\xbe\xb3\x37\xb7\
-\x70\x46\x63\xae\x4d\xfc\xda\x3b\xf1\x93\x53\x07\xe2\x27\xf3\x08\
-\x67\xb3\x2d\x3f\x29\xd3\xa5\x5e\x0f\x67\xfe\x6b\xcc\x7b\x9d\x90\
-\x28\xaf\x9f\x21\xb8\x43\x5b\x9b\xea\xe2\xe4\xfb\x35\x59\xf5\x44\
-\xf0\xfe\xf7\xbf\xff\x25\xe3\x94\x5f\xca\x44\xf9\xb1\x06\xe4\x63\
-\x0d\xd8\x8b\xde\x1a\x57\x42\x29\xec\x83\xcf\x64\xd5\x13\x45\xe8\
-\xa4\xfb\xd1\x5d\x0a\x58\xb1\x46\x28\x90\x52\x06\xb8\x91\x97\xba\
-\xf6\x57\x89\x3e\xd3\xa7\x78\xe6\xb7\xf2\x15\xf3\x0e\xb1\x2e\x2c\
-\xd2\xa6\x13\xec\x40\x7d\x8b\x07\xd9\x45\x3e\x14\xec\x66\x7d\x83\
-\xb7\x10\xba\xad\x8e\xf8\x8d\xb2\xf1\xdc\xc7\xb2\xfa\x59\x09\x82\
-\xc9\xd5\xd3\x9b\xac\xe3\xc3\x9c\xde\x94\x0c\x85\xad\x31\x23\xd7\
-\xd7\xb2\x66\x6b\x5e\xeb\x5b\x25\xf4\x03\xfb\x8e\x7e\xd0\xb6\xba\
-\x76\x8b\x98\x2b\x8c\x5d\x8c\xd9\xa2\xac\xb2\x87\xa8\x6f\x3d\x76\
-\x18\x3a\x8d\x64\xa3\x4e\x27\xe9\xdb\x22\xd8\x90\xc8\x06\xcf\x0e\
-\x7a\x07\x3c\x9a\x94\x0d\x39\x17\x71\xe0\xc0\x81\x25\x8c\x19\xeb\
-\x1d\xbe\x17\x32\x08\x5f\x35\x7e\xf0\xaf\xa9\x3c\x96\xa4\xb1\x25\
-\xd1\x4b\x02\x2b\x5f\x37\x56\xc4\xba\xf7\x48\xb9\x99\xa2\xba\x79\
-\x05\x9d\xd0\x72\x7d\x99\xc8\x69\x9f\xb0\x37\x2e\xd1\x26\x16\x92\
-\xb1\x24\x95\xcb\x64\xac\xf8\x5e\xd7\x4e\x11\xbf\x53\x2e\x74\xe3\
-\x8c\xac\x87\xb3\x0d\xa1\x2f\xfe\x40\xa7\xd5\x14\x57\xe0\xb4\xab\
-\xe2\x0a\xe8\x8b\x26\x3a\x09\x82\xb7\x29\xbf\x6f\xcf\xea\x3b\x41\
-\xb4\xf3\xf7\x68\x33\x7e\x0f\x6d\xd6\x95\xcb\xb4\x99\xd3\xb7\xf2\
-\x93\x69\x4f\x53\x79\x88\x3e\xbe\x2b\xab\xef\x04\x21\xb3\xaf\xd6\
-\x86\x60\x6d\x04\xd1\x66\x51\x4e\x0a\x33\xdf\x9b\xe8\x65\x48\x6d\
-\x8e\xf2\xa7\x64\xf5\x86\x61\x18\x86\x61\x18\x83\x11\x0e\xf5\x99\
-\x18\x51\xd5\x20\x13\xd7\x14\x10\x44\x90\x33\x3a\xc8\x80\x2a\x09\
-\xe3\x2f\xab\x9f\xf5\x50\x00\x10\x27\x88\x63\xf9\x0a\x4a\xe9\xda\
-\x13\x19\x63\x4d\xfa\x4f\x99\x28\x3f\xab\x9c\x65\x25\x0c\x09\xbc\
-\x11\x10\xa8\x26\x67\xda\x38\x7a\xd9\xbf\xc6\xa7\x3b\x86\x85\x64\
-\x92\xe0\x16\x86\xbd\x4e\xcd\x61\x24\x13\x08\xd7\x4e\xb1\x26\xe3\
-\xc2\xef\x5d\xc8\x63\xb4\xf1\x2a\x25\x94\x14\x88\x52\x60\x76\xc8\
-\x84\xd2\xc4\xee\x5e\x5f\xb6\x6c\xd9\xb5\x4a\x26\x11\x00\xc0\xe9\
-\x43\xfe\x71\x48\xe0\x37\xa7\xc2\xf8\x97\xff\x47\x66\xf8\x0d\x87\
-\x9b\xc0\x5b\x35\xd1\x44\x02\x20\xfe\xff\xc9\xd3\x4f\x3f\xfd\xfa\
-\xac\x7e\x68\x90\xfc\xa4\x4d\x8c\x3b\xef\x1e\xe5\x1b\x3a\x55\x8a\
-\xf2\x43\x39\x49\x3b\x77\xee\x7c\x33\x01\x34\x4e\x2e\x12\x40\xe3\
-\xfa\x35\x1c\xb5\xa6\x89\x76\x7e\x43\x16\xd0\xa3\xcc\xb5\xae\x76\
-\x07\xd7\x01\x7e\xe2\x6c\xd6\xf1\x93\x3e\xb4\xe1\x27\xbf\x43\xd1\
-\x8f\x4e\xae\x66\x0c\x3e\xbf\x98\xb1\x47\xa6\x68\xab\xf4\x14\x73\
-\x1e\x5d\x2c\xc7\x98\xb9\x32\xa8\xad\x10\x7d\x0a\xbe\x2f\xc9\xea\
-\x27\x82\x68\xf7\x7f\x19\x97\xfc\x8a\xdf\xa1\x4b\xfe\x38\xab\x1f\
-\x0b\x56\xad\x5a\x75\x45\x75\xad\x1f\xf6\xca\x3b\xc6\x82\x79\xf0\
-\xd0\x43\x0f\x4d\xf4\x5a\xc1\xe8\xc3\x29\xe8\x2f\x7d\x37\x40\xd7\
-\x2b\x95\xd7\xdd\xb5\x09\xa4\x40\xf4\x99\xfe\xc4\x33\xff\x22\x5f\
-\x33\xef\x10\x32\xf1\xbb\xf0\x13\xfd\x5f\x7e\xbb\xae\x0c\x4c\x21\
-\x1f\xf0\xb4\x1f\x49\x6e\x93\x97\x53\x3c\x77\xf8\xf0\xe1\xff\x98\
-\xaf\x98\x55\xd8\xb1\x63\xc7\x77\x85\x0c\x7d\x83\x3e\x33\x1f\x74\
-\xc5\xa6\x4e\xb8\xb5\xb5\x7d\xd5\xef\xae\x74\xe4\x20\xc4\xbc\x38\
-\x40\x32\x50\x73\xa1\x4c\xf6\x68\xdc\xea\xda\x2d\xd2\x98\x55\x13\
-\x4a\xe8\x31\xf8\x43\xdd\x9c\xe2\xd7\x89\x71\x5d\x05\xa5\xc0\x3b\
-\xcf\x37\x78\x87\x93\x49\x0d\x10\x76\xee\x12\x64\x10\xde\xa2\x63\
-\x65\x53\xc2\x63\xcd\xb1\x3a\xfe\xf6\x23\xca\xf3\x3c\x32\xdd\x55\
-\x42\x29\x6c\x8d\xbf\xa9\xfa\x19\x6c\xa6\xc0\x66\x97\x2f\x45\xfb\
-\xeb\xda\x57\x25\xe4\x28\x6c\xfc\xad\x59\x75\xa7\x88\xf5\xe3\x24\
-\xd6\xc4\xf2\x8a\x65\x6c\x79\x78\x0f\xbf\xc4\xf3\xba\x76\x8a\xf8\
-\x9d\x36\xd3\xc7\x98\x6f\x3f\x92\x55\xcf\x5b\x84\x3f\x70\x21\x3e\
-\x1c\x3e\x03\xeb\x33\xb6\x06\x37\x7f\x94\x71\x85\x26\x7c\x85\x28\
-\x43\xd9\x90\xdf\x7f\x99\xd5\x77\x82\x90\xdb\xad\xb2\x29\xaa\xeb\
-\x01\x7a\x94\x39\xc8\xf8\x36\x6d\x33\xf2\x10\xf4\xf2\xac\xbe\x13\
-\xac\x59\xb3\x66\xa1\x12\x77\xd2\xfd\x5a\xb7\x49\x4c\xa3\x3b\xe0\
-\xdd\x20\xbd\x0c\x89\xcf\xf1\xcc\x6b\xb3\x7a\xc3\x30\x0c\xc3\x30\
-\x8c\xc1\x58\xb2\x64\xc9\x61\x8c\x28\x82\xc6\xe5\x91\x7f\xed\xd0\
-\xc2\x88\x6a\x6a\xf8\x89\x70\x5c\xb2\xfa\x59\x0d\x05\x5c\x09\x90\
-\xb3\xcb\xb9\xdc\xdd\x43\x50\x8a\x1d\xe5\x18\x90\x18\x63\x4d\xfa\
-\x9f\x0e\xc5\xac\x4b\x28\x55\x0d\x4e\x05\xde\xca\x40\x11\x63\x5c\
-\xd7\x27\x91\x0c\xe4\xac\xb6\x53\x70\x6a\xac\x1a\x2c\x2c\x83\xf9\
-\x38\x23\x32\xec\x07\x8d\x0b\xbf\xd3\xb7\xac\x7a\x6c\x08\x79\x39\
-\x0f\x67\x49\x1f\x41\x95\x13\x8a\x11\xdf\x26\xa1\x04\x4f\x69\x5f\
-\xf4\xe9\x89\xac\xba\x53\x04\x3f\x5f\xc5\x35\x77\x4a\x26\xe1\x48\
-\x13\xfc\x66\xee\x13\x28\xe2\x3b\x24\x38\x52\xec\x28\xe4\xbf\xf9\
-\x1b\x89\x56\x76\x9c\x52\x46\x81\x25\x9e\x51\xb2\x89\x3a\xe2\xb7\
-\x91\xe5\x5e\x89\x44\x39\xa1\x72\xe8\xf4\x0d\x9d\x72\xdc\xeb\x78\
-\x59\x47\x29\x23\x43\xef\xb8\xdb\xb1\x63\xc7\x5b\xe8\x2f\x01\x12\
-\xae\xec\x50\x82\x03\xdd\xd0\x44\x37\xf2\x1b\x65\x28\xcb\x33\xf1\
-\xec\xc4\xae\xbd\x2b\xf9\xa9\x20\x71\x1d\x3f\x9b\xe8\x37\x7e\xef\
-\x72\xfe\xaf\x5b\xb7\xee\x77\x68\x2b\x01\x29\xf8\x8d\xfc\x91\x8c\
-\x19\xf6\x5b\x76\xf0\xfc\xb1\xc7\x1e\x7b\x73\x56\x3f\x11\xc4\x7c\
-\xd8\xd8\x4f\x7e\x09\x48\xb4\x91\x5f\xf1\x3b\xca\xff\x74\x56\x3f\
-\x16\xac\x5a\xb5\x6a\x37\xed\x63\x1e\x8f\x92\x50\xa2\x4c\xea\x2d\
-\x82\x85\xef\xc9\xea\x3b\xc7\x05\x17\x5c\xf0\x2d\xa1\xbb\x3e\xcf\
-\xba\x4d\x52\x3b\x64\xfc\xc8\x6e\x78\x76\x96\x2b\xa9\x4f\xbb\xe8\
-\x4b\x53\x79\xa1\x5c\x94\x7f\x26\x5f\x33\x2f\xb1\x6d\xdb\xb6\x9f\
-\xd2\x09\xa5\x32\x29\x51\x26\x9f\xa5\xef\xa6\xa3\x82\x9f\xbd\x79\
-\x1b\xb2\xbf\x2b\x5f\x31\xab\x10\x73\x61\x71\x79\xdd\xb1\x82\x9e\
-\xc8\xd0\x28\x09\xa5\xe0\xd3\xab\xf2\x15\x13\x45\xac\xc5\x07\x95\
-\xc8\xc6\x8e\x6d\x9b\x5c\xcd\xb6\xb3\x4e\xdd\x98\x55\xbe\x28\xec\
-\xae\x33\xd0\x63\x5a\xff\xb1\x05\xe0\x13\xf6\x18\x3b\xf7\xb9\xbe\
-\x0a\xd9\x68\xb2\xc1\x87\xdf\xb2\xda\x39\x01\xfc\x03\x28\xff\x77\
-\xe2\x08\x39\xbc\x99\x4d\x5f\xac\x1d\xd8\x0e\xe8\xe7\x72\x0e\xd6\
-\xf1\xb8\x1f\x49\x36\xa9\xa3\x9a\x30\x1c\x07\x62\x3d\xf9\x25\xd6\
-\xbe\x72\x33\x85\x4e\x38\x96\x7e\x46\x13\x7d\xac\xb6\xc6\xdc\xfb\
-\x83\xac\xbe\x53\xc4\xdc\xff\x37\x5a\xb3\x87\x4d\x7c\xa8\xcd\xcc\
-\x83\x18\xab\x77\x67\xd5\xf3\x16\xb1\x36\x3f\xc6\x66\xb3\xf2\x2a\
-\xc1\x61\x4e\x7e\x41\x94\x09\x59\xf8\x42\x56\xdd\x19\x96\x2c\x59\
-\x72\x1f\x6d\x4e\x7f\xe6\xc8\xcd\x13\x5c\x7f\x88\x2c\x34\xdd\x78\
-\x09\x65\x9b\xff\x26\xab\xee\x0c\xd1\xd6\xeb\xf0\x95\x95\x10\x2d\
-\x6f\x1f\x69\x93\x10\x85\x28\x93\x65\xff\x5e\x56\x6f\x18\x86\x61\
-\x18\x86\x31\x18\x04\x66\x30\xa2\x08\x0e\xef\xd8\xb1\xa3\x77\x42\
-\xa7\xbc\x5a\x0c\x23\xaa\xa9\x41\x02\x51\x2e\x1c\x87\x39\xb1\x0b\
-\x91\x64\x0b\x81\x75\x02\x0a\x9c\xc8\xd0\xee\x1e\x1c\x65\x02\x0a\
-\x6d\x77\x94\x53\x2e\x0c\xe5\x19\x09\x26\xf4\x03\x41\x65\x82\x26\
-\xba\xd2\x41\x3b\xf0\x14\x44\x94\xc1\x39\xc8\xd1\xcb\xfe\xb5\xbe\
-\x32\xac\x2d\xa2\x9d\x3b\xcb\x2b\xfa\x38\x1d\x52\x5e\x29\x37\x4c\
-\xc2\x26\xca\x8e\xfd\xbb\x2f\xeb\xd7\xaf\x5f\xa5\xc0\x2c\x01\x17\
-\x9c\x50\x78\x4a\xfb\xda\x04\x66\x69\x1f\xfc\x67\x1c\x82\x7e\x20\
-\xab\xef\x0c\x8b\x17\x2f\xbe\x19\xfe\x2a\x90\x86\xf3\xcf\xbc\xa7\
-\x0f\xcc\x7d\x82\x00\xcc\x01\x82\x89\xfc\x37\xbb\x4c\xb9\xee\x0d\
-\x87\x10\x67\x85\x72\x65\xa2\x89\xf1\xc1\x91\xc9\xea\x47\x02\x89\
-\x44\xda\x25\x27\x94\xeb\x47\xca\xab\x04\xdb\xf0\x55\x14\x65\x47\
-\xbe\xbe\x61\xe3\xc6\x8d\xf7\xd1\x4f\x82\xd6\xec\xca\x2e\x9d\xe2\
-\x41\xed\xe1\x37\xc6\x18\x3d\x92\xc1\xd5\x89\x5d\x7b\xa7\xc4\x2c\
-\xfc\xd4\xdc\x87\x9f\xda\x7d\x5b\xb6\x7f\x10\x4f\xf9\x1d\x39\xcd\
-\xaa\xc7\x8e\x98\xeb\xe7\x94\xbb\x43\x09\xec\x0c\x7b\x5a\x80\x32\
-\x94\x7d\xf0\xc1\x07\xff\x69\x56\x3f\x11\x2c\x5d\xba\xf4\xce\x52\
-\x7e\x4b\xbd\xd5\x56\x7e\xbb\xe2\x77\xcc\xf7\x6d\x65\xc2\x8b\xb5\
-\x80\xe0\x19\x7a\xab\x2d\x8f\x91\x6b\xfa\x14\x7c\x3e\x98\xd5\x77\
-\x8e\xe0\xf1\x55\xe8\x2f\x82\x97\xc8\x0a\xc9\x0f\x05\x2f\xab\xc9\
-\x5e\xda\xd7\xa4\x2f\x50\xae\x13\x57\xe5\x6b\xe6\x2d\x42\x36\xbe\
-\x80\x2d\x84\x8e\xd7\x75\x3f\x04\x84\xd1\x5d\xc8\x06\x7c\xaa\xe3\
-\x5f\x95\x24\xbf\xc8\x07\xba\xe6\xce\x3b\xef\xfc\xd1\x7c\xc5\xac\
-\x40\xac\x59\x3f\x14\xb6\xef\x5f\x61\x67\x30\x1f\xca\x93\xc6\xb2\
-\x33\xda\xcc\x57\x28\xfb\x3c\x91\x8d\x21\x75\x88\xb9\xb0\x1d\x3b\
-\x5e\x57\x6d\xea\xdb\x1f\xcc\x07\x25\x22\xea\xda\x2d\xd2\x3a\x15\
-\xe5\x8f\x24\x94\x42\x7f\xad\x64\x1d\x66\x43\x05\x84\x8d\xac\xd3\
-\x49\x0a\xb4\xc2\xa7\x41\x76\x32\x7f\x0f\x9a\x75\x57\x29\x29\x69\
-\x84\x2f\xb0\x68\xd1\xa2\xc3\x10\xa7\x1f\xd1\x31\x10\x37\x18\xc4\
-\x7a\x74\x74\x16\x9f\x28\xf6\xee\xdd\xfb\xab\xe8\x34\xe4\x91\x39\
-\xc8\x38\x96\xbc\xae\xe3\x73\x3f\x4a\xd9\xec\xe9\xc5\x18\xb3\x5f\
-\xce\x57\x8c\x0d\x21\x7b\xc7\x49\x27\x6b\xf3\x8a\xae\x44\x64\x2e\
-\xb5\xd1\x1f\x45\x5b\x3b\x3d\xdd\x51\x22\xfc\xa4\x27\x58\x4b\xaa\
-\xed\x6e\x7a\xba\x4f\x6d\xce\x84\xd2\x45\x59\xed\x44\x11\x73\x7f\
-\x65\xe8\xee\x53\xa3\x1f\x6f\x0c\x7d\xf6\x9d\xf9\xe7\x19\x01\x71\
-\x05\x4e\x9b\xf7\x8b\x2b\xb4\x59\x9f\x29\x13\x63\x30\xf2\x0d\x08\
-\x83\x10\xf3\xfd\xeb\xb4\x99\x4d\x72\xb4\x59\x57\x2e\xa3\x43\x59\
-\xc3\x9a\xe8\x50\x51\xb6\xf9\xf6\xac\xba\x33\xc4\x9c\xfb\x3c\x6b\
-\x18\x6d\x2e\x7d\x14\x74\xf3\x30\x7c\x8e\xfe\x7d\x3c\xab\x36\x0c\
-\xc3\x30\x0c\xc3\x18\x0c\x1c\x29\x12\x2a\xec\xf4\x25\xb0\x4c\x90\
-\x98\x5d\xf8\xec\x2a\xd3\xd5\x62\x6d\x9d\x17\x8c\x92\x78\x66\x4e\
-\x24\x94\xb4\x83\x9f\xdd\x3d\xe5\x8e\xed\xea\x75\x7f\x6d\x9c\xa0\
-\xac\x7a\xd6\x80\x13\x68\x9c\x44\xd1\x4e\x6e\x8c\xe4\xba\xab\x4a\
-\x06\x19\x9c\xf0\x60\x12\xe3\xaa\x24\x1f\x27\x15\xf4\x6d\x0c\x02\
-\x18\x38\x23\x18\xf6\xc3\x5c\x9d\xd1\x45\xbb\xb7\x6e\xdd\xfa\x5a\
-\x9c\xe7\x51\x4f\xd2\x48\x6e\x18\x87\x78\xb6\xd3\xef\x77\x84\xa3\
-\xf9\xdb\x9c\x4e\x42\xe6\x39\x95\x87\xb3\x87\x4c\x10\x48\x23\x20\
-\xcb\xc9\x44\x82\x50\x04\x11\x21\xf4\x00\xff\x0f\xef\xf9\x8d\xb9\
-\x41\x3f\x49\x36\xb1\x03\x9a\x71\xc1\x81\x89\x7f\x57\xe4\x2b\x46\
-\x02\x4e\x28\xb2\xba\x6a\xd5\xaa\x9e\x43\x47\x22\x6b\x94\x6f\xa2\
-\x04\x8d\x25\x80\xb5\x79\xf3\xe6\xad\x0a\x92\x90\x38\xd4\x38\x37\
-\x0d\x92\xd0\x16\xca\x31\xc6\x04\x29\xf6\x4f\xe8\xda\x3b\x6d\x16\
-\x80\x9f\x8c\x33\xfc\x94\x53\xcf\x3c\x6a\xb3\x59\xa0\xeb\xf9\x1f\
-\xe3\xfe\x10\x6d\x45\x17\xe3\x18\xeb\x5b\x76\x0a\x5a\xe2\x18\x37\
-\x6d\x2b\x65\xa2\xad\x4f\x65\xd5\x13\x43\xe8\xad\x67\xc7\x25\xbf\
-\xf0\x3b\xfa\x71\x77\x56\x3d\x36\x84\x2c\xff\x4e\x19\xf4\xab\xea\
-\x2d\xe4\xb4\x29\x8f\x69\x23\x7d\x62\xf7\x79\xd8\x0b\xbf\x9a\xaf\
-\xe8\x0c\xb1\x86\x9d\xf6\x9e\xf7\xbc\xa7\x77\xba\x12\x9b\x45\x72\
-\x2d\x59\x51\xf2\x91\x79\x89\xfe\x4d\x1e\xd6\xb6\xbf\x4a\x94\x8d\
-\xb1\x99\x91\xab\xca\x66\x13\x62\x4d\xf8\x28\xb6\xa0\x4e\x6b\xb3\
-\x06\x70\x0a\xa5\xcd\x09\x03\x48\xf2\xc1\xbc\x45\xd7\xc4\x1c\xb8\
-\x38\x5f\x31\x2b\xb0\x74\xe9\xd2\x1b\xcb\xeb\x8e\x15\x40\x2c\xbf\
-\xf9\xd2\x46\xe7\x40\xf4\x37\xe6\xcf\xba\x7c\xc5\xc4\x11\x73\xe1\
-\x28\xfa\xc2\x9c\x60\x5d\xae\xd3\x3d\xd3\xf5\x25\xdb\x8f\xdd\x7f\
-\x43\x56\xf9\x22\xd6\x7c\x82\xc1\xe8\x0a\x08\x1e\x11\x70\x97\x5c\
-\x10\xb4\x44\x2e\xa6\xab\x5b\xb2\x90\x55\xce\x08\xf0\x75\x20\xec\
-\x4b\x36\x5a\x40\x24\x8c\x58\x23\xd1\x27\xd8\x44\x10\x9b\x1a\x58\
-\x87\xd0\xe3\x04\x97\x53\x3e\x26\x96\x30\xaf\xe2\xea\xab\xaf\xbe\
-\x1d\x99\xc4\x27\xe1\xb4\x19\x73\x09\xb9\x94\x9e\x6e\x2a\x9b\x94\
-\x63\x8c\x90\x83\x2e\x12\x4a\xa7\x9f\x7e\xfa\xee\x71\x9e\x94\x88\
-\xfe\xfd\x75\x56\x3d\x11\x84\x6d\x7c\x31\x7a\x4f\x89\x74\xe4\x9b\
-\x93\x61\x4d\xf5\x5e\xc9\xdf\x98\x13\x7f\x13\xbe\xca\x4b\xb2\xea\
-\x89\x80\x13\x62\xd8\xf6\x4a\x82\x22\xd3\xa7\x9c\x72\xca\xb3\xb1\
-\xd6\x3f\x1c\xeb\xe4\x35\xd1\xb7\xd5\x31\x2e\x6f\x3d\xf7\xdc\x73\
-\xff\x7e\x3e\xd2\x19\x62\x9e\xbd\x4c\x3e\x9c\xe2\x0a\x5a\x4b\xca\
-\x2b\xcb\xe1\xd9\x20\x79\xe0\x77\x78\x1f\x63\xb0\x3c\xab\xef\x04\
-\xb4\x19\x5d\x20\xbf\x53\xb1\x10\xfc\x9f\xea\x6d\x25\x75\xed\xac\
-\x52\xb6\x79\x63\x56\xdf\x09\x48\x1a\x2a\x71\x47\x9b\xd9\xe0\xa7\
-\x8d\x04\xe8\x7d\x64\x17\x3e\xd3\x96\xa6\x7c\x8e\xf2\x33\x92\x0c\
-\x35\x0c\xc3\x30\x0c\x63\x8e\x02\xe7\x4a\xc1\x65\x02\x4c\xfa\x70\
-\xa6\xae\x39\x51\x60\x66\x90\x31\x22\x92\x51\xf2\xd8\x2c\x3b\xa5\
-\xd3\x0f\x24\x5b\xd8\x51\x8e\x13\xae\x63\xf9\xe5\x75\x7f\x4d\x93\
-\x2d\x10\x65\xc2\x09\x1a\xfb\x49\x98\x51\xb1\x74\xe9\xd2\x43\x38\
-\xc5\x18\x9c\xd5\x9d\xab\x6d\x0c\xce\x34\x90\x3b\xed\x1f\xa7\x93\
-\xca\x6f\x63\x20\x93\xba\x7a\x87\x04\x07\x0e\x5e\xd3\x1d\x83\x22\
-\xc6\x2f\x9c\xd9\x4e\x02\x85\xe1\x3c\xff\x95\xe6\x4d\xf9\xbd\x89\
-\x61\x13\x4a\xe1\xb4\x5c\x93\x55\x8f\x1d\xe1\x7c\xfc\xab\x70\x3e\
-\xbe\x80\xb3\x49\xb0\x84\xd3\x5f\x38\xfe\x04\x89\x48\x26\x91\x68\
-\x40\xee\x91\x0b\xf8\x0c\xd1\x17\x82\x46\x38\x81\x38\x28\xfc\x4e\
-\x60\x83\x7e\xe2\x1c\x72\x3f\x3e\xf3\x25\x9e\xfd\x27\xf9\x9a\x91\
-\xa0\x40\x71\x99\xdc\x66\x87\xee\xb0\x01\xcd\xe0\xeb\x58\x12\x20\
-\x3b\x76\xec\x78\x0b\xf3\xa7\x3c\x09\x51\xbd\x4a\x68\xba\xb1\xd6\
-\x18\x33\xd7\x08\x08\x05\x3f\x27\x72\xed\x5d\x1d\x3f\x4b\xa7\xbe\
-\x49\xdb\x45\x39\xff\x3b\x4b\x28\x31\xef\xcb\xdd\xa1\xfa\x96\x5d\
-\x9b\x80\x28\xc4\xef\xb4\x35\xca\x5f\x91\x55\x4f\x04\xdb\xb7\x6f\
-\xff\x97\xfd\xe4\x17\x7e\xb7\x95\x5f\xca\x45\x7f\x77\x64\xf5\x63\
-\x43\xe8\xd3\x7f\x8c\x6e\xe5\x14\x0a\x7a\x4b\xbb\xb1\xdb\x26\x62\
-\xf8\x1d\xa2\x3c\xcf\x85\xde\xb8\x25\x5f\xd1\x09\x94\x4c\x22\x60\
-\xa6\x53\x25\x24\xf3\x59\x1f\xca\xd3\x49\x4a\x94\x2a\xe0\x5a\xd7\
-\xf6\x3a\x42\xb6\x3e\xf1\x89\x4f\xfc\x7a\xbe\x6e\xde\x22\xd6\x84\
-\xf7\xb2\xd1\x40\x1b\x39\x64\x2b\xb4\x0d\xa8\x15\xf3\xb0\xa7\x6b\
-\xd0\xe1\x21\x67\xcb\xf2\x35\x33\x8a\x58\xfb\xce\xd7\x37\x04\x99\
-\x0b\xcc\x57\x12\x68\xcc\x57\x7d\xf3\x85\xfe\x36\xd5\x39\x22\xfa\
-\x1b\x3c\x9a\x31\xdb\x97\x93\x34\xac\xeb\xc3\x9e\x8e\xa4\xfd\x94\
-\x61\x3e\x53\x5f\x3c\x7b\x1a\xeb\x3b\x01\x76\x12\x54\x24\x93\xf8\
-\x6f\x9d\xd2\x2d\x4f\x35\xf6\x93\x0b\xde\x07\x05\x1f\x3b\xdf\x8c\
-\x24\x84\x6e\x7b\x5b\xd8\x66\xbb\xc2\xce\xb9\x1f\x22\xd0\xce\x78\
-\x2b\xd0\xae\xe4\x11\xb6\x3f\xb6\x10\x3a\x9b\x40\x32\xd7\xb5\x21\
-\x0f\x24\x45\x38\x65\xca\x26\x2c\x92\xd6\xcc\x07\xbe\xa5\x98\xd5\
-\x4f\x14\x31\x8e\x77\x32\x0f\x19\x07\x4e\x16\x63\x97\x31\x3e\xc8\
-\x26\x3c\x6f\x2a\x9b\x94\x4b\xf9\xec\x24\xb1\x17\xbe\xd4\xbd\xd5\
-\x93\x12\xb4\x99\x0d\x21\x4a\x82\x35\x6d\x2f\x65\x42\xa6\x6e\xcb\
-\xaa\x27\x82\x68\xf3\xbb\x18\x67\xd6\x6d\xe9\x3d\x25\xf0\xe0\x19\
-\x7a\xa0\xae\xad\xa2\x92\xbf\xac\xf5\xa1\xef\x16\x67\xd5\x13\x41\
-\xf0\xfe\x41\xad\x8f\xc8\x38\x3e\x94\x12\xa2\xc8\x36\xc4\x7f\x23\
-\xef\x8c\x53\x8c\xd7\x53\x31\x56\x37\x47\x9f\x37\x86\xce\xff\x4f\
-\x61\x73\x7d\x57\x56\x35\x32\xaa\xa7\xd5\x46\xf5\x8f\x92\xaf\x6f\
-\xc9\xea\x3b\x41\xb4\xf3\x8f\xd4\x66\xd9\x46\xa3\xf8\x9d\x94\x8b\
-\x39\xfa\xdf\xb2\xfa\x4e\x10\xf6\xcf\x51\x8c\x35\x63\x4b\x9b\xf1\
-\x4f\x74\xaa\x98\xf5\xb6\x8c\xdf\x0c\xe2\xb5\xf8\x1c\xeb\xc4\xc4\
-\xae\x2f\x36\x0c\xc3\x30\x0c\xe3\x05\x00\x12\x4a\x38\x55\x18\x51\
-\x04\x97\xab\x77\xc8\x37\x71\x42\x4b\x92\x51\x92\xd5\xcf\x7a\xb0\
-\xbb\x07\x03\x1b\x47\x42\x41\x4c\x02\x0a\x04\x31\x09\x28\xb4\xd9\
-\xa1\x9a\x46\xef\xc4\x9c\xe6\xa6\x88\xb1\x3d\x44\xc2\x50\x41\x13\
-\x82\x6f\xda\x5d\xda\xc6\xe0\x84\x0f\x51\xb6\xd3\x84\x12\x0e\x91\
-\x76\x5c\x69\xf7\x39\x8e\xa9\x02\x23\xda\xe9\xd8\xc6\xb0\xa7\x6c\
-\xc8\x71\x27\x41\x9e\x90\x9b\x7d\xa5\x21\x0f\x5f\x71\x42\x15\xac\
-\x6f\xc2\x57\x7e\xa7\x2f\xc8\x1a\xce\x6b\xcc\xbd\x7f\x9f\xd5\x8f\
-\x15\xc1\xd3\x83\x38\x9b\x4a\xd6\xd1\x6e\x39\xcf\x38\xfe\xec\x24\
-\xc5\xd9\x83\xc7\x38\xc4\x22\xe6\x01\xed\xe2\xef\x04\x90\x94\x68\
-\x2a\x92\x4c\xef\xcf\x57\x8c\x04\x74\x11\x0e\x1d\x41\x1d\xae\x1e\
-\xa9\x26\xb7\xcb\x04\x48\x1d\x1f\xab\x94\xf3\xf1\x95\x59\xfd\xc8\
-\x08\x87\xf3\x3e\x76\x00\xa2\x23\x08\xa8\xb5\x49\x74\x68\x8c\x69\
-\x3f\xfd\x08\x1e\x76\x7e\xed\x9d\xf8\xc9\xdc\xaf\xe3\xa7\xe6\x7e\
-\x53\x7e\xd2\xc7\xae\xe6\x51\xac\x3d\x3f\x44\xb0\x0f\xc7\x58\x41\
-\x1d\x76\xb4\x12\xd4\x41\x4f\x95\xc1\xec\xa6\xf3\x29\xda\x3b\x51\
-\x5d\xbc\x66\xcd\x9a\x77\xd7\xc9\x2f\xce\xfd\x30\xf2\x9b\xfa\xf6\
-\x9d\x59\xfd\x58\x11\xb2\xf1\x38\xeb\x01\x7a\x8b\x36\xa2\xb7\xaa\
-\x6d\x6c\xc2\x67\x88\xf2\xe8\x64\xf4\x42\xe8\xae\x4e\x76\x11\x47\
-\x5b\xdf\x7e\xdc\x71\xc7\x3d\x8b\x8c\x48\x7f\xd1\x7e\x92\x1e\xcc\
-\x47\xf4\x97\x02\xdc\x6d\xe5\x5a\x04\xbf\x43\x07\x7f\x4f\xbe\x72\
-\xde\x22\xd6\xdc\x97\x86\x7c\xf4\xd6\x5e\x5d\xf9\xa3\xd3\xcc\xd2\
-\x75\x75\xfc\xab\x52\x55\x3e\xb0\x27\xb1\x2b\x43\x77\xce\xe8\x0e\
-\xe8\xe5\xcb\x97\xef\xd6\x29\x5d\xec\x0c\x92\x06\x4a\xc0\x70\xa2\
-\x42\xa7\xf5\xda\xcc\x05\x51\xf0\x66\xc6\xae\xbb\x13\xaa\xd7\xf0\
-\xb2\x01\x44\xb6\x3c\xfd\x99\xae\x2f\xa9\x37\x7b\xe3\x45\x5d\x77\
-\xde\x79\xe7\xcd\xe8\x60\xf8\x82\xdd\x88\xae\xe0\x3b\x28\xe8\x34\
-\xd6\x7f\x25\x0a\x78\xa6\x5f\xbd\xfc\x9d\x7a\x7b\x8d\x9b\x10\x48\
-\x22\x1d\x7b\xec\xb1\x53\x8c\x33\x3a\x83\xb1\x26\x88\x4e\x40\x1d\
-\xfd\x0c\x8f\x48\xbc\x21\xe7\xac\x37\xe8\x12\xec\x21\x12\xd4\xf8\
-\x41\x24\x44\x90\x7f\x36\x60\xa1\x63\x58\x8f\x42\x57\xde\x95\xd5\
-\x4f\x14\xf1\xfe\xbb\x95\x34\xc7\x37\xa9\xde\x2c\xd0\x54\xcf\x69\
-\x1c\x90\x81\xac\x7a\xac\x08\x1e\xff\x05\xf3\x09\x7e\xea\xa4\x84\
-\x7c\x29\xec\x48\x74\x07\x6d\x98\x4e\xfe\x20\xb5\x33\xe4\x6a\x5b\
-\x56\x3d\x11\xc4\xd8\xbf\x04\x79\xd0\x49\xc5\x3a\x1b\xaf\xae\xbd\
-\xa2\x92\xbf\xac\x41\xb1\x9e\x7e\x66\x6a\x6a\xea\x6f\x65\xf5\x9d\
-\x22\xda\xbd\x5e\xb2\xce\xfa\x88\x1d\x45\x52\x14\x1f\x4a\xb2\x0d\
-\xf1\xdf\x6c\x8c\x42\xe7\x91\x30\xa5\x0c\x6b\x29\x73\x82\x67\x18\
-\xbf\xf8\xf7\x99\xf8\xed\xd6\xac\x7a\x28\xc4\xfc\xba\x86\x76\xe8\
-\x2a\x51\xdd\xfc\x51\xc6\x15\xe0\x53\x1d\x1f\xab\x04\x5f\xe1\x7d\
-\x3c\x33\x96\x4d\x6b\xfd\x10\x7d\xbe\x08\x3d\x01\x4f\x74\x5b\xc9\
-\x30\xdf\xd2\x12\x51\x36\x9e\xe9\xf4\x9a\xd7\x18\xc7\x75\xb4\x99\
-\x31\x94\xce\xd7\x35\xd1\xd8\x63\x4d\x74\xbe\x48\x7c\x8e\x75\xef\
-\xe7\xb3\x7a\xc3\x30\x0c\xc3\x30\x8c\xc1\x08\xe3\xf1\x30\x8e\x16\
-\x46\x94\xae\x19\xc2\x61\x94\xd3\xd2\x26\xa1\x02\xc9\x28\xc9\xea\
-\x67\x35\x36\xd4\x5c\xf7\x57\x3d\x96\x8f\x31\x86\x93\x30\xa8\xff\
-\xfc\x9e\xce\xc4\xac\x4c\x28\x29\xc8\xc9\x75\x0e\xc3\xec\x14\xe3\
-\x77\x12\x33\x38\x56\x59\xed\xd8\x41\x10\x80\x84\x87\x0c\x64\xda\
-\x4b\xc0\x93\x31\xd1\xee\x73\x1c\xd3\x36\x32\xa9\x76\xe7\x2b\xc6\
-\x8e\x30\xe2\x57\xe2\xa0\x11\x74\xd0\xf5\x08\x3a\x8d\x00\xaf\xda\
-\xc8\x0e\xe5\x79\xee\xbe\xfb\xee\x1b\xfb\x77\x3c\x62\xfc\x6f\x51\
-\x10\x0d\x79\x57\xb2\x8e\x20\x9a\xae\x70\xd3\x89\x1b\xf8\x8b\x4c\
-\xc0\x37\x88\xff\x86\x68\x1f\xbf\xe1\xa4\x20\x37\xcc\x0f\x02\xfd\
-\xe1\x20\xfe\x4c\xbe\x66\x24\x84\x53\xbc\x53\xc1\xe2\x32\xb9\x8d\
-\x73\xd4\x64\x27\x74\x95\x28\x97\x55\x8f\x05\xa1\x23\x0e\x94\x81\
-\x47\x05\xb0\xe1\x07\xed\x6a\x32\xce\xe9\x64\xf6\x74\x6b\x38\xd7\
-\x9d\x5e\x7b\xd7\x8f\x9f\x72\xea\xc5\xcf\x41\xed\x16\x75\xa9\xd7\
-\xd9\x1d\x4a\x22\x99\xb6\x12\xf8\xd0\x8e\xd6\x72\x77\x28\x32\xd8\
-\x66\x3e\xc5\xb8\xbc\x21\xab\x9f\x08\x62\x0d\xfd\x80\xf8\xad\x80\
-\x44\xdd\x37\xa0\x9a\xca\x2f\xfc\x8e\x39\xf7\xd2\xac\x7e\xac\x08\
-\x1e\x5f\x85\xde\x62\xcd\x1b\xe6\xc4\x1d\xc4\xef\x10\x7d\x42\x2f\
-\x10\x74\x21\x00\x17\x3a\xf0\x3f\xe5\x6b\xc6\x82\x68\xe7\xbb\x8e\
-\x3d\xf6\xd8\x6f\x70\xc2\x00\xfd\x45\xe0\x4b\xfa\x8b\x6b\x95\xe0\
-\x31\x72\xa2\xf6\x37\xd5\xbb\x25\x51\x36\xf8\xfd\x68\xbe\x72\xde\
-\x23\xe4\xe3\xc1\xf2\x94\x0b\x3a\xa3\x8d\xae\x13\x49\x3e\x18\x13\
-\x92\x0f\xac\x8d\xc8\x5a\xcc\xed\xfd\x57\x5e\x79\xe5\x7f\xcc\xd7\
-\x4d\x04\xd1\xa7\xa3\xd8\x54\xa1\xc0\x2b\x1b\x89\x98\xab\xec\xa0\
-\x67\xa3\x8d\x02\xe0\x65\xc0\x7e\x88\xbe\xce\xd8\x75\x77\x42\xcc\
-\x97\x03\x4a\x68\xcb\xd6\x43\x87\xa2\x7f\x98\xdb\xd3\xf5\x87\xdf\
-\xd0\x3b\xf4\x9d\x6b\xd1\x18\x2f\x9e\x27\xa9\xc8\x9a\x87\x6f\x80\
-\x7d\xcc\xa9\x93\x6a\xf2\xb6\x5f\xbd\x59\xe7\x44\xed\x62\x6c\x7b\
-\xc6\x99\x35\x05\x9d\x8c\xcd\x43\x70\x9b\x40\x3a\xb6\x3e\xfc\x51\
-\xe2\x88\x04\x02\xf6\x1b\xb6\x26\x3c\x43\x6f\xf3\xcd\x28\x92\x0a\
-\xc8\x04\x84\x6d\xc7\xf5\xa5\xf1\xdf\x6b\xf2\x15\x13\x03\xba\x8e\
-\x76\x32\x17\xcb\xeb\x49\x59\x13\x91\xcf\xa6\xeb\x09\xe3\x40\xd9\
-\x18\xaf\xb1\x6f\x0a\x8b\xf5\xee\x07\x74\x52\xa2\xea\x4b\x0d\x7b\
-\x52\x22\xd6\x94\x13\xb2\xfa\x89\x21\xe6\xce\x61\xf4\x9e\xae\xeb\
-\x93\x9c\xb3\xbe\x0d\xd2\x05\xea\x1b\xe5\x72\xfe\xa0\x4b\x36\x65\
-\xd5\x9d\x21\x78\xff\x53\x24\x4f\xe5\x3b\xb1\x81\x88\xc4\x18\x32\
-\xae\xa4\x28\xfa\x0d\x62\x5c\x48\xf6\xf1\x77\x12\x3d\x24\x50\x95\
-\x68\x42\xce\x48\x32\x31\x4f\xe2\xd9\x91\x7c\x90\x53\x4e\x39\xe5\
-\x33\xc4\x15\xa8\x8f\x77\xe9\xe6\x0f\xec\x03\xf8\xc2\x7a\x00\x9f\
-\xea\xf8\x58\x25\x78\x1a\xfa\xe3\x53\x59\x75\x67\x88\xf5\xe0\x71\
-\x36\xd7\xd2\x66\x64\x40\x6d\x1e\xe1\x84\xdd\x5f\x65\xd5\x9d\x21\
-\xc6\xfa\xae\x32\x7e\xa3\xf5\x9a\x36\x0f\xc9\xe7\x39\x11\xbb\x31\
-\x0c\xc3\x30\x0c\x63\x16\x01\x23\x14\x67\x0b\x03\x54\xbb\xef\x71\
-\x1e\xcb\xab\x63\x30\x32\x9a\x18\x51\x50\x3a\x2c\xb3\x2e\xa9\x52\
-\x07\x02\xae\x32\xc0\x09\x2a\x68\x47\xb9\x82\xeb\x6d\x76\x3a\xcb\
-\x18\x0b\x47\x62\xd6\x5d\xf5\x77\xda\x69\xa7\x1d\x52\xe0\x84\x9d\
-\x8e\x5c\x71\x44\x1f\xdb\xec\x60\x4a\x03\xb9\x27\x0f\x61\xa8\x2e\
-\xca\xaa\xc7\x06\x5d\x75\xa7\x80\x21\xbb\x1c\x71\x44\x70\xec\x71\
-\xec\xb4\xe3\x4a\x41\x91\x26\x86\x3d\xbf\x43\x51\xbe\xb3\x53\x55\
-\xbb\x76\xed\x7a\x0d\x8e\x58\xf5\x8a\xae\x36\x0e\x48\xd1\xce\x5e\
-\xff\xe8\xe7\x6d\xb7\xdd\x76\x52\xbe\x62\x24\xe0\xe8\x93\xa8\x13\
-\x6f\x35\xd7\x09\xa6\xe8\xaa\x3b\x92\x60\xda\x89\x29\x79\x40\x96\
-\x69\xbb\x88\xff\x87\x90\x01\x7e\x87\x90\x85\x68\xef\xd6\x7c\xd5\
-\xc8\x20\xb9\x4d\x90\x8f\x9d\xc3\x65\x72\x1b\xe7\x48\x6d\x6b\xa3\
-\x8b\x68\x6b\x56\x3d\x16\xc4\x18\xbf\xa5\xd4\x13\x04\xda\xca\xd3\
-\x68\xf0\xa9\xae\x1d\x22\xda\x4d\xfb\x91\x0b\x12\x71\xa1\x63\x3b\
-\xbd\xf6\xae\x8e\x9f\x38\x9b\x04\x4c\x71\x36\x9b\x04\x49\x44\x94\
-\x19\x37\x3f\x4b\x84\x43\x7c\x39\xf2\x59\xee\x0e\x65\xde\xb3\x3b\
-\xb4\x4c\x26\x36\x6d\x2b\x7c\x3e\x78\xf0\xe0\x3f\xc8\xea\x27\x82\
-\x85\x0b\x17\x3e\x82\x73\x5f\xe5\xf7\xb0\xf2\x1b\x32\xf5\xf5\xac\
-\x7a\xec\x08\x1e\x9f\x42\x70\x55\x3b\xc9\xcb\xef\xd3\x31\xaf\x9b\
-\xe8\x2d\x48\xbc\x46\xfe\x91\x69\xe6\x03\x41\xc4\xe8\xf7\x7f\xc9\
-\x57\x8d\x84\xe0\xe5\x0e\x4e\xad\xea\x94\x01\x6b\xb5\x4e\x94\x4c\
-\xa7\xbf\x9a\xb6\x1f\xa2\x1c\x14\xfd\xf6\xb7\x03\x12\x21\xbf\xef\
-\x2b\xed\x85\xba\x53\x8d\x4d\xf9\x4b\x59\x9e\xe1\x59\xe6\x32\x89\
-\x78\x02\x75\xc8\x5d\x8c\xe1\xad\xf1\x8e\xff\x9a\xaf\xed\x04\xd1\
-\x8f\x37\x2d\x5b\xb6\xec\x23\xba\xf2\x0c\x39\x62\x27\x3e\xf3\x94\
-\x60\x2a\xc9\x04\x92\x07\xb2\x33\x74\x52\xaf\x8d\xed\x4b\x99\xec\
-\xe7\xcb\xf2\xb5\x33\x86\xb0\x47\x0e\x10\x20\xae\x9e\x46\xd7\x3a\
-\x25\x79\x9f\xae\x1f\xb9\x46\x2d\x84\x17\x8c\x17\x09\x5b\xe6\x19\
-\x75\x91\x5c\xa4\x3e\xd9\x38\xd2\xcb\x75\x75\xf2\xb7\xe0\xe1\x8c\
-\xf8\x03\x3a\xad\xc1\x66\x2a\x74\x06\xf2\x8c\x4d\x49\x50\x1d\xdd\
-\x41\xd2\x80\xd3\xef\xd8\x6d\x24\x8c\x38\x61\x4e\x02\x8e\x4d\x17\
-\xe8\x6d\x4e\xa8\xa0\x17\x49\x32\x42\xc8\x2c\x09\x9d\x28\xb7\x2a\
-\x5f\xd1\x39\x42\x3e\xb7\xb3\x26\xca\xee\xd0\x78\xa2\x67\x75\x6a\
-\x17\x19\xad\xf2\xbd\x8e\x72\x2c\x58\x4b\xc7\x7e\xfd\x33\x73\x8c\
-\x79\x05\xaf\xd5\xd6\x7e\x1b\xd7\xea\xe4\xa4\xa4\xa2\x9d\x6b\xb3\
-\xfa\x89\x21\xd6\x95\x63\xca\xf6\xcb\x17\x2c\xdb\x5f\xd7\x66\x91\
-\xda\x8e\xee\x48\x1b\x8f\xb9\xf3\xfb\x59\xfd\xd8\xc1\x35\xd6\xa1\
-\xcb\x1e\x44\xb7\x21\xeb\xac\x8f\xf8\x4e\xac\x8f\x24\x48\xb1\x41\
-\x90\x6f\x92\x7b\xc8\x0e\xff\xa2\x77\xd1\x77\xf8\x56\xd8\x59\xcc\
-\x05\x36\x1a\x32\x2f\xf0\x63\x78\x36\xec\xdb\x6f\xcd\x57\x0c\x05\
-\x12\xb9\xda\xb8\x46\x42\x8b\x36\x30\x87\x74\xaa\xb1\x8d\xdc\xa2\
-\x8f\x42\xc7\x5c\x99\x55\x77\x06\xf4\x05\xeb\x42\xe9\xcf\xe9\x7b\
-\xa3\xda\xa8\xd2\x44\x7e\x21\xca\x44\x1f\x3b\xbf\x85\x20\xf8\xfc\
-\x35\xda\x8c\x4f\x47\x9b\xab\x27\xeb\xda\xea\x87\xe0\xf5\xfd\x59\
-\xb5\x61\x18\x86\x61\x18\xc6\x60\x84\xe1\xfc\x56\x0c\x3f\x8c\x50\
-\x76\x2b\xe3\x80\x62\x70\x0e\xb3\x5b\x59\x94\x4e\xf5\x9c\x48\x28\
-\x85\x93\x79\xa6\xae\xfb\xd3\xb1\xfc\x72\x07\x3f\xc1\xa9\xb6\x41\
-\xcc\xac\x7a\x56\x41\x09\x25\x76\xa3\xe1\x3c\xe8\xd4\x87\xfa\xc8\
-\x18\x0f\xea\x23\xbf\xc3\x0b\x8c\x6a\x0c\xd5\xbb\xee\xba\x6b\x2c\
-\xbb\x8b\xc3\x61\x7e\x9b\x12\x1e\xc8\xa2\x02\x3d\x04\x95\xab\xdf\
-\xc6\xe0\xbd\xbc\xbf\xcd\x98\xa4\x3c\x76\x7a\x4d\x5f\x38\x20\x5f\
-\x2a\x03\xc8\x04\x60\xda\x06\x90\xc5\x5f\x02\x34\x3c\x4b\x10\x3a\
-\x1c\xb0\xff\x95\xaf\x18\x0a\x31\xa7\xdf\x1d\x3c\xfd\x1c\x3b\x75\
-\xd9\x3d\x4a\x72\x41\xc1\x09\xed\xc8\xc6\xf9\xa8\x5e\x15\xa5\x36\
-\xf7\x6b\xb7\x7e\x8b\x72\x9f\x8e\xf6\x8e\xed\x03\xbf\x4a\x6e\xe3\
-\xd0\x95\xc9\x6d\x25\xe8\x18\xfb\xa6\xba\x88\x32\x5d\xe8\x21\xf4\
-\xa4\xbe\x43\x86\x83\x4c\xdb\x08\x1c\x30\x6e\x83\xc6\x9a\xdf\x52\
-\x1e\x7b\xbc\x26\xd0\x92\xd5\x76\x02\xf1\x53\x89\x03\xf1\xb3\xed\
-\x66\x81\xa2\xdd\x9d\xe9\xf5\x05\x0b\x16\x3c\x45\x40\x04\xc7\xb8\
-\xdc\x1d\xaa\xb9\xd4\x84\xbf\x22\xda\x1a\x65\x1f\xcf\xaa\x27\x86\
-\x7e\xfc\x1e\x41\x7e\x6f\xcf\xaa\xc7\x8e\x5d\xbb\x76\xfd\x82\x76\
-\x0f\x13\x84\x80\xd7\xc3\x9e\x4a\xa6\x4f\xe8\x2e\x82\x6e\x3c\xaf\
-\x84\xc1\x55\x57\x5d\xf5\x3f\xf3\x75\xad\xb1\x7e\xfd\xfa\x57\xc4\
-\x5a\x70\xaf\xbe\x09\x51\x26\xc3\x59\x1b\x08\x80\x11\x04\x46\x7f\
-\xa1\x2b\xeb\xf4\x57\x5d\x5b\xeb\x88\xb2\xf4\x21\xfa\x7d\x7c\xbe\
-\xde\x08\xac\x5d\xbb\xf6\x2f\x75\xd2\xa0\x7a\xf2\xb6\x0d\x8f\x29\
-\x47\x79\x9e\xe3\x79\x6c\x4b\x02\xb5\x24\x70\x90\x3d\xde\x11\x73\
-\xfe\x91\xa0\x0f\xc4\x3a\xfa\xbf\xe2\xff\x47\xba\x26\x28\xf4\xc8\
-\xb7\x6c\xde\xbc\xf9\x97\xb1\xef\xe2\xbf\x9f\x62\xfd\x43\x86\xf4\
-\x5d\x11\x36\xac\xb0\x0e\xb2\x83\x9f\x79\x8a\xae\xc1\x26\x52\xe2\
-\x45\x73\x00\x99\x6e\x39\x5f\x17\x66\x13\x66\x14\xb1\xbe\x6f\x53\
-\x20\x57\xeb\x14\x3a\xbf\xc9\xe9\x3d\xfe\xce\xef\x5a\xa3\xd8\x78\
-\xc0\xb3\xcc\x31\xec\x62\xfe\x85\x47\xfc\x5d\x41\xf6\x7e\xb2\xc0\
-\xdf\xa0\xf8\x7d\x46\xfc\x01\xec\x5e\xe9\x63\x74\x06\x36\x0f\x41\
-\x74\x78\x42\x92\x14\xf9\x43\x7f\xc0\x1f\xc6\x9e\xe4\x07\x1b\x18\
-\xd0\x5f\xe8\x42\xfa\x4d\x5f\x45\xfc\x0d\xb9\x65\x93\x4b\xc8\xcb\
-\xeb\xf3\x35\x9d\x01\xff\x4c\xa7\x7e\x48\x12\x28\x30\xaf\xe4\x3f\
-\x72\x2a\xfe\x57\x79\x5f\x47\x39\x16\x9d\xd8\x1c\x31\x97\x4e\x60\
-\x6e\x71\xba\x45\x9b\x95\xaa\xbe\x14\x6d\x95\x4c\xd4\xb5\x4f\xa4\
-\x76\xc6\x1c\xbc\x33\xab\x9f\x28\xc2\x4f\x7a\x54\x37\x0e\x94\x37\
-\x23\x34\x59\xbf\xf9\xad\x9c\x3f\xb9\x39\xec\x2b\xb1\x1e\x8e\x5d\
-\x5e\x82\xe7\xaf\x0b\xf9\xf8\x0c\xbe\x93\xe4\x44\xf6\x13\xfc\x47\
-\xce\x91\x71\xe4\x05\xf9\x26\x29\xcc\xbf\xf4\x89\xbf\xb1\x46\xf3\
-\x3b\x49\x52\x36\x48\xe9\x14\x5e\xc8\xd8\x31\xf9\x8a\xa1\x10\xef\
-\xff\x79\xda\x43\x5c\x81\xc4\x36\x89\x2d\x25\x42\xb1\x79\xcb\xb8\
-\x42\x1d\x0f\xab\x94\xfc\xec\xe4\x1b\xb8\x42\xcc\xb5\x5f\x14\x0f\
-\xab\x27\xec\x58\xf7\x64\x5b\x34\x95\x5f\xda\x1c\xf2\xb2\x3a\xab\
-\xef\x04\xc1\xe7\x1f\xc4\x67\xa6\xcd\xf8\x25\xb4\x99\x31\x64\xad\
-\x46\x5f\xb5\x4d\x38\x27\x9f\xcf\xcd\xea\x0d\xc3\x30\x0c\xc3\x30\
-\x06\x23\x8c\xcf\x9d\x18\x51\x24\x1b\xd8\xa9\xa9\xdd\xa8\x18\x9e\
-\x38\x01\x32\xa2\x9a\x1a\x7e\x10\xc6\x4b\x38\x0f\xb3\xee\x94\x4e\
-\x1d\xc2\x10\x3b\xb2\x83\x9f\xc0\x1a\xbb\x15\x71\x16\x09\x00\xea\
-\xb8\x38\xfd\x19\x64\x40\x42\x94\x79\xf2\xc9\x27\x3b\x4d\x5c\x0c\
-\x8b\x70\x46\x77\x8c\x9a\x50\x82\xe0\x05\x65\x31\x54\xc3\xc8\x1e\
-\xf9\x74\x45\xf0\x7d\xa7\x82\x3d\x0a\x18\x12\xe4\xc4\xf9\xc7\x09\
-\xc1\x21\x52\x50\x99\x80\xa1\x76\xd8\x36\x35\x90\x65\xd8\x3f\xda\
-\xc1\x8e\xcc\x12\xe1\x40\xef\x14\x6f\xcb\x2b\x49\x98\x3f\x0a\x4a\
-\xd5\xb5\xaf\x4a\x25\x7f\x71\x08\x70\x66\x62\xac\xde\x97\xaf\x69\
-\x8c\x6d\xdb\xb6\xfd\x70\x8c\xf7\x87\x74\xb5\x0f\xbc\xc5\xe9\x80\
-\xb7\xb4\x13\xc7\x83\x40\x1e\xc9\x2f\xda\x2a\xe7\x43\x81\x64\xda\
-\x3b\x9d\x3c\xf0\x1b\x14\xf3\xe3\x1d\xf9\xca\x91\x51\x26\xb7\x4b\
-\x87\x0e\xe7\x97\xf6\x95\x4e\xe8\x20\x59\x55\xfb\xa2\xfc\xd8\x03\
-\x59\xd1\xce\xfb\x70\xd8\x09\x4c\xa1\x2b\x08\x98\x28\xb8\xc6\x58\
-\x37\x69\x1b\xe5\x98\x77\xc8\xf4\xb8\x12\xb3\x55\xc0\x4f\xc6\xbe\
-\xba\x59\x40\xce\x66\x5b\x7e\x52\xae\x0b\x7e\x0a\x8c\x3d\xa7\x7b\
-\x08\x9c\x69\x77\x68\x99\xb0\x6b\xa3\x8b\xb3\xad\x1f\xcc\xaa\x27\
-\x82\xd0\x01\x3f\x3d\x6e\xf9\x8d\x3e\x77\x7a\x5d\x4e\xb4\xf3\x00\
-\x1b\x29\x74\x85\x23\xb2\x8c\x4c\x36\x95\x65\x11\xe5\x18\x1b\xc6\
-\x88\x7e\xd2\x5f\x82\xb3\xe8\xc2\x58\x53\x6f\xdb\xbd\x7b\x77\xe3\
-\x60\x1a\x41\xb2\xd0\x5d\x7b\xca\xd3\x24\xc8\x05\xeb\x17\x41\x72\
-\xe6\x1e\xbb\xc7\xb5\x36\x10\x00\x56\x90\xaa\xd4\x5f\x75\xed\xec\
-\x47\xb4\x9f\x67\xa2\xcf\xaf\xce\x66\x18\x81\x58\x47\x76\x96\x09\
-\xc7\xf2\xa4\x1d\xf2\xd1\x94\xcf\xe2\x2f\xf2\xcf\xb3\xd4\x41\x90\
-\x16\x3b\x13\xb9\x23\x88\xc9\x98\xb2\x29\x03\x3b\x94\x75\x2a\x6c\
-\x83\xcf\x84\x2e\xd8\x13\xba\xeb\xa2\x90\xd3\x1d\x21\x17\x2b\x43\
-\xa7\x9d\x18\xeb\xd7\xbb\xc2\x3e\x38\x3a\xfe\x7d\x47\x94\xfd\x93\
-\xf8\x6d\x41\x94\x39\x23\xca\x6e\x5b\xbe\x7c\xf9\x8d\x61\xcf\x3d\
-\x89\xdc\x30\x17\xb1\x6d\x91\x1f\x36\x0d\xb1\x51\x85\xd3\x13\xd8\
-\x7a\xcc\x4f\xe4\x1e\x1b\x03\x9b\x0f\x39\x65\xad\x45\xd7\xd0\x36\
-\xd9\xbd\x4d\xf5\x4d\xca\xff\x03\xc9\xb6\x19\x47\x8c\xd9\x51\x04\
-\x96\x35\x76\xda\xb1\xae\x13\x45\xd3\xf5\x8b\xbf\x43\x1a\x2b\x74\
-\x2f\xb6\x0c\x49\x40\x02\xab\xfc\xcb\x7a\xa7\xf9\x36\x9d\x1c\x24\
-\x5f\x66\x24\x99\x04\x90\x13\xc6\x9c\xf1\x66\x4d\x41\xcf\x71\x0a\
-\x09\x59\x66\xbc\xd1\x1d\xc8\x34\xbc\x51\xdf\x48\x00\xd0\x5f\xfa\
-\x88\x2c\xc0\x33\x88\xff\xe6\xef\x94\x43\xb7\x21\xb7\x97\x5d\x76\
-\x59\x67\x01\x63\xd6\x6f\x74\x20\xf2\x8b\xee\xa3\x0f\xac\xe1\x65\
-\xc0\x98\x76\x49\x4e\xeb\xf8\x5f\x25\xc6\x23\xc6\xab\x13\x1f\x25\
-\x74\xf3\x2e\xe6\x19\xf3\x8b\x79\xdc\xef\xea\xad\x7e\x72\x57\x52\
-\xca\x4d\x4f\xbe\xc2\xe6\x7f\x73\xbe\x62\x62\x38\xf3\xcc\x33\x8f\
-\xa7\x0f\xd5\x4d\x2d\xac\x8b\xd3\xcd\x1d\x51\xae\x25\xbd\xf6\xf3\
-\x1c\xf2\x45\x02\x27\x6c\xf9\xdf\xcb\x57\x8c\x8c\xd0\x79\xef\x0a\
-\xf9\xf8\xaa\x64\x44\x89\x53\x92\x79\xf8\xf1\xc8\x09\xf6\x29\xb2\
-\xca\x18\x20\xb7\xc8\x0c\xff\xa2\x7b\x49\x8e\xd2\x2f\xfc\x40\xca\
-\x30\x1f\xb0\xb7\xf6\xee\xdd\x7b\x47\xbe\x62\x68\x44\xdb\x96\x49\
-\x6e\x43\x8e\x7b\x7e\x91\x4e\xb9\x32\x87\xf0\xe3\xda\xac\x1f\xf0\
-\x3c\x74\xf2\x6b\xb3\xfa\x4e\x10\xf3\xeb\xe4\xb2\xcd\xa3\x9e\xb0\
-\xa3\x6f\x31\xfe\x6f\xcd\xea\x3b\x41\xac\x7f\xef\x54\x9b\x59\x37\
-\x69\x33\x89\x41\xc6\x12\x3d\x86\x8e\x6e\xc3\x67\xca\xc5\x3c\x7d\
-\x77\x56\x6f\x18\x86\x61\x18\x86\x31\x18\xec\xe0\xc4\x20\xd1\x35\
-\x43\xba\x37\x1a\x23\xb3\x4d\x90\x54\x44\x39\x8c\xbf\xac\x7e\xd6\
-\x83\xc0\x03\x86\x38\x81\x2a\x76\xa4\x11\xa4\xc2\xf0\xc7\xe8\x2e\
-\x9d\xb5\x26\xfd\xa7\x4c\x94\x9f\x31\xe7\x79\x3a\xe0\x58\x63\x74\
-\x8e\x9a\x50\xc2\xe0\xa4\x2c\x86\x2a\x46\x36\x01\xa1\x70\x1a\x57\
-\xe6\x6b\x1a\x23\x8c\xdf\xb7\x05\xdf\x0f\xeb\x8e\x7b\x64\xb0\x4c\
-\x78\xe0\x38\x13\x64\xc2\x21\xc5\xe9\xd7\x69\xb9\x36\x41\x65\x88\
-\x72\xb4\x39\xe4\xb8\xd3\x84\xd2\x59\x67\x9d\xf5\x7d\xe1\x90\x7c\
-\xa3\xdc\x89\xa7\x36\xc3\xaf\x36\x06\x3d\xf3\x8d\x80\x16\x81\x5d\
-\xed\xf4\x0f\xb9\xbc\xff\xe2\x8b\x2f\x1e\xe8\x8c\x86\x23\xf4\x9a\
-\x98\xcb\x1f\x62\x57\x3f\x8e\x26\xbc\xc5\xc9\xaf\x4b\x26\x31\xcf\
-\x71\x96\x90\x75\x9c\x5e\xc9\x01\x6d\x18\xc4\x5f\x7e\x8f\x71\x18\
-\xeb\x15\x14\x65\x72\x9b\x9d\xe3\x72\xe8\x90\x31\x64\xad\x4c\x6e\
-\x37\x69\x1f\xe5\xa2\x4f\x63\x4f\x6c\xef\xdc\xb9\xf3\xcd\x38\x9c\
-\x65\xf2\x1d\xe7\x4d\xc9\xce\x41\xed\x4b\xde\xf5\x64\x19\x1d\x13\
-\x4e\x7e\x27\xd7\xde\xa1\xdb\xcb\xcd\x02\x25\x3f\x69\xaf\xf8\x39\
-\x88\x97\x50\x97\xfc\x04\x9b\x37\x6f\x7e\x39\x3a\x00\x5d\x4c\xe0\
-\x4c\xc9\x18\xe6\x11\xf2\xa9\x79\xd4\x74\xee\xd3\xd6\x98\x47\xef\
-\xcd\xea\x27\x82\x68\xf7\x71\x72\xee\x25\xbf\x0a\xa2\x94\xfc\x6e\
-\x23\xbf\x51\x7e\x2c\xd7\xc6\xf5\xc3\xb6\x6d\xdb\xfe\x58\xb2\x5c\
-\x06\x4f\x68\x6b\x9b\x40\x04\xed\x85\xe8\x5f\x19\x44\x23\x99\x46\
-\x00\x97\x93\xbf\x67\x9e\x79\xe6\x63\x3b\x76\xec\xd8\x16\xeb\xec\
-\x6f\xc5\x7b\x7f\x29\xfe\xfd\x21\xae\xeb\x89\xb1\x7f\x4d\xb4\xe1\
-\xbf\xc5\xfc\xdf\xbd\x60\xc1\x82\x27\xd9\x5c\xa0\x44\x92\x4e\x93\
-\xb0\xeb\x1d\xb9\x20\xc8\xc7\xfa\x45\xb0\x0c\xbd\xc8\x1a\x46\x7b\
-\x95\x0c\x57\x9b\x9b\xc8\x48\x49\x94\x47\xb6\x62\x9d\x78\x71\xb2\
-\xc6\x08\xc4\x18\xbd\x0c\xbb\x90\xf1\xd3\x46\x89\xaa\xae\xab\xe3\
-\x67\x1d\x89\xc7\x3c\x87\x7c\x21\x23\xcc\x6d\x64\x8e\xc0\x27\xf3\
-\x1d\xfb\x93\xb9\x4f\xb2\x07\x9d\x45\x80\x14\xdb\x94\x39\x85\x1c\
-\x90\x14\x62\x03\x10\x6b\x1a\x84\x7c\x40\x92\x15\x88\xbf\x93\x80\
-\xa4\x1c\xfa\x84\x04\x2f\xf2\x43\x82\x05\x19\xa2\x3f\x9c\xf4\x40\
-\x8e\xb4\x83\x1f\x9d\x48\x90\x55\x36\x2f\x6d\x6c\xaa\x6b\x28\x03\
-\xc5\x33\x6f\x49\xb6\xcd\x38\xb0\xf7\xe0\x1b\x7c\x64\xe3\x43\xdd\
-\xa9\xe9\xe9\xc6\x8e\xfe\x30\x97\x58\xa3\x18\x2b\x25\x54\x94\x64\
-\x61\xfc\x65\x2f\x4c\xc7\x27\xde\x91\x4d\x9a\x31\xc4\x98\x1f\xc0\
-\xee\xe1\x44\x23\x32\xc6\x89\x51\xf4\x06\xc1\x75\xec\x5f\xfa\xc6\
-\xfa\x42\x9f\x18\x7b\xfa\x85\x2e\xa1\xef\xf4\x4f\x24\x5e\x48\x6e\
-\x91\x19\xe6\x44\xc8\xd0\xd8\xbf\xa9\xa4\x8d\x56\xe8\x41\xe4\x19\
-\xf9\x95\x9e\x46\x9f\xca\xbe\x44\xef\x69\x0c\xea\xf8\x5f\x25\xc6\
-\x23\xca\x77\xe2\xa3\xc4\xfc\xba\x94\x39\xc7\x3c\x1b\xc7\xd5\x5b\
-\x94\x65\x1c\x42\xe6\x9e\x0a\x7e\xff\x42\xbe\x66\x62\x88\xb9\xf3\
-\xb8\x12\x21\xb2\x99\x9a\xda\xf3\xb4\x3f\x79\xdd\x93\x2b\xe4\x0c\
-\x3f\x06\x5d\x13\x32\x38\x12\xff\x43\x77\xbd\x38\x78\xbc\x5e\x36\
-\x3e\x36\x1e\x7a\x8e\x44\x1e\xba\x4d\x1b\xf1\xe0\xbd\xd6\x47\xf8\
-\x2f\x19\x87\xf8\x6f\x64\x87\xbf\x43\xf8\x1a\x94\x43\xae\xf7\xef\
-\xdf\x3f\xf2\x49\xaa\xa5\x4b\x97\xee\x43\x6e\x69\x13\x09\x2e\x6d\
-\x58\x29\xe3\x0a\xd3\xe9\x8d\x92\xa4\x8b\xe2\xdf\xbf\x97\xd5\x77\
-\x82\x58\x63\xf6\xb2\x7e\x30\xd7\xd0\x9b\xba\x72\x59\x9b\x6c\x64\
-\x5f\xd0\x9e\x41\xed\xe6\x77\xfa\x17\x3c\xfe\x67\x59\x7d\x27\x08\
-\x39\x38\x5f\x6d\x46\xc7\xe9\x86\x15\x64\x0d\x3e\xa3\xaf\x68\xc7\
-\x20\x79\x85\xd4\xe6\xe8\xe3\xbf\xcb\xea\x0d\xc3\x30\x0c\xc3\x30\
-\x06\x43\x0e\x0b\x8e\x3b\xc1\x1a\x76\x6b\x62\x88\xb2\xa3\x09\x47\
-\x0b\x23\xaa\xa9\xe1\x07\x51\x2e\x0c\x92\x59\x79\x4a\xa7\x8a\x70\
-\xd0\x7a\xd7\x49\x68\x07\x23\x0e\xa7\x9c\x35\x8c\xeb\xa6\xce\x83\
-\xa8\x4b\x67\x6d\x54\x28\xa1\x54\x06\xc2\x15\x1c\x52\x00\xa5\xc9\
-\x18\xd3\x47\x8c\x6a\x9e\xc1\x60\x25\x48\x41\x30\x88\x9d\x9a\x17\
-\x5e\x78\xe1\x1b\xf3\x75\xb5\x80\xdf\x24\x91\x70\x82\xca\xeb\x67\
-\x70\x86\x68\x1b\xa7\x28\x30\xe4\x19\x07\x4e\x27\x8c\x92\xf0\x10\
-\xc9\x48\xee\x2a\x10\x5e\x22\xe6\xcf\x07\xb8\x3e\x87\x44\x98\xae\
-\xb9\xa2\xdd\xa5\x23\x52\xd7\xc6\x92\xd4\x5e\x9e\xc1\xe1\x23\xe8\
-\x81\x33\x8b\x93\xc0\x6e\xc9\x70\x26\xbf\xb4\x7d\xfb\xf6\x2b\xe3\
-\x5d\xeb\xc3\x51\x3b\x21\xf8\x75\x7c\xc8\xee\xc6\x70\x2c\x3e\x14\
-\xce\xfc\x67\xca\x5d\xd9\x04\xd5\x08\xc2\x11\x58\x82\xb7\xec\xec\
-\x87\xb7\xb4\x0f\xde\x22\xe7\xba\x36\xa5\x6d\x10\x2d\x65\xfd\xdf\
-\x66\xd7\xc7\x82\x6a\x72\x5b\x0e\x1d\xce\x51\xdb\x53\x13\x94\xa1\
-\x8d\x59\xf5\x58\xb1\x63\xc7\x8e\xb7\x70\x8a\x86\xc0\x27\x81\x6d\
-\x76\x75\x22\xa3\xe8\xcb\xa6\x09\xcf\xe4\xdf\x91\x60\x43\x56\x3d\
-\x56\x8c\x9b\x9f\xf4\x2b\xab\x1e\x3b\x42\x86\x17\xd0\x56\x82\xbf\
-\xe8\x28\x25\xbf\xd0\x51\x4a\x70\x68\xee\xd7\xb5\xaf\x24\xb5\x35\
-\xca\x4f\xf4\x94\xec\x8a\x15\x2b\xae\x41\x9f\xc1\x6f\x82\x28\xe2\
-\x37\x41\x14\xf1\x9b\x3e\xd0\xbe\x41\x3c\xe7\x77\xfa\x1a\x7a\xe0\
-\x9f\x67\xf5\x9d\x21\xf8\xfd\xb4\x64\x99\x04\x10\x3a\x01\xdd\x23\
-\x59\xae\x6b\x5f\x1d\x15\x7c\x3f\x22\xd7\xac\x0f\x6c\xd0\x28\x92\
-\x4a\xbd\xf1\xc5\xde\x28\x93\x04\xe8\x2a\x91\x12\x01\xfc\x4e\x40\
-\x8a\xb5\x19\x7e\xd2\x46\x9d\x30\x50\x50\x98\xa0\x2a\xf3\xae\x49\
-\x70\x7b\x3a\x82\xd7\xf1\xec\xc1\x64\x89\x51\x20\xd6\x9c\xcd\xe5\
-\xc9\x08\xad\x19\xc8\x47\x53\xfd\x01\x49\xa6\x19\xa3\x6a\x70\x9e\
-\xb1\x44\x4e\x32\x40\xdf\x1b\x67\xd6\x2a\xe4\x05\xbb\x94\x60\x19\
-\x09\x26\x64\x01\xdd\x8b\xfc\x10\xb8\x66\x93\x44\x9e\x66\x3a\xf2\
-\xdf\xfc\x9d\x0d\x42\x94\xa3\x3c\xf2\x86\x5d\xc1\x69\x1d\xfa\x81\
-\x1c\x62\x5f\xa0\x5f\x90\x23\x74\x8c\xfa\x84\xdc\x22\x47\xf4\x8b\
-\xb6\x36\xe9\x5b\xf6\xeb\xfc\x64\xd7\xac\x01\xf3\x47\x7a\x1f\xbe\
-\x4a\x0f\xc1\x77\xf5\xaf\xae\x3f\x10\x7d\xd2\x5c\xc6\x16\x41\x77\
-\x29\x18\xcd\xf3\xfc\x6d\x10\x9f\xb2\x8e\x19\xb7\x87\xb5\x01\x04\
-\x79\x62\xb3\x0f\xeb\x35\xfe\x0d\xbc\x40\xcf\x29\x81\x44\x7f\x44\
-\xf4\x0b\x82\x07\x92\x59\xfe\x1f\xb9\x85\x17\xd8\xbe\x4a\x98\x73\
-\x22\x00\x1e\x87\x5d\xbd\x21\x6c\x83\xcd\xf9\xda\xa1\x10\xed\xec\
-\xd9\xc8\x3a\xb1\x8f\x3e\x64\x1c\x91\x63\xe6\x02\xfe\x19\xc9\xc1\
-\x36\x63\x59\x12\xe5\xf2\x55\x63\x47\xac\x7b\xd7\xa1\xcb\x75\xd5\
-\xa2\x4e\x18\xcb\x36\x82\xaf\xf0\xb1\xae\x5d\x55\x92\xfc\x31\x2e\
-\x3c\x0b\xaf\x43\xf7\x5c\x1f\x7e\xcb\xff\x09\x3f\xe3\xb7\x62\x2c\
-\xff\x43\xcc\xe7\xef\x09\xfa\xfe\x98\xdb\xaf\x08\xdb\xf6\x37\xd6\
-\xaf\x5f\xff\xdf\xe3\xdd\xeb\x96\x2d\x5b\x76\x4d\xac\x17\xbf\x92\
-\xcd\x1a\x1a\xd1\x87\x93\xb4\xc9\x70\x18\x7b\x9e\xdf\x29\x87\x7c\
-\xa9\x0f\xd8\xdc\xc8\x4b\xd8\xf2\x87\x76\xef\xde\x7d\x74\xbe\xaa\
-\x11\x42\x07\xbe\x34\xf4\xdc\xf9\x21\x1b\xcf\xca\x7f\x42\x3e\xb0\
-\x99\xd0\x87\xcc\x75\xf9\x4e\x92\x11\x9d\x62\x43\x66\x91\x5d\xc9\
-\x37\xff\x4d\x3f\x68\x1b\xbf\x21\x47\xf8\xbb\x51\x76\x45\xbe\x6e\
-\x24\x84\xec\x7e\x89\x75\x9c\x76\x95\xa7\x24\x39\x15\x45\x7b\x78\
-\x6f\x3f\xbd\x51\x25\xca\x44\x9b\x1f\xcb\xaa\x3b\x43\xb4\xf9\x2f\
-\x68\x33\x6b\x08\x6d\x66\xae\xb1\x69\x85\x36\xb7\x5d\xef\x72\xec\
-\x9f\xc9\xaa\x3b\x43\xcc\xb7\x47\x89\xdf\xd0\x66\xfc\x3b\x7c\x44\
-\xfc\xf1\xea\xe6\x81\x16\x6d\x9e\xf1\x0d\x00\x86\x61\x18\x86\x61\
-\xcc\x31\x10\x80\xc6\x88\x22\xe0\x8c\x13\x80\xf1\xac\xa0\x12\x06\
-\x26\x46\x54\x1b\x83\x04\x23\x31\x8c\xbf\x59\x99\x54\xa9\x42\x01\
-\x57\x1c\x36\x1c\x4e\x76\xa3\x69\x17\xae\x9c\xb5\x36\x7d\xa7\x6c\
-\x18\x70\xb3\xf6\xaa\xbf\x70\xb6\x0e\xb0\x73\x1e\xa7\xa3\xdc\x8d\
-\x5e\x06\x3a\xeb\xfa\x56\x92\xfa\x89\x33\x82\x33\x8e\xb3\x88\x93\
-\x44\x82\x0a\xa7\x1a\x43\x1c\x59\x0a\x3a\x10\x46\xee\xc1\x70\xee\
-\x0e\xc1\x63\x25\x3a\x94\xec\x28\x13\x49\x38\x1d\x04\x8b\x78\x56\
-\xbb\x86\x75\x55\x83\x92\x49\x6a\x63\xd3\xf1\x10\xa9\xbd\x21\xcb\
-\x9d\x8f\xcb\x79\xe7\x9d\xf7\x63\x04\xae\xca\x53\x7e\x65\xc2\xae\
-\x89\x03\xc5\xef\x39\x87\x7a\xce\x00\x7d\x97\x23\x0a\x8f\xd9\x6d\
-\xcc\x3c\x45\x5e\x71\xdc\xe1\x1f\x0e\x25\x73\x58\x04\x5f\xf9\x1b\
-\x81\x6d\xca\x10\x8c\x63\xc7\xa8\x76\xf6\xf7\xe3\x6d\x1b\x07\x2f\
-\x78\x7a\x5c\x76\x7b\x6c\x58\xbc\x78\xf1\x61\xe4\x02\xe7\x88\x20\
-\xa2\xae\x1b\x21\xf8\x43\x3b\x9b\x3a\xf2\x50\xf2\x71\x4f\x56\x3d\
-\x76\xc4\x3c\xba\x4f\x4e\x27\xfc\x94\xd3\x49\x1b\x9b\xc8\x68\xf2\
-\xb0\xc7\x7b\x9e\xdb\xbf\x7f\xff\x6b\xb2\xea\xb1\x21\x64\xe0\x08\
-\x3f\xe5\x6c\x96\xd7\xb7\xb4\x71\x36\x91\x8d\xe0\x7d\x67\x1b\x05\
-\x42\x8e\xf7\xe2\x18\x23\xcf\xe5\x1c\xa2\xad\xe8\x62\xda\xda\x66\
-\xec\xe9\xd7\x83\x0f\x3e\x38\xd2\x47\xa5\xdb\x22\xda\xff\x59\xfa\
-\x40\x40\x1b\xd9\x18\x55\x7e\xa3\xec\x57\xb2\xea\x4e\x11\xba\x61\
-\xad\x64\x59\x9b\x49\x24\x1f\x4d\xdb\x2b\x42\x4e\xe0\x3d\x7d\x25\
-\xf8\x8c\xfe\x63\x0c\x09\x2c\xb2\xe6\xc0\x13\x76\x50\x33\xbf\x59\
-\x8b\xd0\x4f\xf0\x8b\x84\x00\xfa\x0a\x42\x5e\x59\x13\x94\x48\x42\
-\xdf\xa1\xbb\x08\x94\x91\x58\xc7\x3e\xa1\x8d\xac\x5d\xac\x41\xbc\
-\xab\x8d\xfe\xaa\xa3\x94\xef\xb3\x92\x25\x46\x05\x31\x06\x9f\xd0\
-\x49\x17\x76\x6c\x93\x2c\x6c\xbb\x6e\x40\x94\x83\x90\x11\xad\x71\
-\x8c\x21\xf5\xb1\xce\x91\xec\x46\x56\x98\xfb\x24\x0e\x19\x73\xde\
-\xcb\xf8\x63\xb7\x10\xe0\x25\xb0\x8e\xbc\x22\x43\xe8\xb5\x2a\xf1\
-\x1b\xeb\x1d\x72\x43\x02\x89\xe4\x34\xfa\x84\xa0\x26\x27\x54\x90\
-\x21\x02\xc4\xac\x81\xbc\x13\x19\x55\x90\x93\x36\xd1\xb6\x96\x7d\
-\xfa\xeb\xa7\x9f\x7e\xfa\x87\x92\x55\xb3\x06\xb2\xf7\xd8\x40\x44\
-\x10\x9b\xfe\xd2\x57\xe6\x25\xf3\x9a\x3e\xd6\xf5\x07\xa2\xef\xfc\
-\xae\x71\x82\xf0\x05\xca\xa0\xf4\x74\x7c\xe2\x6f\x50\x36\x65\xc6\
-\x11\x72\xb3\x09\xbd\xc3\xf8\x93\x14\x55\x72\xa0\xb4\x2b\xd5\x97\
-\x2a\x95\xfd\x11\x3f\xf0\x0d\x58\x97\xd0\x43\x65\xc2\x1c\xd9\xc3\
-\x96\x0d\xbd\xb5\x35\x6c\xb4\x6d\x9b\x36\x6d\x3a\x1a\xca\x66\x3c\
-\x07\x24\x8f\xa0\xd0\x7f\x3b\x49\x22\xb1\xd1\x8a\x0d\x7e\xb2\x91\
-\x49\xce\x70\xf2\x00\x3d\x48\xbd\xcc\x01\xc6\x11\xfd\x47\xfb\x95\
-\x0c\x53\xdb\xab\x63\x50\xa5\x6c\x7f\x67\xbe\x59\xe8\xed\xab\xb1\
-\x3d\xcb\xcd\x36\xb4\xb5\x3c\x49\xd5\xa4\x9d\x10\x6d\xa5\x2c\xf2\
-\xc6\xb3\x24\x46\x94\x8c\x41\x9e\x59\x17\x58\x23\x64\xfb\x62\xe7\
-\xc0\x33\x51\xcc\xfb\x97\x64\xb3\x46\x42\xe8\x9a\x4f\xa2\x3b\x74\
-\xa3\x43\x1b\x7b\x5e\x7d\xa0\x2c\xcf\x20\x2f\xd8\x89\xc8\x0b\x89\
-\x4d\xc6\x13\xbd\x1a\xef\x38\x3b\xfe\x3d\x2a\xc6\xf8\xe5\xf1\xef\
-\x77\xf3\xde\xf8\xef\xef\x8f\x3e\xbe\x3e\xe6\xef\x9f\x86\x7c\x6c\
-\x0a\x39\xb8\x56\x1b\xf1\x74\xa3\x03\xf2\x81\xbd\x04\xbf\xd1\x7b\
-\xe8\x47\xf9\x4e\xda\x88\x83\x5e\xd3\xfa\x28\x39\x29\x89\xbf\x41\
-\xe8\x83\x28\x33\x36\xfb\x4e\x37\x7f\x94\x71\x05\x6d\x46\x50\x5c\
-\x81\xf7\x4f\xc7\x3f\xa8\x90\x83\x8b\xb3\xea\x4e\x10\xed\xfc\x56\
-\xb5\x19\x7e\x2a\x91\xc8\x58\xd1\x66\xf8\x28\x1e\xd6\xb5\xb3\x4a\
-\xd9\xe6\xeb\xb3\xfa\xce\x40\x9b\x91\x7f\xec\x28\xd6\x3c\xd6\x4b\
-\xda\x2c\xfd\xc0\xd8\x37\xe5\x33\x14\x72\x70\x6f\x56\x6d\x18\x86\
-\x61\x18\x86\x31\x18\x38\x33\x18\xa6\xec\x12\xc6\x09\xc2\xe1\xc2\
-\x31\xe2\x44\x04\x06\xbc\x76\x6b\x62\x90\xd4\x19\x21\x55\x92\xf1\
-\x17\xcf\xcc\x99\x84\x12\x8e\x08\xc1\x2c\x82\x98\x04\x2e\x30\xc6\
-\x09\x98\xb4\x0d\xb8\x52\x86\xb2\x59\xf5\xac\x04\x01\x06\x9c\x53\
-\x82\x2c\xba\x96\xad\x1c\x67\x19\x95\x75\xfd\x13\x15\x63\xfc\x1c\
-\xa7\x9a\x20\x50\xb9\x0b\x5d\xc1\x42\x02\x84\x38\x3d\x9c\x02\x83\
-\xf8\x6f\x9c\x64\x82\x86\x38\x1b\x24\x46\x70\x96\x91\x3d\x82\x8d\
-\x38\x8c\x04\x35\x09\x2c\x29\xe1\xc1\x7b\x64\xcc\x37\x31\x8e\x4b\
-\xa2\x3c\xce\xd2\x24\x12\x4a\x20\x8c\xfa\x4b\xe9\x0b\xfc\x55\x62\
-\x56\x86\x7d\x5b\x59\xa2\xcf\x8c\x8d\x1c\x51\xea\x23\xe1\x49\x60\
-\x8c\x20\x19\x0e\x04\xbb\x12\x99\xbb\x38\x41\x22\xc6\x18\xfe\x23\
-\xd3\x8c\x05\x0e\x38\xcf\x68\x47\x36\xbc\x65\xdc\xab\xbc\x6d\xd1\
-\xb6\x8d\xd9\xdd\xb1\x42\xc9\x6d\xe4\x86\x76\x97\xce\x11\x0e\x1d\
-\x4e\x28\xed\xac\x6b\x57\x95\xba\xd6\x43\x24\x4c\xe1\x3d\x41\x01\
-\xc6\x04\x9e\x56\x83\x0d\x75\xed\x12\xc1\x47\xca\x20\x17\x38\xd8\
-\x21\x27\x63\xbf\xf6\x0e\x7e\xb2\x83\xb5\x74\x36\x99\xa7\x72\x36\
-\xe5\xd4\xd7\xb5\xaf\x4a\x5d\xf3\x33\xd6\xa1\x67\x18\x7b\x74\x31\
-\xfa\x40\xbb\x43\x15\xf8\x1b\x62\xfe\x7c\x3c\xab\x9e\x18\x24\xbf\
-\xcc\x41\x82\x28\x25\xbf\x4b\xf9\x6d\xd2\x87\xe4\xf7\xcd\x59\x75\
-\xa7\xd8\xb5\x6b\xd7\xf7\x96\xb2\xac\x8d\x06\xe5\xfa\xdf\xa4\xcd\
-\x90\xe4\x9a\xe7\x18\x33\xe4\x8c\x79\xc1\x1a\x81\xfe\x22\x51\x40\
-\xa0\x51\x27\x50\xe0\x13\xe3\x5d\x26\x07\xf8\x7f\xe6\x3f\x7a\x94\
-\xf5\x84\x13\x95\xac\x0b\xc8\x83\x92\x00\x24\x20\xa4\x57\xdb\xb6\
-\xb1\x8e\x78\x3e\xc6\xe7\x0f\x93\x25\x46\x05\xb1\x86\xfc\x57\xc6\
-\xab\xdf\xba\x06\xff\xea\xf8\x5a\x47\x92\x11\x9e\x93\x9c\x20\x6b\
-\xcc\x73\xe4\x8e\xf1\x45\x9f\x62\x9f\xb0\x5e\x21\x33\x6c\xa6\xe0\
-\xdd\x04\xf9\x98\x57\xac\x67\xd8\x0b\xd8\x6c\x25\xf1\x37\x74\x07\
-\x32\x43\x59\x12\x08\xc8\x0e\x01\x61\xe4\x87\xa0\x26\xc1\x56\xd6\
-\x53\x02\xdd\x9c\x34\x41\xff\x8e\x90\x4c\xc2\xbe\xf8\xb5\x64\xd3\
-\xac\xc2\xca\x95\x2b\x0f\xca\xde\x53\x70\x9f\x75\x9f\x71\xd3\x9c\
-\xa9\xeb\x13\x44\xbf\xca\x71\xc2\x86\x2a\xa9\xe4\x53\x1d\xaf\xf8\
-\x5b\x94\x99\x55\x7e\x00\x6b\x20\x72\x23\x1b\x1f\xbb\xaa\x8d\xfd\
-\x53\xf2\x03\x5d\x8e\xdc\xa0\xdb\xa8\x0b\x3b\x05\x39\x43\x06\x49\
-\xa6\x90\xf0\x80\xf7\xd8\xb9\xd8\xbc\xe5\x49\x4c\x36\x1d\x94\x09\
-\x10\xfe\x9b\xbf\xf1\x1b\x65\x48\x92\x60\x23\xb3\x6e\xb3\x19\x08\
-\x5d\x48\x52\x03\xf9\xe7\x3d\x24\xe8\xd1\x7f\x6a\x7b\x13\x79\x9d\
-\xc4\x78\x44\x7b\x3f\x40\x3f\xe9\xb7\x6c\x60\xe6\x30\x73\x1a\x5e\
-\x21\x37\xd3\xc9\x5c\x49\xe2\x35\xfd\xa3\x9f\xf4\x97\x84\x0e\x73\
-\x98\xf9\x8f\x2e\x62\xcd\xe0\x5d\xf0\xa9\xdc\x90\x00\xef\xb2\x49\
-\x23\x23\xf4\xde\x6f\x68\xfe\x28\x11\xa9\xe4\x73\x93\xfe\xd0\x0f\
-\xca\x49\x5e\xe8\x07\xf2\x82\x5e\x83\x3f\xa5\xbf\x44\x82\x2c\x65\
-\xe5\xeb\xd8\x11\x92\x93\x3a\xf9\xa0\x9f\x92\x0f\xe4\x9a\x7a\xb4\
-\x59\x4c\xbe\x53\xb5\x9d\xb4\xa5\x1f\x45\x99\xaf\x44\x99\x1f\xcd\
-\x6e\x8f\x84\xf0\xe9\xde\x44\x52\x94\x76\x96\x71\x05\xf9\x9b\x6d\
-\xe5\x96\x72\xd1\x8f\x63\xb2\xfa\x4e\x10\xfc\x7f\xa3\xda\x5c\x95\
-\xdf\x11\xae\x2e\x5f\x92\xd5\x77\x82\x90\xff\x9f\xa0\xcd\x9a\x73\
-\xe8\x1d\xd6\x3b\xda\xcc\xf8\xb3\xa6\xca\xc6\x6f\xca\xe7\x58\x8b\
-\xb7\x65\xf5\x86\x61\x18\x86\x61\x18\x83\xc1\xce\x38\x8c\x55\x02\
-\xfd\x0a\x28\xe1\xb8\x57\x77\x62\x0d\x32\x46\x44\x85\xf1\x37\x6b\
-\x4f\xe9\x94\x60\x77\x8f\x02\xae\x04\xb1\x08\x42\xe0\xb0\x11\x6c\
-\x50\xb0\xa4\x89\x31\x06\x51\x26\x0c\xc8\x59\x7d\xd5\x5f\xf4\xf1\
-\x28\x05\x3b\x09\xb6\x10\xec\x6c\xbb\x63\x0c\xca\xbe\x3e\xc7\xa9\
-\xc6\xc9\x85\x77\xe5\x2e\x74\x78\x8a\x63\x4d\xd2\x08\xc7\x02\xc2\
-\x71\x42\xd6\x70\x06\x69\x07\x89\x11\xca\x63\xbc\xb3\xfb\x19\x63\
-\x58\xbb\xcf\x71\x88\xca\x1d\xa4\xbc\xb7\x49\xfb\x4a\xa2\x4f\xb4\
-\x35\x59\xd0\x39\x2e\xbc\xf0\xc2\x9f\x8e\x7e\x3f\xab\x93\x2b\xf0\
-\x45\x77\x59\xd3\x0e\xda\x53\xd7\xce\x2a\x51\x4e\x81\x0b\x25\x95\
-\x70\x66\x49\xf6\x52\x2f\x0e\x1a\xc1\x11\xe6\x2c\xbc\x86\x97\x22\
-\x1c\x0b\x1c\x6e\x82\x10\x38\xdf\x8c\x09\x8e\x38\xbc\x45\xb6\x19\
-\x2f\xe4\xbb\x0c\xa2\x35\xe5\x6b\xb4\xeb\x8a\xec\xea\x58\x41\x72\
-\x1b\xe7\x88\x1d\x82\x38\x47\x72\xe2\xe5\x1c\x0d\xe3\xd0\x45\xf9\
-\xce\x02\x28\xe1\xc4\xbf\x45\xce\xb2\x1c\x4f\x9c\x65\xb5\x73\x10\
-\x4f\xf9\x2d\xdb\xd8\x93\x71\xe4\x3d\xab\x1e\x0b\xc4\x4f\x02\x10\
-\xfd\x9c\xcd\xd9\xc4\x4f\xed\x0e\x25\xa8\x52\xea\xa7\x6a\x00\x74\
-\x90\x9c\x8a\xaf\x31\x6f\x2e\xca\xaa\x27\x82\x8d\x1b\x37\xbe\x56\
-\x9b\x33\xaa\x01\x89\x52\x2e\x5a\xf2\xfb\xf4\xac\xbe\x73\x9c\x79\
-\xe6\x99\xeb\xcb\x5d\xb9\xe8\x9a\xb6\x89\xbc\x92\x68\x3f\xfa\x4e\
-\xc9\x02\xf4\x17\x6b\x0d\xb6\x05\xe3\x4a\x92\x80\x00\x2c\xef\xab\
-\x26\x07\xf8\x7f\xf4\x16\x3a\x4e\xa7\x49\xd0\x7b\xac\x0b\x04\x77\
-\x94\x08\x47\x37\x4a\xa7\xb6\x6d\x5f\x95\xe8\x63\xd4\xf3\xf2\x64\
-\x87\x51\x83\xf3\xce\x3b\x2f\x96\xb5\x8b\x7b\x63\xc7\x38\x12\x1c\
-\x95\x1e\x69\x2b\x23\x94\xd5\x5c\x65\x0c\xa9\x83\xf5\x88\xfa\x18\
-\x5f\xe4\x85\xb1\x46\x0e\x59\x43\x09\x92\x22\x03\x24\x45\x90\x1f\
-\x64\x82\x8d\x27\xac\x6b\xac\x87\x10\xff\x0d\xf1\x77\x64\x98\x00\
-\x30\xf3\x8f\x24\x24\x41\x5c\xea\x62\x2e\xd2\x6e\xde\xc1\xbb\xb4\
-\x06\x0e\x23\x47\x94\x8d\xe7\x7e\x27\xd9\x33\xeb\x80\xbd\x87\x6d\
-\x4b\xc0\x5a\xb6\xad\xe6\x35\x73\x87\x31\xab\xeb\x97\x48\x63\xa4\
-\x71\x2a\x49\x7f\xaf\x7b\x0e\xa2\x4c\x36\x63\xd6\xe0\xfc\xf3\xcf\
-\x7f\x13\xf6\x12\xf6\x10\x72\x51\x9e\x9c\x69\x2a\xbf\xea\x37\xf2\
-\x52\xda\xbf\x4a\x98\xa3\xaf\xd0\x69\xbc\x07\x7d\xca\xa6\x1e\x6c\
-\x5e\xec\x6e\x9d\xc4\x24\xe1\x41\xe2\x40\x1b\xad\xf4\xdf\xfc\x46\
-\x19\xd6\x0f\x25\x0a\xb0\x8f\x99\x73\xb4\x19\xb9\x67\x2e\xc8\x7e\
-\x93\xfe\x1b\x34\x16\x10\xbf\x27\x1b\x3a\x43\xf4\x71\xa3\x02\xf2\
-\xd8\x9f\x4a\x22\xd0\x5e\xe6\x9a\xe6\x58\x5d\xfb\xaa\x44\x7b\x29\
-\xcb\x33\xcc\x51\x64\x96\xf5\x83\xb9\x8c\xfe\x81\xc7\x24\x51\xe0\
-\x31\x7e\x06\x7c\xc6\xd7\xc0\xb7\x88\xff\xbf\x2f\x9b\x34\x16\x84\
-\xde\x3b\x5e\xdf\x00\x22\x19\x4d\x7f\xda\xda\x79\xf4\x83\xb5\x90\
-\xe7\xb0\xf5\x18\x47\xc6\x93\x71\x65\x7c\xb1\x17\xf0\x89\x24\x2b\
-\x24\x22\xb5\x19\x0f\x42\x66\x90\x0f\x9d\xdc\xcd\x7e\x3e\x47\x3e\
-\x98\xdf\xe8\x65\xad\x91\xd2\x6d\x9a\xaf\x75\xed\x83\xf8\x2d\xda\
-\x37\xf0\xfb\xac\x4d\x11\x6d\xdc\x8a\x2d\x44\xbb\xcb\x8d\x2a\xd5\
-\x4d\x57\xbc\x77\xba\x76\x41\xe2\x5f\xf4\xe5\xe7\xb2\xfa\x4e\x10\
-\x7a\x72\x93\xda\x8c\xbf\xaa\x58\x48\x79\x5b\x49\x1b\xf9\xa5\x5c\
-\xf4\x71\xe4\x6f\x51\x4d\x87\x68\xf3\x7b\x69\x33\x3a\x84\x36\x23\
-\x0b\xc8\x81\x36\x04\x0d\xc3\xe7\x78\x66\x6c\x72\x60\x18\x86\x61\
-\x18\xc6\x3c\x00\x27\x74\x48\xa8\x60\xac\xb2\x33\x58\x46\x33\xce\
-\x11\x46\x14\x06\x30\x46\xd4\x20\x63\x44\x44\x39\x0c\xec\xac\x7e\
-\xd6\xa3\x0c\xb8\xe2\x98\x28\x80\x8d\xe3\xa2\x40\x49\x13\x03\x52\
-\xc6\x58\x94\x9f\x55\x3b\x32\xeb\x10\x86\x67\xef\xaa\x2e\x82\x76\
-\x04\x5f\x18\x6b\x39\x1f\x6d\x9c\x6a\xfa\x2b\x67\x0f\xe7\x56\x4e\
-\x12\x4e\x35\x32\x44\xf0\x1a\x47\x07\xa7\x8f\x13\x32\x38\x98\x10\
-\x46\x2f\x7f\x23\x70\x88\x53\x88\xd3\x49\x79\x82\x3f\x38\x43\xf0\
-\x1e\xd9\xc3\xf1\x92\x43\x44\xbb\x78\x5f\x53\x39\x2c\x29\xc7\x65\
-\xa2\x32\x19\xfd\x7c\x37\x7d\x2e\x77\xe5\xe9\x84\x42\xd3\xf9\x54\
-\xf2\x98\xe7\x90\x47\x12\x53\x24\x03\xe0\x13\x7c\x26\x88\x86\xd3\
-\x03\xaf\xe1\x25\x41\x58\x08\x39\x56\x30\x96\xe0\x1a\x6d\x60\x6c\
-\x78\x56\x3b\xb2\x99\xdb\xe2\x6d\x53\xbe\x46\x7b\x0e\x3c\xf3\xcc\
-\x33\x9d\x7c\xb4\x9e\xe4\x36\xce\x11\x01\x09\x9c\x23\xf8\x47\xc0\
-\x59\xce\x51\xb9\xab\xb1\xae\x6d\x55\xa2\x5f\x21\x3f\x9d\x26\xb6\
-\x09\xd6\x11\xf4\x29\x83\x75\x8c\x73\xd3\x20\x3c\xbf\xd3\x27\xca\
-\x23\xf3\x77\xdd\x75\xd7\x7f\xcc\xaa\x47\x46\x95\x9f\x72\x36\x75\
-\x15\x4a\xe9\x6c\xd6\xb5\xad\x24\xca\x74\xc9\xcf\x75\xeb\xd6\xbd\
-\x96\xd3\x3d\x38\xc6\x9c\x5a\x24\xb8\xa2\xb9\x43\x5b\x87\xd1\xc5\
-\xd1\xd6\xff\x93\xd5\x4f\x04\x21\x0b\xab\xd9\x9c\x41\x40\x82\x60\
-\xa0\x02\x12\x0a\xa2\x0c\x23\xbf\x31\x46\xbf\x99\xd5\x4f\x04\xb1\
-\x06\xde\x29\x1b\x40\xed\x2e\x79\xdf\x44\x56\x44\x1a\x07\xe9\x2f\
-\xfa\xcf\x3a\xc3\x78\x32\x4f\xd0\x61\x8c\x2f\xf3\x86\x75\x88\xcd\
-\x04\x22\xfe\x9f\x84\x01\xbf\x23\xaf\xac\x51\xe8\x50\xe6\x08\x6b\
-\x8d\x64\x97\xba\xdb\xb6\xab\x1f\x45\x5d\x5f\x4a\x36\x18\xd3\x20\
-\xe4\xe3\xc3\xac\x37\xda\xad\xcf\x98\x6a\x2d\x19\x46\x46\x24\x27\
-\xc8\x3b\xe3\x49\x3d\xd4\x87\xbc\xb0\x4e\x51\x3f\xe3\x8e\x2c\x12\
-\x28\xc5\x3e\xe0\xbd\x6c\x8c\x40\x2e\x20\xd6\x36\x48\xff\xcf\x6f\
-\x94\xa1\x2c\x72\x83\xcc\x29\x89\x84\xfc\x50\xb7\x6c\x0b\xde\xc9\
-\xbb\x87\x69\x7b\x3c\xf7\xbf\x93\x2d\xb3\x12\x24\x94\x08\x4c\x13\
-\xa8\xc6\xde\xc2\x5e\x80\x3f\xd8\x00\xf0\x98\xbe\xd7\xf5\xad\x24\
-\x8d\x51\x3f\xea\xf7\x4c\xf0\x66\x56\xda\xc2\x61\x7b\xae\x67\xbd\
-\x46\xc7\x20\x33\xc8\x85\xf4\x49\x53\x19\xa0\x0c\x65\xe1\x1f\x7c\
-\x44\x4e\xa9\x07\x99\xc3\x5e\xc1\xe6\x42\xf7\x63\x93\xb1\xa9\x07\
-\xbb\x97\x4d\x12\xd8\xdd\xf8\x59\x24\x3e\x58\x23\x20\xd6\x66\xfe\
-\xe5\x6f\x3a\x9d\xc9\xe6\x0f\xd6\x0f\xec\xe7\xea\x46\x2b\xe6\x01\
-\x32\x8c\xfc\xf2\xfe\x26\x6d\x9e\xd4\x78\xac\x5f\xbf\x7e\x81\x12\
-\x4a\xd8\x1b\xd8\x6f\x24\x81\xb5\x8e\xa8\xbd\x75\x6d\xac\xa3\x6c\
-\x77\x6f\x6c\x98\xb3\xc8\x2d\x3c\xa6\x4e\xc6\x0f\x7b\x06\x1e\xc3\
-\x27\xd6\x2d\xfc\x0a\xf8\x16\xbe\xcd\xaa\x6c\xd2\xd8\x10\xf3\x67\
-\x3b\xef\x62\x5d\xa2\x0d\xe8\xa4\xa6\x72\x23\x79\x91\x6e\x63\xfc\
-\xe0\x09\xe3\xc9\xb8\xb2\xde\x62\xb3\x33\x47\x4b\x59\x51\x92\x0c\
-\xe2\xbf\x99\xc7\xd8\x9b\x6c\xb6\x2a\xe5\x83\xe7\x25\x1f\xe8\xba\
-\x72\x8d\x84\x7f\x83\xda\x16\xff\x9e\x96\xdd\x1c\x0b\x42\x06\x0e\
-\x70\xa2\x8a\x04\x98\xe2\x0a\xc8\x30\xf3\x0d\xbe\x49\xf7\x4c\xd7\
-\x2e\x11\x65\xe8\x43\x56\xdd\x19\x16\x2f\x5e\x7c\x9f\xda\x0c\xaf\
-\x65\x07\xe9\xb6\x12\xf8\x49\x3b\x9a\xca\x2f\x65\xe3\x99\x4e\x7c\
-\x25\x61\xd9\xb2\x65\xd7\x63\x73\x12\xbf\xa1\xcd\xc8\xbf\xda\x8c\
-\x3e\xd2\x1a\xd7\x86\xcf\x51\xfe\x5f\x64\xf5\x86\x61\x18\x86\x61\
-\x18\x83\xc1\x7d\xcc\x24\x54\x70\x3a\x15\x18\xc5\x19\xc2\x60\xc6\
-\x88\x22\x10\x34\xc8\x20\x2d\x09\x63\x2b\x0c\xc5\x59\x7d\x4a\x47\
-\x28\x03\xae\xec\x0a\xc3\x90\xc7\x01\x22\x80\x45\xe0\x42\x01\xc0\
-\xa6\xc6\x18\x7d\x0f\x03\xf2\xd4\xac\x7e\xd6\x22\x9c\x95\x37\xe3\
-\xa0\xe8\x5e\x70\x02\x87\x18\xf9\xf4\xb7\x8d\xc3\xa7\x3e\xcb\x49\
-\xc2\xa9\xa6\x1e\x82\x38\x4a\x78\x20\x4b\x18\xb8\xec\x4e\xc3\xf9\
-\x83\x70\xb4\xf9\x1b\xc1\x0d\x76\xe8\xe1\x1c\x62\x00\xf3\x1c\x46\
-\x30\x01\x79\xda\xa2\xe4\x8b\xe4\xaf\xa9\x0c\x56\x49\x6d\x8c\xf6\
-\x4d\xf4\xd4\x5c\x38\x7c\xeb\x71\xf8\xe8\xe7\xb0\x81\x0b\x88\xb2\
-\xf0\x81\xe7\x78\x1e\x67\x91\xba\x48\x0e\xe1\x40\x22\xaf\x38\x93\
-\x04\xf8\xe0\x27\x04\xef\xe1\x2b\xe3\xc0\x5c\x26\xa8\x86\x33\x5e\
-\x3a\x9a\x1a\xeb\x16\xed\xf8\xcb\xa7\x9f\x7e\xfa\xdf\x66\xf7\xc6\
-\x0e\xe6\x23\x0e\x1d\x01\xf9\x52\x3e\x91\x0d\x39\xef\xb4\xb9\x69\
-\x7b\x29\x9b\x55\x77\x86\xd0\x1b\xf7\xc9\xf9\xc4\x61\x86\xdf\xf0\
-\xb9\x69\x5b\xf9\x3d\x9d\xb8\x9e\xdc\xc7\x98\x8e\xed\xda\xbb\x92\
-\x9f\xb4\x11\x7e\x32\xef\xe4\xd4\x2b\x20\xd5\x84\x9f\x94\xe9\x92\
-\x9f\xab\x57\xaf\x5e\xa3\xdd\xa1\xe8\x62\x82\x25\xe8\x8c\xea\xee\
-\xd0\xa6\x6d\x45\xae\x63\x0c\x7e\x36\xab\x9f\x08\x62\x1d\xb9\x93\
-\xcd\x19\xec\x2a\x2e\x37\x67\xc0\x6f\x64\x02\x7e\xb7\x59\x4b\x29\
-\xfb\xc8\x23\x8f\xfc\xe3\xac\x7e\x22\x38\xef\xbc\xf3\x7e\xfa\xec\
-\xb3\xcf\xfe\x3a\xc1\xad\x6a\xc2\x40\xfc\x6f\xda\x7e\x48\x63\x21\
-\x19\xa7\x1e\x02\x8b\xc8\x3a\xe3\x5a\x26\x08\xd0\x65\x22\x25\x04\
-\xf8\x1d\x5d\x47\x1b\x58\x5f\x98\x57\xac\x0b\xd4\x45\x9d\x6d\xf4\
-\xd7\x74\x44\x1d\x51\xef\x47\x93\x0d\xc6\x00\x5c\x72\xc9\x25\x37\
-\xa2\x9b\x65\x2b\x31\x36\x8c\xed\x28\x63\x52\xca\x0a\xb2\xc6\x18\
-\x4b\x66\x98\x3b\x8c\x3d\xb2\xc3\xbb\x58\xc7\x90\x21\xe4\xa2\x8e\
-\xf8\x0d\xa2\x1c\xcf\xa0\x3f\x78\x9e\xba\x24\x3f\xbc\x83\xf7\x0d\
-\xd3\x5e\xca\x07\xcd\xfa\xcd\x43\x80\x60\x23\xeb\xa9\x82\x8d\xac\
-\x51\x6d\x83\x8d\x6d\x88\xfa\x62\x0c\x67\x35\x6f\x2e\xba\xe8\xa2\
-\xb5\x6c\x58\xc0\x4e\x42\xcf\x20\x2b\x5a\x0f\x9b\xca\x03\x65\x28\
-\x0b\x0f\x91\x29\x64\x0c\xd9\x63\x3e\xa0\xbf\x48\x2c\x91\x2c\x87\
-\xe7\x3a\x89\x89\x7f\x45\xd2\x80\xb5\x98\x35\xae\x24\xfe\xc6\x6f\
-\x94\x41\xff\x62\x27\x93\x34\xc1\xb6\xc3\x06\xaa\xdb\x0c\xd4\xa4\
-\xad\xfc\x1e\x74\x4a\x76\xbd\x53\x84\x0f\xf9\xcf\xc7\x99\x50\x82\
-\x68\x3f\x3a\xa1\xe4\x31\xf6\x2c\xeb\x2a\x75\x63\xef\xe2\x67\x60\
-\x7f\xc1\x6b\xf4\x52\xf0\xed\xb5\xd9\xa4\xb1\x22\xe4\xe6\x7a\x7c\
-\x18\xde\xcb\x78\xa0\x5f\x18\x8b\x26\x72\xc3\x6f\x94\xa1\x2c\xcf\
-\xc0\x0f\xc6\x93\x7a\x98\x93\xac\xb7\xb4\x1f\xb9\x54\x92\x4c\xb2\
-\x02\x61\x4f\xf0\x37\x36\x8c\x91\xd0\x47\x3e\xf0\x2d\x46\x91\x8f\
-\xfc\x6d\xac\xc9\x24\x70\xe2\x89\x27\xf6\xae\xec\xe3\x34\x15\x71\
-\x05\x36\x2f\x2a\x11\xc7\xf8\x31\x96\x8c\x69\xb5\x3d\x75\x44\x1f\
-\x82\xee\xcf\xaa\x3b\xc3\xf1\xc7\x1f\x7f\xa4\xcd\x24\xf3\x98\x87\
-\x6a\x33\xfa\x01\x9e\x0e\xe2\xa7\x88\x32\x31\xce\x4f\x67\xd5\x9d\
-\x21\xec\xfb\xcf\x63\x73\x12\xbf\xa1\xcd\x9c\xf2\x46\x26\xd0\x3f\
-\xc8\x02\x7c\x46\xde\xea\xda\x58\xa5\x6c\xf3\xd7\xb3\x6a\xc3\x30\
-\x0c\xc3\x30\x8c\x66\x60\x57\x38\x57\xf4\xb0\xd3\x9e\x5d\x71\x0a\
-\x24\xe1\x14\x61\x2c\x37\x75\x5a\x44\x94\x8d\x67\xe6\x84\xa3\xcd\
-\xe9\x2c\xed\x28\xd7\xb1\x7c\x05\xb0\xdb\x3a\xdc\x94\xc1\x40\xce\
-\xaa\x67\x3d\xb6\x6c\xd9\x72\x2f\x09\x34\x76\xb7\xe1\x54\xe3\xa0\
-\x69\xbc\x9b\x1a\xfa\x90\xfa\x8d\xd1\x8a\xf1\x8a\x93\x84\xc3\x80\
-\x03\x49\xa0\x90\xe0\x20\xce\x12\x81\x27\x9c\x30\x9c\x6c\x88\x24\
-\x16\x0e\x21\xc6\xba\x76\x9e\x63\xb4\xf3\xbc\x9c\xa1\xa8\x73\x2f\
-\x75\xa7\x43\xd1\x7b\x57\x53\x39\x2c\x29\x65\x12\x47\x6b\xe2\xd7\
-\x30\x86\x23\x78\xad\x78\x3c\x6a\xe0\x02\x5e\xd0\x0f\x39\xd6\xd4\
-\x85\xd3\xc0\x8e\x44\x78\x08\xbf\x15\x9c\xc5\xb9\x1c\x14\x8c\x6d\
-\xc3\xcf\x78\xff\xa3\xd1\xe6\x4e\x03\xf4\xa1\x87\x0e\x57\xbf\xa1\
-\x23\xe7\x88\x3e\x20\x17\x6a\x77\x5d\x1b\xab\x14\xfd\xec\x3c\xb1\
-\x4d\x72\x96\x04\x88\x4e\xff\x20\xe3\xd5\x13\x35\x83\xda\x2b\xf9\
-\xe4\x19\xc6\x2b\xab\x1e\x19\x75\xfc\x24\x40\x55\x75\xea\x9b\xf0\
-\x93\x32\x5d\xf2\x33\x74\xf0\x1d\x24\x94\x68\x2b\xc1\x4f\x25\xe8\
-\xd0\xc5\xb4\x95\x39\xd3\xa6\xad\x94\xcd\xaa\x27\x86\x13\x4f\x3c\
-\xf1\x59\x36\x67\xac\x5c\xb9\xb2\xc7\x6f\x9d\x00\x15\xbf\xdb\xca\
-\x6f\xcc\xb7\xbf\xc8\xaa\x27\x8a\x58\x07\xdf\x47\x20\x8b\xe0\x16\
-\x7a\x5a\xf2\xdc\x46\x5e\x4a\xa2\x3c\x84\x9c\xa3\xf7\x90\x75\x78\
-\xa1\x04\x01\xeb\x0e\xfc\xa9\x12\xfa\x0d\xbd\x85\xae\xd3\x9a\x00\
-\x51\x47\xb4\x23\xaa\xfb\xbf\x6b\x82\xa8\xee\xfd\x83\x48\xcf\x46\
-\xbd\x4b\x92\x05\xc6\x00\xec\xd9\xb3\xe7\xff\x89\x75\xed\x0e\xe4\
-\x5b\xf6\x12\x63\x85\x8c\x30\x3e\x4d\xf4\x5e\x1d\x69\x2c\x20\xea\
-\x80\x90\x39\xea\x94\xec\x40\xbc\x07\x42\x2e\xea\x48\xbf\xab\x7c\
-\x21\x37\x3d\x2a\x65\xa7\xae\x1d\xd3\x11\xcf\x44\x5d\xeb\x92\x15\
-\xb3\x1e\xd8\xb7\xa3\x5e\x87\xd4\x94\x54\x57\xbe\x7a\x56\xe3\xd2\
-\x4b\x2f\xbd\x03\x7b\x1f\x7e\x60\x2b\xa1\x6f\x24\x33\x4d\xe5\x97\
-\x32\x94\x95\x6c\xb2\x4e\x31\x0f\xb0\xcb\xa8\x13\xdd\x8f\x0e\x25\
-\xe8\x4f\x72\xa9\x4c\x7c\xb0\x61\x02\x22\x31\xc0\xbf\xb4\x85\xdf\
-\x28\x83\x0f\x46\xbb\xb0\x91\xb1\xe5\x98\x5f\xb4\x0f\x5d\x48\x1b\
-\x79\x5f\xd3\x36\x86\xbc\x4f\xd4\x1f\x0b\xbf\xaa\xf7\x9d\xd6\xf2\
-\xca\x57\xe4\x0d\xbe\xa8\xdd\x75\xed\xec\x47\x25\x8f\xe9\x3b\x72\
-\x0b\x2f\xb4\x21\x01\x1e\xe3\x67\xa0\x87\xe4\x6b\x04\xdf\xfe\x4e\
-\x36\x67\xac\x08\x99\x79\x71\xd0\xc3\x8c\x93\x4e\xf0\xb2\x7e\x95\
-\x63\x52\xd7\x07\x51\x55\x5e\x64\xc7\x53\x0f\xfd\xa0\xfd\x92\x15\
-\x74\x2b\x72\x52\x12\xf6\x30\x49\x8e\x52\x3e\xfa\x6d\xc4\x1b\x24\
-\x1f\xf9\xdb\xd8\x93\x49\x61\x13\xbf\x58\x57\x57\x73\xda\x9c\xb8\
-\x02\x09\x32\xda\x3c\x8c\x9f\x49\x3f\xa2\x4f\x67\x65\xf5\x9d\x20\
-\xda\xfc\xdd\xc4\x42\xd4\x66\xdd\x56\x82\xdf\x06\x7f\xb5\xb6\x0d\
-\xe2\xa9\x88\x32\xb1\x0e\x5d\x99\xd5\x77\x06\xb5\x99\xf8\x0d\xa7\
-\xda\x48\x36\x22\x3b\xb4\x19\x79\x68\xc3\x67\xda\x1c\x72\x73\x5b\
-\x56\x6d\x18\x86\x61\x18\x86\x31\x18\xec\x60\xc7\xf0\xc3\xe1\xc4\
-\x01\xd0\x09\x1d\x0c\x5a\xed\x28\x93\x73\x55\x67\x80\x54\x09\x83\
-\x84\xb2\xf1\xcc\x9c\x48\x28\x11\x70\xd5\x8e\x72\x5d\x09\x82\xa3\
-\xa0\xdd\x3d\x04\x26\x30\xcc\x9b\x1a\x90\x94\xcd\xaa\x67\x3d\x08\
-\x84\x73\xaf\xbe\x82\x9e\xc3\xf4\x59\xa4\x71\xe7\x39\xe4\x05\xa7\
-\x1a\xc7\x46\x81\x42\x1c\x3f\xe4\x09\xa7\x92\x7f\x21\xfe\xc6\xfb\
-\x30\x7a\x31\xd6\xb5\x7b\x98\xe7\x83\xf6\x06\xbd\x32\xea\xdb\x4b\
-\x9d\xa2\x61\x03\x41\x29\x93\xbc\x67\xe2\x09\xa5\x30\xf0\xbf\xe3\
-\xe2\x8b\x2f\x7e\x58\x81\x0b\x78\x20\x87\x8a\x3e\xa9\x3f\x75\xed\
-\x2e\x49\x7d\xa6\x3c\x7c\xe0\x79\x1c\x1c\xf1\x1a\x1e\x52\xaf\x88\
-\xff\x67\xfe\xf2\x9b\x02\x6c\xd5\x77\x36\xe5\x61\x94\xbf\x39\xde\
-\xf9\x7d\xd9\xa5\xce\xc0\x37\x74\x94\xdc\xc6\x39\xc2\x09\x2d\x9d\
-\x23\xfa\x40\xdf\x9b\xf2\x2b\xfa\x3b\x11\x3d\xc4\x7d\xf7\x72\x40\
-\xd9\x2d\xdb\xb6\xbd\xfc\x4e\x39\xe6\x00\xf3\x65\xff\xfe\xfd\xaf\
-\xc9\xaa\x47\x42\xbf\x6f\x12\x11\xa0\x92\xb3\xd9\x54\xfe\x28\xd7\
-\x25\x3f\x63\x1d\xfa\x6b\x4e\x53\x69\x77\xa8\x76\xb4\xa2\x97\x68\
-\x2b\x32\xdc\x74\xec\x73\x8e\x3c\x98\x55\x4f\x04\xc1\xdf\x17\x4b\
-\x7e\xab\xf2\x00\xbf\x99\x93\x6d\x03\x12\x51\xfe\xba\xac\x7e\xe2\
-\xd8\xbd\x7b\xf7\x25\xb4\x5f\x63\x80\xae\x46\x97\x20\x33\x4d\xc7\
-\xa1\x4a\x3c\x93\x63\x73\x64\xad\x80\xe0\x0b\xe3\x0b\xa1\xcf\xf4\
-\xdf\xfc\x5d\x65\xa4\xff\x93\xfe\x30\xea\xda\xc5\x7f\x53\x5f\x49\
-\xa3\xb4\x2b\xde\xf9\xeb\xd9\x7d\xa3\x21\xae\xb9\xe6\x9a\x73\xd1\
-\xd1\x04\x74\x09\x6a\x2a\xa0\xa9\xb1\x19\x66\x3c\x44\x3c\x5b\x92\
-\xc6\xb8\x90\x83\x46\xa4\xe7\xaa\xf5\xd5\xbd\x73\x10\x65\x3b\x26\
-\x7a\x95\xe6\xa8\x88\xf5\xb4\x17\xe0\xe7\x9a\x2c\x05\xf8\x09\xec\
-\x96\xf6\xfd\xb0\xfc\x28\x49\x7c\x0d\x9e\xcf\x09\xfb\x1f\x84\x8e\
-\xdb\x4f\x90\x9e\x64\x84\x12\xe7\xe8\x1e\xc9\x4d\x13\xbe\xa4\x4c\
-\xf4\x9e\x91\x3e\x63\x2d\xc7\x06\x63\x3d\x67\x5e\x90\xf8\xc0\x2e\
-\xa8\x26\x3f\x48\x4a\x40\xfc\x37\x7f\xd3\x26\x2b\xd6\x0c\xda\x83\
-\xde\x65\xed\x90\x1d\x27\x5d\xd8\xa4\x6d\x39\x1e\x13\x39\x99\x54\
-\x62\xf3\xe6\xcd\x2b\x58\x03\xcb\x0d\x8a\xc3\x6e\x58\x13\x55\x79\
-\x0c\x2f\xc4\x63\xec\x03\xf8\x0c\xaf\xe0\x75\xd0\xe7\xb2\x29\x9d\
-\xe0\xf2\xcb\x2f\x7f\x69\xd0\xbd\x24\xfe\x18\x2f\xde\x89\xdc\x48\
-\xef\x35\x19\x97\x6a\x5f\x78\x5e\xbe\x92\x64\x85\x75\x97\xfa\x91\
-\x0b\xc9\x06\xb2\x23\xf9\xc0\x8f\x92\x0f\xd5\x56\x3e\xf2\xb7\xb1\
-\x27\x93\xc0\xba\x75\xeb\xde\xc1\xe6\x20\xae\x2f\xe6\x1b\xa3\x24\
-\xb2\x39\x75\x55\x6e\xb6\x52\x1b\xab\xed\xaa\x23\xca\x45\xbf\xde\
-\x99\xd5\x77\x82\x8d\x1b\x37\xbe\x53\x6d\x2e\x6f\x2b\xa1\xcd\x8c\
-\x87\x6c\x1f\xf8\xd6\x64\x7c\xa1\x18\x8f\x13\xb3\xfa\x4e\x10\x6d\
-\x7e\x2d\xf1\x1b\x9d\x08\x24\x81\xcb\xc9\x35\xf4\x3b\x6d\x66\x6e\
-\xb4\xe5\x73\xc8\xf0\xd8\xaf\x8a\x34\x0c\xc3\x30\x0c\xe3\x05\x0c\
-\x4e\xe8\x60\x44\x71\x25\x06\x3b\x18\x75\x42\x07\x07\x07\x43\x15\
-\x83\xbd\x8d\x41\x82\x11\x85\x91\xfc\x58\xc7\xdf\x2d\x19\x17\x08\
-\x00\x6a\x47\xb9\x3e\x5a\x4c\x00\x0d\x63\x1d\xe3\x1e\x03\xb2\xa9\
-\xf3\x93\x46\xef\x9c\x71\xa4\x41\x18\xa0\x1b\x19\x73\xed\x5a\x55\
-\x90\x01\xc7\x88\xfe\x0c\x32\x9c\x4b\x92\x11\xcd\x73\xc8\x0c\xbc\
-\xa3\x1e\x39\x7e\x10\x46\x39\xc4\x7f\x13\x38\x84\x28\x43\x59\x88\
-\xe7\x82\x8e\x9c\x82\x80\x9f\xaa\x43\xce\x12\xc4\x98\xb4\x69\x5f\
-\x8e\x0d\x0e\xed\xc2\xac\x7a\xa2\xf8\xe0\x07\x3f\xf8\xf2\x70\xac\
-\x0f\x91\xb8\xc3\x29\xc4\x11\x84\x0f\xf4\x4d\xf3\xab\x69\x5f\x4a\
-\x3e\xc3\x07\xf1\xba\x1f\xf1\xbb\xf8\xa5\xf7\x88\xea\xea\x2f\x89\
-\x32\xf1\xec\x85\x53\x53\x53\xdf\x94\x5d\xe9\x0c\xa1\x7f\xde\xaa\
-\x6f\xe8\xc8\x39\xd2\x37\x74\xe4\x1c\xd1\x9f\x26\xbc\x52\xff\x42\
-\xce\x26\x72\xfd\x24\xd7\xde\x95\x27\xaa\x70\xfa\xd1\x9f\xc8\x37\
-\xfc\x6f\xd2\x5e\xfa\x85\x8c\xd3\xcf\x7b\xee\xb9\x67\xe4\x6b\xef\
-\xaa\xfc\xc4\x41\x2e\xbf\x49\x54\xf2\xb3\xae\x4d\x25\xa9\x7d\x5d\
-\xf1\x73\xcf\x9e\x3d\xdf\xac\x6f\xd9\xb1\x3b\x54\xc9\xaf\x61\x76\
-\x87\xaa\xad\x51\xfe\xec\xac\x7e\x22\x08\xe7\xfe\xb7\xfb\x6d\xce\
-\x50\x10\xa5\xad\xfc\x46\xf9\x19\xbd\x3e\x35\xf4\xd6\x06\xd6\x06\
-\xfa\xa0\x35\x11\x99\x6e\xda\x8f\x3a\x52\xdf\x20\xea\x10\xa1\xa3\
-\xaa\x54\xfe\x0e\xc5\x33\x7b\x83\x7e\x90\xb6\xc5\xf8\xde\x48\x3b\
-\x4a\xd2\x33\xd4\x5d\xf7\xee\x7e\xa4\xb6\xc4\x18\x4d\xf4\x7a\xc1\
-\x17\x0a\x3e\xf2\x91\x8f\xfc\xf1\x8d\x37\xde\xf8\x75\x02\xa0\x04\
-\x44\x35\x5f\x4b\x39\x69\x3b\x26\xd3\x91\xea\x6b\x4a\x75\x75\xb4\
-\x25\xea\x89\xbe\xec\x8b\x7e\xfd\x64\x76\x7b\xce\x20\xd6\x82\x6d\
-\x04\xf8\xcb\x4d\x05\x6d\xf5\x6a\x13\x4a\x1e\xcd\x99\x4d\x55\xc2\
-\x87\x3f\xfc\xe1\x33\x48\x8a\x62\x9b\x95\xf2\xdb\xc6\x36\xa3\x8c\
-\xfa\x8f\x1e\x92\x5d\x26\xfb\x17\xfd\xaf\xc4\x87\x92\x1f\xbc\x0b\
-\x22\x21\xa1\xff\xd6\xef\x24\x5f\x78\xa6\xb4\x91\x4b\xfd\x36\xa8\
-\x4d\xfc\x1e\xe5\x67\xcc\x1f\x59\xb7\x6e\xdd\x53\xa5\x4f\x45\x12\
-\x84\x7e\xd1\x17\xfa\x51\xd7\xe6\xe9\x48\x7d\x86\xaa\x3c\xa6\x4e\
-\xf8\x0c\xaf\xe0\x75\x8c\xdf\x85\xd9\x8c\xce\x70\xc1\x05\x17\x7c\
-\x53\xac\x8d\x97\x91\x2c\xc3\xde\x63\xec\xb4\xc6\x97\xe3\x54\xd7\
-\x17\x51\xd9\x97\xaa\xac\x30\xfe\x92\x93\x92\xf8\x1b\x72\xa4\x24\
-\x63\x29\x1f\xa5\xbc\x4e\xf7\xee\x7c\xef\x9f\x66\x57\xc6\x8e\xe5\
-\xcb\x97\xef\xd6\x77\x7d\xf8\x36\x18\x57\x6d\x72\x02\x8f\xb8\x02\
-\x7c\xa2\x8f\xe2\x51\x5d\xfb\xaa\x44\xd9\xe0\xcd\x8f\x65\xf5\x9d\
-\xe0\xf4\xd3\x4f\xbf\x48\x6d\xe6\x84\xbc\x62\x21\x24\x7a\x99\x9f\
-\xb2\x7b\x06\x8d\x29\xa4\x71\x8d\xf2\xbf\x94\xd5\x77\x82\x55\xab\
-\x56\xad\xd3\x35\xd1\x8a\xdf\x70\xda\x11\x5f\x9e\x36\x23\x1f\x92\
-\x89\xba\x76\x56\x29\xf9\x7c\x54\x56\x6f\x18\x86\x61\x18\x86\x31\
-\x18\x9c\xd0\xc1\x88\xe2\xfe\x5d\xbe\xb1\xc1\x09\x1d\x02\xa2\x38\
-\x56\x18\xae\x18\x51\x18\x19\x4d\x8c\x28\x88\x72\x18\x30\x59\xfd\
-\xac\x07\x01\x57\x76\xf7\x10\xc4\x64\xf7\x26\xbb\xe9\x08\x62\x12\
-\xc0\x6e\xb3\x9b\xae\x30\x20\xe7\x54\x42\x09\x84\x11\xfa\x9c\x0f\
-\x14\xe3\xb4\xc8\x10\x6d\x33\xf6\x22\xf1\x02\xe2\x79\xea\x81\xe0\
-\xa5\x48\x7f\xd3\x3b\x44\xf1\xcc\x9e\x6c\x56\x0f\xe1\x18\xbe\x0a\
-\xe7\x9e\xb1\x90\x03\x85\xd3\xa5\x71\x69\xda\xb6\x1c\x1b\xea\x98\
-\x91\x84\x12\x08\x07\xf4\x5b\xae\xbc\xf2\xca\x2b\x08\xe6\x28\xe1\
-\x80\xe3\xd8\x36\x70\x21\xa2\xac\xa8\xe4\x77\x85\x9f\x47\xea\x15\
-\xd5\xd5\x55\x47\x59\xef\xea\x6c\x7e\xe7\xa8\x4b\x6e\xe3\x84\x72\
-\x7d\x89\x9c\x23\xc6\x50\xfd\xa9\x6b\xb3\x28\xdb\x3e\x31\x3d\xb4\
-\x73\xe7\xce\x37\xeb\xca\x4c\x1c\x3a\x5d\x85\xd2\xb4\xcd\x6a\x2f\
-\x65\x79\x86\x04\x44\x56\x3d\x34\xfa\x6d\x16\xa8\x7e\x93\x88\xf7\
-\xd6\xb5\xa9\x24\xda\x87\x3c\x65\xd5\x63\xc7\xba\x75\xeb\xfe\x13\
-\x6d\xe5\x74\x0f\xbb\x43\x95\x4c\xc4\x31\xae\xee\x0e\xad\x6b\x5f\
-\x49\xe2\x65\xe8\x89\x77\x65\xf5\x13\xc1\xca\x95\x2b\xcf\x13\xbf\
-\x09\xa2\x88\xdf\x65\x10\x05\x7e\xb7\xe9\x43\xf0\xbc\x93\xef\x40\
-\xb4\xc1\x55\x57\x5d\x75\x22\x57\xed\x20\x37\xda\x65\x8e\x5d\x30\
-\x8c\xce\x2a\x89\xe7\xda\x50\xf0\xe2\xb8\x6c\x52\x0f\xc1\xcf\xc7\
-\xd1\x9f\x10\xf2\xa1\x80\xcf\x30\xed\x4a\x5e\x1f\xca\xaa\x8d\x21\
-\x10\x76\xe3\xcf\xdd\x74\xd3\x4d\xf7\x92\x54\x42\xf7\xb1\x6e\x6b\
-\x4c\xb4\x16\xb5\x19\x93\xd9\x42\x92\xbf\xf8\xef\x4e\x76\xf3\x4f\
-\x02\xdb\xb7\x6f\x3f\x4a\x27\x3f\xb1\xf5\x38\x59\x51\x9e\xfc\x1c\
-\xd7\xd8\x50\x47\x8c\xf5\x9c\xb3\x81\x01\x49\x25\x6c\x33\xf8\xa2\
-\x13\x27\xf0\xa6\xad\x3e\x91\xbc\xa4\x4e\xe9\x3d\xcf\x1c\x80\xca\
-\xc4\x07\xc4\x9a\x50\x25\xfe\x4e\x19\x25\x09\xaa\xf3\x47\x54\xf7\
-\x6e\x48\xbf\xcf\xf4\x38\x84\xac\xbd\x87\x5b\x1f\xca\xef\x08\xb2\
-\x0e\x8a\xa7\xd3\xf5\x61\x10\xa9\x8f\xe2\xb1\xf8\x2c\x5e\x07\xef\
-\xfe\x67\x36\xa3\x73\x5c\x77\xdd\x75\x6b\x49\x2a\x91\x30\x53\x52\
-\xa9\x6a\xd3\x4f\xd7\xd7\x6a\x5f\xfa\xc9\x4a\x49\x55\xf9\xe0\x5d\
-\x55\x19\x99\xe6\x5d\xfb\xe3\x99\x9f\xc9\xe6\x77\x82\x45\x8b\x16\
-\x7d\x5c\xdf\xf5\xe1\x5b\x92\x7c\xd7\x87\x9b\x3f\x86\x89\x2b\x50\
-\x86\xfe\x65\xd5\x9d\xe1\xd4\x53\x4f\x7d\x5c\x6d\xd6\x6d\x25\xe5\
-\xe6\x30\x8d\x69\x5d\x1b\xab\x44\x9b\xe9\x5f\xe0\x9b\xb3\xfa\x4e\
-\x10\xf6\xf2\x3d\x9c\xea\xe7\x9a\x68\x7d\xc7\x95\xb9\xc6\x69\x36\
-\xf8\x8c\x3e\x91\x5c\xd4\xb5\xb3\x24\xb5\x39\x64\xeb\x7b\xb2\x7a\
-\xc3\x30\x0c\xc3\x30\x8c\xc1\xe0\x84\x0e\x46\x14\x57\x4c\xc9\xd9\
-\x64\xa7\x1e\xc6\x31\x81\x23\x0c\x57\x19\xa9\x75\x46\x48\x95\x28\
-\x17\xc6\x6a\xe7\xdf\x2d\x19\x07\xb8\xee\x4f\xbb\x7b\x74\x2c\x5f\
-\xdf\x40\x91\x43\x29\xa7\xa0\xae\xaf\x25\xc9\x18\x0b\x43\x79\x4e\
-\x9c\xcc\xaa\xe2\x92\x4b\x2e\x39\xf2\x81\x62\x76\xae\x62\x8c\x32\
-\xf6\x38\x2b\x6d\xc6\xbf\x24\x9e\xa9\x52\xe9\xf0\x54\x29\xf8\xf7\
-\x3c\x07\xf8\xd0\xa1\x43\xaf\x26\x38\x45\x50\x99\x20\x3b\xed\x22\
-\x50\x45\xdb\x9a\x8e\x0d\x44\x39\xfa\x12\x32\x7d\x63\x56\x3d\x63\
-\xb8\xe6\x9a\x6b\x56\xcb\x01\x1d\x25\x70\x51\x47\x25\x3f\xeb\x7e\
-\x6f\x42\x39\x16\x87\xc2\x81\xfa\x8d\x6c\xf2\x44\xa0\x04\x48\xe9\
-\x1c\x29\xb9\x8d\x43\x87\x13\x0a\x8f\x9a\xf4\x2d\xfb\x30\xb1\x84\
-\xd2\x8e\x1d\x3b\xde\xa2\x2b\x85\x74\xe5\x04\x27\x3a\x90\x55\xe4\
-\x8e\xb6\x0c\x6a\x37\xbf\x53\x16\x59\x20\x30\x11\x4e\xe1\x48\xd7\
-\xde\xc1\xcf\xba\xcd\x02\x72\x36\x67\x93\x53\x1f\x6d\x3c\xab\xfa\
-\x2d\x3b\x92\x89\xec\x0e\x65\xfe\xe3\x18\xc3\x9b\xa6\x6d\xa5\x5f\
-\x1f\xff\xf8\xc7\xff\x6d\x56\x3f\x11\x2c\x5a\xb4\xe8\x61\xf1\x9b\
-\x20\x4a\x75\x73\x06\xe3\xda\x86\xdf\xe8\x82\xa7\x9f\x7e\xfa\xdb\
-\xb3\xfa\x19\x45\x8c\xc5\xef\x46\x5f\x9e\x65\x3c\xd0\xc3\x0a\x44\
-\x97\xeb\x43\x93\x7e\xb5\x21\xd5\x19\x74\x61\xbc\xe7\x39\x01\xb0\
-\x90\x87\x17\xc3\x53\xf4\x27\x73\x85\xff\x56\xa2\xab\xe9\x7c\x2b\
-\x89\x3e\x84\x7c\x6f\xcd\xea\x8d\x11\x10\xba\xef\x8f\x42\xc7\x3c\
-\xae\xf5\x9a\xb9\xab\x60\x9c\xc6\xa5\xcd\xd8\xcc\x24\xd1\xce\x68\
-\xf3\xc3\x21\x53\xaf\xcb\xee\xcd\x49\x84\x4e\x3d\x9a\x75\x55\x7a\
-\x69\xd8\xe0\xee\x74\xc4\xf3\xcc\xa3\x7c\xe5\x9c\x44\xe8\xb8\xd7\
-\xe9\xc4\x09\xba\x45\x3e\x90\x74\x4a\x1b\xfb\x8c\x72\x22\x9e\x13\
-\x51\x4f\x49\xcc\x0b\x51\xf9\x77\x95\x2f\xeb\xa9\x7b\x4f\x49\xf9\
-\xae\x3d\xd1\xde\x57\x66\x97\x66\x14\x3b\x77\xee\xbc\xa6\xfc\x6e\
-\x97\x36\x87\xa0\x0f\xd4\xb7\xba\x7e\xb4\xa5\x92\x47\xf0\x31\xea\
-\xfe\x89\x6c\xc2\x44\xc0\x09\x4d\x7c\x27\x9d\xd0\x2c\x6d\x7a\x8d\
-\x65\x93\xbe\xaa\x0f\x94\x87\x4a\x79\xa8\x92\xca\xa8\xee\x41\xf5\
-\x67\xbd\x13\xd9\x20\xa6\x9b\x3f\x88\x2b\x84\x6d\xdc\xfb\xae\x8f\
-\x4e\xa9\xb5\x8d\x2b\x50\x26\xe4\xe5\xae\xac\xba\x33\x94\x6d\xd6\
-\xc9\xba\x61\xbf\x45\x44\xdf\xa2\xec\xe3\x59\x75\x67\x88\x36\x7f\
-\x8d\x6f\xa4\x8e\x63\xb3\x00\x65\x42\x5e\xbf\x9c\x55\x1b\x86\x61\
-\x18\x86\x61\x0c\x06\x57\x22\x71\x45\x0f\xdf\xd8\x20\x18\xaa\x6f\
-\x3e\x28\x18\x8a\x51\x8c\x11\xd5\xd4\x20\x81\x28\x1b\xcf\xcc\x89\
-\x1d\x8a\x0a\xb8\xf2\xfd\x24\x82\x98\x1c\xcb\x67\x77\x4f\x79\xdd\
-\x1f\x06\x64\x53\x63\x8c\xb2\x59\xf5\x9c\xc4\x87\x3e\xf4\xa1\x35\
-\x3a\xc1\x30\xce\x9d\xe8\x22\x9e\x2f\xeb\xd0\xff\x47\xdd\x7b\xe2\
-\xdf\xbe\x57\x03\xe8\x9e\x79\x02\xe1\x18\xf7\xe5\x2e\xc0\xa6\xe3\
-\x93\x72\xd9\x7b\x2e\xab\x9d\x51\x5c\x73\xcd\x35\xef\xc6\x01\x1d\
-\x47\xe0\x62\x5c\xa4\xf1\x88\xf7\xcf\xc8\xfc\x9d\x2e\xb9\x2d\xe7\
-\xa8\xcd\x78\x87\xdc\x4e\x34\xb1\x1d\x3a\xe4\x5e\x9c\x67\xbe\xfd\
-\x23\xa7\x4e\x89\x04\xe6\x90\xf8\x5b\xd7\x5e\x11\xfd\x43\x06\xe8\
-\x6f\xe8\xe0\x91\xae\xbd\xe3\xf4\xe5\xa0\xcd\x02\xb3\x85\x9f\xb1\
-\x06\x3d\x40\x5b\xc7\xf5\x2d\x3b\xfa\x95\x55\x4f\x0c\x25\xbf\x91\
-\x83\xaa\xfc\xb6\xd1\x57\x94\x89\xfe\x7e\x26\xab\x9e\x15\xb8\xe2\
-\x8a\x2b\xbe\x7f\xef\xde\xbd\xe7\xa0\x8b\x59\x1f\x90\x6d\x9d\x1c\
-\x63\x6c\xa4\xb3\x9a\xf4\x6f\x10\x51\x47\xd4\xf7\xc1\xe0\xd7\xcf\
-\xe7\xeb\x9f\x83\xe0\xe9\x6b\x90\x0d\xd6\x04\x74\x28\xeb\x02\x7a\
-\xb4\xdc\x6c\xd0\xa6\x2d\xb4\x3d\xfa\xf1\xdb\x59\xbd\x31\x06\xc4\
-\xd8\x9c\x12\xe3\xf4\x97\xac\xd7\xb2\x25\xca\xc4\xd2\x38\xe5\x65\
-\x9c\xa4\x36\x05\x3d\x1e\x6d\x7c\x5f\xb4\xf5\xdb\xb2\x4b\x73\x1a\
-\x9c\x9c\x94\x9d\x5b\xbd\xd6\x5a\xe3\x51\xc7\x8f\xa6\x04\xcf\xa2\
-\x9e\x39\x79\x3a\xa9\x8a\x1b\x6f\xbc\x71\x05\x09\x37\x12\x20\xd2\
-\x73\xc8\xee\x30\xf6\x59\x21\x4f\x7d\x89\xfa\xca\xf9\x50\xa5\xba\
-\x7a\x4b\x52\xb9\xd9\xc8\xff\xf3\xce\x3b\x6f\xaf\x12\x0a\xe8\x6a\
-\x25\x99\xcb\x35\xa3\xae\x4f\xc3\x10\x75\x51\x6f\xbe\x7a\xa2\x88\
-\xfe\xfd\xda\x4d\x37\xdd\xf4\x67\xf4\x91\x4d\x30\xac\xf9\xe5\x06\
-\x87\x72\x7c\xeb\xda\x5e\x92\xca\x35\xa5\xba\x3a\x44\xfc\x1e\xef\
-\xbe\x29\xf8\xf2\x6b\xd9\xd4\x4e\xb1\x7e\xfd\xfa\x1f\xc6\x16\xe2\
-\xb4\x39\x71\x05\xbe\xa3\xc5\x26\x2b\xfc\x9d\x32\xae\xd0\xb4\xed\
-\x50\x94\x5f\x97\xd5\x77\x82\xd0\x8b\xff\x96\x58\x88\xda\x5c\x6e\
-\x0c\x43\x07\x68\x63\x18\x63\x58\xd7\xce\x2a\x51\x2e\xca\xef\xce\
-\xea\x3b\xc1\x96\x2d\x5b\xbe\x13\x3e\x13\xbf\x29\xaf\x89\x26\x21\
-\x8e\x3d\x24\x1f\xb9\xc9\x1c\x13\x9f\xa3\xfc\x47\xb3\x7a\xc3\x30\
-\x0c\xc3\x30\x8c\xc1\xd0\x09\x1d\xae\x7c\xe3\x4a\x24\x7d\xf3\x81\
-\x84\x02\x46\x14\x46\xbf\x8c\xa8\xff\xaf\xbd\xbb\x8f\xd5\xf2\xbc\
-\xef\x03\x5e\xed\x25\xea\xb4\xa9\x9d\xd2\x3f\xb6\x76\xea\xd4\x54\
-\x4d\xa4\xb5\xdb\x52\x4d\x8a\xb6\x75\x51\xb6\x34\xfb\x63\x5d\xa7\
-\xac\xea\xda\x24\x55\xb3\x69\x99\xb2\x55\x59\x13\x55\x9b\xe2\x26\
-\xb1\x83\x39\xe6\xed\xf0\x6a\xc0\x9c\x83\x01\x83\x01\x63\x63\x63\
-\x1b\xfb\x18\x9b\x97\x60\x1c\x0c\x76\xc0\x18\xe3\x98\x77\x0a\x06\
-\x8c\x61\x69\x3d\x79\xda\xd2\x48\xa9\x96\x6e\xbb\x77\x7d\xef\xdc\
-\x17\x7a\x7c\xf2\x00\xe7\x60\xc0\x87\xc3\xe7\x23\xfd\x74\xe0\x9c\
-\xfb\xb9\xdf\x9e\xfb\x7a\x9e\xe7\xbe\x7e\xcf\xef\xba\xc6\xfa\x81\
-\x24\x1f\x9c\xcb\xe3\xde\xd3\x79\x1f\xc6\x2a\xc3\xfd\xa5\x5c\x3c\
-\xf3\x27\xd5\xb2\xfc\x3a\xec\xdb\x78\xbe\xb9\x59\x8f\xbd\x7c\x60\
-\xbf\x29\x2a\xb3\x2e\x67\xf3\xe6\xcd\x0b\x73\x0e\x6a\x65\x40\x3a\
-\x82\xea\x8d\x74\xbd\x0e\xae\x74\x3e\xc6\x12\x75\x3d\x63\xb9\x01\
-\x2e\x37\x6a\x2f\xe5\x9b\xfe\xe9\x9c\x4d\x27\xc8\xe8\xb9\x3c\xc6\
-\xb2\x4f\xd9\xf7\xdc\x68\xa6\x63\x20\x55\x4f\xdd\xaa\xdf\x53\xcf\
-\x3e\xfb\xec\xcf\x97\x0f\xff\x2b\x72\x03\x9a\x6f\x73\xe7\x5c\xd7\
-\x36\x57\x6f\xb6\xc7\xd2\xf6\xde\x4d\xd4\x73\xd7\x6d\x6b\xe4\xed\
-\xb7\xdf\xfe\xc5\x6e\xf7\x6e\xb8\x3a\x87\x4e\x4d\x6e\xf7\xce\xa1\
-\x53\xaf\xc3\xda\x1e\x2f\x77\x4e\xf2\xb7\x2c\x57\xce\xe3\x0d\xed\
-\x5c\xc9\x3c\x4a\x19\x7b\xbd\x37\x31\x9d\x4e\xee\xda\xe9\x3e\x96\
-\xe7\xb2\xdb\xef\xf6\x06\x36\xed\xaf\x5b\xf5\x55\xe9\x3d\x9f\xf5\
-\x66\xb3\xf7\xcb\x02\xe3\xb9\xd9\xcc\x72\xd7\xf3\x7c\xde\x7e\xfb\
-\xed\xed\xbe\xe6\xb5\xb8\x26\x63\x92\x94\xcb\x73\x9f\xb6\xde\xfb\
-\xdc\xf7\xdb\xc7\xde\xc8\x32\xa5\xfd\x1c\xee\x56\x7d\x43\xdc\x77\
-\xdf\x7d\xbf\xd0\x7b\xbe\xeb\x64\xe4\x57\x7b\xfd\x76\xe7\x7b\x53\
-\xb7\xfa\x09\xa5\xbc\x0e\xff\x6a\x79\x7f\xd8\x99\xeb\x28\x1d\xd2\
-\xb9\x96\x92\xc4\xc9\x75\x3b\xfa\x75\xeb\x72\xc7\x59\xa3\x2e\xd7\
-\x13\x9b\xcb\xba\x2e\x5b\xe9\xbb\x77\xef\xde\x29\x19\x9e\x2a\x9d\
-\x94\x39\xc7\x69\x6b\xf5\x5a\x19\xcf\xe7\x96\x1a\x79\x5e\xca\xfb\
-\x49\x3b\x37\x13\xd7\x4e\x79\x5e\x7e\x6a\xff\xfe\xfd\x77\x1c\x3a\
-\x74\xe8\xb5\x3c\x37\xb9\x56\xea\xfb\x76\xae\x95\x9c\xf7\xf1\x5e\
-\x2f\xd7\x2b\xea\xf6\xcb\xbe\x64\x6e\xae\x7f\xd7\x1d\xc2\xa4\xb1\
-\x78\xf1\xe2\xc3\x19\x4e\x74\xfd\xfa\xf5\x17\x2b\x46\xf2\xfe\x94\
-\xe7\xa4\xb6\xdb\x7e\xe7\x65\x2c\x91\xf3\x56\x9e\xcb\x49\x91\x4c\
-\xea\x55\xae\xdf\x39\x79\x9d\x4b\x52\x34\xef\xc9\xfd\xae\xdd\xf7\
-\xf2\xba\xed\xb9\x66\x27\x4c\x55\x52\x3f\x1b\x37\x6e\xdc\x99\x8a\
-\xe3\x8c\xfe\x90\x7b\xcb\xfa\x05\x8b\x7a\xdd\x5d\xcb\xf3\x57\xd6\
-\x79\xa4\xdb\xec\x7b\xa2\x7c\xc6\xfa\x4c\x79\x7f\x7c\xa5\xf7\x4b\
-\x17\x39\xd6\x5c\x37\xbd\xd7\x4c\xbf\x7d\xbf\x56\x51\xaf\x8b\x12\
-\xaf\x96\x6d\xfe\x4e\xb7\x6b\x37\x44\xf9\xfc\x73\x5b\x3e\x0b\x65\
-\xee\xce\xbc\xde\xf4\x56\xa8\xe5\x3e\xa7\x7e\x1e\xae\xfb\xd8\x6f\
-\xff\x6b\xe4\xef\x39\x5f\xe5\xfc\x7d\xa6\x5b\xfd\x75\x51\x5e\x1b\
-\x07\xea\x68\x25\xf5\x35\x32\x7d\x21\xd9\xe7\x7c\x0e\xcf\x6b\x64\
-\xf6\x39\xfb\xd2\x6f\x3f\x47\x47\x9e\xe7\xf2\x99\xe8\x0f\xba\xd5\
-\x5f\x17\x4b\x96\x2c\xf9\x7c\xf6\x39\xe7\x39\x23\xac\x8c\x9e\x73\
-\xf6\x6a\xce\x73\x59\x7e\x46\xb7\x7a\x00\x80\x2b\xab\x15\x3a\x57\
-\x1a\x66\x68\xf4\x8d\x53\xbf\xc8\xdf\x13\xb9\x41\xe8\x56\x3f\xe1\
-\xa5\x22\x22\xe5\xe2\xbd\xdf\xe0\x4f\x07\x55\x2d\x17\xcf\xcd\x63\
-\xef\x0d\xcf\xa5\x22\x7f\xcf\x39\x2a\xe7\x6a\x52\xdc\x50\x6f\xdf\
-\xbe\xfd\xd7\xf3\x0d\xcd\x7c\xfb\xbb\xde\xfc\x8d\x4e\x74\xd4\x63\
-\xef\xf7\xe1\xb4\x5f\x8c\x3e\x5f\x25\xc6\x7c\x03\xfc\xf4\xd3\x4f\
-\xef\x4f\x67\x78\x3e\xe0\xe7\xf9\xc9\xf5\x99\x1b\x93\xda\x29\x3e\
-\x96\xeb\xb3\x7b\x7e\xda\xc7\x4c\x94\x84\x52\xb5\x6b\xd7\xae\x0f\
-\xec\xdb\xb7\x6f\x59\x6f\x07\xed\xe5\x3a\x2e\x6a\xf4\x3b\xcf\x57\
-\x8a\xde\xc7\x67\x9d\x65\xdd\x7f\x5c\x62\x41\xb9\xf9\xb9\xa1\x43\
-\x84\x8c\x36\x6f\xde\xbc\x36\xb9\x9d\x6f\x08\xd6\x9b\xa3\x67\x9e\
-\x79\xa6\xed\x80\xc8\x8d\x79\x3a\x73\x7a\x3b\x20\x2e\xf5\x7c\xd7\
-\xbf\x65\xb9\x1b\x9d\xd8\xce\xb0\x77\xbd\x37\x76\xf5\x1b\x99\x49\
-\x26\xa4\xc3\x7d\xbc\xd7\x69\xae\x85\xd2\x06\xaf\x6a\xd8\xbb\xfa\
-\x65\x81\x9c\xcf\xdc\x20\xd7\x7d\xaa\xe7\x73\xac\x6d\xe7\x46\x9c\
-\xcf\xd5\xab\x57\xff\xcd\xbc\x16\x67\x5f\x33\x71\x7c\x4d\x26\x26\
-\x61\x90\x7d\xed\xd7\xf9\x74\xa9\xc8\xdf\x73\x4c\xe5\x7c\xdf\xd0\
-\xe1\xcb\xca\xf3\xfe\x95\xde\xf3\x9d\x2f\x67\xf4\x9e\xef\xb1\x5e\
-\xbf\x89\x7a\xbe\xcb\x75\xf0\x8e\x39\x83\x26\x9a\x72\x6d\xfe\x4e\
-\x79\xaf\x7c\xa0\xbc\x9e\xfe\x71\xed\x38\xab\xaf\x5b\x89\x3c\x0f\
-\xf5\xfa\xea\x77\xbc\xf5\xf7\x5d\xec\x2d\xc7\xfc\xf5\x12\xbf\xdc\
-\xad\xfe\xb2\xb6\x6d\xdb\xb6\x29\xaf\x0f\x89\x54\x5b\xe4\x5a\xc9\
-\x17\x41\x6a\x07\x79\xb6\x5f\xb7\xd9\xef\x75\xb0\x37\xba\x7d\x39\
-\xd9\xad\x9a\xeb\xa4\x7c\x96\xf8\x95\x12\x43\xe5\x75\xed\xad\xbc\
-\x26\xe6\x7a\xa9\x89\xc8\x7a\xbd\xd4\xeb\xa1\xf7\x3a\xe9\xf7\x9c\
-\xbd\x9b\xe8\x5d\x77\x8d\x6c\xb3\x6c\xff\x81\x12\x7d\x2b\xe2\x26\
-\x83\xf2\x39\xf7\x70\x92\xdd\xf5\xbd\xf5\x6a\xbf\x7d\xdf\x2f\x72\
-\x0e\xcb\xb9\x9b\x74\x09\xa5\xaa\xbc\xb6\xcc\x2e\xaf\xe3\x2f\xe6\
-\x3d\x39\xe7\x2b\x9f\x87\xf3\x7a\x7e\xb9\xeb\xb6\x46\xbf\xf3\x75\
-\x35\x31\x7a\xbd\x65\x7b\x3b\x73\xce\xcb\x3e\x4c\xd8\x44\x52\xaf\
-\xf2\xf9\xfd\xcb\x3b\x76\xec\xf8\x5e\x3e\xbf\xd7\xeb\xae\xde\x63\
-\xe5\x1c\xf6\x1e\x5b\xbf\xe3\x1f\x4b\xe4\xb1\x65\x7d\x13\x62\xe8\
-\xd2\x72\x9c\x9f\xfb\xf6\xb7\xbf\x7d\xb8\x8e\x40\xd0\xef\x9a\xb9\
-\x16\xc7\x5c\xa3\x77\x5d\x25\x0e\x94\x6d\x7c\xbe\xdb\x95\x1b\x6a\
-\xee\xdc\xb9\x5b\xf2\x59\xa8\x56\x44\xf6\xce\x25\xd9\xdb\xaf\x70\
-\xb9\x36\x53\x23\xe7\x29\xd7\x47\x89\x9f\xed\x56\x7f\x5d\xcc\x9e\
-\x3d\xfb\xf9\xf4\x85\xf4\xab\xe2\xec\xfd\x52\xd8\xe8\xeb\xb4\x5f\
-\xe4\x98\xb2\xcf\xe5\x73\xc8\x47\xba\xd5\x5f\x17\xe5\x33\xfe\x86\
-\x9c\xe7\xd1\xfd\x37\xf9\x42\x70\xee\x8f\xc7\x73\x9e\xf3\xf7\x1c\
-\x5b\x59\xfe\xd7\xba\xd5\x03\x00\x5c\x59\xad\xd0\xc9\x87\xa8\x54\
-\xe8\x6c\xd8\xb0\xe1\xe2\xe4\xa9\xf9\xe0\xd7\x7b\xc3\xdf\x7d\xa8\
-\x6b\x3f\x74\xf4\x8b\xfc\x2d\xcb\xe5\x03\x73\xb7\xfa\x09\x2d\xc3\
-\xfd\xf5\x2b\x17\x4f\xc7\x54\x1d\xa2\xa8\x7e\x20\xab\xc7\xdf\xef\
-\xb8\x13\xf5\xd8\xcb\xf2\x37\x45\x65\xd6\x58\x25\xa9\x54\x6e\x8a\
-\x66\xe7\xe6\xaf\x76\x18\xd6\xeb\x21\xc7\xdd\xef\x43\xea\x25\x6e\
-\x6e\xea\x87\xda\x9d\x89\xf2\xf8\x71\xdd\x00\x8f\x8c\x8c\x7c\x32\
-\xdf\x72\xcb\x30\x58\xf9\xa6\x5b\x3a\xea\xf3\x1c\xf5\x7e\x1b\xfd\
-\x72\xcf\x4f\x22\xcb\xe4\xda\xcc\x4d\x6c\xb9\xb6\x5f\xe8\x56\x3d\
-\xa1\x94\x1b\x81\x0f\x94\xe3\x5a\x5a\x6e\x06\x4e\xd7\x6f\x73\xf7\
-\xb6\xbf\x1c\x47\x77\x1e\x7f\xe4\xfc\xf6\xde\x58\x8e\x8e\xde\xe5\
-\xea\xe3\xcb\xfa\x36\x96\xf5\xfe\x9b\x6e\xd3\xef\xb9\xd1\xd5\x92\
-\xbd\xdf\x10\x4c\x87\x7c\x4d\xca\xd4\x73\xd1\xef\xf9\xae\xbf\xaf\
-\xcf\x75\xb7\xea\x1b\xaa\x77\xb8\xb3\x54\xfa\xa5\xfa\x2c\xdf\x6e\
-\xae\x37\xa4\xfd\xf6\xbb\x46\xdd\xf7\x44\x9e\xfb\x5c\x03\xe5\xf1\
-\xdf\xea\x56\x3d\x2e\xf5\x7c\xe6\xdb\x8b\x4b\x97\x2e\xbd\xf8\xad\
-\xf4\x3a\x9c\x65\xed\xcc\x99\x08\xe7\x73\x68\x68\xe8\x8b\x79\x2d\
-\xce\xbe\xf6\x76\x78\xa6\x9d\x67\x5f\x73\x1e\x46\x27\x58\xfb\x45\
-\xef\xfe\x96\xe3\xfb\x5c\xb7\xfa\x1b\xa2\xbc\x87\x6e\x4f\x87\x44\
-\x3d\xdf\xb9\xb9\xef\x9d\x37\x22\xe7\xfb\x2a\xde\x4b\x3f\xd6\xad\
-\x7e\xc2\x3b\x78\xf0\xe0\xc7\xca\xeb\xea\xec\xf2\x5c\xbd\x5c\xae\
-\xdd\xf2\xb2\x7c\xf6\xfb\xb9\x66\x72\x1c\x7d\x8e\xf9\xed\x12\xc7\
-\xca\xef\xb7\x95\x65\xbe\x58\x96\xfd\xb9\x6e\x35\x63\x56\xde\x0b\
-\xce\xa5\xd3\x27\x9f\x59\xf2\xbe\x9d\xe1\x11\x6b\x47\x4a\xce\x75\
-\xb6\x5d\x5f\x27\xfb\xbd\x26\xd6\xa8\xaf\x8b\x65\x5f\x56\x77\xab\
-\xe6\x06\x38\x76\xec\xd8\xaf\x97\x98\x5f\xae\x97\xfd\x79\xad\x4b\
-\xfb\xae\xd7\x4b\xbd\x4e\x2e\xf5\x5e\x97\xe8\xf7\x5c\x8e\x8e\x7e\
-\x8f\x4b\xd4\xf5\x96\xf8\xa3\xb2\x9d\x07\xca\x76\x7f\xbf\xbc\xbf\
-\x5c\xd7\x0e\xcb\x89\xa0\xbc\xaf\xde\xd7\x9b\xb0\xcf\xd0\x48\xf9\
-\xc2\x43\x3e\xeb\xe6\xbc\xe7\x9c\xf7\x3b\x8f\x57\x8a\x9c\xd3\xf2\
-\xd8\x49\x9b\x4c\x1a\xad\xbc\xc6\xcc\x3c\x71\xe2\xc4\xee\xbc\xce\
-\xe4\xf3\xe7\xa5\xae\xdb\x1a\xbd\xd7\x5e\xbf\xf3\x77\xa9\xe8\x7d\
-\x5c\xa2\x67\x9d\x13\xba\x1a\xe9\x72\x76\xee\xdc\xf9\x73\xbb\x76\
-\xed\x5a\x5e\xee\x2b\xde\xaa\x89\x96\x7e\x9f\x71\x47\x1f\x7b\xbf\
-\xf3\xd3\x1b\x75\xb9\x3c\xb6\x3c\x1f\xff\xa1\xdb\xdc\x84\xf0\xea\
-\xab\xaf\x7e\xa1\x5c\x33\x1b\xcb\x35\xf3\x3f\x46\x5f\x33\x39\xde\
-\x77\x7b\xcc\x35\xca\x3a\xfe\xa8\x9c\xc3\x59\xe5\xb5\xf4\x1f\x74\
-\x9b\x7e\x4f\xdc\x75\xd7\x5d\x7f\x92\xcf\x42\x75\xce\xb6\xcc\x85\
-\x9a\x7e\x85\x24\x12\x6b\xbf\x42\x8e\x3f\xcf\x77\x7d\xce\x2f\x15\
-\x39\x47\x65\xd9\x1f\x74\xab\xbe\x6e\xca\x67\xe5\xef\x66\xb8\xe2\
-\xde\x79\xe6\xea\x3e\xe7\x3a\xcd\x7b\x54\xf6\xa5\xf7\x39\xeb\x17\
-\xf5\x98\x72\x7c\xdd\xaa\xaf\x9b\x69\xd3\xa6\xbd\x51\x87\xec\xcf\
-\x1c\xa9\xb5\xff\xa6\xf7\x3c\xa7\x6d\x8d\xf5\x3c\x27\xca\x71\xfe\
-\x64\xb7\x7a\x00\x00\xb8\x36\xf6\xee\xdd\x3b\xe7\xc0\x81\x03\x83\
-\xf9\x90\x5a\x13\x1d\xb5\x83\x37\x71\xb9\x0f\xab\xdd\x87\xd9\xe7\
-\xcb\x72\x37\xe5\x0d\xf0\x7b\xa5\x9c\xeb\x0f\x1e\x3e\x7c\xf8\x0b\
-\xc7\x8f\x1f\x7f\xb8\xdc\x84\x5e\xc8\xcd\x41\x6f\xa7\xdb\xa5\xce\
-\x7b\x6e\x4c\x6b\xf4\xfc\xfe\xcf\x4a\x7c\xb3\xc4\xf4\xf2\xfb\x5f\
-\x7b\xfb\xed\xb7\x7f\xa2\xdb\x0c\x4c\x08\xe5\xc6\xf8\x7d\x89\x72\
-\x63\xfc\x97\x7b\x63\xe7\xce\x9d\x7f\xe9\x6a\xa2\x5b\xed\x0d\x53\
-\xf7\xff\x66\x3e\x86\x6b\xed\xec\xd9\xb3\x7f\xbd\xc4\xdf\x39\x75\
-\xea\xd4\xc7\xcb\xcf\x5f\x3e\x77\xee\xdc\xcf\x34\x4d\xf3\x17\xbb\
-\x3f\x5f\xb5\xad\x5b\xb7\xfe\x74\x2a\x8a\x33\x71\x76\x92\x8f\x1b\
-\x37\x6e\x6c\x3b\x52\xea\x90\x3a\xb5\xf3\x27\xaf\x81\x57\xea\x98\
-\xeb\x3a\xe2\xf2\x5a\x3a\xa1\x3a\x21\x6f\x25\xc7\x8e\x1d\xfb\xa9\
-\xf2\x7e\xf7\xa9\xf2\xd9\x62\x69\xb9\x56\x76\x97\xf7\xba\x0b\x79\
-\xaf\xab\x1d\xcd\xf5\xbd\xae\xdf\xfb\x5d\x8d\x51\xef\x77\xef\x88\
-\xee\xb1\x7f\x56\xe2\xf9\x12\xb3\xcb\x7b\xe8\x6f\x94\xf5\xff\x74\
-\xb7\xf9\x5b\xc6\xd0\xd0\xd0\xca\x4c\xde\x5e\xbf\xf0\x90\x6a\xef\
-\xfa\xc5\x9c\x9c\xe3\x9c\xab\x7e\x6d\xe4\x4a\x91\x73\xdf\x6d\xe2\
-\x96\xd3\x25\x97\x66\x74\xd7\x6d\xfb\x19\xad\xf7\xba\xad\xd7\xee\
-\xe8\x6b\xb2\x46\xce\x5d\x8d\x7e\x7f\xef\xae\xd9\xf6\xf3\x73\x59\
-\xf7\x65\x87\x01\xbd\xd9\xbc\xf2\xca\x2b\xbf\x7d\xf0\xe0\xc1\xc7\
-\xcb\x67\xdc\x73\x49\x2c\x25\xd1\x72\xb9\x36\xdf\x7b\xae\xfa\x9d\
-\xaf\x2c\x5b\x1e\xf7\x9d\xbc\xe7\x74\x9b\x98\x70\x0e\x1d\x3a\xf4\
-\x4f\xcb\x35\x33\xa3\xb4\xb9\x3d\xf5\x3e\x6a\x2c\xaf\x73\x97\x38\
-\xf6\xff\x5e\x96\xcd\xf0\xb0\x03\xe5\x35\x6d\xc2\x7c\xf9\xe4\x66\
-\xfc\x2c\x64\x9f\x7f\x18\xdd\xaa\x01\x00\xe0\xfa\xe9\xb9\x89\x9e\
-\x5e\x6e\xde\x76\x95\x9b\xa2\x5d\xe5\xa6\x26\x37\xbd\x89\xbb\x72\
-\xe3\x5b\xa3\x7b\x08\xef\x52\xb9\xf9\xfc\xfb\xe5\x7c\xff\xc6\xeb\
-\xaf\xbf\xfe\x7b\x67\xce\x9c\x99\x52\xce\xfb\x92\x72\x23\xfa\x68\
-\xb9\x91\xdc\x59\x7e\x1e\x2b\xf1\x52\xf9\xf7\x33\xe5\xfc\xaf\x29\
-\x31\xbf\xc4\x57\xcb\xff\x3f\x5f\x6e\x38\xff\x71\xb7\x0a\x80\x9b\
-\xde\xba\x75\xeb\x3e\x9b\x4a\x8b\x54\x32\x26\xb1\x94\x6f\xe6\x66\
-\x78\x9a\x77\x93\x50\x2a\xaf\xab\x1f\xec\x56\xcf\x04\xf0\xda\x6b\
-\xaf\xfd\xd5\xf2\x3e\xf7\xe1\x93\x27\x4f\xfe\x56\x79\x6e\xbe\x52\
-\xde\xef\xe6\x95\x18\x2a\xef\x73\xf7\x97\x78\xb8\x3c\xbf\x23\xe5\
-\xfd\x6d\x7b\xf9\xb9\xbb\xfc\x7c\xaa\xfc\x5c\x53\xde\xeb\x16\x96\
-\xbf\x0d\x94\xf8\x83\xf2\xff\x7f\x5b\x3e\x7f\xfc\xab\xf2\xef\x8f\
-\x96\xf8\xa5\x6e\xb5\xb7\xb4\x7c\x03\x7f\xfe\xfc\xf9\x6d\x9b\xa9\
-\xf3\x85\x66\x78\xe7\x77\x93\x50\x4a\xfb\x29\x8f\xbb\x65\xaa\x93\
-\xc6\xa2\x7c\x36\xfe\x44\x3e\x1b\x77\x9f\x8f\xa7\xd5\x28\xe7\xb8\
-\x7e\x46\xee\x17\x19\xba\xae\x8d\x5b\xf1\xb3\x73\x79\xcd\xfe\xc9\
-\x72\xde\x3e\x5a\xda\xfb\x17\x4a\x7b\x1f\x2c\xc7\xbf\xac\xb4\xff\
-\xc7\xca\x79\x7b\xae\xb4\xdf\x57\x4b\x1b\x3f\x5a\xe2\xc5\x72\x7e\
-\x36\x95\x76\xbe\xb6\xfc\x7b\x51\xf9\xf7\x40\xf9\xf7\xbf\x2f\xff\
-\xfe\x58\x89\xbf\xd5\xad\xea\xa6\x51\xf6\xf9\xfd\xe5\x98\xff\x45\
-\x39\xe6\xcf\x96\xe3\xff\xaf\xe5\x98\x67\x95\xe3\x5d\x59\x7e\xff\
-\x54\x39\xe6\x3d\x25\x4e\x94\xd8\x5b\x62\x4b\x39\xd6\x87\xca\xcf\
-\xa1\xf2\x73\x7a\x89\xcf\x96\xe3\xfe\x50\xb7\x1a\x00\x00\x00\x00\
-\xe0\x72\x56\xac\x58\xb1\x2c\xc3\xbc\x64\x78\xc4\x74\x8e\xd7\x21\
-\x75\xea\x7c\x07\x67\xbb\x61\x50\xaf\x94\x4c\x4a\x74\x1d\xe2\xa7\
-\xbb\x55\xc3\xa4\x94\xf9\x52\x2f\x97\x50\x7a\xb3\x1b\x82\x6a\x2c\
-\x6d\xa6\x46\x4d\xc6\x76\x9b\x00\x00\x00\x00\x00\x80\x89\x65\xfe\
-\xfc\xf9\x47\x32\xf7\x61\xe6\x2b\xab\x9d\xe3\xcf\x3d\xf7\x5c\x3b\
-\xf7\xe3\x89\x13\x27\xda\x61\x84\xc6\xda\x39\xde\x25\x94\xd6\x74\
-\xab\x86\x49\xe9\xf6\xdb\x6f\x6f\x7a\x13\x4a\x99\x23\x24\x6d\xe6\
-\xdd\x26\x94\x54\x27\x01\x00\x00\x00\x00\x4c\x42\xcb\x97\x2f\xff\
-\xdb\x5f\xfe\xf2\x97\x9b\xaf\x7f\xfd\xeb\x6f\xcd\x9a\x35\x6b\x6f\
-\xaa\x16\x86\x87\x87\xbf\xb4\x74\xe9\xd2\x7f\xd4\x2d\x32\xe1\xdd\
-\x77\xdf\x7d\xef\x1f\x18\x18\x68\x66\xce\x9c\xd9\x2c\x5e\xbc\xb8\
-\x9d\x47\x69\xf4\x7c\x30\xe9\x1c\x1f\xeb\xf0\x5d\xa9\xb0\xb8\x60\
-\xfe\x24\x26\xb1\x05\x0b\x16\xac\x2e\x6d\xbe\x99\x3e\x7d\x7a\x9b\
-\x84\xed\xd7\x66\x52\xd1\x37\xd6\x36\x53\x43\x75\x12\x00\x00\x00\
-\x00\xc0\x24\x35\x3c\x3c\xfc\xf1\xdb\x6e\xbb\xad\xf9\xca\x57\xbe\
-\xd2\xa4\x62\x21\x9d\xcc\x77\xde\x79\xe7\xc5\x18\x18\x18\xf8\xf3\
-\xc1\xc1\xc1\x33\x0b\x16\x2c\xd8\xbe\x68\xd1\xa2\xc5\xcb\x96\x2d\
-\xfb\x5c\x89\xbf\xd7\x3d\x7c\x42\x18\x1a\x1a\xfa\x62\xf6\x35\x09\
-\xa5\x0c\x79\xb7\x76\xed\xda\x66\xd3\xa6\x4d\xcd\x8b\x2f\xbe\xd8\
-\x1c\x3c\x78\xb0\xc9\xe4\xee\xe9\x1c\x4f\x67\x77\xbf\x4e\xf0\xd1\
-\x91\x4e\xf4\x73\xe7\xce\xfd\x7c\xb7\x7a\x98\x54\xe6\xcd\x9b\xb7\
-\xfa\xab\x5f\xfd\x6a\xdb\xbe\x67\xcd\x9a\xd5\xb6\x99\x07\x1e\x78\
-\xe0\x62\x9b\x39\x74\xe8\xd0\xc5\x36\x33\x9e\x84\x92\xea\x24\x00\
-\x00\x00\x00\x80\x49\x6c\x68\x68\xe8\x77\x93\x4c\xba\xe3\x8e\x3b\
-\x9a\xa9\x53\xa7\xb6\x15\x0b\xb3\x67\xcf\x6e\xe6\xcc\x99\xd3\xcc\
-\x9b\x37\xaf\x8d\xcc\x4d\x94\xdf\x25\xd2\x01\x9d\xa1\xe5\xb2\x5c\
-\xf9\xf9\xbd\xf2\xb7\x23\x8b\x16\x2d\x1a\x59\xb2\x64\xc9\xe0\xb2\
-\x65\xcb\x3e\xbd\x6a\xd5\xaa\x1b\x9e\x88\x29\xfb\xf5\xcd\xec\xfb\
-\xe0\xe0\x60\x33\x3c\x3c\xdc\xac\x5f\xbf\xbe\xd9\xb2\x65\x4b\xb3\
-\x77\xef\xde\xe6\xc8\x91\x23\xcd\xe9\xd3\xa7\xc7\x9c\x50\x4a\xa7\
-\xf8\x85\x0b\x17\xf6\x76\xab\x86\x49\xa7\xb4\xdb\x63\x69\xef\x19\
-\xee\x2e\xed\xbb\xb4\xdb\x66\xc3\x86\x0d\xcd\x37\xbe\xf1\x8d\xe6\
-\xa5\x97\x5e\x6a\xe7\x1c\x4b\x9b\xc9\x70\x77\x63\x4d\xc2\x4a\x26\
-\x01\x00\x00\x00\x00\x4c\x72\xc3\xc3\xc3\xbf\xf9\xb5\xaf\x7d\xad\
-\x4d\x26\xa5\xc2\x27\x1d\xcc\xa9\x58\x48\x62\x26\x1d\xcd\x89\x7b\
-\xef\xbd\xb7\xfd\xff\x92\x25\x4b\xda\x21\xe5\x32\x44\xd6\x82\x05\
-\x0b\xda\x65\x93\x78\x1a\x9d\x68\x4a\x47\x75\xf9\xfd\xb1\x6e\x13\
-\xd7\xd5\x8a\x15\x2b\x3e\x74\xfb\xed\xb7\xff\x20\xdb\x4c\xe2\x6b\
-\xf9\xf2\xe5\xcd\xa3\x8f\x3e\xda\x3c\xfb\xec\xb3\xcd\xfe\xfd\xfb\
-\x9b\xe3\xc7\x8f\x37\x67\xcf\x9e\x1d\xd7\xfc\x49\xe7\xcf\x9f\xff\
-\x5a\xb7\x7a\x98\x54\x4a\x9b\x5d\x9d\xf6\xde\x5b\x9d\xb4\x7a\xf5\
-\xea\x66\x64\x64\xa4\xd9\xb9\x73\xe7\xc5\xf9\x93\x32\xe7\x58\xaa\
-\x93\xc6\xd2\x66\x12\x59\xae\xdb\x04\x00\x00\x00\x00\x00\x93\xd1\
-\xd0\xd0\xd0\x3f\xac\x73\xa9\x24\x41\x54\xfe\xdf\xac\x5a\xb5\xaa\
-\x59\xb7\x6e\x5d\xf3\xf0\xc3\x0f\x37\x8f\x3c\xf2\x48\x1b\xf9\xf7\
-\x43\x0f\x3d\xd4\x0e\x8d\xb5\x66\xcd\x9a\x76\x99\xfb\xee\xbb\xaf\
-\x4d\xe0\x2c\x5d\xba\xb4\x7d\x5c\x3a\xa7\x17\x2d\x5a\xd4\xdc\x7d\
-\xf7\xdd\x49\x3e\x9d\xe9\x36\x71\x5d\xcd\x99\x33\x67\x6b\xaa\x2d\
-\x92\xcc\xaa\x73\xc1\xd4\xce\xf1\x3a\x17\xcc\xb9\x73\xe7\xc6\xd4\
-\x39\x9e\xbf\xa7\x22\xe3\x8d\x37\xde\xf8\xc5\x6e\xf5\x30\x69\x24\
-\x99\x94\xa1\xee\xa6\x4c\x99\xd2\xb6\xf7\x24\x85\x57\xac\x58\xd1\
-\xb6\xef\x6d\xdb\xb6\x35\x7b\xf6\xec\x69\x0e\x1f\x3e\xdc\x56\x27\
-\x65\xce\xb1\xb4\x85\xb1\x24\x94\xb2\x8c\xea\x24\x00\x00\x00\x00\
-\x80\x49\x6e\xc9\x92\x25\x3f\x93\x6a\x85\x54\x19\x25\x21\x94\x84\
-\x4c\x2a\x7c\x9e\x7a\xea\xa9\x76\x08\xac\x54\xfa\x24\xb6\x6f\xdf\
-\xde\x6c\xdd\xba\xb5\x79\xe6\x99\x67\xda\xbf\x65\x02\xff\xc7\x1f\
-\x7f\xbc\x5d\x36\xc9\xa6\x07\x1f\x7c\xb0\x4d\x36\xa5\xda\x61\xe5\
-\xca\x95\x49\x36\x7d\xa7\xdb\xc4\x75\x33\x34\x34\xf4\x5b\xb5\xda\
-\x22\xfb\x9f\x0a\xaa\xec\xc7\xe6\xcd\x9b\x9b\x6f\x7d\xeb\x5b\x6d\
-\xe7\xf8\xeb\xaf\xbf\x7e\x71\xb8\xbb\xb1\x24\x94\x4a\xbc\xd8\xad\
-\x1e\x26\x8d\xd2\x36\x3e\x53\xe7\x49\x1b\x18\x18\x68\xdb\x4b\x92\
-\xc0\x49\x1c\xa7\x3d\xef\xda\xb5\xeb\x1d\x09\xd8\x5a\xd1\x37\xc6\
-\x36\xa3\x3a\x09\x00\x00\x00\x00\xe0\x56\x30\x30\x30\xf0\x7f\x33\
-\x5c\x5c\x2a\x8d\x52\x85\x94\xc9\xf9\x77\xec\xd8\xd1\x26\x65\x32\
-\x0f\xd1\xbe\x7d\xfb\xda\xb9\x55\x52\xc1\x90\xdf\xed\xde\xbd\xbb\
-\xad\x00\x7a\xee\xb9\xe7\xda\x64\x53\xaa\x1b\x92\xc4\x79\xfa\xe9\
-\xa7\xdb\xce\xe9\x8d\x1b\x37\xb6\x55\x0f\x8f\x3f\xfe\xf8\x07\xbb\
-\x4d\x5c\x17\xd3\xa7\x4f\x3f\x96\xea\xaa\x0c\x77\x57\xab\x2d\xea\
-\x70\x77\xd9\xe7\xf1\x0e\x77\x97\xa4\x53\x89\xdf\xeb\x56\x0f\x93\
-\x42\x4d\x26\xa5\x92\x2f\xc9\xd7\xcc\x35\x96\xa1\x2b\x53\x65\x98\
-\xa4\x70\x6d\x2f\x99\x6f\xac\x26\x60\xc7\x3a\xdc\x5d\x96\x51\x9d\
-\x04\x00\x00\x00\x00\x70\x8b\x98\x31\x63\xc6\x77\x6b\x42\x26\x93\
-\xf3\xa7\x1a\x29\x89\xa3\x54\x2c\xa4\xca\x27\x93\xf4\x27\x8e\x1e\
-\x3d\xda\xfe\xff\xe0\xc1\x83\xed\xdf\x32\xdf\x4a\xe6\x29\x4a\x67\
-\x74\x12\x4f\x79\xcc\x0b\x2f\xbc\xd0\x7c\xf3\x9b\xdf\x6c\x3b\xa9\
-\xb7\x6e\xdd\x7a\x77\xb7\x89\x6b\x6e\xee\xdc\xb9\x1b\x32\x7c\x57\
-\xe6\x7e\xca\x5c\x30\xa9\x4e\x5a\xbb\x76\x6d\x9b\xd0\x4a\xc2\x2b\
-\xfb\x77\xf2\xe4\xc9\x31\x0f\x77\x97\xf8\xce\x77\xbe\xf3\xfd\xb3\
-\x67\xcf\xfe\x78\xb7\x09\xb8\xe9\x65\x98\xbb\x24\x93\x6a\x25\x5f\
-\x86\x86\xcc\x90\x94\x69\xeb\xa9\x2c\x4c\xd5\x61\xda\xed\x6b\xaf\
-\xbd\xd6\xb6\x97\x3a\x77\x52\x92\xab\xfd\xda\x48\x6f\xa4\x4d\x65\
-\xb9\x6e\x53\x00\x00\x00\x00\x00\x4c\x76\x83\x83\x83\xe7\xd3\xc9\
-\x9c\x39\x91\x52\xb1\x90\xca\xa3\x97\x5f\x7e\xb9\x4d\x22\xa5\x93\
-\x39\x73\xaa\x9c\x39\x73\xa6\xfd\x99\x0a\x86\x53\xa7\x4e\xb5\x43\
-\x63\x25\x52\x05\x94\xe5\x52\xdd\x70\xe8\xd0\xa1\xb6\x63\xfa\xc0\
-\x81\x03\x6d\x45\xd3\xae\x5d\xbb\xfe\xb4\xc4\xaf\x74\x9b\xb9\x66\
-\xe6\xce\x9d\xfb\x68\x3a\xc8\x53\x9d\x34\x73\xe6\xcc\xb6\x3a\x29\
-\xfb\x9e\x64\x58\x86\xe9\xcb\xb6\xb3\x3f\xd9\xdf\xf1\x0c\x77\x77\
-\xe1\xc2\x85\xe5\xdd\x26\xe0\xa6\x37\x6d\xda\xb4\xe3\x49\xba\xd6\
-\xca\xa4\x24\x5e\xd3\x56\x96\x2d\x5b\x76\xb1\x12\x31\x43\xdd\xa5\
-\xbd\xd6\x6a\xbe\x71\x0e\x0f\x99\xe5\x55\x27\x01\x00\x00\x00\x00\
-\xdc\x2a\x16\x2e\x5c\xf8\x8d\x9a\x50\xca\x70\x75\xa9\x30\x7a\xe5\
-\x95\x57\xda\x84\x51\x12\x49\x99\xa0\x3f\x1d\xcd\xbd\x91\xdf\xa5\
-\xfa\x27\x15\x0d\xe9\x88\xae\x09\xa7\x9a\x6c\x4a\x35\x53\x2a\x98\
-\xf6\xee\xdd\x7b\xe1\xb9\xe7\x9e\xfb\x70\xb7\xa9\x77\x65\x78\x78\
-\xf8\x67\xe7\xcd\x9b\xf7\x68\x3a\xc9\xa7\x4c\x99\xd2\x0e\x75\x57\
-\xfe\xdf\x94\xdf\xb7\x73\x27\x65\xc8\xbd\x5a\x9d\x34\x7a\x2e\x98\
-\x7e\x9d\xe2\xbd\x91\x65\xca\xb1\xfc\x93\x6e\x53\x30\x61\x64\xc8\
-\xba\xb9\x73\xe7\xae\x49\x74\xbf\xba\xa4\xd2\x16\x3e\x3d\x63\xc6\
-\x8c\x63\x69\x23\x99\x2f\xa9\x0e\x09\x99\x61\xee\x4a\x3b\xbf\x98\
-\x4c\x4a\x25\x5f\xda\x79\x2a\x0c\xd3\x56\x6b\xf2\xb5\x56\xf3\x5d\
-\xa9\xcd\xe4\xef\x86\xba\x03\x00\x00\x00\x00\xb8\xc5\x2c\x5f\xbe\
-\xfc\x3f\xd7\x21\xef\x52\xa1\xd4\x9b\x50\x4a\xc2\x28\x49\x99\x54\
-\x2d\x8c\x8e\x74\x3e\x27\xf2\xf7\xde\x44\x53\x1e\x93\x0e\xea\x54\
-\x2e\x25\xb9\x93\x2a\x88\xed\xdb\xb7\x4f\xeb\x36\x37\x6e\x43\x43\
-\x43\xff\x7a\xce\x9c\x39\xdb\x7b\xab\x2d\xa6\x4f\x9f\xde\xcc\x9e\
-\x3d\xbb\x29\x7f\x6b\xd6\xac\x59\xd3\x3c\xf9\xe4\x93\xef\xa8\xac\
-\x1a\x6f\x75\x52\x59\x6e\x5f\xb7\x39\x98\x50\x92\x48\xba\xed\xb6\
-\xdb\x9a\x0c\x5d\x57\x13\x45\x83\x83\x83\x47\xcb\xf5\xff\x8e\x48\
-\x92\x35\x91\xf6\x91\x48\x22\x29\x43\xdc\x95\xc7\xb7\x73\x26\x25\
-\x61\x5c\x93\x49\x69\x2b\x19\xaa\x32\x43\x58\x26\x09\x5c\x87\x86\
-\x1c\x4b\x7b\x49\x64\xb9\x6e\xf7\x00\x00\x00\x00\x00\xb8\x55\x4c\
-\x9d\x3a\xf5\x7d\xf3\xe7\xcf\xff\xc1\xbd\xf7\xde\xdb\x0e\x1b\x97\
-\xf9\x8f\x92\x98\x49\x42\x29\xd5\x47\x35\xa1\x94\x8e\xe6\x4b\x45\
-\xfe\x9e\xa8\x09\xa6\x24\x96\x32\x3c\x5e\x92\x3b\xe9\xb8\xde\xb1\
-\x63\x47\x33\x32\x32\x72\xee\x91\x47\x1e\x79\x60\xfd\xfa\xf5\x9f\
-\x5a\xb7\x6e\xdd\x4f\x74\x9b\x7f\x87\x15\x2b\x56\x7c\x68\x68\x68\
-\xe8\x5f\x2e\x5e\xbc\xf8\xf7\xef\xb9\xe7\x9e\xd9\x33\x66\xcc\x38\
-\x51\x2b\x2d\x6a\x27\x79\x86\xb9\x2b\xfb\xdb\xce\x9b\x94\x64\x52\
-\x92\x60\x99\xf7\x29\xf3\x38\x65\x7e\xa7\xde\x0e\xf2\xec\x5b\xbf\
-\x0e\xf1\xde\xc8\x32\x65\x9f\x3f\xd5\xed\x02\x4c\x28\x75\x1e\xa4\
-\xb4\x83\x24\x8c\x06\x06\x06\xda\x84\x6a\x92\x45\x19\xc6\x6e\x74\
-\xa4\x1a\x29\xc9\xd6\xb4\x91\x45\x8b\x16\x35\x69\xd7\xf7\xdf\x7f\
-\x7f\x53\xda\x5e\x5b\xc5\x97\x84\x71\xda\x64\x86\xa8\xac\xf3\x26\
-\x8d\x35\xf9\x9a\xc8\x32\xa5\x6d\xa9\x4e\x02\x00\x00\x00\x00\xb8\
-\x15\x0d\x0f\x0f\xef\xca\xd0\x71\x99\xa8\xbf\xce\x43\x94\x79\x55\
-\x32\x94\x5d\x4d\x28\xf5\xeb\x5c\xee\x17\x35\xb1\x94\xa4\x4e\x92\
-\x3b\x99\x57\x29\x13\xff\x6f\xdd\xba\xb5\x4d\x58\xad\x5a\xb5\xaa\
-\xb9\xe7\x9e\x7b\x32\x5c\xdd\x9f\xcf\x9e\x3d\xfb\xbb\x83\x83\x83\
-\xff\x6d\xfa\xf4\xe9\xff\xf3\xce\x3b\xef\xfc\x7f\xb5\xba\xa2\xc6\
-\xd4\xa9\x53\x2f\x76\xa0\xa7\xb3\x3c\xd5\x16\xe9\x24\xcf\xd0\x5d\
-\x6b\xd7\xae\x6d\x87\xe8\xcb\xfe\x66\xfd\xd9\x4e\xad\xaa\x1a\x67\
-\x75\xd2\x13\xdd\x69\x80\x09\x27\x09\xa5\xcc\x19\x96\xf6\x30\x6d\
-\xda\xb4\x8b\xc9\xa2\x0c\x61\x97\x76\x34\x3a\x92\x68\x4d\xe5\xde\
-\xf2\xe5\xcb\xdb\x44\xd2\xfa\xf5\xeb\x9b\x27\x9e\x78\xa2\x6d\x7f\
-\xa9\x16\x4c\xb2\x38\x95\x49\x57\x9b\x4c\x2a\xcb\xee\xec\x76\x0d\
-\x00\x00\x00\x00\x80\x5b\xcd\xf2\xe5\xcb\xff\x30\x9d\xd1\x99\x8b\
-\x68\xf3\xe6\xcd\x6d\x82\xe6\xc8\x91\x23\x6d\x95\xd1\x78\x3a\x9c\
-\x13\x5d\xa7\x73\xfb\xb8\x54\x38\x25\x31\x95\xf9\x94\x32\xbf\xd1\
-\x96\x2d\x5b\x9a\x47\x1f\x7d\xb4\x59\xbd\x7a\x75\x9b\x14\xca\x36\
-\x33\xdc\xde\x9c\x39\x73\xda\x8e\xf2\x44\xad\xb0\x48\xe4\xf7\xbd\
-\x9d\xe7\xb5\x93\x3c\x89\xaf\x0c\xdd\x95\x6a\xaa\xec\x6b\x86\xd6\
-\x3b\x71\xe2\x44\x9b\x00\xcb\x76\xc7\x53\x9d\xf4\xe6\x9b\x6f\xfe\
-\xdd\xee\x34\xc0\x84\x93\x39\x91\x52\x99\x94\xa4\x6a\xda\x43\xda\
-\x41\x86\xa7\x4c\x3b\x78\xe0\x81\x07\x9a\x75\xeb\xd6\xbd\x23\x32\
-\xac\x5d\x92\x48\x69\x67\x23\x23\x23\x6d\x9b\xcb\x10\x77\x69\x27\
-\x69\x87\x69\xd7\x49\x26\xa5\x6d\x8e\xa7\xad\x24\xb2\x5c\x79\xcc\
-\xc7\xbb\x5d\x03\x00\x00\x00\x00\xe0\x56\x34\x34\x34\x74\x3e\x89\
-\x9e\x24\x6a\x52\xc9\x50\x2b\x7e\x32\x7c\xdd\x78\x3a\x9d\x13\x59\
-\xb6\xce\xad\x54\x87\xbe\xcb\xbc\x4c\x49\x2a\x6d\xdb\xb6\xad\xad\
-\x98\x48\x52\x28\xdb\xcb\xdc\x2e\x19\x96\x2b\x55\x15\xa9\xae\xa8\
-\x15\x16\xa9\x98\xca\xef\xd3\x79\x9e\xaa\xa6\x54\x24\xe5\x31\xb5\
-\xda\x62\xe7\xce\x9d\x6d\x25\x55\xf6\xb3\x26\x93\xc6\xb3\xaf\x59\
-\xa6\xc4\xcc\xee\xf0\x61\x42\xca\x50\x77\xa9\xd4\x4b\x82\x35\xc9\
-\xa4\x95\x2b\x57\xb6\xed\x20\xd5\x79\x9b\x36\x6d\x6a\x87\xb1\x7b\
-\xe6\x99\x67\x2e\x46\x12\x48\x69\x1f\x49\xb6\x3e\xff\xfc\xf3\x6d\
-\x22\x29\x6d\x2f\x43\xdc\xa5\x9d\xa4\x3d\xa6\x7a\x70\xbc\xc9\xa4\
-\x44\x59\xde\x50\x77\x00\x00\x00\x00\x00\xb7\xba\xd5\xab\x57\xff\
-\xc7\x24\x77\x1e\x7b\xec\xb1\xb6\x33\x3a\x9d\xd0\xa9\x2e\xea\x1d\
-\x16\xab\x5f\x27\x73\xbf\x48\x27\x75\x96\x4f\x52\x29\x8f\x4f\x27\
-\xf6\xd1\xa3\x47\xdb\x0a\x89\x3d\x7b\xf6\xb4\xf3\xb8\xa4\xd3\x3b\
-\xc9\xab\x74\x8c\x67\x28\xbc\x74\x92\xa7\xb2\x22\x91\x7f\x27\xf2\
-\xfb\xcc\x91\x94\x4a\x8b\x74\x9c\x67\x78\xbb\x24\x92\xd2\x49\x7e\
-\xe0\xc0\x81\x76\xe8\xae\x24\xbd\x6a\x32\x29\xdb\x1b\x6b\x07\x79\
-\xd9\xbf\x6f\x4f\x9d\x3a\xf5\x2f\x74\x87\x0f\x13\xd2\x1d\x77\xdc\
-\xd1\x0e\x75\x97\x4a\xbe\x54\xe8\xa5\x5d\x24\x91\x94\x36\x9a\x04\
-\xed\x8b\x2f\xbe\xd8\xb6\x87\x1a\x69\x5f\x99\x4f\x6c\xff\xfe\xfd\
-\x6d\xe5\x5e\x12\x49\x69\xc7\xa9\x4a\xea\x6d\x27\xb5\xea\x70\x2c\
-\xed\xa5\x6b\xcf\x86\xba\x03\x00\x00\x00\x00\xe0\x87\x56\xad\x5a\
-\xb5\x2d\x43\x66\xa5\xca\x21\x1d\xd3\xe9\x8c\x3e\x7d\xfa\xf4\x55\
-\x55\x33\x74\x9d\xd0\x6d\xe7\x75\x3a\xb1\xb3\x9e\x24\x7f\xb2\xce\
-\x24\x83\xd2\xe9\x9d\x0e\xf1\x0c\xc7\x95\xce\xf1\x24\x8b\x92\x64\
-\x4a\xa4\x8a\x29\xff\xcf\xef\x77\xec\xd8\x71\xb1\xd2\x62\xdf\xbe\
-\x7d\x6d\x52\xaa\x26\x92\x46\x57\x5b\x64\x7b\xfd\xf6\x65\x74\x94\
-\xe5\x5e\x2f\xfb\xf7\x81\xee\xb0\x61\xc2\xca\x70\x77\x33\x67\xce\
-\x6c\xab\x93\xd6\xac\x59\xd3\x26\x57\xd3\x66\xd2\x7e\x6a\xc2\x28\
-\xc3\xd8\xd5\x48\xe2\x36\x15\x81\x69\x1f\x49\x22\xa5\xdd\x65\x78\
-\xbb\x9a\x48\xaa\xed\x78\xbc\x6d\xb9\xb4\x31\x43\xdd\x01\x00\x00\
-\x00\x00\xf0\x43\x0f\x3f\xfc\xf0\x87\xee\xbf\xff\xfe\xff\xfd\xe4\
-\x93\x4f\xb6\x49\x9c\x24\x7e\xd2\x31\x9d\x0e\xe9\xde\xaa\x86\x7e\
-\x9d\xce\xfd\x22\xcb\xf6\x26\x95\x52\x21\x91\x4e\xee\x54\x4c\x24\
-\x29\x94\x0e\xf1\x54\x42\xbd\xfc\xf2\xcb\xed\xf0\x75\xe9\x24\x4f\
-\xe4\xdf\x49\x1e\xe5\xf7\xf9\x7b\x96\x3b\x78\xf0\x60\xdb\x59\x9e\
-\x61\xbb\x4e\x9d\x3a\x75\xd5\x9d\xe4\x65\x7f\xde\x3a\x7f\xfe\xfc\
-\x87\xbb\x43\x86\x09\x6b\x78\x78\xf8\xd3\x77\xde\x79\x67\x3b\xdc\
-\x5d\x86\x80\x4c\xb2\xb7\xce\x71\x96\x36\x51\x2b\x8f\x92\x58\xad\
-\x91\x04\x52\xda\x59\xda\x47\x92\xad\x69\x23\x49\xb8\xf6\xb6\xdf\
-\xf1\xb6\x61\x43\xdd\x01\x00\x00\x00\x00\xf0\x23\x1e\x7a\xe8\xa1\
-\x2f\x66\x58\xad\x54\x08\xa5\x4a\x29\x55\x0f\xe9\xa8\xbe\x9a\x2a\
-\xa5\x1a\x5d\xa7\xf4\xc5\xc4\x52\x86\xc1\x4b\xa7\x77\x12\x43\x49\
-\x58\x25\x49\x94\xce\xf1\x44\xaa\x2b\xf2\x33\xbf\x4b\xe4\xef\x59\
-\xae\x56\x5a\xd4\x8a\xa4\xab\xe9\x20\x2f\xcb\x7d\xbf\xec\xc7\x47\
-\xbb\x43\x85\x09\x2d\x09\xa5\xcc\x9f\x34\x67\xce\x9c\x76\xb8\xbb\
-\x0c\x01\x99\xaa\xbd\x24\x5a\x93\x5c\x4d\x1b\xaa\xed\xa1\x46\xda\
-\x45\x4d\xb2\x26\xae\x26\x89\x54\x23\x8f\x29\xeb\x90\x4c\x02\x00\
-\x00\x00\x00\xa0\xbf\xc7\x1e\x7b\xec\xb7\x47\x46\x46\xbe\x97\xa1\
-\xb5\x52\x21\x94\x24\x4f\x3a\xaf\x7b\x93\x4a\xe3\xed\xa0\xce\xf2\
-\xe9\xdc\xce\xe3\x6b\xe7\x77\x3a\xc3\x93\x5c\x4a\xa2\x28\xeb\xef\
-\x8d\xfc\x2e\x91\xbf\x8f\xae\xb4\x18\x6f\x47\x79\x96\x29\x8f\xd9\
-\x5f\xd6\xf1\x91\xee\x10\x61\xc2\xbb\xfb\xee\xbb\xef\x1f\x18\x18\
-\x68\xe6\xcd\x9b\xd7\xd4\xf9\xcd\xd2\x26\x53\x39\x98\x64\x6b\xef\
-\xfc\x66\xfd\xa2\xb6\x8f\xb1\xb4\x91\xd1\xd1\xb5\x19\xc9\x24\x00\
-\x00\x00\x00\x00\x2e\x6f\xcb\x96\x2d\x1f\x2d\xf1\x66\x26\xfd\xcf\
-\xf0\x5a\x75\xe8\xbb\x9a\x54\xaa\x1d\xd6\xfd\x3a\xa3\xaf\x14\xb5\
-\x93\xbb\x76\x7c\x67\x7d\x89\xd1\xd5\x15\x35\x46\x77\x90\xf7\x5b\
-\xe7\xa5\xa2\xdb\xce\x3d\xdd\x61\xc1\x4d\x63\xe1\xc2\x85\xf7\xdf\
-\x75\xd7\x5d\xcd\x82\x05\x0b\x9a\x95\x2b\x57\x36\x4f\x3c\xf1\x44\
-\x3b\x14\x65\x6d\x8f\xb5\x2d\xf6\xbb\xee\xdf\x4d\xa4\xcd\x94\xf5\
-\x4a\x26\x01\x00\x00\x00\x00\x30\x36\xdb\xb6\x6d\xfb\x85\x67\x9f\
-\x7d\x76\x53\x9d\xb3\x25\x55\x11\x19\x7a\xae\x56\x0b\xd5\x64\xcf\
-\x78\x93\x3c\x89\x9a\x1c\xaa\x51\x93\x46\x35\x46\xff\xbd\x46\xbf\
-\x75\x8d\x8e\xba\x6c\xd9\xbf\xff\x55\xe2\x77\xbb\xc3\x81\x9b\xca\
-\xe0\xe0\xe0\xd1\xe9\xd3\xa7\x37\x0b\x17\x2e\x6c\x56\xaf\x5e\xdd\
-\x8c\x8c\x8c\x34\xbb\x77\xef\x6e\x5e\x7b\xed\xb5\x76\xee\xa4\xeb\
-\x91\x50\xea\xda\x8d\x64\x12\x00\x00\x00\x00\x00\xe3\xb7\x7b\xf7\
-\xee\x4f\xec\xd9\xb3\x67\x7b\x3a\xb2\x7b\x93\x4a\xa3\x87\x9f\xeb\
-\xd7\x41\x7d\xa3\x23\xfb\x51\xf6\xe7\x4f\xcb\xcf\x69\x65\x1f\xdf\
-\xdf\x1d\x02\xdc\x74\x92\x50\x9a\x31\x63\x46\xb3\x78\xf1\xe2\x66\
-\xed\xda\xb5\xcd\xa6\x4d\x9b\x9a\x54\x0c\x1e\x3a\x74\xa8\x9d\x57\
-\xac\x0e\x77\xd7\xaf\x1d\x5c\x4d\x94\x75\xed\x2c\xed\xe6\x9f\x75\
-\x9b\x07\x00\x00\x00\x00\x80\xab\xb3\x77\xef\xde\x4f\x1e\x38\x70\
-\xe0\x85\x23\x47\x8e\xb4\x43\x6e\x25\xb1\x54\xe7\x71\xe9\x37\xb7\
-\x51\x8d\x7e\x9d\xd7\xd7\x22\x46\x6f\xa7\x6c\xfb\xed\x12\x53\xde\
-\x7a\xeb\xad\xbf\xd6\xed\x32\xdc\xb4\xa6\x4c\x99\xd2\xcc\x9c\x39\
-\xb3\xb9\xe7\x9e\x7b\x9a\x75\xeb\xd6\x35\x4f\x3f\xfd\x74\x93\x6a\
-\xc1\xc3\x87\x0f\x37\xaf\xbf\xfe\xfa\xbb\xaa\x50\x1a\xd5\x6e\x54\
-\x25\x01\x00\x00\x00\x00\x70\xed\xbd\xf4\xd2\x4b\x1f\x38\x74\xe8\
-\xd0\x97\x8e\x1f\x3f\xbe\xe5\xe4\xc9\x93\xff\x27\x73\x2b\x9d\x3b\
-\x77\xee\x47\x12\x4b\xa3\x93\x4b\xfd\x3a\xb6\xc7\x13\xbd\xeb\xaa\
-\x51\xb6\xf5\x27\x65\x3b\x0f\x97\xf8\x4f\x4d\xd3\xbc\xaf\xdb\x45\
-\xb8\xe9\xcd\x9e\x3d\xfb\xe8\xac\x59\xb3\xda\x84\xd2\x83\x0f\x3e\
-\xd8\x6c\xde\xbc\xb9\x4d\x28\x25\xa1\xdb\x9b\x50\x4a\x3b\xe8\xd7\
-\x5e\x2e\x15\xb5\xed\x74\x6d\x74\x67\x59\xcf\xc7\xbb\x4d\x02\x00\
-\x00\x00\x00\xc0\xf5\xb1\x67\xcf\x9e\xbf\x72\xf4\xe8\xd1\x4f\x9f\
-\x38\x71\x62\xd9\xa9\x53\xa7\x76\x9d\x3e\x7d\xfa\xad\x54\x2d\x25\
-\xc1\x54\xe7\x5a\xea\x4d\x34\xd5\xe8\x3a\xb3\xaf\x18\xbd\x8f\x49\
-\x94\x75\xbd\x59\xd6\xbd\xad\xfc\xfb\x0f\xcb\xfa\x3f\xd2\xed\x06\
-\x4c\x5a\x0f\x3e\xf8\xe0\x6f\x6e\xd8\xb0\x61\xc9\xe6\xcd\x9b\x17\
-\xbe\xf0\xc2\x0b\xed\x1c\x4a\xa9\x10\x4c\x22\xb7\xb6\xb1\xb1\xb6\
-\xaf\xfc\xad\x2c\xfb\xbc\x24\x12\x00\x00\x00\x00\x00\xef\xb9\xd3\
-\xa7\x4f\xff\x8d\x13\x27\x4e\x7c\xe2\xd4\xa9\x53\x5f\x3a\x73\xe6\
-\xcc\xd2\x12\x8f\x9e\x3d\x7b\x76\xd3\x9b\x6f\xbe\xf9\x8d\xf3\xe7\
-\xcf\xef\x3a\x77\xee\xdc\xbe\x0b\x17\x2e\x1c\x2c\xff\x3f\x59\xfe\
-\xff\x46\x89\xe3\x25\x5e\x2d\xbf\x7b\xb1\xfc\x7c\xb6\xc4\xa6\x12\
-\x8f\x94\x58\x52\x96\xfd\x2f\x25\x3e\x59\xe2\x97\xca\x3a\x7e\xbc\
-\xdb\x04\xdc\xd2\x8e\x1e\x3d\xfa\xcf\x4b\x1b\x9b\x51\xda\xd8\xf4\
-\xd2\x2e\xa6\xbd\xf1\xc6\x1b\xbb\x4a\x7b\x49\xa2\x28\x91\x24\x53\
-\xfd\x77\xe2\xae\x2e\x3e\x5e\x96\xfb\xd5\x6e\x15\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x84\
-\x73\x2d\xf0\x00\x00\x00\xdc\x49\x44\x41\x54\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x70\x6d\xfd\xd8\
-\x8f\xfd\x7f\x57\xb8\x8d\x88\xbd\xff\x5f\xb6\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x54\xfd\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x35\x00\x00\x00\xcf\x08\x06\x00\x00\x00\x0d\x83\x20\xce\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x54\x92\x49\x44\x41\x54\x78\x5e\xed\x9d\xe9\x77\
-\xdc\xc4\xba\xaf\xef\xe7\xbd\x99\x32\x38\xb1\x1d\xcf\x76\x3c\xc5\
-\x8e\xa7\xc4\x43\x42\x06\x42\x12\x36\xdb\xe1\x10\x48\x16\xe3\x01\
-\xce\x86\xc0\x5d\x01\xee\x5a\x84\xf3\x25\x7c\xe2\x4f\xd7\x7d\x9f\
-\x92\x4a\x5d\x5d\x5d\x55\x92\xba\xdb\x76\x77\xe7\xfd\xf0\xac\x56\
-\xa9\x55\xa3\x4a\xf5\xfe\x54\x93\xfe\xcf\xbb\x53\xb3\x99\xa2\x28\
-\x8a\xa2\x28\xca\xb0\xa3\xa2\x46\x51\x14\x45\x51\x94\x91\x40\x45\
-\x8d\xa2\x28\x8a\xa2\x28\x23\x41\x50\xd4\x7c\xfd\xf5\xd7\x5d\x71\
-\x6d\xef\x66\x47\x58\x77\x1e\x7c\x68\xfe\xf3\xcf\x03\xe7\x1f\x3c\
-\xfe\xa8\xe3\xfc\xf2\xd6\x4e\x5b\xb8\x75\xf1\xc3\x01\xce\xa7\xe2\
-\x48\xa5\xb9\x09\xdd\xc6\xe1\x9f\x07\x37\xdc\xba\x68\xd9\xb7\x87\
-\xa3\x65\xaf\x65\xef\x9f\x07\xce\x6b\xd9\xb7\x9f\x07\x37\xdc\xba\
-\x68\xd9\xb7\x87\xa3\x65\x7f\x76\x65\xef\xa2\xa2\x46\x2b\x79\x1b\
-\x5a\xf6\xe1\x38\x52\x68\xd9\xb7\x87\xa3\x65\xaf\x65\xef\x9f\x07\
-\xce\x6b\xd9\xb7\x9f\x07\x37\xdc\xba\x68\xd9\xb7\x87\xe3\x92\x14\
-\x35\xa1\xff\x14\x45\x51\x14\x45\x51\x06\x11\x15\x35\x8a\xa2\x28\
-\x8a\xa2\x8c\x04\x2a\x6a\x14\x45\x51\x14\x45\x19\x1a\x18\xd2\x82\
-\xd0\x7f\x2a\x6a\x14\x45\x51\x14\x45\x19\x1a\x52\x1a\x45\x45\x8d\
-\xa2\x28\x8a\xa2\x28\x43\x03\x93\x8e\x43\x13\x8f\x41\x45\x8d\xa2\
-\x28\x8a\xa2\x28\x23\x81\x8a\x1a\x45\x51\x14\x45\x51\x46\x02\x15\
-\x35\x8a\xa2\x28\x8a\xa2\x8c\x04\x2a\x6a\x14\x45\x51\x14\x45\x19\
-\x09\x54\xd4\x28\x8a\xa2\x28\x8a\x32\x34\xb0\x13\x31\x84\xfe\x0b\
-\x8a\x1a\xb6\x21\xae\xda\x8a\x58\x51\x14\x45\x51\x14\xe5\xb4\x49\
-\x75\xbc\x04\x45\x8d\xa2\x28\x8a\xa2\x28\xca\xb0\xa1\xa2\x46\x51\
-\x14\x45\x51\x94\x91\x40\x45\x8d\xa2\x28\x8a\xa2\x28\x23\x81\x8a\
-\x1a\x45\x51\x14\x45\x51\x46\x82\xa0\xa8\x49\x7d\x2c\x4a\x51\x14\
-\x45\x51\x14\x65\x10\x09\x8a\x1a\x5d\xd2\xad\x28\x8a\xa2\x28\xca\
-\x20\xd2\x78\xf5\x53\xea\x63\x51\x8a\x32\xb4\x5c\x99\x49\x13\xf2\
-\xa3\x28\x8a\xa2\x0c\x14\x8d\x45\x8d\xa2\x8c\x0a\xe7\x67\xe6\xb2\
-\x99\xe5\xd5\xec\xf1\x93\xff\xca\xbe\xfd\xe1\x7f\xb2\xbd\xfd\x83\
-\xec\xe0\xe8\x28\xfb\xf5\xf7\xdf\xb3\x1f\x7f\xfe\x25\xdb\xbe\x71\
-\x33\x5b\xdf\xda\xce\xee\x3f\xfe\x57\x36\xb5\xb2\x96\xbd\x73\x65\
-\x5a\x45\x8e\xd2\xc6\x8c\xd4\x8b\xa3\x0f\x3e\xcc\x8e\xee\x3f\xc8\
-\xe6\x57\xd7\x0d\x1c\xc3\x3b\x5a\x57\x14\xe5\xd4\x51\x51\xa3\xbc\
-\x51\x5c\x5a\xb8\x9a\x5d\xbb\xb1\x6f\xc4\xcb\x9d\xbb\x77\xb3\xbf\
-\xff\xfe\xdb\x70\xff\xfe\x7d\x43\xca\xbd\x2f\x7e\x1e\x3f\xf9\x24\
-\x7b\x67\x72\x5a\x0d\x96\x62\x40\x0c\xc7\xea\xcb\x7b\x52\x3f\xa8\
-\x2b\x5a\x4f\x14\xe5\xf4\x50\x51\xa3\xbc\x31\x2c\x5d\xdf\x31\xbd\
-\x30\x21\x03\xd4\xc4\x7d\xe7\xce\xdd\x6c\x8e\x9e\x1b\x2b\x6e\x02\
-\x71\x29\x6f\x00\x72\xef\x11\x35\xb1\xfa\x72\x61\x7a\x36\x7b\x7b\
-\x62\x4a\xeb\x88\xa2\x9c\x22\x2a\x6a\x94\x37\x02\x04\xcd\xeb\xbf\
-\xfe\x8a\x1a\xa0\x6e\xdc\x8f\x8e\x9f\xa8\xd1\x1a\x76\xb8\x77\x21\
-\x42\xd7\xfa\xc8\x75\x0c\x51\xc6\xea\xc7\x79\xf9\xff\xed\xf1\x2b\
-\x5a\x3f\x14\xe5\x14\x69\x2c\x6a\x52\x1f\x8b\x52\x94\x41\x64\x7a\
-\x75\xbd\xef\x82\xc6\xba\x97\xaf\x6d\xaa\xb0\x19\x42\xee\x7f\xf4\
-\x71\x76\xe3\xe0\xc0\xcc\xa3\x62\xfe\x14\x70\x0c\x8b\x9b\x5b\xf9\
-\xfd\xac\xba\xa7\xf2\x3f\xa2\x26\x56\x3f\xde\xb9\x3c\x21\xa2\x66\
-\x52\xc2\x9a\x0e\xfb\x57\x14\xa5\xef\x34\x16\x35\x29\x0f\x8a\x32\
-\x88\x3c\xff\xfa\x9b\xa0\x20\xf1\xdd\x77\xee\xdc\xc9\x5e\xfe\xfa\
-\x9b\x81\xe3\xaa\xeb\xad\x7b\x61\x7d\x23\x7b\x47\x85\xcd\x50\xb1\
-\xbe\xbd\x13\xbd\x9f\x6b\x3b\x7b\xf5\x84\xaa\xfc\x9f\x9a\x53\xa3\
-\xa2\x46\x51\x4e\x9f\xc6\xa2\x46\x51\x86\x89\x4b\x0b\x4b\x66\x42\
-\xb0\x6f\x70\x5c\xf7\xd6\xce\x6e\x76\x51\x0c\xcf\xf9\xc9\xa9\xec\
-\x9f\x17\x2f\x65\xff\x1c\xbb\x6c\x38\x2f\xe7\xee\x7e\xf8\xb0\xe3\
-\x7a\xdf\xbd\x21\x06\xd2\x18\x2f\x26\x85\x06\xd2\xa0\x0c\x18\x22\
-\x46\xd6\xb7\x76\xa2\xf7\x73\x7c\x6e\xbe\xde\xfd\x2c\x44\x8d\xef\
-\xdf\xba\xa9\x3f\x2a\x6a\x14\xe5\x74\x51\x51\xa3\x8c\x34\x2c\xd9\
-\x0e\x19\x1c\xeb\x9e\x5f\x5e\xc9\xfe\x71\x61\xcc\x88\x98\xb7\x8a\
-\x37\x6b\xe6\x41\xe4\x4c\xca\xb9\xc9\x6c\x6c\x66\x2e\x7b\xfd\xfa\
-\x75\xd0\xbf\x75\xdb\x49\xa1\x95\x43\x16\xca\xd9\x23\xf7\xe8\x93\
-\xcf\x9f\x45\xef\xe7\xf8\xec\xbc\xb9\xef\x95\x2b\x97\xe4\xbf\xf4\
-\x9c\x1a\x15\x35\x8a\x72\xda\xa8\xa8\x51\x46\x9a\xa5\x6b\x1b\x41\
-\x83\x03\x0c\x31\xbd\x7d\x89\x5e\x99\xf1\xdc\xf8\x4c\x4e\x95\x2b\
-\x9a\x72\xe4\x58\xdc\x6f\x4f\x5c\xc9\x0e\xef\xe6\x7e\x5d\xff\xae\
-\x7b\xd5\xf4\xd6\xe8\xa4\xd0\xa1\x40\xee\x11\xa2\x26\x76\x3f\x57\
-\xb7\xb6\x8d\xc0\xad\x2b\x6a\x42\xf5\x01\x74\xf8\x49\x51\x4e\x1f\
-\x15\x35\xca\xe8\x62\x8c\xd7\xf3\xa0\xc1\xe1\x18\x51\xc3\x70\x53\
-\x6e\xc0\x22\xbd\x2c\x72\x0e\xa1\x72\x4e\xf0\xfd\xbb\xee\xd9\xab\
-\xcb\x85\x30\xea\xc2\x80\x49\xd8\xe7\xa7\xe7\xb2\xf1\x85\xa5\x6c\
-\xe9\xfa\xb6\x61\x6c\x76\xa1\x10\x56\x92\x26\x4b\xc8\x6f\x37\x14\
-\xf1\x81\x8d\x8f\xb8\xfb\x16\xa7\xeb\xdf\x25\x70\x1d\xc3\x83\x4c\
-\xe4\xee\x6b\xfc\x31\x8a\x30\x11\x19\x66\x53\xc5\xc8\xfd\x5c\x95\
-\xf2\x78\xeb\x92\x08\x12\x33\xaf\xc6\xd9\x93\xc8\x4f\x8f\xb8\x1b\
-\xcf\xa9\x11\x3f\xe4\x79\x6c\x6e\xc1\xe4\x79\x7a\x65\xdd\x84\x7f\
-\x22\x79\x26\xae\xf9\xbc\x4e\xf9\xe5\x7b\x22\xf1\x29\xca\x00\xa0\
-\xa2\x46\x19\x5d\xa4\xc1\x4e\xbd\x91\x73\x3c\xb1\xb0\x98\xbd\x6d\
-\x87\x1a\x42\x61\x14\xf0\xff\xfa\xee\x8d\x6c\x6d\x7b\xd7\x0c\x4f\
-\x8c\xcf\xce\x99\x37\x7a\xc0\x9d\x0f\x35\xd0\x53\x53\x4f\xd4\xb0\
-\x9b\xf1\xee\xad\xf7\x8d\x51\xbc\x75\xfb\xfd\x68\xfa\xf8\x7f\x65\
-\xf3\x7a\x76\x51\xe2\x30\x61\x77\x69\x84\x88\x8f\x4d\x07\xd9\x3d\
-\xb9\x6a\xe3\xc1\x5b\xb7\x6f\x9b\x1e\x08\xb3\x2b\xae\xe4\xbb\x34\
-\x80\x81\x70\x5d\x98\x90\xcd\x3e\x40\x84\x6f\x77\x66\x06\x56\x14\
-\xb9\xe1\x90\x96\x95\xcd\x2d\xf3\x5f\x68\x55\x1a\xd7\x2f\x31\xf9\
-\xba\x41\xdc\x55\xec\x48\x7e\x6c\x7a\xd8\x44\x91\x3c\xda\xf8\xfc\
-\xf8\x8f\x6e\xdd\xce\xf6\x0f\x0f\xb3\x97\xbf\xfd\x9e\xbd\x94\xeb\
-\xc9\x0b\x22\xc8\xd4\x11\x37\x2d\x72\x5c\x6b\x4e\x8d\xf8\x43\x40\
-\x52\xf6\xc4\x1f\x9a\xe3\x45\x9e\xfb\xb1\xb1\x23\x82\x69\xe9\xda\
-\xa6\x59\xd9\x45\xd9\xba\xe9\x71\xe3\xe3\xfe\x1e\x36\xbc\xbf\x8a\
-\x32\x0c\x34\x16\x35\x29\x0f\x8a\x32\x50\x48\x43\x8d\x20\xf0\x1b\
-\x74\xd7\xbd\x77\xf3\x66\xde\x53\x53\xb5\xda\x45\xfe\xc3\x00\x30\
-\x14\x85\x08\x62\xce\x85\x05\xb7\x11\x34\xb1\xde\x1e\x87\xf3\x33\
-\xf3\xd9\xca\xf5\xad\xa4\xc1\x89\xb9\x11\x68\xe7\xa6\xf2\x9e\x86\
-\x26\x46\xe8\xca\xd2\xb2\x31\xa6\x55\xe1\x87\xdc\x18\xff\xe9\xab\
-\x2b\x2d\xe3\x17\x08\xdf\x12\x33\xf0\x6c\x56\x68\x84\xa3\x94\x31\
-\x69\x41\xc4\xb9\xff\xfb\xd7\x5b\x37\xa2\xe2\xf2\xdc\x82\x89\xbb\
-\x57\xa3\xdb\x6d\xfe\xad\xfb\xc7\x9f\x7f\x6e\xf5\xc4\xd9\xb4\xc8\
-\x6f\xe5\x9c\x1a\xc9\xf7\xe4\xe2\xd5\xec\xd5\x9f\xff\xdb\xf1\x7f\
-\xc8\xbd\x7f\x78\xd4\x55\x9e\x11\x33\x9f\x3c\x7b\x5e\x39\x29\x3e\
-\xe4\x5e\x5c\xbf\x66\xea\x6e\xd5\xfd\x55\x94\x61\x20\xf5\x7d\x4a\
-\x15\x35\xca\x70\x23\x8d\x34\x13\x85\x53\x0d\x3a\x30\x09\xf8\xde\
-\xa3\x8f\x0a\x61\x93\x30\x26\x72\x9e\x86\xdf\x18\x78\x9f\x1a\x42\
-\x83\x1e\x8a\xd4\x1c\x8c\x3a\x6e\x04\xc2\xe2\xc6\x75\x13\x67\x1d\
-\xa3\xc7\x5b\x7b\x37\x02\xca\x77\x1f\xde\xbb\x9f\x16\x7e\x72\x3e\
-\x65\xe0\x99\x88\xbd\x2e\x62\x2e\xf6\x7f\xcc\xcd\x10\xe1\x95\x42\
-\x54\xd5\xc9\x6f\x10\xf1\x87\xa8\xa9\x13\x5f\xcc\xfd\xe3\x8b\x17\
-\xd9\x5b\x97\xc6\xdb\x27\x83\x17\x79\x8e\xf9\x67\xf8\x69\x4d\xf2\
-\x1c\xfb\x3f\xe6\xa6\x3e\x36\xc9\x33\xc3\x77\x3f\xfd\xf2\x4b\x34\
-\xbc\x3a\x6e\x23\xda\x44\xb0\xf7\x54\xce\x8a\x32\xe0\xa8\xa8\x51\
-\x86\x9e\xb1\xf9\x45\x79\x4b\xfe\x33\xd9\xa0\xbb\xee\xe7\x5f\x7d\
-\x9d\xed\x1c\xdd\x2e\x84\x8a\x34\xee\x96\x40\xd8\x4d\x40\xd0\x30\
-\x8c\x51\x15\x7f\x1d\x37\x46\xef\x12\xc3\x51\x15\x3d\x43\x7c\x6c\
-\xb1\x1f\x82\xc6\xba\x4d\x9c\x31\x61\x23\xe7\x52\x06\x7e\x23\x31\
-\x87\xa5\xca\xfd\xed\xf7\xdf\x17\x3d\x61\x62\x70\xfd\x78\xeb\x20\
-\x69\xa3\xec\xeb\xc6\x17\x72\xef\xde\xbc\x99\x4f\x28\xc7\xf0\xdb\
-\xfc\xcb\x6f\x6a\x4e\x0d\x79\x76\xdd\xfe\xff\x29\xf7\xf6\xde\x5e\
-\xad\x3c\xd3\x43\x43\x2f\x50\x55\x78\x75\xdc\xf4\x12\x95\x71\x86\
-\xee\xb1\xa2\x0c\x39\x2a\x6a\x94\xa1\x07\x03\x44\xf7\x7a\x55\x83\
-\x1e\x72\x7f\xfb\xc3\x0f\xe6\x0b\xdd\xe7\x4c\x38\x45\x43\xdf\x65\
-\x63\xdf\x6b\x0f\x8d\xef\x3e\xba\x7d\xbb\x73\x38\xc4\x23\x35\xe4\
-\x42\x0f\xc8\x7f\x7e\x7a\x91\xdd\x7d\xf0\x30\x9b\x59\xba\x9a\x2d\
-\xac\xac\x66\xdf\x7c\xf7\x7d\xf4\x7a\xf8\xf1\x85\xbc\xcd\x33\x8c\
-\x14\x8a\x53\xdc\x29\x03\xdf\xab\xdb\x7c\x72\xc0\xed\x25\x69\x82\
-\xf8\xe9\x55\x50\x32\x4c\x69\x45\x4d\x99\x86\x22\xcf\x75\xfc\x77\
-\xe3\x66\xd8\xaa\x6a\x13\xc0\xaa\xf8\xd9\x48\x72\x6b\x77\x37\x5b\
-\xdd\xd8\xcc\x9e\x7d\xf1\x65\xf6\xc7\xab\xb4\xc0\x7f\xf6\xe5\x57\
-\xbd\x09\x48\x45\x19\x60\x54\xd4\x28\xc3\x8f\x18\x04\x1a\x68\xba\
-\xd7\xfd\x06\xbc\x89\xfb\xdb\xef\x7f\xc8\x0e\xef\x7f\x60\xc2\x2a\
-\x7b\x70\x42\xf1\x05\xa0\xc7\x24\x15\x3e\x02\xe3\xe1\xbf\x3e\x36\
-\x1f\xc9\x3c\x27\x46\x13\xb6\x6e\x1e\x54\x1a\xa0\x83\xbb\xf7\xda\
-\x7b\x0e\x1c\x58\xf1\xe2\x5f\x6f\xdd\xfb\x07\x87\x12\xd7\x6a\xb9\
-\xd1\x20\xc3\x2a\xac\xf6\xe1\x77\x6c\x7a\xb6\xe3\x7a\xd7\x6d\xe6\
-\x89\x84\x0c\xad\xb8\xeb\x1a\xf8\xa3\x5b\xb7\x4c\x7e\xf7\xdf\xbf\
-\x93\x5d\x99\x5f\xcc\xae\x8a\xe8\x24\xaf\xb1\xeb\xe1\xee\xc3\x47\
-\x2d\x11\xe7\xc6\x5b\x07\x49\x1b\xe2\x94\x6f\x75\x2d\x4b\x5c\xc4\
-\xf7\x9f\x17\x2f\xa2\xf1\x5d\xbb\xbe\x65\xd2\x07\x5c\x0b\x07\x77\
-\xee\x9a\x32\xa2\xa7\xaa\xbc\xf7\xf2\x9b\x1a\x72\x73\xdd\x7f\xbc\
-\x7a\x65\xc2\x43\x40\x92\xe7\x87\x1f\xff\xbb\xf2\xfe\x56\xe5\x79\
-\xf7\x76\xbe\xeb\x75\xc8\x3f\xbd\x79\x5b\x37\xf6\xf3\x3d\x98\xca\
-\x0d\x25\xc7\xcd\xef\xd4\xc2\x52\x72\xdf\xa5\xf3\x53\xb9\x80\x4c\
-\x89\x29\x45\x19\x46\x54\xd4\x28\x23\x01\x8d\x33\xc6\x7f\x7b\xef\
-\x46\x47\x03\xde\x8d\x9b\x09\xbb\x53\xcb\xf9\x57\xba\x2b\xc5\x8d\
-\xfc\x9f\xea\x31\x41\x60\x4c\xcc\x2d\xe4\x4b\xcb\x11\x17\x97\x45\
-\x5c\x5c\x66\x02\x72\x2e\x32\xd8\xad\xd8\x8f\xdf\xba\xb7\x76\xf7\
-\xcc\x75\xa1\x74\xf0\x6d\xa3\x50\x7c\xc0\x44\xe5\x3c\x3e\x96\x1c\
-\x5f\xc9\x0d\x98\xc0\x2f\xee\x27\x9f\x7d\x1e\x8c\x8f\x63\x56\x7a\
-\x05\x0d\xad\xc4\x5f\x65\xe0\x11\x6f\x6c\x76\x98\xef\xdc\xec\x8a\
-\xa9\x89\xec\x82\x84\x41\xef\x53\xcc\x3f\xbd\x48\xc9\xa5\xf7\x15\
-\xd0\xd3\x46\x1d\x30\x65\x2b\xf1\x3e\x79\xfa\x59\x47\xfa\xac\xdb\
-\x96\x4f\x9b\xe0\x93\xb8\x3b\x86\x66\x8a\x3c\x87\xd2\x6b\xdd\xe4\
-\x99\x6f\xe5\x85\xf2\xfc\xae\x94\x23\x79\x8e\xf9\x6f\xdd\xdf\x40\
-\x9e\xc5\x1d\x1b\x52\x43\xb0\x20\x90\x6d\x9d\xe2\x7e\xe5\xf7\xb9\
-\x40\xdc\x93\x4b\xcb\x1d\xf1\x59\xb7\xe9\xad\xb1\x3d\x72\x6e\x9c\
-\x8a\x32\x04\xa4\xbe\x4f\xa9\xa2\x46\x19\x19\x68\xa0\x69\xd8\xef\
-\x3d\x7c\xdc\xd6\x80\xfb\x0d\x7a\x13\xf7\xf2\xc6\x66\x6b\x8e\x89\
-\x6f\x74\x0a\x52\x3d\x26\x50\x0a\x0c\x8c\x26\xbd\x2e\x62\xc0\x48\
-\xab\x49\xaf\x84\x7d\x71\x66\x3e\xfb\x23\x32\x27\x08\x83\x69\x8c\
-\x96\x5c\xe7\xc7\xcf\x92\x69\xff\x7a\xc0\xe0\xfd\xc3\x0a\x1a\x13\
-\x5f\x61\xa4\x0b\x70\x33\xa7\xc8\x5e\xef\xfb\xe7\xb3\x11\x08\x03\
-\xe3\xcf\x89\x0f\xbf\x29\x03\x4f\x5a\xaf\xcc\xb7\xc4\x9b\x31\xb4\
-\xc4\x4f\xf9\x21\xa6\xe4\x78\x2e\x31\xa9\x9b\x25\xd6\xb1\xbc\xd6\
-\x82\xbc\x89\xb0\xb1\xe5\x9a\x9a\xb4\x9c\xef\x53\x63\xd3\x98\xa7\
-\xcf\xde\x97\xb6\xb8\xe5\x38\x35\xe4\x46\x9e\xb7\x6e\xee\x27\xf3\
-\xcc\xa6\x8e\x31\xff\xa9\x3c\xb3\xef\x8c\x7f\xbd\x75\xd3\x23\xd4\
-\x5e\xa7\xf2\xde\xc5\x92\xa2\x0c\x62\x93\x98\xa9\x23\xef\x8a\xbf\
-\xae\xcb\x5a\x51\xce\x90\x94\x46\x51\x51\xa3\x8c\x0e\x65\x63\xce\
-\xdb\xfa\x44\xb6\xb0\xba\x56\x39\xe4\x51\xc7\x5d\xb5\x6a\x24\xd5\
-\x63\xf2\xcd\x7f\x7f\x57\x18\x3c\x8c\x8f\x18\x3a\xfc\xdb\x30\x8a\
-\x63\xc2\x5d\x17\x23\x1b\xf2\xcf\xf1\x05\x33\x54\x20\xf1\x7b\x71\
-\xb3\xea\x8b\xe1\x96\x47\xff\x3e\x2e\x87\x50\x18\xf2\x30\xa2\xc4\
-\x18\xd8\x48\x9a\xc5\xcd\x5c\x8e\x58\x7c\xb9\xa8\x09\xf4\x1e\xc8\
-\x71\xca\xc0\xcf\x48\x98\xad\xbc\xb6\x0c\xad\x09\x43\xe0\x98\x0d\
-\xe9\x62\xfe\xd9\x3b\x86\x9e\x93\x50\x5e\x1b\x51\xc4\xc5\xbe\x33\
-\x6e\xf8\x6e\x7c\xec\x41\x64\xf2\xe8\xde\x93\x50\x9c\x72\x2e\x35\
-\xe4\xb6\x7f\xbb\xd8\xdc\xb1\x22\xcf\x31\xff\xd4\xcf\x58\x9e\x59\
-\xd5\xe6\x5f\x6f\xdd\xe7\x44\x3c\xe5\xbb\x64\xc7\xef\x31\xe7\x11\
-\xaf\x21\xff\x1c\x97\x3d\x72\xcc\x25\x73\xfd\x2a\xca\x10\xa3\xa2\
-\x46\x19\x39\x30\x0e\x18\x64\x1a\x7c\x0c\xd7\xd4\xe2\x52\x4f\xab\
-\x54\x38\xde\x93\xb7\xf1\xd2\x80\xb8\xf1\x49\x5c\xa9\x21\x19\x63\
-\xf4\x30\x5a\x21\xbf\x4e\x18\x97\xe7\x17\xcd\x1b\x3d\xf3\x3a\x66\
-\x97\x96\x85\xab\xd9\xc1\xfb\x77\x8c\xdb\xbe\x51\xfb\x46\xcf\xe4\
-\x53\xce\x63\x98\xc8\x27\x86\xd5\x20\xc7\xc6\x58\xf9\x06\x9b\xeb\
-\x0b\x10\x35\xa1\xf4\x02\x13\x8a\x09\x27\x26\x6a\xfc\xeb\xad\x9b\
-\xe1\x90\xbc\xd7\x21\x62\x68\x05\xce\xb3\x64\x3d\xe4\xbf\x34\xf0\
-\x94\x55\xc0\x6f\x23\xc4\x7f\xfa\xdb\x4f\x85\xa8\x89\xa4\xb3\x44\
-\xfe\x4b\xdd\xdf\xba\x79\x8e\xf9\x8f\xe6\x59\x8e\x53\x02\x92\x8f\
-\xb3\xce\xaf\x6f\x98\xa5\xff\xd4\x1d\x7a\x75\xdc\x9d\xa3\x61\x71\
-\x73\x2b\x5b\xdf\xcb\xd3\xee\xfb\x87\xb6\x1e\xb9\x54\x19\x28\xca\
-\x10\xa1\xa2\x46\x19\x4d\xa4\x91\xce\x87\x22\xac\xb8\xc9\xe7\x59\
-\x30\x81\x72\x6d\xf3\x7a\x57\x3d\x38\xc1\x49\xbb\x72\x9c\xda\x68\
-\x6e\x7c\x46\x8c\x67\x64\x78\xc1\x85\x30\xb9\xa6\x14\x28\x25\x76\
-\xd3\xbf\x80\xe1\x11\x37\xfe\xf8\x2f\x1f\xea\x98\xca\xde\x13\x37\
-\x1b\xbb\xf1\x86\xce\xee\xb5\x9b\xbb\x7b\x66\x27\x5b\xe6\xfc\xb0\
-\xec\x9d\x8d\xdb\x52\x3b\x0d\x73\x9c\x12\x35\x29\x03\x3f\xbf\xba\
-\x6e\xd2\xdc\xe1\xcf\x81\xf4\xc6\xe2\x3f\x09\x51\xe3\x86\xef\xc6\
-\xd7\xaf\x6f\x3f\x8d\x4d\xcd\xd4\xca\x73\xcc\x7f\xd9\x3b\x15\x10\
-\x35\xfd\x5a\xc6\x1d\x73\xb3\x52\x2a\x78\x9f\x15\x65\x88\x51\x51\
-\xa3\x8c\x36\xd2\x58\x5b\xc3\x9f\x8b\x86\x96\xc0\x19\x9f\x9b\x37\
-\x43\x36\x75\x05\x0e\x13\x3e\x3b\x0c\xa1\x31\x3e\x71\xff\xac\x72\
-\xaa\x6b\x3c\x6d\x3a\x43\xa4\xfc\xe2\x8f\xcf\x23\x60\x7c\xab\x04\
-\x4b\x1d\x77\x3e\x7c\x15\x30\x76\x72\x5c\x6d\xe0\xd3\x93\x4f\x49\
-\x6b\x6c\x5f\x9d\xa8\x81\xef\x06\xf1\x9f\xfc\xf6\x53\x03\x51\x93\
-\xea\x31\xa9\x9b\xe7\x98\xff\x94\xa8\x61\xa7\x67\xff\xfa\x7e\xba\
-\xcd\x24\x65\x79\x0e\x10\xc4\xc9\x32\x50\x94\x21\x42\x45\x8d\xf2\
-\xe6\x20\x0d\x37\x86\xc3\x08\x05\x4f\xe0\xf0\xb1\x4a\x0c\x4c\xcc\
-\x00\x58\x77\xbe\xaf\x88\x63\x80\xe4\x17\x23\x1d\xbb\xde\x6e\xa3\
-\x9f\x32\x7a\x1d\x10\xb6\x4b\xe8\x9a\x82\xa5\xeb\x3b\x3d\xef\xa4\
-\xeb\xbb\x53\xa2\xa6\x1f\x06\x3e\x56\x5e\x27\x21\x6a\xdc\xf0\xdd\
-\xf8\x9a\x0c\x3f\xa5\x86\xdc\xf2\xde\xa9\xea\x3c\xc7\xfc\xa7\x86\
-\x9f\xfa\x21\x50\x53\x6e\xf6\xb6\xa9\xd3\x8b\xa8\x28\xc3\x84\x8a\
-\x1a\xe5\xcd\x44\x1a\x71\x8c\x88\x2b\x70\x2e\x4c\xcf\x66\x2f\x7f\
-\xfb\x2d\x69\x10\x56\xb7\x76\xe4\xda\xc2\x88\x15\x61\x60\x7c\x62\
-\xd7\xbb\x1f\x3c\x0c\xa6\xa3\x07\x8e\x3e\xf8\x30\x29\xa8\x5c\x37\
-\xab\x74\x58\xf1\xc2\x46\x6d\x2c\x31\x4f\x09\xb8\x6e\xe7\xd4\xd4\
-\x35\xf0\xb1\xf2\x3a\x89\xe1\x27\x37\x7c\x37\xbe\x7e\xcd\xa9\x69\
-\x22\x6a\x42\xfe\x63\x79\xe6\xb8\x9f\x3b\x45\x87\xdc\x66\x09\xbd\
-\x8a\x1a\x65\x08\x49\x69\x94\xa0\xa8\x49\x7d\x2c\x4a\x51\x06\x89\
-\xb1\x39\x26\x49\x5e\xed\x98\x24\x69\xdd\xc6\x50\x54\x35\xd8\xf2\
-\x3f\x46\x09\x71\x33\x5d\xec\xed\x11\x33\x08\xc6\xe0\x5b\x23\x86\
-\x3f\x21\xf5\x46\xcd\xb7\x81\x4e\x42\xd4\x4c\xaf\x5e\x4b\x0a\x1a\
-\x04\xcc\x37\xdf\x7d\x67\x36\x82\xbb\x38\x35\x6d\xc4\x15\xab\x74\
-\x30\xa0\xb0\xb5\x7f\x10\x4c\x2f\xc7\xbd\xcd\xa9\xa9\x27\x6a\x42\
-\xfe\x87\x77\x4e\x4d\x75\x9e\x63\xfe\x63\xbd\x53\x1c\xc7\xee\x2f\
-\x02\x95\xa5\xf1\x4c\x52\x26\x7e\xa0\xec\xa1\x91\x7b\xed\x5a\x91\
-\x76\x15\x35\xca\x70\xf1\xe0\xf1\x47\x86\xd0\x7f\x41\x51\xa3\x28\
-\xc3\x02\x0d\xb3\xdb\xe0\xfb\x06\xe0\x9c\x34\xd6\x95\x86\xab\x00\
-\x43\xc2\x17\xb2\x53\xe1\xe5\xa2\xa6\x65\x0c\xf1\xf3\x32\xb1\xf1\
-\x9e\x59\x36\x5b\x61\xf4\x00\x91\xc2\xae\xc4\x2c\xd3\xde\xbd\xf5\
-\xbe\x81\x63\x18\x9b\x5f\xea\x48\xff\xe3\x27\xff\x15\x8c\x0f\xe8\
-\x8d\xb1\x9b\xfd\x61\x30\x11\x28\x18\x2f\xc4\x15\xc6\x13\x76\x0e\
-\x6f\x45\xfd\xeb\x9c\x1a\x07\xf9\xef\xac\xe6\xd4\xec\x27\xbe\x65\
-\x65\x76\x11\xe6\xde\x4a\x1e\x88\xbf\x29\xd4\x49\x53\x1f\x44\xc8\
-\xf7\x5c\xd6\x8a\x32\x40\xa8\xa8\x51\x86\x1a\x8c\xbf\xdf\xe0\xbb\
-\x6e\xb3\x62\xc9\x18\x8c\xb4\xa8\xb0\xf0\x71\xcc\x54\x78\x6c\xfb\
-\x9f\x1b\xc3\xc2\xe0\x0b\xa9\x1e\x81\xd6\x9e\x2f\x69\xe3\x89\x38\
-\x0b\xf9\xe7\xd8\x7e\x7c\xb3\xf4\x2f\xbf\xa9\x1e\x13\x7f\x37\x61\
-\x7a\xa0\xf0\x6f\x56\x83\x89\x5f\x7e\xa7\xaf\xae\x44\xfd\xeb\x9c\
-\x1a\x87\x22\xcf\xa1\xf4\x02\x3d\x1e\x75\xf2\x1c\xf3\x9f\x9a\x53\
-\x93\x4a\x7f\x5e\xd6\xec\x8d\x53\xdc\xdb\x4a\xe4\x3a\xae\x75\xe1\
-\x9c\xfc\x97\xcc\xbf\xa2\x0c\x19\x2a\x6a\x94\xa1\x86\x5e\x0c\xbf\
-\xc1\x77\xdd\xe5\xd6\xfb\xd2\x88\xd7\x69\xbc\x11\x49\xa9\xf0\xf8\
-\x5e\x53\x9b\x31\x14\x30\x6c\xb1\xeb\x31\x5a\x75\x56\x98\xb0\xf4\
-\x3a\xe4\x1f\xf2\x79\x39\x8e\x30\x93\x70\x62\xcb\xc8\xf9\xfe\x10\
-\x6f\xf1\xf9\x5c\x09\xf1\x13\x32\x5a\xe2\xa6\x07\x28\xe4\x1f\xde\
-\x84\x39\x35\xec\x03\x54\x57\xd4\x9c\xc5\x9c\x1a\xe2\x3d\xba\xff\
-\xa0\xe3\x7a\xeb\x5e\xdb\xdc\x2c\xd2\x2f\xc2\x24\x96\x7e\x39\xcf\
-\x10\x2c\x75\x05\x58\xa5\x07\xac\xaa\x02\x96\xfc\x57\xe6\x5f\x51\
-\x86\x0c\x15\x35\xca\x50\x43\x83\x4e\x03\xed\x36\xf8\xbe\x01\x60\
-\x67\x61\x77\x72\x6f\x28\x1c\xb0\x06\xc0\xf7\xef\xba\xf3\x25\xda\
-\x4e\x58\x02\x5f\xf8\x8e\x5d\xcf\x31\x7b\xe3\xa4\xe2\x67\xc7\xd9\
-\xd8\x90\x0c\xf3\x27\xda\xe6\xe5\x88\x7f\xf2\x9c\xba\xde\xf4\xd2\
-\xb8\x69\xf4\xe2\x3b\x3f\x3d\x97\xfd\xf8\xf3\x2f\x41\xff\x1c\x8f\
-\xca\x9c\x1a\x8c\xb6\x1b\xbe\x1b\xdf\x93\x4f\x9f\xe6\x79\xac\x12\
-\xbb\x45\x9e\x43\xe9\x85\x26\xc3\x4f\x21\xff\xa9\xde\x29\xe6\x8b\
-\xf9\xd7\x5b\x37\x73\xa6\x3a\x56\xe2\x05\x40\xbc\x86\xfc\x73\xcc\
-\xf7\xbf\x4c\xbc\x89\xb4\x2b\xca\xb0\x11\x14\x35\xa9\x8f\x45\x29\
-\xca\x20\x41\x83\x9e\x7a\x23\xb7\x6e\x56\x35\x31\xb1\x92\xef\x2c\
-\xd1\x88\xe3\x0f\x30\xf0\xec\xf1\xf2\xc9\xb3\xe7\xd1\x1e\x04\xeb\
-\x66\x09\x2c\x1f\x2c\x2c\x05\x46\x99\x86\xe9\xec\xf9\x57\x5f\x77\
-\x5c\xef\xba\xcb\x8d\xfb\xf0\x87\x11\x2a\x60\x52\x33\x9b\xac\xf9\
-\xd7\x5b\xb7\x89\xd3\x33\x7a\xfc\xc6\x86\x70\x00\x71\x51\xce\xe3\
-\x29\xfc\x58\xaa\xe2\x83\x51\x99\x53\x93\x32\xe8\x88\x02\xe6\x1d\
-\x59\xa3\x6e\xe2\xb3\x78\xe1\x9c\xc9\x9c\x9a\xc2\xdf\xe6\xce\x6e\
-\xdb\xf5\xae\x7f\xbe\x1b\xf5\x9e\x19\x42\x0a\xf7\xd6\x20\x96\x53\
-\x1b\x43\x1a\xb1\x1d\xa9\x27\x8a\x32\xc8\x2c\x6f\xed\x18\x42\xff\
-\x05\x45\x8d\x2e\xe9\x56\x86\x06\x69\x8c\x79\xa3\x8d\x6d\xbd\x1f\
-\x73\xd3\xbb\x83\x88\x89\x19\xd8\x90\xbb\xb5\x3b\xb0\x67\x80\xe4\
-\xf8\xa2\xfc\x57\xe5\x7f\xff\xf0\xc8\x88\x1f\x7a\x10\x98\x2f\xc1\
-\x17\x98\xab\xe2\x2f\x3f\xbc\xe8\xf6\x28\xc8\x2f\xbb\x04\x87\xae\
-\xe7\x98\x1e\x8f\x89\xf9\x45\xe3\xc7\x1a\xec\xb1\xd9\x85\x6c\x7d\
-\x7b\xa7\x56\x7e\x47\x62\x4e\x8d\x50\xd5\x83\x06\xaf\x5f\xff\x55\
-\x0e\xc9\x20\x20\x3a\x0c\x7c\x91\xe7\x98\xff\x26\xc3\x4f\x21\xff\
-\xc9\xde\x29\x71\x4f\x15\xc3\x84\x31\xff\x88\x33\xbe\xff\x75\x59\
-\x9e\x81\x73\xd3\xf9\x70\x2c\x3d\x8e\x7c\xec\x34\xd6\x23\x06\xa6\
-\xac\x2f\x5e\x6a\xbe\x87\x92\xa2\x0c\x00\x8d\x97\x74\x2b\xca\x30\
-\x41\x4f\xc9\xa4\xbc\x75\xc6\x1a\xf0\x7e\xb8\x57\x37\x36\x8b\x61\
-\x1d\x8c\x7d\xe7\x9b\x2d\xe7\x0e\xef\x7d\x50\x3b\xbc\x3a\xee\xe3\
-\x4f\x9f\xb6\x1b\x1e\x1b\xa7\xfc\xce\xad\xae\x55\xfa\xc7\x60\xb3\
-\x32\x0b\x83\x1d\xfa\x3f\xe6\x1e\x89\x39\x35\x02\xf5\x02\xc1\x62\
-\xc3\xf7\xe3\xf3\xdd\xe6\xc3\xa5\xfe\x30\xa1\xfc\x9e\xc9\x9c\x1a\
-\xeb\x57\xc2\xa5\x87\x31\xe6\xbf\x5b\xf7\x82\x88\xa5\x7e\x96\xb5\
-\xa2\x9c\x26\x2a\x6a\x94\xd1\x46\x1a\x65\x1a\xff\xb5\xdd\x1b\xb5\
-\x1a\xf4\xa6\xee\x8d\xad\xad\xec\xbc\x18\xf8\x60\x2f\x4d\x5b\x1a\
-\xa6\xb2\xb5\xeb\x5b\x95\xe1\xd5\x71\x3f\xfb\xe2\x8b\x22\xce\x62\
-\x85\x8b\x17\x27\xf9\x7d\xf9\x5b\xf7\x3b\x09\xb3\x87\x4d\xec\xff\
-\x91\x98\x53\x23\x10\x46\x6a\x95\x97\xef\xfe\xf1\xc5\x8b\xe2\x1e\
-\xb7\xf7\x8a\x9d\xd5\x9c\x1a\x83\x9c\xe3\x3e\x3c\xff\xea\xab\xa0\
-\xff\x6e\xdc\xed\x02\xdd\xbb\xc7\x8a\x32\x04\xa8\xa8\x51\x46\x1e\
-\x0c\x02\x93\x3e\x2f\xcd\xce\x67\x7f\x24\xbe\xc5\xd4\xc4\xcd\xa4\
-\xdb\xf9\xe5\x95\x96\xa0\xc1\xf0\x60\xbc\x22\x46\x80\x34\x60\x10\
-\xef\x3d\x7a\x5c\x2b\xfc\x98\xfb\xf8\xd3\xa7\x9d\x71\x06\xe2\x62\
-\xc8\x8b\x34\x56\x85\xe7\xba\xb9\xfe\xee\x83\x87\x26\xfc\xd8\xf5\
-\x23\x31\xa7\x06\x24\x0c\xd2\xc2\xf0\x4c\x28\x3e\xdf\xbd\x7b\xf3\
-\xa6\xc4\xef\x09\x57\xf9\x3d\xab\x39\x35\xae\x7f\xea\xd5\xf2\xb5\
-\x8d\x0e\xff\x4d\xdd\x08\x9a\x4a\x81\xae\x28\x03\x8e\x8a\x1a\xe5\
-\x8d\x80\x06\x1a\x61\xc3\x10\x02\x2b\x9e\xf6\xc4\x48\xa5\x1a\xf8\
-\x98\x9b\x79\x0a\x57\xd7\xd6\xb3\x73\x13\x93\xf2\x46\x9b\x6f\x5e\
-\x57\x25\x68\x2c\xd6\x00\xbd\x2b\x6c\x6c\xef\xd4\x8a\x0f\x10\x1b\
-\x18\x55\x86\x1a\xcc\x5b\x74\x95\x88\x22\xaf\xf2\xdf\x45\x11\x71\
-\xcf\xbe\xfc\xaa\x32\x7c\x8e\xdd\xf0\xdf\x95\x32\x8a\x5d\xdf\xda\
-\x5b\xa7\x53\xd4\x54\x19\x78\x7f\x12\xb5\x0f\xe5\x53\x39\xa7\xa6\
-\x8f\xc6\xd6\xd6\x09\xc4\x6e\xd5\xfd\xa0\xbe\x58\x51\x53\xe6\xbb\
-\xc8\x73\xe8\x7a\x30\x93\xb2\x6b\xe4\x39\xe6\xbf\xec\x9d\xaa\xc8\
-\x33\x43\x69\x5c\xb3\xb0\xbe\x51\xfb\x7e\xbb\x6e\xee\xfd\x45\x09\
-\x23\xaf\x5b\xf5\xeb\xb3\xa2\x0c\x22\x2a\x6a\x94\x37\x07\x69\xa4\
-\x69\xac\x69\xb4\x31\xcc\x17\xc4\xd0\xf2\xb1\x4a\xbe\xc6\xcd\xf0\
-\x02\x46\x04\xe3\x89\x88\x40\xbc\xb0\xaf\x0b\xdf\x42\x62\x95\xd1\
-\xc3\x7f\x7d\x6c\xe6\xaa\xb0\x84\x1a\x43\x63\x84\x85\xbc\x85\x9b\
-\xe1\x9f\x06\x06\xc0\x1a\x52\x8c\x1d\x06\x84\x55\x26\x36\xfe\xff\
-\x08\xac\x5a\x21\x4e\x86\x80\x8e\x3f\x7d\x6a\x3e\x65\xc0\x52\x71\
-\x2b\x66\x78\xf3\x37\x46\xae\x2a\x4e\x27\xaf\x97\x66\xe6\xb2\x47\
-\x1f\xff\xdb\xc4\x41\xfe\x80\x9d\x85\x89\x03\x81\xc6\xa7\x12\xda\
-\xc2\x17\x3f\xf7\x1e\x7d\x94\xdd\x7b\xf8\xc8\x0c\x37\x01\x62\x06\
-\xc6\xa6\x67\x4d\xda\x3b\xe2\x97\xe3\xf5\xbd\x9b\xd9\xa2\x84\x87\
-\x68\xb4\xd7\x5b\xff\x94\xb5\x31\x96\x62\x3c\xdb\xd2\xe9\x22\x61\
-\x2c\x89\x61\x26\x8c\xbb\x1f\x3e\x6a\xf3\x7f\x70\xe7\x6e\x6e\x70\
-\x11\x85\xa9\x7c\x37\xc4\xbf\x1f\xe4\xef\xca\xc2\x62\x76\xf0\xfe\
-\xdd\xce\xf8\x11\x73\x6e\xfc\xf2\xcb\xd2\x69\x93\x5e\x29\x2b\xf7\
-\x7a\x8e\x9b\xe4\x99\x1e\x3c\xf2\xec\xfa\x6f\x92\x67\x37\x1f\xef\
-\x4a\xfd\xc0\xef\x93\xa7\x4f\x8d\x18\xe3\x7e\x53\x9f\xe1\xe8\xd6\
-\x2d\x53\xbf\x9e\x7d\xf1\xa5\xd9\x2c\xb2\xe3\xde\x4b\x18\x4d\xea\
-\xb3\xa2\x0c\x1a\x8d\x45\x4d\xca\x83\xa2\x0c\x3c\x34\xfe\x30\x29\
-\x06\x40\x1a\x7f\x84\x09\xc6\xca\x34\xea\x02\x82\xa5\x93\xfc\x3f\
-\x73\x5d\x61\xf4\x6d\xe3\x9f\x7a\x83\x8e\x62\xe2\x17\xbf\xc6\x08\
-\xd9\xaf\x81\xe7\x69\x88\xc5\x8b\xb1\xb2\x62\xa6\x76\x9c\x45\x3c\
-\xa4\xd5\x1a\x6d\x3f\x0e\x13\x3e\x86\xd3\x18\xb4\x22\x7c\x83\x4d\
-\x1b\x79\xc6\x5f\xfe\x9b\xa7\xa3\x73\x1e\x0f\xe4\x3d\x06\xe2\xaf\
-\x2c\xd3\x76\x7f\x95\x73\x34\x6c\x7a\x6d\x99\x38\xf1\xda\x72\xe7\
-\xff\x64\x18\xdd\x50\xc4\x6b\xef\x47\x99\xfe\x1a\xf1\x0f\x54\x9e\
-\x6d\x58\xf6\x7e\x9b\xb0\xaa\xeb\x74\x7e\x4f\x1b\xd6\x2d\x45\x19\
-\x50\x1a\x8b\x9a\xd4\xc7\xa2\x14\x65\x68\xc0\x00\x14\x46\xc0\x80\
-\x21\x30\xe4\xdf\x3f\x6a\x83\x73\xf2\x1f\x06\xaa\x6c\xf8\xfb\xd1\
-\xf8\xbb\x69\x70\xe3\x2f\x91\xf8\xfa\x10\x6f\x2b\x9f\x5e\x1e\x63\
-\xf9\x2a\xc8\xfd\xe4\xfe\x5a\x24\xd2\x81\x9f\xd2\x9f\xe7\xc7\xfa\
-\xf3\xfd\xf8\x94\xfe\xc3\x61\x04\xe3\xed\x17\x6d\xe9\xaf\x19\x7f\
-\x9b\x9f\xce\xeb\xcf\x24\xcf\x6e\x78\xee\xfd\x3e\x8d\x3a\xad\x28\
-\x67\x4c\x63\x51\xa3\x28\x23\x87\x6d\xd0\x31\x06\x01\xdc\xff\x83\
-\xfe\xfb\x41\x11\xfe\x89\xc6\x5b\x84\x15\x8c\x23\x74\x3d\xb8\xd7\
-\x54\x5d\x6b\xe9\xc6\x8f\x4f\x3f\xc2\xe8\x85\xa6\xf1\x37\xbd\x3e\
-\x44\x3f\xc2\x70\x29\xc2\x70\xef\x77\xc7\x7d\x87\x90\x5f\x45\x19\
-\x52\x54\xd4\x28\x8a\xa2\x28\x8a\x32\x12\xa8\xa8\x51\x14\x45\x51\
-\x14\x65\x24\x50\x51\xa3\x28\x8a\xa2\x28\xca\x48\xd0\x58\xd4\xa4\
-\x3e\x16\xa5\x28\x8a\xa2\x28\x8a\x72\x56\x34\x16\x35\x29\x0f\x8a\
-\xa2\x28\x8a\xa2\x28\x83\x88\x8a\x1a\x45\x51\x14\x45\x51\x46\x02\
-\x15\x35\x8a\xa2\x28\x8a\xa2\x8c\x04\x2a\x6a\x14\x45\x51\x14\x45\
-\x19\x09\x54\xd4\x28\x8a\xa2\x28\x8a\x32\x12\xa8\xa8\x51\x14\x45\
-\x51\x14\x65\x68\x48\x69\x14\x15\x35\x8a\xa2\x28\x8a\xa2\x0c\x0d\
-\xa9\xef\x53\xaa\xa8\x51\x14\x45\x51\x14\x65\x24\x50\x51\xa3\x28\
-\x8a\xa2\x28\xca\x48\xa0\xa2\x46\x51\x14\x45\x51\x94\x91\x40\x45\
-\x8d\xa2\x28\x8a\xa2\x28\x23\x81\x8a\x1a\x45\x51\x14\x45\x51\x86\
-\x86\xd4\xf7\x29\x55\xd4\x28\x8a\xa2\x28\x8a\x32\x34\xa4\x34\x4a\
-\x50\xd4\x28\x8a\xa2\x28\x8a\xa2\x0c\x22\xd7\xf6\x6e\x1a\x42\xff\
-\xa9\xa8\x51\x14\x45\x51\x14\x65\x24\x50\x51\xa3\x28\x8a\xa2\x28\
-\xca\x48\xa0\xa2\x46\x51\x14\x45\x51\x94\x91\x40\x45\x8d\xa2\x28\
-\x8a\xa2\x28\x23\x41\x50\xd4\xe8\xea\x27\x45\x51\x14\x45\x51\x06\
-\x91\x3b\x0f\x3e\x34\x84\xfe\x0b\x8a\x9a\xd4\xc7\xa2\x14\x45\x51\
-\x14\x45\x51\xce\x0a\x5d\xd2\x3d\x68\x5c\x99\xa9\x26\xe4\x4f\x89\
-\x13\x2a\x43\x97\x90\x1f\x45\x19\x56\xb4\x7e\x2b\x6f\x30\x2a\x6a\
-\x06\x80\xf3\x33\x73\xd9\xb5\x1b\xfb\xd9\xfd\x8f\x3e\xce\xd6\xb7\
-\x76\xb2\xbd\xfd\x83\xec\xd7\xdf\x7f\x37\x1c\x1c\x1d\x19\xf7\xb7\
-\x3f\xfc\x4f\xf6\xf8\xc9\x27\xd9\xf4\xf2\x6a\x76\x6e\x7a\x36\x7b\
-\xa7\x0f\x8d\xd6\xee\xed\x3b\xd9\xfc\xda\xb5\x6c\x7e\x75\x3d\x3b\
-\xba\xff\xc0\xc0\x71\x5d\x37\x69\xbe\xb2\xb4\x2c\x69\x99\xee\x4b\
-\x7a\xfa\x45\x93\xf2\x9c\x5c\xbc\x9a\xbd\x33\xe9\xa4\x3f\x10\xde\
-\x28\x33\x36\xb7\x68\xea\xc0\xd1\x07\x9d\xf7\x77\xe9\xfa\x76\x5e\
-\x2e\x01\x7f\xca\xe0\x71\x69\x61\x29\x5b\xd9\xdc\x32\xf5\xfb\xc7\
-\x9f\x7f\x31\x75\x9c\x7b\x49\xfd\x7e\x13\xeb\xf6\x20\xa0\xcf\xd7\
-\xe9\xa3\xa2\xe6\x0c\xb9\xb2\xb4\x92\xad\x6f\xef\x64\xaf\xff\xfa\
-\x2b\xfb\xfb\xef\xbf\xb3\xfb\xf7\xef\x1b\x38\xae\x72\x7f\xfb\xc3\
-\x0f\xd9\xdc\xea\x5a\x4f\x06\x79\xfb\xc6\xcd\xda\xf1\x55\xb9\x69\
-\x44\x57\x36\xaf\x67\x17\x67\xe7\x25\x3d\x67\xd3\x88\x8e\xcd\x2d\
-\x9c\x69\x79\x0e\x23\x33\x2b\x6b\xd1\xf2\x59\xdf\x92\x46\x77\x62\
-\x4a\x1b\xde\x21\xe0\xd2\xc2\x55\x23\xd8\x43\xf5\xfb\xf0\xde\x07\
-\x52\xaf\xf5\x3e\x9e\x05\xe3\x72\x5f\xfc\xfb\x61\xdd\xfa\x7c\x9d\
-\x0c\x2a\x6a\xce\x00\xde\xa8\x36\x77\xf7\x82\x0d\x50\x53\xf7\xcb\
-\xdf\x7e\xcf\x76\x8e\x6e\xb7\x8c\x71\x20\xbe\x20\x72\x2d\xa2\xa6\
-\x2a\xfc\x6e\xdc\x9f\x7c\xfe\xac\x78\x58\x4f\x47\xdc\x50\x9e\x88\
-\x99\x3b\x77\xef\xd6\x4a\x5f\xca\xdd\x75\x79\x0e\x29\xbb\xb7\xde\
-\x8f\x96\xc7\x9a\x88\xd4\xb7\xc7\x27\x4d\x59\xbc\x29\x22\x6f\x58\
-\x59\xba\xb6\xd9\x71\xff\xac\xfb\xf5\xeb\xd7\xd9\xdb\x97\xf5\x3e\
-\x9e\x05\xf4\xc6\xf8\xf7\xc3\xba\xf5\xf9\x3a\x19\x1a\x8b\x9a\xd4\
-\xc7\xa2\x94\x6a\x18\x16\xc1\xf8\xfa\x15\xbc\x57\xf7\xfa\xf5\xad\
-\x96\xea\xaf\xf3\x80\xc8\x35\x74\x4f\xd7\x0d\xbf\xa9\x7b\xff\xf0\
-\x28\x7b\x7b\xe2\xca\x89\x3f\xb0\x4b\xd7\x77\xb2\x5b\xb7\xdf\xaf\
-\x4c\x4f\x53\x77\xe3\xf2\x1c\x52\x10\x35\xb1\xf2\x78\xf2\xf4\x69\
-\xf6\xd6\xa5\x09\x53\x0e\xda\xe8\x0e\x36\xbc\x24\xf9\xf7\xcf\x75\
-\x9f\x97\x17\x0c\xf3\x3c\xea\x7d\x6c\x86\x7d\xfe\x43\x84\xae\xf7\
-\x40\xd4\x84\xee\x07\xe8\xf3\x75\x32\x34\x16\x35\x29\x0f\x4a\x1a\
-\xe6\x78\x9c\x84\xa0\xb1\xee\x1f\x7f\xfe\xb9\xbe\x90\x90\xff\x11\
-\x35\xa9\xf0\x7a\x75\xff\xf8\x42\xd2\x33\x5e\xa4\x27\x94\x86\x1e\
-\x39\x29\x81\x68\xdd\x8d\xca\x73\x48\x99\x59\x5e\x8d\xe6\xff\xf8\
-\x53\x1a\xdd\x71\x6d\x74\x87\x00\xe6\x87\xf9\xf7\xcf\xba\xef\xdc\
-\xb9\x93\x9d\x9f\x9a\xc9\x9f\x45\xbd\x8f\xb5\x60\x38\xef\xa7\x5f\
-\xfe\xaf\x99\x9f\x64\xe7\x28\x01\xc7\x0c\xb3\xd7\x6d\x13\xc6\x17\
-\x96\x3a\xee\x87\x75\xeb\xf3\x75\x32\x34\x16\x35\xa9\x8f\x45\x29\
-\x71\x8e\x3e\xf8\xf0\x44\x0d\xb0\x75\x6f\xef\xdd\x68\x09\x89\xd4\
-\x83\x22\xff\xf5\x73\x4e\x4d\xcc\x3d\xbb\xbc\x72\x22\x6f\x88\xf4\
-\xd0\x9c\x7a\x79\x06\xd2\x31\xec\x20\x6a\x62\xf9\x5f\xdd\xd8\xd4\
-\x46\x77\x48\x18\x9b\x5f\x14\xf1\x12\x7e\x1e\x1e\xfe\xeb\xe3\xec\
-\x9f\x63\xe3\xda\x53\xd3\x00\x86\xb4\xfd\xe7\xc1\xba\xcd\xcb\x4e\
-\x9d\x36\x56\x40\xd4\xf8\xfe\xad\x5b\x9f\xaf\x93\xa1\xb1\xa8\x51\
-\x9a\x33\xbd\xba\x5e\xcb\x00\xf3\x46\xf5\xcd\x77\xdf\x65\x77\x1f\
-\x3c\xcc\xc6\x67\xe6\xb2\x8b\x53\xd3\xd9\xea\xd6\x76\xb6\x75\xf3\
-\x20\xbb\xba\x7e\x2d\x3b\xba\x75\x3b\xe9\xdf\xba\x0f\xee\xde\xab\
-\x6e\xc0\xe4\xbf\xd4\x9c\x9a\xfd\x83\xc3\x6c\x63\x6b\x2b\x7b\xf6\
-\xc5\x97\x86\x0d\x49\x07\x70\x4c\x1a\xf9\x3f\x16\xbf\xeb\xfe\xe3\
-\xcf\x3f\xb3\xb7\x2e\x4f\xf4\xb5\xb7\x83\x06\xa7\xce\x90\x13\xe5\
-\xf9\x9f\x17\x2f\xda\xca\x93\xb2\x3c\x78\xff\x4e\xa3\xf2\xdc\x3e\
-\x60\x28\x6d\x34\x27\xf4\xa5\xe6\xd4\x68\xa3\x3b\x3c\x50\x37\xdf\
-\x13\x9e\x7c\xf6\xb9\x79\xe6\xa8\xdb\xbb\x37\x6f\x66\x77\x3f\x7c\
-\x28\x82\xe6\x72\xf1\x0c\x8e\xf0\x7d\x94\x7c\x21\x20\xcc\x70\xea\
-\x47\xff\xca\x57\x7d\x91\xd7\x2e\xf3\x7b\x7e\x7a\xae\xe3\x79\xb0\
-\xee\x1f\xa5\x4d\x61\xd8\x88\x36\xa1\x2a\xfc\xd4\x9c\x1a\x7d\xbe\
-\x4e\x06\x15\x35\xa7\x40\x9d\x1e\x11\x04\xc4\xb9\xc9\x2b\xd9\x3f\
-\x2f\x5e\xca\x1b\x21\xa9\xec\x34\x44\x6d\xc8\xb9\xbb\x0f\x1f\x05\
-\xfd\xbb\x6e\x8c\xf9\x85\xa9\x99\xf4\xc3\x22\xe7\x53\x73\x6a\x78\
-\xe0\xfe\x71\x61\xac\x4c\x0f\x6f\x7a\xc4\xcf\x6f\xce\xe5\x6c\x7e\
-\x6d\x3d\x7b\xf9\xdb\x6f\x41\xff\xae\xfb\xdd\xf1\xc9\xbe\xbe\x25\
-\x32\x29\x38\x15\x1f\xc7\x94\xe7\xc4\xdc\x42\xbc\x3c\xa5\x51\x6a\
-\x52\x9e\x6f\x8d\xe8\x44\xcb\xd4\x9c\x9a\x63\xed\x1e\x1f\x1e\xe4\
-\xfe\x50\x3f\xe9\x41\xb0\x6d\x85\x7d\x66\xa9\xbb\xa3\x2a\xca\x19\
-\x26\x5a\xb9\xbe\x65\x56\x7e\xb9\xf5\xd7\xf4\xb0\x9a\x3c\x77\xd7\
-\xc3\x8a\xa8\xf1\x9f\x07\xeb\x46\x2c\xd6\xed\xf9\x4a\xcd\xa9\xd1\
-\xe7\xeb\x64\x50\x51\x73\xc2\xb0\x64\x36\x54\xa1\x5d\xf7\xcc\xe2\
-\x55\x11\x10\x18\xdf\xa2\x01\xa2\x6b\x93\x07\x52\x1a\xa9\x16\x53\
-\xe6\x21\x65\xb6\xfc\xa5\x99\x39\xb3\xa2\x21\x16\x1e\x3c\xfb\xf2\
-\x2b\x73\xad\x31\xc4\x81\x74\x59\x51\x13\xf3\xcf\x03\xf7\xcf\x8b\
-\xf9\x1b\x1e\xe9\xe1\x01\x36\xf1\x97\x88\x5b\xc2\xe7\xff\xfd\xc3\
-\xc3\x0e\xff\xae\x7b\x7c\x76\x3e\x9d\x96\x06\xb0\x2f\x8e\x1f\xbe\
-\xef\xbe\x2a\x62\x2b\x2f\x4f\xd2\x5f\xaf\x3c\x53\xe1\xc1\xc1\x9d\
-\x7b\x79\x38\x23\xd6\xf8\xe8\x9c\x9a\x11\x42\xee\x91\xa9\xdb\xf6\
-\xf9\x2c\x9e\x59\x73\x8e\xfb\x37\x62\xf7\x90\x1e\xdb\xd8\x0b\xe3\
-\xb7\xdf\x7f\x6f\x9e\xfd\x6e\x7b\xa7\xc6\xe6\xf3\x61\x23\xf7\x79\
-\xb0\xee\x5c\xd4\x5c\xae\xd5\x1e\xe8\x9c\x9a\xd3\x47\x45\xcd\x09\
-\x53\xb5\x6c\xda\xf4\x88\x5c\xbc\x64\x2a\xb7\x79\x48\xdc\x06\x28\
-\x00\xff\xd3\x50\xad\xed\xe4\x4b\xc2\xfd\xf0\x5c\xf7\x79\xb9\x9e\
-\x6b\x8d\x5f\x3f\x6d\x72\x2e\xd5\x83\x74\x8c\xa8\xe1\x6d\x24\x92\
-\x26\xdc\x66\xd3\x3d\x09\xff\xf0\x5e\xee\xc7\x8f\xdf\xba\x0f\xde\
-\xbf\x5b\x34\x30\xbd\x8b\x9a\x5a\xe5\x29\x82\xa6\x69\x79\x6e\x1f\
-\xe6\x7b\x7c\xf8\xe1\x59\xf7\x37\xdf\xd9\x46\xb2\x8b\xde\x1a\xb9\
-\xfe\x92\x34\x92\x34\x70\xc0\x04\x67\x18\x9b\x5d\x28\xca\xd1\x49\
-\x53\xc8\x7f\x37\x48\x58\xbc\x6d\x12\x1f\x6f\x8b\xd3\x2b\x79\x77\
-\x7c\x19\x57\x71\xcd\x89\xce\xa9\x11\x3f\xa4\x81\xb8\x49\x03\x69\
-\x39\xd1\x3c\xc7\x70\xe3\x72\x09\x5d\x1b\x23\xe4\x1f\x42\xd7\xa6\
-\x28\xfc\xb9\xf5\x21\x78\x7f\x20\xe4\xbf\x82\x3c\x0c\xa9\xf3\xd4\
-\x7b\x4b\x9d\xf0\xec\x35\x3e\x91\x6b\x49\x3f\xf7\x12\x6c\xda\x93\
-\x7e\x9a\x22\xe1\x50\x77\x6c\xfd\x41\x64\xb8\xe5\xc3\x6f\x6a\x5b\
-\x0c\xf3\xbc\xd2\x06\x34\xad\xbb\x45\xd8\x6c\x9a\xe7\x3f\x0f\xd6\
-\xcd\x90\x76\x2e\x6a\xf2\xf6\x20\x95\x77\xee\x6f\x28\x7d\x10\x7d\
-\xbe\xe4\xf8\xc4\xcb\x17\x24\xac\x81\x78\x3e\xfb\x4c\x63\x51\x93\
-\xfa\x58\x94\xd2\x0e\x9b\xc1\xc5\x2a\x34\xc7\x47\xb7\x6e\x65\xe7\
-\xe5\x4d\xc2\x35\xc0\x75\x2a\x91\xa9\x74\xf2\x20\x6c\xee\xec\x24\
-\xc3\x5f\x58\x5d\x2b\x1f\xbc\x8e\x70\x24\x8c\x94\x40\xb0\x0f\x5c\
-\x55\xa3\x40\x5a\xc8\x67\x28\x7e\xeb\x66\x0e\x0b\x3d\x3a\x75\xf3\
-\x17\x83\x9d\x82\x53\x1b\xeb\xf5\x52\x9e\xe4\xf3\xd6\xed\xf8\x1c\
-\x1b\x33\x04\x55\xa3\x3c\x5c\xd8\x78\xeb\xf1\x93\xff\x32\x3b\x19\
-\xa7\xe6\x54\xd1\x63\xd6\xaf\x8d\xff\x10\x4b\x9f\x3c\x7b\x1e\x8d\
-\x8f\xb8\xa6\x96\x5b\x71\x9d\xc4\x9c\x1a\xd2\xc0\xce\xb6\x0c\x09\
-\xc4\xee\x17\xab\x48\xd8\x7c\x6c\x6a\x25\x4f\x4b\x2f\x79\x8e\xc1\
-\xde\x2d\xbf\xfe\xfe\xff\xca\x9d\xa4\xc1\xee\x2c\x3d\xbd\xbc\x52\
-\x2b\xde\xc7\x9f\xe4\xf7\xcf\xf7\xcf\xf1\xe5\xf9\x45\x29\xc3\x7a\
-\x69\xe7\x19\xa1\x4c\xf0\x4b\x99\x84\xca\x1b\x5e\xfd\xf9\xa7\xd9\
-\xe7\xc9\x84\x6d\xeb\x43\x20\x3c\x1f\xea\xda\xc1\xd1\xad\x32\x7d\
-\xfb\x92\x3e\xe0\x98\x95\x51\xb1\xbc\x32\xe1\x9e\x32\x0a\xe5\xaf\
-\xad\x8c\x04\x7a\x49\xa9\x5b\xaf\xfe\xfc\xdf\x60\xfa\x37\x77\x76\
-\xcb\xba\x55\xa7\x4c\x7c\xec\x4e\xe0\xcf\xbf\xfe\xc6\xc4\x4f\x1d\
-\x8e\x95\x0f\xcf\x8b\x1f\xbf\xeb\xde\x12\xc1\xd3\xe4\x79\xa5\x47\
-\xdd\x2f\xbf\x54\xf8\xf4\x4e\xb3\x6d\xc5\x4b\xb9\x16\x62\xf5\x01\
-\xb1\x10\xf2\xcf\xb1\xdb\xc6\x72\x9f\xab\xca\x97\xf6\xba\x97\xf2\
-\xb5\x0c\xca\xf3\x79\x52\xa4\xbe\x4f\x19\x14\x35\x29\x15\xa4\xb4\
-\xc3\x12\xee\x50\x85\xb1\x6e\xc4\xa1\xab\xf8\x9b\x54\x1c\x1e\x02\
-\x54\x75\x2a\x7c\x33\xa1\xcd\x88\x89\xc0\x83\x2d\xee\xaa\x39\x35\
-\x75\x1b\x05\x3e\xdb\xe0\xfb\x77\xdd\x57\xe4\x61\xef\x87\xa8\xa9\
-\x2a\xcf\x7c\x95\x87\x94\x67\x17\x3d\x2a\x34\x46\x8f\x8f\x9f\x24\
-\xc3\x67\x9e\x52\x9d\x71\x74\x1a\xe7\x6e\x77\x36\xbe\x27\x0f\x23\
-\xf7\xcb\xc4\xd1\x20\xfd\xc4\x89\x31\xa8\x0a\xdf\xba\xd7\xa5\xb1\
-\xe5\xde\xb2\xd1\x60\xec\xfa\xe3\x86\xdd\xe3\xd7\x6e\xe4\x9f\xa3\
-\x88\x85\x17\x73\x33\xff\xe1\xa2\xa4\xbf\xdf\x8d\x67\xaa\xbe\x2c\
-\xae\xad\x17\xf7\x52\xe2\x0c\xf8\xb5\x60\x64\x42\xfe\x81\xde\x3d\
-\x6b\x90\x42\x7e\xa1\x97\x8d\x21\x59\x42\x3c\xb5\xbc\x5a\xab\x5c\
-\x52\x3d\x02\xa9\x15\x7c\x18\x5d\xff\x7a\xeb\xbe\xf7\xe8\xb1\x29\
-\xa3\x73\x72\x5d\xd5\x3e\x38\xae\x7b\x59\xda\x0e\xea\x4c\xd5\x73\
-\xe2\x82\x41\xc7\x98\xd7\x09\x3f\xe4\x36\x8b\x02\x7e\x7a\x61\xea\
-\x2c\x6d\xd7\x95\x05\xdb\xe6\xd4\x17\x35\xa9\xf0\xeb\xb8\xe9\x3d\
-\xf7\xeb\x43\xaa\x7c\x49\x2b\xcf\x17\x13\xbc\x4f\xba\x7c\x61\xd0\
-\x9e\xcf\xb3\x40\x45\x4d\x8f\xa4\xe6\xac\x30\x27\x26\xef\x55\x90\
-\x07\xaf\xa6\xd1\xf0\xa1\x92\xf1\x76\x14\x0a\xdf\xba\xa3\x93\x74\
-\xc5\x5d\x35\xa7\xa6\xae\xa8\x49\x35\xa8\x1c\x9f\x93\xf8\x4b\x51\
-\x13\xf0\x5f\x97\x54\x7a\x39\x9e\x98\x5f\x28\xd3\xdc\xf4\x81\x27\
-\x8f\x8b\xf2\xf6\x42\x83\xb1\xbc\x7e\x2d\x7b\xf8\xf1\xbf\x0d\xcc\
-\xcf\x61\xa5\x14\xc7\x17\x44\xbc\x55\x89\x1a\x1a\xe7\x6e\x0c\x98\
-\xeb\xe6\x0d\xf0\x22\xdd\xc0\x35\x1b\x11\xba\xca\xbb\x31\x08\xec\
-\x23\x34\xb5\x74\x35\xfa\xff\x71\x03\x51\x83\x80\x48\xf5\x40\xd4\
-\x71\xef\x1c\xde\x32\x46\xa8\xf1\xbd\x8b\xc0\x2a\x98\x58\x7c\x4c\
-\x10\xaf\x1c\x4e\x94\xf3\x7c\x3b\x2c\xe4\x9f\xe3\xed\xfd\xc3\x78\
-\x4f\xa8\x40\x2f\x48\xaf\x1b\x43\xb2\x4c\xfb\xd2\x5c\x75\x5d\x48\
-\xf5\x08\x98\x5e\x0b\x9e\xbf\xc0\x7d\xe4\xd9\xf5\xaf\xb7\x6e\xea\
-\x3c\xf3\xcd\x52\x3d\x98\x31\x77\x2e\x88\xaa\xef\xe5\xf9\x99\xf9\
-\x46\x06\x3d\xe4\xde\x92\x36\x90\x36\xc6\x2c\x6c\x60\x1e\x9d\xd4\
-\x59\xf2\x6b\x9e\xd5\x9a\x6d\x4e\xaa\xc7\xb2\xae\x7b\x55\xc4\xab\
-\x5f\x1f\x52\xe5\x7b\x2c\xcf\xd7\x98\xb4\x29\xdd\x94\xef\xa3\x7f\
-\x3f\x69\xd4\xce\x0d\xe2\xf3\x79\x16\xa8\xa8\xe9\x05\xb9\xf1\xa9\
-\x06\xcd\x8c\xcb\x5e\xbc\xd4\xea\x55\x08\x85\x51\x01\x95\x8b\x6e\
-\xd8\x50\xf8\xd6\x5d\x4e\xd2\xf5\xdf\x48\xc5\x6f\xd5\x9c\x9a\x5a\
-\xa2\x46\xfe\x4b\x6d\xfc\xc5\xd2\xef\x5e\xf3\x69\x90\x78\x4e\xa3\
-\x3c\xc9\x2f\x61\xd8\xd5\x51\x25\x34\x92\xa6\xc1\x8a\x97\x07\x1f\
-\xae\xeb\x55\xd0\x58\x37\xab\xca\xde\x93\x7b\x66\xf2\x92\x28\x7f\
-\x7a\x68\x78\xfb\xaa\x0a\x2f\xe6\x3e\x4a\x34\xa8\x75\x87\x9f\xaa\
-\x7a\xd0\x9a\xb8\xa7\x45\x14\x76\xf3\x16\x1a\x62\xe9\xda\x46\x34\
-\x3e\x96\x3a\x57\xbe\xc9\xcb\x79\xba\xe0\x43\xfe\x21\xef\x0d\x28\
-\xea\x9b\x17\x06\x3d\x34\x74\xef\xc7\xe2\x6f\xe2\xe6\x05\xe8\xa2\
-\x18\xff\x54\x5d\x48\xf5\x08\xa4\xe6\x97\xa4\x5e\x48\x36\x24\xef\
-\xf4\x80\xc4\xfe\xaf\x72\x57\xae\xc0\x14\xe8\xc5\x8a\xf9\x6f\xe2\
-\xde\xba\xb9\x5f\xf6\xd2\xe6\x62\x46\xea\x50\xc5\xb3\xe3\x92\x5a\
-\x05\x58\xd7\x4d\x5b\xeb\xd7\x87\x54\xf9\x6e\xed\xee\xf6\x54\xbe\
-\x08\xce\x3a\xcf\xca\xa0\x3e\x9f\x67\x81\x8a\x9a\x1e\x60\x02\x56\
-\xaa\x82\x60\x30\xf2\xa1\xa7\xf4\x9b\x7f\x12\xf1\xc7\x98\x67\x28\
-\x7c\xeb\xce\x1b\xef\x80\xa1\x17\xbf\xfd\x98\x53\x43\x63\x9a\x7a\
-\x03\x28\x87\x84\x7a\xc9\xa7\x70\x2a\xe5\x29\xe0\x97\xb2\x32\x0f\
-\xae\x0f\xe7\x23\x61\x33\x67\xa2\x5f\x82\xc6\xba\xf7\xa4\xa1\xae\
-\x9a\x1b\xc4\x9c\x9d\xba\xe1\x35\x75\xd7\x11\x35\x7c\xe9\x3d\x75\
-\xff\x31\xc8\x0c\x0b\x10\x16\x20\x3e\x53\xf1\x73\x3d\xbd\x5d\x49\
-\xb1\x51\x13\x44\x8d\x1f\xbe\x75\x2f\xac\xac\x4a\xde\xaa\x45\x0d\
-\xf3\x37\x42\xfe\x39\x4e\x0d\xab\x32\x67\xc1\xbf\xde\xba\xc9\xe3\
-\xae\x3c\x7b\xf4\x02\xee\xbf\x7f\xc7\xf4\x88\x20\x20\x62\xd7\xc3\
-\x86\xe9\x05\x28\xea\x82\x13\x8f\x25\xd5\x23\xc0\xbe\x52\xb1\x67\
-\x39\xd5\xc3\xd3\xab\x3b\x4f\x73\xfc\x25\x23\x35\xe4\x83\xb1\x9f\
-\x5f\x5e\x31\xbd\xd9\x66\x5b\x06\x81\x7b\x16\xbb\x9e\x63\xf3\x29\
-\x88\x8a\xe7\x25\x46\x6a\x15\x60\x5d\x77\x48\xd4\x9c\x65\xf9\xc2\
-\x20\x3f\x9f\x67\x81\x8a\x9a\x1e\x48\x29\x74\x8e\x67\x96\xae\xd6\
-\x12\x0d\x55\xb0\x93\x68\x28\x7c\xeb\xa6\xc1\x0c\xbe\x91\xca\x71\
-\xd5\x9c\x1a\x7f\xf5\x93\x0b\xf3\x79\x98\x6f\x90\x7a\x60\x5e\xfe\
-\xfa\x5b\x3e\xc4\x46\xfc\x3d\xe6\xf3\xb4\xca\xd3\x80\xff\x18\xa1\
-\xeb\x85\x1b\x07\x07\xc9\xf4\x61\xc4\xe6\xa4\x11\xa7\x3c\xde\x91\
-\xf2\xa0\xbb\x1c\xc1\xf9\xc7\xab\x3f\x83\xd7\x5b\x77\x6a\x23\x45\
-\x36\x75\xac\x6a\xb0\x10\x95\x17\xe9\xf1\x91\xb2\xc1\x30\xac\x6e\
-\xed\x54\x1a\x50\xeb\x3e\xae\x1a\x7e\x92\x73\xa9\x31\xfa\x67\x5f\
-\x7c\xd1\xb6\x57\x10\xf5\x29\xe7\xb2\x34\xc8\xf1\x1e\x90\xed\xbd\
-\xbd\xca\xc6\xba\x0e\x0c\x3f\x85\xc2\xe7\xb8\x89\xa8\x09\xf9\x07\
-\x36\x72\x0c\x8a\x1a\x39\x4e\xbd\x30\x5c\x91\x32\x69\x1b\x2a\x29\
-\xa0\xa7\x2f\x56\x1f\xf2\x89\xea\xf1\xe7\xa8\xaa\x47\x20\xf6\x6c\
-\xa4\x7a\x78\x5c\xb7\x99\xb3\x22\x06\x8f\x8d\x2c\xaf\xcc\x2f\x98\
-\xe7\x8d\x8d\x38\x63\xd7\x03\xf5\x2f\x95\xe6\x9f\x7e\xf9\x25\xe8\
-\x9f\x09\xff\xe7\xe4\xfe\x53\x6f\x4c\xd9\xd0\xfb\x22\xf0\xbb\xb0\
-\x9e\xf7\xbe\xb9\xd7\x5b\x77\xe5\x36\x16\x09\x28\xbf\xc7\xc7\x9f\
-\x64\x8f\xfe\x7d\x6c\x86\x9b\x11\x9c\x7e\xf8\xd6\x4d\xfa\xf8\x9f\
-\x67\x0b\xcc\xf5\xc2\xe4\xe2\xd5\x8e\xf8\x4f\xbe\x7c\x13\x6d\x9e\
-\x9c\x1b\xe4\xe7\xf3\xa4\x48\x7d\x9f\x52\x45\x4d\x0f\x30\xc3\x3c\
-\x54\x21\xac\xdb\x34\x88\x89\x07\xbe\x2e\x18\xbb\x54\x0f\x01\x06\
-\x2c\x18\x8f\x1c\x57\xcd\x51\x61\x67\x52\xc6\x7b\x81\x55\x07\xc0\
-\x71\x9d\x1e\x89\x3f\x5e\xbd\x32\x73\x5c\x4a\x61\x54\x31\x21\xb3\
-\x8a\xd3\x2a\xcf\x6e\xa8\x9a\x64\xc8\x1b\x67\xcb\x88\xb1\xf9\x5f\
-\xab\x91\xa6\x51\xa2\x47\x26\xe6\xdf\x18\xb3\x90\x28\x15\xe8\xa5\
-\x09\xc5\x67\xdd\x5b\x52\x66\xad\xfd\x8f\x26\xf2\xae\x79\x13\xef\
-\x44\xb6\xb6\xbd\xdb\x71\xbd\xef\x3e\xae\x10\x35\x55\x1b\xf7\x95\
-\x79\x26\x6e\xa9\x03\x88\x33\x83\x1c\x93\x77\xf6\x12\x89\xf9\x37\
-\x06\x42\xe2\x0d\x89\xb9\xba\x24\xe7\xd4\xd0\x83\x49\x7d\xa9\x10\
-\x35\x0c\x3f\x85\xfc\x73\x9c\x12\x35\xb1\x39\x4e\xdc\xcf\xbc\x5c\
-\x78\x2e\x18\x2a\xc9\x7b\x01\xf9\xa5\x5c\xe6\x12\x3d\x06\xa9\x89\
-\xea\xa9\x1e\x81\x94\xa8\x49\xf5\xf0\x58\xb7\x15\xe4\xd6\xf8\x19\
-\xa1\x41\x3d\x96\x5f\x56\x58\xa6\xfc\x23\xe2\xf3\xe7\xbf\x3d\xde\
-\x54\x7a\xd9\xb7\xcb\x08\x1a\xea\x0d\xf9\x95\xf2\xb5\xe0\x5e\xbb\
-\xbe\xd5\x76\xbd\xf5\x5f\x25\xa2\x92\xc8\xf5\x26\x7c\xb9\x27\xc4\
-\x7b\x41\xce\xf9\xe1\x5b\x37\xe5\xd1\x2e\x4a\x79\xa6\x8b\xe1\x69\
-\xee\xa7\x13\x77\xaf\xe5\xbb\x5c\x88\xb8\x98\x7f\xe6\xe4\x84\xca\
-\x17\x06\xfd\xf9\x3c\x29\x52\x1a\x45\x45\x4d\x0f\x60\x84\x63\x15\
-\x82\x63\x3e\x7f\x10\x6c\x10\x1b\x42\xa5\x42\x6c\xf8\xe1\x5b\x77\
-\x2e\x6a\x02\x0d\x9a\x1c\xa7\xe6\xd4\xf4\xe2\xe6\x8d\x23\x17\x34\
-\x0c\x07\x15\x8a\xbe\xc7\xca\x7f\x5a\xe5\xd9\x0d\xa9\x1e\x2f\x26\
-\x31\xd2\x78\x98\x7b\x60\x1b\x3d\x49\xa3\x85\xfb\xc2\xca\x02\x1a\
-\xe4\x90\x7f\x08\x6e\xfc\x27\xc7\xa9\x39\x46\xc7\xa6\xd1\x72\xf7\
-\xeb\xf1\xe3\xbd\x92\x9c\x24\x0c\xf4\xd6\xe1\x3f\x66\x24\x62\xf5\
-\x87\xbc\x98\xdd\xb1\xcb\xfb\x4f\xe3\x27\xf1\x4a\x18\x25\x92\x06\
-\xe6\x0c\x85\xfc\x73\x4c\x0f\x63\x59\x77\xbc\x78\xeb\x52\x39\xa7\
-\xa6\xa6\xa8\x09\xf9\x87\xe8\xf0\x93\x1c\xa7\x7a\xd0\xd8\xc2\xdf\
-\x18\x12\x63\x14\x9c\x72\x91\x70\xa8\x0b\x2f\x7f\xfb\xdd\xcc\xa9\
-\x32\xcb\x86\x0f\x0e\x4d\x8f\x27\xee\x94\x01\x4b\xf5\x08\xa4\x86\
-\x9f\xaa\x7a\x40\xd9\x99\xdb\x0c\x01\xb5\x19\x3f\x49\xb7\xc0\x2f\
-\xf7\x88\x97\x9f\x98\x7f\x33\xa7\x4f\x0c\xa4\x7f\x1f\xf9\x16\x5e\
-\xe8\x7a\x68\x4d\xf8\x27\xaf\x4e\xd9\x9a\x72\x9a\x36\x2b\xf6\x62\
-\xf1\xf5\xb2\x7b\xb9\xbd\x07\xe4\x8d\x89\xfa\xa1\xf0\x81\xf6\xad\
-\x4d\x74\x51\x1e\xf6\xf9\x22\x5e\x27\xee\xb3\x2a\x5f\x18\xf4\xe7\
-\xf3\xa4\x48\x7d\x9f\x52\x45\x4d\x0f\x54\x8d\xd1\x8e\xcf\xce\x85\
-\x1b\xc4\x86\x50\x01\x11\x35\x7e\xf8\xd6\x4d\x17\x66\xb0\x41\x93\
-\xe3\x54\x17\x79\x53\x37\x6f\xa0\xbc\x71\xb0\x65\x39\x9b\x09\xda\
-\x37\xd1\xa4\xd1\x68\xc0\x69\x95\x67\x63\x4c\xf9\x87\xf7\x95\x00\
-\xca\x23\x2a\xee\xe4\xd8\x36\x20\xeb\x72\x5d\xc8\x3f\xc7\xe6\x1e\
-\xda\x86\xab\xf0\x6f\xf7\x06\x0a\x5d\x0f\x0c\x39\x95\xbd\x64\x91\
-\x78\xa9\x13\xdf\x7e\xff\x43\xd0\x3f\xc7\x29\x51\xc3\x04\xe5\x58\
-\x8f\x1d\x46\xd4\x36\xfa\xa6\xc1\xc7\x6f\x20\x7e\xea\x06\x1f\x07\
-\xf4\xfd\x03\x06\xbd\xeb\xb7\xee\x82\x33\x9b\x53\x23\xc7\x55\x93\
-\x84\xe9\x6d\xb8\x2c\xf7\x10\xbf\xb6\x7c\x6c\x5d\xc0\x50\x12\x2e\
-\xf5\xa6\x45\xde\xdb\x56\x96\xa7\x9b\x4e\x21\xd5\x23\xd0\xed\x9c\
-\x1a\x04\x55\x9b\xf1\x73\xef\x65\x01\xe9\xfd\xe4\xb3\xf8\x10\x5d\
-\xbe\xf1\x66\x51\x46\x6e\xbc\xd7\x36\x83\xd7\x73\x9c\xd7\x9d\xc0\
-\xf3\x02\xe2\x5e\x17\x83\xe5\x5e\xef\xfa\x9f\x94\x72\x88\x09\xbf\
-\xda\x88\xdf\xd4\x36\x15\x46\xd4\x98\x32\x71\x9e\x2d\x8b\x17\x56\
-\x2f\xe5\x6b\xeb\x43\x37\xe5\x3b\x0c\xcf\xe7\x59\xa0\xa2\xa6\x07\
-\x98\x4c\x65\x2b\x80\x5f\x21\x38\x6e\x33\xc2\x01\xff\x75\xa1\xf2\
-\x31\x24\xe4\x87\x6f\xdd\x29\x51\x93\xea\x61\x68\xea\x46\xd4\x1c\
-\x7f\xfa\x34\x5b\x95\x87\xd8\x15\x34\xe6\x81\x71\xd2\xdb\x2d\xa7\
-\x55\x9e\x4d\x49\xbd\x21\xf3\x46\x64\x76\x8b\x36\xe9\x8a\x3f\xfc\
-\x94\xd1\xf4\xd5\x95\x0e\xff\xd6\x6d\x86\xa0\xbc\x7b\x98\x2a\x0f\
-\xbb\xe2\xac\x3a\xde\xfc\xad\xd7\xf7\x6f\xdd\xc7\x89\xe1\xa7\xd4\
-\x1b\x28\xc3\x1d\x63\xd3\x33\xd9\x82\x18\x2e\x96\xc9\x5f\x2e\x76\
-\xcf\xa5\xac\x80\x63\xce\xf1\xdf\xf3\xaf\xbe\xee\xf0\xcf\x31\x79\
-\x36\x8d\x7d\x97\x6f\xdd\x70\x96\x73\x6a\x52\x3d\x3c\xae\xfb\xf5\
-\xeb\xbf\xcc\xb6\x0c\x4b\xeb\x1b\xa6\x3c\x08\x8b\x34\x91\x6f\xf3\
-\xd6\x6e\xb1\x3d\x02\x72\xcf\x42\xe9\xad\xba\x1f\x29\x51\xe3\x5f\
-\x6f\xdd\x2d\xe3\x97\x3f\xcb\xa1\x78\x39\x47\xda\x43\xfe\x39\x8e\
-\x6d\xbc\x99\xda\xc9\x9a\x39\x67\xe5\x4b\x80\x1b\x57\x01\x75\x3f\
-\x16\x5f\x2e\x6a\xc4\x2f\xe5\x14\xf0\x5b\x97\x73\xd3\x55\xdf\x7e\
-\x2a\x44\x4d\xa8\x4c\x1c\x7a\x2d\x5f\xc2\x5f\xd9\xbc\x1e\xf4\xcf\
-\x71\xac\x7c\x87\xe1\xf9\x3c\x0b\x54\xd4\xf4\x00\x95\x23\x54\xa1\
-\xac\xbb\xb5\xa4\x34\xdc\x48\xd5\x85\x0a\x15\x0a\xdf\xba\xed\xdb\
-\x76\x4c\xd4\xf8\xd7\xf7\xc3\x9d\x6f\xf6\x55\x34\x4a\x7d\xaa\xf0\
-\xa7\x55\x9e\x4d\xe1\xa3\x9e\xa1\xf4\x70\x9c\x77\x53\x17\x6f\x61\
-\x91\x06\xda\xc2\x5e\x33\xbe\x7f\xd7\xdd\xd6\x80\x08\x47\x1f\x3c\
-\x88\x5e\x4f\xa3\x55\xbe\xfd\xa5\x1a\x77\x09\x87\x5d\x63\x7d\xff\
-\xd6\x7d\x9c\x10\x35\xa9\xf8\xfb\xe5\x2e\x57\xb3\x78\x71\xd7\xe5\
-\x2c\xe7\xd4\x54\xdd\xcf\x98\x9b\xb7\x6b\xe2\xa4\x37\xc2\x88\x18\
-\x09\xdb\x40\xf8\xb1\x74\x0a\xa9\xe7\xa3\xdb\x39\x35\xc6\xe8\x56\
-\x19\x6f\x39\x8f\xa8\x09\xf9\x87\x59\x26\xf0\x9b\x32\x6a\x8f\x9b\
-\x05\x0e\xa1\xeb\x39\x66\xa9\x7c\x6c\x48\x85\x30\x30\xf2\xee\xf5\
-\xd6\x3f\x2f\x11\x88\x84\x7e\x88\x1a\x3e\x53\xe0\x87\x6f\xdd\xa5\
-\xa8\xa9\x61\xd0\xfb\x51\xbe\xb1\xfc\x42\xac\x7c\x87\xe1\xf9\x3c\
-\x0b\x54\xd4\xf4\x00\xdf\x2a\x49\x55\x88\xe8\xaa\xa4\x86\xa4\x14\
-\x39\xc7\x76\x55\x50\x87\x61\x92\xe3\x93\x9a\x53\xc3\x31\xf3\x02\
-\x4c\x85\xf7\x1b\xfc\x2e\xa9\x55\x9e\x55\x46\xea\x04\x48\x0d\x71\
-\x30\x9f\xa9\xb2\xd1\x2a\xe0\x7f\x0c\x5a\x2c\x7f\x6d\x0d\x88\x90\
-\x32\xd8\xc7\x22\x46\x4c\x6f\x59\x8d\x46\xb7\xdb\x6f\x3f\xa5\xe2\
-\xef\x97\x7b\x8c\x89\xb1\x35\x04\x61\x8c\x33\x9b\x53\x23\x60\x54\
-\xe9\x35\x88\xc5\x5f\xc7\xcd\x26\x8c\x4c\x20\xad\x2b\x6a\x62\xe1\
-\x61\x3c\x53\xa2\xc6\xbf\xde\xba\x73\x71\x5c\x51\x8f\xe4\x7c\xaa\
-\x47\x2c\x66\x74\x29\x9f\x58\x0f\xb3\xd9\x09\x3d\x32\xb4\xc1\xd6\
-\x0e\xcc\x57\x0a\xc5\xd7\x12\xf3\xd5\xf5\xbe\x0a\x44\x8d\x1f\xbe\
-\x75\x97\xc3\x4f\x35\x45\x8d\xef\xdf\xba\xeb\x96\x6f\x6a\x1f\xb0\
-\x58\xf9\x0e\xc3\xf3\x79\x16\xa8\xa8\xe9\x01\x2a\x69\x6a\x95\x50\
-\xd3\x6f\x93\xc4\xa8\x52\xe4\xad\xb7\x49\x2f\x1e\x39\x4e\xcd\xa9\
-\xc1\xa0\xb1\xac\x72\x42\x1a\x6e\x60\x09\x32\xe3\xbf\x1c\x6f\xed\
-\x1f\x98\xee\xfb\xa3\x5b\xe9\x9d\x30\x99\x37\x90\x37\x30\xbd\x57\
-\xfa\xd3\x28\x4f\x76\x37\xbd\x26\xe5\xc5\xa4\x64\xba\xb8\x81\x63\
-\xeb\xa6\x41\xf5\xc3\x4e\x35\xe8\xd1\x5e\xb2\x00\xe4\x8f\xef\xcd\
-\xb8\xfe\xdd\xf0\xce\xc9\xfd\x2b\x1b\x10\xb9\x36\x65\xb0\x8f\x8b\
-\x1e\x96\x3a\xf1\x76\xf5\xed\xa7\x8a\xf8\xfb\xe5\x36\x8d\x66\xec\
-\x8d\xbd\x06\x67\x36\xa7\xa6\xf0\xcb\x79\xba\xf8\x99\xe8\x19\xf2\
-\x5f\xd7\xcd\x10\x00\xf7\xd2\x3c\x47\x91\xb4\x56\xf5\x08\xc4\xea\
-\x43\xb7\x3d\x3c\x25\x72\x3e\x65\x40\x5b\xc3\x23\xed\x61\x50\xdf\
-\x53\x3d\x3c\xac\x08\x64\x07\x6f\xfc\x71\x2d\xf0\x0c\xa6\x76\xce\
-\x1e\x9f\x99\xab\x5d\xef\xab\x48\xed\x8b\xd5\x44\xd4\xf4\xa3\x7c\
-\x11\x35\x21\xff\x10\x2c\x5f\xf9\x1d\x86\xe7\xf3\xa4\x48\x7d\x9f\
-\x32\x28\x6a\x52\x1f\x8b\x52\x5a\x50\xd9\xf9\x76\x4b\xac\x42\xf4\
-\x65\x4c\x52\xfc\x55\x0d\x21\x21\x42\xca\x49\x77\x01\xbf\xfe\xf5\
-\xd6\x8d\x41\x33\xe3\xbd\xf2\xd0\xe1\x9f\xca\x8b\x51\x35\xbf\x02\
-\x0f\x12\xff\xb1\xd5\x7e\xc8\x3f\xd0\x1d\x4c\x43\x14\x7a\xe3\x6a\
-\x4c\x45\x7a\x29\x4f\xb3\xe4\xb5\x87\xb7\x34\x56\x64\xc4\xc2\x87\
-\x8e\xef\xf0\xc8\x6f\xaa\x41\x3f\x6e\x20\x2e\x48\x73\x6a\x15\x1b\
-\x82\xd2\x17\x35\x7e\x7c\xd6\xdd\x44\x4c\x55\x2d\xfb\x24\x9c\x98\
-\xa8\xf1\xaf\xef\xb7\x9b\xa1\xbd\x5e\xde\x04\x53\x82\xf3\x44\xe7\
-\xd4\x14\x70\x4f\x09\x9f\xe7\x85\xa5\xcf\xec\x41\x13\x4b\x4f\x95\
-\xdb\x0c\xe9\xd2\x56\x44\xca\xa2\xaa\x47\x20\x56\x1f\xba\xed\xe1\
-\x29\x91\xf3\x29\x03\x1a\x13\x35\x1c\x93\x17\x7a\x74\xdd\xeb\x7d\
-\xff\x4c\x54\xe5\xe3\x8a\x29\xc1\xcf\x71\xd9\x5e\x49\x59\xc7\xee\
-\x47\x13\x10\x35\xb1\xf8\x9a\x0c\x3f\xf5\xa3\x7c\xeb\xcd\xa9\x71\
-\xc2\x90\xdf\x61\x78\x3e\x4f\x8a\x54\xc7\x4b\x50\xd4\x28\x35\x91\
-\x8a\x95\x52\xd8\x1c\x1f\xdc\xb9\xdb\x53\xa5\xa0\x8b\x34\x35\x64\
-\xc1\x52\xd0\x72\x8c\xd9\x8f\x43\xd2\x97\x12\x44\xc7\x66\x08\x83\
-\xae\x5c\xfc\x3a\x63\xfb\x0e\x3c\x8c\xef\xc9\x7f\x21\xff\xd6\x9d\
-\xfc\x52\x78\x13\x24\xbd\x87\xf7\x1f\x74\x84\xef\xba\x4d\x79\xda\
-\x46\x2d\x14\x46\x05\x55\xfb\xbe\x60\x04\xc9\x73\xd9\x90\xc9\x2f\
-\xcb\x73\x63\xd7\xd7\x6a\xb4\x0a\xac\xa8\x71\xfd\xbb\xe1\x4d\x88\
-\xd1\x2a\xcb\x51\xae\x3d\x92\xb2\xf0\xe3\xb3\xee\x5a\x6f\x80\x05\
-\xa9\x55\x65\xc7\x09\x51\x93\x8a\x9f\x8d\xc9\x18\x36\xe1\x13\x1e\
-\xbc\xcd\x01\xe5\x04\xb5\xdd\x12\x86\xf9\xd6\x56\x0f\x3d\x7d\x29\
-\xc1\x79\xa2\x73\x6a\x1c\x72\x61\x93\x0f\x1d\x72\x2d\x9b\x9d\xb1\
-\x51\x1b\x4b\xb4\xfd\xf0\xaa\xdc\xdb\x07\xf1\x0f\x68\x76\xdb\x23\
-\xd0\x6d\x0f\x4f\x89\x9c\x4f\x19\xd0\xd8\xf0\x08\x90\x0f\x3e\xe6\
-\xc8\x4a\x9a\x98\xff\x3a\x6e\x44\x86\xd9\xe4\xb3\x48\x6b\xa8\x7c\
-\x9a\x72\x5a\x73\x6a\xea\x94\x6f\xe3\x39\x35\xf2\x3b\x0c\xcf\xe7\
-\x59\xa0\xa2\xa6\x17\xa4\x62\xf1\x75\x5b\xbf\x42\xb9\x6e\x86\x6f\
-\x62\x63\xc7\x75\x48\x6d\xc5\x0e\x54\xde\x5c\x98\x04\x1e\x3e\x71\
-\xa7\xe6\xd4\x1c\x97\xbd\x0c\x91\x07\x57\xce\x71\x9e\x06\xfb\x93\
-\xcf\x3e\xef\xf0\x6f\xdd\x66\xe5\x4e\xa4\x51\x6b\x84\xf8\xad\x2a\
-\x4f\x13\x57\xb7\xe5\x29\xd7\xa7\xf6\x7d\xc1\x08\x85\xca\x32\x35\
-\x27\x05\x63\x62\xc7\xcc\xab\xd2\x93\x1a\xc3\x6f\x9b\x00\x59\x18\
-\xd0\x54\x0f\x4b\x13\x31\xd5\xed\x9c\x9a\x54\xfc\xe6\xd3\x18\x65\
-\x2f\x5f\xbe\xd9\x60\x53\xf2\x9e\x41\x29\xeb\x84\x60\xa8\x22\xd5\
-\x83\x70\xd2\x73\x6a\xda\x90\xff\x68\xf8\x89\x2b\x17\x37\x92\x47\
-\x89\x9b\xfa\x34\x25\x46\xef\xc9\xd3\xa7\x95\x3b\x4b\x03\x43\xac\
-\x31\xd1\xde\x6d\x8f\x40\xb7\x3d\x3c\x25\x72\x3e\xd5\x23\x96\x12\
-\x35\xa6\x5c\x24\x2f\xd4\xeb\x54\x8f\x6f\xcc\xcd\xf3\x6e\x3f\xa5\
-\x60\xd2\x69\xeb\x8b\x1b\x47\x97\x9c\xd6\x9c\x9a\x3a\xe5\xdb\xcd\
-\x9c\x9a\x61\x78\x3e\xcf\x02\x15\x35\x3d\x42\x43\x96\x1a\x52\x00\
-\xbe\x16\xdc\xcd\xc3\xc8\xc3\x92\x9a\x63\xc2\xb1\xf9\x3a\x76\xcc\
-\xc8\x8b\xbb\x6a\x4e\x4d\xe5\x03\x27\xf0\x50\xdb\x3d\x53\xfc\xf8\
-\xad\x3b\xdf\x7d\xb2\xba\x01\xa8\x82\xf2\x64\x7e\x81\x1f\xbe\xeb\
-\xce\xcb\xb3\x79\x6f\x4d\x6a\xdf\x0c\x30\xdd\xdb\x81\x86\x2c\xb5\
-\x8a\xa3\x1c\x62\xe4\xfe\x56\xe4\x3d\xd5\x63\x62\x7a\xdc\xdc\x70\
-\x04\xbb\x39\x58\xe8\x7a\x23\x82\xea\xc4\x2b\xff\xa5\xde\xe8\x52\
-\xa2\x26\xb5\x8f\x07\x46\x34\x8f\x5f\xee\x83\xf8\xe5\x5e\xa4\x91\
-\x6b\xb8\xce\x87\xff\x52\xe9\xaf\x20\xd5\x83\x50\x0e\x3f\x49\x3c\
-\xd1\xfa\x2d\xe7\xbb\x9e\x53\xe3\x84\x61\x21\x2f\x65\x9e\x25\x5e\
-\xea\x12\x65\x64\x0c\x8b\x94\x33\x02\x27\x35\x44\x95\x8b\xf6\xf0\
-\xfd\xe8\xb6\x47\xa0\x1f\x73\x3e\xba\x99\x53\x63\x61\xbe\x5a\xd3\
-\x55\x98\xd4\x6f\xea\xa6\xd9\x8b\xc9\x18\xe7\x7c\xd3\xba\xe4\x7d\
-\x68\xc8\x50\xcf\xa9\x11\x86\xe1\xf9\x3c\x0b\x54\xd4\xf4\x8a\xdc\
-\xf0\xd4\x3e\x20\xd6\x3d\x2b\x6f\x1b\xe5\x03\x52\xa3\x92\xd0\x80\
-\xd1\xab\x10\x0b\x8f\x63\xd3\x4b\xc0\xdb\xbd\x28\x6a\x2a\x5f\x47\
-\x38\x12\x4f\xd5\x9c\x9a\xca\x07\xae\x80\xf0\x59\xc9\xe0\xfa\x77\
-\xc3\x5b\x58\xe9\xdf\x10\xd4\xe2\x46\xde\x3b\xe5\xa7\xd7\x75\xb7\
-\xca\xb3\x5e\x23\x57\x47\x20\xda\x49\x88\x3c\xcc\x6e\x98\xdc\xb3\
-\xd4\x3e\x41\x75\x87\x18\xab\x04\xa6\xbf\x4a\x22\xb5\x8f\x06\xc7\
-\x18\xc8\xaa\x78\xf9\x92\x34\xf3\xbe\x42\xfe\xe1\x38\x36\xfc\x24\
-\x90\x8e\x98\x60\xc7\xf8\x96\xdb\xe3\x13\xbf\xe7\xb7\x44\xce\xf3\
-\xfd\x30\xea\x32\x65\x48\x78\xc0\x31\x20\x96\x7b\xe9\xda\x4e\x0f\
-\xd1\x55\x4f\x2c\xe7\x6d\x3d\xf5\xed\x9c\xd8\xf0\x13\xcb\xb9\x8d\
-\x48\xfe\xe8\x63\x63\xf0\x11\x57\xa6\xd7\x48\x8e\xb9\x96\xb2\x2b\
-\xc1\x2d\x90\x0e\xca\x8b\x2e\xfd\x58\x7c\xa5\x58\x0d\x18\x53\xea\
-\xb0\x7f\xbd\x75\xa7\x8c\x67\x3f\xe6\x7c\xa4\x7a\xc4\x52\xa2\x86\
-\xf2\xf1\x77\x5e\xb6\xdf\x2a\xe3\x85\x8c\xf2\xc5\x3f\x02\x94\x55\
-\x9c\xec\x1a\xce\x10\x08\xed\x1a\xe5\x60\xd2\x46\x8f\x81\xa4\x2f\
-\x59\xcf\xba\x20\x35\xa7\xa6\xc9\xcb\x4a\x3f\xca\xb7\xf1\x9c\x1a\
-\x81\x74\x0d\xfa\xf3\x79\x16\x04\x45\x4d\xea\x63\x51\x8a\x87\x54\
-\x0a\x2a\x0d\x4b\x33\x6d\x85\xf2\x2b\x98\x75\x3f\xf9\xec\xf3\xbc\
-\xb1\xb2\x95\x2c\x54\xd1\xe4\x1c\x13\x6f\xab\x0c\x30\x95\x96\x31\
-\xd3\xfc\x81\x89\x3c\x78\x72\xae\x6a\x4e\x4d\xe5\x03\x57\x40\xf8\
-\xa9\x37\x5a\x63\x40\x12\x6f\x6b\x4d\xa0\x7c\x98\x34\xe9\xa7\xd7\
-\x77\xf7\xb3\x3c\xd9\x29\xd9\xbc\x11\x06\x04\x22\x79\x4f\x0d\x51\
-\xd4\x19\x62\x24\x0d\xb1\x65\xaa\x1c\xe7\x82\xaa\x3d\x0c\xe2\x4d\
-\x09\x12\xb3\x2c\x36\x51\xe6\x08\x9a\xe7\x5f\x7f\x13\xf5\xcf\xf1\
-\x71\x85\xa8\x49\x4d\xa2\x7d\xf2\xf4\xb3\x56\x79\x05\xe2\x37\xc8\
-\xf9\xd8\x90\x1f\x06\xdc\x08\xf2\x1a\xf5\x2f\x46\xaa\x0b\x3e\x17\
-\x08\x52\xbf\x23\x86\x09\x63\x94\xda\x29\x9a\xe3\x98\xa8\x49\x7d\
-\x0b\x2c\x5f\xd1\xe3\x95\x09\xc7\x02\xe7\x79\xde\xee\x88\x10\x0e\
-\xf9\xa7\x17\x27\x66\x4c\xbb\xed\x11\x40\x0c\xf9\xd7\x5b\x77\x13\
-\x51\x13\xf2\x0f\xb1\xe1\x91\xa5\xeb\x3b\x1d\x82\x86\x1e\x90\xb6\
-\x6f\x2a\x89\xbf\x12\xa9\xff\xf6\xd8\x0e\x7d\x90\x2e\xca\x2c\x74\
-\xff\x7a\x85\x30\x43\xf9\xb1\xee\xd6\x16\x0b\xed\xed\x81\x4f\x3f\
-\xca\xb7\x9b\x7d\x6a\x86\xe1\xf9\x3c\x0b\x82\xa2\x46\x97\x74\x37\
-\x83\xca\xc5\xaa\x19\xb7\x42\xf8\x15\xc4\x75\xaf\x4b\xe3\x44\xef\
-\xce\xfa\xde\xbe\x19\x62\xe0\xa1\xa0\x71\x66\x12\x6b\xd5\xd6\xeb\
-\xd6\x9d\x8f\x99\x4a\xe3\x97\xaa\xb4\x72\xae\xde\x9c\x9a\x1a\x95\
-\x56\xfe\x4f\x4d\xe2\xe5\x01\xc8\xc3\x8a\x08\xac\x06\xe0\x9f\x2f\
-\x84\xb3\x13\x6b\x2c\x3e\xd7\xdd\x8f\xf2\xcc\x3f\x75\x20\xe9\x0f\
-\x19\x40\xd2\x23\x6f\x2c\x29\xff\xcc\x17\xb0\xbd\x26\xc6\xbf\x43\
-\xd5\x32\x55\xdb\xe3\xd6\x21\xa8\xc4\x2f\x13\xfd\xfc\xeb\x5d\xf7\
-\x9a\x34\x86\x65\x6f\x8d\x13\x27\x3d\x10\x75\xba\xfc\x53\xc3\x4f\
-\xb8\xcf\x4d\xcd\x24\xfd\x2f\x9a\x49\xe2\x52\x66\xa1\x3a\x28\xee\
-\xd4\x1b\xfe\x37\xdf\x7d\xdf\x73\x9d\x49\x75\xc1\x83\x59\x36\x2c\
-\x79\x20\x7f\x18\x27\xe2\xe1\x0d\xbd\xea\xeb\xf3\xd6\x1d\x1b\x7e\
-\x62\x4f\xa5\xd0\xf5\x1c\x2f\x4b\x9e\xdb\xee\x89\x93\x5e\x53\xa6\
-\x92\x66\xf7\x7a\xd7\xbf\xd9\x29\x3a\x21\x6a\x42\xf1\x41\xca\x78\
-\xf2\x3c\xf8\xd7\x5b\x77\xdd\xe1\x91\x6e\xe6\xd4\x98\x5e\xac\xc0\
-\xf5\x6b\x52\xe7\xe6\xd7\xaf\x99\x32\xe2\xde\x77\xe2\x0c\x7d\x00\
-\x61\xc6\xd2\xd6\x03\x84\x4b\x6f\x84\x9f\x3e\xeb\x36\xf5\x93\x7c\
-\x99\xba\x53\xa4\x21\x90\x8e\x7e\x94\x6f\x37\x73\x6a\x38\x1e\xf4\
-\xe7\xf3\xa4\x68\xbc\xfa\x29\xf5\xb1\x28\x25\x80\xdc\x70\x2a\xcd\
-\xb4\x18\xaf\x58\x05\xe9\xa7\x9b\xcf\xc9\xe7\x13\xe7\xbc\x95\x3a\
-\x81\x74\xf5\x63\x4e\x8d\xa5\x6a\x12\xaf\xf9\xf0\x1a\x8d\x79\x1f\
-\xba\x2b\x29\xcf\x5e\x37\x36\xab\xeb\x3e\x16\x71\xd7\x12\x15\xe1\
-\xb2\x20\x3d\x88\xa7\xaa\xf0\xf8\xbe\xd3\xe1\xfd\x0f\xcc\xb0\x08\
-\x7b\x74\xb0\x54\x35\xd5\x43\x43\x8f\x5b\xf9\xd9\x09\xbf\xf1\x90\
-\x63\xca\x3c\xd6\xc5\x6c\xdd\x4c\x70\x7e\x74\xfc\xc4\x7c\x86\x81\
-\x38\xe9\x9d\xa9\x63\xb0\x39\x4e\x8a\x1a\x81\x7c\x57\xcd\x71\xe2\
-\xdb\x52\xeb\xbb\x37\x44\x50\xce\x1b\x83\x3d\xbd\xb2\x6e\x44\x25\
-\x79\x0f\x5d\x6f\xdd\xf9\x9c\x97\xbc\xfe\x75\xdb\x68\xe2\xaf\xaa\
-\x7c\x38\xe6\x1a\xbb\x6c\x38\x75\x3f\x7c\x77\x4c\xd4\x10\x6f\xca\
-\x20\x9a\x5e\xc4\xc2\x98\x98\xbc\x15\x30\xa4\xc8\xfd\xf1\xaf\xb7\
-\xee\x7c\xe2\x7f\x5e\x17\xfc\xfb\xd1\x6d\x8f\x40\xb7\x3d\x3c\x25\
-\x72\xbe\x9b\x39\x35\xa9\x39\x64\xae\x9b\xfb\xe1\x0e\x79\x70\x4c\
-\x0f\x25\x6d\x97\x59\x99\xf6\xf8\x5f\xd9\xd4\xca\x9a\x94\x63\x71\
-\x0f\x62\xe9\x6c\x8a\x84\xc3\xe7\x2b\xaa\xd2\x47\x7a\x6c\xfa\x2e\
-\x4b\x7d\x28\xd3\x51\x84\xd3\x8f\xf2\xed\x66\x4e\x0d\x0c\xfa\xf3\
-\x79\x52\x34\x16\x35\x4a\x17\xc8\x4d\xa7\xd2\x61\x5c\x42\x15\xa4\
-\x5f\xee\xff\xfc\xf4\xa2\x10\x34\x52\xd9\xac\x02\x0f\xa5\x07\x24\
-\x4d\xfd\x9a\x53\x03\x3c\xcc\x3c\xdc\xb1\xf0\xd6\x36\x25\xbc\x80\
-\x01\xe8\x0a\x53\x9e\xd3\xd9\xda\xce\x5e\x34\xbe\x7e\xb8\x5b\x02\
-\xb1\xe2\xe1\x25\x3d\xf2\x3f\x7b\x6e\x34\x09\xbf\xca\x5d\xae\x52\
-\x88\xf4\xb8\x91\x9e\xc3\x7b\x1f\x44\xfd\xf7\xea\x3e\x4e\x0c\x3f\
-\x19\xe4\x1c\xbd\x54\x47\x09\x03\xde\x8d\x9b\x1e\x89\x77\x24\xde\
-\x58\x63\x5d\x17\xca\x27\xd5\x05\x5f\xc7\x4d\x2f\x63\xec\xff\xd8\
-\xf0\x13\xf1\xa6\x36\x96\xb3\x6e\x8c\x33\xcf\x20\x06\x9a\x5e\xc3\
-\x2a\x81\x6b\xf6\x9c\x8a\x0c\x65\x76\xdb\x23\xd0\x6d\x0f\x4f\x09\
-\x79\xed\x62\x4e\x0d\x06\x34\xd5\x5e\x34\x75\x63\x84\x79\x61\xe0\
-\x5e\xf4\xc5\xc8\x4a\x18\xa9\x39\x59\x21\x37\xed\x91\xdf\x4e\xf4\
-\xa3\x7c\xbb\x99\x53\x63\xfd\x0e\xf2\xf3\x79\x52\xa8\xa8\x39\x25\
-\xa8\xe8\x54\xde\xa9\xa5\xab\x8d\x2a\x50\x5d\xf7\xb1\x18\x20\x0c\
-\x70\x3e\x4c\x12\xe9\xde\x76\x91\xff\xfa\x35\xa7\x06\xc8\x5f\xec\
-\xe3\x67\xd0\x1a\x82\xea\xcf\x43\x40\x7c\x34\xee\x97\xe4\x0d\x83\
-\x06\xdf\x8f\xaf\x57\x37\x1f\x02\xad\x2d\x10\x05\xd2\xc3\xf0\x16\
-\x7b\x6e\xd4\x09\xbf\xca\x7d\x6c\x7b\x88\x52\x3d\x6e\x94\x81\xa4\
-\x71\x6f\x7f\xbf\x32\xbc\x90\x9b\x7b\xc2\xdb\x7f\xec\x7f\xd2\x40\
-\xfe\xa3\xa2\x46\xa0\x5c\xf8\xda\x34\x61\xf9\xfe\xbb\x71\x73\x2f\
-\xdb\xbe\x30\xde\x4b\xcf\x9e\xa4\x99\xde\x2c\xde\xa2\x63\xf1\xa5\
-\xdc\xcc\xf1\x60\xc9\x70\xec\xff\xe8\x3e\x35\xe6\xbe\x4c\x9b\x8d\
-\xe3\xdc\xeb\x7d\xff\x4d\xdc\xfb\x62\xbc\xf2\xa1\xa7\xe2\xd9\xb6\
-\x71\x15\x74\xdb\x23\xd0\x6d\x0f\x4f\x89\x9c\xef\x66\x4e\x0d\xf5\
-\x79\x71\xe3\x7a\xdf\x9e\x17\xeb\xe6\x59\xc8\x9f\x97\x8a\xf6\xaf\
-\x06\x94\x33\xf3\x21\xeb\xc6\xbf\xba\xbd\xd3\x71\x7f\xfa\x51\xbe\
-\xdd\xcc\xa9\xb1\x90\x96\x81\x7d\x3e\x4f\x08\x15\x35\xa7\x08\x0f\
-\x32\x15\x98\xad\xd3\x9f\x7d\xf9\x55\x65\x05\xaa\xe3\xa6\x92\x99\
-\x06\xcf\x18\xc0\xa2\xa2\xf1\x50\x55\x3d\xd0\xf2\x7f\xdf\xe6\xd4\
-\x80\x5c\x53\x35\xc7\x03\x91\x90\x3f\x08\xbd\x35\x36\x16\xc2\xc1\
-\xe0\x5e\x9c\x99\xeb\x6b\x79\xde\x7d\xf0\xb0\xab\xf2\xe4\xba\xf7\
-\xe4\x21\x27\x2d\x75\xe3\xf3\xdd\x79\xfc\x1f\xb6\xe2\x37\xc3\x4e\
-\xf1\x86\x83\x32\x40\x4c\x55\xed\xcc\xea\xbb\x69\xe4\xae\xcc\x2f\
-\x98\x55\x26\xb1\xeb\xab\x86\x9f\x0c\x45\xbe\xa9\xd3\xbd\x1a\x28\
-\xde\x00\xf3\x06\xb3\x62\x3e\x58\x03\x28\x3b\xba\xd7\xeb\xc4\xef\
-\xba\x8f\xa5\xfe\xf3\x36\x3a\xbb\x14\xff\x1a\x3a\x1f\x5e\x0c\x8a\
-\x1a\x13\x6f\xbe\xb1\x1c\xf3\x76\x62\xfe\xeb\xb8\xcd\xf3\x7d\xbb\
-\x78\xbe\x89\x2b\x72\x2f\xba\xed\x11\xe8\xc7\x9c\x8f\x6e\xe6\xd4\
-\x70\x4c\xb9\x21\x02\x98\x73\x16\xf3\xdf\x8d\x9b\x21\x95\xaa\xe7\
-\xa6\x0e\xdc\xc3\x73\x42\xdd\x1e\x58\x86\xd8\xfd\x5e\xd5\x7e\x94\
-\x6f\x57\x73\x6a\x1c\xff\x83\xfc\x7c\x9e\x04\x2a\x6a\x4e\x19\x6b\
-\x88\x79\x98\xa7\x16\x97\x4c\x8f\x40\x9d\x0a\xe5\xbb\x59\x91\x63\
-\x37\x9e\x32\xab\x05\xa4\x62\x9b\x07\xb9\x6e\x45\x93\x6b\x52\x73\
-\x6a\x98\xb0\x57\x69\xd0\x3c\x78\x2b\x8e\x85\xc7\x71\xb9\xbb\x70\
-\x8f\x8d\x8d\x8b\x29\x4f\xd3\x38\x5e\xc9\x2e\x15\xe2\x26\x16\x7f\
-\xca\xcd\x03\xbb\xb0\xbc\xda\x7d\x79\x82\x93\x96\xa9\xc5\xab\x8d\
-\x0c\x1a\xc6\x8b\x0f\x60\x4e\x88\xd0\x68\x14\xbf\x13\x27\x93\x50\
-\x63\xe1\xbb\x6e\x7a\x20\xce\x4d\x4c\x8a\xa1\xbc\x9c\x5d\x90\x30\
-\x62\xd7\xe7\x75\x20\x6e\x48\x4b\xca\x34\x4c\x66\xf7\x1e\x3e\x6a\
-\xfc\xad\x23\x04\xd6\x82\xd4\x65\x44\x44\x9e\x77\xa9\x23\x12\x27\
-\xf7\x36\x18\x5f\x13\x8a\xb4\xd1\xa3\x47\x37\x7c\x55\x7a\x28\x9b\
-\x2d\xb9\x6f\x56\x54\x1e\xde\xcd\xaf\x09\x5d\x9f\x8b\x9a\x48\xe3\
-\x5e\x96\xc9\x15\x29\x93\xc7\x8d\x87\x00\xa8\x0f\xec\x5c\xcb\x2a\
-\xc6\x56\x7d\x88\x97\x49\xba\x47\xc0\x4e\xea\xec\xbc\x8f\xe9\x1e\
-\x9e\x1a\xdf\x53\x93\xf3\xe9\x39\x35\x77\x4d\xda\x43\x65\x44\x9a\
-\x53\xab\x26\x7b\x71\xdb\x09\xe0\xd1\x74\xd7\xc4\xde\xc3\xc5\xd5\
-\x75\x23\x0a\x62\xf1\x71\x1c\x12\x35\xfd\x28\xdf\xf4\x9c\x9a\x78\
-\xf9\xba\x61\xe4\xf9\x18\xc0\xe7\xf3\x04\x68\x2c\x6a\x52\x1f\x8b\
-\x52\x6a\x62\x2b\x99\x18\x2d\x2a\x08\x15\x9b\x7d\x45\xf8\xd2\x34\
-\x4b\x71\x79\x78\x52\x1f\x8b\xc4\x00\xff\xe3\xfc\x45\xa7\x37\xc1\
-\x56\xb2\x0a\x03\xe8\x22\xd7\xad\xef\xdd\xcc\xee\x3d\x7a\x6c\xc4\
-\x06\x13\xbf\xd8\x65\x15\x38\x26\x3d\xf9\x03\x5a\xbf\x61\xa0\x92\
-\xdf\x7b\xfc\x91\x99\x55\xef\x87\x07\xdb\x92\x6e\x1a\x08\xf3\x00\
-\x06\xfc\x77\x4d\x59\x9e\xb9\x58\x8c\x95\x27\x0f\x27\x1c\xdd\xba\
-\x65\xca\x10\x41\x69\xf6\xc5\x98\xca\x37\xf1\x32\x0f\x2c\xc3\x3d\
-\x65\x79\x4a\xbe\x6b\xe6\xbd\xa4\x4c\x4b\x7e\x6f\xe7\xd7\xae\x49\
-\xde\xd7\x8c\x60\x21\x2d\x2c\xcb\x25\x2d\xc4\xcf\x1b\xf4\xf1\xa7\
-\x4f\xcd\x1e\x1c\xa6\xc1\x10\x91\xd1\xd5\xfd\xb4\x71\x4a\xd9\xd2\
-\xc0\x71\x3f\xf7\xc4\x20\x12\x97\x8d\x0f\x03\x49\x5e\x8d\x91\x2c\
-\xea\x0d\xe9\x33\x0d\xb6\xa4\x91\x7b\xd6\x71\xbf\xf6\x0f\x8b\x3a\
-\x50\x23\x1d\x6d\xf9\x9e\x30\x82\x3d\x54\xfe\x7f\xbc\x7a\x65\xf2\
-\xce\x5b\xaa\x4d\xcf\x3b\x72\x7d\xab\xec\xa9\x1f\x7d\x6e\x30\x4d\
-\xda\xf2\xba\x41\x1d\x64\x55\x18\xe5\x83\x80\x31\x22\x46\xd2\x62\
-\xb6\x8e\x97\x32\x28\xeb\x81\xa4\x89\xb4\xb0\x72\x91\xf2\xa1\x4c\
-\xfd\xf2\xe1\xde\x9a\x7b\x45\xf9\x44\xe3\x6d\x95\xc9\xda\xf6\xae\
-\xf8\x7f\x64\xea\x02\xf7\x83\x7b\x43\x99\x20\x60\x28\x1f\xd2\x72\
-\x1c\xaa\x0f\xdc\x83\x0a\x23\xc2\xaa\x2d\x9e\x3d\x04\x94\x4d\x9f\
-\x4d\x6f\xfe\x2c\x87\xdf\xe6\x59\x09\xb7\xb8\xce\xfd\x5f\xef\xc8\
-\x5f\x7e\xff\x13\xbd\x00\x05\xf4\x14\x12\x06\x1b\x5f\xba\xfe\x39\
-\x8e\x95\xd1\xf8\xc2\xd5\xe8\x1c\xa2\x8d\xad\xad\xec\xf2\xcc\xac\
-\x99\x24\xcf\xde\x34\xe3\xb3\x73\x06\x8e\xed\xc7\x74\xb9\x7f\xf6\
-\x7a\xdf\x3f\xc7\xcb\xeb\xce\x2a\x33\x27\xde\xc6\x78\xf7\x10\xb1\
-\x44\x79\xd2\x83\xe7\x97\x97\xd9\x64\xd4\x8b\xb3\x1f\xe5\x7b\x99\
-\x30\xa4\x1c\x9b\x94\x6f\x07\x5e\x3e\x06\xea\xf9\xec\x33\x8d\x45\
-\x4d\xca\x83\xd2\x00\x2a\x59\x59\xd1\x0a\x63\x2c\x8d\x17\x15\x87\
-\x86\x8c\x4a\xc4\x03\x1c\x7a\x60\x81\x55\x2d\xac\x00\x2a\x1b\x3c\
-\x2a\x35\x15\xad\x41\x65\xc3\x68\x9a\xb8\x89\x57\x2a\x6e\x1e\xb7\
-\xb3\x17\x84\x35\xac\x01\xbf\x41\x6c\x7e\x0a\xe3\xda\x11\x26\x0f\
-\x5f\x45\xe3\xdc\x0b\xb6\x3c\x89\x23\x4f\x43\x7b\x79\x76\x22\x86\
-\x5d\xfe\x2b\xf3\xcb\x03\xeb\x96\x65\x20\x8e\x5a\x90\x0e\x5b\x16\
-\xd2\x88\xb4\xca\x37\x94\x0e\x27\x0d\x52\x3e\xa6\xcc\xc9\x43\xd3\
-\xf8\x4d\x9c\x36\xef\xb1\xf8\x88\x8b\x7b\x91\x2f\x97\x35\xf1\x18\
-\x6c\x79\xe5\xf7\xa9\xeb\x3a\x50\xe6\x3b\x0f\xcf\xe4\xbb\x56\xf9\
-\xf7\xb1\xec\x63\x98\x74\x39\xf7\xa3\x4c\x57\x8e\x49\x87\x2d\x1b\
-\xd2\x42\xc3\x6d\xee\x83\x5f\xa6\x05\x94\x4f\x9d\xfa\xec\x96\x49\
-\x47\xdc\xa9\x32\x69\x58\x1f\x6c\xfe\xec\x7d\x74\xd2\xe9\xde\xef\
-\xbe\xf9\x73\x30\xf9\x6b\x50\x46\x7c\x0d\x9f\x4d\x0d\x43\x82\x84\
-\xde\xe7\xd6\x5e\x35\xad\x74\xb4\x28\xce\x49\x19\xb1\xd7\x8a\xef\
-\xdf\xba\xcb\x25\xd7\x52\xee\x3d\xd7\x27\xf2\x67\xcb\x89\x7b\x68\
-\xf2\xe9\xa4\xa5\x20\x58\x1f\xac\xbf\x53\x2c\xdf\x28\x84\x63\xd2\
-\x33\x80\xcf\x67\x1f\x69\x2c\x6a\x94\x3e\x63\x2b\x1a\x8d\xa7\x54\
-\x18\x53\x79\x4d\x05\xce\x1f\x9e\xaa\x8d\xfb\x98\x18\x47\x17\x2e\
-\xfb\xc4\x4c\x2e\x2e\x9b\x7d\x4f\xe8\xf2\x04\xde\xde\x92\x15\xd0\
-\xc6\x4d\xbc\xa6\x11\x77\x29\x1a\xd2\x94\xff\x10\x65\x78\x7d\x0c\
-\xb3\x29\xa4\xc1\xa6\xc3\x96\xa7\x69\x8c\x3c\x38\x67\x1e\xd4\x13\
-\x4a\x9b\x9b\x0e\x89\xa3\x23\x1d\x26\xfe\x3e\xa7\xa1\x8c\x8f\x06\
-\xb8\x88\xcf\xc1\x36\x4c\x65\x3c\x05\xd6\x4f\xeb\x5e\xf5\x90\x1e\
-\xc2\x2b\xc3\x8c\x94\xbf\x49\x8f\xc4\xe1\xa7\x27\x14\x5e\xbf\x88\
-\xa5\x2b\x95\x96\x36\x3f\xb9\xbf\x8e\xf2\xf1\xe3\x09\xd1\x16\x4e\
-\xa4\x4c\xdc\x72\x71\xc3\x6f\x12\x47\x34\x9d\x09\x63\xd4\xad\x3f\
-\x07\x37\x6f\x9d\x61\xb4\xfb\xdf\xbd\x9d\x4f\xec\x0f\xb5\x67\x6f\
-\x5f\xca\x0d\x6a\x69\xac\xcb\x74\xb9\xe4\xe5\x97\xfa\x98\xae\x1d\
-\x72\x23\x8c\xda\xe5\x57\x05\x79\x34\xb4\xa7\x25\x95\xd7\xd2\x5f\
-\xf4\xfa\xfe\x97\x6f\x25\x84\xe5\x84\x17\xac\x8b\xa9\x67\x62\xc0\
-\x51\x51\x33\x68\x14\x95\xc7\x56\x3a\x56\x08\xf8\x0f\x6c\x5d\x37\
-\xdd\x9e\x84\x51\x59\x19\x8b\x38\x3b\x08\x5d\x5b\x97\x50\x78\x10\
-\xba\xf6\x24\x29\xe2\x35\xe5\xe9\x71\xaa\xe9\x2a\xe2\x39\xb5\x34\
-\x14\x61\x06\xe3\x0a\x5d\x0f\xee\x35\x55\xd7\xd6\xa5\x08\xc7\x4d\
-\x47\x47\x7a\x20\xe4\xf7\x24\xf1\xe3\xb7\x84\xae\xb5\x34\xb9\x36\
-\x45\xe1\xff\xc4\xca\xc4\x0f\xa7\x6e\x58\xdd\xfa\x73\xa9\xe1\x3f\
-\xb6\xf1\x1e\x98\x65\xeb\x97\x27\x72\x63\x1a\x0a\xa3\x38\xc7\x7f\
-\xec\x0b\xe3\xfb\xb7\xee\x5a\x93\xdc\x7b\xa5\x48\x4b\x49\xe8\x1a\
-\x17\xff\xfa\x3a\x7e\x7c\x7a\xf5\xef\x53\x84\xe3\xd6\x41\x4b\x5f\
-\xe3\x39\x45\x54\xd4\x0c\x32\x54\x2e\x11\x25\xcb\xf2\x80\x86\x1a\
-\x80\x2a\x37\xe3\xeb\xa8\x6e\x23\x6c\x42\xe1\x2b\x8a\xa2\x9c\x32\
-\xa9\x8d\xf7\x98\xe3\x91\x14\x35\x20\xe7\xe8\x85\x4e\xed\xb3\x65\
-\x36\x46\xbc\x94\x87\x33\x6c\x46\x59\xe9\x0d\x15\x35\x83\x0e\xc2\
-\x46\x1e\x4c\x76\x21\x8d\x3d\xc0\x31\x37\x13\xc9\x4c\x03\x51\xa7\
-\xb7\x46\x51\x14\xe5\x14\x48\x7d\x0a\x82\x63\x26\xae\xb2\x51\x29\
-\x0b\x19\xf2\x9d\x6e\xe7\xcc\x4e\xb7\x0c\xa9\x23\x88\xd8\xb7\x25\
-\xf5\x69\x11\x26\x61\x9b\xc9\xf0\x97\x27\xf5\x85\xee\x0d\x44\x45\
-\xcd\x10\xc0\x1b\x0b\xe3\x9b\x8b\x89\x8d\xd2\x42\x6e\x66\xc8\xe7\
-\xa2\x46\xdf\x56\x14\x45\x19\x0c\x68\xcf\x1e\x8b\x68\xa9\x6a\xbf\
-\xba\x71\xb3\x92\xac\xf2\x63\xbe\xca\x48\xd3\x58\xd4\xa4\x3c\x28\
-\x27\x07\x13\xca\x10\x36\x0b\xeb\x1b\xb5\x37\x9a\x53\x51\xa3\x28\
-\xca\xc0\x21\x6d\x11\x6d\xd2\xda\xf5\xad\x64\xfb\xd5\xd4\xcd\x52\
-\xe4\x89\xb9\x7c\x9f\x27\x56\xf6\x68\x0f\xf5\x9b\x49\xea\xfb\x94\
-\x2a\x6a\x06\x0c\xde\x3a\x18\x8a\x32\x4b\xfb\xe4\x4d\x84\x7d\x0e\
-\x9e\x3c\x7d\x6a\xf6\x6c\x60\x9f\x01\xff\x81\xd7\xe1\x27\x45\x51\
-\x06\x11\xdb\xfb\xcc\xe6\x86\xbd\x7e\x9b\x88\xde\x99\xf6\x8d\x48\
-\x1b\x2c\x73\x56\xde\x28\x54\xd4\x0c\x22\x08\x1b\x11\x29\xb9\xb8\
-\xb1\x7b\x1f\xd8\xfd\x36\xf2\xe5\x90\x6c\x96\x74\x5e\xae\xbb\x30\
-\x3d\xab\x13\x85\x15\x45\x19\x48\x6c\xef\x33\x22\x84\x4d\x11\xd9\
-\x0c\x8e\x17\xb4\x2a\x41\x83\x88\x79\xf9\xeb\x6f\xed\x1b\x15\x22\
-\x66\x2e\x15\xfb\xb6\x88\xb8\x51\x41\xa3\x84\x50\x51\x33\xc8\x20\
-\x6e\xec\x7e\x09\x08\x9c\xc8\x9e\x17\xda\x4b\xa3\x28\xca\xa0\x62\
-\x7a\x9f\x45\x84\xd0\x5e\x21\x6e\x10\x26\xf6\x05\x8d\x9e\x97\xb1\
-\xa9\x99\x6c\x7e\x75\xdd\xc0\x71\xfe\xc2\xc6\x0e\xe0\xf9\x0b\x1c\
-\x2f\x74\xbc\xd8\x21\x66\xcc\xbe\x2a\xda\xde\x29\x09\x54\xd4\x0c\
-\x03\x3c\xc0\x05\xa6\x81\xf0\xd0\x07\x5c\x51\x94\x81\xc6\xb6\x57\
-\x1d\x2f\x68\x22\x54\x10\x3a\x0e\xb8\xcd\xf9\xf2\xc5\x0d\x21\xa3\
-\x62\x46\xa9\x87\x8a\x1a\x45\x51\x14\xe5\xf4\x28\x5e\xc4\xf2\x97\
-\xb2\xa2\x27\x3a\x44\x71\x8d\xbd\x3e\x18\x96\xf2\x46\x92\xfa\x3e\
-\xa5\x8a\x1a\x45\x51\x14\x45\x51\x86\x86\x94\x46\x51\x51\xa3\x28\
-\x8a\xa2\x28\xca\x48\xa0\xa2\x46\x51\x14\x45\x51\x94\x91\x40\x45\
-\x8d\xa2\x28\x8a\xa2\x28\x23\x81\x8a\x1a\x45\x51\x14\x45\x51\x46\
-\x02\x15\x35\x8a\xa2\x28\x8a\xa2\x8c\x04\x2a\x6a\x14\x45\x51\x14\
-\x45\x19\x1a\x52\x1a\x25\x28\x6a\x52\x1f\x8b\x52\x14\x45\x51\x14\
-\x45\x39\x2b\x1e\x3c\xfe\xc8\x10\xfa\x2f\x28\x6a\x14\x45\x51\x14\
-\x45\x51\x86\x0d\x15\x35\x8a\xa2\x28\x8a\xa2\x8c\x04\x2a\x6a\x14\
-\x45\x51\x14\x45\x19\x09\x54\xd4\x28\x8a\xa2\x28\x8a\x32\x12\x04\
-\x45\x4d\xea\x63\x51\x8a\xa2\x28\x8a\xa2\x28\x67\xc5\xf2\xd6\x8e\
-\x21\xf4\x5f\x50\xd4\xe8\x92\x6e\x45\x51\x14\x45\x51\x06\x91\xc6\
-\x4b\xba\x15\x45\x51\x14\x45\x51\x06\x11\x15\x35\xca\x60\x72\x65\
-\xa6\x9a\x90\x3f\x25\x27\x54\x5e\x3e\x21\x7f\x8a\xa2\x28\x43\x8c\
-\x8a\x1a\x65\x60\x38\x3f\x33\x97\x5d\xbb\xb1\x9f\x3d\x7e\xf2\x5f\
-\xd9\xe6\xee\x5e\xb6\xb7\x7f\x90\xfd\xfa\xfb\xef\x86\x83\xa3\x23\
-\xe3\xfe\xf6\x87\xff\x91\xff\x3f\xc9\x26\x17\xaf\x66\xef\x4c\x4e\
-\x67\xef\xf4\xc1\x40\x1f\x7d\xf0\x61\x36\xbf\x76\x2d\x9b\x5f\x5d\
-\xcf\x8e\xee\x3f\x30\x70\x5c\xd7\x4d\x9a\x2f\xce\x2e\x48\x5a\x9c\
-\xf4\x9c\x81\x68\xb0\xe5\x77\xff\xa3\x8f\xb3\xf5\xad\x9d\x8e\xf2\
-\xdb\xbe\x71\x33\x7b\xfe\xd5\xd7\x45\xf9\x2d\xf7\xad\xfc\x14\x45\
-\x51\x06\x05\x15\x35\xca\x99\x73\x65\x69\xd9\x18\xdc\xd7\x7f\xfd\
-\x95\xfd\xfd\xf7\xdf\xd9\xfd\xfb\xf7\x0d\x1c\x57\xb9\xbf\xfd\xe1\
-\x87\x6c\x6e\x75\xad\x27\x03\x7d\xeb\xf6\xfb\xb5\xe3\xab\x72\x93\
-\x9e\xa5\xf5\x8d\x53\x15\x0c\x94\xdf\xfa\xf6\x4e\x57\xe5\xf7\xc9\
-\xe7\xcf\xb2\x8b\x33\xf3\x26\xbd\x2a\x6e\x14\x45\x19\x76\x54\xd4\
-\x28\x67\xc6\xd2\xf5\x1d\xd3\x83\x50\xd7\x00\xa7\xdc\x2f\x7f\xfb\
-\x3d\x9b\x5a\x5e\x6d\x6e\x9c\xe5\x5a\x44\x4d\x55\xf8\xdd\xb8\xef\
-\x3d\xfe\x48\xd2\x33\x95\x8b\x9b\x50\xdc\x3d\x72\x69\x61\xc9\x88\
-\x99\xba\xe9\x49\xb9\x3f\xf9\xec\x59\xf6\xce\x04\x69\x55\x71\xa3\
-\x28\xca\xf0\xd2\x58\xd4\xa4\x3c\x28\x4a\x5d\x18\x22\xb9\x73\xf7\
-\x6e\x2d\x83\xdb\xc4\xbd\xb8\x76\xad\x30\xce\x35\x0d\xb3\x5c\xf7\
-\xea\xcf\xff\xad\x1d\x7e\x53\xf7\xde\xfe\x7e\xf6\x36\xe9\xe9\x73\
-\x4f\x08\x82\x86\xde\xad\xaa\xf8\x9b\xb8\xf7\x0f\x8f\xb2\xf7\x18\
-\x42\xd3\x5e\x1b\x45\x51\x86\x94\xc6\xa2\x26\xf5\xb1\x28\x45\xa9\
-\x03\x73\x66\xaa\x0c\x6c\x2f\xee\x47\xff\x7e\x92\x0b\x89\x3a\x86\
-\xd9\x88\x9a\x3f\x93\xe1\xf5\xea\x7e\xf2\xd9\xe7\x92\x9e\x2b\x79\
-\x2f\x48\x28\x0d\x5d\xd0\x6f\x41\x63\xdd\x2f\x7f\xfb\x2d\x7b\x7b\
-\x5c\xd2\xaa\xc2\x46\x51\x94\x21\xa4\xb1\xa8\x51\x94\x5e\xa0\x87\
-\x26\x66\x50\xfb\xe9\x9e\x5b\x5e\xad\x27\x6c\xe4\xff\x5b\xb7\x6f\
-\x57\x86\xd7\xab\xfb\xc2\xd4\x4c\xb3\x1e\xa4\x04\x33\x2b\x6b\x95\
-\xf1\xc1\xeb\xd7\xaf\xb3\x3f\x5e\xbd\xca\xf6\x0f\x0e\xb3\xa3\x5b\
-\xb7\x2a\xaf\xb7\xee\xb5\xeb\x5b\xb9\xb0\xe9\xa3\x08\x53\x14\x45\
-\x39\x0d\x54\xd4\x28\xa7\x06\x2b\x73\xea\x0c\x39\xdd\xb9\x73\x27\
-\x3b\xfe\xf4\x69\x76\xf7\xc1\xc3\x6c\x7c\x66\x2e\x1b\x9f\x9d\xcb\
-\xb6\x6e\x1e\x64\x07\xef\xdf\xc9\xd6\x36\x36\x2b\xfd\x5b\xf7\xda\
-\xce\x5e\xb5\x90\x28\x44\x4d\x2c\x3c\x04\xc1\xc6\xd6\x56\xf6\xec\
-\x8b\x2f\x0d\x1b\x5b\xdb\x06\x8e\xff\xf3\xe2\x85\x49\x6b\x2c\x7e\
-\xd7\xfd\xec\xcb\xaf\x44\x28\x4c\xe6\x3d\x20\xa1\x74\x34\x80\x5e\
-\x9a\x54\x7c\xbb\xf2\xff\xd6\xcd\xfd\xec\xfc\xe4\x54\xf6\xcf\x8b\
-\x97\x84\xcb\xd9\x3f\xc7\x04\xf9\x5d\x58\x59\x15\x81\x13\xcf\x2f\
-\xc7\xe4\xe9\xc2\xf4\xac\x29\x3b\xed\xad\x51\x14\x65\x98\x50\x51\
-\xa3\x9c\x0a\xcc\x01\xa9\x9a\x14\x8c\x31\x9d\x5f\x5e\x69\x19\xe3\
-\xb1\xf1\xec\xad\x4b\x13\xd9\x5b\x97\x1d\x70\x5f\x1a\xcf\xee\x3e\
-\x7c\xd4\xe1\x3f\x14\xde\x5b\x97\x0b\x21\x11\x33\xce\x72\x9e\xe1\
-\xa7\x90\x7f\x8e\x49\xcf\x3f\x2e\x8c\xb5\x84\x81\x49\xd3\xb8\xf9\
-\xcd\xb9\x9c\xad\x6e\xed\x64\x7f\xbc\x4a\x0f\x61\xd1\x6b\x42\xda\
-\x7b\x15\x0a\x2c\xdb\x4e\xad\x72\x42\xd0\x9c\x9b\xb8\x62\xd2\x4b\
-\x3a\xc9\x3f\xbd\x2e\x25\xe2\x26\x1d\x3f\xbe\xf8\x39\xe8\xdf\xba\
-\x0f\xee\xdc\xcd\x7b\x6b\xfa\x20\xc2\x14\x45\x51\x4e\x0b\x15\x35\
-\xca\xa9\xb0\xb2\xb9\x15\x35\xa0\x80\x00\xb9\x32\xbf\x60\xc4\x0c\
-\xc6\x18\xe3\x6b\xe6\xa1\xd0\xd3\x22\x86\xb5\x44\xdc\x9c\xa7\xd7\
-\x63\x42\xae\x8f\x85\x67\xdd\x07\x77\xee\xe5\xc6\x39\x36\x94\x52\
-\x88\x9a\x98\x7f\x7a\x8b\x10\x2e\xa5\x38\x20\x6e\x93\x06\x4b\x9e\
-\x96\x77\xe5\xf7\x28\xd1\xe3\xc3\xf1\xbb\x72\x5d\x9e\x96\xee\x45\
-\xcd\xd2\xf5\xed\x68\xf8\x40\x0f\x8d\x11\x34\xa6\xfc\x8a\xb2\x93\
-\xf8\x4a\x8a\x32\x7c\x4f\x84\x63\xc8\xbf\x75\xaf\x6d\x5e\x37\x22\
-\x92\xeb\xb5\xb7\x46\x51\x94\x61\xa1\xb1\xa8\x49\x7d\x2c\x4a\x51\
-\x82\x88\x51\xac\x5a\x36\x4d\x8f\x48\x2e\x68\x26\x8c\x50\xb0\xc6\
-\xd8\x18\x54\x0f\x6b\x9c\x31\xda\xdb\x87\x79\xef\x8f\x1f\x9e\x75\
-\x9b\x1e\x12\x8c\xb3\x5c\x6b\xfc\x07\xd3\x16\x9f\x53\x73\xf7\xc3\
-\x87\xb9\xc8\x72\x04\x42\x28\x2d\x84\xcf\x84\x60\xdf\xbf\xeb\x9e\
-\x5f\x5b\x37\x02\xa8\x97\xb9\x2a\x66\x73\xbd\x48\xf8\x1c\xcf\xad\
-\xac\xb5\xd2\x6b\xd3\xe9\x87\x53\xa4\x99\x65\xf0\xbe\x7f\xeb\xde\
-\xda\xdd\x2b\x44\x4d\x17\x3d\x4b\x72\xfd\xf9\xe9\xb9\x6c\x7a\x65\
-\xdd\x88\xb0\xf1\x85\xa5\x6c\xcc\x6c\x4e\x98\x97\x97\x09\xaf\x69\
-\x98\x29\x8a\xf0\x2e\xcd\x2f\x99\x38\x89\x0f\x38\xb6\x71\xf6\x14\
-\xaf\xeb\xd7\x25\x72\x2d\x79\x27\xbf\x6e\xfc\x49\x3f\x29\x5c\xbf\
-\x2e\x91\x6b\x29\x03\xe2\x3e\xe9\xf2\x3e\xb1\xfb\xeb\xfa\x77\x09\
-\x5c\x67\xee\xf7\xea\xba\x49\x4b\xf0\x1a\xe5\x8d\xa4\xb1\xa8\x49\
-\x79\x50\x94\x10\x4c\x6c\x75\x0d\x66\x87\x01\xdd\xd9\xcd\xfe\x71\
-\xa1\xe8\xa1\x41\xd0\x60\xf4\x6b\x34\x52\x34\xa0\x46\xd8\xec\xdd\
-\x48\x86\x3f\x7b\x75\x25\xde\x43\x22\xe7\x52\x73\x6a\x98\x83\x52\
-\x67\xd8\x88\xb0\x77\x8e\x72\x71\xe4\xc7\x6f\xdd\xec\x40\x4c\x0f\
-\x14\x82\x22\x14\x46\x1d\xd8\x68\x2f\x16\x3e\x34\x49\xef\xe2\xc6\
-\x56\x36\x31\xbf\x98\x8d\xcf\xcd\x9b\x21\xb4\xd5\x2d\x31\x50\xb3\
-\xcc\x61\x9a\x37\x3b\x2c\x97\x69\x4d\x84\xe3\x82\xe0\xa2\x47\x8e\
-\x61\xc6\xd8\x10\x19\x65\xbd\x2e\xf1\xac\xef\xdd\xcc\xc5\x20\x61\
-\xd7\x0c\xdf\x87\x7d\x8e\xaa\xe2\xb3\x6e\xbb\x13\xf5\x45\xc9\x5b\
-\xdd\xfa\xb5\x7b\xfb\x8e\x84\x7d\xcb\x84\xef\xee\xcc\x0c\x8b\x12\
-\x6f\x19\x8e\x40\xde\x89\x23\x34\x67\x8c\x73\x6c\x72\x38\xb5\x9c\
-\x6f\x12\x59\x37\xee\x5f\x7f\xff\x7f\x65\x7c\x6e\xfc\x97\xe5\x9e\
-\xb9\x71\x53\x27\x88\x9b\x32\xb0\xf9\xb5\xf1\x13\x37\xe5\xdd\x24\
-\xee\x10\x0c\x1f\x93\x47\x76\xfa\x26\x0d\x6e\xfe\xdc\xf8\x98\xef\
-\x65\xe2\x93\x67\xbe\x49\x7c\x75\xf3\xcb\xf0\x2b\xf7\x9c\xff\x6c\
-\x7e\x89\xaf\xac\x4b\x81\xb0\x15\xc5\xa2\xa2\x46\xe9\x0b\xcf\xbf\
-\xfe\x26\xd8\x00\x5a\xf7\xca\xf5\x2d\x33\xc4\x53\xce\xe1\x68\xd0\
-\x38\xe5\xc6\xf9\x7a\x32\x7c\x26\xf5\x46\xe7\xd6\x88\x3b\x35\xa7\
-\xa6\x14\x09\x55\x3d\x16\xf2\xdf\x64\x85\xe0\x60\xae\x4b\xaf\xa2\
-\xe6\x9c\xbc\x95\xc6\xc2\xe7\xd8\xcc\x4b\x5a\xdf\xa8\x25\x0e\xf9\
-\x1f\x51\x48\xef\x11\xe5\xe3\xc2\xb9\xb2\xb7\x27\xe0\xd7\x05\x63\
-\x87\x91\x09\xa5\x27\xe5\xde\xc7\x60\xcd\xc9\x1b\x7e\xc3\x7b\x8e\
-\x81\xa5\x4e\x75\xbb\xcf\x11\x02\x03\xd1\x57\x25\xa8\x66\x96\x57\
-\xa3\xe1\xd1\x43\x48\x19\x63\x70\x11\x14\xfe\xff\x31\x37\x3d\x69\
-\x75\x36\x64\xdc\xbd\x95\xef\x72\x1d\x0a\xcf\x8d\xbb\x6a\xd2\xb8\
-\xeb\xae\x1b\xb7\x4f\xb7\xf7\x77\xfd\xfa\x76\x76\x8e\x55\x7f\x35\
-\xee\x6f\x2a\xbf\x4c\xf8\x27\xbf\xbc\x14\x70\xcf\xfd\xff\xcd\x96\
-\x09\xf4\x80\x36\xac\x47\xca\x9b\x87\x8a\x1a\xa5\x77\xa4\x91\x61\
-\x73\x3b\xdb\x00\xf9\x0d\xd2\xcb\x5f\x7f\xcb\xfe\xc1\xb0\x53\x0f\
-\x43\x1d\x34\x66\xa9\x21\xa4\x7c\x92\x6e\x3e\x24\xd3\x11\xbe\x49\
-\x5f\x62\x4e\x8d\x19\x7e\xaa\x97\x36\x1a\xdd\x50\xfc\x80\xd8\x60\
-\x78\xad\x6c\x7c\x03\xfe\xeb\x80\x41\x0a\xbd\x91\xfb\x6e\x96\x65\
-\x5f\x94\xb7\x5a\xe2\x8a\x1a\x6f\x39\xc7\x7f\xe6\x9a\x10\x31\x7f\
-\x0e\x9f\x3c\x7b\x1e\x8c\xbf\x89\xfb\xde\xa3\x8f\x5a\x22\x23\x10\
-\x87\x0b\xbd\x33\xa9\xfa\x54\xd7\x9d\x6f\x8a\x98\x16\xd1\x88\x9a\
-\x98\xff\x29\x11\x56\xf4\x72\x55\xf5\x10\x85\xdc\x3b\x87\xb7\x2a\
-\xf3\x9b\x14\x54\xfb\x87\x26\xee\x90\x81\xaf\x72\xd7\x89\xdb\x72\
-\x7e\x66\xbe\xe7\xfb\xfb\xfa\xf5\x5f\xe6\xa5\x23\x55\xce\x50\x95\
-\xdf\xc5\xb5\xf5\xe8\xff\x4f\x9e\x7e\x56\xab\x77\x52\x51\x54\xd4\
-\x28\x3d\xc3\xb8\xb7\xdb\x00\xf9\x0d\xd2\xf1\xa7\x4f\x8b\x5e\x9a\
-\xee\x8d\x3d\x0d\x34\x5d\xd0\xa1\xf0\xad\x3b\x3a\x49\x57\xdc\xd5\
-\x73\x6a\xea\xf5\xd4\xa4\xde\xd8\xb7\x76\x77\x5b\xbd\x51\xa9\x70\
-\x2a\xc0\xef\xe6\xce\x6e\x47\xf8\x31\xf7\xb7\xdf\xff\x90\x2d\xae\
-\x5f\x93\x37\xe6\xbc\x67\xc6\xe4\xa1\x87\xf8\x5d\xfa\x21\x68\xac\
-\xbb\xce\xbe\x42\xf4\xd0\x74\xd3\x63\x10\x73\x57\x6d\x8a\x48\xef\
-\x41\xcc\xff\xea\xc6\xa6\x11\xcb\xb1\xff\x53\x6e\x04\xee\x05\x09\
-\x3f\x55\xa7\x52\x82\x8a\xb8\x09\x23\xf6\x7f\xca\x4d\x9a\xab\xe2\
-\xb6\x54\xf5\xb0\xd6\x75\x93\xd6\x4b\x0c\xfb\x75\x99\x5f\x7a\x4b\
-\x53\xf9\xa5\x3c\xa2\x2f\x2d\x8a\xe2\xa0\xa2\x46\xe9\x19\x26\x11\
-\xba\x0d\x90\xdf\x20\xb1\xe2\xa9\x35\x97\xa6\xcb\x06\x49\xfc\x31\
-\x9f\x25\x14\xbe\x75\x33\x67\xc4\x08\x27\xdf\x80\x89\xdf\x9e\xe7\
-\xd4\xc8\xf9\xa3\x0f\x1e\x04\xfd\x5b\xf7\xea\xf5\xed\xb2\xe1\xed\
-\x45\xd4\x10\x17\x1f\xa0\xf4\xc3\xaf\xe3\xfe\xf1\xe7\x5f\xb2\x95\
-\xcd\xeb\xf9\x1c\x85\x9a\x3d\x31\x31\xd8\x44\xb1\x2a\xbe\xa6\xee\
-\x85\x6b\x9b\xc9\x5e\x84\xaa\x9d\xa8\xff\xf3\xd3\x8b\xec\xaa\xbc\
-\xd1\xcf\x2c\x5d\xcd\xf6\xdf\xcf\xf7\x3a\x4a\x5d\x0f\x76\x53\xc4\
-\x50\x39\xa4\x86\x44\x7a\x75\xb3\x25\x41\x39\xdc\xea\xc5\x6b\xe3\
-\x6e\x12\x5e\x13\xf7\xc2\xea\x5a\x32\x6e\xa8\xba\xbf\x88\xa3\x6f\
-\xbe\xfb\xce\x08\x0a\xf6\x6d\x62\xcf\xa6\xaa\xeb\x53\x43\x44\xa9\
-\xfc\x56\xed\xab\xa4\xa2\x46\xa9\x8b\x8a\x1a\xa5\x67\x58\xf1\x93\
-\x6a\x90\xd8\x5c\xaf\x1f\x5d\xc7\x4c\xdc\x0c\x85\x6f\xdd\x07\xef\
-\xdf\x35\x73\x45\x3a\x1a\x72\x89\xb3\x7a\x4e\x4d\x21\xba\x0a\x21\
-\xe0\x82\x68\xfb\xe4\xf3\xe7\xc9\x21\x21\xe6\xf4\x98\x95\x5d\x36\
-\x7e\xf1\xd7\x96\x86\x86\x10\xc6\xe1\xbd\x0f\xa2\xf1\xd5\x71\x93\
-\x67\x7a\xb7\xba\xf9\x42\x37\x3d\x26\xa9\xfc\x1a\x83\xf7\xdf\xdf\
-\x65\x97\x67\x66\xcd\x3c\x22\x86\x4a\xb6\xf6\x0f\x8c\xf1\x0b\x5d\
-\x6f\xdd\xac\xb8\x8a\x1a\x3e\x71\xc7\xbe\xa6\x4e\x7c\xfb\xb7\xef\
-\xe4\xfb\x09\xb1\xfc\x5e\xee\x17\x75\x8a\x5f\x7a\xe8\xf8\xf4\x43\
-\x28\x3e\x8e\x53\x06\x3e\x35\x24\xe2\xba\x89\x9f\x7b\xbc\x20\xd7\
-\x23\xd2\x11\x54\x3f\x8a\x91\x8f\x5d\xcf\x31\x7e\x52\x43\xae\x75\
-\x05\x15\x3d\x18\xc4\xcd\xd6\x03\xc4\x8d\xa0\x23\xee\xd8\xf5\x50\
-\x15\x77\xd5\xfd\xbd\xf3\xe0\x43\x67\x2f\xa9\x7c\xef\x26\x18\x9b\
-\x9e\xcd\xf6\x6e\xde\xec\xb8\xde\xba\x97\xaf\x6d\x44\xcb\xba\x89\
-\x80\x24\xfd\x0c\x5b\xd3\xfb\x49\x9d\x62\x4f\xa5\xae\x87\xaf\x95\
-\x91\x23\xa5\x51\x54\xd4\x28\x3d\x73\xff\xa3\x7f\x25\x1b\x28\x0c\
-\x5e\xde\x20\x75\x36\x74\x4d\x38\x27\x0d\x6a\x28\x7c\xeb\x36\xe2\
-\xc4\xc6\xe3\x36\x7c\x72\x9c\x9a\x53\x43\x03\xfa\x87\xfc\x4f\x6f\
-\x0e\x70\x2d\x70\x5c\x67\x4e\x03\x8d\x2f\x06\xa0\x14\x46\xfd\x68\
-\x74\x25\x0c\x1a\x70\xe6\x19\x54\xc5\x5f\xc7\xcd\x10\xd5\xf4\xd5\
-\x15\x53\x36\x75\xd2\x97\xea\x31\xa1\xbc\xb6\x6e\xec\x9b\xd5\x6c\
-\xb9\xc0\xb0\x1b\x27\x32\x01\x79\x22\x5b\xdb\xde\xed\x88\xdf\x75\
-\xb3\x93\x71\xa8\x37\x6b\x6c\x6e\x21\x78\x3d\xc7\xc7\x9f\x3e\x6d\
-\xad\x9e\x63\x98\x11\xff\x05\x18\xd1\xd4\xb2\xff\x6f\xbe\xfb\x3e\
-\x5c\x2f\x84\xd4\x90\x88\x75\xd3\x43\x71\xce\x31\xf0\xae\xa0\xda\
-\xd8\xde\x89\xfa\x47\x8c\x20\x04\x62\x75\xa2\x8e\xa0\xda\x15\x01\
-\x91\x8a\x3b\xe6\x9f\x7b\x94\x8a\x3b\x75\x7f\x11\x34\x66\x0e\x1c\
-\x71\x99\x09\xe5\x76\xef\x26\xf6\x6b\xba\x62\xca\x32\xb6\xb1\x23\
-\x79\x8e\xbd\xc0\xd4\xca\xef\x8d\x9b\x22\xde\x3a\x05\x15\x71\xc6\
-\xc4\x92\xf2\xe6\x91\xfa\x3e\xa5\x8a\x1a\xa5\x37\xa4\xe1\x42\xd4\
-\x84\x1a\x28\xeb\x3e\xcf\x0a\x9c\x50\x0f\x4a\x43\xaa\x56\x05\xb5\
-\x44\x8d\xd7\xa0\xca\x71\x6a\x4e\x4d\x2f\x6e\xde\xa0\x4d\x03\x8c\
-\x01\xb1\x8d\x6e\xc0\x88\x74\x03\xc6\x08\xe3\xc0\x90\x0d\x9b\xfe\
-\xd5\x49\x4f\x95\x1b\x71\x33\x25\xc6\x25\x99\x4e\x53\x5e\xe1\x1e\
-\x13\x8e\x1f\xfe\xeb\xe3\xbc\x57\x4a\x8c\x9e\xc9\x33\xe2\x42\xc2\
-\xcb\xc9\x45\x46\xca\xe0\x96\xc3\x84\x5e\x7d\xa0\x47\x2c\x74\x3d\
-\x98\x4d\x1b\x9d\x32\x36\x86\xba\x80\x63\x56\xe0\xc4\xe2\xa3\x57\
-\x83\xb4\x86\x0c\x6d\xd5\x10\xd0\x71\x21\xa6\x72\xc3\x5a\xcc\xd9\
-\x22\xbf\x02\xc2\xca\x0e\x13\xc6\xfc\x4f\x4a\x9e\x8c\x1f\x2f\x5e\
-\xa8\x12\x54\x0c\xb9\xa4\xe2\x7e\x4f\xca\x21\xe5\x9f\x7a\x19\x8c\
-\x5b\xdc\xb1\xfb\x6b\x26\xf5\x5f\x18\x6b\xdd\xdb\xa2\xac\xdb\x90\
-\x70\x11\xa6\x21\xff\x1c\xc7\x76\xaa\xae\x93\xdf\xfc\x59\xca\x85\
-\xb2\xd9\x9c\x53\xc2\x31\xc2\x8c\x7c\x13\x9e\xc4\xef\x86\xa9\x28\
-\x3e\x2a\x6a\x94\xde\x90\x46\x66\xe9\xda\x46\x47\x03\xe5\xba\xdf\
-\x31\x6f\x59\xbd\x8b\x9a\xb1\xf9\xdc\xe8\xf9\xe1\x5b\xf7\xc3\x8f\
-\xff\x9d\xbf\x25\x4a\xc3\xd8\xd6\xf8\xc9\x71\x6a\x4e\x4d\x53\x37\
-\x6f\xa3\xec\xbb\xc3\xf2\xd9\x96\x71\xef\xcf\xb0\x93\x8f\x31\x22\
-\x18\x31\x69\xe0\xb7\x0f\x0e\x2b\x87\x3c\xea\xb8\xef\x88\xd1\x49\
-\x2d\xb3\x4e\xcd\x91\xa2\x07\xe0\xdc\xc4\x64\x9b\xd1\x33\x61\xd8\
-\x70\x48\xaf\x9c\xa3\x57\x28\xe4\x1f\x16\xa4\xdc\x42\x22\x97\x4d\
-\xd6\xd8\x67\x86\x21\x8c\xab\xeb\xd7\xcc\xfd\x04\x8e\x19\x62\xca\
-\x87\xf6\x3a\x85\x89\x8d\x33\xb6\x4a\x69\xff\xf0\x30\x17\x44\x62\
-\x1c\x7d\xbf\xa9\x21\x91\x67\x5f\x7c\x11\x34\xf0\x26\x0c\xe2\x2c\
-\xe2\x65\x95\x55\xc8\x3f\xc7\x66\xdf\xa2\x48\xdd\x4f\x09\x2a\xbe\
-\x45\x56\x27\xee\x1f\x7f\x8e\x7f\x0a\x23\x16\x77\xea\xfe\x1e\x33\
-\xa9\xff\xe2\xe5\xf2\xfe\x94\x71\x5a\xff\x36\x6e\xa9\x93\xac\x7a\
-\xf2\xfd\x03\xc3\x45\xa1\x9e\xb1\x3a\xf9\x35\xf7\x09\x31\x53\x88\
-\x18\x13\x17\x61\x38\xe1\x28\x4a\x0a\x15\x35\x4a\x6f\x48\x63\x83\
-\xa8\x71\x1b\x28\xbf\xc1\xea\x97\xa8\x61\x77\xd3\x50\xf8\xd6\x5d\
-\xae\x62\x92\x06\xd1\x6f\x88\x53\x73\x6a\x9a\xba\xe9\x22\x3f\x96\
-\xc6\xdf\x0c\xab\x9d\xa0\xa0\xb1\x58\x03\x86\x71\xc3\x58\x30\xaf\
-\x01\x63\x5f\xf5\x2d\xaa\x94\x1b\x71\x72\xa5\x18\x8e\xf2\xd3\x9d\
-\x9a\x23\xc5\x70\x88\x11\x72\x56\x94\x84\xf2\x2c\xe7\xc6\xe6\x16\
-\xb3\xc3\x7b\xf9\xa6\x88\xb3\x4b\xcb\xe6\x43\xa5\x30\x7b\x75\x39\
-\xef\xb9\x0b\xd5\x07\x2f\x9f\xf9\x30\x4b\x81\x63\xe8\x4c\x9c\x0e\
-\xb6\x7c\x62\x73\x44\xf8\x60\x29\x6f\xff\xa1\xa1\x98\xd4\x90\x88\
-\xe9\x91\xc2\x5f\xe2\xfe\x12\x1e\x2b\xd5\x42\xfe\x61\x6c\x6a\x26\
-\x28\xe0\x20\x25\xa8\x9a\xc4\x1d\xf2\xcf\x71\x6c\x23\xc8\xd4\xfd\
-\x65\x12\x36\xf5\x8b\xde\x41\xe6\xb0\x5d\x96\x17\x09\x44\x10\xbb\
-\x0a\xdb\x9d\x85\x39\xc7\x7f\x31\x41\xc5\xa4\x5f\xf3\x5c\x78\xcf\
-\x61\xad\xfc\x16\xe9\xf5\xef\x93\xa2\xd4\x45\x45\x8d\xd2\x33\xa9\
-\x37\x30\x88\x35\xae\x4d\x49\xbd\x61\x02\x13\x28\x63\x3d\x35\xa9\
-\x39\x35\xbd\xb8\xd9\x2b\xa6\xad\xc7\xc2\x49\x6f\x5f\x91\xb0\xad\
-\xf1\x36\x73\x1b\xa4\x3c\xc9\x2b\x3b\x05\x23\xe6\xba\xe9\xc1\xd9\
-\xde\x73\x26\xed\x3a\x71\xa5\xe6\x48\x31\x44\x90\x1b\xdb\x4e\x81\
-\xe0\x92\xa7\x35\x1f\xfe\x30\x02\xc5\xc1\xc4\x89\x40\x09\xf8\xb7\
-\x79\x34\xbd\x53\x86\x2b\x66\xb8\x8c\x95\x6f\x4b\xeb\x1b\x66\xe2\
-\x33\x2b\xbc\x58\xf6\x6d\xe7\x3c\xc5\x7a\x68\xac\x9b\x21\x95\x94\
-\xa8\xf1\xaf\xb7\x6e\x0c\x7c\x6e\x9c\x13\x79\x95\xf3\xcf\xbf\xfa\
-\x3a\xe8\x9f\x63\x44\x4d\x29\x00\x3d\xbf\x55\x82\xaa\x4e\xdc\x55\
-\x82\x2a\x14\x77\xd5\x1c\xb8\x5e\xdd\xf9\x7c\x9e\xce\xf2\xee\x39\
-\xbf\x8a\x52\x03\x15\x35\x4a\xcf\xb0\x1b\xa9\xdb\x40\xf9\x0d\x96\
-\xe9\x41\xe9\x83\xa8\xa9\x5a\x65\x75\xc5\x9d\x90\xec\x36\x8c\x72\
-\x7c\x52\x73\x6a\x38\xe6\x8d\xd5\x34\xc6\x3d\xe6\xaf\x16\x92\x17\
-\x1a\x7d\xe2\x32\x86\xdf\x88\x86\x5c\xe0\xd0\x75\x7f\xf7\xc3\x47\
-\x8d\x04\xce\xe4\xe2\x55\x49\xbb\x23\x30\xe4\x97\xbd\x4b\x62\xd7\
-\xe7\xbd\x61\x9d\x6f\xe1\x21\xca\x74\x96\x14\x43\x0a\x80\xdf\x98\
-\x7f\x39\xcf\x67\x01\x58\x9a\x8e\x78\x49\xa5\xbf\x8e\x3b\x25\x6a\
-\x52\x82\x9c\x61\x2f\xf2\xda\xd1\xf3\xe7\x22\xe7\x53\xe5\x85\xa0\
-\x4f\x89\x1a\xff\x7a\xeb\x6e\x12\x77\xc8\x3f\xc7\x41\x51\x53\x91\
-\xde\x7e\xb9\x43\xc2\xb7\xe7\xfc\x2a\x4a\x41\xea\xfb\x94\x2a\x6a\
-\x94\x9e\xa9\x5a\x95\x64\x1a\x2c\x23\x36\x7a\x6b\xb0\x98\x6f\x11\
-\x0a\xdf\xba\xf3\x55\x56\x01\x03\x22\x71\xa6\xe6\xd4\xf0\x46\x7e\
-\x6e\x9c\x2f\x82\x2f\x1a\x58\xa2\xec\x2e\x53\x66\x02\x72\x28\x3e\
-\xd7\x3d\xe5\x8b\x83\xd3\x40\xe2\x2a\x85\x83\xc4\x8d\xd1\xa6\x17\
-\x84\xb2\x66\x08\x81\x55\x3f\xb1\xf4\x5a\x77\xbe\x97\x8a\x53\x66\
-\x12\x1e\xdf\xfe\x89\x5d\xcf\x52\xe6\xc6\xc6\x87\xeb\x5c\x42\xd7\
-\x14\xb0\xd4\x78\x7d\x7b\xa7\xab\x9d\x74\x63\xee\xd4\xf0\x53\x72\
-\x48\xc4\xce\xd1\xaa\x10\x16\xa9\xf2\x4a\x89\x9a\x6a\x41\x55\x1d\
-\x77\x63\x41\x55\x91\xde\x7e\xb9\xf3\x21\xe7\xf6\xf2\xee\x39\xbf\
-\x8a\x52\x90\xd2\x28\x41\x51\xa3\x28\x4d\xa0\xe1\x4a\xcd\x59\xc9\
-\x97\x79\xd6\x7b\xbb\x8f\x62\xe2\x88\x6f\x9d\xff\xc7\xab\x57\x66\
-\xae\x47\x68\x38\x25\xf7\x9b\xd8\xa7\xc6\xf9\x7a\x38\x46\x80\xa1\
-\x1d\x0b\x6e\x44\x02\x3b\xb4\xb2\x17\x4a\xc8\x3f\xd0\xe5\xde\x0f\
-\xe1\xd6\x35\x12\x67\x29\x70\xca\x61\x9f\xc9\xe4\x2a\x24\x68\x7d\
-\xa9\x5b\xca\x8c\x74\x0b\x18\xbd\xd8\xf5\xe5\x10\xdf\x09\x18\x1f\
-\x04\x0d\x1f\x37\x4c\xa5\xd7\x75\x53\xe6\xcc\xdf\x40\xb4\xd0\x1b\
-\x13\xbb\xbe\xeb\x39\x35\x0d\x44\x4d\xc8\x3f\xa4\x86\x9f\xce\x44\
-\x50\x55\xa4\xb7\x5f\xee\x50\x4f\x4d\xcf\xf9\x55\x94\x82\x6b\x7b\
-\x37\x0d\xa1\xff\x54\xd4\x28\x3d\x43\xc3\xc5\xbc\x82\x58\x83\xc5\
-\x71\x6a\x69\x6b\x1d\xaa\x86\xb8\xd8\xf9\x34\xd4\x90\x1a\xc4\x9d\
-\x9a\x53\x53\x0e\xa9\xe0\xd7\x88\x82\x4e\x30\x88\xec\x4c\x1b\xf2\
-\x6f\xdd\xc9\x2f\x85\x37\x60\xe9\xfa\x4e\x39\x29\xd3\x9f\xa4\x79\
-\x7e\x7a\xae\xba\xd1\x97\xff\x49\x83\x49\xb7\xa4\x87\x3d\x78\x42\
-\xe9\xe5\xd8\x88\x1a\xb7\xe7\x45\xe0\x63\x90\xb1\xeb\xcb\xdd\x97\
-\x4f\x40\xbc\xf1\xe1\x46\x3f\x3e\xd7\xcd\x04\x6d\x7a\xd5\x58\x75\
-\x56\xee\x63\x72\x91\x7d\x4c\x72\xfc\xeb\xad\xbb\xeb\x39\x35\x0d\
-\x7a\x4b\x42\xfe\x39\xee\x7a\x4e\xcd\x49\x09\x2a\xf1\x93\xba\xbf\
-\x33\x8b\x4b\xa6\x7c\xe7\x56\xd7\x8c\x7f\x40\x1c\x41\x6d\xf7\x5a\
-\x5e\x6e\x7e\xcf\x65\xcf\xf9\x55\x94\x1a\xa8\xa8\x51\x7a\x47\x1a\
-\x21\x96\xf0\xc6\x1a\x2c\xc8\x7b\x04\x8a\x06\xb6\x8b\x46\x2b\xf5\
-\x46\x0a\xad\x4f\x31\x04\x1a\x45\x71\xa7\xe6\xd4\xb8\xab\xa6\x82\
-\x82\x44\xce\xe5\x22\x61\x2a\x39\x29\x34\x5f\xca\xda\x7d\x1e\xe1\
-\xd2\xc2\xd5\x68\xf8\x70\xef\xf1\x47\x26\xfc\x60\x3a\x7d\x4c\x9a\
-\x59\xf6\xfb\x4b\x34\x3c\x36\x96\xcb\x97\x3b\x17\x79\x17\x18\xe6\
-\x8b\x5d\x7f\xfc\xe9\x53\x53\xce\x75\x8c\xcf\x8c\x18\x47\xde\xce\
-\x01\x83\x06\x1c\x23\xd0\xfc\xf4\x8f\x4b\xbe\x43\xf1\x71\x4c\x8f\
-\xcc\xcc\xe2\xd5\x62\xc9\x6f\xb1\x01\x9d\x19\xde\x98\x2c\xc8\x87\
-\xdd\x62\xfe\x7b\x9b\x53\x53\x4f\xd4\x84\xfc\x03\xc6\x3e\x25\x6a\
-\xfc\xeb\xad\xfb\xc4\x04\x95\xf8\x49\xdd\x5f\x36\xbe\xb3\xdb\x14\
-\xe0\xb7\x1b\xcc\x3d\xa1\xac\xbd\xe7\xa0\xe7\xfc\x2a\x4a\x0d\x54\
-\xd4\x28\x7d\x81\x06\xac\x6a\xd9\x34\xfb\xac\x84\x0c\x4b\x15\xbc\
-\xf9\x85\xc2\xb3\x6e\x86\xb7\xde\x29\x0c\x5d\xb0\x07\x41\xdc\xa9\
-\x39\x35\x75\x7b\x1f\x48\x77\xea\xd3\x05\x66\x08\x2a\x26\xac\xea\
-\x22\xfe\x98\x4f\x12\x0a\x9f\x63\x36\xcf\x2b\x87\xd8\x6a\xc4\x41\
-\x9a\x53\x3d\x20\x2d\x51\x53\xdc\x17\x21\xf5\x46\x5d\x37\x8f\xe7\
-\x67\xe2\x1b\x25\xb2\x62\xc7\x17\x90\x4b\xd7\x36\xa3\xd7\xd3\x3b\
-\xd3\xb1\x9b\xb0\xe4\xdf\x20\x61\x18\xe4\x38\xe6\x5f\xe7\xd4\xb4\
-\xc7\x9d\xba\xbf\xe5\x2a\x24\xd3\x6b\xe9\x94\x73\x14\xb9\x86\xfb\
-\xe1\x62\xfd\x05\xca\xda\x8f\xcf\xba\x55\xd4\x28\xfd\x42\x45\x8d\
-\xd2\x17\x68\xc0\x1e\x1f\xc7\xdf\x00\x39\xc6\x20\x5e\x12\x63\x67\
-\x1a\xbe\x9a\x0d\x17\x43\x2e\x55\x93\x46\x31\x7a\xc6\x68\x59\x63\
-\xef\x87\x23\x71\x25\xe7\xd4\xd4\x1d\x52\x91\xff\xf8\x12\xb6\xef\
-\xdf\x75\x8f\xcf\xce\xe7\xe9\x88\x7c\x15\xba\x12\x89\x83\x79\x25\
-\xb1\xf0\x11\x70\x66\x9f\x97\x9a\xe2\x90\x5d\x98\x53\xe5\x47\xef\
-\x92\x2f\x6a\x98\xf8\x1d\xbb\x9e\xe3\xe8\x4e\xb5\x0e\x29\x03\xb6\
-\xb6\x79\xbd\xb5\xc4\xbf\x88\x33\xd5\xe3\x90\xef\x26\xec\xdc\xdf\
-\xc2\x8f\x1b\x1f\xe5\x1d\xf3\xaf\x73\x6a\xda\xe3\x4e\xdd\x5f\xea\
-\x97\x5f\x1f\x5c\xbf\x25\x72\xfe\xa7\x5f\x7e\x91\x97\x85\xf7\xcd\
-\x0b\x03\xcf\x17\x70\xbc\xb7\x7f\x60\x9e\x25\xbf\xac\x7b\xce\xaf\
-\xa2\xd4\x20\x28\x6a\x74\xf5\x93\xd2\x18\x69\x88\x30\xf8\xa9\x1e\
-\x11\xeb\xbe\xf7\xe8\xb1\x34\x9a\x34\x7a\x61\x03\x05\x4c\x1a\xe5\
-\xed\xbd\x4a\xd0\x1c\xdd\xba\x65\x8c\x6c\xb2\x41\x94\x73\xd5\x73\
-\x6a\x6a\x88\x1a\x81\x34\xbf\x4c\x2c\x33\x36\x6f\x9c\xee\xc4\xdb\
-\x40\x18\x49\xc4\x4f\x6a\xce\x03\x30\x61\x39\x37\x56\x69\x71\x48\
-\x6f\x49\xca\xe0\x72\x9c\x4f\xfc\x6d\xef\x79\x21\xcc\x54\x79\x99\
-\xcf\x0e\xb8\xa2\xc4\x8b\x97\x73\xa9\x21\x2f\x56\x94\xb5\xf5\xaa\
-\x09\xa9\x1e\x87\xfc\xeb\xe7\xe9\xfb\x9b\x1a\x52\xd1\x39\x35\xed\
-\x71\x53\x06\xdf\xfe\xf0\x43\xc7\xf5\xd6\x9d\x7f\xe6\x20\x9c\x66\
-\xcb\xa5\xf9\xfc\x65\x23\xe4\xff\xe5\x6f\xbf\xb7\x0b\xd0\xc2\x4f\
-\xcf\xf9\x55\x94\x02\xbe\x4f\x06\xa1\xff\x82\xa2\x26\xf5\xb1\x28\
-\x45\x89\x41\x63\xb9\xbe\x7b\xa3\xa3\xc1\x0a\xb9\x11\x3f\x6c\xa4\
-\xb6\xbe\x77\xd3\xec\x4e\x7a\x71\x76\xc1\xf4\xca\xf0\x36\x87\x81\
-\xaa\xbb\x0a\x66\xeb\xe6\x7e\xfb\x5b\x7c\x20\x5d\x34\x92\xc4\x17\
-\x0b\xaf\x99\xa8\xc9\x45\x87\xeb\xdf\x0d\xaf\xe7\x21\x28\xf1\x33\
-\xb5\xb2\x16\x0d\xdf\xba\x79\xa3\x5e\xde\xc8\x77\x7d\x25\xdf\xa4\
-\xcb\xc2\x9c\x15\xf6\xf4\x49\xf5\xf8\x70\x4c\x18\xf9\x32\x78\x2f\
-\xef\xf2\xcb\x44\x51\xff\x7a\xd7\xcd\xaa\xaa\x7c\x88\xa2\x18\x66\
-\x28\xc0\xd8\xa5\x04\x0a\xe5\x43\x4f\x53\x9b\x28\x12\xa8\x0b\xa1\
-\xeb\x39\x4e\x19\x3c\xc4\x6f\x2a\x3e\x8e\x75\x4e\x8d\x17\xb7\xf8\
-\xab\x9a\x03\x37\x31\xbf\x50\xbc\x78\xe4\xf7\xc7\xf5\x4f\x99\xa7\
-\x7a\x88\x9e\x3c\xfd\x2c\x98\xf6\x9e\xf3\xab\x28\x05\xba\xa4\x5b\
-\x39\x1d\xa4\x31\xa2\x01\x4d\x6d\xdd\xde\x4f\xf7\xb1\xf9\x4e\x0d\
-\x5b\xf6\x57\x37\xfe\xa9\x1e\xa4\x46\x2b\x7a\xe4\xff\xe9\xe5\xb4\
-\x41\xa8\x33\x3c\x93\x82\x32\xdc\xde\xcb\xc5\x61\x28\xfc\x90\x9b\
-\xb7\x66\x7a\x57\x62\x9f\x0a\x08\xb9\x8f\xed\x77\x7e\x02\x82\x10\
-\x37\x6f\xdc\x29\xff\x1c\x33\x71\x7a\x65\xe3\xba\xd9\x28\x0f\x03\
-\x5b\x15\x7f\x6b\xfb\x7f\xca\xa7\x88\x53\xca\x09\xe3\x1f\xba\xde\
-\xba\xcb\x95\x65\x92\x2e\xca\x95\x55\x60\x47\x1f\x3c\x90\x3c\xc7\
-\x97\xf9\x5b\xb7\xce\xa9\xe9\x8c\xbb\xce\xfd\x7d\xf2\xd9\xe7\xe6\
-\xa5\x83\x1e\x58\x86\x31\x11\xcb\xa4\xb9\xea\x85\x63\x7c\x76\x2e\
-\x98\xf6\x9e\xf3\xab\x28\x05\x2a\x6a\x94\x53\x03\xa3\xc1\x1b\xde\
-\xf3\x2f\xbf\x8a\x36\x60\xfd\x70\x1f\x8b\x41\xb6\xc3\x4e\x21\x63\
-\xd5\x86\xfc\x87\xc1\x8f\x85\xd7\x74\x99\x32\x8d\xbc\x9f\x9e\xf6\
-\xf0\xd6\x82\x42\xa1\x36\x92\x86\xb1\xb9\x85\xe4\x10\x50\xaf\x6e\
-\xf6\xf5\xc9\xcb\x2f\xef\x55\xf2\xcb\x0f\x37\x9f\x27\x88\xf9\xef\
-\xc6\x4d\x8f\x89\x99\xd0\x6d\xee\x59\x7b\x59\xf3\xad\xa8\x2a\xff\
-\xb0\x7f\x78\x94\xed\x8b\x51\xad\xfa\x34\x82\xeb\xd6\x39\x35\x01\
-\x51\x23\x7e\xfb\x7d\x7f\x61\x6b\x77\xb7\x78\xd1\xe8\x8c\xb7\xe7\
-\xfc\x2a\x4a\x81\x8a\x1a\xe5\x54\xe1\x0d\x1c\x03\xc2\xd7\x96\x43\
-\x0d\x58\x2f\x6e\x86\x4c\x18\x4b\xb5\xcb\x4e\xed\xdb\x7b\xb2\x21\
-\x94\xff\xfa\x35\xa7\x06\xc8\x5f\x2a\x3c\x76\xf2\x8d\xae\xc4\xaa\
-\x09\x79\xba\x30\x3d\x9b\x1d\xd5\x98\xa3\xd4\xd4\x8d\xa0\x99\x10\
-\xd1\x94\x1c\xb6\x93\x74\x73\x9e\xfd\x85\xaa\xc2\xab\xe3\x66\xd8\
-\xe9\xa2\x94\x5b\xd9\x4b\xe3\xc5\x89\x91\x4d\x0d\x41\x55\xb9\x11\
-\x4c\xcc\xaf\x0a\xfd\xaf\x73\x6a\x4e\xfe\xfe\x02\xe2\x31\x17\xad\
-\xce\x44\x63\x27\xce\x9e\xf3\xab\x28\x05\x2a\x6a\x94\xd3\x85\x06\
-\xb3\x10\x36\x0b\xeb\x1b\x66\xf3\x37\xbf\x01\xec\xc6\x4d\xa3\x69\
-\xe6\xd0\x18\x41\x53\x6c\xc3\x4e\x83\x5d\xd5\x08\xca\xff\xfd\x9a\
-\x53\x03\x55\x06\xb8\xe7\x79\x35\x20\xfe\xc8\xdb\xc5\x99\xf9\xec\
-\xd9\x97\x5f\xb5\x85\xef\xc7\xd7\xc4\xcd\x12\x6e\xe6\x4b\x18\x23\
-\x6f\x0c\x5e\xda\x68\xf2\x3f\x5f\x6c\x46\x5c\xd5\x09\x3f\xe4\xfe\
-\xcf\x4f\x2f\xb2\x73\x13\x93\xe9\x38\x8b\xb8\xf8\x8e\x56\x55\x78\
-\xbe\x9b\x3c\xbd\x7d\xe9\x72\xb6\x77\xf3\x66\xf0\x7f\x9d\x53\x13\
-\x10\x35\x85\xff\x7e\xdc\x5f\xe0\xeb\xed\xf9\x3d\xe6\x45\xa3\x88\
-\xd3\x4b\x77\xcf\xf9\x55\x94\x82\xc6\xa2\x26\xf5\xb1\x28\x45\xa9\
-\x0b\x06\x84\x46\x0a\x43\xc6\x9c\x08\x56\xcd\x84\x1a\xb4\x94\x1b\
-\x81\xc0\x4e\xb2\x7c\xca\x80\xe1\x12\x8c\x13\xbd\x20\xc6\x40\xd5\
-\x11\x34\x20\xd7\xb0\xf4\x34\x16\x9f\x19\x7e\x6a\xd2\xb3\x22\xd7\
-\x30\xaf\x26\x16\x1e\xc7\xf4\x84\xe4\xf3\x46\x7a\x68\xa0\xc5\x2f\
-\x79\x24\x1c\x96\xc2\x23\x6e\x62\xf1\xa5\xdc\xf4\x6e\x61\x74\xd8\
-\x29\xb6\xd5\xc3\x95\x8b\x8b\xaa\xf4\x99\x7b\x28\xd7\x71\x3d\xdf\
-\x89\xfa\xe3\x55\x7d\x81\x8a\x98\xb9\xfb\xe0\xa1\xf9\x0e\x90\x31\
-\x76\x18\x58\xa9\x0f\xb1\x38\x39\xcf\x7d\x5d\x5c\x5b\xaf\x15\x3e\
-\x75\x03\x41\x4a\x9e\xa8\x17\xdf\x7e\x1f\xfe\xd6\xd5\xfe\x21\xc3\
-\x4f\xe1\xde\x83\xca\x21\x91\x1a\xf3\xb5\xaa\x86\x80\xca\xe5\xeb\
-\x9e\xdf\x4a\x41\x55\x23\xee\x2a\x41\x15\x8b\xdb\x52\xde\x5f\xb9\
-\x8e\xfb\x1b\x4b\x4f\xcc\x4d\xaf\xdf\x82\x88\x15\xee\x71\xab\x5e\
-\x85\x9f\xcb\x9e\xf3\xab\x28\x05\x8d\x45\x4d\xca\x83\xa2\x34\x21\
-\x6f\x34\x73\xc3\x4c\xa3\xf5\xae\x34\x7a\xb3\x57\x97\xb3\x27\x4f\
-\x9f\x1a\x91\x83\xc1\xe1\xfb\x3d\x6e\x03\xe7\x36\x78\xf9\xc6\x6b\
-\x63\x4e\xef\x8c\x63\x18\xeb\x36\x7e\x72\xdd\xd1\xfd\x07\x66\x29\
-\xf9\xc2\xea\x9a\x11\x31\x18\x43\xe0\x98\x8f\x3f\xa6\x1a\xe3\x10\
-\x63\xf3\x8b\x12\xde\x47\xc1\xf0\x98\x53\xb3\xb6\xbd\x1b\x34\xa2\
-\x8d\x11\xff\xa6\xfc\x24\xcf\x18\x1e\x0c\xc7\xd4\xc2\x92\x31\xb8\
-\x94\x1f\x62\x85\xf2\xc3\xc0\x03\x43\x30\xf4\x68\xf1\xd9\x08\x26\
-\xe5\x8e\xb3\x2f\x90\xf8\x61\x42\x30\x7e\x79\x73\x6f\x24\x08\xc1\
-\xa6\xa1\xb8\x87\x08\x36\xbe\x06\xfe\xec\x8b\x2f\x4d\xef\x08\xf7\
-\x90\xde\x10\x7a\x4c\x98\x53\x61\x3e\x65\x20\xe5\x62\xc5\x06\x7e\
-\x6c\xaf\x5a\xb2\x3c\xca\xbc\xe6\xf1\x60\x64\x09\x9f\xfc\x21\xa6\
-\x80\xfc\xae\x6e\x6c\x9a\x65\xde\xac\xa2\x6a\x85\x3f\x69\x56\xde\
-\x21\x88\xb8\x27\xee\xfd\xa0\xbe\x71\x4d\xc8\x60\xb2\xea\x6e\x51\
-\x0c\xea\x3d\x89\xab\x75\xff\xf2\xfb\xb9\xca\x0a\x2f\x2b\x0a\x62\
-\xe9\x96\xf3\x7c\x51\x9c\xba\x40\x7a\x5d\xff\x40\x7d\xb7\x79\xf7\
-\xfd\x4e\xad\xac\x9b\xb8\x17\xbd\xf4\x42\x93\xb8\x17\xd7\xae\x99\
-\xb8\x5d\xff\x1c\xf3\x59\x8f\x58\xdc\x6d\x48\x38\xa6\xdc\x8b\xfb\
-\xeb\xd6\x2f\xca\xde\xd6\x2f\x04\x8c\xe9\x2d\x95\x7b\x4c\xdd\x8a\
-\xdd\xe3\x58\x7a\x7b\xce\xaf\xa2\x14\x34\x16\x35\xa9\x8f\x45\x29\
-\x4a\x63\x68\x34\x6d\xc3\x29\x06\x0b\x03\x44\x23\x68\x8c\x2c\x06\
-\x57\x1a\x45\x1a\xd1\xd0\x1b\x1c\x60\x3c\x27\xf9\x0a\x76\x29\x68\
-\x9a\x37\x7c\x36\x6e\x8c\x7a\x1e\x77\x81\x69\x8c\x8b\x5d\x6a\x1b\
-\x84\x99\xe7\x27\xef\xc1\x68\x0b\xcf\x09\xb3\x4e\x4f\x48\x5d\x6c\
-\xf9\x91\xff\xdc\xf8\x20\x70\x88\x2f\x2f\xbf\x10\xb6\x7c\x5b\x79\
-\x74\x84\x45\xd3\x74\x11\xbf\x49\x43\x1e\x7f\x2e\xb0\x6c\xfc\x6e\
-\x1a\x9c\x38\xe5\x9a\xdc\xd0\x35\xb8\x67\x36\x9e\x32\x9f\xa1\x3c\
-\xba\xf9\x92\xf0\xb9\x77\xe4\xcb\xd6\x2f\xf7\x1e\xf3\x5b\xa6\x23\
-\x90\x86\x32\x4f\x81\x7a\x81\xbf\x1a\xf5\x82\xff\x8d\xe8\x0c\x85\
-\x41\x3d\x88\x85\x71\x96\x71\xfb\x90\x16\xb9\x47\x75\xeb\x97\x29\
-\x7f\xf9\xbf\xfd\x1e\x4b\x3c\xa9\xb8\x88\xa3\xc7\xfc\x2a\x0a\x34\
-\x16\x35\x8a\x72\x22\x98\x86\x93\x86\x2d\x37\x40\xa6\x01\x2d\x1a\
-\xd1\xf7\xa4\xb1\xab\x9a\x14\xcb\x32\xe7\xc7\xc7\x4f\xb2\xc3\xfb\
-\x0f\x44\xe4\x2c\x9b\xb7\x54\xfb\xb1\xc7\x5a\x0d\x2a\x8d\xb6\x89\
-\x5b\x1a\xcf\x36\xe4\x5c\x95\xff\x00\xad\xbc\xf8\xe1\x39\x61\x06\
-\xfc\xf5\x84\xc9\x47\x2b\x5e\x53\x7e\x46\x28\x7a\x70\x0e\x23\x01\
-\xe6\xda\xee\xf2\xd8\x41\x2c\xfe\x36\xbc\x32\xe8\x26\xce\x32\x0e\
-\x84\x4a\x67\x1c\x65\xbe\xac\x58\x2a\x70\xd3\xd6\x22\x0f\x27\x96\
-\x8e\x96\x9f\x80\xbf\x22\xdc\x90\xbf\x12\xfc\x97\x61\xb8\xfe\x9d\
-\x30\x42\xfe\x84\xb3\x8c\x3b\x88\x1b\x9e\x29\xf7\x40\xfd\x32\xf7\
-\xc0\x8b\xa3\x66\x3c\xad\xb4\xfa\xe9\x6d\x16\x8e\xf2\x66\xa3\xa2\
-\x46\x19\x3c\x6c\x03\x46\x23\x07\xd2\xa8\xed\x1c\xdd\x8a\x0a\x9a\
-\x2a\x37\x3d\x39\x84\x51\xd9\x28\x3a\xf1\xb6\x11\xba\xb6\x2e\xa1\
-\xf0\x20\x74\x6d\x3f\x29\xe2\x31\xe5\x17\xe0\xc4\xd3\xe2\x84\x7f\
-\x62\x71\x16\x61\x35\xca\x97\x7f\x4d\xec\x3a\x9f\x6e\xfd\x59\x7a\
-\xf1\xdf\x8b\x5f\xe8\xd5\x7f\x88\x22\x1c\xb7\xec\x3b\xee\x41\xc8\
-\x5f\x1d\xdc\x30\x7a\x0d\x4b\x79\xe3\x50\x51\xa3\x0c\x3e\xd2\xa8\
-\x21\x4a\xe8\x8d\xa9\x12\x30\x21\xf7\xda\x4e\x9f\xe6\xb0\x28\x8a\
-\xa2\x28\x03\x8d\x8a\x1a\x65\x28\x40\x90\xd0\xad\xfd\xe3\x8b\xe6\
-\xcb\x7a\x57\xb7\x9c\x89\x86\x81\xb0\x15\x45\x51\x94\xd1\xa0\xb1\
-\xa8\x49\x7d\x2c\x4a\x51\x4e\x12\x44\x09\xe3\xf6\x6b\xd7\xb7\x6a\
-\x0b\x1a\xe0\xeb\xd8\x4c\x6e\x54\x51\xa3\x28\x8a\x32\xda\xa4\xbe\
-\x4f\x19\x14\x35\x29\x15\xa4\x28\x27\x4a\x31\x0c\xc5\x50\x12\x1b\
-\xf7\xd5\xdd\x78\x4e\x45\x8d\xa2\x28\x8a\xa2\xa2\x46\x19\x3c\x10\
-\x36\xe5\xf2\xd2\xc9\xec\x5d\x11\x38\x07\x77\xee\x9a\xbd\x6d\xec\
-\xbe\x25\xbe\xc0\xd1\xe1\x27\x45\x51\x14\x45\x45\x8d\x32\xb0\x98\
-\x95\x16\xa6\xd7\x26\x17\x37\xf9\xde\x16\xce\xbe\x19\x17\x2f\x9b\
-\x9d\x4c\xcf\xcb\x75\x7c\x27\x29\x9f\x28\xac\xa2\x46\x51\x14\xe5\
-\x4d\x45\x45\x8d\x32\xf0\x58\x71\x53\x0a\x1c\xf6\xc9\x28\xf7\xcd\
-\xc8\x37\xff\xca\xf7\xcd\x10\x41\x23\xd7\x86\xc2\x50\x14\x45\x51\
-\x46\x1f\x15\x35\xca\xf0\x80\x60\x41\xe0\x44\x50\x41\xa3\x28\x8a\
-\x32\xfa\xa4\xbe\x4f\xa9\xa2\x46\x51\x14\x45\x51\x94\xa1\x21\xa5\
-\x51\x54\xd4\x28\x8a\xa2\x28\x8a\x32\x34\xa4\xbe\x4f\x99\x14\x35\
-\x2e\xa1\x35\xe1\x74\xff\xf0\x5f\x28\x70\xf6\xb9\xe1\x3f\xff\x3c\
-\xb8\xe1\xd6\xa5\x9b\x38\x52\x69\x6e\x8a\x1f\x0e\x70\xbe\xdb\x72\
-\x69\x82\x96\x7d\x7b\x38\xc0\x79\x2d\xfb\xf6\xf3\xc0\x79\x2d\xfb\
-\xf6\xf3\xe0\x86\x5b\x17\x2d\xfb\xf6\x70\xb4\xec\xb5\xec\xfd\xf3\
-\xc0\xf9\xb3\x2a\xfb\x10\x2a\x6a\x6a\xe2\x87\x03\x9c\xef\xb6\x5c\
-\x9a\xa0\x65\xdf\x1e\x0e\x70\x5e\xcb\xbe\xfd\x3c\x70\x5e\xcb\xbe\
-\xfd\x3c\xb8\xe1\xd6\x45\xcb\xbe\x3d\x1c\x2d\x7b\x2d\x7b\xff\x3c\
-\x70\xfe\xac\xca\x3e\x44\x50\xd4\x28\x8a\xa2\x28\x8a\xa2\x0c\x1b\
-\x2a\x6a\x14\x45\x51\x14\x45\x19\x09\x54\xd4\x28\x8a\xa2\x28\x8a\
-\x32\x12\xa8\xa8\x51\x14\x45\x51\x14\x65\x24\x50\x51\xa3\x28\x8a\
-\xa2\x28\xca\x08\x30\x9b\xfd\x7f\x6c\x7b\x1d\xcb\x35\xfc\x6a\x90\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x81\xa6\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x46\x00\x00\x00\xe4\x08\x06\x00\x00\x00\x7d\x96\xeb\xa0\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x81\x3b\x49\x44\x41\x54\x78\x5e\xed\xbd\xf7\x7b\
-\x16\x57\x96\xef\xbb\x50\x42\xa0\x1c\x50\x00\x81\x00\x49\xe4\x60\
-\xc0\x36\x38\x1b\x4c\x70\xc6\xd9\xee\x76\x87\x99\x9e\x9e\x33\xe7\
-\xce\x79\xce\xb9\xcf\xdc\xfb\x0f\xcc\xef\xf7\xdc\xe7\xfc\x30\x77\
-\xee\x9c\x9e\xd3\x73\xa7\xbb\xed\x99\x6e\xdb\x6d\xb7\x43\xb7\xdd\
-\x0e\xe3\x4c\xb2\x89\x26\x83\xc8\x02\x81\x12\xca\x59\xe2\xae\xef\
-\xaa\xaa\x57\xa5\xd2\xde\xf5\xbe\xaf\xf4\xca\x42\x62\x7d\x60\xab\
-\x6a\xd7\x5b\x3b\xef\xda\x7b\xd5\x0e\xab\xa6\xe5\x94\x95\xdf\x20\
-\x45\x51\x14\x45\x51\x14\x85\x92\xdc\xa3\xa2\x28\x8a\xa2\x28\xca\
-\x2d\x8f\x0a\x46\x8a\xa2\x28\x8a\xa2\x28\x2e\x2a\x18\x29\x8a\xa2\
-\x28\x8a\xa2\xb8\xa8\x60\xa4\x28\x8a\xa2\x28\x8a\xe2\xa2\x82\x91\
-\xa2\x28\x8a\xa2\x28\x8a\x8b\x0a\x46\x8a\xa2\x28\x8a\xa2\x28\x2e\
-\x2a\x18\x29\x8a\xa2\x28\x8a\xa2\xb8\xa8\x60\xa4\x28\x8a\xa2\x28\
-\x8a\xe2\xa2\x82\x91\xa2\x28\x8a\xa2\x28\x8a\x8b\x0a\x46\x8a\xa2\
-\x28\x8a\xa2\x28\x2e\x2a\x18\x29\x8a\xa2\x28\x8a\xa2\xb8\xa8\x60\
-\xa4\x28\x8a\xa2\x28\x8a\xe2\xa2\x82\x91\xa2\x28\x8a\xa2\x28\x8a\
-\x8b\x0a\x46\x8a\xa2\x28\x8a\xa2\x28\x2e\x2a\x18\x29\x8a\xa2\x28\
-\x8a\xa2\xb8\xa8\x60\xa4\x28\x8a\xa2\x28\x8a\xe2\xa2\x82\x91\xa2\
-\x28\x8a\xa2\x28\x8a\x8b\x0a\x46\x8a\xa2\x28\x8a\xa2\x28\x2e\x2a\
-\x18\x29\x8a\xa2\x28\x8a\xa2\xb8\x4c\xcb\x29\x2b\xbf\xe1\x9e\x1b\
-\x79\xf4\xbe\xbb\xdd\xb3\xf8\xf8\xee\x54\x35\xd5\x5c\xab\x73\x6d\
-\x0e\xab\x16\x55\x52\x59\x71\x11\xbd\xff\xd5\x4e\xf7\xca\x10\x08\
-\xe7\x5a\x63\x13\xed\x3b\x76\xc2\xbd\xe2\x50\x5c\x90\x4f\xeb\x96\
-\x2d\x71\x6d\xb1\x33\x9a\x30\xc2\xe2\x1c\x0f\xa3\x0d\xc3\x16\xe7\
-\x78\xd1\xbc\xd7\xbc\xf7\xa3\x79\xaf\x79\xaf\x79\x3f\x84\xe6\xfd\
-\xd4\xce\xfb\x44\xa0\x23\x46\x8a\xa2\x28\x8a\xa2\x28\x2e\x31\x8f\
-\x18\x99\xa4\x42\x45\x51\x14\x45\x51\x94\xa9\x84\x8e\x18\x29\x8a\
-\xa2\x28\x8a\xa2\xb8\xa8\x60\xa4\x28\x8a\xa2\x28\xca\xa4\x04\xeb\
-\x96\x60\x12\x89\x0a\x46\x8a\xa2\x28\x8a\xa2\x4c\x4a\xb0\x98\x7b\
-\x34\x8b\xc6\xc3\x50\xc1\x48\x51\x14\x45\x51\x94\x49\x09\x76\xb8\
-\xc1\x24\x12\x15\x8c\x14\x45\x51\x14\x45\x99\x94\x60\xdb\x7f\x70\
-\xeb\xff\x58\x51\xc1\x48\x51\x14\x45\x51\x14\xc5\x45\x05\x23\x45\
-\x51\x14\x45\x51\x14\x97\xa8\x82\x11\x34\x4b\xc2\x28\x8a\xa2\x28\
-\x8a\xa2\x4c\x75\xa2\x2a\x78\x54\x14\x45\x51\x14\x45\xb9\x19\xc1\
-\xa7\x44\x40\x22\x17\x60\xeb\x54\x9a\xa2\x28\x8a\xa2\x28\x93\x12\
-\x7c\x5f\x2d\xde\x6f\xac\x45\x43\x47\x8c\x14\x45\x51\x14\x45\x51\
-\x5c\x74\xc4\x48\x99\x7a\xdc\x60\x59\xdf\x66\x14\x45\x51\x14\x25\
-\x84\xa8\x23\x46\x9e\xaa\x6d\x5d\x80\xad\xdc\xac\x4c\x4f\x4b\xa5\
-\x59\xf9\xf9\xd4\xd3\xd5\x45\x69\x29\x29\xb4\xe6\xb6\xd5\x72\xfd\
-\xe8\xd1\xa3\x72\xac\xac\xaa\xa2\xd6\xb6\x36\x3a\x72\xfc\x24\xb5\
-\xf3\x3d\x34\x6d\x1a\x4d\xc3\x0f\x7c\x54\x14\x45\x51\x14\x3f\xfa\
-\x75\x7d\x65\xd2\x92\x99\x3e\x9d\xb6\x3f\xbc\x95\xb2\xb3\xb2\x68\
-\xf7\xae\x5d\x72\xed\x81\x07\x1e\x90\xe3\x17\x5f\x7c\x21\x47\x93\
-\xbd\xfa\xfc\x79\xda\xb1\xe7\x1b\x6a\x6a\x6d\x57\x21\x49\x51\x14\
-\x45\x19\x46\x54\xc1\xc8\x5b\xd4\x94\x68\xcd\x92\x8a\x32\x5a\x66\
-\xa4\xa5\x51\x79\x71\x21\x3d\xbc\x75\xab\xd8\xc3\x84\x20\x60\xb3\
-\x2f\x5d\xbe\x82\x3e\xfa\xe2\x4b\xaa\x6f\xba\xce\x72\x11\x0b\x46\
-\x2a\x1c\x29\x8a\xa2\xdc\xf2\x44\x5d\x63\x34\x1e\xea\xb6\x15\x65\
-\xb4\x60\x94\xa8\xaa\xac\x74\xcc\x42\x11\xec\x45\x85\x05\x34\xb7\
-\x30\x9f\xf2\xb3\x32\xe8\xc6\xe0\x20\xdd\xd0\x35\x48\x8a\xa2\x28\
-\x93\x0a\xcc\x6a\x79\x33\x5b\x89\x42\x17\x5f\x2b\x93\x86\xb4\x94\
-\x64\x5a\x38\xbb\x84\x36\x6d\xdc\x28\xf6\xb1\x08\x45\xc0\xb3\xff\
-\xf4\xa5\x17\x69\x61\xf9\x5c\x22\x15\x8e\x14\x45\x51\x6e\x79\x54\
-\x30\x52\x26\x0d\xe5\xc5\xb3\x62\x16\x8a\x3e\xfd\xf4\x53\x1a\x18\
-\x18\x88\x59\x48\xca\x4a\x4d\xa1\xd4\x64\x7e\x1c\x6e\x0c\xea\xee\
-\x35\x45\x51\x94\x5b\x18\xd5\x63\xa4\x4c\x0a\xb0\xae\xe8\x6f\x7e\
-\xfc\x43\x39\xb7\x09\x39\x0b\x2a\x2a\xe9\xb3\xaf\x77\x50\xd3\xf5\
-\xeb\x34\x30\xc8\x02\x8e\x4b\x6e\x76\x16\xe5\x65\x65\xd1\xb3\x4f\
-\x6d\x17\xbb\xcd\x7d\x66\x6e\x1e\x7d\xb1\xfb\x1b\x9a\x96\x94\x24\
-\x46\x51\x14\x45\xb9\xb9\x19\x8f\x0d\x62\x51\x5b\x7f\xa8\xdb\xf6\
-\x54\x6e\x2b\xca\x44\xb1\xa4\xca\xa9\x83\x36\xa1\x66\x20\x29\x99\
-\x5e\x7b\xfb\x1d\xaa\x6f\x6a\xa2\x41\x9a\x46\xd3\x92\x53\x28\x29\
-\xc5\x31\xad\x1d\x5d\x74\xfe\xea\x35\x7a\xfd\x9d\xf7\xac\xee\x61\
-\x5f\xb1\x64\xb1\xac\x35\x52\x9d\x47\x8a\xa2\x28\xb7\x2e\x51\x05\
-\xa3\xf1\x50\xb7\xad\x28\xf1\x52\x98\x9f\x67\x15\x6a\x96\x2e\x5b\
-\x4e\xfb\x0e\x7d\x47\xd3\x58\x38\x4a\x4a\x1e\x32\xd3\x7c\x06\xf6\
-\x1a\x16\x8e\x1a\x9a\x5b\x8c\x42\x11\xd8\xbd\x7b\x37\x25\x27\x4d\
-\xa3\x1b\xf2\x4f\x51\x14\x45\xb9\x15\x89\x2a\x18\x61\x78\x4a\x75\
-\x18\x29\x13\xca\x8d\x1b\x54\x7d\xfa\xb4\x9c\x9a\x84\x9a\xee\x9e\
-\x1e\xd9\x6e\xef\x4c\x81\xb1\x20\xe4\x4e\x85\x4d\x9b\xe6\x1a\xef\
-\x3c\x39\x89\x52\x67\xcc\x14\x77\x36\x21\x2b\x3f\x2f\x8f\xc3\x93\
-\xd3\xf8\x71\x47\x9a\xa6\xa7\xa6\x52\x32\xc7\x07\x06\x8b\xb9\x65\
-\x41\xb7\x67\x12\x89\xeb\xa7\x3f\x3c\x9c\x7b\x61\x8e\x39\x5c\xbf\
-\xfb\x68\xfe\xf0\x6f\xc1\xf0\xa3\xba\x19\x2d\x7e\xbf\x83\x26\x5e\
-\x4c\x7e\xc0\xc4\x03\xdf\x8f\xb4\xa7\xb1\xf0\x9d\x9d\x91\x21\x26\
-\x61\x65\x00\xfc\x7e\x8c\xc6\x2f\x93\x7b\x98\x58\x88\xd5\x9d\xfb\
-\x1b\xca\xdf\x7a\x8f\xa2\x4c\x12\x74\x8d\x91\x72\xf3\xc3\x0d\xed\
-\x82\xd2\x62\xda\xfe\xd8\xa3\x62\x0d\x0a\x35\x58\x68\xbd\xff\xf8\
-\x29\x4a\x4a\x81\x50\xe4\x08\x46\x46\xd8\x9f\x34\x6e\xb8\x33\xa6\
-\xa7\xc9\x94\x59\x49\x49\xb1\x5c\xbb\x7a\xf5\xaa\xfc\x5c\x52\x5a\
-\x4a\xd5\xe7\x2f\x50\x6f\x7f\xbf\xe3\x0f\x77\x76\xd1\x80\xd6\xed\
-\x54\x0e\x2f\x3f\x3b\x8b\xee\xbb\xfb\x2e\xa3\xb2\xc9\x8f\x3f\xf9\
-\x84\xda\x3a\xbb\x28\x33\x27\x97\x8e\x9e\x62\x01\x8f\xfd\x1d\x8b\
-\x52\x49\xa8\x2c\xc8\x9c\x31\x83\x1e\x7a\xe0\x3e\xab\x72\xcb\xde\
-\xbe\x3e\x5a\x50\xe9\x68\xfc\xfe\xe6\xc0\x41\xea\xea\xe9\x75\xd2\
-\x13\x43\x98\x73\x0a\xf3\x45\x83\xf8\xf2\xe5\xcb\xc5\xee\x69\x10\
-\x9f\x3b\x6f\x9e\xac\xc1\xf2\xe2\x3f\x9d\xf3\x71\x59\x55\x15\xb5\
-\x37\x37\xd1\x8c\xe9\xd3\x47\x2c\x8c\x9f\x53\x3e\x9f\xce\x5e\xb8\
-\x38\x94\xe6\x51\xa6\xd7\x03\xda\xcd\x37\xac\x59\x4d\x47\xdc\xf8\
-\xf8\xe3\xd7\xc5\xc2\x71\x6d\xe3\xf5\x98\xc3\xc9\x9c\x91\x4e\x0f\
-\x72\x79\x01\x2f\x7d\x9e\x7f\x3b\xf7\x7c\x43\x8d\x6d\xed\xa1\x65\
-\x84\x91\xc5\xd2\xa2\x22\x5a\x5a\x55\x49\x97\xce\x9f\x93\x7a\x65\
-\xda\x18\x80\xfa\xb4\xe7\xdb\xbd\x54\xd7\xdc\x12\xc9\x37\x9b\x9f\
-\x41\x9e\x78\x68\xa3\xc8\xe8\xc1\xf8\x1d\x38\x78\x90\x6a\xea\x1b\
-\x9d\x74\x86\xf8\x95\x9d\x99\x49\x0f\xac\xbf\x23\x34\xbf\x6c\x7e\
-\xa0\x0e\xac\x59\x3d\x5c\x83\x3c\xdc\xa3\x3e\xf9\xeb\x40\x19\x3f\
-\x33\x37\xfa\x7b\x29\x8b\xf3\x73\xe3\x83\x0f\xf2\xf3\x90\x46\xff\
-\xf8\xaf\xbf\xa1\xde\x81\x01\xc7\x6f\x45\x19\x67\xc6\x63\x8d\x51\
-\x72\x7a\x76\xee\xdf\xbb\xe7\x8a\x72\xd3\xb2\x6a\xf9\x32\x2a\x2d\
-\x2e\x1a\x21\x14\xc1\x9e\xc4\x82\xc9\xe2\x45\x8b\xe8\xfc\xa5\xcb\
-\xce\xe8\x10\x7e\x30\x35\xca\x7c\x0d\x3b\xd5\xd0\x29\x40\x50\xa8\
-\x6b\x6c\x92\x35\x49\x5d\xbd\xbd\x62\xea\xb9\xa3\x18\x1c\xbc\xc1\
-\x7e\xb8\x9d\x6b\x48\xc3\x8e\x0e\x60\xd5\x92\xc5\x94\xc3\xc2\x41\
-\x51\x5e\x0e\x3d\xb2\x75\x2b\x65\xcc\x9c\x49\x3b\xbe\xfe\x5a\x7e\
-\xf7\xc7\x2f\x39\x39\x99\x1e\xd9\xb6\x95\x2a\xe6\x97\x53\x6f\x7b\
-\xab\x08\x63\x6d\xf8\x34\x09\x63\x8d\xab\x81\x32\x16\xe4\x66\x73\
-\x58\xc5\xf9\x79\xf4\xf8\x23\x0f\x5b\xc3\x03\x9b\x36\x6d\xa2\xfc\
-\xdc\x5c\x3a\x75\xe2\x38\xcd\xca\xcd\xa1\x7b\x36\x6c\xa0\x9a\x2b\
-\x57\xa8\x07\x02\x12\x6e\x08\x09\x73\x4e\x81\xe3\x3f\xdc\x1f\x3e\
-\x74\x88\xd2\x39\xad\xdb\xb6\x6c\xe1\xf0\x66\xd0\xfe\xef\x8e\x88\
-\xd3\xb9\xb3\x4b\xe9\x69\x4e\xd3\xd5\x9a\x8b\x22\x14\xa0\x53\x04\
-\xfe\xf2\x81\xfb\x9a\x0b\xe7\x45\x88\x6b\x6c\xe1\x74\xb3\xbb\x68\
-\x61\x87\x31\x30\xd0\x4f\xd3\x69\x30\x12\x1f\x7f\xfc\x10\xdf\xa3\
-\x27\x4f\x52\x2f\x97\xa3\x74\xd9\x51\xc2\xd8\xca\x42\x65\x25\x97\
-\x87\x3f\x7d\x9e\x7f\x8d\x2c\xc4\xf4\xb0\x3f\xf0\xc3\xd4\xb9\x43\
-\x30\x7d\xee\xb1\x47\xe8\x8e\xd5\xab\xe8\xf8\x91\x23\x94\xca\x42\
-\xa4\x29\xfd\x00\xfe\x65\x67\xcc\xa4\x97\x9e\x79\x5a\x46\x53\xce\
-\x5f\xaa\x89\x2d\x1f\xb8\x8e\x3c\xba\xe9\x41\x63\xfc\x10\xa7\xfa\
-\xeb\xcd\x4e\xfc\x70\xaf\xc5\x1f\x08\x46\xd4\xdb\x6d\xcc\xaf\x25\
-\x4b\x96\xd0\xc9\xea\x33\x8e\x1f\x06\xf7\x4f\x6e\xdd\x2c\x65\x1c\
-\x0c\xff\x20\x0b\x65\x08\x3b\x9d\x05\xe1\x7b\xee\xbc\x9d\xa6\xf5\
-\xf5\xb0\x50\x34\x83\x36\x3f\xf4\x10\xa5\x70\x3d\x47\xfa\xf1\xf9\
-\xa8\x41\xac\xd5\xb3\xf8\xad\x28\x89\xa4\x0a\xaa\x56\x98\xd3\x17\
-\x2f\xc9\x31\x11\xe8\xd6\x1b\x65\x52\xd0\xd0\x74\x7d\x44\xa7\xe3\
-\xb7\xaf\xe3\x4e\x6a\xd9\x82\x79\x94\x9f\x95\xc9\x7d\x8a\xab\x8f\
-\x08\x26\x88\x34\xd6\xce\xf4\x9a\xb3\x16\x29\x65\xd8\x51\x46\x9b\
-\xf8\x77\xdc\x67\x03\xa3\x44\x5b\xee\xbb\x87\xa8\xa7\x8b\x85\x82\
-\x14\x63\x7c\x80\xcd\xfe\xd2\xb3\x4f\xd3\xcb\x4f\x6f\x97\x87\xcf\
-\x1a\xcf\x00\x6b\x58\x30\xcc\x9f\x99\x2e\x23\x33\xf1\x86\x07\x3b\
-\x3a\xb9\xca\xd9\x25\xd2\xa9\x87\x86\xc9\xd7\xd7\xad\x5b\x27\xa7\
-\x41\xff\x76\xef\xd9\x43\x37\x06\x07\xe8\x81\xf5\xeb\x45\x30\x38\
-\xb0\x7f\x9f\x5c\x8f\x16\x3e\x84\x96\x1f\x3d\xf3\x14\xdd\x18\x08\
-\x29\x97\x18\x80\x50\x07\x01\xcb\x16\xde\xf4\xe4\x24\x8e\x9f\x3b\
-\x7d\x15\x06\xff\x5e\x54\x50\x60\x8c\x6f\x4f\x6f\x1f\x5d\x6f\x6d\
-\x75\xfd\x18\xee\x0f\x46\x89\xe6\x15\x15\xd2\xcf\x5f\xfe\x01\xcd\
-\xb2\xb8\x07\x36\x7b\x5b\x53\x23\xad\xae\x5c\x48\xb3\xf2\xf2\x62\
-\xca\x07\x9b\x7f\xeb\xd6\xad\x1d\xda\x24\x10\x42\x7b\x7b\x9b\x1c\
-\x4d\xf1\x41\xf8\x78\x4e\xc4\x8f\xa0\x3f\xae\xdd\x14\x7e\x32\xe7\
-\x31\xea\xfc\xd6\xfb\xef\xa5\xb6\xc6\x06\xce\x93\xa4\x11\xfe\xe3\
-\xa5\xc1\x94\x7f\x8a\x32\x59\x50\xc1\x48\xb9\xf9\x61\x21\xe5\x04\
-\xde\x6e\x19\x53\x23\x0f\x60\x9f\x99\x9e\x4e\x3f\x7d\xe9\x05\xfa\
-\x2b\x36\x65\x85\xf9\xfc\xa6\x9b\x2a\x1d\xc8\x88\x4e\x08\xc2\x11\
-\x46\x96\x44\x48\x72\x05\x25\xef\xdc\xbd\x6e\x03\x42\xd1\xcb\x4f\
-\x6d\xa7\xcb\x17\xce\x8b\x3d\x2c\x3e\xc0\x66\x3f\x7e\xf4\x08\x2d\
-\x9d\x3f\x57\x3a\x99\x68\x9d\x64\x45\xf9\x3c\x11\xc2\x4c\x9d\x50\
-\xbc\xf6\x9f\xbc\xf0\x1c\x65\x65\xcc\x8c\x1a\xa6\xc9\x7d\x0a\x87\
-\x8f\xe9\xa7\xb5\xab\x56\xc4\x1c\x9e\x67\x47\x7a\x4b\x0b\x20\x10\
-\x70\x79\x8c\xa1\xc3\xec\xec\x1f\x90\xa3\x29\xbc\x3c\x57\x28\x96\
-\x0e\x39\x24\x6d\xb3\x0a\xf2\xad\x42\x5d\x46\x76\xb6\x93\x37\xc2\
-\x50\x3d\x40\xde\xcf\x2b\x9a\x45\xcf\x3c\xf1\xb8\xd8\xa3\xa5\xd7\
-\x66\xdf\xb4\x69\x23\xfd\x88\x05\xe3\x0c\x11\x50\xed\x0a\x45\xbd\
-\xab\x36\xff\xe0\xce\xf9\x17\x8e\xcd\xbd\x4c\x8f\x89\x1f\x66\xf6\
-\xed\x33\xe7\xcf\xfa\x3b\xd7\xd3\x9a\x15\xcb\xe9\xf2\xc5\x0b\x62\
-\xb7\xf9\xef\x94\x81\x7b\xaa\x28\x93\x8c\xa8\x82\xd1\x78\xa8\xdb\
-\x56\x94\x78\x19\xe0\x46\xbc\xb0\xa4\x54\xce\x83\x8d\x70\xd0\x7e\
-\x60\xff\x7e\x2a\xca\xcb\xa5\xff\xfc\x93\x1f\xb1\x90\xf4\xbc\x08\
-\x49\xd2\x11\x05\x85\x24\x08\x40\x41\x13\x85\x2d\xf7\xdd\x1b\xf3\
-\x48\x49\x34\xfb\xd6\xcd\x9b\x69\xdb\x03\xf7\x0d\xc5\xcb\x00\xde\
-\xbe\xd3\xdd\x1e\xc6\xe4\x5f\x4f\x4f\x0f\xbd\xf7\xa7\xf7\xe9\x6a\
-\x43\x23\xa5\xa4\xcf\x90\x8f\xe3\x7e\xf4\xf1\x27\x91\xdf\x81\xff\
-\xfe\xe9\xd3\xa7\x53\x1e\x04\xa3\x90\x30\x6d\x9d\x22\xa6\xe7\x30\
-\x32\x67\x4b\x4f\x34\x3b\x84\x0a\x19\xe9\x18\xf4\x95\x41\x3c\x70\
-\xf9\xd4\x37\x36\xc9\x9a\x2d\x10\xf4\xff\xf1\x47\x1f\x95\xe9\x23\
-\x47\x68\xb0\x93\xec\x86\x6d\x8a\x6f\xf5\xb9\xf3\x1c\x8c\x53\x17\
-\xfc\xb5\xa1\x24\x3f\xd7\xba\xc6\x6d\x34\xf6\xca\x39\xa5\x94\x35\
-\x33\x83\xf3\xc1\x3e\xf2\x63\x73\xbf\x6f\x2f\xca\x27\x7a\xfe\x65\
-\x62\x2a\x8d\x31\xc7\x27\xba\x7b\x53\xf8\xe9\xd3\xd3\xa8\x27\x64\
-\x24\x0a\x74\x77\x77\xcb\x51\x51\x26\x2b\x51\xd7\x18\x8d\xc7\xfc\
-\x9d\xa2\xc4\x0b\x3a\xa9\x9a\xda\x5a\x6a\xb8\x76\x4d\xd6\x74\xd8\
-\x1a\xe5\xa0\x1d\x5b\xf0\x33\x66\xa4\xd3\x33\x4f\x3e\x41\x77\xad\
-\x5b\x43\x35\x17\x2f\xca\xfa\x07\x2c\x4e\x06\xd2\xf9\xc5\x20\x10\
-\x01\x4c\x67\x61\xfa\x00\x98\xc2\x83\x90\xf2\xfa\x5b\x7f\xa0\xcb\
-\x75\x75\xd4\xd1\xd3\x4b\xe7\xf9\x99\xf9\x96\x85\x0c\xac\xc7\x78\
-\x88\x85\x0a\x10\x8c\xdf\xe1\xef\xbe\xa3\x86\xeb\xcd\x22\xf8\x49\
-\x67\x1c\x88\x0b\xa6\xbe\x0a\x73\xb2\x8d\xe1\xd5\xd5\x37\xd0\xab\
-\xaf\xff\x9e\xae\x36\x36\x52\x6b\x47\x27\x5d\xbe\x7a\x95\xf3\xe8\
-\x2a\xd5\x35\x5d\xa7\xf2\x79\xf3\x68\xee\x9c\x39\xc6\xfc\xc1\x5a\
-\x97\x5a\x16\xa4\xbc\x51\xb2\x60\xfa\x11\x1e\xd6\x8c\x00\x93\x7b\
-\x00\x3b\xd2\xfb\xe6\x3b\xef\x52\x53\x73\x2b\x65\xe5\xe6\x52\x07\
-\xc7\xe1\xf8\x31\x67\xa1\xae\xe9\xfe\x14\x2e\xb7\x53\xa7\x4e\xc9\
-\xfa\x2e\x8a\x32\x32\x17\x46\x7f\xff\x00\x6d\x7f\xfc\x31\x39\x0f\
-\xc6\xef\xd8\xb1\xe3\xd4\xc9\x1d\x73\x24\x6d\x41\x38\x9f\xcb\x8b\
-\x8b\x64\xe4\x06\xf8\xdd\x23\x3f\x77\xed\xdd\xeb\x4c\xb3\x7a\x8b\
-\xef\xd9\xe4\xb0\x20\xf9\xf2\x73\xcf\xc8\x7d\xa6\xfc\xc0\xba\xb5\
-\x34\x16\x72\xa0\x5c\xf4\xcb\x9d\xbb\x64\x8d\x52\x56\x76\xb6\x2c\
-\x4e\x3f\x78\xe0\x80\xdc\x17\xcc\x8f\x8d\x1b\x37\x52\x76\x56\xc6\
-\xd0\x3a\x1f\x5c\x0c\xc4\xf7\xae\xb5\x6b\x8c\xe1\xf5\xf5\xf7\xcb\
-\x3a\x1f\x67\x74\xd3\x9e\x8f\x19\x33\x66\xd0\xf5\xba\x6b\x72\x1e\
-\x0c\xbf\xa2\xb2\x92\x4e\x9e\x39\x3b\x34\x42\x1a\xf0\x63\x1b\xe7\
-\x0f\xd6\xb0\x05\xc3\xdf\xb1\x63\x87\xac\xe9\x0b\xa6\x7f\xf9\x8a\
-\x95\xd4\xd1\xd9\x49\x9f\x7d\xf1\x39\x35\xb7\x77\x88\xec\x1b\x59\
-\xab\xa7\x28\xe3\xc8\x78\xc8\x28\x2a\x18\x29\x93\x03\x6e\x60\xfb\
-\xb9\x01\x6e\x6a\x6d\xa5\x8d\xf7\xdf\x67\x6c\xb4\x63\xb1\x7b\x42\
-\x12\xa6\xa7\x2e\xd7\xd4\x38\x9d\x34\x23\xcd\x77\x48\x23\x8e\x29\
-\x34\x2c\xb4\xc6\x1a\x0b\x93\xff\xe8\x54\x7f\xfd\xdb\xd7\xb8\x53\
-\x68\xa7\xde\xfe\x41\xea\xea\xee\xa1\xeb\xad\x2d\xd4\xc1\xc7\x16\
-\xee\x28\xb0\x70\xfc\xe0\x81\xfd\x91\xfb\x81\xe7\x7e\xd9\xb2\xa5\
-\x74\xe6\xdc\x05\xe9\x44\x82\x1d\x49\xf6\xcc\x19\xf4\xc4\xa3\x8f\
-\xc8\x79\x30\x3d\xbf\xfa\xed\xef\x64\x21\xb9\xa7\xbf\x69\x48\x55\
-\xc1\x34\x11\x90\x9a\x59\x88\x33\x09\x91\xe8\x94\x8f\x9e\x38\x41\
-\x3d\x10\x0e\xbd\x8e\xd1\x87\xad\x53\xf4\xec\x1b\x36\x6c\xa0\x2f\
-\x77\xed\xa6\x3f\x7e\xf8\x31\x35\xb7\xb5\x4b\x1a\xaf\xb2\x30\x78\
-\xe6\xfc\x05\x4e\x73\x1b\x3d\xff\xf4\x53\x72\x9f\xc9\x3d\x84\x16\
-\xec\xd0\x93\xb4\xe2\x62\x48\x9e\x9b\xc0\xdd\xe8\x74\xef\xb8\xcd\
-\x3c\x72\x05\x21\xf4\x9a\xbb\xdb\x4a\xd2\x15\xf0\x7f\x06\x97\xe1\
-\x0b\x4f\x9b\x35\xa0\xbf\xf3\xa7\x3f\xc9\xa2\x78\x11\x8a\xbc\x7c\
-\x61\x41\xea\x89\x2d\x0f\xc9\xee\x3f\x63\x7a\xba\xba\xe9\x04\x97\
-\xdd\x05\xa9\x4b\x3d\x84\x89\xbc\x7e\x8e\x20\x16\xf5\x1f\x3d\x79\
-\x4a\x06\x66\x1e\xb7\x94\x1f\x84\xe2\x66\xce\xaf\x3e\xae\xd7\x1c\
-\xa0\x13\x9e\x8f\xde\xb6\x56\x39\xfa\xc3\x03\xab\x56\xaf\xa6\x43\
-\xc7\x8e\xb9\x71\x1c\xe9\xce\xe3\x06\xfb\x6b\x13\xaa\xa1\x1d\x3e\
-\x4c\x30\x5a\xb5\x74\x31\xed\xfd\xf6\x5b\x39\x37\xb9\x07\xef\xbd\
-\xff\x3e\x9d\xbe\x70\x49\x04\xf1\xfd\xdf\x1d\xe6\x38\x1d\x97\x35\
-\x60\x03\x9c\x66\x08\x4f\xa6\x34\x29\x4a\xa2\xc1\x73\x87\x05\xff\
-\xad\x1d\x1d\xee\x95\xb1\xa3\x6b\x8c\x94\x49\x03\xba\x52\x74\x8a\
-\xaf\xbe\xf9\x36\xbd\xfe\x87\xb7\xe5\x9a\xad\xd1\x8e\x66\xc7\x9a\
-\x97\xf9\xa5\xc5\x32\xd5\xb6\xac\xb2\xc2\x99\x7e\xb1\x4c\x69\x80\
-\xf4\xd4\x54\xeb\x42\x6b\x8c\x9c\xbc\xf1\xce\xbb\xce\x16\x65\x59\
-\xc8\xed\x19\x67\x41\x77\xef\x40\x3f\xbd\xf5\xfe\x07\x91\xfb\x81\
-\xdf\xfd\xdc\xd9\x73\x9c\xb0\x3d\xe3\x63\xfd\xed\xe6\x85\xd0\x1f\
-\xfc\xf9\x43\x47\x28\x82\x40\x04\xc3\x1d\x11\x3a\x23\x18\x47\x40\
-\x4a\x96\x37\x77\x53\x78\x60\x10\x9d\x31\x7a\x6d\x4b\x9a\x83\xf7\
-\x7b\x76\x08\x45\x1f\xfc\xc7\xa7\xd2\x11\x42\x08\x90\x34\x42\x4d\
-\x02\x1f\x61\xba\xfb\xfa\x69\x1f\xff\x66\x73\x7f\x07\x16\x76\x1b\
-\xd2\x19\x33\xdc\xd1\x62\xc7\xd8\x5b\xef\xbe\x27\xd6\xa0\xff\x5b\
-\xb7\x6c\x66\x21\x26\x93\x53\x66\x9e\x4e\x5b\x52\x55\x25\x47\x53\
-\xfc\x1a\x9a\x9b\xa5\x23\x17\x23\x57\xb1\x1d\xbd\x44\xb6\xa4\x9b\
-\xee\xc7\x48\x09\xb6\xe1\x8b\x7a\x07\x49\xff\x50\x99\x3b\xc7\x14\
-\xaa\x65\x01\x09\xd3\x73\x26\xf7\xe0\xbe\xbb\xd6\x13\x16\x8c\xdb\
-\xf2\x23\x78\xbf\x67\x8f\x15\x9b\x7b\x6f\x0b\xbe\x0d\xdb\x74\x2a\
-\xec\xa8\xef\xbf\xfc\xcd\x2b\x74\x92\x05\x42\xec\xe6\xec\xed\x1f\
-\x88\xa4\xd7\xc9\x03\xee\x56\x50\x0f\xc5\x85\xa2\x8c\x2f\x35\xd7\
-\xea\xc4\x24\x12\x15\x8c\x94\xc9\x83\xd7\x69\x71\xa3\x5b\x53\xd7\
-\x40\x17\xd9\x1c\x39\x71\xd2\xda\xe9\xc4\x62\xc7\x48\x40\xfa\xb4\
-\x1b\xb2\x86\x24\x6c\xdd\x0d\xa6\x53\x6c\xfe\x7d\xf0\xd1\x47\xee\
-\xc8\x8d\x3b\x05\xe3\x0a\x2a\x4e\x27\xeb\x08\x2a\x10\x22\x16\x5a\
-\x3a\xe5\x7d\x7b\xf1\x66\x6e\xe8\xc8\x39\x2e\xc7\x4f\x57\x8b\x10\
-\x88\x37\x22\xe8\x41\xda\x7b\xf0\x10\xbd\xf6\xe6\x5b\x4e\x27\x2e\
-\x61\x78\xe1\xb8\x6f\xfd\xbe\xf3\xfc\xc2\x42\xf1\xc6\x94\x7e\x8c\
-\x7c\xd9\x64\x93\xb0\x4e\xf1\x83\x4f\x3e\x75\xd6\xe1\x20\x8d\x9e\
-\xe1\xf4\x0d\x09\x65\x49\xb4\x7b\x9f\x79\x64\x0c\x76\xac\x51\x31\
-\xa6\x35\x0e\x90\xbe\xc6\xd6\x36\xa3\xff\x20\x3d\x25\xc5\xbc\x8e\
-\x89\xed\x73\x4a\x8a\x8d\xf9\x81\x9d\x68\xbd\x2c\xd4\x71\x02\x9c\
-\x7c\x74\x99\x53\x52\x62\xbc\x1f\x14\xb1\xc0\x54\xdf\xd8\x28\x69\
-\x8e\x08\xa4\xc8\x7f\x9c\x7b\x47\xbe\xf6\xe7\xcf\x3e\x97\xfb\x4d\
-\xf1\xad\x5a\xb0\x80\xe3\x15\x58\xfb\xe6\x62\xba\x1f\x78\xe5\x13\
-\x8d\xf0\x35\x46\xd1\xb1\x85\xff\xca\xef\x5e\x97\x91\x42\x29\x77\
-\x57\x10\xf4\xd7\x85\xc8\x28\x96\x2f\x1f\x15\x65\x32\xa1\x82\x91\
-\x32\xb9\x40\x87\xe3\x76\x3a\x58\x9b\xf3\xd1\x17\x5f\xd2\xde\x63\
-\x27\x68\x30\x25\x95\x2e\x5d\xbe\x6c\xed\x04\xa2\xd9\x7f\xf0\xec\
-\x33\xb4\x61\xcd\x6d\x66\xe1\x88\xed\x50\xde\x08\x4c\xee\x11\x0f\
-\x8e\x90\x74\x08\xf2\xa6\xec\x75\x0a\xae\x71\xec\x2c\x30\xec\x3f\
-\x48\xaf\xbe\xfe\x06\x5d\xac\xbd\x46\x83\xdc\xa1\x60\x4d\xca\x2b\
-\xbf\x7b\x8d\x2e\xb3\x80\xc7\x37\x8c\x7c\xc3\x66\x77\xd5\x17\x2e\
-\x50\x4d\x7d\x03\x5d\xe2\x7b\x3e\xdf\xb5\x87\xbe\xd8\xb5\x9b\x85\
-\xc2\x7a\x19\xa9\x70\x3a\x5e\x37\x1c\xe0\x75\xae\x12\x7f\x27\x0d\
-\xb6\xf4\x16\x8a\xd0\xe4\xa6\x33\x98\x5e\xc6\x96\x5f\xe7\x2e\x5e\
-\x74\xc3\x75\x4d\x24\x7d\x8e\xc1\xf9\x00\x0b\x25\x36\xf7\x07\x0f\
-\x1d\x72\x83\x1b\x19\x66\xcc\x70\x18\xed\x5d\xdd\x8e\xb2\x41\x43\
-\xfa\xe6\x14\x15\x72\x18\xec\x7f\x24\x2f\x1c\xb0\xe6\xe7\xe2\xb9\
-\xb3\x72\x1e\x8c\x1f\x71\x79\x78\xf1\xc7\x51\x0c\xbb\xad\xbb\x5a\
-\x2b\x3f\x9b\xd2\x03\x01\x91\x33\x81\x6f\x0d\x94\x3b\x70\xcf\x71\
-\xad\x6f\x60\x90\xd6\xac\x5d\x2b\x97\x83\xf1\xc5\x1a\x38\xa8\x60\
-\x40\x58\xa6\x1c\x31\xa5\x2f\x1e\x6c\xee\x3d\x65\x8f\x36\x6c\x2a\
-\x1b\x60\x6f\xeb\xec\x74\xca\x9e\x85\x6b\x6b\x5d\x50\x94\x49\x8c\
-\x0a\x46\xca\xe4\x03\x0d\x30\x37\xc4\xd2\x19\xb9\x6f\xad\x07\x8e\
-\x1c\xa3\xd7\xdf\xfb\x13\x1d\x38\x71\x8a\x85\x8e\xd1\x09\x49\x7d\
-\x9d\xed\x34\x23\x15\xa3\x0d\x23\x85\xa3\xe9\x69\xd3\xad\xee\xe5\
-\xa3\xb5\x58\x68\x0a\x23\x57\x46\x82\x0e\x43\x16\x46\xb3\x40\x03\
-\xb3\xff\xc8\x51\xda\x7f\xf8\xa8\x6b\x77\x46\x7f\x4c\x1d\x0a\x7c\
-\xc4\x6f\x98\x9e\xf0\x8f\xd2\xe4\xe6\xe4\x50\x6e\x56\x16\x15\xe5\
-\xe6\xd2\x03\xeb\xef\xa4\x2d\xf7\xdf\x2b\x3b\x9d\x96\xcc\x9b\x43\
-\x2f\x3f\xfd\x24\xfd\xd5\x8b\xcf\x53\xaa\x4c\x97\x59\xd2\x6b\xea\
-\x85\x5d\xc2\x3a\x45\x89\xa3\x2b\x0c\x48\x6a\x83\x71\x66\x7b\x4a\
-\x6a\xaa\x9c\xda\xf2\xcb\x23\x24\x0a\xd1\xe1\x70\x3e\xfc\x8f\x4f\
-\xe5\x34\xe8\x3f\x76\xcf\xc9\x74\x5a\x40\xd8\xc0\x48\x92\x49\xe5\
-\x01\xa6\x07\x2f\x5d\xbe\x22\xf9\x1c\x2c\xc3\x99\x21\x7a\xa3\x2e\
-\xd6\x40\xa1\x28\xca\x67\xb8\x9b\x61\x48\x7e\xb1\x80\x7b\xfe\x82\
-\x35\x3f\x96\x2e\x5a\xe4\x08\x70\x81\x3a\x67\xbb\xdf\x2b\x9f\x68\
-\xb4\xb7\xb7\xcb\xd1\x16\xff\x68\xd8\xc2\x97\xf2\xf5\xea\x80\x9b\
-\x3e\x45\x99\x4a\xa8\x60\xa4\x4c\x5a\xe4\x0d\x55\x3a\x33\x36\x2c\
-\x38\x60\x48\x7f\x90\xaf\x1d\x38\x7a\x54\x84\x24\x8c\x24\x35\x77\
-\x76\xd3\x91\xe3\x27\xac\x8d\x7c\xd0\x7e\xdf\x5d\x1b\xb8\x7f\x1a\
-\xb9\x85\x3a\x6c\x8b\x3e\x46\x2e\x38\x36\x8e\x09\xe9\x24\xbc\xf8\
-\x3a\x6b\x50\xd8\xa4\xb8\x47\xac\xcd\x40\x1a\xe0\x36\xe8\x1e\x6e\
-\xc4\xdf\x24\xd1\xa0\xfc\x20\xc7\x0f\x7a\x70\xa0\xac\xb1\x82\x05\
-\xa1\x97\x9f\x7f\x96\xd6\xae\x5c\x4e\x0d\xb5\x57\x28\x6b\xe6\x0c\
-\x7a\x78\xeb\x56\x51\x3e\x08\x95\x05\xb6\x85\xe2\xa0\xa1\xc1\xd9\
-\x5d\x67\xc3\x96\x3f\xd8\x59\x16\x89\x62\x30\xae\x2e\xb8\x6a\x73\
-\xbf\x5a\x3e\x33\x31\x26\x91\x48\x40\x18\xb5\x8d\x4d\xd6\xf4\xc9\
-\x74\x5a\x40\xd8\xc0\x67\x5b\x4c\xf7\x5f\x64\x21\x1a\x8a\x1d\x25\
-\xff\x03\x65\xb8\x65\xb3\x7d\x77\x9e\xb3\xb3\x71\xa4\x9b\x20\xf8\
-\xe5\xcc\x99\x30\x3d\x5c\x10\xe0\xdc\x78\x06\xea\x9d\xf9\xfe\xd8\
-\xb1\xb9\x1f\xcb\x1a\x23\x10\xad\x0e\x28\xca\xf7\xc5\xaa\x45\x95\
-\x62\x12\x89\x0a\x46\xca\xe4\x87\x1b\x67\xe7\xed\x15\x42\x92\xb3\
-\xce\xc1\x59\xf7\x90\x42\x67\x2e\x5e\xa4\x0f\x7d\xd3\x6d\x20\xd8\
-\xc8\xfb\xed\x55\x0b\xe6\x0f\x2d\x86\x75\x3b\x29\x8c\x32\x00\xd3\
-\xfd\x58\x88\x0a\xa4\x7f\x88\xd6\x47\x44\xe2\xe9\x8b\xaf\x67\x47\
-\x18\xe2\xc9\x48\x30\xd5\xb2\x74\xde\x1c\xd1\xb8\xbc\x76\xe5\x0a\
-\xf9\x0c\x05\x30\xc5\x07\xc4\x6a\xb7\x11\xad\x53\x14\x42\xd2\xda\
-\xdf\xdf\x2f\xc7\x50\xf7\x63\x85\xf3\x0a\x53\x76\xd8\xf9\x65\x4a\
-\x5f\x70\x3a\x0d\x1f\x79\x7d\x78\xcb\xe6\xc8\xef\x20\x72\xff\xd7\
-\x3b\x38\xff\x39\x41\xc8\x7f\x5f\x19\x40\x87\x14\x30\xf9\x8f\x85\
-\xd7\x40\x6e\x0f\xc9\x0b\x8f\x81\xc1\x41\x6b\x7e\xd4\xd6\xd6\x72\
-\x1c\x71\xe6\xd4\x37\x0f\xdb\xfd\x13\xbd\xc6\xc8\x2b\xdf\x58\xd2\
-\xad\x28\xe3\x4d\x59\x71\x91\x98\x44\xa2\x82\x91\x32\x75\xe0\x5e\
-\xca\x13\x32\x1c\x21\x89\x8d\x37\x22\x23\xd3\x6d\x47\xe9\x9f\xfe\
-\xf5\xd7\xd2\xa9\xd9\x1a\x7d\xac\xf9\x48\x4b\x49\x96\x4e\xd5\xdf\
-\x4d\xd9\xee\x87\x5e\x17\xa7\x87\x88\xb1\x87\x04\x5e\x07\xec\x37\
-\x16\xf0\x89\x93\xaa\xb2\x52\x19\x09\x02\xb6\x4e\xce\xb3\xe3\x83\
-\xba\x48\xdf\x6d\x6b\xd6\x8a\xd0\x66\xbb\xdf\x59\x63\x64\xc7\xe6\
-\x7f\xa4\x53\x8c\x82\xcd\xfd\xa1\x43\x87\xe4\x98\x08\x50\xd6\x7b\
-\x0f\x1e\x94\xf3\x60\x78\x32\x9d\x96\xe9\x7e\xe5\x9e\xff\xcd\x9f\
-\x5b\x26\x82\x4e\x30\x3e\xc8\xaf\xb6\x8e\x4e\x29\x03\xa9\x3b\x72\
-\x75\x88\xe0\xfd\x9e\xfd\x9e\x7b\xee\xe1\xbf\xb8\xdb\x33\xe1\x94\
-\x96\xce\x96\xa3\xcd\x3f\x61\xb8\x5c\x24\x84\xde\x1f\x03\x36\xf7\
-\x63\x59\x63\xa4\x28\x37\x13\xf8\x78\x6c\x22\x3f\x20\x0b\x54\x30\
-\x52\x6e\x7a\xd0\xa1\xa1\x93\x83\xc0\x92\xc6\x82\x4e\x76\x46\x86\
-\x18\x9c\xc3\xc8\xa8\x40\x10\xaf\xa3\x73\x47\x64\xbc\x5d\x43\x5d\
-\x7d\xfd\xd4\x37\x8d\xdd\x30\xb6\x46\xbf\x68\xd6\x2c\xfe\xcb\x7e\
-\xba\xa3\x0d\x98\x3e\x02\xdf\x77\x27\x81\xf4\x96\xcd\x2a\x30\x7e\
-\xb5\x1d\xa0\x53\x87\xee\x8e\xc1\xa4\x14\xfa\xf5\x6b\xaf\xd3\xff\
-\xf8\x9f\xff\x4c\xfb\x8f\x9f\x14\xf3\xbf\x5e\x79\x35\xaa\x4a\x03\
-\x1b\x63\xed\x14\xbf\xcf\xfc\x6a\x6a\x6d\xb7\x2e\x6c\x76\x3e\xbb\
-\x81\x32\x64\x41\x30\x3f\xcf\x18\x1f\x28\x4a\x84\x72\x4d\xd4\x11\
-\x11\x70\xe4\xe8\x10\x36\xf2\x05\x0d\xe2\xf1\x90\x96\x96\x6a\x0c\
-\x1f\x94\x97\x97\xcb\x31\x88\xed\xfe\x09\x5f\x63\xe4\x96\xaf\xa2\
-\x4c\x55\x54\x30\x52\x6e\x7a\x6e\x5b\xbe\x94\x2a\x4a\x8a\x68\xf9\
-\xfc\x79\xf4\xb7\x7f\xf1\x63\xfa\xd9\x4b\xcf\x53\x45\x29\xdb\x17\
-\x38\x76\x67\x27\x99\xfd\xd3\x0a\xd2\xd9\x41\x48\x12\xe1\x28\x49\
-\x94\xef\xd9\x1a\x7d\xd8\xb1\x7b\xc9\xef\x55\x77\x6f\x2f\x7d\xfa\
-\xd9\x67\x72\x1e\xbc\x1f\x23\x13\x39\xd9\x59\x7c\x06\x07\x96\xf0\
-\x5d\xd2\xb8\x43\x99\x95\x9f\xcf\x26\x8f\x66\x70\x47\x09\x83\x73\
-\x98\xc8\xb4\x8f\x8f\xfc\xac\x2c\xab\x50\x04\x3d\x46\xc7\xcf\x9e\
-\x17\x5d\x32\xfb\x0e\x1f\xa6\x86\xa6\x66\x59\x04\x2e\xdb\xa7\x39\
-\x1c\x18\xa4\xd5\x94\x3e\x30\x96\x35\x46\xb1\x60\x73\xef\xac\x31\
-\x4a\x10\x6e\xb9\xda\x16\x36\x97\x14\xe4\x73\x9e\x3a\x75\xa3\xfd\
-\x7a\x93\x5c\x0f\xc6\x87\x33\x8c\xbd\x80\x3f\x23\xa7\x32\xfb\xb9\
-\x5e\x6d\xb8\xcb\xbe\x1b\x11\x4a\x3f\x63\x29\x77\x50\x77\xf5\xaa\
-\x1c\x83\xe1\xc3\x5e\xdf\xd0\x28\xe7\x26\x4c\xf7\xc7\x83\xcd\xfd\
-\x58\xd7\x18\x29\xca\x54\x46\x05\x23\xe5\xa6\xe7\x74\x75\xb5\x1c\
-\x6d\x8d\x74\x2a\x74\xf2\x0c\x0e\x9f\xfa\xb2\x81\xae\xaf\xdd\xd5\
-\x90\x6a\xf3\xcf\x11\x1a\x86\xfb\x06\x2d\xd1\xd6\xf0\x59\x00\x89\
-\xa5\x7f\x5c\xbe\x78\x91\xec\x18\x2b\xcb\xcf\xa5\x25\xf3\xca\xe8\
-\x6f\x7e\xfc\xb2\x7c\x65\x1f\x76\xec\x86\x1b\x26\x1c\xf1\xf1\x51\
-\xdb\x9a\x18\xb6\x9f\x75\x35\x2d\x7b\xbb\xf2\xbc\x05\xdd\x11\x5d\
-\x32\x6c\xe6\xce\x9d\x17\xb9\x1f\x04\xe3\x6f\x63\xac\x9d\xe2\xf7\
-\xb2\xc6\xc8\x05\xe5\xf9\xf5\x37\x66\x0d\xcd\xce\x74\x5a\x26\x0b\
-\xa0\x69\x94\x96\x9a\x3a\xe2\xf7\xa5\xcb\x96\xd3\xa5\x2b\x57\x44\
-\x20\x32\x4d\xa3\x81\x3a\x16\x5a\x82\xf1\xf7\xec\x55\x0b\x17\xc6\
-\x54\xee\x20\x7c\x77\x5b\x8d\x93\x90\x80\x60\x66\xbb\xff\xa0\x3b\
-\x7d\x18\x2d\xdc\x71\x5f\x63\xa4\x28\x53\x94\xa8\x82\xd1\x77\xa7\
-\xaa\xc5\x28\xca\x44\x31\x30\x60\x5f\xb8\x0a\x3b\x76\x1b\x61\x8b\
-\xbd\x08\x15\x81\x51\x17\x13\xd8\xbd\x15\xe6\x1f\x3e\xf3\xe0\xf4\
-\x54\x0e\x38\x2b\x0e\x59\x23\x22\x5f\xab\xf7\x7a\x48\x5b\xf8\x7c\
-\xdd\xa6\x5c\x10\x60\x24\x26\xb8\xae\x09\x5b\xce\x4d\xf7\x23\x7e\
-\x9d\xdd\x8e\x50\xe4\x6c\xdf\x77\xd7\x53\xf9\x8d\xdb\xc9\xda\xc2\
-\x9b\x0a\x6b\x8c\x04\x4e\x27\x16\x61\xdb\xa6\xd3\x72\x32\x66\x50\
-\x6e\x66\x86\x31\x3e\xa7\xcf\x9e\x15\xf7\x98\x6e\x15\xa1\x24\x20\
-\x98\xc0\xb6\xfb\x9b\x6f\xe4\xdc\xe4\xbe\x6c\x76\x69\xf4\x72\x67\
-\x32\x67\xa4\x5b\x77\xb7\x61\x3a\x74\x68\x77\x1b\x0e\xc3\xe3\x10\
-\xbc\x1f\xf6\x14\x2e\xef\xa8\x70\x7c\xa0\xb5\xdb\xe4\x1e\xe8\x1a\
-\x23\x45\xb1\x13\xf5\x09\x1b\x0f\x75\xdb\x8a\x12\x0f\x5d\xee\x07\
-\x5f\x6d\x8d\xf4\x0f\x9f\x7f\x4e\x3a\x01\x4c\x99\x48\x47\x15\xd2\
-\x49\xe1\x5b\x59\xcf\x3d\xf9\x84\x9c\x9b\xfc\xc3\xc2\x65\x11\x2c\
-\xe4\x0a\xe3\x76\x54\x67\x2e\x5c\xb4\x86\xff\xec\x53\xdb\x65\x8a\
-\x2c\x6c\xd4\x6a\x56\x41\xbe\x55\xb9\xe0\x52\xee\xa4\x9a\x5b\x5a\
-\x86\xc5\xdb\xb4\x50\xd8\xb3\xa3\xd3\x92\x11\x0e\xe8\xcf\xc1\xd1\
-\x30\x0d\x04\xf7\x5d\x6d\xec\x27\x13\x74\xef\xd9\x6d\x4c\xa6\x35\
-\x46\x02\xa7\x7d\xd7\xfe\x03\xc6\xf0\x0a\x73\x73\xe9\xde\xbb\x36\
-\x44\xec\xc0\xfb\x7d\x1f\x0b\x69\x4e\xfe\xb1\x91\x2b\x23\x81\x9e\
-\xa9\x60\xfc\x3d\x7b\x63\xdd\x35\x19\x8d\x0a\x1d\xad\xe4\x32\xdd\
-\xb6\xf1\x41\x39\x35\xc5\x0f\x6b\x9c\x10\x7f\x11\x64\x03\x91\x08\
-\x9b\xbe\x5d\xb1\x64\xb1\x53\x5f\x3c\xe3\x87\xed\xeb\xd7\xdc\x46\
-\xd4\xe3\x7c\xe5\xde\x16\xff\x68\x98\xe2\x0b\x74\x8d\x91\x72\x33\
-\xf1\xe8\x7d\x77\x8b\x49\x24\x31\xbc\x7a\x28\xca\xc4\x02\x1d\x33\
-\xb6\x6f\x63\x79\xf6\xe2\xdc\x6c\x2a\x9b\x55\x48\x65\xc5\xc5\xdc\
-\x2f\x70\x47\xe5\x1a\x74\x12\x38\x62\x3d\x4f\x49\x5e\x2e\xfd\xc5\
-\x8b\xcf\x87\x0a\x1d\x73\xe7\xcf\x97\x6f\x71\x49\x27\xe5\x75\x54\
-\xdc\x69\x41\x39\x23\xde\xec\x6d\xe1\x97\x15\xe6\x4b\x18\x11\xe5\
-\x90\x3e\x83\x35\x44\x45\x59\x99\x46\xe5\x82\xb0\x43\x51\xa0\xe0\
-\xeb\x18\xc3\xa6\xa3\x9c\x35\x4d\x76\x10\x1e\xf4\x1c\x61\x9b\xbf\
-\xc9\x3d\x98\x12\x6b\x8c\x5c\x90\x6d\x27\xab\xcd\x42\x27\x84\x88\
-\xb9\x73\xe6\x8c\x88\x0f\xd6\x68\x0d\xfb\x04\x08\x4c\x10\xbe\x86\
-\x7b\xea\x1a\xed\xd3\x69\x7f\xf5\xf2\x0f\x24\xbf\x87\x95\xbb\x4b\
-\x32\x0b\xae\x50\xbc\x39\x77\xb6\xf9\x5b\x6b\x42\x64\x8d\x13\x84\
-\xb3\xe1\x71\x08\x9b\xbe\x65\x71\x4c\x84\x7c\xaf\x9e\x7b\x61\x97\
-\x95\x14\xd3\xe3\x9b\x37\x51\x6f\xbb\xf9\x03\xb4\x9e\x5d\xd7\x18\
-\x29\x53\x05\x7c\x2e\x09\x26\x91\x44\xfd\xba\xbe\xa2\x4c\x34\xe8\
-\x2e\x30\x75\xf4\xfc\x53\xe6\xaf\xa2\x7b\xf6\xc7\x1e\x7e\x58\xd6\
-\xf1\xa0\x53\x28\xc8\xce\xa4\x2d\xfc\xa6\xbe\x72\xe9\x62\x4a\xea\
-\xeb\xa1\xa2\xdc\x1c\x7a\xfc\x91\x87\x29\x25\x39\xd9\xea\x1e\xf6\
-\x4f\x3e\xff\x92\xda\x3a\x3a\xb8\xbf\x44\x87\x35\x34\x25\x05\xb2\
-\xb2\x73\x68\x71\xc5\x42\xa3\x7b\xec\x7a\x7b\xce\x1d\x39\x6a\x6b\
-\x6e\xa6\xd4\xd4\x64\x5a\x5a\x55\x45\xb7\xaf\x5e\x49\x83\xdd\x9d\
-\x94\x9a\x92\x6c\x0c\x0f\x5b\xea\xdf\xe3\x4e\x1a\x7a\x6e\xe4\x3b\
-\x6b\x6e\x27\x39\xc8\x9d\xdc\xa3\x5b\x1e\x92\xdd\x4f\xc1\xf0\xa0\
-\x22\x00\xca\x1e\xfb\x06\x6f\x50\x2f\x0b\x8d\x4e\xa7\xea\x8c\x12\
-\xdd\x73\xc7\x3a\x4a\x1d\xec\xb7\x86\x07\x60\x6f\x6a\x69\x95\x8e\
-\x37\x32\xed\xe6\x4b\x27\x34\x80\x9b\xbe\xca\x0f\xfb\x37\xfb\x0f\
-\x48\xdc\xfc\xd3\x75\x23\xe0\xdf\x8b\xf3\x73\x8d\xee\x5b\xda\xda\
-\x44\xf7\x90\xe3\x3e\xc4\x8f\x78\x60\x3f\x10\xa7\x95\xcb\x97\x51\
-\x51\x61\x81\x31\xbd\xc0\x6f\xaf\x6b\x6a\x1a\xf9\x25\x7d\x03\xb8\
-\x7a\xfa\xcc\x59\x9a\xc5\xf5\xc7\xe4\x1f\x04\xc5\xe6\x86\x7a\xf6\
-\x67\x9a\x08\x60\x28\x83\xa4\x1b\x83\x94\x97\x99\x41\x4f\x6e\xdb\
-\x22\x6a\x02\x6c\xf1\xc9\xc8\xc9\xa5\xef\xe4\x2b\xf9\xc9\xce\xae\
-\x49\xc4\xc1\x8d\x07\xfe\x2e\x5f\xb2\x84\x4a\x8b\x8b\x8c\xee\xbd\
-\xfa\x56\x51\x5e\x4e\x1d\xad\xcd\xf2\x15\xfd\x47\x58\x20\xba\x63\
-\xf5\x2a\x3a\xec\x4e\x57\x9a\xe2\x0b\x60\xef\xe6\x7a\x77\xbd\xb5\
-\xcd\x58\xfe\x00\xfe\x6d\x7e\xc8\x3c\xfd\xb7\x13\x6b\xba\xf8\xfe\
-\xd0\x3a\xa0\x28\xdf\x13\xb5\xf5\x0d\x62\x12\x89\x0a\x46\xca\xcd\
-\x0f\x37\xbe\x98\xe2\xea\xe9\xed\xa1\x0b\x67\xc3\x34\x08\x0f\xd9\
-\x31\x52\x90\x31\x73\x26\xed\xfd\xf6\x5b\x4a\x62\xf7\xd1\xee\x87\
-\x1d\x1f\x68\x0d\xeb\xa8\x9a\xf0\xf9\x8e\xda\x2b\xf2\x21\x54\x9b\
-\x7f\x87\xbf\x3b\x24\x6b\x98\xb6\x3f\xf6\x98\x74\x8a\xe8\xa4\xc2\
-\xc2\x7f\xfd\xad\x3f\x70\x07\xd5\x3e\xd4\x41\xb3\x01\x08\x2f\x8b\
-\x3b\xd7\x53\x27\x8e\x8b\x3d\xe8\x7e\xeb\x96\x2d\xb4\x76\xd5\x4a\
-\x99\xce\x29\xc8\xce\x92\x4e\x71\xc3\xba\x35\x74\xf6\xd4\xa9\x98\
-\xd2\x9b\x94\x9a\x46\xd7\x5b\xdc\xef\xad\xf9\xd2\x09\xc6\xda\x29\
-\x22\xfc\x17\x9e\x36\x0b\xb1\x5f\x7e\xfd\x35\x35\x72\x3e\x3a\xee\
-\xed\x7e\xc4\x0b\x7c\x69\x6d\x6f\xa7\xeb\x9c\x1f\x20\x2c\xfd\xa8\
-\x4b\x57\x9b\x9a\x65\x34\x28\x58\xce\x23\xe0\xeb\x7d\xfd\xfd\xb4\
-\xa8\xb2\xca\x2a\xa4\x00\x08\xe5\x95\xf3\xcb\x45\x03\x79\x5e\x56\
-\xa6\x08\xe1\xa8\x7f\xb6\xfb\x6f\x5b\xb3\x86\xfe\xf4\xd1\x27\x8e\
-\x90\xe9\xad\x11\x0b\xc4\xa1\x89\xcb\xa7\xad\xd1\x69\xf0\x6d\xe9\
-\x41\xfd\x4e\x67\x61\x6c\xeb\xe6\xcd\x23\xc2\x83\xd0\xed\xe8\xd9\
-\x1a\xe9\xbe\xa2\xb2\x92\x4e\xb2\xc0\x67\x2a\x7f\xb0\x6d\xd3\x46\
-\x6b\xfc\x6b\xb1\x8b\x8e\xef\x0f\xab\x03\x8a\x32\x99\x89\x3a\x95\
-\x36\x1e\xea\xb6\x15\x25\x5e\xd0\x00\x43\x41\xe3\xb5\xa6\xeb\xd6\
-\x4e\x62\x2c\xf6\x23\xc7\x8f\xd3\x57\xbb\x76\x73\x63\xef\x08\x28\
-\xd2\x51\xf8\x1b\x7d\xd7\x7e\xe6\xca\x55\x5a\xc8\x9d\x24\x18\x6b\
-\xf8\x6f\xbe\xed\x7c\x35\x5f\xc2\xf3\xc2\xf4\xf1\xf5\x37\x7b\xe5\
-\x18\xe6\x5f\x16\x77\x5e\xe8\x84\xf1\x19\x90\xdd\xbb\x76\xc9\x75\
-\xef\x77\x4c\x17\x01\x9b\x7b\x1b\x93\x6e\x8d\x11\xe0\xbc\xab\xe7\
-\xbc\x0c\x9b\xee\xf4\xec\x98\x2e\xc5\x67\x5c\x22\x02\x41\x20\xdf\
-\x83\xe0\xbe\x2f\x76\xef\xa1\xb7\xde\x79\x57\xec\xd1\xfc\x8f\x66\
-\x87\x50\xf4\xf6\xfb\x7f\xf6\x8d\xd8\xb1\x91\x5f\x7c\x70\x98\xad\
-\x6d\xed\xf2\x15\xfb\xd1\x84\x07\xa1\xe8\xdf\xdf\x78\x33\x62\x07\
-\xc1\xfb\xa3\x61\xf3\x5f\xd7\x18\x29\x53\x9d\xa8\x82\xd1\x78\xa8\
-\xdb\x56\x94\xb8\x91\x0e\x2c\x89\x6a\xea\x1b\xe9\xf3\x9d\xbb\x42\
-\x3b\x05\x10\xab\x1d\x1f\x10\xfd\xf4\xab\xaf\xe9\xe3\xcf\xbf\xa4\
-\x41\xb6\x7b\x6f\xc1\xa6\x37\x61\xef\xfa\x1b\x7f\x7c\x3f\xaa\xf2\
-\xc4\x68\xf6\xd7\xde\x7c\xcb\xf9\xca\x3e\x9f\x1b\xc3\xe4\xf3\x81\
-\x1b\x83\x54\xd7\xea\x28\xe9\x8b\xc7\x7f\x74\x8a\xaf\xfc\xf6\x35\
-\x3a\x5b\x73\xd9\x7a\xff\x54\x5a\x63\x14\x81\xf3\x6c\x30\xc5\xfe\
-\x19\x0f\x00\xfb\xd1\x13\x27\x91\xe9\x18\xda\x12\x37\x51\xc1\x3d\
-\x5c\x46\xe7\xaf\xd5\x51\xea\xcc\x0c\xb9\x14\xe6\x3f\xb0\xd9\x17\
-\x54\x56\xd2\x6b\x6f\xbf\x23\xba\xb4\x3c\x21\x5c\xca\xdd\x10\x0f\
-\x5c\xbf\xcc\xc2\x5e\x98\xca\x00\x93\x5d\xca\xff\xb5\xd7\xa9\xa1\
-\xc5\xbe\x70\x5c\xd7\x18\x29\x8a\x9d\xa8\x53\x69\xa7\x2f\x5e\x12\
-\xa3\x28\x13\x8d\xd7\x81\xd4\x72\x07\x85\x91\x96\xe2\x92\x62\x9a\
-\xcd\x42\xbb\x6d\xba\x20\xcc\x8e\xe9\x94\x59\x25\xa5\x22\x10\x9d\
-\x39\x7f\x81\xfd\xe5\x0e\x2a\x4a\x47\x05\xe4\x2a\xff\x06\x8d\xd3\
-\xfd\x83\x37\x28\x39\x39\x99\x8e\xbb\x9d\x4c\x2c\xe1\xe3\x83\xa5\
-\xaf\xbe\xfe\x7b\x6a\xc4\x2e\x34\xf6\x27\x2c\x4c\xd8\x30\x3d\x74\
-\xf0\xf0\x61\xd1\xfc\xfd\xd0\xa6\x4d\x72\x3d\x9a\xff\xbf\x7b\xf3\
-\x0f\xd4\xcc\xee\x32\x32\x32\x68\xdd\xea\x55\xc6\xfb\x9b\x5a\xb1\
-\xc6\xa8\xdf\x18\x76\xf4\x35\x46\x7c\xbb\xe7\xce\x44\xc8\x1a\x23\
-\x8c\xd4\x1c\x3b\x75\xda\x75\x1f\xe2\xc7\x28\x90\xfc\x6a\x6b\xa7\
-\xce\x96\xeb\x62\x37\x85\x0f\xa1\xe1\xe3\xcf\xd9\xce\x42\x51\xd4\
-\x69\x34\x1f\x72\x07\xdf\x57\x53\x5b\x4b\x07\xbf\x3b\x2c\xee\x1e\
-\xd9\xb6\x4d\x7e\x33\xe5\x2f\xf0\xdb\xb1\xa0\x3f\x29\x75\x3a\x7d\
-\xb5\x7b\x0f\x75\x76\xf5\xc8\xd4\x69\x12\xb6\xdd\x87\xe5\x01\x5f\
-\xef\xe7\x7a\x0a\x41\x0e\xd3\x65\xdb\xb6\x6e\x91\xcb\xb6\xf0\x20\
-\xe4\x9f\x38\x5d\x4d\xaf\xfd\xe1\x1d\xea\x42\x78\x9c\xbe\xbb\xef\
-\xb8\xdd\x78\x7f\x77\x4f\xef\x18\xd7\x18\xb1\xbb\xb0\x3a\xa0\x28\
-\xdf\x13\xc5\x05\xf9\x94\x39\x73\x06\x75\x74\x75\xb9\x57\xc6\xce\
-\xb4\x9c\xb2\xf2\xa1\x6d\x14\x8a\x32\x09\x70\x76\xe0\x0c\xf2\x7f\
-\x98\x1b\xa2\xa7\x66\xc9\xe2\x45\x34\x6f\xce\x6c\x3a\x7e\xec\xb8\
-\xe8\x79\xc1\x1a\x23\x80\x46\x1d\x42\xd0\x8a\x95\xab\xa8\xa5\xad\
-\x95\xbe\xdd\xbb\x4f\xbe\x8d\xd5\x2b\x6b\x96\x7a\xa5\x61\x47\x07\
-\x8d\x11\x01\xe7\x7c\x64\x27\x31\x02\x0e\x5f\xfe\x41\x42\x90\x45\
-\xd3\xd3\x68\xf5\xf2\x65\xb2\xf0\xfa\xfc\xb9\xb3\x94\x96\x9a\x46\
-\x0f\xdc\x7f\x9f\x2c\x70\xdd\xb9\x73\x17\x0b\x20\xbd\x34\xab\xa8\
-\x98\xaa\xcf\x9f\x17\x2d\xc7\xe8\x50\x9c\x8e\xc5\x09\x3b\x2c\x4c\
-\x7f\x5a\x2b\xca\xe7\x51\x7f\x77\x37\x65\xb1\xc0\xb3\x75\xcb\xe6\
-\xc8\x1a\x12\xec\xda\x9b\x55\x52\x22\x1d\x68\x7d\x23\xd6\x7f\x38\
-\x7e\xa7\x4f\x4f\xa7\x59\xb9\xd9\x12\xdf\x8a\x8a\x85\x38\xc8\x57\
-\xde\x11\xd4\x8d\xe4\x14\xba\x7c\xf5\x1a\xdf\xe7\x4e\x1d\x7a\xf0\
-\x4d\xb3\xb8\x53\x44\x7e\xe2\xfc\x4c\x75\xb5\x6c\x45\xaf\xa8\xa8\
-\x10\x77\x5f\xed\xfe\x86\x06\xf9\x44\xdc\x59\xe2\x8c\x0f\xb6\x62\
-\x11\x38\xe2\x2e\xee\x25\x7c\x76\xcf\xbf\x1d\xe3\x38\xd6\x5d\x6f\
-\x76\x94\x51\x4a\x3e\x98\xfd\x18\x2d\xc8\xa7\xaa\xb2\xd9\x32\xbd\
-\x08\x82\x9d\xfa\x9b\x6f\xbf\x43\xe7\x2e\xd7\x52\x52\x0a\xc2\x0f\
-\xa4\x3d\x06\xa4\x3c\x50\xef\xb8\x4c\xa0\x34\x32\x27\x63\xa6\x4c\
-\x67\x6e\x64\xff\xb1\xf6\xcc\x13\xd2\xd7\xdd\x7e\xbb\x2c\x34\xff\
-\x7a\xc7\x4e\x11\x40\x30\x32\x28\xf5\x4d\xea\x19\xca\xc7\x49\xbb\
-\x2d\x0f\x23\x70\x78\x08\x13\xe9\xc2\x8e\x33\x1a\xe8\xa7\x99\xe9\
-\xd3\xe9\xbe\x7b\xef\x93\x9f\x77\xee\xdc\x19\xa9\x5f\x58\xd4\x0e\
-\xc1\x50\xea\x95\xeb\x7f\x29\x77\x1a\xd8\x0d\x59\xb1\x10\xe5\xcf\
-\xe5\x81\xf2\x67\x77\xd9\x79\x79\x74\x94\x05\x54\x6f\x6d\xdb\xb0\
-\x72\xe0\xfb\xd6\x70\x7d\xce\xe4\xb4\xa1\xfc\x60\x5f\xc8\xe5\x07\
-\xce\x9e\x3d\x43\x57\xea\x1b\xa3\xd6\x01\x45\xf9\xbe\xf0\xb6\xea\
-\x27\xf2\x7b\x69\x2a\x18\x29\x93\x13\xb7\xc3\xf0\x8e\xde\x39\xff\
-\x71\xce\xe5\x1e\xe7\x20\x44\xda\x6f\xb7\x33\x42\xc3\x6e\x3a\xc6\
-\x81\x3f\x7c\x11\x5e\xfc\xf6\x00\x23\xc3\x72\x3b\x46\xe7\x47\xb9\
-\xc7\x8a\xeb\xa7\xf3\xe9\x13\x5f\x58\x01\x1c\xbf\x1d\x41\x4b\xbe\
-\x16\x0f\xdf\xc5\xed\x50\xdc\x1c\xdc\x78\xa0\x93\x86\x09\x84\xef\
-\x08\x9c\x70\x03\xa5\x99\x72\x45\xae\x23\x9e\x8e\xdf\x4e\xe7\x0e\
-\xbb\x11\x09\x13\xf1\x1d\x08\x84\xcb\x88\x1f\xbe\x70\x6d\x7e\x8c\
-\x12\x2c\xfc\xfe\x9b\x1f\xfd\xc0\xaa\x92\xe1\xc4\xd9\xf3\xd4\xce\
-\xc2\x25\x3e\x2a\x6c\x4a\x7b\x2c\x78\x69\x72\x8e\x43\x79\x2b\xc7\
-\x11\x20\xbd\x38\x38\x61\x49\x78\x10\x5c\x50\x36\xb1\x86\xed\xfa\
-\x2d\xfe\xbb\x75\xc0\x09\x6b\x28\x3c\x2f\x2f\x9d\xa3\x97\xb7\xfc\
-\x03\xa2\x16\x29\x4b\xef\x7e\xe7\xb7\x48\x39\xb0\x09\x32\xe6\x3a\
-\xa0\x28\xdf\x13\x2a\x18\x29\x4a\x10\x74\x12\xee\x11\x8d\xb7\xd3\
-\xf6\xf3\x1f\x5b\xad\x96\x3e\x41\x7a\x85\xe1\xe7\xa3\x25\x96\xf0\
-\xc5\x7b\x74\x28\xae\x05\x1d\x8b\x9c\xc6\x11\xae\x2f\x1c\xe9\x14\
-\x9d\x80\x86\x80\xb7\xae\xdf\x11\xff\x19\xcf\xcd\xc8\xfb\x7d\xf7\
-\x05\xe3\xe1\x85\x11\x4c\x07\xf0\xdc\x05\xdd\x04\xf1\xfc\x18\x11\
-\xae\xf3\xc7\xeb\xc8\x13\x0a\x87\x05\xc5\x86\x77\xad\x5b\x63\x14\
-\x8a\x30\x62\x03\x2d\xfe\xd0\x16\x8e\xcf\xa8\x8c\x35\x0e\x43\xe9\
-\xb3\x94\x3b\x40\x10\xf2\xc7\x31\x12\xda\x68\xc2\xe4\x00\x9c\x20\
-\x10\x06\xce\xdd\x80\x70\x70\x3c\x75\xbd\x0d\x84\x83\x7b\x25\x72\
-\x70\x87\x8b\x2e\x11\x37\xce\xfd\x23\xb0\xb9\x03\xae\x9b\xa8\x75\
-\x40\x51\xbe\x07\xc6\x43\x30\x1a\xf9\xaa\xa0\x28\x93\x09\xb7\x81\
-\xf6\xde\x60\x65\xdd\x08\x86\xf8\xe5\x53\x19\x23\x8d\x5f\x6f\x4d\
-\x42\xde\x78\x63\x09\x9f\xed\xce\x7a\x16\xfc\xe6\x84\x0d\x77\x71\
-\xe1\x85\xc3\x46\xfc\xf2\xfb\xef\x86\x31\x94\x2e\xd7\x7f\xf7\x5c\
-\x8c\xc4\xcb\x67\xdc\xeb\xb8\x67\x04\xde\xfd\x5e\x7c\x4d\xee\xa2\
-\xe1\xde\x37\xd2\xbd\x73\xc4\xef\x09\x01\x9d\x37\x1b\x4c\xdf\xad\
-\x59\xb1\x8c\xd6\xae\x5c\x6e\x14\x8a\x40\x46\x76\x8e\x1b\x2f\x84\
-\xcf\x17\xc6\x18\x87\x48\xfa\x6c\xe5\x6e\x2b\x97\xd1\xe0\xba\xf7\
-\xf2\xd1\xa9\xc7\x43\x61\x58\xeb\x97\xe7\x26\x58\x96\xd1\xca\xc1\
-\xe6\x4e\xae\xb9\x69\x51\x94\x29\x4a\x54\xc1\x68\x3c\xd4\x6d\x2b\
-\xca\xb8\x80\xc6\xda\x6d\xb4\x6d\x86\xff\x0c\x99\x44\xe3\xfa\x1b\
-\x1a\xee\x58\x71\xfd\x89\x2b\x0c\xff\x6f\x7e\x13\x0d\x93\x1b\x98\
-\x58\x31\xb9\x85\x49\x00\xcb\xaa\x2a\xe9\xb9\x47\xb7\x51\xe5\x9c\
-\x52\x5a\x32\x6f\x0e\xfd\xa7\x1f\xfd\x80\x1e\xd8\xb0\x7e\x84\xca\
-\x02\x4f\x28\xc2\xc2\xe4\xa3\x27\x4f\x72\xf0\x4e\x1c\xf0\x2f\x61\
-\x78\x7e\x5a\x0c\xff\x49\x58\xba\x05\xd7\xbf\xb8\xc2\xf0\xdf\x13\
-\xed\x5e\x3f\x26\x77\x30\x8a\x32\x85\x89\x2a\x18\x8d\x87\xba\x6d\
-\x45\x51\x94\xb1\x80\x05\xe8\x67\x4e\x9d\x12\x65\x9a\x0f\x6f\xdd\
-\x1a\xfa\x99\x17\xd8\x0f\x1f\x3f\xe1\x2c\x4c\xc6\x08\x88\x76\xee\
-\x8a\xa2\x84\x10\x55\x30\xda\x77\xec\x84\x18\x45\x51\x94\x9b\x85\
-\x0b\x17\xce\xcb\xd1\x24\x04\x01\xbf\xbd\xa5\xb5\x95\x1c\xe5\x9d\
-\xdc\xdc\xc1\xa8\x50\xa4\x28\x4a\x08\x51\x05\x23\x45\x51\x94\x9b\
-\x0a\x59\x14\x1c\x9b\x50\x04\x95\x06\xd0\x1b\x35\xc0\x6e\x74\x7d\
-\x8c\xa2\x28\xb1\xa0\x82\x91\xa2\x28\x93\x8e\xf2\xf2\x72\x39\x86\
-\x09\x45\x50\x76\xf9\x8b\x5f\xff\x46\x94\x1d\xfa\x17\x41\x2b\x8a\
-\xa2\x84\xa1\xdb\xf5\x15\x45\x99\x5c\xdc\xb8\x21\x8b\xaf\x07\xba\
-\xa1\xe9\xf6\x86\xf3\x6d\x37\x6e\xc5\x76\xee\xde\x45\x03\x03\x83\
-\x54\x52\x5a\xea\x2a\xd3\xc4\x67\x37\xa6\x39\x02\x91\x4c\xa1\xa9\
-\x60\xa4\x28\x53\x8d\x09\xd1\x63\x04\x75\xdb\x40\x17\x60\x2b\x8a\
-\x72\xb3\x20\x4a\x2b\x3d\x25\x84\xd0\x40\x1e\x51\xb6\x83\xa9\x32\
-\x1c\x86\x76\x6b\xe9\x82\x6b\x45\x99\xba\x4c\x88\x1e\xa3\x75\xcb\
-\x96\x88\x51\x14\x45\xb9\x59\x60\x71\x47\x04\x1e\xf9\xe6\x58\x0a\
-\x4c\xca\x90\x49\x86\x71\xf5\xfc\xc0\xa8\x50\xa4\x28\x4a\x1c\xe8\
-\x1a\x23\x45\x51\x26\x1f\x18\x09\x72\xa7\xc8\x22\xca\x0e\x21\x24\
-\xb9\xd7\x22\x8a\x09\x55\x28\x52\x14\x25\x4e\x54\x30\x52\x14\x65\
-\xf2\xe2\x0a\x3e\x10\x80\x22\x42\x90\x67\x14\x45\x99\xf2\x60\x0a\
-\x2d\x91\xd3\x68\x40\x05\x23\x45\x51\x14\x45\x51\x14\x17\x15\x8c\
-\x14\x45\x51\x14\x45\x51\x5c\x54\x30\x52\x14\x45\x51\x14\x45\x71\
-\x51\xc1\x48\x51\x14\x45\x51\x14\xc5\x45\x05\x23\x45\x51\x14\x45\
-\x51\x26\x25\xd0\x63\xe4\xe9\x32\x4a\x14\x2a\x18\x29\x8a\xa2\x28\
-\x8a\x32\x29\x81\xf2\xe9\x44\x2b\xa0\x56\xc1\x48\x51\x14\x45\x51\
-\x94\x49\xc9\xbe\x63\x27\xc4\x24\x12\x15\x8c\x14\x45\x51\x14\x45\
-\x51\x5c\x54\x30\x52\x14\x45\x51\x14\x45\x71\x51\xc1\x48\x51\x14\
-\x45\x51\x14\xc5\x25\xea\xd7\xf5\x15\x45\x51\x14\x45\x51\x6e\x46\
-\x8a\x0b\xf2\xe5\x98\xc8\x05\xd8\x3a\x62\xa4\x28\x8a\xa2\x28\xca\
-\xa4\x64\xdd\xb2\x25\x62\x12\x89\x8e\x18\x29\x8a\xa2\x28\x8a\x32\
-\x29\x29\x2b\x2e\x92\x63\xcd\xb5\x3a\x39\x26\x02\x15\x8c\x14\x45\
-\x51\x14\x45\x51\x5c\x74\x2a\xed\x56\xe5\x06\xcb\xc3\x61\x46\x51\
-\x14\x33\xa6\xe7\xc5\x6f\x14\x45\x99\xd4\x44\x1d\x31\xf2\x54\x6d\
-\xbf\xff\xd5\x4e\x39\x2a\x93\x14\x6e\xb0\xa7\xa7\xa5\x51\x59\x69\
-\x09\xb5\xb6\x34\x53\x5a\x4a\x2a\xad\xb9\x6d\xb5\xfc\x74\xf4\xe8\
-\x51\x39\x56\x56\x55\x51\x6b\x5b\x1b\x1d\x39\x7e\x92\xda\xbb\xba\
-\xb8\x76\x4c\xa3\x69\xf8\x81\x8f\xca\xe8\xa8\x28\x9f\x47\x0d\xf5\
-\xf5\x72\x5e\x58\x58\x28\xc7\x86\x86\x06\xea\xed\xef\xa7\xce\x9e\
-\x5e\xce\x5a\xcd\xdb\xc9\x40\x32\x97\xd3\xfc\xb9\x65\x54\x98\x9f\
-\x4f\x35\x97\x2e\xd1\x8c\xe9\x69\xb4\x7a\xb5\xf3\xfc\xec\x3f\x70\
-\x80\x06\x06\x07\xa9\x74\xf6\x6c\xaa\xa9\xbd\xc6\xa6\x56\x9f\x9d\
-\x04\xa1\xcf\x8f\x32\x11\x44\x15\x8c\xbc\x45\x4d\x89\xd6\x2c\xa9\
-\x7c\x3f\x24\x27\x4d\xa3\x9c\x8c\x0c\x7a\xe4\xa1\x8d\x94\x9d\x95\
-\x45\xbb\x77\xed\x92\xeb\x0f\x3c\xf0\x80\x1c\xbf\xf8\xe2\x0b\x39\
-\x9a\xec\x47\x4f\x9e\xa2\x9d\xdf\xee\x65\x21\xa9\xdb\x69\x80\xb4\
-\x11\x8a\x0b\x08\xa2\xcb\xe6\xcd\x91\xf3\x60\xfe\x2e\xac\x5a\x44\
-\xbf\xff\xe3\xfb\x44\x49\x49\xda\xb8\xdf\xa4\x4c\x4f\x4b\xa5\x8c\
-\xe9\xd3\xa9\x28\x37\x9b\x36\x3e\xf8\xa0\x94\x67\xd8\xf3\x02\x3c\
-\xfb\x9c\xf2\x72\x3a\x73\xe1\x12\x1d\x3b\x75\x5a\x85\xa4\x51\xa2\
-\xcf\x8f\x32\x51\x44\x9d\x4a\x1b\x0f\x75\xdb\xca\xf7\x43\x66\xfa\
-\x74\x5a\xc2\x6f\xb9\x3f\x79\xe1\x39\x9a\x55\x50\x10\x97\x50\x04\
-\x1a\xae\xd6\xd2\xa2\xb9\x73\xe8\x89\xcd\x9b\x28\x2b\x63\x26\xdd\
-\xe0\xb7\x62\x9d\x2a\x88\x9d\xfe\xfe\x3e\x39\x1a\xf3\x97\xf3\x71\
-\x50\xf2\x53\xf3\xf4\x66\xa4\xac\xa4\x98\x2a\x4b\x4b\xa8\xbc\x78\
-\x16\x3d\xbc\x75\x6b\x5c\x42\x11\xec\x95\xf3\xe7\x53\x3a\x0d\xd2\
-\x92\x79\x65\xb4\xac\xb2\x82\x8b\xf8\x86\x18\x25\x76\xf4\xf9\x51\
-\x62\x61\xd5\xa2\x4a\x31\x89\x44\xd7\x18\x4d\x51\x66\xe5\x64\xd3\
-\xc2\xd9\x25\xb4\x65\xf3\x43\x62\x8f\xa7\x51\x07\xc3\x1a\xf9\x05\
-\xf3\x69\x41\x71\x91\x08\x5a\xd2\xb8\xc7\xd3\x10\x79\xf7\xfb\xcd\
-\xad\x02\x27\xd5\x96\xbf\x87\x0e\x1d\xe4\xdf\x07\x6f\xa9\xec\x88\
-\x8b\x60\x9d\xf9\x9e\x32\x0a\xa3\x44\x5b\xee\xbb\x87\x66\x65\xce\
-\xa4\xb4\xd4\x94\x98\x9e\x0f\x60\xb3\x3f\xb2\x6d\x2b\x6d\x7b\xf0\
-\x7e\x9a\x53\x98\x2f\x2f\x16\x37\xb4\x23\x8f\x1d\xce\x26\x5b\xfe\
-\xea\xf3\xa3\x78\x60\x57\x9a\xb7\x33\x2d\x51\xa8\x60\x34\x05\xc9\
-\xc9\x98\x49\xa5\x05\x79\xb4\x69\xe3\x46\xb1\x8f\xb6\x51\xf7\xdb\
-\x93\x93\x93\x64\xe4\xa9\x30\x2f\x37\xa6\xc6\x7d\x5e\x51\x21\x3d\
-\xfe\xd0\x46\x7a\x7c\xf3\x26\x5a\x50\x5a\x2c\x06\xe7\x30\x4e\x07\
-\x31\xf5\x5b\xb4\x94\x94\x14\x39\x9a\xf2\x13\xa9\x77\xb2\xe0\x86\
-\x9c\x2b\x0e\x10\x4a\x16\x94\x14\x0d\xab\x2f\x5e\xfd\x19\xef\x7a\
-\x03\xa1\x08\xa3\xa3\x0d\xb5\x57\xc4\x3e\x96\xe7\x05\xf8\xed\xc5\
-\xf9\x79\xf4\xa3\x67\x9e\xa2\x1b\x03\x6e\x1a\x6e\x81\xfa\x3f\x56\
-\xf4\xf9\x51\x26\x0a\x15\x8c\xa6\x18\xc9\x49\x49\x54\x9a\x9f\x1b\
-\xb3\x50\xf4\xe9\xa7\x9f\xca\x31\xac\x51\x07\xb0\x4f\x9f\x3e\x9d\
-\x8a\x73\xb3\x87\x3a\x28\x5b\xe3\xce\xd7\x37\x3f\xf8\x20\x55\xce\
-\x2f\xa7\xcb\x17\xce\x53\x6e\x66\x06\x6d\x7f\xec\xd1\x88\x3d\x32\
-\x25\x67\x73\x3f\x85\xb0\xe5\xa7\xb3\x70\x57\x9b\xf4\x61\x70\x7d\
-\xb8\x72\xf1\xe2\x88\xfa\xe2\xd9\xc7\xb3\xde\x40\x28\x7a\xee\xd1\
-\x87\xe9\xcc\xa9\x53\x62\x8f\xe5\x79\x00\xf1\xd8\x8b\x0a\x0b\x64\
-\x6a\x3a\xea\xf3\xa3\x44\xb0\xe5\xa7\x3e\x3f\xca\x78\x12\x55\x30\
-\x82\xba\x6d\x4f\xe5\xb6\x72\xf3\x93\x39\x23\x5d\xd6\x44\x00\x53\
-\xa3\x32\x30\x30\x40\x19\x39\xb9\xf4\xeb\xdf\xbd\x4e\xff\xe3\x9f\
-\x7e\x41\xfb\x8f\x9f\xa4\x6f\x8f\x1c\xa3\xff\xfe\x8f\xff\x44\xbf\
-\x7c\xe5\x55\x6a\xeb\xe8\x08\x6d\xe4\xa7\xa7\xa6\xd2\xb2\x45\x55\
-\xdc\xa6\x73\xe3\x2e\x57\xed\x98\xdc\x83\x1b\x83\x03\x31\xb9\x9f\
-\xec\xf4\xf7\xf7\xcb\xd1\x96\x9f\x8a\x19\x5b\x7e\x8d\x67\xbd\xd9\
-\x72\xdf\xbd\x74\xec\xc8\x11\x39\xb7\x85\x0f\x7b\x6b\x7b\x87\x3c\
-\x3f\x9f\x7d\xbd\x83\x7e\xf9\x9b\x57\xe8\xf4\x85\x4b\xd4\xd9\x3f\
-\x40\x7b\x0f\x1e\x8a\xe9\x25\x03\x6b\xf5\xd6\xae\x58\x7e\x4b\xd4\
-\xff\xb1\xa2\xcf\x8f\x32\x51\x44\x15\x8c\xc6\x43\xdd\xb6\x32\x7e\
-\xdc\xb9\x76\x8d\x1c\x4d\x8d\x32\x84\xa2\xd6\xae\x1e\xfa\x6c\xc7\
-\x4e\xaa\x6f\x6a\xa2\xc1\x69\xd3\x28\x29\x39\x85\x92\x52\x1c\xd3\
-\xda\xd1\x45\x27\x2f\xd4\xc8\x4e\x34\x93\x7b\x00\x7b\x45\x79\x39\
-\x77\x52\xdc\xac\x5b\xde\x7a\x71\x65\xcf\x9e\xdd\x72\x6e\x72\xef\
-\xbc\x2d\x8b\x75\xca\x63\x4a\x3f\x38\x74\xe8\x90\x1c\x95\x21\x50\
-\x25\xd6\xaf\xbf\x53\xce\x4d\xf5\x6f\xbc\xea\xcd\xb2\xaa\x4a\x19\
-\x99\x02\xb6\xf2\xfa\xe0\xcf\x1f\xd2\xf1\xb3\xe7\xe8\xc4\xb9\xf3\
-\xf4\xf9\xce\x5d\xb4\xef\xbb\x23\xd4\xd2\xd1\x49\x2d\x9d\x9d\x74\
-\xec\x74\x35\x7d\xb1\x6b\x0f\x1d\x38\x79\x9a\x06\x53\x52\xe5\x7e\
-\x53\xfc\x01\xec\x0f\xde\x73\x17\xa5\x25\x27\x13\x79\x23\x60\x8a\
-\x15\x5b\x79\xe8\xf3\xa3\x8c\x27\x51\x05\xa3\xef\x4e\x55\x8b\x51\
-\x26\x01\xdc\xc8\x66\x67\x66\x5a\x1b\xe5\xb9\xe5\xf3\xe9\xf4\xb9\
-\x73\x94\x94\x94\xe4\x08\x44\xdc\x38\x4f\x0b\x18\x5c\xdb\xbd\xff\
-\x00\xb5\x71\xa3\x6f\x6b\x94\x2e\x9d\x3f\xc7\x61\x45\x6f\xd4\x6d\
-\xee\x87\x3a\xb7\xa9\xdd\x29\x84\xad\x91\x50\xec\x58\xf3\x6b\x1c\
-\xea\x0d\xa6\xd0\xa6\xf5\xf6\xc8\xb9\xad\xbe\xbe\xf7\xa7\xf7\xe9\
-\x38\x3f\x37\xed\x9d\xdd\x91\xe7\x26\x29\x05\xcf\x8a\x7b\xee\x1a\
-\x3c\x3f\x07\x8e\x1c\xa5\x7f\xf8\xe5\xbf\xca\x4b\x88\xcd\x3f\xd8\
-\x0b\xb2\xb3\xf9\xf1\x71\xa7\xd4\x14\x23\xfa\xfc\x28\x13\x45\x54\
-\xc1\x08\xdf\x1f\x49\xe4\x37\x48\x94\xf1\xe5\xc4\xb1\x63\x72\x34\
-\x35\xca\x2d\x6d\x6d\x34\x6d\x5a\x12\x4d\x83\xee\x0f\xd1\xff\xe1\
-\x3b\xfa\xaf\x27\x25\x53\x7e\x91\xb3\xca\xdf\xd4\x28\x25\x73\x07\
-\x80\xed\xcb\x58\xf6\x38\xac\x59\x97\x37\x7a\xc7\xac\x5f\xbf\x5e\
-\x2e\x99\x1b\x35\xb8\xc2\x7d\xb8\x75\xc8\x8d\x15\xff\x3d\x7e\x13\
-\x0f\x26\xf7\x30\xa3\x85\xdd\x62\x5a\x11\x6f\xfe\x48\x83\x29\x1d\
-\x38\x33\xa7\xdf\x5b\x23\x31\x06\xdc\xf0\xa1\x78\x10\xc6\x8b\x43\
-\x4c\xf9\x19\x0b\x7e\x7f\xa2\xf9\xc7\xbf\x21\x2e\x30\xa3\x8a\x83\
-\xef\xfe\x3d\x7b\xf6\xc8\x25\x53\xfd\xe5\x1b\x1c\x23\xb7\x0e\xb9\
-\x19\x0b\xd0\x53\x14\xb6\xfb\x0c\x23\x45\xa7\x2f\x5e\x24\x0c\x90\
-\x46\x5e\x20\xf8\xf9\x70\x4c\xf0\xd9\x71\xae\xf7\x0d\x0e\xd2\xe5\
-\xa6\x66\x71\x6f\x2b\xff\x67\x9e\x7c\x3c\x74\xd4\x35\x14\xd7\x8d\
-\xbf\xfc\xfd\x79\x3f\xe6\xbc\xf1\xbb\x0f\xf3\xc7\xfd\x0d\xe1\x5b\
-\xef\xb1\xc1\xf7\x23\xce\x13\xf6\xfc\x28\x4a\x08\xc9\xe9\xd9\xb9\
-\x7f\xef\x9e\x2b\x53\x80\x82\xec\x4c\xda\xfc\x90\x79\x8b\xfe\xa1\
-\x83\x87\xa8\xbe\xb9\xd9\xd7\xa8\x1b\x14\xa3\xf1\x35\x5c\x6d\x6d\
-\x6f\xa7\xc3\x47\x8e\xd0\xf5\xd6\x36\x4a\x9f\x99\x41\xd5\xfc\xc6\
-\xfc\xf5\xae\x5d\xd4\x0c\x7b\x46\x26\xd5\xd6\xd5\x47\xfc\x80\x79\
-\xe2\xa1\x8d\xd4\xd7\xd5\x49\x79\x59\x99\x74\xef\x86\xf5\x94\x9f\
-\x9b\x4b\x3b\x76\x7c\x2d\x5e\x06\x1b\xb5\x3b\xd6\xad\xa3\x25\x95\
-\x15\xd4\xdf\x3d\x74\x7f\x0a\x37\x90\x75\x8d\x8d\xc3\x14\xe1\xa5\
-\xf1\x1b\x63\x79\x51\x21\xdd\xc3\xbf\x2f\x5a\xb8\x60\x98\xff\x79\
-\x39\xd9\x54\x73\xa5\x36\xaa\xe2\x3c\xac\xb9\xda\xfa\xc0\x7d\x23\
-\xdc\xc3\x0e\x8d\xba\x9d\x3d\x3d\x31\x2b\xdf\x83\xb2\xcc\x62\x4e\
-\xd7\xf6\x87\xb7\xd0\xbd\x77\xde\x4e\x3d\x6d\xad\x54\x94\x97\x43\
-\x2f\x3d\xf3\x14\xdd\xb5\x76\x0d\x5d\xab\xad\xa5\xbe\xfe\x7e\xea\
-\xed\x73\xf4\xaf\x60\x54\xad\x24\x3f\x6f\x44\xfa\x61\x87\x90\x0a\
-\x05\x9a\x43\x9d\x6b\x6c\xe1\x17\x66\x67\xd3\xa3\x0f\x3d\x48\x1b\
-\x38\xbc\x81\xae\x0e\x2a\xce\xcf\xa5\x17\x9e\xde\x2e\xe1\xf7\x72\
-\x7c\xa0\x91\x79\xd5\xf2\x65\xd4\xd4\xd2\x42\x3d\x71\xa4\xcd\x03\
-\xbb\x09\xef\x33\xe4\x77\xc6\x8c\x19\x54\xcb\x2f\x48\x9e\x7f\x18\
-\x69\x99\xc5\x71\x29\x9b\x95\x4f\xcf\x6f\x7f\x52\xe2\xd3\xd9\x7c\
-\x5d\x76\x43\x3e\xba\xe5\x21\xca\xca\xcc\xa0\x2b\xd7\xae\xc9\xc8\
-\x49\x58\x1c\x16\x96\x14\x45\xca\xb7\xbf\xbb\x8b\xd2\x59\xe0\xde\
-\xb8\xf1\x41\xf9\x2d\x58\x7f\xeb\xd8\xbf\x7c\x0e\xf3\xde\xbb\xd6\
-\xd3\xe2\x85\x0b\x25\x7e\x49\xec\x6f\x3c\x65\x18\x04\xdb\xe8\xb7\
-\x6e\xde\x2c\xe7\xc1\xf0\x60\xaf\xbe\x74\x89\x7a\xfa\xfa\x29\x89\
-\x9f\x99\xa4\x64\x08\x3f\xae\x41\x58\x01\xe3\x3d\x0b\x38\xef\xec\
-\xec\xa2\xda\xcb\x35\x34\x33\x3d\xdd\x58\xfe\x18\x0d\xd9\x77\xe8\
-\x10\x0d\x40\x10\x88\xa1\xfc\x91\xdf\x33\x58\x90\xc8\xcf\xca\xe2\
-\xfa\xb7\x35\x52\xff\xbc\xf2\xbf\x63\xf5\x2a\x29\x7f\x3c\xff\xeb\
-\x6f\xbf\x5d\x9e\x8f\xba\x86\x86\xa8\xf9\xef\x07\x65\x9f\xef\x7b\
-\x3e\xbc\xf2\x5f\x50\x5e\x3e\x54\xf6\x0c\xb4\xe7\xaf\x5f\x73\x1b\
-\xa5\xdd\x18\xa0\xd9\x85\x05\xf4\xf4\xe3\x8f\xd2\xb7\xdc\xb6\x70\
-\x20\xa1\xe9\x98\xe8\xe7\x47\x99\x9a\x54\x95\xcf\x95\xe3\xe9\x8b\
-\x97\xe4\x98\x08\x74\x57\xda\x14\x63\x1d\x0b\x1d\xc0\xd4\xc8\xcf\
-\x64\x21\x61\xdd\xaa\x55\x43\x6f\x66\xbe\xb7\xb3\x61\x70\x23\x83\
-\x45\xa6\x4d\xad\xed\xd4\x84\x06\xe8\xf4\x69\x36\xd5\xd4\xd8\xd6\
-\x2e\xe6\xe8\xa9\xea\x48\xe7\x80\xe6\x08\x8d\x76\x4d\x60\xf7\xd9\
-\xee\xdd\x76\x65\x92\x55\xdc\xe8\x5e\xbe\x78\x81\xef\xcf\x8c\xdc\
-\xdf\xd8\x50\x2f\x6f\xd0\xf8\xe7\x81\x1d\x76\x4f\x1a\x76\x27\xc1\
-\x5e\xc7\x8d\x68\x2c\xdb\xb7\xe7\x95\x95\x19\xdd\xc3\x9e\x9a\xc2\
-\x6f\xab\x81\x30\x6d\x40\x2f\xd4\xf2\xf9\xf3\xa4\x11\xb7\x29\xcb\
-\x84\xff\x7f\xfd\xa3\x1f\xd2\xd6\xfb\xef\x95\xb8\x21\x7f\x4d\xe9\
-\x07\xf1\xac\x91\x40\xfe\xa2\x03\x47\xf8\x2f\x3f\xf7\x0c\x77\x4c\
-\xa5\x74\x60\xff\x3e\xf9\x2d\xe8\x3f\xd2\xb7\x76\xe5\x0a\xaa\x2c\
-\x2d\xa6\xaa\xb2\xd9\xf1\x29\xe6\xe4\x7b\x1e\xdb\xb6\xd5\x98\x5f\
-\xcd\x8d\x0d\x91\xfc\x5e\xc3\x82\xd7\x62\xf6\x1b\x42\x90\x49\xf9\
-\x21\x34\xac\xb7\x35\x35\xd2\x8a\x05\xe5\xf4\xc0\xfa\x3b\xad\xe5\
-\x84\x8e\x32\x58\xbe\x9b\x36\xd9\x77\x53\xe6\x65\xb3\x50\xf0\xf8\
-\x63\x7c\xff\xfc\xc8\xfd\x95\x15\x0b\x63\x2e\xc3\x20\x33\x38\x5f\
-\x1f\x7f\xe4\x61\x39\x37\x85\x77\xbd\xb5\x95\xda\x59\xc0\xf1\x84\
-\xa1\x58\x04\x18\x20\xf7\xf0\xfd\xcd\xed\xf6\xe9\x68\xd8\x21\xf8\
-\x3b\xe5\x12\x1e\x77\x28\x9b\x5c\x50\x3c\x4b\xca\x33\xac\xfe\x81\
-\x2d\x2c\xe4\x21\x3f\x7b\xdb\xdb\x24\xff\x51\x17\x31\x22\x16\xb5\
-\x0e\xf0\x6f\xc1\xe7\xc3\xb3\xcf\xe1\xf0\xe1\x1e\x42\x28\xd4\x27\
-\x3c\xf7\xd8\x23\xa2\xd2\x60\xc6\xf4\xe9\xce\xee\x57\x76\x3b\x38\
-\xc0\xfe\x87\x84\x31\x91\xcf\x8f\xa2\xc4\x8b\x0a\x46\x53\x8c\x4b\
-\x57\x6a\x8d\x8d\x30\x80\x7d\xe3\xbd\x77\x53\x05\x37\xb0\xe8\x14\
-\x86\x0d\x61\x07\xf0\x1a\x77\x8c\x2e\x39\x6b\x29\xbc\xf5\x14\xee\
-\xda\x24\xfc\x86\x7b\xd8\xf4\xf3\x1b\x35\xb0\x35\x62\x31\xd9\xd1\
-\xb9\x49\x63\xc8\x17\xdc\xf8\x64\x72\x43\x09\x4c\xf7\x3b\x71\x77\
-\x1b\x62\x43\xfc\x87\xb8\x61\x0d\xbf\x7c\xee\xbc\x11\x61\x06\x41\
-\xa7\x8f\x37\xe9\xb2\x59\x05\x31\xab\x40\x80\xc6\xf0\xa5\xfc\x16\
-\x03\xc1\x0e\xd8\xee\x8f\x85\x59\xf9\xf9\xa2\x81\xb9\x28\x37\x27\
-\x6e\xbd\x54\xe8\xf4\xff\xea\x07\x2f\x4a\xa7\x84\x74\x9a\x84\x13\
-\x13\x26\xff\xe0\x16\x1d\x2c\xf4\xfc\x50\x4f\x97\xa4\x2d\x5a\xf8\
-\xb0\xaf\x5d\xb5\x42\x14\x8d\x7a\x3b\xca\xfc\xa4\x70\x5d\x02\x61\
-\xee\x41\xa8\xdd\x50\x6f\x62\x65\x49\x55\x95\x1c\x6d\xfe\x13\xe2\
-\xc7\xf5\x1b\x23\x12\x2c\x15\x38\xf5\x3d\x46\x70\x67\x37\x3f\x17\
-\x18\xd5\x78\xf3\x9d\x77\xa9\xe1\x7a\x33\x15\x14\x15\xd3\x91\xe3\
-\x27\xe8\xcd\xb7\xdf\x11\x7b\x5e\x5e\x9e\x73\x67\x48\xb4\xef\x5f\
-\x7f\x87\x28\x9b\x84\x10\x32\x9a\xfc\x59\xbe\x78\x91\x68\xbf\xf7\
-\x9e\xf7\xb0\x3c\xba\xe7\x9e\x7b\xe4\x18\xf4\xef\xc8\x91\x23\x48\
-\x3e\xbd\xf4\xd4\x13\x22\x34\x05\x7f\xdf\xb1\x63\x47\xa4\x7e\x05\
-\x7d\x9f\xe8\xe7\x47\x51\x46\x43\xd4\xa9\x34\xa8\xda\xc6\x76\xfd\
-\x6b\x8d\x4d\xee\x15\xe5\x66\xa6\xa1\xb1\x91\x0a\xb8\x23\xb4\x35\
-\x3a\xb0\xa7\x4f\x4f\xa3\xe7\xb6\x3f\x49\x65\xa5\xc5\x74\xbd\xa1\
-\x91\x7a\xfa\xfb\x64\xc8\x1d\x48\xd3\xef\x76\x00\xe8\x08\xc4\xf8\
-\xcf\x3d\x83\x46\x8b\x8f\x00\x6f\x92\x18\xce\x07\xb6\x46\x2c\x9a\
-\x3d\xaf\xb0\x50\x3e\xbe\xe9\xf9\x0f\xbf\x31\x7d\x73\xbd\xee\x9a\
-\xfc\x1e\xbc\xbf\xa2\xb2\x8a\x4e\x56\x9f\x71\x84\x37\xf7\x7e\x13\
-\x03\xbd\xbd\xf2\x26\x6a\x0a\xff\xe2\xe5\xcb\x23\xc2\x0c\x52\x92\
-\x97\x23\x82\x45\xb4\xf8\x07\xed\x98\xce\xc4\x47\x47\xf7\x7e\xfb\
-\xad\xd8\x83\xbf\x2f\x59\xb6\x2c\xea\x54\x00\x84\xa2\xd2\xdc\x2c\
-\x19\xd9\x8a\x37\x7c\xbf\x3d\x87\xd3\x9f\xc7\x7e\x61\xaa\x12\x69\
-\x34\x85\x05\xd0\xa9\x61\xa4\x01\xe5\x19\xf4\x6f\xed\xda\xb5\x32\
-\x52\x75\xe5\xd2\x45\xb1\xc7\x13\x3e\xea\xdb\xcc\x8c\x4c\x6a\x6a\
-\x6e\x19\x16\x3e\xa6\x4f\x31\xfd\x06\xe2\xf1\x0f\x78\xf6\xaf\x76\
-\xee\x94\x0f\x1e\x87\x95\xa1\x8d\xdb\x59\x68\x3b\xec\x8e\x3c\x04\
-\xfd\xdf\xb0\x61\x83\x6c\xc9\x87\x28\x27\x53\x68\x10\x8e\xe2\xf0\
-\x1b\xf7\xf6\xf3\x33\x75\xe6\xfc\x05\x6a\x6e\x6b\x17\x73\xe6\xfc\
-\x79\xc7\xde\xce\xf6\xf6\x0e\x19\x95\xf5\x46\xa3\x4c\x65\x82\x91\
-\x39\x4c\x8f\x81\xd1\xe6\x0f\xec\x49\x2c\xd5\x6c\xd9\xb4\x91\xf6\
-\x7f\x77\xd8\xc9\x7f\xfc\x10\x08\x0f\x65\x8f\xe9\xb8\x1d\x5f\x8f\
-\x9c\xfe\xee\xee\xe9\xa1\xdb\xb9\xfc\x17\xcc\x9b\x6b\xf4\x1f\x02\
-\x51\x2d\xb7\x23\xa6\xb4\x4c\xe4\xf3\xa3\xdc\x1a\x4c\xc8\x54\xda\
-\x78\xa8\xdb\x56\xc6\x09\x6e\x1c\xf0\xc1\xd7\xa5\xcb\x57\x88\x35\
-\x5a\x23\x74\xf6\xf4\x69\x2a\x2d\xcc\xa7\xff\xf2\x17\x3f\x91\xe1\
-\xf1\xd2\xbc\x5c\xca\xc0\x67\x3f\xbc\xd1\x05\xef\xed\x12\x8d\x4e\
-\xd0\xf8\x88\xb6\x7b\x24\x56\x7b\x90\x76\xee\x40\x80\xf9\xfe\xe0\
-\xbb\xa9\x1d\x5b\x78\x17\x2e\x5c\x08\xf5\x06\x1a\xc4\x31\x52\x63\
-\x73\x1f\xcd\x7e\xfc\xe8\x51\x39\xda\x7e\x0f\x03\xd3\x67\x45\x59\
-\x19\xa1\x23\x33\x1f\x7d\xfc\xb1\x4c\xf7\xcc\x9e\x3b\x57\x84\xbc\
-\xb0\xf8\x6c\xdb\xf8\x80\x7c\xd2\x05\xd3\x1d\x52\xb6\x21\x98\xdc\
-\x17\xb1\xe0\x3a\x1a\xa1\x08\xc0\x8e\x2d\xea\xce\xc8\xce\x50\xbd\
-\x8a\xa6\xa7\x26\x56\xfb\xa8\xe0\x38\x9c\xab\x76\x76\xdb\x9a\xfc\
-\xbf\xd6\xd0\x40\x3d\x2c\x54\x3b\x1d\xee\xc8\x3a\x1f\x0b\xe2\x16\
-\x1d\xb7\x8c\xb4\x26\xf3\x31\x25\x62\x22\x3b\xd9\x30\x12\xe5\xde\
-\xef\x27\x9b\x85\x59\xac\x21\x03\xa6\xf8\x61\xfd\xd8\xdb\xef\xbd\
-\x47\x57\x59\x20\x49\x49\x9f\x21\x7a\x94\x3e\xfa\xf8\x93\xc8\xef\
-\xc0\x7f\x7f\x4e\x56\x16\xe5\x67\x67\x39\xcf\xb6\x5c\x1d\x09\x46\
-\x7e\x40\xd0\xfd\x23\x5b\xb7\xd2\x8a\x25\x8b\x87\xf9\x07\x3c\xbb\
-\x37\xd2\x14\x64\x22\x9f\x1f\x45\x19\x0b\x51\x47\x8c\xc6\x43\x1a\
-\x53\xc6\x97\x0b\x97\x2e\xc9\x1a\x0f\x10\x6b\x23\x74\x70\xff\x7e\
-\xca\x9a\x39\x83\x9e\x79\xf2\x09\x5a\xbb\x72\x39\xd5\x72\x47\xdb\
-\xdd\xd3\x6b\x1c\x49\x0a\x82\x37\xff\xf3\xd8\xce\xcc\x6f\xee\x25\
-\xa5\xb3\xe9\xca\xd5\xab\x74\xfa\xe4\x49\xf9\xcd\x14\x1e\x1a\xf1\
-\xaf\x76\xf0\x9b\x7e\x67\x17\x15\xf3\xfd\xb5\x57\xaf\xd1\x91\x63\
-\xc7\x65\xea\x21\xf2\xc6\xc9\x26\x95\xfd\x7d\x96\xe3\x03\x82\xf1\
-\xfd\x8a\xdf\x6c\xb1\x30\xdc\x7f\xbf\x89\x05\xf3\xe6\x51\x85\x61\
-\xf8\x1f\x76\xa8\x24\x88\xac\x21\x09\xfa\xc1\x1d\x27\x3e\x4d\x61\
-\x5b\xc8\x0e\x3b\xde\xf8\x3b\x39\xce\x5f\xee\xda\x4d\x3b\xf6\x7c\
-\x4b\x6d\x9d\x9d\xb4\xa8\x6a\x11\x15\xcd\x2a\x34\xde\x0f\x3c\xfb\
-\x97\x1c\xff\xc6\xe6\x16\xeb\x1b\x6f\x09\x0b\xa9\xd9\xdc\xb1\x98\
-\xdc\xd7\xd5\x37\xd0\xaf\x7e\xfb\x5b\xd9\x2d\x8a\x3c\x38\x79\xe6\
-\xac\xbc\x3d\x5f\xe1\xeb\x8b\x17\x2d\xa2\xd9\x25\xc5\xc6\xf0\xb1\
-\xde\xa8\xae\xf1\xba\x84\x25\xa1\x19\xf2\xec\xd9\x27\x1e\x93\xf2\
-\x8c\x16\x7f\xec\xd6\x6a\x6c\x69\xa1\x99\x99\xd9\x52\xde\xfb\x0f\
-\xec\x0f\x9d\xee\xd9\xb3\x7b\x37\x35\x34\x37\xd3\x00\xa6\xd3\xdc\
-\xf4\x62\x64\xaa\xb2\xb2\x42\x16\x69\x7f\x2d\xf5\xa1\x93\x1e\x7b\
-\xe4\x11\xb9\xdf\x14\x3e\x84\x00\xd4\x97\x2b\x5c\x5f\x50\x7f\x3a\
-\xb8\xec\x66\x60\x24\xaa\xa5\x35\x6a\x3d\x30\x51\x94\x9b\x4d\x9b\
-\x36\x6d\x92\xf3\x60\x78\x9f\x7c\xfa\x99\x8c\xec\x84\x6e\x54\x88\
-\x01\x2f\xaf\xe5\x68\x34\xe6\x91\xa8\xec\x19\x33\xec\x23\x9d\x35\
-\x97\xe9\xdf\xde\xf8\x3d\xd5\x5f\x6f\xa6\x56\xae\xc3\x97\x39\xff\
-\x2f\xd4\xd4\xd0\x35\x2e\xdb\x55\xfc\xec\x42\x88\x35\xe5\x1f\x24\
-\xa2\x26\x16\xa4\x25\x5c\xc4\x2a\x10\x6e\x49\x7e\x2e\x6d\x7c\x70\
-\xe4\xc2\x77\xbc\xf8\x04\xfd\x83\x32\x4b\xb4\x0f\x8b\x96\x2e\xa1\
-\x26\x8e\xc7\xc9\xea\xb3\x2c\xf0\xf9\xea\xf2\x04\x3f\x3f\xca\xad\
-\x03\x5e\x22\x3a\xb8\xef\xa9\xe5\xf6\x2f\x51\x4c\xcb\x29\x2b\x0f\
-\x7d\x7d\x7c\xf4\xbe\xbb\xe5\xf8\xfe\x57\x3b\xe5\xa8\xdc\xe4\x70\
-\x83\x84\x11\x81\xf4\xd4\x14\xfa\xd9\x0f\x5e\x94\xcf\x78\x44\x6b\
-\x64\xc2\xec\x58\xb3\xf4\xe9\x57\x5f\xc9\x42\x6c\x34\xa4\xd2\xfc\
-\x04\x1b\x21\x37\x4c\x67\x1d\x89\x33\x22\xb0\xb2\xaa\xc2\xba\xdb\
-\xe7\xff\xfa\x87\x7f\x94\x06\x8d\xff\xb8\x5e\xf1\x1f\xf8\x8d\xb7\
-\x67\xb7\xa1\x03\xb3\xf2\xf3\xe8\xe5\xa7\xb7\x1b\xe3\x87\x91\x92\
-\x33\x35\x57\x9c\xb7\x6f\xf1\xcb\xdc\x30\xe2\xcb\xe6\xd3\x65\x42\
-\x64\x64\xfa\x52\x66\xcc\xa4\xdd\xfb\x0e\x44\xd6\x4c\xf9\xfd\xc0\
-\xdb\xee\x5f\xbe\xf4\x82\x9c\x9b\xc2\x47\x27\x5d\xd7\x74\x9d\x7a\
-\xfa\xfa\xd8\x99\x13\x7f\x49\x07\xf7\x3e\x33\xd2\xd2\x68\x79\xc5\
-\x82\x11\xe1\xf9\xed\xad\x1d\x1d\x74\xf2\xfc\x45\x51\xac\x29\x9d\
-\xaf\x2f\xec\xb4\x94\x64\xf9\x2a\xbb\x69\x4d\x06\x84\xa2\x57\xb9\
-\x53\x1c\xe4\x3c\x76\x3a\x6d\x37\x5c\x27\x68\xc9\xff\xd9\x85\xf9\
-\x34\x9b\x3b\x17\x53\xf8\x7f\xfe\xf4\x73\x51\x48\x28\xdb\xce\x03\
-\x79\x06\xb7\x7f\xfb\x93\x97\xad\x0b\x7b\x61\xc7\x48\xc5\xbf\xbf\
-\xf1\xa6\x08\x39\x5e\xa7\xee\x79\x53\x36\xbb\x94\x5e\xdc\xfe\xa4\
-\x31\xbd\x60\x30\x39\x95\x0e\x1c\x3d\xea\xc6\x9b\xdd\x72\x78\xc1\
-\x7a\xf3\xf3\x1f\xfd\x50\x84\x74\x10\x74\xff\xcd\x77\x47\x1c\x77\
-\x51\xea\x4d\x2c\x20\xbc\xbf\xfb\xf9\x5f\xca\xb9\x29\xbe\x28\xdf\
-\x1a\xec\xbc\x8c\x52\xbf\xc6\x0b\x08\x15\x58\xf8\x0c\xfc\xf1\x43\
-\xfe\xff\xe3\xbf\xfc\xab\xd4\xe8\x48\x9a\x23\x71\xe3\x3c\x1c\xbc\
-\x41\x2b\x2a\x17\xc8\x56\xf8\x60\xfe\x61\x7a\xf0\x1f\xfe\xe5\x57\
-\xa2\x83\x29\x58\xe7\xbc\xb2\x0f\x2e\xa4\x07\x7e\xf7\xa7\xcf\x9e\
-\xa3\x2f\x58\x28\xc5\xce\xb1\x01\x8c\x00\x22\xff\xc5\x70\x5c\x7c\
-\x53\x8e\x13\xf9\xfc\x28\xca\x58\x89\xbd\x25\x51\x26\x07\xd2\x48\
-\x4d\x93\xd1\x97\x5f\xfe\xfb\x6b\xb2\xf0\x13\x84\x35\x32\xc0\x66\
-\x3f\x7b\xfa\x14\xcd\x2f\x29\x16\x01\x65\x96\x7c\x40\xd6\xe9\xc0\
-\x86\xe1\x86\x89\x06\x0a\xdb\x9a\xd1\xe9\x6e\x08\xd3\x63\x84\x06\
-\x1d\xf7\xa2\x73\x1e\x36\xad\xc0\xd7\xa5\x71\x1c\xc2\x16\xbf\xe5\
-\xcb\x97\xcb\x31\x1a\x57\xf9\x6d\x1a\xd8\xd2\x67\x23\x4c\x83\x38\
-\xa6\x58\xae\xb9\x8d\xba\x93\x5e\xa4\x61\x28\x1d\xc8\xfb\x6b\x2d\
-\x6d\x91\xfb\x41\x30\xfc\x30\x3d\x2c\x39\x19\x19\xd6\x85\xaa\x6f\
-\xfd\xf1\x8f\x8e\x50\x24\x79\x87\x3c\x1b\x7e\x44\xf8\xb5\x8d\xd7\
-\xe9\xb6\xb5\x6b\xe5\xfe\xa0\xfb\xee\x8e\xf6\xa1\x32\x0c\x96\x23\
-\x63\x9b\x4e\x81\xbd\x85\x85\xd1\x5f\xfc\xea\x37\x32\x52\x24\xe9\
-\x85\x92\x43\x74\xb2\x7c\x0e\x73\xf9\x6a\x5d\x68\x7d\x4b\xf3\x16\
-\x00\x03\x1c\x0d\xf5\xe6\x9b\x30\x3d\x46\x71\xd4\x9b\x68\x40\x2d\
-\x00\x08\xe6\x8f\x67\x2f\x2a\x2e\x96\xe3\x84\x74\xb7\x9c\x37\x77\
-\x6f\x30\x3f\x3f\x1f\x7c\xf4\x91\x2b\x14\x27\xb9\x79\x86\xa3\x63\
-\xbc\x3a\xd0\xd2\xd6\x6e\xcc\x3f\xbc\x24\x61\x27\x20\xe4\x27\x1b\
-\xb6\xfc\xb8\x6d\xcd\x1a\xfa\xdd\x1f\xde\x61\xc1\xfa\x33\xea\xea\
-\xed\x73\xb4\xe6\xb3\x50\x82\x7a\xe0\x94\x7f\x32\x67\xd6\x90\x90\
-\x36\x91\xcf\x8f\xa2\x8c\x15\x15\x8c\xa6\x22\x6e\x87\xd3\xdb\xdf\
-\x4f\x17\xb8\xb3\xba\x58\xd7\x40\x47\x4e\x9c\xb0\x36\x32\xb1\xd8\
-\xf1\x01\xcc\xb9\x85\xf9\x94\x9f\x95\x31\xb4\x06\xc9\x8f\x1b\xa6\
-\xff\xcd\xdd\xe6\x1f\x9a\xce\xc8\x5b\xbe\x67\xc4\xfd\x50\xc3\x0a\
-\xc2\xd7\x18\xc5\x8e\xcd\xbd\xac\x31\x32\xc1\x69\x9b\x5b\x5a\x6a\
-\x8d\x3f\xd6\x74\xe0\x8d\xd9\xeb\xcc\x23\xf1\x77\xd3\x8e\x6b\x35\
-\x57\xaf\xd1\xeb\x7f\x78\x5b\xee\x8f\x37\xfe\xeb\x6f\x37\xab\x5c\
-\xc0\xf4\x15\xa6\xff\x9c\x3c\xf3\x85\x1b\x34\x7c\xfd\xcc\xb9\x0b\
-\xc6\xf8\x63\x7a\x8e\x0b\x70\x64\xf9\xf9\x30\xc5\x17\x23\x15\xaf\
-\xbe\xfe\x86\xd4\x29\x49\xb3\xa4\xdb\x31\x43\x1d\x73\x92\x7c\x26\
-\xc3\xe4\x1e\x5c\xbe\x74\xc9\xe9\x94\xfd\x61\xfb\xe2\xec\xd5\x1b\
-\x9b\xfb\x58\xeb\x4d\xac\x98\xf2\x07\x78\x76\x27\xc4\x89\xe1\xd8\
-\xa9\x6a\xa9\x3f\xd8\xf4\x92\x99\x93\x2b\xd3\xcf\xaf\xbf\xf9\x96\
-\x2c\xe2\xf6\xd2\xce\x99\x3e\x94\x76\x37\x1f\x71\xac\xa8\xac\x14\
-\x3f\x4c\xe9\xc3\x48\x92\x14\x82\xa1\xfc\x6d\x42\x31\x46\x8a\xde\
-\x7e\xff\x03\xaa\x87\x9e\x31\x2e\xf7\x21\x81\xd4\xa9\x07\x52\xf6\
-\x5e\xf8\x60\x82\x9f\x1f\x45\x19\x2b\x4e\x4b\xa4\x4c\x3d\xdc\x86\
-\x0a\x8d\x0d\xd6\x22\x7c\xf4\xf9\x57\xf4\xdd\xe9\x33\xf2\x2d\x27\
-\x28\x7e\xb3\x35\x5a\xd1\xec\x3f\x7d\xe9\x45\x5a\x88\x75\x67\x16\
-\xe1\xc8\x33\xe1\x1a\x8c\xdd\x06\x54\x6e\x1d\x72\x63\xc2\x16\x9f\
-\xa3\xee\xc2\xcc\x68\x94\x94\x94\xc8\xd1\x96\x1e\x1b\x36\x3d\x41\
-\xb0\x43\xd9\xa5\xc4\x9b\xf3\x16\xf1\x8e\xa4\x01\xb8\x76\xe4\x3b\
-\x46\x6e\x6c\xf1\xb7\xea\x61\x41\xa7\x32\xdb\xde\xa9\xa4\xa7\xa7\
-\xf3\x9b\x7f\x3a\xa5\x24\x27\xc9\xdb\x7f\x5a\x5a\xda\x30\x0d\xc8\
-\x62\x67\x73\xd8\xa2\x01\x1d\x6b\x6a\xa0\x47\x06\xe1\x8c\xec\x1a\
-\xed\x5b\xb6\xbf\xf8\xf2\x4b\xea\xec\xee\x71\x3a\x43\x31\xdc\x81\
-\x49\x47\xe6\xa6\x1d\x69\x66\x93\x95\x9d\xed\xdc\x6f\x88\xbf\x13\
-\x9e\x21\x54\x9f\x1f\xe1\x1a\xd3\xbd\x3c\xc6\xad\x43\x6e\x46\x43\
-\xb4\x85\xdf\x35\x35\x35\x72\x9c\x10\x38\x4d\xfb\x8f\x1c\xa5\x9a\
-\xfa\x06\xba\xc4\x2f\x35\x9f\xef\xda\x43\x5f\xec\xda\xcd\xe7\xf5\
-\xd4\x28\xeb\xea\x38\xff\x5d\x21\x52\x04\x1c\xd7\x44\x46\x02\x19\
-\x73\xfe\x41\x05\x46\xa6\xb1\x08\x3c\x4c\xf9\x81\x5d\x69\x75\x0d\
-\xd8\x75\xe6\x96\xbd\xb7\x96\x28\x50\xfe\x7e\x26\xec\xf9\x51\x94\
-\x04\xa0\x82\xd1\x54\xc6\x6d\x60\xc4\xf0\x5b\x58\xdf\xe0\x0d\xf9\
-\x96\xd3\x2b\x6f\xbc\x45\x47\xcf\x9c\x93\x35\x1f\x97\xa2\xec\x66\
-\x02\x41\x7b\x56\x6a\x0a\xa5\x72\xe3\x88\x91\x07\xaf\x21\x36\x61\
-\x73\xef\x80\x86\x70\x78\x63\x1a\x44\x1a\x71\xc6\x16\x9f\x58\xb1\
-\xb9\x2f\x2f\x2f\x97\x63\x10\x68\x8f\x06\xa6\xf8\x63\x3a\xa9\x95\
-\xdf\xda\x39\x53\x9d\x06\x5c\x7e\x19\x09\xae\xa7\xca\xdb\x79\x7c\
-\xf1\xcf\xce\xca\xb4\xae\xf1\x79\xe4\xe1\x6d\xf4\x5f\x7f\xfe\x33\
-\x5a\x59\x31\x9f\x56\x57\x2e\xa4\xff\xf6\xb3\xbf\x90\x75\x21\xcb\
-\xca\xcb\x68\x15\x5f\xfb\xaf\x3f\xfb\xa9\xd8\x97\xcf\x9f\x4b\xf3\
-\x4b\x8b\x8d\xf1\x07\xbd\x3d\xdd\x4e\xb9\x59\xca\xce\x16\x5f\x49\
-\xaf\xcf\x8c\xc0\xbd\x6e\x73\x5f\x51\x51\x21\xc7\x90\x7e\x59\xb0\
-\xb9\x77\x88\x5e\x6f\x62\xa1\x9f\x05\x7b\x5b\xfe\xc0\x8e\xcf\xde\
-\x44\x8f\xe9\xf8\xe1\xe4\x71\x12\x89\xaa\x00\x8c\xaa\xb8\xa6\x78\
-\xd6\x2c\xca\xe5\x3a\x22\xbb\xbd\xd6\xdf\x29\x0a\x17\x2b\xe7\x94\
-\xd2\x92\x79\x73\xe8\xaf\x5e\x7c\x8e\xfe\xea\xa5\xe7\xa9\xb9\xbe\
-\x5e\xfc\xb0\xa5\xcf\x96\x2a\x9b\x50\x8c\x97\x1c\x7f\xb9\xe3\x1f\
-\x9f\xc8\x6f\x26\x26\xf2\xf9\x51\x6e\x3d\xa0\x4e\x08\x26\x91\xa8\
-\x60\x74\x0b\x10\x69\xd0\x44\x48\x1a\x9a\xc7\x87\x90\xf4\xfa\xbb\
-\x7f\xa2\x6f\x8f\x9e\xa0\xae\x81\x41\x67\x61\xa5\xa5\x11\xf2\xdb\
-\xd1\x69\x2c\x5f\xb2\x98\xe5\x22\xf7\x2d\xd5\x40\xf8\x9b\x7f\xec\
-\xd8\xdc\x8f\xe7\x1a\xa3\xb0\x2d\xf2\x3b\x77\x42\x68\x41\x7e\xe2\
-\x10\xd2\x41\xb8\xbf\xd9\xe2\x6f\x5b\x23\xd1\xd7\xdb\x2b\x47\x5b\
-\xf8\x89\xb0\xcb\x77\xb5\xbc\xee\x31\x50\x7e\xb6\xe9\x14\xa7\x3c\
-\xdd\xf4\xda\xd2\xcc\x34\x37\x3b\xdf\x08\xb3\x85\x1f\x8d\xf0\x91\
-\xc6\xc4\xd2\xda\xd6\x66\xcc\x1f\x70\xc7\x3a\x67\x8d\xd6\x84\x89\
-\x46\x9c\xc7\x78\x66\x93\x93\x53\x64\xfa\xf3\xc9\xad\x5b\x44\xad\
-\x06\xa6\xb3\x2b\x58\x10\x7a\xf9\xf9\x67\x65\xf7\x28\x34\x54\x63\
-\x37\x29\x34\x90\x43\xe3\xf8\x81\xfd\xfb\xd9\x8d\xbd\xfe\x7a\xd3\
-\xd3\x36\x6c\xf9\x31\xac\xec\x43\xca\x1f\x4c\xe4\xf3\xa3\xdc\x7a\
-\xac\x5b\xb6\x44\x4c\x22\x51\xc1\xe8\x56\x81\x1b\x99\x21\xe1\x68\
-\xe8\x2d\x54\xd6\x0b\xa4\x24\xcb\x4e\xa5\x77\x3f\xfa\x58\xa6\xdb\
-\x0a\xdc\x85\xa7\xb6\x46\x09\xf6\xb5\x2b\x57\x72\x9f\xea\x8e\x18\
-\xc5\x39\xf2\x10\x2b\x13\xb5\xc6\x28\x37\x37\x57\x8e\xa6\xf8\xf7\
-\x0f\x0e\x70\x5e\xc2\x66\x69\xd0\x7d\x0c\x44\x99\xae\x31\x11\xab\
-\x46\x69\x30\x5a\x7b\x59\x59\x99\x1c\x6d\xdd\xbe\xcd\x7d\x0c\x49\
-\x16\x6c\xee\xcf\x9c\x39\x23\xc7\x68\x58\xc3\x4f\x20\x48\xca\x97\
-\x5f\xdb\x17\x9a\xcf\x9b\x33\xc7\xad\xd6\xe6\x29\xc7\x58\xc1\x67\
-\x3f\xb0\x9d\x38\x3b\x23\x43\x3e\x98\x0a\x83\x73\x98\x68\x1f\x5f\
-\xc5\x77\xfe\x16\x95\x95\xd2\xcf\x5f\xfe\x81\x68\x9c\x0e\xdb\x2d\
-\x08\x62\xb5\xdb\x08\x15\x8a\x63\x2c\x7b\x30\x91\xcf\x8f\x72\xeb\
-\xf1\xdd\xa9\x6a\x31\x89\x44\x05\xa3\x5b\x91\xa0\x90\xe4\xae\x1d\
-\x80\x90\x84\x2f\x83\x7f\xf8\xf9\x57\xf4\xcf\xbf\x7e\x45\x6e\xb5\
-\x35\x4a\xfb\xf6\x7e\xeb\x8c\x18\x59\x3a\x8e\x44\xbd\xf9\xdb\xdc\
-\x8f\xf7\x1a\x23\xdb\xfd\x91\x37\xd5\x18\x3b\x0a\x5b\xfc\x6d\x6b\
-\x24\xc2\x3a\x15\x90\x08\x3b\x76\x05\x39\x8c\x4c\x44\xd8\x74\x4a\
-\x2c\x44\x8b\x7f\x34\x12\x35\xd2\x18\x0b\x5d\x3d\x3d\xc6\xfc\x01\
-\xbb\x77\xef\xa6\xe9\xa9\xf8\x96\x99\x58\x47\x05\x84\xa2\xbf\xfd\
-\xe9\x8f\xe8\x67\x2f\x3e\x4f\x15\xa5\x45\xb4\x7c\xc1\x3c\xfa\xdb\
-\xbf\xf8\x31\xfd\xec\x25\xc7\x9e\x9d\x31\x83\xe5\x22\x0e\xc0\x20\
-\x1c\x41\x5b\x34\xbe\x8d\x86\x91\x20\x60\xcb\x0f\xcf\x0e\xbd\x42\
-\xd0\x39\x76\xdb\x1a\xf3\x6e\x44\xcf\xee\x4d\x4f\xdb\xb0\xf9\x1f\
-\x2f\xb6\xf0\xc7\xfb\xf9\x51\x6e\x3d\xa0\xcf\x0d\x26\x91\xa8\x60\
-\x34\x85\xc8\xe6\x46\x0f\x6f\xa7\xd0\x83\xe3\x7f\x33\xc5\xb9\xf5\
-\xed\xd4\x2f\x24\xc9\x82\x4a\x47\x40\x6a\xe7\x4e\xa3\xa0\xd8\x2e\
-\x54\x60\x3a\x0d\xda\x99\xc3\x3a\x0e\x5b\xa3\x16\x2b\x13\xb5\xc6\
-\xa8\xb1\xc9\xf9\xfc\x8d\x29\xfe\x39\x59\xce\xe2\xe2\x58\x3a\xcc\
-\x68\x1a\xc1\x4d\x40\x68\xb1\xdd\x3f\xbb\x6c\x2e\xfd\xee\x0f\x6f\
-\xd3\x2f\xfe\xf5\xd7\x74\xe2\xdc\x79\xba\x7a\xbd\x99\x5e\x7b\xfb\
-\x1d\xfa\xc5\xaf\xe2\xb1\xbf\x2b\x53\xa6\x28\x73\xc1\x3b\xfa\x88\
-\x27\xbe\x26\x6c\xee\xbd\x35\x46\xd1\x18\x6b\xf8\xb1\x92\x9e\x11\
-\x5e\xbf\x36\xde\x7b\xcf\x90\xe0\x62\x7a\x76\xa2\x80\x45\xf4\xc0\
-\xe6\x7f\x6e\x0e\xd4\x5f\x40\x13\xf5\x70\xbf\xa1\x03\x08\xdf\x16\
-\x0b\xde\xef\xd9\x21\x04\x41\x8f\x57\x67\xff\x00\xfd\xfa\xb5\xd7\
-\xe9\x7f\xfc\xcf\x7f\xa6\xfd\xc7\x4f\x8a\xf9\x5f\xaf\xbc\x2a\xdf\
-\x62\x03\x36\xf7\x36\xc6\x2a\x14\x7b\x4c\xe4\xf3\xa3\x28\x89\x40\
-\x05\xa3\x29\xc4\xfa\x35\xab\xa9\xa2\x84\xdf\x4c\xe7\x0f\x7f\x33\
-\xc5\x9b\xea\x4f\x9f\x7f\xc6\xbc\xcd\xde\x8f\x27\x24\x89\x49\xa2\
-\xb3\x17\x2f\x59\x1b\x25\xd8\xa1\x17\x45\x5a\x38\x83\x9f\x93\x79\
-\x8d\x51\x4f\x5f\xbf\xf5\x7e\x8c\x94\xc5\x83\x2d\xfe\xb6\x35\x12\
-\x8d\x2c\xbc\x00\x63\xf8\x2c\xc3\x5c\xba\x7c\x85\xda\xba\xba\xa9\
-\xbd\xbb\x87\x6a\xae\xf2\x9b\x12\x9b\xf6\xee\x5e\x31\x66\xfb\x35\
-\xb9\xd7\xb9\xff\x9a\x98\xbe\x81\x41\x29\x5f\x94\x77\x90\xf0\x35\
-\x46\xd1\x99\x34\x6b\x8c\x38\xed\xd5\xe7\x2f\xd0\xc7\x9f\xd8\x3f\
-\xa3\x51\xb5\x70\x81\xbc\x64\xe0\x99\x89\xa1\x1f\x1f\xc1\xd2\xaa\
-\xca\x11\xf1\xf7\xdb\xeb\xb0\x48\x5a\x84\x2e\xb9\x14\xa1\x28\xd7\
-\xfe\x6d\xb1\xf7\xfe\xf4\x3e\x1d\x39\x7d\x86\xaa\x2f\xd6\xd0\xd1\
-\x93\xa7\xa9\xa1\xa9\x99\xb8\x34\x1d\x9d\x42\xae\xc1\xf3\x6b\x73\
-\x3f\xfa\x35\x46\xb1\x33\x91\xcf\x8f\xa2\x24\x82\xa8\x82\x11\xf4\
-\x68\xe8\x07\x64\x27\x07\xc7\x8e\x1f\x97\xa3\xa9\x51\xc2\x16\xee\
-\x41\xcc\xef\xb3\x70\x64\x12\x64\x86\xe1\x0a\x47\xcd\xd7\xc3\x3f\
-\xf0\xd9\xdd\xdd\x25\x47\x1b\xb6\x46\x2d\x56\xa2\xad\x31\x72\x92\
-\x11\xbd\xcb\xb2\xb9\xb7\xad\x31\x12\x8d\xbe\x8c\x29\xfe\x18\x29\
-\xc3\x77\xa7\x62\x09\x57\xbe\x0d\xc6\xd8\xc2\x37\x81\xb0\x37\xdc\
-\x75\x97\x9c\x07\xef\xbf\x74\xfe\xbc\x94\x8b\x37\xfd\x29\xeb\xc3\
-\x42\x0d\xf4\x0b\xf1\xd1\x9d\x2a\x15\x37\xee\xf4\x29\xb6\x4a\x8f\
-\x14\x8b\x1c\xe2\x89\xaf\x09\x9b\xfb\x9b\x69\x8d\x91\x80\x3a\xde\
-\xde\x61\x0d\x0f\xd3\x69\x73\xf1\x9d\x48\xef\x99\x89\xf6\xdc\xf8\
-\xc0\xc8\xed\xc5\x73\x67\xe5\xdc\xe4\x3f\x34\x98\xb7\xb4\x39\x4a\
-\x0c\xfd\x05\x01\x15\x0c\x8f\x3d\xfc\xb0\x9c\x07\xe3\x83\x91\xa2\
-\xd3\x17\x2e\x52\xef\xc0\xc0\xd0\xfa\x40\xd7\x48\xf9\xba\xc7\xc5\
-\x4b\x9c\x85\xa8\x41\xf7\x9e\xdd\xc6\x58\x85\x62\x8f\x89\x7c\x7e\
-\x14\x25\x11\x44\x15\x8c\xf6\x1d\x3b\x21\x46\xb9\xc9\xe1\x46\x1b\
-\x6b\x0c\x6c\x8d\x08\x1a\xf9\x02\x7c\x44\x32\x8a\x72\x3f\x3f\x69\
-\xa9\x29\x56\xff\x60\xef\xed\xed\x93\x73\x13\x61\x6f\xfe\xd3\x65\
-\x3b\x2f\xe2\x10\x3d\x1e\xb6\xf0\x21\x24\x78\xee\xad\xbe\x70\x3a\
-\xd7\xad\xb9\x4d\x4e\x4d\xf1\x0f\x03\x1a\x86\x81\x29\xfc\xca\x05\
-\xf3\x9d\x3e\x32\x4a\x3e\xce\x0a\xf9\x80\x66\xd8\x1a\x89\xea\x73\
-\xe7\x8d\xf1\x95\x4e\x25\x3b\x1b\xfd\xb9\x23\x20\x45\x84\xa4\x80\
-\xe1\xeb\x45\x79\xb9\xb4\xb4\x7c\x2e\xfd\xe8\xd9\xa7\xe8\x65\x36\
-\x4b\xe7\xcf\x15\x83\xf3\x59\xd8\xda\x6a\x89\xfb\xcd\xbc\xc6\x08\
-\xbb\xad\x9c\xd2\x0e\xcf\xf7\x58\x81\x3c\x52\xdf\xe2\x7c\xbd\xde\
-\x16\xdf\xa7\x9e\x78\x5c\x76\x7f\x45\x46\x5b\xa3\x94\x39\x90\x0f\
-\x00\xf3\xb3\x16\xb6\x90\xfe\x93\xcf\x3e\xe3\xbf\x52\x90\xce\xd1\
-\x25\x3f\x24\xff\x30\x7d\x36\x5c\xeb\x35\x04\x21\x7f\xb9\x0f\x8d\
-\x02\xda\xd2\xf3\x7d\xad\x31\x9a\xc8\xe7\x47\xb9\xb5\x58\xb5\xa8\
-\x52\x4c\x22\x89\x2a\x18\x29\x93\x04\x6e\x10\x9b\xda\x9c\xaf\x71\
-\xdb\x1a\xc5\x1f\x3c\xfb\x0c\xcd\xca\xcf\x97\x06\x3e\xb4\x91\xe7\
-\xeb\xd8\x11\xf3\xf4\xe3\x8f\x89\xd5\xe4\x5f\x67\x57\xf7\x50\xa3\
-\xee\x36\xc6\x1e\xb0\x85\xe9\x89\x71\xd6\x3b\xf1\x49\x78\xbb\x48\
-\x03\xee\xef\xa6\xf0\x23\x6f\x9e\x96\x74\xe0\xcd\x7b\xcb\xfd\xf7\
-\xd2\xf2\x45\x55\x46\xf7\xc0\xb6\xc6\x08\xf1\xc7\xc7\x65\x6d\xf1\
-\xbf\xd1\xdb\x23\x61\x86\xe5\x21\x16\xcf\x3e\xff\xd4\x93\x72\x6e\
-\x0b\xdf\x04\xc2\xde\x7b\xf0\xa0\x9c\x9b\xc2\x7f\xf0\x9e\xbb\x9d\
-\x70\xa3\x64\x1e\xca\x0f\x0b\x77\xa1\xcc\xf1\xf8\x91\x23\x34\x73\
-\xfa\x74\xf9\x4a\x7a\x11\xdb\x3b\xdb\x9d\xcf\x82\xd8\x7c\x88\x27\
-\xbe\x26\x6c\xee\xa3\xad\x31\x42\xda\xbb\x43\xd6\x58\x15\xe4\xe5\
-\x39\xc9\x0e\x4f\x7a\xec\x70\x3d\xec\x61\xe1\xfe\x8d\x3f\x84\xaf\
-\xc9\x99\xd6\xdf\x47\x65\x45\x85\x9c\x67\x51\x84\x23\xbe\x8e\xef\
-\xfb\xcd\x2d\x2c\x90\x2d\xf4\x36\xff\x30\xf2\x83\x51\x78\x11\x6c\
-\xe5\xdf\x10\x61\xdf\x2a\x5b\xb5\x6a\x95\xc4\x59\x04\x20\x68\x00\
-\xc7\x73\x04\xe3\xa3\x88\x85\xde\x6b\x57\x2e\xcb\xb9\x2d\x7c\x1b\
-\x89\x5a\x63\x84\x18\x4d\xd4\xf3\xa3\xdc\x7a\x94\x15\x17\x89\x49\
-\x24\x2a\x18\x4d\x21\x7a\xfa\x7a\x43\xd7\x4c\x60\x4d\xd0\x3c\x6e\
-\xe0\xb1\xb0\xd3\xfb\xee\x99\x67\xd0\x40\x41\xbf\x4d\x66\xfa\x74\
-\x9a\xc3\xbf\xff\xf8\xf9\x67\x43\x1b\xe9\x6c\x74\x52\x60\x78\xbb\
-\x1c\xa1\x6a\xd1\x62\x39\x9a\xdc\xcf\x2b\x2d\xe6\xbe\xcd\x09\x33\
-\xd2\x38\xc2\x04\xc0\x42\xe4\x4f\xe5\xcd\xda\x9c\x9e\xed\x8f\x6c\
-\x93\x9d\x3f\xfe\x34\xc0\x20\x0d\x2f\x3d\xf9\x78\xa8\x50\xe4\xd9\
-\x6d\xf4\x0c\x3a\xf1\x31\xb9\x87\x50\xf6\x02\xfb\x4f\x86\x8e\x12\
-\x02\x19\x1a\xf5\xe7\xf0\x3b\x63\x0b\xdf\xba\x46\x82\x3b\xba\x96\
-\xf6\x4e\xda\xb0\xc1\x3c\x9d\x76\xe5\xd2\x45\x19\x0d\x8a\xe8\x90\
-\xf2\x85\xed\x01\x05\x7b\x0f\x6f\x31\x7f\xc0\x17\x9d\x72\x67\x57\
-\x97\xeb\x6e\xa4\xdb\x89\x5e\x63\xb4\x6b\xb7\x7d\xa4\x71\xe3\xbd\
-\x2c\x14\xc6\x50\x6f\xe2\x01\xc2\x05\x34\x4c\x2f\x5d\xbe\x42\xec\
-\xc1\xf8\x7a\xf6\x17\x9e\x7e\x8a\xfe\x8f\xff\xf4\x73\x2a\x63\xa1\
-\x27\x83\xeb\x57\x56\xc6\x4c\x4a\xe3\xe7\x25\x89\xdd\xcf\x48\x4b\
-\xa5\x8a\x79\x73\x45\x10\x2f\xcd\xcd\x0e\x15\x8a\x60\xc7\x07\x54\
-\x07\x38\xde\xf2\x01\xe0\x80\x70\x13\xb6\x70\x19\x2a\x04\x86\x18\
-\xf9\xe0\x95\x95\x14\x4b\xf8\x61\x23\x55\xdf\xc7\x1a\x23\x30\x61\
-\xcf\x8f\x72\xcb\x81\x0f\xdc\x27\xfa\x23\xf7\xc9\xe9\xd9\xb9\x7f\
-\xef\x9e\x2b\x53\x00\xbc\x01\x3f\xfd\x44\x78\xa3\x82\x35\x0c\xab\
-\x96\x2d\xa5\xde\xf6\x56\x2a\xc8\xce\xa4\x2d\x1b\x1f\xa4\x95\x4b\
-\x17\xd3\x60\x77\x27\x15\x72\xa3\xf4\xe8\xb6\x6d\x94\xc2\x8d\x97\
-\xcd\x3d\xbe\x9d\xf4\xf1\x17\x5f\x51\x6f\x5f\xbf\xb3\x66\x25\xd0\
-\xb8\x83\x3c\xf6\x07\x1f\xa0\x05\x41\xf7\x5b\xb7\x6c\xa1\xbb\x6f\
-\x5f\x47\x8d\x75\xd7\x64\x7a\x6f\xe3\x7d\xf7\x4a\x33\x2f\x9f\x1d\
-\xc0\x0d\x3e\xbf\xd0\x09\x6d\xe3\xfb\x41\x30\x3e\x7b\xbf\xfd\x96\
-\x8a\xf9\x0d\xfd\x8e\xb5\x6b\x68\x71\xc5\x02\x1a\xec\xe9\x91\x37\
-\xfb\x67\x9f\x7c\x82\x32\x66\xce\xb4\xc6\xdf\xb3\x7f\xbd\x73\x97\
-\xbc\xd9\x3a\xd3\x10\xbe\x34\xf0\xb1\xa3\xb3\x93\xda\xaf\x37\x4a\
-\x23\x6e\x72\x9f\xc3\xf1\x6e\x6e\x6c\xe0\xf8\x4e\xa3\x3c\x16\x12\
-\xf1\xa6\x3e\x9d\x1b\xf5\x39\x85\xf9\xf4\x0c\xe7\x7f\x58\xfe\xc1\
-\x8e\xf5\x25\x47\x4f\x9e\x8a\x4c\x81\x48\xf8\x2e\x98\x2e\x41\xe7\
-\x66\xcb\xbf\x27\x1f\x7b\x8c\xca\x4a\x4b\xe8\xe2\xa5\x4b\xf2\xed\
-\x32\xee\x59\x44\x88\xc5\x42\xe1\x62\x16\x9a\x5e\x7c\x6a\xbb\x55\
-\xa8\x6d\xe1\x8e\xb1\xa1\xb9\xc5\x37\xfd\x32\x14\x2e\x28\xc9\xcf\
-\xa5\x8d\x0f\x3e\x28\xe7\x7e\xf7\xf8\x56\xda\xfe\xef\x0e\x5b\xdd\
-\x79\x40\x50\x45\xfa\x41\x30\xfc\xaf\x76\xec\xa4\x56\xef\x5b\x6f\
-\x70\x6f\xf0\x23\x9d\x85\x8c\xc7\x1f\x31\xaf\xb1\x39\x78\xe0\x00\
-\xcd\x9e\x55\x48\xf7\xdc\xb5\x9e\x96\x55\x55\x51\x5f\xa7\x33\x42\
-\x2a\x9f\x2a\xc1\x89\x25\x4e\xa1\x48\x3c\x88\xce\x5f\xac\xa1\xb6\
-\xa6\x46\xb9\x14\xcc\x6f\xbf\x3d\x63\x46\x3a\x3d\xc3\xf5\x6b\xed\
-\x8a\xe5\xd4\xd9\x7c\x5d\xf2\x0b\xf5\x6d\x71\xc5\x42\x19\x99\x83\
-\xa0\x14\xe6\x1e\x23\xad\x97\xeb\xea\xf1\x11\x7c\xce\x07\x67\xcd\
-\x97\x3f\xde\x83\xfc\xc3\x8b\x4f\x6f\x97\xf3\xa0\x7b\x08\xad\x98\
-\xa6\x6b\x6e\xeb\x70\x9d\x38\xee\x72\x32\x33\x69\xfd\xda\xdb\x68\
-\x5a\x5f\x4f\xa8\x50\x04\x7b\x7d\xd3\x75\x19\xcd\x35\x95\x61\x6f\
-\x7b\x9b\x31\xfe\xb7\xdf\x7e\x7b\x4c\x65\x1f\x81\x7f\x9f\xc8\xe7\
-\x47\x51\xc6\x4a\xd4\x11\xa3\xf1\x50\xb7\xad\x8c\x0f\x68\x1a\xf0\
-\x11\x4f\xdb\x1a\x15\x10\xb4\x6f\xd9\xbc\x59\xa6\x57\xd0\xa8\xc7\
-\xaa\x5c\x70\xe7\x37\xdf\x52\x2b\x77\xb0\xa6\x37\x5e\x81\xed\xdf\
-\x1e\xfc\x4e\x4e\xc3\xfc\xcb\x62\xe1\x05\x9d\x20\xb6\x35\x37\x36\
-\xd4\xf3\x8b\x23\xbf\x41\xfa\x46\x31\xe0\x6b\x7a\x26\x16\x6a\x86\
-\xc7\x07\x6b\x16\x2e\x5f\xb8\x20\x6f\xea\xb6\xaf\xd2\xdb\xec\x56\
-\x38\x0d\xe7\xaf\xd6\x85\xba\x9f\x99\x9e\x4e\x3f\x7a\xe1\x39\x7a\
-\xfe\xf1\x47\x29\x3b\x2d\x85\x4a\xf9\x39\xf1\xeb\x9d\x09\x5b\xf3\
-\x15\xb6\x46\x02\xe9\xde\xcd\x42\x00\x3a\x7c\x9b\xfb\xb3\xd5\xa7\
-\x69\xd1\xbc\x32\xfa\xbb\xbf\xfe\x19\xfd\xed\x4f\x7e\x44\x4b\xe6\
-\xce\xa6\x25\x6c\x7f\x7e\xfb\x93\x56\xa1\x08\xf1\x69\xe9\x60\x41\
-\xd0\x2d\xb3\x40\xa9\x09\x13\xba\xc6\x88\xe3\x14\x6d\x3a\x18\xf6\
-\xb9\xb3\x67\x8b\xd0\x88\xf2\xae\x64\x81\xc4\xb4\xe5\x3d\x1e\x90\
-\x13\x6d\x1d\x1d\x74\x8a\x85\x23\x53\x78\x20\x11\x76\xe4\xff\xa5\
-\xba\x3a\xd9\xb5\x65\x13\x0e\xb1\x70\x19\xbb\xe5\x6c\xfe\x3d\xbb\
-\x7d\x3b\xfd\x9f\xff\xf9\xaf\x45\xc7\x51\x15\x34\x60\x3f\xfd\xa4\
-\xec\x3e\x6d\x63\x21\x23\x96\xe7\xf7\xfb\x5a\x63\x84\x74\x4d\xd4\
-\xf3\xa3\x28\x63\x25\xaa\x60\x34\x1e\xea\xb6\x95\x71\xc2\x6d\x68\
-\xdf\xfd\xf8\x3f\xa8\x8d\xdf\xd8\xc2\x1a\x25\x30\x1a\x3b\xbe\xf2\
-\xbd\xcf\x7b\x7b\xf4\x2d\xf6\x0c\x32\xc0\x9d\xd5\x1c\x77\x0d\x4f\
-\x4c\xfe\x63\x71\x2b\x5e\xa3\xd1\xbf\x79\x43\xeb\xec\xf7\xb1\x53\
-\xa7\xe9\x83\x0f\xed\x0b\x39\x81\xcd\x8e\x91\xad\x0f\x3e\xf9\xd4\
-\xfa\xbb\x6d\x8d\x11\x40\xaa\xda\xf9\xed\x1e\x6f\xa5\xb1\x86\x17\
-\xb4\x67\xe7\x17\xc8\xd1\xf6\xbb\x15\x29\xc7\x24\x3a\x5b\x7b\x2d\
-\xa6\x0f\xfe\x42\x23\x72\x2c\x9d\xe2\xb4\xd4\x34\xaa\x6f\xc2\xda\
-\x96\xf0\x37\x6c\x9b\xfb\x58\xb1\xb9\x8f\x45\x8f\x11\xa6\x83\xdf\
-\xf9\xd3\x9f\xe4\x3c\x5a\x7a\xc4\x6e\xaa\x37\xf1\xc2\x79\x81\xfc\
-\x68\xef\xee\xa6\x57\x7e\xff\x16\x7d\x14\x32\x1d\x0d\x46\x63\xc7\
-\x48\x51\xf5\xa5\xcb\xfc\x42\xd1\x11\xd9\x19\x68\x2a\x03\x5c\xf9\
-\xe4\xcb\xaf\xe4\x3c\xcc\x3f\xef\xa5\x02\x2f\x35\xfe\xdf\x31\xb2\
-\xf7\xde\xfb\xef\x47\xec\x20\xe8\xde\x46\xa2\xd6\x18\x81\x09\x7d\
-\x7e\x14\x65\x8c\x44\x15\x8c\xc6\x43\xdd\xb6\x32\x7e\xa0\xb1\x85\
-\x39\x75\xf1\x32\xed\xfc\x76\x6f\xcc\x8d\x50\x34\xbb\x08\x19\xff\
-\xf1\x29\x7d\xbe\x63\x27\x37\xea\xce\x6e\x98\xc8\x02\x50\x03\x78\
-\x0b\xff\xe8\x8b\xaf\x62\x16\x6a\xe6\x89\x90\x82\x0e\x2e\xd0\xb9\
-\xb1\xff\x67\xaf\xd4\x4a\xf8\x20\xd6\xf8\x2e\x5d\xb6\x9c\x7e\xfd\
-\xbb\xd7\xe9\x9c\xbb\x25\xdf\x76\xbf\x15\xa4\x8b\xcd\x87\x9c\x86\
-\xd1\x08\x99\x19\x39\xb9\xf4\xd9\xd7\x3b\x64\x4d\x0f\x08\xfe\x1e\
-\x6d\x8d\x04\x72\xb5\xb7\xaf\x8f\x7e\xfb\xf6\xbb\xd4\xc9\x1d\x76\
-\xbc\xe1\xfb\xed\x78\xf3\x1e\xe4\x32\x8b\x08\xb4\x28\x3b\x37\x7d\
-\x41\x26\x7a\x8d\x11\xea\xcd\x85\xab\x75\x51\xd7\xfc\x78\xf6\xf3\
-\x52\xbe\x86\x7a\x13\x2f\x92\x1f\x49\xd4\xd0\x74\x9d\x8e\x54\x9f\
-\x0b\x55\x6e\x0a\xe2\xb1\x37\x5c\x6f\x66\xa1\xa8\x86\x5a\x3b\x3a\
-\x86\x9e\x1d\x4b\xfe\xe3\x5a\x57\x4f\x2f\xdd\x48\x85\x8e\xb0\xf8\
-\xc2\x83\x50\xf4\xca\x6b\xaf\x4b\x78\xb6\xfb\xbf\xaf\x35\x46\x5e\
-\xfa\x26\xea\xf9\x51\x94\xb1\x10\x75\x8d\x11\x1e\x66\x18\x65\xf2\
-\x20\xcd\x2d\x37\x4a\x35\xb5\xb5\xd4\xdc\xda\x46\x4b\x96\x2c\xa1\
-\xa2\xc2\xc2\x98\x1b\x25\xbf\x1d\x9d\x6a\xda\xcc\x0c\xfa\xe3\x47\
-\x9f\x50\x6d\x5d\xbd\xfb\x8d\x35\x67\xb4\x48\x84\x22\x18\x13\x7c\
-\xbd\x9f\xdd\xd6\x73\x23\x5d\x5a\x52\x4a\x79\x79\xb9\xb4\x67\xf7\
-\x6e\xf9\xc9\x14\x1e\x14\x17\xd6\xd4\x5e\x1d\xe1\x2f\xfe\x62\x7a\
-\xe1\xdc\xc5\x4b\xb2\xdb\x06\x6b\x0f\xa2\xc5\x97\x52\x52\xa5\x51\
-\x85\x40\x01\x1d\x2f\x2f\x3c\xf3\x74\xe4\x77\xe0\xdd\x6f\x5d\x63\
-\xe4\xe2\x5c\x23\x6a\x6c\x69\xa5\x9e\xee\x1e\xba\x10\xa2\x97\x06\
-\x78\xe1\x77\x0f\xde\xa0\x6f\x0f\x1c\x94\x4e\xb0\xb4\xb0\x80\x36\
-\x1a\xa6\xf7\xf0\x01\x53\x8c\x86\x39\x61\xbb\xe1\xfb\x61\x3b\xae\
-\xa0\xbf\xaf\xbf\xde\x22\x9d\xde\xa9\x53\x27\xa3\xa6\x1f\x78\x76\
-\x74\x2a\xed\x5d\x5d\x74\xad\x89\x3b\xe6\xf3\x17\x7c\xdb\xbb\xf9\
-\x18\x0c\xcf\xc5\xbe\xc6\xa8\x77\xcc\x6b\x8c\xbe\x8e\x61\x8d\x11\
-\xae\x61\x8d\xd5\x77\x47\x8f\x8b\xde\xa3\xf4\xe9\x69\xf4\xd0\xa6\
-\x4d\xf2\x93\x29\xbd\x6d\xec\x1f\xd2\x18\xb5\x3e\xc6\x80\xe7\x1e\
-\xc7\x33\x9c\x5f\x07\x0f\x73\x7a\xf9\xfc\x91\x6d\xdb\xe4\x77\x53\
-\xf8\xc0\x64\x47\x79\x61\xcb\xfa\xe9\x0b\x97\xe4\x19\x40\x9a\x3c\
-\xdd\x52\xa2\x43\x2a\x24\x9e\xf8\xa5\xb6\xae\x8e\x8e\x9d\x38\x41\
-\x39\x19\x19\xc6\xfa\x03\xfc\xf6\x8b\x97\x2f\xd3\xbf\xbd\xf1\x7b\
-\xea\xe8\xea\xa6\xb2\x39\x73\x68\x49\xa5\x59\xb9\x24\xd6\x18\xe1\
-\x79\x32\x95\xa1\x7d\x8d\xd1\x1d\xf1\xad\x31\x72\x91\xfb\xf8\xff\
-\x84\x3c\x3f\xca\x2d\xc3\xa3\xf7\xdd\x4d\x55\xe5\x73\xe9\x34\xf7\
-\x11\x89\x62\x5a\x4e\x59\xf9\x18\x5f\xb5\x94\x9b\x12\x6e\x88\x65\
-\xdd\x05\x37\x32\xb2\x06\x83\x1b\xc3\xdc\xcc\x4c\x5a\xb2\x78\x11\
-\xcd\x9b\x33\x9b\x8e\x1f\x3b\x2e\x0b\x39\x83\x8d\xd2\x8a\x95\xab\
-\xa8\xa5\xad\x95\xbe\xdd\xbb\x8f\xae\x73\xe3\x83\x59\x0a\xec\x0e\
-\x93\xc6\x47\x46\x88\xdc\x86\x1d\x8e\xa2\x35\x46\x88\x83\x18\x27\
-\x7c\x74\x9a\x73\x39\x6c\x6c\x21\x87\x72\x45\x4c\xff\x60\x7a\x05\
-\xbe\x1c\x3c\x7c\x84\x9a\xb9\x93\x13\x65\x75\xd2\xa0\xfa\xfc\xf6\
-\xfc\x19\x1c\xa0\x8a\xf2\x79\x54\x56\x5a\x4a\xb5\x97\x6b\x28\x2d\
-\x35\x4d\x46\x32\xd0\x09\xed\xdc\xbd\x8b\xae\xb3\x10\x08\x41\xa7\
-\xa7\xaf\x2f\x12\xdf\xe9\xd3\xd3\xe9\xae\xb5\x6b\xa8\xba\xfa\x34\
-\x3c\xa2\x85\x0b\x9d\xe9\x9c\xb3\xdc\xe9\xb6\xf1\xbd\xd6\x30\x3d\
-\x02\x69\x58\xbb\x72\x85\x7c\xd0\xf3\xf4\xc9\x93\xb2\xb0\x14\x23\
-\x59\xdd\x1c\xfe\x67\x9c\x7f\xe8\xa4\x9b\xdb\xda\x9d\xf0\xdd\x06\
-\x1b\xf7\x67\x65\x66\xd0\x99\xea\x6a\xf1\xc7\x4b\xef\xb1\x13\x27\
-\xa9\x8e\x3b\x4c\x47\x39\x9f\x3b\x82\x60\x22\x10\x3e\xc2\x2e\xcc\
-\xcf\xa7\xeb\x0d\xf5\x92\xfe\xad\xbe\xdd\x67\xa6\xf2\xeb\xea\xe6\
-\xb2\xf3\x97\x9b\x77\x6e\x82\xc3\x81\xf6\x74\xec\xb6\x42\x7c\x61\
-\x5f\xe8\x4e\x7f\x9d\x3a\x7d\x9a\x6a\xb1\x38\x3e\x39\x65\xc4\x82\
-\x61\x3f\xf8\x04\xcd\x6d\xcb\x97\x52\x35\xdf\x1f\xcc\xef\x4e\xce\
-\xa7\x46\x2e\x23\x27\xbf\x63\x4f\x33\x3e\x75\x33\x8d\xcf\xb1\x26\
-\x05\xd3\x9f\x58\x43\x05\xa1\x09\xae\xa7\xb3\xd0\x5e\x7d\xe1\x62\
-\x78\x19\xc6\x4b\x24\x7c\xae\xfc\x6e\x1c\xf0\xec\x60\x27\xda\x5d\
-\xeb\xef\xa4\xec\xac\x6c\x3a\x78\x60\xbf\xdc\x8a\xe7\x07\xf5\xef\
-\x8b\x2f\xbf\x94\x72\x2f\x9d\x3d\x87\xea\x1b\x1b\xe9\x04\x77\xda\
-\x9e\x00\xc2\x7f\x22\xf9\x1e\x6b\x1c\x25\x6c\x76\x3f\xc8\x06\x7a\
-\x94\x3a\x5a\x9a\x23\xe5\x8d\xf0\x30\xb2\xd7\xc1\x82\x7f\x7e\x41\
-\x21\x0b\xbd\xe7\xa9\x1e\x65\xe3\x86\x85\x85\xcd\xd9\x33\xd2\x25\
-\x1d\x15\xb2\x06\xcb\x51\xae\x89\x60\x5b\x3a\xbb\xa5\x9e\x7a\x2f\
-\x37\x11\xf8\x26\x08\xc5\x55\x2c\x50\xe1\x5c\xea\x2b\x5f\x46\x7d\
-\xc5\xf3\xbf\x7b\xdf\xfe\xa8\x65\x6f\x84\xfd\xf2\x97\xe5\xf7\xfe\
-\xfc\x28\x53\x1e\x08\x46\x20\x91\x3b\xd3\x54\x30\x9a\xea\xb8\x0d\
-\x93\x77\xf4\xce\xf9\x8f\x73\x2e\xf7\x38\x07\xc1\x6d\x5f\x9c\x37\
-\x30\x36\x7c\xc4\xb9\xd7\xa0\xc7\xdd\xf9\x20\x4c\x39\x72\xc3\xe8\
-\x86\x3d\x3c\x5c\xfc\x71\xfd\x46\xe7\xe1\x36\x88\x23\x70\xdd\x39\
-\x0d\x2c\xfc\x81\x7f\xf2\x83\xfc\x0c\x86\xc7\xd1\xeb\x84\xf8\x07\
-\xb8\xe3\x46\x79\x28\xed\x20\x86\x30\x3d\xe0\x1e\x47\xf1\xc3\x90\
-\x0e\x97\xa1\xf0\xbd\xb0\x11\x38\xdf\xea\xba\x1b\x4a\x2f\xe3\xdd\
-\x27\x61\x0f\xdd\x6b\xc4\x0b\xdf\x4d\xfb\xf0\xf0\x5d\xff\xdc\xc3\
-\xb0\xf2\x93\x30\xbc\xa3\xd3\x79\x88\xdd\x86\xeb\xe7\x50\x7c\x3d\
-\x4f\x19\xd7\x6d\x64\xb4\xc9\xe6\x4f\xc4\x8f\x01\x39\x0e\xf9\x01\
-\x37\xfc\xdf\xcd\x6b\xe9\xcc\xc2\x80\x1f\x72\x34\xe4\xb7\xf3\x03\
-\x1b\x27\x1e\x31\x95\xe1\x28\x88\xc4\xdf\x0d\xdb\xb1\x23\x3e\xf2\
-\xab\xdc\x13\xcc\x77\x9c\x48\xd6\x20\x5e\x6e\x3e\x45\xf2\x5e\x7e\
-\x8e\xdc\x18\x95\x48\xba\x7d\xe5\x11\xc9\x83\x08\x4e\x38\x12\x96\
-\x5f\xe8\x95\x7b\x9d\xfa\xe2\x8f\x64\x44\x30\xf6\xea\x9d\x87\xeb\
-\xf7\x98\xca\xde\x06\xfc\xc5\x71\xa2\x9e\x1f\x65\x4a\xa3\x82\x91\
-\x32\x7a\xbc\xc6\xc9\x6b\x94\x9c\x8b\x91\x76\x66\x04\x68\x78\xdc\
-\xe3\xb0\xf3\xd1\xe2\x0f\x5f\x08\x84\x2d\xe1\xe0\xbf\x13\x9e\x91\
-\x11\x69\x70\x3d\xc0\x41\x9c\xa0\xb1\xf4\x8e\xae\x1f\x7c\xf4\x1a\
-\x62\x31\x7e\x62\x09\xd3\x0f\xc2\x14\x3f\x70\x74\xec\x11\xc4\xb9\
-\x21\x7c\xc6\x73\xe3\x45\x57\xf0\xdf\x17\x4b\xd8\x00\xe1\xbb\xc7\
-\x61\xe7\x41\x22\x7e\xbb\x16\x3e\x71\x4e\x63\x08\x07\xfe\x8a\x9f\
-\x08\xc3\xb9\x14\x01\xfe\xc0\x8f\x28\xfe\xd8\xf3\xdb\xf9\x33\xea\
-\x34\x0b\xf0\xd7\x3d\x05\xe2\x97\xf8\x1a\xbb\x9f\xf1\xe2\x8f\x83\
-\x9c\x07\xe2\xe0\x47\xa2\x30\xca\xbc\x37\xe1\x0b\x3b\x92\xaf\x7e\
-\x10\x84\x1b\x4e\x24\x2c\xc6\x73\x33\xf2\x7e\xf7\x3e\x53\x7c\xbc\
-\x30\x4c\xe9\xf3\xdc\x98\xdc\xc5\x8a\xcf\x7f\xe7\xe0\x0b\x44\xbc\
-\x45\x18\xde\x71\x28\x1c\x63\x9c\xfc\xf7\x8d\x25\x4e\xca\xa4\x67\
-\x42\x04\x23\x4f\xd5\xb6\x2e\xc0\x9e\x42\xb8\x0d\x52\x58\xc1\x47\
-\x9a\x9a\xf1\x68\x74\xfc\x0d\xa2\x9f\x58\xc3\xf2\xb9\xf7\xfb\x14\
-\x1a\xe7\xb1\x86\xe9\xc7\x92\x7f\x71\x87\x3f\x96\xbc\xb5\xc4\xc1\
-\x23\x34\x2e\xb1\x30\xd6\xfc\x4a\x64\x7e\x7b\x8c\x87\x9f\xf1\xe0\
-\x0b\xdf\x96\xef\x60\xcc\x79\x6f\xc2\x52\xde\xa1\x61\x8d\x36\xbf\
-\xc6\x3b\x9f\x13\x95\x96\x44\xe6\xaf\x32\x69\x19\x0f\xc1\x28\xea\
-\xd8\xf3\x78\xa8\xdb\x56\x26\x18\x34\x28\x6c\xf0\xb6\x65\x33\xfc\
-\x67\xfc\x1a\x1e\xbf\xff\x7e\x13\x2b\x3e\x37\x31\xc7\xd9\xff\xbb\
-\xdf\x8c\x06\xd7\xad\x3f\xec\x51\x85\x3f\x16\x5c\x3f\x82\x71\xf0\
-\x0c\xff\x19\x5b\x18\x7e\x3f\xfc\x26\x56\x4c\x6e\x61\xc6\x82\xc9\
-\x3f\x98\xef\x0b\x5f\x98\xa6\x3c\xf7\x0c\xff\x49\x7c\xbc\x5c\x3f\
-\xe3\x0a\xcb\xff\xbb\xdf\x44\xc3\xe4\x06\x26\x51\xb8\xfe\x8d\x39\
-\x2d\x8a\x32\x4e\x44\x15\x8c\x20\x85\x25\x52\x12\x53\x14\x45\x51\
-\x14\x45\xb9\x59\x89\x2a\x18\x29\x8a\xa2\x28\x8a\xa2\xdc\x2a\xa8\
-\x60\xa4\x28\x8a\xa2\x28\x8a\xe2\xa2\x82\x91\xa2\x28\x8a\xa2\x28\
-\x8a\x8b\x0a\x46\x8a\xa2\x28\x8a\xa2\x28\x2e\x51\x05\x23\x6c\x85\
-\xf3\xb6\xc3\x29\x8a\xa2\x28\x8a\xa2\x4c\x65\x74\xc4\x48\x51\x14\
-\x45\x51\x14\xc5\x45\x05\x23\x45\x51\x14\x45\x51\x26\x25\x50\x3e\
-\x9d\x68\x05\xd4\x2a\x18\x29\x8a\xa2\x28\x8a\x32\x29\xa9\xb9\x56\
-\x27\x26\x91\xa8\x60\xa4\x28\x8a\xa2\x28\x8a\xe2\xa2\x82\x91\xa2\
-\x28\x8a\xa2\x28\x8a\x8b\x0a\x46\x8a\xa2\x28\x8a\xa2\x28\x2e\x2a\
-\x18\x29\x8a\xa2\x28\x8a\x32\x29\x59\xb5\xa8\x52\x4c\x22\x51\xc1\
-\x48\x51\x14\x45\x51\x94\x49\x49\x59\x71\x91\x98\x44\xa2\x82\x91\
-\xa2\x28\x8a\xa2\x28\x93\x92\xf7\xbf\xda\x29\x26\x91\xa8\x60\xa4\
-\x28\x8a\xa2\x28\x8a\xe2\xa2\x82\x91\xa2\x28\x8a\xa2\x28\x8a\x8b\
-\x0a\x46\x8a\xa2\x28\x8a\xa2\x28\x2e\xd3\x72\xca\xca\x6f\xb8\xe7\
-\x46\xbc\x45\x4d\x89\xd6\x2c\xa9\x28\x8a\xa2\x28\x8a\x72\xb3\x11\
-\x55\x30\x52\x14\x45\x51\x14\x45\xb9\x19\x79\xf4\xbe\xbb\xe5\x98\
-\xc8\x05\xd8\x3a\x95\xa6\x28\x8a\xa2\x28\xca\xa4\xe4\x5a\x63\x93\
-\x98\x44\xa2\x23\x46\x8a\xa2\x28\x8a\xa2\x28\x2e\x3a\x62\xa4\x28\
-\x8a\xa2\x28\x8a\xe2\x12\x55\x30\x1a\x0f\x75\xdb\xca\x24\xe2\xc6\
-\x8d\x21\xa3\x28\xdf\x37\xfe\xfa\x17\x34\x37\x23\xa6\x78\x7a\x46\
-\x51\x94\x49\x41\xd4\xa9\xb4\xf1\x58\xd8\xa4\xdc\xdc\x4c\x4f\x4b\
-\xa3\xdb\x96\x2f\xa5\xba\xda\x5a\xb1\xcf\x9d\x37\x8f\x0e\x1c\x3d\
-\x46\xad\xed\xed\x34\x8d\xff\xd1\x34\x36\x4a\x4c\x64\xce\x48\xa7\
-\xe2\xa2\x22\xe9\x18\x1b\x1a\x1a\xe4\x5a\x61\x61\xa1\x1c\x2f\x5d\
-\xbe\x42\x3d\xfd\xfd\x9c\x9d\xa3\xcb\x4f\xf8\x9d\x9c\x94\x44\x85\
-\x05\x05\x62\xf7\xfb\x5f\x53\x7b\x95\x7a\x7a\x7b\xad\x65\x55\x56\
-\x5a\x42\x6d\xad\xad\x12\x2f\x2f\x3e\xc1\xf8\x8d\xd6\xde\xdc\xd1\
-\x89\x5a\x32\xba\x7a\xc2\xf1\x99\x55\x90\x2f\xa6\xa9\xa1\x91\xd2\
-\x52\x53\xe8\x8e\x75\xeb\xe4\xa7\xfd\x07\x0e\xc8\xb1\xa8\xa4\x84\
-\x7a\x7b\xfb\xe8\xf8\xe9\xd3\xd4\x85\x34\x3a\xb5\x72\x62\xea\xa5\
-\x1b\xdf\xec\xcc\x4c\xea\x68\x6b\x93\xf8\xae\x5a\xb9\x52\x7e\x3a\
-\x7a\xf4\x28\x0d\x0c\x0e\x52\xe9\xec\xd9\xd4\xd6\xde\x41\x67\x2f\
-\x5c\x94\xf8\x46\x62\xa9\xcf\x91\xa2\xdc\x94\xe8\x1a\x23\x65\x18\
-\xd3\xd3\x52\xe9\xe5\xa7\xb6\xd3\x81\xfd\xfb\xc4\xfe\xc0\x03\x0f\
-\xc8\xf1\x8b\x2f\xbe\xa0\x53\x17\x6b\xa8\xbd\xbb\xc7\xe9\xc8\xb5\
-\x51\x8f\x89\x97\x9f\x7a\x52\x3a\x4e\xe4\x1f\xf0\xe7\x67\x6f\x5f\
-\x1f\x1d\x3e\x7b\x41\xf2\x73\x34\x79\xba\xb0\xa4\x88\x9e\x7c\xec\
-\x51\x39\x0f\xfa\xff\x3f\x7f\xfd\x0a\x77\xc2\x7d\x56\x7f\x97\xcc\
-\x9d\x43\x33\xa6\xa7\x0d\x8b\x0f\x18\xab\x7d\xc3\x5d\x77\xd1\x3f\
-\xfe\xea\x95\xb8\xd3\x94\x9c\x34\x8d\x66\xe5\xe4\xd0\x43\x0f\xdc\
-\xc7\xf9\x55\x10\x57\x78\x47\x4f\x9e\xa2\x5d\x7b\xf7\x53\xaf\x27\
-\x64\xc6\x18\xe6\x58\x48\x4b\x49\xa6\xfc\xac\xac\xb8\xe3\xbb\x66\
-\xed\x5a\xaa\x3e\x7f\x81\x76\xed\x73\xe3\x0b\x31\xe9\x7b\x88\xaf\
-\xa2\x4c\x55\x8a\xb9\x7d\x05\x89\x5c\x80\xad\x6b\x8c\x94\x61\xdc\
-\xb6\x6c\x99\x51\x28\x02\x3f\x79\xe1\x39\xba\x31\x38\xc0\x2f\xc9\
-\x3a\x35\x10\x13\x92\x47\x37\xac\x9d\xe4\x96\xcd\x9b\x69\xc3\x9a\
-\xd5\x7c\xdb\x20\xdf\x15\x67\x7e\xb2\xdf\xcb\x96\x2f\x97\x53\x93\
-\xff\x37\x06\xd9\x4f\xf1\xd7\x80\x1b\xaf\x68\x9d\xf8\xa8\xec\xec\
-\x37\xea\x88\x13\x46\x74\x20\x88\xcf\x29\xcc\xa7\xe5\xf3\xe7\xd1\
-\x4b\xcf\x3c\x15\x97\x90\x01\x3b\x46\x37\xdb\x9a\x1a\x69\xc5\xc2\
-\x72\xda\x7a\xff\xbd\x94\x95\x31\x53\xd2\x1e\x6b\xf8\xf1\x82\xf0\
-\x10\xdf\x25\xf3\xca\x46\x15\xdf\x6c\x16\xa6\x24\xbe\x0b\xca\xe9\
-\x81\xf5\x77\x3a\x65\x84\xb8\x8e\x53\x7c\x15\x65\xaa\xb3\x6e\xd9\
-\x12\x31\x89\x44\x05\x23\x65\x18\x75\x57\x9d\xe9\x33\x63\x27\x34\
-\x7d\xba\xdb\xe1\x6a\x23\x1e\x2b\xfb\xf6\x99\x85\x4c\xcf\xde\xd7\
-\xd9\x41\x33\x52\x53\x39\x5f\x59\xa0\x18\x45\xbe\xda\x3a\xe1\x0c\
-\x16\x10\xa4\xb3\xb5\xf8\xb9\xce\x9d\x9e\xb2\xb9\x1f\xad\x7d\xc7\
-\x8e\x1d\x91\x3a\x12\x2d\x35\xb3\xf2\xf3\xa9\xb2\xb4\x84\x8a\x72\
-\x73\x68\xd3\xc6\x8d\x72\x6d\x2c\xe1\x2f\x5f\xbc\x88\x2a\x67\x97\
-\x50\x7e\x56\x26\x87\x9f\xf8\x7a\x0a\xa1\x68\x76\x7e\x6e\xc2\xe2\
-\xbb\x76\xe5\x0a\x16\xb0\xe6\x8a\x20\xa9\xc2\x91\xa2\xdc\x3c\xa8\
-\x60\xa4\x0c\xc1\x0d\x33\xa6\x77\x6c\x8d\xfa\xa7\x9f\x7e\xea\x76\
-\x36\x71\x8f\x6f\xdc\xd2\x44\xeb\x24\x7f\xf8\xdc\x33\x43\xa3\x1c\
-\x71\x74\x8e\x58\xc3\x02\x8c\xfe\x3b\xc5\x14\x8a\x2d\x3e\x63\xb5\
-\xc7\x42\x59\x49\x31\x95\xe6\x66\xc9\x9a\x9c\x44\x87\xff\xd3\x97\
-\x5e\xa0\x35\xcb\x97\x25\x5c\x88\x2f\xcc\xce\xa4\xdc\xcc\x8c\x84\
-\xc6\x77\x66\xfa\x74\xfa\xd1\x33\x4f\x0d\xc5\x35\x81\xf1\x55\x14\
-\x65\x74\xa8\x60\xa4\x0c\xa3\xb5\xbb\x47\x8e\xa6\x46\xfc\x6a\x43\
-\xa3\xb3\x86\x43\x89\x99\x58\x46\x66\x72\xb2\xb2\x68\x7e\x69\xf1\
-\xa8\x3a\x72\x5b\xa7\xdb\xde\xde\x1e\x2a\x17\x45\x1b\xc9\x1a\xad\
-\xfd\x9e\x7b\xee\x91\x63\x18\xb3\xf2\xf3\x28\x7f\xa6\xb3\x70\x3c\
-\xd1\xe1\x7b\xf6\x69\x7d\xbd\x54\x80\x91\xa3\x04\x09\x47\x99\xe9\
-\xe9\x32\x52\x14\x4b\xf8\x3d\x3d\x3d\xf2\x12\xe1\xd9\x41\xd8\xfd\
-\x45\x85\x85\x54\x5a\x90\xe7\xc4\x55\x5f\x39\x14\x65\xc2\xd1\x5d\
-\x69\xca\x30\x30\x05\x81\xa9\x9d\xb2\x59\x85\xf4\xf8\xa3\x8f\x38\
-\x8d\xfc\x67\x9f\x53\x43\x73\x33\x5d\x6b\xbc\x4e\xd3\x92\x93\x29\
-\x29\x39\x89\x05\x24\x96\xa9\xa7\xa2\x90\xc4\x9d\x28\x3a\x6c\xec\
-\xf8\x9a\x33\x67\x36\xd5\x37\x36\x51\x1d\x9b\x51\x09\x84\xec\xd7\
-\xcb\x4f\x3f\x49\xc7\x8e\x1c\x11\x6b\xb4\x4e\xf2\x5a\x4b\x2b\xd5\
-\x5c\xbd\x46\xd3\x92\x92\xa3\x87\xc7\x7e\x3f\xbe\x79\x13\x55\xce\
-\x2f\x37\xfa\x77\xb4\xfa\x2c\x75\xf5\xf5\x73\x59\xb1\x5f\x9c\x9e\
-\x61\xb0\xdb\x25\xf3\xe6\xd0\xc3\x5b\xb7\x8a\x35\xe8\xfe\xa3\x8f\
-\x3f\xa6\x9e\xde\x3e\x5a\x7d\xdb\x6a\xb1\x1f\x3a\x74\x48\x8e\xab\
-\x57\x47\xb7\xf7\xf4\xf4\xd2\xbb\x1f\x7e\x24\xf5\xc4\x94\x8e\xec\
-\xcc\x0c\x9a\x5f\x54\x18\x55\x28\x1a\x18\x18\xa0\xca\x45\x8b\xe9\
-\xd2\xe5\xcb\x74\xaa\xba\x9a\xed\x83\xb2\xfb\x6d\x56\x61\x01\x5d\
-\x6f\xa8\xa7\xac\x8c\xd8\x46\x6e\x5e\xf9\xfd\x5b\xd4\xd0\x74\x9d\
-\x5f\x01\x51\x67\x47\x5f\x5f\x17\x94\x14\xd1\x76\xcb\x42\x77\x2f\
-\xbe\x94\x9a\x26\x3b\x0d\xeb\x1b\x1b\xe5\x3a\xc8\xce\xce\xe6\xe7\
-\x29\x85\x8a\x0b\x0a\x68\xeb\x96\xcd\x72\xcd\xe6\xfe\xd8\xf9\x8b\
-\xd4\xd7\x3f\xe0\x94\xd7\x54\x7c\xb6\x14\x65\x1c\x18\x0f\x19\x25\
-\xaa\x60\xe4\x2d\x6a\xda\x77\xec\x84\x1c\x95\x29\x0e\x77\x9a\x78\
-\xc3\x96\x75\x0f\xbe\xb7\x6d\xe9\x54\x58\x18\x42\xa3\x2d\x66\x8a\
-\x35\xdc\x58\x3f\xb2\xac\xaa\x92\xba\x5a\x9b\x69\xc6\xf4\xe9\x91\
-\x4e\xeb\x8d\xb7\xdf\xa1\x9a\xba\x86\xd1\x75\xac\xae\x00\xe2\xf7\
-\xcf\xd4\x29\x02\xd8\x21\x84\xfe\x3f\xff\xfa\x9b\xd8\x04\x4f\xf6\
-\x1b\x82\xd1\xe5\x0b\xe7\xc5\x1a\xf4\xef\xc2\xd5\x3a\xaa\xbf\xde\
-\x6c\x15\x8c\x20\xb0\xd9\x16\x0e\x5f\xb8\x52\x2b\x3b\x3c\x9c\x32\
-\x8f\x27\xcd\xd8\x89\x06\x27\x1c\x7f\x4b\x1a\x20\x60\x44\x9b\x8e\
-\xba\xde\xda\x4a\x75\x4d\xcd\xa2\x1e\x02\xee\x9d\x7c\x87\xc7\x72\
-\x8b\x5b\x47\x89\x36\xde\x73\x17\xb5\x37\xb3\xd0\xc3\xd8\xfc\xfb\
-\xe3\xfb\x1f\xd0\xa9\x4b\x35\x9c\x07\xae\x90\x16\x88\x4f\x4c\x70\
-\x60\x3f\x7b\xf1\x79\xca\xce\xca\x34\xc6\xb7\xb3\xab\x9b\x4e\x5f\
-\xbc\x24\xd3\xd0\x8e\x50\x83\xb4\xe3\x57\xfc\x71\xe2\xca\x0f\x13\
-\xbd\xf0\xe4\x13\x74\xb6\xfa\x34\x7e\x30\xc6\xf7\xb3\x1d\x3b\xe9\
-\xc0\x91\x63\xce\xf3\x15\x2c\x33\x45\x51\x8c\x4c\xc8\xb7\xd2\x20\
-\x10\xa9\x50\x74\x0b\xe1\x76\x44\xd2\x91\x24\xa7\x70\xc7\xea\x98\
-\xc8\x48\xd1\x68\x04\x84\x9b\x1c\xec\x8c\xda\x72\xdf\x3d\x44\x3d\
-\x5d\x23\x84\x18\x47\x38\x8c\x7f\xfd\x8f\x1f\x53\x27\x08\x82\xf6\
-\xdd\xbb\x77\x53\x65\x59\x29\x87\xe9\x08\xa7\xd1\x08\x5d\x63\x14\
-\x03\xb6\xf8\xcc\x2d\x9b\xeb\x94\xb3\x94\x39\x97\x7f\x4a\xac\xc6\
-\xa9\x33\x70\xc7\x1e\x8c\x10\x42\x72\x32\x66\x46\x15\x8a\x2e\x5f\
-\xab\xa3\xd3\x17\x6a\xa8\xb5\xa3\x23\x52\xff\xe4\xc8\x7e\x3b\x75\
-\xd1\x8b\x53\x32\x7d\xb1\x6b\x0f\x9d\x3c\x7f\x31\xd4\x3f\xec\x52\
-\xc3\xe8\x92\x08\xfb\x72\x35\x7e\x20\x10\xd9\x84\x22\xd0\x33\x30\
-\xe8\x08\x45\x10\x42\x25\x7e\xce\x71\xb8\x3d\x85\xde\x62\x21\x0d\
-\xd8\xe2\xdb\xd2\xd4\xe4\xd4\x35\x30\xca\xba\xa6\x28\xca\xd8\xd1\
-\xd7\x92\x78\xf0\x3a\xc7\xa0\x89\x07\x93\x7b\x98\xd1\xc0\xee\xa6\
-\xa7\xa6\x8a\x49\xe3\xc6\x17\x46\x3a\x00\xbf\xbf\x30\xa3\x21\x22\
-\x20\x79\xc2\x90\xfb\x26\xec\xfe\x6c\x25\x18\xb6\x67\x4c\xb8\xbf\
-\x21\xfe\xc9\x1c\xd6\x88\xb8\x27\x02\x9f\x7f\x9e\xff\xc1\xfc\xd9\
-\x72\xdf\xbd\xd6\x91\x97\x8a\x8a\x85\x22\xa8\xc8\xbd\xa3\x20\xde\
-\xdd\x5f\xdb\x1f\x7f\x9c\x2a\xca\xe7\x71\x70\xb1\xad\x8d\xb1\xf9\
-\x87\x35\x46\x61\x84\xae\x31\xe2\x42\x1e\x56\xf6\x10\x92\x63\x30\
-\x49\x62\x50\x57\x9c\xba\x13\xa4\x28\x37\xdb\x1a\x5f\xd8\xb1\x86\
-\xed\x72\x7d\x03\x0b\x12\x49\x8e\xf0\xe3\x09\x16\x6e\xfd\x73\xfc\
-\xf5\xc5\x89\x7f\x6b\xef\xe9\xa1\x7d\xdf\x1d\x36\xfa\x07\x60\x5f\
-\xb6\xa8\x8a\xcb\x6f\xf4\x5b\xf8\x31\x9a\x18\xe6\x3f\x14\x69\x0e\
-\xe5\x95\x2f\x9e\xc3\xe2\x9b\x44\x10\x79\x16\x56\x71\x5c\x18\x9b\
-\x7f\x22\xbd\x8d\x32\x9e\x70\xe7\xb5\x07\xfe\xe7\x69\x58\x7d\x4f\
-\x24\xae\x9f\x5e\x78\x09\x0d\xd3\xef\xde\x6f\x4c\xb8\xbf\x21\x7c\
-\xc4\x65\xcc\xe1\xfb\xdd\xfa\x8d\x09\xf7\xb7\x60\xfa\xbd\xeb\x09\
-\xc3\xf5\xcf\x54\xbe\xde\x6f\x62\x46\x4b\xd0\x1f\xcf\x98\xe0\xeb\
-\x08\x3f\xf4\x9e\x49\x8e\x2a\x78\x8c\x01\xbc\xe9\x62\x0b\xf0\x72\
-\x57\x6f\x8c\xf7\xa6\x0e\xfb\xee\xfd\x07\xa8\xbe\xe9\xba\x23\x30\
-\xa0\xb2\x58\x28\xc9\xcf\xa5\xdb\xd7\xac\x91\x73\xbf\x7b\xf0\xe1\
-\xe7\x5f\x50\x2f\xd6\x16\x84\xb8\xf7\xc0\xe8\x46\xf6\x8c\x19\xfc\
-\xe6\x3d\x93\xee\xbc\xe3\x0e\xd1\x8b\xb2\x7b\xd7\x2e\xf9\xcd\x6b\
-\x64\x3f\xfe\xe4\x13\xea\xec\xe9\x15\x0d\xc1\x18\x9a\xef\xc1\xdb\
-\x2c\x7e\x88\xc1\x7f\x6c\xa1\xce\x4c\x4b\x91\xf3\x60\x7a\x67\x64\
-\x66\xd1\xd1\x53\xa7\x9d\x78\x06\xfc\x9a\xc1\x9d\xc7\x43\x18\x75\
-\x61\x82\xe9\xfb\xe4\xcb\xaf\x1c\x65\x83\xb0\xb0\xbb\xcc\xf4\xe9\
-\x94\xc9\x69\x80\x72\xbc\x60\xfc\x2f\x5d\xa9\xa5\xdd\xdf\x7c\x43\
-\x35\xf5\x8d\x72\x6f\xac\xf1\xf6\x03\x65\x81\x88\xcf\xf2\x25\x4b\
-\xa8\x72\xfe\x3c\x3a\xfc\xdd\x77\xc3\xd6\xb4\x78\xf9\x93\x9b\x5f\
-\x40\xdd\xdc\xa9\xa5\x4b\x97\x65\xee\xf4\xf6\x1d\x3c\x44\x9f\xef\
-\xda\xe3\x74\xd2\xec\x47\x5c\x71\xe1\x46\x23\x9e\x35\x46\x9e\x1d\
-\x0b\x77\xbf\xab\x3e\x47\x37\x38\x28\x47\x20\x35\x84\xc9\x7e\x8f\
-\xd7\x1a\xa3\x57\x7e\xf7\x1a\xd5\xc9\x34\x5c\x4a\xfc\x69\xb6\x30\
-\x83\xeb\xed\xdf\xfc\xf8\x65\x39\x37\xc5\x17\xc2\x05\x46\x7f\x44\
-\xe9\xa1\x08\x5a\x8e\x60\x11\x1a\x36\xa7\x03\xff\xf8\x4e\x5a\xb9\
-\xb0\x9c\x36\x6d\xda\x24\x97\x83\xfe\xbf\xfd\xde\x1f\xe9\x4c\xcd\
-\x95\xd1\x95\x21\x83\xb8\x43\x6f\x91\x3f\xbe\x60\x78\x7e\xb5\x44\
-\xf5\x1f\x9d\x18\x76\xe3\x75\xb6\xb5\xf1\xf9\x20\x95\x14\x97\xe0\
-\x2a\x5d\xbd\x7a\x95\x8f\xd3\x28\x8f\x9f\xbd\xea\x0b\x17\xd9\x1f\
-\xa4\x3d\xb6\x78\x62\xcd\xd6\x4c\xee\x28\xb1\x26\x6e\xcb\x43\x9b\
-\x8c\x42\xdc\x3b\x7f\x7a\x9f\xba\x58\x80\xec\xe0\x67\xb0\xb5\xad\
-\x9d\xbd\x8d\x92\xaf\x21\xa0\xfd\xc9\x98\x8e\xe7\x37\x9d\xee\xbb\
-\xfb\x2e\x63\xfb\x83\xf0\x31\x82\x36\x7b\xee\x3c\xba\x7c\xf5\x9a\
-\xb4\x19\x08\x4f\x42\x8c\x12\x6e\x58\xfb\xd3\xc6\xcf\xac\xbf\xad\
-\x45\x5e\xce\xe1\x36\xae\xa5\xb1\x9e\xd2\x38\x0f\xfc\x2a\x14\xda\
-\x3a\xbb\x68\x76\x59\x19\x7d\xb1\xfb\x9b\xb8\xc2\x5e\xbf\x66\xf5\
-\x88\xf6\x0b\xf6\xda\xc6\xa6\x11\x6d\x98\xad\x7d\xf9\xe3\x07\x7f\
-\x96\xfc\x1e\x4b\x1b\xe6\x51\xc6\xe9\xeb\xef\xe9\x96\xf6\x7e\xe3\
-\x83\x0f\x8e\x28\xdf\x56\xae\x4b\x9f\x71\xfb\xda\xce\xe9\xad\x6b\
-\x6e\x89\x3b\xbc\x58\xf3\x3b\x99\xeb\xe4\xe2\x8a\x0a\x5a\x56\x55\
-\x41\xa7\x4e\x9c\x90\xf4\x16\x96\x94\xd2\x47\x5f\x7e\xcd\x41\xf1\
-\x1d\xa3\x4c\x5f\x22\x18\x8f\xa9\xb4\xe4\xf4\xec\xdc\xbf\x77\xcf\
-\x15\x0b\x79\xdc\xf8\x3c\xb7\xfd\x09\xca\xcf\xcd\xa5\xc3\x87\x0e\
-\x51\x3a\x57\xce\x6d\x5b\xb6\x88\x7d\x2f\x0b\x46\xe8\x5c\xa5\x42\
-\x86\x54\x8e\x07\xb9\x11\x41\x27\x16\x74\x0f\x7b\x03\x57\xe8\x7e\
-\x16\x8c\xc2\xfc\x40\x83\x74\xcf\xed\xeb\x28\x33\x25\x49\xa6\x23\
-\xa0\x1c\x30\x63\xe6\x4c\xda\xf1\xf5\xd7\xf2\xbb\xbf\x51\x4a\xe6\
-\x06\x1a\xfe\xcf\x9d\x5d\x4a\x9d\x2d\xd7\x45\x50\x68\x6d\xef\x60\
-\xff\xe5\x7f\x68\x25\x4e\xe5\x7b\xb1\x43\xc6\x1f\x3f\x2f\xbe\xcd\
-\xad\xad\x74\xbe\xa6\xc6\x18\xcf\xf2\xb2\x39\x74\xd7\xda\x35\xc6\
-\xf4\x75\x74\x75\x51\x67\x77\x0f\x4d\x9f\x9e\x26\x02\xe2\xbc\xa2\
-\x59\xf4\xf8\x23\x0f\x1b\xe3\x7f\x70\xff\x7e\xca\xe0\x46\xf7\xa5\
-\x67\x9e\xa6\xfa\x86\x46\x6a\xc2\xc3\xce\x84\xe5\xad\x1f\x34\x58\
-\x58\xc7\xf2\xc2\xd3\x4f\x49\xfa\xf7\x7e\xfb\x2d\x25\xb1\x5b\x53\
-\xfe\xcc\x9f\x5b\x36\x62\xa4\x08\x42\x49\x37\x37\x08\xe5\x0b\x17\
-\xd0\x39\xee\xa4\x8e\x1c\x3b\xe6\x7c\xc6\x21\x96\x8e\xda\x40\x5f\
-\x67\x3b\xa5\xa6\xc4\xb7\x25\x1d\x23\x24\xeb\xd6\xdc\x46\x27\xcf\
-\x9c\x71\xf2\x1a\x3f\x18\xc2\x5d\xc4\x71\x44\xfe\x82\xa0\x7f\x68\
-\xc4\x3b\xbb\xbb\x87\xe2\x1d\x60\xdb\xa6\x8d\x92\xff\xa6\xf0\x5b\
-\xda\xdb\xa9\x03\x1a\xce\x47\x99\x66\x13\xeb\x56\xae\x94\xf2\x30\
-\x85\x07\x7a\x59\x36\xad\xad\xaf\x77\x85\x0b\x36\xb1\x84\xcb\xbf\
-\xe3\x0e\x08\x1c\xab\x57\xae\xa0\xa2\x42\xf3\x9a\xa9\x34\xce\xff\
-\xab\x58\x10\x3d\xca\xf4\x0c\x0e\xde\xa0\x17\x9f\xde\x2e\xe7\x26\
-\xff\x33\x67\xce\xa0\x01\xf6\x12\xf9\x2d\x71\xb2\xf8\x8f\xeb\xe8\
-\xc8\x3a\xb9\xd3\xec\xea\xee\xa5\xba\xa6\x46\xee\x78\xd0\xe1\xf6\
-\x8a\xb9\xde\xd2\xca\x69\x87\x7b\x8e\x27\xc7\x35\x0c\x74\x68\x9b\
-\xee\xde\x40\xd3\xfa\x7a\x28\x9b\x5f\xdc\xb6\x72\x7b\x90\xc2\x79\
-\x67\x8a\x1f\x9e\x47\x3c\x6f\x6b\x57\x2c\xa7\xba\xda\x2b\xf2\x3c\
-\x62\x31\xbb\xc4\x32\xc6\xbc\xf0\xb7\x3f\x79\xfc\x92\xf8\x08\x0b\
-\xd5\xb6\xf6\x07\x40\x48\x45\x79\xd4\xf0\xf3\x55\x5a\x90\x4f\xe5\
-\xf3\xe6\x51\x8d\x7c\x62\xc8\x9e\x3f\x20\xac\xfd\xa9\xbd\x76\x8d\
-\xea\xb8\x4d\x40\x27\x7d\xdf\xfa\x3b\xe8\xa1\x7b\xef\xa6\xb3\xa7\
-\x4f\xc9\xf3\x05\xa1\x01\x78\xe1\x23\x3f\x4a\x8b\x8b\xa8\xb7\xbd\
-\x55\xca\xa5\x9b\x9f\x07\x10\x16\x76\x29\xb7\x4b\xbd\x6d\xad\x23\
-\xda\x2f\xd8\xb3\x72\x72\x22\x61\xcf\x2e\xcc\xa7\x1f\x3f\xff\x9c\
-\xb5\x7d\xc1\x88\xce\xa3\x0f\x6f\xa3\xbb\xd6\xad\xa1\xe3\x27\x4e\
-\xc6\x14\x76\x10\x08\x44\x4f\x6c\xde\x48\x9d\xcd\xd7\x29\x8b\xeb\
-\xd7\xe6\x87\x1e\x32\x96\x2f\xa6\xdf\x11\xbf\x27\x1e\x7d\x44\xc2\
-\xab\xb9\x78\x31\xe6\xb6\x1e\x84\xe5\xf7\xf9\x8b\x97\xb8\xfd\x6d\
-\x96\xfa\xfd\x32\xb7\xa7\xcb\x16\x55\xd2\x01\x6e\x9f\xbd\xf4\xd6\
-\x35\x34\xd0\x99\xf3\x17\x24\x8c\x58\xc2\x1a\x2f\xaa\xca\xe7\xca\
-\x11\xeb\xfc\x12\x45\xf8\xd3\xc7\x40\xdd\xb6\xa7\x72\xfb\x56\xa5\
-\xbc\x7c\x9e\x1c\x83\x95\x12\x76\xac\x41\x89\x3a\x4c\xef\xfe\x66\
-\x72\x0f\xd0\xc0\xc8\x90\xa8\x65\x15\x04\x1a\x41\x7c\xa6\xa3\xad\
-\xb1\x61\xd8\x9b\x89\xcd\xbf\xa0\xfd\x79\x76\xfb\xf2\x33\x4f\x49\
-\x61\x47\x86\x5e\x6d\xf0\x6f\x36\xff\xce\x54\x57\xbb\xd3\x4a\x6c\
-\x09\xfa\xc1\x76\x5b\xf8\xf8\x56\x18\xb6\x68\x57\xcd\x76\x94\xf9\
-\x45\x8b\xaf\x67\xcf\x99\x9e\x4a\x39\xfc\x50\x72\xcf\xe4\xc4\x3b\
-\x04\xbc\x49\xcd\x2b\x2a\xa4\xaa\xb2\xd9\xd6\x91\x90\x68\xf6\x37\
-\xdf\x7e\x9b\x0e\x9e\x38\x45\x47\xaa\xcf\xd0\x3b\x1f\x7c\x44\x9f\
-\xef\xdc\x4d\x8d\xad\x6d\xfc\xbc\x23\xe7\xd0\xd2\x8c\xee\xc1\xb7\
-\x85\xf7\xf6\xbb\xef\xc9\xd1\xf4\x7b\x15\x0b\x3d\x39\xb2\x36\x06\
-\x5b\xb8\xcd\x78\x6f\x76\x36\xff\xa3\x61\xcb\x8f\x32\x7e\xd3\x4e\
-\x28\x5c\x76\xb6\xcf\xa2\x80\x0d\x1b\x36\x50\xf5\xb9\x73\x92\xcf\
-\x8e\x89\x23\xaf\xd1\x28\xb3\x39\xc3\x42\xec\x5b\xef\xbe\x2b\x2f\
-\x19\x05\x45\xc5\x74\xe4\xf8\x09\x2e\xcf\x77\xa8\xe1\x7a\x33\x15\
-\x95\xce\x16\xe5\xa4\xa3\x05\xdf\x3b\xc3\x88\x96\x2d\xfe\x10\x02\
-\x7e\xc2\x1d\x25\x76\x72\x72\xec\xdd\x36\x01\xcf\xc9\xc8\x92\x43\
-\x5c\xbd\x69\xc0\xa1\x35\x53\xce\xb9\xac\x49\xb2\x08\xb2\x7e\xa0\
-\xa3\xe9\xb9\xc7\x1e\x16\xa1\x3e\xde\xf6\x20\x97\x85\x9a\xff\xf2\
-\x97\x3f\x8d\x4b\xcf\x13\x84\xa2\x27\x36\x6f\x1a\x75\xfb\x03\xfb\
-\x5d\xb7\xaf\x95\x67\xd3\xdb\xd4\x61\xca\x1b\x81\xaf\xdb\xfc\xab\
-\xbd\x72\x45\x46\xef\xfe\xe2\xf9\x67\x45\xc8\x8b\x35\xfc\x9f\xfd\
-\xf0\x25\xaa\x98\xc7\x9d\x67\x94\xf4\x36\xb0\x60\x0e\x4c\xfe\x21\
-\xce\x08\x7b\xe9\xbc\x32\x7a\x7e\xfb\x93\x72\x3d\x96\xf0\x2b\xe6\
-\x94\xc6\x14\xb6\x1f\x94\xcd\x13\x5b\x36\xc5\x3d\xd2\x0c\x7b\x51\
-\x5e\xae\xb4\xf5\xb3\xf2\xf2\x9c\xf0\xa2\x85\x19\x92\xdf\x4d\x5c\
-\xde\x48\xf3\x4f\x38\xbf\x4d\x6b\xec\x4e\x9e\x38\xc1\xce\xa3\xf4\
-\x7d\x93\x94\xa8\x82\xd1\x78\xa8\xdb\x9e\x54\xb8\x85\x6e\xab\x94\
-\x05\xfc\x56\x14\xa9\x17\x21\x15\x24\xb4\x13\x83\x3b\x31\x72\x69\
-\x18\x68\x94\xd0\x08\xda\x3e\xd3\x11\xab\xfd\xf8\xd1\x23\xb4\x68\
-\xee\x9c\xa1\xc6\xd0\x12\x57\xef\x83\xa0\x46\xff\x22\xf1\x1c\xe9\
-\xd6\xfb\x80\xa8\x29\xfc\xb2\xd2\x52\x9a\x93\x9f\x2b\xc3\xdd\xb6\
-\xf8\xd9\xec\x2f\x3f\xf7\x8c\x28\x01\xe4\x88\x5b\xe3\x0c\x8a\x73\
-\xb3\xa9\x20\x3b\x2b\x6e\xff\xfd\xf6\xbc\x6c\xf6\x83\x85\xd0\x48\
-\xc7\x85\x05\xbf\xfe\x69\x9d\x51\x10\xb6\xc6\xe8\x6c\xcd\x65\xba\
-\x6d\xcd\xda\x88\x1d\xf8\x7f\x5f\xc0\x82\x64\x36\x0b\x47\x68\x54\
-\x6d\x69\xb7\xa5\x67\x4c\x6b\x8c\x04\x7b\x5e\x8f\x86\x8b\xe7\xce\
-\xca\xd1\x14\xde\xc5\xcb\x97\xdd\x75\x3a\xae\x40\x14\x6f\x5e\xf3\
-\xfd\x67\xf8\x4d\xf9\xfc\xd5\x3a\x3a\x5f\x7b\x4d\xa6\xa6\x61\xce\
-\xd7\x5e\x15\xf3\xe1\xe7\x5f\x3a\x8b\xa3\x47\x59\x86\xe0\x4f\x7f\
-\xfe\x50\x8e\xb6\xfc\x82\xbd\x98\x85\xff\xff\xfd\xe7\x7f\x29\x42\
-\x44\x5e\x96\xbb\xe0\xdb\x7b\x5e\xbc\xf2\xe3\x38\x88\x70\x14\x31\
-\x43\xc2\xa0\x67\xe7\x3f\xce\xbd\x06\xd0\x69\x3e\xb0\xe1\x4e\xe3\
-\xf4\x15\x88\xd5\x8e\x91\x26\xd1\x10\x1e\xa5\xc3\xc6\x0b\x07\xd2\
-\x73\xe6\xd4\x29\xb1\x8f\x36\x3c\xd8\xb3\xf8\x05\xf0\x81\x0d\xeb\
-\x39\x3c\x0e\x53\xae\x8e\x24\xac\xfd\x81\xfb\x9f\xfd\xe0\x45\x99\
-\xbe\x8b\x25\x3c\xe0\xd9\x33\x53\xf9\x59\x46\xb6\x46\x69\x47\x6c\
-\xee\x3b\x5a\x5b\x69\x31\x0b\x45\x18\xa9\x07\xf1\x84\xbf\xed\xc1\
-\xfb\x63\x0a\x1b\x24\xa2\x7c\x31\x52\x37\x3b\x2f\x87\xd2\xb9\xdd\
-\x8c\x26\x1c\x85\xe5\x37\x84\x60\xe4\x77\xd8\x1a\x3b\xf8\x1d\x9e\
-\xa2\xc9\x49\x54\xc1\x48\x21\xba\x70\xe1\x82\x1c\x8d\x95\x52\x6a\
-\x45\x6c\x55\xc3\xe8\x9e\x09\x53\xc6\x87\x6f\x97\xd9\x1e\x12\xbc\
-\x69\x5f\xe4\xce\xf5\xb5\x37\xdf\x92\xdd\x3c\x29\xe9\x33\xa4\x93\
-\xb1\x55\xe2\x47\xb6\x6d\x93\xe1\xd0\xb0\x86\x09\xd8\xdc\x2f\xac\
-\xa8\xe0\xbf\x76\x97\xb6\xf4\x35\xd6\x5d\x93\xe9\x2b\xdb\xef\x61\
-\x76\xbc\xe9\x67\xcf\x9c\xc1\x6d\x8a\xdb\xc9\x18\x98\x95\x63\x17\
-\x8a\xb0\x05\xfe\x37\xbf\xfd\x1d\x1d\x39\x7d\x86\xbe\x3b\x55\x4d\
-\xaf\xbd\xfd\x8e\x8c\x24\x78\xbf\x03\xef\x7e\xbc\xf9\xbf\xf4\xf4\
-\x76\xe9\x97\xfc\x53\x1a\x32\xad\x11\xd2\x59\x45\xc3\x96\x3e\x8c\
-\x44\xfc\xf9\xd3\xcf\xac\xbf\x23\x3e\xdb\x1e\xe4\xb7\x55\x94\x97\
-\xa1\x81\xf3\xd6\x04\xd8\xdc\x47\x23\x78\xbf\x67\xc7\x9b\x39\x84\
-\xd8\xac\xcc\x4c\x36\x19\x91\x85\xfd\x10\xd2\x60\x6c\x76\x89\x9f\
-\xa1\x8c\xf0\xb1\xda\xb0\x91\x86\xdd\x7b\xbe\x45\x86\x3b\x79\x3c\
-\xca\x7c\xe6\xd2\x62\x2f\xfc\xa3\x2f\x43\xc6\x9b\x9e\x1b\xad\xff\
-\x70\x51\xdb\x78\xdd\x1a\xff\xa0\xfd\xf2\xc5\x0b\x34\xbf\xa4\x98\
-\xfe\xee\xaf\x7f\x26\xd3\x21\xa8\x9f\x98\x7e\x88\xbc\x5d\xc3\x78\
-\x71\x09\x9a\x10\xb0\x28\x1f\x9d\x66\xb4\xf0\x63\xb5\xff\x94\x3b\
-\x3d\x8c\xe4\x86\x8d\x66\x20\xcc\x30\xa1\xa8\x85\x05\x06\xb4\x3f\
-\x17\xaf\x5c\x95\xf6\xe7\xf4\xd9\xb3\xa1\xe1\xaf\x5b\xb5\xd2\xa9\
-\x2b\x21\xc2\xbe\xcd\xfd\xb3\x4f\x6d\x97\xf6\x20\xcc\x7f\x60\xb2\
-\xa3\xfd\x59\xb5\x6c\x69\x68\x3b\x12\x26\x24\x14\xe6\xe5\x5a\xd7\
-\xb0\x45\xb3\x63\xba\x2b\x9f\xdb\xa7\x68\xbb\x4d\xa3\x95\x2f\xda\
-\xfb\xba\xfa\x06\x7a\xfb\xbd\xf7\x64\xd7\xe6\xd2\x65\xf6\xe7\x1f\
-\xe9\xfd\xe1\xb3\x4f\x73\x98\xd1\x3f\x37\x63\x0b\xef\xc9\x47\x1f\
-\x0d\xcd\xef\xc5\x8b\x17\xcb\x71\x2a\x12\x75\x8d\xd1\x78\xcc\xdf\
-\x4d\x36\xb0\xd0\x10\x73\xf4\x20\x58\x49\xbe\xde\xb5\xdb\x59\xdc\
-\xec\x8d\x2a\x58\x1a\xb7\x7b\xf9\x4d\x09\x73\xb8\xa6\x4a\x86\x05\
-\x6e\xfd\xdc\x50\x8c\x18\x99\xe0\xca\x9c\x9b\xce\x9d\x4a\xf2\xc8\
-\x4e\x05\x0f\xc9\x07\x9f\x7c\x4a\x5f\xf2\x43\xd7\xda\xd9\x49\xed\
-\x5d\xdd\x54\xc3\x6f\xc7\xc7\x4e\x9e\x92\x39\x66\x34\x22\x20\x18\
-\xde\x91\x23\x47\xa8\x89\x1b\x33\xe9\xf4\x71\x21\x10\xdf\x41\x4e\
-\x0b\xd6\x10\x04\xc3\x83\xfd\xca\xd5\x6b\x74\xa1\x06\x3a\x61\x46\
-\xa6\x15\xa3\x42\x8b\x2b\x16\x1a\xd3\x07\x3c\x3b\xd6\xf0\xb4\x77\
-\x75\x51\x46\x76\x0e\x9d\x39\x7f\x9e\x76\xed\xf9\x86\xa6\xa7\xa6\
-\xd1\x43\x21\x8d\x0e\x16\x6a\xd7\x36\x36\x72\xb8\xd2\xfd\x0d\x8f\
-\x33\xe7\xd1\x02\xee\x84\x36\x6d\x1a\xf9\xed\x2a\x34\xda\xff\xf2\
-\xea\xbf\x73\x23\xd2\x49\x03\x7c\x1f\x4c\x6b\x7b\x27\x35\xb3\x20\
-\x9a\xcc\x61\x2e\x5f\xb2\x78\x44\x78\xf8\xd6\x17\x94\x1b\x76\xf5\
-\x38\x23\x18\xf2\x06\x3f\x06\xc2\xd6\x18\xed\xfa\x76\x2f\xb5\x71\
-\x03\x87\x46\xec\xb1\x87\xcd\xf5\xeb\xe0\x81\xfd\xa2\x27\xa7\xbb\
-\x0f\xeb\xd8\x86\xd7\x8f\xf1\x5a\x63\x84\x05\xbd\x2f\x3c\xf3\xb4\
-\x7c\xcb\x0b\xd3\x27\x45\xfc\xf6\xf9\xfc\x53\x4f\xd2\x9a\x15\xcb\
-\xa9\x35\xc4\xde\xd2\xd6\x26\x0a\x31\x25\x34\x5f\x98\xe9\x2c\x64\
-\x3d\xf3\xc4\xe3\x72\x6e\x0a\xaf\x8e\xeb\x3f\x9e\x21\x19\x9d\x83\
-\x3b\x43\x7c\xa3\xc2\x6e\xe0\x16\x2e\xe5\x68\x31\xa3\x82\xdd\x41\
-\x01\x23\xd6\x07\xd9\x76\x2f\xda\xec\x28\x1f\xac\x01\x7a\xf1\xe9\
-\xa7\x64\xdd\x48\x43\x5d\x1d\x75\x60\x2d\x12\x23\xb1\x89\x31\x4e\
-\x18\x39\xc6\x47\x72\xb1\xa6\x05\x98\xc2\xc3\x4b\xd2\xbb\x7f\x7a\
-\x9f\x6a\xeb\x1b\xa9\x9f\xaf\xd5\x5c\xbe\x42\x87\xbe\xfb\x8e\x66\
-\x72\xfb\x65\x8b\xdf\xb9\x33\x67\xe8\x3a\xa7\x4b\xf2\x07\x17\x02\
-\xf1\xc9\x9d\x91\x66\x1d\xe9\xdd\xc1\xcf\xee\x1f\x3f\xfa\x98\x9a\
-\xdb\x9c\x35\x69\x97\xaf\x5e\xa5\x93\x67\xce\x8a\x0e\xac\x4d\x0f\
-\xdc\x6f\xad\x5f\x18\x1d\xc4\xfd\x18\x46\x09\x96\x49\x58\xfb\x03\
-\x3c\x3b\xda\xbf\x2b\xd7\xae\xc9\x48\x5e\x33\xc7\xbf\xa0\xa8\x88\
-\x72\xb2\xb2\x69\x0f\xb7\x87\xc0\xe4\x7e\x76\x71\x11\x7d\x73\xe0\
-\xa0\xb9\x1d\x61\xf2\x73\x72\xe8\x6a\x8d\xd3\xcf\x85\x85\x8f\xba\
-\x50\xb1\x68\x91\x4c\xd7\x7e\xf1\xf5\xd7\xd2\x9e\xdd\x7f\xef\x7d\
-\x94\x1e\x22\x44\x6c\xdb\xbc\x39\x34\x6c\x67\xba\xf2\x21\x16\xa2\
-\xcc\x2f\xc1\x48\xdf\x1f\x3f\xfc\x58\xfc\x68\x6a\x6d\xa3\xc6\xe6\
-\x16\x3a\x74\xec\x18\x1d\x3c\x7c\x58\xd6\x00\x61\x0d\x12\xf0\x87\
-\x8f\xf8\x9c\xe7\x36\x16\x0b\xd1\x4d\x79\x0d\xc2\xf2\xdb\x94\x1e\
-\x6f\x0d\xe6\xa2\xa5\x4b\x64\xcd\x55\x0d\x97\x79\x92\xd7\x2e\x19\
-\xfc\xff\x3e\x80\x6c\x92\x68\xf9\x44\x05\xa3\x18\x40\x07\x6a\x5b\
-\x38\xda\xd4\xd2\x1a\x93\x60\x34\xda\x4e\xac\x6c\x56\x81\xb1\xd2\
-\x36\x5d\x6f\xa6\x4f\xbf\xde\xe1\xbe\x21\xe3\x8d\x98\xdd\xca\xb4\
-\xcf\x34\xea\xeb\xef\xa7\xb4\xb4\x34\x3a\x7d\xc2\xd1\x3f\xe5\x77\
-\x2f\x0b\x51\xb9\x42\xf3\x8d\xc6\xf8\xa2\x13\x7b\xea\xf1\xc7\xe4\
-\x3c\x98\xde\xaf\x76\xec\x14\x21\xc3\x94\xd6\x58\x1a\x95\xf7\xde\
-\x7f\x9f\xce\x5c\xac\x91\xf0\x21\xc4\x5d\xad\xab\x77\x76\x53\x70\
-\xc7\x88\xe1\xf1\xe3\x96\xe9\xc6\x8d\x1b\x37\xd2\xfe\x43\xdf\xc9\
-\x08\x4b\x24\xde\x2e\x10\x5a\xd1\x29\x83\x60\x78\xaf\xfe\xee\x75\
-\xe9\x84\x64\xed\x06\xf2\xc9\x9b\x16\xe3\x3c\xc2\xee\x1c\x8c\x64\
-\xa1\x41\x0a\x86\x87\x91\x18\x2c\x7c\xb6\x09\x8f\xf1\x50\x98\x93\
-\x6d\x6c\xb4\xc0\x4e\x16\x8c\x10\x1f\xec\x48\x5c\x5c\xb9\xd0\xda\
-\xa8\x3f\xba\x6d\x2b\x9d\xac\x3e\x43\xbd\x98\x6e\xf2\xe5\x7b\x5f\
-\x57\xa7\x2c\x94\x0c\xde\x0f\xfb\xa1\xa3\xc7\x42\x05\xa3\x55\x4b\
-\x17\x87\x76\xb2\x20\x5e\xfb\xd7\xbb\x76\x51\x17\x3a\x3c\x0e\xcf\
-\x1f\x66\xe5\x82\xf9\xfc\x36\x6c\xde\x3d\x07\x1a\xf8\x19\x8a\xec\
-\x46\xf3\xa5\x6f\x54\x78\xee\x4d\x66\x0c\xc0\x35\x34\x5a\xe3\xed\
-\xfb\xf1\x47\x1e\x91\x6b\xf1\xe6\x0f\x36\x16\x40\x48\xc2\xc6\x02\
-\x2c\xd0\xc5\x8b\x06\x3a\x59\x89\x59\x94\xf8\xad\x5a\xb2\x84\xea\
-\x6b\xaf\xc8\xb9\xc9\xff\x0f\x3e\xf9\x0f\xfa\x8c\xdb\x83\x8e\x9e\
-\x1e\xea\x83\x10\xc7\x02\x37\x16\x76\x37\xb7\xb1\xe0\x6d\x79\x09\
-\x80\x1d\x7a\xbb\xf0\x52\x85\x36\x0c\x71\x18\x56\x57\x38\xad\xe5\
-\x2c\x4c\x98\xc2\x3b\xcd\x02\xd0\xc7\x5f\x7c\x49\x37\xf8\x19\x91\
-\xf6\x07\x3b\xe9\xdc\xe7\x0b\x63\x13\x58\x28\xdd\xdc\x60\x5e\xb3\
-\xb3\x74\xe9\x32\xeb\xf3\x15\xd6\xfe\x78\xf6\x05\x95\x95\x22\x24\
-\x7c\xcb\x42\x42\x9b\xbb\xb1\x03\x0b\xbb\xf7\xb3\x90\x00\x21\x0e\
-\x23\xe3\x20\xe8\x1e\x2f\x3d\x10\xda\x64\xec\x24\xd0\x8e\x80\x58\
-\x84\x32\xe4\xeb\xb5\xa6\x66\x09\x1b\x6d\x18\xc2\x46\x1b\x86\xb0\
-\x31\xd2\x3a\x33\xdd\x2c\x84\xa6\x70\xbb\xfb\xcd\xbe\xfd\xd6\xb0\
-\x17\x2f\x5c\xc8\xe5\x7b\x59\xce\x83\xee\x33\x72\x72\x25\xaf\xe5\
-\x19\x91\x76\x6c\x28\xaf\xf1\x42\x0d\x45\xae\xd8\xd8\x63\x7a\x9e\
-\xf1\x2d\xbe\x5a\x6e\x6f\x11\x9e\xe9\xd9\x8a\x25\xbf\x21\x84\xee\
-\xe1\xb8\xbf\xc7\x42\xe8\x25\xae\xb3\xf5\xcd\xcd\x74\x94\x5f\xc0\
-\x2f\xd7\x42\x4b\x3f\xe2\xe2\x98\xa9\x84\x4e\xa5\xc5\x88\xad\xd2\
-\x78\xc3\xaf\xd1\x18\xcd\x42\xd9\xb0\xe9\x87\x23\x87\xbf\x93\xb9\
-\x5f\x54\x74\x67\xca\xc7\xeb\xf4\x71\x4c\x76\x04\x09\x6e\x20\x51\
-\xa9\xbd\x6f\x37\xc1\x8e\x6f\x59\x89\x3b\x7e\x44\x4d\x83\xab\xa1\
-\x6b\x8c\x42\x08\x5b\x63\x04\x30\xdc\x5e\x7d\xe1\x92\xec\xbe\x91\
-\x87\x3b\x32\xcd\xe1\x2c\x3a\xfd\x8f\xaf\xcc\xbb\x5b\x3c\x3b\xcb\
-\x32\x88\xf2\x08\xaa\x64\x7a\xcf\x1c\xdf\xb6\x4e\x57\x88\xf3\xf2\
-\x05\x79\x85\x73\xc9\xaf\x24\x79\xd3\x33\x85\x37\x6f\xce\x6c\xe9\
-\x14\xc2\x86\xbd\x63\x25\x9a\x1e\x23\xc4\x09\xeb\x5f\x5e\x7f\xfb\
-\x5d\xb1\x9b\xe2\x83\xe1\xec\x92\xbc\x5c\x8e\xcf\xc8\x29\x35\xd3\
-\xfd\x60\xac\x6b\x8c\x46\x65\xf7\xe7\x99\x3f\xef\xf8\x34\x9a\x7b\
-\xce\x09\xf7\x30\xbc\xe1\xbe\x69\x40\xbc\xb8\xde\x60\x4a\xed\x95\
-\x37\xde\xa4\x8f\x3e\xf9\x44\x2e\xc7\x95\x3f\x8c\x67\x6f\x6b\x6a\
-\xa4\x15\x0b\xcb\x65\x14\x08\x6b\xe8\x42\x17\x24\x33\x6d\xd7\x9b\
-\xe4\x68\xf2\x6f\xef\xc1\x43\x74\xe4\xc4\xa9\xa1\x97\x24\x77\xfa\
-\xd0\x5b\xdc\x8d\xcf\xcc\xbc\xf9\x8e\xbd\x7e\x15\x15\x14\x70\xd8\
-\x23\xc3\xc7\x14\xa8\xe9\x7e\xf0\x05\x0b\x19\x78\x86\x44\xb5\x00\
-\xc2\xe4\xe7\x0b\x1d\xb6\x74\xda\x7c\x0d\x8b\xde\xb1\xf3\xcd\xe4\
-\x3e\x27\x3b\xcb\x09\xcb\x90\xde\x68\xed\x0f\x84\x84\x77\xde\xff\
-\xb3\x08\x7d\xa6\x76\xe4\x2a\xbf\x64\x01\x9b\xfb\x7c\x7e\x8e\x8c\
-\x0d\x9f\x8b\x29\xbe\x00\x76\xbc\xd0\x9d\xbf\x5c\x6b\x0d\xbb\x86\
-\x5f\xf4\xc2\xdc\x3b\x6b\x25\xc5\x3a\x82\xde\x0e\xe7\x79\x0d\xba\
-\xbf\x6d\xcd\x1a\x19\x59\x96\xfc\x95\x30\x51\xbe\xc3\x0d\xae\xbd\
-\xfe\xee\x1f\xe5\xfe\xa0\x7b\x4c\xff\x2d\x5f\x5c\xc5\x59\x6d\x6e\
-\xcf\xa2\xe5\xf7\xec\xb2\xb9\xf4\x8b\xdf\xbc\x4a\xbb\xf6\xee\xa7\
-\x6e\x0c\x00\xb8\xe9\x15\x85\xae\x08\x5f\xda\xd3\x9b\xf4\x99\x1d\
-\x03\x2a\x18\xc5\x40\xe8\x1a\xa3\x38\xb0\xb9\xb7\x75\x62\x78\x1b\
-\xb0\xed\x86\xc1\xf4\xcb\xdf\xfc\xf4\xc7\x32\x67\x8f\xc6\xc8\x6b\
-\x64\xa4\x8a\x72\x45\x6d\xe7\x37\x99\x83\xa7\xcf\xd0\xff\xf3\xff\
-\xfd\x8a\xfe\xe1\x5f\xfe\x95\xf6\x73\xc3\x09\xf3\x0f\xff\xf2\x2b\
-\x57\xaf\x11\xfe\x99\x31\x85\x07\x2a\x5c\x21\xc4\x86\x2d\x7d\xd8\
-\x7d\x75\x99\x1b\x0d\x4c\x65\xc9\xc3\x0d\x21\x85\x1b\x4f\xe7\xcd\
-\x07\x26\x99\xb0\x79\x78\x61\xd5\x22\xb9\xdf\x98\x5e\xbe\xc7\xd4\
-\x98\xa2\xb1\x31\xdd\x8f\x7c\x1b\x1a\x61\x62\x83\x1f\xbc\x07\x98\
-\x8f\x78\x98\xf3\x0a\x67\x89\x35\xe8\x1e\x6b\x02\x3c\x01\x64\x64\
-\x53\x12\x3f\xa6\xf8\x39\x0c\xc5\x07\xe5\x95\x99\xe7\xec\xfe\x34\
-\xdd\x0f\x0d\xce\xd8\x89\x23\x8b\x65\xe5\xdf\xf8\xad\x31\x1a\xad\
-\xbd\xa4\xb8\x98\xff\x22\x66\xc3\x73\xcd\xd1\xd3\x63\x77\xdf\x8d\
-\x91\x2d\x39\xbb\xb9\x41\x9d\x41\x7d\x45\xa7\x7f\xb8\xfa\x1c\x0d\
-\xa6\xa4\x52\x4b\x6b\xdb\xa8\xf3\x0b\xf6\xe5\x8b\x17\xd1\x92\xb9\
-\x65\xb2\xfb\x27\x28\xf4\x7a\x40\xdd\x06\xb6\x6c\xdb\xfc\xdb\xb9\
-\xe7\x9b\xc8\x73\xe4\x09\x28\x52\xe7\xdd\xf8\xc2\xb4\x74\x74\x5a\
-\xdd\xb7\xb6\xb4\x04\x8b\x4c\xc0\x06\xd4\xfd\x87\x8f\xd0\xeb\x7f\
-\x78\x5b\x46\x5a\x20\x94\x40\x08\x7b\x9d\x5f\x72\x44\xef\x9a\x84\
-\xe7\x86\xc3\x86\xff\x38\xcf\x16\x4a\x93\x8f\xb7\xdf\x71\xbb\xf8\
-\x13\x0c\x0f\x42\xb9\x24\xd5\x14\x28\x63\xcb\x2f\x74\xd2\x18\x65\
-\x95\x69\x57\x4b\x3b\x82\x78\x41\x8f\x10\x30\xa5\x77\x7a\xda\x74\
-\x27\x8f\x0d\xf9\x1c\x26\x24\x40\x95\xc2\x35\x6f\xca\x37\xa4\x0d\
-\x83\x1e\x36\x5b\xfc\x0b\xf2\x21\x80\x8e\x0c\x3b\xac\x7c\x4f\x9f\
-\x3d\xe7\x6e\x4c\x70\xc2\xe1\x3f\x92\xbf\x5e\x9e\xa3\x9c\x71\x0d\
-\xa3\x84\x6b\xd6\x9a\x37\x72\x74\x77\x74\x70\x90\xdc\x16\x02\x43\
-\xba\x6d\xf1\x5d\x50\x51\x49\x1f\x7c\xfa\x99\x4f\xab\xbb\x2b\x0c\
-\xc1\xf8\xca\x1e\x65\x3d\xd5\x50\xc1\x28\x46\x4c\x95\x16\x78\x23\
-\x25\xd1\x18\x4d\x27\x86\xea\x16\xb6\x1b\x06\x23\x09\xf8\x8a\xf8\
-\x6d\x55\x0b\x65\xe7\xc8\x86\x35\xab\x29\x23\xdd\x7d\xf0\x19\x69\
-\x1c\xf1\x10\x7b\x52\xbe\x48\xfa\xce\x43\xcd\x7f\x8c\x15\x3a\xda\
-\xc8\x8f\x8d\xb0\x46\x05\x8d\xc9\x20\x77\xe8\x91\x87\x49\x1e\x28\
-\x37\x7c\x79\xb8\x9d\x23\xa6\x2a\x4c\xee\x41\x6e\x6e\xee\xc8\x66\
-\x94\xd3\x69\x15\x5a\xef\xbf\x5f\x8e\x92\x44\x31\x23\xd3\x8a\x2b\
-\xb6\xf0\x12\x45\xf4\xdd\x5f\x6e\xbc\x38\x7e\x50\x46\xf7\xc1\x87\
-\x1f\x89\xd5\x74\xff\x83\xf7\xdc\xed\x74\xa0\xa2\x32\xc1\xc9\x0d\
-\x5b\xfc\x33\x33\x33\xe5\x68\x23\x5e\x8d\xdc\xb1\xd9\xbd\x3c\x1e\
-\x99\xd7\x61\xee\xa1\x9f\x65\xb2\x20\x75\x95\xeb\x2f\x3a\x08\x28\
-\x4f\xfd\xe5\xbf\xff\x56\x14\x53\x42\x45\x00\x88\x2f\xbf\x1c\x3b\
-\xd6\x10\xfe\xe5\x4b\x2f\x88\xf0\x6b\x12\x8e\xf0\x65\x7f\x9b\xfb\
-\x0f\xb8\x7d\x70\xa6\x21\xf9\x39\x82\x41\xfc\x02\x06\xd7\xba\xfb\
-\xfa\x45\xfd\xc4\x2b\xaf\xbd\x4e\x17\x6b\xaf\xd2\x20\xb7\x05\x98\
-\x7a\x83\x72\x4a\x28\x23\x34\x14\x99\xf3\x52\xc6\x75\x12\x23\x21\
-\x97\xd8\x7c\xb1\x6b\xb7\x98\x4b\x75\x0d\x32\xfd\x8f\xf0\x22\x0e\
-\xbd\x78\xb3\xf1\xc7\xde\x98\x7e\xb9\xc1\xb9\xcb\x7f\x2f\x08\x6b\
-\x7f\xb0\x86\x4d\xa6\x93\xa3\xb4\x23\x48\x8f\x2d\xbf\x9a\x9b\x9b\
-\x47\xb6\x23\x3e\x8c\xf1\x65\xca\xe6\xcd\x8b\x29\x6c\x28\xa7\x05\
-\xb6\xf0\x4d\x61\x87\x95\xef\xf1\xe3\xc7\xb9\x7e\xa4\xc8\x7a\x1f\
-\x08\x75\x98\x45\x80\x30\xe6\xd7\x80\x8d\x6b\xf8\xad\xa5\xad\xdd\
-\x18\x7f\x4c\xdf\x4a\xb9\x04\xea\x15\x08\xcb\x6f\xe8\x29\xf2\xd2\
-\x1c\xf9\x1c\x94\xa4\x3b\x50\xcf\xa6\x20\x2a\x18\xc5\x40\x79\x79\
-\xb9\x1c\x4d\x95\x2e\x1e\x6c\xee\xc3\x3a\x31\x68\x33\x35\x55\x5a\
-\xe0\xb7\x63\x1d\x47\x6f\x7b\x9b\x6c\xc9\x77\x76\xc3\x6c\x12\xc5\
-\x6a\x78\x78\xa4\x22\x7b\x95\xda\x7b\xb0\x43\x2a\xb4\x2d\xbc\x33\
-\x50\x38\x18\x82\x2d\x7e\x32\xd2\x04\x21\x0d\x0d\xa9\xd7\x98\x04\
-\xc0\x15\xcf\x7f\x73\xf8\x86\x26\x85\xfd\xc1\x22\x69\xd3\xfd\x10\
-\x1a\xb1\xce\x2a\x8c\xf6\x56\x47\x79\x64\xd0\xbd\xb7\xdb\x23\x51\
-\x98\xd3\xe3\x03\xd9\x82\x03\xa7\xe7\xcc\xe5\x5a\xeb\xfd\xb0\x57\
-\xf8\x54\x2e\x8c\x97\x1e\x23\xa4\x1f\x6b\x48\xb0\xfb\x05\x1f\x74\
-\x9d\x3d\x77\xae\xec\x36\x0a\xb7\x9f\xa3\xcb\x57\xae\x70\x3a\xdc\
-\xb2\xf5\x95\x31\x34\x3a\x03\x5b\x78\x05\x98\xca\x99\x44\x78\x1d\
-\x83\x37\x8d\x81\xd1\xbe\x0f\xbf\xf8\x8a\xfe\xef\x7f\xfa\x05\x55\
-\x5f\xac\xa1\x94\x19\x33\xa5\x53\xb1\xa5\xd7\x64\x47\x7d\x9d\x95\
-\x8d\xed\xf3\xee\x2e\x22\x1f\x0b\xf9\xd9\x06\x26\xf7\x58\xf3\x82\
-\xbc\xf6\x46\x0e\xfc\xf9\x1e\x81\xaf\xe1\xad\xff\x00\xd7\x97\x7a\
-\x6e\x4f\xd0\xa6\xec\x3f\x7c\x54\x0c\xce\xdb\xb1\x18\xdc\xe4\x16\
-\x76\xf8\x8d\x8e\x11\xed\x06\x77\xd0\x48\x73\xfa\x8c\x19\x54\x3c\
-\xab\x90\x72\xb9\xdd\x82\x5e\xb2\xfb\xd7\xdf\x41\xcf\x3e\xfa\x30\
-\x55\xce\x29\x15\x8d\xea\x7f\xf5\xe2\x73\xf4\xb7\x3f\xfd\x11\xed\
-\xfd\x76\xaf\x78\x13\x4c\xaf\x27\x94\xdb\xb0\xe5\x97\xb4\x0f\x31\
-\xb4\x23\xde\xc8\xb6\x29\xbf\xcc\xa2\x89\x43\xd4\x97\xc2\x18\xc2\
-\x06\x36\xf7\xcd\xee\x07\x8f\x83\x84\x95\xef\xbc\xd9\xa5\xf4\x77\
-\xff\xf9\xaf\xe9\xbf\xfc\xe5\x4f\x68\xf9\xfc\xb9\xb4\xba\x62\x3e\
-\xfd\xb7\x9f\xfd\x94\xfe\xb7\x9f\xbc\x4c\xcb\xca\xcb\x68\x95\x6b\
-\x47\x7e\x43\xd9\x25\x08\x86\x8f\xe5\x13\x9e\xc0\x6d\x4a\xbd\x2d\
-\xbe\xc1\xfc\x0e\xeb\x33\x26\x12\x68\xbe\xf6\xb4\x5f\x27\x0a\x2e\
-\x61\x25\x16\x4c\x95\x16\x78\x23\x25\xd1\x18\x55\x27\xc6\x15\x11\
-\x1d\xff\xce\xbd\xfb\xac\xe1\xdb\xec\xd8\x32\x5c\x5a\x98\x2f\xca\
-\xdc\x9e\xd8\xf2\x10\xa5\xa5\xf8\xde\xca\x43\x2a\x78\xb4\x39\x67\
-\x1b\xd1\x1a\x15\x27\xc8\x48\xb7\x69\xc5\xe6\x1e\x6f\x7a\x26\xba\
-\xb8\xc1\x07\xa6\xf8\xce\x2b\x29\x76\x1b\x04\xbe\x10\xe8\x6c\xb0\
-\x08\xdd\xf6\x41\x53\xa8\x3c\x10\x12\xd0\x0e\x44\x1b\x99\x71\xe0\
-\x80\x38\x83\xd0\xf0\x60\x48\x7c\x7f\xc8\xb7\xbf\xa0\xd1\x77\xed\
-\x4a\x16\xdc\x30\x4d\xc8\x69\x32\xc5\x1f\x8c\x65\x8d\xd1\x91\x13\
-\x27\xe8\xed\x0f\xfe\xcc\x9d\xfc\x65\xaa\xbe\x74\x99\xde\xf9\xf3\
-\xc7\xf4\xee\x87\x1f\xcb\x67\x35\x60\x70\x3e\xd2\xfe\x11\x35\x77\
-\x74\x1a\x47\x22\x6d\x6f\xb2\x00\x76\xe8\x5d\x31\x35\xd8\x37\x35\
-\x6e\x79\x0d\x8d\xca\x3a\x82\x43\x4b\x67\x17\xed\xde\x7f\x50\xd6\
-\x21\x41\x3d\x04\x46\x66\x62\x9d\x6e\xcb\xcd\xca\x1a\xfa\xe0\xad\
-\x57\x5f\xf9\x88\x05\xc5\x36\xf7\x50\xc6\x29\x1d\x96\xf3\xdf\x8e\
-\xdc\x83\x4e\x0e\x71\x75\x47\x8e\x61\x10\x6f\xef\x65\xc9\xbd\xd5\
-\x8f\x93\xc6\x69\x94\xcc\xcf\x8b\x68\x7c\x7e\xf6\x69\xfa\xf9\x0f\
-\x5f\xa4\xb9\x7c\x0e\xe5\x85\x2f\x43\xd9\xe2\xca\x15\xd2\x29\x63\
-\x3a\x08\xca\x55\xbd\xcf\x84\x98\x76\xd3\x7a\x76\x1b\xd1\xda\x1f\
-\x24\x03\x29\x0d\x4d\x2b\x63\x73\x8f\x91\xe7\x30\x6c\xf1\x85\x90\
-\x10\x4b\xd8\xe1\x42\x99\x99\xb0\xf2\x4d\x84\x1d\x42\x37\x46\x95\
-\x4c\x24\x2a\xbf\x27\x12\x4c\xf3\xc2\x24\x12\x15\x8c\x62\x60\xa2\
-\xd6\x18\x01\x34\x4a\x7b\xb8\xa1\xbd\x74\xad\xce\xea\x3e\x9a\x1d\
-\x42\xd2\x8a\x85\xf3\x45\x79\x58\x98\xce\x12\x0f\x9b\x7f\xa3\x5d\
-\x63\xe4\x8d\x04\x45\x7b\xb8\x46\xd3\xa8\x60\x6b\xfd\x5b\x16\x0d\
-\xd2\x4f\x3d\xf1\x38\xdd\xb5\x6e\x6d\x64\x84\xc5\x11\x92\x6e\xc8\
-\x67\x43\xa0\x85\xd7\xff\x6d\x25\xe0\xb9\xdf\xc3\x82\xa8\x74\x08\
-\x09\x6a\x10\x62\x4e\x0f\x5a\x21\x36\x98\xbe\xc0\x6e\x97\xe0\xfd\
-\x9e\x3d\xa9\xbf\x8f\xd2\xa7\xa7\x8e\xdb\x1a\xa3\xcb\x35\x97\x9d\
-\x8e\x52\x3a\x7c\xa7\x13\x75\x46\x0b\xc2\x8d\x33\xdc\x3e\x32\xcf\
-\xf0\x59\x01\x60\x0b\xaf\x49\x84\x6a\xd4\x49\xa7\x7c\x46\x03\x1a\
-\x7e\xa8\x19\x80\x31\xe9\x59\x1a\xad\xbf\x51\x41\x3d\x81\xe1\xf0\
-\x65\xbd\x89\xe4\x99\x93\x6f\x7d\x83\x37\x68\x3f\xa6\xdb\xfe\xed\
-\xb7\x74\xe2\xfc\x05\x5a\x1a\xa5\xbc\x60\xc7\xc8\x2f\x57\xd8\x61\
-\xf1\xad\xb9\x54\x23\x47\xd3\xfd\x18\x09\x02\xb1\xd4\x54\x2f\x9e\
-\x72\x94\x11\x00\xcf\x38\x69\xe0\x3f\xee\x9d\x43\x60\xa3\xc6\x9c\
-\x59\x05\xb4\x62\xc1\x3c\xd9\x4d\x37\xab\xa0\x60\xcc\xca\x25\x3d\
-\xa1\xdc\x86\xcd\xbd\xd7\x3e\x44\x4b\x69\xf8\xc8\xb3\x9d\x58\x5e\
-\x0a\xa3\xe7\xb2\xdd\xbd\x51\x28\xe3\x72\x0e\x2b\x5f\x90\x28\x3b\
-\x07\xe6\x9a\xe1\xd8\xee\x8f\x35\xbf\x27\x9a\x7d\xc7\x4e\x88\x49\
-\x24\x2a\x18\xc5\x88\xad\xd2\x79\x23\x25\xd1\x18\x75\x27\x86\xc6\
-\x8a\x1b\xb3\xba\xe6\x56\x69\x60\xc3\x76\x97\x80\x30\xfb\x83\x77\
-\x6f\x88\xaa\xed\x36\xea\x70\xb2\x85\xd1\x8e\x34\x05\xb1\xb9\xb7\
-\xbd\xe9\xe1\xa1\xad\xa9\x6f\xa0\x0d\x1b\xee\x12\x7b\xd0\x7d\x5f\
-\x67\x07\xad\x5b\x52\x25\x53\x8b\x5b\xef\xbb\x47\x86\xfa\x21\x14\
-\x6d\xd9\x6c\xde\x42\x8f\xdd\x73\xa2\xc3\x88\x3b\x0c\xc9\x7b\x43\
-\x67\x11\x0f\xd1\xd7\x18\x0d\x47\x3a\x28\x16\x2e\x2e\x37\x86\xef\
-\xae\x79\xf9\xd9\x67\xa5\x0c\x6d\xbf\x8f\x69\x8d\x91\x24\x1b\x9d\
-\xa8\xdb\x91\xca\x54\x8a\xd3\xf1\x87\x19\xaf\xa3\x0d\xe6\x19\x16\
-\xc1\xdb\x16\x86\xc2\x9e\xe7\xee\x52\xb2\x54\xc9\x98\x58\xb5\x74\
-\x09\xfd\xec\xc5\xe7\xa9\xa2\xa4\x88\x96\x73\x27\xfe\xb7\x7f\xf1\
-\x63\xfa\xd9\x4b\x6c\x2f\x75\xec\x4e\x9d\x77\x17\xa0\x8e\x17\xc8\
-\x33\xc9\x37\xe4\x19\x9b\x88\x90\x94\x4c\x1d\xdd\xbd\xf4\xca\xef\
-\xdf\x8a\xfa\xfc\xb6\x34\x35\x0d\x3d\x9b\x91\x0c\xb1\x8f\x0c\xd6\
-\xe0\xdb\x85\xf1\x76\x5d\x28\x9f\xa0\x31\x00\xa1\x68\x76\x7e\xae\
-\x4c\x97\xd9\x5e\x22\x82\x76\x6f\xf7\x6b\x98\x46\xf7\x30\x46\xdb\
-\xfe\x04\xb1\xb9\xb7\x8d\x3c\x7b\xd8\xe2\x1b\xed\xa5\xd0\x63\x74\
-\x42\x99\xbd\x7c\x13\x65\x4f\x49\x49\xe5\xbf\x23\xcb\x39\x51\xf9\
-\x3d\xd5\x50\x3d\x46\x31\x30\x91\x7a\x8c\x80\xe7\x2f\x16\xc2\x41\
-\x39\xe1\x95\xba\x7a\xf9\xc0\x2a\xa6\xe7\xc2\x94\xb7\x99\xec\xf8\
-\x56\x12\x74\xfb\xf4\xf6\x71\xe7\xef\xf4\x80\xf2\x9b\xc7\x78\xe8\
-\x31\x2a\x2e\x9d\x6d\x55\x0c\xe9\x07\x5f\x91\xc6\x07\x64\x4d\xf1\
-\x3f\x7a\xe2\xa4\x28\xae\x1c\x91\x47\x7c\x8e\x8f\x7c\x9e\xbf\x74\
-\x89\xae\xd7\xd7\xc9\x25\x93\x7b\x6c\xd3\xc5\x67\x51\xc2\x3e\xe8\
-\x8a\x35\x33\x97\x6a\xaf\xb1\x9f\x1c\x06\x77\x66\xb6\xf2\x88\x87\
-\x58\xf4\x18\x05\xc3\xc1\x19\x16\xbe\xa2\x91\xcd\xb1\x4c\xf7\x61\
-\x31\xe6\x91\xef\xbe\x8b\xd8\x81\xff\xf7\xb1\xe8\x31\xca\x62\x21\
-\xb4\xb6\xae\x8e\x85\x1d\x5f\x1e\xc4\x6a\x0c\xe0\x2a\x34\x68\x9f\
-\x3a\x71\x5c\xec\xc1\xf0\xa0\xa7\xaa\xfa\xdc\x79\x51\x64\x69\x53\
-\x44\x17\x8d\xdb\x57\xad\xb0\x3e\x5f\xb7\xb1\x50\xb6\x8f\xf3\x0a\
-\xf5\x3d\x92\x96\x38\xc8\x66\x21\x13\xfa\xae\x6e\x0c\x0c\xca\xc8\
-\x14\x14\x17\x42\x68\x80\xb0\x05\x44\x90\x09\xfa\xc9\x76\x84\xe5\
-\x19\xce\x4c\x39\x42\x19\xe2\xa3\x5b\xb7\x18\x95\xe7\xc1\xde\xdf\
-\xdf\x2f\xca\xfb\x38\xe3\x1d\x77\xcc\x9a\x95\x2b\xe4\x83\xa8\xa6\
-\xfb\xa1\x72\x02\x7a\x74\x86\x95\x53\x82\x28\xc9\xcb\x09\xfd\xcc\
-\xce\x47\x1f\x7f\x4c\xd7\xb8\x1d\xea\xe4\xf6\x0b\xf9\x8b\xc5\xdc\
-\x68\x9b\x6a\x1b\x9a\x68\x3f\xdb\xbb\xdb\xdb\x44\x60\x0e\xba\x5f\
-\xb5\x7a\xb5\x28\x27\x74\xe2\x3c\x94\x4e\x30\xda\xf6\xc7\x4f\x58\
-\x7e\x35\xb0\x60\xe4\xec\xa8\x1b\x1e\x2e\x18\xad\x72\x5b\x3f\xd0\
-\xd2\x8f\x0f\xc8\x82\x60\xf8\x3b\x76\xef\x31\x86\x1d\x16\xdf\x0b\
-\x57\x6a\xa9\xab\xaf\x5f\xda\xbf\x1d\x7b\xf6\x48\xfc\xa1\xbc\x53\
-\xec\xec\x5f\x6c\xf6\x69\xc3\x3f\x50\xec\x0b\x3b\x11\xf9\x3d\x15\
-\xd1\x11\xa3\x18\x31\x55\x5a\xe0\x8d\x94\x44\x63\xac\x0b\x65\x51\
-\x31\xa5\x82\xba\x8b\x20\xcf\xb0\xa0\x7a\x9e\x1f\xd6\xbd\xc7\x4e\
-\xd0\x6b\x6f\xbf\x2b\xbb\x4b\xae\xb7\xb6\x59\xfd\xf7\xdb\x97\x55\
-\x55\x59\x47\x8d\x46\x3b\xf2\x33\x91\x6f\x7a\xc8\x1b\x68\x0f\x3f\
-\x78\xaa\x3a\xa6\xe9\x0a\xe0\xb7\x43\xcf\x13\x46\x8a\xce\xd5\x5c\
-\x21\x74\x75\x5e\x43\xe0\x6f\x40\x46\x4b\x6c\x6b\x8c\x02\xb8\x61\
-\x63\xa1\xec\xd2\xe5\x2b\xe4\x52\x3c\xe9\x01\x63\xd5\x63\xc4\x91\
-\x70\x8f\x89\x61\xdf\x21\xbb\x10\x07\xb2\x59\x20\x1e\xf6\xc9\x8c\
-\x38\x80\xd0\x12\xf6\x2d\x36\x7c\x46\x01\x7e\x3a\xff\xe2\xe7\x67\
-\x2f\x3e\x67\x1d\x89\xba\x7d\xd5\x4a\x79\x8e\x4c\xcf\x52\x04\xb7\
-\x3c\xa5\x53\xe2\xe7\x17\xca\x45\x6d\xe5\x77\xe7\x9d\x77\xba\xc9\
-\x1f\x8a\xab\x4d\x65\x07\xb8\x43\xea\x57\x6c\xa9\x9a\xc1\xc2\x1c\
-\x3e\x01\x02\x83\xdd\x8d\x30\x38\xc7\x74\x63\x30\xcf\xb1\x26\x31\
-\x4c\x28\xfa\xf7\xd7\xdf\xa0\xa3\xd5\x67\xe9\x4a\xbd\xa3\xfd\x18\
-\x2a\x0c\xb0\x5d\x5d\xf4\xdb\xc8\xda\xa5\x14\xb9\xcf\xe6\xde\xc6\
-\x44\x8d\x3c\x7b\xd8\xe2\xeb\x8d\x04\x45\x63\x34\xcb\x01\x1a\xb8\
-\xed\xb2\xdd\x8f\x35\x64\x35\x2c\x1c\x21\x8f\xb1\xc8\xbf\xbd\xbb\
-\x97\xcf\xeb\xc4\xe0\xdc\x6c\xbf\x26\xc6\xb9\x1f\x1a\xc9\x5d\x45\
-\x8c\xa8\x7f\xe2\xeb\x10\x89\xca\xef\xa9\x46\x54\xc1\xe8\xfd\xaf\
-\x76\x8a\xb9\x95\x09\x5b\x63\x94\x3e\x3d\x7c\xe7\x93\x1f\x93\x7b\
-\x10\xad\x13\xf3\x23\x0d\xac\x08\x48\x49\x32\x44\x0f\x21\x09\xdf\
-\x49\xc3\x54\x1b\x16\xc2\xfe\xf7\xff\xf7\x17\x2c\x24\xbd\x2e\xf7\
-\xda\xc2\xab\xbb\x76\xd5\x6d\xc8\xd9\x18\x1a\x74\xdb\x43\x12\x6d\
-\x38\xd9\x16\xde\x78\x36\x2a\x02\xe7\x09\x34\xf8\xde\xb7\x61\x3d\
-\xe5\xc4\xf1\x81\x49\x28\xbf\xc4\xee\xaa\x5f\xbe\xf2\x6f\xa2\xd1\
-\xd5\x11\x8a\x12\x33\x52\xe4\x27\xee\xf4\x00\x84\xcf\xf1\x78\xef\
-\xe3\x4f\x62\x4e\x4f\x5c\xfe\x33\x36\xf7\xce\xf4\x4c\x02\xe1\xb4\
-\x40\xbb\x72\xb4\xe9\x34\x68\xef\x95\xef\x49\xc5\xd8\xd1\x7b\xe4\
-\x71\xc7\x8e\x91\x1c\x5b\x7a\xbe\xdd\xeb\xec\x8e\xe2\x88\xc4\x2f\
-\xee\xf1\xf3\xf1\xe9\x67\x9f\xc9\xa9\xc9\xff\x59\x05\xf9\x1c\xe7\
-\x01\xe7\x39\x32\x3c\x4b\xc3\x40\x99\xb2\xd9\x7f\xe0\x80\x58\x8d\
-\xf1\x15\x2f\x86\xfb\x73\xe2\xd4\x69\x39\x9a\xee\x17\x65\xa4\x4c\
-\x2c\x39\xf6\x37\x3f\xfe\x21\xbd\xfc\xf4\x76\x2a\xcb\xcf\xa5\x25\
-\xf3\xca\xd8\xfe\xb2\xd8\x0b\xe4\x83\xb7\xc3\x5f\x94\xf0\x19\x1e\
-\xdb\xf4\xd9\x90\x5e\x32\xae\xa2\xd2\x06\x0d\x4d\x19\x3a\x2f\x6e\
-\x8e\xb9\xe7\xde\x7b\xe5\xfe\xa0\xfb\xb1\xae\x31\x8a\xc6\x78\xae\
-\x31\x8a\x05\x9b\x7b\xa3\x50\xc6\xf5\x01\xbb\x39\x81\x29\xbe\x45\
-\x88\x13\xdf\x23\xed\x3d\xe7\xad\x97\xcf\x76\xe3\xde\x27\xed\x98\
-\x77\x74\xfa\x0b\xaf\xfe\x05\xb1\xc5\x37\xd6\xfc\x9e\x68\x8a\xf9\
-\x19\x84\x49\x24\x3a\x62\x14\x23\xa6\x4a\x0b\xea\xeb\xeb\x8d\x8d\
-\x99\x1f\xec\x80\xda\x78\xff\x7d\x72\x6e\xab\x84\x26\xd0\xe8\xe6\
-\x64\xcc\xa4\x9c\x99\x33\xa8\x62\xde\x5c\xf9\xc8\x20\xec\xb9\xd0\
-\x4b\x01\xe4\x0d\x94\x8d\xff\xc1\xe0\xb7\xb5\xfa\x96\x16\x6a\xee\
-\xea\x91\x5b\x4c\xe1\x41\x6d\x3d\x1a\x71\x53\x3b\x3e\xd9\xd6\x18\
-\x81\x12\x6e\xe8\xff\x92\xdf\xe2\xb1\x3b\x06\xca\x19\xb1\xc6\x01\
-\x1f\xb4\xfc\x35\x0b\x88\xbf\xfc\xcd\xab\x74\xae\xe6\xb2\x6c\xa1\
-\xde\xf1\xcd\xb7\x32\xb2\x86\xaf\xda\x5f\xe0\x37\xac\x7f\x66\x81\
-\xe8\x9d\x3f\x7f\x24\x1a\x5d\xf1\x86\x2b\x8b\x88\x91\x9f\x96\x06\
-\x64\x34\xc4\xbb\xc6\xc8\x0f\x62\x80\xe9\x43\x7c\x21\xde\xe6\xde\
-\x66\x1f\xab\x1e\xa3\x84\xc3\xf9\xb9\x6b\xdf\x81\xd0\xf8\x3f\xbc\
-\xf1\xc1\x88\x9e\xa6\xd0\x11\x18\x1f\xb8\x1f\xdf\x6a\x0b\xcb\x8f\
-\x06\x4c\x4d\x8d\x46\x28\x72\xc1\x02\x67\x9b\xff\x18\xa9\x4a\xe5\
-\xe7\x4e\x04\x0b\xb9\x12\x4e\x0a\xd7\xaf\x99\x21\x1a\xa5\x77\xba\
-\xdf\xca\xf2\x83\xcf\x5e\xd8\xee\x47\x7d\x47\xfb\x22\xcf\xb3\x5c\
-\x31\x23\x1f\x8b\x65\x4c\xf9\x83\x11\x53\x99\x16\x44\x9e\xbb\xf9\
-\x1e\xa6\x51\x1e\xd3\x33\xd2\x51\x63\xb1\x3d\xa7\x5d\x84\x21\xaf\
-\x2d\x92\xe7\x67\x68\x9d\x99\xc9\x7d\x18\xb7\xe2\x1a\xa3\xb0\xf2\
-\xad\x93\xcf\xc0\x20\x2f\xd9\xb8\xd3\xcc\x91\x7c\x8e\xe4\xb7\x73\
-\x7d\xeb\x03\xf7\xd1\xd2\xf2\xb9\xb4\x74\xfe\x5c\x7a\xf9\xd9\xa7\
-\xe8\x47\x6c\x96\xf0\x39\x8c\xad\x7f\x9a\x0a\x6b\x8c\xd6\x2d\x5b\
-\x22\x26\x91\xa8\x60\x14\x03\x61\x7a\x8c\x8a\x45\x07\x8b\x23\x64\
-\x98\xaa\x1e\x1a\xee\x1f\x3d\xfb\xb4\x6c\x61\x35\xb9\x07\xd6\x4e\
-\xac\xbf\x9f\x16\x96\x16\xd3\x5f\xfe\xe0\x45\xd9\x72\x9f\x9d\x96\
-\x42\x0b\x67\x97\x38\x5f\x4d\x76\xa7\x1d\xe4\x91\x19\xf6\xb0\x38\
-\x0d\x15\x86\x52\x6d\xe1\xdd\x76\xdb\x6d\xec\x14\xb1\x35\x37\xa6\
-\xb6\x87\x24\xda\xc8\x8f\x2d\xbc\xf1\x6c\x54\xa0\x1c\xed\xa5\xa7\
-\x9f\x92\x35\x1f\xde\xfd\x73\xe7\xcf\x97\xf5\x3b\x50\xdd\xdf\xd2\
-\xd1\x41\x8d\x6d\xed\xb4\x9b\x3b\x65\x98\xba\xeb\x2d\xd4\xd4\xda\
-\x4e\xf5\xd7\xaf\xcb\x7c\x7f\x44\x20\x92\x06\xde\xc9\x43\xaf\x51\
-\x4f\x14\xf1\xa4\x67\x18\x6e\x83\xd7\xc4\xf1\xbf\xc4\x6f\x95\xb6\
-\xfc\x1d\xad\xff\x36\xf7\x18\xbe\x4f\x34\xc8\xd1\x63\xa7\xab\x43\
-\x85\x0c\x74\xf2\xcb\x16\xce\xa7\xe5\x55\x95\xee\x54\xaf\xdb\x59\
-\x9b\xe0\xeb\xd1\x76\x17\xc2\x0e\x3d\x4b\x08\x13\xf9\x28\xe5\x3a\
-\x8a\xb2\x2d\x2a\x75\x46\x65\x4c\xfe\x43\x03\xfd\x53\x8f\x3c\x2c\
-\xc2\x1c\xff\xb1\xc7\x17\xf0\x6f\x25\x05\x79\xb4\x65\xf3\x66\xb1\
-\x9a\xfc\xc3\x3a\x2b\x89\x2b\xe7\x98\xc4\x94\xcf\x07\xd8\x6f\x7c\
-\xc0\xd6\x74\x3f\x78\xf8\xa1\x4d\xec\x35\xc2\x77\x4d\x10\xbe\xb6\
-\xb4\xb2\xd2\xea\x3e\x6d\xc6\x0c\xc7\xbd\xd7\x1a\xf0\xb9\xff\x79\
-\x0a\xde\x9f\x95\x95\xed\xe6\xa7\xf3\xac\x44\xf2\xd6\x83\xdd\xaf\
-\x5d\xb1\xcc\xba\x7b\x6d\x4c\x7a\x8c\x62\x60\xb4\x23\xcf\x13\x25\
-\x94\xa1\x7c\xab\xcf\x5f\x30\xc6\x17\xf5\x6b\xc5\x12\x7c\x11\x00\
-\x65\xcb\x07\x7f\x3e\x7b\xf0\xb5\xe9\x2c\x6c\x5f\xb9\x78\x51\x46\
-\xce\xa1\x32\x01\x9f\x79\x39\x7e\xe4\x08\x0b\xe1\xd3\xe9\xee\xbb\
-\xee\x1a\x21\xf8\xfa\xb1\xc5\x37\xd6\xfc\x9e\x68\xa0\x16\x03\x26\
-\x91\xa8\x60\x14\x0d\xae\x74\x61\x73\xc0\x5b\xb7\x6c\xa6\x6d\xfc\
-\xa6\xeb\x35\x8a\x5e\x03\x05\x8d\xa4\x73\x0a\xf3\xe9\x2f\x5e\x7c\
-\x9e\x85\xa2\x4c\xab\x7b\xcf\x6e\xc2\xd6\x89\xa0\xd1\x1a\xb6\xbb\
-\xcc\xab\xec\x1c\x26\x1a\x29\x18\xa8\x99\x07\x26\xf7\x2d\x6d\xad\
-\x72\x6e\x62\xb2\xad\x31\xaa\xaa\x58\x28\x47\xff\xfd\xf3\xe6\xcc\
-\xa1\x59\x79\x79\x4e\x5e\x78\x02\xa3\xbc\xdd\xfa\x8c\x0c\x33\xe3\
-\xc8\x86\xef\x93\xbc\x13\x1f\x12\xcb\x98\x47\x66\x24\x6e\x49\xf4\
-\xd6\xfb\x76\x0d\xe8\x20\x68\x1f\xfb\x1a\xa3\x04\xe3\xe6\x71\xd8\
-\x48\x26\x80\x7d\xdb\xc6\x07\xe4\xcd\x17\xdf\x87\x9b\x53\x52\x2c\
-\x1a\xa1\x93\xd8\x2d\x0c\x46\x3e\xa0\x76\xc2\xdb\x5d\x18\x26\x14\
-\x61\xe4\xb0\xa7\x1f\x1a\xd7\xb9\x99\xc3\xf3\x80\x38\x8c\x82\x03\
-\x47\x8f\x85\xc6\x77\xee\x9c\xd9\xb4\x6c\xc1\x3c\x79\x26\xbd\xef\
-\x9e\xe1\xb9\xf4\x9e\x4d\x28\x59\x85\x10\x07\x05\x88\xcf\x6f\x37\
-\x7f\xf0\xd8\xb3\xf7\xc9\xb3\x3c\xbc\x2e\xe2\xfc\x0f\xef\x7f\x20\
-\xe7\xa6\xf0\xab\x16\x2e\x10\x1d\x43\xc3\xda\x03\x5f\xd8\xf7\x6f\
-\xb8\x93\xda\x9a\xcc\xcf\x27\xa6\x93\x65\x0d\x96\x30\x14\xea\x99\
-\x33\x4e\x47\x63\x0a\xaf\x4c\xa6\xef\x9c\x38\x06\x73\x14\xeb\xbd\
-\xd6\xaf\xb9\x8d\xa8\xa7\x5b\xec\x26\xf7\x61\xdc\x8a\x6b\x8c\x90\
-\x87\x58\x58\x0d\x4c\xe1\x6f\x14\x8d\xf7\x69\x52\xb6\xc3\xda\x7b\
-\x0f\xb6\x63\x3a\x19\x75\xcf\xe4\x1e\xe5\x6b\x1b\x85\x9d\x0a\x6b\
-\x8c\x6a\xae\xd5\x89\x49\x24\x51\x77\xa5\x29\x44\x2d\xfc\xd6\x59\
-\xc2\x0d\xb2\xa9\xd2\x01\x7c\x15\x7e\x76\x61\x01\xdd\xbe\x66\x0d\
-\x2d\xe6\x8e\x3a\xa9\xbf\x57\xb4\x4e\x3f\xfe\xf0\xc3\xf2\xb9\x03\
-\x5b\xa5\xf3\xec\x3b\xf6\x7c\x23\xdf\x45\x8b\x74\xd2\x2e\xa8\xc6\
-\x77\xac\x5e\x65\x74\x9f\x3d\x73\x26\xe5\x73\x98\xf8\x8c\x86\xd7\
-\x3c\x79\x2e\xd1\xe1\x97\xcd\x2a\xa4\x6d\x5b\xb6\x88\x3d\xe8\xfe\
-\xc3\x8f\x3f\x91\x35\x1f\x22\x1c\x20\x3c\x5f\x98\xa3\xdd\x5d\x36\
-\x51\xbb\x49\x16\x2d\x98\x3f\x62\xb7\x13\xbe\xa2\x8d\x35\x2b\x3f\
-\x78\xee\x59\xba\xeb\xf6\x75\xd4\x7e\xbd\x89\x0a\x72\xb2\xe5\xcd\
-\x7a\xd5\xb2\xa5\xf2\x55\xfa\xfc\xac\x2c\xba\x67\xc3\x7a\x9a\x5f\
-\x36\x87\x3a\xdb\xdb\x24\xb3\x21\x88\x02\xf1\xdd\x12\xc7\x78\x09\
-\xdb\xfd\x75\xa5\xae\xc1\x49\x4f\x20\x4d\x41\xf0\x1b\x1a\xb5\x99\
-\x19\x99\xb4\xb8\xb2\xc2\x98\x3f\xc0\x6f\xc7\x62\x74\x53\x9d\xf2\
-\x08\xdb\x2d\xf7\xf5\xce\x5d\xd4\xd1\xdd\x13\xb5\xbc\xe2\x05\xbe\
-\xb4\xb2\xc0\x86\x4e\xc6\xb6\xdb\x0e\xc0\x8e\xdd\x83\xf8\x8a\xfd\
-\xf2\x45\x55\xd4\xd6\xd8\x20\xd3\xa5\x2f\x3e\xbd\x5d\xb6\xe5\x5f\
-\xe0\x4e\x3b\x6c\x77\xa1\x67\xcf\xca\xcb\xa7\xef\x8e\x1d\x8f\xac\
-\xb7\x18\x55\x5a\xf8\x7e\x4c\x35\xa1\x63\xda\xb6\xd5\xfc\x3c\x79\
-\xf1\xdd\xce\xf5\xff\x8e\xdb\x56\x73\x7d\x6b\xa4\x7c\xae\x7f\xdb\
-\x36\x6d\xe4\xe7\x77\x25\xf5\x76\xb4\x49\x7e\x43\x39\xa7\x77\x3f\
-\x08\xc6\x17\x1a\xc4\xa1\xdc\x73\xd8\xba\x10\xc0\x71\xe8\xe2\xf2\
-\xd8\x74\xff\xfd\xb2\x23\xce\xe4\x1e\xc2\x23\x76\xbb\x65\x73\x1d\
-\x69\x6d\x6d\xa1\xac\x19\x33\x68\xe5\xb2\x25\x74\xef\x9d\xb7\xd3\
-\xe5\x0b\xe7\xe5\x3e\x53\x7e\x9d\x38\x5d\x4d\x47\x4f\x9d\x72\x5e\
-\x12\xdc\xe9\x30\x80\x76\xc1\xf6\x3c\x9f\xab\xae\x16\xfd\x61\x50\
-\x6b\xe1\xe5\x27\xa6\x08\x21\xc4\x3e\xca\x42\xad\xad\xfd\xf0\xec\
-\x5f\x7e\xf5\x95\x7c\x11\xde\xa9\x5f\x6e\x1d\x73\x99\xb0\xdd\xad\
-\x4c\x59\x69\xa9\xb4\xdf\xc1\xf8\xc2\x8e\x9d\x7f\xb1\xb4\x61\xe5\
-\xdc\x9e\xd8\x76\x5f\x62\xb7\x98\x6d\x67\x6d\x58\xf9\xa2\x3d\x9b\
-\xc5\x2f\x09\x8b\xaa\x2a\xa9\xb3\xb3\x93\x3a\xba\xba\xe4\x3a\x5e\
-\x90\x4b\x8b\x66\x51\x6e\xc6\x8c\xd0\xe9\xe4\x3f\xbc\xf7\x27\xea\
-\xc1\x2e\x64\x43\xdc\x13\x91\xdf\x53\x91\xa8\x82\x11\x54\x6d\x63\
-\xcb\xfe\xad\xbc\x5d\x7f\x90\x3b\xa5\x95\xfc\x96\x0a\x0d\xbd\xc1\
-\x4a\xe7\xb7\x63\x4b\x38\xb6\x0c\xa3\x91\xdc\xf8\xe0\x83\x72\xdd\
-\xfb\x1d\x6f\x66\x29\x7c\xdd\xe4\xde\xd6\x89\xf5\xf3\x1b\x6f\x2d\
-\x57\xcc\x99\xfc\xb6\x19\x0c\x0f\x5b\x9c\xa1\x0c\xae\xab\xa5\x45\
-\xbe\x8f\xb6\x8a\xe3\x87\x87\x32\x95\x7b\x78\x28\x64\x7b\x64\xeb\
-\x56\xb9\x2f\x18\x1e\xf4\x8c\x9c\xb9\x74\x99\x6e\x70\x38\x4e\x63\
-\x38\xbc\xc2\x8f\x76\xcb\xea\x44\x35\x2a\x97\x2e\x5f\x09\x15\x5a\
-\x61\xc7\x70\x34\x84\x00\x34\x3a\x10\x52\x50\x3e\xe8\xa4\xf2\xf9\
-\xed\x11\x5b\xf8\xa1\xb1\xf7\x99\x27\xa1\x0c\x72\x8d\xcc\xe9\x77\
-\xb0\xd0\x88\xd1\x06\x09\xc5\x12\xd7\x58\xe9\xeb\x6c\xb7\x76\xe2\
-\x98\xee\x93\xf4\x04\xd2\x64\x02\xbf\x36\xb5\x34\x73\xfc\x6a\x65\
-\xc1\x7f\x58\x7a\x41\x34\x15\x10\xe8\xb4\x6d\x9d\x6c\x0b\x0b\x2f\
-\xe3\x21\x18\xc1\x1f\xf8\x84\xfc\xad\xe2\x46\x7e\x76\x71\xb1\x35\
-\xfe\x63\xb5\x17\x14\x15\xd1\x57\xbb\xf7\xc8\x87\x50\x23\xd3\xa4\
-\xa3\x4c\x07\x5c\x75\xb2\x70\x84\xfa\x8d\xe9\x3e\x10\x16\xbe\xbf\
-\xbe\xe1\x7e\x08\x19\xd1\xe2\x8b\xf6\xe1\x83\xff\xf8\x4c\xbe\xf3\
-\xe5\x8c\x68\x8e\x8c\xef\x85\x4b\x97\xe4\xab\xfc\xc0\xe4\x1f\x54\
-\x00\xe0\xf9\xc1\xa7\x3a\x9e\x78\xf4\x11\x51\x31\x62\x13\xca\x61\
-\x97\xdd\x98\x7f\x78\xc7\x29\x17\x4f\x18\x43\x98\x6c\x30\xb8\x70\
-\xc7\x6d\xe6\x97\x32\x00\xe5\xa9\xd0\xc0\xde\xcc\x2f\x66\xd8\xbd\
-\xf6\xc2\x53\x4f\x8a\xd0\x1a\x16\x1e\x80\xbd\xaf\xbf\xdf\x2a\x18\
-\x4d\xd4\x96\x79\x30\x91\x42\x19\x88\x56\xbe\x78\x5e\xa0\x92\x04\
-\x2f\xdd\x4f\x3f\xfe\x28\xdd\xb5\x76\x0d\xd5\x73\x7b\x85\xe9\x32\
-\xd3\xfd\xe0\xbd\xf7\xdf\x97\xcd\x39\x08\x53\x04\xee\x40\xdc\x13\
-\x91\xdf\x53\x91\xa8\x53\x69\xe3\xa1\x6e\x7b\xb2\x81\xea\xb0\x7b\
-\x7f\xf8\xc2\x51\x60\xb3\x2f\xa8\xac\x94\x6f\x49\xd9\x7e\xb7\xad\
-\x31\x42\xb8\x50\x5e\x18\xb6\x9b\x07\x6a\xf7\xf1\xa6\x8a\x85\xc7\
-\x78\xa8\xd0\xc9\x87\x4d\x2f\x60\xe1\x31\xbe\x72\x2f\x0b\x24\x11\
-\x82\xa1\xb2\xdb\xd2\x13\x6d\x38\xd9\x14\x1e\x18\xcf\x35\x46\x48\
-\x4b\x5d\x6b\xbb\x34\xf2\xb6\xf0\xe3\xb1\xa3\x53\xc1\x77\x89\xd6\
-\xaf\x59\xcd\x9d\x83\x3b\x35\x31\x46\x6c\xe1\xc5\x85\x34\x4c\x49\
-\x74\xfe\x6a\x9d\x74\xa2\x20\x5a\x7a\xa2\x61\x73\x3f\x1e\x6b\x8c\
-\x22\x20\x1d\xdc\xd0\x42\xbb\xf7\xab\xaf\xbf\x21\x97\x6c\xf1\x1f\
-\xad\x1d\x1f\x74\xfd\xec\xeb\x9d\xdc\x01\xe2\xe3\xaa\x4e\xa3\x6e\
-\xea\x88\x62\x86\xdd\x62\x84\xe4\xdf\xdf\x7a\x5b\x04\xe6\x44\xc7\
-\xd7\x11\x8a\x3e\x95\x35\x71\x4e\x7c\xd9\xc8\x2f\x43\xc0\x8e\x4e\
-\xf5\xd4\xc5\x9a\x84\x84\x8f\xe7\x05\x1f\x94\x95\xb6\xc0\xcb\x23\
-\xf9\xd5\x01\xba\xd9\xde\x78\x9b\x85\x26\xc6\xe6\x1f\x84\x3e\xb4\
-\x37\x8f\x3f\xf2\xf0\x88\x35\x49\xf8\x0c\x0a\xf4\x1c\x79\x76\xe0\
-\xfd\xae\x6b\x8c\x46\x12\x6f\xf9\x86\xad\x01\xf3\xec\x78\x09\xbe\
-\x78\xe5\xaa\xb4\x1b\xd2\xde\x23\x10\xc3\x73\x60\x73\x1f\x6b\x7e\
-\x4f\x45\xa2\x0a\x46\xe3\xa1\x6e\x7b\xd2\xc1\x95\x09\x95\x16\x5f\
-\x98\xb6\x55\x22\x9b\x3d\x23\x27\x97\xde\x7e\xff\xcf\xf4\xdd\x91\
-\x23\x62\xb7\xdd\x6f\x84\xc3\xc5\xc2\xbc\xd7\xdf\xfb\x13\x7d\xf4\
-\xc9\x27\x72\x29\xde\xf0\x3d\x3b\x1e\x92\xb3\x97\x2e\x8b\x82\x39\
-\x69\x08\x2d\x8a\xf4\x26\xdb\x1a\x23\xa4\x00\x3a\x3e\xfe\xe7\x6f\
-\x5e\x95\x11\x12\x9b\xfb\x78\xed\x7d\x1d\xed\x94\xcf\x42\x52\x64\
-\xdd\xc6\x28\x49\xe4\xee\x2f\x94\x17\x46\x2f\x3f\xfc\xfc\xcb\xa8\
-\xf1\xbf\xe9\xd6\x18\xf9\x90\x4e\x98\xeb\x20\x54\x4c\x5c\xac\x6b\
-\x88\xfb\x83\xab\xc0\x64\x87\xd0\x32\x98\x94\x42\x7f\xfe\xf4\x33\
-\x57\x28\x1a\xdb\x48\x91\x1f\xf8\x81\x51\xb8\xe3\x17\x6a\xa8\xfa\
-\x9c\xfd\x25\x27\x5e\xfb\x82\x8a\x4a\xfa\xdd\x1f\xde\x91\xc5\xb7\
-\xce\x74\x1f\x3a\x30\x8e\x6f\x30\xce\xc8\x33\x36\xf8\xe0\x2b\x34\
-\x68\x8f\xa5\x3d\xc0\x9a\x13\x08\x45\xcd\x32\x7a\x61\x0e\x13\x67\
-\x78\x29\x5b\x58\x55\x25\xf6\x78\xfd\xff\xf5\x6f\x7f\x17\xba\xd0\
-\xde\xc6\xad\xb8\xc6\x48\xf0\x95\xef\xeb\xef\xfe\x51\xda\x6b\x60\
-\x8b\x4f\x34\xfb\x07\x7f\xfe\x90\x8e\x9c\x3e\xc3\x75\xb6\xd7\x99\
-\x19\x80\x91\x52\x1d\xce\x54\x58\x63\xb4\x6a\x51\xa5\x98\x44\x12\
-\x55\x30\x52\x1c\x50\x69\xa1\x70\xef\xf3\x9d\xbb\x62\xaa\xa4\xd8\
-\x5d\x72\xbd\xa3\x93\x3e\xdf\xc1\x6f\xae\x7d\xdc\x48\xb3\x7b\xdb\
-\xfd\xe8\xc4\x46\x56\x59\x07\xb8\x6b\x63\x7f\x8e\x9c\x39\x47\x83\
-\xa2\xd6\xdd\x5e\x89\x6d\x76\x0c\xa7\x1e\x3f\x7b\x9e\x1a\xa1\xfd\
-\x54\xa6\x15\x92\xd9\x63\xb7\x31\x34\x60\xf3\xaf\x52\x1e\x7a\x5b\
-\x4c\xed\xe1\x9f\x95\x46\xc5\xee\xce\x23\xbc\x51\xb1\xb8\xe7\x34\
-\x40\xfd\xc0\xec\x59\x85\xb4\x29\x30\x7d\x69\x8b\x4f\xac\xf6\x97\
-\x9e\x79\x8a\xb2\xa1\x1a\x21\xda\x6e\xa3\x28\xd8\xfc\x8f\x21\x4b\
-\x46\x80\xfa\x70\xe6\xe2\x45\x11\x70\xa3\xc5\x3f\x9a\xf7\x36\xf7\
-\x09\xd7\x63\x64\x00\xe9\x40\x63\x0d\xc5\x80\xaf\xfe\xfe\x0f\x74\
-\xee\x72\x2d\x2d\xac\x74\x1a\x37\x5b\x7a\x6c\x76\x74\x22\x98\x2e\
-\x38\xca\xcf\xc8\xbe\xc3\x87\x9d\x3a\xee\x9f\x3e\xb3\xd4\xf3\xb8\
-\x40\x7c\xd9\x40\xe0\x7a\xf7\xa3\xff\x90\x8f\xeb\x2e\xac\x8c\x5f\
-\x68\x00\xb0\xe3\xab\xf8\x10\xe2\xde\xf9\xe0\xcf\x32\x95\x8e\x67\
-\x12\x1d\x18\x46\xd3\x24\xce\x26\x24\x2d\xc8\xb3\xeb\x91\xf6\x20\
-\x9e\x91\x52\x8c\x4c\x7d\xf6\xd5\xd7\xf4\x6f\xbf\x7f\x33\x22\x14\
-\x59\xc3\x74\xc3\x7a\xe3\x8f\xef\xd3\xeb\x7f\x78\x5b\x2e\xc5\xe6\
-\xff\x0e\xf1\xbf\x97\x85\xd4\xf9\x0b\xcd\xcf\xf3\xbe\xfd\x10\xca\
-\xed\x65\x62\xf3\x3f\x5a\xfb\xe3\x11\x3e\xf2\x6c\x77\x1f\x26\x24\
-\x38\xae\xa2\x87\x0d\x6c\xf1\xcf\xcd\x75\x54\x26\x58\x71\xf3\x1c\
-\x0a\x19\x0f\x73\xf9\x16\x14\x97\xc8\x65\x9b\x7f\x26\x3b\xea\xc3\
-\x6f\x58\x28\x3d\x71\xee\xbc\x94\x81\x08\xbe\x28\x63\xf1\xdb\x1c\
-\x7f\x9b\x7f\xb1\xe6\xf7\x44\x53\x56\x5c\x24\x26\x91\x4c\xcb\x29\
-\x2b\x1f\xfb\x5c\xc1\x2d\x82\x8c\x1c\x0c\x0e\xf2\xff\x41\x99\x5f\
-\x87\x42\xba\xe3\xc7\x9c\x35\x31\xd8\x02\xdf\xdd\xdb\x43\xbb\xa0\
-\x86\x5d\xb4\xc0\x3a\x1a\x6b\x9d\xc6\x39\x49\xd6\x27\x2d\xad\xaa\
-\xa4\x33\xd5\xd5\xd2\xc9\x2e\x74\x85\x80\xb3\x67\xcf\xd0\xb5\xa6\
-\x66\xea\x1b\x18\x74\xd6\x16\x40\x60\x09\xc2\xf7\x23\x6c\x67\xf4\
-\x62\x90\x72\x33\x32\xe8\xb6\x55\x2b\xc5\x4f\x84\x8f\x9d\x20\x5e\
-\xa5\x46\x27\x81\x61\xff\xca\x45\x55\xf2\xe6\x76\xf0\xc8\x11\xea\
-\xea\x46\x3c\xd0\xb0\xbb\x8d\xa0\xa9\x21\x74\x81\x7a\x01\xec\xae\
-\x59\xb8\x60\x01\xdb\x6e\x50\x75\xb5\xd3\xc8\xe0\x21\xc1\x50\xff\
-\xd1\x53\xd5\x8e\xfe\x12\xf8\xe5\xf3\x03\xbb\x85\x96\x56\x56\x50\
-\xf5\x69\x28\xa3\xe3\xf4\xb9\x8d\x22\x84\x22\xac\xcf\x68\x6c\x6d\
-\x37\xba\x8b\xc0\xe9\x83\x9e\x26\x7c\x46\x00\x69\xad\x58\xb8\x50\
-\x16\x9f\xa3\x91\xc3\xed\xdd\xfd\x83\xd2\x21\x44\x1e\x74\x17\x2c\
-\x8a\xad\x2a\x2b\x35\x4e\x1f\x1e\x39\x7e\x9c\x76\x7f\x0b\xe5\x7e\
-\xd3\x22\x8d\x9e\x37\xb2\x85\x9d\x35\x85\x05\x05\xd4\x54\x5f\x3f\
-\x2c\xff\x82\x8d\xc4\xaf\xfe\xfd\x77\xb2\x5d\xde\x5a\x36\x61\x70\
-\x3a\x66\xe5\x64\x53\x6a\x4a\xb2\xa4\x07\xf6\x6a\xb7\xd1\xae\x64\
-\x21\x00\x42\xb6\x27\xa8\x5a\x3b\x43\x03\xc8\x9f\xe9\x29\x29\x74\
-\xdb\xf2\xa5\x54\x73\xe9\x92\xf8\xeb\xd5\x27\x2f\xbf\x5a\x3a\xbb\
-\x45\xa0\x36\xc6\x9b\xef\xc7\xce\xae\x4c\x16\xfa\x46\xd4\x47\x76\
-\x7f\x9d\x05\xf5\xf6\xae\x1e\x2e\x2f\x37\x5e\x71\xc4\x2d\x5e\xe4\
-\x99\x62\xe3\xd5\x6d\xe8\xe4\xc1\x74\xe6\x9a\xd5\xab\x28\x3b\x3b\
-\x8b\xaa\x4f\x9e\x94\x35\x3b\xd6\xfa\x7d\xf8\x88\x08\x2b\xf8\x1e\
-\x1b\xd2\x39\x54\xcf\xf1\x7e\x3c\x0e\x71\x47\x5c\xc5\x70\x7c\x07\
-\xb1\xfb\x94\x3b\x3c\x7e\x5e\x9c\x35\x88\x85\xc6\xe7\x11\xac\x58\
-\xb9\x4a\x46\xc6\x0e\x1c\x3a\x24\x42\x11\x16\xdb\x22\x6e\x5e\xfb\
-\xe0\x75\x5e\x31\xd5\x03\x2f\x0e\xbe\xf6\x60\xc9\xe2\x45\xa2\xec\
-\xd1\x6b\x8f\x1e\xb8\xff\x3e\xea\xe6\xe7\xee\xcb\xaf\xbf\x76\x3f\
-\xb5\x92\x2c\xe1\xcb\xe7\x8b\xbc\x7c\x92\x30\x11\xbe\x25\x4c\x5f\
-\x5a\xb1\xcb\xb3\xa2\xbc\x9c\x9a\x1a\xea\x28\x8b\xc3\x43\xfa\x44\
-\x28\xfb\xf2\x4b\x19\xa9\xcd\xc9\xcb\xe7\xe7\xed\xc4\x90\xff\xec\
-\x27\xd6\x40\x76\x77\x76\x88\x3f\xde\xf3\x8c\xfa\x85\xf5\x94\xf8\
-\x6c\x88\xd4\x2f\x37\xdd\x1e\xa3\x6d\x7f\x22\x70\x58\xd0\xf5\xb6\
-\x9a\xcb\x03\x71\x47\xfd\x46\xb8\x78\xe9\xc2\xed\x7b\xf6\x1d\x10\
-\xbd\x65\xc1\x76\x04\xa0\x0d\x4b\xe3\x7b\x90\xaf\x15\x15\x1c\x5f\
-\x76\x28\xcf\x13\xff\x96\xcd\xe9\x8f\x35\x6c\xec\x40\x5c\x38\xe2\
-\x79\xaf\xa0\xa3\x27\x4f\x1b\xdb\xb0\x20\xc3\x9e\x09\x36\x05\x39\
-\x59\x91\xfa\x75\xda\xf7\x3c\x20\xff\xb1\x30\x1b\xcf\xc3\xac\x92\
-\x12\xaa\xb9\x72\x85\xce\x5d\xb8\xe8\x2e\x95\x70\xeb\x56\x94\x32\
-\x1e\x73\x7e\xdf\x04\x60\x1d\x34\x48\xa4\x22\x6a\x15\x8c\xe2\xc4\
-\xa9\xb4\x4e\xa3\x88\x06\x43\x2a\x30\xae\x45\x40\xe3\x86\x83\x53\
-\x19\xa5\x42\xba\x15\x4a\xee\x93\xc6\x0c\xf7\x7b\x6e\x50\x81\x71\
-\x1f\x57\x3c\x54\x64\x5b\xe5\x43\x38\x70\xe3\x6e\xbb\x74\xe2\xe1\
-\x85\xed\xfa\x35\xe4\xa5\x73\x70\xc3\x1e\x3a\x3a\x95\xdb\x1a\x06\
-\x80\x9f\x12\x47\x27\x8d\xc3\x3c\x85\x5b\x37\xae\x23\x1e\xec\xd1\
-\xba\xf3\x21\xe9\x72\x1b\x03\xf8\xe7\xf7\x03\x71\x16\xb7\xbe\x3c\
-\x82\x4a\x82\x25\x73\xcb\x8c\x1f\x84\xfd\x94\xdf\x8c\xf1\x19\x0a\
-\x69\x1c\x70\xbf\xeb\x66\x18\xe2\xfd\x0d\x7a\x72\xdb\x56\xd9\xf2\
-\x6c\x7a\x73\x82\x86\xdf\xda\xc6\xeb\x4e\x23\x6e\xf3\x27\x04\x2f\
-\x3d\x4e\x5d\x91\x2b\x72\x1d\xfe\x38\x69\x1a\xa5\xbf\x5e\x1d\x1c\
-\x91\x57\x00\xfe\xc2\x7f\x7b\x9d\xb2\xc6\xcb\x5f\x5e\xe2\xd6\x5e\
-\x5e\x09\x03\xe5\x2e\x47\xc4\x87\xcf\x90\x2e\x5c\xc1\x75\x49\x1b\
-\x7e\x73\x0e\x42\x24\x39\x48\xa3\x1b\x5f\xd7\x78\xe7\x38\x8e\x1b\
-\x91\xf8\x22\x7e\xbe\x36\x40\x8e\xf2\x03\xfe\x44\x0e\x43\xf1\x45\
-\xb4\xdc\x38\xfa\xf2\xd9\x6f\x8f\x19\x84\x25\x47\xb7\x1e\xb8\xe1\
-\x23\xd0\x48\x9e\x45\x60\xdf\xe1\x35\xc2\xc1\x33\x08\x8b\x9c\xc7\
-\x10\xa6\x17\x8e\x5b\x57\xe0\xf7\xf0\xe7\xdb\x61\xb8\x9f\x43\x75\
-\xce\xab\xa7\xf0\x27\xe2\x46\xee\xe3\x7b\x4c\xcf\xa6\xf8\xef\x86\
-\x35\x2c\x1c\xd7\xff\x71\x68\x47\x22\x4c\x64\xd8\x41\xe0\x0f\xdc\
-\xbb\xc7\x61\xf5\xcc\x03\xa7\x3e\x6f\xbc\xbc\x74\x8e\x4e\x18\xde\
-\x35\x2b\xf0\x73\x8c\x69\x9e\x68\x26\x44\x30\xf2\x54\x6d\xdf\xea\
-\x0b\xb0\x87\x81\xca\xe4\x1d\xa5\xa2\x0e\xcf\x42\xae\x4a\x4e\x65\
-\x44\xc5\x92\x0b\xfc\xd7\xe7\x46\x8c\x1f\xef\x5e\x1c\xa3\x11\xf0\
-\x27\x72\x1e\xc4\x09\x58\xbc\x16\x0b\xfc\x97\xd3\xe8\x61\x78\x0f\
-\xe4\x08\x7f\x23\x7e\x3a\xfe\x05\x19\xad\xbb\x08\xec\x4e\x52\x04\
-\xe7\x23\xfc\x70\xdc\x3a\x5e\x39\x7e\x60\x34\xe6\xe5\xe7\x9e\x91\
-\x73\xbf\x50\x03\xf5\x0a\xff\xfc\x9b\x57\xf9\x61\x4e\xf6\xbd\xed\
-\xe0\xd7\x40\xd8\x6e\x78\xb3\xf2\xf3\x69\xde\x2c\x28\xea\x1c\x2e\
-\x14\x81\xcc\x9c\x5c\xfa\x7c\xd7\x1e\x47\x30\x42\xe3\x10\x16\x7f\
-\x13\x08\x43\xd2\xe2\xa6\xcb\x8f\x97\xa6\x78\xfd\x04\x12\x77\xe7\
-\x28\x26\x48\x34\xbf\xa3\xc6\x0b\xff\x1d\x3f\xbe\x37\xfc\x69\xe2\
-\x33\x27\x59\x86\xf8\x79\xf8\xe3\x88\xb4\xca\xb5\x89\x8a\xaf\x73\
-\x94\x2b\x21\xf1\x95\x18\xbb\xc7\x84\xc4\xd9\x1f\x07\xef\x3c\x18\
-\x07\x04\xe5\x86\x37\xec\x3c\x1e\xe0\x37\xc2\x60\x8f\x9d\x83\x2f\
-\x00\xf1\xca\x90\x2e\x26\x92\x1f\xc6\xfb\x9d\x7b\x83\x7c\xdf\xed\
-\x88\x9f\x89\x0c\xdb\x88\xcf\x3f\xeb\xf3\x0a\x1c\x4f\x9d\xf8\xe1\
-\xcc\x0d\x2b\x16\xc6\x9c\xe6\x09\x66\x3c\x04\xa3\xa8\x62\xe0\x78\
-\xa8\xdb\x9e\xf4\x70\x25\x41\x65\x81\x71\x16\xb6\xa1\xd3\x74\x4c\
-\x44\x07\x89\xfb\x3b\xee\x0d\xba\x91\xdf\xfd\xc6\xbd\x1e\x13\x01\
-\x3f\x24\x7c\x74\xda\x41\x23\x71\x81\xdf\x43\x61\xc0\x6d\x2c\x78\
-\xf1\x89\xc4\xcf\x33\xde\x9b\x83\xc5\x9f\xd1\xba\x8b\x20\xee\x71\
-\xbf\xc9\x0f\xc7\x6f\xdc\xe3\xe1\x0c\xff\x8e\x9c\xfe\xda\xb7\x77\
-\xaf\xeb\x87\xe3\x8f\xf3\x86\x36\xe4\x47\xc4\x88\xdf\xc9\xd4\xd7\
-\xdb\x2b\xee\x82\x42\x11\xec\xdd\xee\x6f\xa3\xc6\x0b\xc7\x2b\x07\
-\xbf\x71\xe3\x31\x2a\xbc\x34\x78\xfe\xc7\xeb\xb7\xe7\xce\x1a\xaf\
-\x51\x08\x81\x63\xc5\x8d\xb3\x17\xaf\xc8\xb3\x65\xaa\xdf\x6c\xfc\
-\xfa\x7e\x24\xad\x13\x1a\x5f\xe7\x28\x71\x32\xc4\x55\xcc\x18\x9e\
-\x49\x2b\xfe\x38\x48\xf8\x38\x0e\x0f\x77\x78\x9b\x34\xca\x72\xf5\
-\xc2\xf0\xca\xc5\xe7\xbf\x35\x5d\x6e\x78\xfe\xf8\x79\x7e\xe0\x28\
-\xf7\x18\x70\xe2\x19\x70\x13\x83\xbb\x08\xe2\x1e\xf7\x9b\xfc\x70\
-\xfc\xc6\x3d\x26\x26\x32\x6c\x23\x3e\xff\x42\x9f\x87\x48\x19\x38\
-\xe1\xc6\x13\x86\x17\xaf\x91\xf1\x75\x8e\xf1\xf8\x35\x55\xe0\x54\
-\x87\x33\x1e\xea\xb6\xa7\x0c\xa8\x30\x5e\xa5\x72\x8d\x77\x4d\x8c\
-\x89\xe0\x3d\x9e\x19\x0d\xae\x5b\x7f\xf8\x7e\xc3\x7f\xc6\xec\xf7\
-\x08\x13\x0d\x93\x1b\x98\x78\x30\xb9\x87\x19\xc1\x8d\x11\x42\x11\
-\xec\x98\x83\xbf\xeb\x8e\xdb\xc5\x0e\xc4\xa5\xc5\x3f\x28\xa6\x2b\
-\xca\xcb\x35\x0a\x45\xe0\xc8\xb1\x63\x7c\x2f\x9f\x38\xb7\x8f\x1e\
-\x53\xf8\x30\x63\xc5\xe4\xa7\x67\x62\xc1\xe4\x0e\x66\xa2\x71\xe3\
-\x61\xaa\xd7\x9e\xe1\x3f\x37\x47\x5c\x81\x2f\x3e\xa6\xb8\x7a\x86\
-\xff\x8c\x5f\x9c\x5d\xbf\xad\x61\xc2\x8c\x15\xd7\x1f\x6b\x18\x26\
-\xfc\xbf\x87\xdd\xe7\xc7\xe4\x06\x26\x1e\x4c\xee\x61\xa2\x61\x72\
-\x03\x13\x0f\x26\xf7\x30\xa3\xc5\x75\x1f\xcc\x77\xbf\xe1\x3f\xa3\
-\x0f\xc3\xef\xde\x6f\x6e\x51\xa2\x0a\x46\xe3\xa1\x6e\x5b\x51\x12\
-\xc1\xfe\xc3\x76\x15\x08\xf7\xdc\x79\x07\x2d\x5b\x50\x2e\x1a\xae\
-\xb3\x32\x87\xbe\x1e\x0e\x83\xcf\x24\x94\x95\x14\x8b\x62\x48\x7c\
-\x65\x1c\x7a\x58\x40\x50\x28\x7a\xfb\xbd\xf7\x9c\x05\xcc\x9e\x64\
-\x74\x0b\x37\x14\x8a\xa2\x28\xb7\x0a\xfa\x49\x10\x65\xd2\x82\x9d\
-\x48\xb7\xaf\xbd\x4d\x34\x58\x9b\x46\x8e\xbc\xcf\x34\xac\x5d\xb1\
-\x9c\x7a\xdb\x5a\xa9\xb4\x20\x4f\xb6\xe0\xe3\x33\x2b\xd0\x18\x2b\
-\xca\x30\x37\x99\x95\x61\x62\x37\x11\xb4\xbd\x0f\xf2\xb9\x4d\x13\
-\xb1\xa2\x28\x8a\x32\xb1\xe0\xcb\x1c\x20\x91\x5f\xe7\x88\x3a\x62\
-\xa4\x28\x37\x2b\x10\x53\x3e\xfa\xe2\x2b\xfa\xe0\xc3\x8f\xc4\x6e\
-\x1a\x39\x02\xf1\xda\x3d\xe5\x68\xf2\xe9\x00\x99\xdf\x67\x23\xbf\
-\x28\x8a\xa2\x28\x53\x1d\x15\x8c\x94\xc9\xcb\x34\xe7\x53\x0d\xc7\
-\xcf\x5f\xa4\x1b\x29\x69\x72\x69\x2c\x42\x91\x51\x39\x5a\xb2\xbb\
-\xf8\x50\x47\x8b\x14\x45\x51\x6e\x09\xa2\x6e\xd7\xf7\x54\x6d\xeb\
-\x02\x6c\xe5\xa6\xc4\x5d\x37\xe4\xe8\xe1\x18\x94\x85\xd4\x1b\xee\
-\xb8\x43\x94\xdd\xc5\xf2\xc1\x4f\x7c\x46\x62\xee\xfc\xf9\x54\x73\
-\xa5\x56\x94\x05\xc6\xa3\x1c\x4d\x51\x14\x45\x99\x58\x26\x44\x8f\
-\xd1\x78\x04\xaa\x28\x09\x05\x82\x11\x8e\xa2\xa8\xcc\x11\x92\xe4\
-\x1a\x9b\x9c\xac\x2c\xca\x66\xd3\xd6\xd6\x2a\xb7\x66\xf1\x39\x68\
-\x6c\x6c\x12\x2d\xbd\x10\x8c\x30\x1a\xe4\xed\xea\x70\x8e\x8e\x30\
-\xe4\x5d\x53\x14\x45\x51\x6e\x4e\x26\x44\x8f\x91\xa2\xdc\xf4\xb8\
-\x42\x8c\x8c\xf2\x24\x27\x51\x52\x72\x0a\x1f\x53\xe4\xd8\xd6\xd9\
-\x29\xdf\x1e\x6a\xe9\xe8\x62\xd3\x49\x35\x7c\x0e\xd3\xd5\xd7\xcf\
-\xc2\xd4\x34\x4a\x4a\x71\xee\x73\xee\x77\xf4\x81\x0c\x8d\x16\xa9\
-\x50\xa4\x28\x8a\x72\x33\x03\xe5\xd3\x89\x56\x40\xad\x82\x91\x32\
-\x75\x10\x01\xc9\x19\xed\x09\x2a\xa1\x83\xd0\x03\x01\x68\xc8\xb8\
-\xbf\x79\x0a\xd3\x70\x3f\xdc\xca\x51\x05\x22\x45\x51\x94\xc9\xc0\
-\xbe\x63\x27\xc4\x24\x12\x15\x8c\x94\xa9\x07\x04\x1b\x11\x92\x5c\
-\x41\xc9\x1d\x01\x72\xec\xae\xf1\xae\xf9\xae\xf3\x1f\xd7\x03\x45\
-\x51\x14\xe5\x56\x45\x05\x23\xe5\xd6\xc1\x13\x7e\x54\x00\x52\x14\
-\x45\x51\x2c\xa8\x60\xa4\x28\x8a\xa2\x28\x8a\xe2\xa2\x82\x91\xa2\
-\x28\x8a\xa2\x28\x93\x92\xe2\x82\x7c\x31\x89\x44\x05\x23\x45\x51\
-\x14\x45\x51\x26\x25\xeb\x96\x2d\x11\x93\x48\x62\xd6\x63\xe4\x81\
-\x6d\x71\xc1\x15\xe0\x90\xd6\x10\x31\x28\x81\x0c\x7e\x70\x16\x0a\
-\x22\xcb\x8a\x8b\x8c\x3a\x06\x82\x7e\xc7\xc2\x68\xc2\x08\x8b\x73\
-\xbc\x8c\x26\x8c\xb0\x38\xc7\x83\xe6\xbd\xe6\xbd\x1f\xcd\x7b\xcd\
-\x7b\xcd\xfb\xe1\x68\xde\xdf\x7a\x79\xef\xe5\x6b\x30\xae\x63\x41\
-\x47\x8c\x14\x45\x51\x14\x45\x99\x94\x40\x20\x4a\xa4\x50\x04\xa2\
-\x8e\x18\x29\x8a\xa2\x28\x8a\xa2\xdc\x2a\xe8\x88\x91\xa2\x28\x8a\
-\xa2\x28\x8a\x8b\x0a\x46\x8a\xa2\x28\x8a\xa2\x28\x2e\x2a\x18\x29\
-\x8a\xa2\x28\x8a\xa2\xb8\xa8\x60\xa4\x28\x8a\xa2\x28\x8a\xe2\xa2\
-\x82\x91\xa2\x28\x8a\xa2\x28\x8a\x8b\x0a\x46\x8a\xa2\x28\x8a\xa2\
-\x28\x2e\x2a\x18\x29\x8a\xa2\x28\x8a\xa2\xb8\xa8\x60\xa4\x28\x8a\
-\xa2\x28\x8a\xe2\xa2\x82\x91\xa2\x28\x8a\xa2\x28\x8a\x40\xf4\xff\
-\x03\x7e\x12\x0b\x5b\x73\x51\xc1\xc4\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x04\
-\x00\x07\x03\xe3\
-\x00\x69\
-\x00\x6d\x00\x67\x00\x73\
-\x00\x18\
-\x01\xab\x51\x67\
-\x00\x61\
-\x00\x73\x00\x73\x00\x69\x00\x67\x00\x6e\x00\x65\x00\x64\x00\x5f\x00\x73\x00\x75\x00\x63\x00\x63\x00\x65\x00\x73\x00\x73\x00\x66\
-\x00\x75\x00\x6c\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0e\
-\x02\x89\x27\xe7\
-\x00\x68\
-\x00\x74\x00\x77\x00\x5f\x00\x6c\x00\x6f\x00\x67\x00\x6f\x00\x5f\x00\x32\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x08\x59\x1f\x27\
-\x00\x68\
-\x00\x74\x00\x77\x00\x2d\x00\x6c\x00\x6f\x00\x67\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x09\x2b\xda\x47\
-\x00\x70\
-\x00\x61\x00\x73\x00\x73\x00\x5f\x00\x73\x00\x75\x00\x62\x00\x6d\x00\x69\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x18\
-\x0c\x88\x4f\x87\
-\x00\x74\
-\x00\x72\x00\x61\x00\x63\x00\x6b\x00\x69\x00\x6e\x00\x67\x00\x5f\x00\x73\x00\x79\x00\x73\x00\x74\x00\x65\x00\x6d\x00\x5f\x00\x6c\
-\x00\x6f\x00\x67\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x13\
-\x0d\x0f\xb2\xc7\
-\x00\x74\
-\x00\x72\x00\x61\x00\x63\x00\x6b\x00\x69\x00\x6e\x00\x67\x00\x5f\x00\x73\x00\x79\x00\x73\x00\x74\x00\x65\x00\x6d\x00\x2e\x00\x70\
-\x00\x6e\x00\x67\
-\x00\x10\
-\x0d\x6a\xba\x07\
-\x00\x73\
-\x00\x63\x00\x61\x00\x6e\x00\x5f\x00\x71\x00\x72\x00\x5f\x00\x63\x00\x6f\x00\x64\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x2c\
-\x0e\xc4\x71\x07\
-\x00\x73\
-\x00\x63\x00\x61\x00\x6e\x00\x5f\x00\x79\x00\x6f\x00\x75\x00\x72\x00\x5f\x00\x73\x00\x74\x00\x75\x00\x64\x00\x65\x00\x6e\x00\x74\
-\x00\x5f\x00\x63\x00\x61\x00\x72\x00\x64\x00\x5f\x00\x75\x00\x73\x00\x69\x00\x6e\x00\x67\x00\x5f\x00\x6e\x00\x66\x00\x63\x00\x5f\
-\x00\x73\x00\x63\x00\x61\x00\x6e\x00\x6e\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x08\x00\x00\x00\x02\
-\x00\x00\x00\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x00\x4f\xff\
-\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\x57\x16\
-\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00\x9e\xe4\
-\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x00\xd2\x8c\
-\x00\x00\x00\xde\x00\x00\x00\x00\x00\x01\x00\x01\x76\x00\
-\x00\x00\x01\x0a\x00\x00\x00\x00\x00\x01\x00\x02\x76\xfc\
-\x00\x00\x01\x30\x00\x00\x00\x00\x00\x01\x00\x02\xcb\xfd\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x08\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x90\x0d\xe6\x31\xee\
-\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x00\x4f\xff\
-\x00\x00\x01\x90\x0d\xe6\x31\xf8\
-\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\x57\x16\
-\x00\x00\x01\x90\x0d\xe6\x31\xf3\
-\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00\x9e\xe4\
-\x00\x00\x01\x91\x01\x06\x04\xe4\
-\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x00\xd2\x8c\
-\x00\x00\x01\x90\x0d\xe6\x32\x2b\
-\x00\x00\x00\xde\x00\x00\x00\x00\x00\x01\x00\x01\x76\x00\
-\x00\x00\x01\x90\x0d\xe6\x32\x26\
-\x00\x00\x01\x0a\x00\x00\x00\x00\x00\x01\x00\x02\x76\xfc\
-\x00\x00\x01\x90\x0d\xe6\x32\x17\
-\x00\x00\x01\x30\x00\x00\x00\x00\x00\x01\x00\x02\xcb\xfd\
-\x00\x00\x01\x90\x0d\xe6\x32\x1c\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,239 @@
+import html
+import logging
+
+from PyQt6.QtCore import Qt, QTimer, QEvent, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QFrame, QLabel, QVBoxLayout
+
+from application_layer.states import Severity
+from presentation_layer.gui_config import GUIConfig
+
+SEVERITY_STYLES = {
+    Severity.INFO: "background-color:#156082; color:#ffffff;",
+    Severity.WARNING: "background-color:#FFC107; color:#000000;",
+    Severity.ERROR: "background-color:#F44336; color:#ffffff;",
+    Severity.ALARM: "background-color:#B71C1C; color:#ffffff; border:3px solid #ffffff;"
+}
+"""
+@brief The style of the notification cards per severity.
+"""
+
+class NotificationCard(QFrame):
+    """
+    @class NotificationCard
+    @brief A notification shown by the NotificationCenter, dismissed by tapping it.
+    """
+
+    dismissed = pyqtSignal(object)
+    """ @brief Signal emitted with the key of the notification when it is tapped or its time ran out. """
+
+    def __init__(self, key, severity, title, text, parent=None):
+        """
+        @brief Constructor for NotificationCard.
+        @param key The key identifying identical notifications.
+        @param severity The Severity.
+        @param title The title.
+        @param text The text.
+        @param parent The parent widget.
+        """
+        super().__init__(parent)
+        self.key = key
+        self.severity = severity
+        self.title = title
+        self.text = text
+        self.count = 1
+
+        self.setStyleSheet(f"QFrame {{ {SEVERITY_STYLES[severity]} border-radius:10px; }} "
+                           f"QLabel {{ background:transparent; border:none; font-size:16pt; padding:6px; }}")
+        self.label = QLabel(self)
+        self.label.setWordWrap(True)
+        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 4, 8, 4)
+        layout.addWidget(self.label)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(lambda: self.dismissed.emit(self.key))
+        self.render()
+
+    def repeat(self, text):
+        """
+        @brief Coalesces a repeated notification into this card.
+        @param text The text of the repeated notification, replacing the previous text.
+        """
+        self.count += 1
+        self.text = text
+        self.render()
+
+    def render(self):
+        """
+        @brief Shows the title, the repeat count and the text.
+        """
+        count = f" &times;{self.count}" if self.count > 1 else ""
+        text = html.escape(self.text).replace("\n", "<br>")
+        self.label.setText(f"<b>{html.escape(self.title)}{count}</b><br>{text}")
+
+    def start_timer(self):
+        """
+        @brief Starts or restarts the auto-dismiss time of the severity.
+        """
+        timeout = GUIConfig.NOTIFICATION_TIMEOUTS.get(self.severity.value, 0)
+        if timeout:
+            self.timer.start(int(timeout * 1000))
+
+    def mousePressEvent(self, event):
+        """
+        @brief Dismisses the notification when tapped.
+        @param event The mouse press event.
+        """
+        self.dismissed.emit(self.key)
+
+class NotificationCenter(QWidget):
+    """
+    @class NotificationCenter
+    @brief Non-modal overlay showing the notifications of the kiosk above the pages.
+
+    Unlike a modal message box, it never blocks the event loop, so scanning goes on while
+    notifications are shown. A notification with the key of a shown or waiting one is
+    coalesced into it ("Alarm triggered ×12") instead of stacking. At most
+    GUIConfig.NOTIFICATION_MAX_VISIBLE notifications are shown; the others wait in a queue
+    bounded by GUIConfig.NOTIFICATION_QUEUE_SIZE and are shown by severity, then by age.
+    """
+
+    def __init__(self, parent):
+        """
+        @brief Constructor for NotificationCenter.
+        @param parent The window the overlay is shown on, it follows its size.
+        """
+        super().__init__(parent)
+        self.cards = {}  # key -> NotificationCard, in the order shown
+        self.queue = []  # NotificationCards waiting to be shown
+        self.stats = {"shown": 0, "coalesced": 0, "dropped": 0}
+        self.card_layout = QVBoxLayout(self)
+        self.card_layout.setContentsMargins(0, 0, 0, 0)
+        self.card_layout.setSpacing(6)
+        parent.installEventFilter(self)
+        self.hide()
+
+    def notify(self, severity, title, text, key=None):
+        """
+        @brief Shows a notification, or coalesces it into an identical one.
+        @param severity The Severity.
+        @param title The title.
+        @param text The text.
+        @param key The key identifying identical notifications. Default is the severity, title and text.
+        """
+        key = key if key is not None else (severity, title, text)
+        card = self.cards.get(key) or next((queued for queued in self.queue if queued.key == key), None)
+        if card is not None:
+            card.repeat(text)
+            self.stats["coalesced"] += 1
+            if key in self.cards:
+                card.start_timer()
+            return
+
+        card = NotificationCard(key, severity, title, text, self)
+        card.dismissed.connect(self.dismiss)
+        card.hide()
+        if len(self.cards) >= GUIConfig.NOTIFICATION_MAX_VISIBLE:
+            # A more severe notification takes the place of the least severe shown one
+            ranks = list(Severity)
+            least = min(self.cards.values(), key=lambda shown: ranks.index(shown.severity))
+            if ranks.index(least.severity) >= ranks.index(severity):
+                self._enqueue(card)
+                return
+            self._hide_card(least)
+            self._enqueue(least)
+        self._show_card(card)
+
+    def dismiss(self, key):
+        """
+        @brief Removes a shown or waiting notification and shows the next waiting one.
+        @param key The key of the notification.
+        """
+        card = self.cards.pop(key, None)
+        if card is None:
+            card = next((queued for queued in self.queue if queued.key == key), None)
+            if card is None:
+                return
+            self.queue.remove(card)
+        else:
+            self._hide_card(card)
+        card.deleteLater()
+
+        while self.queue and len(self.cards) < GUIConfig.NOTIFICATION_MAX_VISIBLE:
+            self._show_card(self._next_queued())
+        self._update_geometry()
+
+    def _show_card(self, card):
+        """
+        @brief Shows a card below the shown ones and starts its timer.
+        @param card The NotificationCard.
+        """
+        self.cards[card.key] = card
+        self.card_layout.addWidget(card)
+        card.show()
+        card.start_timer()
+        self.stats["shown"] += 1
+        self._update_geometry()
+
+    def _hide_card(self, card):
+        """
+        @brief Removes a card from the shown ones and stops its timer.
+        @param card The NotificationCard.
+        """
+        self.cards.pop(card.key, None)
+        self.card_layout.removeWidget(card)
+        card.hide()
+        card.timer.stop()
+
+    def _enqueue(self, card):
+        """
+        @brief Puts a card in the queue, dropping the oldest of the lowest severity if the queue is full.
+        @param card The NotificationCard.
+        """
+        self.queue.append(card)
+        if len(self.queue) <= GUIConfig.NOTIFICATION_QUEUE_SIZE:
+            return
+        ranks = list(Severity)
+        dropped = min(self.queue, key=lambda queued: ranks.index(queued.severity))  # min() keeps the oldest on ties
+        self.queue.remove(dropped)
+        dropped.deleteLater()
+        self.stats["dropped"] += 1
+        logging.warning(f"NotificationCenter::Queue full, dropped notification '{dropped.title}'")
+
+    def _next_queued(self):
+        """
+        @brief Takes the waiting card of the highest severity, the oldest on ties.
+        @return The NotificationCard.
+        """
+        ranks = list(Severity)
+        card = max(self.queue, key=lambda queued: ranks.index(queued.severity))  # max() keeps the oldest on ties
+        self.queue.remove(card)
+        return card
+
+    def _update_geometry(self):
+        """
+        @brief Places the overlay at the top of the window with the height of the shown cards.
+        """
+        if not self.cards:
+            self.hide()
+            return
+        margin = 20
+        width = self.parentWidget().width() - 2 * margin
+        height = (self.card_layout.heightForWidth(width) if self.card_layout.hasHeightForWidth()
+                  else self.card_layout.sizeHint().height())
+        self.setGeometry(margin, margin, width, height)
+        self.show()
+        self.raise_()
+
+    def eventFilter(self, watched, event):
+        """
+        @brief Follows the size of the window.
+        @param watched The window.
+        @param event The event.
+        @return False, the event is passed on.
+        """
+        if watched is self.parentWidget() and event.type() == QEvent.Type.Resize:
+            self._update_geometry()
+        return False
@@ -0,0 +1,49 @@
+import logging
+import threading
+
+from PyQt6.QtCore import QThread, QCoreApplication, pyqtSignal
+
+class SubsystemLoader(QThread):
+    """
+    @class SubsystemLoader
+    @brief Brings up one subsystem of the GUI on its own thread.
+
+    The factory runs on the loader thread, so a slow database or card reader does not delay
+    the first frame. The result is handed to the GUI thread through the loaded signal.
+    """
+
+    loaded = pyqtSignal(str, object)
+    """ @brief Signal emitted with the name of the subsystem and the result of the factory. """
+
+    failed = pyqtSignal(str, str)
+    """ @brief Signal emitted with the name of the subsystem and the error if the factory raised. """
+
+    def __init__(self, name, factory, parent=None):
+        """
+        @brief Constructor for SubsystemLoader.
+        @param name The name of the subsystem.
+        @param factory Function called without arguments on the loader thread, returning the subsystem.
+        @param parent The parent QObject, if any.
+        """
+        super().__init__(parent)
+        self.name = name
+        self.factory = factory
+        self.setObjectName(f"{name}Loader")
+
+    def run(self):
+        """
+        @brief Calls the factory and emits loaded or failed.
+        @details QObjects created by the factory are moved to the GUI thread, as the loader thread ends afterwards.
+        """
+        threading.current_thread().name = self.objectName()
+        try:
+            result = self.factory()
+        except Exception as e:
+            logging.error(f"SubsystemLoader::Could not start {self.name}: {e}")
+            self.failed.emit(self.name, str(e))
+            return
+        results = result if isinstance(result, tuple) else (result,)
+        for item in results:
+            if hasattr(item, "moveToThread"):
+                item.moveToThread(QCoreApplication.instance().thread())
+        self.loaded.emit(self.name, result)
@@ -0,0 +1,36 @@
+class GUIConfig:
+    """
+    @class GUIConfig
+    @brief Configuration class for the display GUI.
+    """
+
+    DATABASE_RETRY_INTERVAL = 5
+    """
+    @brief The time in seconds before the database is connected again after a failed startup.
+    """
+
+    INDEX_RESYNC_INTERVAL = 600
+    """
+    @brief The time in seconds between two full reloads of the validation index.
+    @details The index adds new students and devices and updates the borrow states whenever the
+             user starts an action. Scans missing from the index are looked up in the database, and
+             the scanned student and device are read again when the action is confirmed. The full
+             reload drops the rows deleted since.
+    """
+
+    NOTIFICATION_TIMEOUTS = {"info": 4, "warning": 6, "error": 10, "alarm": 0}
+    """
+    @brief The time in seconds after which a notification of each severity is dismissed.
+    @details 0 keeps the notification until it is tapped or dismissed by the application. A
+             repeated notification starts its time again.
+    """
+
+    NOTIFICATION_MAX_VISIBLE = 3
+    """
+    @brief The maximum number of notifications shown at the same time, the others wait in the queue.
+    """
+
+    NOTIFICATION_QUEUE_SIZE = 20
+    """
+    @brief The maximum number of waiting notifications. When full, the oldest of the lowest severity is dropped.
+    """
@@ -0,0 +1,127 @@
+import os
+import sys
+import json
+import time
+import platform
+import resource
+import statistics
+import subprocess
+import importlib.util
+
+def current_rss_kb():
+    """
+    @brief Returns the resident set size of the process.
+    @return The RSS in KiB, the peak RSS where /proc is not available.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def measure(mode, path, decode=False):
+    """
+    @brief Loads the GUI images once and measures the time and memory it takes.
+    @details Meant to run in a fresh interpreter, see ResourceBenchmark. PyQt is imported
+             before the measurement, so only the loading of the resources is measured.
+    @param mode "module" to import a Python resource module generated by pyrcc, "bundle" to register a binary .rcc file.
+    @param path The path of the resource module or bundle.
+    @param decode Whether to decode every image afterwards, as showing all pages would.
+    @return A dictionary with the load time in milliseconds and the RSS growth in KiB.
+    @throws ValueError If the mode is unknown.
+    """
+    from PyQt6.QtCore import QResource, QDirIterator
+    from PyQt6.QtGui import QGuiApplication, QImage
+    app = QGuiApplication(["resource_benchmark"]) if decode else None
+
+    rss_before = current_rss_kb()
+    started = time.perf_counter()
+    if mode == "module":
+        spec = importlib.util.spec_from_file_location("benchmark_rc", path)
+        spec.loader.exec_module(importlib.util.module_from_spec(spec))
+    elif mode == "bundle":
+        QResource.registerResource(path)
+    else:
+        raise ValueError(f"Unknown resource mode: {mode}")
+    result = {"load_ms": (time.perf_counter() - started) * 1000, "rss_kb": current_rss_kb() - rss_before}
+
+    if decode:
+        started = time.perf_counter()
+        images = QDirIterator(":/imgs")
+        decoded = []
+        while images.hasNext():
+            decoded.append(QImage(images.next()))
+        result["decode_ms"] = (time.perf_counter() - started) * 1000
+        result["images"] = len(decoded)
+        result["rss_decoded_kb"] = current_rss_kb() - rss_before
+    del app
+    return result
+
+class ResourceBenchmark:
+    """
+    @brief Compares the startup cost of a Python resource module with that of a binary resource bundle.
+
+    Every run loads the resources in a new interpreter, so nothing is shared between runs.
+    The first run of a module also compiles it to bytecode unless a cached .pyc exists;
+    the following runs show the cost of unmarshalling the cached bytecode.
+    """
+
+    def __init__(self, runs=5, decode=False):
+        """
+        @brief Initializes the ResourceBenchmark class.
+        @param runs The number of runs per variant.
+        @param decode Whether each run also decodes every image.
+        """
+        self.runs = runs
+        self.decode = decode
+
+    def run_once(self, mode, path):
+        """
+        @brief Measures one load in a new interpreter.
+        @param mode "module" or "bundle".
+        @param path The path of the resource module or bundle.
+        @return The dictionary returned by measure().
+        @throws subprocess.CalledProcessError If the measurement fails.
+        """
+        env = dict(os.environ)
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        args = [sys.executable, os.path.abspath(__file__), mode, path] + (["--decode"] if self.decode else [])
+        output = subprocess.run(args, check=True, capture_output=True, text=True, env=env).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    def run_variant(self, mode, path):
+        """
+        @brief Measures a variant several times.
+        @param mode "module" or "bundle".
+        @param path The path of the resource module or bundle.
+        @return A dictionary with the file size, the runs and the median of every measured value.
+        """
+        runs = [self.run_once(mode, path) for _ in range(self.runs)]
+        return {
+            "path": path,
+            "file_kb": round(os.path.getsize(path) / 1024, 1),
+            "median": {key: round(statistics.median(run[key] for run in runs), 2) for key in runs[0]},
+            "runs": runs
+        }
+
+    def run(self, bundle, module=None):
+        """
+        @brief Measures the bundle and, if given, the module it replaces.
+        @param bundle The path of the .rcc bundle.
+        @param module The path of the Python resource module, None to measure the bundle only.
+        @return The report as dictionary.
+        """
+        report = {
+            "parameters": {"runs": self.runs, "decode": self.decode},
+            "environment": {"python": platform.python_version(), "machine": platform.machine(), "platform": platform.platform()},
+            "bundle": self.run_variant("bundle", bundle)
+        }
+        if module is not None:
+            report["module"] = self.run_variant("module", module)
+            report["speedup"] = round(report["module"]["median"]["load_ms"] / max(report["bundle"]["median"]["load_ms"], 1e-3), 1)
+            report["rss_saved_kb"] = report["module"]["median"]["rss_kb"] - report["bundle"]["median"]["rss_kb"]
+        return report
+
+if __name__ == "__main__":
+    # Measurement of a single run, started by ResourceBenchmark.run_once()
+    print(json.dumps(measure(sys.argv[1], sys.argv[2], "--decode" in sys.argv[3:])))
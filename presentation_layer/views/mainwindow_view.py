@@ -1,22 +1,32 @@
 import logging
 import paho.mqtt.client as mqtt
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QMainWindow, QMessageBox, QLineEdit
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QMainWindow, QLineEdit, QLabel
 
 from presentation_layer.views.mainwindow_view_ui import Ui_MainWindow
+from presentation_layer.assets.resource_bundle import register_resources
 from presentation_layer.controllers.virtual_keybord import VirtualKeyboard, CustomLineEdit
 from presentation_layer.controllers.password_checker import PasswordChecker
+from presentation_layer.controllers.subsystem_loader import SubsystemLoader
+from presentation_layer.controllers.notification_center import NotificationCenter
+from presentation_layer.gui_config import GUIConfig
 
 from application_layer.device_db_service import DeviceDBService
 from application_layer.student_db_service import StudentDBService
 from application_layer.states import UserAction
 from application_layer.states import AdminAction
 from application_layer.states import ScanMode
+from application_layer.states import NodeState
+from application_layer.states import SubsystemState
+from application_layer.states import AlarmState
+from application_layer.states import Severity
+from application_layer.startup_timeline import StartupTimeline
+from application_layer.validation_index import ValidationIndex
 from application_layer.services import Services
 from application_layer.mqtt_gui_services import MQTTGuiServices
-from application_layer.qr_controller.qr_scanner import QRCodeScanner
-from application_layer.nfc_controller.nfc_service import NFCService
+from application_layer.qr_controller.qr_config import QRConfig
+from application_layer.qr_controller.qr_device_scanner import create_qr_scanner
 
 from data_layer.config import ADMIN_PASSWORD
 
@@ -37,56 +47,91 @@ class CMainwindowView(QMainWindow):
     including user actions like borrowing, returning devices, and admin functions.
     """
 
-    def __init__(self, parent=None):
+    SUBSYSTEMS = ("database", "mqtt", "nfc")
+    """ @brief The subsystems brought up in the background after the window is created. """
+
+    ALARM_NOTIFICATION = "alarm"
+    """ @brief The key of the alarm notification, all alarm alerts are coalesced into it. """
+
+    def __init__(self, parent=None, timeline=None):
         """
         @brief Constructor for CMainwindowView.
 
-        Initializes the main window, sets up the UI, connects signals, and initializes services.
+        Initializes the main window, sets up the UI and connects signals. The database, MQTT
+        and NFC services are brought up in parallel by background loaders, so the window can
+        be shown immediately; the status line shows their readiness.
 
         @param parent The parent widget.
+        @param timeline The StartupTimeline recording the startup milestones, created if None.
         """
         super().__init__(parent=parent)
         self.current_student_id = None  # type: int
+        self.current_student_uid = None  # type: str
         self.current_device_id = None  # type: int
         self.current_student_name = None  # type: str
         self.current_device_name = None  # type: str
         self.current_user_action = None  # type: UserAction
         self.current_admin_action = None  # type: AdminAction
         self.current_scan_mode = None  # type: ScanMode
-        self.msg_box = None  # type: QMessageBox
         self.admin_password = ADMIN_PASSWORD  # type: str
+        self.node_states = {Services.MQTT_RFID_PUB: None, Services.MQTT_ALARM_CLIENT: None}  # type: dict
+        self.alarm_state = None  # type: str
+        self.timeline = timeline or StartupTimeline("CMainwindowView")  # type: StartupTimeline
+        self.subsystem_states = {subsystem: SubsystemState.STARTING for subsystem in self.SUBSYSTEMS}  # type: dict
+        self.loaders = {}  # type: dict
+        self.first_frame_shown = False  # type: bool
+
+        # Set by the loaders once the services are up
+        self.device_db_service = None  # type: DeviceDBService
+        self.student_db_service = None  # type: StudentDBService
+        self.validation_index = None  # type: ValidationIndex
+        self.nfc_service = None  # type: application_layer.nfc_controller.nfc_service.NFCService
 
         self.ui = Ui_MainWindow()
-        self.device_db_service = DeviceDBService()
-        self.student_db_service = StudentDBService()
+        self.index_resync_timer = QTimer(self)
+        self.index_resync_timer.setInterval(GUIConfig.INDEX_RESYNC_INTERVAL * 1000)
+        self.index_resync_timer.timeout.connect(lambda: self.validation_index.request_refresh(full=True))
 
         self.mqtt_gui_services = MQTTGuiServices()
         self.mqtt_gui_services.send_alert.connect(self.show_alarm_alert)
-
-        self.matriculation_numbers = self.student_db_service.get_all_matriculation_numbers()
-        self.device_names = self.device_db_service.get_all_device_names()
-        
-        self.nfc_service = NFCService()
-        self.nfc_service.smart_card_scanned.connect(self.display_student_name)
-        
-        self.qr_code_scanner = QRCodeScanner()
-        self.qr_code_scanner.device_qr_code_scanned.connect(self.display_device_name)
+        self.mqtt_gui_services.alarm_state_changed.connect(self.show_alarm_state)
+        self.mqtt_gui_services.node_status_changed.connect(self.show_node_status)
+        self.mqtt_gui_services.deactivation_completed.connect(self.on_deactivation_completed)
+        self.mqtt_gui_services.connected.connect(self.on_mqtt_connected)
+
+        self.qr_code_scanner = create_qr_scanner(QRConfig.BACKEND)
+        self.qr_code_scanner.device_qr_code_scanned.connect(self.on_qr_code_scanned)
+        self.qr_code_scanner.start()
                
         self._init_ui()
         self._connect_signals()
-        self.mqtt_gui_services.setup_mqtt_gui_services()
         self._setup_virtual_numeric_keyboard()
+        self.timeline.expect("ui_ready", "first_frame", *self.SUBSYSTEMS)
+        self.timeline.mark("ui_ready")
+        self._start_subsystems()
 
     def _init_ui(self):
         """
         @brief Initializes the user interface.
 
-        Sets up the UI components and sets the initial page.
+        Registers the image bundle, sets up the UI components and sets the initial page.
         """
+        register_resources()
         self.ui.setupUi(self)   
         self.setWindowTitle("Tracking System")
         self.ui.stackedWidget.setCurrentWidget(self.ui.page_1)
 
+        # Status line below the pages, filled by the retained node and alarm states
+        self.node_status_label = QLabel(parent=self.ui.centralwidget)
+        self.node_status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.node_status_label.setStyleSheet("font-size:12pt; background-color:#0F1C1F; padding:4px;")
+        self.ui.verticalLayout.addWidget(self.node_status_label)
+        self._update_node_status_label()
+        self._update_action_buttons()
+
+        # Non-modal notifications above the pages
+        self.notification_center = NotificationCenter(self)
+
     def show_keyboard(self):
         """
         @brief Shows the virtual keyboard.
@@ -124,6 +169,136 @@ class CMainwindowView(QMainWindow):
         self.password_checker.password_verified.connect(self.on_password_verified)
         self.password_checker.password_failed.connect(self.on_password_failed)
 
+    #################################  Startup  #################################
+    def _start_subsystems(self):
+        """
+        @brief Starts one background loader per subsystem, they run in parallel.
+        """
+        self._start_loader("database", self._load_database)
+        self._start_loader("mqtt", self.mqtt_gui_services.setup_mqtt_gui_services)
+        self._start_loader("nfc", self._load_nfc)
+
+    def _start_loader(self, subsystem, factory):
+        """
+        @brief Brings up a subsystem on a SubsystemLoader thread.
+
+        @param subsystem The name of the subsystem.
+        @param factory Function creating the subsystem on the loader thread.
+        """
+        loader = SubsystemLoader(subsystem, factory)
+        loader.loaded.connect(self.on_subsystem_loaded)
+        loader.failed.connect(self.on_subsystem_failed)
+        self.loaders[subsystem] = loader
+        self._set_subsystem_state(subsystem, SubsystemState.STARTING)
+        loader.start()
+
+    @staticmethod
+    def _load_database():
+        """
+        @brief Connects to the database and builds the validation index of the students and devices.
+        @details Runs on the loader thread. The index has its own connections, as it is refreshed
+                 on a background thread.
+
+        @return A tuple (device_db_service, student_db_service, validation_index).
+        """
+        device_db_service = DeviceDBService()
+        student_db_service = StudentDBService()
+        validation_index = ValidationIndex(StudentDBService(), DeviceDBService())
+        validation_index.refresh(full=True)
+        return device_db_service, student_db_service, validation_index
+
+    @staticmethod
+    def _load_nfc():
+        """
+        @brief Creates the NFC service.
+        @details Runs on the loader thread. The card reader library is imported here, so its
+                 import time and a missing PC/SC stack do not affect the first frame.
+
+        @return The NFCService.
+        """
+        from application_layer.nfc_controller.nfc_service import NFCService
+        return NFCService()
+
+    def on_subsystem_loaded(self, subsystem, result):
+        """
+        @brief Slot for a subsystem brought up by its loader.
+
+        The MQTT services are ready once connected to the broker, see on_mqtt_connected().
+
+        @param subsystem The name of the subsystem.
+        @param result The result of the factory of the subsystem.
+        """
+        if subsystem == "database":
+            self.device_db_service, self.student_db_service, self.validation_index = result
+            self.index_resync_timer.start()
+        elif subsystem == "nfc":
+            self.nfc_service = result
+            self.nfc_service.smart_card_scanned.connect(self.display_student_name)
+            # The user may already wait on the student card page
+            if self.current_scan_mode == ScanMode.NFC and self.ui.stackedWidget.currentWidget() == self.ui.page_2:
+                self.start_nfc_scanner()
+        elif subsystem == "mqtt":
+            logging.info("CMainwindowView::Connecting to the broker")
+            return
+        self.timeline.mark(subsystem)
+        self._set_subsystem_state(subsystem, SubsystemState.READY)
+
+    def on_subsystem_failed(self, subsystem, error):
+        """
+        @brief Slot for a subsystem that could not be brought up.
+
+        The database is connected again after GUIConfig.DATABASE_RETRY_INTERVAL seconds.
+
+        @param subsystem The name of the subsystem.
+        @param error The error raised by the loader.
+        """
+        self.timeline.mark(subsystem, SubsystemState.FAILED.value)
+        self._set_subsystem_state(subsystem, SubsystemState.FAILED)
+        if subsystem == "database":
+            logging.info(f"CMainwindowView::Connecting to the database again in {GUIConfig.DATABASE_RETRY_INTERVAL} s")
+            QTimer.singleShot(GUIConfig.DATABASE_RETRY_INTERVAL * 1000,
+                              lambda: self._start_loader("database", self._load_database))
+
+    def on_mqtt_connected(self):
+        """
+        @brief Slot for a connection of the MQTT GUI services to the broker.
+        """
+        self.timeline.mark("mqtt")
+        self._set_subsystem_state("mqtt", SubsystemState.READY)
+
+    def _set_subsystem_state(self, subsystem, state):
+        """
+        @brief Updates the readiness of a subsystem in the status line and the buttons depending on it.
+
+        @param subsystem The name of the subsystem.
+        @param state The SubsystemState.
+        """
+        self.subsystem_states[subsystem] = state
+        self._update_node_status_label()
+        self._update_action_buttons()
+
+    def _update_action_buttons(self):
+        """
+        @brief Enables borrowing and returning only while the database is ready.
+        """
+        database_ready = self.subsystem_states["database"] == SubsystemState.READY
+        self.ui.borrow_button.setEnabled(database_ready)
+        self.ui.return_button.setEnabled(database_ready)
+
+    def paintEvent(self, event):
+        """
+        @brief Records the first interactive frame in the startup timeline.
+
+        The milestone is marked once the event loop is idle again after the first paint,
+        that is when the window can react to input.
+
+        @param event The paint event.
+        """
+        super().paintEvent(event)
+        if not self.first_frame_shown:
+            self.first_frame_shown = True
+            QTimer.singleShot(0, lambda: self.timeline.mark("first_frame"))
+
     #################################  Home Page  ###############################
     def start_button_clicked(self):
         """
@@ -144,6 +319,8 @@ class CMainwindowView(QMainWindow):
         @param action The user action selected (borrow, return, admin).
         """
         logging.info("Action button clicked")
+        # Fetch new cards and devices and the current borrow states while the user gets the card or device ready
+        self.validation_index.request_refresh()
         self.reset_device_student_details()
         self.disable_confirm_button()
         self.set_user_action(action)
@@ -185,19 +362,25 @@ class CMainwindowView(QMainWindow):
         """
         @brief Slot for confirm button click event on page 3.
 
-        Processes the borrow or return action and displays the result.
+        Processes the borrow or return action and displays the result. The student and the device
+        found in the validation index are read again from the database first, so a card re-assigned,
+        a device deleted or borrowed elsewhere since the last refresh is rejected.
         """
         try:
             logging.info("Confirm button 2 clicked")
             logging.debug("Device name = {} ".format(self.current_device_name))
+            if not self._check_current_scans():
+                return
             self.ui.stackedWidget.setCurrentWidget(self.ui.page_4)
             logging.debug("current id = {}".format(self.current_student_id))
             logging.debug("device id  = {}".format(self.current_device_id))
 
             if self.current_user_action == UserAction.BORROW:
                 self.device_db_service.borrow_device(self.current_device_id, self.current_device_name, self.current_student_id)
+                self.validation_index.set_borrowed(self.current_device_id, True)
             elif self.current_user_action == UserAction.RETURN:
                 self.device_db_service.return_device(self.current_device_id)
+                self.validation_index.set_borrowed(self.current_device_id, False)
 
             logging.debug("Devices = {}".format(self.device_db_service.get_all_devices()))
             self.ui.output_label.setStyleSheet("font-size:16pt; color:#ffffff; background-color:#156082;")
@@ -215,6 +398,27 @@ class CMainwindowView(QMainWindow):
             logging.error(f"Error processing confirm button click: {e}")
             self.show_error_message("Error", f"An error occurred while processing the action: {e}")
 
+    def _check_current_scans(self):
+        """
+        @brief Confirms the scanned student and device against the database before the action is stored.
+        @return True if the action can be stored, otherwise False and the user is notified.
+        """
+        if self.current_user_action == UserAction.BORROW and self.validation_index.check_student(
+                self.current_student_id, self.current_student_uid, self.student_db_service) is None:
+            self.ui.confirm_button_1.setEnabled(False)
+            self.show_student_alert()
+            return False
+        device = self.validation_index.check_device(self.current_device_id, self.device_db_service)
+        if device is None:
+            self.ui.confirm_button_1.setEnabled(False)
+            self.show_device_alert()
+            return False
+        if device.is_borrowed and self.current_user_action == UserAction.BORROW:
+            self.ui.confirm_button_1.setEnabled(False)
+            self.show_error_message("Error", "Device is already borrowed.")
+            return False
+        return True
+
     def back_button_1_clicked(self):
         """
         @brief Slot for back button click event on page 3.
@@ -234,7 +438,9 @@ class CMainwindowView(QMainWindow):
         """
         @brief Displays the student's name after scanning the NFC card.
 
-        Retrieves the student's information from the database and updates the UI.
+        Looks up the student in the validation index and updates the UI. A card missing from the
+        index is looked up in the database before it is rejected, so a card assigned since the
+        last refresh is accepted at once.
 
         @param uid The UID from the scanned NFC card.
         """
@@ -244,15 +450,17 @@ class CMainwindowView(QMainWindow):
             self.ui.matriculation_label.setStyleSheet("font-size:16pt; color:#ffffff; background-color:#156082;")
             self.ui.matriculation_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             
-            # Retrieve student information from the database
-            self.current_student_name = self.student_db_service.get_name_from_nfc_uid(uid)
-            matriculation_number = self.student_db_service.get_matriculation_number_from_nfc_uid(uid)
-            self.current_student_id = self.student_db_service.get_id_from_matriculation_number(matriculation_number)
+            student = self.validation_index.student_for_uid(uid, self.student_db_service)
+            self.current_student_uid = uid
+            self.current_student_name = student.name if student else None
+            matriculation_number = student.mat_number if student else None
+            self.current_student_id = student.student_id if student else None
             
             logging.info(f"Retrieved student name: {self.current_student_name}, Matriculation number: {matriculation_number}, Student ID: {self.current_student_id}")
             
             if self.current_student_name is None:
                 self.ui.confirm_button_1.setEnabled(False)
+                self.validation_index.request_refresh()
                 self.show_student_alert()
                 logging.warning("Student name not found in the database.")
             else:
@@ -263,19 +471,37 @@ class CMainwindowView(QMainWindow):
             logging.error(f"Error displaying student name: {e}")
             self.show_error_message("Error", f"An error occurred while displaying the student name: {e}")
 
+    def on_qr_code_scanned(self, device_qr_code):
+        """
+        @brief Slot for a complete code of the QR code scanner.
+
+        A scanner read directly delivers codes on every page, they are only used while a device is expected.
+
+        @param device_qr_code The QR code data from the scanned device.
+        """
+        if self.current_scan_mode != ScanMode.QR_CODE:
+            logging.info(f"Ignoring QR code {device_qr_code}, no device scan expected")
+            return
+        self.display_device_name(device_qr_code)
+
     def display_device_name(self, device_qr_code):
         """
         @brief Displays the device's name after scanning the QR code.
 
-        Retrieves the device's information from the database and updates the UI.
+        Looks up the device and its borrow status in the validation index, which was refreshed
+        when the action started, and updates the UI. A QR code missing from the index is looked
+        up in the database before it is rejected.
 
         @param device_qr_code The QR code data from the scanned device.
         """
         try:
             logging.info("device_name = {}".format(device_qr_code))
-            device_name = self.device_db_service.get_device_name_from_qr_code(device_qr_code)
-            self.current_device_id = self.device_db_service.get_id_from_device_name(device_name)
-            device_borrowed_status = self.device_db_service.get_is_borrowed_status_by_device_id(self.current_device_id)
+            device = self.validation_index.device_for_qr_code(device_qr_code, self.device_db_service)
+            device_name = device.name if device else None
+            self.current_device_id = device.device_id if device else None
+            device_borrowed_status = device.is_borrowed if device else None
+            if device is None:
+                self.validation_index.request_refresh()
 
             if device_borrowed_status and self.current_user_action == UserAction.BORROW:
                 self.ui.confirm_button_1.setEnabled(False)
@@ -348,19 +574,40 @@ class CMainwindowView(QMainWindow):
 
         Displays an incorrect password alert.
         """
-        self.create_msg_box("Incorrect Password",
-        "The password you entered is incorrect.")
+        self.notify(Severity.WARNING, "Incorrect Password", "The password you entered is incorrect.")
 
     def deactivate_alarm_clicked(self):
         """
         @brief Slot for deactivate alarm button click event.
 
-        Sends a command to deactivate the alarm.
+        Sends a command to deactivate the alarm. The button stays disabled until the alarm controller responds.
         """
         self.current_admin_action = AdminAction.DEACTIVATE
         logging.info("Deactivating alarm...")
+        self.ui.deactivate_alarm.setEnabled(False)
+        self.ui.deactivate_alarm.setText("Deactivating...")
         self.mqtt_gui_services.send_deactivation_command()
 
+    def on_deactivation_completed(self, success, rtt_ms, message):
+        """
+        @brief Slot for the response of the alarm controller to a deactivation command.
+
+        Shows the confirmed result instead of assuming that the command arrived.
+
+        @param success Whether the relay is confirmed to be off.
+        @param rtt_ms The round-trip time in milliseconds, None if the alarm controller did not respond.
+        @param message The message to display.
+        """
+        self.ui.deactivate_alarm.setEnabled(True)
+        self.ui.deactivate_alarm.setText("Deactivate Alarm")
+        if rtt_ms is not None:
+            message += f"\nConfirmed after {rtt_ms:.0f} ms."
+        if success:
+            self.notification_center.dismiss(self.ALARM_NOTIFICATION)
+            self.notify(Severity.INFO, "Alarm deactivated", message)
+        else:
+            self.notify(Severity.ERROR, "Deactivation failed", message)
+
     #################################   Utilities ###############################
     def set_user_action(self, action):
         """
@@ -396,98 +643,95 @@ class CMainwindowView(QMainWindow):
         self.ui.password_layout.addWidget(self.keyboard)
         self.keyboard.hide()  # Hide keyboard initially
 
-    def show_alarm_alert(self):
+    def show_alarm_alert(self, trace=None):
         """
         @brief Displays an alert when the alarm is triggered.
 
-        Creates and shows a message box alerting the user that the alarm has been triggered.
+        Repeated alerts are coalesced into one notification, which stays until it is tapped or
+        the alarm is no longer triggered.
+        @param trace The latency trace of the alarm, passed on to record the display time.
         """
-        if self.msg_box is None or not self.msg_box.isVisible():
-            self.create_msg_box(
-                "Alert",
-                "The Alarm has been triggered!\n\nPlease contact the admin to deactivate the alarm."
-            )
-        else:
-            self.msg_box.show()  # Show the existing message box if it's not closed
+        self.notify(Severity.ALARM, "Alarm triggered",
+                    "Please contact the admin to deactivate the alarm.", key=self.ALARM_NOTIFICATION)
+        self.mqtt_gui_services.record_display(trace)
+
+    def show_alarm_state(self, status):
+        """
+        @brief Shows the current alarm state in the status line.
+        @param status The AlarmState value.
+        """
+        self.alarm_state = status
+        self._update_node_status_label()
+        if status != AlarmState.TRIGGERED.value:
+            self.notification_center.dismiss(self.ALARM_NOTIFICATION)
+
+    def show_node_status(self, node, status):
+        """
+        @brief Shows the liveness of a node in the status line.
+        @param node The name of the node.
+        @param status The NodeState value.
+        """
+        self.node_states[node] = status
+        self._update_node_status_label()
+
+    def _update_node_status_label(self):
+        """
+        @brief Renders the readiness of the subsystems, the node health and the alarm state in the status line.
+        """
+        subsystem_names = {"database": "Database", "mqtt": "MQTT", "nfc": "NFC"}
+        subsystem_colors = {SubsystemState.READY: "#4CAF50", SubsystemState.FAILED: "#F44336", SubsystemState.STARTING: "#FFC107"}
+        subsystems = [f"<span style='color:{subsystem_colors[state]}'>{subsystem_names[subsystem]}: {state.value}</span>"
+                      for subsystem, state in self.subsystem_states.items()]
+
+        names = {Services.MQTT_RFID_PUB: "RFID reader", Services.MQTT_ALARM_CLIENT: "Alarm"}
+        colors = {NodeState.ONLINE.value: "#4CAF50", NodeState.OFFLINE.value: "#F44336", None: "#9E9E9E"}
+        parts = [f"<span style='color:{colors.get(status, colors[None])}'>{names.get(node, node)}: {status or 'unknown'}</span>"
+                 for node, status in self.node_states.items()]
+        parts.append(f"<span style='color:#ffffff'>Alarm state: {self.alarm_state or 'unknown'}</span>")
+        self.node_status_label.setText(" &nbsp;|&nbsp; ".join(subsystems) + "<br>" + " &nbsp;|&nbsp; ".join(parts))
 
     def show_device_alert(self):
         """
         @brief Displays an alert when the device is not found.
-
-        Creates and shows a message box informing the user that the device was not found.
         """
-        if self.msg_box is None or not self.msg_box.isVisible():
-            self.create_msg_box(
-                "Device not found",
-                "The device was not found in the database."
-            )
-        else:
-            self.msg_box.show()
+        self.notify(Severity.WARNING, "Device not found", "The device was not found in the database.")
     
     def show_student_alert(self):
         """
         @brief Displays an alert when the student is not found.
-
-        Creates and shows a message box informing the user that the student was not found.
         """
-        if self.msg_box is None or not self.msg_box.isVisible():
-            self.create_msg_box(
-                "Student not found",
-                "The student was not found in the database."
-            )
-        else:
-            self.msg_box.show()
+        self.notify(Severity.WARNING, "Student not found", "The student was not found in the database.")
 
     def show_error_message(self, title, message):
         """
-        @brief Displays an error message box.
-        @param title The title of the message box.
+        @brief Displays an error notification.
+        @param title The title of the notification.
         @param message The message to display.
         """
-        self.create_msg_box(title, message)
+        self.notify(Severity.ERROR, title, message)
 
-    def create_msg_box(self, windowTitle, text):
+    def notify(self, severity, title, text, key=None):
         """
-        @brief Creates a message box with the specified title and text.
-
-        Configures and displays a QMessageBox with custom styles.
+        @brief Shows a notification in the overlay of the window without blocking the event loop.
 
-        @param windowTitle The title of the message box.
-        @param text The text content of the message box.
+        @param severity The Severity.
+        @param title The title of the notification.
+        @param text The text content of the notification.
+        @param key The key coalescing repeated notifications, by default the severity, title and text.
         """
-        self.msg_box = QMessageBox(self)  # Create the message box and store the reference
-        self.msg_box.setWindowTitle(windowTitle)
-        self.msg_box.setText(text)
-        self.msg_box.setIcon(QMessageBox.Icon.Warning) 
-        self.msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-        self.msg_box.setStyleSheet("""
-            QMessageBox {
-                background-color: black;
-            }
-            QMessageBox QLabel {
-                color: red;
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                font-size: 18px;
-                padding: 20px;
-                font-weight: bold;
-            }
-            QMessageBox QPushButton {
-                background-color: red;
-                color: white;
-                font-weight: bold;
-                padding: 10px;
-                font-size: 16px;
-                border-radius: 10px;
-            }
-        """)
-        self.msg_box.exec()
+        logging.info(f"Notification ({severity.value}): {title}")
+        self.notification_center.notify(severity, title, text, key)
 
     def start_nfc_scanner(self):
         """
         @brief Starts the NFC scanner service.
 
-        Resets and starts the NFC service to scan for smart cards.
+        Resets and starts the NFC service to scan for smart cards. If the NFC service is still
+        starting, it is started by on_subsystem_loaded().
         """
+        if self.nfc_service is None:
+            logging.warning("CMainwindowView::NFC service not ready, the scanner starts once it is")
+            return
         self.nfc_service.reset()
         self.nfc_service.start()
 
@@ -497,6 +741,8 @@ class CMainwindowView(QMainWindow):
 
         Stops the NFC service and waits for it to finish.
         """
+        if self.nfc_service is None:
+            return
         self.nfc_service.stop()
         self.nfc_service.wait()
 
@@ -504,7 +750,8 @@ class CMainwindowView(QMainWindow):
         """
         @brief Handles key press events.
 
-        Processes key events for NFC and QR code scanning modes.
+        Processes key events for NFC and QR code scanning modes. Key events only reach the QR
+        code scanner if it is read as keyboard, see QRConfig.BACKEND.
 
         @param event The key event.
         """
@@ -515,8 +762,17 @@ class CMainwindowView(QMainWindow):
             if self.current_scan_mode == ScanMode.NFC:
                 # TODO: Handle NFC key input
                 pass
-            elif self.current_scan_mode == ScanMode.QR_CODE:
+            elif self.current_scan_mode == ScanMode.QR_CODE and self.qr_code_scanner.reads_key_events:
                 self.qr_code_scanner.scan_qr_code(key)
+
+    def closeEvent(self, event):
+        """
+        @brief Stops the QR code scanner thread when the window is closed.
+
+        @param event The close event.
+        """
+        self.qr_code_scanner.stop()
+        super().closeEvent(event)
     
     def reset_device_student_details(self):
         """
@@ -527,6 +783,7 @@ class CMainwindowView(QMainWindow):
         self.current_device_id = None
         self.current_device_name = None
         self.current_student_id = None
+        self.current_student_uid = None
         self.current_student_name = None
         self._reset_label(self.ui.matriculation_label, "Student Name: None \nMatriculation number: None")
         self._reset_label(self.ui.device_label, "Device name: None")
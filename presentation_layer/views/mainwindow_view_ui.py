@@ -1,4 +1,3 @@
-import presentation_layer.assets.ressources_rc
 # Form implementation generated from reading ui file 'mainwindow.ui'
 #
 # Created by: PyQt6 UI code generator 6.7.1
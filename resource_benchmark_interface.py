@@ -0,0 +1,26 @@
+import json
+import argparse
+import logging
+import logging_config
+from presentation_layer.assets.resource_bundle import RESOURCE_BUNDLE
+from presentation_layer.resource_benchmark import ResourceBenchmark
+
+############################## Setup Logger #############################
+logging_config.setup_logging()
+#########################################################################
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compares the load time and memory of the GUI images as binary bundle and as Python resource module")
+    parser.add_argument("--bundle", default=RESOURCE_BUNDLE, help="path of the .rcc bundle")
+    parser.add_argument("--module", default=None, help="path of a Python resource module generated by pyrcc, e.g. the former ressources_rc.py")
+    parser.add_argument("--runs", type=int, default=5, help="number of runs per variant")
+    parser.add_argument("--decode", action="store_true", help="also decode every image")
+    parser.add_argument("--report", default="resource_report.json", help="path of the JSON report")
+    args = parser.parse_args()
+
+    report = ResourceBenchmark(args.runs, args.decode).run(args.bundle, args.module)
+    with open(args.report, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+    logging.info(f"ResourceBenchmark::Report written to {args.report}")
+    print(json.dumps({key: value for key, value in report.items() if key not in ("bundle", "module")} |
+                     {variant: report[variant]["median"] for variant in ("bundle", "module") if variant in report}, indent=2))
@@ -2,4 +2,4 @@
 
 # Raspberry Pi 3
 . venv/bin/activate
-python3 alarm_interface.py
\ No newline at end of file
+python3 alarm_interface.py "$@"
\ No newline at end of file
@@ -0,0 +1,5 @@
+#!/bin/sh
+
+# Local MQTT broker for development and benchmarks
+# Set BrokerAddress = 127.0.0.1 in the [MQTT] section of data_layer/config.ini to use it
+python3 broker_interface.py "$@"
@@ -0,0 +1,5 @@
+#!/bin/sh
+
+# Load generator for the alarm controller
+# Set DEVICE_SOURCE = "population" in application_layer/alarm_pi/alarm_config.py to benchmark without the database
+python3 load_generator_interface.py "$@"
@@ -0,0 +1,6 @@
+#!/bin/sh
+
+# Startup cost of the GUI images: binary bundle versus Python resource module
+# e.g. git show <revision>:presentation_layer/assets/ressources_rc.py > /tmp/ressources_rc.py
+#      ./run_resource_benchmark.sh --module /tmp/ressources_rc.py
+python3 resource_benchmark_interface.py "$@"
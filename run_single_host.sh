@@ -0,0 +1,5 @@
+#!/bin/sh
+
+# All services in one process, without a broker
+. venv/bin/activate
+python3 single_host_interface.py "$@"
@@ -0,0 +1,53 @@
+import sys
+import time
+import asyncio
+import argparse
+import logging
+import threading
+import logging_config
+from application_layer.mqtt_config import MQTTConfig
+from application_layer.alarm_pi.alarm_service import AlarmService
+
+############################## Setup Logger #############################
+logging_config.setup_logging()
+#########################################################################
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runs the RFID, alarm and GUI services in one process without a broker")
+    parser.add_argument("--no-rfid", action="store_true", help="run without the RFID reader")
+    parser.add_argument("--no-gui", action="store_true", help="run without the GUI")
+    args = parser.parse_args()
+
+    # The services talk over the in-process event bus instead of MQTT
+    MQTTConfig.TRANSPORT = "bus"
+
+    alarm_service = AlarmService()
+    alarm_thread = threading.Thread(target=lambda: asyncio.run(alarm_service.run(handle_signals=False)),
+                                    name="AlarmService")
+    alarm_thread.start()
+
+    rfid_service = None
+    if not args.no_rfid:
+        from application_layer.rfid_pi.rfid_service import RFIDService
+        rfid_service = RFIDService()
+        threading.Thread(target=rfid_service.start, name="RFIDService", daemon=True).start()
+
+    exit_code = 0
+    try:
+        if args.no_gui:
+            logging.info("SingleHost::Running without GUI, press Ctrl+C to stop")
+            while True:
+                time.sleep(1)
+        else:
+            from app import App
+            app = App(sys.argv)
+            exit_code = app.exec()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        logging.info("SingleHost::Stopping the services")
+        if rfid_service is not None:
+            rfid_service.stop()
+        alarm_service.stop()
+        alarm_thread.join()
+    sys.exit(exit_code)
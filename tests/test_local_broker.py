@@ -0,0 +1,41 @@
+import time
+import socket
+
+from application_layer.local_broker import LocalBroker
+
+def connect_packet(client_id):
+    """
+    @brief Builds the CONNECT packet of a clean session with a keepalive of 60 seconds.
+    """
+    body = b"\x00\x04MQTT\x04\x02\x00\x3c" + len(client_id).to_bytes(2, "big") + client_id.encode()
+    return bytes([0x10, len(body)]) + body
+
+def test_stop_ends_all_client_handlers():
+    broker = LocalBroker(port=0)
+    broker.start_in_thread()
+    clients = []
+    try:
+        for index in range(2):
+            client = socket.create_connection(("127.0.0.1", broker.port))
+            client.sendall(connect_packet(f"client-{index}"))
+            assert client.recv(4) == b"\x20\x02\x00\x00"
+            clients.append(client)
+        # A connection that stops in the middle of its CONNECT packet
+        client = socket.create_connection(("127.0.0.1", broker.port))
+        client.sendall(b"\x10\x20\x00")
+        clients.append(client)
+        deadline = time.monotonic() + 5
+        while len(broker.clients) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        broker.stop_thread()
+
+        assert broker.clients == {}
+        assert broker.sessions == {}
+        assert broker.loop.is_closed()
+        for client in clients:
+            client.settimeout(1)
+            assert client.recv(1) == b""  # Closed by the broker
+    finally:
+        for client in clients:
+            client.close()
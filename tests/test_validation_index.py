@@ -0,0 +1,177 @@
+import copy
+from unittest import mock
+
+import pytest
+
+from application_layer.device_db_service import DeviceDBService
+from application_layer.student_db_service import StudentDBService
+from application_layer.validation_index import ValidationIndex
+
+class FakeDatabase:
+    """
+    @brief The committed rows, shared by all fake connections.
+    """
+
+    def __init__(self):
+        self.students = {}
+        self.devices = {}
+
+    def add_student(self, student_id, name, mat_number, nfc_uid):
+        self.students[student_id] = (student_id, name, mat_number, nfc_uid)
+
+    def add_device(self, device_id, name, qr_code, is_borrowed=0):
+        self.devices[device_id] = [device_id, name, qr_code, is_borrowed]
+
+class FakeConnection:
+    """
+    @brief A connection with REPEATABLE READ semantics: the first query of a transaction
+           takes a snapshot of the committed rows, which is kept until commit().
+    """
+
+    def __init__(self, database):
+        self.database = database
+        self.snapshot = None
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def read(self):
+        if self.snapshot is None:
+            self.snapshot = copy.deepcopy(self.database)
+        return self.snapshot
+
+    def commit(self):
+        self.snapshot = None
+
+    def close(self):
+        pass
+
+class FakeCursor:
+    """
+    @brief Answers the queries of the ValidationIndex from the snapshot of its connection.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+
+    def execute(self, query, params=()):
+        snapshot = self.conn.read()
+        if query.startswith("SELECT id, name, mat_number, nfc_uid FROM students WHERE id >"):
+            self.rows = [row for row_id, row in sorted(snapshot.students.items()) if row_id > params[0]]
+        elif query.startswith("SELECT id, name, qr_code, is_borrowed FROM devices WHERE id >"):
+            self.rows = [tuple(row) for row_id, row in sorted(snapshot.devices.items()) if row_id > params[0]]
+        elif query.startswith("SELECT id, is_borrowed FROM devices"):
+            self.rows = [(row[0], row[3]) for row in snapshot.devices.values()]
+        elif query.startswith("SELECT id, name, mat_number, nfc_uid FROM students WHERE nfc_uid"):
+            self.rows = [row for row in snapshot.students.values() if row[3] == params[0]]
+        elif query.startswith("SELECT id, name, mat_number, nfc_uid FROM students WHERE id"):
+            self.rows = [row for row in snapshot.students.values() if row[0] == params[0]]
+        elif query.startswith("SELECT id, name, qr_code, is_borrowed FROM devices WHERE qr_code"):
+            self.rows = [tuple(row) for row in snapshot.devices.values() if row[2] == params[0]]
+        elif query.startswith("SELECT id, name, qr_code, is_borrowed FROM devices WHERE id ="):
+            self.rows = [tuple(row) for row in snapshot.devices.values() if row[0] == params[0]]
+        else:
+            raise AssertionError(f"Unexpected query: {query}")
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def database():
+    database = FakeDatabase()
+    database.add_student(1, "Ada", 1001, "04A1B2C3")
+    database.add_device(1, "Oscilloscope", "QR-1")
+    return database
+
+@pytest.fixture
+def services(database):
+    with mock.patch("mysql.connector.connect", side_effect=lambda **config: FakeConnection(database)):
+        yield StudentDBService(), DeviceDBService()
+
+@pytest.fixture
+def index(database, services):
+    return ValidationIndex(StudentDBService(), DeviceDBService())
+
+def test_refresh_sees_rows_inserted_after_the_previous_refresh(database, index):
+    index.refresh()
+    database.add_student(2, "Grace", 1002, "04D4E5F6")
+    database.add_device(2, "Multimeter", "QR-2")
+
+    index.refresh()
+
+    assert index.student_for_uid("04d4e5f6").name == "Grace"
+    assert index.device_for_qr_code("qr-2").name == "Multimeter"
+
+def test_refresh_sees_borrows_after_the_previous_refresh(database, index):
+    index.refresh()
+    database.devices[1][3] = 1
+
+    index.refresh()
+
+    assert index.device_for_qr_code("QR-1").is_borrowed
+
+def test_full_refresh_sees_borrows_after_the_previous_refresh(database, index):
+    index.refresh(full=True)
+    database.devices[1][3] = 1
+
+    index.refresh(full=True)
+
+    assert index.device_for_qr_code("QR-1").is_borrowed
+
+def test_local_borrow_survives_the_next_refresh(database, index):
+    index.refresh()
+    index.set_borrowed(1, True)
+    database.devices[1][3] = 1  # Committed by the borrow of the GUI
+
+    index.refresh()
+
+    assert index.device_for_qr_code("QR-1").is_borrowed
+
+def test_card_missing_from_the_index_is_looked_up_in_the_database(database, index, services):
+    student_db_service, _ = services
+    index.refresh()
+    database.add_student(2, "Grace", 1002, "04D4E5F6")
+
+    assert index.student_for_uid("04D4E5F6") is None
+    assert index.student_for_uid("04D4E5F6", student_db_service).name == "Grace"
+    assert index.student_for_uid("04D4E5F6").name == "Grace"
+
+def test_re_assigned_card_is_rejected_on_confirm(database, index, services):
+    student_db_service, _ = services
+    index.refresh()
+    database.add_student(1, "Ada", 1001, "04FFFFFF")
+
+    assert index.check_student(1, "04A1B2C3", student_db_service) is None
+    assert index.student_for_uid("04A1B2C3") is None
+    assert index.student_for_uid("04FFFFFF", student_db_service).name == "Ada"
+
+def test_deleted_device_is_rejected_on_confirm(database, index, services):
+    _, device_db_service = services
+    index.refresh()
+    del database.devices[1]
+
+    assert index.check_device(1, device_db_service) is None
+    assert index.device_for_qr_code("QR-1", device_db_service) is None
+
+def test_device_borrowed_elsewhere_is_seen_on_confirm(database, index, services):
+    _, device_db_service = services
+    index.refresh()
+    database.devices[1][3] = 1
+
+    assert index.check_device(1, device_db_service).is_borrowed
+    assert index.device_for_qr_code("QR-1").is_borrowed
+
+def test_edited_qr_code_replaces_the_old_one(database, index, services):
+    _, device_db_service = services
+    index.refresh()
+    database.devices[1][2] = "QR-1B"
+
+    assert index.device_for_qr_code("QR-1B", device_db_service).device_id == 1
+    assert index.device_for_qr_code("QR-1") is None